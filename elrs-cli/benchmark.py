@@ -0,0 +1,342 @@
+#  Copyright 2021 Dimitar Dimitrov | MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+#  associated documentation files (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+#  of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following
+#  conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial
+#  portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+#  INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+#  PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+#  LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT
+#  OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+#  OTHER DEALINGS IN THE SOFTWARE.
+
+#  This is ExpressLRS CLI benchmark. It times clone, pull, reset and build of ExpressLRS CLI end-to-end against local
+#  file:// bare repository fixture (with many branches and tags) and stub 'pio' executable, so results are reproducible
+#  and don't depend on GitHub or PlatformIO toolchains. Every run uses fresh copy of ExpressLRS CLI scripts in temporary
+#  project directory, results are written as JSON and can be compared with results of another version.
+#
+#  Usage: python benchmark.py -n 5 -o results.json [--compare baseline.json]
+
+import argparse
+import json
+import os
+import pathlib
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+scriptpath = os.path.realpath(__file__)
+CLI_DIR = os.path.dirname(scriptpath)
+
+# Steps timed in every iteration, in execution order
+STEPS = ["clone", "pull", "reset", "build", "build-cached"]
+
+# Build targets declared in fixture PlatformIO configuration
+FIXTURE_TARGETS = ["BENCH_2400_RX_ESP8285", "BENCH_2400_TX_ESP32", "BENCH_900_RX_STM32"]
+
+FIXTURE_PLATFORMIO_INI = """[platformio]
+extra_configs = targets/*.ini
+
+[env]
+framework = arduino
+build_flags = -DBENCHMARK
+
+[env_common_esp82xx]
+platform = espressif8266
+board = esp8285
+
+[env_common_esp32]
+platform = espressif32
+board = esp32dev
+
+[env_common_stm32]
+platform = ststm32
+board = bluepill_f103c8
+"""
+
+FIXTURE_TARGETS_INI = """[env:BENCH_2400_RX_ESP8285]
+extends = env_common_esp82xx
+upload_protocol = esptool
+
+[env:BENCH_2400_TX_ESP32]
+extends = env_common_esp32
+upload_protocol = esptool
+
+[env:BENCH_900_RX_STM32]
+extends = env_common_stm32
+upload_protocol = stlink
+"""
+
+# Stub PlatformIO CLI - prints output shaped like 'pio run' and writes firmware files into build dir of environment
+STUB_PIO = r'''import json
+import os
+import sys
+import time
+
+args = sys.argv[1:]
+if args[:1] == ["--version"]:
+    print("PlatformIO Core, version 0.0.0-benchmark")
+    sys.exit(0)
+if args[:2] == ["device", "list"]:
+    print(json.dumps([]))
+    sys.exit(0)
+
+projectDir = args[args.index("--project-dir") + 1] if "--project-dir" in args else os.getcwd()
+environment = args[args.index("--environment") + 1]
+buildDir = os.environ.get("PLATFORMIO_BUILD_DIR", os.path.join(projectDir, ".pio", "build"))
+targetDir = os.path.join(buildDir, environment)
+os.makedirs(targetDir, exist_ok=True)
+
+compileDelay = float(os.environ.get("ELRS_BENCHMARK_COMPILE_DELAY", "0"))
+print(f"Processing {environment} (platform: benchmark)")
+if "nobuild" not in args:
+    sources = [name for name in sorted(os.listdir(projectDir)) if name.endswith(".cpp")]
+    for name in sources:
+        print(f"Compiling .pio/build/{environment}/src/{name}.o", flush=True)
+        time.sleep(compileDelay)
+    print(f"Linking .pio/build/{environment}/firmware.elf")
+    print("RAM:   [==        ]  15.2% (used 49812 bytes from 327680 bytes)")
+    print("Flash: [=====     ]  48.1% (used 630000 bytes from 1310720 bytes)")
+    with open(os.path.join(targetDir, "firmware.bin"), "wb") as firmware:
+        firmware.write(os.urandom(64 * 1024))
+if "upload" in args:
+    print(f"Uploading .pio/build/{environment}/firmware.bin")
+print("========== [SUCCESS] Took 0.00 seconds ==========")
+'''
+
+
+def git(*command, cwd=None):
+    subprocess.check_call(['git'] + list(command), cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+
+
+def gitOutput(*command, cwd=None):
+    return subprocess.check_output(['git'] + list(command), cwd=cwd, stdin=subprocess.DEVNULL,
+                                   encoding="utf-8").strip()
+
+
+# Environment for git commands committing into fixture, independent from user's git configuration
+def fixtureGitEnv():
+    return dict(os.environ, GIT_AUTHOR_NAME="benchmark", GIT_AUTHOR_EMAIL="benchmark@localhost",
+                GIT_COMMITTER_NAME="benchmark", GIT_COMMITTER_EMAIL="benchmark@localhost",
+                GIT_CONFIG_NOSYSTEM="1")
+
+
+def writeFile(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(content)
+
+
+def commitAll(workDir, message):
+    subprocess.check_call(['git', 'add', '-A'], cwd=workDir, env=fixtureGitEnv())
+    subprocess.check_call(['git', 'commit', '--quiet', '--allow-empty', '-m', message], cwd=workDir,
+                          env=fixtureGitEnv())
+    return gitOutput('rev-parse', 'HEAD', cwd=workDir)
+
+
+# Create bare ExpressLRS-like repository with commits on master, and many branches and tags pointing into history.
+# Returns path of bare repository
+def createFixture(baseDir, commits, branches, tags, sources):
+    workDir = os.path.join(baseDir, "fixture-work")
+    bareDir = os.path.join(baseDir, "ExpressLRS.git")
+
+    git('init', '--quiet', workDir)
+    git('checkout', '--quiet', '-b', 'master', cwd=workDir)
+    writeFile(os.path.join(workDir, "README.md"), "ExpressLRS benchmark fixture\n")
+    writeFile(os.path.join(workDir, "src", "platformio.ini"), FIXTURE_PLATFORMIO_INI)
+    writeFile(os.path.join(workDir, "src", "targets", "benchmark.ini"), FIXTURE_TARGETS_INI)
+    writeFile(os.path.join(workDir, "src", "user_defines.txt"), "-DRegulatory_Domain_ISM_2400\n")
+
+    history = []
+    for index in range(commits):
+        for source in range(sources):
+            writeFile(os.path.join(workDir, "src", f"module{source}.cpp"),
+                      f"// revision {index}\nint module{source}() {{ return {index}; }}\n")
+        history.append(commitAll(workDir, f"Revision {index}"))
+
+    # branches and tags only update refs, so they are created in single 'update-ref --stdin' transaction
+    updates = [f"create refs/heads/branch-{index:04d} {history[index % len(history)]}\n" for index in range(branches)]
+    updates += [f"create refs/tags/1.{index}.0 {history[index % len(history)]}\n" for index in range(tags)]
+    subprocess.run(['git', 'update-ref', '--stdin'], cwd=workDir, input="".join(updates), encoding="utf-8",
+                   check=True)
+
+    git('clone', '--quiet', '--bare', workDir, bareDir)
+    # partial clone of ExpressLRS CLI ('--filter=blob:none') needs filtering enabled on serving repository
+    git('config', 'uploadpack.allowFilter', 'true', cwd=bareDir)
+
+    return workDir, bareDir
+
+
+# Push new upstream commit to fixture master, so every pull has something to fetch and merge
+def pushUpstreamChange(workDir, bareDir, iteration):
+    writeFile(os.path.join(workDir, "src", "module0.cpp"),
+              f"// upstream change {iteration}\nint module0() {{ return 0; }}\n")
+    commitAll(workDir, f"Upstream change {iteration}")
+    git('push', '--quiet', bareDir, 'master', cwd=workDir)
+
+
+# Temporary project directory with fresh copy of ExpressLRS CLI scripts and stub 'pio' in fake home directory
+def createProject(baseDir, cliDir):
+    projectDir = os.path.join(baseDir, "project")
+    os.makedirs(os.path.join(projectDir, "elrs-cli"))
+    for name in os.listdir(cliDir):
+        if name.endswith(".py"):
+            shutil.copy2(os.path.join(cliDir, name), os.path.join(projectDir, "elrs-cli", name))
+
+    # ExpressLRS CLI puts ~/.platformio/penv/Scripts in front of PATH
+    homeDir = os.path.join(baseDir, "home")
+    stubDir = os.path.join(homeDir, ".platformio", "penv", "Scripts")
+    stubPath = os.path.join(stubDir, "pio-stub.py")
+    writeFile(stubPath, STUB_PIO)
+    if os.name == "nt":
+        writeFile(os.path.join(stubDir, "pio.cmd"), f'@"{sys.executable}" "{stubPath}" %*\n')
+    else:
+        writeFile(os.path.join(stubDir, "pio"), f'#!/bin/sh\nexec "{sys.executable}" "{stubPath}" "$@"\n')
+        os.chmod(os.path.join(stubDir, "pio"), 0o755)
+
+    return projectDir, homeDir
+
+
+# Run ExpressLRS CLI command in project and return its wall time in seconds
+def timeCli(projectDir, env, cliArgs, verbose):
+    command = [sys.executable, os.path.join(projectDir, "elrs-cli", "elrs-cli.py")] + cliArgs
+    output = None if verbose else subprocess.DEVNULL
+    startTime = time.perf_counter()
+    subprocess.check_call(command, cwd=projectDir, env=env, stdin=subprocess.DEVNULL, stdout=output, stderr=output)
+    return time.perf_counter() - startTime
+
+
+def resetProject(projectDir):
+    for name in ["ExpressLRS", ".elrs-cache", ".elrs-worktrees"]:
+        shutil.rmtree(os.path.join(projectDir, name), ignore_errors=True)
+
+
+def runIteration(iteration, projectDir, workDir, bareDir, env, branches, verbose):
+    timings = {}
+    resetProject(projectDir)
+    timings["clone"] = timeCli(projectDir, env, ['--clone'], verbose)
+
+    pushUpstreamChange(workDir, bareDir, iteration)
+    timings["pull"] = timeCli(projectDir, env, ['--pull', 'master', '--fetch-ttl', '0'], verbose)
+
+    branch = f"branch-{iteration % branches:04d}" if branches else "master"
+    timings["reset"] = timeCli(projectDir, env, ['--reset', branch], verbose)
+
+    target = ",".join(FIXTURE_TARGETS)
+    timings["build"] = timeCli(projectDir, env, ['--build', '--target', target, '--no-cache'], verbose)
+    # '--no-cache' build doesn't store artifacts, first cached build fills artifact cache and second one is timed
+    timeCli(projectDir, env, ['--build', '--target', target], verbose)
+    timings["build-cached"] = timeCli(projectDir, env, ['--build', '--target', target], verbose)
+
+    return timings
+
+
+def summarize(samples):
+    return {
+        "runs": [round(sample, 4) for sample in samples],
+        "min": round(min(samples), 4),
+        "median": round(statistics.median(samples), 4),
+        "mean": round(statistics.mean(samples), 4),
+        "max": round(max(samples), 4),
+    }
+
+
+def cliVersion():
+    try:
+        return gitOutput('describe', '--always', '--dirty', cwd=CLI_DIR)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def runBenchmark(args):
+    baseDir = tempfile.mkdtemp(prefix="elrs-benchmark-")
+    try:
+        print(f"Creating fixture: {args.commits} commits, {args.branches} branches, {args.tags} tags")
+        workDir, bareDir = createFixture(baseDir, args.commits, args.branches, args.tags, args.sources)
+        projectDir, homeDir = createProject(baseDir, args.cli_dir)
+
+        env = dict(fixtureGitEnv(), HOME=homeDir, USERPROFILE=homeDir,
+                   ELRS_REPO_URL=pathlib.Path(bareDir).resolve().as_uri(),
+                   ELRS_BENCHMARK_COMPILE_DELAY=str(args.compile_delay))
+        for name in ["ELRS_PROM_FILE", "ELRS_FETCH_TTL"]:
+            env.pop(name, None)
+
+        samples = {step: [] for step in STEPS}
+        for iteration in range(args.iterations):
+            timings = runIteration(iteration, projectDir, workDir, bareDir, env, args.branches, args.verbose)
+            print(f"Iteration {iteration + 1}/{args.iterations}: " +
+                  ", ".join(f"{step} {timings[step]:.3f}s" for step in STEPS))
+            for step in STEPS:
+                samples[step].append(timings[step])
+    finally:
+        if args.keep:
+            print(f"Benchmark directory kept: {baseDir}")
+        else:
+            shutil.rmtree(baseDir, ignore_errors=True)
+
+    return {
+        "version": cliVersion(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": gitOutput('--version'),
+        "iterations": args.iterations,
+        "fixture": {"commits": args.commits, "branches": args.branches, "tags": args.tags, "sources": args.sources,
+                    "compile_delay": args.compile_delay, "targets": FIXTURE_TARGETS},
+        "results": {step: summarize(samples[step]) for step in STEPS},
+    }
+
+
+# Print median of every step of results against baseline results
+def compareResults(results, baseline):
+    print(f"{'step':<14} {'baseline':>10} {'current':>10} {'change':>8}")
+    for step in STEPS:
+        if step not in baseline["results"] or step not in results["results"]:
+            continue
+        before = baseline["results"][step]["median"]
+        after = results["results"][step]["median"]
+        change = f"{(after - before) / before * 100:+.1f}%" if before else ""
+        print(f"{step:<14} {before:>9.3f}s {after:>9.3f}s {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ExpressLRS CLI against local git fixture and stub pio")
+    parser.add_argument("-n", "--iterations", type=int, default=5, help="number of timed iterations")
+    parser.add_argument("-o", "--output", type=str, help="write JSON results to file")
+    parser.add_argument("--compare", type=str, help="compare results with JSON results of previous run")
+    parser.add_argument("--commits", type=int, default=20, help="number of commits on fixture master branch")
+    parser.add_argument("--branches", type=int, default=200, help="number of fixture branches")
+    parser.add_argument("--tags", type=int, default=200, help="number of fixture tags")
+    parser.add_argument("--sources", type=int, default=20, help="number of source files compiled by stub pio")
+    parser.add_argument("--compile-delay", type=float, default=0.0, help="seconds stub pio spends per source file")
+    parser.add_argument("--cli-dir", type=str, default=CLI_DIR, help="directory of ExpressLRS CLI version to measure")
+    parser.add_argument("--keep", action="store_true", help="keep temporary fixture and project directory")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show ExpressLRS CLI output")
+    args = parser.parse_args()
+
+    results = runBenchmark(args)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as outputFile:
+            outputFile.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baselineFile:
+            compareResults(results, json.load(baselineFile))
+
+
+if __name__ == "__main__":
+    main()
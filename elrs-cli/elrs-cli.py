@@ -21,17 +21,40 @@
 #  languages and tools for configuration, build and upload of ExpressLRS firmware.
 
 import argparse
+import configparser
+import contextlib
+import fnmatch
+import glob
+import hashlib
+import inspect
+import json
 import logging
 import os
+import shutil
+import sqlite3
+import struct
 import subprocess
 import sys
 import pathlib
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 scriptpath = os.path.realpath(__file__)
 
+# embedded Python doesn't put script directory on sys.path, so shared modules next to script are found explicitly
+sys.path.insert(0, os.path.dirname(scriptpath))
+from elrs_events import emitEvent, setEventSink, setupEvents  # noqa: E402
+from elrs_lock import LockTimeout, ReadWriteFileLock  # noqa: E402
+from elrs_logging import setupLogging  # noqa: E402
+from elrs_metrics import (BUILD_DURATION_BUCKETS, FETCH_DURATION_BUCKETS, FLASH_DURATION_BUCKETS,  # noqa: E402
+                          InstrumentedPopen, incCounter, measuredOperation, observeHistogram, setupMetrics)
+
 # TODO: rename to configurator path
 PROJECT_DIR = scriptpath[0:-len("/elrs-cli/elrs-cli.py")]
 ELRS_REPO_DIR = os.path.join(PROJECT_DIR, 'ExpressLRS')
+ELRS_REPO_URL = os.environ.get("ELRS_REPO_URL", "https://github.com/AlessandroAU/ExpressLRS.git")
 
 # TODO: windows only paths
 GIT_EXEC_DIR_WIN = os.path.join(PROJECT_DIR, "setup", "win", "PortableGit-2.30.1-64-bit", "cmd")
@@ -41,104 +64,1546 @@ PIO_EXEC_DIR_WIN = os.path.join(str(pathlib.Path.home()), ".platformio", "penv",
 os.environ["PATH"] = os.pathsep.join([GIT_EXEC_DIR_WIN]) + os.pathsep + os.environ["PATH"]
 os.environ["PATH"] = os.pathsep.join([PIO_EXEC_DIR_WIN]) + os.pathsep + os.environ["PATH"]
 
-# Organize folder names
+# Organize folder names - checkoutDir and srcdir point to ref worktree while building it ('--ref')
+checkoutDir = ELRS_REPO_DIR
 srcdir = os.path.join(PROJECT_DIR, "ExpressLRS", "src")
+WORKTREES_DIR = os.path.join(PROJECT_DIR, ".elrs-worktrees")
+ELRS_CACHE_DIR = os.path.join(PROJECT_DIR, ".elrs-cache")
+ARTIFACT_CACHE_DIR = os.path.join(ELRS_CACHE_DIR, "artifacts")
+FETCH_STAMP_PATH = os.path.join(ELRS_REPO_DIR, ".git", "elrs-cli-last-fetch")
+REFS_INDEX_PATH = os.path.join(ELRS_CACHE_DIR, "refs-index.json")
+TARGETS_CACHE_DIR = os.path.join(ELRS_CACHE_DIR, "targets")
+TARGETS_CACHE_ENTRIES = 20
+PROGRESS_TOTALS_PATH = os.path.join(ELRS_CACHE_DIR, "progress-totals.json")
+SIZE_HISTORY_PATH = os.path.join(ELRS_CACHE_DIR, "size-history.sqlite")
+METRICS_PATH = os.path.join(ELRS_CACHE_DIR, "metrics.jsonl")
+PROMETHEUS_STATE_PATH = os.path.join(ELRS_CACHE_DIR, "prometheus-state.json")
+REPO_LOCK_PATH = os.path.join(ELRS_CACHE_DIR, "repo.lock")
+
+# Images kept from PlatformIO build dir in artifact cache - firmware and images flashed together with it, like
+# partitions.bin and bootloader.bin of ESP32 targets
+ARTIFACT_PATTERNS = ["*.bin", "*.bin.gz", "*.elf", "*.hex"]
+
+# Layout of artifact cache entries, entries of older layouts (firmware files only) are incomplete and not restored
+ARTIFACT_LAYOUT = 2
 
 # Logger config
 loggerfilename = os.path.join(PROJECT_DIR, "elrs-cli.log")
-# logging.basicConfig(filename=loggerfilename, encoding='utf-8', level=logging.DEBUG,
-#                     format='%(asctime)s %(name)-8s %(levelname)-8s %(message)s', datefmt='%y-%m-%d %H:%M:%S')
-logging.basicConfig(handlers=[logging.FileHandler(filename=loggerfilename, 
-                                                 encoding='utf-8', mode='a+')],
-                    format="%(asctime)s %(name)s:%(levelname)s:%(message)s", 
-                    datefmt="%F %A %T", 
-                    level=logging.DEBUG)
+setupLogging(loggerfilename)
 logger = logging.getLogger('elrs-cli')
 
 # Initialize argument parser for ExpressLRS CLI
 parser = argparse.ArgumentParser()
 parser.add_argument("-c", "--clone", action="store_true", help="clone ExpressLRS GitHub repository locally")
+parser.add_argument("--remote-url", type=str, default=ELRS_REPO_URL,
+                    help="ExpressLRS repository URL cloned and fetched from (env ELRS_REPO_URL)")
+parser.add_argument("--reference", type=str, default=os.environ.get("ELRS_REPO_REFERENCE"),
+                    help="local bare mirror of ExpressLRS repository (path or network share) borrowing objects to "
+                         "clone, only missing objects are fetched from remote (env ELRS_REPO_REFERENCE)")
+parser.add_argument("--dissociate", action="store_true",
+                    help="copy borrowed objects from '--reference' mirror, so clone doesn't depend on it afterwards")
+parser.add_argument("--update-mirror", type=str, metavar="PATH",
+                    help="create or update local bare mirror of ExpressLRS repository for '--reference'")
+parser.add_argument("--export-bundle", type=str, metavar="FILE",
+                    help="package ExpressLRS branches and tags selected by '--bundle-refs' into git bundle file")
+parser.add_argument("--bundle-refs", type=str,
+                    help="comma separated branch/tag names or glob patterns exported to bundle (default: all)")
+parser.add_argument("--import-bundle", type=str, metavar="FILE",
+                    help="restore ExpressLRS checkout (or update its branches and tags) from git bundle file")
 parser.add_argument("-p", "--pull", type=str, help="pull latest changes locally from ExpressLRS GitHub repository master branch")
+parser.add_argument("--fetch-ttl", type=int, default=int(os.environ.get("ELRS_FETCH_TTL", 600)),
+                    help="seconds after last successful fetch during which pull skips fetching, 0 always fetches")
 parser.add_argument("-r", "--reset", type=str, help="reset ExpressLRS to specific branch")
-parser.add_argument("-t", "--target", type=str, help="specify ExpressLRS build/upload target for PlatformIO")
+parser.add_argument("-t", "--target", type=str, help="specify ExpressLRS build/upload target for PlatformIO, "
+                                                      "comma separated list or glob for building multiple targets")
+parser.add_argument("-j", "--jobs", type=int, help="maximum number of targets built or serial ports flashed in parallel")
+parser.add_argument("--no-cache", action="store_true", help="always build firmware, bypassing local artifact cache")
+parser.add_argument("--cache-max-size", type=int, default=int(os.environ.get("ELRS_ARTIFACT_CACHE_MAX_MB", 512)),
+                    help="artifact cache size cap in MB, least recently used artifacts are evicted above it")
+parser.add_argument("--artifact", type=str, help="upload cached firmware artifact with specified key")
+parser.add_argument("--no-rebuild", action="store_true",
+                    help="upload firmware from last build of target instead of rebuilding it when it is not cached")
+parser.add_argument("--port", type=str, help="comma separated list of serial ports to flash in parallel")
+parser.add_argument("--usb-id", type=str, help="flash in parallel all serial devices matching USB VID:PID, e.g. 10C4:EA60")
 parser.add_argument("-b", "--build", action="store_true", help="build ExpressLRS firmware for specified target")
 parser.add_argument("-u", "--upload", action="store_true", help="upload ExpressLRS firmware for specified target")
+parser.add_argument("--refs", action="store_true", help="print ExpressLRS branch/tag to commit index")
+parser.add_argument("--targets", action="store_true",
+                    help="print ExpressLRS PlatformIO build targets with resolved board, platform and options")
+parser.add_argument("--json", action="store_true", help="print command output as JSON")
+parser.add_argument("--ref", type=str, help="build/upload specific branch or tag in its own worktree, keeping "
+                                               "main ExpressLRS checkout and other refs' build dirs untouched")
+parser.add_argument("--max-worktrees", type=int, default=int(os.environ.get("ELRS_MAX_WORKTREES", 4)),
+                    help="number of ref worktrees kept, least recently used ones are removed above it")
+parser.add_argument("--events", type=str, help="append structured build progress events as newline-delimited JSON "
+                                                  "to file ('-' for stderr)")
+parser.add_argument("--report", choices=["size"], help="print firmware size history of '-t (target)' builds")
+parser.add_argument("--since", type=str, help="limit '--report' to builds of commits not older than branch, tag or commit")
+parser.add_argument("--prom-file", type=str, default=os.environ.get("ELRS_PROM_FILE"),
+                    help="maintain Prometheus node_exporter textfile collector metrics in file (e.g. elrs.prom)")
+parser.add_argument("--lock-timeout", type=float, default=float(os.environ.get("ELRS_LOCK_TIMEOUT", 600)),
+                    help="seconds to wait for ExpressLRS repository lock held by another ExpressLRS CLI process")
+parser.add_argument("--serve", action="store_true", help="stay resident and serve JSON-RPC requests over stdin/stdout")
 args = parser.parse_args()
 
-# Github clone whole ExpressLRS repository function
-def cloneElrsGithubRepo():
-    logger.debug("Cloning ExpressLRS GitHub repository in local directory: {PROJECT_DIR}")
+setupMetrics(METRICS_PATH, args.prom_file, PROMETHEUS_STATE_PATH)
+
+repoLock = ReadWriteFileLock(REPO_LOCK_PATH)
+
+
+# Hold ExpressLRS repository lock for duration of block (or decorated function) - shared by commands only reading
+# checkout, exclusive for commands changing it
+@contextlib.contextmanager
+def repositoryLock(exclusive):
+    mode = "exclusive" if exclusive else "shared"
+    try:
+        repoLock.acquire(exclusive, args.lock_timeout,
+                         lambda: logger.info(f"Waiting for {mode} ExpressLRS repository lock held by another "
+                                             "ExpressLRS CLI process"))
+    except LockTimeout as error:
+        logger.error(f"Unable to take {mode} ExpressLRS repository lock: {error}")
+        sys.exit(1)
+
+    try:
+        yield
+    finally:
+        repoLock.release()
+
+
+# Run external command, never letting it read our stdin (it carries JSON-RPC requests in '--serve' mode)
+def runCommand(command, cwd=None, step=None):
+    with InstrumentedPopen(command, step=step, cwd=cwd, stdin=subprocess.DEVNULL) as process:
+        returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command)
+
+
+# Run external command, passing every line of its output to lineHandler as it is produced. Returns exit code
+def streamCommand(command, lineHandler, env=None, step=None):
+    with InstrumentedPopen(command, step=step, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                           stderr=subprocess.STDOUT, encoding="utf-8", errors="replace") as process:
+        for line in process.stdout:
+            lineHandler(line)
+        return process.wait()
+
+
+# Run one of concurrently executed external commands, prefixing its output lines so they can be told apart.
+# Returns command exit code
+def runPrefixedCommand(command, prefix, outputLock, env=None, lineParser=None, step=None):
+    def printLine(line):
+        with outputLock:
+            sys.stdout.write(f"[{prefix}] {line}")
+            sys.stdout.flush()
+        if lineParser is not None:
+            lineParser(line)
+
+    return streamCommand(command, printLine, env, step)
+
+
+# Run external command and return its raw output
+def captureOutput(command, cwd=None, step=None):
+    with InstrumentedPopen(command, step=step, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE) as process:
+        output = process.stdout.read()
+        returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command, output)
+    return output
+
+
+# Run external command and return its stripped text output
+def captureCommand(command, cwd=None, step=None):
+    return captureOutput(command, cwd, step).decode("utf-8", errors="replace").strip()
+
 
-    subprocess.check_call(['git', '--version'])
-    subprocess.check_call(['git', 'clone', '--filter=blob:none', '--sparse', 'https://github.com/AlessandroAU/ExpressLRS.git'])
+# Github clone whole ExpressLRS repository function. With reference mirror objects are borrowed from it (git
+# alternates), so only objects newer than mirror are transferred from remote
+@measuredOperation("clone")
+@repositoryLock(exclusive=True)
+def cloneElrsGithubRepo(remoteUrl=args.remote_url, reference=args.reference, dissociate=args.dissociate):
+    logger.debug(f"Cloning ExpressLRS GitHub repository [{remoteUrl}] in local directory: {PROJECT_DIR}")
+
+    os.chdir(PROJECT_DIR)
+
+    command = ['git', 'clone', '--filter=blob:none', '--sparse']
+    if reference:
+        logger.info(f"Using ExpressLRS repository mirror [{reference}] as clone reference")
+        command += ['--reference-if-able', reference]
+        if dissociate:
+            command += ['--dissociate']
+
+    runCommand(['git', '--version'])
+    runCommand(command + [remoteUrl, ELRS_REPO_DIR])
     
     os.chdir(ELRS_REPO_DIR)
     
-    subprocess.check_call(['git', 'sparse-checkout', 'init', '--cone'])
-    subprocess.check_call(['git', 'sparse-checkout', 'set', 'src'])
-    subprocess.check_call(['git', 'config', 'pull.rebase', 'false'])
-    subprocess.check_call(['git', 'fetch', '--all'])
-    subprocess.check_call(['git', 'fetch', '--tags'])
+    runCommand(['git', 'sparse-checkout', 'init', '--cone'])
+    runCommand(['git', 'sparse-checkout', 'set', 'src'])
+    runCommand(['git', 'config', 'pull.rebase', 'false'])
+
+    # clone already fetched all heads and tags, so next pull doesn't need to fetch again within TTL
+    writeFetchStamp()
 
     logger.debug("Successfully cloned latest ExpressLRS changes from GitHub repository 'master' branch")
 
 
-# Github pull latest ExpressLRS repository master branch function
-def pullElrsGithubRepo(branch):
+# Create bare mirror of ExpressLRS repository with all branches and tags, or fetch latest changes into existing one.
+# Mirror is meant to be shared (LAN share, USB disk) by workstations cloning with '--reference'
+@measuredOperation("update-mirror")
+def updateElrsMirror(path, remoteUrl=args.remote_url):
+    path = os.path.abspath(path)
+    runCommand(['git', '--version'])
+
+    if os.path.isfile(os.path.join(path, "HEAD")):
+        logger.info(f"Updating ExpressLRS repository mirror [{path}] from [{remoteUrl}]")
+        runCommand(['git', 'remote', 'set-url', 'origin', remoteUrl], cwd=path)
+        runCommand(['git', 'fetch', '--prune', 'origin'], cwd=path)
+    else:
+        logger.info(f"Creating ExpressLRS repository mirror [{path}] from [{remoteUrl}]")
+        runCommand(['git', 'clone', '--mirror', remoteUrl, path])
+
+    logger.info(f"Successfully updated ExpressLRS repository mirror [{path}]")
+
+
+# Size of ExpressLRS local repository object store (loose objects and packs) in bytes, as counted by git
+def gitObjectsSize():
+    counts = dict(line.split(": ", 1) for line in captureCommand(['git', 'count-objects', '-v'],
+                                                                 cwd=ELRS_REPO_DIR).splitlines())
+    return (int(counts.get("size", 0)) + int(counts.get("size-pack", 0))) * 1024
+
+
+# Fetch ExpressLRS GitHub repository branches and tags in single fetch, unless last successful fetch is newer than ttl
+# seconds. Origin is pointed to remoteUrl first, fetch from changed remote ignores ttl. Returns fetch duration and
+# received bytes, or None when fetch was skipped
+def fetchElrsGithubRepo(ttl=args.fetch_ttl, remoteUrl=args.remote_url):
+    currentUrl = captureCommand(['git', 'remote', 'get-url', 'origin'], cwd=ELRS_REPO_DIR)
+    if currentUrl != remoteUrl:
+        logger.info(f"Changing ExpressLRS repository remote from [{currentUrl}] to [{remoteUrl}]")
+        runCommand(['git', 'remote', 'set-url', 'origin', remoteUrl], cwd=ELRS_REPO_DIR)
+        ttl = 0
+
+    if ttl > 0 and os.path.isfile(FETCH_STAMP_PATH):
+        age = time.time() - os.path.getmtime(FETCH_STAMP_PATH)
+        if 0 <= age < ttl:
+            logger.debug(f"Skipping ExpressLRS fetch, last successful fetch was {int(age)}s ago (TTL {ttl}s)")
+            return None
+
     logger.debug("Fetching latest ExpressLRS changes from GitHub repository")
-    
+
+    sizeBefore = gitObjectsSize()
+    startTime = time.monotonic()
+
+    # heads from configured refspec and all tags, negotiated once with origin only - separate 'fetch --all' and
+    # 'fetch --tags' used to run ref negotiation twice
+    runCommand(['git', 'fetch', '--tags', 'origin'])
+
+    stats = {"duration": round(time.monotonic() - startTime, 3), "bytes": max(0, gitObjectsSize() - sizeBefore)}
+    observeHistogram("elrs_fetch_duration_seconds", "ExpressLRS repository fetch duration", stats["duration"],
+                     FETCH_DURATION_BUCKETS)
+    incCounter("elrs_fetch_bytes_total", "Bytes received by ExpressLRS repository fetches", value=stats["bytes"])
+    logger.info(f"Fetched ExpressLRS heads and tags in single fetch: {stats['duration']}s, {stats['bytes']} bytes "
+                "received")
+
+    writeFetchStamp()
+    return stats
+
+
+def writeFetchStamp():
+    with open(FETCH_STAMP_PATH, "w") as stamp:
+        stamp.write(f"{time.time()}\n")
+
+
+# Github pull latest ExpressLRS repository master branch function
+@measuredOperation("pull")
+@repositoryLock(exclusive=True)
+def pullElrsGithubRepo(branch, fetchTtl=args.fetch_ttl, remoteUrl=args.remote_url):
     os.chdir(ELRS_REPO_DIR)
 
-    subprocess.check_call(['git', '--version'])
-    subprocess.check_call(['git', 'fetch', '--all'])
-    subprocess.check_call(['git', 'fetch', '--tags'])
+    runCommand(['git', '--version'])
+    fetchElrsGithubRepo(fetchTtl, remoteUrl)
 
     logger.debug(f"Pulling latest ExpressLRS changes from GitHub repository {branch} branch")
 
-    subprocess.check_call(['git', 'merge', f'origin/{branch}'])
+    runCommand(['git', 'merge', f'origin/{branch}'])
 
     logger.debug(f"Successfully got latest ExpressLRS changes from GitHub repository {branch} branch")
 
 
+# Modification times of every file/dir git changes when refs are updated. Loose refs are replaced via rename, which
+# updates their directory mtime, so only directories under refs need to be checked
+def refsState():
+    gitDir = os.path.join(ELRS_REPO_DIR, ".git")
+    paths = [os.path.join(gitDir, "HEAD"), os.path.join(gitDir, "packed-refs")]
+    for root, _, _ in os.walk(os.path.join(gitDir, "refs")):
+        paths.append(root)
+
+    state = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            state[os.path.relpath(path, gitDir)] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            pass
+    return state
+
+
+# Build index of ExpressLRS remote branches and tags, mapped to commits, plus current HEAD commit
+def buildRefsIndex():
+    index = {"head": None, "branches": {}, "tags": {}, "current": None}
+
+    # '--dereference' adds '<tag>^{}' lines with commit of annotated tags, which overrides tag object
+    for line in captureCommand(['git', 'show-ref', '--head', '--dereference'], cwd=ELRS_REPO_DIR).splitlines():
+        commit, ref = line.split(" ", 1)
+        if ref == "HEAD":
+            index["head"] = commit
+        elif ref.startswith("refs/remotes/origin/") and ref != "refs/remotes/origin/HEAD":
+            index["branches"][ref[len("refs/remotes/origin/"):]] = commit
+        elif ref.startswith("refs/tags/"):
+            index["tags"][ref[len("refs/tags/"):].replace("^{}", "")] = commit
+
+    # checked out branch name goes first, then other branches take precedence over tags pointing to the same commit
+    with open(os.path.join(ELRS_REPO_DIR, ".git", "HEAD"), encoding="utf-8") as headFile:
+        headRef = headFile.read().strip()
+    localBranch = headRef[len("ref: refs/heads/"):] if headRef.startswith("ref: refs/heads/") else None
+    candidates = [(localBranch, index["branches"].get(localBranch))]
+    for name, commit in candidates + sorted(index["branches"].items()) + sorted(index["tags"].items()):
+        if commit == index["head"]:
+            index["current"] = name
+            break
+
+    return index
+
+
+# ExpressLRS branch/tag to commit index, cached on disk until any ref file changes
+@repositoryLock(exclusive=False)
+def listElrsRefs():
+    state = refsState()
+
+    try:
+        with open(REFS_INDEX_PATH, encoding="utf-8") as indexFile:
+            cached = json.load(indexFile)
+        if cached["state"] == state:
+            return cached["index"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    logger.debug("Rebuilding ExpressLRS refs index")
+    index = buildRefsIndex()
+
+    os.makedirs(ELRS_CACHE_DIR, exist_ok=True)
+    tmpPath = f"{REFS_INDEX_PATH}.{os.getpid()}.tmp"
+    with open(tmpPath, "w", encoding="utf-8") as indexFile:
+        json.dump({"state": state, "index": index}, indexFile)
+    os.replace(tmpPath, REFS_INDEX_PATH)
+
+    return index
+
+
+# Fetch objects reachable from refs, which partial clone ('--filter=blob:none') didn't download, in single fetch - git
+# would otherwise fetch them one by one while writing bundle
+def fetchMissingObjects(refs):
+    objects = captureCommand(['git', 'rev-list', '--objects', '--missing=print'] + refs, cwd=ELRS_REPO_DIR)
+    missing = [line[1:] for line in objects.splitlines() if line.startswith("?")]
+    if not missing:
+        return
+
+    logger.info(f"Fetching {len(missing)} objects not downloaded by partial clone of ExpressLRS repository")
+    command = ['git', 'fetch', '--no-tags', '--no-write-fetch-head', '--recurse-submodules=no', '--filter=blob:none',
+               '--stdin', 'origin']
+    with InstrumentedPopen(command, step="git fetch missing", cwd=ELRS_REPO_DIR, stdin=subprocess.PIPE) as process:
+        process.communicate("\n".join(missing).encode("ascii"))
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
+# Package ExpressLRS remote branches and tags matching patterns, together with checked out branch, into single git
+# bundle file, which restores checkout without network access ('--import-bundle')
+@measuredOperation("export-bundle")
+@repositoryLock(exclusive=True)
+def exportElrsBundle(path, refPatterns=args.bundle_refs):
+    path = os.path.abspath(path)
+    patterns = refPatterns.replace(",", " ").split() if refPatterns else ["*"]
+
+    index = listElrsRefs()
+    refs = [f"refs/remotes/origin/{name}" for name in sorted(index["branches"])
+            if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)]
+    refs += [f"refs/tags/{name}" for name in sorted(index["tags"])
+             if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)]
+    if not refs:
+        logger.error(f"No ExpressLRS branches or tags match [{refPatterns}], nothing to export")
+        sys.exit(1)
+
+    # checked out branch tells import which branch to check out
+    with open(os.path.join(ELRS_REPO_DIR, ".git", "HEAD"), encoding="utf-8") as headFile:
+        headRef = headFile.read().strip()
+    if headRef.startswith("ref: refs/heads/"):
+        refs.append(headRef[len("ref: "):])
+
+    logger.info(f"Exporting {len(refs)} ExpressLRS refs to bundle [{path}]")
+    runCommand(['git', '--version'])
+    fetchMissingObjects(refs)
+    runCommand(['git', 'bundle', 'create', path] + refs, cwd=ELRS_REPO_DIR)
+
+    logger.info(f"Successfully exported ExpressLRS bundle [{path}]")
+
+
+# Restore ExpressLRS checkout from git bundle - new sparse checkout of branch checked out at export time, or only
+# updated remote branches and tags of existing checkout. Origin keeps pointing to remote for later online pulls
+@measuredOperation("import-bundle")
+@repositoryLock(exclusive=True)
+def importElrsBundle(path, remoteUrl=args.remote_url):
+    path = os.path.abspath(path)
+    logger.info(f"Importing ExpressLRS bundle [{path}]")
+
+    runCommand(['git', '--version'])
+    heads = {}
+    for line in captureCommand(['git', 'bundle', 'list-heads', path]).splitlines():
+        commit, ref = line.split(" ", 1)
+        heads[ref] = commit
+
+    newCheckout = not os.path.isdir(os.path.join(ELRS_REPO_DIR, ".git"))
+    if newCheckout:
+        runCommand(['git', 'init', ELRS_REPO_DIR])
+        runCommand(['git', 'remote', 'add', 'origin', remoteUrl], cwd=ELRS_REPO_DIR)
+        runCommand(['git', 'config', 'pull.rebase', 'false'], cwd=ELRS_REPO_DIR)
+
+    branches = [ref[len("refs/remotes/origin/"):] for ref in heads if ref.startswith("refs/remotes/origin/")]
+    localBranches = [ref[len("refs/heads/"):] for ref in heads if ref.startswith("refs/heads/")]
+    branch = next((name for name in localBranches if name in branches), None) or \
+        ("master" if "master" in branches else (branches or [None])[0])
+
+    # local branch of exported checkout is usually reset to another branch or tag, its commit is fetched as well,
+    # so new checkout restores exactly what was exported
+    refspecs = ['+refs/remotes/origin/*:refs/remotes/origin/*', '+refs/tags/*:refs/tags/*']
+    if newCheckout and f"refs/heads/{branch}" in heads:
+        refspecs.append(f"refs/heads/{branch}")
+
+    runCommand(['git', 'bundle', 'verify', '--quiet', path], cwd=ELRS_REPO_DIR)
+    runCommand(['git', 'fetch', path] + refspecs, cwd=ELRS_REPO_DIR)
+
+    if newCheckout:
+        runCommand(['git', 'sparse-checkout', 'init', '--cone'], cwd=ELRS_REPO_DIR)
+        runCommand(['git', 'sparse-checkout', 'set', 'src'], cwd=ELRS_REPO_DIR)
+        if branch is not None:
+            commit = heads.get(f"refs/heads/{branch}", heads[f"refs/remotes/origin/{branch}"])
+            runCommand(['git', 'checkout', '-B', branch, commit], cwd=ELRS_REPO_DIR)
+            runCommand(['git', 'branch', '--set-upstream-to', f"origin/{branch}"], cwd=ELRS_REPO_DIR)
+        else:
+            logger.warning("ExpressLRS bundle has no branches, checkout left empty")
+
+    # bundle is as fresh as fetch, so pulls within fetch TTL don't need network
+    writeFetchStamp()
+
+    logger.info(f"Successfully imported ExpressLRS bundle [{path}]")
+
+
 # Reset current ExpressLRS local repository to specific branch
+@measuredOperation("reset")
+@repositoryLock(exclusive=True)
 def resetElrsLocalRepositoryToBranch(branch):
     logger.info(f"Resetting ExpressLRS local repository to remote '{branch}' branch")
 
     os.chdir(ELRS_REPO_DIR)
 
-    subprocess.check_call(['git', '--version'])
-    subprocess.check_call(['git', 'reset', '--hard', 'origin/' + branch])
+    runCommand(['git', '--version'])
+    runCommand(['git', 'reset', '--hard', 'origin/' + branch])
 
     logger.info(f"Successfully reset ExpressLRS local repository to remote '{branch}' branch")
 
 
+PIO_INTERPOLATION = re.compile(r"\$\{([^.}()]+)\.([^}]+)\}")
+
+
+# Split PlatformIO multi-value option the same way PlatformIO does - by lines, or by ', ' for single line values
+def parsePioMultiValues(value):
+    values = []
+    for item in value.split("\n" if "\n" in value else ", "):
+        item = item.split(";", 1)[0].strip()
+        if item and not item.startswith("#"):
+            values.append(item)
+    return values
+
+
+# platformio.ini and files matched by its 'extra_configs', in PlatformIO read order
+def pioConfigFiles():
+    mainConfig = os.path.join(srcdir, "platformio.ini")
+    configFiles = [mainConfig]
+
+    config = configparser.ConfigParser(interpolation=None, strict=False, inline_comment_prefixes=("#", ";"))
+    config.read(mainConfig, encoding="utf-8")
+    if config.has_option("platformio", "extra_configs"):
+        for pattern in parsePioMultiValues(config.get("platformio", "extra_configs")):
+            configFiles.extend(sorted(glob.glob(os.path.join(srcdir, pattern))))
+
+    return configFiles
+
+
+# Sections in PlatformIO lookup order for environment - the environment itself, its 'extends' (last listed first,
+# recursively) and finally common [env] section
+def pioSectionChain(config, section):
+    queue = ["env", section] if section.startswith("env:") else [section]
+    chain = []
+    while queue:
+        current = queue.pop()
+        if current in chain:
+            continue
+        chain.append(current)
+        if config.has_option(current, "extends"):
+            queue.extend(parsePioMultiValues(config.get(current, "extends")))
+    return [current for current in chain if config.has_section(current)]
+
+
+# Resolve option value of section with PlatformIO 'extends' inheritance and '${section.option}' interpolation
+def resolvePioOption(config, section, option, depth=0):
+    for current in pioSectionChain(config, section):
+        if config.has_option(current, option):
+            return interpolatePioValue(config, section, config.get(current, option), depth).strip()
+    return None
+
+
+def interpolatePioValue(config, section, value, depth):
+    if depth > 10:
+        return value
+
+    def substitute(match):
+        refSection, refOption = match.group(1), match.group(2)
+        if refSection == "sysenv":
+            return os.environ.get(refOption, "")
+        if refSection == "this":
+            refSection = section
+        resolved = resolvePioOption(config, refSection, refOption, depth + 1)
+        # unknown references, like PlatformIO built-in ${platformio.packages_dir}, are kept as they are
+        return match.group(0) if resolved is None else resolved
+
+    return PIO_INTERPOLATION.sub(substitute, value)
+
+
+# Parse PlatformIO configuration into catalog of fully resolved build targets
+def buildTargetsCatalog(configFiles):
+    config = configparser.ConfigParser(interpolation=None, strict=False, inline_comment_prefixes=("#", ";"))
+    config.read(configFiles, encoding="utf-8")
+
+    targets = []
+    for section in config.sections():
+        if not section.startswith("env:"):
+            continue
+
+        options = {}
+        for current in pioSectionChain(config, section):
+            for option in config.options(current):
+                if option not in options and option != "extends":
+                    options[option] = resolvePioOption(config, section, option)
+
+        targets.append({
+            "name": section[len("env:"):],
+            "extends": pioSectionChain(config, section)[1:],
+            "board": options.get("board"),
+            "platform": options.get("platform"),
+            "framework": options.get("framework"),
+            "upload_protocol": options.get("upload_protocol"),
+            "build_flags": parsePioMultiValues(options.get("build_flags") or ""),
+            "options": options,
+        })
+
+    return targets
+
+
+# ExpressLRS PlatformIO build targets catalog, memoized per content hash of PlatformIO configuration files
+def loadTargetsCatalog():
+    configFiles = pioConfigFiles()
+
+    digest = hashlib.sha256()
+    for configFile in configFiles:
+        with open(configFile, "rb") as config:
+            content = config.read()
+        digest.update(os.path.relpath(configFile, srcdir).encode("utf-8") + b"\0" + content + b"\0")
+        # resolved values depend on environment variables referenced by ${sysenv.*} too
+        for name in sorted(set(re.findall(rb"\$\{sysenv\.([^}]+)\}", content))):
+            digest.update(name + b"=" + os.environ.get(name.decode("utf-8"), "").encode("utf-8") + b"\0")
+    configHash = digest.hexdigest()
+
+    cachePath = os.path.join(TARGETS_CACHE_DIR, f"{configHash}.json")
+    try:
+        with open(cachePath, encoding="utf-8") as cacheFile:
+            catalog = json.load(cacheFile)
+        os.utime(cachePath)
+        return catalog
+    except (OSError, ValueError):
+        pass
+
+    logger.debug(f"Parsing ExpressLRS PlatformIO build targets from {len(configFiles)} configuration files")
+    catalog = {"hash": configHash, "targets": buildTargetsCatalog(configFiles)}
+
+    os.makedirs(TARGETS_CACHE_DIR, exist_ok=True)
+    tmpPath = f"{cachePath}.{os.getpid()}.tmp"
+    with open(tmpPath, "w", encoding="utf-8") as cacheFile:
+        json.dump(catalog, cacheFile)
+    os.replace(tmpPath, cachePath)
+
+    # keep catalogs of recently used branches only
+    cached = sorted(glob.glob(os.path.join(TARGETS_CACHE_DIR, "*.json")), key=os.path.getmtime, reverse=True)
+    for stalePath in cached[TARGETS_CACHE_ENTRIES:]:
+        os.remove(stalePath)
+
+    return catalog
+
+
+# ExpressLRS PlatformIO build targets catalog of current checkout, or of worktree of specific ref
+def listElrsTargets(ref=args.ref):
+    with worktreeCheckout(ref), repositoryLock(exclusive=False):
+        return loadTargetsCatalog()
+
+
+# Resolve branch (remote), tag or commit to commit hash
+def resolveElrsRef(ref):
+    for candidate in [f"refs/remotes/origin/{ref}", f"refs/tags/{ref}", ref]:
+        try:
+            return captureCommand(['git', 'rev-parse', '--verify', '--quiet', f"{candidate}^{{commit}}"],
+                                  cwd=ELRS_REPO_DIR)
+        except subprocess.CalledProcessError:
+            pass
+
+    logger.error(f"Unable to find ExpressLRS branch, tag or commit [{ref}]")
+    sys.exit(1)
+
+
+# Remove least recently used ref worktrees, together with their build dirs, above max count
+def evictWorktrees(maxWorktrees, keep):
+    worktrees = sorted((entry for entry in os.scandir(WORKTREES_DIR) if entry.is_dir() and entry.path != keep),
+                       key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in worktrees[max(0, maxWorktrees - 1):]:
+        logger.info(f"Removing least recently used ExpressLRS worktree [{entry.name}]")
+        try:
+            runCommand(['git', 'worktree', 'remove', '--force', entry.path], cwd=ELRS_REPO_DIR)
+        except subprocess.CalledProcessError:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            runCommand(['git', 'worktree', 'prune'], cwd=ELRS_REPO_DIR)
+
+
+# Lazily create (or move to latest ref commit) sparse worktree of ExpressLRS for ref, with its own persistent
+# PlatformIO build dir. Returns worktree path
+def prepareWorktree(ref, maxWorktrees=args.max_worktrees):
+    commit = resolveElrsRef(ref)
+    path = os.path.join(WORKTREES_DIR, "".join(c if c.isalnum() or c in "-_." else "_" for c in ref))
+
+    if not os.path.isfile(os.path.join(path, ".git")):
+        logger.info(f"Creating ExpressLRS worktree for [{ref}] in [{path}]")
+        shutil.rmtree(path, ignore_errors=True)
+        runCommand(['git', 'worktree', 'prune'], cwd=ELRS_REPO_DIR)
+        runCommand(['git', 'worktree', 'add', '--no-checkout', '--detach', path, commit], cwd=ELRS_REPO_DIR)
+        runCommand(['git', 'sparse-checkout', 'set', 'src'], cwd=path)
+        runCommand(['git', 'reset', '--quiet', '--hard', commit], cwd=path)
+    elif captureCommand(['git', 'rev-parse', 'HEAD'], cwd=path) != commit:
+        logger.info(f"Updating ExpressLRS worktree for [{ref}] to commit {commit}")
+        runCommand(['git', 'reset', '--quiet', '--hard', commit], cwd=path)
+
+    # builds of every ref use user defines edited in main ExpressLRS checkout
+    userDefinesPath = os.path.join(ELRS_REPO_DIR, "src", "user_defines.txt")
+    if os.path.isfile(userDefinesPath):
+        shutil.copyfile(userDefinesPath, os.path.join(path, "src", "user_defines.txt"))
+
+    # worktree directory modification time is its last use time for LRU eviction
+    os.utime(path)
+    evictWorktrees(maxWorktrees, path)
+
+    return path
+
+
+# Point checkoutDir and srcdir to worktree of ref for duration of the block, no-op without ref
+@contextlib.contextmanager
+def worktreeCheckout(ref):
+    global checkoutDir, srcdir
+
+    if ref is None:
+        yield
+        return
+
+    previous = (checkoutDir, srcdir)
+    with repositoryLock(exclusive=True):
+        checkoutDir = prepareWorktree(ref)
+    srcdir = os.path.join(checkoutDir, "src")
+    try:
+        yield
+    finally:
+        checkoutDir, srcdir = previous
+
+
+# List PlatformIO environments declared in ExpressLRS PlatformIO configuration
+def listPioEnvironments():
+    return [target["name"] for target in loadTargetsCatalog()["targets"]]
+
+
+# Expand '-t (target)' expression - comma separated target names and/or glob patterns - to list of targets
+def expandBuildTargets(targetExpression):
+    targets = []
+    environments = None
+    for pattern in targetExpression.replace(",", " ").split():
+        if any(c in pattern for c in "*?["):
+            if environments is None:
+                environments = listPioEnvironments()
+            matched = fnmatch.filter(environments, pattern)
+            if not matched:
+                logger.error(f"ExpressLRS CLI target pattern [{pattern}] does not match any PlatformIO environment")
+                sys.exit(1)
+            targets.extend(matched)
+        else:
+            targets.append(pattern)
+
+    # drop duplicates, keeping order
+    return list(dict.fromkeys(targets))
+
+
+# Ref name, commit and commit time of sources being built - recorded together with firmware sizes
+def buildRevision(ref=None):
+    try:
+        commit, commitTime = captureCommand(['git', 'log', '-1', '--format=%H %ct', 'HEAD'], cwd=checkoutDir).split()
+        # local branch is reset to whatever branch or tag is built ('-r'), so its name says nothing
+        if ref is None:
+            ref = listElrsRefs()["current"] or commit[:7]
+    except (OSError, subprocess.CalledProcessError, ValueError) as error:
+        logger.warning(f"Unable to determine ExpressLRS commit, firmware size not recorded: {error}")
+        return None
+
+    return {"ref": ref, "commit": commit, "commit_time": int(commitTime)}
+
+
+# Sizes of sections occupying memory (flash or RAM) in ELF file, empty when file is missing or not ELF
+def elfSectionSizes(path):
+    try:
+        with open(path, "rb") as elfFile:
+            data = elfFile.read()
+    except OSError:
+        return {}
+
+    if data[:4] != b"\x7fELF" or data[4] not in (1, 2) or data[5] not in (1, 2):
+        return {}
+
+    is64 = data[4] == 2
+    endian = "<" if data[5] == 1 else ">"
+    try:
+        if is64:
+            shoff, = struct.unpack_from(endian + "Q", data, 0x28)
+            shentsize, shnum, shstrndx = struct.unpack_from(endian + "HHH", data, 0x3A)
+            header = endian + "IIQQQQ"
+        else:
+            shoff, = struct.unpack_from(endian + "I", data, 0x20)
+            shentsize, shnum, shstrndx = struct.unpack_from(endian + "HHH", data, 0x2E)
+            header = endian + "IIIIII"
+
+        sections = [struct.unpack_from(header, data, shoff + index * shentsize) for index in range(shnum)]
+        namesOffset = sections[shstrndx][4]
+
+        sizes = {}
+        for nameIndex, sectionType, flags, _, _, size in sections:
+            # SHF_ALLOC sections only - debug info and symbol tables don't end up on device
+            if not flags & 0x2 or size == 0:
+                continue
+            nameStart = namesOffset + nameIndex
+            name = data[nameStart:data.index(b"\0", nameStart)].decode("ascii", "replace")
+            sizes[name] = size
+        return sizes
+    except (struct.error, IndexError, ValueError):
+        return {}
+
+
+def openSizeHistory():
+    os.makedirs(ELRS_CACHE_DIR, exist_ok=True)
+    connection = sqlite3.connect(SIZE_HISTORY_PATH, timeout=30)
+    connection.execute("""CREATE TABLE IF NOT EXISTS builds (
+        id INTEGER PRIMARY KEY,
+        target TEXT NOT NULL,
+        ref TEXT,
+        commit_sha TEXT NOT NULL,
+        commit_time INTEGER NOT NULL,
+        built_time REAL NOT NULL,
+        duration REAL,
+        flash_used INTEGER,
+        flash_max INTEGER,
+        ram_used INTEGER,
+        ram_max INTEGER,
+        sections TEXT
+    )""")
+    connection.execute("CREATE INDEX IF NOT EXISTS builds_target_commit ON builds (target, commit_time)")
+    return connection
+
+
+# Record firmware size of successful build into local SQLite size history
+def recordBuildSize(target, revision, memory, duration):
+    if revision is None:
+        return
+
+    flash = memory.get("flash", {})
+    ram = memory.get("ram", {})
+    sections = elfSectionSizes(os.path.join(pioBuildDir(target), "firmware.elf"))
+
+    try:
+        with contextlib.closing(openSizeHistory()) as connection, connection:
+            connection.execute(
+                "INSERT INTO builds (target, ref, commit_sha, commit_time, built_time, duration, flash_used, "
+                "flash_max, ram_used, ram_max, sections) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (target, revision["ref"], revision["commit"], revision["commit_time"], time.time(),
+                 round(duration, 1), flash.get("used"), flash.get("max"), ram.get("used"), ram.get("max"),
+                 json.dumps(sections)))
+    except sqlite3.Error as error:
+        logger.warning(f"Unable to record ExpressLRS target [{target}] firmware size: {error}")
+
+
+# Firmware size history of targets (target names and/or glob patterns), latest build of each commit, oldest first.
+# Each entry has size change against previous entry of the same target
+def sizeReport(target, since=None):
+    if target is None:
+        logger.info("ExpressLRS CLI '--report size' needs '-t (target)' parameter")
+        sys.exit(1)
+
+    sinceTime = 0
+    if since is not None:
+        commit = resolveElrsRef(since)
+        sinceTime = int(captureCommand(['git', 'log', '-1', '--format=%ct', commit], cwd=ELRS_REPO_DIR))
+
+    patterns = target.replace(",", " ").split()
+
+    with contextlib.closing(openSizeHistory()) as connection:
+        connection.row_factory = sqlite3.Row
+        rows = connection.execute(
+            "SELECT * FROM builds WHERE commit_time >= ? AND id IN "
+            "(SELECT MAX(id) FROM builds GROUP BY target, commit_sha) ORDER BY target, commit_time, built_time",
+            (sinceTime,)).fetchall()
+
+    report = []
+    previous = {}
+    for row in rows:
+        if not any(fnmatch.fnmatchcase(row["target"], pattern) for pattern in patterns):
+            continue
+
+        entry = {key: row[key] for key in ["target", "ref", "commit_time", "built_time", "duration", "flash_used",
+                                            "flash_max", "ram_used", "ram_max"]}
+        entry["commit"] = row["commit_sha"]
+        entry["sections"] = json.loads(row["sections"] or "{}")
+
+        last = previous.get(row["target"])
+        for key in ["flash_used", "ram_used"]:
+            delta = key.replace("_used", "_delta")
+            entry[delta] = None if last is None or None in (last[key], entry[key]) else entry[key] - last[key]
+        previous[row["target"]] = entry
+        report.append(entry)
+
+    return report
+
+
+def formatSizeChange(delta):
+    return "" if delta is None else f"{delta:+d}"
+
+
+# Prometheus metrics of single target build, result is 'success', 'failure' or 'cached'
+def recordBuildMetrics(target, result, duration):
+    incCounter("elrs_builds_total", "ExpressLRS target builds by result", {"target": target, "result": result})
+    if result != "cached":
+        observeHistogram("elrs_build_duration_seconds", "ExpressLRS target build duration", duration,
+                         BUILD_DURATION_BUCKETS)
+
+
+# Prometheus metrics of single firmware flash
+def recordFlashMetrics(port, success, duration):
+    incCounter("elrs_flashes_total", "ExpressLRS firmware flashes by serial port and result",
+               {"port": port, "result": "success" if success else "failure"})
+    observeHistogram("elrs_flash_duration_seconds", "ExpressLRS firmware flash duration", duration,
+                     FLASH_DURATION_BUCKETS, {"port": port})
+
+
+# Build single target as part of parallel build, prefixing its output lines with target name. Without autoClean
+# PlatformIO doesn't remove build dir shared with other targets when project checksum changed
+def pioBuildWorker(target, pioJobs, outputLock, fingerprint, revision, autoClean=True):
+    startTime = time.monotonic()
+
+    key = artifactCacheKey(fingerprint, target) if fingerprint else None
+    if key and restoreCachedArtifact(key, target):
+        logger.info(f"ExpressLRS target [{target}] firmware restored from artifact cache [{key}]")
+        emitEvent("done", target=target, success=True, returncode=0, cached=True)
+        recordBuildMetrics(target, "cached", time.monotonic() - startTime)
+        return {"target": target, "success": True, "returncode": 0, "cached": True,
+                "duration": round(time.monotonic() - startTime, 1)}
+
+    progress = PioProgressParser(target, loadProgressTotals().get(target))
+    emitEvent("start", target=target)
+    command = ['pio', 'run', '--project-dir', srcdir, '--environment', target, '--jobs', str(pioJobs)]
+    if not autoClean:
+        command.append('--disable-auto-clean')
+    returncode = runPrefixedCommand(command, target, outputLock, lineParser=progress, step=f"pio build {target}")
+    progress.finish(returncode)
+    recordBuildMetrics(target, "success" if returncode == 0 else "failure", time.monotonic() - startTime)
+
+    if returncode == 0:
+        recordBuildSize(target, revision, progress.memory, time.monotonic() - startTime)
+        if key:
+            storeArtifact(key, fingerprint, target)
+
+    return {"target": target, "success": returncode == 0, "returncode": returncode, "cached": False,
+            "duration": round(time.monotonic() - startTime, 1)}
+
+
+# Build multiple targets through bounded pool, each target in its own PlatformIO build dir (.pio/build/<target>)
+def pioBuildParallel(targets, jobs=None, fingerprint=None, revision=None):
+    cpuCount = os.cpu_count() or 1
+    workers = max(1, min(len(targets), jobs or cpuCount // 2 or 1))
+    pioJobs = max(1, cpuCount // workers)
+
+    logger.info(f"Executing PlatformIO CLI 'build' from directory [{srcdir}] for {len(targets)} ExpressLRS targets "
+                f"with {workers} parallel builds: {', '.join(targets)}")
+
+    outputLock = threading.Lock()
+
+    # PlatformIO removes whole .pio/build when project checksum changed (first build, reset to ref with different
+    # platformio.ini or source files), which must not happen under concurrently compiling targets. Targets are built
+    # one by one until PlatformIO actually ran once and cleaned it if needed, the rest runs with auto-clean disabled
+    results = []
+    remaining = list(targets)
+    while remaining and all(result["cached"] for result in results):
+        results.append(pioBuildWorker(remaining.pop(0), cpuCount, outputLock, fingerprint, revision))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results += executor.map(lambda target: pioBuildWorker(target, pioJobs, outputLock, fingerprint, revision,
+                                                               autoClean=False), remaining)
+
+    for result in results:
+        status = "SUCCESS" if result["success"] else f"FAILED ({result['returncode']})"
+        if result["cached"]:
+            status += " (cached)"
+        logger.info(f"ExpressLRS target [{result['target']}] build {status} in {result['duration']}s")
+
+    failed = [result["target"] for result in results if not result["success"]]
+    if failed:
+        logger.error(f"Failed building ExpressLRS targets: {', '.join(failed)}")
+    else:
+        logger.info("Successfully built all ExpressLRS targets")
+
+    return results
+
+
+progressTotalsLock = threading.Lock()
+
+
+def loadProgressTotals():
+    try:
+        with open(PROGRESS_TOTALS_PATH, encoding="utf-8") as totalsFile:
+            return json.load(totalsFile)
+    except (OSError, ValueError):
+        return {}
+
+
+# Remember number of compiled files of target's full build, used as progress total of its next builds
+def saveProgressTotal(target, compiled):
+    with progressTotalsLock:
+        totals = loadProgressTotals()
+        totals[target] = compiled
+        os.makedirs(ELRS_CACHE_DIR, exist_ok=True)
+        tmpPath = f"{PROGRESS_TOTALS_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmpPath, "w", encoding="utf-8") as totalsFile:
+            json.dump(totals, totalsFile)
+        os.replace(tmpPath, PROGRESS_TOTALS_PATH)
+
+
+# Parser of streamed PlatformIO 'run' output, emitting phase, progress, diagnostics and memory usage events
+class PioProgressParser:
+
+    PHASES = [
+        ("Processing ", "configure"),
+        ("Library Manager:", "dependencies"),
+        ("LDF:", "dependencies"),
+        ("Compiling ", "compile"),
+        ("Archiving ", "archive"),
+        ("Indexing ", "archive"),
+        ("Linking ", "link"),
+        # not "Building in release mode" printed before compilation
+        ("Building .pio", "image"),
+        ("Checking size ", "size"),
+        ("Uploading ", "upload"),
+    ]
+    MEMORY = re.compile(r"^(RAM|Flash):\s*\[.*\]\s*([\d.]+)% \(used (\d+) bytes from (\d+) bytes\)")
+    DIAGNOSTIC = re.compile(r"^(.+?):(\d+):(?:(\d+):)? (warning|error): (.*)$")
+
+    def __init__(self, target, total=None):
+        self.target = target
+        self.total = total
+        self.phase = None
+        self.compiled = 0
+        self.warnings = 0
+        self.errors = 0
+        self.memory = {}
+
+    def __call__(self, line):
+        line = line.strip()
+
+        for prefix, phase in self.PHASES:
+            if line.startswith(prefix):
+                if phase != self.phase:
+                    self.phase = phase
+                    emitEvent("phase", target=self.target, phase=phase)
+                if phase == "compile":
+                    self.compiled += 1
+                    total = max(self.total, self.compiled) if self.total else None
+                    emitEvent("progress", target=self.target, compiled=self.compiled, total=total)
+                return
+
+        match = self.MEMORY.match(line)
+        if match:
+            section = match.group(1).lower()
+            self.memory[section] = {"used": int(match.group(3)), "max": int(match.group(4)),
+                                    "percent": float(match.group(2))}
+            emitEvent("memory", target=self.target, section=section, **self.memory[section])
+            return
+
+        match = self.DIAGNOSTIC.match(line)
+        if match:
+            severity = match.group(4)
+            if severity == "warning":
+                self.warnings += 1
+            else:
+                self.errors += 1
+            emitEvent(severity, target=self.target, file=match.group(1), line=int(match.group(2)),
+                      message=match.group(5))
+
+    def finish(self, returncode):
+        # builds compiling nothing were incremental, they don't tell how many files full build has
+        if returncode == 0 and self.compiled and self.compiled >= (self.total or 0):
+            saveProgressTotal(self.target, self.compiled)
+        emitEvent("done", target=self.target, success=returncode == 0, returncode=returncode,
+                  compiled=self.compiled, warnings=self.warnings, errors=self.errors, memory=self.memory)
+
+
+# PlatformIO build dir of specific target
+def pioBuildDir(target):
+    return os.path.join(srcdir, ".pio", "build", target)
+
+
+toolchainVersion = None
+
+
+# Fingerprint of everything, except target, that firmware depends on - None when it can not be determined
+def sourceFingerprint():
+    global toolchainVersion
+
+    try:
+        if toolchainVersion is None:
+            toolchainVersion = captureCommand(['pio', '--version'])
+
+        tree = captureCommand(['git', 'rev-parse', 'HEAD:src'], cwd=checkoutDir)
+        # uncommitted changes to tracked files are not part of the tree hash
+        changes = captureOutput(['git', 'diff', 'HEAD', '--binary', '--', 'src'], cwd=checkoutDir)
+    except (OSError, subprocess.CalledProcessError) as error:
+        logger.warning(f"Unable to fingerprint ExpressLRS sources, artifact cache disabled: {error}")
+        return None
+
+    # resolved user defines are only active ones, so comments and formatting don't invalidate cache
+    userDefines = []
+    userDefinesPath = os.path.join(srcdir, "user_defines.txt")
+    if os.path.isfile(userDefinesPath):
+        with open(userDefinesPath, encoding="utf-8", errors="replace") as userDefinesFile:
+            for line in userDefinesFile:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    userDefines.append(line)
+
+    return {
+        "tree": tree,
+        "changes": hashlib.sha256(changes).hexdigest(),
+        "user_defines": hashlib.sha256("\n".join(userDefines).encode("utf-8")).hexdigest(),
+        "build_flags": os.environ.get("PLATFORMIO_BUILD_FLAGS", ""),
+        "toolchain": toolchainVersion,
+    }
+
+
+def artifactCacheKey(fingerprint, target):
+    return hashlib.sha256(json.dumps(dict(fingerprint, target=target), sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def artifactLayout(entryDir):
+    try:
+        with open(os.path.join(entryDir, "meta.json"), encoding="utf-8") as metaFile:
+            return json.load(metaFile).get("layout", 1)
+    except (OSError, ValueError):
+        return 0
+
+
+# Images of build dir matching ARTIFACT_PATTERNS
+def buildImages(buildDir):
+    if not os.path.isdir(buildDir):
+        return []
+    return sorted(name for name in os.listdir(buildDir) if os.path.isfile(os.path.join(buildDir, name)) and
+                  any(fnmatch.fnmatch(name, pattern) for pattern in ARTIFACT_PATTERNS))
+
+
+# Restore cached firmware of target into its build dir, returns False on cache miss
+def restoreCachedArtifact(key, target):
+    entryDir = os.path.join(ARTIFACT_CACHE_DIR, key)
+    if not os.path.isfile(os.path.join(entryDir, "meta.json")) or artifactLayout(entryDir) < ARTIFACT_LAYOUT:
+        incCounter("elrs_artifact_cache_misses_total", "ExpressLRS firmware artifact cache misses")
+        return False
+    incCounter("elrs_artifact_cache_hits_total", "ExpressLRS firmware artifact cache hits")
+
+    buildDir = pioBuildDir(target)
+    os.makedirs(buildDir, exist_ok=True)
+
+    # SCons state of build dir belongs to another build and decides from inputs only, so it would take restored images
+    # for up to date outputs of next real build of different sources. Without it the next build relinks everything
+    for sconsign in glob.glob(os.path.join(buildDir, ".sconsign*")):
+        os.remove(sconsign)
+
+    for name in os.listdir(entryDir):
+        if name != "meta.json":
+            shutil.copy2(os.path.join(entryDir, name), os.path.join(buildDir, name))
+
+    # modification time of meta.json is the last use time for LRU eviction
+    os.utime(os.path.join(entryDir, "meta.json"))
+    return True
+
+
+# Store firmware of freshly built target into artifact cache
+def storeArtifact(key, fingerprint, target):
+    buildDir = pioBuildDir(target)
+    artifacts = buildImages(buildDir)
+    if not any(name.startswith("firmware.") for name in artifacts):
+        logger.warning(f"No firmware files found in [{buildDir}], ExpressLRS target [{target}] not cached")
+        return
+
+    entryDir = os.path.join(ARTIFACT_CACHE_DIR, key)
+    tmpDir = f"{entryDir}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(tmpDir, ignore_errors=True)
+    os.makedirs(tmpDir)
+    for name in artifacts:
+        shutil.copy2(os.path.join(buildDir, name), os.path.join(tmpDir, name))
+    with open(os.path.join(tmpDir, "meta.json"), "w", encoding="utf-8") as metaFile:
+        json.dump({"target": target, "fingerprint": fingerprint, "artifacts": artifacts, "layout": ARTIFACT_LAYOUT,
+                   "created": time.time()}, metaFile, indent=2)
+
+    # incomplete entry of older layout is replaced
+    if os.path.isdir(entryDir) and artifactLayout(entryDir) < ARTIFACT_LAYOUT:
+        shutil.rmtree(entryDir, ignore_errors=True)
+
+    try:
+        os.rename(tmpDir, entryDir)
+    except OSError:
+        # same artifact stored concurrently, keep existing one
+        shutil.rmtree(tmpDir, ignore_errors=True)
+
+
+def directorySize(path):
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+# Evict least recently used artifacts until cache fits its size cap
+def evictArtifacts(maxSizeMb):
+    if not os.path.isdir(ARTIFACT_CACHE_DIR):
+        return
+
+    entries = []
+    for entry in os.scandir(ARTIFACT_CACHE_DIR):
+        metaPath = os.path.join(entry.path, "meta.json")
+        if entry.is_dir() and os.path.isfile(metaPath):
+            entries.append((os.path.getmtime(metaPath), directorySize(entry.path), entry.path))
+
+    totalSize = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if totalSize <= maxSizeMb * 1024 * 1024:
+            break
+        logger.info(f"Evicting least recently used ExpressLRS artifact [{os.path.basename(path)}]")
+        shutil.rmtree(path, ignore_errors=True)
+        totalSize -= size
+
+
 # ExpressLRS PlatformIO build target function
-def pioBuild(target):
+@measuredOperation("build")
+def pioBuild(target, jobs=None, useCache=not args.no_cache, cacheMaxSize=args.cache_max_size, ref=args.ref):
     if target is None:
         logger.info("ExpressLRS CLI '-b (build)' needs '-t (target)' parameter")
-        exit(1)
-    else:
-        logger.info(f"ExpressLRS CLI build target: {target}")
-        logger.info("Executing PlatformIO CLI 'build' from directory [{srcdir}] for ExpressLRS target [{target}] firmware")
-        subprocess.check_call(['pio', 'run', '--project-dir', srcdir, '--environment', target])
-        logger.info("Successfully executed PlatformIO CLI 'build' for ExpressLRS target [{target}] firmware")
+        sys.exit(1)
+
+    with worktreeCheckout(ref), repositoryLock(exclusive=False):
+        targets = expandBuildTargets(target)
+        fingerprint = sourceFingerprint() if useCache else None
+        revision = buildRevision(ref)
+
+        try:
+            if len(targets) > 1:
+                return pioBuildParallel(targets, jobs, fingerprint, revision)
+
+            target = targets[0]
+            logger.info(f"ExpressLRS CLI build target: {target}")
+
+            key = artifactCacheKey(fingerprint, target) if fingerprint else None
+            if key and restoreCachedArtifact(key, target):
+                logger.info(f"ExpressLRS target [{target}] firmware restored from artifact cache [{key}]")
+                emitEvent("done", target=target, success=True, returncode=0, cached=True)
+                recordBuildMetrics(target, "cached", 0)
+                return
+
+            logger.info(f"Executing PlatformIO CLI 'build' from directory [{srcdir}] for ExpressLRS target [{target}] "
+                        "firmware")
+            command = ['pio', 'run', '--project-dir', srcdir, '--environment', target]
+            progress = PioProgressParser(target, loadProgressTotals().get(target))
+
+            def passLine(line):
+                sys.stdout.write(line)
+                sys.stdout.flush()
+                progress(line)
 
+            emitEvent("start", target=target)
+            startTime = time.monotonic()
+            returncode = streamCommand(command, passLine, step=f"pio build {target}")
+            progress.finish(returncode)
+            recordBuildMetrics(target, "success" if returncode == 0 else "failure", time.monotonic() - startTime)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, command)
+            logger.info(f"Successfully executed PlatformIO CLI 'build' for ExpressLRS target [{target}] firmware")
 
-# ExpressLRS PlatformIO upload target function
-def pioUpload(target):
+            recordBuildSize(target, revision, progress.memory, time.monotonic() - startTime)
+
+            if key:
+                storeArtifact(key, fingerprint, target)
+        finally:
+            if fingerprint:
+                evictArtifacts(cacheMaxSize)
+
+
+# Check if last build of target left firmware in its build dir
+def hasBuiltFirmware(target):
+    return any(name.startswith("firmware.") for name in buildImages(pioBuildDir(target)))
+
+
+# Make sure firmware of target is in its build dir without building it - from artifact cache or last build.
+# Returns False when target has to be built before upload
+def prepareUploadFirmware(target, artifact, rebuild, useCache):
+    if artifact is not None:
+        metaPath = os.path.join(ARTIFACT_CACHE_DIR, artifact, "meta.json")
+        if not os.path.isfile(metaPath):
+            logger.error(f"ExpressLRS artifact [{artifact}] not found in artifact cache")
+            sys.exit(1)
+        with open(metaPath, encoding="utf-8") as metaFile:
+            artifactTarget = json.load(metaFile)["target"]
+        if artifactTarget != target:
+            logger.error(f"ExpressLRS artifact [{artifact}] is built for target [{artifactTarget}], not [{target}]")
+            sys.exit(1)
+        if restoreCachedArtifact(artifact, target):
+            logger.info(f"Uploading cached firmware for ExpressLRS target [{target}] without rebuilding it")
+            return True
+        logger.warning(f"ExpressLRS artifact [{artifact}] misses images flashed with firmware, not uploading it")
+
+    if useCache and artifact is None:
+        fingerprint = sourceFingerprint()
+        if fingerprint is not None and restoreCachedArtifact(artifactCacheKey(fingerprint, target), target):
+            logger.info(f"Uploading cached firmware for ExpressLRS target [{target}] without rebuilding it")
+            return True
+
+    if not rebuild:
+        if not hasBuiltFirmware(target):
+            logger.error(f"No firmware from last build of ExpressLRS target [{target}] found in [{pioBuildDir(target)}]")
+            sys.exit(1)
+        logger.info(f"Uploading firmware from last build of ExpressLRS target [{target}] without rebuilding it")
+        return True
+
+    return False
+
+
+# ExpressLRS PlatformIO upload target function. Cached or already built firmware is flashed directly ('nobuild'),
+# otherwise PlatformIO builds target before uploading it
+@measuredOperation("upload")
+def pioUpload(target, artifact=None, rebuild=not args.no_rebuild, useCache=not args.no_cache, ref=args.ref):
     if target is None:
         logger.info("ExpressLRS CLI '-u (upload)' needs '-t (target)' parameter")
         sys.exit(1)
+
+    with worktreeCheckout(ref), repositoryLock(exclusive=False):
+        command = ['pio', 'run', '--project-dir', srcdir]
+        if prepareUploadFirmware(target, artifact, rebuild, useCache):
+            # with missing or stale project.checksum auto-clean would remove firmware that is about to be flashed
+            command += ['--target', 'nobuild', '--disable-auto-clean']
+        command += ['--target', 'upload', '--environment', target]
+
+        logger.info(f"Executing PlatformIO CLI 'upload' from directory [{srcdir}] for ExpressLRS target [{target}] "
+                    "firmware")
+        startTime = time.monotonic()
+        try:
+            runCommand(command, step=f"pio upload {target}")
+        except subprocess.CalledProcessError:
+            recordFlashMetrics("auto", False, time.monotonic() - startTime)
+            raise
+        recordFlashMetrics("auto", True, time.monotonic() - startTime)
+        logger.info(f"Successfully executed PlatformIO CLI 'upload' for ExpressLRS target [{target}] firmware")
+
+
+# List serial ports matching USB VID:PID, as reported by PlatformIO
+def listSerialPorts(usbId):
+    devices = json.loads(captureCommand(['pio', 'device', 'list', '--serial', '--json-output']))
+    usbId = usbId.upper()
+    return [device["port"] for device in devices if f"VID:PID={usbId}" in device.get("hwid", "").upper()]
+
+
+# Flash already built firmware of target to single serial port. Every port gets its own copy of build dir,
+# so concurrent PlatformIO processes don't share SCons state
+def pioUploadWorker(target, port, outputLock):
+    startTime = time.monotonic()
+
+    portBuildDir = os.path.join(srcdir, ".pio", "flash", "".join(c if c.isalnum() else "_" for c in port))
+    shutil.rmtree(portBuildDir, ignore_errors=True)
+    shutil.copytree(pioBuildDir(target), os.path.join(portBuildDir, target))
+
+    # port build dir has no project.checksum of PlatformIO, auto-clean would remove copied firmware
+    returncode = runPrefixedCommand(['pio', 'run', '--project-dir', srcdir, '--target', 'nobuild', '--target', 'upload',
+                                     '--disable-auto-clean', '--environment', target, '--upload-port', port],
+                                    port, outputLock, env=dict(os.environ, PLATFORMIO_BUILD_DIR=portBuildDir),
+                                    step=f"pio upload {port}")
+
+    recordFlashMetrics(port, returncode == 0, time.monotonic() - startTime)
+    return {"port": port, "success": returncode == 0, "returncode": returncode,
+            "duration": round(time.monotonic() - startTime, 1)}
+
+
+# Flash same firmware of target to multiple serial ports in parallel, returning per-port results
+@measuredOperation("upload-ports")
+def pioUploadPorts(target, ports=None, usbId=None, artifact=None, rebuild=not args.no_rebuild,
+                   useCache=not args.no_cache, jobs=None, ref=args.ref):
+    if target is None:
+        logger.info("ExpressLRS CLI '-u (upload)' needs '-t (target)' parameter")
+        sys.exit(1)
+
+    with worktreeCheckout(ref), repositoryLock(exclusive=False):
+        ports = list(ports or [])
+        if usbId is not None:
+            ports += [port for port in listSerialPorts(usbId) if port not in ports]
+        if not ports:
+            logger.error("No serial ports to flash ExpressLRS firmware to")
+            sys.exit(1)
+
+        # firmware is built at most once, all ports get the same image
+        if not prepareUploadFirmware(target, artifact, rebuild, useCache):
+            pioBuild(target, ref=None)
+
+        workers = max(1, min(len(ports), jobs or len(ports)))
+        logger.info(f"Executing PlatformIO CLI 'upload' for ExpressLRS target [{target}] firmware on {len(ports)} "
+                    f"serial ports with {workers} parallel uploads: {', '.join(ports)}")
+
+        outputLock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda port: pioUploadWorker(target, port, outputLock), ports))
+
+        portWidth = max(len("PORT"), *(len(result["port"]) for result in results))
+        table = [f"{'PORT':<{portWidth}}  RESULT      TIME"]
+        for result in results:
+            status = "SUCCESS" if result["success"] else f"FAILED ({result['returncode']})"
+            table.append(f"{result['port']:<{portWidth}}  {status:<10}  {result['duration']:>6.1f}s")
+        print("\n".join(table))
+        for line in table:
+            logger.info(line)
+
+        failed = [result["port"] for result in results if not result["success"]]
+        if failed:
+            logger.error(f"Failed uploading ExpressLRS target [{target}] firmware to: {', '.join(failed)}")
+        else:
+            logger.info(f"Successfully uploaded ExpressLRS target [{target}] firmware to all serial ports")
+
+        return results
+
+
+# JSON-RPC methods served by '--serve' mode, mapped to CLI functions
+RPC_METHODS = {
+    "clone": cloneElrsGithubRepo,
+    "update-mirror": updateElrsMirror,
+    "export-bundle": exportElrsBundle,
+    "import-bundle": importElrsBundle,
+    "pull": pullElrsGithubRepo,
+    "reset": resetElrsLocalRepositoryToBranch,
+    "build": pioBuild,
+    "upload": pioUpload,
+    "upload-ports": pioUploadPorts,
+    "refs": listElrsRefs,
+    "targets": listElrsTargets,
+    "size-report": sizeReport,
+}
+
+# JSON-RPC 2.0 error codes
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_COMMAND_FAILED = -32000
+
+
+# Failed items of multi-target build or multi-port upload results, empty for other results
+def failedResults(result):
+    if not isinstance(result, list):
+        return []
+    return [item for item in result if isinstance(item, dict) and item.get("success") is False]
+
+
+def rpcError(requestId, code, message, data=None):
+    error = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": requestId, "error": error}
+
+
+# Execute single JSON-RPC request object and return response object (None for notifications)
+def handleRpcRequest(request):
+    if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or not isinstance(request.get("method"), str):
+        return rpcError(None, RPC_INVALID_REQUEST, "Invalid Request")
+
+    requestId = request.get("id")
+    isNotification = "id" not in request
+    method = request["method"]
+    params = request.get("params", [])
+
+    function = RPC_METHODS.get(method)
+    if function is None:
+        response = rpcError(requestId, RPC_METHOD_NOT_FOUND, f"Method not found: {method}")
+        return None if isNotification else response
+
+    try:
+        if isinstance(params, dict):
+            boundParams = inspect.signature(function).bind(**params)
+        elif isinstance(params, list):
+            boundParams = inspect.signature(function).bind(*params)
+        else:
+            raise TypeError("params must be array or object")
+    except TypeError as error:
+        response = rpcError(requestId, RPC_INVALID_PARAMS, f"Invalid params: {error}")
+        return None if isNotification else response
+
+    logger.info(f"ExpressLRS CLI serving JSON-RPC request '{method}' with params {params}")
+
+    try:
+        result = function(*boundParams.args, **boundParams.kwargs)
+        failed = failedResults(result)
+        if failed:
+            # the same failure exit code of CLI, per target (port) results are still returned in error data
+            logger.error(f"JSON-RPC request '{method}' failed for {len(failed)} of {len(result)} items")
+            response = rpcError(requestId, RPC_COMMAND_FAILED, f"Failed for {len(failed)} of {len(result)} items",
+                                {"results": result})
+        else:
+            response = {"jsonrpc": "2.0", "id": requestId, "result": result}
+    except subprocess.CalledProcessError as error:
+        logger.error(f"JSON-RPC request '{method}' failed: {error}")
+        response = rpcError(requestId, RPC_COMMAND_FAILED, str(error),
+                            {"returncode": error.returncode, "command": error.cmd})
+    except SystemExit as error:
+        logger.error(f"JSON-RPC request '{method}' exited with code {error.code}")
+        response = rpcError(requestId, RPC_COMMAND_FAILED, f"Command exited with code {error.code}",
+                            {"returncode": error.code})
+    except Exception as error:
+        logger.exception(f"JSON-RPC request '{method}' failed")
+        response = rpcError(requestId, RPC_COMMAND_FAILED, str(error))
+    finally:
+        # commands change working directory, always start next request from the same place
+        os.chdir(PROJECT_DIR)
+
+    return None if isNotification else response
+
+
+# Stay resident and serve newline-delimited JSON-RPC 2.0 requests from stdin, one response per line on stdout
+def serveJsonRpc():
+    logger.info("Starting ExpressLRS CLI JSON-RPC server")
+
+    # keep original stdout only for responses, everything else (git, pio, print) goes to stderr
+    sys.stdout.flush()
+    rpcOut = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    rpcOutLock = threading.Lock()
+
+    def writeMessage(message):
+        with rpcOutLock:
+            rpcOut.write(json.dumps(message) + "\n")
+            rpcOut.flush()
+
+    # build events are sent as JSON-RPC notifications, interleaved with responses
+    setEventSink(lambda event: writeMessage({"jsonrpc": "2.0", "method": "event", "params": event}))
+
+    os.chdir(PROJECT_DIR)
+
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            response = rpcError(None, RPC_PARSE_ERROR, f"Parse error: {error}")
+        else:
+            if isinstance(request, dict) and request.get("method") == "shutdown":
+                if "id" in request:
+                    writeMessage({"jsonrpc": "2.0", "id": request["id"], "result": None})
+                break
+
+            if isinstance(request, list) and request:
+                response = [r for r in map(handleRpcRequest, request) if r is not None] or None
+            elif isinstance(request, list):
+                response = rpcError(None, RPC_INVALID_REQUEST, "Invalid Request")
+            else:
+                response = handleRpcRequest(request)
+
+        if response is not None:
+            writeMessage(response)
+
+    logger.info("Stopped ExpressLRS CLI JSON-RPC server")
+
+
+setupEvents(args.events)
+
+if args.serve:
+    serveJsonRpc()
+    sys.exit(0)
+
+if args.refs:
+    index = listElrsRefs()
+    if args.json:
+        print(json.dumps(index))
     else:
-        logger.info("Executing PlatformIO CLI 'upload' from directory [{srcdir}] for ExpressLRS target [{target}] firmware")
-        subprocess.check_call(['pio', 'run', '--project-dir', srcdir, '--target', 'upload', '--environment', target])
-        logger.info("Successfully executed PlatformIO CLI 'upload' for ExpressLRS target [{target}] firmware")
+        for name, commit in sorted(index["branches"].items()):
+            print(f"branch {commit} {name}")
+        for name, commit in sorted(index["tags"].items()):
+            print(f"tag    {commit} {name}")
+        print(f"HEAD   {index['head']} {index['current'] or ''}")
+    sys.exit(0)
 
+if args.targets:
+    catalog = listElrsTargets()
+    if args.json:
+        print(json.dumps(catalog))
+    else:
+        for target in catalog["targets"]:
+            print(f"{target['name']:<48} {target['board'] or '':<24} {target['upload_protocol'] or ''}")
+    sys.exit(0)
+
+if args.report == "size":
+    report = sizeReport(args.target, args.since)
+    if args.json:
+        print(json.dumps(report))
+    else:
+        print(f"{'target':<48} {'commit':<9} {'ref':<16} {'flash':>9} {'change':>7} {'ram':>7} {'change':>7}")
+        for entry in report:
+            print(f"{entry['target']:<48} {entry['commit'][:9]:<9} {entry['ref'] or '':<16} "
+                  f"{entry['flash_used'] or '':>9} {formatSizeChange(entry['flash_delta']):>7} "
+                  f"{entry['ram_used'] or '':>7} {formatSizeChange(entry['ram_delta']):>7}")
+    sys.exit(0)
+
+if args.update_mirror:
+    updateElrsMirror(args.update_mirror)
+    sys.exit(0)
 
 if args.clone:
     cloneElrsGithubRepo()
     sys.exit(0)
 
+if args.export_bundle:
+    exportElrsBundle(args.export_bundle)
+    sys.exit(0)
+
+if args.import_bundle:
+    importElrsBundle(args.import_bundle)
+    sys.exit(0)
+
 if args.pull:
     branch = args.pull
     pullElrsGithubRepo(branch)
@@ -153,9 +1618,14 @@ if args.reset:
 target = args.target
 
 if args.build:
-    pioBuild(target)
-    sys.exit(0)
+    results = pioBuild(target, args.jobs)
+    sys.exit(1 if results and not all(result["success"] for result in results) else 0)
+
+if args.upload and (args.port or args.usb_id):
+    ports = args.port.replace(",", " ").split() if args.port else []
+    results = pioUploadPorts(target, ports, args.usb_id, args.artifact, jobs=args.jobs)
+    sys.exit(0 if all(result["success"] for result in results) else 1)
 
 if args.upload:
-    pioUpload(target)
+    pioUpload(target, args.artifact)
     sys.exit(0)
@@ -0,0 +1,213 @@
+#  Copyright 2021 Dimitar Dimitrov | MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+#  associated documentation files (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+#  of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following
+#  conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial
+#  portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+#  INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+#  PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+#  LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT
+#  OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+#  OTHER DEALINGS IN THE SOFTWARE.
+
+#  Importing of archives embedded in bootstrap scripts (get-pip.py, get-platformio.py) as base85/base64 text. Payload
+#  is decoded in bounded chunks, never holding whitespace stripped copy of it. Without cache dir decoded archive is
+#  served to import system straight from memory, without writing it to temp file. With cache dir it is decoded straight
+#  into cache file, once per payload keyed by hash of embedded payload, and imported from disk by zipimport.
+
+import base64
+import hashlib
+import importlib.abc
+import importlib.util
+import io
+import os
+import sys
+import zipfile
+
+# Setup points this to ExpressLRS cache dir, standalone runs of bootstrap scripts don't cache decoded archives
+BOOTSTRAP_CACHE_DIR = os.environ.get("ELRS_BOOTSTRAP_CACHE_DIR") or None
+
+# Payload characters decoded at once, multiple of both base85 (5) and base64 (4) group size
+DECODE_CHUNK_SIZE = 64 * 1000
+
+
+# Decode base85/base64 payload, split to lines, chunk by chunk into output file. Whole groups of each chunk are
+# decoded, partial group is carried over to next chunk
+def streamDecode(payload, output, decodeGroups, groupSize, chunkSize=DECODE_CHUNK_SIZE):
+    newline = b"\n" if isinstance(payload, bytes) else "\n"
+    carry = payload[:0]
+    for start in range(0, len(payload), chunkSize):
+        chunk = carry + payload[start:start + chunkSize].replace(newline, payload[:0])
+        usable = len(chunk) - len(chunk) % groupSize
+        output.write(decodeGroups(chunk[:usable]))
+        carry = chunk[usable:]
+    if carry:
+        output.write(decodeGroups(carry))
+
+
+def decodeBase85(payload, output):
+    streamDecode(payload, output, base64.b85decode, 5)
+
+
+def decodeBase64(payload, output):
+    streamDecode(payload, output, base64.b64decode, 4)
+
+
+# Resources of package inside in-memory archive, for importlib.resources
+class InMemoryResourceReader:
+
+    def __init__(self, importer, packagePath):
+        self.importer = importer
+        self.packagePath = packagePath
+
+    def open_resource(self, resource):
+        return io.BytesIO(self.importer.readMember(f"{self.packagePath}/{resource}"))
+
+    def resource_path(self, resource):
+        # there is no file on disk, importlib.resources falls back to open_resource()
+        raise FileNotFoundError(resource)
+
+    def is_resource(self, name):
+        return f"{self.packagePath}/{name}" in self.importer.members
+
+    def contents(self):
+        prefix = f"{self.packagePath}/"
+        return sorted({name[len(prefix):].split("/")[0] for name in self.importer.members if name.startswith(prefix)})
+
+
+# Meta path finder and loader of pure Python modules and packages from zip archive held in memory. Module __file__
+# and __path__ look like the ones zipimport sets (<archive path>/<package>/<module>.py), so code deriving resource
+# paths from them, like pkgutil.get_data(), works through get_data()
+class InMemoryZipImporter(importlib.abc.MetaPathFinder, importlib.abc.InspectLoader):
+
+    def __init__(self, archivePath, archiveFile):
+        self.archivePath = archivePath
+        self.archive = zipfile.ZipFile(archiveFile)
+        self.members = set(self.archive.namelist())
+
+    def readMember(self, name):
+        try:
+            return self.archive.read(name)
+        except KeyError:
+            raise FileNotFoundError(os.path.join(self.archivePath, name)) from None
+
+    # Archive member of module - (member name, is package), None for modules not in archive
+    def moduleMember(self, fullname):
+        path = fullname.replace(".", "/")
+        if f"{path}/__init__.py" in self.members:
+            return f"{path}/__init__.py", True
+        if f"{path}.py" in self.members:
+            return f"{path}.py", False
+        return None
+
+    def find_spec(self, fullname, path, target=None):
+        member = self.moduleMember(fullname)
+        if member is None:
+            return None
+
+        name, isPackage = member
+        spec = importlib.util.spec_from_loader(fullname, self, origin=os.path.join(self.archivePath, name),
+                                               is_package=isPackage)
+        spec.has_location = True
+        if isPackage:
+            spec.submodule_search_locations = [os.path.join(self.archivePath, fullname.replace(".", "/"))]
+        return spec
+
+    def exec_module(self, module):
+        exec(self.get_code(module.__name__), module.__dict__)
+
+    def get_code(self, fullname):
+        name, _ = self.moduleMember(fullname)
+        return compile(self.get_source(fullname), os.path.join(self.archivePath, name), "exec", dont_inherit=True)
+
+    def get_source(self, fullname):
+        member = self.moduleMember(fullname)
+        if member is None:
+            raise ImportError(f"No module named {fullname!r} in {self.archivePath}", name=fullname)
+        return importlib.util.decode_source(self.readMember(member[0]))
+
+    def is_package(self, fullname):
+        member = self.moduleMember(fullname)
+        if member is None:
+            raise ImportError(f"No module named {fullname!r} in {self.archivePath}", name=fullname)
+        return member[1]
+
+    def get_filename(self, fullname):
+        return os.path.join(self.archivePath, self.moduleMember(fullname)[0])
+
+    def get_data(self, path):
+        prefix = self.archivePath + os.sep
+        if not path.startswith(prefix):
+            raise FileNotFoundError(path)
+        return self.readMember(path[len(prefix):].replace(os.sep, "/"))
+
+    def get_resource_reader(self, fullname):
+        member = self.moduleMember(fullname)
+        if member is None or not member[1]:
+            return None
+        return InMemoryResourceReader(self, fullname.replace(".", "/"))
+
+
+def cachedArchivePath(name, payload):
+    digest = hashlib.sha256()
+    for start in range(0, len(payload), DECODE_CHUNK_SIZE):
+        chunk = payload[start:start + DECODE_CHUNK_SIZE]
+        digest.update(chunk if isinstance(chunk, bytes) else chunk.encode("ascii"))
+    return os.path.join(BOOTSTRAP_CACHE_DIR, f"{name}-{digest.hexdigest()[:32]}.zip")
+
+
+# Decode payload straight into cache file, removing archives of previous payloads of the same script. Cache is
+# optional, returns False when it can't be written
+def storeCachedArchive(name, path, payload, decode):
+    tmpPath = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(BOOTSTRAP_CACHE_DIR, exist_ok=True)
+        with open(tmpPath, "wb") as archiveFile:
+            decode(payload, archiveFile)
+        # concurrent runs write identical content, whichever rename wins is fine
+        os.replace(tmpPath, path)
+    except OSError:
+        try:
+            os.remove(tmpPath)
+        except OSError:
+            pass
+        return False
+
+    for entry in os.listdir(BOOTSTRAP_CACHE_DIR):
+        if entry.startswith(f"{name}-") and entry.endswith(".zip") and entry != os.path.basename(path):
+            try:
+                os.remove(os.path.join(BOOTSTRAP_CACHE_DIR, entry))
+            except OSError:
+                pass
+
+    return True
+
+
+# Make modules of archive embedded in payload importable, taking precedence over installed ones. decode streams
+# payload into file object (decodeBase85, decodeBase64). Cached archive is imported from disk by zipimport, otherwise
+# payload is decoded and served from memory. archiveDir is where in-memory archive pretends to live, it is never
+# written to
+def importBootstrapArchive(name, payload, decode, archiveDir):
+    cachePath = cachedArchivePath(name, payload) if BOOTSTRAP_CACHE_DIR else None
+    if cachePath and os.path.isfile(cachePath) and zipfile.is_zipfile(cachePath):
+        sys.path.insert(0, cachePath)
+        return
+
+    if cachePath and storeCachedArchive(name, cachePath, payload, decode):
+        sys.path.insert(0, cachePath)
+        return
+
+    archive = io.BytesIO()
+    decode(payload, archive)
+
+    # in front of path based finder, the same precedence as zip archive at the front of sys.path has
+    importer = InMemoryZipImporter(os.path.join(archiveDir, f"{name}.zip"), archive)
+    pathFinderIndex = next((index for index, finder in enumerate(sys.meta_path)
+                            if getattr(finder, "__name__", None) == "PathFinder"), len(sys.meta_path))
+    sys.meta_path.insert(pathFinderIndex, importer)
@@ -0,0 +1,51 @@
+#  Copyright 2021 Dimitar Dimitrov | MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+#  associated documentation files (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+#  of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following
+#  conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial
+#  portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+#  INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+#  PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+#  LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT
+#  OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+#  OTHER DEALINGS IN THE SOFTWARE.
+
+#  Structured progress events shared by ExpressLRS CLI (build progress) and its setup application (setup steps). Every
+#  event is dict with event name and time, handed to event sink - newline-delimited JSON file or stderr ('--events'),
+#  or JSON-RPC notification of ExpressLRS CLI '--serve' mode.
+
+import json
+import sys
+import threading
+import time
+
+# Events destination - callable taking event dict, events are dropped while it is not set
+eventSink = None
+eventLock = threading.Lock()
+
+
+def setEventSink(sink):
+    global eventSink
+    eventSink = sink
+
+
+# Write events as newline-delimited JSON to file, '-' for stderr. No destination leaves events off
+def setupEvents(destination):
+    if destination == "-":
+        setEventSink(lambda event: (sys.stderr.write(json.dumps(event) + "\n"), sys.stderr.flush()))
+    elif destination:
+        eventsFile = open(destination, "a", encoding="utf-8", buffering=1)
+        setEventSink(lambda event: eventsFile.write(json.dumps(event) + "\n"))
+
+
+def emitEvent(event, **fields):
+    if eventSink is None:
+        return
+    with eventLock:
+        eventSink(dict(event=event, time=round(time.time(), 3), **fields))
@@ -0,0 +1,122 @@
+#  Copyright 2021 Dimitar Dimitrov | MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+#  associated documentation files (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+#  of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following
+#  conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial
+#  portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+#  INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+#  PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+#  LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT
+#  OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+#  OTHER DEALINGS IN THE SOFTWARE.
+
+#  Cross-process reader/writer lock of ExpressLRS repository. Commands only reading the checkout (builds, uploads)
+#  share the lock, commands changing it (clone, fetch, merge, reset) hold it exclusively. Lock is advisory lock of
+#  lock file - flock() on POSIX, LockFileEx() on Windows - so it is released by OS when process dies.
+
+import ctypes
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Seconds between attempts to take lock held by another process
+LOCK_POLL_INTERVAL = 0.2
+
+LOCKFILE_FAIL_IMMEDIATELY = 0x1
+LOCKFILE_EXCLUSIVE_LOCK = 0x2
+
+
+class LockTimeout(Exception):
+    pass
+
+
+class Overlapped(ctypes.Structure):
+    _fields_ = [("Internal", ctypes.c_void_p), ("InternalHigh", ctypes.c_void_p), ("Offset", ctypes.c_uint32),
+                ("OffsetHigh", ctypes.c_uint32), ("hEvent", ctypes.c_void_p)]
+
+
+# Try to lock file without blocking, returns False when lock is held by another process
+def tryLockFile(lockFile, exclusive):
+    if fcntl is not None:
+        try:
+            fcntl.flock(lockFile.fileno(), (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.LockFileEx.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32,
+                                    ctypes.c_uint32, ctypes.POINTER(Overlapped)]
+    flags = LOCKFILE_FAIL_IMMEDIATELY | (LOCKFILE_EXCLUSIVE_LOCK if exclusive else 0)
+    return bool(kernel32.LockFileEx(msvcrt.get_osfhandle(lockFile.fileno()), flags, 0, 1, 0,
+                                    ctypes.byref(Overlapped())))
+
+
+def unlockFile(lockFile):
+    if fcntl is not None:
+        fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+        return
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.UnlockFileEx.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32,
+                                      ctypes.POINTER(Overlapped)]
+    kernel32.UnlockFileEx(msvcrt.get_osfhandle(lockFile.fileno()), 0, 1, 0, ctypes.byref(Overlapped()))
+
+
+# Reader/writer lock shared by processes through lock file. Reentrant within process - nested acquire only counts,
+# but shared lock can't be upgraded to exclusive one, as two processes upgrading would deadlock
+class ReadWriteFileLock:
+
+    def __init__(self, path):
+        self.path = path
+        self.lockFile = None
+        self.exclusive = False
+        self.depth = 0
+        self.guard = threading.RLock()
+
+    # Take lock, calling onWait once if it is held by another process. Raises LockTimeout after timeout seconds
+    # (None waits forever)
+    def acquire(self, exclusive, timeout=None, onWait=None):
+        with self.guard:
+            if self.depth:
+                if exclusive and not self.exclusive:
+                    raise RuntimeError(f"Shared lock [{self.path}] can't be upgraded to exclusive lock")
+                self.depth += 1
+                return
+
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            lockFile = open(self.path, "a+")
+            deadline = None if timeout is None else time.monotonic() + timeout
+            waiting = False
+            while not tryLockFile(lockFile, exclusive):
+                if not waiting and onWait is not None:
+                    onWait()
+                waiting = True
+                if deadline is not None and time.monotonic() >= deadline:
+                    lockFile.close()
+                    raise LockTimeout(f"Timed out after {timeout}s waiting for lock [{self.path}]")
+                time.sleep(LOCK_POLL_INTERVAL)
+
+            self.lockFile = lockFile
+            self.exclusive = exclusive
+            self.depth = 1
+
+    def release(self):
+        with self.guard:
+            self.depth -= 1
+            if self.depth == 0:
+                unlockFile(self.lockFile)
+                self.lockFile.close()
+                self.lockFile = None
@@ -0,0 +1,163 @@
+#  Copyright 2021 Dimitar Dimitrov | MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+#  associated documentation files (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+#  of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following
+#  conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial
+#  portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+#  INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+#  PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+#  LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT
+#  OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+#  OTHER DEALINGS IN THE SOFTWARE.
+
+#  Logging shared by ExpressLRS CLI and its setup application. Log records are only put on a queue by the logging
+#  thread, a background writer thread formats and appends them to elrs-cli.log in batches. Log file is rotated by size
+#  (or on every start) into gzip compressed segments elrs-cli.log.1.gz, elrs-cli.log.2.gz, ...
+
+import atexit
+import gzip
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+import time
+
+LOG_FORMAT = "%(asctime)s %(name)s:%(levelname)s:%(message)s"
+LOG_DATEFMT = "%F %A %T"
+
+# Maximum number of records written (and flushed) at once
+MAX_BATCH_SIZE = 512
+
+# Rotation settings - live log size cap, number of compressed segments kept and whether each start begins new log
+LOG_MAX_BYTES = int(os.environ.get("ELRS_LOG_MAX_BYTES", 1024 * 1024))
+LOG_BACKUP_COUNT = int(os.environ.get("ELRS_LOG_BACKUPS", 5))
+LOG_ROTATE_ON_START = os.environ.get("ELRS_LOG_ROTATE", "size") == "session"
+
+# Seconds between rotation attempts, rotation fails while another process on Windows holds log file open
+ROTATE_RETRY_INTERVAL = 5
+
+
+# Move live log file to compressed segment .1.gz, shifting older segments and dropping ones above backupCount.
+# Returns False when log file can't be moved
+def rotateLogFile(filename, backupCount=LOG_BACKUP_COUNT):
+    rotating = f"{filename}.rotating-{os.getpid()}"
+    try:
+        os.replace(filename, rotating)
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+
+    if backupCount <= 0:
+        os.remove(rotating)
+        return True
+
+    for index in range(backupCount, 0, -1):
+        segment = f"{filename}.{index}.gz"
+        if not os.path.isfile(segment):
+            continue
+        if index == backupCount:
+            os.remove(segment)
+        else:
+            os.replace(segment, f"{filename}.{index + 1}.gz")
+
+    with open(rotating, "rb") as source, gzip.open(f"{filename}.1.gz", "wb") as target:
+        shutil.copyfileobj(source, target)
+    os.remove(rotating)
+
+    return True
+
+
+# Background thread appending queued log records to log file, one write and flush per batch of records
+class BatchingLogWriter(threading.Thread):
+
+    def __init__(self, filename, recordQueue, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT):
+        super().__init__(name="elrs-log-writer", daemon=True)
+        self.filename = filename
+        self.recordQueue = recordQueue
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.lastFailedRotate = float("-inf")
+        self.formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=LOG_DATEFMT)
+        self.stream = open(filename, mode="a+", encoding="utf-8")
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            batch = [self.recordQueue.get()]
+            while len(batch) < MAX_BATCH_SIZE:
+                try:
+                    batch.append(self.recordQueue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in batch:
+                stopping = True
+                batch = [record for record in batch if record is not None]
+
+            self.write(batch)
+
+        self.stream.close()
+
+    def write(self, records):
+        if not records:
+            return
+
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.formatter.format(record) + "\n")
+            except Exception:
+                lines.append(f"{record.name}:{record.levelname}:unable to format log record {record.msg!r}\n")
+
+        self.stream.write("".join(lines))
+        self.stream.flush()
+
+        # size includes lines appended by other processes sharing the log file
+        if 0 < self.maxBytes <= os.fstat(self.stream.fileno()).st_size:
+            self.rotate()
+
+    # Rotation is retried at most every ROTATE_RETRY_INTERVAL seconds after it failed, successful one is not throttled
+    def rotate(self):
+        if time.monotonic() - self.lastFailedRotate < ROTATE_RETRY_INTERVAL:
+            return
+
+        self.stream.close()
+        try:
+            if not rotateLogFile(self.filename, self.backupCount):
+                self.lastFailedRotate = time.monotonic()
+        finally:
+            self.stream = open(self.filename, mode="a+", encoding="utf-8")
+
+    # Write everything still queued and stop writer thread
+    def stop(self):
+        self.recordQueue.put(None)
+        self.join()
+
+
+# Configure root logger to hand records over to background batching writer of log file
+def setupLogging(filename, level=logging.DEBUG, rotateOnStart=LOG_ROTATE_ON_START):
+    if rotateOnStart and os.path.isfile(filename) and os.path.getsize(filename) > 0:
+        rotateLogFile(filename)
+
+    recordQueue = queue.SimpleQueue()
+    writer = BatchingLogWriter(filename, recordQueue)
+    writer.start()
+
+    # only message (with exception traceback) is rendered when record is queued, full format is applied by writer
+    queueHandler = logging.handlers.QueueHandler(recordQueue)
+    queueHandler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(handlers=[queueHandler], level=level)
+
+    # records logged until interpreter exit must reach the log file
+    atexit.register(writer.stop)
+
+    return writer
@@ -0,0 +1,319 @@
+#  Copyright 2021 Dimitar Dimitrov | MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+#  associated documentation files (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+#  of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following
+#  conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial
+#  portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+#  INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+#  PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+#  LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT
+#  OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+#  OTHER DEALINGS IN THE SOFTWARE.
+
+#  Timing instrumentation of external commands run by ExpressLRS CLI. Every command started through InstrumentedPopen
+#  records wall time, CPU time and peak memory of the process (together with its reaped children) and exit code. Each
+#  record is logged and appended as JSON line to metrics file, tagged with name of operation (clone, pull, build, ...)
+#  which started the command. Operation counters and histograms are also exported for Prometheus node_exporter
+#  textfile collector, rewritten atomically after every operation.
+
+import contextlib
+import ctypes
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from elrs_lock import LockTimeout, ReadWriteFileLock
+
+logger = logging.getLogger('elrs-metrics')
+
+# Metrics file is moved to .1 backup once it grows above this size
+METRICS_MAX_BYTES = int(os.environ.get("ELRS_METRICS_MAX_BYTES", 4 * 1024 * 1024))
+
+metricsFilename = None
+metricsLock = threading.Lock()
+
+# Prometheus textfile and JSON state it is rendered from - counters persist across ExpressLRS CLI invocations
+promFilename = None
+promStateFilename = None
+
+# Seconds to wait for Prometheus state of another ExpressLRS CLI process being flushed
+PROMETHEUS_LOCK_TIMEOUT = 30
+
+# Counter increments and histogram observations of current process, not yet merged into Prometheus state
+promPending = {}
+
+# Histogram bucket upper bounds in seconds
+BUILD_DURATION_BUCKETS = [5, 10, 30, 60, 120, 300, 600, 1200]
+FETCH_DURATION_BUCKETS = [0.5, 1, 2, 5, 10, 30, 60, 120]
+FLASH_DURATION_BUCKETS = [5, 10, 20, 30, 60, 120, 300]
+OPERATION_DURATION_BUCKETS = [1, 5, 10, 30, 60, 120, 300, 600, 1800]
+
+# Operation currently executed - ExpressLRS CLI runs single operation at a time, so plain global is enough
+currentOperation = None
+
+
+def setupMetrics(filename, prometheusFilename=None, prometheusStateFilename=None):
+    global metricsFilename, promFilename, promStateFilename
+    metricsFilename = filename
+    promFilename = prometheusFilename
+    promStateFilename = prometheusStateFilename or (prometheusFilename and f"{prometheusFilename}.state.json")
+
+
+def labelsKey(labels):
+    return json.dumps(sorted((labels or {}).items()))
+
+
+def incCounter(name, description, labels=None, value=1):
+    with metricsLock:
+        metric = promPending.setdefault(name, {"type": "counter", "help": description, "values": {}})
+        key = labelsKey(labels)
+        metric["values"][key] = metric["values"].get(key, 0) + value
+
+
+def observeHistogram(name, description, value, buckets, labels=None):
+    with metricsLock:
+        metric = promPending.setdefault(name, {"type": "histogram", "help": description, "buckets": buckets,
+                                                  "values": {}})
+        observations = metric["values"].setdefault(labelsKey(labels), [])
+        observations.append(value)
+
+
+def loadPrometheusState():
+    try:
+        with open(promStateFilename, encoding="utf-8") as stateFile:
+            return json.load(stateFile)
+    except (OSError, ValueError):
+        return {}
+
+
+def mergePrometheusState(state, pending):
+    for name, metric in pending.items():
+        stored = state.setdefault(name, {"type": metric["type"], "help": metric["help"], "values": {}})
+        if metric["type"] == "counter":
+            for key, value in metric["values"].items():
+                stored["values"][key] = stored["values"].get(key, 0) + value
+            continue
+
+        stored["buckets"] = metric["buckets"]
+        for key, observations in metric["values"].items():
+            series = stored["values"].setdefault(key, {"counts": [0] * len(metric["buckets"]), "sum": 0, "count": 0})
+            for value in observations:
+                for index, bound in enumerate(metric["buckets"]):
+                    if value <= bound:
+                        series["counts"][index] += 1
+                series["sum"] += value
+                series["count"] += 1
+
+
+def formatLabels(key, extra=None):
+    labels = [tuple(item) for item in json.loads(key)] + (extra or [])
+    if not labels:
+        return ""
+    escaped = [(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+               for name, value in labels]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def renderPrometheus(state):
+    lines = []
+    for name in sorted(state):
+        metric = state[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for key in sorted(metric["values"]):
+            if metric["type"] == "counter":
+                lines.append(f"{name}{formatLabels(key)} {metric['values'][key]}")
+                continue
+
+            series = metric["values"][key]
+            for bound, count in zip(metric["buckets"], series["counts"]):
+                lines.append(f"{name}_bucket{formatLabels(key, [('le', bound)])} {count}")
+            lines.append(f"{name}_bucket{formatLabels(key, [('le', '+Inf')])} {series['count']}")
+            lines.append(f"{name}_sum{formatLabels(key)} {round(series['sum'], 3)}")
+            lines.append(f"{name}_count{formatLabels(key)} {series['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def writeAtomically(filename, content):
+    tmpFilename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmpFilename, "w", encoding="utf-8") as tmpFile:
+        tmpFile.write(content)
+    os.replace(tmpFilename, filename)
+
+
+# Merge pending counters and observations into Prometheus state and rewrite textfile. Both files are replaced
+# atomically, so node_exporter never reads partially written textfile. Load, merge and write runs under lock file
+# shared with other ExpressLRS CLI processes, otherwise concurrent flushes would drop each other's increments
+def flushPrometheus():
+    global promPending
+
+    if promFilename is None:
+        return
+
+    with metricsLock:
+        pending, promPending = promPending, {}
+        if not pending:
+            return
+        stateLock = ReadWriteFileLock(f"{os.path.abspath(promStateFilename)}.lock")
+        try:
+            stateLock.acquire(exclusive=True, timeout=PROMETHEUS_LOCK_TIMEOUT)
+        except (LockTimeout, OSError) as error:
+            # kept for next flush
+            promPending = pending
+            logger.warning(f"Unable to lock Prometheus state [{promStateFilename}]: {error}")
+            return
+        try:
+            state = loadPrometheusState()
+            mergePrometheusState(state, pending)
+            for filename in [promStateFilename, promFilename]:
+                os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+            writeAtomically(promStateFilename, json.dumps(state))
+            writeAtomically(promFilename, renderPrometheus(state))
+        except OSError as error:
+            logger.warning(f"Unable to write Prometheus textfile [{promFilename}]: {error}")
+        finally:
+            stateLock.release()
+
+
+# Log metrics record and append it to metrics file
+def recordMetrics(record):
+    record = dict(time=round(time.time(), 3), operation=currentOperation, **record)
+
+    usage = ""
+    if record.get("user") is not None:
+        usage = f", cpu {record['user']}s user {record['system']}s system, peak rss {record['max_rss_kb']} KiB"
+    logger.info(f"[{record['operation']}] step '{record['step']}' exited with code {record['returncode']} in "
+                f"{record['wall']}s{usage}")
+
+    if metricsFilename is None:
+        return
+
+    line = json.dumps(record) + "\n"
+    with metricsLock:
+        try:
+            os.makedirs(os.path.dirname(metricsFilename), exist_ok=True)
+            if os.path.isfile(metricsFilename) and os.path.getsize(metricsFilename) > METRICS_MAX_BYTES:
+                os.replace(metricsFilename, f"{metricsFilename}.1")
+            with open(metricsFilename, "a", encoding="utf-8") as metricsFile:
+                metricsFile.write(line)
+        except OSError as error:
+            logger.warning(f"Unable to write metrics file [{metricsFilename}]: {error}")
+
+
+# Group commands under operation name and record wall time of whole operation. Usable as decorator too
+@contextlib.contextmanager
+def measuredOperation(name):
+    global currentOperation
+
+    previous = currentOperation
+    currentOperation = name if previous is None else previous
+    startTime = time.monotonic()
+    returncode = 0
+    try:
+        yield
+    except SystemExit as error:
+        returncode = error.code if isinstance(error.code, int) else 1
+        raise
+    except subprocess.CalledProcessError as error:
+        returncode = error.returncode
+        raise
+    except BaseException:
+        returncode = 1
+        raise
+    finally:
+        # nested operations (e.g. build started by upload) are steps of outer operation
+        if previous is None:
+            wall = round(time.monotonic() - startTime, 3)
+            recordMetrics({"step": "total", "command": None, "wall": wall, "user": None, "system": None,
+                           "max_rss_kb": None, "returncode": returncode})
+            result = "success" if returncode == 0 else "failure"
+            incCounter("elrs_operations_total", "ExpressLRS CLI operations by result",
+                       {"operation": name, "result": result})
+            observeHistogram("elrs_operation_duration_seconds", "ExpressLRS CLI operation duration", wall,
+                             OPERATION_DURATION_BUCKETS, {"operation": name})
+            flushPrometheus()
+        currentOperation = previous
+
+
+class FileTime(ctypes.Structure):
+    _fields_ = [("low", ctypes.c_uint32), ("high", ctypes.c_uint32)]
+
+    def seconds(self):
+        return ((self.high << 32) | self.low) / 10000000
+
+
+class ProcessMemoryCounters(ctypes.Structure):
+    _fields_ = [("cb", ctypes.c_uint32), ("PageFaultCount", ctypes.c_uint32)] + \
+               [(name, ctypes.c_size_t) for name in ["PeakWorkingSetSize", "WorkingSetSize",
+                                                     "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                                                     "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                                                     "PagefileUsage", "PeakPagefileUsage"]]
+
+
+# CPU times and peak working set of exited, not yet closed, Windows process. Windows doesn't account child processes
+# of the process, so these cover top level process only
+def windowsProcessUsage(handle):
+    kernel32 = ctypes.windll.kernel32
+    creation, exitTime, kernel, user = FileTime(), FileTime(), FileTime(), FileTime()
+    counters = ProcessMemoryCounters(cb=ctypes.sizeof(ProcessMemoryCounters))
+    if not kernel32.GetProcessTimes(int(handle), ctypes.byref(creation), ctypes.byref(exitTime), ctypes.byref(kernel),
+                                    ctypes.byref(user)):
+        return None
+    if not kernel32.K32GetProcessMemoryInfo(int(handle), ctypes.byref(counters), counters.cb):
+        counters.PeakWorkingSetSize = 0
+    return {"user": round(user.seconds(), 3), "system": round(kernel.seconds(), 3),
+            "max_rss_kb": counters.PeakWorkingSetSize // 1024}
+
+
+def exitCode(status):
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+# Popen recording metrics of command once it is waited for. On POSIX process is reaped through wait4, which returns
+# resource usage of process and all its descendants it waited for (compilers spawned by PlatformIO)
+class InstrumentedPopen(subprocess.Popen):
+
+    def __init__(self, args, step=None, **kwargs):
+        self.step = step or " ".join(str(arg) for arg in args[:2])
+        self.usage = None
+        self.recorded = False
+        self.startTime = time.monotonic()
+        super().__init__(args, **kwargs)
+
+    def wait(self, timeout=None):
+        if self.returncode is None and timeout is None and hasattr(os, "wait4"):
+            try:
+                _, status, usage = os.wait4(self.pid, 0)
+            except ChildProcessError:
+                pass
+            else:
+                self.returncode = exitCode(status)
+                # ru_maxrss is in bytes on macOS, KiB elsewhere
+                maxRss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+                self.usage = {"user": round(usage.ru_utime, 3), "system": round(usage.ru_stime, 3),
+                              "max_rss_kb": maxRss}
+
+        returncode = super().wait(timeout)
+
+        if not self.recorded:
+            self.recorded = True
+            wall = round(time.monotonic() - self.startTime, 3)
+            if self.usage is None and sys.platform == "win32":
+                self.usage = windowsProcessUsage(self._handle)
+            usage = self.usage or {"user": None, "system": None, "max_rss_kb": None}
+            recordMetrics(dict({"step": self.step, "command": [str(arg) for arg in self.args], "wall": wall,
+                                "returncode": returncode}, **usage))
+
+        return returncode
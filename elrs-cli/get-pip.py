@@ -38,7 +38,6 @@ import os.path
 import pkgutil
 import shutil
 import tempfile
-from base64 import b85decode
 
 
 def determine_pip_install_arguments():
@@ -127,13 +126,11 @@ def main():
         # Create a temporary working directory
         tmpdir = tempfile.mkdtemp()
 
-        # Unpack the zipfile into the temporary directory
-        pip_zip = os.path.join(tmpdir, "pip.zip")
-        with open(pip_zip, "wb") as fp:
-            fp.write(b85decode(DATA.replace(b"\n", b"")))
-
-        # Add the zipfile to sys.path so that we can import it
-        sys.path.insert(0, pip_zip)
+        # Import pip from the zipfile decoded in memory (or from the bootstrap archive cache, reused while DATA
+        # doesn't change)
+        sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+        from elrs_bootstrap import decodeBase85, importBootstrapArchive
+        importBootstrapArchive("pip", DATA, decodeBase85, tmpdir)
 
         # Run the bootstrap
         bootstrap(tmpdir=tmpdir)
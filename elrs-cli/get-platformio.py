@@ -18,7 +18,6 @@ import os
 import shutil
 import sys
 import tempfile
-from base64 import b64decode
 
 DEPENDENCIES = b"""
 UEsDBBQAAAAIAGxOnVATZ7w/9gAAAEYBAAAcAAAAc2VtYW50aWNfdmVyc2lvbi9fX2luaXRfXy5weUWPTU7DQAyF9zmF1S7KT5IFElKFAKHCBgmxIBXbaDpxM4PmD4+nKGfiGFwMp0ViMx4925/fW0Jz0YCOgw3jDRTeN+tZqZbwGNNEdjQMZ/octgYhTWxiaDJ6FdjqA1K2MUCi+IGaZWVrbJ5ZCFIHm5nsrjAOUMKABCwM/oqNdqpkhE33BC9WY8jYVlW1p+ih3SnpWJ8isZB8UoQ1eMXa1HBQzg6KRehkwmGXUNfwmvzp8/8+M/oa3k/+BN33qoh16nu4g8WbSkb9fDvYKKIoTm9pVtDJ8aNwKQkl3EOKbmLUJtjPgm2k8X4hqL/YR9bqql2316vqF1BLAwQUAAAACABsTp1QKT7Hpf0gAADntwAAGAAAAHNlbWFudGljX3ZlcnNpb24vYmFzZS5wee09/1/bRrK/81copJzsYOuA3H0+7yimdRLa8o4QXiBp+whxhBGgqy25khygR/O3v52ZXe1XybIDSXqv/rTBXu3Ozs7MzszuzK4eet1HXW+YnsXJxaY3Lc67/wUlSw+9p+nkJosvLguvNWx7R5eRN7kpLtOkm0fjMCni4fsoy+M08SZZ+q9oWLAmR5dxDrAij/09i/Mii0+nRXTmTZOzKPMKBqO4SrvDUTjNI+/J4TNvLx5GSR4FS0vxeJJmhXc+TYZFmo5yUZBF4ttVmCUMy3xpaeksOvcGl2E+GEUhYD74LcrS1vtwNI3am0se+2RRMc0Sj8qwRHzC5MzD0uO1E6/X8/w13/08iPOz+CIuWm33c+8BNm4zfNiI8tx7Hl7vnkWMNOdxlLXSU6AKR2cwyEdpkQ8GXs87PlnCMhzEIIsm2WDQyqPROa+roO/rINu+2jL6lbfreCkjbWY3j/M4yYswGUYtrNHxoHowGCC+gwGg/m1J8aBIi3A0SDPGK0ZTPqj96Zj9HDYamI908bXxxUlclHiqHIIPokPE7HlxUnAWNqePjd1K1va9FQVyQ5LF5w5yWeCVBgoa6jB6BDnQBY9X3E+L3fFkFI0ZvOhMxWxUzIeZJhhurI4yBYFo5ATTH00uw7sAND+ltpyEikZ55Gxpkm6m4BpDuzexJV0RJaD3Wn6YD+PYn0OCTTTvVH4bsfePK70Nhe67kAnVncyEOxRfEtLXZEOlcGJbblmZ5DD5yqJgmI4n8ShqZf7b1puz1fabQP3T+maz2zpe6/4j7P7W7/5v0D1Zbbe/YaVvVu3ir3yyZpMwK2I2aWZ1BWAC41v7GwRvdPrI3ekj3qk9tzQyofBoJQIz8CKSi95+mkR6hXH4rzRzlceJs3wSFsNLV3kWZRFzJPLI8fB0Go/OnMCQfj2ULV3c+SNdDITzEsAXfejwWT6gRmLUuXcVj0beacR4Mk7fMxcqTrzHwdrXHnhOhzGI0uEkGrb89eA6uPbbHsgzc4aC5Y4F/BlTQNEwLBjcHwkNuw6bDMNfRtH7aNTb0J9K7wccriK6LkDpacwBdy9JCw/IpNUGUuSsOjxsIb+gKjIIviBH8EvJAviFNIcvAK+tkhbglFi8lV0YUy6MGaDXMDF3sizNWstPQ0bMKIYJW045RrmN4DGjXCrLSKTWO14QBO1gmUst71x0vGlLYYfG1KERdZTxdPhoeqQ7GLZ51NKp1xES065RI+CPJ++jJGaGJtr02HjSK69IvXQcF0p3f8Xeggr5ZlgUUyY5LaWIjb7V1j1cTminHMNHjIhg0S8HGPI1mX6Mz8IiGvzCJP8ibzWjl0IT3eqSEPWI7MYjFKsegdYfkaD1qDvjkUod+UOvJEaMf5dM2DRzewJlev4tKvhxxJZMZ1L3DdMoYzZnOMq5V9EhVg4SJuouZULGhs8FXHvI+k5D47TcLtc6YaI8QDKargnr1iQNdKwSuafRteetOXER08qSIJpnkqG2PiIlvmY/IC3ufEAaWWVKlSarNNONMfZWvfVPhbXBMuhjHpbdN5OkXHyx3JqNupufd8g2BDWbbZ+LRVJSvnxezR5DFTfnYFqRseUls1t8WUOukY/QfYWDy8vLL2mAIePzlRimRw59pwRz5k0nYK9hD4xBZM9YEQINGAhVILAQN6bQ2viVCxF9RSObSWFyt/3c0iTdbUP2P1bydCogp75IAiw+KOzzsw0KXZBSZXG3Bya899EKXh8loHlPo5xzDPc8bEtXWiuX3QQdaKFHQLUQod6t5O+CZW+FfrZrnE7N53SvPCzPk+mkp9iMuRFemJ3GRRZmN6K5J5Z9CdNoISPMmD3owtYBw/B0xBYVCWzpC2AQO8imI3BjZQ9db5eWGVGSTi8uPWjNmiUFw/Ic1r7Ir7+SOr9iSzcP9vijnK2Ak1GU5wrdxCC0LSOEP06ziKlcNobH3lladPOI1UVtrHbHzHMWKiVswJG3jNp3WemGrWLCAKDm6bh8jqXMJ8/Y2vvGCyeTiDVmyxf4xhwwtjgjpa/AMbuThNq5DmFhbyxnt7e3hdwHnJf+WrDu66stMTPWOsz0eWvtJiBoAVwDZqPDVnXsf/+x32k3Brn6t8ZAPZ/VbQR4daPLAA/+Xj9sAZpVRuDdv6vgVUt7ygyOa9frzdkq7nQpf2G/y1cWomO+muQgAvxtLOqtbQusNGO2W9pk+bU+4Ubh8JccPA3a+GR6qBSjTW8lW7YArBgz3uXtwEdMbHNn53gT8Q6YLLfaJ+aYnDsED70fI+YKsTkWQqWu0JgcsL43cXXJyF4+GqZTtlD1A7/tbXkb9saDwHKVGYlgzZfoP/QOGboTj4cDUVXksGWmzDJZVxCVrarTc/TIztNs7CVJh/0fTCawmYFfgl9/dVCI4Rf8K40NI/QQNAPAgvF6V2EOscGOdxV5oAeY84c6jGmiaDwpbjhDjY0a1jIYwZNJCwKLgIcZnWSYUg9scIJs+WQUE9nKqvrOlcJDMLCjKDGltdbY8rrSWth7M1mU29uCx0q/mycqt54yRiXgEDN6+dDWNyGxaZVPT9mEPH5LW8lr3X+sBt0TmNVd9g9U0wcJJSKku+qbMtkX7rQUCZ326jaQr9Nc7P5gD+ubchqg36L2G9j9JlzfC/kpu4ddr/Q0PB3dCNTuAaGu5UZx6hoNOQ0Z4UCw4LE9+1ybmlBTyN8qY8u6rp1tD6cOUEcdJw6lEp85cbHxqMVBGgl13y/IoglTwBFBx+mmyl/VGl5RHCt5dyWH6J4ypcpWmsXADmvgrJpwsIE2IXEKM6dv1vR1+oy0Tz3bZexw79LlQB4ADC+scBqFcmnzpbLiL/azi9w5dhFuaLG/zMyD9jCAM9CIuqVXwQK1TtN0xNpdXUYYCQA8hsNoAsoUpuUoKpiPmkymumqgEbpaF8wlZn/G4YRr/jynSI02VNuMoUf/2rSHxj4AGFh93DO8B1+sFcjC6JQB98C33AFDgl3mXAsQMoEQixolclgzzazWSivLn5LP7s6lKokyJzkah3XIxl1k6XSSt3R62hlKCNU0tpVrPtWbAanC1ujnOTCv7xeGsXi/0HqhfpFuC/eLrav61TnF04eIvvIRjwiB4InQS8lRI+QmQkRqXcF2y93R1L2IzujDlPMJd+JbelDTNooP2QMR+UzO0w4K6sRjmiay6orkNqeQYqzaCJ3CZ5YtZmNvGVsy6kNwQqpMqNm02tg6IpCK+6ojjJwow4dxmZqRt9R5SOEwVeqinFsjjV8a/atYVR3r1ELb1eQU1U1K8nKbiM4GJmRHwHUBqvHAqpNgsHView8Ng7V1joQbFXQslIJaNkpawOInLqIxKAeltcVNMA5Qz+bP7CU3fJZ1Syq7YroI+nattOHDHDLotiOXiAqWBp/go1CcYw7NZV4qag4okqmoZRHPPsXfMF4XARuMv1L5aoMGBQydNuM0j/Qjk+cN92uxsYptXhi6Q9uLD6tAiv9BM82vtCMj8KDeCrjaWcag5ItICnC00lRSZYNZ5tPeNBIsJT6Ah6rnt6wIhuA32uSGb7ZQLyvBGqhB2VArkoo9kg33NJqT9/b00LwLncYi3WizofJrajKUDkv2zNtXQ0XLk+GKqDo7FB62WkpUQ0nC6CjR/Y4ZRu4oeSttrT/mVtjdqWvLszL9VM+xERGQMnvLTRZtmRoQNLkElRDaFuAyG2xhwORuLtmQ9XQnLZAj0yQ0Z4drWiX7x+261a/uSztg9NC2Ry/TqNzolR5Eq12HgrUxoKMgBMKQM167edbySt5ayVZyTFW2EznlCQP2LQnH0WCgx8CYEBJkvdiXegXmie+Ouvm+bKWJNlt+XNoo4370WZr4uMwfTc8iCA4jPNZfzsogRMS4y/4Dn3tYjG686NdpzOY2m9OgPi/D9+re+UMvLMBe5szqemzKM76cRmA734GAvAtMagFedzaLv51k6STKihu5V5NFw+gM8gIHv0Q386aYyHJoXTqZljK2T1oAEdu088rX65n/FnJ/T1a/4pxsE8fMHHd8ZPWgbm0bKGt1m600+GjsgRhHapwJIArzHNLtCDBXBc+r8gB0PCvkeTie1KXVo5c764RPk2R0BSa0FqntzqbddX1hgw22axq46otjBs4GazXsnXkQof6AxJ1TbIaMyPMUuimFj51RyWtq2atazTKRj2rqyayipmlqeGYuWg7erjb5V8JQE3uV5s58X01uk+hzMIH0Fmo/8ODpJ/Xf/KjKfSEnmKIo6vIEiV6s4fpZCOnEtTcT2YsvhrDbs3H9Ygi7XUVYfkAIDnnsspW3fnxteXm5z6AyJyXDvrycVWMGjTKEMKMQ6/1zd//ZoL//M/iGj3xZtHcEJVtayQ4W9ZSynf951d+D0p5aevjDi5dHO/+D5Wrl5wdHP8tQJZZ9T0C3e1oZFikl+wTsgVrraf/lDlZ8qxQe7e49Q4Af1Jovnh/0j3af7NGTHo/ePWR2fsLcs19iTJmPQ1wHx0XunU9HZTKCQqS93f7hziGD8e+SbepwNxWSdPQaOHL7+e+ESBYNgDn26aqt263e7W3vtte73Wb/3T7o3b55e/vh9kOv3XpzFjxqu09NkdQqvC8DcwM4WkQLTE2csXy+00iQsfVOiN47j0TRfSLpPg8cAfM6Hiefcn7GHr1sg9WQ6z1srz8QsNgf/cGAH0rv4Yxz9RBQjWZBU0d7S8XYdZoGSmhbsnL+i5CJi0zKIgYGCouqIawJKBUjTG58GSljzwMVaRse7lM+cqdqAiECoYAgrO7IoIIqfIKIJUQNa+cI+5Wk+jgikQDKBbYR7FMQQ4mLMeAeqApFx5PLpVnpGMqVBBkupZX5N7SJpPSOBLT2q9CXwy7RoqksIT0lEWE6ePF9xkoaMxJv8m20ZDo+ZcOApXTE0PHEYe3AlbNm86RCQQhRk4qibof6PEvHA2QhW/jx3Wn8oc9NXgiy3R9dhTeM004Bh9wKJvxC8RobiLjaUUDtM1WX1UHaWmPKdK1bC0/xSjjojvcyTC7MXSkV7krOt4R4iwC2D8ICd2Z5SRFmF1HRNnou6TYuj66Uc8HeElK1qB6+n739KHeVOKqlEu9ItT3HmfotYbrYJM+ZEG43A7rI4lH0tLA/SCpBeIHkrogFH+kB8QyNloKue7vL3nMyh9zmF6hgvnYWtd6vM7Zu6PemlKpnvR2IjYiybKMEwSWDQTUlg8NBY4q9cpkwdFoJSWykuxMTmUP7mlfI7Yyi8CKMYaOOWbDDaMx6cLjDAKXIbiSdRPqN60SupWDKzPLoGvOFpFq0CE+XDSwtPdv5rv9q72hw+PP+Uf8n8E1zPLXtl679E2Z3kT62a69r0ZTzinLrxQlxnjD1Kg8v+C4JZE7TofDt3jooE9jfvEmK8LrnJ5OxMMD9kn40/4GieocYiJRPE9pr5LmyNMV56mxoLj2oi10m7lkSjkY3HQYccAK71E9uXpxLO9IfjdjP50KPmV+UnTmqCWeyqawtKIV/icLku/9eo/6z6CLOIdpCNCELkE9Psa56uwc+Bi+RPwuoB83gUh1nOoHtjPSJBJAUneMahAsF7R2zdckpHAor4MC5AEKbZbwXcivEOOe208+mkxHwJxIAYad1JQcPqFORNd6imh2t42MqPFGoVmGXXa0UglqKUJRXLXeia7agyA3Dk0+ZIWuJWUQaDrQVb2ksCSQIhoj8oVcqFwFkzVA3DIqUm7WWgkazZYBsUM5EXS+YR24SNjUhqkCVu2JuKYBE/qQYtycsknaOUDoAFh8ajsIavDEgJ+Y5JrhLXBFT7hNo6KHQ6taRpFcxyOfxCMKfmt+R691+h1WgU4iUhnj06FzeoZEznZSf32BiKBgH8JJVNGAeCF0o8+ntfBK+o6v6NHZqxQ1OZiuSVu88Aekuo+EvZVZpmRjLkY+ZpnXirvoQM7wuOm9aS8hDrII9nUKKuG1vvHCcgq3VSZ1OCrRFKma8jM2iEdO35INwXpada6sX3sDpQY2ZoubPLauMOVmKyhimTMDZdJD3Nrno/SOn9DuF81D9nXkQV3H2yhXYayf7VV4YTDCqcO9A4vyJAhY1YiMdTHWDo6mLqQBq7Ocb+ngOv56MluLOOwLNJnh5P99TUmSNLuabseZpor8GA+bIV1/R1wxEmn0shLprAptAYHQsiptJBhlXBIatJ1jVnv+mME7CH2DVLtZVfEV3irtg6ptETVAYUHetdlset2D9iE7VkfGahqyA/zwspuGII07Y4OG59CIeKscMfgaFbWidPuos0Gz8gBZzZaFf7hfnHnM54LBYdEbnud4U7sGRMQBpJvwahsc4TWDaa4FSRZfDIiI+t4at3gsg5J38bZJ657133JWvufnuEa9iuV0Ie5bPJZYKPdh6+Q0u+ixaAuCc2wtsEdIaGsoV7fewTBewIVcRi/xNjhogJfFGkKQXDbi6oHDQcUT7eSjmZXfWdUqKDpcNO8Qghyuh4HfbU7oSqGgNaKWgoFOx1wQfsJBxMm2SySxxCMKzMwVtzXTDUUJZE8PE627bKMFN0knLMowkq48UWHNudSgCWUrCnIl2FVJ0Jzetyk2dUvJ0s5s3NRwVtxeOLEniqGEN7y+OK0Nc9zLS0tvDDD+rE4e4CvbhCl1FWOlq7iyOGqPnHr0DMTnBpRdaTiqd8tWbrM3I4qB9fe+gco6x9Ul7fkKZpKeZ45LbGTePYkOexIcnGskMpxnrpYW2a1ilY2fbYbKA2Ml3LXmss6l+HcWJJB/Xr9I30KoCSKgOALHZ8WZ3/aRqgQbehLeKFZdqn+bHDAr77nd8c1BtuYlHgn9PNhZgf0obOxoJUrsMrZNrfyRr65inBn4LWVt3kAg+X7C5RbH9GHMrZfP/obmd304uZhAa2/oFrd1iBodkx8W5uzDcmttyO5fb4nZN0MwRUoQ6obYQnR0wP97dmXVB+OgTmGnWyX+ymeYSUmOoT/70v70vZBo3d7PvcDqK113g0llXKAvuEVbs+DYwrohEp33XRrHx1qS6l9RIKlRmz/HyDtqmUJ1p9KTukPoYuJ/XswEkPjv1LVrOJr/JsFl2hdxWSX7MJDKo/+JgwHN9eXouK9BSePG3lubLSrT8YvytZRezEiXpF4seelt4d1yZdYC/uiEdHzl4ufNyZ2+nf7gz6O/92P8ZYv1+iAPw9eZnaZTLLMFKKPv9o1cvKbk5CRk9wpGAI1rg7WDJ6Aac+Dw+izLIeD33KFUKHW+seH19bcI+7D/fOegfPf0Bkz7CcdSlu0iX1B70ca4+wmdPXu3uPRvsPj/Y2326iyTEZcAwLnxnW8QPizo4Zn77ngLr8Ojl7lOEREfbOBL6ElUkhIFzQeODb8oRpUnKkLiBQkzmE7+rl7QyxYzgqcd+eeuezQ1+IFhU0KlhrY5RWmtWxyWzeGIkrAgEXmVCJM5RlHE+X0k0PyIXErDyIJFtoczHlkm5trHcL0fQKwejVxACytvrDy0uaHfe8zK9icoSkRihyZZJZzzxp7ZqqrK1k7CixweOLnXmWFcXBuXVzepVyPqxYFG16lQkTNuBuBJGoauEjYtvq0f7RocqunOwTr0hrgKQWNhusu1eqB1KMel5UsbdiQ06h2fSW+ncfezfSS6NFU7S6cxyAcY3r/Fm5XFotTd6PYPZTAemn3g2IOgeaiUlvz9yupQC5vZCIHfqYS6C596RxXGbZfZUsKo4zsjXyDHX5k4o9oQxeahMJRcAERoV1avOCM+YMDWU3lqI0PXc26rinql34Aa5rKjuiNmmO57D+GqeP8g8/lOYxaepMD/QBW++lZDiYSmHBhR41oUFnJDzrp10Ps5eSTnZqU4X2vC0HCStvvTkqbYxN2eLinma2nSfFj334CR1g7gedY8vxLIuPvD9+XwRl9jT5RsuV57uUnRDl+TwVquRqtFfYgHgxEVbMChoaP6nZIhJeFrxUhp09W0mJUPsR3weaA8UPmgXOyx9K3J2AyMVXZz1la91EzXb/I2AjlMEUPyxmbtKmjDe1prx4xBWijAhSHVk8/1Xz5/svISjrf6bR7drt8fr3X+c4A0gj+Rm7H5/9zVzbg92nhpnYJeXl99qhGt9c7CVTrZrDsZa1fFehe1/J6e/8/cTQhncoGCUoRNNZXCbuwFns4t1UHS3j8Pub2wI8u2FZuU3q1AbJWxG5a+0X2y8AeSOhUUrOe0R7YzrRxh5Xu+8fPLicMe6EsTJbsFyZ8q5YTZORylcHq8mv4tLBDuGoS7T4MUekfYUNvIRGKygCaptoHjyKkiWFAAeVsY2DqOGFKg8yUmCz3ums5sEyILD0f9LeV8tmw1Ylfe8ZNCczwGZ/Aofpgy/2/3JOoiuPDKPo6utrEPpRgV9T015YByGV55ou25aubb7pjzRduG08nI3znzkOgYPH7/nb0rcjVub3I9+l8DxhPzgdX/vFYI+xlOT/jX885NPd5WeNJVyzslS1tvWEqdS7hzVUQBmiRwew9NftMCED6Hpij+LzuNrfufhoOA338EXVD+DchtM3h5cjad9ylh2wRvqPAuYIWoJFOivIeniplzxQhuOpzhfpHEJDWx5yeLAuK5JXKxbQqKBzoBElYwB8T0WAYlTqh4Sr2QvCMpXjOKpLNgw9RVLJD7lFpl+LeJap3x/n3jxm61b6CJC4IF6plqKv8oYNjMX1XIgctWCRmeLxT189gm0mkGqdzJWDpQu/xXX8S0OX7350e7DlQZjQXWST+3KXUHp3lmBUKp4QRdWkBdf0lflwl15GyWJpHmJmPjQbZnmdb3yasnKxo6VribZ8opTpUDjFyXA8Fsvy7tGF1V+uiSauLnvHWg8S+zt9jvCS+hKTVmiPbe7e+j16U0AYXJTXMJpAUzvx7f1hePIG6d50c3jiwRPuiaFh9fxurQDX8rTXe1OsbiMLy7L/flAeQ2rrW1wIgqIeAt7Y4j4llAXRNe0qwBC76y0gXCXiVZP+C/fwiyjFt5fzKd7Rx3swuCTuGfc5hS6VzaqfIesnA/We6fFR2Up9hyVcyRRGGtdt0Ztn7MGhXeRipYxHX6GKJPyMiN8z09YeYHtbC1dQfhqeZiDe1Ui8Em4Jz3gj2LhB4zD4mH2INiAP197H3obwQYUb2BJ8FgUrwd/C/5O9dmXIFhn/6zNZIqlO90ExmtEL+Ci7fJef/USqSb8+MMz1YwgCXJqXpfb4ZmJnlv3NZg+i47cwZoKJBpIx50gQaytQKLyDQL1KICxFZu12mYZ1VBDBPNI5qzOGovUvkumGiuIZhLy0HvAdAPreRuyRJiy8G5vve0eqpM5Rif51fZua1h9RyJFWG+UeG8IvNdB490f3rVSyB3KGjEUaD/uzoHiviqm9v4y1bOSgBadKSWKqx6+JYCn/GysLorxvU+s/QVmlhmkhs+dT6xtPq9wNi2mGT+VBp4p3vOx5PujBTjicIYaWMaG4M1oP3zmYXiTub0199SW2uejZvZM1WZSycVNTo0K6u3c/3TZKu3QfNPlE/krc3gk802WPU2cebhrL7oIhzcY7pKRL74V4DomJ+MW6lG5mqtM8RpThN+uu8J0/WsPwgVK9K2Nl+pE4Zl5uelBlMDLPGbdb+q+21TPQIOjXOqIvG3zKNesS1oP2Ihgp2Jj1WOUnY7x1dVFqgyk4srWryGnFdISErgTii1rx7Tb4Xf8qoHD565uddVuYmJ90nkWlRZlVcr0lIJipXvadxlZr0eAjaK8IvJeHpZqcHStTtB24UocvGSCkTmjqy/k68TTc7gETXKFLiBpeJ/uorImvmmX3sGn+qiYyiLcOTm6mfBb7uj9dIV6/U8F0GMFoHy/rH6eyHmUiA7tiPsUA+OyTn7BzNIhXY0qRaJBXH1/MjaD6tChjKnD5XhfRED9v1/s7mNA3b+9lXGLH34++GFnH0q9rqfE7JTw+/XtT7fVIfiD/ssjrHZcvksZwtVKjP7gOQagBk/2Xjz9px2n1xj1tvXN5vv2N57rI17ETVc2hSO5YaaBUCP9GOPnIf42gnhRJsAMmbyxGYL3HVsA7iH2/2/Y2oFqHkeEjyKLuq7ELCMZoKq1nc72lSsXgO737QGz7igtAJPRSVqtvHJnviKZ7SbZ+5bjVmYv31W+AiudjiAUxI8JaQ8pOOpKZoCpR9PIzlrAVqCAqLntwVCFHv0N6E3szhggeIJYye0FCTj+dg9v9fWXrGraqfjjE1cnMBQ+9wXO7u5G6VVHbBZy1EtaEICOt+HOxdTQkOkSFGSBi0TxnGV6Bdlb9uMtfOzYQ4RPtZNYpqKoyPpeRbpoo3wThWxl/F9Tag1yT8SnOvbEQEpUVsp34rbUex6pBwc9bJIHzMlmHmXLImwlDGUi1kpPkiYDqltfzzjnW2LmJhDKJJ7xtRJWaznCG5UZmhAQ1BbS6rp3BnNsCgThZAJUJOVV2xg+AoueuuyZ2YoG3KsNS5sfClPrFKsJWlvNMYhtNK8OaZsfCnEb/MKV4aq3PhtERUxb66Hpcr4elGN9KT64nK2Vnj1VevY+h/TAVs1/rPisNawssyWqkiHUzxchW9WiYK6GzI+tXGXLPMhmC1IpRIZo14+Fy5DOUXnCoLpxBRGq7fOsQbrJo72jdVBrSLhvd9sTl4nYDV1bgEYjG0V3aic1vKPUTu3NR0r5503PnJmCKQb2YvDiYOdl/+jFSwuIDPJKjWrmesqtZq/SfMphaJV2nLW+12pZulTGMtRK959kyv0wuiIevxuGRX2DjdPR5K10gVwgQ9R45YwDXPNsUH0A/+nJoE3y0o617AbHbTQPvd0LhmlE70dCkD69pfTqMqLTc/QeDbxkPFVepYC1Agug4Ku8vFpB2Zm/KqXYAnanmazHtZmsDtrAp+YlVXKbl1ZJYkaYIFxS/L0Rjfkz4/XPjNd7z3iF1b2aVupU4XMmlpoZoTCn30IQ9W8UNqevW5iL4n0Nj67FAyjZqk5S0ZPDpB84b0YpYrQWMESoY/q6tRZUhShndFyZeGrNYN7ztegXB7x+HwPWZzbvd0P2DLk1bMRVeTWLjjgv+2JElaNc9/BdXxsL9DUjI/dYLkCcqQSk1DM76otbeCefKjXXKQkfFhX92cmVHPyG7GCDRA2DoR/oUp3yyWP+pHHX9SmZn4gnH52bOQtPe/NwzgzNhQnhynyowKZ56sPdYMMTJFzYzMiQcPWvZHk15vvdpnmJnK6PoNwCfOK9KvNzRoZjMxTuljlKwtcczKnO+Jo93xp28lF5XzXI7NUM+PNmV1mpVPNLy0fpFdG/TM5dQF7vWZfsaaL0f1BLAwQUAAAACABsTp1QFey3UvEDAADsDAAAIQAAAHNlbWFudGljX3ZlcnNpb24vZGphbmdvX2ZpZWxkcy5wec1WTW/bRhC981dMlYNEgyKM9FIYYAF/xOghyMVKmrQomBU5ktYhd4ndpW216H/v7AcpUpTbJAejPEjk7sybmbczj3wFy7MlFLLkYnsBrdksf7Ir0Su4ls1e8e3OwKKIYbVDaPZmJ8VSY82E4cUDKs2lgEbJeywMuax2XFssBPovuTaKr1uDJbSiRAWGMMyjXBYVazXC1d0NvOUFCo1pFPG6kcrAI1OCUtFRtFGyhvKeia1MyzWE/ZrQKz3abA2vdGoUE7pixmYUbNstGoNPJq/Yn3tgGvKAmnYWa6YxiiJKSGu4w/oDqluOVbnwYdLrHfML8UUUAV0lbiDPueAmzxcaq00CZ0xtNf2dfXm0d2QJ4fILqUZDbqytzGJes6e8QrE1u3kCr8/P495Ytw2qxSCHBCx+nPbhjgMdMrJF5eU6f2BViyEtd58APjUKtT2nhE5GCDood392lOtsNruWgo7UODR3ViUzzDIEG6lqZtKot3YHrXeyrUpYozPm1pls5cblnRL3OYVuQlLxMFJ/r9C0SngHI3PfYAvnMSjvCMrXJ9f3g/QD0DspKJON3bQt6B7pHBGoFRfWYwxKlE1wA29DrqwNU1hmt4ywBlEpkpCm3z9s2MsBQXaSjVDhUfZu9ZChe8yJFjtHYnuy7lGQA4Pu0fu73iAnKsYxMIlqqTlmXLXCZsqpA6TSQ2amnD/buMcgfZy4H7kPXkL8zA0gQpQwNjkqJVVeUx+zLWoq968+iTn1nY0xv4B8MXsjDOkMA7cEnUCJtl7TMhfwMf2U/ta18yxOHMzfIZYuFG+cfmQWK+Q2i79j8h3/1BOGs4rQghA0slnMwyqNv++mYTMN3cbN1Mliam8Woy03U+/95H0OztlKtfgZHnlV2flUWMsHkmFi4Mf0PJ0lE4AbpO4snHr+6kNNbbRhxZcKH7DKXo9343HhhURV4FHdfnFatm+fYSN8g/CVSHNKjdVSczunkaD9wkRZ4eEdktZ8q1yNOh2qkGA1TXzDzC4BH8oHsnP1bHbD0IdqvOPv/Sn/0c1mWJgYBlp6O/98PGPPZXhgYjz702E96LsGJvZBOIykYbESn4YSYWNrHLHDgxL1gipVJzsZzOfjPh0p2QCBa05kMVEE7UtGUeOvAxkQdNJhCBnsumjdXAzP4nBq9hXxn4j/DtV/RDRYvIycaYoEFX1k2bHOMidtyc/ZZXqVXn+bxDkovuF+/h3m96ue3gvDno6G3y/Ow6nfvLm9fP92ld99ere6/Dj5BOoY/P/pwCS10yLQtWqg4ofsVNnjfuvkIBDVy4F/fnk5sJW+sBZc0Y8N+zViMBzPzs/Oou4hPXHZgMQ4+gdQSwMEFAAAAAgAJ5c6UiFJbRxRBAAAywoAABMAAAB1cmxsaWIzL19faW5pdF9fLnB5lVZLb+M2EL7rVwy0CGIvXF16CxCg6faRAJvA2HjRI0FLI5sNRWr5iFf99R2SoiXbSRf1Ic68vnlyxmVZFuvB7bWC+81mDVJsDTcDHITbg9sb5M1PlrcItVYKaydIsddaCrVbQSskEmUdWN/32rgVeIsGWiNQNXJYAVcNdNpgUZKf1ugOGGu98wYZA9EFG+Bbq6V3yBJdFB/gGR002HIvHUi925E32BOWJHCngb9q0UD5pI/MVnvVlHDgRpGurYoRezTOZJanUDLyKHzyUt4nvCIpVFmE32vsQ+6jZcVe0dhQi1GBZQZjo8ZUr1CurBdq/OkoWZNkFXnP58zJnAU85o0cgUPRY81zbKrWDbKOaiV6bhxrteka7vioH9x3XPEdlWk0CS4eE2sFa6O/D0eqD9S5S4O2p9xxnsWXkTeqeCck6X3zOEXW8Rdke5ogKs2pmqMJG5W+BGIudaJD7Y8gm0TONSiwLN2hY3sqRlEwxj2NsaG5uoXyTjUGB1gTuH6FBY9k1UfyF7vn/+hDpdAtS7KTokZKJBk+PmwC79hN4s17G9xIGdmLAuhTXna0XE2S57dFswYcWbM2zBFynTMv1isTY3EyyZuGWUflNizM9gT0xjRlUSMs30pk+Wlk/rtjlRVy6TM973bmnU4TcZdFMb66iuw/xyAXjCneUf2XFSUwvsDF7DUulmRW0D6AiwQXEl9R3mbM337/9eufy5vknDZO+L5H2ccNYeCbF/WLHAJMePccnh0tuO5+2ixuj5CQK/hqsfUyGEacBrc+eSkiTY3wRtloktcQb134m+CFq04C+QCbvbDQIY1pAwqxscHllp6VIhQSMSaUcIxV/RAkVKGInutDS8EYauOIRpnT/mmBKktb+2cgAOI0tG2buL4JlStNAAZ6Xr/QYKV4Un40wf/RiaiYs5o0T+q1ONGqLLo/aES4c6Eto8HEKa8W3NbhcS8tXKW+BWeR6tBaim9py+VyFuN8HkY3J2Jy+TngJLQTUezWorxrGqoGhzQ0b92SpH8DVzS0cJq/iR3OykU4TFVVwSeJXIHvKxpJeXo1SONOynxmwn2k1C187Lx1H0Oned9TiygkryTlDIP21wbJE22VAWo0jsdh4LHzA+HZvfayUdeOzG8gtvMgLK5ovK5Dw2mT7rlp4nyH4xtniv6hs0ubOJ12gumwpjyE7aLc0g1RNQYfXRXvbe2NcMNfKXAC5vLABws7DbptYTvkc1wVxxtraQdLTDkuymRANZxuZXUGuxrTv90Yj8vg1m//pnm+k+6Jyj45Tzln5zpEGp5wXPTvuB/DO/P/Fv5FFA+0XSlOXEvuwpKb4mh0qPtr+D20RXdAem/jibMrsBoOCC+IPbXih+V5M753PF/W6enhUVhLolHjskQ0PaFO/8//Be6Z57R0zy/EouYOd9oMtzOocKpGkB/v34QYVzC9lry/ph9vc/N38hE7RYuO0snBLIt/AVBLAwQUAAAACAAnlzpSHT8TcgINAAA7KgAAFwAAAHVybGxpYjMvX2NvbGxlY3Rpb25zLnB5rVptb9s4Ev6eX0E4KCx3baHtHrBAABfXy25vi9vdFm0Xi0MucGiJTriRJVWk/LKH++/3DElJpKQ46d75Q2Jbw+G8zzOkN1WxZavVptZ1JVYrJrdlUWnG16rIai1W9vPZma6OF2cMrw0tSIosE4mWRa5ivk6aVT/zspT57Zz9XGu+zoT7fCYOiSg1e2eofqiqohrn9RifUAh9Vwme4vtm2cefiuR+bDPGztmHjOtNUW0XqhSJ3Mjkgv1SOB6K8R2XGW11ZvgnGVfK8rMb0isVG1hK5FpUq1WkRLaZdQ/pVWLRWZ/8ILWjnjOIttLHUth3O57VeKsrnog1T+5HuZ09ZKP3VSoqkX4vE+2IYqu5T/QuxyYy/RE6ispRldiK34qWRslD70mMr5qnEtrei6Oam3dGZEi1WvEsQ7Qs2dXko0hgk+z4qxLpZZFrLnNRTeZs8uPnzx/sziTk5BrKrH6pswyrivXvUCea4Stn6jEmUeh+Z5/JZGL+f6iKnUyhB3deXCi+ESzFXotM3gsYzfFh+zuZ3LEtPtAXitUl04VhcnOz5Qcl/xA3N4zUJNJMEMNiT5HF9/yIT4Jlgiu9qJyYixpy2gVrcSzytM8stnFwUfKKb5n7uvPvz/wgt/WW5fV2DfmKDbOcmcjEFv8V5MNXJG3IKZWqLJRAvuZJx+6HnaggptwKxnNy1JZJxcQOpoCYLlk8g8zblTc3PsfI+HcGW2B5AheLNGbsEm8oPp0Z9xIuvBXaEbQ+MW9a311mCn4OgrRLCpl7SeGMs3z5Yh6ot/ylyIWXE0Qdrxw1eLt34XOfAWj8j2c9Tl14LO03vuwIzYA6QyUAnakIFLadLrAEGbxVB0HhCX2OyF4g5ARSiVxApFAZkUtlS5Ob6WuRpxQE5i15DTnMMogSt4z2Ut91ooSVwjh82VcrLosyImkC2h7RFQiusZZYBHQIvrqyseRrq4bazpmNmk4mF3i2wIG5yfonaYIyXSgl19nRMrEWOUilyV6WH+w0xbbTYGF/y74t4KXIyGpkeZJJDKuznnjvNmxPNSbNp9qJiIwLJZwTyVbe3ml2x3eCfNwq02NnqgprqgozVcV4s83ZtbiVeU68XXx0OoUxsAGzPOrpMmOvw7wJzU2vlTHLY/ZDLJFcEYq1Xr7lmRKzzjTYe5h8HCEdckVNyQttPXAx9EBQiIKVQb6lIjuRb6eC64RuNk9OKvSYxENJ4Y8hTjgloMu5MT8G1XMUgFRcKgFIowF8bBMRqUE/UbDH5B1Wc1NgCnQNhBSVetOD8abOqXMiEhGza9GgI7TVeNJy8WRJEL/V12h4jgZRHllZSEJRpsuhiVjPAGIgvnOsL4WJ9K1DfQMfUmfJkHFRB0kGBjuZ4rEV/Ks8DuzoIkjmToxhMj0eFoQZ/kxMNOq260NlGxwVYq7TAMpBijtD7inzxpT9ihZS0dlIkaULq3rJZaViwHJULcplJwLb1pmWCDtLzHK+BUps1SOvJsUW26G8JVzZjpgrqeUOwRYinPs9r259adJUUrjybCgJxU9pQjentwRmEh3XZcp1h8HeuO+BanqwkFyqdFFRdSXDMWs55Ra+7XRhEN2QQgEqbCe0IVnocSZ5ngjjW8Pt49tL9t2rb1/ErMvAsoGwFO4bKKQtw5YdhQsiA/YjWQVPLK/+rsYaTupfFalzc+P1amiujlD6YFJ+X+FbZY1JO3PdqMPEl5pnoztYvQqCc2TpBkq3pp3CRKWM2VuI6XG2vHzumCNypWFnlqC2aABWlos9+ISRC5HJzmiIeBTzNL25MbywJWdZUZROW/TjMPacRu1+Y5rQQwob+M/iLycmBKvqBF6GorRtE0hz14nRzSWemDqJXEYM2WhQxVZYWLy2rLJCaSfg69evmwxD1eql56xPQppG009CLy6L4l6K6ZxNN0WxXPNq+gAxvLxIWuI1/2P5pT4chtRXUwp8tIUF+sutvpsSxpl+Nx3Sffrhc8Px2jxtRJizlv1w1aXj/pPjblc6/u18MIL/HQcD9+fs+XNbAHzgX5eYBUPTzU29nMUtrx5eD9C9N4V4dCj5jWMcMiEJesh6g2cUsJTLkSOf99w4e6APQIbyuCIk16wMm5IAinpgqTjAlulwGeTp18f+Gme+p4D2wXAVYGA0oz3sPqM4uWqWXHd4wzamUwufPiaB8xCYhbx6+9IBQ/w7cAR12KuXF9dfARLx9MlyOwr1ACsnjbeaSlSPuc9PfGk5FagqlccLzqUo9ALOUMyb47CZKTZEcscV17pqnk8IFExmo8DBYPXHt6BTKQtLemzMc/imI7BLZn0TUB+IovvGDIiWmWla93jX2oRwxVZUtyKNZjO2XNpVwYYnWJiNAx5joHS1ysWDNnbCkhGsk6xDnEpnzkZKHuIP/3xlzw2P+g6t+lVnQ4fCYJQQXsXNk4C0RawjxM1xGtGuMKJhdRWcjnU6jQ4T/9PAcM7e52iGDoOYFgcohGkTiPxo2mYfyDkIrEZCPHYwvBc9RwOhaM3VCy+taOLyShG+4mjiy8YEHhM0ju/tgHY1T69nbPGa7ebQewskw9xJrj2JM8nhDGLn5KoSAOJ52g7m3cT8zgDxpu5vCvRziEGfLQcawzfsFnAhdzG0p+nqH+JoRipDSPNWGvuSeqa1KIzkCN3OaCgw2C+VGPtp6N9wCZOmtWgOg8pK7ggZWWPEA65AYXBSdTTJQ8Zh+6KGmcWBxg57zETjFUFmi2hqWMLn86lAzOgpaSvzHZ070iLgdJF1ZO1he/Py52dzSNId+Ngj98Y8gx7qHExmc1lndRt2P2PVsTrmWHRbDppnU9VD0TwW3oEOBSHGtIRX6WhZH+g+zvyk3t1tAO1GWO3B7ovYwZhDJ9kRZVxzomZgPeKyEIqOm1rwbrzlZtENnSLyjOb0oycXxsVmjKHXSRRK6G7aIcwevUWZb4vCwctxqivCiNPOMtMGLk5HEwQ2WJkqD2m83tk+x0iwMpVmFHqcw+KidFm+3SKZqFoxfo9ZorDnZyUinuKaY9ChIzb8L+3JYhddboN+JQNacsEWtWLOW4kCLNaK6QoJvR/kDCxYloTMyOddQDi4ZmPiOWG2UfALq/1dQCzZXrK1FYTKMc+PpjXToG5dYe8+bAvpkvlNyku6C0AIKXP2s+n3IzvsBFOeO7cmg3rTfHtYgcBoh7li02R2CzZHHe+OKY2S7DV72cMs5gzrM/QZObkyrJzVZkzzexrLNdti1mIvybvNMcFkuAz71fZeJfr3i//Ywj6bxHQfyHXUShTi8+5TA4KICI2sp8US21M5Yr0DpSHKOjk3GKTjYj1EO8YB/dZKr8YNUVtTvPo4KkF4EtTbut31sZ0MkSmFvQ2fAkz7m8XmSOtR7cb37DcB34j2qO5JCvmndONsbGLGo654mBclOiYfc3r3ZMDz0bQr6ga0jlKLzkjbmq+MdPSRekVqjz1i1q7KO/NsS320TKS9PCC7N+3ENInYT86xjj9SIcfnsv8jBrDt+mq0iT+OA7pur2gutI44Z3/jCfkQXdacR2m5lpgRj8aYd1qXmVwbSrir65TOd80D+AH1IrlDBo3TSLoX7b564taxPW35nVfNRnS93udjsXwlyrHDfzcUP1PRMzWbsGcs6gY2mJoiZbWa23FrOIn500J3aDE+QZ2uFXaQt3ndBP7gDjKsTDs6FCTCkRJwzr4vKFZzYc/qEIM7c5Val5k3mIS7m02DYkivJ5xwXLNviIV3vwFb9E2dZEUuwoF4Fj6MezYcjMqGqtulK/G9rZCb9qxY2LsaCgobd+ZymH6TkSdZbQacFBaRiSHFkyCtPY/RBn8+xRtmrkE1GTZ0WzD2zUObeoH3ZHWhKS0Z6omYMPlafZXCX6Nvq4rR5NSp06gL/eubNu9cE3Fr/2pubrZQo0hbZhQ8K1eWoiQzBlCK34rZ+KGEaRvAYU1ZMvfHvKVrKlzDpcGH4dBaGupX8XemRxhE62ZKTscEJXzy5sM7exVxICxKDjHH725bj5fYbGQizbV2zD7TJWOLWyuxsD+6qvjeBnJ33e3k8xhZSe118oF+K6XtdYm/r5OOrpKahcVarTZFlhofy7wW6SprS3Y0MZ78l550udkV9KvrEAiQiBRLTrZ4cGFGL4KE9IMNFLVKKwLJ0cMijFQ6dzI3yrszxm/C/FgA8DWFT7xaYG897OYWor//7RNNPalQSSXX7nc6Q47Q6+PbywXdTLFP38av4r84d8k8NXlGOMTY2mxjt8RkV+sHGFI2ut9sUAjRJLaTRa0aaVHF3e+IML3xHBBec3ySOh5laEeC4Hdsw7GgeU0sAXMGt5dsxhpDQS7YM0WNktQaZTgbfDt+YE8vDysu25F48fJ6lNh7TrHorf2GITDx10VSJctoNhSDXk1Ihb9PCcSwTJD1OppcINxfhpza8d4Op54Y7c4eIG47l+ouJf4LUEsDBBQAAAAIACeXOlKHGRR1PwAAAD8AAAATAAAAdXJsbGliMy9fdmVyc2lvbi5weVNWCMnILFZIy8xJVQDSBUX5JanJJakpCmWZiQrO/i6u/uF+rkHBXPHxZalFxZn5efHxCrYKSoZ6RmZ6xkpcAFBLAwQUAAAACAAnlzpSt+ClBz4WAABgSAAAFQAAAHVybGxpYjMvY29ubmVjdGlvbi5wec08/XPbuLG/+69A5Zdn6iIzn6/NqdW0Olu5eM5np7ZymTZNaYqEJJ4pkkeQVvSu17+9uwuABEDKTm460+pmziQILBaL/cYiyzLfsCBY1lVd8iBgyabIy4qFC5GndcUD+X5woNrjsOJVsuH6Pc1XqyRb6ddc6Key6SLy6JZX+m0blhkMEAdLnFh+05PyssxLFgp2Tc0zfO3rhwjkddX2nMuGA9nZL8LoNlxxofuL5JPzxYcmf5PfwdO6qoogShOeNfDfzOdvT/Is41GV5BlOE9hNXwxt9iniBQFjhyzLfwrH7PXLp88UnLpKUr8o8087PSYqORA6oLZAiDSI8qzin2CFVbkbI5CTfFMkKY/ZNqnW7Pr6/I8HDH56xSI9oPdvQsHhI5GSTbDd168HnJBi3hmNobYRm1ZVmSxg5+l9SHO9TcNqmZebY1HwKFkm0Zhd5DinT3MAUAB9kWdczhmloRDWzB6+NDQYjqkb/groeSAXRW0w165aA5lejIFMsMPw/+O8GLEtPyo5C+MYeIdV60SwKoe/nGXhhgvYCA48whKgXJixBVd04LHEsN05TQinRdPiAqBRg4POc2NhzlDvgXVZi1JQL/59S/umzG959jYpuF6a09JdmrmusbVl9sj7ViYZF9gyTSUthMnub3gY8/I0iSrN78yDhVV5mURhOgLlgNISsyRjd8+HGtgdLwWKiAIU6IYgUD24xqeZzDO3V2kBycj04YJvnd2S7df14kdonKYVUuW9VEnq005UfIOgmuZhR9xBIDdhFa2DdS4q3CaNzwkvKxSQUMnPiNn9DIHXQ66/O3sbvJlNT2dXI3p5O/3mfKZarkcscrUOaQtEwSYC7AtMHiwBZV4WZZJVckFKldRlmiaLF1qRyG8lBy1/x4MIR5b8J2E34yRqD0Za0oNtGRaB1MdImgOwAMB0yg74K16dwyMvvSDABQcBdEEsgwUosmjNgVYT9vMA9eRgzF49HTF6FvDy8uWLXw4ODtn7Nc+I33Pgf1L2KBF1gbZHCshdmNYc9XII/IhmZwk4r+o0LIHesHKehVnEAZSXwAgucHERqOSAQACAZZikgO5QQ4XZYIp//pZtgDxrAWIG+o6TFEZ1WaI2x37+wdXsZHYxD06n8xmsQ1tDHx+850+fw3J+N2LPYM3ByeXFfHp2cU0PV5fnwcmb6VVwhcNK7kdSfXvl4MPfj39z+D+P/vfoq8f+34Obf/zz6fHX4fH/T4//+nEAcA6kaNr2x3Ps0YjlxNBKTgeDQaP8YwYSNSYg4xuktC+tk29DuGGg8xnYm7skBqKDpgEmKUPkPlGVdQSiSyAXIANgwmNxjCsIq2QBhKx2LA13vASyVVsOm5enIP4AJGYZ38KT1DbCl8pmCqoO5wxTdst327yMcReBWSrgNRYC3WvEGzYEZl8mqxrVozZLAjeb9qXBXSrCaYTKgVuwkixK65grJXfMbm5gMaCVbm7G7JrL/Y3zqN4AQUIyzwaxlMT47URFnqcO3d5C000LPa/LiAegy0GEhJylolnkF6a+MOAui7ncxUhgKGNBLjWeBqZNMFPtiDFCqjMgebpDGyIH+uxsSTZUjeDxCDtmSpPHfBnWaSXpneagr2NG+uXmxl6hr3oGLj5su06itaaxYHEiwgVKlZrhIlyl/AgmSFeg96v1hnmCw4Tzk7fBxeXp7Hz6F9zjZyCEWYpEsXcVxXTB1wkwUcjIEVLsw9hroB7/FG6KlI9YsmS7vAY3SKwRHIj+IuU4CfuO84JN0+SOo6EJFddp66oJMFJAEcgmWa0rMnFjPZfvA04xP16ksPzxmBXEygeNPWSfRS32mH1oh+DPU7t0DZrh+vLku9l8xJqm4LvZ7O30/OyHGSqTUTvyo574spQIhzvwqDPSXpL+3FocW+xoOcgWKNObAmUVLDHzuL/yR7DbHz7e3Az9Rm8cGMwRkHmZMFt/f5DKW6FyOGanauLuhsPsCpSvO8OEeulg6q4u55cB7FWzdoM5cOmAm4WQQ9UJ+yJgDcZgYYBKpTQmBsuBsUNJkayINhtWE7UmXS4iEYHqFwMCr8NU8IZq4LQkWVIFAbB6uhyxr8JyJeDPV7dbw4dKlGBC1PD2L8/HFmPcbv0iL7yBVFSDEfnVw5bfwHUr+bFATWApG7/pgTP79kfAE+CCbQa41oeBCXnM5qSpKNTSJFYmIca9JD0DXoZSLU0fUCEmFD0EXVvsb3KkHtNB19nXhgzWByAHde9nB4dKGE7duwobBRl/tTPTe0P/btdAGid3hGrubpxjsv17OEUO+hPAK4D5dg1zIUdSd4OXtK3H37e8ArPHwPitc7Kf0s8GyYdVl9LlAXtXIX+HEJ9mMbF1w+3SkyXr//rPpxd+i/xZxlY84yU67xDUmUIBij/PjiptBwiYOZmehlRQA3BZp+nu+Kc6TKUgxTk6bhTyjMhxqNa1IIO1U/DB50vIV5NkSUHxtdYM3Nw1B14AW7ECOALDKwOkXq+yVNLso4VszQIqjQ039rlEz5cULMoq/wRWtJI0jTialM46EZ2G0Qzavcm3HGCNbDJT2G7TCXQNqE2MkHCe04tr6YjXiN7voYtNwTTPb+tCwengkqRpS6g8g/8pp576hgV+KxMkJ+50a2FgERAvoGNtwKdcS88EgodlJGcXFDaBulRtkvgtsmByfFAvuKcJalUZuijLdYuGGqGA2YAoAtaPZAK1koNXQ74SahFahQET8ILWCHxcIdGWkM21eYnPwcjRzkj6IVXVytBZEBW6LILW0AAOowr4klwIwzaEUZkLoZweGbOvCCTAERzwRPkGKv9UA1Qx9HsltORVXWZSiwRxJigw9EtU9qBAfK2O/0TNgsS5K/0jGf/sUQLXUgloD/MGh90wrUsMvnyPEZSotXQQeZXPi/SWYtIg2Xrgv2do/6Eb0BvRaQBKCDhSTioFGUIrwflGMOSrPFMuCk5IJhjglGGJNneZp2m+ZaJOqn7i2VQDxUtkMGwvBBuofrMeHTlrdjrUFs7cW8ATTWoGnh5EMviM+oqca8SmgTSWGzjGzEIXTj/aFEgFt1uMe38xfYAeQ237AnrkB9dqf8RUXnf0QQ9000Duh24ZWQO62d5Cb9J1+ockgEEGJVTWoW3xbPeXoQds7acy7agWhupZ5XnRKmpkLSiGdVVJLisdbOMI2gvURU+qqIsZCVmndWCkhEHmH8nUBMTXNag2T61U56Ynj8Rw0AHxSC3aWK/qPxx91spmOkPO+xbXTXftWRsbvA4peWzpwBCjdWMTx7DGAeDM96GmtBmOMKQQ/OMaA46gqgFS6grjIfs2zyFQYNOiYLMM9D3GDFqlxDloAjS4AAq+MAWEOMSdF/xZVEpKJw7Mrrb7RWgVJS/AUW0VhEytGZg1PK9YuSNNnaUN7V04ZPPL08sxe518YrKHytziqtCHiXmBliLPjLmA/DqysBBp5nCm+D4sbzuBSyiJVvKaQrEutLCuchBkjmL6tKWKAuHukZJniUejVR0v2KYo0bIFXNSVMoWK1tIpHaGFsZxdfLJVtak7D9mMQtY4j9BGgrVd8CjUMQV4lm3iZslOZJpJehcpb5I6BjTMKVCSm9JdW658SxlCI02V7wx+I2hWOzfU7hHldIE+e3N8vvSCPAltaDISje0T3h/QmO0R2sH3Eq0ozHCbMYdLrm2eHVe0mmgdluC2oMf6qGTekhwnsLEp2NwKmvp1kd4TwslfgbtVeMPhA9LuxjFfttMWh6zpmEANky/Qlaz6PTyhomcIarxEoK+PuV7vDvRpVQ7JlN+xycTMq5MzdEenDS5s/PWs6F7MWtWcomaAKJ5nAk9PAQFPdvbBk4HxwyGhChN3EvtfzAI6HUnpf3Nx5HaJukDLKdjRI3HUu9mDoxE7Gvg/gs/qbcLCA2TB+FSYQhN0nuR1cBwOh6NedsD9u2fTF3m8m6D+1bQT9GZnQNQXFEn8aNNDf7RcJp4K7irc6V2exGyTx8lyJ8/PeDMYE190yARWztfoDvfMo578KC92niWxA0wWHIcQ/1YDvZ2es+u37YYjr91iHwVx2LuyD4N3CHVKUNHhCsCaBTqvgTMGNKOpdGvw4D038U+au1lddxvwf+02aJw62xhE6zqD+PnXbacpntMU1FAGGvOO61RrlG82oKLVVA1wGUph7CSs+Avnk3GtQorxLMpjmcOMpfCja84ZJWV7sehsLMSWJi/J1uCW7wQZusr78Plb+tHYlNukCEI6eggaLCdsIJuOddOgHU1z2uNVODMgz2VvT/KOW2VrcZW1X304TfoaR+30k+apgfugEBhY2jyuUVVa1GT10X5Gb+dDemulK4/6Wtr7SQXBpOt5OTNag+11QBiRiSXg026NtZwHljLXw2d6OHieik0HjoMEjK1gekMrNCMGT6TL1tV90tEBhzyodgUn9gTOlK2q6THzFruKC0c7A2jDIkrJd6A5dMMfYTNhsr8NEDeCFof0we/d0coaU6/uV/yht5JkNd831ECZoIDCwbX1YErQCJ2J/OvTJnJvUFfLV4NhZ0DKM5Rl0gKfPHiTMwyHH56PP3Z6g4dMiZwJIRCWZbjzFAQ90bA7hx71GIYN/lb+LetaX6MLzf9rYMiAATp5qrOV7Z4uKy7zPUDUKEUPeYTaN0y3IWi4dYhZYPiQo0HEjTzowl0MnuLUNL198HxtnDzb9sc5cP4eM83qfNY4hiUzIAMWfZhMx47KQCsrYZxgXl+fEzyVYVnsQMGFGR39jovdeFlnUXs+29RDGJUJN19+oCX0iVZTDKGLmqgxpCKJvrYgTsre5rAKzXajmsJs7tZtmF+rVARJFuAfVPxJee+hk7WrbUaB0g3NGy5emvOmCVQ4IJBypzmSiHXasTvuHR7dO5/ksZXTqHMi6lgu+Pb88pvpeXA6ez19dz4P5mffzy7fzQ0gbcGbC57S8k05jfMVowx6GY6N9Pu9xy4yE4MkGWnc5Z9Rg7WRhWrOZhrJ0ZTDYyD1aHdoaIg6Sz93YWhyKjj61RHTli6ylq8pC7S72UQi/8ZqMTXHleYqnSEmpd+maGSGhj3zv/afKo+NErfbhJLvmO41oJG2aJLgKNmrnKlSTfzmMw/rLs6EAKN++OL/ftvNKeRVHuUpuUMklS2bg5dGkrWPzb+Qixs5/3zu1lrAaVYivIcruwLeDxX1yL4voEqMT3s877mRwBDrvE5jGRsucKPSlEqBIrALZnGTVW6BZTf9OexDPPFtFaPyXZpT1S0/SlN9mnAyu5oHV7M/vzu7mp3q2o4t2J9U5AZAaZMy1PUniqdlERP6GpLR8GxHwcaUTwIcRSfvuwACPiNnlji4dX2qJh9uSNBeB8xijiYX3o70DSSsgd0A1QXVKbjznFPif5tSMWdtnn+l3nH4G/o6Lb3dbYvWbXTwbQ1s84jRXi78IqzWPv9UwCvGC57+PuyFoMyx+XY/HOyyD5Q04ebrg7nTQ6xvMw/IVVVJZOciH0qxWtpbHRm0BrXxCmxnwGT1h5LVul+Ph9HDwya2auE0hGoePI2sSql3/VsT33lZG+g2NDcT706S5wS0l1CToxHA6dBke3hQlLf0AZF2RpqZdBlmLziE9f+JdHsL8hIYokzitu6iPcTHpIY8W1Y2lM7bkQuxNs9G2+UQ66hkn8eEoZArtI1ydLruj1B7HIzueIMlRYBOVJAvl27RrF/lMYRZQ/YHZpTWmqgZg20s9E0SHx96jhd7w8eBrO+WVcWwQAiPGKLlKaP489Nfhr60pLqGYgFbvGPdiIzApRDgo5uDRTGmnMu7LKI7aujjTYqw8ozlDruHjT1l6BYU04V7D3GPDpVI4m1MGuYqcwzUSbMm5qEIhGQwWRzgd6lZm49NoZXleUqNY+xRn23tsk0/MFIHZrceV7e/hr3ncLMNsSY9RexeA1o19BC+9Qq7tto2rPuPbA0f3VmL28V0JXrdA2dKc9vn5Q45D2t32eV1U2CnNhhzK6BMMMxeJXfcOL0ChsnLW3TJgL+BP94nWZxvBfOU+heqXPuF//KxlTuz6U0VjKbltr7qRK1rmT+jExpZt1cP63T6rENBx8H6hgMIJ5CmSTUSjkaOyDGHekO6YzzXPVOWykk52NTBtglaDJtJwMeiSMRy8+wuOGfbp/HuOnDaGKXjzDkAddBi7VZvHwpB3C3b0xNDks7GjRxJtqN1593pbAT91iUV/WudiEn72HaxZAOiFWlGpT4E/8EoeKfqQjP2MQaC4pqfX989w+MCevCfYexSrct8y0J2youSS72q9LIxVpdcUfHWfsH5HF52FZVWqHuZvmFMYHs1xsmHtmChl6814hCjrZ8HtFRMZas1D37ZJycPWN3BBV/lVSLLPQnYE03GthgcVxMrSkL02DWSA0SW7C/ErqqunQ7ldX3a3XP/KfzX3MWTZXg9gPA4VFpAelJX6OQlAaoGhnggTaKkSmWxcLY6hml6AEkYxpYcDfrKeWzi9tiXLgftNSPasHZDJ3tLut/7y34kciteFZyXlEhZJFlYghICj2SCdlgXXt0TrEkc9ROdgNuz9Vm238ibp5QZuLi8mHUYE62ALudp9TfV9DbqAtiTHI89bO0Gqcp7tX2VTsHO+zVG0ZqtYH68IiGM1DnVPKCH2ACmagnkOHTJHXAo/sDvqqpxN1KRgyzbUBAXVHXCfXado2qhRWKJKmbV9oA7l+AYxAMgEwAzA/tN1a4NMho9YQcJuM1mOZ+1/Z3To0w5iOqqgHVLEsgPDN0NDR9QCPjrb8XfwLgwSfoT/G/UaXi74Mae/2bElqDHqQYoBIrh9TAiHQ4L9/jnNMeNPH8mINQ7gwhQ+vhL8CvxehndNULQ+mYqHjmEP0LfBSh+QffSsj5N1Uxi6DMYe/X6hD1/9eyVyndSJnP85MkKlEi9wMt/TxTLNX8TTImKJy+//t19syD2MchJkgp/ONChhN77buCNvx4lhL977sBao60W59qrh8wy6pc/wNSx964fZV+keViLTAwtovOL1iCasj8BZcSyrsdAJyjdnEZ7PmBkNvoTr2ZxMYqrkSlQZ1vycol0RtS7zJzSZQq11l7Yzl2Tzv2TlqRWxGR26Q1A0Li0za5aPFs212RaXNU1PNYo6G1TQX4yJfmQV0sdWNZdEZn1TSGeizExzbES0h6gS+Tv865pvf0etuQu2+/sdzgdok2M570muTcs7fwrDU4o4Phyro9sBnh933od9vud9Hv8ctdNBkVLNmIbCuPiVnPfoufqFqlQSWIDlJXwlFd1TM/6c3Z1z47+98QvDwcuvTyEh+mkZHqVp1RWPG7VpBRGq8j+M0dSf1Uw7v5TBE7VeJqvfGW67V2wTHKcSN9MVrzKS1CgCfSEWCHumzNRybhNng6W3XDXJJV+atPoVKTe/PspqGZKLuslRa40Dl3RJec+yfC6c2WAoVCPOBxvAUXaX8LmBirdIqa7Zuoybevg+gG6S4Hyo/BPy9OIhN7bfVVNkuKK/Qfy9vCxNvqyvt78hy502cVpvdnsjLIL937/O1U4Ac4AHpmF9C8aQFM75CTVt6z8pgxC/eMd+v6pSCU8p8YD1ulMb/yrNa+ePQMIPyi73R3ptBz8C1BLAwQUAAAACAAnlzpSV6IfBB4oAAANkQAAGQAAAHVybGxpYjMvY29ubmVjdGlvbnBvb2wucHntfWlz20iS6Hf9CjwqHCK9FGTZM9u9ilVPeGx1t2J9aG15HRu9HSREFEmsQICDQzJnYt5vf3nVDcryzryN/jAMh0UChayqrKy8KjOxbOpNMpst+65v1GyWFJtt3XRJdtPWZd+pGf8+OJDrqmmqWv8o69WqqFb6Z1svblVnfu1a/fU+aypo1x4ssTNulliAdZNkbfKRLl/gz6F2XbFRdd/Zltd84YAbp4u6qtSiK+pKPzE+SODzx6xVHz++IbhTvtLUt6q6KrbKufi632x2rwwMvvjz9fXV0LWLLwu19S99DNv9h2qKZaHywZs4vtnNbtYu1mqjpgcTmYTSgFt/Eq/KulX5VV2XzpAvNttuF1z7WWW5aq6ypgV8u9frtnu1zqqVyp2rl1WrFrDsH9SfetV2n3mZ+N6bepHhSP4jK3sXUW+zLx9U1+ycS+/UvZ2gc/2qqbt64Y0PLn1xH/0A45WFdK766+Xf16jaZovbbKUMotriS3AnhUvppr6zbWCWvYpateVsk3WL9WwNSKqyjdLNX6mmgzUEPCiHLNOGsaVbCfLeqm5d561p025hFQ0opIIPck2a9F1RDlBt0c7sxVne1Nutyt1HtohC3dppisMqoN/Zuuu2s66HG6X7HE1eP/emWNb/7mCDWgQTa1U3Wxalmm3rtsAu/Lb+BLO2BWzN1kR/sy0ToP8AEI3FGfxw7+rdLff13nZa9E2p735qymkyU9WiztWsy5qV2tdyVtXNJiuLPytaXGQe/pU9zwFEuj1NcCZqBrcODr40uH+S88TQVcqXDg6AEcJ1YYcpPP0GvqpmPJshPc1mk4OD2Wu1zPqyg3b1zX/Dmo3h4sFhghtYrrQHixLwmNjNhDfHfHNyRpthNBoZtpZw8yXyz7J0aAH4S12206TtF2uYMz1wRo3P5qnP1LCHeZJVud/gY9AiPSAgaQr469QZjwUZk9cMUVhvVTWeJHmtENedxXcCw9yqZqGq7pjXLuG1Sz59uGw1wPt1AWMu2qRv1bKHBVkmu7pvdFMgsjvVEPTqCH72W1ovH26ugTnwU4M9+sKMF9biXV0pukK74VXZwjW7OehOrpYgIIuq6GazcavK5TQR2oCuzxHAxOADx4uzxgb2In6arIAVi7nqePSupuZJu1ULEhnpaHJgnsUOU7p/HpLzmIfBczmnhvx94j89I5YxEyD4Jy3reyDPoB2h8jxheW9n3naNTNyZJ2znvqmS0ZOWRnH+pBF8PGkmo+RJMu52W8UPpXoXTO1kprbHidsXLKLa3xte9Vp/cdYEZOcMO+Vvd1kpl24cONTpAoWpM/dDZEcI/seshCXqaujumJcrq3Ywqw5GVWRlYqVzODB60o6MewjmoHcubRtsQJsWd6rKnb3b0mbMiza7KWEwa0VN0kEwW9iwxESu17Bj4F+XgWaTEE9DKXB2crJepdsdSKYqrZvVyYK/nyBbP/kuy26y756fqpvFs5M3xc0JK1zQ/rB8/vvnB7ObEi4AQ5uR0oc74y/0Lb14+dPLy3fTRH59fv/pzes/vnn/6t/+CqNhphRzmbH/cxoIzoC/Xa8bECXHbbZUIWMjhge7jimZsX4GfDrbBNsOlR7kIzk90SGOcFgO00rGKl2lyQgmmpX48GgyJazCM0XV1QaUZo6IVSCgAigiYKRzfyRI2XYkV7izvjISZCS4hijGgXqhByTF75+ZEVkeAyP79hHBNi4WzpheZTCgFgRJ/rHLur59U1RE/DeKeVWOvAzpr6XbSYn3FxmyXWhCctEOCQRrlsCoi5wmdnKaPkN+f5qeuo//rbjFTySC8PO+KnfJfd3cwi6okisi8uR5yvuCpq+AryB2ixXwUBqBbvbCR5NoIhY8WxvG/iiQDQFF5ix4VYbiqsqLuyLvM1cIS++AMQMK8JYly7LOOkQOIEGBkjAVmQfqVkv41j0xqSimFNHNpgYWCn1QGitAb7UA4bo0eAQhXBY3L1ipEU1qLp2sClSHQaImG0CDAbaExTlewbJXzIu6BpUSlLRaJ5RBtWnycomoxIFBQyCqftHBWNZZ60wTmBATyJSJHf5l5X22QyrZMz7Wcvy12GRfWhB2di3e9Zsb6Bwm6zJMINo2u0NmCYgFfBMJK9xuafIWpok3quTUahXOTko2oJMVHXEbmDsouj0JaJjo5TKZz4kHzuf4bKtoRxKvn/r4c0dzXwBbhxEsAGQHIG9gKQFbO76BygHcxPHmwMQWxOJ3R3fKxx4N3sMFDcRiAgYn47luehhOVdOIeKrzuWAOBj40NOJEWWd3Ly1vmnxeQ9cAadko5YskgJzdZUWJQmnKi4/SiwHiyAysHmRlCRAdpg20wbNqVKkyWhYtsDKt57UF6INquYRHkPAdEQc22KIvs2bvSgFpKxgfsk+jdd5nzD4Bur9ShB/BjjdFUCFZDYOnto26Q/4LW7XOUaP3hQzZOK0jZ/gCPllUi7KHmdzDQEm+y/4BZbyvSgWCsQbkNRoGIRb3pOUR6su2LBZFV+78XtF+KpTTK9lQOIVlseobQoWe8c0O1RCyNmggehBI77QfWaVwwbOO6Egs2r4JG5ufPrwBhW1d92WuCZhIKAd7cwEjnRIfgimhWqcixq43PBn/b7MKzO5mPtD7LMLsS+iC1idrdjwVHpA0fHhQzi63g/uGQf3Xfz19ihQyu713RpTnZAsDqzdyhZeROocF4H2Pe6hdR7054iEQcdO9aAuecUyzueH/e+2bEUpVVqnsc2zm+AMQdwxb9baBcVrEppCnVdvhk3pv96+2kewlVkTOmY/ajcmC4FwEQvr64seXn95cz64v3168/3RtG8rmPT+1l4gDhQCFRoLOZRsFV5n+Bi/OhuHITd5+wT1DNnTFMQECa3mvUTlxNrmrI0dP8NBCa5ERjI4K+mLvinFatJpsxoL1qfa4THyjVasi5/p+irbFjFQY/ezEgy/4Rd6OSAlsYLl5zsxLr3EwfNupfPNvWyDyLXicTIRz/q6N+rEQTWDwEt1AW5ZgARhiNOey0AP3NGGYNuYCqEN/+evQE0wt9gH+bTs+TH5EgYrilb11/TZpa9Zr8hoEETqmxpMEvYWdI3yRK4L8Ku0wUXecIbtnD5WZv78eBl/ptu/IAJm4g7leK7RSGxShLXBU1kiBHHEkZKWqm55cXsm2b7Zg0rapP+2q38xcIXuePIsbGOkU3ZVtBDf0hnJJzSLWn9VhclGR8fwuW5XqCFXPVd2A8NjQBPAJoJop8ursrgaLBV3BoEstm2y1AbFPojQNQH4m2wd3z21V32vTCHg+qb5JlqNOooWunFzU7CyY4hrem+cbtS0z1vuCPsoC7dlogWTuKeh70sF4xD3MpIfRNPnlV2fpwkd/GRGaRr/qfeHT9J7mQp7BUx7Rkjyo1D0t8kMOD/GwZIFYjMy8oWcHKemfzpNT06KsVynR4tib0wgM24aIFYbIZpSjlY6f5JOz5El79gTwF+Mi6HCghS/ozGXyogGdjb5/5sB1VgehapR6MtkfPbnV9nREUtX05t/TgtTlpVqHmGl+7w+bBbIjO/z7T5+61OFMSX8TLxg2cOgCneiGLqZmXIHD1F3pn2DTZJ4J/bkgHVqIJ3KW4T4Ut4kxTxxfwSXKu/2GDLu9kXeezVkWkJ03n5MmMZ+ToQP9Wq5KxOt238rgjLWGn32eBPx8FN8BMJ/7rECtdVmzDYB0Cvwex4T+Fzw+cR8MtULrjEz9g8C5Zk4kCNGhhLcRrg9vYN5oSs737EKhWuMvJ1JrAtbrkjbJFZRXrJ1ZgWtJIdYgeFbJyw7IEAxndpGfIXO0sl1UC1+zIHdtcEwqhDe6kqfILet716U/kraMR39CWswE1rffrY//cdQKP76O7H54eA06koC2QVAXm36TkH2KtKAN+4iKS/Thw2xiqBOfV6A7FhD4fg1CqCyn8P8RnhaxmZIRb3RIGkneVQIul9aFg0ZyC0IKbWP7yDSBkYMSArgCgl6BiMuLVm67Xkt22tCkBg85x3gp0FAsZx+BJaI64ubS3hkC8vGRc7wwiagy8vrLkIBAMyA26htIJeu7eoZHWADtdJKcg0oSr/qh475gbSL3MQjqmvF5bPqO3UC7ATiuy1OObEG9QwyJsmA8WckYOAJoDaj3ock7AAzmgVudfLg7WnXiAii0J1FzdzsP8XGUYHx4ZMS7e1AD+qLL24OVc/nGVe/z9OQmQ1pBF7Y93AhZJzb38e54ytlTaNyji75pkCD5gBdQJ+fRhjOHqD8Do30NnM/MbI6TNVe12Jr7gsTlqFmJTijQh3vcT+IKdWQCMxp9kLPIGudMEpZ0gZ531AiR+6icdz1uePI5hhvdQEDxA4yq8nwbJKG0P0u8IUA0QCsNu9r2ToIHKTIumIPxYQ5MZFg8RKLAty14ezl2uk+RQniout+pZgcMB7Y5jDGHnndTsH0qlYY8O5ARgS4diYs0YorDQuBHWNMQGG137WpSd6TzAweqfPGA3AIlaMTAJPxpPHKIWA+NSUiQi7N+iKk5bNkBxSNCvguYHtheU15GYB1pyIxj6W34pN3rdKwDPOyRG/4VSCagmaZYrY16k5lzBJjyBqzkaZKZYwQd59Vql/lDh51mVFuwo2B7sCU9PKpDWHgmJcBGXhPHCKwAx2AN4CMbEP3EV2D9aSc/q3JLEwGmL2ccTM0oHR4+knFnhzqbPmFqEx0sErlP9Cm4VexLoO2x74N5vH9HIIbAzMaAjRruhU9o8soxXt/yGVR3Qh4h69ZHTCMhAuWDrruoN1swqm+Ksuh20wCeOa/BiJo8KYEAmqExftUBRatGClmwbqpppkmPMUNyHSm6D2yQS5aWEo246Hqg4p0cjMAjfxBLhKMC3LA1CmsBdBjXa7wINAAvaDFcBgIbxsLFiiTPh6YywtY0ujxBtCTjRl9AzfpJS1EY3oQ9cB4z+ag40iC7gTXA5UI3CP6C6fFZv3demlzaM1YUY+vMOb46pOM4DmVZEBIXGFyHiguKkW7d1PfeMSeh3MUcqE6kkhHaRhRjMGKlCL6n9BuHE4Yn/LZQ+oomva3btkBL04XUMhIqCmX9+IYRwOeNqPK5fiHcHnjYCHvA4K0GzlpUWZmiT6pSfOiQ16yla+WiXrpsUGJBQI1u3WiQom17dfrs+XfPXfSPDAZGdNjNKzEhl0Ze8FkL7uhSgflAKJqYhh4+4CnrKyAbTojmX5Pn6Xfp734j60V8Y5PdKu2IDA42EtZdNuSC9xnJuebTaAL11a3K5RAiefoUcQ48XwMdOA3wtGTVAM/cOIKyRocHHQ0mLD1c/UxUYCfcp+6dM9NH6tSeWs5QKookwIC7MJrwke6NB4MlkHxlfjY6gqIiPCD7IiRIK6VTb9QaMFBX90OL650b48dRLmQ2woLM5YaOBaNQigcdL54Mnw7GVXjxFKGKZWMrOLBRB1Y87Ps0TnJyfFq1W6gbCEL7XTzNxYjIgQfSFt2j2hB3xD7pgdEpDD0S+BG90wLgS7BYFDOnvnSNxAPxwfS9y6rsVIethkDjJK0uVNbHnjydemH+E+SskeJytXvOXKZlVkkhS152ADR5oZsUZEK2HjkP+OYDhQNY3rkiHnEeKxznLl4nMfdzkUlNNT+aULBF63kLnuq7Uy00hEMBHTtwNNGaXXeJWmpbC0RkexgLiKxzcUcHS3Z3PLBMaD4ww4u9I+7QZ9Jq7HHPIebo4yNWPEPIj4Ho4OEzn2O19+Q2Q5MgyAJJxhLMeHV5dTFJ2NlCuOCI46J1oJVqVcA6AoWijkhxmrUYWYEhzVZOqyqy7XSInA6eT90RYnSDyHBQqArgDVNhmAtVoGpsQ+6BMDt2jGc5u7yD3RFMLt4KrMl91SS+fH+h03MG9pNogMhTN9ni/ceTN0XVfwmaEUKpzcXHnz9dv37/+R0tRYj/2uqUU25+9eH99fvr/4SnYcIVO0rqirsKOsHVb0HDUU2xuO1SWJ11f5MW9QnoiKuT589Of3dyenpy+i8nWY6BPT2g8riojs355XF2bMJ8j+v2y/GtaipVHsPtk5DwlaigdJJeJX+JyNQhpNg3Kzc1KvY2MJP3W/x1jw/apXVylA5GEuImHwe73HH+ZflsmOu7t9yeXm63yUW1KiTyCkND0RYAOkfY6JD0FPvA14ptRtMkOA9iyNbCeJGYsGRWANicELOETkvYQKT42Xt0ZoFcDcBhpBQ3zXLrHCHOt61Ry2hsuN7O5bMi3wNwElCkZUUWBNGaoxm0lLglRiziuMNTnUO2OvUDNEjYh/2G2AXMdg9kdg3idEJwok5opzwlhyR/Vk1tqEF8MsD7yTXi6GQhqfskMegLf6zejp9v1t09uguhRa58b7TAMvZEEu2RK0hlKZ0wiO+AqW5lDt31jcmAqGJfU0U5LlkSmxp7e3HHPPE3MXF9WR5h/KSjW6G0Xz5HFxioCYz+bspxgv1yCSwTqADoU8KMuas2etoKWBkMB2UggvSlsYF3jn7QAE8sUa53gzLJG9+L6NbgfB47qvjwQ0tJUP4u7NaLZJwd2AfyThHqzQTsatjtu1iDyu9qYMPzS8YcJ4qYpyByu63L4lYlH3fANTYXX4puku4B9R7DSO8LcusmZV3fyqMZLOqK4zxREcnVMABMYWPVFWcxVsKGv0XLnroZu0Mq97cryP5ucGFFQg5Ez7DkucMjSlxOkDR27pQTqW+dh5KIUybv2gpznUAkjSiH4Q8jO4Y9ESZHT1DroBgSTIVK6N+I/xwNxIbofN/oxgOxJP5lUXu9a4hJ74I72/iOu19Szs74SqNSVatuPRjMEu3MwUTQcQRy065iahvIXrb7jUhsvWVme1VmHTpMjrWn8WyYebjHL9FGGP2YFSUbpZStYKKyx0ifIIP4BGbQB5XOTIY8NMYHJnFDGO2AgvdlMSuqZU080r89iY5iQ7w5Liuvfxat26xbx1lzn/B+lCM4DQOMwqAignZOIFPKf9U9/29lt5kQP+cUb+j4wuEKrwVwtlhgrL1zCGYa1WU+41OxKFqUL/tH4hF9gz4IHeDaDSsSmN8rXTjRLwNnnjLF2C3nQvOP4/DztYgVHe7xms48zaIV7Qw9Zpw3ahSxfQuo4zkQe+yDnKP/i/NgMmBCOg3HeOJ0ejVasJ4jyfEh7l1mAM3OqBZj/Mejk9HwORWdrroup/ev359hSL6EWmalyQhGsWpVOBzdzY5y+0ktppwODcfdD7wLWEIwrhBL7lhpogVnmcQU+ahEXcnRdSbyqVUm8cNEkZp50PlZU7ToR+MMHQ558xNH7HZpOokc6oI0RKIPm+RrK1AQpYa5w6qUeHEfLAN4CMJgh4ORJuMY9xR0M/YY1VeyhnXSuec0dfIFAonpScubOg/D/r8lb6BRnG0S8HKRgWbDBbej0wNzB3eJVoCirih3ilyiwS3/7MGbG9ZuiLITtDD5yplEGI1pFV5imkQL+tii8rIU7UGwe5iF8WqwO0p1p0pOH0PiFjPUHHxQtDRY8Bijpl3GLOR3KFIsEtEwyu6BAjqQ4u1ghqhLh285iG6zqStKWOowMHyLQZBNgYFwkjpFE4ZtBcb/wrhUodVdkfuu/JudrZjgZ2nMTeEFHVQkUxtOY3WBzt1VnrO/A8fLPkFFSvaXLcXVwX73ntzCozWoz3jCoCpJr5m70UY6Jw6dvo95FDGseZHxScLqgM2e7eAvxQnBjH3b/AaUeFrRPef/8cEUI9lnGi416VUYa6z+dHE9Ta7ef8T/P8F/qlukkwgs7HMf5jXM59OHN6TuCd06zo8EY/5DGLiFfCCvsy4jklRVrs0sDQFbw2gKyvDTxAEWBRCE/nWz61Q797U+PHvqVEOKi5PGiw+eBM+xfwH9Vsdk7XlJs864o0Q6GrpNpUN3VN92tWmpp2RJF+M8jl+u0AfmQblcHiM/OX6L7izGPZ5cE49hxuDmNnISLtzXWyiIVacME/2APlUGetdJElyAoS6Nnq8bx3OOEiTx80rSI1nXrEz6sE4iwhwQPBHQTjGJvA4OJPUq/N+B4GuvHtLc8f356RhXqJbN54gm0KKoxgQ6JTlbFs8Nxc1PjFBsJH7oK0OxxXVSGsfcjY8cyuv2wNE5ZF6g24YKDoCx1Tr4SeM5cMAPHstqdJrJOKKCYxo4KmqDi4hCLTAzMTG6qiUh1vSsoyGoM/Zb1hLixrM8CMgxitfXayvBk7ivOISRTya1rwZj96nOge9H3AB7K+hkJ01elm1tclsJLZo8/DJY6FHXqkAbUbi5ZR15Or5yKHkAMWGI+RHrPdUZ6foYe4Af6BGchbjj5HGMet4Ah+Z4nTXgqrSjBnNYSjigO6lNXjw7ncJ/z/15vnj2Aq9+h/99P0mTC6yLYCa+qIHQ5ciVxy6mGiJTp/G54AhB2kzUYDBlq44nF2pb0SR1YsOUwaL8AzbXSMEAXCFS22snPtZmTPvjwpIHEgCPjl8GyD7wsMSapNM71Inb3C0HgZ++tWYwxXyIJsXph3xmwdIF+VOxqmisA+xvMBwDqwToqkJT2uxNkavWE+3+IRHsiii3wjk73mQ7t4rF2AZ4TP6WMIp4Oq4mHM9J2UgO7R2QaghsbjNZS2QzhpyyBoGr5bMgitvFmc/nbo/AonXcis7HCdM8OJk2JA4nCNymGaGWJKoCwkfto6gHEoZc5S+as2xyE60tVo9Th4GTCwlEcAztzzkKEOY6FFbwcFqTnDqPkU0zmQtsX/EU4ZXxauARKier4B5p9Z4ykLV2gXasByVSQmnLTqwl4dUDO4I+yLzlh8JTNbfLo1aPxuft/wnDZrSJkbHIAuKYz5vUXZLxBMiirvwJQSMjzymU9lsQ72hOBUdz8dbkcKZgA0FP1m4jc/sowNnRlPj5ZD6wnwbDNYwAkE2pI6xka6E+C3inqHR+POmarGqXQYQuVV1Dl4o9lXgESCktVOVgI4TbCGdzzF5n3J0bEBfMrVpTgSWeIqDW2Lz+PK+kgCFrueqWK3U4ejQNS7Yol/4AwhVRldRhPDJLoxRd0yIyicnc13gMockJi7yozthfLjp87R9k7/G23vYlWaFm9dnTQ1EP8VSxNIVDDf5s95eokLDtzmdbYqTaUCFRP93yDxx2Ld7ouecusM4LKhmC7mj0L+m6ib4DLafscYoJm5kaFfZBcfl4gdTaOhj0ANscfHYS8c+HKh6ItjHlEgSxn9ErUECzBrqyTxmPj1VKRJCeu9UJwqIIlovs82Q7Lc6TcKePgp0+kp3uRRyT05aKWjpdh8qR8QzSaD2vsO8PplENKjZj5xw/ni5m3/vKFdrc9+rIyWHkjAysQyN1C5KgcOOjnMJMaHiSqahHPLwb+2VBaU4P5TMMwnDokYjX82dHrkyMfETODhuWLJk5+25w67a6nprUPRIr03mUpQYg5ERMi5MGK/K2xE0/bXPmCYCpu6wpSJlAilZ4ugF2/NTL6sW4NHQSBU4kVFk7cv2sm7pfob+Go1/6ytQpy7BiEnrFlg40t1HCw6KyCU4MupFUg56rG3emwntyDHw3QlAme8flpDjuq+hazQKNldSyz8uJl3MgY/YChbInh//8+9Pkl9NfSaMzjsGhZ7DRv+qoMQkXW9SbE2GC5i/BbU8A7g+RJxbXxW5YO3tLGk4lXl2eN5cIhQeK9voHlbbywtT5LlUYpgMM1Tztbcq3CvaDTQg1bhQunZeb2ClkDSyfuUDh+3fvLl5dY66BA4x8kagy1dsd20/ChrFak612kWD1RkwAIebBJUs6ob+69bIcqAWGPrJBuCzFx4kG0Q4Hh1uXVLntLg25+xCa94kJPW8EFESG6Fs9bbtxXOnFR2gPzPRWqW0QAnIDpi4pABksF8rfTtnNi7EeaDZGZ9WH7PzKCjwhpbybTxVBwoKxbHA4QZ5NM8CF/o3GQqwI9qPmRrgSQJq4yFgtVeXOcNn8YRXbAcScsMVH81pYNAPpt6w2Vaj02PHQPSrGCsNySqEyuA/qvgCMkIqlK0lPmY2RcoOhTnWTmzxeU23agiBXFhWoB9pAaO2gssYC+UTcRPpxrRKSjhBUtB6zy1Y3eSiu4VDXYtpzJsIHsr4Z8q3B+YRMp4SCLaGhz4RcIzUo+PI/idrHDzAxTIQ2bMUWcOBC4/ao0+gOOnzGg6PH4Ed2ek2ikL24b+zi6/sZP7q0sZsGyqkCwbq9RX+P7+lnpsXabJxX46/iQIgZdz2cM+ShIro6FL6DnyiEBz9BmQxcyrgRnWASGUe39EmmrpYXj1EODuXv3mAUxiNYi6zGrWrR4Ia9Dbg353PhEmfaLRsA84xoHcKlbScqscRs0AftWJgBPF0Pi5Ib0Gpzhieph1z3QsLE8roHhnwsTQJgG1CvfCIwCrlsENbkl67PhW8Re/dZM8Mkf7b4oWBsH0xMJ/A2sXR1aMJwz1iXSWc3MByqzMRfo7XiOvZCu0et49tB3QsP8lARu28wj70Ruh/sV5O7UxrQMwZjyg83TEx3yMXOhyui2LU+93Aet9Qn8to0ixrEB936E5G2U3XgHgXKCoPB/4/PXl0h5weiiDT1/YOh9Hhd5EjiqwcP1amOq3FIYY9Jv/3KMHycxKopC2SvlR9MqaPvvDbxSzn0Z+AFKPrjBIT6NwbeBKI/8ftZDLTBq+FLOZyoxME0lddcWiHkUZIS0box9eThDi0XhiLnkWC/9I12XlXqS+dUueIsrXT/asULEaSJT5OxH2AbznUyicUgblD9xDiMuS7jHtw1Gnhzy4QzrffV1tM92ve4jEevuFSNTrGk+rlwNwUN4FvH49HWvtl6xOQV1QCR0XRUEylRwR6PqkamVCIFE91jDublltGBJAYtzyzbSmYwg8UtatvqvN21qQ7qHE9+ef7rAzqP7rwtQVsfR3zI1+FtQQKbwIOiTQJafVJjo8DZ1loAhxRHa2XocigM/zPoRkVHkR7JLerueCxrdrycD+ZozNRaGptk9AFwZOvr7HU3N+4+2+mqyLbqMTSXgr5dHceuH0pwqQ9qarKCjaUFnbJjnbPT5MRvAB5YOVvRM0jHFS+9PRwxZSJLCWwpunhcrlpA5Zv2lZxiIoi5tC9RZKmihoNJE5GWxHPQricTghHVKRoAButATgo6ZjI1RpXg0knDXqnOMkWudj0ALiqYJ+zTcM0Yk6LW6/pSgUav6TfCBXrhdkm2yoLki4cDwMnLiwMaP8H4ckrWdPFIOYoY6nX0pDmSejzGFazrijy83U3FlihMUX++ySZ4UNPfqyQN3RD3dXQn9Bh/1S4Z1u9mQybr0DicsEb3xzdaKxo3FPCov/wPdcLD5Gc/BOIPju+Pr8xKeZEPCRSJcuDTejkwQQqPWo+9UOLodsSrgzQNDI198exFzAXErjhPRj9dXI98PjKYO/WQOPSknx6B0cZdOTiY4eVFxsQ92xrRkoBEXtCh8BQ7VkFCjoFMuhbdYMssNAxlrrgJ/RSKxwP3RPYMJPGMpPBYPzmJ+I0pWMizQv7ypE2Of2D+IWgNlv7vyDci2H8vLrLf1IpPxb7KVs7/wWcObaLFvSnexyqe896XsFTAOmuZAmcsr85hPHU5dhkPL+SYxdsxvbBlNAlYj+x6gWU2fZgYFnYXFoj/7TMXnshvn7U8hqEgug0X+W2qGv9gEhZ7fw8mEZGY84K14C2N4/ila8Fb1T5iBhTmJTzwMsgpBeYSeP2KmD1vhpwn9AYxKRo1n8tigeG5Us0WFP1uLqHu5p5+xeqc3zk5n+MFTCuTQL26yTmi+A5fn+uGFItD9nI5CAwelQC5Sp4tRD/DKqI2FQ5zAObzW7WjcyD0Tc/nCx6097NRf2rlZzbDK62dilyZARFzE3yDrGTb8gWEj+fd9zAdnCm9najc8StigEedber8DB/jSBovWJAClbGElLwmLQzPobhJ7BF9tzNOcaMAtH67amBrEsTA1NMVNhFcVlHRObfEz563xrT7XxvjEME/Xgzj39S0FeZoaSIbuo7UNgBGk1D4iFBkiD1LhcGdYLsM33V27XB/SO9fe9GNuRPzlTQmDxp1dAow/LaDoTcWDL73IEiXZ5oIEg+oCr3f6ZBUG5RkvPhD12aDQHwc4Sd8XY+mGNhb+qvfwNAOepj094EmSEa6CX6Pu9EUJV3pnwEsoS8EJV8HGyBB2Db4y2/mECQeItlffrOAOqFpcGWwuUOu9gnn4kCl4MWjyhdfcWtiofO5ZaLAx5e2TPiD3NhuLaxZCvrnTVm0a47/plNtlAHmdJ1f9ecOxVXUHW85H67vea98oJdzsRl0sgFeYj3QMCmPAGMNxeNCERUNaEWGy/mEu6cl8T2ffgdaanbnEefedsSmQjLdq2kanjhEinufcnnlHqIMz9K9kdLi+Lsj2DCh+mfjyh5b/Nql6QtNg1SsSmjQ0Q8kMtAP+bJkeB09gG8VMTCBxrOGclSl9qwpTaMjLPw3FhQbE/aJbnsMLz0TBmwOj47a5PLqDBn/nq1hCFxi5nQ0iH7RtZMq7sXNxaFc3pukUq0CGR1oYF91ZQuybIZ/nKg+34PPBwCmtKZdur/hbUnhC3JdVfz/+6uTPv6vvjvpd797MfzyJLckga+Z6hdW+FeBUl/3m83OXh0KcTYHqNGOx9PNI+9wk5GBQc2a4JGxo04NWn1fKh0xZV9INAp4gZUPVGdcv5jdICa8LxUUDIaGSXd/UYqBbpjYvc72dUgt7Tvh8eNGiXnoHniDldN5rNWdOx0OanN/x7dYPU42PUYyfotU3PvurJDD++Fs4dnXb+lFDG0PzHs84H9gRjsZrt9rHj9MfqybhbFPRXiYROyeguY1hDD+K+QDD5WU9MuEbQgNFC6MEWDJnGrxzX0SGWDaTmd0u2hnd6KCBYWB+JSxpePGmJEMl0Qcfao0NGEszvpwNDSuEqKEtu/Rk/YoTUbDsDDxB3O1bNRI5AqBjVFXK6xam98VdDD8UamzfQB1gLxNDcpyWJC8XrRYXFVVJ5i01HZYVhVV1Py4b7OVStfdptwD8hCUnGONKqzxSEiNGBF+BgpqXVYtZgwoCcX9zHCiuMUDKlNlo+wpXk1ykbBY8O194Bf7iWocZSanhaRvZR1fgYvMe+065ivg+I2HSb8aql0DV1tIZq0QngROcrkxHd/oF8HRNXYImkSBYJqK7GDamvwCzq+Pz3/Hs1cR46WUDyNJhvySopowXR8D2/V7rO3w0uQKpQL66KTWkg8cU9LcTDSMd1T0YsyBZDRJ/1g4L5CXmTolWQyofdNMsUgFJoVSsSeuEcPTQOKieoihF2lqPAL2HdJYwoKncvElwwoUblGWH374wQ3uCAnqSF6tsKrrFUh6TCE5mngPN7okpY4UPvrp4vpomhzphpoGH1mGyqnfRK8e2VeFaZp8/4yfQC1hv1Yr1D7kTnbKwrEeTTuHnvQzqRwYjwPBO/ShKlnBBn2nW3L6e1AWi7O0qcwNRqKwHAtfiS3qz0N9csNDY7fouGTKEcVoGIyKuVdmd9w09OZYyka4vLr7Z6R20Nh1+dTD5KPzHpSpnPNFD6O7ncKW7TvbcHFN0LQdz6LJ/lxQug4GL7f4ukjaoH/q0WNhAEp8OxpWQuWpALrUb0J36vHbcgh08U5e72OLlWR2UBrOz/U9Npx6L/rx6/xgTjgtDecCARb1W3UExlM2mp8S10kTSuN66EUlz7///Yt/0QRNDNfNDvxFXhFDN1SVy+Vf3aRBoQD888vp2fEpB+rpSosogv4fUEsDBBQAAAAIACeXOlJezEm16wkAABkgAAAVAAAAdXJsbGliMy9leGNlcHRpb25zLnB5vVldbxu7EX3XryAUGJELRQl6XwLhOkCuojQBHCew7PZxTe1SEutdcktyJQsX7W/vzJD7qV1b7kMDxJKW5MzwzPDMDHdjdMaiaFO4wogoYjLLtXGMr61OCyci/3s02uC8Wc7jR74Vdmbl0yzTe/i2cy6P4lQK5crF31WsszwVTtwKnjBuGU5K5Tpqj4xGb9gf3Aq2fIpF7qRWdjQaxSm3ln27u/u1NEabSTV4OR8x+Dcej2mRKJ+zwoqErY/M7aRlmU6KVMxg1oim5yCtJfUf3CiptpPw2ZF68E9fIfOX1qm3tLJ50NKNNkzgDMtiTioOEjQoxlkOYmoNidiAV6SSLoomVqSbKU2YskxYCx4IGvAfjs5wkF3RnGqgMmfWkTS+sHN2Ycfsgk3aUi+b2o1IiliEVQ2Fb9hX2EYu48cUkcoLk2sLkVBNMAKCSXnDoohQiqIpm9xoJaYM/15W6N2KfxXCOg9gBeWzAFazLHiHO7bjewFBZnUsuQNI72+v7RlIFmYYThgDNOFv9bhS2gWzDeD/Ab/SwC6Sq9X1YBjecknBthMK57FYGCc3Mga82IbL1DKMQUUhs2KxVkrEiPdQyBv9dDxLmduJhjjmNEY6rvZqn3VTwHTqT8yU/YWbrW16qsgFxExli4fmsnZQv4C2p7WRW6l4GtEccDp9Vjv9ImKdiLO2ygunM+5kDHuBRejaNcdR2PdCKwcE+e7umIvuzrvIOh0/QyhNjVZnAtkD2EqJpxwwhpEdz3OhgLNk8s74w/XeCJsDuZ4y2Js5HEDFM1gHrmkpZ+sC0kAqaQt47NbA/cCOCVAXcDhsdC1T6Y6z0aLy7zJg2BKEati14Js+mv/Bn26FMyGYmmQwHE8Zf5JZkTFVZGthmN7ggTFSQBBbogqRiGTm9znPueEZHdI5u2sHY0WWc4du8XPmZNf84T9wwiBj/TarFxBDo0vqDSMrPDQVWTAE/WGCuuABZKVAJmFiRWl2VsECs7nVyq8sVCJMekRpISQDHOfQmhd0RQTRoTY/BE7yX0bVaDgtMDIGr1SYloBSpvIbu7BssuBlhrwwl5RJGoova6lNl/ZTZ4uH60ytrVvsuNqK5NzYAP4ST9I6IlXMh1vhLPBN8AEFMce/Qm4V24GCc7NEwOLqtwaYDbjuYJAOkM7RjJaKFmyIUzOpvBacjiO9g65K8yrs7mQmdOFWDuj9LCJBNkDUAEGp9nDoEwhkzA3E186L6yesoOs8hgTGih+FKyX6wGY6jgtjw4FdcBcTpVHh5SccZJpCvQQDbK0BzTnE5PwBK8imdkvrf+8+/vQA20rCmnByW8vY7z1PPz3M2uettemujknzx5SdEapdJDwGMChTJI1YyD2CkHAH4YSlN6wQZi/MCYMDWQBQbUQTDXGhdFkaYUXEuHM83oEBiIaCI23Ru1LthJHO6wByBXmYtOraMey4B6LWpv+XbZbMis7Wgxv0+m/EoZNmJj0mTVlPBdk06OCzL+oDB/F1Ku0ONCtxaBY97N4WPE2PbLn4eXNzu/x6v1p+GUjYyyx3x7oFeEG/L/OZKSBBEx6bhl7rXaOh3TDgNfyfpvoAuaxf9SKFsjF5he6SCKESEcaWxvAN/KLESj930K6tBcyPSfyA7msN5xFs/jtPi8Ax9dcpe7kqhN1B2NYVzMFo/ItkydlW7mEWRq1UeeFesOEXNzbYcGpWvwGQGSJiZzgsVmYy5SbUwRAZOcojQHos6EkUaVDanxy+glifHUhumQbKRS93a+3WoqL/UgDoqGSVyIDdKzjrmbhXj0of1Nm48HrLFAiQECBUixzbephjSeizYPgp/VDcACPVwlCTnx0g8T865X13K0NFfheeIPmqlFpTty+FBxPWPYKBW8eT6bhUcDioclCBXEMBhRtJMe9T996qY2uA/ra8Wd5+X0TL29uftwiB03C8uTpWsrw1dkzTV7+Wi+9fe+f/iQm5sBG2I/8+XV01gQIIFqry8pKjceFRbxEfVKlfGNhdhkfQhrWMGleqBzwv9R+/VbH+JxDX59TdQANRKuwY0K+0y/x1ocRbrWkmQ13CVp9vBljguyK7RUi6r7Ij44+h7CkUpB5QCyO+Bw5cOaB0dYSaPsPU8yp9lpZRNiT2K2xo2gCFtfAc+Pwuf6Xcob9eBzdACoHM7q5X76n712ojt4Xx/CF9qcD3QFSQEQX2q5AagqIhAG6+//DOOTvSSrDbAJPbMRWCxNqGAa1fBBTYiVDx8/FNn03V4GAofwSkatxtxhOqbMurznC95wOwDDlNHRlPA88FvbK8phmqC/2BBKJb7Ar1KJJJqxWesl4CDqvqqgxiIfbrkV20STBBa2QeeOCQnWh46BLhD50cwYRv/tJ1Ebr1VPTRHX3iAmbBDWmCusseGG9tZ/5ql/re0tAHlspHT9QTX2EqtskRYiPXBZxbqO+gVvfXWJYZfgj2XhKT4jaisL/J5XN4tq+La/OnAxfKnW1VwKZCbcG3WBartw4CAFuJ6sakvJy5plneDCA3bwJUaH1wtPU+EI1hsQb+cmyPTiYxuN2HB0j8TvL0wU/ba2ivYgCB+A8qD0iOmqjU4tGzDobwQgZh6kZbX5vqhU+r/ZzckLVtPUmgpwLal5i5Ob3CDDeU446DLiRbHx30HoYUwU8qZSvBdE9QCalydWnB6Ui5sh66bAQHdap00LzrXhMgYbUPzDJAKJWXJ+/00qwH/XLSNIjoAb9r5YkDWtuutDqRppPLWsPMKwCHZMDlEDoNSFqYlQvoYsB/7VSOfrNXweTXePsE8S1kjiDvwpDH6wAYcref3+Ptkzg4cfY3ECt6yza8MtvRKN4v7yXdWHHfYezoXJKA5y602yXzZ2uxEgnd5vSkpq5V0+IfXEEV2mi9Q6FLfURVK/pitLIBmvefX35O3LuPMUQOWzmdlx05cgM15W07MET3f519mJ1fgL9hb7FBSLHIeov5j5qvtaAXUNCFGqrEqTkx/sM21lZL5x8/fPzA3n0KCq6qAQxRfBXI5Ib6a/lEdzf16wx4XlbjUNFW68bzdgSUBTteWvasBcNxpL2o0VyQF2grO05dtF83LfMa1M8mFJnIDfP377H5w68Wvo8rsSK1g0rawUzub6s9bZagt6lMQLyf1V3+O+mF/GGooKpffJzbG/XFeWXqpK8q+SrCRVxZrlkIlVjgOzeji+0uPMeXOeHqvbH5gbevdD6xXQe5L90Yro/4Tg9CP/LHOsr9uim9mDjQ9RHU7A4LImoiUr2dlW9v6fYyw0T9HHnDI8y6U7Cc4j6J8L6tv3e9aEyjazlo5A0RXJCCHh0HR4y7IjuuOwXiZdfdKyMOUiVYHmO9NohfeHHBoFzVBd700J1feZVK1y/mGFovLxLAW4PEttP+C1BLAwQUAAAACAAnlzpSxyhLLCAKAACDIQAAEQAAAHVybGxpYjMvZmllbGRzLnB53Vl7b9vIEf9fn2LBIBCZk9a2fEEDtSrqc+y7AHEaJDm0hW1QK3IlMaZIHncZW03Tz96ZfZDLh3zJoQ+gggGJy53ZefzmtV6X+Y6E4bqSVcnDkCS7Ii8lYSuRp5XkoX4ejcw637EkpZVMUmGXdsmOy33B64WSj0ZrZEsLFt2xDReWq0geRqNRzNdkU3EhwijPJM9kiOT+Okl5xnZ8QmADq1K58FhRpEnEZJJnR3kkuZwKWXK284L5iMDH8zz1/SNyI3LLiXeuWU4/AEuP5GvCCDKmI7VxXrCS7Yg9SnPBzwegtatE5lq+AxwrkWQbMt/l8XxZK7+k7gFGg4b/qzXJ8i6viGVkxfVZPK71xvOX5rdhaxVN1gOylxx8lzV+oNq4LaMG18e3JC/tESOHzi5px6zzcsdkuOUs5mWotAnLdTSbnZ742jufWFrxjgN+4mnBS7KusgidhRpoRoRlMfmlyiUHR6DdUk40b6J4cwm/tEHB2IoXuJhJvtmjYEnGY5Jk5N3lOUERjBvfslImUZWyMt0DNV9XKZ7X4yzI/TaJtmCazVYSRBtLMsUhy7Pp2fvzV6+0OmJC0uROQ4CgmoICJBIBXNM0vxeKZqmkOH3xgrznWs3v6ffkD1spCzE/OpJ5ngqacLmmebk52spdeoSWA4InQhNMgeCPy7ANxj4QFQgBaAi/WpcJGlCWaCn+UAA/sAyYGfCj9cizdN/CoFKszVgtDXAuyvxTEgNDJshyudpLwPMS4bKEE5cW2oCXht2ZcsoUnTLVrkaBqiyJ8pgbQXvYTcDRQrIs4r4SZYIZga6SjJV7hdegOUDLutDfNObI1/cquZ6+8IKR5ZjlCLG9D04GmGgaRIJ+Hns3NzflTTYO3GgRGGMLUo2fioX3VHhj8pS0sF3vleW+IWyIKc+0NExESeI1+/lDxAtJ/J+1GS7UtouyzMHGZu0lr9eCNu+CCdFwSgXvHq2iVUtQ64/2e/u32ZyQJ+TtXm4BlLNDNrRSt2z4hOhlG+SERaiDAKuaN7GFHYaylkK9VcpPzR7Dy+wE01thyKqSDs+GQxsqwqE5HbmyOxWHtkW1GKoVcsnAsc8W4Nyeb3+L5QbRZxyidkDyDH/6cPX6efju4u3rs/OLq4s3H94D/We1tfJuquPj2cybw8+n8D0x9nrHi5RFUGRuPHKfyC38uPGoQ/P8XNHon2ZhMvoyGj0hZ2mqUlqZw/cWgjlSGU9V3uOH42PMDscPJ5fkmYblM3z6gQ4JSqsihpzrq4M/10ZAE6GbtqUfRYGS/fP8ePbXLx7VIY/L9W4VdhH6sWTZhvsow0RL8B05afaB7WEbBi5s9VGmiX75ZRSYIhSW2i7hDrCeFGmdLjLO45SLEIBk9+ygngoTSkhrlksf5Iu2Qa9MHmJxrfbTTZlXhX8c3GonF5jXgGoB5DTKdwUUCL9h6f3Dox/zJPOv4TUXEYOSqw8IlD30b1T00LH0ju+FH9xqE9TQMjnKHE9FtfKtYm0kd9LCwRqO5ej5f6mCK4DVdfx/VbNVkVtqWf6Sl3co4cuSrXXz05Twk2M6m9HfLUOlqUIB18QrvmWfEpARKmZUlaneAJkADL4q4QiQ1mhHKQkHjuof0+DR9g33pxHdQOxXK5rkum2AdkEVVUHx8YmOArCfWpxCqLL/hw6iUwIm6rsogAnyhzhcQcDkoEiT3f7THYXdcjABDSTPdiA+0lVg0r4Ek6xgKrpnZSymmFBgulklaSLB9ANxC7IcjGZgGKXQNEAV+QXCQV4mPI39fPURXNuJ7jOCoLHRhHEOcpSajKzyeO/E39d3pxBrlscaz6bkqkJ+3Hq2PROBBG1OuHKkTY4ytHb3xxzoOPMCg4mlzahmkPgNYmg7imG+cRLJqcoq2ozI3xBgqCRZIhOW6gSmbCjV3IiH9s8IbV9cDh8WAScGGAcmkGbBmMBURaRuc1S2MTkYjzFyUPLDvmZnZreJdgb8zTGBz5cHMePMk3XFDEPUKwybuiZ4up7UTwrEzZHgtObJOmLxJs+cTUbWwdXGLIuDYmoaJ3ZRIhoqly+UQJ03NSAWtUjtHQr/CyV9+4V1L/RqX9wepYeTAQqEi28egyG2ja6wu7ukPfAnFcMQets8rl2CTVwoK0g8wo9SqHQKY042mXyDMR0z2nygoEjm6uj58p9Q29JkdUrVKYK6+WRJ1pB683KvG8s8jadC7hG0KF0/beDnfVXgdY/AfAM5vYISiBcmX3canFIzahoMiENolEyysCPD2ZuXahU9rsShoFT9gOHQ+Nq9XkIEk6tXVxdEVQijyv2Wl1xFWv0KWdhwpTUrzOH8ge2AaD4ftfAxXuf5eE7GK1aOJ5037I6jDPDax23qVko+yPGEjM09mEA1zatx0KEvOUtreuDv0OcFz/xmQ0DhZ+wHXQ6oUeyw+LtiAbWyZmHWag4gWrJjG370seCbnkTQj4E9DcOWDs0bDVywRWM9XND9ms5wxi+C7Iaydhe1gzVfObAzTsNGYKx3BGSxIKft9/jpYsK9j7SNQouoP5b32QwS4qfD/ZErUOdGoXegk+kwu44eOaH3viWeMxipAKwbDkg4fufIOvloO9VZv9G8l4562c5yC4YPpjsIkLBudX1Xl4X7ELiSm+HH4ePUtZJnJhVKX5U00p9/8OPi68+feFkmsarL28Mz0aFJ6JHqjOUem+PB8oAtck032Hrh59/Q2jv8O+29PeBrWnw2eNNnbdn1z6DGA7cyXacJ47WmpNWTftdtv2F8dQz+czOOtrYI3ZoxqAvYqudCzyZ2KCCJ5DCjkQu6oU1uHNtL/peJAJIE5RkTU+x6TnZ1a/viDOwGuIY0h2f6d2ArU6oEDlasLqjYhSzdPVb3FjsczO5OFt6nE+/35G4GP2bwg1K6HE60SiLIBte3Te4Ft6nAWLTEPpCb3S0T1Sp1M/QwO6qs6jthrm5SGrTgdYql7eV8s0OoCyZMgP10rU9hMGlmsa/bRzdTuLjs55oKjGbufDQeG+gaJgY6ivMBtL5TO4Xb1ptpojdSDdKnMMMZ3zRdJ3RcIV4m4bo3gEFv0vn/k/P8Otf/ZfNuW0a3PNHiNf+eyd2mmG445FqzdUIuGdSvoO8CpYB1QQXj8pyYu9qG1mV7bZdvgw4uDHJaRahGSUsyA6ue+A4Heyt5QNc2wUD6/HX1Dorr6tUhx/9geEEfiGpdQ1FROFDs1NL2YFe3CXEDDj2ptRqIzlJqILKou4oD4L6Cs8UAlMGwkJkYqcXqIt25GwBaPRGRXNdj4PhVmMZ030jVg7c7zLv3Bk397iVo1yT9Yjl2Tx93ryOaW40BhtagjzC1ch9gPGj+VtgM2uwWe7w+BLCoVF59w/htHL9buJmxpdF1L0Qqz5v0FnuJuNOE2o8PEYHh402cSwGYVGDZdqP1q7qfDnqsOsNMk/cG53hHbwUz14QIjF+hadKrQ2f9P/oXUEsDBBQAAAAIACeXOlKHq7+jfgMAAIgJAAATAAAAdXJsbGliMy9maWxlcG9zdC5weZVVwY7bNhC96ysGKhaQCptBGiAoXOwlaAL4kKRIeimaQqKk0ZpdilRIand9ybdnSFGyLXs3GwGGJXLmzcx7w2FrdAdF0Q5uMFgUILpeGwe8sloODovxO0nieiUUt7UQ03etG6zt9KVt0no8oSecN3uHdvsxGddZK1A2dtr8hF8HtO6dX4wGPa9v+Q3OJlY8LHYYLU27VZLcG+HQwHXMhEmtb4c+SwfXrn9P839f/ZckSYMt1DutLRaVHlTDzT7LNwnQk6Zp+P84GMCu4sZwa4W6kfu1pSgSwWAveY0dKgetNtCJDp3W0rIFJDsBnFYptYk0tsMHKdp9pi0bDFeN7rKXr/M82IsWlA4Fs7/++W1MbokzBaJKqdosDajp6G+QFFSzTazak1ME1gtd/Y+1s9mowaL8Ldlxh6DviMzRgiVh5/PQe64tSGFJ4Ray2xXc5eAGIscCVQGNINxVePVGlqyC66aWROam/DYYKUX1KsrPjnUvY5gpEaJBEP/WcVVjzHUVIuQHTgSR4Yny1dGvm4sKFigtntp6u9kk7HghwwIIBeLI+jz86qRPj7Lwzz5gBLt5/TT+weoYhvmmLkYOs1+Df34m2SNaMQYN9gZrEqzZbOAle538QMS/dwi8aYQTWnkNn6UMdPyWFHY7YaEdVO2dA5r2wwEdMtgSU8iJosEibLzRpjxvuXIF9ztR72KP2uc3B0SEn+xF9vMtFY9PFhF9f/g33x4XOy320RNuc78FVVH5I1t0g3Si58YVZNo13PE5oenkXn/QCheSvw3ewEPWJIOfB1R+WY7OZUkC0NAirRDmEC98iLWPAe+379/65DruIpUbsuBdTPJAw58n+HFcU1EHwnG/ep52+WmkqbxDrG2ceD3WggCoiyh9RUWOo/Ew+e6FlFAh3KAKDd6M1c5AsfEOyUjstXXL+VwuB3Tjh2q8obJ5Cs9hqe29FBdH8dltcmms/GD2TkmwcIdlVZau11f2i/miUriCbMLOp17zz3jdZd4tj34BkxlUDYXb0WlEY7N4qfgnNMD1mBbzH8kj087vrShxt5hxEcA6E0xygF/gDd3G99xQc9S667kTlZDC7Z+G9gfJ4YMr3L7HRZALhYVgT0zVI+5G04uspoHQuHlO93r9OOG1Vo5u/ZBuJCC9cLr+OBzdK+uRZqCTGRFi36C743LALF+dwCffAVBLAwQUAAAACAAnlzpS6KKRi2gWAAAzTQAAFgAAAHVybGxpYjMvcG9vbG1hbmFnZXIucHm1PP1v20ayv+uv2KeisJSnsE1S3OszoAJ5ubQNmqRBnN7hkAuolbiytqZIHZe0rR76v7/52E+Ssp3enYHYEnd3dna+Z3aYbVPvRZ5vu7ZrVJ4LvT/UTSvk2tRl16qcv08m9vmmLku1aXVdGfdo21Wbtq5L/6CsLy91dTmZbBF2lkdrHPj3aqOqtjz+YlTxoq5aqSvV2Pmbuqp4+gGguhU/fvjw7oUfeQcjC3p20X+Is/P1MTebndorC1PdbtQhwWA2EfDzut5IfPwXWXbqZdPUzYKev5G371XbHKNH75r69nhBQH+prqr6php5broDQlcFj/3y/nVvxdwidJCbK3mpPDpG3/ZGMniU7etr+NQ1ZanXMNIY5RbAs19rXdlFjfpHp0wbyEtf36h2VxfGzulaXWYHxFZ4ZjrS5QhAN8rku7Y95G0HA2W8rkFqBPDwJR4FZNwYIZnDg8kkz2VZgkgtxccp8uaNrOBgzXQhpkS06DuhlSNEXDr9NJlMQIpgpZWl7FK1r+GjamZ5Xsk9SOp8Mrm4eJ3/9PJvf/35/Z8vYC6zdHqlAJIu1ZR5MN0oEIjBAziw8Q9kjs/8d2PK/Fo1BgjTm5IXuolnAQVbddu6R7j1QRpzUzfFFJk9+UI8L0tBzBcwigNCNpfdHsTfiHYnkQtdWYi1EkCEa12oQrQ1jMB3FP89E2khdGsAGj4zC1E3NKOrCtWURyBQxEuTiQ87DZJlRGcYGgyatuk2oNcMFVDJJjlTSpWFSanHqgN8EV8IWBcGdrVpRx4j4/mxrtrwuNV7VXdhBLHelrWkDx94MMxGCdPKJLNZ0AJeMGNj4a3hGGFkXdabq7EBU3fNRuWyKEC4zQjuQVpGhwI3B8ORXI2PsYgNx7y0DYYSwTu1kGVwdK0XR6ahaWW1UaLeChjMQFte8DiSlm3KM9ZfXBuNB6B7eWv0b2qEuTslQfbsIQpgSxjKSZt5hMxBIdjsoFXozbofDh5qqy95wqYEfsTc3VypNq/ZtPOUUoMdhCPPSnWtSjEDrOegMIcWzYb7eo32nr4gLYCO87lou0OpIuAE3aTAUwQBF+QHagUCD/JngaIT7E/ewkPVHGBsTJNgCvC/BxFnoCk5B71WAp8XhCtTY0TJAZIRW2sjgmEg1c8QDtqkTWdaMOAwV7C+G2F2ZIp0tSm7QtFqax50Bd/AoOBsiVZkryu97/bZBA37T/B0GYcGWUByNrUz4CyRwYHzJOyN7FBqWMUUzpfDYW5kUwDt8CM5KTOdT8iNvCAAdyEQZiESI9sCNpNCbUUOv2RXtoRoVTd7WYL0NzPSPiT2QlhP6xCcnzPzplP6+6JRslWRlRVg41AapVso7EISJUBVNmCJae3zzaamIyIz33//Qjz732//tAB5anfECuaSkFUhUD7AjQBzpVGPQdFVZXSrr1VGkEBMGgV0UgvmGkVoKAD+SIbBrmlWkBza3HoegoQnQEGSFQdb7hSZeLUVx7oTN9rsSPh2EuSat1urnbzWYHgXzqURLFm2qqmQPBuIC+QalA1XrlYkFVWI2VYrS5FzsB6SRJSpz7S2J7TSDxBAQMTNTlXDc6CbY2doRXuNvAmy4eHdaEvk1crhQIRerZDU8IVUKpV8wrA9HpSIMOwDt0foSU04yPNIDh6X+gqs9fpXEGIXGlBo7PSY5IbY4fkQY9HfhK0VzwDv2jUVaH5sP3gP4C2QhayIhDP2DQbHCgwE9zmHkJc1OpH8L8SFRmdzo8S+a5HLiHQ43AIimStF4A8gU7oxbEjdsZZ99DOcOJvHkz5ObWTyibS99ywr6xvQ1d4KClmS+fzEz7bYg0SBGKFOkWZ4xCEkIUmoFFtZIFXbyMoAG4CO6BNrAXHrb6CBqmXvgRxCxQHGzabBv00HHm/aczHzIBd660A4AiES7gww9Anju6puxdu6UmFdfHaatQzYzeKBTLdqb2bzmAAi9aeEwV4eWWvIrzpKmFOkkBYaCRiLTQBqAhswoAdLn/pvZh0cPV4yeszA/BQCnpetfgTCH/GNPLBZAF9yaVyYjQphPVziXR+zNcP9IVs1BoQY0jSQcQstTDWoRGetALPnPSbEXg3ZITItZ/lZ1pcNJKhjSYb2BZgxckK0LVPx38Jy0y041Ad0S/5sf2bPxRYViQVGy25mwGYZg7hQyhYZE48SIY1IeUuWWdeYiCRPQ3YEwRyXPZqJ+CIqjCOboLDD7NEj50QnFN3EtpBt014e0CJZz4fi5X2HNV7kb02S1lCcpE1i2HApuh86/A2ItJtu2I06xwGJO56zUAaS4YJgvZSbnYjSV7JjxhkycO0kJRHmhsTq6PbnQKMDcAjtsqzXcIKjQBdNeZyuCg0+sqOnNUuhC92zSd83AkX/yXYXY6Dpeai+YHmg1bKcnQhiFs5szxcBgPmjEH6fTJCEzEllUgQdbmM1G7/tSPEGgE7Yq0f0nqXFjF7ABZFsfcPBrmzWGuwRcMB6EgNRgS6tkYKzUcUJmK4OFB80cnMF/CMwQcN73o9BQ6SThiRVt89pOEj/226/BukAgRiAwPgIpEi5eKvQZiNtqAdPSyWtM2Q14dIYCy6H7PHW1n2EjX/kB7iLi9zJ5oBAeUosRFeBnTICfBsgaWGQ7F9C2Fh5YOr2UOqNhv3TXf/+d9JWVy4i3l/dRHFMUWhSgFLQAtU6+D494dB4C3n4zi8756hp5bLRtPaXpeKx8nphLHIvb+Ue7O/5+cRD/O6771zNBEQxliPPs+XTeTIdJ9olrpA2O/vh5YezhThDaT3/6qvLur4Ef7ap91+d/SuL91KXnw/gKHd1PbZ5qaqZW0tHC8NPJ15P6ANn4NYe+wc2DUrsNCVCOUS5bZ7PjCq3iyDuyydfL5z0LHHJQozJReTHUu3NeoAtqIA2Ps6GANnx9R6mi1jVluOl5cD8BWrfocacEuzespT7dQHe41wcsk0Jj31EhD9fUIEYDTOET6EmZ40eRUPkQ8Dks2JF8kYOKIJUQ2LfaE6rbfaQ4D5qSscH0sUjLqL/yMXSEX+BRqqxfIjYZZ00Pk1m30ZMU7ebHDMB/nQtS/toHcFhPoJlcwE5E+E9g/9elob8eaMeN1Jj4F2hT24BK3BAIpTr+4jRygizSt0QXy1qfNwFJch8FTDI2ElsI0ydJ8Efn74D2M+1TWuJhg5sfry3wwckxW+CR5WRubSRSFoazoIQQqa9WvUOAcEdBB2uYIzF4fg75nEDiB5eXF0OFSSbJ+9JT+Pasdy0HJtYAw5r4yA19XQ7OChSoWvF+ijOEdr5KtJcV+FfJRQBy3aQFULZWzMhXtGBIKVQVeETL6tCBaT66JW5gqV/oxucbJShVn/QLtyhaB/5z6c41O0RHLEZZlr9SctT9itRQFaF5yUctbvcJcn9Djin4JRHCCohOghhSXCgjneLCFZa5UEg8KCtG72xUaULJ0IdyekI2jC64QvQbCoERtLJKKZLmfgr1lggqH3+7pWr98C2coO6akNyzKFTswdsaxReYxWBQ0mC7C8bpvZ2YUrXCfM7Ke3SnwUxJaIrJo/WCi5djJwAor1vcOv49iidc3LDm8F+1iw5OZvFyv/oUb9YGAwXm8ae8Y0l9+X+0GL1EAvJGDNCXMkqhgwrIDuhGpHaU5iH0oHOK7IapM03GgYxXZPbLS7Q1eNtqS938dUfeMR113LK4uevVXTCx1wb2mL+hKpaqtMKF1yxt/7hzD07gLRycYAnm40qmIlL5uBCWDVCObzLfv+gsEL3Rw03Cn3MP6S09Z89a4zjZIIx66cAmkwwkQ8EHkIaeFaEdDuqKnbG3Qrgz+oUkukt9mqVuY09HWj/YOh6rmCvmkvAwNc1XeR8ZgDK0D6tVh7StWw0aTMevxe8U4UEXGPP7lPODFyJEcIqUazzPhC1WopShsTuqTkFA8Nb+dn0bc1Vb3NQG73VAHqaqOGoIc6JDHlEtVn0eX5qeVJntOYEzAYLY/8QyKn0EHQPvuw1IlDB6+Q+rhq5EN9+fQdaZBk/Wdinp/maJ34Y2Kq+iyJdtGv7GN6hvW4FK/D4tci/Xz97tyiRYo7FSPsOa5YtZ9hJNT3SSLrTAlnXUYzE94O0nIqf1luN3VWEe1anOScsowvO7xWCNHqhepmrT9WNE+1BiI/yxR/nQxEdwhnTu367ygCeA+Qykx7ME9Jzn+w5UDP3YRizP1wsPTCWy9Mg/6NuxEfioSwZCapDCoRn/F6Ki5sUtlmhxUYhvFdZR5dWfFMEgdnz6F4K7T/JLRWjU1Ff+PusNCPxDo1LvuPyS64kcu/YcZEK0Rfoo4YRJsgsWcSiVuQv97Ld7CDFgwgVY9z6EJWfGEwSnOC4zchSkmc9owuEXsYIokI4Ss+TuZpjqbGgz0dzkx5Ob/j2ispXPUS4CKxc1Vhgbpysvl/1k+nk50Yms1kfczUnHMVJAkVp8wMS5oHyJWfzBP/oiP3JmofRKPm05oKeWaWFTw8O+S70XpeywSDlHDOgk/o6loUO47o0vGLr6bNqcBIsiETL6B4sTojDRQIo3ng2yLBdbIUFMU0V9pCigzR9nvkZiw+DGxiWCmhz9FxKQur/tm6tzdHb+IioskiDJKqzyTiHhIXvM7FSskjtX5+msgmnROJS6WGUsR1KkWsmnMG/+YOcCSUViYR2WZRddFlcmIGvTgFicYs+e0hx8WwYVbLcuhLfCVF9g8uAvNFdEVgOXxekmIPvG05VEXrpnWOP2NeF3h5PFk9RcJlmxnIXUQhkf14duY5pgyOPUoQpXynYwKjehkvGmKM20w+Jj01D4l6XMcqg74zpeX8hxYt2IOBIno9+nzGGk7l57uZ7aP4BmJ09VuxxP21zHB9g+SgHp6H79tEVXOcUPyluND4N9uDa3pLVpTmB4igGQFQ6XV+N+pMjQec7At8bDEqY+8ZwvPV3QRY1+eHwCcl/VYEE0EWt3jr7cMv3dAjYlsCoskBuFAIDSgAxIrVC2c92MgEswpvJ8ujv6Slg4sSTG4LYwmCUYRuYxIuf3759+eJDsLTU6TwulVhLIu/GPdPjBcB+VTp6irvf02KdWqqw2yL6bO9oYjJnvXuA2DgBj3UBtLbM45nEOgDJqAQ3a4dPsO0vFpRtVIbkRHE1qQUNOrS2Va2oxYfXF8gm/BPFbsAPD+rdsd3V1VMMBsmSdKFVHgtx2D1eKqxTS+7fezhDbDOru/z4r6W/Yh7h1GQcVvYHFuvb7N3fnnJHDNBkwK/sVN/iWOY1/hLBbKDcU7rR4gY3bsiLtAXZ1FBJmYcQG2xfmg7BnF1r6XTB6oA5cwFP4AzwlBknnqZAIoED2mOIbmWKC/g2hINgmAqVyw9NRzeFyc1gEsVhb6407sbAxTzDBoLMbheCGxIn28y6aWpjHlP87PbGNwj0hthE5sGoqjBxwPK4a3SU4DZkd2xET+W51Srxu/bG3I2F6+5QLrAmEpS42+xYd8D+yAMw5NBoUCgP7jNzTNdSAie0dyC6/ezoiTOAh5gJFx1FeTwiOOKdQ+j1kGgrgnd183FqO6MNvtbhS1dsUuNpjqPRcKyQvtPO9SfF7QkOhpvzyZ3BPhjczzjzcL8L7AY3FeYAuqjslbUT2FmiGaQKftnQkd8LxLUKAELagYv8D1MqL20hlVJEqw8cDDJ4zJHzwezZoIA0mDLqBR3U+Jbrgm0JjJUSG5TRo3OM62Di2z13Ym7fdJolJsVPSO7UsGv6f54+e7IQF7Y8/afsm+yb+Dj+6AZcTWfwmujZ18/S89hLUHAGP7z8ME38OvWDLkGWuIHRvbQyoJg2riw4s3MW/DbLQFocSBrNSJF01YZV3oi6D8mJL2DWwffz7GVzxde/4F/llq7YrQty174OCkxzJMwieC92anNl43jXqZpT8OLunGohr2tdUMudu6+vVHtTN1fUnEcGWcdXgCTB2gQFn82xMwtMIzaXYvc2N2siSXF4fcRKGEyy6Qi/m5ilXCTqZHcg6hzzcPceA3oCFYKqlFOOxktu3ET/D4lEQ42biWmZpwUSlHUew/MMureiQ/GYqwLj7PuPOR7/J/jQ1SV/G1xfDnKZII9ub11Bpo+R2azn21mPlu4DvlkBTmqJ9I5MG2c4yfuU6Y4xNzEWuvt0Xn0LmFxhqBWbKz8LAT3MRLFnYS3+FI592vO4LwEERBhApW09m74PNk18acTj7+D3tBcMjVmuu08Vlzv6jmAA1TsD10kZvWk5i9qTen2U/4fvbADff8UYht5DcKFJtGbFV8UcQsXthS7wJFBcCt3qyr33tbA5GA64mNOaWFQODlbRL6Qth+x54cDpax+YEtZxFsnlKC4kDdcPFC7pMrbVdcTO6TenOvYmF47a+oYZyhQgl6W3bjw8wIUyS7pAp/cHFIKjlRSbKmwg9tUxbknt5bREgq8cbRB8AEeAKHStsSNYvHAXBlTCQwISYh6W7GApmGVn24ckid6vSknL9MR0LOp6cWVKwF6uS3rdB6amqZ4lUQijCRCl4Mz6JCFJcbo/TZrZ3nYqtlLgN8dqJ7XkQe4JuQXzy3m6IJXMONq8hxsLzR5Yjlc2+MZSuXVitSk10txWR6mjF2udVEbAg/eKBwJzqaFsZ6CILyskGYk+NuiU8hIGZWWFzOIZOBdFZqFF1732UQWpvIboAm/ofZktkPf46FHIjLDHHGIBRhPRwN5n4+9Q79svIpm+hlQhE+LVO2FfpV2IVjbgsIV7VxFirrevQj8Rya4sb+TROHwD3erwQhmzQ2FGRfISKEVd9QZvvIpeu68HhD2wrrHVpVCJwXMdtGgdS2o3ePbk6beDHt4nmC2Ren9+/+/T+9bin7Wusrq5HOvf5bW97t0n6R7P7tzD3L1J8829q1swVBDLnGoxHkXxWa/BOGkbTpLNRap7aNLDo6S12D9NWox7y+8ai0xbb/yUmVmSQQnzxtqZaXB+nmSHUYAfTjXyxkMvivRzMbv4EmkPv77UU/GlGFZ7/GR3S3HHDMq67xinRLxXw0lmJQUDvy5NiZNimU2zZ65Hy1bO+gnOsL7FvQUxrHQXe+lGIvfw3poYXtpGkxyRZkGAeSglsg6rFPgrwiAqMS57vjUq8oV0IP0O/vifv48tiETTL4qejS3xzfnRG8yzwcrFSdnu1W1Sof5o30cMtZD0rKdX5IMqSvL4IRD4ZH0A/DTiRHfAoDUy6FwXn4fXCKK+frv9iTcS/tNtiMPG0/Ei8h2Huv8qE3/G2svvu7zEn5FmnH8Bk6h2zghFDyxu/er6592xQnSXSlvcGxC7gFMVZQUBoFNKeye0ProQ9Nz1EVKDNN9ZP6dGZgpgfqyjsMyVCMXPXD+O4cbtAesj/58sBhzpKEoufadX5Hi36bmYPvrq0fT3wJxKtRCtDMq3GT9P7CQ9Ga1S5B+nP7pKql0YrxytQrilWXfAwvBs8G6OFRs3799xBeDq/ug3Zxfz8Vr/wtfa+xX27EEFb+tS7ruKu+f2zRev+01P3+OrCNGtV8h4XEYAAgv7QHTK0sNdtLazvwfMu5EqSSl6KehW3KgzexnH27mdeuBgGqQMlI3rVtnbUYSGydMZisgZ9kcibHzrgBslszGxiIqe4QX2uISe+tvRYvuIUsfq/DkWarSqPiiVhmIIimn6n0zNQiGeOWr3TPIHHwcto7L9/wNQSwMEFAAAAAgAJ5c6UvyP7gKnBwAAYRcAABIAAAB1cmxsaWIzL3JlcXVlc3QucHnFWEtv4zgSvvtXFLQH2xm1+rA3A8Ei6M5uAkw6wbQHe2g0bNqiYk4kUUtRcTyN/Pf9iqKeVuaBwcwYQWyRxWI9vnopMTqjzSapbGXkZkMqK7SxJHalTisrN/XzbJYwXZSoVBa6tA2ZzPc6lpusSq0qhLGbRJssFlZ4+kLsn8SjLKNSvUSZfsavyqSp2mHHlLJhg7Wa02y22Yg0hRyX9CX4Qf6vkqW9k/ag4zL4OpvN9qkoSxpuLPTuJ7m3y9WM8AmCwH1/0PmzzBX4SsrUi8oJspE7L0s6HjRfnspM5tCWVhl4rbYQRBcy31LmWIdUVvuDYydKWrnDjgga/DO6Wa8fcEuOu5XOH7ROtyTy2JGPaXn3TuSwhdlGM0fyYPSziiHLTh7Es4JwLGAmnlT+SHudZToneypAoBPiu8jUanvhyvayWO4do+NB7Q/uDB9pqBMl07j2FHO2mqpSehk+FziaqD1sfgrrJW+JyB/feBdDkS2p0slYytyx8iTOmnCmuwhSGekY1QdjguXtQdKPP3xPCzYnm/I/1+uQbq6vPob08fr76/X1MvrF23c6Pv2x6y+YxQXbhZ8a21QlM2rhS+B+PB7fMYrftaCsjdzKziI83H+GAg8/8r+r9YebN8RvRfZeFfmJ8CPuuSckZemo0pRSrZ+oKli+GnFFYXRhlLCy8x5LJix7nr1IOpeNSmKH8CJ71C084GncWzPrKe1Fvc2VVSJVP0tD0F3glDTlyuvhVuggRewWyX9u6gVmrfJ9WsUSsluYBfI37gipylOJKNW41DQ82C/0qBCSLTP5UqRqr2x6itrIdT96mNs0ylzSt6CGShBSAPzwFyOIv+8f1rf3nz4HrzMfDwlSmoKCm82ilGkSNlJcfoLFlp0+vBk1El62ssJj33q8fFZYDI6F7ZPPFe0zyLsHhp27tVvqy9KtjlPp5dpUve0uxe50lcfCjLleXDwd3cNyRfQPutqV1oi9bfeNUADMJ21vm7Qn42tjtOnUck744DOkfLE+zobZFpLU+d/nzmB4HD5XhvQxp22bTZt0GnW0y866HjfeUU3iZSP6kK4VHZoN6nrum6djz6FN9ufPHcCP1D6M9XGid/B18TMVbjppuW23tTTQZidKJBZdJ5btthYZ64jI2EcXf9YHRD/+BLJ5rxY5ahxFGLNoysDYzCiVAlKKDO61HNSZyCuRdvhIEPs2oltLe5GjaLjrOL1lXJBLZSvBdQjxhzqQSiotZxUuLZz1fVLhjy6YjmM4hsYUs7M4V2hEaOkLQptEjgeZE0ocAhqYqwsismDLzNtzolqEb+y5XN7hFrEmYZzaBPrInkqxkI49FU362FvzskFYVRTSLJazfjB6lHwJGkGwFnzFGXx3hCppmMGkLi9MpKHVAOxGomnyxOcGGMZVJ+wQ2/VXh27/PQT4gNOyg0Rayt8sEZv9zxNpHM19O/zNgd0L3K4naHkxBc5EbbQiqpIqdVV73G+lCveetS4hSbufRicw1ZQUcGb9hu7qKk+/EHWYRA42AnZw1c/vBqvm2OsZHeCP5lsuehYcALw2xFAG0NJ3lxT8K6DvukZ8UZP2jveh1RTEgU8vLhox3obDEIS/o4z2AfOnF9IRyv8iFLJtfjsMxx2oR2HL8b+ct7fbSWNAhgWcI7C4DPnuTpBVUuX7bmx5c77behljrhx+dusrU4hTqkU8XV5RDi23DjypRHTPbeIRzcm0EPWkGLXI7G5ueLfn5rgEHaUrg+9f3k108vPh3Z257toRoK39rs9pyqwrgzz5uiYc5RXpkJtwZeclHCRKnYtdeuqgLRLpRy1u8FFS6m7YqozLvdYR3aDYPUvjBoBMnGgHNk+NsztG6jHHnW3hrbW+v6rsoSf+Z9Q9dAc8EvryLtI+5NoGnxuLJ3l6/yzSilsEA94lXX362LLiXVbQVujwIrqi9qHuZRb8nINbSAyEkO5u766dOZdUk8FWZoiGloRZNPJF9G+u/S+CW8nVajbISn6YQ947K1nzROv5iuY7YebhxC7CkkUEyYJJ+XdkX+w8pLl3vpuo/dZ8OcEDnkhbHrinx8PlvY5giTIr4sVyigsrHPfY/OzY7FTesvFrLZdzJiOWKhOP8v1PhXyclDvX7Bh/5UDbbqc27chyr6PEAT8iet3I6vwfUuHeVnQrzI4W7NxEGQTKAGH9oHSYWPYdT7uKW19+xYEJo04hO5fgVIbOs30dAkY7o48lUnwP6phgZN09o6Btt74GAOM8YJYVZwAZu6xG8w+1Bd6t4Ym5Lxdu2O7GM8zPCMKjURaUeNwLH7KxhIsAQd/mxydoDOkMol5n1NQOH0Itv/oVTC83QsuC3040GX70BoITvhwz7YLfMW/6/W5eRuW0/dJyXtP6Mf+X9ibfXl9/teXAcsC2CDgvdsV2dQboemZl701Mqq1STX181JZcXqvfueyQcZEO3P1zl6znfCmCj+2pczajm3ZO/BolCs6YL2djqcfl8FxiviFsiszGpbzLt9+STivU9N9tf3Lu3glZ+0/ng8Gbsk2LcNYHTmem4FcLbnB+cGTWBkdfakjwXMY/3qBpgPbVwa4f38BeX7XXc6T2TjeNsl9YntH+Yif9u1rh/wNQSwMEFAAAAAgAJ5c6UikvGAhjHQAAK24AABMAAAB1cmxsaWIzL3Jlc3BvbnNlLnB57T1rcxvJcd/5KyZQuQicoD2Sutw5tGlboigfbUm8InmRU7IKWAADcM3FLrwPQvCH/Pb0Y947C1Kx4+RDUHcksTvT093T09OvGS2rci0mk2XbtJWcTES23pRVI9JZXeZtIyf8/eBAPc9K/VderlZZsdJf/5Zns4MlApuXRSO/NPBdA1NP1mmRrmTFrepyfi8b3UJWVVmJtBY39PgCv8baNdlalm1jW97yg4ODptqdHgj4qJazqgQUDuSXudw04pIeElhuxa/FmfhQFvKAh0om8zLP5bzJyqLWcH68vf3pR5kuZPUmmzeqIRBUcDvd7HVay5ubdzTCmDpd0MjQRPWR+rsBPSRMXpeL3Yey+bFpNsCy83K9SZtslssxvX0j5+VCMlh6QKDt18tiDj1y2chrQFI/e0jzbHF+1xb372Sxau6850wNP/oJ2FAC1Q5EhKO46j2tN4C6BEwJrlRjGZoPRorOTTq/h2k2VNbZF/WmbbI8qRQg/TqrJ8vNZJ6XNYDEb7rBpCknd4DLwQFIGkyUkrdkJZt38KeshpNJka5BZkcHBwfzPK1r4NYyTxvJTKuG5ewvMEsjnvGFXIKcZ0XWTCbDWuZL9Rw/+DWZLLOqbiYgSDDabdXK4PUibVJ4MxsMghcwDDzHBZAsJE4HkFDDwyEgZkcGvNOmqdTgY4G4OyhUEhZgIVSroYGsGlpIdggFCPFyAGVLUZQNPbUPnRHwxUHYOmBAtKNByaFySIMfxDj1/IyH0q86YC0UuQD+7QHv9sqWXkcfZHwu36Z5LXvaqUklLRBjljOUea90Ck24tCrlaxB4RHBe0LP3r/40+fj68vbG50CHkeEcBRLCRPowllmR5nkETpcrem39/m/ZRi2sG5BRaVcXAXl7eX1zO3l/8f71xTV0PaKHV7c/Xlyrhzfw9Jh1xsdX795dfZy8eXX7Ch6exIb42rXby8rj78Vz0cdO7lsjOdA7pDBxafrfWMoACBXOrpFpVaW74chdth7uEeQ9LsPmulcp4Bj1EL7YIbZ3WS5JD54+SfxwwT9xDT+ygPADXR+ysq3N5Djkdho/E5eroqwk0SfSZSMr0dxJQWuQbYseQe+depd7nb7A/RC/CAhP+LsUMuKv8rzcAk/TLIfNTazSagabp0jnyKEUzACRFaIEYiqxggHEPM9k0dRRaP1zaVqkWaCI1Eq3E9cWLei6iae6Fc1xCXp85EdY7fHpa7RkdGmDpbrU1l1WE86oxpSWYj3zml5HNQ3Pyk27QeOkFjNgvThkcJvdoUiLhTjk7odCWzpOxzor5hJlbyfquxQkMjUWIq79RNyCWDblBjBMi/md1xebL2GhBsMBCg1YT7oDN1EomN77FGTISQafvLG8rIadPfYurUPlNbDcH4x6dg7bpGdH9/UAbItfB2hTlXOE4hG+zNv6LkZ1Dx3UPkZCx9BhyKOoxgQzUO9b79u8iYvTQBmLb9EAvn57/sPJy2M77uVSgGiicl6j9pJgyy9AC9SA9YMUMykLkW7AKwD7qClFCkMjR2D9p+hHjFHOnK2sWJDaSxvb6c4F+v7nm1vYlApZ4UJMxTl6ZUXz4kK1MKDuyEEA7SnzBQPMsxoWA4KbcyehgYJ2wsdlhT3gC+wa8ztr8+FC2EpcB4xSYrgS39fHwImFrDvb+4KZi8LwCbdf/WC4TuqmyjbD0YgWxhpxIBBJDQM2w8F4MPpsB4uKijfteqRPR5/N9D95w0YUFogC7A4AQy6GPtBA5pTyXfTvlp7NfkDs8qiHnwomyDrQqsnvEOeJKHU70N3wG25gA9xgBp2erlFmO3U1LCkrA2tWdSH5alfBUu8Cz826dOjvaudzmJXJ5RW62sHywkbGRSUZTTOQ84SHeA16eptWi/rF3HjXYpuBZj+lMU6nd+B8J7y1Ju6AUzFrGxJw47ZOpzNw2KdTIJ2A5yUslgURz7OygDX9YiHX+GR7J3l9TKc4hdALFNhGVs0OOYebPDoWiYBtQYFjovFlXpcixBdB/bRr7kqQ1gYGAKJgbcLWUO0Oa3EK3D+dZuWUIMGXNpdjwmwO2xCgMkelAsaGBE4vMIaCKiVdkJnBakuvZxWxEeWSFAABXFawg23L6l6x9eILmC2wCeLjBtcmSv9Mgu4Cw4jtTaWuEOqjrFY79CkBxJ7I2YnSN57ORJt07M3KIe7UC1A1WZ4jiao3ELloK7SrAAzoiZZCNok3EE/annEIJuwhcg0mK6hh7kDD05iztKY597TxoYL3QqvfQ6VV/cHLKluhJ2aCHnb8jyw6mb8CxLYCTYqqtjaqfCEovJI+gccGOs/2WGQNsA5wfZAFtkb6wILJW0Wgxo8Vm5y1K7Fpq01Zg34Vl9DXAkQTdQvWpWAD0qcTFnmVydpSd0uTRw/1cuX9BQhoDB3/2VY5iPdLHTkC1yO5xp9TK5X42YIo46B6tlk0/trKuvHxkAUQMjezPckpOmbRuuD3Zpfj9wLsrvk9xp4oWKdUFgw3AytPVqDpxboFtNdp4+x9D2neSlxAep/lUJySg7FyInB5JOJKc2/MJjr7LMFmeX714fbiw+3kzcX51Rv2pz+xzibbjPTn4HO/grZkdiA9R1Cgsrn39cWby+uL89vJze2r259vLmikl0fHY/Hy6AR/vMQfP+CPX36ObOTe3j0233C1nA0G9gFzoj5D5OxT9BPa+uzIPsGtFNat+wjUVg1Pwp5VNm/cZoEWOaMV7diO7tIPXnaWZjDYpizz4JGNCgcv1vUqeKJkP3gaF88zCh+5fUmyJ6B178pFBzC/hJUTvEnbpuQ4q0Opjt4oocnAf8GNZS6HanLGQQA85leopiAl6i9LUMfADzr4wPWgQYCGJQL9APrDf6mEA96qv/zXLCjwlv8IAaPAEGD8w3/pSweaad6DcBjWZWd6Zv3X8YmF1vEXfmc7cdDBfukEXdl0CoOZ/JJ2quib5Sb+vCP/0KzzrANrQiGACVoVJgho3sMygIfwM+jmyCwx0HzzZJNIQGPGEVJ8NhbDOvtCc1msJs1uI0FoCY1R1AlWrMBfIQtxTcMr/BW8cRI+Z8469xDUriYjNUAehE6mw3J//GfiFThJW9g9a72BzTnN8qJudjntI2BtFfUSZljbFL/1kVQdOvFm+xLEa9mE091UEwCovWy1AjHLMhzoEY0VgzvNYJTk5Va6MYNn4k1ZHKKZN2858raRICZg5QLaczQ3kaiU3EiawgaNm0VWz8GAxVeZXU7WXz0TQ/ii/TsyQRBRtFAJZcfD8wKjA8UIcoYMuMhEWIZRtsclBw3aNbgQ2gIAOuIyz+9BhNdgwiApOlpBeyG/Hfoae+SOdLnUAo/pL7VfGeMycekKNjNipM3dYPM94q6V4WIY7Hr+V8fXRT+zkousAlGf5OWcYg6h6zxwkmE3d2WbL1CIdTehfKAKY16/tWSfsgVVnyLjm7ud7aDHEbyckWyAtwIqU9so2AbwQyY5jkYZTgMmAccLhR3dtWUIQDHQg+N2pFXEPYsYAjRoEmWFDs+rhpkKLnQMq/48m7cONVYDR3RUY17qZtJARGCfo+nszJWX6iNVp7ICoYqLYRVTlfCzbexQLogwxeLpT04raZQXYPEWUYRdjmJWmp1s1hrwN4qNXnUUADA7FcVVlCdbOVEBhUJiifm5oK3K7eC5Ww7eM5iFexME00/J9ZpJxEHxHtyCdH6PnhQpQuRTlKJOHsUuUcs9lSkZ2qy/WyEx3ld2EGw9m1SHTX+nYxB2CoD8kPnPxFt054PQCYchZFqBc1kJ5Z6Jo+Q7mhv1POmsg4h28oJu/mZoei03/X2IUfMUXDPPgB/10WjnbG/4L9zbsStIHJUn9HR0KxiGGnFHkTYyz/eJ9tUM3V+SlqJdz4CvsNuQAQPOdp5jcOFBJbS2oH9EXYplWiXifbqD1bBEiwCl0AoWNEzXZVtQ+EbvFq7Teoob0el0qt1rvUa8YAFxeDp1Z4WRSnWo2oQ9GK+hTFZjYfPlo7jce+z2LEbHlXR3T460BntozxaElULQNUtzvXOzG47GgxcfpKjUUqQPaZZj/CuOq7HTuzpZB3i4iauZAazqF3W+XQlXFkg3E/GMIoIWZQpCLQFXXoBpERT+kPPWYJwPzLBZLEMKG5fMHjjsp4ZNeBDmKEDP89roLh3wwnlxcwMWoKdcZ3KJGQwMXpCpVwhT7pR0+ublKgGlgop72HlJU3Ctka0sA4BsysYF4RTUO4M4lFttvuoMBzC9UUTDf/ILCWq+Q+mYZYsF2KQ9kGDNXL89Fz+cvDwCGHPxMnmZnCScdUa4T8dJ8ZWM/FKodJYlEyang/VpHyw9jd3Xkcwvrzq79epPNJ3/zCOXNjoiWdQbOc+W6OmuMaEA8hfEymqUwQi8mRQ6EpxilnQFPaOBsUhfVCxJ0PpUfHcyhv9Haj5zNNZlUbfAShJNWvfdPDmnWUHUlaWYFU2tXJKUygrzEuWXYUxBXqbOYj4ex+AxrFZpRuxXU6rXCerhQ5VVQ9njOrzIwlAsRH3TDD8BbkNoya4P/IHM4yZucqs716yAhgraSPxGHHenmISCYo1eWWB8QeJnEEyXzrIsrCjE5ZQ6twVFR1HuFbOGv6hHA/ELEYQ83E+XNKOQFXHJptwMo8Ul/46jXMSLSwyUTtlXPCNtNfqvxVGclT5Ix4o6x+B6ZXwGCrA3NKNkUVWZG5UCfxB2xnINqwoMu3os7rgqVC1fTNgoOLCzDyY/f/jjh6uPH/bZlDp0hrLkuCQdC7OPXQbAkUcUBsSJCK25al5ANfmAKhZAaYSUIx0OK61TNDw5+g6jyN+N0BU5PjoSv9ZBPuD0CXynEdyNn5KLP168ejPw8TT8P+q4SErAAuNCp1D3ObSyedFuaPGa6BpGeLJZ20hypyRq77Taxa2HZyAMjTzVGtJEUZRNwrxCzYiT/SIDLhY12C4PoDAwxaNVsAPvxijjE/NUhw4N9H3WyiOBHGN5a3JBW0Wtl86g2sUNUwu9FYYmWukltEO4wdLObZY7bNkdyI0kfYouWqmDS9G3FHCKDeVo32hHQNJA7mVMp+fnPj1u6IhUrPw3GEowFBaTi+vrq+vJ+btXN5zmGV5eKV/SFucxkY+klOIAnwNEVW5EoMZuRTSj6BRSjIMQ+5jLNTQtPav0jc3HkhuPjq6kIgzc1jclQsqw2JWhcUOG2Bu8oUq3nsQwfqKl1B3lG66m7vR51Xcaqd5iEKWqqXWc32C3BGv1H6kdiHIyGZxTCV2Doc96D0c5Fb/ASH3bROyGAfo6XPak8u1Zk6C1ENLTtcik/8hTbp48RWpxTAmr13DYDbvZmSdR9pvv2VLeYkNloer51oHTsgAZpd2AnP5s6bbiepGmRUE20DjuxOn22Gj7BXDWLvfJ3mwwiBe+QbfnQTevUMptq3PXvwuOABnOkVqYzNE23M+5c2wC1vkWPO4HmYsNl8HYUzVjgWkh9IUr+UI7oirCYaA8gMGVgsk/xigKl7YZiM4BHTTkUQfkMr1nXeIWd9xlqzvVJ91kTjTxCvHJmrEOBYbBwqcFBufQt5ggIJPK6dcxUfdth5V7vpundId3aCrm9729/NP7i1NxuZCkMrfyECuM7mVYGYK5OhW0Cg8M4ZKOxwuAqyDGO9kAc5lMsU13CBrUEJhWGMKggCrVvSiR6bpJrIPCYYc2MD2mzWmMmgiTKdAIVlcLCmQUZYobRI2oUJ8xtSIE7FrZYKG5ooAjcbTXNBgPabZYvqnB1r/tgERThoLPGKjkpIfBdEDSl1EaZCh79v1nCJ0rRTCCkFMpEGCCdVog+9++f3VOfOWSIY6eV5KYtxBIwx6fUOM9lAHL/if4P/Ti1l6Ee9Q7HxzFYYmsg2hYn8h4p92G6NCalVmV97KAHanCTQZQD+mmTB1IrVESKMnNXVVuAeGtMebThzJbsGiT+tkEQNpC+wxZvvPR9Ja9d/wseliHEIKBFxm5W5yvRNEjOPmOsCokiwQhKlIU1bKtAjhuYsR9o+wgi1d8Gpwo4BrgYxfcxCgcTrs76BClTlelinu1eP4vpiTSYkel0Fj7SBUPGeqKLfbh4A4r7UCvZrE4zxPSMQ6lPUUP+yzuTuOEUB5GVgx4zPDKlqYF/NIbO0XJ2uUym+tiPK706ILD8mLYANEAQl5xmpSqxlNxV6IxsQyZxPz06uYsvKYs97ClLzXo88ORoygjtMQSfl51oQ0jt40qSWTxgal3VlcATdkYT95j9880qce+iTUZoL5zD17edeTmY9OF8nDSdcMVWWHdGT/0U1m07feFJbJ1lqcVEqkSOX31npzCYRub64e3pUgXiww5ldoaF1vDe4qVyh560ylxZjr1EJxOHbNHFVcCgT53foSFu27nd44wNkquEbEE5UEHlBfMAQol1KK+z3DL8s1VOU9Zb4hFKWtUemuwzjCsXJN5QggiLZT+MVUSbGwv2zz3wJm57dCxz/H7+6qC8fNYZbCDiMfxfXjUuPBZs6gkH3kzNfLe6EsMSiPVbd6ECtN2A6ZkjdQTxke21JcWz5fkO5yhZWYKxhNbuq4/GRXjAsNxte3KFiykolFV8ElYBo/zBgRmRQteYlndh7kmPsyHNeUwLvTn/Ph0qs73OXgMr0AnVpzGgYGnU5BHW6avP5gBGkWXlVO2Y/0+Q9MyEIt4ZKxTMxipJIzmuePgwtILz83s1HmZJDS88c+eLjdgi/E7cO1Zt1iopBm4oe+NdU9TAUvjmOIHLIkbqtq5vDIrlFwHrfn2hz+WGzW52vCw9GBU3jt338cQz2zCTzye7y2s3gPiUeyAlq9BEFrGMyrIyX85E0emiqtz4BI/o1Nk609g2i/Lav1CKcv5qXjdrlY7XfFK2QA+FtLdxPHD5kfHHaXTKWDTcvVLbdRAHEYPZJ1NreQCNETK6n2LSkflLr51dicx4Z180gMszZHJOxCfhLYPNHPGHpnK7bfGHSWee8C9AVubCiqO/3UsTo6OT8QQkTn99ttZu6oThpWU1erbrK5befz9yb/9cgSD94DjEy2ouMBUm8c4ikFH0MeUvKGznuTx9oIDvVat+biYYh4CBgh0ZAUHiM+nEUltZ8UaPbo29EeroZ4iZWMXdUodlY/anzI86kbn9MevTXc/Pd4ufqy0YYHBYsWZE97idKbMBg7nVDaz6KGa4fH2M5cVS5cudzIHr7I8a3aJ+IguzB4wYFNhzIxLWYUqeFTmCTotYbFGXCQYlnLQ1VGWGk9rrbWdz8KFdRqktMH9LSusSNwDLixNqJBp7eouElfRH50WdnE2O4lTrzOOy4VfCtM9MB6rFX9OGd34dR9x4eutrTFDdLq8cAfpBn/9WOjwKRmJgxDXPSabJV2V5PrZg2hgmWffcSBOxDffiOPvoz5Ej7vwSh8UKytzegxTW2wv0obLqdUEmqJwqVN0WO4IRl+TWbtZ21RcB2YPKdMUqsCdpw9hGILgWcGe4648vX+EN4GhCIdUJEIxFZO4vlInQJwuwth6oyJw7CqhW25yx3VtK4bIt5i34Hw5QXj8oJmD0VLcULmC37naBodJ7G5Gh7LBa9jpGmfE1INWYEOMBegN+f+QjxKTsKCaze4YtbpGYaLe0FqvQ7sShZHKdzKntFN3QYOrI+1BzXpPAJyAmlddS5AvOKFNLFrBuT9dp63Bsycg2A0IRRWjj73VBL+j45C8SI1qwOU2UZveUDv853k9FiBj33xjbtG63/bohd9nD3i/wBNOjQp93gYUQDWdjvXiSJ0lXfGAlGLUAPeWl06142aZc200tXOoGDcsldJVUZ2wQJsP9mLOOsXiLd+vmU67B/kqjF7EWGLPpVV4WKlzS9ZXH4/DlZF9SX76j5OYu6ROcp8kP3Re9p2QS7xp7xyXw0/c5XnsyF0COnANS9M7nOJxmqeL6nYU4i/BVEYnT8Ud9XE6UyJjXWt9zk67pTBXA34I/uiRe91BjWejHHH2jUs6Qlr5dqM+RapnxLc1+DBppcqe/Jf6XGmlDxH6r9UZ00qdIQwB01lT/uW/igic38BbneZN59IHbMSz8SxyhQFZpmrn5qP3fevXqAzgvmLSvhJ4fYaz28257Qo13jJt847l0XeGxes06pDlG9wOOWV5n8m/pDZjnIGX8mT0nwkVFMJ7c9A+MRdIGHjsQu05KsPbQtyE7Qa6H42ZPx4rdwe3xz0DxaLpSBz8e48+RE8vPGUYfcLBH22R0BVo+qYhZ4t9YkTL90Wpm39PDwWsdNA9PEQZHCBwgvOPgnwaQG61x3JwqbAbMlgTRUc0H+cIO1tXKifpqVygAKMEFObUSXI1Donz4HGKufVjFCvcR/to9vDs7C+DWxWPfUEhP3WbSPf+Cviu89GRqp+0KlswHl26YenOq2wD+7vf3kmyRC/16UTe3GnQnqPXIOWROxzk26I6TSmh+XiY1eD7yAyEVw3pi1m657LcQxsUePtrm1V4CwgoTbz9Rd38EsQwQmXpCy8f82hKpeJn/8gB0f/wrGZ0wmf+mV18hO1GWN97FGXV0R7hnH06tSA+w2D4RwyIaeT42HEnZV8pElY/17pAK8iLePKfw/ZVqyC4deEetbd1SuMjiH/Ji2i2A5pqOjeydG4zpCzIxppclFPLKEiv797Z4qmSul1T5kzXkVfplk8BgYFtg1HqOAofEvO8sP1nuWKrZjNwaz3bDbgzcqJPoZtzXf6BQ7yuEfO9h3jYKVth5Awve7ZnsFNG2pwhdzpzL7xvVQUETDER3yDdPZToHInvDSapDIz+Sm6qkxJQWQF87ChP1Qp/qVLh2eBXoBGOR5+ObJVv/Pynd04fi/YRCnT9/skV+8/0gQ59zAunlcpeTM4TPKUZiHwSGT4SUPZOiTiXSitdgQi6U30Hk5OrqbaRq461JpVwhacw9mWZdAfD/0mdLuXEJNkd7sVKF50h6XfcpHNgnoxI/ZU155DPr9+9FSqbKgtbY4GwYrzsvXKBNmuk8tdhS59ePicQpxd5+siY4ZMXOOZ+vtCIXTzPOsD+XkT/SZx+EpGwm1AQHwj9TQhwP6SvFsR/Ju3GjXSR9rd8o9+fUKLy5GqUvRUoabG3ACVWf/L/lSb/lCju3voHU/96LbcVVog0jk1IFz8igzL0T/gGQ55sXSPLIboWjca8XGVzbzO2nnbsNLQuNg3/+YHouQPrZFDloj7mHPE0OAImDjtX3JzqbocIZp1RVi8JfY8Y+k+LdjM9ff/oQ4QqunLOnhXrsxrJyoySeqmP5XGgjqN1hWc28rWtEeuwQ7j5+tSqEX030IwvsVbnya34klWHB/rsjX1u90cK9iL/XsSwp31f6d6eOs6wfViPw/RdLuluGCt7uoqh0neWBAEF7kZ3IOkAy3otF1g4HhYFO+GDpC+C0IdZ3wXulvKYVR49TtzZaTpOmv7MgOj7zht/v/QsxI55gB99k2qQko2OSGAeycAEeduzeMFPlHSFyt5MDTfpJIP3qXf8PMMDI+cqmI5y8tPup51bTc6JQF3EbY6vRQCZs0QmzQgg/8CQAd4362x113yjQWEtQQRILpsaTQM8hvqA+UxwPlGlF7ttuuuWC4STFJ6Z2sPMnqqmP+ypYdrDajyPjPKlN2KwmtQG9Ofqz8WpuTIoC3TLvgXyNE/PIY2OC2Wxtcko3uCp7jrDxLku+0brjtA8RDwP43THFxSGTAhD/PdosPdg33IMuPWRE/9OEfmvnHImChkOnqqFv16pGgN0hTpr780412o/QrR+vn7HhT5bZWfVZYtXtZLFl9WOlaV7Xy7di2C5s70z1+tkrvZC69AxbZzdzlYTcOUp160H15btz4/rSyLDS7MxKOU2SACBpqx2e0KGQctPL44/J53L2vYEzLzwY+fGRXWbK1hu3X9NYNbSjUNn4pMNZdBtBrQEdQpfFa5EbljtZkhBgAs+0o0gItWars9uAip/LiKnr1lJzAaD5C9lVgwZ15F4zn0/HX2GP6lrpyeS8MUg8en4FDi6T+d/6YWEVUAEoxeCZaFp2D38HU/j+t39XvEe3DrBkHuxGNKAnvnK7/1+cTYe/BdQSwMEFAAAAAgAFJc6UgAAAAACAAAAAAAAABsAAAB1cmxsaWIzL2NvbnRyaWIvX19pbml0X18ucHkDAFBLAwQUAAAACAAnlzpSKoPpFbUBAAC9AwAAJQAAAHVybGxpYjMvY29udHJpYi9fYXBwZW5naW5lX2Vudmlyb24ucHnFk0Fr3DAQhe/+FYMu3cBiQy6BQA4LcUIO3QRn2x5KMYo0a4vKGiGNne6/r2R2G2cbeq1vHo++eXpvLIQodr2JMJAeLYIPNBmN6R2li8AEGhkVA/cIG++hdp1xCOgmE8gN6LgsRIIUZvAUGCgWRaFxDya20nuc21cX1wWkJyCPweVPlpS0ywagkOtpvl6WP4C1UTr9Qr9O0DS9wTw7gtnPOlNrOgFhdM64Doybq3sTIkOHDoNkQw6OnLKYMbvUElGR08uexGAzJD9kQEhG9M4k4fYAkY21GS1PnDW8jAyGZ1p2dFQ9WIxJCEYORrGZcA2RjvxMOdAIsafRaveJwSHqbLnqUf2EfXYkuZtxERF6Zh+vq0pZGnXZEXUWS0VD9ceZSpOKVeSkRwZdnbSfXDqLYGl+OpGSK4+pfhebp6d6e/+wrdvmy3b38LkWP+DmBoQ/cE/u8kq85fJXku+i/oCUTXubdTa67JBXM2AW/Vw3X+umfX68233bNLVYw/EaF2W6Zor81XC/Erc4oSWft7ESi50536b/IO1+zmnx6/xDYDtMQ1ys9S36gEoy6vIsvjtpIxa/AVBLAwQUAAAACAAnlzpS65sc5VoMAAACKwAAHAAAAHVybGxpYjMvY29udHJpYi9hcHBlbmdpbmUucHm1Wm1z27gR/s5fgSqTsXQj08nlm6e6jpM4OU+dixsrc9NpbyiIhCScSYJHkLLVTvvbu4s3AiTl2L1WM4kpcLHYl2dfAGgymUTLHZekEFmbM1LVYs8zJgkllRA5KWhJt6wmzY42pJXw4qMQWyC8qCpyWW55yU5ktPr65foDa9IduWX1nqeM/HHXNJU8PztLc9Fm8VZNilNRnNGqYmreWSZSeVYdmp0oz9o63yCDH1ZJHEWXD7SoYJFWwuLn51FE4LOpRUGALufrN4QXlagbcgMyftIiDmhgtbKp+Tp2K9pZILsW3UydEy4TR5VIWmZr8aBX5ZvRl9PZuXqNnxcDhtpSbvREEmegi5srsmY7XmZgU0ZkykomHSu0GlkM+E1nioLlkvnLetrrFSmRIr1jzWnO9ix/2loeE1hGva1hGN/GNfutZbKZnny8XJ7MyYl1qufOE5iz3LGaEQr/VjkveEMbLkr5bAz8PbIoOHtxo4aSv7SioWD+MksUZwn4II1Q6jiTSoM5oCK8AcgeSCka0DxCsjUoQNKdQIqNqMlBtDUBAXKeKjlj0onf7GrGiKi0/EjdSl5uI4s6UQ7hD+h8HZO/ipaktEQ3kPM0p1Ker/peXJF73uyc3HGnAVdeSYVsTtlmw9KG7wGsJUbfgaS8TttCNrRM0cWS5KLc4l+liQoRYKB4wxRQGXl5foij70P5KJinLmjuBP23jRgPCyuyPhBW0nUOBjCwAlbA+lY/E5pLQXZ03/M6eqEGm9c8VQM45blIMMsBIhDnHvdT4H7qc0c84IpKDgqmuYdY2KAXf0PoYN4qO4sju6VQRjBLzAEfRLboe0FkxVK+OSh0bUQOzFB3MKqy9GoFwsYHWuSrlc1JKirLfbKnNQdTMdmFJ34+XlwmX28vk9vP7/58ubxNflwub66v3pJzctLULTuJojcxudogf4U/hTay6sBFPuTsgQPj6Mkm3JgZZ2CaueJs/a5yAMAoo3UWWd8HLkcMibYhCnai3PBtWyvDEwgFZR1ADejLa1EWrGyI0zuOJlBJIpV/k2TTNmDSJLEJl66lyNuGJfp7FJlxLuxTLrZbjDTz9Z7WJXyVhmMcs4eUmbA0JFNlabToZV2Leu6+/qzn6oFP9OELa+qDR3NTi0akIveGbm+vvW9LXjCwghmZWREqmt6BmWQs+UNciD086biBN7V0xQXGfhW8tLNMCrVvv+ivnxgYOpMdkaxANccD1fhixixN2/AcCEGXjhd8CV43WnJLYBQxJHbUK2bGlVEEjM67AmrA5ejgiXvqqRQdaY+QKzWsbKU5WAKoIT+JkkVRBL6FL8bD8ZY11/AI1SZJSloASqCCRAqNXd27yWkD6bcwvpx6fjWFtwL64/OUPFMHjkfn2OIXusZMQVTj33eiLJlKOa4lwvIwqAbE9Ad+hYHg0LhSfZZfr0fLWMZrWCkHN5eyYTQjYmMSg8nthBUt6MkyVaQBgHNd+iQksvWvMBdzmWMb5GZJoLdLoSmCyYBRZIYyePJDDmkxtHXYr7A0KrLf19Ahh58gH69RLQhvnuekphyLUTmsl4EXV9CCdVn1O79oqjJP95TnmINij8jm1KZhRaXsoRMgzAGtRvLrHG2zaUEsXRi8NC7bSicreXQtSmyYS/4PVY0LodoJ0O71K1KwLV0fGiZHppnAH8578/3Reahaq23XlkY8ljkZCoVgkBuMBFp9vlleff7p1njhLTsI1Q8KYJBSQOG85xHTHNieh6ETjAQqx+NDxjaQ5nnJmySZOuEkyzfzrr8E7LJaLjALdKOYwTjrj+5pzjOAdJKyuuEbDBy2WEKJ7EgsoBLLoXvt9eLQriMoLHFYjrV+R5JFQKmUPYo0ovosGPVKYTwJGMy6/sDWshgfwmUmbjsjTYi7NcdaTZdcbGYI15xAorCNWq/NGU0qXuZhfVY22m1nWMMcyBQY4TEXZ6w8wwwkm7OabSBFQGt61t927ZoijyfzgO+xBN9ReYYLE3Ls8KZgZuE1C9AXjwEJis/YcDixDy+Y1B+KwhkdoX2CgqBqcvz+8sPF1+ulHysAEVYb4T28wtS2LhXDgPrB0xQqbdIcKqafQBUztA72oF80pw/QlqtmtmanNsMeYC/fgACqe3ONVF8GNbMTArQXkNiPRbdOMkF4dl/WIjv0Ivw52aBmGq69DGC6m4Vpa6yVk+XVp8vPX5cd4Xff2bya3N3bDNFfE/ym3JhAQ2I9PDV/504ED46uR7IfvUVILKlGgn42uyDFLHaDf1iQV8GbBkpiHqYoWxA6+MXq/2F+CixuPxU95IJmC/TA8K122qLvu76PzF/E8z//NSSjSm3YwJQYRtlCAWdI1jfPYjzO0B590iGzDESCnShbdD5zmwqDi6n5OxvOHi0vR/NFOL9LMKbjdX55b2S6hHGWsUzVEay4bKzs+LsKG9geuvrMr0olGuToY2yh1E0aIUhO6y2bYE2CbfGUzc4H6j+v7uGnq322qXArzf0aBQVlMs7AtCXSMoACV2Faev2qWCtZoeHpVwdni+HwbMSiwUZu+pgx34v7EsPiMVMuQUF13uJQ+ASbBttL41WMS2BCpSgX7PfJbfeAINs12v5xhD2/sXHZ5qh3rRuHXp7Yydazb75/3LODuDqqNmzH33Xh+LjSduv+qB1NMOlO4n9txEww3R/ajYJOr+fkJSDopS2UhB3THlutxMv7OsN5edKUskYkAWkokx2du5rqatmwHPYkeEF+hCwMraaF/p8GpTjJhd7M9otcIFKsa2lvyrQLAgi0wevQCy/Iux1L79Tu2i1k+feD9nhFcbUXnZqI0kn17EhWObaXGMKoDo/lPfFC20jYU7fQJCzIm1dvhvT4MTu3BZl8vFxOogHNoAXp3NTrRWNepjXDjcl4gu9WcwlLi7kIhJ6TBK+BVK0c5TMbhrmOvcCe40IrMDzZTU7V3+suz2bY9gb6Dk1uJZQ5Y1UCqFQwO0yDacMFcrGNM7Zut9PJFyMHbu9eSnL6AyYGZ/VeMAw5ORKYoLtCPF6cPn2622DEg5be/xxrCvsyjFOM95v4Mc3kMcZhrnp09YV9GCez2wPzd5xoPBfaT5ATdR4CkN7DNnon2lxnFX09gEeLLma645kdlRofCd3Afg/8tYbwmQ6SpDYKYgNoTy+QdjLrpUkTx4bh1EbrWFKZ9xfuNSyPpYdnZoEQYQHMMTs5bM/GBNBR9FjsPAmux6A6ik61Fx2HZ2+/MyT4JjyfAM1vwvI4JGfBpvVIslIHBk/oFlyO7Ah7rYG/SdbX3lUtsu66YDrrl2roZLNWn4p/vLgEEGIXgWfMGzwdIqxMRYZpj7aNKCBBpbB1PMzJum1U19Tjhj0UgFLs9VWVm63dEwfUeMgE6E0c0SJULTY+xWCbTgz1qaWezMJED9oOGUIVNopMhtUoY/n4gn8bLvaLf4ZAS7lh9RPltuS+4J29fmb22lMdXFtPnkirzNwjltDgs+YELyDuzI3nPZ72lydodNW3irYGkOz1JXO6a8s7lhHYHNPYh8WICmApQ96zlCXBzDOYF8sq56DkvN9O2UmxBsPUMQ/pjph/aLNfsKGaT2JVNx13DwKi5oBvmvtduH8FN+0B9QrvQzNzBZQxYwbYAt2L+m6Odi1a2DJXwA4vSRHMxiNg2R4vcB7P2WnOwStC3d6EQFfpi4v4Ld4DXH2ehlobtr0jj0JuF2PWSeBFSGkz4KgtQ1JdaXqUejABC/R2d9/cc5iEdtzM/43i/zd1BghZDEaeob9K2aNHWDpJ24Os4FrD3e1KcuQAdFDz0cB4soo4e4/n9P7F4InK07TNmzjM+nhDgL81sedpc7vebHBoYijiBK8H7DWJWhECw71M9d2p/36YUB+5JbGfR7bcWwj6NqduUWggGmy4oTM6cj5Vsz0eMei4VeewRAWzskh3CGKVOHJS9e37jM71I86x3MNz4PBlDzL2pFojZXhePbgK8xzqqFWvdrRH1HcY+EuAhEODOFija3asvRb+hcgs6CJs52dBoLb19lwc76H872N7v28AYzJ+XmVc6h8JONCMnmWlYlviHayRU53gQVccnkJg91/RmkIDijV6BBRPA8QwD7orpugFucg5FGDd5Er9i4zhbzYQtgUF/8A/UrXrnKfq934c75k2NIVNSeT/cBH8OmQS+xTR2O8cvz3N/VwSBnEbmj9hzR5dNGg1j84MyYYTk2JfyCfOVrTRfwBQSwMEFAAAAAgAJ5c6UvpCeGihBQAAQBAAABsAAAB1cmxsaWIzL2NvbnRyaWIvbnRsbXBvb2wucHnNV99v2zYQfvdfwakIIHeqYq/riwFjMDIvDZqmReKgD04g0NLZZi2JGklF7Yb+7zuS+kFZTgvsYVheIlHHu+++u/tIe543ulldvye0VHvIFYupYvmOFJynAYl5rgTblAoSsvlKQLBDDAkIqQTNR6MrKUsgL6aTgEiAGdkrVczOz2OeQLjjfJdCGPPsvDgvRZqyzetzpjfI8wQUZelvLJlPJyMPEWwFz0gUbUtVCogiwrKCC0XoRvIUg0f2fWTtUr7baYi10Q7UNa6AqD/nKs2ab/q5Xg7DZvHtavXx7oLnOcSK8fwjZtqYFDQ+0B3IULIvYcaf8EnnFMUpQ26ecTAaISIy74D4UZTTDPMYj0ajOKVSEk1xP6R/AsZ4NiL4pxnR/6+yIoUMA0tCczKoEs/JE5ZC/+dbbVGzrKtWOzVlbH2aBxnv0SfC9XRmsl5NYIv8s5ypKPIlpNuAlBJEQIoqMEHRd0BeUrGT+O/lodJPNVwXsv6rzQlD2AT7JEFq72+vCcJB8NgpAmHjI1XapBBcIVjbYDrHsHWkEWgTvesTQz+VbFAJvqGb9Cth1ufvH94vrm4eHvRXTT3ZcpFR1bkqqsZRgeWouEi0iVnQe8KTiciywGIOS6e7Pd2Ow5awY146D2gXNnzMG2b6nwWtTKJzg6SXfFRQgcW3X0JZpEz53sODF5DpUQzkmCIXc2fbevIYloXO4MjWiVZbTh/7FsjWHClzWiOHKtJtZXrDqfsL8hGEJtuSa3p0jyWXe3oAW2MJMQ61/d51ZkhWuhd4fADleMtKqcgGyAEKRXgBOan2LAUi4E8UDj0IAktoQ0IS9mHnZRZ1EST5eU6mrQXOaJjAptz57ZKp951CCrScGOxmKN0BynlIzhIrbRK17UyeSS/ouTgV+4TFnkt1YrkZrvbLeNQ+7oFqscVi/O11LejNiPcOoHi1SNkTeN9acyQpslv0eC/QMRfsL6MUnmMkC8eqqqpXjqiA10XX6aDJkU75Oo95lxHRkmjf9ZOD/gW5gzwhOey4YlavMpAS9fU4wXWH/FGDMqVAnsmZUfAwFoDQIr0c3SwvP6yuFqtl9H55d7e4XPpDTuuRcigddoF3a1uqwTDTAYPmbdxjIazbz/culysv6BeO3PAcTmzUPT+32/Fk0LRjX4DfM9gnuggJi5WPb9quduOPn8FsvRCpqCoNZgtb77Zr9hkJkzz/vo9+4hbN93ckVFETcx2G4aPXhkr86WQy7pX+FvTxaYZewBYE5DG+cXsCmKlHGnl9CigSUz1qZvTjlEtzGjjerJsaBd98xlYkfgWkongqo9cDjoPj2ihHj+hwWyDRulL9/jRHkdzzMk3qAAmpmNrjyRXvaZpCvoNB1+rK1+0aPdG0NIW2/K2d8XpsFDsg3vj5zQ2uxkCfS1IfbMMws16rsy2R69kbnJhmZLy+wXPh5PrNrFN8dDM0wsNSg+r7E5Qh/csvMYqzVoJBMO8+hy+FPc2xS0S/02b1SPsOR8Ep3sY9x0NFOboEHZfHVvWiKR8OaK1A8EdKd7pWRlTw6JO1ply8XVxfL28un9GUAT0nhMXYZHLXeHcla3G/eru8WV1dPKtaA8jtQR2453vQHM/HOZ0A9GNpbSD/L8XxvxG908r7b0VwvJ6hDjrti6PVYSQ/zckvk8lghh0LHORfJ9PhEB8PnlcLl4DPdtjqEsxIJTheZdprMEpJc9/1xt+dZe+T2SkbxzbZhut6ak+x7YxnX2dPcNjdIgiixQs8k3twkQnAH4C56Yvu8ol9pPW8mxjz+6R9y7B0POnee5epDU++zk0PHg/G0SpGFgzk/LW7lDCBcOcrUTqWyCcIFUn9C8/chbrPzsUYC9vc3k5qqXO1+zaYWfeyZ6bWue4dc/WjHykD9hzODFeGo3ZEg4aJoM0/GKTsyM0/UEsDBBQAAAAIACeXOlI/f2HCWxQAAIpBAAAcAAAAdXJsbGliMy9jb250cmliL3B5b3BlbnNzbC5weeU7/XPbuLG/66/AKO8mVE5m7OR6c0+tOvU5cqNpYvtZzqXXTIaCSEjimSJYkLSi67R/+9tdACRIUbJz7/3wPtzehCQWi/3G7gLq9/u9u3czto2LNZtdTYOTvMwyqQq2lIrd7Iq1TNkrn13KJJFbVqxFLlic5oUqwyKWac7iJdvJkm1lmUS9JL4XrJDsQah4uWOIORSqiJdxyAsBwKmD80oWYogoWSSWvEwKlsQLxVUMgJHsvUhl8QIeXAwsXIvwPk5Xv6dFUyEiXA6AeBTFSBBPgBR1T0TwJI5gUq9BAsxTuUiWfq93t45zwpETFUviEZCzjIf3fEX05gVPEhGNer0XbJ7trjORzmbv5gHzAFkBy5Pkzr73T/3TAcKEapcVcqV4tt4h2CZO4025YWf+a/+7IVsquWHZTgKePE9oRhyl3IV85Z8aOBfXoNd7K7cCJDus54Pk4AHoB4m6wEO2Xcfh2h3GVYYslziSCLYVvRJUCcwB70qADmIlwiLZsbVQOMxgIisztuYPKBIlEl7EDwIAlmJbS0iJv5cwMwJx/gwaCXlqhYYy3WjxNKUbys2GpyhS34eXSJwsEhnej0ZswfN1r8fg79+AR7KTE5BWnFU4a85ddok50CeYAVjlAxlKh9EMgbwk6Y2WZRqO5v8qVQIG99oPZVqoeOFXuP04/QVkEcRpIQMDNdcaQeuxJoyk9xYCHEWQNS7ECux7w3Ep9vbu7oaEA1aS+4xMDYWzAEnLFH2IcTaf53EhwjIv5Cb+VcznvY2MygS8ApyPF4ynOyZBeIoV8Uawei0YzbIEuQOT1wvnrMxx4fncUjwfGn+EtTuErQWsxV2o3Yge8C/eUAA4KJ4K8KsE6A1onvgSiqxgU1pjopRU9cIZz/Ne7wrizM6YEproCGQyqphiPNeuL9UGlLnTgWcIoopYXIC5gZHYEAbxrLddi5Tszxoq0yLOGVei9m8w33NtOihDlJiBAw8Bn1lzHSIyCQoDL2B5HIGHLJfAJZNLcJ6cLxKcCsHhJYS9Hhh5pkSeo36cqMe8HHxtfnE7fT8BDRfgRvNg4JN2gjyNR2xdFFk+evlSpP42vo8zEcXcl2r1Et9ezoSCCBBc8Y0IpmlkLIBmhwptRON8DA2tHwAtYaniYheIL1ki42JAiCo11li2262jXUBjVqxdsIZ1v/qxJEj0zxpiBTGhXIDZbF7e/xK9JOftw0ZEHhYEy7IolQgCa4h8kcukLESg33s9893EYh/+6+2FSzv5y+9O/31/1F/zXze88BcgKwyQvo0qZpb5jsZmRgLz6em4fFzaIgwu6njU61Xuto/MnfQhNZYsosmXApCiqg850LNOcAaGvDLxpiGeP45hnznzT2lumIDndc73JrQcPA3afqolEUtL7Y872BGn1/pzDjFGFHZIIJkozBl9Jqq74DDKybLQAkKWbmDTgZi3OckzEaL4RpUn1fJr4giWsL3JBcafLlkdx/qasDoo2BjSlFTUi/m+3fpI4Yg49yHmC5zjmg8+BHagstlEriBWr+wrRlP7uMuNSMFhbAgu4qTXWtaO5fGXXi8IIHqBp4zZp35HzO0PWV98KRTsigGiqb5/7vWeYXiE6Lblu5xSptzvvT2fBfh1zO5UKRDmPc8032Ym5lU3NgvCnTyDALQAzjOuICYVQp1A2gWbnt8LrOdAwMopVRyzf5AgkS3/5vb67vri+l0A0XLk+jL+9/DqdfB+cvf2+s2QZqA7uRMezppT6FM1458g7iXGbAiGyoO5IIZqNmJ/3R/QhmFBHFQAShAGWd+Y/R4znxok0ZTPwGCbD4vnGEWa+LOjNBmYr6PKTGrT1cT1OGWvnkDZq99C2atuyl5VlPWCvIjA7AIwaQchlhbWlhDtxeT2Lri6vpo0jeKnye308mcaGDZhr2/uptdX5+864W8mk9sW/O3kPz5MbydvDsIT+Lddo5fn03fB9BKoIMAA8aGFVvwAa4bJijPY1gvPexiy+wGVYfdD9oAB/KA0fMgiN7k3GKDLWuekVEimmCLBHi+gRvkL5ZQUZXsAEXy8nd5Ngh/fXV/8ZTb92wRWPvv+9Q/f9XpSxasAvTSoIwI5rXl1AADPBaR/EGUsDJLl159BixD0YNCEPn8linfwKJQXBCnmMQGQ3YMSkHVmjdqe+u9lei92JxBuoKyxwYiKiyocndAOHGEKZqtYv6/z28DWgoGuiEQaQpUZQMCCtLSOSQ1mKryWkQqsxeFR2FqAVnZNNEfGp7Pg5ufrm8kVatOE5ObkLggtyq6oX8nyQwoF88YRKCauix0zhVFX9WMFuS+mLlM4Jqrj8LU49mzwoOCOQLYEdAnJ/CMy1CBaiMesxogSslb89yd0Q+xbFGtwscoanue2UD5JoHK35brGg5U11nRQnwBGn/DcrZXc5mzuZCxz7LBA7bGjgiWVRQ1tV4dtWkD6EmETBOwfIkWjCzEen/ln89/TXP7A44Tjhg1QMomgtLQR+khC6gubD1bpR5Uh5towgEhwbNof6iHYHuBjUM0OIJoFlGxCZoJ51QDzU3yok0vFYyj6HAF41RDx/Nyl7rmt0jZxnus2hany0JR1PwjqGx/mNbHcqR0rM0ASUb0n2QP1Z7DuTsVWKL+GNwHiGau6P+zUP/uOtkS+kKBDrFIbyTUGbQu7iFNcg3oAggVUj2h8KKx4AYUNCoECNVaMIi2wXQP6BKxWN36tHLvH6AWtOv6KaAmICogxfTAlt6MaHASlEBX/BRVUkniy/B8VP4m0W/raF6M0p92i2i89fG35IcQTEFkBxT2LrmZYJbNZSYn8eQK5aUotLPoM3ppQ71D3ptQGtRhhFIQPevcvQMNcRaYrudNaEWwFKKqC3ijI17K/cI0gUyCaULi0cHwp0xj7MIBf6V4DRIwtjGAZfBIJHItqdZ/PLqZTIAtqK599FFXLk6AhkCAmQmHRSVQ2tkJwN6S+iO7wYB9EVnS/xg4ftTYswlCLDh8thQ8xZx/uLk9+YB4yrsWuw2cOfN3sPmjA4BIondH652k0i38V1HAs6i4kQuU1voGR15QiG0NFYrsHA9RCuKxFmu4ttm+KUqVkqFD6rMCuEis9y5/Go9WTr7EthNjy+zjLsMFj7YQeKN2AdQK9jmtLrj3h348SXGCLnd61TETOwdpJM7iikWZD7zdKosH5bArCBJrBt8uiwqbVTew+L9gvZQ6a40tsq2JvUjeDfU3UfIRqxDYYtWcistMKEaR3UYjmiaTbDiN/kHFkdiGwP4jzG7+TKRM2dN+0os3tApIFgkNCTFrGX3C7+FT2X/gQNcq+3//cBDRhBknxwW/AAzE18/TcwT4s/pG2xvTPp0SkFpiNPneCGwPQUEZCXp/nYRxDffItcwSntdnrmH0YyLQKCCCUSvjTN1fnrf6kg4iaAiaOv5Goyhz7RdObh+9xF8bOH2UDSpYr3f9GfEwvrXwbl/ujPkoWSXHCr14CP+oljKT27NViofH9KO5QShwmAJrvct/ELEjwlhL7QN7rITt1lOQoxteu6/XLYnnyQ1+v2KCPgjNu8jnE2YAnBeX0XiYE7PQQT1oB+s/knTx1mwh1Z2yIRvsQY6wwBwgs1+Eb3qv4bSy+lQLdYAsLZ4QminWdh2Afd1PCw0IUgI+d30xzsnLs+FZasYVuxQRsmbDtuAj7jrxowTGroP0WrO18Q2JZT3qmHRb+X4hwDXGUmtm6hZ8pfYaB1A0ZZAg2nNHJFg+VzElADjIlIMHkkDpUzRZzWFDLeYXpHwo404y3+HY4cZuVXqv/OXT4pDSiSo9gc9oiBSD6JeQ8pIvZ+RWrsj+fnef3zVgJsImkMxqIdF5cPM8NsiXPUT8QyFKAkBmKpWqjD/bPLHRtQVTVuap/IPmkNMjvTgwGPvWv3LMKgq6S2itZXMoSj69q6V9JsFOwqmqtoXUSFILYZMUOsoi88NvO+emzu1CdZtGSb0p9xCOqtYcVQFevdtic7oD8WaRC8QT5u9tlwkVDGzjFOf11gElKw07P7U5C3kP1yhIFUB/t/b2kLA8PQqwDGutBleflRjjoUklWofMvMH+T89aiSeTK33KVgspbeWdNCeZLGAlLKB+VcEhxj/3MLgiFV4oHta0U1PYQaC9f6iRd2+yRhNE5yGuh4/osyF3fVI9k+Zj76y44kv4N1D+N6Y5KBh02su9hZqxKLPH06+Zcbzya1Ga6GII/6W3oxroYOjQO6cQRNRtyrGQQaoNdgQBKkII2A5vM0/K5PtjlFo+Z75vXGY8SSqLZm6uZDtUVFSa5Yza54zpMgLs4melQ54gGnUmI/SpcgkILsLWlgtRJ0XGdDpGobai3t6h0na0203eLTwI9ZC7urQB9foiH47XIYAtAzzX3Cwgl7oi1Lih9tgrBNJNBMagMy3q/aSa1lm+/2tWxJ/6pUrjXB5FBgtXMTDBM6x0eD5czb78SGmLgoWCne+8U6QpwdB3o3mgjGdQonZwByatShM81YTqMRp5D3PSGGQsDGkH4OgkZNAg8SsjUWqimxOwcTjqBp0r6LOoj7A+QtevzIk+fxdSpBOxeJ/bsIabQsyV45d5aqXswUBWmggz4hLCb6gPvn4xYdUYTQGYJhhBEsEN6uuMNn8Aj8EVpu8DClnZNqDO4WvCVllsokwQWgBEIgdku23VUGwHkW3ER4KFrshxiuWVoGpoDrCGdW6N4AsVXKxEFQi7zMTb1nGSDrq7Uk3HTq16aQOZYbGzQtwY7lkLQjs/NiU1xwZTT1niYSCykq06a5R/npJK4H+wlqQ7BvgGs8ooLmWGbki7bULC2gcL/HbBWqlDomxiVoCFkAG2BRhfLvL0mpsEdrPyRnTZT/S6gkzE720ekee6YTQOWFSROifDBWMALrlZgby9e3G/xySFwrw6DXYSjdpq69wlZG027ommcSO3yC8gbJ/Y4VjSXsfx0Ggf6g/BxCTaGmuHkbIiNZKhMgRjQzOT6st9R6Bn9LvrN7bKZC1fA1Hdyzog9jDJu4Org6W9CyVtapaNasxw5QqNaZV0Wkdym4Nnj5gnU7eRiMv1p8iaYvf1w9+b649V/B0vHyP8I+8et4FE38RidqVW95RA7MJoqgPUcdxk2fAeYM2fo3qBLGyRgC9G/o2sxPMI7DkpfJcKxCBsW/cFTuHO8t9sY3Xrn3QwvweEdmuIE8vooX4NrMV5iBlDYmyxHRHXIbDVXeFgHUNpu+sSW0Cf+36g++4a5tf4eMzadAj9r+iqdgny9w7qCaTmsxvi/wmtP/6/57JMZ+n/jsQes8X+U21YOmdey0h5p3o7nE84sC+9kZdi2C6CMjJMA72UaxBgIHKz6yixmYk0W9vy+TYJjw7iQR3ibauo2sI94ZN9hYQetjM74f7OZ7ZvaYA8Gb3nGaSkeI/+RcFUv1RU0HF1D9ZYk3fooZMGTgI7K3ARUq8kZ/APDxnJrMv6ZqTp7a5vAHrmI4JODduSu8S3ruErRbGE3ZenOHRMlDtc2yLVS1mfscvrX9xO0LTwhdi9eCXtBL6+6hPARC1FdzMetBN41ySqk1hTojPVpGfMf2NkT/KFVFlTXGBoG0e0zNn12QQ9FmEOOeGTXP5jgV9IAt8F2J7YKjCUu4pSrHbrcZkwVjiMmc/TatXtVTVPbVnVirPFnnN2ZRXypznYNtEND54TmEbEflZussXZr/HL6bnL3880kOJ9dQX7gNHUdnP9otrtMW74/Yp7n9fFGv0yxydDX8317IgAw3sC/uBoM8X+dOM6TgmaOOo4RiJZ62j9rzZg+97F6sq0CJQsJlbq9kqZXcPcCXe23MHYZybcNI9Edg9/oMo0y8beYKl7fcy6sPnpttiLbIjOGvYEaGjtpyzz+VYxPzp4igpbUHTK6kA51cNEdDSCcuHzKfdzqeu2462Zto1XkO7A1iGkqtW9p7fWV6N8p4xvGq46Snmq7PvVxynxusMznTOPx9VTIwTOIxhicCR9NVTzNE/vjAuyUFUIteShsz3zvssF8XtNZrUD4qJubJPjjJPcy7uMtJ+sAbc3a73jys3dt0w5+bllDWHxpXd60Qm3gHLSmSbNV7fWN6Dc6dce50T76kz60KnYVZwbNMe+3SxkU5o2yQaE6EQ0ZdS33DL+muT4aaggCkVooT+M4RLi+rxmgXxwg/uDF0E/1etRhdTANzBHBn5yPbU7bKx/i1vKj4b2Dd04/0fTPQ2YpQaNE92wm7IH5bZ+FgrRlvae35sqdM1pYwzhbg4naZqp+a4bfOKdf96Sh8Mz4EC/N+2ik1JRu5YQGCDuq+qm6ZOAefu+Tq6EDPN+zCznEJpJHlhM66nTMLeQYnsbYfscXZLR6wZyTXppM6Slu477FBDfBTz8cZIFQ4YLHUNH42DwcRLWX9NXi6WZek2Y5bmZ3RBe1Ow/S9ZQlzG9RPI3reDPia+rTMqW7k3RsDZVqgYdQkNW6R0ldhSsRiUBBuOZxatUPH7Qk7sXOsQT8ec1Wqqit/pppSFPchE5jpd3Xs0gbqrYYDwvV5KCOz9g52mlMytnhNvhX4R9XjwfNpckJOhBNAfksvIRvFhFnL4JRhafL65B9c0cCJKf5NiLEK4S1CBohgydZWiWBeWtPdGNH9Q0P53K6bJTjD9K0DLxMn3jhb1Jr0M/tMN5ksV479+ola/ow2TAHFl6D4Tr3xVHnTf8OEH+GqMuQeiiSQdWmCSDNNWkwpV0OgkNnTXtr2D1ZWyeNupdf0o48wKTdXiUEfcbVrHkcW2uttBenn5IkHqCa6rHGlz3LbObszdmHo2OqNVuA7IFOnKALihYGB72dYhQCO2urEPyqNhNic1X9eJl8pHFpuD/UvETTIw1+fR+pDzaAFyMOtSmJlSd2lh5vKTWj9YLjj5aMfDrOAfBvARze71W7zeNnEHVlwOaHAc2UR0Poy9VCqSCV+t8IOFjbu0ABWp2RmVlGw2I/+7T3n1BLAwQUAAAACAAnlzpSlhI795klAADuhQAAIgAAAHVybGxpYjMvY29udHJpYi9zZWN1cmV0cmFuc3BvcnQucHnlfWtz4ziS4Hf9CowqJkquljnlcndvh689MypZrlK0y/JJrqnr7ehgUxRkcUyROj6s0lzsf998ACQAUvJjZi52dh0dXTYJJBKJRL6QCXa73c5MhmUmb7Mg2aRZIfJyQ/8u00yUWRxH81PxEAUiLHYbmXudzu0qysU6uJe52MRBAe3Wx0lQRA9S3F7NRPAQRHEwj6Uo0gpAmcssF2kC/cLJTGyjYpWWhShWsgOvRLoUMEC63kSxzDxBI8B/QSKiNSITJICPDArAU8xlGGAf6CtudgAnETdBeB/cyc44Wciv2HGdPkTJHSIArdO1BOiA2sOJ9+44zY5X0d1KZgJQepBZH0ZZELCFXAZlXIjJRiaz2VWnWAVAjVW0yQlfhTpAT9JChMGG5giYL1IcS8FH5OFpEu/ENtghBpnM0/hBAjieFDy6Q1oxOCYMTDSIC5kpMkKHsohgYtAWMdtkKYy11qgGRadqwQCRHvUy5kgyWKgvkl7wwgmYskk86FgBWZd5QbPK5P8to0w6ixEUr/OO7rmJNpoGQRynW7ngSbodhQSaQX/FL6pLlBQSFmnBSwPNYfpRWuZArjhN7o6BBmtn+tBTzd/rIG1X6UbStHF5bkY34rtvT2GB4ljIB5kUJWC1E0RyoUiel5K5OQcKFmK7isJVZwOrBr8DeYD4mSwQe2ofpkmRRXPgoUUZS0+8LxFtWod8hRsDcexjz0TSRDp6MIncCtMj1kN4SwYKYwJcxavw36cgNHYAvLqPYF3TZccdepZ6nkfrBqMFmURi8mJTN27WFzkMC3PmrUI8EiV/lSGMWpyddToCftQ7tR09NZCXE88Ummeo6SNtPIbtA/VSX7XtHXU6H4PNZoe7AGb/O7XoYbqgpQrEPMiLIFtEOVAMNl2OqwtbB2lGjZZpSWiLL7iQ79Nk8RrERR5muw0QGMbIgmzniUEiZALyBjgGtuuc6KpZcBWtaZXncfA3WgHEANCOYrX4nrhMM97VmQzyNOnrBV/Q0pbxAnkS5p1HCyC6ZtIwfaC/5ikIgflOEwj2RByFMoHVQJLDC43v6xyo7nkE+Hgep+G9XoZhutllIH0K0QuPxLu3J98dw/++r2ctfkRO/vN2Dr97iSz+yP1ugOWAj9WGR46A4e5gSQq56ItlJkkQhasguwN+ALSDZCc2QGck87wIogQpEhCsEHBg2pMIWBbbIOMpBHmehlEAMEGmheUadlNA+3AJGzoXPVyt7kz16B71CRwMtpBBrLeIfl0xOIg/YKMQ4fShURiXtD/06zhaRzwKQwMQRCAt1vqEbx95PVriv5KmuCnncZSv+gJYCrm0LHAf4ENaEUYN5vSHFOU8EBegRDAHxXMaSyVRU6QV4KFIRmNvV+ma9BNCqmYFJFuWWQJDM3ssUiAhjUwbTsnrZYqSEacJzLSIcHa54gCUYMEcOIrmxbwAghHQVsIdxV292upVvgKphrzIBJS4VXiKxtQyRCNHXRnBeuBexXHdKXsKj48jMZtc3n4ZTEdiPBM308lfxhejC9EdzODvbl98Gd9+nHy+FdBiOri+/VlMLsXg+mfx0/j6oi9G/+dmOprNxGRK4Mafbq7GI3g+vh5efb4YX38Q76Hv9eRWXI0/jW8B8O2EBlXgxqMZAvw0mg4/wp+D9+Or8e3PvG6X49trhH05mYqBuBlMb8fDz1eDqbj5PL2ZzEaAxgWAvh5fX05hpNGn0fWtByPDMzH6C/whZh8HV1c4HMEbfIaZTBFXMZzc/Dwdf/h4Kz5Ori5G8PD9CDAcvL8a8XAwweHVYPypLy4GnwYfRtRrApB4ntiUMRVfPo7wMY47gP+Gt+PJNU5pOLm+ncKffZjx9Lbq/mU8G/XFYDqeAco8zekEhkESQ68JAYK+1yOGhOS3Vwma4N+fZyMbp4vR4ApgzhCA2cHrdMG6W2bAx76/LNF48v1KS8xJy0qf/+501HOU+vJrAQKuekLmg/5LZlmS6j/S3NsExUr/ma9AbcfVXyD3ZFH9ldcviqwMqxfFCoQxigT9YCuD+0wuK4zy6GuHZwEiVesxHIef+a5+mkekgXPddphm8hLVS8AyiOykqNjVvw1hmxT7wMFG9mOwLGINr0dE90FYyqzwk9QHkqQZc64/L6N44Rdx7pfJfZJuEz8M/ADMoUI1CLFTkGXBzscB/Q2YdeoN0AHWI1yiQEvuuJF6F6fBwg/jCCQyQwBRHyXqZSERMdCP/r3cqRegkItsdybEK3GjbfR8I8NoGYVn2hR5R/1p3rxYeoo+CvyURFpHfg3lphBjejPCqT4C9ZSxqkGIc3GdJrIezAOuIYM99+bwCwLOPXQosI/GQb/x9YtOxwdKxsDC5+KXbosVAjKrC6ybBfCcaKuf/9rpvBKz6zFIS7DJwZpPs/u883Ew8/HhubjNSoCegjD2kbH8+g3+6ak/jQbgHQx5n+g2wN6+Vz/GAckCWrDmg8VB1VGi+QOam7QccD3YnnGME0XFwXoabKUVKAL2nlD9vKJGpDIzMLEAAK+V4SWBfSyLAozeCE1faJSlQQi6EbQimT7Ah2AKvo5jALZIQVKCLwX8HEf3En6vLR/ttOXr8u4uli4qDgIIDOzbsEDTUyl/IkAiac5TubRRIN2msWOLHVdCjAHSXSlz8C1fwa9fKsNaoOkEdi/ZhmyukOhALxCBRgluwZxHAQt5kSavC1TJEQ0KsJDI+R+2sMlBQSokNc1zdtXYFET6kqF9l0LLIFcqHLQ2ogQ/J0C2QnsxmxS0syIWgkO3JrWBAz0BBfYKLCZgcPCzSTdlHJABl8PqJ6F0MWSXYsHu2bx6XYPzGJhyOuuxmRDrEgwrFwO0eeWOHVRiQdqRUUGWUIVbjvNKyM9NkyUYVQW7wGhWKnuCiY8WBi+b5sa7NF2ciWiJC7IK6mV0qQ/vX4OdmYFjEIXsswHBAfVtAtDI65UZSpgAKaPtVTSpvY4fVlzmg6rIYRcqreF9gX//EsSlvKimDN6J08EnjM5r3eNdwQP0Yl6JKzRIhWIZQP7k+/v39V5TsQFwTshw1az3Gs0wML7T4xAjCAAAfQaAxrwPi1eA16h4DT3CpPIf3wRvNKzKAARpiYOxdYheNMwZRvW/TMGS8t9fTYY/zcb/PoIZnHx/+sO3HYP8aQmeN/jiD6B0wL8FutXy6WJ0Ofh8desPxzdgO8wYefl1E5BHTt5oCqBQfz5EC3CkRRhtKFJSIjU8c2sulGtuBRTQN0m3KGztWITYglGKHjv68Dy6P/sMc5mhLGcL29TFHriR/mh48XGE/58NfDSG/MFo5r/77nv/w/CTDwYeTLz/nK4n737QXQHK4a7Tl445femIBrJgEMN/7976N5Orn09O3373PJSf2/2F8/1HzVaPOHw/fMmqGl2fzQ2q33OxNbo+k4ueOsd9HZ/Je0+d376Oz+KYxwd7ycxeOK+XzOrprP90bn/BvnrBnqomCC1/eEbbZ+L+ONlfsFLPZYj9q0pW/vsgV9aEVkgUHJVnpIlvppPbyXByhQb8w7tT1MFgTCaor8mCCwSaIOkS9SmG8zkqJvC8ADVpFeK/BFjgEmbg8KDhKGOMU20xNq5i1kGho5xeBQttCe8dhnH1EQsqXX0icvLW++Gbjg/GcZGGaeyDW7OOEnB+voKK/H8cmEVFXk0BgJ6Jnk2ge3h4oyCcOP6t/fLdUec/wMNegomWB0WR9cBAAPfJJlD36Ix9uRasfoEOnt38V8CUnePm0t1DCz34u/7TGx09guPp83A8fSqOp0/B8fRxHGnpn44jNT+Io7XCT2/0KI7+c7H0n47n0xB9MqbP4EvV4cmY7mfNllbgLnQWcilaD0QYQwzA4b+f0uRe7o43QQGerz4TJY/KsZSP0TcCuQBcdqykhGdBIiFgxR8cCDoCUTV2QhNP6FHHP3TowwZ24P0Y/h4NP09Ht9PB9ewGA6AqvmKD2N+OadoWx3GJ+jkBJ2RtUBZl8XwnzpZlEp791rIsvz1Gy7YQzyFKHm5f06kRW9pL0QMtW2l2GYDyeQpxuSFT10e319eueM9wjqNFXyyCIvDn5XKJh+P0B7iSd8XKpyNTmTnL4Pp6VmCr9pzxCUe/Zrf6xFjmBStLHIWAzTEggzpZqsgEHbtywMsaVcWifBW4NEKMGPesdnGjmRs68O5kYRPgqOqMQQy7P8wDx6nh4w8j7AgMmWXAEuOEDvXjqv08yGWNjA3dU3G1Tg2YSAQNeAGgR8ty/PL217pLEa0lOvIN2DBN9a5XT5Ai1ybteFTkjbRMEMpbA7RJV6LtCsO1RvMfGxjbHRRNNY6KmHhwpR/9EUZs9lH9MBxFTL4NIpAMaUZs3DNI2teAjtqB0PSCKK9YigjQozMNbzT4MBhfg7pBGBQO6R51GmAyuVanqefN9Tk2qNHoyTsKNZHKpAkxip+JNzXMI4/kXbBYZDLPe61zMHan+ObQeEeNJ+GqTO79PPqbBCwMsnmZDB9IUPb0tq9RaqFAteDfnBsw25aaIohVi4MrW4M9sHb7d9owTnO5+ABKQy7LuBXCHIa4r3mfzzV6JiccYeTXQVPvEenx0Zf1EnDn9yowTPyMTgM//d25MHmrObH27UystXddqzHPK+h4bDgdzUa3uJfclzfjm1E7SR8l52Cuk0KsbriDajo8ZQ6mSDX453fNPfRk0foFTy3eYyDXFJjU/G3HWOAR/YNn6fbatgp3vYaOoLNFqS8rkEBkd/CDakCpX4ou/7P0LwF/sQIGo4szqEAT5xRB5rh9Igs8rPmfp4Tnu0Lm6GAwXfeqYHM7QCsl4/VZbtGzVtUGevQP1d+0ak/R3NTwRweXf7LGpjH+uSrb7a30D1PF1HrwaEHL0uxDrWvtJk0Rpn/UmQu4qoDamk9GYlDblNijzxP5jGX8ek20yEs+Eczk67wF3roE7/ABD6/wtCwFEbOO8iqVjRgL0y28VjWiOPOXGuWzmin/ays7oq/b+l9GzdncAWgT8wA1Dm2s/36KzTq4v5dyg4yOB4NbTG1AVzwHSCD9ZBLiEXscPUg6J6bzaBBv4sPw9YJFEx1CqjxXmTQ0XEgJC0GBiS9FdQYfCPT7OW9YpdwCEMyNxHPttVynmEGK2cxiqzIePM8rV/C/ebDwxM8yWPWp6+uc0x3SDB6/h3cd22HW669DKUAUDAtMoc0loNCzWx91HH2/p/sXbMT97fYYZwrjACTLF16vGS1Xj6nqWAODm/ExpmAHRTSPYgCtFjnjADil6LyuzrGdlA61UCpF8DoFrhVV/g1p6r7wF1m66R3xaTU8g1XqHVFUGxcf3XbUDkC+uyCbY1I+ggpTsD3CAt6kS0DiZlfbEfQLWUXggYCW8Hu5jJd9hZGhFfCxV2ltpaatl2EVl3EUIryzp0H60X4fkiiwIir1S3NjtMDWeVeH3/qLqEVZ89hOZpduVrWj3ZUHD5gJsVQ1AfKBM+ePMUcjuispY1mpZVXTkMAAlI5QpAaov8ksre3CBYpxfYy/5ZIBQAsTtxDKMgPcFpQKobOBVtIApkZUWTic9xHLQCXEa3wQDWVJYs1AphkOcTSAqRQyyg3qYlZ8vOvy7lYY6c2tugd3SCyd3j14SKOFiRq2BHsX3oesRmuEYDpEBmclavvLYLd248tskNcN3ipr7s91JqVmzHWQwIbIao4nFeODwctGDUI0GF5vadrWOjFTKCA8OaxdmEvOK8OcZdjNRC5VHbFIxfgPEwqkVZDcMhExXpppPdi+ztFZRcgEomJ/zpivYLk40bqFaaaywjYgKWCFVA5SvYeCZSFZRiyDsKiXgDgywEXEYzvMX8GsoG2gk6mBN3IDTu7V+2OM1SiYtVQNjosucyN+KHiHe6303bPN7f0nv27iKIwQOmdYhRTPNxPUdpEkzcK7SeU8lQmm2sU7AxqVqvAimfQV24CJrnpS8UCd2oZpNJSgxzQx4EUGGQkH2yCxJ7fXHjDWuUkQ50nfFmQVEYnKPdukZgO+6mrIfNg4PicZ5YfYfybBeijJpKiqjlQ30NC7qnSLy2JwVfTSo/irJcyBXChYCRBb4A+jPV+dz4L0oPNZW1zWG6DMi3RNcnKRyhzXiNDDUozkjmouFFIoHrCKIS/It1a1VEGG9n0FTmtlnXZFzqPKqqvq2dDQwUgWPkgwQ2xNWf1tZFMkwpijaWkM6fEMk7rEG5h10rNyso6Oem/sB4YpmCOZbcMFFmeUYO7oYqhWsoUrWFL0NUr9lmGrXvVvbpZ1jxE4cjgoiDdJdRiYKwOi+vsJPDW4urmuO2hNpZBup61yb6tObfZ99ahqhVndFABpS/bu1Sjv9933LQFO4cYiQU10a3h7a+6lsG6wjBKMB9lI2Dn13vByKnHzyJ4zUr1MvFN88G4j6CTVGj3IjKp6igxe+/MS7Ys9yzXk8NUWjRpKLX3g3a22oAKM2KCo1umJKEe36CDk0lihZZTlQBaChUaX0Rs3G4jmKJMo5aOc+Pp/0Q7PJVbzcLdaopCDHmg0aCLi4n3NM1OUfVThCes0Yv9ZF77pgJeWyNR7n4p6hZoaVYFCysW8L/6KY+fB7gxAp7HnsioTu5VPaz1YhqA1EWHzxBx/3DQIGd4itlNil8+JKgOQi/7TewG7htLscYDtmUMq5lfKCIMluI/obc/iIjd0YQEAtqhm2gwaOJuXH1Hm7rnoctwB85DPxO8XXfF70TNB943o3GE/ndf0Iq1XHuUOgd83tIYEI2c0suwfmTaK6yijTuLAk8REJiwyRp5JsFRsBTY7ZVs7vFizDRhSKKr2l7SwlFGJTr2jfaYxSIk4BrkSHhmokpnQ2AbrtVxgAaJlK8VgIaPXcy5O+hifjh7QpMSSCJlZzfgR+nZ99Zpcg7eAT5qEi9puTTcFMjhXE1AxSq8bRd0+DvB2r4WPv0FPHUSbYU7RZPjT6FY7q/DIx0qs0bRPQziQXMtIhTVzykEgydDr4p7GahqcIe9XsJHBFAax8/scl5y5wZSsziZgwbpHoJIZS1YkhQxhG3BchEoQsMgIfcVyY4kOVeTlRTm6z709kPGHElpSsGGsRn3RzeZdijYum3vNbAlLsvToTNfg6rpgyvWdec+YirCSLksTQkOWvBIf0HcUw8sBwWVXCpQlOJNsNuKgWKFAtLLjrRY+beVcjhhyRp7c91UxDOqwbIE2YOFVy4KXA7BbLIzZMIazWww2O/DYkNBRFy5fV9upj6U9GDEoMzEc5JziiHUGBRbE0iGQAyy6S7BmxUltRJ7AjZ/367BCkN8jb0TKBUURocqLDdQwkmGWKc1L+ElCyqXkQg6zQ6thgwXTN1JmtxVvG6YkH7HMdxmsNxH96Jm2Df4o5Uj9W1RByx69pA1JcUcspWY2rEKbbtJAy7TUwqLRBtRIs2G96XOeSN9gsyfO6e8ZdJLEOz0wJmG9ZEhHQbdsSnxzC0vmOod7u4yUZKto0lhwNd5z173VptU2QpMJ9lq7zHSNUxJDROx1tQ/CNRffDcOb8/bosKjWBRigy1fBvaxNN1IHxl945Ym/Ajc0CdayfqEMcVu2agFePcUcS6XujYfB1+ZDI6LZeHgvd23P/A0s22aVBbkxou3ZqbzLPSEyfXKt6sZYkuONNBVZamGUlSDDSrDYA119Nq9NDjsozlKPqyTRwZ9XkW4+o8gcWWbb7JfK1VAuCcaEIqrPn0dFzoKwMn/AxgDda56jsHQ3wAWiEn8c2c05wgdiVYnnXKkPA24lm5xoZ2hnhGqRS2OqZEbbB0A2bqSV0zEaLuIsWrS+nRUAcY07v8XQ3+fOjid4FHIwlNB+KNN30yv0i2eHF5jiH9X1K9WSpOtNqUKadXks8IHld2KRL4do7Gh5hPe80Dz49pZUvHvz5vREHFOB6bKqWghinNyuWfKJrGTAI5ePTtuiBJgFr+xQWbAY1S/hrxiRX0ZUyEAXheRg7xqcQEZbW32kLa/UVM9hBhyoA1v03cm3//btD6fff/tvthlI2QWqA0zAzfZoCsIKeE/99o04OTCAC/AX7vWr8gs7jzJXXaTsmBQM6HkMMl5W8YhACVhRCVh8pQqseWNiPDBNLQPbEcoNrUT3JuVgmhZYCttzZTifM7ekTzgNiTrWEw9kAoiuXrcslsc/PMFwIeKhOXaRYnrgNcBoJinaFG1gi3E/56GtvZ9rfKDbW6g4no4J23LOijLv6WlHANsAOEFG+08XKsEEdRmtSw4Pg5ak31EfKW2Ze48yqg7o/YV7fIpchjU08nO49qnjBV/d8Wpl/+xdohJfYJfoKJl5ixadO0ZFLUX57A59FTNE3gxyYFAc4+GCNChtP9DsKwJEZ0IaGp9N0kmKAU67XToyafh/AUXzz7AXydktHcJUGXILumbJVM4lO01Rok/ncrknCkcpVKbru9dQ3LdUM0k3BE0oIPTYLmxRymb390i/STIj6g1gFv26ZuPl29JacrbziLBtq25SybAdbVLYx+l95291vN5yHYrjcOw/c99zz8oe6hqYmOauYdIeIOBe1VS7ZT1Xkrai/dx1Ye2My9sSvOExnGPpFtXSiv3HyvswEW/JoackYAZw7rCmmwK1J6PLTAjUB+/dyswXh9IBZfzo8PU+GKZYPFrIRTseakmco43WQ43W/kiiKCmbqfMYdmkf8kkxDf3DGe+Ve4jxuyR1z1mVX2kGO1VDtXSv6Nq6Y3DPCl2Vo6/68b6DVSizkG/xq2OSCxmiGcngorRxtlsdSttZOX90c0nbGh2fi5MmID7cb+mto64VcljsoKKk83KZR38z8KpqNHSJBh/TqUM6fttTvepOlOdHZU/qYKJZT+H2URmb/PqXsxrEr+66UGa2hTxDrmZA8BOCcI7qwwr3Yk6aurYS1ms0ufSeRroq4dBSXzRIe/61endO9h1jZez8/bUv3E8VvtQEpu669wbPiYDtF74epIKCZSV+nXSDP08WZK1CDAn2mDa1ie7EpRxkXdvWWJtbunCI6sExf1ihgxtJpe9s66AwutCUmtDli1fxHisDFM0v73pipm7jQgOlrxJmcARXrvbtzo0Cmr5O7K3eXKfXKWimncVALxPj9UkmBVQUxSgLSVGUYszkC2NCDBlfAUl1FOqeA+xjupV0ka+6zBUD6C4CdOIXgeHGdyLqU+Q3gMIbBxxtZFoR3Hp9dZ+qoiUdJBtO3V859gs9urTLug4w7Mx7ycYaaOcwCsfykJQt+fTALFql4fEBiw8ctpkL3q4bUW60qkVTHcIsD535tvLJE9tr7jHOel2e4Mu41mmBNz+hDw0rr5IynYMNMu3VAtAFnKJxLLIFt8GjDNZqKy1s611JOOtW5ChxwGxA7oPjGFdXA1PisVEigzf8whO8u5gFjyG1XT4dY2KxzgVDfirvnFz+1mPCpi3wFOMbz5m26pY5ZEK8QjmYYz4dnntj+NKkosJ6C6TCrVSXAylqwlIYhDPZTvVsZeZabRn5kep8slH04eZfqt9qGHc2jD0WjN/oR2UePCoVe9T9/n/qFcrufkyxsMBBDUqYvlCzPEMua9Z4kiAyhJA931aJQykH7RLnJfz8heuV+nuZ+RYPNfGGMbyCjEtpttzn+czKGQutPFOkRRD7VY1VxRzkVRkvf6yX0TVKkzq9WFcg/WL0PDPBfCNa7n371V56s7lZjkJzWZUFJnm4W+bJzGydDJBkanHucKSwemkZoLeTi8mZFjNjFNdhLEFJa8RIAP8J02DGHEMt0j895ib8KE7a3IQqg78Ru9BwFNbPOImzJ+t2O1R1YOHf8Nqfi8Jjfr9JhT21BK2I6RBGEx/zNPYn1epCojPcs7s2EXlkKvs78gXCXrYGc9dtjeGdfXM26i8eL7nAnxaf93G1u9cZNVUUmi6hzo0CVyHCQxssfVyfU2GJtTk+Z3crlGhJigWDtZx6ZbT5yBE0FGrb6nzprLXpiUdZksLNm9BZJas0Xug8f5Vwxhf06uQRA5YQrTlhr/CyUR5EHdJ/sGJWg4K/wcHXs+Jvb82cFmCDpQnsFOR2/XZ43ediD4BtwMS5DNP1OqUDB1NlkW1nI82uOtqEHPNFm0tNma6eBYuOgrygV01EvrUQmQ2urSAlGZlrydHdAI9uxRoTZUIKD309s1EIago5s6CLSXOTIKzxVSm2HefmH0yZnIwvZnzB/CAukAae3WzuiU/kQM3RdCLRXjiXD5MLubPSiwbXue1NmaxU3eaapXnuYRgBTT/1FxmyTka63IoV7Hi0hq/SId/fY8D7q2LDTG4kle9oanJmk1vgBwrijT4CXaRv8EsYYm2G2tONzAI66gTboVyr/Eoj1776QsjW8aTxemCT0fFcTfI9tYTkMg7uzC/XKDYyEgDogmH87kRSnfMZ8IxUYvIyOUG48XEW3UGdChhywjEmybgixlHpRy6x6CpfVbEAaw7EoBNgAsgHGYbx9UjOnG6G3VSIypKdC5lVtrJdINOWZJcFc0PW5EWa/SukfL0SN9q8VOe6vOhJfebPUeYdXsJ9DRsguruLZIsnzkrGppOmbnXDTmMlbIE6xGY60ahlEjWstpkM8PwroKgFM/KarhReYX5LUl3SzDOsJtYSVAA1RG/T9P5PoorzJ396+pxR8j8+W6U+dMLXW3vKvLYEal9aZbXRYaUuRlOOJzUTOBVvm9g4ovoCWvRwpFYUNAwbDaNEHIA3rCAECdO9ogY9DeKoCaKKlu4D8R5mdVNk+2AYm/TwNRQGwo8nx+nBnpnH1sTvH5Bop6Mseqa1Caaz0R1HRB/UO7JGn3ebWdltMglofi3v0oI+juMckh+sdnL8d+r3rEIng2i6f+2gH7ij8LRNjdh5rPurBdQX4DBX4cQ7daOFz8LjXeu5Qlddpdr9OyCfHIJ88vdAPgD4uWDN20LbwfItpi8Hu4fAfIHrAW+mjSM+c4GHmaSiS01q5q22mir+d3Zam5f0jeUl8Q0CTzsRbHf1/x5fDa8XNT5O8ugnUiq0NTDl2a3ThdTnevL8+OQpJHAWyUCjDWifYyrnnJHd6dAsH/v2yiF0z7tZV59egTo453TON0F2l8M/b+63+JtbLaLKzepurfeW1iH0+pMR/NlEAxpVNFdgdE0DiZ1IXSQCRhcgLNVH+16dnHx3Sr4kultHtR6voZhBOEXWxpdjXOJy1+bMgcbWDRv1N2nORf0VGnUXR/slqu2XcoxFsAYzTN/EwQD0PRkuJdXH7vrss8HTWGUlESgi1DLQn8SAHVyAOYaFJKqf+O23+i7S337TLr66JYWrQAhSq0ty6EaOSgQ0ON1IC6+Yv8oTw7yatot69bNfHWgpF/e3XNGhUqfar+hwCokO37JxsMG9bJQaue+NXPX2pnZ2oOUt/RmjEIDDrg6drmR4X2VDHq6DbzjKqLApcIo+aZXrSSBxf+hqUb60HLeRWQ2gK/DWa3XVmxnBOuJjT/zkHTB+e4K72nJ8cy/Nzp4M3YxhXHnRMtU+X3n1rzJjXPl9C6lYd18U/IuMYxDqIAXagy4zXbTMpQsYZjK/kalvNaLUUpi20CeJuLVR9pZmXKPI0nKOHxEd5XgkEJFsNWJaMinXGEOhCxWqjwTOrvQk3Ngaf6iW/UcdSynVty9VaIkE91Ifw8Oo+JGkXS3EbFWw7mMS5HYlMUnQPVJXlWj8xRiH2SwxoZZC/eWym7kgTT7T6/J5Q4mfsPZxlEj1pSP8RqObBlyLJuPIqMkGLKd81Df7jirB7BqOprf+dPS/P4+no4va/lFCjgrvqmbXk+uRGs0A7s7WHbc5Y0eO4rbFkSszs4kX4aHujtbjYDa0unFDwfKxQrSF72ep+sYqHua3B1K3MsJrtuzEla0KuqFtYMbqyD9Z7Y2V85epZaC4t298hqq+Lon+pERPhXuchpwWYkDiyzIV8pVjVCYql7j5KaTAMoFwkU1w/KXfgOMS+EVUveF0lJE2OF2fY1xrRgW5dv2IvuhELSGRXRViAom5PAlTZzDSz+Fg+hIsNuvTpTPQ2LHI9PkVSFMsS9mq+wwpiCqDDHReRtNV37GuMrNxn5prgzuWsp+N6GYtLJFviOiacSgyeTAXcR+XHdmcaF4fU90vYnHhJX+Arl8lcuuvVZtf/bbuXLHzkdUtKr87339/zHODtvq2GO1qq+sj7ItfukcO7VyG1XMOUF0pcx4/TF6sqj8w/NJMC5z8RMTQX4GL6wiy6kJineHatCDoB7LVnzRzK8pA9hh/SRAYSOZd69yfrs/gkckSr7rLr1Hu5I1zi/23HVbl6dyyJa+55lf8aTUs1Sh4B0Rg52Zy8nidNa4WBx5gj74Au9FYJxwKbxh0F6fNVtUwDtmrCvp+OLbNqoe399LLL9JpuUWHj19QpqHyz/hG4aJxuU4FR9+UgmlbYzxYQxNNLqo7Uwh8ZDHPvrtSVHBcf0ZER0/6FBdxL8vpuvk7xHItSDTTdxrcXZ3DELK0vyLjEz8n776xMwSdKyKafsMvefTVA0sKP97LZzq9zRH5jljyV1P713oh0c1Uqdd764CtFFBVjoVfPedD6vrVIvWrcwHMEVFnwhSTMADArPHGej8L7u7kwpfpMneb2CVfvAnobcNg2Kqr6/i4m/NDqIyWLAOpY/CUoqlsr0jmxkUDBjyUpFTLS7km+Spa9/lsWPLHvAmIvjc04Psydaqg9f0VhR5YuDejG/Hdt6eV/47ykz6BXjdUGPLNKxVt3dd7aOs2ayNuM9PvNX27NCWD5C7Fc6mteerJieyi+RVXFR8w4FERMZ7VifoeOvPofBPb9aPu5d72JaX42BLoCjH0EKrZ7wHmtdSzt/BS33lZm7htb9or2+v3rTXuxuu2avf6dWvde+O1VQHf9ra1Fr5u2FYVjz/mKQYndFr07PwnUEsDBBQAAAAIACeXOlI/u6WFVggAALkbAAAYAAAAdXJsbGliMy9jb250cmliL3NvY2tzLnB5rRlrb9tG8jt/xYJBUMmQ6LurcyiIqGiRBxocLjVOTtOiCOgVObKIUFwed2lFKPrfO7MPcvlynTb8YJG7857ZeayfsPXFmqUiy8u7mDVqv/6GVoIwDIObQy7ZUWRNAQhRKp6XklW1uM9lLkpeMNlUlagV24uabX988Z8t7X7KQbJ9LY7slKtDXgZNXRT57uuI+fQsqjR4Vyv7+z1b8JLBJwUl8WBibzeWK8bLLNAfz5CUYFDyHRLKkca+KVOlRcrVecUA+ULNUFrFi4Jdn7ci/SiZ6JZQLhlYSUhKXAB2eysJ7vaW+Nc8CtAAYPXKj1UBR0AbEJ9OesLbN0ix5uUdkLhWW7YHrpoaZMTeKMYLKYI+kigKcUKjWwYOPA6CdWeL21sy6DlBopuvtHRXPL68jKLo9nbZAk7CjcCeGU1rOAoF7OXb7RTas8McXiFS9Pgcmo/1TkJd8iNGAXqMVVzKk6gzqaNEtRbVJIIgiliJ8sRxwBhZCiOkhlQc0dYZZEwJ1sjWNVo69A8SsivaHLgi0wMQRww3pHMWDUG0UiKAooCRaGEUgSutB1pbFI32J3LNRAkmbElGYyWihcrc22ACnpGH0yLHQFjLPMPgOUBJZ6MEDEB0JrLhSOqIR4WRDTCIrI9a77+5vr/SlvHAZBeFzvftGYisG4IehRX9/fdqRAgZvp+SyUqhTWKjvbF+QusQXXvczJ5nuuCUY3zv8Mii1oxLDzvPyPSQ+rjGuzX8vwGpYu1gzC6w3mEAfYxjVp3VQZQBmZZ1YRR23nxuKH/7nd5dH4RU4UNKPZtTikyDmtj467QMprRkU1o6YpeOiGbb4Fap8pRjgLRu06Q+U10dzs8dk2/j547NQHfKxToyk2TfUJZIEkpIlHn5TscwJOY7CFR91kfJAWhGAXxKoVLsjV57Vdei7gGdeF2iUaURU7OKIoOD9pIO7CVUdCrL9PzeIBh4hx3Ry0Iv0dO90ROauHAVA8PVJUoKlRzPojajTdDcRZSoTF5nYZ9a5kTBYhMzWUGa79EjRYHp3+b7iLHXmCiOoiaymHyOmuoKPQxDcgelKonOcKWqxqOO4mQilVEuLqG8RJEwni+pDNb5LjqoY/FE23ZtS15HcblqX0cWM1tL/bfmuYTAeJZIgXKGBvIQBeFWL2uHTcGp/AiiUR3kjVmwRKPIHRhKcQblh5ub6xft6kp/b7uFMWIlRDGNfI07IwK0GMxGkIWzYmq9VuwtnDp8T9coIt5HXvI7SsCGAtH/r1lyUJjCiwg950AqXkugYzZxGmQxexZwj23YWywDQRCkBR5Fk1862RZ9/ZcGj04n/X7PqgLT8Fph5tZWYZ71ddGx35Ld59xlL5MUopaSfslgj2c9L3OVJAsJxX7FLnh9J/Hn4uOJ3ixvLTfuR4mOxURYc2+YAUMLVouwvxkuO9Smgnox0HKlKS6jVoAha0/GEk4JaaWF9GRyNqHnFZ7oXZHLA6qM8L5VyA6DjiCapKEbsuTjCRX77fd2Nd8b5SWW+xQSnmWYRmTcO9oO89ewDxV+QFoT2MEEdTpZznrz1H0on7q/3lFvI9M9ZBZC0qkrxQSESb0zVT+Z0qNNHlGFMA6LKJy91OMeU3TUuYLNRKQYwWWCLQ71GuGHOQJknmkCZl+Xqllsku0hbNqfx3YVcpqC232Auy2rMxLY3Xn8OivlNC7tTOHZxGyQ7McY6uLCxU9vaxl4ca9zVS+598NGF5GpvDqOGJ1IRqvhCy9LCfZUauGx0W1UxBY2AluFnsplOCLxdByMFn4Qj2PNTLhfk5lfuaIHfQ2fmLkxp6GS3+U4sSHMAQqsPTusfbmign6UJPwOdDoRZXHGruRMS6bI9ulhxODMZqoskaoh6kHgyQd3cBEoHils6vOmBzUCQio4J1M/U6awAFPrep5cjinT8xkudc+0a93zBVzsnke72j3LsfEKCQ8pPm4H/kRvFr7mGBa6OYfZYhOj3iHKrx3xCFGnxfw8Ef+KeCNCc+nAOy8U1C9hT/PiPX65Cw95EE2RMRxUUmSorz1ADmL98Qr9bWU8RWrAMcbMc9hsPWHvgebvrxTSMbSzpir0hKUP9E84EO5zyC7flff2lWW5xEHQBDU1gkjFdu+XnSBRddbnGzNDyukigagNOlYz+fGCen6E5vcEDSXSS0VdIwwmE4k9N2lsLpZ8keguwpOKxgy2O5t+z1wwmXsvJHcEXsqu35kWo1GC5hQ9yrh8ZuVgVMQjvzUdkBh3cgMAm3Co4vV73HFjvxgvWexu8UVBneaA6ZjwdoLy9vGkhxNKj76uHHYeWHizwag3tw2Ou6Vww6ePb5xWYy7DYbSLIenaVNf25iU6er55p6El0SKCTHbnxFxNUefatbY0b4bxnO1XfUDpQ26nQH+fGBt680FHsb2D6Jba9opmHw/SdU395bI5JqSi3PzzH93qAQ8PWngAe3HRmVEjuVbHq3x6WsvQPO3YtmhlXPa6cScntQLEp3e9OFgkmhHd1NB6KZTe66dziRlGOb4GONJrizAO+7UAmReAQw7tLtlmw/41rgxOulUn0sbw8HWwzFxMbJi9CQoHsvlNeTsVXP/vx59/SW5+uX6V2CtBH4d6UQR9zQuv4YHiAaaHL8f1pm4ex/TqL/G8+nuaXvEvx3Wg6bBJMPX0J140YOpo+M78n4KKGiioj5g+bPZw/PU9hqmYU6Fvpju3QRHr3j2Ywfj/W0+owZAX9/XvN27+PBc7g+p2bwpMD24tGH0NwNrpLO5OyICQm7/i9uQMIPSUFWsHdDvdNcA4x/w6vPL44Hw8HsS9OxC/GIxuQXoitUlw5TLfaj7Z0TNy51yRGAkyAxr8AVBLAwQUAAAACAAUlzpSAAAAAAIAAAAAAAAALAAAAHVybGxpYjMvY29udHJpYi9fc2VjdXJldHJhbnNwb3J0L19faW5pdF9fLnB5AwBQSwMEFAAAAAgAJ5c6UihbhZTuEAAA5UQAACwAAAB1cmxsaWIzL2NvbnRyaWIvX3NlY3VyZXRyYW5zcG9ydC9iaW5kaW5ncy5wecUba2/iSPI7v6KP02pAxxDIazKjy+mIMRO0BBAmkx2tVsiYJvhibJ8feeyvv6put93tBzizu7rRaAZ317urqqtfzWazsdzZIdl7m9ihJA5pSKzozYf/Io+sbXdDTPKy86BvHbvWjnhbsoUfke25ITGh24IfkelGIdkG3r5hUCsO6DIw3dD3gqhLljtKHj3TITsaUGIzun7gPdsbSiLoc7yXjw59pg4ZzMfQWUohpMQEbBqG1I1s03HeGK6WYFZI1MHPBgC+fQBkP6BR9EYeAy9kQrx4wRN5saNdt8FtYHkbJqBJ1iYQCDZ2SDfkmQYhkEbFkSUD2nox8LFd8mA7Drnx3M2HkHihFbz5oIBjrwMzeOuSgUuo6wV7Lw7Jhq4jJO69AE3gvrP3QCYga8f83XYfgTaaJjBthzXHYZeMvACENyMSUDP03A6HYQKEOy92NmRNmbJgyoBTZQ3P7GvtRTuyfiNx4IBAZx9CkMuiLloSZIcOIe+H8EujQeCP5vlvgf24i0jLapPTXv/iI/xzmSlJ/vkCP//9sobfXZdG/+J4cxrs7ZAZCeTDYV6jmWEE6KYDXkEpGs/amcEj7aCUpvtGfDArWnUdmbaLBjAZLQtk4KYGUqG3jV5w3FFiMww9yzaBJtl4VrwHRzBxzMnWdsBbWzg4TSPBaLY7jBww21DwPRgq7BfdbNi9GC0bRoHNfKcDQJYTb1AW0e3Ye5tz4dSABDMQ8x+IlQ6Tt4PRY2/xf8pU9OO1Y4e7DgEPAvLrOILGEBvZAHDRQKcTGOiQgnGBig06JC4mpGTuy8IFDRwlJuO+u/P2CMsopVqBybZx4AJr7g0bD0zIOP+HWhG2IPmt50DMoZrgOxubxU3iARir5hociOnFfcH1IhCbi4KD4mejnXSFOwhIdD1uQIqRwVWUVAtQDBaWEL4EA5vFa07lbiLHrU6M2Wj5MFjoZGyQ+WL2bTzUh6Q5MOC72SEP4+Xt7H5JAGIxmC6/k9mIDKbfyc/j6bBD9F/mC90wyGzByI3v5pOxDu3jqTa5H46nX8kN4E5nSzIZ342XQHg5Y0wTcmPdQIJ3+kK7hc/BzXgyXn7n4zYaL6dIezRbkAGZDxbLsXY/GSzI/H4xnxk6iDEE0tPxdLQATvqdPl12gTO0Ef0bfBDjdjCZIDtGb3APmixQVqLN5t8X46+3S3I7mwx1aLzRQcLBzUTn7EBBbTIY33XIcHA3+KozrBlQ4noiKJeUPNzq2Ix8B/BXW45nU1RJm02XC/jsgMaLZYr+MDb0DhksxgaIzNVczIANmhiwZowQ4E51TgnNr44SgOD3vaGrMg31wQRoGkhARug2mjD34JRBVqttHEHKX62IvUfPAB8MPQeiZsW/G42k3XfMCLLjnuMl81TS1+I5bDiZ8HHSRvdTbfl9rvPP+Ww8XeoL/mGt1p7npL/fIip+Y5Za+eLLdqOzU/HheO6j+B3av9NVJL5iBS6WAZ89e4P02rLI3TiCNJ/IvYU5dpVMGQ0OlaTsrm9aT+YjwIf2qwCHGSKkKzbVNuxtapFu+BZGdN9qk79dk+bQDCDAm1+YEAyDjBm6HgRe0GrOXJhA96Y1MzBnhLGPfXTTbDcaYrq7zkgD4AqaW+1fe7+JfjDN1gOgKPYd2tqbfgts0BGTZTf0HTtqNbvNdruNYipY/yStfq9DrtqyfBA5TDbWhH+4kCDhL6Tf616xBOTSFxqwSiCVuYNZiPwUdn8KmynuT6QlcwS5O4oIv/Z/azNgULixoVsoQszNyto4Tss195B4QWUv7PdW/cuVb0a7RFLw2AkAYoWAfoaTKAffQqbDhLqGAcM0++R6Ly5BTAKmBPH7l/9Ad2eTSPD2JRX07+TGfiRGHLDCiFo717ZYddPvQ70VkRdWknEKZBNTkcMTLInOmkZQt1CUwjHX1KE4Y3LEbgqWH4l/XfOh6F+2M5nwDxP9Om+GFIQ6IS1FkJ2ZmbIt88aRQkAVVRl/VEUzY5x4cMADynqZLh8kF/6QUoCiDqY8Nh4tpN1Bg61oELje9TKIEwHoq0X9SDDJ+GfR1FICBCfCRA3wLRhf2+FTKjpKE/yL6dYhU8+l6EOsZrWhuryWXIn7jOiCSat5YrAoPZlw0iejAMhgHRqeCLDuVrSlTU3IHpoX0BFWnbzmKbJRAZo8/xxiqCJIbAuUUMEbyJfURMY8dza00djd0FfWgAkPGgyoddxH3YUKFd3wOs2M0Dc0wT2v04SYQqttgyAw39Smuzgy1w4t6Rnyug2HSGnnfqQ0LSHrFlvGQy4jEz9pW0AyuBaTRYu3tVEyqJksM/ICDpBSaswMAypEKPCvxXzRSNTNk8K2dqp4vpe3toUR8t2ssZ2zRx5I7msrFirIkvakHDXIOzeQv8IqK/9Mj8N8M52YlkJhiGgUqr4tZLgoZ2cB1UYo/TWigWs6sPzZw+JHciOpcwxenY5q1j3e4PowejtAHjGTWH/Ff0eO+RjmyeRgQPW5iQECzBWtABb6oGiw3UqWxmQeeJFneY7CxZhotg+LJSO2I5rv8WDt9Bod0AJSW1jdzyi4lI2KcNhMuwQ3jJ2oxISsd+YjatE0mS4Grt8LUic8C2SNiUHZmoETlvsajXRGTHOgMgRdWDfySu+a/Jpm7jTGOlJTGlpZo7BOwbHaB2GEf0lQVb5TSuegB6lEJQcqksrSQYL02yFL4XKWm16kpUYBXArCrzTieVAxcZFDKUrGS2TTIi8RjnUZFeHrcAED1mWggNahLamuBRT+fbCjHXqewkidHzqZcx60ZY5gJk4hVR6WC5bqBYkKJA5LIkjIJklUKOEN0GySvYOYhvUJjzqFvXC/TpoqS/iXk5FFSOO52rUyI0r6VKWMZIZXwk81U3kwZ7NKdRQelKdOYIo8wCmUq6AuUHmLvPrkLWLRKVqS4u0QiKStlI8qtc3J+h71hrA2yamnMq3mlqDW4Tb/WTP6p++eQJSK6YeyscK4UlJjsqDmZhS7FvPzZKeilYVNfgrPAqkjTfh8G6LdFkQfQApaoJqqcYh8RhS3Q9olXMSCWdUYZ/ZoPEOmoTqochnTkVXuKKLmTagQPD7UDHxOaZDL/Tn2aeCkmzelfBNCNdlWZZwc78xrSnm+L0/kUQZxtPOgy6YHzZ/lPpENjskiE64rVupSRzxB8b1yQTJS7/CBobeHNDGFMutP8gWJYB0xbk13E+7MpwPsi6wypDosMIjep1xJKBeFYGTr8Gdx+xcIwOnWkUBzvPBdBuYIdUhDbTiN92tclCXbi3yNdjC0aihXTbemVAflyaoZRbDi3K4sOUvWP6kG5ZNbuSQ1w1N3cWvir5Ff3Y8vDeYc+3c5Q7nof9ATfkygv9KK7/GCHzQnffQidoTLEetEVU7ccovm6b5bHrGr8S05v/hBwwoyh0xXzbRW8oNFE05MbJemlv2yvaIS46nk6hTWDBICauBaUB5I9UKYL+kF20MF0EF6f0wcPD5CkcJymSqqoKMUawulP5tOXKgMZRGKQyS25AojladZW4qvSk2nebEbVQlUwbOMgrxGZ8cAtbgPIgZ7yE8YQC1BBLF37JqAu7PlahImVctCZStHDn5567OTywrSxmdV7KvMJbnlwC2dO5W90yOltQJ7uNhXydYts9WkdWcfE0gglNfYRWo/KIf5+mfKYb5WyqGc3+bIDCbzqSB1ZDmmZsSjtEqkQZzkXHMQJdeMcsebfydpuUY8PE63+Wn06T9SEN8MyzaJ//9bfMoWifRVvnLI4NLPkslOOlVRoy4PKp3YSF9FisoJjtpQuUOY8FcaKre8UmCpoTw9ppDiqwpMOvcpNhaQCqdxhTYVRToPrYjfJ1RdOhqZgwf6u8AMcw7Rtd1Ver4tU+iQZjWNZrJNVcGSHZYkdv8RdjK+YNXgoZY7oo/sPf0b68qdtGujBcVLj7kThGR/5reDKPkjizRuShAg7+fWyceZcJyMC95vqGBQfuRyjMXx05cCCh8haV+9JBkdnb6LG+f5+wrytF1bhgOZrIIGVjH81zwKcqbLji8L0h2US6WZySSUrilQlUVLTlXLzMnqsT9kX0kUWQl236QcD7fwS85L8udx2Z6UUmIeIld5ElaKBJJPqPsY7XJiKMeARzAriuoqrJu3iBZdqBZDgSobWVzTKMdLj0UOHU5VxZ56myY7PDnWV+JS5bdRyiHUuygH3a+gnzL68pnQUQOBeRnj/LgoB0vkWJosoVc/9fPrPH/yQJUMhnpt6KCBZZFkRUQVfFyT5G7T+xT604QW3GXZczexDqkw8H3qbsr8IkckX0wfJ1drrmZYmF0L6//8QuQIat0cJbCYjGXr/ozvsZxcSqpm5nqSHGNItyYUudztJG8p1H0qDaz+ilTkKrPIE6On8k5dLX5FCsc5Hr2pV5tzOaX3SFB5D/AHZFBpKUV3wVmSvKUkyWqvEpBpCJeCyvc15SrvSOIWCLnpI1mxt9Qle7vyqj6/zWq7Nr6bsdlTMf6IAC/rNywHFj7ARMMnby2PvfPJLquz/weEA3nJIyB8UGZaUYhXquX3dCa70xz6pkXZCzRVNUYqfVjXTTmwH0/5Wu9+ObqSrCWaW73X3lWv1+v3epnwYpn1F6ggSFcLnt8wu4Fs/zRzDRo80wBPwEGLXgYrNgJOoblfaD2D1lPeupwYorUPrefFVmz+VGxGylfJgtJQH0KSjQe5E+/QJ48fCCCSfveM0Gfq4v36CN/efcDnCUJhZgY7KvJBWfu9Qvud+ZrtGF2Tz58/Z8prjg2WTu59ZtrDEFNT3MVNbUUtvjkw1+8M+t+YuhblHNN+aeNh7D6Db28Yfkk3CGdRJk8/sQx7rvlo+vhqwoe5AOTChxZ+HPheSL/wh2ov4B05SuBjWzvYd8jLzrZ2CTEbH2cCFdw13nTLBBhSFzcLzsr67mFwqGVvbSbgeRnIgrI3mTjPs9aRaTswsAB+UQY+giLdyQFelgHOcLzFbfdP3LI0CNTtq4+fIeKkrgd8OHoDs9lT0nkmdbKT8s3XAAJoGwvsiwLA1Jt6kb194wD9ywLAYI3uydEvZcF+wR16DfexsjFHoE8yCfYqNen4LHWMXb7tlLCVtUKy+qtvBzSh2D/P9YLE31kRIXj2Zb3uXfZkZ+F57IwhgTiVIKZerlO2260XRnhJ5M4OweetHQc5l0HwlC296YEDy2FOz3Mw9yENNBPCxXGELmeyER4gQSGc7u/oHpzKGd7CJM0BL2STZDlM8/Y+XpxLyJ33JSj0zWAzA8it470kAJIvUesbDWCoR/wFDPRffrrqXUn9U0+cmEWQ4nGu/3h6cXp5JoHgphnYn80mvP9M8kno575QSuc03V5jW6uQ+2w8GyQPlO9o+zY+udrhFz4zjQMIZl7oWQkCf2di4qPXJP9DagVACxLFLor88MvJyQafkXs+Hkn7YKuu5e1PlFfGJ2Eyl5z0Ly56MPwfw9BZcRYrJtMKz+Yo35aHjLrSteGtjv8agxU+l1wNdGN1enG5+qrdrYzbwdnVOSa8V613quWQFkdRznqH+fRPrwQS4As+N4f4lKOMqvlotwP4e9pbzWeT7/2z3oWCqg0+V3E7hniVItYxRq/3eVSNUKIVIOjHR0m70XKjdH5slIooV7X5JBi9QU0mCXz//LCtEuhM9cubWggJ9Fl+DEvcLMcCtD475mZFlE+1+QhDVXpXOXz/7LCPFA31qRaCMFRGvoa/DsuBy31Vq6ZcEPrsAOUi8HHKAvLiKNkEUsoXFRpBvPcVmBITAcxpgY4GMFc5ShelUCrMeeN/UEsDBBQAAAAIACeXOlJ+KdZ8WBEAAFQ2AAAtAAAAdXJsbGliMy9jb250cmliL19zZWN1cmV0cmFuc3BvcnQvbG93X2xldmVsLnB51Rttb9u4+bt/Bc/FofLNFdKXHYoA2ZCm6V2wtinidMXQKwRapmNdZFFHSnG9Yf99zwspkbLdpt2+LEAbiSIfPu9vZMbj8ei13jwq1Z0qxUqVtTJWLLURzUqJmcpbo66NrGytTSPmRbUoqhubjkbXK2WVkEaJd9tmpSuxbKu8KXRlYaVs6EulG7EojMqbciuMKmWjFqLRBHpV3KzcrqfvLuxo3ro1KlfWSrPFiTeqwclrfN5oc5sK2HYriiov2wXsLjYrXSoxh61XQi9F6SkZnWmjXum2WkjESawBJiAu5FzjPtUCRtYaNlnLSt6otaoagi1yXeXKABFFBTsXVqz1oi3VCFGT5VrbRsBcoAkoYmCN2SJkwFDe6aIDXCp5a2mn2ui7Atk2kjU816YAPtCX1qplWwoJuNlGwsYhc5Rx7Mn1QqWjMQiqWLMUpFU/P/NvebOtlfVvRaNMo3XZDejuySj/ZG3ZPTamzRv/1qh1vSyA3NHS6LVIvbyF+3726gwE3ExFzN4pK0rRbEejB8BGYJtRN20pjVCfa4O8BxnAKBBMCnBj5Fy8O38jYL0UyEUQnqQRkOWiBHozeMnOzq+uZ9nVuTgBgGmu1zUgl4wE/MzHj/DnxfkvF28Fzrt4dXF2en1Oo79VSfrTXye/VfR2/vblzozxFCG+vLw+ff16NBmNRgu1FFm+zBCjDKnP5ttG2YT+bwxwYXJMG6Mg8PcvxZ2qAOl+wlTkRpFsgVEvibL576D8gphZkIYBE+Jv69Y2TJCCL1cK9AaZNN+SIuSyLJVJo42NalpTDUSQMtQzQoA5hD+DSbdnr07LUuey0ealWsq2BFmGBJSqCikmOBF3CrJxME/mUdPWJTCJfx1gUAnKjfJ1foLn9ryqUP91XpBzACq6HWKqg51t8U8FGoG4uo1HNOWB+ID+w6kYu45gnbhVW7bIO1m2ypLekZkrYeVaCW0Wntc09UQkzcejT+wNaabbDWc4GDTn8YE5wDAPaEda12C1V8DVn4aUTZKfcFEHod/om2DwMseZgyrTLfsOxenmOjKjAd6+HxogOP3CRkhVj9jf1PYMjOCFzG/t/Vf9HbcfrAv0GNQ7qbfZHH4fUFqnrOAAUXPQKUTWPSP7YF3BsMH2QsZ8f0POM1gGgmUPnuZZvpImqzvMvAbwrB3hMQ4suA9Fszrjge+UIe4S8JcdPa5hqOcVhCH4/f761XPPzkCzGMuOwYQT8xnWZNIYuU1K29zPQ+xl+sBNvGkbOS/VKULuxUAb3UMKtOBKFlahQ8B4mM5mr8+NASvGVEYWJeQ9A2ktkQ4QxFtdKRqByH8c6jx/3pET4chiclj3IvpWMeHPUfzqtGe+NWo5dBHOLhgDbw2Tfv2keyqWlK0xFcfRBgb5JN5QWkMsSsbvKySDch5GVbm054dxDxJdIqQja/SKIPsYaKfWzhpx4iSa0WME3+PF/w1WO4I7IAYnt9O6VtWC3EnCzJk6lGKQS9DZsrwPWKeTSQhFfc5V3YgXMH5Oj5gvSSvUcSigfcL5EniY3CPJ/Ao1fS/DyIKOxY92LH4UiZpOhmYOE4J8wBl4o7O2KjBRTcjxD+yclR9MTbznWd5fUmLU+1OXE6XiPdpsl2ejIinE2KGCqSh5X3r/ByYTBSb1lYZYC3H8j7YgN13qhmsRSuR9fYJ5KA1gOlmqz7GVE/qZtBnm8lkdeGdpGyZu6ofeXV68vT6/Sjr/zWsmLug6Gg967l9U41z2OzCATlADDKZf9sWBKwYNcVsCceikek2Zt8ulCkMNO2gnPf6aPD568izQF2XB89wH+9ib7aDP0KcCwd+HmJ4gRxR6AcZmn1+6nDllZu+d65rKsbNIxfxmkCwFrqATEKOYEuq7rMT9Y3Z2C/khXShS/XHbLB89H0cWwzO8xUAIg/Isq3RG+pzQ/1Nn/sDdLC9hygnuNjShlQLXTUHM2yLaEWazzcroDcWxDg4SAFOhZi34A/Gm0YEBRdBhOk85ORFHx4EO4E4jH/5oStYR72u+FB7OgO0kgDdYvN8opxmOPqKHoEDKXbcNu/09zmOwCa/5kouLZ3ta3C7ODAQGdbfviWjH457ADp12fDmbNbJprXN97G865sQC2jWw4YSTyNO6JJz0dTAzYRT63BT1g5wwF1i1WifwL+Oy+FAJSh8xg8Ll1LvAUhr85lpCgYdCtNxHKSp09sIFt24FpzPoKnPQFkidfKEOJlEsOOnFiQIy1KKKPeYDYAXsU2JRhurZF/EPLWR2wH/lm0Y4vScGmNS/pKCVpcxVMh//Zn6roDyHh2rsZAp1WcaknYiPvVejPkg6//mZM0CgNl+lN0a3dfJ4MqHAQWPIkaihkC6xs9GA1wuYS4A/eZlT88rvG9jEnjj6VgujMVeBqcWyyCnY2Vrl8KIWnohetN+aJX5Lhhhkh9+bGU5CFvRYf5kHX0y+dtNlFA1yl5oNKJ49rPZMoybRyd7uTAdif+7oFh/KHr+BgiFOQ//XS74vyLAhk+xsfZ+WjEc8WhwjcdgrurUHOfKt3Ji3Rblgojk/6yR6EJfd1LnTIibuG2iJMuQuO+6JiLo+S6PYC7GdzRXoGQ/0sXHezoEyTAgNxsg0hqQryDg3smoQ3EKzVwTudVFU5yB2eyw0Lt4A46ZBaRnAsivdAt8Qo/SQJceUMoPilk0/7iNEYclOuGKK48GVYld/bVpFOIsbihB9pwjTgdBNxa5cfQafhfX1QeWGrA9BXbxMoixnh6x+HqGJgdcDD+goFpjjN9vvpwUyHQfjXpRcuMn/QzKwZa4N9rVu1ZbCYzKg5DqqPvKuFupWijcyF341K9xGUSSGMOyPPsQGPArHEaOIDFla11Hu1rbU0AAdVo+aAiqhGjIMWLygPDHcEZv8Ph+0jbcRdBspGgETiVuv5B3ahOr3qKGQsDq/Ve7EhHkHDEFYwOO/uYkoIt+JQSMYNGGm7hQHc0kcwSx5AOEl2AaqaKQPkjusmLq4E6pwQ86HkfBm5Q9TOqo5laDzKDyh4XxHVw2stdieH6Q17ytwHk1bgbjK7TTciV08UA6VpiGO+/1kxycWjQO1VhK2YKGiG0a5rm8tYoar8BX0W1XKFPlASqm4gHpJycXUwdqohyCuG+0OnbqmZL+sJ5HFjmAqbHC7ragySB041k4/Y1OUJQrsOcSEagGVE8dn0Ad4BRFS/ujyLlQU0EFNztdBsxqAREthvtfCR7XRDenVKtAnpofIoCMIALhRDpy0t5QpPDuKgKYun8YRl0GcCG3TloeSZ0ds1h1ZJ12u+PhnVVGuGK7+ePz802RvFdcZ0NcgPD/+NEGM3ziNp8RZQFH7iKtalE4vl5PupC1d3y7wOXFu37MlI40iqvAp/R3knURAph15k9Rh1KE+6gOj3nTRzKlKxP2isapcptHeA6cZ2Jdzl5Yrpf3ThicJEUV8wuS5Opl2DJ6KV6BLimvFaZy6egj+OAr/3ymlGaeO9F/lHXkWQmYR0TxFQ/Q8qamcw+7z0vuLsFXvAkO/NBKBjwGllosMI4Tl3BQFk/RrkPADlRseSoMzwwXAGgBjMflkt2VQlTjjsv4I0RVwmA/QUZYr3Hri0kPOEnvskLXg3GVhADI13Skf8O13F0oLbKjBPBY1GAU5ET+JcvRBZzwse6BAcyVUB60f4zZOVwRRJ50+YHATuibdQC0Zm/l4gh3QZVh1bIizrhxYQskoF8ne4qKfda9T0j2Z2d60PMSANTkc6XPaYRftK1Vfb1j9kmHiAsp1QWfwMdY9NqDzlKLvlA1sUPD5lXMXiDlbB+p925CHBT+xf9UHbqCCPoJF+qhL6UNhyZIWunqIfQOj9gPYAICH1h+0sqYfXnZEa9x1g2Upb+x+qKDvYFdGrvEkGdNAdyUE7bleGfDV3Y4t2EK8SW+aFAADdwjGBckA8hENLa76QpcUynVCYK5oxO7RgR1XxYuDGuqBOO1aMq7heKcgTLj7IRS20RiIzkaZtVoUPp/h9UbhNQswOHcfg4Io3afpEgX1uTHSBV/vVZwjDAC5BKoaVFIU7FlkvtS6VaoWKw0lDigFnv8ed06DQXVMlSVa6hZySe5C/TA0jxxMYm+rmViCnWacEDM96iQUkJx8RoFDTL5RSQh2Epe7dCD1hZ2oXD1tLhBgtOGUN5nsgxYeEeDQ8H5Mf1Q/KJyL/fVc+LOnYsSEdc+BGSlp4IpTSQX4npmqLA4XYN+/ee/xd7feOR8DDEL23vNUK1aBr5fVvW8Ow3kSRrqQZZMooudlAdO4JcuVXe84fsI4Nbzx8hpWxdGQbprJ7VzxjRJ33lW16zlUUWA3iB9Ucb+yZWCnFAxWlgRNLx2+dHGtcxCuYqHjsooKIF/Vgn5NewP+pzIaW99r7bxfXMljteTcALiLtqCWIxkTVSPUJyD6Q4I4KeGgv68TfHnLzRALrqZRN64ofxCWGgaUD+/eQFIFMYd8E0aYtcwvZ1x+oPvDWl9sdQtYxAQ6UG0FfLM0gypUDhhqwQWYb3PHtRgnO1ihYEjyFQbTBsU0ZDjrgv0nsp4RSujs8bPEk0I6ZVxoZdkL8jXFotx6SMsl1jbF5WyCh15NfwADBK0o3FYWFK+P60sIX4pqe2IBFLtEkYOHF5iG1FOehCF7xQHcUxvSGrF8xiltrcsiBwfsEAK338hb1aWapIWkOdgSdzUCndsHV6IeiHOJtywrVyWimkSZSdQucIrXRRo0KLUgA3DQ8D7cBweLysgaIhWQ3ATEhLqxrx/SRZwHojbFHWIOS2MWXOK9SqCYUPMUd5oP1ScM5Xi6RpkKhc28adFZ0RKov5dBQdqFMgQ2lA4gvAIuQmUm58cONBfcEoi97BqGfSWP6KAk+rQ8tLZksyqA5YiStS0X8OBKdGswhVtOugqAK+VmkMmQEWHmsE+LXPsDdntog6s1DtwOFz8wruhYnBPd65H6woWwOBb+rsyDIQ6Rn3qkzSNSl4M+inpNDhIEgVqDLc2LEoCRz8JshfenC5aMl29meE3xlV3YmfFzqVNl1JrzFWScvwPN1xCQSLD5LrvCRhimUwUoV+Gdid+QOmoL3rer8Waz1zNqm4GPLjXg2qEFCSUYZn/9t5dBYNH3K7LcUkj1G0WnnmIOIYlilTt+w0e8TEj9BaSRHpAc+gJhmcrVA0c26CmyaEUcuCu1ycLgiu/+4O5rZXIHe5Bj9VkFpLCYVcSb7J7NdAlQMJ+QiFJujFXeLShMt8lJc0/zj1ZZd1fkGA8BOvfR95v/Cn4hgAY+Puor0A1ndIQU8mPz9uD6YwF3OtMTdZCr2wMd7biGxJ+9TRo/Pbg12DNs96yqF07I149HnwYdmhDBGIv47WDX5oDAXRoZg48m7zS5DGd+7OVNcYN5Z4j9FHObDa4RaIXBkY0TJJY3vhnsf754bNOpW63r5GgSKZlDztdMfJQmUaCd5yE/jHWUHXrPHgcazHxz7v/zhmF4HbD7K4WU8+qD+fjxQDrDg0XKxygUcWWCeSVyETdCU6bWA9QeajoANFe5dL1wX5uIOfDklp241yIMtXTQh07aOv+8/opy7Jx+BuKbCq6JghKYomkwZX+9hOyDWPhfcO+gEgNYLHyuX8+yd1eX15dnl6+zv59fzS4u385A3f7FST7Er7sn42ORHE3FEydhGnyKg0+n4sgPAqC7x27wcTSY+uEn8fATN/wUhv/tazAylqwpbdZWWCtUWS4zWWKtDO4a/6RkUH69wAWoDQBU0ETgbo7de2Qepo8MR5ydDi79KZOt5e9TfiAb28uMj27fT641Cq/gkbIlFJglrDn6fPSEviyUzU3Bt3x63GnG0yOasbbu+libN2kNNpOM//LixXg6ADo9AGrigWSlqtyfQsCbP8xEmjM0WmYXbfz4z8HHPXu/+JX+JGawdLrDm6nfdiL+hI9hXc3LR/8BUEsDBBQAAAAIACeXOlKsOYysUAAAAGwAAAAcAAAAdXJsbGliMy9wYWNrYWdlcy9fX2luaXRfXy5weUsrys9ViI9PKy0pLUqNj1fIzC3ILypRSEwqzs8pLUmNh/C5uNJA6vRg0sXFOfG5iSXJGfEZ+cUleYm5qVxc8fGJOTlAE2wVNJQw5ZV0NLkAUEsDBBQAAAAIACeXOlKyVRaTFR8AABh/AAAXAAAAdXJsbGliMy9wYWNrYWdlcy9zaXgucHnFPWtzGzeS3/krcHSlQnppni05qTtXlAot0TF39TpKjpPzqibDIShONJxh5iGJu7X//foBYDBPUpS3TuUyZ4DuRqPR3Wg8BnghjqP1JvZvl6noeX1x8PrN61fw33+L9zL8w135obiUqYyTKOy86LyAl3jlJ4kfhcJPxFLGcrYRt7EbpnI+EItYShEthLd041s5EGkk3HAj1oQvolnq+qEf3gpXeFAqkAPYdAmEkmiRPrixBPC5cJMk8nwXKIp55GUrGaZuiiUu/EAmopcupeheKYxun4qZSzcAesAu5upM8eCnyyhLRSyTNPY9pDIAIC/I5siHzg78la/KQHQSRwLkgHCWQD2Q24FYRXN/gb+SKrfOZoGfLAdi7iPxWZZCYoKJngwRC+ryn1EsEhkga0DDB+6pxjmHBIXlrFGwqRJVgikPy2hVrI2PPC2yOIRiJWHNIxAdlfqH9FJMQYRFFATRA1bQi8K5j/VK3lHzXUOuO4vuJVWJmz2MUuCY+cC2WOdNrLKSpRsEYiaV5KBokLNbqFWMPCQp6IHvBmIdxVRoubZDZuLjWFxdfLj+PJqOxeRKXE4vfpmcjE9Ed3QF792B+Dy5/njx6VoAxHR0fv2buPggRue/ib9Nzk8GYvzr5XR8dSUupkBscnZ5OhlD6uT8+PTTyeT8Z/EeMM8vrsXp5GxyDWSvL6hIRWwyvkJyZ+Pp8Ud4Hb2fnE6ufxsAqQ+T63Ok++FiKkbicjS9nhx/Oh1NxeWn6eXF1RhYOAHC55PzD1MoZ3w2Pr8eQrmQJsa/wIu4+jg6PcXCgNroE9RhilyK44vL36aTnz9ei48XpydjSHw/Bu5G70/HXBhU7fh0NDkbiJPR2ejnMWFdAB2sIQIyj+LzxzEmYpkj+Hd8Pbk4x8ocX5xfT+F1AHWdXhvkz5Or8UCMppMrFMuH6cUZVhMFCzgXRAYwz8dMB4VebBsAwfdPV2NDUpyMR6dA7QqRuaIafNjpdLvdT6kfgMaBTixAKR5ieCY9nEvQBBcsMUO1AK+yAdMLxQHp3SEgdjqLGBTecRZZmsXScYS/Qj0CfU2iAIzL4fdOR6UvstBLoyhIdIIPfqqQEIEqu2kU6/dkY7LSzVomnY7juBnwEUNpR6JbcXnih5lK+mlN/A6j+PbHLqDdQz5oOOO9Gb45GL6GGoA0PiVykQVUeYDZQM3dOJFCwYOvWCzAaaKZoIUMO5e/HQAJ4GyoSfrhIvry+kYcHYkDyD5szj7E7Le1+e8ObsSPR6J3OBBv+yCyhQDQdx0Bf+iswluHJAC4PXgf9CnHBy9+K+M8CxJUlheAV84z8EHlpPIxpQzkI40pbeaHbrzRqbNNirLGjLPRr1eT/x0rllfuY+L/Q3ZkkMh63mZuIjmtjUURROFtM5/c2MNjzLqGxyrfWeijhtbwjjXighfE8jpwU2jb1RB8XZwm2IH0un+49263zzXAvxfir6zdbvDgbhLsQxJxeACk02RooHJZQB16vTfihx/E4Zu+eCXeMIe5WJjoJP0WvHMErnkWSPT1SxccOUowWvRIBOI/jvT75cZJ8NFJ+3mRJB3xay+i7sLiGP/mcgHWF0hQ6h70WYtSNv7FEkwzFIrVjslP400RGKj0fu31+yZRPnpynYoL0NIF9E3jOI7iIsoLkNArkFAhcauMqnJiWt+/3YnW94clWnMZiF/BkEkY7nzuQATSQ08zwFhEiQS81WheDk4w1mGfhHaNDg1BMWHoIBVyFfCribMjciCoyALZC92VzKlP2Elx3kCJHf0odqacKtwF+ChKgEZNgXJqCnU0cYfpdqy2I7sjCskXzLwBflgtnFP3H5sTmXhxUT9YLyBwS5ViDITFLf5h4hDToIb407HwbmWOBmTBGNcWJsRlWZCinSEJB16j4F72+hZpEG9KHA3ycgYKsU9mEd5Hd2BgjpNgWcNmrcT4BwIc+OeiLYrsNoBwDgI36DqEex/58wT7JyVpBLuFgBX8V4lKLFfRvQGao8j8NfQzw5I9BZp10AB2TI5ViYpxjFIVRtZYxxqwLalRU7IMTPudQVg3P2N1ytuyvRGhTQKI20P5cHQehYU2zaDz7Fk0mfP+0FAp1sHuYaw0oIzyRuJVd4KZSmPsZJIQ6CjmyYcWM7cAoRqW1mk9KrkxJbeS6Wkq/ZLaYuMZYeGLRUnhtijuvRtkmK8I9RxtzESpot95KQNG7Ze5ptSisarG5u6NX6h/29luqY0tUlvamOtqnJl6VZqtM2wpzv242plgJbFz/tJVGBDwwyMWBc83Jbi/ACA+sX/BsArfcADCxa9QQx1Xm05yU5YbkWGmIFbNZsQuuIsERn7BXAB6HPsUnfpsYRWSyOtN0cyMqT7N0lAJyNr4AVOwGLI9Tjev9aZoyt3bGrHkVot0lOW1WyVC1VHnxmkiD0C6zs1Amg+CqmEE/6q+oAZTF1WthiatYHd2MXW13l4hA9Ek1TK/Wx2Z8T6NrkxDKiPQXmhlmfmQPZHxKFf+4xmAXbrpkuMPaQUCOjKh35FYASD0SelSDdIwEon0gC3xH4doQwmN7SDmxbkBFXMMmRL1w1wuIAUSwyjslS/Hl4evD8TCD+dAEtGDyIVHGGan2mJnOHmxgsIxDCZqGIWbAeXwO55ECgLoV/2Ehp9qbETzEQx3aCrUZLRQCyVWpyXcKUEVYe7C6CFU2ehF/vkvqzQMLq1mo+mlgXgJg8cAKSVWgej1dDp6PgNTo6uFMr/krP5FdIdd+F/jwgASS7QYwkitwJAGrfagTyspLwPbtb6MAWlT2fOBedn1rhZbFIDFXZljJFwOS7dVthI/Ntc+r6uGVTHd3+SmJpqLXT+Rgq2MsntdsghWdojlQV3CKBVYiDZ2W6RWqIIoT68JzZR6MLhGi3ChYkimtq7WcOGJlSyErOxCVcRgCT+vkdXmfuKHOJfoyR4ZhRWFlgalTBb+rwvBqt6cAB2Wsglhcputq6syk5JYCpbjJ87a9e7c25YW0K4T/6ZMI40zUHufZ0gRfK6bmgYoiuQwH2V/BjAp1SwteOBlRHPAIE1wiHGME8DJWnqCnXZCbtEgK/d4OHwrgEuJnvbtd9bA12ZQVXLpJiY2bWg1itzQciFys5QSQXFCpVUe07Jlsmz+zPwY1xJ8W7AoEtNRyLnNbAt3qOfyHjAy6A02bHWJbXbNXgLJJVEWeyqGp+ogvQR9kZuYNOg/HdMHHtX3ojq4tTpbUulJKleJHX9bHS0mknFj/wVGSkGpblrTb2nhU4iK7K3c+A7ZU3JD7urCWUIuRbJd74pm2iYXGJAXXvwI/zcp/UEt/sIPoLYEr2di8WWWQToYNGXkMOqpnlauJwy2cMGWK5SLLyVI+5XINXDth+ss5SGI4pRHJDbbsfvgGDh+aKQGhYY15MC5NOGs3HW70BQA/jSQAG30HuYIFCX5/5ya5Y/t6LN6/Pxp1oIfZamSDwRnK4jAiAIEfus48mTSWPnYDW/lFvE/GiB+2KYz3J0pd1BDm+018GddNVB6S30FZVAphN+qNeCiMq+OtlmVaKpwsgzko/NnFqWEvvZh8E6iwnR84KwGbNsqSxbagPEpkfGJ71HT2M9eFASSJisbWUXwUwihNap+3hGV+dPI+dsO6I9fTy26//C3mJcCwJ9tmgUwDs60SxZEizcqQdqvFb1S8zgFrux618F6Ubjwb9e4uETu9JjeL/m9HmG9iaVqgPXGwec6uPls5dyG7DTgGX/hZ4hJdeDOPFutNk66jKVLrqL8XgSoI7FM0zX0pdGdL/9wY2YQX9BA4QWzh3n2FgoJCwMfS8hJA+oqcHA9LlW4mEDvG4hkTMrQgDQSydvi4/XZ6aV5I/R1c8Mw84EPJWiOCzXnnDpMuXL9wFn5EFvgQhmiUNLwbHI2fl9IQaAhAW0hBJ3NbYnSpJhEpBhsC61VBgoMNU+L9M6qyUQzB6+hm9ugVUAYhQ1lQCTXVEwBqdEWrVJwpbBI/bqQQlQJqI4QtsPH6+vLKxnfs0JUU6ihE36to3H886SIUEnYRuGKouciTl3aNjrepe/dcadqPa75qQ7hz0xmBPM/9FAHEst1rDQeH2thksi7k2mS807vV82MWh7I8kUtXii9o9gNwa7VYwuYM/fdICJvemKeVN5Q5bWh41amnMQHeKuSsWDaSCVejB3qXKvplXrXSqrJFeBaCZJe5NyxnlT5K8C1EUx9Cmyu+UejY2orVnpH4OpHY8FrGxb0i7QNKeGGLLxqGnliawuHc6ahHkzrhq0KBBwEUewto0j5//TuGFOO7RTNhwXZTnK1wp1ceQscU0q1TQqQrdK9K6pgevcsJVxEoVK2D+ZJEYgaei+NuoLRAXQms0hpxxm/v48K2mJBtVerrL3p3d76m8UB+CXu2AFRD+NphpMmuIclCIXBvX0bSYmzD60kNYQmye/NJNuItea1cBlHsyjNw5rSq2LMTq2j9bgK4rVnBTicoBw+v7QFOQo/KXVbv56dTi+P845LEcq7rhvcgzefiwc/nEcPCU2N+QvfE2YlorSlB3dUdQH68KDL81TVmRNcjCwwB+AqpnbUY/+m07FXKStE1EYnvSycTwTx8q/a35CvEhfnQ3mFuH5C1MxDDe3FBcbocpvjJLIppd/B3S684mTxUV1TxXmtclqnw0s8R8W5rIqadfuder4oVzPW7Vvrq7SawgsrkOXYNrbPZBmtHOglqaLF4jRap1DA7rNlFOBPaQuGsobtXsAeyEOQn+6Pzsz+mTwHN9gHGWBgXBS7t3si/xH54Z6oNvxTcRMU9564WfickrNw77LNJJFx47ujOesgS56Om4V7FqoQ9ys2H9xpMmnk0LbRFlIDUeC2jNg2ewd0ZIiz90+vJzUmDGrizZ64qTGdp2JmhY73Sai0eWiPRk3A/6Kxr1Tf/WT9RwKhTIPI2xsdINzVXo6O0O22ejp2jJv4/Putxn9T7PRbu5RiBNDa39XEBHmf3YpZ34u38tVp6KmVdFq75S2hsRJxty5qruZoA+9sjwooLP5qUQEH2YWogJJ2jwo+TU/Hxcj9oDWIt1BxImZf3GMYZIGJXkfR1VIvbtaau6FSr7D1td1NYQl3L4UlzFaFredrL4VVGtOksEU5d2vUo05hdc52hY0lOKQk/Woqq+gVlVYl7q62gBetZVivebqIxiVPGJsEgYMEZIPybiGBSx3z5xDAVXBs0AMAr9X7LfgAdaBp7IN/K9N1HD36DQHLFuypyt6n5hcktBMft380uY4tJNDxnMiFC0MRchwf3XAe7NkQSGsq58TOc+nwKs4lrx/vWTfAftw8hxGarH9mRS7BITxE8fzs9qvQ+OynS9VeU+kGq71ojmZJGrteCvXzvVGWLp9bya9CiJrrq1DS9Tvxcc31a1Tw61CiGn49pp6Lf/UcAjhj/Cz85/F/7HpL+Uwan0LayPlcMZLffJ6nAqhYwpu836sHAigvkG6YrffBhrC13Ps+oRnd0Ns8iwL2nRsYt+OW0b3waTxDC+mBv2dHyjTu5J/3u9GoD6CbIq/dQmiFvVcQrXBbw+gm7vYKpE0k2xhKlyReDKZ1Zl04neftElAn6yj8ilPDmmA5pObU3WNqkKPelVGjz6qMBmUEXC+IErmEEGhfAvgh+HNwm0PpHL3JCBpktasVMPqeZsDIW+yggcE9DUFrYIslFEVeNgWVW28LJnMHY8gX476ePVgLfEWTyDN2t4opImHgkG+Q2mFdsUnRWjjYUddyCvupW45fq3GsObvwi627j/LZLd6sf9VF2m5jI9dqYSF/qyLWfZOqNfA4lm4qhVvRNPoIIlm7nj4qRCZyNcNPp/ALCf0BQw61+y54BCLm80/mUMbWNwN1M5PqFAYM7XbEU3NHhKf6sB0xTVepcNnmd0bW3oWx87balUDB1ohIywe86mOJL10zG242K5iOGx+13ypa+E1nHz1v1u0ufoRSSCD1RP6Z9j2vNRfPbnBDPC5mhd/P5GqoPyupXZxHEOUciJwqg84C4I6kdIjDlHK4GDraplpQ4bssfV5AodT826gthwRUPvFC38WlYTN6qeN8efIXasXCet0QpJV5S6I7EN/EXfGNoFoP+igP+6tjBz9QcnA3PJ6Q49CT43StPNQqzsMnzONMgsToJ4sl56sXg84Q+EEOZ8NTMW/OsyMJ5+u3IsxtEM3cQIGoF4TIvxorVsFf0WNdDSALH5sqYL/X1cC8NFWhkNBQB/sdO2mjD+78HneOOLg9HQ9Dou+eH9OOav5zaD3V/sbuyyg9P62av58OkU4PGx4fgG4Zz2bDc4PAndFHy/qxjQUNg18gV8t2w00PGx6nnZ0uRgR32BsZTacvZu/48+KQjv8hOpC/iiP+DkvrqikRnWMWzqIsnDv6GJeeSqhyoDIY3aMezWFc9WHekTp16IxesQu0KsfwujTGUKfMeEFSLQ2zGH2StyLHbEpfn1eNoVLuCos1DNY2SLmuOSz9l58S0X+GFBoK4cMTEEO1BrW7FlT1rCMsmzS35pAjq6SePmABYXUn2GnUZXNYEEHUtcIAO4WfZcpH9KlEgccP0je46mCnjW4TA4KdBWos9d5UeUMStUCdcUZf8wMIfW9oHFffxlLuqhmDq4gYugDLjdWi2a6tjMnerQUNAEo4ltNrxtNAJdzcFzajKpha+0endSc3SQ+/wn9591Dn8YDQfEhABNEvYtMmi+34CqyOgk+b6LYRYKg6fJy42o7PUDb+vS8fsFq28FhpUL8BqYu5XQuaK9EMz/k2BnHdjEDZAF9yZ9tbheQR543ytDZhbLtJntQijG41yJPag7Gt5ti1NTTEk1rEwDyhVQwI4hgXpwUOHm2qO2Rh4guIDflcMqoD+bY5H73qxpsh7ge16TBLWyipum2j5XPM3EqqB1zpI5ZgTOjH7WRJUKaVdqL9hbm9aSTfqfU/s15Nl5cMeZ9ar4vbkMJXb+zhWVaLwfl4ouESowT4n+ugzmZJ4wyCBk4K0wPcK8fHHELy8Ip+et0f33f7Qxw8q7ICjYeviHIAuLbWoOSVp32tD2qcy0faiWfDAQyCGqlqAHy22fQjZlF/4oog0VC/UdZ7RNU56sWwC/j46OBRT3F6DP1pOv4zcwOMlMtpHFCrzeCFUzTf3IgfjsQba4c1407pIIGpvJWPOUErcd2tYJRgCerMTb2l3qlYPKxix4J2Kqdb9qn1mqaPyPocxXduzBEIHuubuuHcDSDGEjNQiASCq+UWFVSnafaSYSzXgevJXtz9+9+7A4E/8NCn7ZoE48jEc9dSa7XRWn4oaykm5bVQatib1bAQxXNI//L6xnbIRiN7s2wxEH4DWrb44ms8W0fNl924PQ2POe6ZL37xc8j1ANH7thYbfS3rcq67OrGo2y16S/MClt4+TSV3Ukfj/GYUsiKzIiBvF8Cr5RwzysfvzAr5avKlVAV1FshLN75NuEPEJ9UGpWOqGLQihX6vjF0oy6ru3oVZNLaV9rxyGkuwJ1Hko/Qc6xBBns/Rn4njxBsA2F1CLGnippeuVR83EOmsfKpSZaoIiuTjChuPMNOnGaZr63wdGxXGSbjdQqKPwKOb+fyidFZzhizNLDESnlCT4/XSWZG4BWrSF36Ih7kU6Wr26PwWOyOd6dRO2QuSbHs8eQTNgkODxFEn8TlB5KmX4pk1Y0DKUsnnWeMh6Pls9NA+lMZfaIr1Ml3E6vgw6HJwWpbee2+K1dcUjhh8uNDjl3ILMLvNrafyczrwXiaDvSZl5/ODwRbShqxi1JpZlF4PxIG/giVMqzYMpsXLvkLDOz1bzjvpckGPWVcKsJ1afclVQjeYsrpK949naB/xGdoH/XdtnGLZDs7x9lTh+OxwkFnDKx5rZgDqZVun+lYaTyjnROqrWjCLvLbUsLW1/fHfUNmvx3XBfHdgoyzHTmcNfWza6lAJosuTSn3UCoViGskwwBkVD15wF3jdQigfXiXpJpCMkc/8YHRlDi18S4cWHgy/K7iRxRp4ZcLDdbSmI5ZwQQUbL0nnUZYWzk0D8Hploo4oP2QL2ceT+WVv7qZuv9IZoOu2vjlEoIHIj2KvORgcQXgYwSQLAC/EhA85Q+7xVDEcPdG4Bs915yepo0Y+zNFPh2WmepVCLRYXYPdIvV8BoiMoy3VRZdVDL9ZDzZzuxyr9So0IaA0ssXQLeeKVscQoVKUKC43Xehyqod3la0y6TQ2AP3rIaNVjoCgUGQAASwty9XhwQ5y99NUM3gc8QstkJrKsk5BSqR86GLm2xVdRMqtRADRvk6oESvxcx1mxMciflXSWSCaFM5v1H7sEnEBWq1rI6SpLUjxZFFnF20xcdRVB1zpOMJyXai7pYIBKzSWp3E41B9CvXXMiuWPNkdMdag6FcLXr+iiLnB+Co/XnOPGDW5UFoGR8sitecIPer9cvkkXe7UqWoiRkJ76lQKtSelWYANMmzF0Eqv9msXTvbEabmQT/HvihdYtEr/v3sFu0NN7UYEGIbtsxlTlJJFVLCSjUGFtV3dhcCatGRavwrOSKgbwfgobwB7otZAitGrspSTypdh9+jSKTnwFminLhZKCSJ3MSsNEWlf1AccqhKtrhjvVIdclP6KLt/hXcdmv/ugiyZFnujjEN4MlF5qDMUHVwZ8mIqXF30+wswEMTIC2ymmG3CowHvMmArRB7VFpNVZdP9OuF9zqX3tu+Fcw8xO466VmN4K7Xcj4wCTBo9W9DOT/KJ0E+T0eXl+OpM7q6mvx8jnchXeXw2XqO93fVgH+6PBldjxVoaVWOi4Wes6RTi8LsC/OqWTSsDXShfcAvosPgVIHTHiH1XBMiiUXeC6oUxZMZP2rxJFWe1PQADWrxgGxaiOzhEygBhU/55hCzCQrT1ZIlRT6uMKgmFFT3VsR8Nqq+vSLCMew6cEO6f+QdRVgz/HRC+HPpolKB1125d1gKncGmaBn6ZNbo9QN5D6M/vLdNLZmri7zUhWi0FYsm8hI8zRtXEc3Rsi+oWNfDI1YtzimPqeWSSPO7CXSL4+rqg+P0vCDRx+Tj6bZ0nBmkzPt1gSyR5G0nwgDmDfcTlcbrGKXC1lAPFzeS1BfYXNrQxrVKVsVay8ZDXSVTb7DTVOKEIF4rRCngMXr9gfjnvwoblQoaQ0+WupAo59KLeMkBW47Wz9Vtes36UzBxNK7i0noU+7cwaKLgEnLMDoohnhFo38MSRLwsq+HZXzoOZdDpvxoU/Q5B7xr9IXBTyKLL/UIPN0W7xulpKh4Yoq2r+FJz/r7hGZ22wehXhcBeXcugEttV4B4gSojlogYUqqiPTyZVA2CcwVSXXJQqauh+KYLdmEbJE8v+KVcbhmSogcIjJcVXU0RRY3PvRlNiIW2z4huwesnADNKOulm6ePVfXT2OONLjEEtDI4mHJb98mbx8qXfVWVdpqWOsP1hjXi2DV+J3FRf9Ll79qIaDdLL171DK7zkUviEEJ5fpHb6rQtq0aBrfosbvRM/K0i63pKKD/LqwlkW6+uEWBelFYpZg6lZiGMuOCiuhNhoWeH88RhXvIcLLyr79JvkWN+Tx5pV+v9ioODTfr0WTl6Yt/n9asUQgbzj0h5VCrBYsjwnB7ZpmLDZCZcboiaJWBeJlfqUJhwbVQZ+2i97g/X9VivX6wzRZKA0088U+WzdS2g31DOVAYze13F1JzEtNm5usf6uGPMUs2yVbY+VtLuPr2jhfTukc6BGqk1+Q0rsrRhL0O7JCCYrvgAiM9/AONU3BIbVz0G/AM0dTCQxg8X4KM2tJxD7ZaYd4lZq+v2IJfOsLX3Dn8JpWRYs3f+qoBSR3G6iFFey1BoonyCoyYekxiQVXH+nCl/U62Ogb2Uzl+EJcKyi1Gh+stTAn31UFddlxlDeV1k1+/IITy9xclbCj+1NLswjPDbGUmSTGfdDR6qReF9j/JgEYz80SqSUbfqvbS0um1x+iUmh2S4EC/uWBiQbK2/nIpBGxCiQL/0gE7mo2d+m+hXf61gVDBVjQO1XYdxT8DZGi61GPIzy8L5XqJkM8Qc7c66BuRFWjHV5ig8EOb5jEiQl9W7S6JgMdzxovxMjWOkl92EREKCK3wGFIHtn3alS+GlHjK973cDm+FHgVEaoWPr/97g1hEDIhmS8S8FYIvlFDHH7/vfhpKukUwvmIRqZYMxyLq7U7EJSOnMGyMRasxsk6b2juTXIS6cbekhbu+GZlzbTiTfyEZohKMf/FjX3akvpCqE8QwBLBQsFJ19zbhJG3H9InN3IjWNHWcQT4q2SoWsINgdYSI8WQonsgRMNR/naMv23I705RN0nLUF0rI+dD0bsCRVjTWJl0GO/WRtIUwkcrCaBuAo3f17MWyCi1D0tETUCZizYKs1AF+MI1rB9lLL9NTAkBjPjwQiiZJO/EKGSxdLXL7urbqklQrDMrvCHbIgjmuoA68bCLNsmgjKAUYBBc1gPZNdgnmWveGfRRV72l9O6wJhY9U1ylXaxmsdpPUwSvGQR0/6tFDDJljLem4+Y0LSlyr+bWYdsTKq9XdFzUsWjkvnEmdDZm3d0mRadFkYr+tIdvyMrtxEBW7p0Nik3+xS+O8/LJWNralasB3tnNq4cDHEKTrOz7yMjHlCQr8JPaYadQ4JBUe94znyX1O/8HUEsDBBQAAAAIACeXOlIAAAAAAgAAAAAAAAAmAAAAdXJsbGliMy9wYWNrYWdlcy9iYWNrcG9ydHMvX19pbml0X18ucHkDAFBLAwQUAAAACAAnlzpS3rhjs0gCAACJBQAAJgAAAHVybGxpYjMvcGFja2FnZXMvYmFja3BvcnRzL21ha2VmaWxlLnB5dZRda9swFIbv9SsOGoV4S8zGGIxSX6wsgcBYSz8W2E2ixMerVlsKkjwvlO23T5+O17i+aCOd9zzn6NWxX8Hs9Qx2suTixzm0ppp9dDuEUkq2bPe4l8rovGGPWPEayd+Th5DLJAPzgHB9MA9SwHvYbLTcPaLpkzcbaNAGS6ikglYjdNw8ABM2w1a32cyQjgkHkrBTyAwCA1rZfAoBBnL7E3cm9/3xxpUFLkmlZJMUcffWr5ZXhJASK0hnWaduJgTso7GuptDIEguq6BS2bVWhst0UX6XAKaAI1qSlUlLpuBDY1VygX5Hs3PNcW+5/8gRkNWqEbzhZlX/I/0vmFQhpbG9m4jrL4KKAJ98e7dyfLf0TqrlHMW6d/MbqFueuuwnl4hereelPBWcKJlLUB1BT6Oz5gNW17LDMKJyBx0+zzMM6xY27hsJVAS58vo/YmyhjRPURsHfouoxpXsi0RnvmpLeKYXTLBVMHR9k+47POE22kNyAyhucMoje+iySL/HFZRxPeotM8TMKVR13WT0HeT8ZaYaUd4F2q0k8FcA3uuo/1jqECZiMJF/B2XMxl/nm++HT/5W59eb9YzG/Wt8vv81NAUQwJcTSClcft8UFoRcBgCdpYQxsNTattNkYAzY6+oWmVcLY8uwH7fpanNgdwOMZlLHKzumZcTSzC2zt4mUIZrMfudZRkRRhJJxA9cD8O3HDKXmKurOYFpvP7maHRjiD0uwZ/m0C8s7+WVyvF9nsLDJLjlyJ9JPrvQ9an53HKBy+Wr+Ji5B9QSwMEFAAAAAgAJ5c6UvyUc6ZWAQAA9QIAAC8AAAB1cmxsaWIzL3BhY2thZ2VzL3NzbF9tYXRjaF9ob3N0bmFtZS9fX2luaXRfXy5weY1SzW7CMAy+9yk+lQMgVb0gLmi7bNqkXbZHqELjQrQ2rhIX1rdfmjKgIKT5FMX292PbNC07ge99kojrNwlCzPDVOTRKyn2xZy9WNYSqs6UYtjAesif44VN5rPL13GfwjCOBbd3jqKxA+ARlRoah5SFiBSNzDyWoSfmhODx3zDqPICEfBOYHcj6UF8ZWjCcsVhnWy1HxEE4ZT/iIdG/OsVuk76qut6r8DmpwIKvZkUbJmtJlEvsqxw28r/9UvpITU5lSCUWI7EZzQj8ltXLNMgo4z240/RJIIyBX0fnZaiRUaPvWoGHd1XTuiqntqdHnQVVxM7CTyMXAIH1LG5idDZ7OEEPcWZhkp4iX3DK+Hrm7HMXVFNt+Kj0vgr6aGrKixrX+b6Z3bpIZPllgiTTpDNtOoLnsBmBjdzgOxxFurXV8MJrypCjCmosCz1ikt2RphnRKF1b/C1BLAwQUAAAACAAnlzpSPoRL1rEIAAAvFgAANgAAAHVybGxpYjMvcGFja2FnZXMvc3NsX21hdGNoX2hvc3RuYW1lL19pbXBsZW1lbnRhdGlvbi5wea1YbW/bOBL+7l8xUFBETh2laW67PeOyQNCmuwG6SbZp94rr9gxaomI2MiWQdB3fr99nSL3QSfqyd5cCqSKSM8/MPPNCJUnydiFpKVy+mC1q67RYynRM5UrnTtWaSlMv6XLjFng+yvBvQtJaqZ0SFa0XUtPKKn1NV1evsyRJRqMdOq+dnNLbhbJUqkoS/l/pQhpy0HR59YoqlUttJQnrX+V1wb+W0gZt/K7xGiHMuqJS84yIFs4104ODos5tFpaz2lwfHB204rKFW1ajkVo2tXFkZPdkN5ZRqUYUhQF2WkDvXAL5XOQ3vEUW5Gp6mj17TEpDdaOg76wk5Ri70taJqsImuADYGNTGOrmcwHTJm3B4IXQBU88uT1olV9J8luak8g61lDp2xxqagQKiFNsWrNg/yn4YUw3JZq0gsNbVhoqaXp5fhbjAvcDj/Qkc9driaAfdZtZWs+3wMZ68RoT0yj/PJQNlnV0gn2Y/ZiNnNtMR/Eqtn3oHjeRtLhtHZ/79qTG1aTf2LjxGkLUcjWYzGGnBk9kM7xJYkj3JDsGCUV4J7HshjVOlyoWTXk76u6hW4XEcZDbYhu2FLGlWaMv4gzlpoSfUmTSBJ25na1UVuTCFPT5sT4Nxv7YuIpHntSn4CTa/efWCnh0+/WFCVgYiP8v+lh2N/KmWSa6uK5sp6UpPJKbPgSlzPrbTntoPp1pVLWDH9n/4GFxSkq4dFTrg4R8j3cpoeiUqK4O+HboMLPP0DlE/2rcb7cTttN1RydItYe2E9oxcCuUT5hiCM9tUyqVmN9sdtwCMRzAsJVkSljohWPW7PjwJKGOJYeFw+jFg632Kpe54ltcr7dJkrxULI4dtP22HYrB7h86sBeN2Dn/8+/MnUxKfa1VQITUqhaW6RCTMZ6QqzTcAVIaysayRqIMEhzxCAsheHzUAXRpxvUTJQRackF0hsTYsTyIv55WyC1lEIpoa9WBDYlmHqsT0riQfFxxRS3ZRrzkbXJsbIjpspLC1hlQUpEUNsNkQVsHJeY/Q/brnCCgF9+hN5C9kXT4c8lnNjJ5SQo+hrzEg+riXMu4YYxsJkKuGCyNMoVxA+/qgHiTH/HsgHC0NwRKUDGlQ04+P+3zq3nXavpAu+HM1Vyh1dJi1O7lb5JWCO+nql4t3r1/S+cVbEg6bGu9Rn7wkqEGhwC72dMHtolSIJJyxXqh8MerCHUU6XwgjcoddMLkx8DbqHVViLqtQHQM7+AwTdd8T3S9nnSsG/qMY7SUxN//JrWp3b5cruugZxVxUzsqqnDAhPHavViP32SKuxK7iojiI6unYv+OakImmkbpIkw//zj4+bjNHVhGqDHxF7q2VW6TJrd7fT1D2zRCT+8uxAd8M0VEW7f6fwhTJQYc38ktxgivlci59Q2PYiC4CdLLfxiyW8657WfIWBYVG+3wUlfoPjhc1VyifGQ+71chM2lw0Mu3cOe5cbGXsp4uukU58uPuQ6j6UmCkMag8GmQyNdb1e732vxgz5WolcouT+sZdMyMcaVbLPI/RH76xQcLnAdWSxINi1RrWjrfLgz5V1qHGcHn2pnn4DFB/oFGMHyjfWOHMwcjG+E19fkj+yJPtUK52ylHF49S9Ax+azn88v3py+OLk6HY+iioGNWejAHTPHXYN29WylFc9raT3/1NITDFfWD0k69+8n7OAx7Cx4UMq6CUHpsqZ/UHo0iXiN7UAeCUVUNJ7huuNE2FwpYJVcae1xwnHLXbKFFkc6dP140g4QqgmjA5uBxWFkOL0Ff/vZijl5dkntWWmz4NMu30jeosvmyvmpTFq9i3YvS6U5khjIrmsD6i99EHnI84fTLkcPMWk9pX1KLlaOFV3ldSOTcbY1UoC0CC73qqXYeA4Jcug3FaPTcl2xMuSs4Fz/BMkYK89h2q6NgLeSXir4+xo+lGHaWDXwmhTLaTS95YKNaEfW+QZdCXvaCQ/R6Ddmqpm1j2kc++BYZAMHpEnHWwFhEcedz9vQ3LlecD8cZrshLr9Lo8oNl3lHe7xpj1KkRCFZa8EehiC+NQRVeDXf+LNw3VWd30iXXUuHxmn4MHD12c85udcp3MtCdJ8+P3zuWdqFOpixqrhcIFHLmqdtWUxojuDFFPHL3Hcxc2JSDthiBYFCd4cFLph+jPBXiRIBXiEN6UIjrhBkUSMYaHf3irxqWZu/CGwRp+3+bG3U+P2gMgzad0aU0NUARtfxYDK5EyTwThbcCZPt48xS633NMvgvvmrIW+c7AEnlO/WdQy9O37ydXVy+Pbs4P3nN5/yLN6e/vTt7c/py2ByI1F9M/h+M5p+WjN9D7Z6UbXMJN6HBmTGwcyaAjohBaTSsjR9Q7y9Nkdx3Qes9yV82+Rfx2ZeCQvL1mz0+OIGp4MQNWBKJ6pyBtxa8HyiMMXhVFX4ArirypRaFG/Ml38W1VXxbwEgEoZE07t29PqV9wfPWfoexJw4okEl/xdxfxY2MNFZqboQBe5swOvQyuAcNuKzXPd3i4AO4PLat6YF/fPr4N+11NLrtWdh/7LOGC02abJdjdKquFnI5uJGbCX1m5rCncHQaw8Wqn1JxH0i2AWCxA9ta4ovUnduxF3yviG4Z4ivH1uvOom6a8ELGkTMiYKB1+y3jq/iYdAPGuy04Qjl04P8eZH/bDjtiDvHA24aDYfmPKCj9KFRF+Ezl/CTrEVNxfsUBw6iBWhMJ4ThthbRf44BiqbvNbYU/xH3btgcIsJrfN3+H3r9/f//LBXem0Av8bQZ3wZzLNL0I5WUL2SBqucLe9mNPdm89Cm2oUp6y9yG1e/8y3b4S0e7n65GtpE67HWP6iQ7vtrRv3L37zvXoXv/p5rZw6Wl7FKaxRzahR5QOX5l4pg/j8lI0Kd/OJz3q8Ti+pvPv9nYXw4Z7v417C+o2tkfmDqJO9IcnHx+88HyXa0B5uNzUuFXzN4gh/hRoHTGecAGs0PjX0k9AK13E7flPUEsDBBQAAAAIACeXOlLmipma2AEAAIMEAAAYAAAAdXJsbGliMy91dGlsL19faW5pdF9fLnB5bZPBbtswDIbvfgohu2yA0TfoIcs8NGiQGHZ62IlQbLoRYlsaJSfr20+ORUdp6pP4/RQl/aQb0p0AaAY3EAII1RlNTsiD1e3gEKY4Sb6J35rEQVani6Taikp3Rjp1UK1yH6kwpM+qxrDdCneUTgwWa+G0OKA4IuFT0oyHPVW677FySvd8mrJwg1CTNgbrkE34d0DrOLV8Xefwki1/ZUV6DfLlz00WSJmKTp4QjihrJDtXsEb3FqPTGgNVq210iKMP1osxCIK17ezJ90T4b7nJt5AXu/1utduU6ZW9LEsot+spWJeQ/9nl2bYsNzMps9Vbke2L5bbMd8V+4lwF9lzIb1np3uE/N8XSWiQHjerfkQypPnD/JN2eEapR9Q7Zezze+uwN8G5OwgguJA1YXZ3QF/kR3udUh3qY3d1PYSqqgQh7B6MeUgdqOe2N2lS8o4Ojtj7ZSLIIwwit8fPg70vWhW0Xqeby4xoaTf7Ksk5v4YWUwyQBkG3rZ/A5WL0Ivi6mRyxiZyP2yVtWbl4yif1mdt9OptcR4CCYwqF/PC8f28NK7B+zL6c8EuehZMYOczz7zCAedmYPo/FZiIaDpahrM7qfGMZ3HXyA1z7O/t/+1Bjd/a+LcRL/A1BLAwQUAAAACAAnlzpSjUlFJZ0HAAAuEwAAGgAAAHVybGxpYjMvdXRpbC9jb25uZWN0aW9uLnB5nVjbbiM3En3XVxRkBG4ZSntmMnEWAubBmXgSYye2EcvZhyBoUd2UxJgiOyRbmv77reKlWy1pdrHrB8vipa6nThW9MnoLRbFqXGN4UYDY1to4YEurZeN4Eb6PRnHd6vKV49cVXWuMlGL5Xc6/lLx2Qiubrn/WJaOFJ2YsvzNGm3glz0utnBHLdLJgdc3VWihecLUTRqt0sGblK1vzTqYVX+LWngmXVh/0v1g7x1/CfdLm2ZvnFU6BjhUrbQrDWTUajSq+AmELNEDxkqwrKqNRe5XR0mQGcAFPkjm8sv3W1rwUK1GOAH/G47H//I1jlNDLuWk4iBW4DYdeHAqHKBGYqsBudCMrWOIZqS2v8pEXMquZYVt/b+YX/GIpmbWzxca5Oi+l4Mrlv8znTx876QvQy7/wzyjlQTs+A3QZ6miyBSleOdzW9Z2P5xTNQ4v2Qkpgcs9aC8bbD4vFJyYtXyzAaS9Mcud9SaJgg/bLgW+Gly3apdbgDFMWfUATZQt4HBqbD8JEIIEPsOaOOWd8dKcwptXxFLzqiT+HEfRH0Uq/ej4Ds96lLlzREX/rWNSDVkFSHzv0nzDQxkRAZptyA8zCsgWKOKJ4kh8LpyT7NWfaPlEXJyAgyWwpMd77jUCxG244bDmjanCXqINzlXBxrGMA0Yw8wKyJLdeN+/AmfxPCFMrr60j/P8M2Gl3AnBCyalSH31LXAgPk6yzUel63IJSHx1PrNnjsXf4DWIcIYaZCGRg8w0wLjlss0kY4nsNtVaEUpzECFgt3rRjRCynQCkGzCKILHVhjkaOYR8WBVZWgFSZhqyvygiXD3IY52OORnRZYU0JVHosa7p92N2C52XFjUUwlbKnxb1SPVv/08Jzq1LbW8S1Umlt16RDhOx7uJveZFK7NPUuUmA7kvh7+mQ8hmme4tdOAipimGKXi58+PP95+Ln66+3T78nlezO9/vXt8mU9jQTSm5EW8/4EQOu0qpY9D3JjMUjVFBJObV/HylaeWmEjvlxcxJAe8t+MKSaTknXs5wFlxGYN337qmxnJfLLKNti6YRuw6WSwm/1kfwBPylk8F7gU/mPQCrmKErsATHnfcBDKykW3iPkLiULBQhK0ygHbJEdOYdIepQ9kh4zEtqPt+BUofKEKc2KbGcuYVsV+QsZZ6iYDCvLJGuk4rWuEFBtcQLsgFMwrWLKIzR/6Kl+KdRaAai4SHbO7VXw1TG0wgLxxsG6wHJH8GIbp6BSG8IbReFrHnge/oHCGbmIlF0CTQpVBs2WuKdg/PwF23Ckg+Kbq8BOoM1CDfYGFKaf2Nx2dSgdb7b9G5nrv9H72JSOFReaJY2ssxPcbZvXCbbPzHeNJTo1f+IR0yosb9P8eRw4zBLcJ30HIBLx1qdkwik3rKYVLqPa+KNRPFim2FbLNJYh8aHPgX7x51FrRMqJWm3mWjyIZiLwnh+w3HK4a83WvzCmQtVft7zwjYy7Sp7DTUf/cNI7bUbpNHaXMCtBFIoIieE0boWXPQWy25kEQGScEPCuYZ50anHcbHD0tXVzwbi0qx8aANvChBW4H5j5kdZ6TcMGF5QeHMum36OZ3JsmZ8+Y29nIJkSy6BSqylKDiNYdVqPYZvvDWTachckhStJvAams8U9BWT8nIA9WkMwTQde378+M/ief7b3e2vB/Bhq3DAtTX20tpop6dQMoUhR/bAPYYxRH3dhThmDEwbRPLgUNQcPrIzqqJP6eeCihs3dqIiLqGSjjUq+Q5jFRk7VWXChVrnAzEFXiyGJB+7/HDxSDu1rEhTyCdKJ+Vf6zJDl5Pbuac4LyaLn5NjNUP6+ooc4qRseHJyEuQ8xiCzbLiZoIlnei8jmKNbnNBIrMeHFgTW4KdGh0mPAuOnvfNm+2Evm5zdHJARiiRNZyX6aqLtcDR8PTQ7Gx+yUccCKpaTFNZhAYfXx9fhkHAwSwYlgKWB9qjS+wrEg1SB8fxsUB2EAPrEzewKfyU7zjFRN3SczIQVpwkuzHOeTU8IOfTZPgw0CtMUHGSnEen2U/Hy8Px09zHMc10DognDS/DTQc2Nf4IwT9WWM4Mz9Spyc2Bsmkg8mSee7ZpXx7W9yvuHu3kK6i+3z8X90+83fZTOXAg2jg6gGw6lHG6YLUS9u/EM14ft7OMwDp3IYrGxq+hBqKL8+MnUcVlSgmtxWqfVC5rpIQz13SRLEw91a3IsumF9iFjpGsx0S8IwnH832rE4bEVpqtkusUvqVXfPj9neXO6nHCIq+IsmGUwEiiJK8qmlMQ3fLCn5F6FDUktniSkV5/iItFa2qaU+c+7fW3Z2fb3GltwskTW21/H/CN2nsLbh9vrt+/c3KXOn/ybI8SnfL1p0eKm/ZJOTlngQPpH8zFN4D991XchTDbuYyDK+e/aM3kfbWkishTRR3KT45wei7p3PjqcTmr5oMhkiglJyeBu4ojckTpVzfSCooql5S9lO758wVRKWsBqP4XTozX8Pc91IeX3z9u2ZW8tmbfHhR27n2qxDRm6+/8d37374H1vtsBBvzvQN313iuPBmMjxwUAbdc5x+Yvu4S/94GhpS45NkkPEjVjxsDBElSREWeSIJ1NnX+ng2e4s0/m9QSwMEFAAAAAgAFJc6UjdKrp1cAgAARAYAABUAAAB1cmxsaWIzL3V0aWwvcHJveHkucHl9VE2PmzAQvfMrRvSwICEuva3EKWq3larsajc9IweGYInYdGySzb/v2BBwvpYLMJ6P997MuCG9h9yYrgS57zVZqAiFxXKgrpPb72WllcVPmwGh0d0BywrJloT/zGJy4QckI7WKoqjGBjhKYWXZ4FwHyZ5la21f2oEPuiQCfnrSnydXqFhrhdn0z6GN3E2mGo2VSvhEpmpxj/4gSp99hjiO/fsd7UDKwIYGBNmAbTGAAGcIIBT82mzeYPW6Xv9YbdiP9LBrvb+vnkc+33MvSOzh7/ufBeRY0T3OrJswKIh5c5aV53BBaAn3HjBaB/LcoHFt6LXu9kKJHVLen8KkxtIdKZaUG4Yy2s7AAu8cEpkjOPm5Z+6VAdoqvVDwG/xu4IhPhKC0hcFItQMxMsjYBEdxAqv5ANk8dnHkzXLPGoE04PqzICPfGfgpOoPRVMm3IABoQCGPz7lNU3YGkDEiEB2XNtBoOgqq55q3ckBRQOzoxV+X/xh6P+ic8ZzVkT1K23poH56P9ONST5YQ7QwhmcvMAuRXUEw8+7hk4UA8PMhZ43IB5j797hgfkX5N7pWbT0dpZt1uGzaFuV05b+u48iMIt8zT0o8Eg+3OINj+Svi7wEyrOv2WtaRri7Di7tq+oEJeAKc0K9yIobOjEq4mTCCc0hwLrTDqycIWUTmng6yxhu3JTbtPxkQpv0gfMIHiwb229DCgWdy52JLgO83mqFmP4uZ+TOavyT+9HRy3a2cdLwYiOHCKPj5jbS8OWSZhLSUB+QziTou6nCQeq8Xp9TgFEfmtf5JG4fQEztF/UEsDBBQAAAAIACeXOlJOA/af/AAAAPIBAAAVAAAAdXJsbGliMy91dGlsL3F1ZXVlLnB5bVDNSsQwEL7nKQb20gUJWry4sFdPKyh7EE+lNJNlMM2knUbFpzdJu7SogUD4/gn1gccJOnYOu4nYi1J25B60Dm333l5QgGaN0NdvSidM9/yxioaIEZUim+X6+a0+KEhnBy+ZALoK0YDlMYkMAlqbugXYw9MZXskb/hQNZ8x6Sa5dXT/okrO0zGGtQBN9FDRNzyY6bGY8tXke2gM83t/eKaU614rAiSwXviobdXnv53kGLTTkaaoEnb2BZsHzyYguFjhu/0kbTGi1V2vCIPSNS4RDf0x3EzTiFEefiWrN3NpDvPbThP2/E3QbAnpTFcHGesHZ+rdu4w0c0twfUEsDBBQAAAAIACeXOlKSZK9U6gUAABsQAAAXAAAAdXJsbGliMy91dGlsL3JlcXVlc3QucHmlV+tv00gQ/+6/YmSEkojEgA6hU6QiWghHdRWtruW+nJCzsSfNUns37K6bBsT/fjPrt5vCPaKqyXrnPb95eG10DnG8LlxhMI5B5lttHIiV1VnhMC7PQbBmupWw+PJFTbN6+QJVolOsbqMI7xLcOqmVrWk+KoM7qVKxyvBEp/uFMdrU5FuR3IhrtJGVd43QKUjl8BpN7PZbtEHwCC6EtSDoD25FViDspNtIBcvlBkWKxi6X4DTYG7klYsylc1Jdg9U5wvurqwuoyMBtBHlmEESaYgqicDoXTiYiy/YRsV5tELTK9vcZbLFl65iJTsvlccKOzhbsPulaLqfEvly+19bRbxAqpdNHi2Z2fI2KnkXB5e+nF/H7xfHbxR9wBOHr1687T+gUeoqL45OzRfXwkugoUl9RWXTjv0JRKsVKaTiFcEMK+btgVYJVhZ8mQXD85s3i4ipefHhz/vb0w2+s7/qr3E5TXGfCYRg4s58HQJ866ka7THKM40KRsDTOdVpkGFcX8AiU/iLm8O7Fs+dBmWY49bw+o6WwLeUpwMxieRxa8YTMmK5MGATxu+PTs8Xbq8XZGdmmV58xcWOyOyADIRc3GFcZGHtBN4jbWGTyFo8+aIVT/7CMRlxHo3PDwYh9MDoPCboyiSnlm87DrdF3+/jgVSotYzZORLKp1U5Kv8Iw9N+XG3I/KZyFtTZA+tAIjzyDXwq0roZRFHjy+VYYkXecKaXx53RNcLkyBXrwpKmFUaKVoqhQLc09y8yzjCqZfZGDULRy3wgFK4I7rLTOUKgpZNK6KZC51hkijRrSWj84I5RllFguqlEXN6OW/IzkUB1mGfnt4LOWimpjtYdE57loyS69lpKQDGFkMcgo7reSSrDvRpu3+VCAwa1BSzd8cBsvqQI87HUBO6HILVskGxLfMIfbvdtoNStMlsnVL0+fRS/DnsY2852Y6YxYLDIFFzxrUiLHOaN7p01ahc4nfcS82sivosyUF0idLRo18pjiYNaG4PuvJng5s/9hSA/qPwYlU8wIms7obE4tYeafDFC5uBP5NsP5PGhkvXr1ql/XnZJmFdNu0YYnwuVCPX0ePQsnjYhvnZIYzWHUKYopjFo88F0rYPT9YRuGHYQN6eob9FsW3KuG771uUM+MI/hWXsj1w4VJd9JKZZ1QCQ4NmXJ6Jy0xf3xrrQ+Y/YSfq3wgYEDDI2EaRly4Q/ZJR4/Fn0kZNPmGugrH/an1iZgGYoI6Xoc6QCOoO+NIRkvbsB9qrQ17ix7PHrb4CRsBh4qxdaRbYaWME19lITxpd6HxatxKmUyiFP3TsHDr2a8E51rVw9XfKDxQ2A+r7aVpNR6Kb5P6sEkP9IE2gt3qLy2pO0AVQoO0Raqao5rntLzEa0lyt9pKdmK8okVwCnQcDFTqOAJqKgJ4MyemkOtbBJbCQ8mvZVuCrisnzTlNBLOTltrIDkc0aoRzmNOGQrSGnKWG2ZHLTbNcdxlDUc8CToy2rFppBzz12ziUi2zMxnc8CJqCpEFIek11FzrMMlrNWMbksMBmCas/rPoImD9i7nGnEsuNa3x67tetKZxf+h+DIucVllSlcr1Gw9PSj3G/bfsNBmjT1Tsu3MJP90S4ZDOQIGAtKM60wJY2LIGbnYHdBhWb7CewrqLhZ7E3+IAjnS2vBw+6raBxP6T8P76PjONuQr1iJuSjgASNE1I1CS5NuTAyF0bSMu+XDk56vZYZTCXBgvY23tPJKCNxsKSx9Da07yges0zeYLWqlgCs3gksARxv+uyETDanlXBRg4/fU4icv8lkBnQfgN5/T3E0BBQ/rQHVNKyGvIMw71ZnPNQxHbxZTX6AxEZuw/yvsWgEFeTh979+s/LuHytAvgKdJIWhDJV4K5m7O7XPe5nNMotPOYH7KOzJ7JRl7QBHqIPITl3/U0PDj4pvO13FN6ReY2kN7hsU9uxPC7++iYedqB3oDuDS0D/5FfiQdY2jecF6CKxr4ETXWef0W0etGSSt7rSFP7ZRCI89zYE0T4K/AVBLAwQUAAAACAAnlzpSNijVtGAFAAC2DQAAGAAAAHVybGxpYjMvdXRpbC9yZXNwb25zZS5wea1WTW/jNhC9+1cQ3kNswFGC5rJ1ERTpbrbJIdugmy4KFIVDSyOLjUR6Scpeo+h/7xuSkmUnyKJAdbElcj745s0bltY0YrEoW99aWiyEatbGeiGXztStp0V8H41K3keNVHVG1hrrup13be3VWlp/qzfSKqn9Z2Vq6ZXR76mk3M/EJ4/ln0yrC2l3H43/wH/jYnKcZfQ1pzUb9Y5vSBZk76V1Sq+uOWa3dy3zJ7kilzn1NWvMhnqbyvv1Iq8VaRzBhddaLUejUUGlUG5R8qpxVEzM8q/pfCTwjMfj8PuuovzJiW1FviIrpFipDWlRqppOa/VEAibIGG5E9JGNgt0ch5cNr0Z//DxU9NzQG5FzjKwPG/54u9sbvolpiEflUqLTR3iyDjAqLXLpSNzvfGX0hSgMOX3ihSMvHuPux2zg6ecbcetcS+LN99+97b9bQqU155TtY4TVWAJx5b1VS9Q+YL5PbS2deyXjjZICwAlTlipXst6f/zSdfyt32UtpxCT+hxRUGTPo6yRFbrSXSqOepUFNtQm1fV6aSvqBuxV5hwxrAtyFMBp5VbJ1TE8xoWyViZuHh/tfya3BV5q+eKpyzRl8NJr+28msVKjxZ1m3cc9k/JuWy5qYPgV5sg2O07M0Rkl8HE8T0+GMrF9UoYMW69hCk/jqjmh/FfYOeF/XIu0UldyQWBK6wLV5Ts6VbV3vBDtk+rP59VdvZQ570jnaGvkBsaQQoV25IpYcVALUECmXLkJqoV80vG6NRfsB4chvcXHYX9zLWWztjNG/QzoQgc7TPOmFY5w2ZFW56+wDok60toYWXAyUJnsuMfuK3O6TTceRFk3N0nXUwG/Q7ijCVgG5EgIpHOilPY4EQm4p1Jabl5HYWgOHT0oXCQ3ZcE2zzpERjQQtC1q2q1WILZ3iqhQF2AsWQc9y5YdCgiCgNWigtPNS59QVetbp3xCv6f6EkWkPu3VHNHhHM6B+nV2ymYkVAvx9/k82ztBGjfQTD6ueUNNpBKIIku7EJTeQBNP3mYzT2ngWWiIKDnaBnLvayOJFm8F6bxcMWx0puCiklzDtuwxYDIzmhy3dx2JlyH0rmctxpDXxoN2Bs8HuHwZOtnQCDhhmqwpUd4xWKm0iOVJQ/sSFmkjRdNNRpBC9t1S2rhEwnPq9k0GRojgMMOrymiQsBv4GFEibZmKy3HkCmM7b6ZHbl5BMdh2YqWpDIBM3AoiYLg2TVPLhgxaKpSl2YW0DXFm3hvBVUJIjBRDEQzasdJ4Dvo504YZhw3YR0kSHh6yTwLnJNHZgrAD32sCwIyUUZV+MLt3Ql/xF5W0t7XB6fiKah5Tc/OxspXzVLrPcNGdJRvpfxSPWnb09Px8NrQ13vlppA8IwO0pT12bLB38B09PXrkjDjfzw3SKvpWpAPcdmwDzaYcKCdwDUDnWqC/HNi9pxoKuOs304AL+kA1ZjlIHGGA9LfoUI0qFI8rOXhT8O+Be/H3ziIR0/c2GS4THNj9TuGaeLdO2cvALq7NtwTA8c79/+HB11h0DSB310LLHPx8wkmV6m39mhg8uDt+n+/trxduFNIP+k+/D6XTbK0xfwNAzhQbtWYEwY8FLcXF+9P027YvFupC5q9Aibf2lVGM+luFqvrzVmE70+n7vbUR9rj0q/1N2I+5ubVXCMGqBNUia9UctXsRNO8oSv9iAhzmYGszgS98Pt73fXc/EOwxINWBj4hTI401BltpjRsAFlZbjNcJi1VRvpqRefRXT7Y3AX/4O43RmytNwxYEDDuMC3dD+dcyb3IBNPy1OHqapwKZ4zdBSgO74wdoEuxcXo2eeshZmFyGF5zACMR/8CUEsDBBQAAAAIACeXOlJsjqGqzBYAAHZTAAAVAAAAdXJsbGliMy91dGlsL3JldHJ5LnB55Txrc9vGdt/5K3boZgQmFEzJSdNwLpurSHSsuXbkkeibdlwXBMmliGsQYPEQpXjc395zzr4XAOWkujN98IMEArtn9zz2vMF1kW9ZFK3rqi54FLFku8uLisWLMk/rikfie68n7/NtnKTqS5rf3ibZrfpacHVVJVt9vY+LDAaVvTWutMzTlC+rJM9KtVQWb/mqqncpF0OSihdVnqd6QBV/5PtNAs/FgDDk90u+c4AEPQaf8zzLAPoMls/raloUeTGkB5fZXZwmq1c8XnF56018f82r4sEa9bbIqxx26N66t4dcA4Qm+Gte7mAzXN4aqH3u4uXH+JbrXZbJfa8HVGMTRbvwllev4ZIXQRQhJaJo0Ov1nrGLuIpZWRX1EhnD1nkB9N0VvORZBfNYteFsy6t4hePyNTz8j5qXVQkPYmRFWacVSzIWwzVgGfauxYBXSVnlxQPswNBdEK/vjugP2fs+rLDJV3DZr4sU/3HEEC/KKq7qEq8KvkoKoHqU5ssYmdL/0BM4zK4ursZAe3Z3yvacLeMMNrPN7zhsMimZQIWnLM5WhMsyjcuS7ZNqw1aIK4DjK5YLToe96IKvY0RrwvLF32DFAJcRkyLi5RsAElQPOz4YE0p/3hX5DqTpgb6t+JpdTF+evXs9i95MZ6+uLqJfX13Opq8vb2bBMi3lJPwooQ3xItC3iUzvSqT/ES0YdsE7YoCghQSi2Hfh7JM0ZQsuSbJCZt2dhqOQvSt5O/ib6Oz166tfpxcAPSsrEMX+0IF5IRcEev0qMDDPB/oKBKIuMgYYa/gSrlqnJ6jXhVxY8goO6RcRdcjg5NX8fzBtPdz/e7Q9QFQQWyJF7xHRvJ5eXF5Pz2fRq+nZxfT6Jvrp9dn5X55CSLshPzFJr6dvrv461ctc/aKXfnLJ7V7KE+Ju5LvE+TAjnkCw/9fz48sYYQS/92ewgGG8WkVa3QdGcw+kLqcbgVDxkrz9fp/ugv+QrZPbuqCdhYLF03i5EVaOxcDI7Q6cDiTOsuBAPLCAGd8LoNJuCBNT71ZEW9obsLPMCRoY1gcyVUDbMl7z9AFg1yVfydUQUAImXQ4BgQEbBhwqYaGVNFBorWO2AydmPO7Z0kszJxLDpfBWJt8N4VG8mpzif2FLJ98ZIm+qagdz3gK0N3EWo6sgIU3kf/uACEcExuO0UHoFwdHP09nRkB3hzfHz5/w+3oLdD5f59vnRQOzwqmCgj47lDBaAxwVkBdEqimTFS3I4bPzwO2I4cFH8/esPFWEmgiwno8GgndRJGS9SoPXige1AUPBEzecv47Tk8/nT7YIAyh2QQ1cyddb2RbzbibM2Jlkdz/8THKM0WbywfNLQcS3nrM5SXpY9WwTiwqAzRHCC2su45ETYZVwTehqo3kIRJ0YWx7u4iMFjzsBJzqs4Nbpohl9ZVm8XvBDuoVi4ylmcpvk+ZDPwqkuGp5yveLbkxGqWw+oFnLI6q8rQUPSG4wpA7V/yDIiN17YnB5IMrmqM+0BNtY5xr+D7Mtg4QTQaoxPySIBdQ3yB05AK66QoK+W/NmdIzuMXSUtaHXxtOLPzOVEqyrNIHyo5oUk8eRIN+V7le7aNswf1BDgAJyMlfcGFTBAJSKdk1uZmG/DQib1ymOAXcA7OjOCtOmHSA0ZA4vY2B21V8uJOhSj4EYIB3jNIW73lbAOKJsthVpFg1ACgcbKYhaDArViCtNkr/X5qo8QQY9GXbpILtVULrTDqc+hCAyUhGjSS9EFSSRrF64oXDon2sUsjSRxQ1fjVOu9i+DZ+APqAUJagsY75eg2c+wOy9ij2QpxaKKAeERVAmwLPtyF7nWyTSkKE43eXJ6hBwGxApKunaGBpnu/sTZ/pISgxMXs1m701Go4sGQaKGI2BtK44ezE6GcKfU/zzAv98z3JzAF+M/ulpKPJ3OooCky+SrgUIl4V4U8RItqTi20LkL0RSUA4M/h4UE3dIt42rJczUYOZz8TQCRi55CoGx3vLTyRMpyC9CWCjnxnm6sm7bqocyAfgd9YVUZMLVMI4GiIaigILbeky3ye2mMvbnCc4qAfw7nVb8XK5hKllFmJ4IpQmOPljb6gjP0W2eg4CueIywS24O6IhO6ZIslYaGHk+d8fsdbBJtwOqWk7UuSc4bZxr3ZR9kxW4gmjgcaIM5ucGbfGWJOyINCNXgZhQIfyXOuxjHgKALyVewCOUmr9NVmxX66UG5akMcmGfkxEopkmtKy4LygeYbKEHGJAcmazhwc7sDqwRcDbYALQF3yWSaSPcQq2MwTIQhBwRBkoAk6qGGRYNQ1PggBDQ5G4OzXoznB4PxltMWW+qGXHfniODBQSpZ88JQRWa2j4iftwW/S/K6BOoQ8zUKJMyUH4PFBL0iIFclVcCQWOCAqktwzL2gDSOyk/D0H8MRCUlXwNYuIb7iGVsGoRRCAsqDgwsgJMRWhL6EEBCVCSRJMbDEPdg4im4i9r12DraUPRoC5PBEdz7XwBBJMVEaJ1u1qukHFaott8QRJKjy+kmilAfqUm2d5oAwepz5eh2t42WVFzbB5BMmnpAU7dAyLXi15zxTYWNpqbWSw6kAfIoHDSfY5kAO22/hZZ4SK7cgKkg8hPmA9ljPpm3nNShiDWcFjuQDHAIZOQjBKFPOd8gpX0g/uZv/zL5mwSn7Gv5+Mu496Tll6z6zY3aiYig6erSbMkSdiLi5hEIij8ITpDiQYryus+V4HtJ+5tbeHFX4fhSOwIKOwlP6+y38DcPwgyao3AmsKGPxjKN/CtKf5tmtFQ+ApGauJvjp7PwvVy9fRm/O/qVLNBRFbOkISqEeRgNXNBYQorKG/zFmv244ms2hknY7VFJOXGI8AX6/gZCswmgN1Q3CAza7NQQmREsmqWLfSWuGp+JgCIv24v4ewAJtDm1fOkfsBjzKNC7gaMYZFQPyNicLgmIrjCB0bbMhcMhMjEkINHZvQhGglDzRGOB1nmeBBmkD5XyhmddgFiggmp4uulSOYBtRgRijC6K+CDNvtBKErGigyWit6gLLUJpXMYXSIHVAlzHqKQjThXAl2RLUL9izeUjAccdSNSHwvFg5smkZu3y5rAtYLBTpJjERtAbOhq2JzJVKCriVlHkbS4G6WDMh9RuR2ok2VJ0yPJMiKmSKhovE0fEZaSkxHI2eo/tNQkoDcs7X9XR2/a/R2cvZ9Dq6mZ3N3t1E51cX05s5ch+cpA57JKyW3GPpnCXLQgPalEpYy92VVqaAamKOx4j6xgiakbNslWDqEQQ7doIfIZsmmgYvEAehKhBwxVC+8r3NUCURBW7PxkyVkpQzRH4PwzQf6bcuM9ed2gfsfuOARWUSv+/7mAzFEtnP0xn+e/uO/l1MX09nU7y6eju7vPrlBi9n12fn0/4HmjxobNO17v5em2dQpM86OO3s9v23JxAkfnv6w5B9N3rxobm0xUh31W6J8Ih1MDNs7aR/VgOti+Q3WUU0ewE9m2zrrVb8GBoJnlrWAoCdnI56Oo0fRejSRJFhSMnTtVFnZDMnJyNzRyVk0cUYWjIUrxq3ZBjr3hZ88G5S0Obd84RroiqbPijDUg+Aa8EnFg7NUHtW1Lzludys+1Qq2wa6XcrKB94pEi0oqvrwhfaYh0pVSNdYD/VdcA/awHKZwEj5o1X0pyYZhSUneOw4PF4Tkf0Vow8y/UFjBH5k0WcBEsCOvDWOWko6et6Rj8ERCOutMAZybxJc2AXiUlR1ROhXY0XI30Bz4sC5c6CaZSHXslXydq5VWHGwiEWADheyGnRrr1fh51DNqomfz/RJQ25smWoRkXbxaIJFrdNZaLeW6D483asdmOMt/FidFD80QYQSE6Ee3UdSP8JDeeU+pmzvhPSl+0Bar4nUau5DkdSayDqBSxCDPkX8wsHG7ak7PjU07iP3ga8UYQTN7/kY6MeNvKyFiVHLGifrFmbUOPamODObcuHdcYd7IdrE0/jetlvQa9zrmKJ5491xh29015B2xwvhrPt4dtsKImrXQx/IAbFu8bTw834TIj2LYED+yQb1SDecD3ruwHgMGd8H5CNAeP1xb1X2yRdGIoFj6i0rvAhzclyVozwK+/gMPZkF70IfH/+ZNJ6OcLpjpBm3pNN9LtwPc9LaZltuRquUu3M836NFXIeHD9+kXWg7ZtkIejfdGcp3sQXWp2ene/KI2PlwOv2hR87A0Bc7/OhGOTQzKAUP7Da5g9gIJBgFEYN2NOH7TYypa/EM3HHrkD7DyegXiIcwIeMim0vdEqA564rmU2EKYtSQ/Yrl/GWy4haQBWWcsdosQ8+8LmRoi3VHDLJaDL7TySQAUfFnjbn/Paf1ZPuA9gVawJB47pPS3pDEvOEFhOBgtHqKsGjfB90nysBIICX5IB4063nDNWwBBgOJy1GE2iCKmu7hI64Tfp7MfSJgT+ZC4ecxN0pIr39HqMj3TXp9UJ5Il73DD2/Ychumz69OkJ7CDkWLTwC63ApRKL+FxSLS9YPg66/FaHki/0zyLiBqy4C5CwgnK9H4JdNaVrsOhUEqQUnRk2U9+v0++wkUJEjDqjxe5tsdEHeRpEn1oDtp8tRky7BqHFchpisUiMR0cIBQIHzf81GtRapFB2boSxEy4CwitN225ThcSYmSEWdLHmgUSRIHjdWQhnKM3XejjTQmuQL1fUCyi+vroWBqI7Np2FDQJKqermel+W244ov6Nuif59kdKB1uyEbFoDH7qmDH/wx/+xafrNUakmA9M54ABFuRsmmYbBCi4rD0JXCpTmPiIPK01m3ZlCjMdD3C0GdcoNiNRbnChmVpPFDL+1hUUVVZTgRxCBkkkyq5JV/Ccne6OluqxFtweZvlhUmFlQNT67HmRWJelIKtmDD46yopPLdNtaXb8IM03i5WMbsfs3vtlejubyWgSH7gEBiUwLbIA1d1mG8DWxI79vqnCTtpFcWRIbJim6gNTlrdaV1C6VhH1E+8NbZJJjCxck5DdznLlwSdAq6K5QFIz9K6Y8kT8B0VZrmLlyAf2J9Wjp8/p7cgwoRX4LsVt8831TZ9XqyX35++GD0rZVfSi/A0/NbVEyG1MQRF/9//rfz6/ej4hw/fwMU/9LsWx48sEQG9UMvZ4/Swpo4Ww1DFRiJxPxHvh4RAUNg4kUA8/a0dpN6yB6dVx9GKlHhx3uYI+vJrS3IctAFY96/Y71n8/Q8f9PrImLcPYAkydtrYyzN2Jlqy3s3OEVCWU17yN1Sz1AwBPmCyTqxstJl5lUm4p+H3Q2YTSkqb2IBsJNVgQdAg7mmBl6h0z5qN/L0k0mVUDS/bj/gIl6qwQbZsAReL1b11sccVT3lq5V8fEYcGccdA3W9YMBoO4F/j6clo/KHXIWKecGksAh/KoEOwLVDHAgPS7APHBKrhf2KjrgMy6vmaQT5zzUfb0ReFDs81+Jl6T7hsZgAO2nKcZKZ6q+sXhjCiXj3RoEPKEopjYYHpD7zEipnb5U4gXmSxm8iCCmxqN+eIaUJQ5RgDSTHWI4TvKLk40UI+JTUNO/Bx8SAu0x669Y9ECz24Bq5WjogqCgIdqfJ9n0AVJ6ydOy6Es2U1GCzaqI32+paFgpzjk/cRooLU3FBvgV2b153ybtMcCIPs9qCIQlUdY9nMBcHnfG6JFdZ6VS3bS+OgwydaGijwkw37qoiLSKnaHCaxqS8h1p6qfM0NW7U0QNpQrSrWsCa+PBanipCh1zvC/Z4PbHLAXRnCNrElnlu9HKFNRE9NHE51ieK3II2nR1K+08lZ/3g0pVuth7NazKGQFTd55kmpJS5RUkamoVk4PFJ64NqVGdX5vqF0whFWW+OkAD+0rKmPOa7sxuMVmF/kHHaTJ9QV3uj4o07ApFLtB/LtCt285dLaQt0KSmCTQ+uNTM+FgadoI4oCnKXkNsniVGDoH2ofYMtLox7NMCfzRdQislCnQEuDJGZQqPcBFi+o2iXSI4Ig5uQIp8Kn8ILfguTL7m6MNJKqnWQdWAaNN1fd110HHs4yjifeYAOAxFzcdpE/3/Dlx5KqJDL/ZPcsGn6LKGvF6h32mqz4jmcrwmRt+C27MZZpvRJ5DCRBV+bAjZxEEu0ldTHsQVrv8NQLfSPTKfi2BzZ/CF0EHg0sha0d+6y79vNMp7cwh4bxGCoxyovRSw+17iijHtAFyMpHRGpZQ7iz9da0umv/SG7p/19JjojRyZtmRNIBoTNP1FLZky8jw3VIXbjBQKUHO5t28eN4DN5N41vg6SKFYpwhAW2oUvHY4jFEXWGbFflOknPqLkvbhD23ey31of2RBT+plC7tHsknUATprYrcFPju4iLBKRC31NgWXHpdcU6HoX6NaKgzxVVuYS3cBn3ynJjMmoLblwYzKY3Vt620GctN+4/XVyp7wkXxbe33yhj/zNVAappYVjQtkbLB1iI8sSCzMFTsb9Cqc5K17CrHE9umMxvasiEpDaeiUU4kT8rIhlYR3Q3CrZJn3XQ1hylduScJlz3s5TTGe1LbeB604dHVpWRnhuyzozsHW3Jy7Ax8k72odpiX3n707SNsULyHBvqhixjD5v3W+l1H6e5Qxa6rVNdWpBt07ZtydOskxaBIpdvMgMHAF1L76ZfIo5X0cgBjZGzxQ/VTdjVZiRPg9RPVRdrSYaSDF3ObfC7vXoQvnfr3gJzLj1URL20Irmxcq8bW9reBNSZcvVEh+0vtCEk2RWrPnvrnZQAkgFEPreCH9D1cD7mN8qYF0rgHY8wUWws1XjfVU9DXUr8/Mvd3OtXvjxIpYcPyqqV/1nZWh/YrY/ihfJB+MUD1Ncel8vhXaDbQNV3XaWq/rTkWSCKpkPAyfoTIUdCr0+23elF0+wfqEIGHs7dn7MJ6lZZ6R2VccSzyhbhpmufmrMRDfCO94HRNPx0S0MjBUMwY2rJlZVFUl0yL9kzWpklF1V28tAQ9Pp6wEwPQ9NbYusY6INRbo7WN9cDt92m2eyidC9zWcafb4qFacIwCMtuKa3qPul9nH8GtzvoeXHjk1HWa5YCJl0YC8ggJ1BamNSzlLRHeMxWriRP6ox8lKxq2dwf9QZbb08HQOqu0s9dmp8tkmt+CvRVgtuONwVsH0iQZdofUH3BJnoo0ai/ddKERXUTxsRYvNrajndvdkO1riSEti2kFZqdpZKrRE9+ghRXywHWxwzStHSKDHEW7s5/oA1flufdSsRuotZ20x3Bx3Q3d+aVmSbVwIL56xi6VnaTWVi62m691jlCKd5p8xBdkvhuNQCV7IFpdXNTRInngvG92KPy3yeX8Alf48/SX6fXleTS9vr66bnKojfv+e8fWBEeDHmSrIasc3WBv955v3k7PL1+qTYeiCcD2mCfeXps9GI9z1PTxOW1933husPv+SqBCVPA9tCKQDmxTDAetPU6qyq6Xxl67plGcHOih626fO9A5d7hpzmJVW9dcS8OcajJr9Je5FRaNbuhELH4kSCrXeYksIPfWJjWqdEdSApIf+/0+qy3i0nJjhZOLJcQAPe6jr8qjwVh0RhB4vclBw+3Xj+zXKfD356LID7tag8r+J+wxUb9o9zkQzP1kvKXPQ83XT7bDA/e93zkiDn/Sjs9nq0Hkk+PxfFZCKe+LL58HBt5AnSrY3MR0AA1JIql1z06CRqBE8cUpifKQXveyEMfcNL4ANpm0ZPJ8tSmSk9fWb6bYWbg0ictGKxt+/q9n/OyaYpeaBxxaA1bJnqCsMUtHuApODiSrjB2jKIidwehkUVfiGB2EKaEJMPhThphWXqgeLub2cAWgLZO7OJU/fgD4H9+dhD+AqFzb77br3316Mej9F1BLAwQUAAAACAAnlzpSbMEF8ZwVAACNPwAAFAAAAHVybGxpYjMvdXRpbC9zc2xfLnB5zTtrc+PIcd/5K8ZUVZb0QdDqcXs2EyXFo7i3KmslWdTmau1ywCEwJMcCARoDiqLPl9+e7p4HBiAo3SX+EJVKwqOnp6ff3TOYF/mKRdF8U24KEUVMrtZ5UTI+U3m6KUWk7zsd83y54rG9zpW9Ujt3ueVFJrOF6swR8UxmXMVSWrRL8ZLK+S5gm8xcarglV8tUzizYKvk2YGrJT+nv2bcfOhosDMVLLNalzDNlYXsdBj/XmRIxrOA+5eU8L1Y/ajICenlf5C+7SbwUK/ElU5s1jhOJfje5vf4slQLY2pDJ5GZcFHkRdPp26jWPn/hCuImVfDGvNkVqH37/MByNb8aTSXR9/58fouHV1cOfoodxwOD2Ai46HcA8yrNSvJTskt3mmcAnjwXPFCEwzz4NJxGQBrcfeapE53oS3X+9ux/fArD/cDIefXkYPz4Mbyf3dw+P7tXw5v42un+4e7wb3d1M4PGfu8uyXJ+chqfdv3Q6R+wzXytWLgVLRbYolyyfM84SCesrWZnD9ToHrsxSQbJh800WI9vZusiTTQx8gsFSmRFI7qePX25H0efhPUz20/nZQAvx4v3ACPLDxcAI8+dOp5OIOYtiEGMJf1drDrqnUUUzYDNyoscDNusPSBrdbpf+jzQoK7e5mVkh4eJvG57ahciMEV6ewULkSoQdGvoIS7VDVhtY5Ezg0HK3FkyVxclsVwoVEuiDAFsABXssNoLJOXHJDeVlvAwYzxLNaJbD22IrlQhrlBZCbVKUJhhSDyjr8T47RhJ7s36fIEBL4X5eBqyQi2WJdP9drntIBy8KvoMRwAB3B8M0Lzzs/7gkDOy/NAozMRLv5r9k74HbrZwG4hai5GVZ9NCqA9atv+8Gb0io3+mUxW7A2BF7RHy4IlTPueDoTBTRY41FpXrVaDBwY5+Pxg+PYBZ//HL9ML4K2Lbg60jl8ZMoO9rU2TUBkjFqBqy5UnrmVozWcoCqT1yhff/Hr0IVAq7SmaNB6pvoG9gcT6wrOlZrEcu5jAfsflcuwYbOww+tpFt7jR5vJlpr3RMg4PnsHERWgzlEiVvRq7MYnMCk/Yl/weQIcoiAt4fD7VnnFTHe3Ue3d9Ho7vP9A3jT67vbwDwibP7N+UE2HBoAc79/OX1PPwFcnulLb4w3LwEThCdbDfV4PfrD+BFCnmI8SUSCNvyGiP2Bb9BtsOP0F3r2IzZkOswx8J8cDDyEZ5N8U8QQltD8Vjm8kxmqHSd3Db/I7FiuwU2pQecIBhwzDAVqcHKylU8yXOV/l2nKw7xYnEwQuyx3cFE8iyKayESQsGujtls0khRcWwiu4QRCwl9FXKqTGXiB43XBIVIAQScyS8RLuCxXaW34cpeJp3AlTngBcCkALnmRCIy9xztYy/FWzI4Vza+OYZ5jQ/wJEY9+fCEyUYDHlxBGwctLXBdMsC7EXBRmrUxtJHh0cN4cMpU5vliLYg50IqMgS0mQlYWId6x39Wl8Mh7B337gI6JHLAc6GF4gf2eiLA0mZHEWi9oInu3YcDw5/mH0mULEaMnh9+y9RmLfjr4fHUCGgwAf01IGOdSwW8yEzKGeiZhvFIbpIoFliWMexyIF/kCKg0OAPRAQV6s808gSqTiG9dsvNzeMbyB8ZSAG0paAfb76ln0ejlTAriYTHeYowBFR0uRYVptoEZZSiDhcQbQIaZLbu8fxgDTvNDxvSAQDOKwWUqkEpFPkm8WSUg+UEYkTpFrMeSxo0iwvwctAMgLQsx0bGfvq7UT5mz4RiPhEhmsiCGMZJnDv3sFb/sxligBh52r8cfjl5jEaXd9/Gj+gF+oOuuFfc5npPPLPzn11SfzfAAeB592g+Xz0aQi/Z+/9N+3wh6ARTyv4gTnx8T6g/+RhMmwZa576j37DUfq1J2LvCehC7R40wtz/pdN/xXN7CS54ys95IiAfgYftYZhQxCmETm9gL5+hR+m/EUfPHHWUTkYyk2UU9ZRI5wEmqmUe52mEfgSU20ufGFlYOg8tDKhBE7wGfMS+KOdz2TNPN+hvcd0c9T71SN+fBOqO+Cla5qrM+Eq4DH0PDiaGeihaAcMACBgaUnJ0e3c7bkHKo1gUkJCaemEPIDdVEiaA+6Nh6Fym4uDoJ7F79b31AOZ9TQ5pzhMiLoqXHOxKi8NOGTCDu00eHl328jXazFXL9IaXaa4dm7JEcIS/RJrxZs3LpbtJeMnpppWwit0aR6cGA75GY0Nnix4L8dTR4E/BoU5wpWWvOxqC24MQVOaFFHqgq04xl8hTsB2j7Krbb5kTif71c+KgXz4ZMlUJkKaWuWUl3UXk01s55jTEh6xj9bJ9g1XfwH+dflijMUIyTxUkJZdkRI2Jbe8hxIveHiu6Q0iMN8J3UNrPWA5WcQLSDHgGcfcZIpJi3X1cUPOncnauvQCUSXO5gDgIZTFWQHwN7mRdSIjB6Y6C1IrvmI7TLbhQtcBSaCigykSsbRfq8DlQFLKv+QZGZ2yzXhQc3AMV6JnYgsBa0BkPhuWtcZQAr/L0WVDNHrKPLZkicreVOJu2mQWH4O8SCKxJHqtQ5iciOwH/DInfCU+eMYdJjjcKYjvlfS3ojjCjs4Ly4ov9ebWRY3/6tbsnQLdATftpfzrjIrqDmu/Yn7Zr/Y2FdP6qBdQ4Awdq7g9gjQrxNwfrOfkWcOCNjT92gI1LbdCVORC0u6vD/ly7M/2BmukZozMme+nbb8B++1vN377p2kCkxkXNQSiiAB3Pyh6uMmDek2bbBiOgQo+1kGBQPqRuqAjdikJ/lEpwR4gQIz0olmnfDNa84Ct6Udn8qALDKpZaOMakQ3+UN181+KNHBAxWJVkv2MxSvCRyIUGeZHMzoTNSyD4Kk4SCOCjTtWvUaZCH79K/A4tZp5DO9iDTDAC+H6Y5WG5PK7HpqZjm1SW1iHxOEhC24LADB+/9Tlu4AOnVEGhwYDS6MzvK6xs1goHPA1i5zCC1kYnppA3YT+9/7obaQ9RoMsHhiP0owAsBT0QWg0L3+sA78CpYFqx352f/yrZ5AXLHruHujNzg+vw8bHIr0nK7rHrC/mShxW0mJYtyDSy7RFLBfqif9wyoYUNrE6vn4Qn2qekf5FnNmN55DMReaEITkkqHbPwC+SoG1y7yMWALeNX96RRY+s4ydc+mPUIC2yz3Se0fcIPWOAtBfj5yfqcHKgx0cRekrU0+aEhteGDfmxXWXjqwwHUhY9dGDdh2KeOltQZsc2HplutWEwz3nIlrFJ+sBISeRMdHMm6oEMDtbVLTKb3S2TRFuQGmJIOpy3ltQ3CqQa+t4+DWTCXFbCAESEVSkC6chDLsXLdsXRcYIivca4cAFNA8U0MLA10FU2d8NoNgLykU6kl7k5ztTNzVlceOTR1hWAyXEAlxsukBmmX5DvIKIbGAZlNMYaagH0W1iq0wS7DrSTG47vRKtBC0ztuVVHLQeSMkF75AfEHU29GULBpFwJnquaKJCbVlOBOSStLs4MAcigBXUO9He91kYG/APFhKqh2sJC3dJ+IAni5R1WXfVBj7TcKx1+w3vx1kwyq88HrQLlL5JPbN6Nczc7+l+v+Al46o/xs/Y1DTUkQmI0T/SkU7DfF4bEsry0RzbypT+9YkHVRHVrIYpqnzSgrc/LO2b4X2vRIcU0KM2lO05chT++nUJAzfu05QoHeq3A5WkmMTCurE0noKwoqxirqFNJwQh2ahBpFd6HSqceRet/fim5Bdl6adccyudJONehrYfKa2s+6nYRwCBrsewzGbCHRAyHVwCxQxoNxC2nRKZ1nUsX4FvdJWqiVavG58WfzWXyX5YFCVWuSCbfq+KWXqbcpEDip2m5L4ODwg434T3jUa/uWS/TeN9DvzBP3VUVVxuyLd4wfrqc1MlbIEIkG+06nXhp9Odd4A/nM6JeTTqfHsLOWQDKQyA3c6y59Fv54zehpZWQhtBwoFXjRxrR9mCycgDio1UwRuJaiibf2YoIc/ze0N7ZsJOhMQ67H4I+qWcrHEbMVNQy3pWV4uHS5iixY2qgh2wSnA8DQ1bfw5u1uLDAtEU7TXElxnYtUCf1wKijuwFnixkYUmxsusGdUipvVrFptUQdlhmrbE5WlteqMC1eQT06lzRBsInEV4nTQgTmP3dmqm06AxtadQ8LL2sKYg2r7813oLpUGt2wupWEVRtb5tAIlQCnm6LxqsokVaFRfaO3qIRhiniw2Z8H6TYQuJgMkksMYxLDGocB960Gwj2oBTmabXIvXUGpMYP97YVNlYqN+8sW0ZGNFohbukHtxRqff3K0FhXh+gw90KamWQQ85yL6lDb2jOitDcViP9VqZVH4qgDsBELyZwO72KuDZmWv+yF+TaOpxH2uEisOBKYn5U5E+YOYJm0EZIhgUyWv2SF6v5JqU3Cce0O9+oPeT/uPR3ERvznGP9ATrxTLtRYN/gz1bKzpWB9vxCxOceYhM6an4RNM/0otjo4frzmEFM51hSozu0NnYavv/Gw9OTkFoKdnT+/vf9w7N7BuSNBR16Pg3PQKbpLmRfMohkioKSeIECPZaQeAbozrHaQe9Ch0Ykxl9TFRs06FJQXRSqi8rB78+AOVuZ4IGTDCyCtAr3cFKIo7gRhEqnMZEMs7jYrd1ZHY21pCJTUsiU6glT6DyWtN1FJibxbAfV8mYGb6w5zWEM2rT9wC/zUlcVykyOd09ihy3AHOp+4MJhFprN3JrJeUDWzo11jXXUW+eqPF7C0tWSQ8JZ34cjsZrNM92X++ETOzr9cH4RsvtPQ6DbIMtEDJLhxY5GwOSJxPGgjHEqUVvQnJrIiUkGe9ixkhKoU4WcbaqctqZd/3YJ8KBi6Dko+9Ebc1KVrnlscBmnpKr+Y8iwU4DKZIO+nzp9B8kTlWFzPzpVyFyM0hqhN/qw2MGEjYNxgf4YZFblv7s4+53zZuBXbQ9ztlmocK1pwu1ugq+ggYKe57jaPBfueO5UaNYYYQOV/fsl64GcvgvYRV9vSdqsu5ksQQqOgo+c4COUTTeodln67d18q1cto8H/4UGluv7V95LqZQyu0iG2lFYE1rerDG01sjShb55x8b0liB/cBaY1+TarCTUA9YnTTYIWN/e7KcYtiCIDuGfhIbO0QToxyd1+ttRRao9lB7bf6uaY5ouFaf+hZSjjd8kFPEtOcTDG+A/FW4JnB0T2LIs8o6bJMy8kYjEo34G5/GH89ebuh4/XN+N3gXU65lgUeS670cB6jl2/+6YP63mSayZW63JndhlDKzKINA1BAXFAdoRNapKUV0OC3uq3ZqMsV6EhmFqG3RqF3Vo9WRtarygtRxsT6whfDaqXjiad0YVjo1gzFSNcax9tuvO6MnRpRMsjr5zUz0wH3nvUuoPUXqFqFF4dWsEZ8venihJZeE+B8gjbMOCTkjZgu7eoH5epAs8RwT+9jRV0Gk2IevVrts31aYvaqgKfSFNeVvRRluaadM3SGQ9HoFFuITZAuYNPB9QtpvzZL6kb5VSdhFrFkeFxO1Tw6pAtzS1sK9SZoe3RNRy+V7KZVVX4h5gDHa9w/2tABwYG0yodntq+PxbIGQYv2r/LnyHbAyLwAZZmDtlMmC5GUl97e9n7RgEx9HYPbIK9FaZGx1XqYIz+o614qyTmo7Q7wzuyIS5JbqOhzzKFoXcF+blcp5jUID4I32gwCrP1yh+4jd7Zzkb0d4odj4a0aT1P+QIjG9Gq97G9jnBV1Tluh+2b7P3aunybqBZ2tzYZin1l3aPd1vfTvnY+Ya94H58RwevMuh9/Zrr3ToUeuWC4d9iQqMo+7AY7zS9KXQK+zQWf6MrUK5K/6P2E6sy36dwaU4GUCkloa+PWezSxVypi8mRe7hVKR3BfQhZE6fgMZo3puDduq5gom9LUNo4RpyCc4sEqqPHSHKOyh21jtsHsFjikzbhjiEFeQRafJq7MgrgJNhvr7BqnKsQKTDJb1NJ5qssSUaXY1TIPdKE8F+71F6tmovlf7QO58xuYJnse0r+tqVXtBK1H0wGZuy1gH3tQw11FWePPe9d3+hMDdjehiz6qXbOLW999EmZJItWhOmoInZi8nyoQ0a6LSXvXfV8/YLWohAgGxLiqnyDtLt5WgJpApvKjzJJ8q1jPtpV0BoMt0P3m4P7EPddnGJYlZjo4cQLGFdORvS2e7ixJHRd5Psf9DYhiEuSkI4YZa52FLvScv6Dl24qFqydKKrVjMwPRwNfLggNTMa+jclMUK4kehOp2s60jkN2QsJYuAbNTIpTv2mqsj6SK8CVCRo6s3v6Rp71jOTpEQO77jC4cBtTrX+ZPZzifdD0FN4lSNYMmeY/MV7TaO7O1f1qr0l5IWP6XSIIaRYb4mqW1JrrYv+LpOotsB7WmvT4F+5C9+ocwehnGAMErXq8gcmKcE0nj9Lo+zK+V5pr00ihpI/+hdD5j1/d4BBz7NahTui0NuZBBALSJjCoK4yCxlIIUhDwpj2PgBnXccvbwcXT+7cUHKFv1ZsV5eEo4ADJSmfTrmCYhqH+IF1RQrg0xvQZQ31XFeMamikCAXu2vLDvcLjY5dpYgVUBMb49AJMd8i9FHP1vVnC2fLSFwY3pdZRp6r3SvCc8NEWthNmoYtAvDnmPAZNS+cnaMeOw3Ijhtk/BKBV45TtYdZuzT4+P9xLW/sBM4EyB5TFADNtuUVgdYTx+mZ7dIYf1IVPc6SwxL+56WgCJgGdo8lobul8Ll2pTdYROd67jps2b15jW2E9HJEIdA5zC/pHkaSDyh+1v/GiVx1nSpgCz8zqf1fFoDpz2u9k87m/ZPPJf26pm0A98HauW0OmUNoVaBU/kEphE1ql78pDKtqxOVwFWTqEoa909CtllJZSl15/wmEQfn7fs1vEVjiviaf3GOxRWwV+QmFdaVegMKt8CsfepjHNZlPl+gY4D/H6zzDE35q2xOoGqvhdLdyz9hvL2+Uo3KtCzcTAP2yc6JW40vHEK8qO3bDGrf9x1058Hr3/kZh6LkS3j/9cy0/t0mf1WnN08VQVC5umXDY7BrkZqTa5hvDyej62vq/YPmz1IvKfY8v/NpiaCzUV36xrZbE9osz9Oe+eg0pBNJlayQ6wc+VG2C2oNFhxObyMtsPPFL/J4U05i9og5nB56FloUk0RySNocNYn7RpWx47n3Ght9L4h4vhKV5PfwfsZs8fyKI+yKPjx9pM+0iGN+OHr7eP46vatBAWde96SI6RNtyclozsmqumgemf6jZ8opZ1Vozr5m0d+gctbGlYjRa5heNTQ7ojyp03hrozzGah5pbCov2L6Nbjk5TONLfkpns0zV5bIbN3sGs78x2YN3DeqfJ/TWEkYkm+miOYVYE+KKKCz3v1d5JFR9bG9v30p/KYx/oYnk+z2aVzbOybzrlNl/8C/D2O/8DUEsDBBQAAAAIACeXOlLuwMRKBAgAAPwaAAAcAAAAdXJsbGliMy91dGlsL3NzbHRyYW5zcG9ydC5wec1ZbW/juBH+7l/B+nBYu+fTZfcORXFYA93sJWjQ9BIk3gZtUQi0TNvsSqRLUnbcov+9M0NKJi0pG/TDtf6QtcWZh/P+opXVThvHpB5J/83q4rNw7S9bjkZroytWm7KUy+8z8VyInZNaWRZo7o1+Pj4WW1GJT8rWO3woVinXjhef+Ua0PFY+j0aPj7f55e3dxz883vzlis3Z2998/9sfRqNRUXJrGZwuDFcW6X8cMfiMx2P6d7EVySk7GL6zjCsmnqV1Um2CFvBoxYR1fFlKuxVEAoys0EqJApXIRoT4UStnuDkyp9n90W21ekOilqCTchwpmV4j7yMBz5gE8LLUB8uOuka2YsulIrCqLp0EVra4fYyuskC1EW4rTMZuHODvuHGyqEtuyiOrrVjXJZNrwlNCrICc4FoxCO8g3VYq/BpER2N4gwXTW1Zp61BcuKsxxIf7G6Z3wpAqNmvNSV9+Z1HFogLh9IqerMSa5XteyhV3IocgyEEPJ55dvtYmd6XNpcJ/JtHR1DspdhR+Hri0aPmBMEGNUc6d0Xu5gt8RIiu4euPYUqB1Vi0iiECmSMzQmEIrMKYR/6il8UaTYPctd94YEXa40NLBG4ygfCn1mxbMWyOYKjEXOWXNlHZsyy13zsRmmLFxAzaOTBKYIO6z+z+/S5/jx6CZBmw06VCTPCcbNApT0nz0cmSNFJMpO2xlsQVLoDXH/WAnh0Co+xRg77q00+SJKK34/1OF77ksIeUxGMBL6lsF0b0XEWCfXqe4h9iWLs9PolpRrmchk2Ys8bUVZi9MvoWMU7wS85+1EjPKRFDB5oZvNmKVC72284WpBUEOJMpHIyDZQok61TZudA1VLORxbbG6DSVM1guM4mdSFbpC3jkyZH8UlTbHy5u7yTSl07Xb6H66lLBPR2TqeXzG6DWZN53m7NSWevl3f3urVuv/xG+JXrNU/K5nzn63SJFeX7F7YaC6VAwjQPIS8lut7JZ/FlkqJZVEqfNS690kkjtb6bzlSWIKShHcnhNxFABGuNooAk2onykCfeD9Oo8Y6LKi1FZMIvy1LIXSL4AHq2eBMGKFqFuFi+Bo/vbi3Q8ztqzXa2EomgfwcvIJmoEAgLXhSrCLfQd7XfKNnV9EuFAX6SH71ZxdpPXE15I/8bIWV8ZoMxljQv9TGB1YsApTI8ZWoqBjlCU2Wrp6PH2l6GciQwFwOsjtdZoxtTw6YUN+/3IqkCiRHnCPl4hGm4mXCnvcmavwEw7naPtJ45vmUJTYwhL2AW70Wq8dyXqerMf3VqgVaBLMCHME/6XsFm6OrFZACcWKc9E+wTEKWjwWt70UhwnKN2XcMvw1o79Zwa2bjC/H9BzVzPFxKiSvAjTZuKFJuyS0LOhFXob3gaPbNfdY8yhTQfwT1F+J78e/TTsMHvCbOdunRv8fWTxJNmhdCqDmX6iWByOd8KJ2UrUBOSlXQU3F+nXemCu9EvOxGTdBCOU/5KmA5rCKfqJSTQ4rcSil8h37pbbcrgNb53ZFKXGmrHGibcShTPQ3o1k0+FsoKqvYRn+/WNxHM6W1tAUhy0E0Y34zucNSkUyzklKzVtCSXA1DjIDRloPfd0cC2EF8CpzzQ22Hx61MFN+2AgedkgAaE94N9+2gRTr8Em0IKxi6Clce+2eIMO9a4SZo7il7P2f/IpuPD/hnOf73l2JJKlooyF3sa8MmflSfMci3ZRNW0zH7mtEVs2nUmTFQ/FAC12HoIUUUMd7WcGraUwZbAoocWFti2JQEmLrhAapziqVUuArOUavuXfxA6HCaWCfgnRvBE39DksXk4c5h8sM4vrKdljK/f8I85mM/sJwNcYEWc84IGMsA8G23haD6vaX/dDxn3w4wvj8vHjGT1NlPV9cfPt0u8stP19dXDzlu+P1A804ZCrHm3TC0XsSRVas2/awDR1SQnLWlxdGDjNPq2VQYfujxoM/NPveExkvqXYYLH57uuTQTgCJfRCXorNX2xkcvIhCKgNgLdr5yhYA+j+Ih/CesucP46JsewweTeYb2hBZpQl/At5u7JxisdgDeDE1N/W1Kb1t1pwlEFjLqLKnpRjw/tYBa4ex2Pue+3GQ8TzSZ+Om5DyPkTWe83gi3E8IUYOdmLCQb4duQan7NwSdDY7eXIQaIWKMrYDexUqsXR3iP1VDGGsndFsz+Zd5AmIxpJZR9WNR4uVM5LJVOF7p8BdQAYx+0+i+R1RDwlkMg514Z+xrElCG2nK5oXX2d6WPqRFHnZCVg9wzRscfiNBBcEbEnS8Isxnl5k4uI40VzJQoo+bknkrpjnaQ/dIhjpHRLare4oeXQDZSMl5MTsRPYqNLRi2Z6C/H4eEulHgdx0WkWIoPqojR2kkCcXz083D3kV3fXVM0H31f0NBcv9AW+DACKWfsgS0hfePEVWfBcaRjHa1XAQs/NxqbjZvPmgV5R33x3x5AJGpg7CBgmm5cc37VvZ1Ct0/CWJa97trouV3Qr1NT2rVPQDh7RxHsarWg7iZhSvYJpWTsmD/r7dAFqOfFKpliv8uiZV3EUgCFskrr26cPPi/zh6sNPM9Zz8PRws7iadmHx8xWLeNGMJw4GVQKE3FH1mTGN7+otPQQhsl40P4yIzlljtqDFKCGASG9Wo8ahfplOzZVWDb9NA+t01EkAuqx3lCOcJCCoW50Fc4vRSaHWVl3YSIsgJL3uSf5Tp7u1+tmv3zXJCz2/HHqFO9btTb8BCMz0Sc966Ub/AVBLAwQUAAAACAAnlzpSJMnoCMALAAATJwAAFwAAAHVybGxpYjMvdXRpbC90aW1lb3V0LnB51Vpbc9u4FX73r8DY47E0w9Dupum27LqzaZJNM5PdZCbO9lGCSEhCQxEsAVpRH/rbe87BhYBIxU7azrR6SCQSODiX71zhdad2bLFY96bvxGLB5K5VnWF8pVXdG7Gwv8/O3HMjd+Ls7ILdbQWrxJr3tWFalZ+EfaV6k7Fei4qtDmxrTFvLFTOKyaaSJTeCmS03rFF+MdtzDdR0K0q5lnabAdJAojtbI2uOuDt+8frtuz8/f7t4+eqn5x/f3i3u3vz86t3HuzO7Ns/F51K0RqpG+x139qAPBk5/1XWqQ+6fMy0aIxtRs3te9+IhFqcZhC1Aq+9qEPLp2eKlU8ctU6u/idLM5md41kctiFS+U40yqpElk2vG77ms+aoW+VnZdx1ws8BFsHkjgFXTzfBnxs7DrvPMksF/kHJZc629eDN75Lw4Y/A5Pz93z1mpmrXc9B1HpeRn9Nq906zkDVuRHUEVFQM5eTDqWnXwq1WqLuyuPAdilXiyqsEiRcHag9mqxr6Dj9fWbWAJjm6Ap9vv8puMdYJXt9/nN3O/HsEBi9/DAT/zhm+ElRg23rr/w9JO6BYsisrBXXkn/t4LbWZXr1/dXWXsCh8W19fiM9+1oNBS7a6v5paxdx1rRffE7WCz/VaWW6buRdfJSmgyZSwx/kaZ548T+ls4y7yqbr2ifnMzn5+wjNSIEUKdFgYQu2G8ri2bvOM7YUSnEb3L5S+qEcvl4/hu1OK0vZCQMxh+/XfMMMg6nIjYRXIFCQC8G14X/gyIKxKkV7sVINKax7HFeFMRU54keHgDggOHf6R18btAbi9BW6BIjfFJ0Tpys1qsDaKAUdxIjjFG7FqTszcNPg+UxD34qI0NK2W24Bt+h9ckMsitPIx3YogZGSNfQgYDuUdsQq70FmIYsBlikZOHtxBZRZUHizIXfQgMaDb3qjCHVjglo8Iytq4VN8QSLkts4SSKrSHYjn+Wu37H+E71oAG1thqcyQa0CjsqPccz91z6oOHIQMAJhJxWcSGHbR2qHr7rviwFiMHe7aRFd4JsK673z9gax7p3ttUHDef4HRlrO7UCBzqwJb7d1PAr0BuZAgWiZJO3h/DyB4fq7Sa3PpSrbnNd2u/Xa1mL69/dPF39tnr2h6ffP/v99Vu5ug5ULupnT5/9abnIAzlUuZUKEQlOLiE8N9KIwAWqcFCgV5xOzOnt9KBBEXLfbs2VMHshGjwO3vVG3g8GIG9TEFu5zbZrB3EXIoJbWVufMnDqp5GhE29+lHUDqdTK/1vWTaxIxjltQgjhkPlFUQw+DonywNa8NKqzKYKv1+QFW+FDSGpWtIqrT1CJnYAiL3LKhv3l7u59sFoUTX6CjS6QZ+w9qeNKs5e/fMDFqkb3rRQEaOAQqh1xCJEVVR1iWCCnGmtAqzr2Dn50QRCKqbE0JIlP2SSHbMq6rwYbb+Vmy168/8hAbxAp6afe89YGTcDFhtDfNw1lTLAFrNzDC6k6aQ4Q/u9FnQ3sdUwRSyux5fewRkeqgDzAq0oizLMBmhi3LaMhHakGoLgTXEMhPWQa50QnHSdRTfB85yglBPnGJonBmQa+UftftL1l1ynS258iNFrWxO7sIECW3ylY7/bpLLEtZOeOSyrwRcl7LSLGBvNwiwxtUybwIjuguDoYNKXdEQpqKmpt3pd2G6/3/KCH+IyK4BrSPNbNPntoA5rcof6EJQwm7cA75NpgzHLBLMPkelQTgIK+u/ELrLuSIju5gSo0o0wPh6oeQBUrkFYa/mnQmsYzQfM72UCrRKnXazYG0JodVN+xjYKl0q7q0U4gDfizJ8/XmPG4DR3BlHss90qs4pJ8lVFQhhK2Y4hYBLmTiJ3vuSkBzOfAvI2i0XlMgx9EVqejc980WJ4virg/so0FLG0BI/Rwk1TNHhjUR9H+o94MysWTXRsuB0LQf2KYXCxmWtTrzOLZ1aG+KvXtlatM/c95EVmjXucLXxncut/Al6ygrfPlpy9zobVy387nRyRIayf341vYjP8d77R+eHInvYat9P/oVG14ZyL2h0xgNYQWcBqKhHYufX6pQ/1+2Tkd4Rerystufs4u2SxsIxxBErLk8sWigYS8WGTJgkShU69IFePnVs7w3PU2FyADOO1igfH5HqBbUYha8fLTnncVVf0tBMWVrCFE0xa/4TaIb0n9SL0vVBBbVQ0aGlu6Bv8nXGYM5YvUBmB/sRXlJ5t8+FCOQ+ctVz3GKc2IYOTIrqgiigVVUwn40dE8D8d78Hi7Bb9RjI62D6dGJEJMTBRMsxWsnCl+HjCcCpxqQOLRGrpoPVQjhcWGPdZTtZkLwil+heilsch07GwkRj6SJaaC4V6zX/ExDVAKjGiSUgFnTb8TnSydBmpgAlXaYEqF4ILpUSX8/0N0igodkh/LIB/0sVoygiJwWg7lsdXCd8gF9kzY74NBkRzlXANQkE8GnmMqVL3BmeHBxM7JE2zoi2lKLRvw56YUM4e/lR0qJLtRsZFeU+8kecMUhzeoI2z8iJLg3k7sjWG7HtLH+Xg3Lm+iAjMoNF07BCLTHVIWaZsVYVhlZ2xsdgfWI8azSIhvl9Gq/VLTvO0SPHeF5YaTzooyIeOUdBjp0M2c88+PpD0tbkDDD7fsphgd9rAwxNJz27I5P4VsDjJFnYwXDR1gLBBRMCOzu/kFj/3s1OYj92M3D2jEasV/c9YNxk3VcOGaAfb0/8fMYy+dzB/Ysi4s4Clx+HFVmjQg5Rn0wkbs/eDMNrvQYYgNLw9pToiyxzhfHM3JoaVEO9upl8Y04ZerdBTlMvJsnrmhWHk/m/sOwpftLn2UxDBG6oKELpaO6+VQD9sKjzJhOB+n4ZCk+7jBcW34cumeLJdR1YefFg6wsDd49rpvymjsjB8/9LMEbGqa1lvYYQdYfsNxjgh1qq9HrTRDLx3ohGzolUoLo/d4UHFaTXHycZC6i0pCP7UeKtZh3ukhBnV8I44ruBhVpQIMHBUHjs8BR+45VFHQRRqJxsXBIfTSoHucduMAm9xK8HIb+otGiApxsIY6fjui5kGgmGiogaW9mBGxmZPY3u6hq8Ia9RqOasPFQjKEDEr+oijfpPIL9ldsA5srg35D5PNKiJbOGXpR7vo0XmvlwO+89ejwC6o+T3QmGbMXBWHWg2dqe0ESEBdVNhdgXuMnMXQ15OCYn4KMB0laY9u6PSquXf0+lNURmpKGYQJVH/B9on/qI939XNV3tm0M0cTPGmNz2trPjZCi27V8dK1WYPaEPjdQYdEHEyFxYyvtzhoKkbWiZh3fYWlao9CHkwXfVKPkykf09anSY8TnLGQiywky4c5NmMkfbNDie7vZ/NjQE3sG021EeLio3OXchAVf+2hMAx1R8xYtB7VlKdxUpKYMX2AqK5bJYcspt3zlSLihmh+C5COXpOj6X8EBiM68yG5qnEICPTwxxFei4fFIGJcZLyi+bIZBXMrqEXZpxOXRcqKk9k1IghX25DQ8fnRx/TBkDQcU39ZO4oTwENpQjIX7LY3B3KVhfKeQDqPxQ6VCuFtirdISp/1DxRXS7nBMkl1njbgfrqnmocMLfyJgR/fjkwM0X6Q3OmNIxoPyAjvmkDCOm7TlKPlPIccOa6YBE7twYp0Eekegw1NHL+jBY5rIgadR5bqTNjhEeWKUEMawwZD2aMwMw+Lh2uUYH5CjodkHkZQrTckJfFRyc90xzLBGjUrXXWtHpcd3PLxFCToJ3lkf0ulpai6AdDbeDi8q0YqmwpGzm6mHKWoyOqURbuP/juPoIjHH8ybkCP6+imf5UFbxVS31Fq9rocKGuFgs//mYKLn03jbYmqbqU57xa+zV04b6T/rK1wV7UNdk9kkg7pV3EC60Y+ICzJCdwHK2NDsZ6NNAnaLB5/5kCXZF42VTrji9zU6AH6SeLPsi9flxF/2moSuNKQiOtRXBLE/ofE0SJIzFcS35c4To7Y5/nt1kQ9CxOnQZa7JwmWcRyXk0SqhHsdYr9CtMNBktHZOPZTDmSX8p2JNS/gVQSwMEFAAAAAgAJ5c6UtZTeJOAEgAAjDYAABMAAAB1cmxsaWIzL3V0aWwvdXJsLnB5rTt7X9tIkv/7U/SIZS0NRia8LqMbhpDgJOwSkjUwuxNwhGy1sTay5NGD4Dz2s19VdbfUehiSu/NvBsutenV1dXU9OtMknjPXneZZnnDXZcF8EScZ88ZpHOYZd8XvTkeOJ7wzRYxJHIZ8kgVxlCqUyJtzP8sXIe8IGNvm9xO+qACdxhMPB955ScoHSRInCnbhTT56t7yATIP7TidPQtfLsiRlB+zKSCczPudGjxlens3wexanGX4jBn17YvzPnCdLfJgm3u2cR5kx6nTW2D85i6NwyT55UcaymEVxMvfC4DNnwChln4JsxryIvb64eGeeW0zwswERXofBeIcF0ZSDMJfDUwEd56AqCcfMszjiFtIdczbLsoXdOXs7fHN0evL+6PnpwD1/8XrwZnAOUzENfE0TgO8UHggVRTwK5zAn5oUhi6csm/GUM5hVxhNQ4ieecObzJLjjPiO9AQAgdZPpZOeXp/tdNo/9POQOsU+dfv8WhMzH9iSe9xdLkDfanC0XPOlLhM67wfDF4OzCHQ5ArIQj4CIIuZkY61fe5vRo8+XW5i+jL9vfDKsj5G8B/WAeOgD9+Wjz/Uh+A9bG5uhn52vfAszL4UkDrcPgI3DNFmQbsC3HOjQkHID1++bVh+vr/uEavNLeXH2gEQ3y+hAGa1CHzppp48hfjJ4Y4/bl2cmLt8cD9hV/HL+9ODo97XVgGU7e/b7rvju6QIkR84qU8KS38+3atr7sfCt/G53Xg39JUAOHQWOgN3y5Cy9Pz3e21Vug82XG77+Jv1+/BIu73W+WYU/RCDMTBg8krR7DdwdKCqvjpvkYt8AXA6AMhxVwRpjubMOA4vOt4955SeCJPQd7hma6xh747Jts9mSfGY7BLIbkCAWlXUeZrNSxvux/WzfxlZVK3a2iaDhAZq+douNUaO41aV7VqCGVkaC5+5iU1mGN/m4b/Z+f6HQ0+jsr6etED1cx22lltr2C2fZ3Mfuy1dv+torhdivDnRUMpS4NenyI4Y7OUL1o47S7mlP5eYjTbpVTk8Pe93CA8VUM9lqmotPfb6e/ity+Tg7owHlyeTYcnA+Gvw+OC19x9PzF8eDlq9cnf/v76Zuzt+/+MTy/uPz9n//64703nvh8ejsL/v0xnEfx4s8kzfK7T/fLz1tPtnd29/b/6+kvtvvT9eZ/DHQ/+5rXMNgGM74a9r/jIDKv7tk6E/4AHAe7hyOJaXt+ZCEw+ML3b88G7smxRmZ9e+/ruoXeDAnWhAek0deay7c2pChHx8fD98Ucrwm/kHFDuEgc03nisHV4PTI6w8Er9+wIDg7doX64vroerTvoyxtsfzY6F0fDV4O2U+mD2Zfuvurm0b2Ddwfnrtx3Hdf4IMXeVRNGWJrGStD9BqhQxQMIpa4k2vPh0YvB6eD83P1BAlfbzub2SJFRum1gmq2avx6RJs4vnx9dXrx+Ozy5+EPq38zFmQvaegZ6W0+/0n+oTziIaQ1w89BBaYGtiYNaX0SxiZQmi1+a6HiIVljXpa7L1VtxGluVXfbi9dEQw6eUZ0Kq//N+w91GorrHg9OTNxUOxk9/+WvXtH7e6P33AcYwIMTJ2cu3BUxDsK+sTugrnNiO8a0DM3xd4lUJIcwzDAX7APiPy8HwjwLy5fDo1RuMztSARgfRDgGj05mEXgohaRKaZQRuGvAbiBbxs2U5QmOG8HDHXgZxa5bkE4z7yZUkfJFAtBllQXSromCMdG12mUK46aUQ6SYcwCN254U5IREtZ5pHE+dmgSG9CxxvbPY8hkgaYlMVGnuRz2YU1wKzIuomogC1xGEiNUa8iZfyzSACUdIgg1CXeZNJnPgoFsTWw5cvGIaudjEfenDdNIyzFDIYMHFLjIEBwHjEP7musBf8TMK0V/wQ4h1g9F0OYnJRG0LZa0OYctSHvAYiJSK1MZWTaMNydfATTIkOqSyKM/php5mXZClmHCbYiQat2KKP76MnwB86LbkAQUrEkGMVWb4/UMlOGEOSAQpU7+WKpzlkDSYYVQ8VaNkNtSrVSjo90mKPFNcjXfVItJ7QSK9QQkFArtmzRRIDq2xZrCCSQMs2Ux5OtanD0r8Esx1D3vjJS/x0E50LnILjIAyypUjmwBrJLG1I/bpoesGEszD4yMHsvMxWu0GfKDCxkeUqcRIOM0gzMPSgRaIjmTeLRQmiSZgLw4W9QDPHTQcDFdZAinwOcCY0mBUsZqeyjPhSEFi5lEhmA+zgEO2gROjUpwhwqyYX8SyMJy3zOuPZpzj5yEKZv2tTE/sarJWScG1aSmwcr0oqBTHWIbj0DTxkCrX3SpymET62NrDcLbIXzy/i6I5jaQFAYALgTDxEKRV0MQPlojejKaaQ3oc+pNRgOLAkIQc3m8R55G/CEi6EgUnfZ+vO72LGa5KDp4NXbO4taenGnPF7b5KFS+EjPfSQ5AkJLIgWOST8Pni7gk6TT4+N84wFmRITif6ZB+CaYVexsSCNztLk9q1NR0FakBOVDjYOvegjrRuMhCGbeeBtHRB6Ht9x37JLzQzuvfkCCwuO06ks5W+//cYuwXoLwcwu1h6w9BDHtyEd+f25F4T9rtVEtFH9+uhK5CauYtXtsW6e8gR9hLOAsxAM1cdBtBSkAM9Pt3oVArZts24fNxsC0jbBB+WUutZKwRqcnik2ztMtonhI5NYKWq2m+INeUroHzWOEMJQbmpOg6hZIxwzNQRjsE5fVrhns1RQP0Jm3WPBImACfLzLlklJmgpVvserW+44jBIXZUAcIuJ7cAD1V3ADO8lF8AkLsZxVcci+P4ZJT0JDIpB9Dyg3KWmD2ZmPOwn0/QqB+1j7qnyVbctDCN2vYxVo/TmANCRQnaNO/h3r8A/ODg7rmFnWPSvAdBE4XcHS60wBiZROOcp+HwTytRY6wc3yMFOEc4L7jsCf29p5g9wpitYh50pzoSIAwMsh44o1DjuVMIogDGCcgLwZuFv0UsYSAEpyrlFwC2mwoJIXjR6IsMBQi6og59zKwO1/DEMKcTEmJRLKHkDojJIFqppE8lC5XHc2CgPJ4mr9Dt6OrqDuN4/7YSw7H3md0H4f9A83J0Wsc1iB0J/gYNUhT6tT0192iaIyvzyfg91MIbSLuJaGMfqJ8PuZJofjUBgyYt8+9kCL+0EtueROqstzzIHID/x68DXIrhghUH0R6PhYjBBEtniXk1J4GkW/6lU2Gr35lW1Ujn8SYgeS8Ev4oKWDNkCMexwJZvqiSKGWGv403SnRfcGinroYq4qlNA8maLNl3Ovr4lSPRRmDeV4rEBnvCHBgpeMvN5vJoEvvcDSI4swPfnczgCDUxiAXCEZwEXojBuHzRYwQO9nlg5Nl086lR7st3PJkAxqYgiHna5fCEFZSKTkXCwfWHS6BBmDFFQLBjQ3jhL9miQsYvCVQtAhRWkpYqa+iogBAaKhEOsLFjQ2qH7aaM32fljKUprwFF1Zbh90FK+WhdtvEy49JS19gFeF2YSso5CoebWps7xf1KdyjviulKWmmMR+YE1JJ+hCAP+zDd9S7DNYCIDZs/Y/IUGC4JTNGrAa6JFEhbQsnDVfyxJl+2XOw0H0dlChV687HvCY/miC/7FgLOhbkF8cgCEzCrp2kWcaTOIKR3SSVAv1w2IZ8p7QWsFpSexLfguDF4McReDFK3IiUo96BN7oOSCUQ7eZSZY2Nd0pCIrr7MCOklibdU2Th6iAA9ROJFt9zc6kFEHZkFUUs7nSCWQf1KW4ITBUSAE6RYBLH84piBE4SqBu+ovcW22V/ZTkEI4Zgm+VUA4W2AW3JUgXEhkAM4+Gviz4qXMls0hKePoA0TRTWgz6gmwwXZX9mT7acFhu1zWhQLNVHZ4WUmXPVmTeVuCO22u82VaDZsNg4+GOUFDWA121RCWlfbzkjZi2V/noL6ze3C6iyr4uiapOWklLlYysWJTMLFQMn148xNOYUsqYkjcp5r7JyLfimEjVkch6kd8Gxqx8ltf5bNQ9WrXEtFw3lzz962d8mcFinP/XgTeRMpRZ4dyLIJHq9UMSE3QXHErMjNKf8LwcHg2adQhWfMM4wHDtjVCBFPoiALhENCdKq2Y0QDBDDgRteTUZJIaKW1S5q40oq8buNdu6uCkAlsTIT0AwisgBaE/uCIgtsIyQbgSAJytVSFmYZ5nKe6hSo+YIyGbaw4Tku+R9GSsgHhtLASEoEsNgQUZSpJOYJPOSgJKKdWGFeosf0J2db5CgRb0DElqKVJcYJrAXPCap8+AyEJkBduuIffUq5FvCBhQk+L9tdAGF6pJJFwgn+rTEDGLM6ak2lpEqLKJmInCNWKGFOaAwgr8qU40WJJ4YYkNQrdo00CU4dlWwGPSJsYoEraQFI8XW2NtP0vJcZiaJKhyzSM75Ac7ArowTc8iJMWlej5PsPohuoZpYRrKl7H7QAgHssSyLhxpCvTbjUJWEkxBZiDTSVrWHarKa5c9EJWVe7pyx6WACucRFEPdjGNM2UViLJJSVumgZUiaQCHAkw7mnCFAXHFOIi8ZOlmywWveVFKIyvBB+Z9OGpVC20y2Y1Y292NKk04GILF3T6QrbR2bDq6Je0K/FShVOngh3CAUtnnsVM4P1vpSFoiUGi8wQ/ZA4aMeKqJSCJdeJH5pEkIP5/BLiBWZSKRviJsB5BHnVZw4C0xKna9vr0nLVvRQ8+Ao+1CVjnLp6sdZ9QKzcOU/widJyvolJDiHGwPwyVUr9HlaVegtHDSnkM6GalKOrBQLDcEACi2RbbV89OIN8rzAjMQya7se+r216SokpXqRmhlPIbTRHadQfzIk6oyQ2/MQ0umkPCIu4Wkk+ctOIVRU0+W7gtEFVfsf500ltbKTR95snfkRUvzCqOze4v9RvFU0fxGGN1lZsmytkvFfTLkUh4RdDGNndAruoZW64qAdsALptzFW1ZN7TSvsZnGZaSCAqqFYuusyLzQUXdRAnVDy7B6DaLVLlGpstZZST0iTVvTnTKQHnn1SXZwkeQcf/g7bgJ8Uxqw6oogMifHZ0f/P7rIjTNcue562lXVLI/R9mLIRFgN1v1puXtlFaE6cTlHfV5FTuOlkyAwrFounWFFIzPF10MJsuziMAGJwRY2hHCd4HAUTUomPYKW+6kUWKvRgh8pLivIjSe5i9wtlZtVMjpY4W8ExbK/K5AUh3YcWSPWesaW2jgPVCKlIEWjqKxDSnULAKnYsqwP/9cqgarel2NXsMjVCMNnDrWlnRv7MglvtLuhNnsOet/k06ko0Qp9QlQLQYAIN8XuCSLMLkKeibuZNnsZ8NAXE1ok8V2AwSk1LSBaxRmK3Js6OEQhwemrZjElxWHgYS1DwnEFFsa3wUR0qHkIkhQNoJQMYezhdGbcuwtCCP0iQqdemI/RVCBSipsbmaXc3MgdLhk5wMWb427EeTjkFbRJUg6yUleCBGwsbBU1G53gbUQTCjg6N6rXefNwAfOHGjXYZJE9ctVroVZ4t8Tp9rRWuGiBdyWdHvZZrFXcSxLO0612noLmKo5Pt3pay/1BXv1pHB+OveRRNnIWjQmJUq7o5mNBV5+bVhhD68Rl1rKTQRFpa3sMmcu4M41zcE6u7OjIrpMkVdy4VbFguQnxI3CMPjX+i6p/5ajQ+0xxEmTL1Q0mcUlX+jBkVHVg+CkjddmyLjpDqm5avUWwKoxuibi/71aCjldMqYpa76gBkdpVJDnFAr9lohoLeRFDm3gzpiK4VW5aCFS99dPgJCSFxWyJleUsKodkM1psmbew4PJvRX0Pt8gkBXBQtd6YxEYsc4v9eiAg4Xt/b29nry3exNChNUgAEyslkvnZg8lgRf6qLdL9AzDs1psxj5ShWlF+4JReKRDtsapE/7sTfSUHtX2rTLRN3c5HAfRqV8ykhmVQaP6O17xosXrsKIN4cpxn4ndLJ7EaJbasd+norErrao29lAWV1PtIbcLipGO1Kz1wZkMw3VK7oAtp4kasKO5NtVAOkgdshQZ4DUMASuQxX8ayxCNLgvSMd94kxMXb47cOG5L5iHLVJ+wkgiDjhHsfV0lq6068apZtwRk6zse7v+qal/GAE5Aw5WaH80cUgCi85d5kJpqf4t+WUDSCLRF2A4q8KW70rT06Ma36QuEfLj92c+qlF5liYkjVbP10mpNYCQ/ylU1tRQN4QUbYsMV7lLBs5yEHnTCgVOpSeBjXDswDnYP0PrULgjoEDli124L6e0rFa1cH6bZHOeTVSJJnqt8j1AFoxGq5VagDqUEJp9IliO+Fe20G9cdFb5/ufTYvdzJceO751abgonIFiFy7puGFLQ90vNkm/+nTwlYX+/CZ/pHZ/wBQSwMEFAAAAAgAJ5c6UqJGv3HABwAAHBUAABQAAAB1cmxsaWIzL3V0aWwvd2FpdC5wedVYW28bxxV+56+YUg+iXIpWawQBXLOBCziokVQybAV+CAxiuHuWnHJ2ZzMzqxWB/vh8Zy7LJUU57ltL2OJlzvnm3C+r6tZYL8jaxkxU/OJIU+GHb3s3qaypRdU1hTdGO5FOWmm9knoy8Xb/eiLwCnRe1ZRJatMYbxpVTOixoNaL9+H3d9Ya+wxL+CzdiHWyWkmtVyuxFL9Ob81nub/HH+V/NPaTKXYU4aZzMe3x66oydmVJlkc/9FZ5mn6ZTCaFls6JZ2Fm74KgyjRXUcAW5GC7EP80vXBb0+lS9CQYWZhGuMDqfphcgOR+SxbC47/vjfD7lpwwlXj74b0Te9OJQjaicyQgUQBQzWaE8Vr4Lc5kU+yBVZuSLM689FR1OoJotSNBrdH65e63jjqaC9mUgc9o0EdyTdBwoAdW9OhL5luwkCeoLHBt8IeqShWKGi/6LTVB5K18gEZCG8+qMFYUVngjdkSt8FYWOxzNxZoKydplTR15lqwWXQstC8qiRhvwCeAScHC7W4h/dJ6taxq9F/RAbCZIg7uyvaVwsJqmJIeQ+BeYgcX4pWku/cB1JGHUeg7OYLATU7ERZOE7hFo0/9geC/HJRK9HXFYgGnV2JeBMtuzsahGC4Nb0c7FFsJSBpdgaA+o1+Z6oOXCxsJHtB3HXsJCl4rCTWvzSqEdy88FxoN4iI6A6qJoNMCEkx05hmgdIBy5oBEvUcoeIg6GcZiEgWCWVZstobzYEre08BN9WbbbXTVevEa+lqBTsWZIrrGq9sS7GSGsUlIXZopRCBZ9X6hF4fFswJG5O0rKuraWKjq0B1T6rpjQ9KHxID+A0JoPOIAwE1ySdFx/2fgvA0pBjJ7bWPKiSo6+3sm3JAo6FV/4Kwdb5IMWlE3c/HWLPjK4bjJcBQyz7rXJs2WdN+TfRaqlGnuqN3Tko3lBU6ZN5PbqH9R6HQ8xIjt19H/QljdNElCwjPkMr7QwrhPvFmgMUxh2uxPWFHOjZZM7UxEG1tmaHMIIZauU4FRaTiaq4Si9wpYP8K9VURvx9KWav5uK7VMUuxL9iPYk2nsd4seStQsSAm+3gxHqPOKhkp33gwmexYqL9KuB6O6uYF+lmOp+g+QWaDuBVM8tnKJmseL79DlWT7ZLEj1K4xX93i6ryj2yRW9PQ4SwCyRLOJDSKShvpZ1OYYno10BwEOsMx9BvY+8/5nslA3W85Se5td4Iw9L7x64w5xscwx6fQbEI4vxJvlqLdc7F7I14tvsuBu6CBJJ0uxV8X3x8hpa46S3jHrFfcRumpdBfikhbSbtyvN18uEWqo1SiFXERSpOPGtfHbQUp23Bj4CSIcMyCKPy3jOLF49/72/uPT64OBpHL05OSpfwYrJ7cvDx67HnvsLNMoXN6Im/PAx+A3f4SzPI6sb8HkMD1LhoqDAaAjZApnQDTwaphYYn+b8dtc8Dyz/BElA+0rjDL5S7pnybckcSAu7BJYguf4S+AZpSubX3zsGmaPY8+07lCBXUuFqvaHkgxYbgHhfg7+fD1/Tplliy2hfGE4+xK+9yffVWQf3R4IFlzSmzIoeJUJT+Tsn6G8EJ95jCgNV24JDZvrtcZpKuQNDDlHeLgwvXqqUeHUhjur64qCO/56n3BqaQNXGAjiRMEyyLWmxbhxmW6znScUN4IJAFQmNHRepNyU8ggp9TTU+laiewnDScwXlapCmyQeiYAQdMwyBAMktDxpDfkI1eKMgA49i2MccmGdQgeNm4fGjns5Gl5USdYZDX0PzSLar2rgnjS+z1Jmx7d58s482T6/J1ezI/ccA/H9MbwD6yvlOzLGgrjG+jCLINzB+uFTBLpKqcBd7/8wEWrpdkMReRL14fQ/y1xIP9z9/PP722fi/gzt3S/3cR1h25j1v8VwGmeEo8OFpY1C4NtkNca7mqRAwL4TpgmWz/EokIYMH4bHocE2GDAwGjniqHNDoy7NKtCf9uU41vkzXdmLF0vxl5ubQ3FN0TBImwAnT0LlJKzS3YfYygHTdGcC5gU3pLl48WLX86ckb/T48+vftMlj2DX91qkHqXkdkg+Yo7koTPOVKx4mV9wwkVbRJMOo9bZFboENO0wwdC5CaZca+S2OYTykO64czvCGE3dFKJ4zN+4bCslJimdoUXYUxsU8w5qmUpvOxibO1SJOWWiQO9q30hec+wktLNyoGlaG0S9ulDz6avIvNxY7Cj7Ewexotvlq4PHrxFlH3p2Lm0iYB5a3HpMnZnhKc0saNZ6OlCG9I+vRdJCOOf2SR77N/xdcj0vSch83My68mO2KLT9/0FRTnoWS1bk06LiYK+vS44meLm2uqzw4UxnKfBEeDmDtU2EvHT3QyPsKnIJNoMb2FZe1VPPN4J0SZYeHeM4pjh0uOxuu5r3i5w5w/4lXj6JJVsj5hBRkTDJAvvDrRps1uuCJpXIRej6k+XXCxA3kTJlOngIaNlYJJ89yX5nGD9OvQp4fgg7uZ8U+aOlxVl/HGq2K15xw1GzCgvY89rkiMa44fxQ/p2HG5T3V1zPNZzqdcnWJ3ZtJQ4c3WFQPxSQ+z9ioB8rPgKL8H4NALgR3KK6H4QRVlsGYO+z3IT0yTa7d9Ngqm30OQb6m5aitxraWdRktckdqh1b1jXoz7f+03ocefkbx3wFQSwMEFAAAAAgAm5aKUaPnZtN3BAAAxwwAABMAAABjaGFyZGV0L19faW5pdF9fLnB57VZbb+JGFH7nVxyFB4NE3LDVSluiVCIJJFa5RFwaRVFkBnwM0zUz7sw4BK32v/eML0Bi0mylvlTqvIBnzved23fGrlaPL7js3HgD6HlXncG4A5e94dVv8I5ttVKFyYpriPhcMbUF+hsqRNAyNBum8By2MoEFE6Aw4NooPk8MAjfARPCTVIRfy4CHW7uViAAVmBWCQbXWIMP04WYwhR5qTWc3KFCxCO6SecQXBO7xBQqNwDTEdk+vMID5NsV1bSDjPBDoSqJnhktxDsjp3Pp+RqVpBz65zcJbztgAqaDGjI1fgYwtsE5BbyFiFF2BdCvHSrDPNAAuUtqVjCmtFRFSohseRTBHSDSGSdQgBrKFe29yO5xOoD14gPv2aNQeTB7OydasJJ3iM2ZMfB1HnIgpK8WE2VLgRNDvjK5uCdG+9Hre5MFG3/Umg854DN3hCNpw1x5NvKtprz2Cu+nobjjuuABjxKLEtpjHirwrcUiUa0mVDNAwHuks9Qdqr6YAowBW7BmpzQvkzxQeg4WMt/+oh5EUyzRfguwLeg48BCFNAzaKk3aMLHeXWPb9bYAnFm4DPjfJiImvEbVgTPAuD4m6G0mpGnAptbGm/TZhzz41m2enzZ/PmgDTMe28t6AzuP7ByahWKpVQyTW4ieBWLSyiwuHCUBmphVIZmBYH1/lBDkCRkPpzI0/EiRkbEl1+Wmg2P/f9fMP3G/B7ZzT2hgNy7fssinwfLuDRKflxGuBkwez/WXv7dMBnH3NG54k4AwwhM67NtwZ9Enm9VQFaJycn6W/mIO0PigUNNjU0V8CSWwFbHNjhEEu3kkJaMVNsDQVhy+7RQGFuin8mxJR2HV/Ymgt0M5jZxvgGBbOZ3dCzmZV/9mCHZDubvYoy0xMNKhfaMGLfpdOAHSbP7Efs9YGtXYpxkvOEAuwoJVXN6bzEVBYaCjn/w9bHlqQIX9tYd14bsJSmBc4rvrfL+fbdcWkc18zULM++G/X6DoiRxtdhFVakiZ2/PTQ13Sn0oizO2msTN0QM3sAVmkSJvckikhoJdygdq7MP5EMWqWRiqTWfR3st6f/F9B8R07+hprKM8vrtDnxuL0dC0O0IFxcHd6V7693c+pcPk84+bIU6iYy2V+LTbtO+1WIl5/Ri4gfK9RcrpjQaPzvTr5OnGLJ9d0kmCylCHlhh1erw656j7w28/rTvT25HnfHtsHfdKjWi8CLYmhIoSA93S5BIblD5HwPd1LBWLxFUYUqCuucikBu9v6ZTJqtJZIHVlDcenn758vkXm+yGZodt7NfPETZ8MYoVfKeaxMlD+mxI5VgyJ7JyAi41UBlt3/w1h2uZ+nXq5XKV+r9i2t9w4afOjtsfKfMOTzn6997A77fvbCdr5dAafzs7H61DpnIjcj26LI5RBLVvR105RYOcFnwcmLPXItm/o9F3oBETy4QtD4DFThnwvX54n0UoankydgDO3lxg2UtB08cKjXhu14CvuL2I2HoesLwQLTjN/jweZvGUj33O8rjrXWb7VPkLUEsDBBQAAAAIAIKwcVE5v4QQ7zkAABZ6AAATAAAAY2hhcmRldC9iaWc1ZnJlcS5weZWdXY8lRZKm7/NXhNRaLS0lEP4d0b0zEtDQU1oa2KLQqPcGFVVJk5qikskqGrG/fu15LGp7pWGkXS6SrJPnePiHudlrr73u53e/++3/to8//fOTL7bPn3zy6Rdff7p9/PmXn/z37T957+9ufrc9++Fu+/Lx/m/3r5+/2j55eHm33b/Z/vLwv+5fvXoe//7xx59f3794/vbhcXvx6v7u9dvtRbzng5t3H33y+v7tfXzyT3d/v3v18NPd4/bw/fb2N9qM939x9/bNi+c/3f1fzd4/vH4T/3z86eHRf0TD21cPj/n6i8e752/vXm7f/WqL//FRzx9p66df41E/vN3e++T3WznPI5r4zbd/sH306tX2lPe+2Z7evbl7/PvdyxzJJw+v3z7ef/dzDPO9N7//Q7yybX95/vhv21f3r/72eP/j9v4WPXy7vX3Yvvr17Q8Pr6/xx1S9uv/u8fnjr8za9493d9ubh+/f/hId++P268PP24vnr7fHu5f3b7L5mIi32/PXLz98eIzP//jw8v77X3np59cvYzj0+u3d449v3s3hn7/4Zvv87k30dPvz3eu7xxjNVz9/9+r+RXz48/sXd6/f3G3P32w/8dqbH/4xU5/Rka+vjmyfPUTzzu4ft7v7+DvP/vvd45t4ZasflHdPu1q83WKt33v+lv7Hav7EB38fnf51exWr8fjukx/85hT8Y6Qvt/vXNvtDzH38Eg3GQH8Js9q+u9t+fnP3/c+vbqOFeO/2r0+e/cuX3zzbPvrir9u/fvT06UdfPPvrH+O9MdPx11i/bOn+x5/CBF9uMarH56/f/hodjwb+8unTT/4lPvHRx08+f/Lsr/T+syfPvvj066+3z758un20ffXR02dPPvnm84+ebl998/SrL7/+9INt+/ru7t0UM5m/Ncn/Z4q/jyZ/fIiZfHn39vn9qzc59L/G8r6JDr56uf3w/O93scwv7u7DorbnsUV++vX/aw1fPbz+m+ONj/xjQv+43X+/vX54e7v98ngfthPW9x9WN1r5x/rehtG/+OB2GyXe9Pz1v72KJfg6Pv7Z/ffR9GevHh4eb7ePH9685a1/+Sg+u9dS9vdL28u2ffN1vPKf/bd9+sWf/h+dyu9uouGP7/822BD//vPd6xdhlc+/e0Vfw0CfPb//5fnr/xpOJjbC88fo4lePDz8+0P/Yhz+/fnH/Kt743354+/anP3z44S+//PLB3cufP3j7yx+O8uGP8ZHHD//Z+S/12Lb33//nbf+g1zpLvFTHfPfSWMfgpVHqu5dWz5fKXvv10nG2o/PBvR/XS+caR/MBT17e4T7eWTT9e8o0b//0rrEP3yvvX7/+fvun+oG+52n08eHH3/jc6/hgdOfD90bfy/vx2+//af+g7CM30q8/hT/8zcc9/45dUMd/waSyUw+vY5u+ectm+vHnFz9sP4RT04GEu3n6p6c3Nx8/+fP49tlfv3ryyUeff/unJ18/e/rk42+ePfnyi2+ffhT/yyGMWKhPfnj+iGGFUf37l496IZcqG/jo488//fbrJ//zU7re1rwajv329NtnX3772dNP/8e3Xz7906dP4+/v3YTTLLfl2OPH2OdtdHnclt7Kbbjl4zb+esaPo/LbvB37Hq+VteJ9e71t84iPxQLe1qPyibLfbrjhMm/aUXp8qLXbVlf8Fosd/1zxhK3327Bg/lrik2ePH+VYt6Xw1znO23Yu3lznbeuj3NY5Wrbb6k2hW/GGeHob+22nH1uPB9daxu3W+Oc4ox8tHljOyWO2g/7y2zhuo8WdgZzx11az3X7EPMwWL/u3Ek9vJXo07eWKdmuNt5boWzyw3dbOX/vhm6MnIyat7WfhfZ3JuNqd/SbmyMlrDHen5y0+meM7b+ty4G3Eh+aMHvXo+RFv2WJ7M3OxGKU2ulN51jUPx34Tw4iZ2QfD3VkPfuNZ8a7odOk1WmNGSmX2d2d6sSKd/sbU5owwQZPfaPecN/Hx6MzAHs5Y5/jBimMUJ+ObffAj/jp37KG4RvHo1mh8sRj5B/55pD3EEG5ieuMftR08eGBsJ0YRAzpbLMV+VtY5+rGib6XHPMRrncbjLb1jhTPm64z5ivUt2W6NdSsrXt7PMB1ntdD9PSa0HN3x7Sz7zicZSIw+ehVPOKK1bcU/482OgUl719/eb7bzHAxyMfpoPHZStME/ZzQU4ztYlOh5i9Fsi04U5mbE7Ne2GNypsTE3YTe2O/ebmFrsISy0rpi80mJGtjk1j+j+Sd/2M1obDDwWLoytMy7MaITBFj4Wz7f7aWexcW5K7HSMs0eT0VCsP/bDjg7TiB5hsDsDKRhRiyds7cBGBssS1hJTEO/r7NVRr/6e9SZs0KnFK4T9hDmzTaLxaIglZt9P2j3Cuks9Y5baHp1uaWeLN9P9au+G7dY91m3Rt26P6MKMbsVsMeZYxlJifmNlFh/iLd0Nxswd0cYR6xubFscRyx0WPrPd2m9i4LRbY1ZXjTHXeH/BpmPZ6TStTXdU7OP4a6GDYXvxa3SahWoM8yhu+rSz2vebGEuYLjs13t+Yt1ioEmsUHdTUGyvOazG10VW2MP2dbL+wcT6G7cWzyoFnpd0xb8JZNNqNbq0T053xYLZa7LlYy8E+Hg688pje8BTx20FXC1vHOTzCzju2Z7sr9ltnQy6808maloldxvLEszDik/GFoTQmOfYPdh6vxTs0+4PFi4GMaDfW/Gr3OG7iDUQJ9xEe6DzcfvrkaCjWHUMpfBInwW5sbKs5WVA8ysTi3TW15jy0PdZtRgdjBCws4+vFmeZds/KEk3lgkhsD320D093xFPFUwjSmwGjW1W7dw59VtktMXiW+NFYrBhTd0jHb5NGxkXhMGLtrecQui2UJA3RcB8uNcy+531qbN9EtTZewgHfqMb5YWAOE+56dR2uEtnj+wUwTUPWTWzz/PAkf1XCX+62NGv1tvEwAjl0abqA6LToffafTiDscOPdOk8u3xG+juy+MMGE8+7WPY7zMryseC3CsmLIRTwhTiE6X8Bnhegc9p13MtBBfR8xIOCSCVqxg/LPxw2dd7QYOY5bjcXTrqDofHB4P7ge+YBKZCeILd7EOnsVeCVNmRk7CuO4qOraObLfve/h1/TU96jGrMSPijYn/462E+IOFYkhhQJh/debsJcaDB4opjbHW9OsdXDKjWzEgAQ6+Fktey/f7I9btjO6XgxWsLi0WF4Plr3hRgQJruc7cFz1wSTTJPBDJA5izUzGPxZItlmxihSxo0+UQ5yNgxEBihNHzgn8SMBFN8Ci0Cy5pMauNmBO7shAWjO47vhNjE7B0m4znt6l3JPoQijHd6v4ZrKCegnYDl4QtE7xY03ngRfCJUzfAihN7wUVYF34de+z4B1xOZebigTjQeF/8ds1D4JIwUPqG6QxWi27FFJx4LHYvXchQfOgaDDx4BXxib1jtYZODP+Q+7oFLIthiOsSydbDBcNrN6WbJBuAAXx84AxNnwwy8x6LxMvG60YlwSAb7tLMBLqkgsIHvKqz4mjYeQ5sRh8LX4glj8aI1onUsVNMyzli3gIEYRSe0Gbxb4rMRuKTRhY7HiKjX2AhA5eh0Z0fHYwi24gfA4oqp6vQ3WgN0hcEW5jA64c6/+tvxk+6Gbi9BSgDOziRjFG0CLCYr2OKpBcMOUBmd7tN9TLwSAOyu/tVu4JIC4IwtDIYmVODhC8A7lhgXdRDOp1uHKEHsNezT6VgywnMXvzDgPePmAJcAHbZTt0EEi8cDzYAThO59EDQOJhTIx6NjIODv5Yw4TLrKhg1bzHYDl1RbY0BhRAyo6RoYfXQ1njBxQw48PkksixES7mKqAlZjD7uvsWsuXD3BJTEsoD29HK4ukID3C/wPkpKKicfSMHD8Q3XmcG/LMA5Iq85X2m9ggJvObo+FIh/SA5i8GOQILZ3+VtxmCyOKDgKMd40NH0eQA0wFGmaEI+dhBi4JW2G2gA5r6FwHH9I1AHPZHIVVPYvR72QTMbXNTpAvxLNiH+JHRu7jWNiIQ8O++VatC/8LLil0kIynsLeaZkpOFT7iIBKIGrBRlrYwrt6ueQhcUvVip+8/dNBseSbqBGDhVDaXDBRbQekVr9+NXDmG4swRlK+4Gd4x/ANWsED6CyA7q9tPTwikbQJewCLhnA0THST68fwTt0l3NlDLVq88du3Et5MFYH7NmsZyok6MLTrY3al6MVwp6UkMzqwYV1qZB3ae+fHsiR9W4JINH1OJeHW5ZzU2no75x/Yb5AYEymnKzTSyL46l82FwRLWJUc79ahdcwh6I92v5nWyMUZk/FQAsALIxJHLmWFB8jLEJ+DPiY7HcjTHgqVrawxKXTF4m84qAwfuNQ+wygNBGQnHw1BmIKiaVxSB8HDvulUiAwwejE5Fyv4WvjXWLRWzA4oYPHeDfJtAau76LvLCy2HSVeFFJuwYBdQNZhmetLBnx+N08BC4puXGiCzEPeic2ZNIGPMFMebJap4bdcd+kTIe7gRDPxIev4be0swNcMgwyYcTd9KCf7gHGV3QlODrTz50nGDyrgIwkY4EFSVNXB2K03McRUCI/Disooi1x1FqaEwvl2uMEjbjr1DzMffCAhhliCOlZOKToybxw39FYN4AAphu/MapFyosTNtsmSQ6QZWZE9koqdjKaNUR08Xw4nwAywIMj8cMRuCQ+hH8I516JoOH1CJk5ZreJdklO19i9GPvZSbF2DYsUS6/ECgYwynYDlxDkcLgA+qrDwzUAL2fuLcewWHuYIablZFpaxyjZ2627/Rj1zH18BC5pV39PVisaOtzHPF2vBy0T74tZ3YWG3Z6z9jrrQ/bH6CcgveYhcEmvJnjs9gNUNjpNNkCdmDRj78Fq6XcY8wITTxa5Y9jTp1ZmKfPj2Hw3YUgd3KUpGHMklk5sVcKByAyrQ9wuu20YQQlQpBZlNdMYcH3N/p7wJWCxJlWxAbyZ7ioBBAKMMdLVBrVEFhaNMAaipWSXyT/xdZjvzvQPJ3zJTH9CvMDHdJYxA+UAzx3M/oEVgreW7pgOshGb9A2Oo+JCwjUlfjjBJRhsI+xWJi8+DiToNsnyMNLKxJ8D1yA4Oo0w9LJpNzAsh1E97SxSWNZtQXfIduJSTeUhAQh83UxKBNjJMsO8+SuQr7sY+gAyLmxpXnnLCV/SJ29txKjGLtNjsjlgQAvgIJrEpk42QmdGZAcE0tooaQnRLBCG/owdGHgy+tvAbkW/Dv4Nl3OSWROUpXEApnPZfWyVaN2bfl2WT6NkRs492w1cEp1hz544ppMtZArLh3ZtZItlJyOouqEmLYJ54G02Mp3wp665qc3IdgOXxIeIpI1ZJSUjtSjiEnxM/Ci0KxWGt4EYaFJ3mFjZTRUWvwHmytXfQf4WvYxkktAN+wFw6VUezxkBDst14CejXYaLD8e9NWkOcp4yDQLJl4SJVfoLRXr6dB988APoS+BJ6AtZwKM3OtgknA8cObBuw+/EZOCk+pntBi4Jo4uFhRkvkDEBCcj/2VutOdPkAQx3kp503gJWiE/4g3+aoUqaDPcFGftNdJWRdv2OjAyW7CTjwLr46DSWOV+QJkZh1hLaoK6EM3CxPdctHMpNITxWWMHYiwQ0fC27vfHAbuAZuF740QGZWCA6G2lJwf9WcGpbcoAZ5+NNEd82cmEd2CETPCXnSCZ5677Lc/kE5gboQHpSQG8B46RvYFga23/kvojEPuJ8BScSuhfIcmVCwT42+pB7nfIPJJM41VgjcAkOl2S6nYmdCQwr7awELunDeSgO0m7pTc0q2BKFLChMt5H+baSklX8OksjojrYHHVKNNdc8BC6JD/FKbLBB/A7vze6hhLLv0gEAABKVSJ6YQbwzYYxCQYV53CzTgBHahXdIDyJuYiatOmaAQI4Ucg44QS6xUWppsOTDYARpHX5jx9Fg7GSj17Qc2S64pMgbGQ+ZowXgJC/brEtMM0q8+TLFk25vhiCewIYZLDLIfTNxpt1GPYDsdU7JG4lDqUF6RGoxAYTMUjTE7mWX77tGyawmrMLEgchH1gNAe/APncfpnVi3zmqB1Cqu19lfcOOk/BveuRbBXJd1xncKwou0/DW/gUuiDdjcoq9lLCRbjR3VXPGls4T7AiTBY0YnmFWgJF6pmeXCJ9TarvkNXFK6L5uy8OAFLYIjb+T4o5hek9n72nChCPGZWOVbQNhwB6Ve7QYuqaxbh8IbJTcd/TAsAakPabKEAmxwPBCIuZO7N/xDMXu1ijdXrlsLXFIM7FhtAcMOk2pcVPgu6TQiPm5ICv7YqWzxVypKHQpxFG0/u5P+N6Ym8lgCIPx6h2McMOIDqrpmHbKQLQHVF3Ql1tXgXUsVARY8NmQtlYFasi4SzbNuulntV85lJw8AzMCXVNNKSmnFakFxb0Onke9GwjZpUuwh4byy3Ul864wAkDZOYwldAKGwMoNZja5SvsNFGiP1cSQjFUqjksoPCdyLT6WEQ7u46ioMI/3DavGT5bTTw40AUpNolfjBWRe3iY4OHJX58ZH7ooFLYGJjHkBlYCbIm9KSkyV1q5K1dH+484DeU2JNJq/wVJbFclzyO7C+4SdBQMLt7dQDYJIk1WCxulxVa8rkjxD6HXagZQe7f9WfyURnHOryJXBEcJfRkO8iz8Ho504by8kwMwEYL+Ycb2dpCJxRRRfiWegT2w1cUsGJIzIVTJKsqYnnbByAhSNnxWO4bmHDAuk9yVOZzC8BJ4PA5R86fElhfM1iiomjntiKpCWGqiWxqgZ7ouXM3QjrgYk3QfspHZL7Ih5805j7AaIpblfwWSNkFoDpcJfXTCZpsusiMcVJXFl48ywnM8JxzQN8yXALWeedWoE5oKkQG2w4XArLFFMobAQgc+2dVfNzkgaQLUiGduMV5kEvMgndLlQHMEBBw3CUaQzRvTkQrNtkb0p4ANxwtIcV0Z52NqjjFFdcggK2ngpFgQirVlC3Yg0GJ6Gdg5SsUJPBVGJIcxPthtELp0ZqGniH1BRP33YnlPgyRe7kQ0uajtSCUBF/xZ8tuX9Nwc+68EzQ5XcCnwSuFsWRuuFSY1czetjcaUzHT0JUFeiTBuPf2JfNLbwbG2F9DcoEEtsNXNKs0B7si92aqgu1nHOSajPPpf2ClKzJMbWmR13LIOxLCUJR2+7BfhtES3IftRGUYqP3ppV03x0CYoS4jK4Kunhgt9PsKf3ToZAk250763Y4eZDc+jOS1AnrKuCGlA8vhhFnCk2Jo5k5kCWAGXWbh5vzzPmd1HG6VnCYWEGWHmIbVvwQLzM+y/D4ImueB08AWBQqh4X+Rsww0l3tBi7pSED6bmlTYgD3ttj3UwvFO1OPrUWCnIgEtd/0yUDJGAi1GhLGvVztwpfIjFPUGhJhZMCx7OBw8JmlYwxgFNlOXFkFz6JvKWc1BZFSkYjM/RaWFPiXJHWl/eInIWMoQw0LaA1uxGrpIMferJ0NNxFPaLo3QxXh47jaVV+CQ6C809y9p6gMV8b7N6lXiOxqgUc6YJL3w1G15OGbwQg4MxM/zMAlhdJm5GuErCyWAUQOIscht0haQDIJlIzACFKDO4hNwFvg4UlGmkXhK14s6zgYlvNA2tHpUafdDW9eoPBaBq/FLLmCPoY9W63ywE7grFu94vECl1CbK9Uk7rQkgsFY8skODj65+MHSnv6BRNBdLil2YBTWUmf6s2UdR4aMpzPIiseslBgae6Az5n71CHy2pMnA/Io7NBT1JfizmXWnGP1+E5tEdQLxGwMYsjWguGa5s0uqOqF4CoEFmBSJzSBQjipSO90FV7sLfrL4BvEGaBbGtJqx7+yQk7yQgUNLdxQ6DX60q11YrAjbNAZHRDqvdgOXDMY81K2chnM5WRwNaKSRMxd88obKqGB7nTSx6TYBFqMmxoRLSp1YbOzIAxozU/T5MqYMSMKqR4+GqpJp+XvKIggb5T0rAwf1As1OPPGeOpB4VydeYKtwcCNHCnl06rtIu3B9h9TOqXcEi02L7mBXUGwHFS7XN3Ug4bCo42SmikBDcqFaRTroNJPcXXsfTU4nJytUB8fBpiCj4Fl+IvfbAS5B8FDRP3TLgqz4qDoEWCgKQp0Obs5ql/6D/5WRxwriNSo6uaDX/KIvIZWvhhueOaiZ4DjoEVtY3pEykCIT6ic9SfPlW2CCgdkw/f2qX4TDCjxZly83VoFghNrJSvkhfQw+I7A3PMXAADs089YQQag6m6wg5e/4kf09qeM0tXQwheu0v7ZrG7QLXIIGrXR6Y4OXmRIbQhBBuQMF8L/jnX84A5dU4ktsDmPUCR/vE0B7XYaXIAMMxMQahc8GXzPYJpU6bzVHs5Ywr/h2wpeQZ7Vd5JGitcLTcS84MM2jqziUwaeGt0thArrUbOFjB0vW9ws/nPAlhPOm59RTFMEqnCzU1YDNLhbLTlgzlrFKr67sIBhhadhAw3fzgL4E04k9YyK4WB4WCkvqcpZgoGZR6zAy2rjzAAOwy3Vg+8PdmPZ7oi9Z8NvqgopIn85suVr2l2CLyATvsZEgNMvazTIfEb+qIyWaoW3aEA4HLum7C8Dj8ApNPzXlSU+7xdqTrgJEijW5rk5MsFwIWoQKmIguE0y7gUs6zmJAkY4qyjkMu1gN0igKEIWq0JDaH9a9rBXrTxfexhpmaheudtW9VtWxOIkpAqOXRlAy1eNwk7JhaBIg3/RFpzK3NF0mHrVZz7wQAXXkF9LNUPyqeaU3wX0NLd8mabHJ4ODcVw7EUrtzQ/QBd2LibX83D/AlkBzxIfA9SZSWZBEB0NGpFtQhmCF4FWM/VkhFqSuVWwAFAUBLHhxpSbQrGWLCxFajdt+6ZcFdJQ9uflm5c/8o6/SBOMvd7QdYhi+p/ZoHcInrPNVHkSZZJcSHdwomnQ0e/aCrBS+Go0v9JnCYdLJRXWgWD+o1v+hea0m87PLgd9Qf0K7wfU/zhz+rIhr2RddQ3Nu4Uhx4s6aSuja0iug9D7oF5GIeDjJENH8FZ9lVLtPfJkENm1GzYDyJBMrs7AmgciRPW9G9tkOGQW7NSgb1GfGyO8+SJalYKVoXRqz04oC3xxcNEvdaVCAcV7voXoE122JoqgPYqR01Tq/W3V1BhUiUqSXNHf0hPJB9Ia4gdIiweGa7gUva0tvs7k8bx4cbWjLBxBNT6AIkddcXPrfuwmyqQiDAYWqMGdku+hKU5/F+loxaRRV+nPLx1mDYfuxGOOE2zOdxEgCcYc6hPKdm2M91Q/faqxVahWyACFizSqeLO5Wco6AEG6Ri0XOtBWILKY4MR9PBKLq/7AzdawefFbYV6RyGCGtFNWQJeoDl1F4LTq1BZAwLLGQrHaHgqOrJQE0yzLSL7hUZR5/yr01TxwkC16ZyYMl7MCkkd4c+GdUM3EIp5GAHviv/v/iHiu6VKhyehc0EmpXpAXIVV0sKmm1FsZm/wqEAawyoxKFRXendmJB2hu61VbNisoVZ9VhMC0mRNQ3AzJYSYVkotp90MPGt77rtaX9VLFzrBl/SpdFPOVxkDoIZ0j+ZYEGoKgICasExN2BNJ8gOAFa18EmE6TPPB+CxbhrApTULXokGIHx1A9Nltw6JIk9v1xQi4aKFLu4k/qoOpI+r3Up8a3osxoIrGfrr5ccBbm5r2Ansoct17Hrn5fuY3/ws5pk8LUq72G/EFwvGaKQLCUhHdNlRUg7BASCpwWtH99kDwzFbDRFMUaQ3v2gZj9G9BlJyAfyQTTI+HF7N18hRhkbsYxi4TpiAdhjG9XbY3qxXu4FLhs64Uc3DlXXKDhsuqqMQKm6wLhOAmzWP7XIzxYyAGjH1a11ZzfpQVfdK/lTxeh0t6MCLNfBZlUhWwLWs+HqoARrfQq3ZHYKWBqXSSP5HTT6KUjP9hXXFYLeiZSiUNs7iBDVdZAt2BulDRUvYPKlQPaIxcNY60GNlu4FLCsWiohKgWGvzMAjpcj9UWLhG0AE4YfjGrrYzd/Qh064eHcYi84uK7jXSSlUwoC1N/ZRVEfexRqenVNhMpG7SXkdRa4FsAQIBpLgN91u/5iFwSZc+4ONF/gxbqQoxwTGVMLpBDBfma1RzOojv3S2hetVO8BYgpO0GLuloM7auwJ6BL555UBU69TH6SbpK0aWajR7q1Kx4qFOjAA1er/tlD+het2bt1SICMQqRR2PZG96xNS3ZRYExwIVUaLJa5ISr2h//Cii4cEm3jkMcgmTpfLLkaZXUCoGJiWVQ8J1PAmUIPGyd0x9iMF2kpGPOL7rX2jyCgiGy2LEoULRmcmAVdsNoKTv0pImFZRJyo5qII/Vc6gmudtG9enYAfnK0dJFmxazCwdZs/sHSBeedDnGJDCF4oLmFYR5ZX2CS7cqXMAUqoAQdu8VpMgI1+EfOmwt10EvoQvpmpzGZ0axcku2fyZ9BMWFn6DKVM2JJuhc23bAyu0tNnsqgSF6ycXJsqxsVaEjNaoKBRtbfKrrXOtXhqc0AqTmXyFU3NIJdlbKFR9XiGHunklxUGaXSpMo3At8ve0D3WkiIKxCxQgptYmMY/4CImMIupYEQyTNbTeWnjbugkINutWXvch7QvRZzXMSkFalGW3bhANVLwbBQuzaylFfxvuZ8uSVAb0q23Vg99wW612r+JpW5p5yGZWe/gbYGOuTuiZAh5IRQL7YBGrLYK/dFTtfauvoLLmmuaXGk5g2Nf+Jhda70CK1QJfq1ogRwCAjJ30w1JV9Pn3+1O+AnWXZVahZTNFPjN7x5W2oEDRBy7lRv1MOQrRTyhQrCHk1e41o3dK8jE5XTXmJiZFKUjluTLNWBYv6MgVIr9TTPycFrdBOERsdEb+l/0b2WQ2Fu0VnhSuCeTCF3a4iEYvo2muck5FUAWLAeA8VuQ0TZyFX7fuEHdK+djVAlUEHfhW3SSDJQp/FJol+3cahnNa4oBVQVbhQlKJG13bEmf0bdPfYxAi6VsIh+mg56z6eDq8nLlMRjBRvqnlpUeFD641xoh2aOxANWKXnPqu4VNnmjtrItJZwepyRNXCgvZdBP63rDgbAH2TBYXPM4E/CgeqRuXvaL7rU0q3+nBzFBkdXzLYN5Y1arI+Wpnsfsdt8fPgv6BJs+3P6p92ShIg7Jcab/A0AK96cKST9uB32N2Is2Wpva9Q9Z5TYrJ12+eAJ0rx0rHwCtqpzQTwKh+vREyu4xBCyUYN+s8sCiNrYpsbyleTa9QeI+dK91tz6j/erDm7+RdLJX6HRt+phmaxAI1IfIuwdl0WGd7lCheeGzQ1wCBkh2S05pqPYn2FsmgVCiylNl9EgQhsIpLK4OfQCrpeh/f9df6ji47wHHuFm/NYHvHtDDFzS5xYljnC4oWc0Ql/CJLHaw5qR97bIHdK/bTOdq4AEzkV6zAB3c1fWwR0oytRH2mwibTceEDrmWZbKX/FlF9zpamjX2IM1QmeTOE9iVnt3lMMjQzaJercSQzfjqqdFTrs78Inlw6JaI8+B1HM3AlQ3WqAuH0Vj15pEvyi+6UgVnaFxHFrqktIfTjYln3b+ie21QD0Uez3PYzXUe5HtE7VP5hFDLGi3A2ONHaNIqktetO1UefshzVIjOIx6zP9Xin5qpRy+0H7JtUremzpCydve02ZTbqxqsAn8oRA9tX7ha3Ssq+9IV3FogVCIA3uEEwoDu6R6C291ReA+WdjT5dcxI8UrLWJP7GN3raG5Nkh3MqYGEt+HByjQxoCSZ3DJHcjOzy1OKfriZNR526LjaRV/iWVSV5ASZIjVYJOLQwnpu0CMoHK4oMD0VTrZSryxFPSQZn6qP63xLRfda5OWoLDXUjaXqLlQeUfyxrkZBqJXstJbBBE2nWw4duofunPvV39N1AwkKNZZ6NRkZ2CJyVsoOEJlI8BQV6BPVwupWFHIQZF2CpZ3BJ4Y/W2wEKFornfJBClWSssc42ZJD+hhucZBQFFBZOzwEl2/GKLJe2NS9KsHgmGaDKysEmYIKu1yOkXXzrD40kgq+bRoEAJVkQZhnrIrnUvdsF1wCZhnQwkPafwMzTUn21H6rnwR+THtuak7m6Uq7p3CbytYu3rOpez2UHmiSJrqUuuUOPB5Jol+nu6HIU0gU+T6eJTxoFhyx+NRzNXSvlSyo4x82SSwpBRKgwvHetvTmVIVUJkJ+bmglC/53M1c8rMYcBqgj2wWXsC8GiG3kKQ1AnQyvRUNcQ/UwoLXMjKXk5y0r1HQ/QSWtJI8Iqx12Rs5qGOFUQPc8AwG7HGooTK89qeohOHb5EkB2D6iwNoc/oHfTnzV0rzFSzJpNt6kfr5o/mCkf6Gr5SbYONLOHH6bzZQHYBFuN1371F76ERLdCpdZhjuBiozFAT9CGSYm+U1wErdg8FESgPjKFJTcxQbjWDd1rzcqDWNP6MWoyJnk0ESAZQab8nmNtkhsn8wvEoIa5K8g9nK9cN3WvDKgSnhoscUuVj3yJNi0AgBiAiR3UlGN+sXNjaUJkSDzrTnmfQkP3OsiPN89wqJjNzAQg0KXO9BkEReXv0DhV54MGv+8ex1Mjrhwj76to6F4bs7WhkKnFFP2Q0PFEIIGkyuqzt0+isMIlDxmSFoxEx+z3UzYl/QO61yqbm4Hd1OI0PYH+W5opyy6rL+dDQyUVeUyyjCLnPzzXYVmJdjknrMLWk4kwXrWoDDzsm5NM9lH9EDmSx727+ixW9fBEF8IMWIGW9diG7rVAsA01YcrzJOLMomtua2baGALGg7eqQIyuKQDIimet4TFHz3psQ/dacW5F6a2p6fRUIfQxVj6QUw5WsKshJrvraF9qqs528zyxEnv1uOaX8ziwHw0V1+geEfMIP1IjE2Lev0GidYB0ZSM0yPvBjCAkIfOVQcJ71ZXtch7HGvT0NLzaIg+ddrNdsJUCSEmAjJuU3kxhCXe7qjOVkVRwS8ZNgPdNLZa5WDd3WfcCGa8VMARlphy7N8/VYR4cYxko+htljz7TMpnfd+0GLqmS/b0oLWFHU0fpusjibzZJMPLI7fL5JORdq3WXUY8Fwu3JVzd1r54A2PPCHTtjTZesiYQxUSH205X6e+4LTaMHGiWD1O4Sw3qrV7ucxznz2CxeBAhzpCPlCdXGHSkhqFg3VV4LdwtpkodToVm6Jp7nyeCh4aMIT8XlUQhJBkE9ibLOgH2PT7oEIlGMjSyMykRZziHQEM6/XOckmKjYF+a4iBt2i3uWArpG7wyG6ZL7NBBuY9k7uc/oVga656K8YYhEKc+LNHSvzSRmWP4wWgmCm0vs+DyJ5jygvB92kFIEkBOGeXRdOr6+5/nupu61eVpG+bu2DavOIZ5KalF030h/mzcoIRFuXnlzyCodKty8rgCsdM2DuldFl4elUMwkV7z7T/A9MQTOspAB191QkUdKDIssgQBWhjnvU+A+gZtWhTVeBNU1ddKe08uTCAYKKSRV2cdqrj3vTypfAOHNs8OgodHbNb/WcchWFLIp0dX/ojkZWeSUTcY1jZTHOKviPq3AabEBwv685vdgv3lRktk2tWXODrTiBqOYg1SiHR41dR/jHVV+4kIGJ3BHN3/TXWXeTYwMv6M43VNRzTM1iHWnp6S1KVSeZh9IFFScmybKcHtTDKdP6jKz36920ZcAr7ZTYEi+6WGxboWY9ChVIiBhDpB1BXqSqtP8QrEwcFGToaBqu811szPw27sNmVOBBojuXZDvRrDMR2455OWqWRjrAAj26OiZ98M0dK+dtLl5vBWdwhA+o6LdnPgzyRDkdvBhSBG3Uwytf1Lb5FEyItK68Dq619EttHsso1hM8Ugm8Nli+ul9CgA9FVvdg9+EJfyIoi5vqBpmNZkfIzuMPNajheweCIq23KnqfdRTLREKpUK9qNeJTCOSY4B12FW4wYdd7U7vL+F81q51EWRWUkFYcvVZnNzDSQwjrhuM2q8FeaSpjdy6ezJyJH9G7L0patCHdwxIb5pZF9fNeWDnIb6CtOjJf4BLNk8KpEraERJh8jx6U/cKA9nAD8gIYV1xIKpKvBAslQWqUgk3OmtIaJUxZCSdhKqbJbyLF+pep5wAUrWpwXISuYskyKR6TqOvOfv+xkx7cQzZktc+dW1pXvNAHQeAPLq61+qhZc8pcBKtKk1lyQhtSpK82mNDpewxfbLyQnVh5GTMtDN0r0N6nCPCgx8F0UYpilopS0recAVGWVYhSO8TZnvBiicKIBCEsuPK39C9bl475y1Bp+QcQkwqYYUOtmlEmM6g1oI/A3BzXKuCQMvwh+Hgahfd6+BgwmZqcSgKhIQgyYg1Eua6zpjY8pP+NnkMcbuYxyoxN+Knn0T3OpQFEyOLJ59ICZtKCFUozfUgu6MY2S1TeG2YBzu7wmA4YXPFdflfdK+161SUFDc/SdhVWVDdvSAqKnzU4jtBq3iFgeJMp88SPu6tlIsnSN2r53/xnMn4kx+TB9QlxgSE7l40ZjLbrOOrhT14DMsN6Qhf3ffUZTZ0r5VANbxrjGywwp0W79FKVgd+BTTSUVAX3bfcdDeDyrG6GKKFax7Qlygb6J6yzzhkf1n2Q6ctOqbd4iy5B/0n+00MhqHuWQBJe0D3uqniOmyIzLqbzEqBL+M3yYBX3mSehVcQJxPLvGzPuSn6vdQbNXWveduAJ5q8+cTdgxs6FLtovwgKWbLRPZx6aIr4DGOjlklmNNvV38AlHVaympxJH3vJECtekGLXLhDpavmsbsAEY+dWCY+8uQhMLF/9rl1wCVRbpWzVdJ9o46qH8UA0vZgo5RhAWcQrrKDOvIiF/e7ZI6ufF45C99o8Swgj3RDvja4MAKygShiYXZsyQhCCm9nqclPfB34AMw7Ft+PKs9C9bodC0+pESXeT6C5VHRBQpp+QJlRvujQ+VtCKF2pYOTxsEplQS1yN7rVSEm6HfFBe4gcaGV7XgulSzCHHH8Sh7l1cVi1SIkblG/3QIMvt5eovutctg8yQrzZyCBZZLbI2NMyDFK+jFepNyfhwXF7UhBK5+paDH7kv0L3W5fkWL3yAnFPc0PPpPpBEGxChSHWo7SQicXNGbzLMlDOGcuQLp6J77Z7MpsSAbIE3eOsY4ESuV34Q+zm9CqTSLTATy1iU+qugIeIP1ai0i+4VDF2rJ8O7NohLr06yjoYgp45JYhak1FRd7Kpg7Mnkh1N1rRt1nKbnTEROKoS7oPLdUV72JcvnDaKkBd37jYadxoyWwQjLBLNd52Y4QBv9BdYwloq2qFEKLWfez+LVedZ5NQDCXQ7cfJ5yIGqDorLBMwPJe6LRjnzIWZX4MIxR32TnjeHBWZ0VPtHbE7XzKbk8fYtDwiEVa2Er20VfwoMbx5eLOm9FECNvSeMItsUnb4CB8zn0YvAE3LI1OBXbPNOEXKpfOryu7nW3jm22K8OBG/JACyijF5Mtr7Lh6Bs5UuXc2SZNBxk+hsDRKuV+zS91nOGJb7hTBH2VokCR4qouT9WHc63A7jW4PDprTHYVhvBw5shbcl90da96WG9t8sgKnalSV94nduYxAA+YqvfkdLJGDOtrGOdATRUwXToQwCVxU8sTVzMFhhsZMojLLL2REYA8iqeImf3G1HaUc0Ps0Uz2Ug/T0b225fwyD2ojFB57NEqZzqHfoaxDVBts5qagZap2zenzOjZwyWW/6l7J6HrzLJaxt3o6jfI+cd5LV5CoFVRZvQnmrIbT0LTkhcVDTPeV/FlH91qRc4+hg+7aFPvTCfVGV3YNnGUp+RjfrGXqfFhVr+2xjp/xoqN7HVyuMLzng2raUEBlIRqU02XmFStIWgjkS/5wocBg5vgkoivrpt37Xodn0hBIkJT0PGa8fFagMi/y2SwI4U+t/w0vWgRRDUEBjWfQGNf8qi/xKIzZArvHe2dx33Wp/wVHIazpVFRqz4uaAEJgUrWwqjkQStae9XluxIw8y0sCqn3zBloqrqfdJ14Ux4fDh22lvjq8gUG8rhIDIqdMqyDlardyT68RdwhwIKy8sm5pBRg2rnrLJp0CCBLXwbq4J4ZRylp2HqlP5c6AmwIuoVLEWylJN1X2hn0a0jHqu5A6eTdmnl51CdDz1ry8g0CdeTfnJ8OvZ9/gz5pWTuBhv1Ft2tSinkZmtEXKTWCQBjRHh40bpJ9DyRdFAdtFX6J2S3mTmhZlGcviSPGfTiNetEvrkQKQS6iuOfMSYgJZ0arSztC91p7vIht0h2j+Sx/ODDoPFJ1hA2s3RnopFEkkizE4jTo4iNrX5XfUveJZNqLV4JRnl62Bse0kk+V0avVAMIogquFJ6OF9QV5p7A0MxLAzz1lCu5NnyVxoWJ12LRhgsNABxNKqvEri8DSN8FYldNsj8wV64i0SWW+BvOFeYb0uwVY5blXwRf2NxC6d9uFld3gPz/1KLpP0ekpvpLED5Ms1D9RxPHfgreBF0+FAqmdTFMRCeLQMGjpLS0N21dPi3nzl8dOlT854ge61Ur3uyvBbzj1J56nY0cqLSwakJokSPnsAXsbY1GJ6NGGJ9TNuonsdskDIhSoJZq0mO3gs73SyhN0FoXiAvD1GXpAO4i44FcyjiVypy+zqXqE0+lJ0aappZXR587YXQ/pXHsOxBW/ZolZCjhbDNA7lVb5cGXL5B3Svg2mvwgpURsUEL+8D8UoJ0LF8vPfjQh936pXDSx2Wt2+CuiUiR9771dG91mQl1XnDDnQdmLYKiCCQdAuay/QeEmJa+dGF6BXyMdR2UrfS0b1WZEjbzFtZfANxSPYF/lV6laNAFf5u5LmD6rSE1fKxbVoaosg5s77Z0b0WisNdYQ3vH4jTK0rroXR8eS8gMYey4FDfDSBDM8trnIYi1gCm6irXunFOuAjlZA+72h51RF6/zbbOS8XsDIRHsp0YFrQBUW14mm+3fpLnLzq614a+rnkBB/fUbDCrQ5GzekuqsP16zf5GXJlCF65bVnTkgKFcx7zsAd1ro7bS4SerN2QTqwdlh7a8ig7r2pWWwK4tCwXkoATDIfPoRTcwmmPmfTZcUxp+3S8doApAulirN5PKSuI2E01zKuFaPBLXpinSCUAlJOVGltvbhXfQvQJ66Bt19+UZOovp3LCj9FcJvxU24Z23npFnTQkETpm2fL54Pe1seB7n1BQ8Zepl9FiNZ0A5lANFOqbAX5um2Du9Up6NeJV9mVp10O/mAb4ECx2267UfFF0axcvmXUoy85DhVVFKtcptaPPOGDCunLs3Z146fs4Q3wxyqiGFCHE4YPm6RQFsdSgsd/SeEiFQVo/Dwef25WEuCxt0p2S9kHN7N93vG1hZAsR+vMjy8IJBCAQChAh3Kkt26+gscfPemUvSWb29dmS9m7MO0V/yIbNHjch7qUb+5mIzPtM5Iig2XXe3CdBQqsTzNeQy6K2yXfgSS7wAww6pWikaNmp91SvrPVVOUl8lNXVvpADde3rEv174lkefe/p1dK+bZAQ9GiC1oaSC0zXdM/XK3IYR1GsIJEgoVYIpGnewNG8fOhXE5nkyqu03m8Ia3RZ3QBUA71DLLUNG5buqwvGIchG1HArvvEILhJTftYEzufCkutfTje6xOJgTiVHc7BDgeJ0e3qN74c/pZaB5ENX0zLiCbJe077r/DOr1pnkxoyeaSE/68i45cEm3xu89nIATlwfJePM7PA5PCpz2ibqIt8Ql/0CaxLrZGe+HAYt5LHD61Qx2EEgikeKNH+as7IuS43IZ1YIBZy5/hu61cFJpeOaDlKV7ZYdpsB/yayDymDEjxWOWkq7fB7LSesDh6cOrv9z36t3PxfxNZTjawyln6dcEVP9AQ3lkkuiuqAHmkfLaQNLWPDPbL7yD7rXCZLWmxolTplNH4+bIJ+D1hyHbFffmIKtHDhOkZuN4O2+lod2D+/B0RyRFeWU95BxFot7Nbdn8kCwbOqp2esE3cehUfAv5ygYffgsBnAjtonttHoX0hjO2d/d+8G648ZsaihfHQmF6vpxjTVLV3vWe8c0FoqBw6Ww6utcB3G49r4blwUu8HE9XQHCaXkthLrcJPrF53yv1VXJbQZfyguv+nY7utWScBa54faWX8DZv6KMOCdRpyFh68UZBRfeSQdOek4bLcDcbz3hxyJcALk/9jo5cUa3cASl38Z7TvHwRNCIBZYXccn33y0tgpvLrODK+qXudOXr2gAUhZ2upJPdKKA/GuWTM+fKv7EtSoSlBTkaCJbf6bt24Vw0lwpiijK4KECLD8OwDD7+SAGjm93pQs/fbc6YOSeyqA2fi17rmge/HQcMwZr4f1VdeHoqrrroSNnjzlAqm6Llxv69jeVBS+yVHczde8QLda03BpFiTTI4ifTuNh9QDlkUBbzn0SpTmA/FAFKcthHs+wStWZ96H19G9Nmk9Dwt3+dRT+OyY/UITbQSA43xB1Ktd8ErCkdym9714D/3VLnzJLnrxklqP+7k8FgBkbK3oGEFTkwt+UeQCmDIZkPih2Fzb5dfRvTbmbTNkeY+AG13aVPnPFFF5GKQ7DyT/2qNb2O83oexBNXPMyz+ge20UB4rfPKA4qHukjtokuUSzKqUCVuGdlyowq2PpLEmjCLLd5HDtV3+5V02kT6IwvJmuet9KfmcObn66j9jqksvYqsQlrmnkRViHn/WH/mGoe11p2ycvYwBUSDgg171fLm/5hjnRiMAgw6thDm85hBX1WvqiguVdu/AlCGirdz3kl8PA6EkpezP/NB56jafDRR6Y6I045IaBBev49bHSr/NtFjdV65LxAcgOv6XIr+o4vZNHbtzReMGA5ErzQC5b8vD5YIrTGxiu/sKXLK/zP30D29UD6+5jT3ZNe+Sz2CHU22Uslsyuh06ZjJJx8+ovdRxcWYEc65458fyvEiLFGOgXy/UVQfp/oqoFrG5rBGpJaB1Xu/obuGRIPo6cN4hRDyhPZxDLd7HVUHgFkvd4kRJ6cUsXA7EbvT2x5fdqcAnuTSEObF5Pp1hXsYBiMY+QesBU5tpvx/BKQHLLAac2pMK85+/065POq13uVfMIoMksxbWxshoM+2Ha7llGDgRARVXwQIFnGwpSAWlDwdDwUrF37Xp/ibNqzuq9Zp7V9MAQ9TfdhQTUyi8/49HNO3nAv6dfv0CS490jeY/3yPte3aTGIQUaUApD/hUCwfMahxc1yVTiBqA+xnL2NSNDmwctEkdxZV30V+NE5bO8Zx/vv1xszx3gXkySvbHcW989nng6OE8NeZ7Y0knyqdxEFriPYABr1bHLavonuWti5f2Iysxk7bCpxvnRAWLu3p4ls5tK5OT7uKaJc4B+4Y/7DSOWjvAaD7m90x+YkwmQtLTLqPyo+1Q8ICH7TH/GnTiRbw6fzpR1v3CNJSbbXS62e5tz2CWfEJ0+FIeqidArWOvzdH3WA7gIhXNqukPelaVFb/vypKwKM2zVR5OPGa2tzHIyaJg8kbW16c0k65oHzuM4v0d+dRYkjw5a/Lv7TR/2nIGTZ5FYjaXrVQdCTMjD2LBrK+9d5GaBiJtM3qHvMMEjFTpSrW1r3sNG8DxsjadO2wDesrSHF5Wi7rn0DxxYv+mHr4AGYH078q7ulyR4pBjtVi/CYTgtUY4AxwvfD+UjhiVyxZU8LYeGYx87jZqpwWg5eX4plVbghSmsan5fHoFkaHG8GSpKjkF96koehkOMN9vpd2B5AEZewXside5eCu3pQwfuN8R0v1jLaYEUa06GN9f7hOxv85wwFUTOr3cv49QaT0/k6dQOn+AXTdq4o2HiwQ+Ht8eQi+tb9sQPHJeK+MYrgmsaH+lKSKy8RgOANcRAQL7q4R2/bHBq2HpAt6QkaZ7f5BDNTa1egalyjbRSGZbKIxiZ3nOWXHHLgoZs59f+2lWGpE++4hu619/f3PxvUEsDBBQAAAAIAHCOi0rL52dmPAMAAN0GAAAVAAAAY2hhcmRldC9iaWc1cHJvYmVyLnB5lVRdb9s4EHz3r1jELw7gunGLANcLClRW7NSov2DZKPJk0NLKJkqRBkklUH/9DeWvXGoDd3qSljvD2dnVNpuXH+r1n4YTGg3j/iTpU280jX/Qldxmo0mLLdPUyo3UQlFsMibpaGx+S6UEvoui1DIV3lhKlWTtKUVOp3GEDrX0EshHfmFldmzJ5OQvcCJ/wt6lYsdvaKXRDp92Z2z9AWKaGbuPp5aF54zWVc3451XCBq5dhau2nlrxLXW/fPkLFBfTOxQpRfOQ62jOju0LZ/tKYqO9lesSZbbc7d+IEI2F/UUzqTZWFvSBoNCTNzSr/NboQ/2wSsm1FbYKruWWmZzJ/SuEPVBlSkqFJsuZdHt6GOFJ6OyjscAXJpN5FUKlzlBOUO3ZFu7o4dNkSSN2UEpPrNmimlm5VjIFeCRT1o5JONqFmNuenRoEIclBCA0M6Gt3H4glzsPdL2wdIvSp0z3edmBsE3rdEj7oRzd3AXgL0RUpdMMekZ2LFpwrzUjqmnYL7/ECQhT6irGiNVPpOC9VGwzIpZ/DxffpckHR5Jl+RvN5NFk8PyAXTuMU/dszyWKHEcwIVVmhfQXhIBj35/F3IKLecDRcPAf1g+Fi0k8SGkznFNEsmi+G8XIUzWm2nM+mSb9DlDAfLQ5mXjL5ZHEOysLAyYy9kMrtS39Gex0Eqoy24oXR5pQlJooEfpFd9b96qIze1PUCcjb0gWRO2vg2vVqJ2cH0/dFdsJz728bQp5023XeRJPQvhRYkgA9kDuqBMsa2qWecD6njCNi7T93u3Yfu57su0TJB5NpD/cnjf1wqzUYjt6agTrFOt8I69jtr1qgf/Qs/0bhUXvYqzzFOE/az+vSAwXaReuM8Rq0Q6VZqPsLi+iQJJ+P9yRECmtPchZk+AHpyc//4Jh5hG1UOm+ikzrnilDx8ul8l49V4+tgfNRqNVAnnaoq9vNZl1dgVWBUYjJxWK4mNs1q1HKv8EA+PK7F7WmemNtUJnVP+7TkVBwcHVpD29ULNrX8JfQd968JKhHJ/w/avV514f7XFUvQI1tFv6BqU++pU4aGbKy0Kfl+lZV9aTTfhqptrBEroTSk2V8FxqNDxTeMfUEsDBBQAAAAIAIKwcVHgWSg9PQkAAMMkAAAbAAAAY2hhcmRldC9jaGFyZGlzdHJpYnV0aW9uLnB55Vltc9pIEv7uX9EX19XBLcbgOLdxXrYK2+CQ2ODjpVK+rZRKSANMIiRWM4Swv36fHgmQkMCGXGr36qhUbGZ6np7pfvplxsfH+R+6rN80W3TbvKq3unW6vG1ffaAtssdHx9QbC2qHciR926OrwBUkFd0Fv0vPs/F9Mpn50rF1EJLjSeFrciBTPloubfpSS6y8Fl+FF0xFSMGQdA4m5FtCK8eeigSsDHyFr+E0CM0XANN9EEbjTihsLVwaLAxiVpUdMtZ0AVVjTYWrIlUvLl4CIle8TDXPow7LKuoIJcKvwo1OchX4OpSDGY5ZUMVXGCG6s8MvdC+9USgndELYoSYd0P1CjwM/Pj9M5clBaIcLttowFIJUMNRzbOw1LYIZObZPoXCliuBhCE22754GIdZPAlcOFzw0810ch3etRThRSxvetPp0KxR2SjfCFyFOcz8beNLB4lvpCF8JshVNeUyN15Zq8Ea68UaoEQDeWPc1CYl51v1VhAojdFauLrXFiCWCrwu25v3Dm1NeWMSmF+TBG+FyZTnXBOuTuiR9AzuG7fELAHHQOWhFA0EzJYYzrwQEyNLHZu9du9+jWuuBPtY6nVqr9/AasrA0ZuG/CElOpqCgSzhVaPt6gY0D4K7euXqHFbXL5m2z98C7bzR7rXq3S412h2p0X+v0mlf921qH7vud+3a3XibqCrE0MRszz8grEw8BOQlgSVdoW3oqOvoD3KuwQc+lsf1VwM2OkGAU2QiR6WIvH3qBPzLnxZK1QV+THJIf6BLNQwnugH0Z7wJl7d8SSO+US/SiCiHb/+LBBV0sb8ghoBteEIQlugyUZtG7GtZWzqrVykn1eaVK1O9iZNuH6q3rJyaV46OjYRhMqCxmjp4jKH5jz3H4FOr9q95HC+7qWL221ejU/221O9f1TomiGTjxtm51m/+pl45oyyeWfLhvXtVuretmt9dpXvZ7zXbL6tTwo7jW/iXc1P6hs007Zp6onSUf1T4anD2vnqXU31zyUK7+eOopG1jJPrqFgRy9SG3gsnnzIle9mXiC8kjuUcWfpUrpfd/s5qrl8ce1GqkdOo+OHM9WqCJjO7xeph8EQw3FZ6GkKgSDz8LRyOrGf612/+addV3r1azeu069+659e01vqVo5OzcC3X6nbj3UuxirlC8u1mOtthmqVM3QXbPVvOvfZYGeH5l5VwzJsiRqkGUVlPCGsX7+IGfZ06lEyGt74Jm4HgnN5eO3mfAdpI6Qy4ExpoNTxd8LkVAwSQDdCN3myUKxuBplbWWLF1o6sBjVigDeUivwxYac2YKl5O8inmfYLn9FArMHATKbEUkoNUkf/zjR+UojFdNX25sJmo+lM8bvoRQq2r5n+6OZPTJnXP5eSkChDphC4dieM0N9YaMAdChdGEJEeTohPtZ6+ur0dD6flydRi1IOwtHpNAzYxepU+to77fuSa5TtMSOU0NdCY5JL1lhPvAQa5/XhLOSKGKf2cto4ejFFk+JZboJWlmlU8m3psvnyrRxo4LBPVL6AcdP2+RDtii4U19yKBjaI9ezZMzOOas3cF8j2jidAIK7ecJQWkEgYoDmM6s3Qs0fsUF4KR/XCGboAd2k2U9f5ZGhc2DmONzOtw9hWCayBQJWe2O4WmzRsT+02SsVQi4cM6W0HzYYi0ADlDb8KN8VAQf5sMojazYT4fBxwwd6IJC6pKMHchfgojme7bF9Z23gohGtMXDIqov8tT/hpk7MYx8JyF1Eh/+IHcx9q/ZEeJ60uhysYevuWzl6l0t4xzRF4vrdARKDhQPyhATo7GSw0ImqtARHDzVmSl7HPpUrhLQPfHBT5I8oEBUZaJwwB17zKXXZSTe47Gv0FNkpLZ735ExLqxrlWnkCqkG5qcgX9JpOT0opiYXiQftma5n41/3/Krsx1uNnpyuNsoXX6yQ0vPQv9RIqigc0pDPYX3+ANzl/oxex0nGHPcKsrXf8fetknmpjMeJQTKoCjyxChh0uny1i9L0YQMBhqjnY+YZusL95waCHTZY7+JqZFfilL2y9WbOTjani0W+3f3mY0bkCCX4XMpk6pUMiCnWSwiln3/vOxpF0sbtJuRbll1c+yJj55eJRwgx+EE7AYNTJBhAK7OGAPz7kiIo/inlOtVP5OahaKteqMKaE2wcBAW8IPZqOxxTzKtg5NzUGEWwFY4CCp8cULulaswv2KF/KYG9rzRMIuJ1AafJ+PyuM60SPBiRBlELlkwkmXc6vBkpyHeU+5h0h5Ko7L3DYrHWdRJorSK+c3C+5KnfQj29OcFGnbRZ+UyPOrqOMLUbB8auBi4XIIsuf9UTJy+JoJU6Ax0FHN25Ble9lxTSkROgLBPYnHSnifSduZ9gdzwVzRZOZpOcXelnDm7m6n+h415lTOZXBVlxJoJteVNw2LxLvsa819J7ex3dbxxlbc1YKq2RTG3wpdMl4sllfLn9Rdbrvd7eo4N+99ezRgj10E96Qbd4O4M570Pq6cWeK0zc6TpgNROtWEEA1lqDQZuChXv6LKN+ecTk7wcyhSskqAfu6GrF3NkfWDqEZGNcBHdwEWMiPLuMyjh0OX5Ywl6IQGLGrM+HVlBWA2ZRwEGy1P+mvlUzJdJ2S4nH+7Os9N9xfnSKqFhPCJkS3ST2vg6iczWlvX+2w7kUvqD50fRup86INJnfto8AipU88J+5F65/vCgaT+0Pk+Ug8q/3ukvqw8ndSXlf8CqaOXmR/D6u3Yh9F662PULl5nnqn2IPajz1YHMDvCfCqz9yD2n8DrUqw0h+SlJDGTjC9kKV80t/RCEsvM1KrFfaMhiXFANFzK0YsfEwvbkA+LhC2vorviYOO9dI8oeOQF9YAY4Ffe78vt9h4Ny3kcLj8LKv0lQ2IzImobnY25q2ZiY+u1r/ri55z4qJ3nxwcG//U8BZUNlAPBzyt7BV/3fbP7Y4JvG/JhwZf/p4FdsZf+o8Eeobf77wgHRJ76nLhGHhR5L+PwuRiaaBJ7NFnrQCzRCin4CwVipja9rMa1KTHBb1PfLhobpWlJjurLlznxAZxEKORpqle2aKrvp6leQSA+r+56KF1H3iZk9HNnIG/mInZn49GH2FilmUnep97f/7D7VD70/1/E803q/f13Vts/+Sa1+w6VKIq7bk+Jmpd3b7Kf1in+AVBLAwQUAAAACACblopRxenwBXcEAAD/DgAAHQAAAGNoYXJkZXQvY2hhcnNldGdyb3VwcHJvYmVyLnB51VVta+NGEP7uXzEQjnOoo9p3FJrmAnUcO2fq2MYvHKEUsZZG9nLrXbO7SlB/fWclWfKL1Mb9UioCkWdnnn3mmRddXVU/8NB/Go5hNOz1x/M+PIwmvd+gxveqcQWLDcJE8zWXTEBPhQjcwLP6kwvB6Pd2G0seMKs0BIKjtBCQj9fYhw4lt5wiH/EVhdqhBhWBrcAk/zFaE7AdHsByJQ391Dul0x8EDFOlM3ugkVkMYZWkiOdXMe2wdgldtbHQ7F1D5/b2Z4KodPegKwTMnK+BGRrUrxhmmfSUtJqvYkqzaa5/IQvAM9PfYcrFWvMt3AAxtGAVTBO7UTLPn6QSfKWZTpxqkUYEoyL7RsTuIFExBEyCxpCbDJ6EsMBk+KPSFL9VIY8SZ4plSOk41hb11uw1fBovYYSGmMITStSUzTReCR5Q8IgHKA0CM7BzNrMplRo4IvOcCAwUwafq3gFyOnd3v6I2ZIFPXmd/W47YAqp1k1nHn6q5c4HXRDoBQdXQ+0ivUoIy0xC4TGE3pD29ECAl+kZtBSuE2GAUixYhkC98Gy6+TpYL6I5f4Ft3NuuOFy935EtK0ynVL0Pi2x21YAiUlWbSJkScAJ77s95Xiug+DEfDxYtjPxguxv35HAaTGXRh2p0thr3lqDuD6XI2ncz7HsAccS+xE7NK5ELiiCC3ipQM0TIuTJb6C5XXEEERwoa9IpU5QE4dBYxGZJdcVEOh5DrNl0JKQe+ARyCVbcGb5tQ71H1n1SWUsr4tavrAa8FPHXJi8rugEswpfMAjgh4IpXQLHpSxzvW5S7HtT51O+6bzud0BWM7JUvdAf/z4zqVy1WhEWm3BQxlTL1PV3OhMtVpxuZ5baqL8PNgwbdDu6ITUyf16ZJyjnabGRqMRCGbM3vqkVbzLjppHjjSzNLJUoAh8n9Pk+37ToIha1LRy7UdcUOvej5XE3NM9Jt6VOAfQLXCh116BdIhx8H5dIpG/57PAUgP4lDXcQ/v4MEvS0MHvf5yErdBYfx1Tj/i5FPfgmDaKlDQtK5vmcwH7LOidHF2L7+sgjxiXF7qHGjKzH5vdk9nPrj05zu6nuxc6xjOnM44/3EPnIrl+JRvpYpNCvLzLfMm2eKphNl91wMc5pk5rAgqUjHiIMsCTNC9Bc49GG2uZkT+x1WB4h8nUJew6NGbr/3+y+0TKQYgQw3yuV4lFnz42Bwle0MSOeh1TStlyedKdRzF5F78z1LiVR02ax6Y5FOwrNXUB7+eV498frVhvMFmOH/3h4hynfoyyl5qAfRqVt9SVOw1NI488UNTyHk8W/nO/dr0U+2PAhHnHArk5XCCHop06fqF1eH7rP6Sfka2Mqhfg/KTo75OJO934OYUKzAvbIKfQ9m5vC/uFNSkg2qW+aU85/u7b4p18AesX997tv5/f9E6h1mvyCXEVr5sfP5g0MIv42IKKRXz+saukkAuTA/ztcq3mQX9lBCF9MNV8CuN+gbbSuLNdU5brS+pwrsdhQd2/f79LLvlclK11OjMFn8ZfUEsDBBQAAAAIAEqliFHgl2FavwcAAPYTAAAYAAAAY2hhcmRldC9jaGFyc2V0cHJvYmVyLnB5lVdrc9pKEv3uX9EVfzBsQAu5dWt3yWOXEIipi7ELcKWyiVcW0ghmLUbakWRb99fv6RmBBIZUQlVSZqanH6e7Tzfn58c/9HH4eTylyXgwnM6H9HFyPfiDTsien53TYi3oWsuVVF5EgzgQJFO6iv+UUeTRrZKPQqe48deeTkVGgciEn8WafIg6Z1sNYyUzCbFP4lFEcSI0xSFlR1RDfiqy1PcSgaPNJlfS9zIZqxRfdRJr8wWK6SbW9tzXwstEQMvCaHxpytOsKylgap1RY9CkN51OFyqOijvUjyKasWxKM5EK/SgCG8kgVpmWyxzxNdJmDydEV55+oBsZrbTcUJvgYUZZTDdFto6VkZivC/zzopjv4128BqESIEAayaX2dMHohloISuMwe4Lnb6mIc/I9RVoEMrX2gVRGngr+Gmu838SBDAs+ylWAeDmsTOhNugX58/SWJiJFKPRZKKFh/iZfRtLH44n0hUoFeSklfJauKyhH7Mi8dIRGMdQb+N+SkLhn25x+nNAbp7u1VmpsIVZqeBn7j3Qn/LAJpwuKkC69fekchaCKNCCpjNo1koM/oBCBPqH8aCkoT0WYRy1ogCx9GS8ur28X1J9+pS/92aw/XXx9C1mkArdIsNUkN0kkoRhRaU9lBRyHgqvhbHCJF/2P48l48ZW9H40X0+F8TqPrGfXppj9bjAe3k/6Mbm5nN9fzoYPkCrGFmME8BvIO4hAqNzGQRJN4Mkpt6F+R3hQORgGtvUeBNPsCXRWQhwpJil/KYRSrlYkXTypA35IMScVZi560RO2gPF9kF1qq/LbQFb7Tot+7EPLUQ4QUzPF8JEOoHkVxrFv0MU4zFr3q423nTbfbaXd/63SJbuc4OfWh4fTTT5LP+dkZMsX9FMUrNM1q+xXenoUa7eQIlaPKy+MbHS8hNc9QXmdnZ37kpSAN8NJcZHwndCNe/hfshM49I27My+vZYnC7cBeXsyG+TD7Re+o4//jdXgciJNeV4AfXbaQiCluoXLVyQxmhft9PYyWgicoPCzhuysahhS/3r2pPcV/7diCGUK2EjdlZiWxizhquq7yNcN1m5Z4GPWXGt5Oe1FFxPg0Xw8FiPP1sVfwr0cx4WbFTWNK4sXSoV4ss18qGtnsQChGU4CzzunQC9E9ZMb6dUF/zvrICEFw/VqEMhPJPvew4ndIgv5b+RqDvg8pTg7a7BrG7yyITbqyiorHvNL4BMi2cNF82lheNb9+fO5329+e/je6ary8Q4gVd2EAPjePsJ4xLhf+V6TEvcp9iHaQHHrx69Wr39xdmilAqZhju1axIhOF0dj+t3nhRsvaWIuuRUCtm8N1JSt+89p/99r/vdsJ7LvT2v5r0ez5O8PD789859NGoervBrBO6x0yqMd9QViQi8M63/1grtSe7Nzz9pUrAvwg0RGnzKFtySHHO4xhkhMyCDxUID+wmbYgGG4QfyQ0oK6gyVJRepI4dGmGufPaeXzykrK5sMg8TwmoxQ2NnJNvpioSXZoRyPoWCXQX4pVzlcZ7Cv//lXIHGxdKPKg2ayTuJPN9OUIQDhCKM8gRHGLC+lDXddYg4jtLrhGeTiYMDSH0tE6TxaS39NQUx0zgPPRqWma4y5hytIasWDr03VcMTr2g0K9vl6NViJZ5JPCdgFDPP7TvEmTNCUVGH0owpL2vv8KtpO4kk1wHrAGyY8MqPcux7jL2FsRKtZ8iuaEIFVXDWD9OkaI0AIKFRt1X+l1rVvq4OX5TnPy9aO4VHPqbBKwgxto3nUlnrvb23W4Qd8ZzB0waLfOu1u3c1FTaWsZ3kEaNWhVuuN9ZCiqqxgLS2tWTXHcxd70Ddtqy2hVhuEeoCqyE6zUdqsHh5yEORQnEDVgpTpKif4FAX2izyNPLs+TrG3OTi4yGVeytUI1ZNk7dsjSYw6S8fHKjB5moaBBXcdPbuOGiXg0bqDELtbu9uT8LuKJWgI1NDY42mMV8peAca5lRe9F7ksG6FufqHidoJ1xJVsvlW9CconVPjlrzrRiLjrvkBp8+MgbS23N3fQ/r+3raW5s0Q16bluCz2GKds+hfEbwDiwWZ6vM7iRinnnKGF5JPADvzuw1Ha6EdpvHNgeDBJTpuQmw1+mGBcR0XF0iLkPTf2/VzrnfsfTnBeOREs9QXHqW9L38sYnXCIQ80bdtPmF5r688F4XLttmV8JMGzdyoCxAZobAnHt9N3fT5Bw1bVb4/39L1Hrrp6Vm3krXI48zMhqL9LikdfMfX5hh5gJsG2vRCMSypRQs3fQX3Ps+/glBKuMErYiuwrgZQoHAgYZWIKDLWPYH6H0254WKN61SB5+Y8s9Y/41de8O7A3Wwn/gznwSF7Dpxxue+WYmhPwDSTDb8xGsXi6uJoSID5u6ssc9+eFI155Aij+Y/4ca3v1Iw0Ln4gjtlvmus25qWmJbKm1bKlw9fLyteuk7jnMyoB0R7d5tryrueunrOUEnP7CY8jOz+xxCV1ozqflgy2Zrxob7UrVV/4cQSX1F80IO2EwdFav2fsjH5+C5kaxQqIA7Kn7IrFxX7LCpq7vmCRPXecZroVcOMhR0ue7h9wFoCE3/JOhBJNnP2QTdv7RUdtu2vut7zzg8koF6usuBdAzsXwX5AM4DXcfBPQnq3Q/m1f8BUEsDBBQAAAAIAIKwcVFc+zdIpAUAAAYOAAAdAAAAY2hhcmRldC9jb2RpbmdzdGF0ZW1hY2hpbmUucHmVV+9v2zYQ/e6/4tB8iLO6WtxiwJogwJzUaY0lTmA7KIIiMGjpZHOlRI+knHp//R4pyb+TdUaB1se7x7t3d4/u0dHhD112P/f6dNO76vaHXbq8ubv6k17wPWoc0WjGdGfkVOZC0ZVOmKSlTP8jlRKRNlOKYYsatWsvl07C8xMvWOk5G9IpuQMY8O+zs7GYM0xZVuQyFk7q3OKrmWsTvgCY7rUp7bFh4TihyTIg7l8ljMeaL3HVzFHz6oTaHz/+DoiD7hF1lKKB97U0YMtmwUlZyZXOnZGTwmnTtCdnsBDdCvOd7qWaGpnRO0KGjpym+6Wb6byqH9QoOTHCLD1LqWEmq1P3jMTOaakLikVOhhNpS3gQ4Ujkya/aID7TiUyX3lTkCcrxWTs2ma05/Nx/oBu2yJQ+c84G1dwXEyVjBN/ImHPLJCzNvc3O1kxd+0SGVSJ0rQEf2D0nljj3dy/YWFjofdSub6sQW6QNNYXz+aObcx94gqSXpNANU0dGBylYV5qQzAPsDNzjHwBEoc8YI5owFZbTQrWAAF/62ht9uXsYUaf/SF87g0GnP3o8hy+Yxin6VyLJbK4kgFGVEblbInEA3HYHV18Q0bns3fRGjz77696o3x0O6fpuQB267wxGvauHm86A7h8G93fDbkQ0ZK4p9mQeInlFcQrITIPJhJ2QypalP6K9FgmqhGZiwWhzzBITRQIrMl/+rx4qnU9DvQhZE3pOMqVcuxY9G4nZwfTtdRco6/62MPRx1KLf2nAS+XeFFgwRfi1TQF8rrU2LLrV13vW2g9jT9+326bv2h9M20cMQlpc+1O1/+kkROWo00Cm/LkpPoQHTRiM1OqOI8wKzXZ3dingmcx46DFWj0YiVsF4JEvgHW3Xe1JO/OHbYSawkvXnzJvzdIet9KCudPDMYS79MAjuAA8t/F5zHZe8EzQUkJS6UMARruCQCbyaAMUDKKM8ueoz7EFX107ZWc5syuhsmufTWfjQx9yJ2cAxY22mJBcZFTJTfKXwNUYgW5GTGUdDP7YB4JvIpgyNnN+AmwuJiLCvMNDe8kLqw1RnEJKQdsJFonXVAx8h6AfiwxrJ+K8Uue74k74iRlTl2nG2QOmiXgCS+qyk5awSg4QgLVUKclQKAP25VCwLxD+PCPAcxEaR4irnf6kyA2vo0ZQRSBC2Ekkl4ZiC6yOckNBHUGBCNNZpB8iYMTZAJ506m0qt4gLvt1mlVeeWJf2TYliW6Pb7XCLuDs5teKWBgfc4xAuJ6GX1aloO2efljK6c50MLY5eW07EP5xsA716T9F5RprcSYrIaTnmcSQ+lfjxhPkwhSigif4i5cnXFU1hwmFckpFknVRJlleIJ83bhI+lmF1T7j4rRage3sVjtQ0dodDCCkWw3fIPY1TnG3Wvd+v+VbaxooXq/nuppDpexj5bhnp7aStDXkp3q3Ayz/iFWRcHDah1u1ImgXumBRWPkjpTSFLvp30HvXwpRwSuOxxE+P8bhpWaUtslklXmXBKo3GePhZ0QWOdg7iwpixp2qMTsHh9NC5H7mxwvy/cF6244L60Jztc6/HYOaiFuZoyu4m2JrjcS4yHo9PtiMgBeyaJ41VcaXBn+1VtXX5prxHQTHWGDn/cKVjRVG8gXUUGrfW5Gemadgv/B70b8SGI17Hcu1SaWwpyi3vL5TVISgAgKmpm63CArvla3Ox2Y5vx8E4dl6vj5++xU+rENyzX+GhEs+2xui/WvpyW7fTquyrzNYVPG2y5mfSHx1XRAX9CcmWka1NKn0LysMVxFb7mnsF/3KIrFT4dTp+2l+f8Hm7wfbJa9OyBb2Rs+/Dyu/p1WV5e0HtlYNhV5h876b1CIKHYIdUBeLB7+5Q72PUndiBCTJRXjCuRPBVrKpMv29gLvj8MTf+fyhuuUJW+CFQiOlPIdW+QPsXUEsDBBQAAAAIAJuWilHYDB0JWgIAALAEAAARAAAAY2hhcmRldC9jb21wYXQucHmVU01vGjEQvfMrnsSFSFsKiXop7WEhkKxKALGLIk6R2Z3NWjU2sg3p/vuOFwhVk0itT54389582e32+wfD8V0ywzQZjWfpGMPpfPQDH8S2W22MjPZWbvbe2I67+soIcCs0hkrovBK2aJCEkZGxhXC5aQVaVkkHJTdW2Bp8LS0RnCn9i7A0QG32yJljqZDuqE+QHkIXn41l/tYUsqwDtNcFWfiK4MluHUzZGHezFabkHPvuSJMVCov9RsmcyVOZk3YE4bALmKuowKZueJNQSHoqBBPD8sJLowcgyf6Q+0DWMYLrbv+c7aQYwVh0hA/1W5hdIF5x0TWU4OrOzO67I7h0WkDqRrYyO26rYkFu9EUqhQ1h76jcq4gVOBaPSXY/X2WIZ2s8xstlPMvWA471lWEvHeioJLc7JVmYu7JC+5oLZ4GH8XJ0z4x4mEyTbB2qnyTZbJymmMyXiLGIl1kyWk3jJRar5WKejrtASnQecRjme0N+HXHJklvDkyzIC6ncsfU1r9dxgapAJQ7Ea85JHrg8gdzs6v/aoTL6uemXKZeBDiBLaOMjvFjJb8ebt9tllct+IyQ670b40ucgoX8qXkHK9IksWXqijLERhsb5EPoQM7d33e/3PvVven1glTLy0cF4dvuPH6rdavGmjPVwtWuxUYZL9/RunqQuDb6hcxOhx3+NPxYW62t8R2b3dDJv2JwI5Y52eFL6+cnXO3Ls6LAd8ZeRuSnoqonw9Ms3fnafHA3OUwuT2wZaIXPffQVaxOp/Zr+kO6Z/rebv7Jvak4sC/DY3gx/m5Zy/AVBLAwQUAAAACABwjotKvUKaMWgDAAA/BwAAFgAAAGNoYXJkZXQvY3A5NDlwcm9iZXIucHmVVE1v2zgQvftXDOKLAzjauLsFNg0KrKLYqRF/QbJR5GTQEmUTpUiDpBKov34fJdlOWhvY5Umamfc482Y43e75Qw/Dp/GMJuNoOEuG9DCZR890Ibbb6dJyx2luxFYoJinSGSdhqdA/hZQs0GZLKWxB5xA6VsIJRD7yVy71nhvSObkzHIifcWdTtucwFUWpRMqc0Mri1+y1qX9ATAttGntqOHM8o01VM/5+FTOea1/hqp2jXnRNg7u7v0FxNjygUEqKfaylmFtuXnnWVBJp5YzYlE6bnr3+AgvRlJkftBBya0RBN4QMHTlNi8rttGrrhzRSbAwzlVcpN5yT1bl7Q2L3VOmSUqbI8EzYhh5COGIq+0Mb4AudibzyplJlKMdn7bgp7EHDp9mKJtwiU3riihtUsyg3UqQAT0TKleXELO29ze5OSo18IkmbCI006Gt174kL+P3dr9xYWOhTMDjc1jL2SRvqMefzRzf3HniNpCuS6IY5IIOzEpwqzUiomnYH7fEBQhT6hjGiDafS8ryUfTAglr6Pl9/mqyWFsxf6HsZxOFu+3CMWSsOL/jVMothLAWJUZZhyFRIHwXQYR9+ACB/Gk/HyxWc/Gi9nwySh0TymkBZhvBxHq0kY02IVL+bJMCBKOD9I7MU8J/JR4hyUhYaSGXdMSNuU/oL2WiQoM9qxV442p1xgoojhieyr/9VDqdW2rheQk6D3JHJS2vXpzQjMDqbvt+6C5dTfPoY+Dfr0eYAgpn5ItCABfCRyUI+k1qZPD9o6HzoNgb39NBjc3gz+vB0QrRJYLh0azh7/4xLpdjq50QUF6Y6Z40D4YUMD/SsarqLn+PGdI8SeqCx2RIvDu1Bb6zBuBUt3QvEDMqo9ifdMG08LKTb+Msvd3ugNpG7jp6V04qFyPII34W5Re08Ya4sj9eLur7t1Ml1P54/DSafTSSWztjE3sN55NqwLbAvMRk7rtcDSWa97lsu8tftjS6yf3juqPtURwRFwfYqFo1Vgjey+nqm59zHXExYrdr4cfmmS9s+RNVdDFz+O0P3mOcbdzRx9aE07yRv+jqw5GECE5jk3XLngY57vKdbMd/EnxP96ucO/Fmqwhh2MtfUfNA/ZuuooaNvUtWIF/1VUw11pFF3VxV5dYpBMbUu2vYh+xrtm6qrzL1BLAwQUAAAACACCsHFRRASsycACAAB9BgAAEAAAAGNoYXJkZXQvZW51bXMucHmtlE1v4jAQhu/5FaOe2gsqtJVWSCs1QKAuIUEkrNRTMMkA2RqbjZ12kfrjd+JAKKv2sKvmAn7tGT/z4bm4uHBcIUCtwGwQPFluNf3jBniBUGrMaFWocr1RpbFH0g0vMjSw4+kzX2PLcbq8NBtVdGHAJfQEl/YIXGZctpbH5f16y3PRStX2yrmgSx0nFVxrYHJXmshwg5dq+RNTc9V1gL7qTPUbb3INSFhQ4K5AjdJoy5HlqxUWtARdWWvgUMr8BQvNBRAguVIFpIS0RMhl68zrdD7zEjfqMwbf4dpKXtRvlLZVHtjoIek9xR4pnQbY53JdUuDDXBgs/htaHNzAyvrR8IoWlu92Yg9GAbeeFov5MajBIabF4jyW/gMLvMhLIjaZ+mzIvEEV0+/r9tluPHMHLGZh4Pr1dsduP7pTt9qvtVurjcOZ5wa18s0qQRgk/cexldp1uly/9tMevr+GpA9w3j6iqM2s06Px2wnn7UDRpH1aqGUu11/UKTvyhp92x8CLvX7MglHTHMNwHgwSFje9EYRxMjlvjAlPN7nELyK0f2Bb+/wMNIrdWXzq4NksnDWELI7+JozwV4kyRT9/RpFvlMr+kVM0htXA4HYW8JTaF1ZKCPVKBbLnyOglV6UGJfGcOPBGbsx+eA30PPDZ2POfGu5mWTfoNIzYweDGscq9DWaLNHMyK2S4gjWahICTlLK2VkWO+jIV+hDXAaBboCkLqbsUIAKdrlqA4ngX1cmccm1DqdLQOtJXX+0Ebpus9o9J6NfG+/8u/rvbm/GwVRkKTfktDvMgoiQL7O0NVhdrNFPby4sF0CA9VaQKwKhWnTJX7s2mKo5Abce7hH4YxLPQB4JKldR5RggZlVSgIevzolHve0N6otVg6dzdHcoUeEmPnujYivXkiJ4mvdC3wk39ktjIPprOXV3N462V0nb+AFBLAwQUAAAACACCsHFRBIgFPTUFAABuDwAAFAAAAGNoYXJkZXQvZXNjcHJvYmVyLnB5rVZtb+JGEP7OrxglUgUS50KqSs2lkUqIufMdb7KJTmlVWYs9hlXNLt1dknK/vrN+wTiYu9y1/gLMzjw788wzgy8vmx+4c995Uxh7Q3cauHA3ng0/whnfy9YlLNYIM8VXXLAUhjJG4Bo28jNPU+ZItYKIbE6rdPUEN5w87/EJU7lFBTIB04BB/lM0OmJbJNNmsxM8YoZLoemn2kqV/SBgmEuV2yOFzGAMy32GeHoVUxZru6er1gbaww70r69/IYhGdwcGaQq+9dXgo0b1hHFeyVAKo/hyZ6Rq685bsgBMmPoL5jxdKb6BN0AZGjAS5nuzlqKon6hJ+VIxtbcsJQoRtEzMMyV2A3u5g4gJUBhzncMTEQaYiH+UiuI3MubJ3pp2IqZybNYG1UaXHL6bPsAYNWUK71Cgomrmu2XKIwoe8wiFRmAattam1xVTI5tIUCQCI0nwGbs3gJzO7d1PqDRZ4Mrpl7cViF2QCtrM2Pypm1sb2KGk95BSN1QZ6TRSUFUaAxcZ7Jq4py8ESIU+k4xgibDTmOzSLiGQL3zyFu9nDwsYTB/h08D3B9PF4w35EtN0Sv3Lkfhmm3ICpqoUE2ZPiRPAxPWH7ylicOeNvcWjzX7kLaZuEMBo5sMA5gN/4Q0fxgMf5g/+fBa4DkCAWFJsyWwi+UBxQpAbSUzGaBhPdV76I7VXU4JpDGv2hNTmCDkpChiNyHb/TT1MpVhl9VJIRegN8ASENF14Vpy0Q+o76S6hVP3tkugjpws/98mJib9SakFA4SOeEPQolVJ14U5qY10nA4rtXfX7vTf9n3p9gIeALOcecKf3r1wil61WouQGnGjNlEazVXJJ1VP37AgNyRigmWfG0pEGQay0IX1tWLTmAg/e2UlgTyb5SRGCYkdzUniNmVjt2ApHPCWFdsGCl2FUaB6Y/SqjdaQ3ZXT7/e9hMAkns3t3TAwGs6ve1dVwemr7MK9sLWh4Cr+P/sGv02q1opRpDa6OaqW3a79o51iAi4uL7DMbq5qDnRhN0rqw6xd0tMYNXgDbErlUXiZRUidGhuoGFAWjeZrPNPJIqwGZ5uneClWuBP/MlikC5huZwvWaVAIa/95RuL1LWU1nA0d7wsgMiscojF1aJEQS7uEi55B+9iXGBMKQ0wYOw7bGNOnS8hCrMMkadDuVAouK7aN3tJ3bLwnqgg3sOAecY4Sj750Kh/wLLYXU3lv448/DGU1SdnwUCD+8EI4zfO/R3nDDwJvMx97Ic+/f1vpcv8Ah9lHE7VONHiuq0/k+iFMdHiG9qpoPg/nAlvOdNZyK/lsT+Djz3cH0v11/PEsvOs1I7E9IKGFEG9BQv62u6j5hPhQYh8Uy+opXWlTQ7JZtqMYjRdNg2p1K/bkhU/BrhV5ilN52pis10yqvc1fnNf+ngDOn9onoHYeLHbbqxkMnMjapuIU66/MywzNtSFG067l2/t+uZH6/0eojOs3+wHkBFgq2wZfUKzQ7Jc5cfw6wvPd1YKV3JYIVJUO0J3ZrRico5QydpFPvXXFZz7m+Ptgx1XjGq9er7k8Q42L9LveGemTU0f2ZvqyuyrM64jfJr6inJkH7p1IzFFI5jcxV1iDP/CAPL2avQhP4j8nN7ajTlE098rb2IuC4vj/zz6VyMhQjRow3OjfOwJtb6Dd6lz1/GfDrLfSakznccWDg+O3Gmc4W4cQ9G3ms1Cz+xJP+4b/ClLcI6Irm7L6Q2Wj2ML0PvcUX4hrWQMV9PjxVXmHxatg+7XUD4tHKqCAPE/o6qhrnPT/6F1BLAwQUAAAACACCsHFRwQpgohQGAAAOKQAAEAAAAGNoYXJkZXQvZXNjc20ucHntmW1T4kgQx9/zKbrWF2oVcBCe17oXyKKy8lQJ1pb7xhrCRFIbEmoS3OKu7rtfNyQLkY6CyOpdCVrodP97Znoe+lfh6Ih/wXnzstWFdqvR7BpNOG/3GteQ4HuUOoLBWEJP2fe2KxxoeCMJtg8T7y/bcUTWU/dgYls2Fbm2XDuw0fOLfJCON5UKPAsCJgb6d2Xgm2IqsWkymbm2KQLbc338V009tfgHA0PfU8t2U0kRyBEM54uIm10JRbGmc+xqHMBJ4xTytVoVQ7DuWag7Dujk64Mufake5Gg5k4bnBsoezgJPnfinn7EFoCPUD+jbzr2yJ5ABHGEAgQf9eTD23HD+mBrHHiqh5pQlS0kJvmcFP3FgZzD3ZmAKF5Qc2f4yPCYiAOGO/vAU6ifeyLbm1DRzRzgdGnUg1cSPcnjZvYG29HGkcCldqXA2/dnQsU0Ut21Tur4E4cOU2vzxKlMXNBAjHAhceBh+kd0zkDbaqe8HqXxsAS2bj3oLI6bBU3AiAho/ruaUhKc46Dk4uBoqUmbZFKxmOgLbXYQdY+7xDwyIE/2J2wiGEma+tGZOGiOgL3xrDa56NwOod2/hW13X693B7Rn6YqbRiuu3jGRPpo6NgXFWSrjBHAeOATpNvXGFivp5q90a3NLoL1qDbtMw4KKnQx36dX3Qaty06zr0b/R+z2hmAQwpoxRTMrkk/0qxhSEnHmZyJANhO/5y6re4vD4O0BnBWDxIXGZT2rijQOARmc53WkPHc+8X80XJKqFnYFvgekEafiob9w7uvo3VxSir9U3jpjezaSjl0Um4PxxcAgPlF7aFoS8cz1NpOPf8gFw7ddTmtHw+l8kXcnmAGwNbkl7Q7H7Z8hI5SqUs5U0gK90Z7mVcNTo6HWGObVcaAW6iVOrq+12jbcCfcJLKp3OxNwAOK4cnLldJ5ThblWwWa8uTLh/p8nEb6fK8TiOdxvenkU7jdQXSFXhdgXQFXlckXZHXFUlX5HUl0pV4XYl0JV5XJl2Z15VJV+Z1FdJVIl0Rf0tpLbKRrmLh+sXfZKuSrlrhbaSr8roa6Wq8rka6Gq8TpBO8TpBO8Loh6Ya8bki6Ia8zSWfyOpN0Jq8bkW7E60akG/E6STrJ6yTpJK+zSGfxOot0lpU6XZxGY7A4jOunNGsM8OZMx5qaut7TUY6vQvo55+2aliGZJroGMngJbOf9gqbWwLjrNPdqo+sog5fRi2JsN8rELC5Wochnji71SmrhUUpcwXKipRT7SOqjmsHrNNkjtMQ/kv3YPrRcRquwfXAJffEe3KWJKkJGi84Nood+125275A/2k06Q3g7xn7C89W56/S+NNvo8fex6QjfvwvE0JHHn2FZC9PLWa5eoZclTKRSdCtvevg0rPU4xoAJMxbqzpFurL/YqDc1rpiQ56er75nL84xWyGufNp0c4d7PxD05HjcoS748/ieVahk9Ladpje6vCq+9qwpfOFCFL/4PKvwjW1jhtXT8vV7hWVtY4TlbVOFZW1jhOVtU4VlbWOE5W1ThWVtY4TlbVOFZW1jhOVtU4VlbWOE5W1ThWVtY4TlbVOFZ26rCrw5lcqHnqvou9WiPG5Up9LuQwoGb2CL/2xBjexRZFv1Xi7tLip7nhMMh296ruwYZpSfI6OC7bMkV7zhRhVymcEAef/k0onukUM0UHt13zwPaOqmt3ZPJwBYjnA0uSsC3WqJjnOLWb+rk2I+ZLmm+iREiwkNhhpSZRncT8bYjva/9nUkvqlCvRXoVhvQKTMx9Sa8ccl6VJb1auvRBer9sH6T3lqSHh/I/THpvBX97kN5vfOT0ypx3EEZ8AvtC0DoAaz5Bd/v1Vn5RJpLdXpf1DrEbXxf2DkOjC9h7H+jJ3nXFXAa5IHYn70CjMSCl6/xZIF2C2LZAms/tRqSLirIzkW7MeXsi/drfjki/iql4hKTX+ps/fCys2VYPH4sbMV/n4WMpZvt4+PiBpO8PSfFQvh2SfnzLeAC0YkB0z8zty4aHf9q4/7eHCx6NHYutvkRcO0XPksCy/m1LApvfLD4JAotzvDMIbExzexC41rcDgWtPSeESBqT+BVBLAwQUAAAACACCsHFRIDfE0CoFAAClDgAAFgAAAGNoYXJkZXQvZXVjanBwcm9iZXIucHmtVn9v2kgQ/Z9PMWpUFXSEC61Ouibq6QiQhJZfwkZVVEXWYhbYq9lFu+u09NPfW9sYbKDX6mpFCt5982bmzeysLy5OP3Tbve8Nqd9rd4del277o/YHOoO9qFyQv+I00mIpJIuoreachKG1+iaiiDWUXlKItUZlB+1JYQWQHf7MI7XhmtSC7AkO4IfcmpBtOJbW61iKkFmhpMGr3iidvICYxkqn66HmzPI5zbYJ47Erph3XZgtXK0vVdo2ab9/+CYqT8Aa1oogmDmtowg3Xz3yeZtJW0moxi63SVVO7xgrRgOnPNBbRUos1XRIitGQVjbd2pWSWP6SJxEwzvXUqLTTnZNTCfkFgN7RVMYVMkuZzYVJ6CGGJyfnvSsN+reZisXVLsZwjHRe15XptdhreD6fU5waR0j2XXCObcTyLRAjjvgi5NJyYoY1bM6u9UncuEC8LhO4U6BN1b4gL7Dvfz1wbrNDrRnPnLWOsk9JUZdbFj2punGENQW8pQjX0zrJxUoJ9pnMSMqFdQXv8ACES/YI2ohmn2PBFHNXBACx97PkPo6lPreEjfWxNJq2h/3gDLJTGLuqXMon1JhIgRlaaSbtF4CAYdCftB1i0bnv9nv/oor/r+cOu59HdaEItGrcmfq897bcmNJ5OxiOv2yDyON9J7MQ8JXIu8QKUawUl59wyEZk09UeU1yDAaE4r9sxR5pALdBQxHJHN9qdqGCm5TPKFyV7QGxILksrW6YsW6B1031F1wbKvbx1NHzbq9EcTICY/RyiBB/M7sQD1XaSUrtOtMtZBBy3YXr1uNq8um2+umkRTDyvnHuoOOz84RC4qlYVWa2pwGaOXUTV3dMZazYRcehZNBOcsXAnJk7cMvZ6FK6YNtxsgoVZmN4gjK263lrex63E7TnYzG8wicBrHsk4Zd2btZCfhz3ztTECTd6k7AZlBd9p+P+4cbLQwvLYGgyu1+2cTSvu1gHZTg3+1JSDyMGZdAAbeIBiMOt1+pVIJI2ZMupymUj2dIaYQhhBabkFBIDDLgqBqeLTI1t1jYky16gFVnRJEIzeo7bHYyOQKEN27EwJVi7GWbA81C5hL+RuK9O68bsfOE7WObEsqls00BrXFYq5GuvCjUuzMvxtK0cnfaECw2W3uMmvMQLI1L3vW3MZa0gv4vnw/fnGOImJyGbPlWfP3bMMkonixT3TB+TyB1zHXLQ8g8YGhG0rCzVgcdNBGXFZz1AHMPbhSH998uM5Z3KBmyRu5SbqFVirf/CSekn0cDInRgfGTYQuUu05y7YNCFrurIZ24yV71gLZWYMBoK5K8KwyFRncyGU2KeeT1i9RyiarN+SxeVl+9NIS/bGqscMlwrSEOLpwkxZfmVf2I5vhJUzgodD3zlRWuTqJ2OppchcMR1xiO/GDQPbKY4Zvmc2GVR/8lRc/3QHVGi9Pe70bTYSfo+b/Ev+fjBj1278QK0HfH9V9CwjDWmkv8B8o157F4cCucr6tj6n12mJYpx6fmExzl7XT1dN7o6HjnJ+mAr57HfxxZznRy6P00HY8M/06Op8PdHxx8fDavBf1GzacfaeTi8/+S/EVBlCIpDuODEl8VSnzZfNpD0SwJOu/QQrt3un637feG99flGVM9LfFS2YBLFS9XAT6dWNV94M7LeaW2STMruRBzLkMO5F9pJN7DaOK3p37gP0y6eOl3ynN3n+L3z2j5Mtgnur8MSlGUbpFdfg6xP47lnEuJ5NZZAxSsTzfFWYos8jX7Wj2MpV7grlX+BVBLAwQUAAAACACCsHFR9EEDeWEYAADqNAAAFAAAAGNoYXJkZXQvZXVja3JmcmVxLnB5lZprjxVHkoa/969IiS9GapjKqKxLrrUrAQZPazCwDWjk/YIaOJijafqwpxt72V+/8TwF9kpmpF0kl/tUZUZGxuWNS+atW9/+V+4//PHsSXl89uDhk+cPy/3HTx/8rfyTsbdObpUX73fl6XH/y/7q4rI8OLzdlf11+enw3/vLy4v8/eHDp6v9m4ubw7G8udzvrm7Kmxxz9+Tr1LOr/c0+Z/6w+3V3efi4O5bDu3LzDZo5/snu5vrNxcfd/yK7P1xd58/jx8PRH0m4PDsct/dvjruLm93b8vqzFP+81MURWh8/51Lvb8p3D26X2vuaJL45/G65d3lZzhl7Xc5317vjr7u3204eHK5ujvvXn3Kb313f/pd8U8pPF8d/lGf7y1+O+w/lTkkOb8rNoTz7fPP+cPVl/ymqy/3r48XxM1J7d9ztyvXh3c1vydj35fPhU3lzcVWOu7f76418CuKmXFy9/cvhmPM/HN7u333m1aert7kduL7ZHT9cf5Xhj09else76+S0/Li72h1zN88+vb7cv8nJj/dvdlfXu3JxXT7y7vr9H5J6BCPPvzBSHh2SvNL9vuz2+Z21f90dr/NNibv162pfKJ6W1PV3Fzfwn9r8yMTbyfTncpnaOH6defebIvhjp2/L/kqy71P2+UcSzI3+lmZVXu/Kp+vdu0+Xp0khx5a/n73469OXL8q9Jz+Xv987P7/35MXP3+fYlHR+Tf1tlPYfPqYJvi25q+PF1c3nZDwJ/PTw/MFfc8a9+2ePz178DPePzl48efj8eXn09LzcK8/unb84e/Dy8b3z8uzl+bOnzx/eLeX5bvdVxAjzW0L+XcTvkuSHQ0ry7e7mYn95vW3951TvdTJ4+ba8v/h1l2p+s9unRZWLdJGPn/9fOrw8XP3ifnPKHwL9vuzflavDzWn57bhP20nr+5N2k8of+j1No39z97RMNQddXP3jMlXwPKc/2r9L0o8uD4fjabl/uL5h6E/3cu4QtQ536jjUUl4+zzf/7F95+OSH/yOo3DpJws8vUFbu6t3x8KFcvEaRMfyU9v1fN+UDhpS+eZ028ubyU+LDZe4vEeBTCjndIwX44eMnjO1m9+b91eHy8MtniNZYS7lz59/KcHfp+Tum+evvHvl7qvH773VmwhDt64veW2PO0NY/XvWuLs/e7i7KD19tF784R6DlXzdK01j+Ur6rd778uJ3vl/FuQO482c0N/nnuVQ6Cn5wY4zTcyb9vSy+W/sV3Pn9MCLz8xtyTk4cvH/zt/NWLn5+dPbj3+NUPZ89fnJ/df/ni7OmTV+f38n9Jab47/D7u3v3HD189P/uPh/k+VwuE9eD9xRGTSXP5z6dH8eXi9eWunH6ZlE6TM5++enT+8N9fPT3/4eF5Tv7upJQ6nuZ/Qz5iOK1jn09LW+tpXWrPR74rY6ynZR76aYkavKunZRmWHDfk1+iOi9NS1uX0JCks/Ibq0NI4x/m01prvYhj50PKvOSfP68RfSXoaVj5MPGYeElhhZpWgC/BINvORy9eWjxlGRqYMUxIcZ8iMyYj025qkSzhjZCUJtNOT0lsuBe/5e8oxLUf3Ab4W38HDmO+WJTcRTaoru00JjIhrWRHSxlFPgrXm7567L2t+TtIwt+bAsrBHxFBZc2nQbwi3IcjGEOausDArlRTkSUqXRVvj4TzozzMrs1EJujzzUjVJIdRgEpwX+JfrxpBpSBkuEyyhhWUKVmHMhD4mFplYZEr68/bOcVCYoDDD9QzXc85dc9xJGWVuZvTsX1CAw7J2RJXLtZpCWwdYHyb2CMEZ0ioq9ZGamJHP5JZZCgXUyuelInsWXRDVwkqLOvJdEpzU6AJ9LWSB9OLczpZXTFc95ubTRDQHLJlHuO8VU1pUf5JB/bmx5GvtzFigumLYdSOY0h23lw1LYMtpxEmws0hD8zl6UmiYyDxCFbOPAYGjvKUOsL5IMBnpmOBa5YZ5fWA0A5HmhBsscLP04IM/kUVnRoeFDukOwaaHdcd0XG9k3x2+ZC5H19Re/oXQYG7NndQhJVVXfHlEUuvgI+0wnyN/Nh6wuX2ZeSw8VrTV+atD2u2laNricgypIgSG0PGUFadfa5IBbQqr5LyVd5gWe9SFFEgb0Bb8r9VpIEnAQpU04LC6PF6++gUcGrd3qa2pg0C40Jq4UyCT+xaLHOIHxLzotmh5CHgAgqJKFebwtRXwWUcWGRkyQh+fEfsUSGXuMDsul5tVyoqCO9KdNgGxKBjTtAQgoVUQdVIWoKxcd1nIDx0TRxMF90gtV5dHBMBSGbE+zKGBTaPS5N2IC3X3mIuUNgEOMythdxMwCkyfJA8YQWAsOMSKZxZsbgVlx1RKaQQIbDPBJliJ7eFwA/7RAIzGxlrqKLcMuq2gW8NRR6Q5hBwigbTasukxFy6gc9FyAYx8J8PYWBPrBgGWPWI2RKB0ODYPnsQC3GtpgN06ySagoixW+AD6Jk0CCQ8rW17xoXXygXVPsAn+YskZOkBigGYVFGfHsQgg0nnXEO6IH/Eht6yZovrKY8CvVjBzneFBCrPvJkzED+wRPFzBQ6ReV/BvTdIniVQAT9c4mcdGp8ENICAMNqofGuYFmcUPsBRA2qJS8P7QbIiW4VJ+0c4Xf7KyaIlDr9hAIiUmAlVluLoc9N3YCmLXUJlsZUXi+hBWtCK+ggeMYAzgU+bmBwwPyc0T7oidY5v5AXAoBUjYaBnh4AEDCiJcH0RLOBQj+aALjeCCiA1+ZNYBwdRvKgWvMCgWjKXO4o7Gzlawwxnr6+BaLJLxkfzXKi77c2URtQyszlDVoTvGQk6R+8Zl0ZFqbQHpjiAJEJNrbu6OWW77Ti1XV+6oteMBA3HZVISQWYlKVd2y+epyZdSXlSH+vcpcbrlXtNxxkgamAb2pM0Iyxt5BjQ62xiKyQBU31qYJ9CkksiF+1tV0Adczb+qovkOrAoDDbJgjxqPWYTABcWEMD5hDuGmq8L+tBJupMjgEm3CXTgiYVz5jm2B3/oVDy3D4aPDFONYkNUi54hnE3D5uMQVvFeLwmYq7AHuZGBGVmGc22Yj7XVGFNgZ+VEEEjgjY+F9uGZQSF2r6bVk3RmQTLRAMOloA5PMvtAytPpod+RWp4POdhLMS4yvxthJ8Ekw1xgZy4RDdr1JgMg7Rm1gH/5hqb0hl1T1WfRm3JiAFoa+hlI4qOlBufmtq1RuqZl4FGafqYMSMP3Qgs5sfdgJ/Bx87oNgnDRZVqx7yw+amXGQyc3AGoseKOmFnAOGGGS1H+Bl1sbNhMLDgM6IsbtZAiG662LUnbBOqFYzsCBIQzLmkIiEEaSIAbMeX++xP/BugGUnQIjRnM3dkzU46shYZZxUlh+TTSVWgAaUY07pqJT6NjoYvLa0J6lgRXxtYx07yQWVAOpeeAxhBIXCDCbPcTGtRy/DFRp0STaWQf5q+m3Wy26ptCrAz5jAQIysoVZkS+rtTyA2mWdRgudmySIZlDt0STvoinsNhJYkIK7zRLJ15g4kqquiORqRuTz8CZWftCXg0pnRlaI7dyRw7YBFaNxto219Q2JLLXKmy79XkGw+eqg6AyjCqqm+55VV/dANih9aH2LGTunEI0ncyxd4B06bQmIYHWyqZf/Su63UrBZWifRGaUEUiMzgHnqM3NxWutNkmCxMHCmAwgoyBpxQiXAFCc8tgPvlIhCjLu1UcBYa0DlYKMT4jR2xASQhYTb6DanQCNkYyOQqMOmBAdTX0qSi50fBI6VV1kgk9Cv8uBM/ASfKRUS+fjT+NmyRLJvam5Tk6P5BSbH/hvMhwEZBCMoiGzKdhbVSfaYcg9pyyyc+YqQMrPFRtDlqIoRhLG+MyzuQD7CaSR8BRFZLJbSqRcQsJBtRRCtTx6NFmRExWZWyq+lWqLBwsnOgSZOpB2ppbdoFEyhgMfRIMH8yTYVscuKMZ02RwnowNcJhmk0OgmupIgiMbGA0BMDJLgWJeixlNhMnrxcguaLHSKBkWVmXNfW4EmRdQbWyALwHiVRw1uu/wHm0HI56Njjr5YtBwriCI2dieqVSsIGVRXVht2hNit0IFKxouWu2ZWFvYJ8As54U9mfrDYbGSGsxesNBqqkAYrd1qVxQXbZyHrBWa6m+iv3/xFU/JJ+KcUBJwXFi+222qviMrHP0LROVRt3pAgTjXopyyZcVsmj6EYTSNbPJBCjYjvu1hwYTFi+yUMgF8VVeafVBvVMChNcxm9mEjSCBjZ2CT9WxgIiTMCSKmDyyHDUyry5ECa3f5Nbe8KZNVFj5vjsTnRd0irwU9YoKFLU92qTapGy+0JwlsYdQptn+IQFY1i58R9oIE1KPcEDzJnYKqLKh0gkIkKBnKuillheDKZB1a7Ngghw/2PWaREYIyIkFsoFI0b7EtBJYZggCsZUzTCMATIbpu5Scgr51rv9YzK7rtsNBhoSszkuhGTGnJZ1TrZZC4IjmgpBLZ8wMindwoarUOwiIrWFHttTjNrHwK2314CmqlIZkPMlPXgy8TBKwvP4BA3b8WHi4HabCupidG1ZdxjXxAqzI6kSuqOaP0gSq7ImGChuvRPclFLIY0RmYAZJTBSRAko04JqpNi03WxJiGmGOuaeGgh7SLYHKlCEDyjKhrFMBKkCvqh2A49fxwgbZxZmSdOo54pzAr9CtZplotRCNdjLqVYynCWB2HD0e7H9fQUYvDocj7gZuSradO2ZfDQ+pikPWjgBulKPiCI5xfAblwsjtgjQbeinoD1QkLbZqeJ8TSVbEsgwxxjxxmJ2BTFps34m8WKKdisPVHqTy4Mm81GGcF/NBVkOdrOQcZcnUzvMycjOesuPKXaRgXsquC2WHmwE3CNjZamcZg6z6MEyexIH8fBL4gKDKsKEviqbm9j2HcQBJ+qq88sLOTkFpMgIQeIC+JAVNGGNHbe3rFHWVqgsEBhUYb+hZDskRluyb7yJSEZDhdtyeQVRxUNKAqjmpGP/oT0ap8LPrQsUrBR21zlcMtWobXapSLE0NgyGRhVADkduJlyhSpxmZZNssluQaDa7ZMDX8aiGRSk4s6fxGDYxFtLU5mmYKAUEshICKRZpFEHLeYjZKyjhQ/hPt1ApaBlU/DFlS0ACI8AeFUMXSNGARreLHO5uyAjI887ySeegmZo/BZy1OAEIGLLyMAYozaZO/4R9IaDHlZYDs4WUURocnEIsgAQFPZNbd4QZxpkaBYFTbGg4xW0hIJGTVD517Z9hTSoREGZBAEe6rOgnAry4jBDI9qHEQeQz8l0nEd/MhmTANICXAh8MnC6JDgy2exIYTiFVGQTi2cnmNuIMQa4YPXjQQ492ELrPmj258Mtk4BM9ATaarbK8kACoTxCIAClaA5mGGUwmgd8Cl2wdEdRyWmeSRk1Fj1Tm0YL1eyCvFvxNUzVNS2i7LduvkZtZD1OUYCPZJBaZARL23oO5K1N9ZDluFHwYyQqBagBlAfZRIQM47EcQuQD1wuCQyElJv6VzSZMQCwoCQGiZUzWT9aNNgjZDnhoP4HzrBxiGNXV9fJCvgssjcjV84FBRQnH6giEK6Z9gAjxooDTZTOlWaWQNy02cN28ZgrojrZsCIJBFrVqHSZQzUUWCLJRnQL5L1tFj2FUjz+aaGC7lymLvRymEKRoUmaRhvdsrQQ3Bi39m6yTJPGkkBEE8Sq25iBgGhZRULCH0lS1jWuNdiPDmoAD/IfgMDV9mTSKxkOE3Kx+RlG6nu1kPYx8iuIxKA9ClZWwwMB8KZrIDzKD1WnIbdFoQq0dPI8GUPBgOUXJaPIKYIy0woDfGvb5SVRI8coGsOZNw+YQrqwg0SjwVewOmFfqt5og6icAFU/vbGG78GqnfRVHO7vFRPCwEBnpTwbmnGUe4lP2Vnhl4oNBEBRf/GnJgNkY61glHwuPlQfwxb6TRXjgAwg3kmSN1pIFT0TMxTNai7QAvjyBndkooJj+R9WPggsxxaO5CeFyCpiTobXYzyNUEEuthXGS4AgvC3C2N64uD5uYeKGVZGPD8D7TfbA77tF4s8+BXVAWxbidTqCEXD05BGCBksA18sFAAJbImGMQCCg7GqTIUcrkOS6ap681aAM6uSc+wmUZJehoZGOYbtJnKyhYe5rBgHE7BgfwJlYi+R6xeKI7TQzHyLGOCiLRDtDJ6SSGJ6ejP20x2s3y8JAmCdl2EaZnol6+lAeEAb5rgiOAPsqhBMFRjkSCbkoAWoHPh2kAx65cnMDiwUNPImnH5QNHMieyMQeyGKlM4sbtVAujNeWmhCPXTL6AbQLXOFHrmb2MZmPm08TlUdmQh3lqZiZKZzrNiw+zZaSoJIaZowAiC4XP6FZm3VhfsBFEMJAqkjNGjmZklpZ2IIUEeuLNGsQ++aYUApK3D9q2PF+qnUR/+oBXznBa9y/LWxYhnHDgF6OVphks8bbQ7EzjZGcg46h7kuCMi8GNVERz7rY5kyXaS3XQJ4FHT7xHDxfwlNg8RWkiDE/ANxPUIVYpwJJ2LuvIsCsLbGcSSVZ9mb7HCB6OHm+7FTUDAmEJMSqLrQ6yz+wM+AKfuMUR3DZIqmhZAOEUPjhRDI6ewpKLvkThQkRw+B22Pjn/S9Go+cYencZPBDJxLSE4FA6PmcJyvRpOSDNnoyofqlueeWAnZqdV9duY8RyMEpRmWqVFVL3xQlyogFGlY1RtzoNIwXFwndyJLKE8T1xJTDP0QL97V8T+oRW3V2Hc95ZZmyBQd1ERTxsZFt5oLTxWHranEchWc5Jjc1AYHA/G1uv0fAibEx7Ju6u5v4dc9ldnQJ1Dp+AAKCi7giOKEpa3HFQEZxRh/LOTRfM/wLCgwxl2rszmQcvCPaBi8eBZnN1kcRmjPUlvQmiT6S/qMcOcJM1PwIfWW5DJBd2sUAscd4XtGDsxtkNpWmR5i9DEMEqIlJJ7ZDTm1rYTZNuXICqwjd8Ga6Z3Qh9TIiIU4B0tW2+aGKkAwdrsnpUnSUvBn+xMgShrAqNdaLuxy2AjyF0QtKgtw9yG4jSoLYvNiC8nGJYVlGGmYLOr2z8iO9UfOP4oZiHUWNXWHslGUNrUSTnP/iQlNm7acGlO1mjhg+A8q9VFLXsUD63RS2Nw419cLKq2/D2FJzDWybtm2hi5Mql5mFO37T7PIkH0AwSZ25gvzNo0yEIgLl2b1l5J1QzJzQzAulQNboO5s8QlmSCQVVqT1Y4X0Sw2zRNsJllSNCZowKoiHfRgTw8UDYcLxRMs67pmNSet7XaDh8dQIHp5LciLJjMoawoJhhW6A8VbSIuH/pPM2iQjh5xELgWEG0xOxpIp5IoHqzTGS9+aEcrCwSqB0syW6WSZBAB228KUAtxCCzOfmVjqzQJzlMkeb/XQxhtBXqDS4uGwdDn2oHtltFOkMPNYePjBggxk9PDb2ovTO2ttjtRj8nzZlodgJ0oJUPhf4YJY4Dg5BdLVB4wAjzYZJuulRaosbHmLaYU2oTKVCDwUTphicp4EnQJUccIX01bRs51RY2ecZwFco8oElIRzS2shPeprkKHutcvNTcfgzkTQT8oHVMGiSVnb2PcS1OK9yMFq1MNK6xtcj+zOxkMxWbIT3ixTibSTtKxL7bmyZiPh9IaTKeVkKUg+Mm93ndh8s2HhaPgiCBK4Kj2Zum3eCtUTVutlG/bzYMvRz0yeoIXtePhNCCjeSpk9uaHT51HQRI5V7QXj/QBxog2wSks7uDIV3ITKh905D+0kzUqAm0eZxTNhj608nrVT6RatRjn4jEl14Y+09oJbdTFt3WvfQRAP5spJeDuD64JVVc90B7j3VcaNIBY6enzgLS5DLanIJNfESM5hgk5i2J3jBKB6jYoCP2xr0z8KIkISNBMyNfSow/yQQD9qeHK4qlvww85P896JZLAGz0YHz6Ynr8cQXrzGWCxtYIQYSbu60KQuq80Cr4mEyaR+6zhUTYgRWAjGqRSrOVMyu5Iet7CyBGe7AxpLt0ACtkcvutJGndQtPR+v1kwQ5Mg4KL7CpIRbXOEVvOYF1smylQYr1hDe1VIWdvG8Mew0UJzef8qw+9k9AqbesiGr4gZgiIdkK5XjtPCgk7t5QU2SMjJj8gDLu8oQ5PZaMYzO5IcUCcFBXnCYEVo8lVTBiMO0hnvPwVWYdFv2jaJIXoOjuSQIaNGQDK9B0BALXe/L/UDvLGFU9rGxE9wlvIo7eVzX/MlK3jIdXA8M43pzzGKmBU03ZDIQUXU5DG3MGf60FoYj5MpF1+QQD+bEMmYZCcsRUqtZJ4dhheapgIhNUbB6ZwLf8nLAzOEkJ5SZfXlJt0vQz2wA2Jtt6BAWZk87t6Mzu3NMniTNngDFefsLC7z15RR9mk9un5z8D1BLAwQUAAAACABwjotKJgWX+DgDAADUBgAAFgAAAGNoYXJkZXQvZXVja3Jwcm9iZXIucHmVVNtu2zgQffdXDOIXB3C0cRcLbDcosLJip0Z8g2SjyJNASyObKEUaJJVA/foe+ZqmNrDLJ2kuh2fODKfdvnyoP3gaTWk8igbTZED98Sx6piux7VabFhummZVrqYWiyORM0lFpfkilRGDsmjLYgtYxdKSll4h85FdWZsuWTEH+Agbip+xdJrYMU1lWWmbCS6Mdfu3W2N0PgGlu7N6eWRaec1rVO8TfrxK2wdrWuGrjqRPdUu/z578BcTE8oFApiptYRzE7tq+c7yuJjPZWripvbMfd/gML0UTY7zSXam1lSXcEhp68oXntN0Yf6oc0Sq6ssHWjUmGZyZnCv4HYA9WmokxospxLt4eHEJ6Ezv8wFvmlyWVRN6ZK5yinYe3Zlu6o4dN0SWN2YEpPrNmimnm1UjJD8lhmrB2TcLRtbG5zVmrYEEkORGhoAL9T94FYwt/c/crWwUKfgt7xtgNil4yljvANf3Rz2yTegnRNCt2wx8zgogTnSnOSege7gfb4ACAKfcMY0YqpclxUqgsExNK30eLrbLmgcPpC38I4DqeLlwfEQml40b89kiy3SgIYVVmhfQ3iAJgM4ugrMsL+aDxavDTsh6PFdJAkNJzFFNI8jBejaDkOY5ov4/ksGQRECfNR4kbMSyKfJC4AWRoombMXUrl96S9orwNBldNGvDLanLHERJHAE9nW/6uHyuj1rl6knAV9IFmQNr5Lb1ZidjB9v3UXKOf+djH0WdClv3oIEvq7QgsSpA9lAeihMsZ2qW+cb0InIXLvP/V693e9P+97RMsElmuHBtPH/7hE2q1WYU1JQbnKNsI69ltrVqgf/Wse0aRSXvZrzxG8Cfv5znvIwXaReu08Rq0U2UZqPqZFO0/SeCZ7zzEFMKe5a2b6kDBYRs/x4ztHiHVUO6yiEz3nyl+i02SSTmaPg3Gr1cqUcG5v3jPsXCaOdYFtgdkoKE0llk6adhyr4mBvjquwfjrvoLq0iwhOCbfnWDgOKqRg9+VC3Z1fuX7IfS9FKpqSf0D7L9fl+Hi5xWr0MO6s/6J3IO/rU5GHnqZalPyxUMu+sppucNfdc3xzDUIJva7E+mr6Mx6b0Detn1BLAwQUAAAACACCsHFRzNtJ1TM6AACFewAAFAAAAGNoYXJkZXQvZXVjdHdmcmVxLnB5lZ3djibFtabP6ypSQqOxpQJn/GVE2uMtNRi8WxsD0zSyPCeo6S5MyU0Xu7oxYq5+1vNEJB7J3tIMB0VXfZmRkRHr913viu+99/71f9uHH//x6Wfbp08/+vizLz/ePvz084/+Y/svrn3v5r3t+Xd32+eP93+9f/Pi9fbRw6u77f7t9qeH/33/+vWL+P377398c//yxbuHx+3l6/u7N++2l3HNBzfXrU/f3L+7jzv/cPf3u9cPP9w9bg/fbu/+xZhx/Wd3796+fPHD3f817P3Dm7fx6+MPD4/+EgNvXzw8zr+/fLx78e7u1fbNz474z4968chYP/wcj/ru3farj369pfMcMcS/vPyD7cnr19szrn27Pbt7e/f497tX800+enjz7vH+mx/jNX/19te/jb9s259ePP5t++L+9V8f77/f3t9ihu+2dw/bFz+/++7hzXr/WKrX9988vnj8mVX79vHubnv78O27n2Jiv9t+fvhxe/nizfZ49+r+7Rw+FuLd9uLNq988PMb93z+8uv/2Z/7045tX8TrM+t3d4/dvrzX842dfbZ/evY2Zbn+8e3P3GG/zxY/fvL5/GTd/ev/y7s3bu+3F2+0H/vb2u3+s1CdM5Ms1ke2Thxje1f3ddncfn/Psv989vo2/bPmDdD1tjXi7xV7/6sU75h+7+QM3/jom/fP2Onbj8brzg3+5BP9401fb/RuH/S7WPv4RA8aL/hRitX1zt/349u7bH1/fxghx7fbnp8///fOvnm9PPvvL9ucnz549+ez5X34X18ZKx6exf3Ok++9/CBF8tcVbPb548+7nmHgM8KePn33073HHkw+ffvr0+V+Y/SdPn3/28Zdfbp98/mx7sn3x5Nnzpx999emTZ9sXXz374vMvP/5g2768u7uWmMX8V4v8yxJ/G0N+/xAr+eru3Yv712/nq/8ltvdtTPD1q+27F3+/i21+eXcfErW9CBX54ef/rz18/fDmr75v3PKPBf3ddv/t9ubh3e320+N9yE5I3z/tbozyj/29DaF/+cHt1lJc9OLN317HFnwZt39y/20M/cnrh4fH2+3Dh7fvuPRPT+LePae0v5/Knrbtqy/jL//Vf9vHn/3h/9GovHcTA3/81UfP/4xG/OePd29ehli++Ob13dS0ECDE49vHh++3b+7/2rafHh7/hiT8vD1/cf/Tizf/PQxQKMmLx5j+F3HVA+8Wd/745uX967jwf3z37t0Pv33vp59++uDu1Y8fvPvptyP95vu44/E3/8azUx7b9v77/7btH9ScjxR/yu24/tT6aPyppXz9qdf5p7Tnuv40zjIqN+51rD+dvY3i1j99dfdi+8Ml6kzuGeu//f4a6ze/Su+vf/56+33+QKP0LGYYr/zP972JG2M2v/lVq3t6P/7169/vH6S9TQ37+YcwlK//1eNefIN65PbfkDXm9Hp7eBP6+/YdWvb9jy+/274La6dlCTv07A/Pbm7cl6+f/+WLpx89+fTrPzz98vmzpx9+9fzp5599/exJ/G++Q2MZP/ruxSMyF/L2n58/aqDYxO32GuTJh59+/PWXT//Xx8y/9OMaPdTx2dfPP//6k2cf/8+vP3/2h4+fxQW/ugmbmm7T2Pfb1PbjNibeblMt6Tas9riNT8/4MTL/Om57SXt80Htct+fbcqS4OHbxNo89Lk58usX29JpvSi8tfivltuQaw8WWx689HrHVehsSXuJfKW4942E5jXqbEp8e7bwt4+DZ+bgtdY+Lj1rWwG3cJCYWV8RlJQap+xFPrfHoHIPebiUmtrUz/hbTu03nwa3bYMY1/tXGbc2nr8KnvKgD9xpLEdfG3zM/4q6S+m06Enf1eJWcY+AUs4snxoxrXJfq2Lm43pYWK1h2pp1zZT3ONfC538REeO3NN47LRo/Vrp1H5/OWZ8e7x2rl0TJziltHj4vDArB48beUnY8za3PgsR838Sb9Nu8tRmo7mxL3b8fwsnhi4taTF0gxp1gAV5u9LM443cYrMqkjPj1cHgbO+abz7rmeMbEzNiV+dN49dvtkZY/a+BELeOwu5WCj4m+ldFYrHlHnB0rPkopRxk0scfyWy+DRFZk7EY2YBK+d9jOz2zGTHlKVat35W2X0eJ9aGS42PjbwZJPX5o0Wm5d6/H0/YxKubIp1ynu8Z0iWr8gkWgjJ2RHh+CDmFY9Q0nr8Ghc3nsOL/jLjvt9sZ4wZ7+kCxCRCp2KjzsJCj3jFjKTFe8ZmxbM7s0i8QIt1z6Wz7qcyF88pbUnFGMdNLC9bGeuZe4yeSizKdiiuyPHJ7PYzhmusduxebEhhV9HGFtuYemKNc+IF8hz43PNNCq1HSOMKhbzGrbHaDhKLghiFHWMkpTwesZWBpLC8iFuswoiHHfHKLa8Zn2nchCwWlhcLUTvq33k+apHYd2ZyMPAIKU/KZj55YgwS4oZYIscpO72l0meJzetur3NqyBd6nZnYFnuZUshXbI93IcyxHqFqila81MDO1HFgU2K7Y95r4LbfxLszcGaPc6xxiEq8OyqExQtlxOCoW3vh08QUsU5xcS4tHlZ40c6657zE7TyOm3idMGwYvLgBtUA3UtMcsdCjsO+xg6EwMVll7kQ5UcSQdW5joWLx0jj7Gnjkm8zaxcBsKmvnG58h6aF96Asq3RgpTAumtGA14mED0UrokMs4Qt5r2ZccE3/HpXFDj80P+4OCHMhnjBQPY2IIIwY0og5syslexN/i4oz4D3ZQq9HY+OHAcW29KdqqrEbF/bHtifs7t8YjQgQQl8StB/YUgUAYj4NdxbocSL7qk/M1cInNO2KK8RIxWWWxxq2xbNi5kO14xGApfDbvvjsI1gVntofjwX8jELxP72vgeoR1y2ouqtrZxphEvFP8evAqjjkqkhLPCXlgy0LXUw9JCTn0zdxzHpbyGvjINzExRRiNQJlqvGJs70AqDl6FazWlA83BvO8upWZzayweWhJeKR5xrIH7iBkX/47OFExC7FFFZsMSVV7AV2SkkMN4Nv/qLh6WqKogBZ8TIrQvlS5hWFlj971jCWOjGo/GLoRo63gbc1e50byYXdHTnLt+rPOronHysOmaUItwplgoDQlSkbA6G0seM1G34mXdmc6+9cHDMJYh0iyKzr1iu2JmfSypCMsRhp7fEn6jhm7FosQNR5i4MIdei/dkt3ipWHH1ADuJeW8qbGhzwY/GRu1rYAKWI7vsjI7m4jxis5C54m7FByfCPLAf2f1F8MJ48iney/ghfFaobl0DR8ASY6ICOHhMQrwhQhLPCdFSw3lEKEjGbse/MhsS797nonaMFcNh5/AUc2ACFmxVTFsFTTgKnT7h0AxTmFh1TjFcOTSW2Hgc9BkTyLnFDrSuyV9SkSJgCaEe3FAYHbnBRB6YqWSYY+gyhQxDTxCFMysY4Jy0bqhPjlWIfy05jhe9CSFVLfBggzWuKhgGCyNGKLmd7u/QTMQOEtmlA+9Z8eb7cEw/SGvgCFjYwpAgjAtbFssWb4eCZZRpawQNGbd+FESduLOheT0WICVcJRufCNRKvVQ6E7BEEBCCgoIRUkQAOxg9NvTAzkXogVSx+MYAiFAvKshJjOhSqP8nIU5ZA0fAEpe5PUQtYTBCI2I9iDGrQXaP3Yr72TccbB/Yj4R/CqsTQR0SxbSPbjiyNC+0KVRatYigsOrqKw4N4194gYIHysTHhRgxGXyeITOFyZYRa1R1V75jOZZU5AhYEvFoaDOKjPPIhZ1pOE6c3BjYeP3L8EfBfhAx4SD3gdPOBjYY7+WaYosiYCGk2E6tPSFJzaQkyCwmP2IVAonBrcSDPDteJQY2zmHjq9pcuCREcg0cAUtWwU9mUtBrND/MxI6taTyCkJUtY6HDdJ7E4bjAWHKSGBKjwd8MpdbmFQKWfBAEDebZMA6YfH6krFFOZj3oS9jOeHeEPrt42pQDC0EAl5Wea+AIWCq6FbulcUA+DCl0CkQjtRqIELGFLMUUCZx3Ze7k2WRxDdeAgB/1WooIWCL6YFMJKXrV2Iak9+puxw4aREUqF8OhAlinjDLUYozXMFHNOxTBa+BBqtCcJ7aKPIBQMISMcIgptopRbuorFpfFZykTBqcQJEdwtRMz46TKMvTlZPNOFCwsZmye/oClJFw/44mxR0gKSSVqEYrYeKnO+yDRiDopQfyKq+5r4NjosBVEZ51koGOACWMrgQiJK6G1ATH2C5NQK4tPKpkIwJDS+JTreHZeKW+YWXweIYkhb6t4RQOWw0jdjFGZwdiyxgOfR+yXsMKx+GgtJhfBi+xqGaHY8ptQIXY7phg/OjvLks9YOKGIOFiNC8tjGk3EtRlDnLuv10nx2JDzGpiApc+EXhUgxJrxAko/9xIrerJbRKVHJlg7cFKHzlT5OHkLjOLlTKsBy0GySThVdEPEEAnp5YNYKHPcxJiYV+S441AGmZCuAQ8QUUfGSV2bd7J5yAKCX5LJ98E8hxkwG816EJ4mY2bymlymkLmrSB+rnTX++1qKkMqbGIOtYN9qUr7UzY7gqY1sTzeB1Okih+bnIUcFlYpPsT/N666BCVgab4KDroZo9VQZsDVJu4L90uLt6BbamHW6MUgmSe5mkb0SepTlTCMPiFw6rHiEl65Hw5RrdhEyJYBYZY+FCjUAHCkMh9k8p7xjk6rWiV29gsLW2DzscWtstCGJ4WXW2hPlY5n30/zJ67CxB5a1Ge1hsjGbfYhGXDOOgCWRn/di5MGHHdE6TAy71mAgn4X1CD+4s1v4zEwqWckd40WNEMiFz2vgCFhCZlFLYoiWvZasiRjg4GFDj4j7x0dkQv2QFBZfRcKME4Al8ZN2LDk+ImAp0/aqtBpwFwWHsvMwBXyQezLZEHDnzjsaprDxCdvHJdsvM46ILQy93gpZHERsLX6E71CPUKuMkGSQMcSyYh1BLkIZYu6oSlgigseBWI0lbpFI3YTS4gqIlYiEYjZYRwyOe9yVL5CgpHygpnsxdNEmYa2LuQ6R/1iu6QBhyexRUssb+Wg1kMArIa6NhTZC2E2CuktB/tNdfNdN5SbQO1Z8fICwHBqXQqROTmZUbbCGxY273CMGQd675pkpIkIF7xWKYBrMQl1B4UHAgisIkQHKqtiKk5io+C92FenLLP5pAGa0Gj/yqR8tSs+JCGu311KE0WDziKnI7oRkTr00Ieve0GZCTsPDYmCmG0JITIMnSEfW0w5s+QKbwnrE5tUp+CgoOcwBxDXniQfqp2OylCdBrknh/BUvfbJQJ3tJsndcRiiCzIg2q3aSeJC1byQNSEqk4bo2U1nQEKPnYijo65HxeZ3ZCEDZMdYahwu9yT66xorFj8QPXwDQg2hi2/ygsFrsm6kTgC9uFfwA8+rAxPu/LEUELF1fFOF7DHcqH5jIhIKABJmTiTlup2HsgSlVIzIfCGV7CfH+ldyESYo8D0tIcpXESwbP31lZwtOUxH8O/S16MP3tyUh4BUwxXjpMIRHGL1IRAUsnpAlTFeqPu+zIYq8zICa1PjAEmM2ezGB1YdpTERJcJfKBHwUVmwNHxBjxMdaE+DyB32xJ6AePStpZBU3Z/O0w0eSSkX22t5n24UGEWdravBEBSwbczbrlYWRZkHRCEvKArU4/mtEhcGpjBX3zbsRG9h63FaLsNFFKBo6AJZnfnxPTJpUk/EDzYwEwWOhrC83NAMudcCgBkMbCxjviJTNBSPwKRnW5/0HAspE3d31us6ogqif0y48dwxQ6XEGNN8z7hudPRHaRmfLDyL/gJK5oM1K/cP8zPid4LQbJJh0YeiSahY73IQBjTBDeIvJKrlPJ+ePNTBpO7PaSihEBSzW1P9UNHS9wcgf8Y6O7sQZwcugLaUEoXSZa7dXAKimCBfNMnrfw4zBk+w2jcwWiyQaAclTQg5gxkrK7RqgvboQAPZIWpG/ozfF0uxAk4cwVV5wGLEgL7raCHkQM4csyMIYe6xiZGIlyRr5QGlWFEkg6nLuwJq6p1CXHJwFLEmzSSYLhkotnZrdZ3ziGus4qmAoKHIDVDJfsFDRgGwjbRrpm3KgqzMhUwId9Q4wOlLuBy4KQxFIofQez81+s58G6iWHgqayNjFVVCLtWbzIeMB4oQqxUIa4WU9jts6sW5L1ZDBV/vZNTkQiQbtdiFpiE9pc9PiNgiUEICpO2V/gDSTcQIXUbFss2TCSRA4lEzMLV9gU6boTQAww1L1sRRvjAVjgceQ0K0vFKgJSxMu7MYEOBmEnIySs6gWL4dUAcwqFKWk/O3uuqjoVNzzc5zU3xCteT6UzzjKRSZGjIUpqixeymbON4jBBITsyAj4VthmMIzavGboDDXTsLoNctQyZhOLFzfHs2QcCmIHPUr2qZdzhZVqb0NXAELGG6eDtjqoaqFa4lzkq65aSN18ygdINFyVQQCIxIg7v+mkpUTr8sRWfzQsuqG405zfjcMlcMPD5jqMGEkjWHpJqTINRZNiONbsYkitU144HPqz6VMEk8bfgrS+57Nv2gmQMmoakbIkGknGjo3FALgmnaiphnJOlVTDoboiGGSG8elvccODRiRj2iO6BygAE5qS/IZh8WWLljeelwbxGwlPlA9Po0QdAPU2kQiLWOcrAAogfNvTDIVpsTj8UyNpPPtcYRjIfZbCylICP2HPgjsdAxE28gOMFLk6fVMp1xJ6x3Pj4bHQxxiRW4BqYklC2MEexViiRpNxxDVYntq3EWWh/uhl8z4qbBoVzASDPSxX6cl7glAxbCAspcG7IIyMfoIEFNmXWNsRqUUND/MrUZLA2/nolfOnsZP5aCJEpCxHl5ofDYTuECixTZRXVi2h9gyeJLgaKTxc2YmQiSShIJ6RrYgOUQ27RCdfADLTOUA+Vk7cJTEoaiNAN0myiulrmNFpw612GizulMwx1UsiYTFB2aeSLpGC74BPSs4IuAKxvSu2nJqmX7rukgpWDGRYXta/NyBCzltE5njApq1Bizqdwkv8yzUN8opLdZjL6B1Bm39qTFxDeDYtVe1sCUhKrlksO/4zJQ0AmpJBFrbEVzZQVS2Ddip3MY0WOndKtDwPYaOAKWsMJsuUEpy2sYK6i+hiPLmJ+SqBKbG+V38Wx0gLlvZu91+byw/2wer3ha1iHwh4qQyc8zxZBNAwrWUo6ZdID/ZpK9bDmbzTMNTiaaS44zCAuCn4hGKlWWXqeWYpQtKlITO9UXFiXjQk+sILvagbeSOCKhVL0YIWDaN5WqZrGu3YxlzT2BdCkJ1aSTmpAKS5F9IuWojNMdSN+QMuCvbQ0cAUs+BPTcLYYjwE9IZawnKkARy1r3IBRrum+zTTTvHHIEVFhjtyXH8a9YY6LdSU8YBjyuB9YNvJTMdkPNE3qwkYBuVmMoQybgqUTymtpcsrXGhZKQ2IRMj5MkkFg2H26ZMot5TgYxRN+WpM8h+wKbghUm1C8UGdJ5WbdCwIJbjylKasC1EQ92aTqnQbZ7dDKI5l1LxiB61EN8EF9Cgg9NZQ5MSahPOUbwyWGmzzU9rVYLyWcFOKzCWX3AK2VZFezqoWU+CZcv6xZp2s1GlaiA2mThfXL5DVXZTpcXwGa3fMzOMEi2anSIYhPagjNl8+P98tI1azZ5RTTf3AIqQxWHLCYNpDStoXlE3w1YoOppDrGFwrqTT5qG1rUUlYClH24K4bbmkHUCmUtUeQpedsOcdGpimWJsJjiIXIVZFEzMCcauaORrxgQs2TyPWOfAv1HPq8lAxBcwFy+uojsINpmFEBCIoZQDS7IUx2XdQi1DQSRpAAPuxE/Z3OBgKzobBcZF9B4GWGSNJKiaCu584CVUc3Bh+biWAoTlbKyCsLm6SXRXrJ5W0djK/T6HXw+jHv9W+MFq43jOJOljBSyNgEWeARBVyRNndyvIv/DNrZk8u/gYthNtxqH0EOGKYSv+C1ixm+Y4cAQsHfMR00ZID2XOlJvcs5LZ8ioESwkRrCASRfoKyFZvlrOzpDcs88LdInxS8yTsgMe7FVhhxL3LcSLGjK0EbxBgINM2OztBrAD0IyZjABRR+NKBKQlZ12oWsnngeYoZgtxaG1ajENduUW7WMkHW45JuvQWXniixVwsXDmxJSJVGmXaD39OQFc+fVTrKvxQvi8gW69bljBXZKAgucF92yfO1FJSELIjqQUhfCvlkN7JEljrGv5rxNald8v/w0oT1cbEGQ1FHS85rYDgsI5tqoBbZMRV85o7Jz9l1b3wA8qmA61qIkyxHgR31WbhYpIII+CLa1MeI9p/JTUE+Sb5Z6Czgi3UroodNxIr4FskvMuxw8zXNxVtyfFASUvDT5ASEl2YbO0rfDdcJODCvrKKVF9LYGVgBNk2gDFd7esdS6ZDUm5wnUYrdVngsGjNFKsepWykldEJcAdT4wTvqS1Ak+ERdw3Rca3yAsKCg8WiIeFmWnFPk7Xx3hFS7ny0DoIhwbSpSUU0uQEM6Br2ci6wYcWaYzV0gBO+Zie6SHE9idgLajnlP1t5OSihY63AeRJDSynR8RSmHY3nZigMOC6HTdsx6MTax6EyZ5yw0Wh2zQIzPxJ5q7THFGbZBNqZJkgXzmnGHw9JNhXmJZLFu4m4ID5mlHLyDMJSkY4PGUIoLYN3QMpMU1mKl4Bo4ApZC1JWxjikblRM+SH85TmcHS+7wEQQX1eIhDAQj6qS7GjwME7eoJlXS7ZkQMnwz2pOS1ZfkrxgM8EGq+537EyJY0vR+0kKwP5ZFCTT7wt3qJN1mubmgIVXdcnYnGoURYmUpYRSYCYWqRKwse2m8TqQLYl0oQpd64RWQbuMuqy8sJfCH2KjiqkZkX0DUpxrLIhpVsg8TMJ473XPE+lyuCdJthyoXdwEHWQwWLaN42QSgqCvjVrMpkRVE6xNkTeWcpEqJyY6+Ng/SbafwUbKRZZL8WXgn2T0WWAjrfcWmIlGl1VMxT9DpEGHkMOMa6jVwBCxpEirkYhEFmtQ2oYaiDXDL5W2qaqwHZBDAjZKm2SSL4+J0ZaaQbjNktAI3rfDuHTOT8QcxCZJSTQIq3QX5dkRI/9JVc4Kl3XQIVuiVjkG6TUh6LRN5JeU+0EEkDaSg4ncoP8Qbg7FBR86zyBCWqJruV+PTpku/liIClriBVEFmpamohAjCNglMwLcRZzKmZDS0RG4HaGyn9t7BjzPhUE1l2QpJt0MuaBWOQpYQTWsW2uhmvXhoSSgEU2SYsTBFyjZZHlisCeKugSHdFtC2QoiXhc3bZMh4PyZSBy2VEqWlIpJkS+3GCugA5qQ3WR5XXAHpNoMJVYohnSXqTcOGxR4kCFWJJluF/laQzUTGl3GV8YFqTuRvftyugUFY0lQ6cDereJKiGB2UIlHTitdGXMiLAKEzYGKZdHVAh6IpPcQGlrhBuq2UZRJFvURQWGDuZuHsPjksRpGgWLAdkh6ZxHumSdlfcSiE+vW81hjSLdxLkgYuI+wDPwZhScQ6pcmm47FwVmsy0AS0XNwSSA7AD00Uui1bAel226TgAlhTDIkr8MMUWUeTUgPkT9w7FC1edmiKZ8LicwBiIeGNcg18Uow93V6nTVTNoh64QMijucqUl6Js5nCq0uDxTSPkw9hGRX0FLA3SLagF6SBZKDnyTBWo8VH0zXRn5MPys9mM3EdmkTSgMnQt+3fV9BoYhAV7Do8M5wXC0gw0vQvTZYuGNAhEsBh2yeCEJ0RJp4PJFHQw10VAapBuC9zJUtwA6QUacFxOpmwGkl0AfAq6XimlJaLSDvWuA7n1ZjAPzNHyNfCh5mnYsAtSjLDYUjPo7uiCjKh5Af8t1POS0JzEQiN/yu6JKKyci0ffIN0myE7lNOig6nQaxqKbxCVFqj/gbKyWz+F9hpsHZZzsP2v7EKurLt0g3XYZIUU7C6/Pih1c0GrAMiaaAgC2S89Ueq0bmtBaSHYpiDBWkt4k3SaheN2LMcAgbWzCSRSSANq6ACeK2EWCDrl2WEHaWIDHC8lnp9QyB874vFPryLJzmQzSTO4p7ieXXQBKt0g4lLveC4OTT/sC0EvXaBVYGqTbBAcnZV0w/2qKDIZAAhOwU6WCWaptMGozcF8zsbIwnqXFD554rIEpCREyo90YS5+KjxgGhayd3HpJ++R5ImtDiIh9M34B3tq0BGl56QbpthqJZZO9XcxBvETmiiEr68HDuKQ34zm7dKBBTZTUWXBJL9fm0SVEeRGbjwjrpFBuYWaZUZhNC42gztkKAghNQciSUfFJOJOl7y/eZoN0SymLyNZuBD0qwBAGnAJJKXZngTw0qUS4wGaBV/MqSIgbOHafvWxFtiTU/BNgRHMpiHarNUKiniQ466eIASqN5na4UP0QCsdLD+P1FXg3SLfZjLMnrYF6zZwoIxzi6YAr9CslRt+6lF41DzBSSt6Y7DHB1SUVkm51xkAIXcifjo0EwpPQ5orn7oC7sOOodJDMJwdRSFweLq6Sl5YRmqRb0mgBrHPWsIEBSRpYmY26YxFqALsuh7CmFciudfJ90CZb1tq1xhGwVGlHVH4S3rdDHOnAt13WzGl4CAQJsJOwKYVCY6VZK7QUvc7YH2DJtrDNBuk2H3bAyP4gikt6fgEGXzaL6uERhTXxnqdIn0gykjarzlUSzVJpSLdx04EeAK8dZkPEKt0Akr+hNDpTa7MSHU6BYfw1FVHyUCbl9JYcQ7pNNLplcNRM61WhVypXqwooE+SW8MBkBIdJh1J1MKaoCZGdPOeqwViaB+k2k2ImvfcuAMYUTxMEyBx2I1n0NUclcM8TvCP0oPsliZtJTC6Lt9kg3RZSqn5McrEBNYKXhDqA3Q1YqBsYmyerF8X8CfNsOVtF0ElcCgLpNgGFxc7gKQH1J3sNPGv2skiRntkIjsuMDZXuigGCh5PqMnwv8L9Buu2H9YDqtJE0jCUFhXgV191OBnWQmEi8FZtibxAp2kaTTCU8LOmSCki3aYjhKpUYy2QubmtONopTfVltsKfTZLHaxcEsSFSLceOupCypgHRb0ywEQV/hhsPy8ZDJnLmVUh5wEsTVYumb9dykMsZLc4kixCtfawzpNiFkdfaO2YhgSsRIxG6J/eiHjusUZsFiyiGZ6b5KJ+kfrV9M0ybpllxtOyz1mBZYt8SakCBkSgMJ910oq5TuLADaQPsL/HJ6NNlLOBOXHEO6TcVODlZBihCSSrMBa4duaXt9H/G5+Tf212CpmZ1ZYGU+ixHSIN0WkoFCHSUbFOY5MVIAqoUYh2p8DdM0Ub4pkgVPYln6bnOyxK67WHleg3RbwI+7hCzb6+atWGYQwA37k7LTVubwzcQV/TDjO1lZqsEyds5Va2qQbrMNjvBqOtyWDtWki8HOZI8OXlS1U07v1g0hRRZJr+RPXQK2TSHlkopmwEKYszbFlhX5dsQA1CwgAidYYTmb4xIyUrMop502ZJG2twrZ7wvmbZBuK10o3c5aa5lNznw1TUJ9h4KHNuPzpOPoVqHZABSTiNiDKK31Wgq6hI5pbPVFWLJiT4UvgBEhzCFpSTQiFRxfOSn0mccDEHSR8Y6xO1fjX4N0220wON08eefZF3BgopEqqMW6Az9Y1Tzs3iMcOWVrZxFrPO9K0huk2wyBoGS9NMEeqXUl9usTZZ0dloSCMk017/BDD/m/qin2hzrI1ld1rEG6LebDuzbN6jyIqLlWlcQs8Z6ZVMu/OAS5FMRJGW3c7A8e/mvhbg3SbTVulutzKq428yhzMj0AtiWjkSFVkU95n6fGDqoI+pKG7cKrtNkk3apRqvRpkVMWwpw2hpHoSpbKafIsMZHcwEgIeIz58Svh2eqBbJBu+2ERi52xurY4I9pe8ic8CAzjIqtKerfgRtPJNfUFASf+qKs9v0G67bYwN4VMA97FIYk2kxQy6EAE89Wsq2ueMcAIrtW6XbttqH+5f0i3idA6kwkWc1c0r9u+2DVCNhxYF7JwIWzU/YC81z5i5Hi2bq6SUIN0W6ulRD3LIXOFfbdiRnprIqTZJY/f8gRCyP3koZ0y3aEINZdsKYikWyLtzkxKlxx4Oh3+Bkgosj9dbddHsKETIgJmoQ566hFt0Fnt+U3Srcx/yhhlNi0RvwAtJmtVWWjPQwam5nErVQEJQGMaS1M0IvIFmjZIt4We434YXwtYs2WH8ehkoAMRSQOvJGasB0WTbGC0k7zaHpuNT/u1xpBuKU3koSnGmRI8d7iChWJbp5qdDzksUowIL227oGhSDJHolcp4r34xplu3S4iOtSRxhEJ2dnltzJJVPn/lLfAWu4lVk/hOeY5wBkZZKaJ3l+ZJurWv6dAIDcl5MJuG2CbkOusTGGCLpIexOXFaMh0THrPRtTrA0jxIt1XMoFt1BxOyXxoXnDiQoJC+VPdNVhZZZIZ4kaVSDrdmODMvWVIB6RYyPeiBlCntCjEVomXBnI73WrWnQB120dNunA8V6dQIUNrcbdxdKg3ptlADyjjzTFkmzS3f8SXNu5AKAEoKSXVuKBaTX9NsSBEvNYfo18CdPO9ABQzCgOd3oxFF0ISJ2P4wyU+yk3msIB0fwBsvlFUK4Gz9x1JAuq0SIGUWHMT88svUNx280kc9zl7Jbmgs5fJwioTQKCLEr3JeZhPSbdefHHJ91AhCOXBqKIfxRKRKTwmPNcHXzXZSMIECrzcNmeoy/1fXZoN0W6TF4V+zvKtphFAhG5ztQpUuCne6Qn/bNMVJIi5xAWai2AJzXngFpNtMdJbpoazQ4rqAizOeKCkZDjMuVYYw626/Iq6hzmzCIqf58ar9t9O2ZiQA+KRgK3ISs0Qb4dDVahZKZil5yh6A3QTBSMaoxW59nXtfhh7SbSIgjzn5A6h2PgIJmBpuiCSaQcO24SU5btISoPp2hxNG9n4Zeki3GfAu7WIbYoZiX8AKtFV3OtG7TddQ8npXEWVW8kQqDbnaB+xeLoz+gHRbWJiCe+iE1skC3ixsIS7kaRvgWzVHHYZ3RHuw/hJLvklCxjrVq6XggHRbq0UbPWo37FOOzYwJu/iXUDqYULIabUskbqjsumUJme7qMvTHbklIW0MaDbOyU05LYO95JpVSI1CQ7uE2cz1YTxuJhMwsdXQv6WvgCFgycV4XbjysrWCAjVqAbjqIRCfdLnblCoQUYTgsnoxWCFlFo3wue3xIujV33ecBQoxJ+mOG5KkV9ACULDOpmYQZivkwyroENvpguEc1LRrEscthmT2+1oFp0WBlqttD6gR3GhIN1hpXKzk3CX+giF0RZONhJdTVc3NAus1QDLLn6siSw7cWyMEdXnCHaVHoLy4CpFP6PCnFAr7iT2ImBHm1bRyQbhOpeaEQFXuEByOfBT6pkrqlZ1L5LZO5LwLHgRMa4MMeRKKb1VCylgLSbcmS7FEQEoQ8mXPDjWbJ7YOuttfaNeUUCTnBNjlEp3fzVnud9mtgSkKm+7MDBgWDsNM5VSVzJkYqNv6x5fBnNuv8drUArlSJmrNBsVhgGWvgA+qfB42oqgTPY8bx6LB1XAy1Z7N0ObQqGAhrneaZTS5qMxH5amA9IN0WKpgbZip5JI58OzinCUikEIMkEzu4DBmUMksbMuwSudTspbky14wpCWX1iLSzmzRohIhruiCOuoV1a/b3aVMs1BUtAXpNVmvr91jx8QHpNlsaNZtB3MuQT4kLPG3H8sQOeeNJqXKNHJ19q0zKPE/btSDIIxuwEKfZ9SWNos2kQQITygRF8ZgHCJFJHdIoMNQstPwd1Cd3rctiQR6QbvOMcQ0bDZ6VCvM3FaRqxDAJNA0hgttpKGfqImfDdl3z48WNPSDdFg80OS1zn74dpEohGUpK3VpE8V+AUsyO8k2yzdquFtmO+sHzshWQbqtkWILCJEvFppLDJi7dt23ap6uAnRSF8lgV+CqndXIqFcXjStZxKQek294lC5w2hViW8bAxcjLTMZTBCMNO4d2TmmBB204+487TcoU7tdYY0m2x2Fd1jciCsSMYSgbAypaPbMUXaPPULQxOHtOXWPwD7OYAjbFghaN4DosR2wwl1QgCYgKmLFfHV5HTox8GbgT4S121wKXvZlxOe7EgD0i3SXBGOqGtSp6oQNG3wgEuYr2HTK/T1/ZkIMyuRLbTYqo7iM9Z9bwD0m2FPlxs3uumxx7g0d0t7E+xeMBbAEYOCdhwxsBlM6zQCusY3iPvuDavGLAgRsK/FEl7N6SwLEuyqMxMP4jMHko5Wfkk7M3jkoS9/eAa+ETzNNsCl+zCObsmKOpNpMB98z2BnVQBbZrQsScvAGt2jdBlKyDddgkZbG+HaZGa/Urmzaga8H6SGN09c0UoyzN15EMagBm529d4+TxIt5sn7Eh0OO3EqmZi2K/q8iALGnV7OqniwSfoVq0PGyjE0/UlK4E8IN12MNgqpi2zyYMCXGOMSxlSfPD8JM+9G5foswxITW66ORHZ/yrGHnUGLCyRPH4P7BI0RT6z4cPwuBP/xZYBO81zNnBI1FZ7n42/6MC5YjdIt0mdscVDfADiWRW/zjKBQOEnjLd7vJnzNPWidsY7zgZjW5B/WWPPYREusKtPNJhf05wJibKhC05bM2EDPAHHBhk+nXIR9CB2Ta7DRw5ItwXYPQvJemQAEUr2LILJXcLYSsSr84duVTABjpSRavdevc/aPEi3lL0xH+JpAD6kFTQI9K4EUIYEuCwToDxdKEp+AssuFDU64L60L5j3gHS7tXniIUKmqmjt51vo+cFLJb7beq7Tt/bm0W44uWpNXFbVYugdkG43fF7yWDuRynmOy+kjjBwUUqTilBbra5O7CWl0u6vIWvQF/VpjD45DjrVpRDg1G+edBhc0i50aDD8gb7ZUIj/UZhzJvfZlZ+VoeWlIt5zQxx55qBnhh6RsGejgssPqLS/gMROmzNmeO+tp84A79d9oc9kKSbc6SToaN3KTYk2M3C93pQIRlN3jERtYzK1PA4qnEzyrPrHyY60xpNs+7D+V6Wr5xwMDWTt9BAl9GZafic13iwcYJk4mKjYdzrMxh6MvnwfpNsmREM+3LFMmFKZUKUuYLpIbou9uQAr4lnZBg93T0pwPn17idshhwf7ofCStyO+wX0BGvtANcVYnAKv4tzqTE48x8TQ83Q1aMtYpUwek2z7E4w75tiYNhA9TKujwdreI5+y8him2weoqRduXfY7pEFtzRfSSbglq6clij0WikQAPoiHV6Lbsykov4tzEvNnXVpsx+Yfv421L3CDd9rkz1aM8ZCtoXWlAIxESI+ue5tDkKCHbw955Yjd8jmcwsD99XO4f0m1FoGqeZ1N53gPulsDqtJrNQttpfFrdl+AhBgpcJ2CjpFAKy2NBNwek20Ryk2Ah5WZvEPFCt9QLRJXEdHTGrhbodva1ebYxEa0DGUy6XCfHHJBus3EJ2ESfTUu8gEx32MR9yJzVdAGzWKen/bqQ0VfDLqrBtD3gKpetgHSb7YyTTzXmIW+eKkkIPs+CI9TPrpadMh4DiU2b03ZgIgQ6JNt+DQyHxXIt5fSEk0ueT0CknUHrMxhZlRXh0RNNoR/W8+meIYnSNxJC53rFx5BuN3mSEjpEbu11AGpNBq/wrjrF2Nrm3LFOMr1m1Yo4PkvhYt3WaWkHpNsNLe0UCjr4dfcgHKKJbI48+4UMXu3dkF0Iqm97KmBALvKEDskUSyqGJSFCmuyRpLvRt6YDjgPWIElqGj4b8K74eprXwVugyFLt5YZcKS+k28L2JNUfzDLtNs94COmp7WRMDSNlSNk9U1KmidJ2UYywAXUdX3VIuqVWVrN9IuqmxHePV2uO1JiYtWo3ivVoHssizuzfcOldRboG7sJjrGz1nZB+VsxDzapn2bJb9omBtnepkPCUyxDIALqVLalHrBdeAemWs735kLvAem12Pz3pZHfdMUwe+Ac+WKft5NA8jwgjw6HMXGSjtHWUx+FJt813knVMZVDyZ9E/aQklhFUDAQ8f4c08JcYeRDHybOjhB2spTjksiiaFMWhpRQ5MsQ+6eOiDB5sSCnKdRUHPwRRuJNEtHnMzOST5GhiEpUntmIvFnOz0E5HwDBnenRC6iEiKTQ5PmyaSYX8yBKAk4DrWGXoHpNvt1AX7srNaYO1tZzjWU28D/cS2ZrtgbRCCsl2ydSF718FKWrsGpkvIivCupM9WWovOBgK8xeEHjoRAeCw35QISme5J1x6ROjyjbBFCD0i3VaVrNj579pAlECjBHq0EUli4q9ovRKtPmepHHi8pYCiH3U9XXAHptlsksc6HEarWyfp0q8i8PGnZr9VDJpFNPTLgLiVpPBxGgDtWOtYh3Wb7P4eNur67PyQMogLZT4ezAzIzuLA3UQxWyR/+wB4vZ9ol3YoQN10BKSZReQfVq/MsAsUA/0ThlEZofvVigR3LTOx+c8nKGtiD4/CjkyhOwXu6NmOVubLm7J6Bh0e1SCoESTA9zAHcX1XlSGvggyMbPeXBhnFiEA/88viHopDp2+3kLM5YtwyiAP7iwSXugGWaywh1SLcZqUjUpZKlCc/+4OyxDIJXd7mgrLGdVJ4OCGLVPUhPXj+AWtkt6i+MvkO6zYdn5ZiEQcH3VBQBY0/PPNXm4gExdC3gwjippMyTsiWEw9na5XGtwLtDuu2WgG3QHnoLLgOKr/NQkHm0Acy5eZQh6zZDD1TFZnMqc7NRdoH/XdLtMNYRUyKhZ983iU5CFURSnUMbqj1d1ByyHCcLF5zi3G0NNs4Zq+emQ7rtHkNgUY8Ws4RUVA8izoahu/GTUYsgDhJN5RYaaJE7dGr2kMNzvwYmYJEEBKRbRClIo7u94rN2V1xjVBJkncJ6Osx19Kj2zg/H1IpeA9PWnOf5hR4w4xUemI4znXsJfW73wIjKp5jIrJA4AXFR3oLOtIsn1CHdJsiBNc9TAxMfggk5CIbJg+FhYRfw8A5UuVECyYScZbdTj3YIT3i4qCYd0m31DONJm66SiNiy04PIcW0emdR9Dngp9fxkOgX1hibQ7hGWu8K8To7pkG6LR3jjvIoHGoCX9tOuGhp/SIkq5fh+KgHJf6HwFKKtiJxzZU7+dQ1MwGIzTzOmw8bjwrv+0bMICDkztNbKGuc+H4axIr1EfZLH9tjgfC7KVId0Wz3g1yNYrDBBHcw2PQKldXCiSpdRJUTK2cZjJEV6FLBTbXM+hC51aR6k27rb2+ixvGYUnvcr+iAp26MhPR2jSdfwPCC1hPCOhfZURxOJukDTnu0SmscEekSr5/Pz2jOtQCWLS0lADIMqu1AeXIBRhRSQhdz8Zot9uaYu6barR55P0DyKHi6Ep4HOD8gnkWOIvBtgUcJBVxKBNPVtrowXXwPT1nzO+9ny4qPZcnjB1J/66aHQSpp9a12ElaSjuGWaHrtnVKSleZBuq2ibh3TLCsumc8M8QKjBcqenL4GrKrieSTql3KO+NRhEXIu4wRnGMWPiXo9rsRHSMgQVhEyrYl0/eBUSd1oN+6SLdu/wAzWM8PCXgQ83z91iPZoz9gQ3No9dHbJMJPHMY+ms2Gt/iEVx5B5BmVX4FcZ2Sbeeq+4BL+CtHcZSt00KEKfa/mibAXlJbdOmqD7sCt6ve6jqbovEkuNiSUiyowdpkQORryS/W4CEvnouxe7ZDCIfBDEectI9RLR5/pZCTy68uoQ4/C0UBEfhoQ0kR1nmrpgy8FgHHstWk4iPK5l+GR4kPPtm4afvkrmI51ZHIedDRapgQ55M91nwZrjDeMGRDJw9EQGB4FfjOYnWw/oCkdDpOf7pGpiAJYlXwB3Inu5zaOxIDKcpJt8Aj5dVNb+2orn47MXhmIYZHnN1Dcw5LCRnCZ51Pw1jwfObX58wT2XCGXtAnT2l1PM8BzPpKkmNpRKdc4BrYBAWMKFOwT15vgkgYz71zeK/+EFdsLRrULDkoeE0B5Su7dSjsYNlFbw5iCKcKb379jWAfpbZxAUmJWvHxjDYNMW+E5C1qjdXoj2ndJ5Uuzv6GhjSbSbGzHOxuluB/VERxSb9NhjCmWYnhQwb2wottUoCpsbvKXXnIm7QFx62wtZxv/yDWqTULLryKpyN7sFRNst7kJ7nNHtyA6TqBPE9cypAp+jaL34FbbxhKzyOw4hR9TdUYN8lzpuyAuJkv6CAg46q3/+gCxXuk43rARxlMULojQz3P884QpslWnm4qCcRCt4dihuuaR6JR1kkKRD+zZXBuWv3VycWDXA3Zfc7XDBidoedosGejen3mFB0lh+mG2q2jqO5Hk5je4kaBiU37elaCki3lKq7FV2S71xVML+UpymuQES4xaG/daPAmZthAobN9liQvpIXx5uWl5s0A4RTMdLa64yxvTpJI22//MODK+djHZPamV30BlvGrCuBhLh/M0BEB2DoAMcsFI2Kx55hhIpuZJ1+67cfwXTHb/gtASSQmdC02O/T6zVjOCzdsvI8MN3zWAuPQIebD1PBmCwBnGetW3Wy0w9uxxCLEy3fj2vgCFgG2W6RYUM2U+2dtXzdRARsWyU7nOenh8wMkrBS5te0eB1p3+nXLCxbAek2m8R5XILnHmWph3HZmAcmS8C2GHJIasJi4WAB3wjdWVkqWaevtzQP0m22j9EaNMFJFZhGtrON7TR1jN2jQKTvAlVU2TCJrUkMJ7p8sCgLgoQpFkth3o2T8+QGv/mleuiMrGEbyEKWBmHO2D3Ic9oKB9biESKZDq3uY9hBDOwkvJUFtK+gW08EBJov4K0uiuxTForCBxjZEEOlNDn2fM24sHnCnaApcN7HjBGJMeE5V6iQw6M207yEcCi2bBCrJBPdIcA5T0a9BrYktHv+INFZcxCX3Efg8zzdq0qQBaMXyQFIlcgPHjU83ArLXPMC9Kjtxow95wPnUTz90tGLP1j3w+Sb53iKq3AMRqi6W8bhnonu+UhXZgrptkp394AYC7dAR9nTD2zpPnSmjQX0pBVMKYW+sdtQJ0ioxbKd8zKbkG6Lh7qe6sZAeEQVhxJEoXHe6jcqmRqLtrvdWBdJSWZCItur1kTdgqVAAszvPZsTct8EGbWTBw+rZijItqx2wXcNreeH6m6sNKyjR4GpqZnaNyOv2IYJT47BYFTHFDX2sb4x2zgQy+olSNQ8BcyezGvgyuZV5RNOdLiXsds4mCxXAAiK3ww/sJtSmIW99FtBKqvtQVRCL78M7DksWqjma0P09BhbHgbiXeEqj107R76BtR/iZpTyqhSyIRXIJojF2+yedAv0PDyoWnLx7MsEb6XIUSXtDw9mF+U8WQClVy1pLrQ/bDa9BubgOADBQaI8zIyHImw+q6dyPacwgx5ohWfVSXDXyppfzuIXDy1bAem2ZnkGhvWnbVZsftL++LKs4mFLJop4+r12rAfHCNiZ70n7Mr1+sW6QbpOgx/z2AdfDZGJ+uYsD48vAUHeXV5x5vgUJk6pCLAtnPY/VL01eE4G3OzMnRufTwdod3OrEOp/iVcifaps/bCs05WTdumJtlH0NTMBiKClaZ95bZWVZ2PdcY/dI+ZoHbmEmTkdnG7Vp2S+7oiq56DzEiXw9GF0GcnoMvDtbPlEXzzV2xmytmzx4C1XfQ9g9hyn7LYB+cK0xbc3EZBWoo05JJeKzcgP0OzxJ3aPku+ZdsR68hQevJC/GfujzVnKDgw7r1llewgf8fW3CF3gQqREE6XX3ZJHEu+uQHERWOgXJ071UwJfm4VRCpcEcQQUHdKJB2b8SyybgRo6WpZbAUpzmT74ZVmeOFGNSpeWEFP6V1sB8lxCpOcdYQxwBh7DFNXzmsMgg9g3oMDw11MNpPEUewkyp86x0M9jOJdeMaWs+psEhMWyeo+vhpERS2CQyzuEpnXne6g9HZ2uG315U+RuR0MIrkNSbbUjTMQbAA6V5uoZfieeXRjHZ5DE5ukXn6eHofuCPwg+C/notBQELJLEtz0DEaRMYJY/2x7qdPpEih8w3zyA3sGFXOLtwzHUjsEkLSmcVb359c/N/AFBLAwQUAAAACACCsHFRoEGNGDgDAADTBgAAFgAAAGNoYXJkZXQvZXVjdHdwcm9iZXIucHmVVF1v4kgQfOdXtMILkYgv7Omk24tWWuNAFh1fwkZRntBgt2G04xlrZpzI++uvzGc2C9ItT9DdVVNd3XS7fflD/cHTaErjUTSYxgPqj2fRv3Sltt1qU7Jlmlm5kVooikzGJB0V5odUSgTGbihFLGgdS0daeonKR35lZUq2ZHLyFzhQP2XvUlEyQkVRaZkKL412+GlLY3c/QExzY/fx1LLwnNG63jH++pSwDVdZ46mtp050S73Pn/8GxcXygEKlaNHUOlqwY/vK2b6TyGhv5bryxnbc7T+IEE2E/U5zqTZWFnRHUOjJG5rXfmv0oX9Yo+TaCls3LuWWmZzJ/RuEPVBtKkqFJsuZdHt6GOFJ6OwPY4EvTCbzuglVOkM7jWrPtnBHD5+mSxqzg1J6Ys0W3cyrtZIpwGOZsnZMwlHZxNz27NSwERIfhNDQgH7n7gOxRL55+5WtQ4Q+Bb3jawfGLhlLHeEb/Zhm2QBvIbomhWnYIzK4aMG504yk3tFu4T2+gBCNvmGNaM1UOc4r1QUDaul5lHybLRMKpy/0HC4W4TR5eUAtnEYW89szyaJUEsToygrtawgHwWSwiL4BEfZH41Hy0qgfjpLpII5pOFtQSPNwkYyi5Thc0Hy5mM/iQUAUMx8tbsy8ZPLJ4hyUhYGTGXshldu3/oLxOghUGW3FK2PMKUtsFAn8Rcr6t2aojN7s+gXkbOgDyZy08V16sxK7g+37ZbpgOc+3i6VPgy791UOR0N8VRhADPpQ5qIfKGNulvnG+KZ2EwN5/6vXu73p/3veIljEi1z40mD7+zyPSbrVyawoKinW6FdaxL61Zo3/Mr/kTTSrlZb/2HCEbs5/vsgcMrovUG+exaoVIt1LzERbtMnGTmewzRwhoTnvX7PQBMFhGyfPju0SIc1Q7nKKTPOeKn6pX8WQ1mT0Oxq1WqoRz++heYOeyblwLHAusRk6rlcTNWa06jlV+iDcfV+H6dN5RdWlXEZwAt+daJA4mrCDuy4W2Oz9L/YB978RKNB3/gPVfrrvx8XGLy+gR3EW/YnQQ7+tTk4eRrrQo+GOjln1lNd3grbvk+eYahRJ6U4nNVXgi5JvQN63/AFBLAwQUAAAACACCsHFRGUXS12MnAADrUAAAFQAAAGNoYXJkZXQvZ2IyMzEyZnJlcS5weZWcbW9lVXatv/tXLAldCSRD7/Wy324rkQooOqXQQKoKRdwvyFSZLiumTGzTrcqvv+N5VhEiNZESPhS2zzlrr5c5xxxzzLnOBx/8/n/l06d/evZV+fLZZ0+/evG0fPrl15/9c/lv3vvBxQfl5Zvr8vX9zV9u3l7dls/uXl+Xm4fy57v/uLm9vcrvP/30y9ubV1ePd/fl1e3N9dvH8irv+eTi148+e3vzeJNPfn791+vbu5+v78vdj+Xxd8bM+7+6fnx4dfXz9X8Z9ubu7UN+vf/57t5fMnD55u5+/v3V/fXV4/Xr8sM7R/z7R13dM9bP7/KoN4/lw88+KvU8jwzxu2//pDy5vS3Pee9DeX79cH3/1+vXcyWf3b19vL/54Zcs88OHj/5v/lLKn6/u/618c3P7l/ubn8rHJTN8LI935Zt3j2/u3r5ff7bq9uaH+6v7d+zaj/fX1+Xh7sfHv2Vifyzv7n4pr67elvvr1zcPc/hsxGO5evv6D3f3+fxPd69vfnzHn355+zrLYdaP1/c/Pfy6h3/66tvy5fVDZlr+dP32+j6r+eaXH25vXuXDX968un77cF2uHsrP/O3hzW879QUTefF+IuWLuwzv7v6xXN/kdZ791+v7h/yltE/qr097P+JlyVl/ePXI/HOaP/PBjzLpd+U2p3H/6yc/+d0t+G2lr8vNW4d9k73PDxkwC/1bzKr8cF1+ebj+8Zfby4yQ95Z/ffbyn77+9mV58tV35V+fPH/+5KuX3/0x781O59Wc3xzp5qefY4KvS1Z1f/X28V0mngH+/PT5Z/+UTzz59NmXz15+x+y/ePbyq6cvXpQvvn5enpRvnjx/+eyzb7988rx88+3zb75+8fSTUl5cX/+6xWzm723yf27xjxnyp7vs5Ovrx6ub24e59O9yvA+Z4O3r8ubqr9c55lfXN7GochUX+fnd/+oMb+/e/sX15iO/begfy82P5e3d42X52/1NbCfW93enm1F+O9/LGP2rTy7LWvOmq7f/dpsjeJGPf3HzY4b+4vbu7v6yfHr38Mhb//wkn11arcvHtS+1lG9f5C//3X/l6Vef/w9B5YOLDPynT1uvLdv28Ihf/PsvgY7bd5z76/LqzdX91Sts6fHqh9vr6YH5GwvM4v796/vXv75WLvPpu5/Km//Y9q0z8JpRy8cf/2NZPtlPfvKHvFCXNt6/cLb3L9SeF9oyjl9fON6/sGx5IUPOF+ony/LrC83pPHt9DXT8as14ynO2uPyDj6t9/cOH9eP3P36Uv/Y5iedx7kz37z/4Nu9h6n8oH/Z9XQMo+e0jh6vrPn3p3c+BxN996tUPOEJb/w9WNed29zae+vCIP/30y6s35U1wTQyJoz3//PnFxTyB719+982zz558+f3nz168fP7s029fPvv6q++fP8n/fPj52xuffPrl0+9fPPt/T1nOvi3/+Urc6/n3L7/+/ovnT//l+6+ff/70ed7x4UXd9npZ9nFe1jH6ZevbuOxnyz/HsufXvvBrvaz7kr+NLW/Zzvy6Vv9ZY6d7u+w1f2ttWS8vMkIGbBmhretxWcaeofe8u5z5cK9by9/GcjmWbbmsZz7Szm3LP2O/7OuxZHx+OjNKP0bLgDn6y3Js5+VomVI5d96zH5fr1vxcnnSuW+afJ42YCa6Tua4nkzuOy5ppX7ajZSVjOS8vShu8kVf2vFKPPYta8tC674OPZGVH7Zcl07mseQ9jZa5LRq1r5jUOntlGxt8ymexh37KympUdR1bbji3TXDPCmnm13rIeV9syTK8je7Exfj3WTGnPg/uWhR1rXmWaF9mvbMtoB5vRMsKSGe49+7zkwy0L54Uj88rO9ZNF9Kyp9KypL2c+tnBGPc/MGnIopa7tsm5HHrX2vHHvWdm65qeyMuEM3c6WZ2Zj8zm2hk3K2jPMln3NGS2Z8Mqh55kXWeyaN2bU0TAgLGbkTcxh5ZS3yzEYv1fWna1qLK+U7FfPj1lOOzO5zubumk2m3Rv/jHy48rzMJlvcarYPm4gNDCwms1mOPG4s2Ys9h5eTYdRYyMo6s5H98qIvmWwMv/J4JsfcD2wCE6/jzPLW2GGcIyPUGF7fVncAA8JK5yFUD69mD9cMUzpHHcjJ5/KRurMDSxaQ887yGvabR12OHCQHzLllG2ICjc92Nilulb3HbA6G0XQzdF1yMoMp5Xg2DC9P5ljbe8fMm6uG1zBstia7lM/mSTHsHEpOgdPreXxlv7aTzdjxALx1y7b0Mz/1rcUael6IR2URB9twZvtim3lcbThFzYCN88kuYcQnS9mcXBYwzuxFwYgHT/KAd37K+fO+lWEy1oo/LDGgsjlDTDKQkDnsbPZx8qv+jd9uHMoe64hFYkp4euMEl5ap46xBgOzAguPzt5gNtorLJgbmKUecsOJhHQ/I/DdQihcWPodPslV1ZecWnr4f+HyePrJpOZQjL8cIABVPIRtUeg5gZNjLdcHE2b4OOAQ3M69tYwrYOYC0LgDNGj+KxWGH9eQ8YksxKnbuwJsyuVLAyIWt2mITdYl3xpfwycwmmIK1AbAFizzxmSXWFl/GwXMgOP3ODPPPwKtXTKsDpnX35LMNXcisWJHjA2QHaMMOt1X4GpXd5UTPLD4WHg/uh5iff87YV8yBNTJhPL2C9MEwRjg8lODHwjHqy4lxnQNgKR1Ly4DxMByChe7ZyBiMw1QwcvA4vJ/xdwxhXx2aacatYofA0spCV/xxjWnVM6cQS6sEqfxtVFFDvGKbs1XZpIxaOfSNjTyNWdhh3IM5nFgak2PdjSDYeXLXjStx7GCvmXDVjceKReKOeGycsHOMGbCD+TEbweHEb1nKAnLteCJPHkt2YO2ac0bleAaGF08E5ljJyeKPDjhkTjEbjYAF6KPbIQDGvhYOZXTcbAHA2ZqN6NXZmoPz2HOCY8HLtgNfrpzPtmRHeg4zKNWJm9gE9lt5Ye9gclyoA+pdm2uJPYGiyq7HdgafXdYhfGUp7i6IVLXuM48vxPi8Z8EDQBvCzpmPlIrtHCvGyDawnIS2Bg4MADbPG0dMqwNGjZDfdv0WoPSNS44s5pS93oC5zpPyR+xkI+7zPiJmhYr0HQjdVg6AMyO6xIuJ+yASOxy/YskcJu4fSANJ2NcFqnNCXoCroAa+DO0o4GPZ4znV84dANcJJbzjE4XkDq5WH4H+NNY0zVlqJLtUQsLnkZvzASQbzAlYD4MTu0/3KG11ZA7EJgokSK5gPwhE5zhh2lfRAYzLDFfZVCbWJNpXzzikwAlPiCLNQQgfGWMqC60lZiK8VAA80xYgAqZjcRazRaCBIEhzw4A56bhzPecjaOAUWBYrH8w4wP0/i5OMfQA64RjC+SOgTEojBeOtJXNv0akz8EBQP2BEbiUNk5wA8IDNmis/AADaAOK9eBImJGhg6LzdwekCbQtMwy5OoB0LEabLQWEPVshJj2JX8jdgQmBCXm1GP0AEawGUbJh+TgCoMDxPDnudYMUuM8ZDbALp5cD2xrEYoCjbhy4AdSJn3YFpNvMpSTsNvJlLBsDid1BbzEiGqRwbti8nFxDi3zP+isNqKhwVTZCoGMoCM2dTTPcROxDXxcJG/Qcb82BA1NgJjBowZLWATpwwv64DKTuTdCNgNZCkdn2xYN7uy6QD4A8SxN+jooTFi2GGFHFzwfWDiCWlixUIUJzICUC1jBVBBiNU3N0bohFbctrLXB3wnr8YOsaU1lpDj2Ek4WAALJfR1nR7sa110xkqTf2DnfCx/y0byU9aUU8RsOMLCViUiMEMjhFnHLmVlwidEe2PxMbd8loVu2hi0kvChi8I6L7peDnYU1l2rbJXDhNpWNiTzB0JlUbjsuUD7MA5SoDoAlrwndmiesgJsKzjdwKF5PLjjgjfJALaccmHAZpTYZMNQiuG+5tBHky5kwy8q/ybuY/eHIQ32YtbEXDfsKyAAEBA1MJvdACEgYb5gd6bFqPhyA0IbCUHhjeFKhO2qewK1LopT0Lo3Ar3h5NiAJkLYSaa2ED4wk8RlDA8KE0faMewc8NExZ0K5SH/KzXaTR+ZKkFpX1g3TNX4vJkOLaEN22tlY2XblAM7AV+IfgXIBIXIUIXukh42MYjUVwOvyicRlGOUqdIDYwuU2zBGJ55BlWdvJQS0eAP9gzjkZMuB8YmyssULuD7aUkN/ByMBXNdaRb4IiFR7TTf1OEhN8jQQmTphfBRW9QpqxYIf77tA+rpL4sO3AfSMLaHyk7FLdBXOGjs5wgpUu5ujscAIB+RMmwTTLJpnMDAdMLqjR4DHkZzsATqCXc+VHOMsC42Byi0fdCYeQBnnxJvcjLjej3knaqjCgEU+WgJuByaGK8BhCMpmtdm7O08hBCGGdeBTGyslDljqbFg/GBIGqsRlg5QaVfZWZCENkrQ0TWT152QT7T+g72QvYXfCQjLsTufqEvZXEBPs9MC3JBq594Guw9AZhjpkjXbAr2E6yz4ZxMCC5ZTkBhy1nG7sgLyK7Qh3IQrFkIHonQkOHKvvTyCArAXXlwY0TzBIrh5K96eJoN5WFoTWct0A74MWJhhgV48sjd4z44M19B9kBvIM3D2SW0nR69JhVdjRVEZjiYbBhD7Ha7jafMpOOTATG49BQpKyTXHKQ63FIg/Deh8LDUM5QQwGdQa4cOMfKg0n4ymnId2FsLpZFMjeI2uHYmVIhB01yLR8lwZcLmuQQ0hYY5g7zgfTEGPHEhiuobpCPb6Q35PsBBxQEsC8HynvYltWkOZ/rsMmKiRellyOTG8SiCoJWqefAYkg8437E5Y3zWZsbSQ4nvBCfKhQfytcXwwnhdpDCZz2kTgtsZSMfxx0H1n0AX1slGhMSCNaVHYjdMyXI0jg8YHQIwEfrI2A3PlblRRXWuYNhO66X8EjaDUlBjwkSN/Iilky0P2RVFZjQ4rvWQEje2NzTRIT54wWQqotyGtKae0g0rtJmzBRWpZUuRgQkQHTA7jaTn41KTETmKoeZJq4XMFIhZJp8hHVnUPU9gKybj5NaYg1d1gmurcSL8zRzJismx90PwihstaMiFXlYA152kcudI9eDno4DKD87bowsxaYlXgA+eob0wUAPI+i4cW8y90X3R9wEjrsWSfxYVXDAq7qYTROhB0qiMDRpRjxlnApnWh/8cLDajVgkkT8RuxZsegent+B0DGiDaKOrbGpMMBMgbayEgLPqnpIgPEBhC7RpZjUzR+BXR2BrcPKixRxdVg4uAAEIeBDOhZQOa9dq3bR53uAhoqgpL+7SlHwn5LD1O/vapsaLARFT2i7dYikdDrELhShxnTgAm8zJK2KANjzpWGWn2dcTd5cS4W+FzCOGTZrXSQ9xjYLdtynMof4th2KUO7ADWgQDvGLt+BaL1xir5BtwaIjUhfjRdzmkUhUUA6xI6j2ggUYcNqSbAJh59DwOYreZqSHY7gNVZMfVEZ4KukQ+R85+SoJIgYfpOXROFWyw0Kmtmet1DAF7HboeGT22NEixGxlYQY2vUN1GAr72ZmKNsqvfnhKCAzzkScgesPmu3k0KGl8GrKtUBLtfAOvDCZPNrcSiHWGZIDXQrCv8OfB+gDsqV0Zo4wDgwFhNV0T6rvC3OtUz2TCSKTpXyIVpKr/OYAAfgeUgRsTx8f4qc1CD2OT5ZuqkSfiaUivpVLJF+VQMAcpS2yQXEi/iNxLpTG93dBuVsop4I3aoWaO3xuZ2XAqoUjQGHk8l+FWhjCCLb5HHZSNlUZtmQ+QFf1fzFEyX8WuTXTSlN0YFYDmUDlXLUWPJYhhT2PPqKuFsaPAFKGmw0KaYOmUWqALliQRKs0UKDqdPx4qAAMJhDoWHgDskDxc5a88jLoue37DknAJbRaZgygjF71CrKvMhNPUhahDRAPBCIBkY8kXASLKPkYHY25SNYMwii5UCzpFTrkTC0T1vhABwrbBTtU9NI4jdQLyOrp2nQMEAOyXg0xBwct67eg9bla2JRQCUIPuJyA7Nzyj47kC6L+wzZLahATZ2PNE93jpNcIFKQ7eWbrargUK3VKEpWx1qXYa6gWFb4lFFAneyeMM0SE/w2XgjptpQQELQLLFheEboQ8WDfxBONvMUeExHz1/xlAE17Gg0dVOgAkergZLzbgTUneC/n/iRIoZ5r7W3TAbCqc5FMjExBv8gSCH1tEOVGObbVS0aSSBbWmQhEA70pGo9a6pzKk3kYlkerofmjpJYMJuyCdGkByvBZjcNng4HplRzb9BGgQ2pqqAfJg7gUoIwyUrX0kAWImipqjqbAjG/EiBOlDGE2AKXLVYi+FvSWzD/lOUSRinVBOyMQIoAwCOg+x53OqmMGhCxZzEhg9Ph0BQU48vWRklojGaHkANAcVBt0zDECuUZ4sWpQ8NtTrgsRZvQJghNl8GqrTJDzLQehl/meuLfBzg9IGMEyg6nGxDmjs7RJa8Nw+6Z9VoFB7LRRoRoijK9ycMBTjx/ZcAd4YRkvi/6pAqUMGephnIaDtBAiIuG8TRYSSX5SlyjWLIpUrNaTGlFOye7DlqSx0EhyVWDbYokENpuSkqBhlhRKUAkdCC9cf77po8iBPk33MXaD5Gk1lnAJNw2ZQkLIdk4wkLyZYXxHYeDnrLZtalPbuazCLFT7YW84hCkLaum1GeCDy5g9kNVZEUcbFTRFGqoBDeCc4xRmZ7FAz5gUddJQJtGzaAUQBFyHCAGMkGbuphM4GabkZEyFq9UdM04NKEcrxCvjDiI+GNopQjJuwVLIGbuYbXSydEPtqWQZ6/WepX7Gk5v1XpW13bwwyKaYUH9EI5VKe7UuWRnqJQvOqP+Qs421d6J0/gHoW+DcVRZwmJCZj1WPQ8ln7jc5YczReUjyngIrME5lPCMOvCFJHxkkKeVD4EAX1aUbiqO1n70ZRQQAllrMkyVjGYZHJtmeeRnsWk4KvQXF01UoH0BLXIWQg4rHQy4YLBy4HNKQvB8dSiTlaY5EyPln0r8MF1rwog8HbfqKDGx/ZkFrEyE4Hwa4zVTU3FrhERCAjbViiHjQEfpFrGbwYbCwWqBqZOnsHMJjHkUvhAzB8BtwqCWRfWogoKd3Qw0QS43CiacxyBAQHoqum+Hf140ycDieqoslzoMoEXxuDUhVPk4zjvw6o7RVlyjkjp1FOZCH0Uckz2EmjQrH4uNGrwMBuT0pJm0PeAkUM+BhjVgCR0AbBDaEExiAzNyyQM5KGGClbFVg80gj2+Wt3tXr6JIvhtibAnAC3bwA1A8SLZAl6IQVH2ZGkiVgJBbBtpBINQB+yhkWoOIgzTZxtTETT9Nfs0RwGV9uS+WP0xRgNCdGSr8EfCsbA7zf6IjsvOYaiwKFP0dFSKRGfDTMkMAhr1L/mwtwOsONUb81s4Y3r1bybZHZlgPwgsMfWS77hmZOcyBwiEMdhbSN1MiyQzBwHMEqgitBerWjkNzlsizfcoslGFIhkKWVOgXa00I9hPL8VtOnhSrdsvBrIzQMVRP0DWH6uVAK5o12m1Vx7a7gZApcOqUZDrkRSt10IAPVIRkflHAVYXedG18hgEtvSfAciiWkc0CYPyeMnlX50Tj3+rA2dxdBUc1k2ohYlfHDisC5BBiKPWSpyyUAZCN3Dm7c9BCVBvNZzeYyTRnjh8grpb05BVt0nx0CCqPlcnWavMRysnQZWc9xSo8Dm1H0K42hRM2swXMxiwZu9sXxf5mWwLBB+Y+O2NY2XEoVZG7kvPgiVXBAmUs6Y7hEPSnBLYoXFImWSbaDNsZ6B2wf0HlyiYDy+4IsWRSBbW0IVw3uFMxoaT8mDyORNci3QEe7khXlk4roFgOrUhVBE9pNlOg6sFJ6R0oSDbtVMGBUTpN0qdBeLoY3YJsIZ4LoXDUapsIMsUge8fsq1UzhKYmySW7GtCHkImFJMqI09QPIXrkuJuSPAdHtAzFs+MBVQdjt3iB/TZdD5Gvq21bkKEjpG7yw9VeBRyafDmeyeeUMw7JAGdkxapqjHZskJeSZez8DeU1gGrvA+yLdoPKFg+G6YBRRxfK8mS+8LdmbmRGT4jpdrnZbWcOYlAiUbdNiy6rSo7b98nkIYmL0piogUSO7kQjQKX7bqWhqkGO22I9y6B02ji2Cl92S+HbiaWr1VVKJIXyZq+WSmFtq4kJ+ohASSYYeuLqYjbIe51oH36oiUyr5TANUmR4WHeDyFdKsdWCH+DQ2IFK6awhJ670uw3r11QwEqROuQfdGvARlfZjUeMHHJSYLQJjGPZ3kA/0ZkXGZE6wJqag+aES8zmkvYP8abWYRKPa5kPwukOo7aZ5Vnkt9XNuCnGAAQy/HrMZz4zYTArJf1VqtTdBHt6UPAR+zpaY22xFErZN83YzG8MOZbihrIrp2vFAStc29Vz79yBjU+njAAZs+wAwbIqgWlE45Xq6XRQXmp2P3cSBNZL1N6ovq55os1G1ao1kA8mqYOvoglSz8ogfLRawmk1QBC0dlY+IJ0SSdswmRIkL2IQUZl3PmtFQOQZtSFYKMk6jSfNiWEwkEGd8VDH7SRBNYL7DEigEpCggIU0WNL91THlMXdP+MPPSmVYwEU/BpNPKgUk6PVE2Rx6W5k7zbMwSQqi72Kp3WgPZJT2UPygxVDLWAYfsQ3MwUp02+dhJa33LmhTwctrVqGWB2PPcgGRSs26pX9qMGlE2u4tsisESFPTkyputYXAPGn+q1TsLGupOpz1RB653WPuzor/bJyDjICmg2jbM3lECBoa32oZi+VRWiKKmGEgvWzWMVshrDN1yraISagqBuJtqHlb57dekLyRvHtYl7f8Vn2hxqO4KMYT2GNiLDXTGUkOMPTmbxkikAsrtgVM0LuimFCHqPis+7LX+p26D8Qyav0ZT9rKpuVPPpixDmGg0Dzeyq0KNoiAqVA9lUV5iETZxnVZvFWp0g9lMOtuCoBiwHBtBCK1jtwfODsliExSpzKLKrRqneoJhT4ZpRYNoM8uiUw0ydPACSSfCQDF7p3bSNHEIYZVIWLRZ0WCbqQ0+1Ilcw2IlP3X0F+7aQKoRI8jHu0q4IgxiuWIHIlI/lZ1Pe0UoaJ0WuhflDdk20Zh1H/YkDru1TxwO7kdGNE5ru3v+ZgdNMzO36C8rNH2Dl632chCrV9FAT+GorS2JNtIMCzSQhIZ4VrsJ/ia32SyqyUIhVKTmpBpJMEy5jHAcCrxyKIe6wzSymDQZh8lpQ98Jo6dWpToODq2TtcnVKLzslqhscYdKz3Yug6dlaXZu2HZr6Lbob48ze9i1SPpOiB8NvC1KPcPkl+IC+Xij/6VvljLZldUapNV6CzTnhFBKjXoY9YLi4zFYAnihz6ib26/WDQG8BtfgBHu3mRdbQWe8KHZQmThYC6dtvFKMaYu1BodWNWQls72AJJAspiCUFn153SxGQ9rHbFXBTKVp1TYU6xGECYw4joWBEpDI8odJDUGwqNiJStBKfCZ5ijbRfCNkxr0HMCQ98/IBFImsr6gmU+8tzTYzDr0qKiHyyA+rimq3GahQtVYhbLY9EHekOnbrW8vAP4hC2QaahpqyBCCyGTa7nbquEWqCOS+LEpc6OQ5hb5B7oekidTeLjogpFurxxEaBpsA/L5rplQ0Ly0wABFis9lDbwWWrpTk1SxyADTc73PO3tcrwOVWSd+4F2MCl2uH1BUvqtqLZ/kEV0/kvyhIWEmRkpBX2lTWrWBweXVUNBthOLzbg1YZtbKchsJbTxj6lntXOVmoIwpfdRbODlLeQMRJaE6QMHbZgErFP20OVhCzVsdm2WZBlFOowjSOrhx2FLNSmXJOtxVY3M1aodIFfNardA/Wp2eU2i5VDpYQ+I+HFnHA3M6dqvZiDWNslAddE7JlQUECCGrvNnrMCR0jb1VqsuJqUC02yO+IT3o+iUmDNF80Dtpp3WsVG/sFlG0tuaJ0DclHOmbuAazzzZJpU18bsCa529Vc7MbzsANyDrc2YMnteDXMgtjo5kRCpbdDJXm3WIF3rsMJ6GCLRviqp8qowC6YVlOpq0Wa3so0dSinUc5UAB+2UrLavNl+K0ByCV3Iq3QEhbGQFiwob5oCJ7zaQH4rlzMbWiNVSv/0wGhp7rfCg4nhgNkNlY7W2iHjaTBzs5rVfzLY/xUBkEPptNqfE1GkhLLO8wuq425QBrVCv3r9QLIBtz9o7GfHOtluyIA6g77RDLwASCrI511qGvSgkvxfd9nw6tbtdF6BuJbJXQlOhnFqtWCIOjc1ynX1yYKvSLeGjW1edhyKiIsV0TL7QA1CYYadY2ed9HgRi0zB7nTDVusu7CRAEs2aJanLsIRTO2zJYqL0iu2VXgHMRnaFIXrLRYnhmm/1b5olER3hqlX3RpFTsTRmTPrCHXmkB4jCResyCGTZHvDD+2Swn+fa+xbQB+aEdvqeuQVcrJl+7XkFhB+/pdmYrg/DhBisci+3yXrqwn4DkGhdKejs7DbyfBKOxRAk4mDBRmEpoGFzvMYQRnG0SsxPY+0JDxZ/S5S5ZIrxAqgvlj7bO/N+rF7ZDEdwkf7s+o0PYDWlJEuDnn9UrXpXkccy2ERUdRQAeOm+ISEAU/pTzISUmCpSp4SiNqkP4CE6B78oPuzwJSlygUeVUZ+5ejlP0senU2yw8ZFdIBkTs9Oj2Vyn8SFvBwzb5lZknljyLx0yJPbQHjkaZgmbdvDhor+cqeZlFDwimTcyz/1BihDBkUR4zrTTphhcD8l6osi3WXInqDpG225IztQMpMOUPknJEXXgAuukwwAIlXmTQHZs6cFdQwNIIXAhUhb7LwmXIvthDplZrxzglq3rapakOBVISJpqdPl6+43PNFnSWU5qyhzr2bGWlKwUWhdZMHywGZUPdTCHsdjfJIaaAFbb4UZvpSN1N/3YPTQroY1rlxWQZMZtZpEWDBSao43ZiZG3i1aHZS/4IozYz2eJHaEJgqyYw9Nk2qhoXtWq/RnbSkWKzKnwHrtxo1G627nnrpc1WAvbQBOm0kEqZYZFW0rPUp1aBXNY8FEu4JmlI5D5ENunheWtgM9eD0lvFIuEGlQqyY5ZsExGIrYSGHRbMuVqamy3uWJGNMs4QNlwPW0YX79iZiHrBhbYErK8hERWE2WJfC3SuLTbWajunC/UGmHaCFVW7u6Ax0xVkK97kskKNjyq3byr5HIr1crqSxuq1B4VlNUVv7i1eRESztJvaLj0qPpUSUlVdNhneZJ0WHCZYG1NUpOw4gpHt9kujp0OiEaTa7jVCeufq7Ci1wWbW49kMjF8RwCXD6zstZYOkvCgv1cmkBXDxD21FMW0sXlHkRiGrsCNI5mt50zTymOUucz3safYJ2wYGnAAGh3cLh133s6vKJgbVawO9i1JIsa2N8KsGa1XcShT76i0kzLejilR42EUjFy/2Anr741SXh++u3oSC0HoNmujYYD5lnZ3sXisk7tvDSYbNDmeGQpyysz195gyz3IUlqLR7cWV2bkIzdtuz9ShwzYIlgs6+LAYp6OlhtxR5hJdOTbmaoow1SMifpfdV+RjwtK5jQ02jp7a5iNOrEF7HsDtAI0B6A4FQqTob1NZZQ4d4WZL0coulP7SPZlXR+3mHjWRek9xtSwEhJGdSVoSUVZ7R9SPbrOU7yKM4/iGQCflQQXhe2NckETat8Eq3cxPKaiTZvMRlWUYcJVajnqhwkeuNYfnmNBLSzcKHi9Ihh9SoDvfuWNZxvSZnmzKZCMpxN8mhJFnfizBM2HqK0v2uKt28M6/CDWzLF+y13+Ue3DLdpSwK0F5HUyyHfVGQOyazsmfJRpDdVmDSYgz2tB+tmqECzFbOSZppNx6LnWLevrLbAMu1YYReVa5ssyO7zdze8VK3IZ6j2yzzyp2JLuGQc9u88GJf5PC+CCrYLKdVqYgaIxBqYPHm9yyDG5oUELBzLs8sdpJwAAhB7fDS3iTt3hAgSHFbqoALrdpda+laNcWU0WYaSAmjdkyi7fPqsoYNNHn3zw4BstFqoRuO1zjqgpLfql0Kq8qoN2N4pg5XVdRsTGSGXjeGhcwd0FP8yoHDG9bzaw4IQ1bON4UaqO1qOxHpoNKISvjprSCvmBB9rZ5vu40TFSETDQKAsgIATR782hCyqrhD5a4cXqtXYIOMlc0bJ6oIWKkd4zStVC6sF1sbKYZ2c0mvZ2O6xVuZpwSq4AUEPL+Iwb4Dy+W7zX5qX5Derpi62cGx2fcn/lKCoZMBbbhu8/4v5+1V+0WURaKbupZ3HYAvG4u4FVERguostvoNB1PvIRJ699binsNUBQu/K0BxmU7p1VtH3kLiobCLNrVhyNgkILu9qyyvepEMKDwEQFo7unkQNRB4pOIWzefxZSH69LaXpXhlBHv6qNGbGe5eLlN3tFHURha3wT5xWLkSuQrnaS7DfsHki2zb28eWLb0dfDi5zQscThNN31xVbY0AhP812nQSAiwSSU1mp4FU3a+5IP5ZvqOIZkV0zGY88ye73DBVKmn206EpxZflV8U8nqecljpg/LPeAc/YJbQGbDv3YDTs+qEculgLtXxD8thnbiy+e3uJMq/XVUSW+XUValOwKC/GmGQuxjE7EqjwUGravBq2eqeW5KvOooRdmpZz7IKxCouAsNv6681vWO2ix8I6bdm2p3KzPcZ2TlqNkfcLhclqSdrqy/CuZ5dKSWjhQGKkN8TnZS8LDlBuawHDpnlIin2RXlM2kaPVpi82ldhK0EQgsmRgldSpVu+gGo8AShRgrjWBV+DJmDHM/lav8lgsgQ2bPArgU2pDq928EeJe+3UYXl/wWztOnYv4tNtRaj6LQ5vrmR56UQ2LJHnsBK5i9CXxHOu8+sn8udZUxORZHBveGAevXNRmf795MEF32H3uBQvvuCquVOoiwNdKSm3ziZk0pbRSvTy82abFDtC34a3lbhFKzii95sEg75gXx7RXUkvoYugcQZ3aSQGHCuhWLGCe3jZQa2kSdLGPaOxNgma9kUQU4mu2gFdz4YVhqhkxDTzNd5suWK/Br9gvG6+KuuMwpcYf4JZoDL3apec3ThCdS7PJYEZ2m4jYQ8q8Vv53+58UT6uilTeHvDDO5JTHDhuiF68omi3SQS71VJywQ3neUOWmLqhhpzw0sxGS6zl7Hyhn+90yaHdoGmQBFrTombAmZdeI3/EApJFV9vcYBoC7CPBwdjx0iRCrm7GBtGJ+yYM1Nhag7FXtVvN4aG2k16nv864qiaL9Tzj5ItHGRWdL52nlceKJFWS/Q8QORosSfnkN6zHywg/RuxvXpZvF0OYeer+b21b2tFdbhxTBZ/WW1dKYM7y15a3Mw2/yOOQj3gAzVcLEvftlOdBqRTcE2AHh105w9MgBxW6WQrI9dXKKMfO7crxJCcYvNnQo3c4OM68GzYuoaoWUI09VKvZZjaPaIK3AzQ1rOwWx8za/s8kv8eCU/ZaW4f0HqmaHnbQ2QgK1Q0l+Xu2nzmMvvFEChjl7lvK+je6ojVi3UYbZwOXNIkf54Pbq4ZEK/MVHFxf/H1BLAwQUAAAACACCsHFRfqv+jzYDAADaBgAAFwAAAGNoYXJkZXQvZ2IyMzEycHJvYmVyLnB5lVRdbxo7EH3nV4zCC5Ho3pCqUtuo0l02kKLyJRZU5QmZ3Vmw6rWR7U20/fU95jNNSXUvTzAz5/jMmWGazcsf6vYeBmMaDpLeOO1RdzhJvtEbtc1Gk+YbpomVa6mFosTkTNJRaX5KpURk7JoyxKLGsXSgpZeovOcnVmbLlkxB/gIH6sfsXSa2jFBZVlpmwkujHX7arbG7HyCmqbH7eGZZeM5pVe8Y/3xK2MC1rfHUxlMruabOp08fQXGxPKJYKZqFWkczdmyfON93khjtrVxV3tiWu/6MCNFI2B80lWptZUnvCAo9eUPT2m+MPvQPa5RcWWHr4FJhmcmZwj9D2B3VpqJMaLKcS7enhxGehM7/MRb40uSyqEOo0jnaCao929IdPXwYL2jIDkrpgTVbdDOtVkpmAA9lxtoxCUfbEHObs1P9ICQ9CKG+Af3O3TtiiXx4+4mtQ4Ruo87xtQNjm4yllvBBP6a5DcBriK5JYRr2iIwuWnDuNCepd7QbeI8vIESjz1gjWjFVjotKtcGAWvo+mH+dLOYUjx/pezybxeP54x1q4TSymN+eSZZbJUGMrqzQvoZwEIx6s+QrEHF3MBzMH4P6/mA+7qUp9Sczimkaz+aDZDGMZzRdzKaTtBcRpcxHi4OZl0w+WVyAsjRwMmcvpHL71h8xXgeBKqeNeGKMOWOJjSKBv8i2/l8zVEavd/0Ccjb0jmRB2vg2PVuJ3cH2/TFdsJzn28bSZ1GbPnRQJPQPhRGkgPdlAeq+Msa2qWucD6WjGNib207n5l3n/U2HaJEi8taHeuP7/3hEmo1GYU1JUbnKNsI69ltrVugf8wt/olGlvOzWnhNkU/bTXfaAwXWReu08Vq0U2UZqPsKSXSYNmdE+c4SA5rR3YacPgIfu7fvO7f2LTIx7VDvcopM+58rfy5fpaDma3PeGjUamhHOH8F5j67J0HAzcC2xHQculxNlZLluOVXGIh4+rcIBaL7natCuJTojrczESByOW0PflQuutV2pfgV/asRSh65/w/8tfLHn9vMV99Ajuov9igNDv61Ofh8EutSj5da+WfWU1Xe0fu3qLQgm9rsT6TXgS+nR81fgFUEsDBBQAAAAIAEqliFENKdOymRIAAA42AAAXAAAAY2hhcmRldC9oZWJyZXdwcm9iZXIucHm9W+9z27jR/u6/ArU/WJ5Kqp1r2muu6VVx7ERztuyxnWYyeTMeiIQk1hSpI0gr6l/fZ3cBEpRoJ3fTeT3Tnk0Ci/29zy6Yg4PuH/Xm7N14oi7Gp2eT2zP15uLq9Bf1xNqDvQN1tzDqqkjmSaZTdZrHRiVWXeb/SdJUqw9Z8mgKizfRQhfWlCo2pYnKvFARlg73PIVxlpQJlr01jybNV6ZQ+UyVHaSxvv65XWzwP53mSzy9zosyyTOrosLo0sRqumECu5R1YUBttQHlRal6p0fqxfHxS5DoXD5UozRVN7TWqhtjTfFoYmH8NM/KIplWEKdnj14xa5e6eFDXSTovkqUaqBW4UmWurjflIs+cuFBQmkwLXWxIV7PCGGXzWbkGYz+pTV6pSGeqMHFihTzkLpXO4j/lBfYv8ziZbehRlcUQh7guTbG0XmXvJh/UhbHgVL0zmSkgzXU1TZMImy+SyGTWKG3Vip7ZRaOpc2Lk1jGiznOQ16TSn5RJ8J7OJmPiiXoxPPGnOYp9BZv2dEn8w3gr2ngEpjcqhTUKv3PYqYJG0lglGZNdQPf4BQQh6BrOpKZGVdbMqrQPClirPo7v3l99uFOjySf1cXRzM5rcffoJa6FpvIX9hFKyXKUJCEOqQmflBoyDwOXZzel77Bi9GV+M7z4R9+fju8nZ7a06v7pRI3U9urkbn364GN2o6w8311e3Z0N4nDFexaTMLiXXKp6B5DKHJuHyOkmtiP4J5rVgMI3VQj8amDkyiJFYaUTEavObbJjm2ZzlxZZGoT+pZKayvOyrdZHAd+B9O9YFlca+fTh9NOyrlydYpLOHFCa4xfbzZAbS52meF331JrclLb0cYe/xi5OT48HJD8cnSn24xZOnftTZ5O13ppKDvb1ZkS/V0GWKVZFPIT2sRyF0ioe3przmh26hySo4vVtAb5JsflvC2/a8izkacW5sdogQispKp+mGlJ7Ps+Q/0CHcM5tXem7IA7RPU7CVGpfkmlotTEpZw9Eiq5I64YreVu/NtDBrikuTumV2j3RSmy6JjbZby31CdLyQIRRnVLENfEfDDm6VVeYrYoSCQ7ZTstkf314Nfvzx5d8GP+4j1fwrsZDOvafX6ySL87UdnLx4+ZIWXOTzJGqtaAgMxt0rvg6WOhos+G9a8fPPW4vwhFl+k8NXiOB+wzPpiNwaAYisD71DD1nJm0ly6IOKAHJkkpUW7oocAz3tso7Ut80JZahynSNzzGbYlZWkeDKTrfD/fDqHORQOJoJjhiqkjdicJZmBmeOYTeAqFTwFVHwuQlDMKWSOv/54PDj++rdzSp82Xxq1TGyERJqRY7EFl0j/ll6vDVKWXyaqGtiViZIZx3Cc6AjRmUSWpQuOP/yU4A+7OEQ8z3VZQVBob4cdMBMRM/FfyFdD5dQy2WSZpLpoydYoglMoJw/daJHKi16tEEiSrUYoT0SBuFRIVwUFijN8ab46AlkeyoOgifIsMkVm4j6SVIqYqah41H5BxmtcgUkUhpTDpbJlrEujM3AjlcDFHjNZRwJOWC301JTNWSQDa8pqKP9RpxW0Acr0/sVf/T6nVVDrJVmUVjGdM2Os4V4dNfgkzpd4AzfzqooMClK5NlJkyMe8dJAfTxKknQSxLYpPyg2ZaV9idH/rlVpCSisySjX/yrknL1DfqTRYSulsekMln9Ii8Y0krzQXa4SSVm/Gb8duBYmi03kOkyyWQ5ag3mqNsc0x8D5yx0KvLVVazqypmbElGCDJbmGptCadUZxmNW8ZuSgnVTCM8CVqUx09gK0Y9hvBzUhhxGErQam55EZsRIF5oOr1QDCIE9vnVCPZrXEG7ZslBf5CVcL7FcKKEIs/4Yv6vF7kqZHXnqn6NYhReHVtE6rfdQaofIb2aB2twOYWfxYZHG/l1XA4VKaMDtU+nR2zU+0kiL5C6aIywdydZXMCYqJjqP1R9OS8gOxc61inNlf7j86LaHOHwdhp912aftLXdt1svz4HpKMIjznycoeMeRn5iDP00FVI8Uu7AvZOpgmfkW95a0kJwq5SvXG0+GhmXUA4FpAM5C/sxbXv0gEoIzGtwH5EnfMbEPotanWpk353QY3fOKO2UifFkk6XOZVa4AoLiVJGUMgLsHXmWoSSkhu4PS+49VhT4ELwEmvNI2U28DlGIiOURzv7pDbE3dJ6SGu9HFvmATVI7GznOM1R1JaqWnH+cqrV0/wRmDvAEysBQLAvMlGW2KV6yFDmaCUSPWplkIEpyNrRONhGE7X3i/4G6mNOf3A0IXOTiJzIpR9rVq8XSSsaSRznV9AX9X0duGdVFVC2cc0dCdUmUGWC8igB98YZalKEdC/lIGEImJoluHJwlqC/kJIQ7SBDqX0byQx2IVOWF0ud9oMI9MHSeNIWimLMaKupQzgttEHa82A0M+LVU6dCDw4kl3J1nCXcaW5jHzqB8kCziAFHcBDFkXf7cK/XL1wQKaukIsrHQge7ICYvtqq6C2FqpRCajmuCN9iaZwAH1L4F6AltzpoLkVW/ogI3pIcNOofdAKKQApwfEVYrKCBAqrK8G1UOwLAFr9n0oWBD9baqOx3yjkDSVoCXHPYU5lAguiUjXdKTByVkq9qXuNNCjM9m1HKQNQE2Z+QjFPGLRDyCkD/VTGlW1IFH9fSsJgttUqaIGxQBNHv7ptXnOGzo/FOeUfPr8gBCLVqwLDgfwAxpxs0+EBugjO5OI/Nkv1YJowhyPkNI3Hf8IIUTb98VebUS6q7Yd7HivG2zC1MSCjZSunjDQyKlUrju11EGk0nOkUMEacXwPp4oSJpikUAtz3iMJMVmqQEI3YwiVAU9Q3OBrFcjt4EgN2XhRZxOXHds3BOfPjslpBJT5HEVUdci7KFUrqGV2nxb6pJS6EpfKi0/TTIYQbui6cZXrCzSyt3lBRVBPUe58iWqCZq6hPUBi9aD0e3peNyKzXCpXaEgeoyTEaQl3M91GQavOENnG+RrhB85KGGVKgqPY1SsKM5SI+SGTlIH22aSpIzGNu+7UgVJFWpOugicekXtiss8ILRAZIsMnmyn4nut1vkIiYPbOw/g6w6dl1Ht+phklOYu6W9PWRDcFm3CDoJQ5AjJ5wSkRDW5m2ttb6Mk3WdEVU8KwvzaRzWGLSQAuQQJ+TV3r9MqSR1sdtBwmzyhpjxlzS71g4i60kkxyGfOg0GGYDGU69TdVkIIsTmXYtWKbJrAzOYrfoGM6P8qGr6xh3hU2RpWSIYl8q0ylbbr4tKp2Sm6FYJU3dGF+FS92eJThqcIY1IoLSahKEwoY4QBW8MmW83nVCscXz7HyARymzOEm4gFcu99IUjsv6l5NA4bN8Z3/tX3iLVKy62hjBsvHfBozUhqlQY0NRaqbomu07XeUPwDGgBRHw+Pj8mtYPCZyAI6UEvE09sMmKRoKrZtRk2UxaSxQuBmtgSyFg65BRbwLLl6W/ErbR0y3pGR/dtPrvYnFEWyb5/C5ePCjUbfheHrJpG0EWAMNfHR1AxHknxYoWTlVV2LaDJtgRb8XCyjs5xSvYQBmlFjeeXORGIqCL8QpKklbInS3xGOjnLIlM6gYtitojC62tWGNL1j9r6jUZckX3rCXqghNvBTGVdZaCRBiMpVWpqHybA+sIosldQgpUUqCHlQM/omQOFVGKizwe+BQvs+MragK6wRAvrh3l6EntW2BO61ktLRqz1COQftVPAn1VBpTY/AE7snYpX3nY8no4v7X0bn6rU6/mo0P5xc3VyGT6fB0suzS3kYh0vrpyZYOvkwkYezcKl/OjsOll6fybMfwpX+4Z+DhXe3I/SZ/PhluDZ4/pc9p5FLIIwlWjDXMj3WDVprXCTWDQZEQ7fduXwwOYLRpwb1nWtHH8mRGoKCJqQ2T+k/rtPcJe9I0oWJro+4HE/uRarT96Ob+7fj27vR5JSEfvltEcRD/xe8AxYyMs2CkH2e6curt2cXIb9IoifC8r/Gtx8g0PuzNzdnH+8no0t6Hbo0r7q4ejc+3V3WigWhF5uZur+HFsr7+x5lW+fv3MTQzLjXzgW8ZFjvOGoWU6a+Z8vcUzzeu5p0Lyp8rSYoHU+vlnr13OJVYR6730wNUoN5ZoFnxSXKzjWOgWeWIKZNCYlrvcmDbaV9Sw/H362EZmUDEnnCFjaT1CO5BEkKSPLKOpDaD7Yvr0k5lICXb1hb8jcNnOViF1COSyaDXSIo0wF64uBSQE3LAAGOnCwTikHX+UwNQD13HS5NU6vVbcZDdfisFcP3LL01TRGnye46a25oQ7g9bOwD69xzuDmrWrZV36Ml79Ki9Va2f8Z1Wpu/4UMh5YatxIrNHTdRcKaUPBWRAT4zzbp+SOgN6yLR+hs5v7F26ydYdH3W2sMZ/UuLrSzPnmRNXFAaBXVndZx4kKvVPM9jCpjBeZiYYxk9rHlARmPsgNZhaqJFXpryUPXobgO985GfvQhkVhpoqyzyFWGCWekv9OlgwfahPzZL5ZbFDV2ki/MefY72wxQf5R7ctZgX7rKjoRXpBv03IvG5TG+1MpodHiy64bcLBx6vNYTomLlrg5ymBJhZ4wO21QUPt1TtcdS14bj9Rc94MIOC4gZOOBd/yjcdZqER+nydQAdNDURoBWyniYZuesl3DIfX+eqwrw7RROrl6pAPPbyspkg1D2EsEqJFK0WzRZCZc9tIinB3Zs0Z13x3DL7RIORrAvoCJRtSU5OZWVK6bGEbmQHTt3kFtKrKtUHnbF1qWaKdCohJTyF0xOcoT/xa0V0/KW74TJQ1gMyFSAO7nourBnG1t12fBXE1MyZ28TTdlOYentoKq1bMaPy+sYn0DS7VDFyLWqP0YPOF6xubRrEeQ9VfULiRxVPdYkCt7ht917jlkrM8TWV2SV4sCo4WJnowcSjRyZEaSUjQlxgcuQiWEydjn7wl8V9o6BaY8117GJD40VTiYt9t7QzaUp3E5B2tm5raHdqkWtCxMDL04Ji2voqBvaH640loAsFroTpe/CYZdwNvnLX5conVDwfFgUMiiKO+ujTLvppUWd8FF+fhfpuS+4qG0kAdlu1k1jRSdD/jGDr7Ghn+OmlL99zbUTdWpb7zz2gZ9XN02UJBlFgQZ9q9o9qEsFqb0neZMBjgOBO4SUZbxho+y6MfvmENAOyifNLnmPP2AXUT2yizyfw7UEcKwP+f5IEjbkWoC19BkJTBWw4s93hRVAmiQ4FcFFSk+CasFSn+Dpx3sLYQJy7UlZ6jSgOG8vRTLgfgBO9M6RpnmqvAEQJyk1w280AakrU+J/DVcJnEccpdvXg/XQbQuIkjuVVY6Z6Gy6gDIK30wNlQEt3OiH270AZUP0IzVZkvdenummYMF9g01L79dTBNWsi7Vxi5ecVRS7n6aajJCPqIblN4jEiuOeUvy4qN+9aTeMXzB+s+0Uk3Q/X5cnTtSgf7zUzKiqWvt9Tr162vuVBs7lCgXrXqk/vgaGu8ommUdlhjkOWQDELfFJFD5oy7kqwK3Ip+XJXsOLJh0Bc0YF1mVHR2T/Pte36XZ+mmV5e9ZiMZKarYb/zbtiAQnd6/5k6g/aq2F7XNfPvsQd7AQ7F/V5aznxuibBHe7Tf+8MQxclQGpxmU+aDuvWig7aCvHAwzB92Nd8snyPm0xKx2rvE8tjoFIX7UzaRQ5qDoofx+Hrx4RSwwd18+D05ehRH35TNU+0rePUntG33sH1+rk8696Akb7tsNxXdL8KJLgu0a+uXzM3TU75Gw1X7vCGhSa7occUJckidyMaidscvxer2OVpdd74g/OHqK096T3sD7VI9CRXz46An1etX+IKp9zjEatXdS+o1q62ruGwE6lro14GQvSKjn2E5XBS53ZnP0EvT1swNslOIrZLEUWXYn/0kmC4h15DTVA2KIU49qmrlWVxp8e3Z3dno3nrwTDv8pCbzc1JjfDaTvaUy9PSA6UJd++u4R/St3qbtTr34OdrmRY+doVQaIUjHdB3kmo8relxEkTe2Dusc0bDWtTfFkmA+eN3dYqWqi/3BUnxi/vuqqMryhY2rZecDfX6vB7zthd3oa+tjY18gdJZao2nzr2cyggzkuIRi+oGo0zG9Fw72uQdJwDu9orsSCOWr4M+iaK+1sPQqVVB/8j8YI7XHy79Z/Tfrvgfq/l/bzmr/lWM5yHlP0GQq7r8uCcZLz8r5a6s2Ubg8PscfSPxZoY9dYb4bdfkNz9N/LYq/xb3XcfBN+xP++Q6b99GGZfPRGH/blR5QKdJXSn62W3X3E9r0meCLH+Bvl7fziyB1KK3n41HbGlLu56cbwN8R0Zf7I/xyG/zGF/yxg1nWlyj0FLW9pvdvtn0OyUsv+L7RPr8v/n6XRad4uDPvckia//xdQSwMEFAAAAAgAgrBxUcIaOWEVMAAAsWQAABIAAABjaGFyZGV0L2ppc2ZyZXEucHmVnF+PHceR5d/7UyQgLGDBLU1FRP5dYxegZMpDryxpSQoD74vQIltWY1rdnO6mvZxPP/E7WVwvYA2wq4dU38ubWVWZJyNOnIisTz759f/KF8//8OKb8vWLL59/8+p5+eLrb7/8H+U/+e0nF5+U1z9fl28fbv5yc3d1W768f3tdbh7Ln+7//eb29io///LL+7ubN1dP9w/lze3N9d1TeZO/+fziY9cXdzdPN9nz99d/vb69f3f9UO5/Kk+/Mmb+/pvrp8c3V++u/69hb+7vHvPjw7v7B33Igct39w/7+zcP11dP12/Ljx804j9e6uqBsd59yEv9/FR+8+WnxdaaOcSv/vzz8uz2trzkt4/l5fXj9cNfr9/uJ/ny/u7p4ebH9/mYv3n89L/mN6X86erhX8t3N7d/ebj5pXxW8g6fytN9+e7D08/3d+fz51Td3vz4cPXwgVn76eH6ujze//T0t7yx35UP9+/Lm6u78nD99uZxD58T8VSu7t7+0/1D9v/l/u3NTx/46v3d23wc7vrp+uGXx49z+Idvvi9fXz/mnZY/XN9dP+TTfPf+x9ubN9n565s313eP1+Xqsbzju8ef/z5TX3Ejr84bKV/d5/Ca3d+V65v8d6791+uHx/ym+Of28WrniJcl1/o3V0/cf67mOzp+mjf9odzmajx87Pn5r07B35/0bbm507A/59znHzlgPujfElblx+vy/vH6p/e3lzlC/rb8y4vX//zt96/Ls2/+XP7l2cuXz755/eff5W9zpvNfc/32SDe/vEsIvi35VA9Xd08f8sZzgD89f/nlP2ePZ1+8+PrF6z9z91+9eP3N81evylffvizPynfPXr5+8eX3Xz97Wb77/uV33756/nkpr66vP04xk/lrk/x/pvinHPKX+5zJt9dPVze3j/vR/5zL+5g3ePu2/Hz11+tc5jfXN4mocpVb5N2H/681vL2/+4ueN7v8fUJ/V25+Knf3T5flbw83iZ1E3z+sbo7y9/W9TNC/+fyyNMsfXd39620uwavs/tXNTzn0V7f39w+X5Yv7xyd++qdn2fdws+Mzi8NK+f5VfvOf/Veef/P7/0ej8slFDvzqisXKp/rp4f6XcvUjC+nHnxLf//up/AKQcm8+Jkbe3L5P+3Cbz5cW4H1Ocm6PnMBf3r0HbE/Xb36+u7+9/8sHzfkfr95d3V2zJA/X//b++u5N4v3qx9vE7NW7jY2cox/v82FfffbHF6801vPvv/zsj99tc/VBJuMxt/LG5/1D7rvPuV/zWcpnn/33cnw+xrFqfuWtf/xqtmFHftXMP361vEej4+H141cjJ5KOR50fv1o1TLf+4u01xujj/mDvvWTRyn/7OFj5p/Ib++z88Gl+b/55w5q9zMfISfzHvnf5I24pO/rq7bfdfzvjt7N/ll9+qoFt7au//vAuze2vXf8yn/O/ANYXv395cZGT9sPrP3/34stnX//w+xevXr988cX3r198+80PL5/l/3LI+Pxgur78+eqBuU4s/tu3DzJerEO53CM8++Lr5z+8evG/nmePGn3ugXObvvzh9bc/fPXy+f/84duXv3/+Mv/5Nxel1OMyDa7R9Mti07NpNDP/wVe7dPORf812WWLaZfBdjaNextHnZe1Hvwzr7TKaZQ+st/WL/GCXOZhf+sie+atxabbi0t37ZTvGwXczLzPs0tfql+Y1L5OX5bvFT/KeZst/6N32uOEX5t35t7zBbit/mvcWucxc3fPe4sirrnVp4+D2I3/nPnPwVWkmD1Jp8k6Oeo5b50V+8Es78krZZKf8jmbRVJp8+hpBkwMdOWmm7tx5GXPwDPmE3jQ3bY/b64XboTnKO+p5Yes5bt5+0FSaRqMZGTTzMldMf63slhPajlyHWDzmygfRuPO4yK+1FJ2n5yHXkVObM22VCTWNkWvpLbv79PyHOPKZjTsfkbdT85G8rxwlxnm/q1+YvvF8lnyMTjO4j3zSmqDIn+Z6gBHP7catTlCw+B3PNXmuyXNNnmt2jWvm3K/uSL9idRePltfKhgVd9Fz0XPRczMiix6JHLmiC66AxGt/j+rzID8E3labRdJpBM2noyTSa0TMxUjWuGd2MbkY3o5uNPW6tOa7R3ejudHe6J5yzoafT0+kJnEFhNvRwegQ9gh5BD3DDuD3XzYKeQc+gZ9Az6Bn0rPSs9Kz0rFyr0qPSo9Kj0gMYGfBk3NFz3EbPRs9cqFwyuje6N7o3uje6N7o3ujcu2OnW6cbGsk6PXve4K9eNnZ0NPTs9Oz07PQc9Bz0HPcG0gWkbQmGuUWO/dXb0zDnMedw482Ne5BSBwbxLm3kzBs5yWA3EtdgNNrgWtgBblA3XSuwZc2PgMdci9xTX17heLxL4jZ0tqGMGElg5vQnYlTdYVi6Z14Mt3Nmu2sI5BbkMbOHgzhff5cLnkm88ZIcctzMu5qUmxPJXK/dAXqEKoQbyDeQbyM9f0/AMifj0ZcbvVtrJHDIfZs9vfo/dWewjbaGFFQsMnkbj9x3jmjMY2K5ctuzOaIEtapabKMBorl3DAm374MMv8vcyIDnaYIyOfRh5W/kdd8nOM0330kA15wszWxLOwWSkOXBMDhbQt133OS8C+5DmMK0CG7KURmOy3LnbS85gDoHtlNPIdcgfy6U0vqv8hT1lXOaLcdOXXGCF82sNbvoLI5z4LbE0bmC0uZlCE1wQmHburTjdcv+kh5Aj2zgLPy6wEgzJ101/cUeF0eR9glstcoEaMv9qjh8EGWwnw7wVsJdPdI4baSebbjWXvbDHE+8NZ5Q9I/BbmjfjmdW9a6o0l5oMrpUzYpj5ErbxG80vChYr/9QMcqvOGKZJ5h+0G5bGNfwxu4FZzVuhG9sE22mycSce4AD5IXs6NtSxoZ42NJugqTSNhpnWJMsFDsbNDZa7hBnhLjFShSto3Jnr5rhpWaLCcuLnC6avjM5dVg3JTLOWnfnKf8kJYnCseT4gd64ZmRtn9WDd8GrBEmN607oxRs5lwkcLhScHbBjGxLocNTOSMx0H2CuDSetcMLafz8eA77D2LAVMItefH9C9ATE2QnbipnNf5BPlXzIDtvHIPGiWuOnWNx7SAec8iC5hicL0VAKRnp7vuP2iqWLX4CpyXOaLfYGDytvRv2LP6jkPyUvyStxRE8A1mp4+2QAUqmBtHAubtqunfdq7YYLa/Bhs+qNp4QfNxkNNXpIf+BrP6HhGx184TpHbygY8mMyF/qI7HtHxiI5HdDyi4xHdt3+r8BLHMzqeUUTP8YwwsGzoCUIdzwg1y4YL4hFZy2w6FlAf6Rbn/SYvyQ90xz1itLOhO+7R0z06hCXRbNwvrCWfK+RNPOERUMn8i8Ex1iKanzCpfpG/H9BGEUhuIR1rBZeVZaxMbUwoHJu0mnYNVh/aUVmtHJIbw/t62zhr8BJv/BQH7DhgiGEDFNnwaDhg18rggFn7JmbrmH7v9MDxOo7X+3m/8BKMazb0xAG7Hg0H7DhgxwFjp7KhJ27UcaOO4QCj2dBj0mPudWvwEmhxg0BmQ0+cl0PXsLoNepkNPTWrOA0odSMYaNDQxhI01/yuzUsavCQwOYHJCSYPEtoIHhosucExG76/iUDiAhuL15j9xpxnQw9AEbb3W4OXBIwtwGWAywCXAS5xAdnQE6YW4DHAY4DHAI8BHgM8BniM0z5kPJLjgssAlwEuA1wGTC2AZMDUAigGUAygGEAxgGLA1AKmFjC1OHHWk5fkB3pWeoKVgKkFGAkwEmAkwEiAkQAjAUYCjGDUsqEHGIm+160nL2mYyGzoCVYCkhZgJMBIgJEAIwFGAowEGIHzN9h8w9lnQ4+x16031g2sEO8VXa5XRXK5y2b+NP9SkxyIdQg2s7MYQXiUDgZTlveU5hQSEduedXjJYqut0NfczBRZ5VYTjbVrBYFiAMUAigEUAygGUMSoZcMjre03MwrJ+wWSASQDSMIasqEnkAw2aQWKFShWoFiBIlwwm0bTaQbNtjsjeUl+oCeQrEASxpoNPYFkxWbgHrOhJ1CsPE3lQSpQrECxAsXqm++M5CX5gZ5AsgLJCiQrkKxAkoi2Edg1ET1mNRt6AMUKFCtQrECxnv5iJC/JD/QEkhVIViBJqJcNPQkeKlCsQLECxQoUYdPZ0AMoVqBY2/bzI3lJfqAnkKxAsgLJCiQrkKyYrQoUK1CsQLECxQoUK1CsQJHgtNWTrw94SQWSFUhCobKhJ5CsQLJitipQrJititmqcO0KRioYqWCkgpE6z3WbrBtYqWAFQp8NPcFIBSMVjFQwUsFIBSNQ+tbASAMjDYw0MNJOvj6Tl+SHxjedZtBMGnqCEVSPhhLRIPJNvkx+pYGRBkYaGGlgpJ28eiYvyQ/0BCsNrDTMVgMj0NFs6AlGGhhpYKSBkQZGoC7Z0AOMtNjrNpOX5Ad6gpUGVhpmq4GRBkYaGGlgpIGRBkYgWNnQA4w0MNLASGt73WbykvxAT7DSwErDbDUw0sBIAyMNjBCtZMO1wEgDIxCnbOgBRlrf6zbhJQ2sNLDSwErDbDUw0sBIAyMNjDQw0sBIAyPIHNnQA4w0MNLO+GLCSxpYaWCFICobeoKRBkZg89nQE4w0MNLASAMjDYyIOsjZ9+NcN3hJBysdrHSw0rEnHYygizXocEPnakhATYIOakpTfE541hSPiWVBXRh3oZfASxr0o8k6yjB2MNLBSAcjHYwQ+WXDtcBIByMdjHQw0sFIj71uC17SwUoHKx2sdOxJByMdjHQw0sFIByNY/WzoAUY6GOlgpIMRtCyNCy/pYKWDlQ5WOvakg5EORqC52dATjHQw0sFIByMIfNnQA4z0U39Y8JIOVjpY6WClY086GOlgpIORDkY6GOlgpIORDkY6GOlgpIORfsYXC17SwUoHKwQlDXEuG3qCEWlwqFuN0LwRPTci3yZS2cFIByMdjPQzHlrwkg5WOljpYAUZMhujcZqgqTSNptMMmklDDzAywMjYcWFGDLlu6G3Z0BOsDOzJACMDjAwwMsDIACMDjAwwMsDIACMDjAwwMraOiHie44KVAVYGWBnYkwFGBhgZYGSAkQFGBhhBPczNSA8wMsDIACOj1j0uvGSAlQFWBlgZ2BP0ktzB9AQjA4wMMDLAyAAjA4wMMDLAyAAjox97XHjJACsDrAywMrAnhJoNmSMbeoKRAUYGGBlgZICRAUYGGBlgZIy+x01ekh/oCVYGWBnYkwFGBhgZYGSAEdTshpDSYEMNItQgQmmF6AFGxjrXDV6CAJUNPcHKwJ4MMDLAyAAjE4xMMDLByAQjaETZNJpOM2j2uhm8ZIKVCVYmWJnYkwlGJhiZYGSCkQlGJhiZYAQhLht6gJEJRubmJRng57ohFWdDT7AysSeoGWlR6QlGJhiZYGSCkQlGJhiZYGSCkQlG5uYlZvCSCVYmWJlgZWJPJhghxs6GnmBkgpEJRiYYmWBkgpEJRiYYmZuXmMFLJlhBQsyGntiTCUYmGJlgZIIR9LtsuBYYmWBkgpEJRiYYmZuXmMFLJlhBpWgoitnQE4zAf7OhJxiZYGSCkQlGJhiZYGSCkQlG5jzXDV4ywcoEKxOsTOzJBCMTjEwwMsHIBCMTjJDOSCd10BiN0wTNXjeHlyywssDKAisLe7LAyAIjC4wsMLLAyAIjC4wsMLLAyAIj6J7pBve6ObxkgZUFVhZYWdgTVNRs6AlGyEs0lMIG028w/AbDb2L4C4ygrLa1eYk5vGSBlQVWFlhZ2JMFRggZsqEnGFlgZIGRBUYWGFlgZIGRBUbW5iXm8JIFVhZYWWBlYU8WGFlgZIERBN9s6AlGFhhZYGSBkQVGFhhZm5eYw0sWWFlgZYGVhT1BUs6GnmBkgZEFRhYYWWBkgZEFRhYYWWBkzXPd4CULrCywssDKwp4sMLLAyAIjC4wsMLLAyAIj5J0aKaeG6tsQwJKWnOuWvCQ/GN84TdBUmkbTaQbNpKFnYqQTtWVDD6OH0cPosXmJZTie4xo9jZ5GT6en09Pp6fR0ejo9nWs5PZweTo+gR9Bj8xLLcDzHDXoGPYOeQc+gZ9Az6FnpWelZuValR6VHpUelR6XH5iWW4XiOW+nZ6Nno2ejZ6Nno2ejZ6Nno2bhWo0enR6dHp0enx+Ylac6OHLfTs9Oz07PTs9Nz0HPQc9Bz0HNwrUGPQY9Bj0GPQY/NSyzD8Rx30nPSc9Jz0nPSc9Jz0nPSc9Jzca1Fj0WPRY9Fj0WPda7bYt0WPRc9wQoyZEfn6mhaHTmrI2d1smgdjbOTRetk0TqadEek7GTRup28JOPki04irZNIc5bCmbcKTy07H4pES4hnptwD6jfmJRAcOqm3TuqtID2Ynf4t4+SLiuzjkEWHgwRWpJM9CRxfgbYG6mEhNjBwFrCyIEh2tmQgPDl6VLWdd7KMky8KbsQxPk7MWpANnLjBCeALMRLx7iWbMy+duHHCz6K8qTIkiraha0aoonGTlxR4qhNMGqTH0MqMSC60K0mpGQFCwdOZFCciM2OWCiFsIZI0nsFRETRu8hLD5DgqasHxGNJrQWAz9lHBKhW4tsOoUJryLnPcQHFzZcgLqXm0N2ebaNzkJQaPMlxmkN80LHdAaYNItcDDDTJVcMAFFx9w3YLyWPgHhyM4Upid+W5r5HFwXkYyskC+jJimk8AqxMzWdB8kCDE0Thhc4GJOLOxYUUdYcxxDRfTTuMlLAgPi7AFDYTYchKNUdvJfwVar6IOORGxooYY9DaX0iEsLaclCJFcwuRo3VKcAFHIMJwI3tJzAThUCxsJ9GA7NsJiG9TBcmxEqdNtIJncnqXzr4Hk5z3nAOTfl/BgXRdGR/R2IGblXI3p2jGDA4woxh2MGXY5dXq0rl7r138TbvAgEoM6Qjg5u7HGDjjq4NOJ5w0cXHI9BCB31vUBlneDFoC6FEMDWibPkXOT19ATcdOXfmvZxI1sJ2CY52kZukCoCdArDPRcWtCylPcivono4xJFxO3kcQm5XdhXNznBGhqM0QtNORt3RjexQ9ohLQ8srEa0rCRd6mg5uTruTmLpwMsSONTXkwkIU4iSMDXXLyEabZtWVcDuUg9HuVZ6OvcpOIuj0uvNkeUfkcch9kiezqloHVMxD2aa8D2/KGe3LdGoimGTsA8Fsgf2XJkXTlU7e9iGfCt0T+Bv4JfWFaOJKCRMwGm7UkDetKQHL4hHkGEGcSXclf1KQH93OfZFxctoHzBxKaDTtMm0rGRXHvLh2lIFCUNvILgst21xhPfgxOnhh12jc5CWFW3BqAgocCy0JEGFyWEbmMg5l1BmIVERoMxOfO3bPMdHmsmyx91unvgSFtehWid0L1MyRA5xZLUp1IJA4GcwQV6DgopCXcSUWoGZG3ORxxgEZJ2PXWTLSNaijBl838i1WdwEMwIK1kC3tAMCIN5lDCgK0mQW7icK91y03yYUrk6tsP5UIpW9wYh+4c5II7vJ+6YoLeYYgn0WOLSfNmKVDzhCBvG78Zpx84eiZMGG2NzlgthVJrYJ2apAINwnvbJghsC8SUiG3BMRy/ziCQCHZoXGTlzhANNisEQYXLuMUIRjuzllnJ2QKRCyHNQRczJGqa98yPoYW2z3rOQ/JSxz5qyIemXwJSS1jsQ1xwxG5g8d14pCQUWPdHFZWoRNGuG54mIr6pHGTl1iXrcNsIVUY6nMhHilEaE4e0kj7OgFCQYE0Mr5GzGyq7CKENbh+iZOnTupLIFWuirSQpztwWfn0FVrjyE5BdsPI1BjyvFGZUzffwYAhkhrpONPOY1zqS6i88aabUU0Y9oFY2DEDUeUv9uYAWOR+CcMDxlGGyjFUEbKzwHvdJvUlTQUEC3Of+82RoG2zLcw3jrqQuDFSq07i09HBK0mXQkrE8BxBPiCOXaeQ3p11Y1ZxLYVcYlE9DK7CmzYTVgzBoyA9FCTtMmWQyPwgODt1KEbWryBKaVx4CaG0ISwZdUHWxYp2vcZkfrH1TRsXelflzlVwIWuXPEP+aqNwbH+RcXLadSYbEaKG7IlK9kgE4565diKUtaeGwrVuKJWG5GpyJGisBtv1tuv7cj0qdYPYByJQNCUnH2tIJb65yqGNy4IeUIFc9gh5cIpt5JQJnhz5uqCkadzkJUaA6WT/om+uqVld7AZtifwHuI31zdTYP0NkI681tTlVJBXaU+e41JeohgE9ykBSQZIzjGUhp2Da1liKIhKhWk0ExhBhQXo2AjVjMbqd+E1GcWHY9dBcrs3SuSOKYtC8C1khI3Vi6M9mggy7nEwVgQ+2ENsJU0T61rjJSwx/HOjgRmFYJRXr5EMLbrSQ7QqAUlGdw/aQ/Kt4alc3ShEpaDnrmHJiKvuYbDv7mKxQYAsK6aJOkZ2hcBQ0ekeZsikDyoNApO1Q/Y7KPw9VTGh+cyXTvzFHTgBS0EQd9c52oKLvqtYNBoZnRIgzUi2V7LIT75aQnWZF5q5TSH5CHECVp+IhqtQqttkP+SaRLzUHlo3HFQCr+OyAfCo2GMIetGMde1zqXknqBIwiFFWEitAgERT2UJLEHeEURVZBMukPJ74pSEYF7+ddYd/Od1MpfeHas/INqnZS0ZwcsFgnWrORmg/8pqmyC7AbKdDwzWm46SqjGntc6l6JRQOj7QgDxjWNnJETeTpKj1XV7lacBgV9pOudvF5XRRUEtiDJefRzfpOX+Pl7DI0gxjMTQhoxc0HnN2Sn4AoOIQu00CIqSzmlI1EU/JX7cc5v8pKYClSIKBHDTcEOBMOp1zDRUcVUSI1OwsTgeMYOLTLuyH+OAOdgj3Gpew0kGEOMNpXDkoM21AQTV6D0wdGLq4krYAnrtigAQNYZSQPfZG3rtIQRyXfAGbF+kDg3toQrykS+KETARv7CqVxzyk0MbaRoXGJVw5QWagzK3P7CqXsNdm9RRCcfyTWdOkMLlVpq94LVJvNdMWUsHgnKstTgt4eqp+Y5bsdODpV6so+nPM3BNLI1Db6+gwwsLOjqOzKCQrFnCyUHVKQYfc23v3DqXgtarylMQi+xsaObCknCvNBQBmDCFFk3p8KjILlSkAAHwzfiTVQVxrjJSzxUXsXjKr6g+sNdEY+mkeAsthKwQC3eBzjh3Y2qQicVXEQUxtaVXXWvpJwcZ+RU7XiTaAIvmArdDjG7jhEkGCA8oQqndl0fUkDZgqlYTVSacZOXUGwDnJhQTZ7INeXkFFIU208DJz4UDFA2lmgJ0wbDYlL8ReqROd/4pe41Nv9UHIkV6QpZqHviryL/VrfVxYfI+GjiQQFKtEFTinwplUcaN3lJRUQyPKlRKeUguaAmOG7fMe7etxiDjcE+Kd4kj1SazgzA8EnjOs5F4yYvcVksUgdGiYLLb8FjUMEwszJbOs/A3EhLmlpkKv0QzDDRTnrNffNJFgB+xpJV+QvuHIOnysC1qYNAjBSG4DA3yzKYOKJJEwMlFMPqj9PuUPfqOFFTuTGCIMUW7Fl2FFuClLQRXTkEq7JhnPruzlqGytymdCtMA9lEjQsvEQmEtgXJH2MavSsMVrHuwqQzGRCnaAr0VUingjfJIYe4qzjQxhl1rwU4+ZL8JUkupJrpZIPOXygMlsWCiBBGULFQkOUrFr4oGBE82+k3d90rT08yMlBwXAbBRTqwbIeiXDYp+noZClkgEZh+PxSAIe9Sn2q+z4vgN6jTxRIRXcGhnVxmUBlTqFgoXQQdFglZ7FL55FKoejMm1KE6ZW6uv/cxda/OvnAZ0tiVuEhMbFdMqg3te25GKthQeE9tJ3wntnJDdCUfApwZl7pXl1NEBDCyTSHPiAZnChmoCzIyOkZlSukSK5Z8CMuNPEbBkB3C4+ZRlO9eOBV8hn8z6FJFtq1sMK8qqmVIfG/gWjvCi2tbS5MlEV0BoFNFVqD+Gjd5SSj8I5QOlxNnf5IWNBI3SMQ8jdQf/USyjAqkifOWqvflwSVenfebvMSoRSqwsjj0pEukstI02B4V/RTM62QBWb8gq4lxYfahKYr9quSxvd+oe3XKkAo/Naivk0L3oX2vOGto9hEBZD3wdPBqRwdyJt4Ra42Mb9EtMq70EkUVS85ILgsqiT+mSMp0TEmFwQTaRUEv8qYd2j+MJiRTx1RItWvchX+Daojfm+qKZQTJkEAv3RXb0oSkGsktIjgSgyT6Uf4/twq277dtvQSKeIjKVcYgnNLWRMRCeLctlkr1gI5ujVPQdcEDMoVnPnYc4NS9mqt+nQmlzsZNLFknlAjA0GldpeAYH0pHWDK0/Cq9ZDGaLiNKtPkOda9OrXqhTtdUZkBWnkoOno8pm1LNRMMUEEvqY4IMddYV42vS2LXrHLcTB2hLVMgtBq/qYJhJKhZzx2lA+ShaM1Vr133uTOOKwMLB5M0+3m/yEoNRBNNTqTY1FC8j/VKmbIaCVKw+JMmaum/diC3JEyI0FCoWSt15U6fu1ab8m0yf6rx14MyxehTCY+ZDJ7s4ZmFLh9WCkyAyebBjBdNLSs/O8zp1ryUUrMP7qEQguY7z5Ke4BcIem6oGXYqPG8QNoMhsAzG5Z8pl3U48UPdqVAsa6rNVxae6S8iMIgISjwXHU5bEGFfgKuss+RrnrXNqMqBbR8QVXlAUgyICI+e2JK9WHYXZITdxLNQBu+PKB2CVnJ1noU0vknZor+z5pe7VmKgaO+hD/yXWlwBEiVigl5g2ru4X0mXaoeyyQhRk2KyClwqF1YybvKRQqOJzJ110EkLEhWiFR6v7wAW2YAliqMOHxDnAvmTNtSUE4o0z6l59CWIhlUIH+uDQU1kW6CW3RUWp09hQHkl2emnJBmxEZykhaSevpu61uOTYPas8i+iSiTFyR9iHqaMtRNZNOi0GXwcoSIQ45eyFuNv8tJPUvToiQCCeB6n8oqhYp6KWYtbQhBJBNJ3Popg/xDvx80unt7Sq7NqTV1P3Gjp1JqvQdCiHVXDJLToZqQUlx2VbX4eS5NQGu8aGOC6xDNbOqAjRuMlLvClgUiCI0Z6KsSVqIuuZAACjqkrEdORNwVlB0SGFA7RwhVPv8yFegg4jEUKOkiC5UClacLGGhS+Iml730hKcVrER3AF+SDLs2CfsznVLXtI5HlignmXnDyCc6ApBKWJQimhKL1GcE/I+BaexlMgjVGBWjejH684XOnWvJoUBixxDaUzpcjLfB3KERBNFJhhQpTiqeB9H30h+2ZRBaog8p65B3atL7qAirirARCQ0lZ1Th2HUrTgaih3ajZJ5JbFtBwxQRG8RpeLEw9Q5YfmLplQdj4aiZ9pgG2w8jVQoboY4C90NRwl72t4HiAuU+1yHU/daqk4uMzOhncopPaWcphScru2Hk2EJ2DqmyMhleumhg9HaWGQuNW7n/NuOReElsH+ph4cWStF2l4mUbIqNw1ufW0LeUoqBFG6i5zN+o+41ukKcTb4IAdBSpg5jq96+SvCFKWGQ9kIpyhTX5lYprjO0NztO3Yi611DdP4bUXFHmktwiDoTd0Rk65pwUWZVbQAE17YapkgOE9K35nHEsda8kI7FTWhl+umUnjmuBOFE+YeRQzKFDYkQ6QylFOW/oOESs+D6P7tS9mrJIymVyfscwrq6QBaqMZoXjQY5lSFlYstFlKhQjiFP2ZpONtu0vda8mlgGtMFdO6tAtwCSYWulGeFXjuJQTEfCYSFE8F3ELl3aVKp91jk7dqw2pVqZEMKkOUTkFghBIpTYpgTZkEaduu6oc13U7ylc2RY3iznvdqHstysrIRGnt8VGmfPfeJlp2nBylvEURMCbEzkQ/PBn1EgWrtJ0fcupeC3VlJn/MX06FWZeYuPNZMvOIUhweNJiwdwXEO3+N/cUj6Txk3XFsUPfqXcfZTaGQeAw/QAqaSoRQfoSC71SzcWKOjaAAkzCGTIrUn7GPJR57XPQS8qamA8qhs6jgh+owJ1qxvseFQA4I1o628dZAjNOzoZQByQaXVWJc9BJiRtMS76O8moemcgRMtbIhSgayESD+AQ0LSJpNySGa6aZY6rxf8jgU6pW2cxB6IKZWZSyHElJSIvASqD9dCfmpfBrkU3EWD6xnHXaOCy8hhRLoNsi2OEpWRul9Tvd0VddounWMMVTBoqwmmJbwDtnQ0aE2z3HRS5aysMyl7xIb4AwxpI6/aA+ii1Xb6UZqIpSQx7IuJb+0ozFNim0/IaBTHIB/UwYeaqSMuvRJOEihqsVVT0VBC5V7aHV6d4PqQNjC7Dxl6ikQ0bicE3YxTAI2zJbtQ6eYhlCiANsVeho5aplSbhW9pOgYufJOOLLQIWTGJY+D0TbKYQ2HRoyE30JraHIVHSSxhbvMGykOMS+VKbGqFE4Z+kPVlmRc9JKx30iBi2/K9iO3aHkw5LL1MjlyUDujbhIHabrYBfxFGvauRyQrc1EldMopKv+mDKocVVXWGH3QpciEKCoZHYlthypdeIahDDXh5zrvF72EhG0hLegcv6yqWYLDh8wbxRiGPQm97gKPH3AF0+AhUUzR81TZwp5f6l5NHJo3G3QaR0NwkyIOas6sEOlOV2ClTaRxMX74Qepuw5V5qee4yuN0aYFoE1IgQ0q3qnbQPafoPu6OZyBb6srZSF+aEs33POBrdlzIKbnEg+yk4vTNw2VwxYSVq5bcomSODorj+PQaj64dgu/XCk5pent+qXv1rm2F9CBRXjWbQytDLK5OEgJdeJSujHJ9yH1ANuouIHNIxHm/8BLOCBZxIUr7nJyu8czGQQMzcQUdqa5i+jDsofcuaAWhqF0FKlrp2OMmL+nK3+IFg1q6wsq44CyjjdoanElz3KhrW8PFzCXBVM05TpaZ9s2reRsKcbe0CWlKi05acdlaMVGM8FY2VdxGQeGukZHzZuL3dwQ+Ow4guM+4eyrHL1Kp3QPUXe6cA8RSnCTeNyUeVYQGe5ILAmdMhikUU8UN41JfwskND6X3G9GVMrnwVN7R4RD/Kt9LXUcNicCYBpR+XwKg6p2033c9bVD3GmQrXbqjeCIhWWCOO+OGkNTEEIgtlb9ARzSF/CQbylJ9CSbEdhwQ1L0WHLurZ9NRdCWiAaJMA1fwrgLIqskgJMTCk64qdeeASCHx9pq234vCS2W4XynN8n3SaMTUMNXMAzp/tS0PoeJ2VXvJC9ND7lb1ZE3W4JwH9BIS4kXpM8K/UtXJlH4RBVdPEgAusipnyPrC+2QL185Z6SUmm5dQ91rYb0a9sFEzVHFefmwpXhkVNq4yQAQZoaBXuSjRKqJXUpuGXh2+eVRQ92r0NBhYKOJRFateaqA6OOaBc575pGwr4sciPQxyHW0bH1L+kgTb3ONS96o08RAJrhKA+Av7oMivKcGNrhHS7bEUU8fp9QImImVJBBL9xslLqHuNuRkFAFfkuSRQQ3pYI0InawqnXMIh8gX+9dD6Kh+AaaC028e5j6l7Lcq/ce7WlkiPInawCt5DryCilKFQdWZVR/KVl8Ff6U44lWCmtMNp16l7dSUPKUxwFcsqS8fpu6IqYc0b70IwlRZyUiCUizoUvWIVJDQoz1t3nBWqe90q6sBIqKq6a5Pq7R7S+0T0VKTEtqbRntWrQJYKvULyte53zwN1rzWkWA6VUS+gi9WV7kn+GGXeEZydLERHpa48XIXmd8RXx66HPOLc72MCJhduehvV0IpDXBi3iyQJUxu/gBOTTmo1lkq+ELb07ie0OtdbqPrp36h7te3YB7ElCg5yRFCzb2OTL5iw3nSBv1ChNjJHVxGRsm7SJChNjWPHhUHdq5ErKCpVpm66qKS4i3RMtAMl5qqchryEaiKU8c1ZmpKnuvYqAcrJU6l7NbSyMmTXMWAqUWCTxtBuwMJWlf9MgZiAnMp71aRJxXWV6Ap2Jx5U9yrhW9ReMqR0G6rZQq/skOrLySdvejFP13zxSLv8ScG/lFWSsud+o+7VOBbiUwGmsjfKEnYZXGz9LrBX5SUcXuUFek9OU3JPJVdsAFdK/ByXPM7SRh+aI6AjASiU/GfdgA7iUWAVQsEpmlYsydwcx9CL3DgRaO3cx9S92lIFn8yLCK8CG7k7DC7euiKnBfSyoMkaftD3Okj9ke1W9fdxzm/ykpib+mq12LNybfIvk3cTuUQLLOFQRT1qMmAfeuNUlZ3WK6mkCW+cqe7VJeGJ4/FGFfDuKh+mdKaqJkLlflI9dDqDsLaGJDZtdekEKhA8/TF1r6VpH0OcRNApFvC2K6Ll2CV4yDSxV0Kjofe5JExMv3Kjmr4zvlDd65KMg9lCPXQFURQTkS0ACsq7S6CmJJNDGMI0OegKzk1lu0rorp1/C9W9Vr0DsMkWgAwJ6lNRBbsBDqRiTtspfB1IIEhWwlrlArqM0pdz+zfqXg0lNpbqUQQiVXYBdXh1IGVWbrUM1b64avCJfbrARoAgDYch2643Cupey1RxGSUNep8XQbKj0Tv6jqPDlKXISGWw4oJNZoiPkrSlTHFuxnY9TFD3aqSrYxsmBfDIlSpUgaBX1YFUmVLNoESenSrUG360TeQ8yYPuvF5Q91qm1lRSJpUbemMZudTYiinAnqIforkq4+PoEBKmgcdo2isU2sauNwrVvUobUQWJWJzOyOglOJTQF73uSHEkp8jiUIGe5mvvBhxJ0+zLX+37naovUXh9SCmU9KADMHgOZgQP5oq2xWcJ3ZwqnJi7iIftJ3MMozvPqcXUeRxZMfzA2O9Z0u3Dd1QR0mUsyRYQmvN+Gj+LtFDGXERepReg5dxv1L0WlX2fJUHIppuva+OKY+poAELG1FuV0JK0rUM3jbmiLOSQvlPPeRiqn5T6AgCm/ItuH+qgmeZpkDdNZfLHxg1UYCrRpDBGZQtah72Pp/SSqVJaET1udSmtLbARe2EfYKwu1Y4A3nftwJJV0JYkUBMT33UVQd2rH6qi5d+Ud9qpUOV0pwpiMT5NiyIfrTMGYsIAQPmWpbhFb4Dc+3iJl4jaq4ZNNfB62wuxD8GAH1q3Lrap0EbqJcQN94G4EarA1fuu2s47cUQCHYZIXKE/ib+qkkGV07hyfURtOgShPHroVXFKkyDGUIugFzWpMENiG+OKl2z3hCTHr1Q2O7YIrOIy1B+Z764lg1gA2Kb0BLuXSh4bUhtOe0bdK9Esj6b6HZFglVmoMFfRto5ISPdUFSIGacugBMlUmbL9oisVvM77hZeg9xnKfMgPKXqUtqeQRUcRxQJCfsik36miVQyURAwVWOyuLkHpE0oPOUeFEVS9kWowu4J6pahQJZW+o7KgIEoZ5MR01k1keSkR48qlSqmMPS68hDFcGU/VRkAEYquozE1XlZwyHzgelUNgKYIItXbNOUyCeLO0dY6bvMR1iDxkzVXpIZ+uUnv5PKFATB/lhANO7hKXBTtV5CkyY4Czzqaq7hWsht4tuFXfQ56DV4QRkpGPtV1qJDavhJS2SVUaQce1VI8OPDbfqdS9muaeEtKg9q/qyJcKL0jcu460KYOq8lpXZlbjIpKakr3Ex1QjRWydoFL3apTkGDFVV3WYsteIxkVnb1zal7T8Q8iHtUxRX8kcqsUSxESz1x53oStLTXBlZVSfqipaHVkUj8LWL1Wd6UF0g6yqgK24SdXi7J8zT0ZpX9pfFSZIOtMBEYmwu6oZ96hEnnyIjvR1pVHx6UMisGoBoC6oyG3XxTOXnG/RSSmcsngqvhfVzCV3qzZ5bWom5q5XDQpnyqOziVAPERXiPE9WTXmcnfzBArgcu15fKXAiElZdELeg2nPU7CrdnuRtU1WAxjW44I676657ZZ211ebesxj+rvQoRkIeVJq7jnwpNuiqniK+6KryBKh68eh+/1k11ZeobEp+nmgwtv3T6QRsAaenVJdellZLRg3+rShXpQzcmEmprOf9opfoDb+74GDIsUoihZ2qNqSLNkqbQQhU9SjqLDTUmgpltmKA6rLrHyp1r6G0Fe/rMXlhpSV1cg4ttCoUQYd23arwoBptHa8Qr9cuE0X2fo6bvMQlWriqlxQLS6+GtJONjiZTNmS7pPASCpmq5DDuSwdR9cZp1nzn3yp1r65gnQRoVX2f+A4Vh6EQS+cfVOl8bK1X5+r0xmvRH6058yWWtc5x4SWc83FCTd8HI4ZKGgQA8MMaDcleeL+dOsFRkowM0zkjJSN1jmrXxVe97xVLXwjgq8r7VTtLRZNxpsfxPj4UkqosD/GeRH+oAlfsXzvJtpy37Y7e90rJSOholBTpqTBGUvyO00k8Kj0r29VV0cSrwaVgKSiS5hTaq3tc6l5NtYfKUWJybNMJnl6US7XqequnSlNhdqYKRoQ4l9RItGIAKs732XDmJOMWHKDS1b7jJ9VCSQ6A2anA07WMJFiU5XFNGsH/rp+X8K+F3zjT+16pyTLEUlcFLIFriA2Ioio9y/khg8V2k1zYdUHIxs5NKohTQH7OA/Ul+NRAy+H1jrgFuRtFN1QeyW/qQDeXpoDMxK04khoq++kqn5OaHue4fZbyye3V45NecfnpxcXFfwBQSwMEFAAAAAgAgrBxUQZ5JWpOEwAAu0wAABEAAABjaGFyZGV0L2pwY250eC5wedVcbVPcSJL+zq+oHX84uBOsSi9787KzsQwGmxkbCMAx53A4OkS3mta4kVhJbYb79VtvT2WWpMb2zUzEjdsN3VK9ZGU++WRWSuLZs+l/4ofjF6dn4tXp0fHZ1bH44dX50U9iS9tnO8/E9aoU5211W9XFWhw1i1JUnXjd/G+1Xhfq+93dpq7mRd+0Yr6uyroXc9XmYAddT+uqr1TP5+XHct3cl61olqKfGFO1Pyv7bl7cl2zYqqk79bW9b1rzRQ0sLprWHp+3ZdGXC3HzaEYcT1W0eqz7RzXVqhe7R3tCfvPN12qIyeYH4nC9Fpe6bScuy65sP5YLu5Kjpu7b6majlrnb7X2rjgjxumg/iItqfdtWd2JfKAl70Tfi4rFfNbVbv1LVurppi/ZRa23ZlqXommX/oAT7Tjw2GzEvatGWi6qzwytF9KKoF39tWtX/rllUy0d9aFMv1HK01H3Z3nXQ4YuzN+JV2SlJxYuyLlu1movNzbqaq86vqnlZd6UoOnGvj3Ur0tSJFuTKCSJOGjW80e53oqzUeT33x7Lt1BGRHEjM5kaMhLL1btFr+ZU173XHPSX0o1gra7ToeTCpAlrpQlS1GXaldK8+qAHVQh8UrMRNKTZdudysIzWCait+Pr1+ef7mWhyevRU/H15eHp5dv/1OtVWaVmeV/exI1d29guBCqFW1Rd0/KsHVAK+PL49eqh6HP5y+Or1+q6U/Ob0+O766Eifnl+JQXBxeXp8evXl1eCku3lxenF8dHwhxVZZQsVbmlJK9ipdqyLtGaXJR9kW17uzS3yrzdkrA9UKsio+lMvO8rBSiRKFc5P7xi2y4bupbs17VhRT6naiWom76SDy0lcKOQt/IumoUsm+kQD8/iEQuVaOi/rBWJrhS3U+qpRr6ZN00bSR+aLpeN319qPrGiZTxvkxjKcSbK3Vk2z9xfPb8M0nl2c4OkKH+r6q2uC3qQiT781XRiq7816as52o1xc1agU2vqN7c3Sj9KGnLYr4S81KBpC3vW+WjtfLVqje+Zfo9Kpfqy9umfdz55T45UiNq3y1/7cX3YndnN470K4ni3+Ulf2O/6f5yL9rZTaJMfdTv1P/OzEufSc23VH22n+zv1JyT7ryMcvMJ79yMlJqjifkkzc/U/5TmSMaOZE5Zupd9Walsz0wL+lv08Fv1+LmvxAqqZc/d264jNxq1usmNxqAvaA26Q7vc6wLfMvdbGv1bO8VOx/qnHTUx7UmjdsTcvO1R/dNr9P/9ywpK2MTn3GltrDnSaeZeOdN07nSRG/zmDIXSYzHzR3I3Qx5xHyGbWYxKjtHf+vqjMRoTRkmbsddQYpCUmDVJr2G7Xul0gZXrn7AD6d0iTRr02Z+J+xyb9nYGzC+9RmGLBOzw+2P0D9ItYZQ8T3oOle43+DSNCLmScartIc0rcywbu17W3629pF8G7JCYMUIeJ9TbI3rxBqPSN6QO3GlgUHImnMMCQPiJJxYiGTte4hYVe9gkflEWHtbQMXNISGMgZTXKOXToeVgv93bSaObO507/EDD15xDDEM9SJ046moEzTuYwaiOTBEZTBmhQcxaYNwveCKnSDSoH5JX7kGpHSdzPxGkXQTWPhoAiyss8aBJypiQir5MOQzZJgYcmXieYFj6aOKZLvZ5gUkwTuhlPfjI3toUGzQFVsCyB6CmkqIytkjRK5iTTktFTh63U4QuhVLr2iRs/80eeMn3OTO8JP2FC2lUnjsHIS+kt/TpJy2mUsnOpcwL4eajXNCK7pX7u2M/EI1Pq5EltmodDMDQndelMKwMHgxi5x7KeMo84KwBxsYcH0T6AQ0vkhI90BkDJuEZJR7HnR2AE2kwiohbphkg8ziAuWEP68STDKA8J4F6uVYIYRTCPURlRqmc1kHl/tz+5f2YObYQwiChZgiejNPBdGD1zApDThRpNmU5xVH3bhtHUDxs7swE98Pk0Slm7JEJkzjwRQUDydNIlURUYI/HtwC1EmB6jXJukUY5JyTweqQa0AQIHisGqIY9SykzbkqHXYytibUKA8Bol3eGNzIm7WcI+x74lUARtZf4b+nOPDlMNxHrJzsmI4hJCKIv10iOCcxmwmXldkRbRC7ocptfc6ylQhBs94gjYIA8+gdiyIY+SX/KdJoYHXqBFMjnyUTuhdEelExA24PoF7YD2aUfBswDkoykPoTzWJ957+dRAFaXNSYStBv3OHMKtXRCTiIakx3cYmSh7QrYQ+6MpJSUkqPQT84hDLJBGFG/IrzOHccrxKWyAp6XHv6V9LDakJ+lBI1070zLkURKWkrJQKBgLZEwUbzEHTWWBtmD0kPjjiFJvcibaMPKUe8CjMRM09G7CHHkvzILzFLszx5OJn3x6g5F4OIT+IaOQeSWcCSvKIyR1HIfSmNTCOmeDUE4ErIYb48ThnCITbe5S/zn1rXlkSrzXx1yjYW5EVM7dS3r/xdoTZkrkR2HGCgvwDV8SfOa0RSMRjwB4aVjS4Tyaex4lPk0YFyBKET8gZtH53EX71P/EUoiY4OFkVZTI4DWSeHSYOIN4Eyec9L9xLNxAJC59RvqCSYhPkWHFTH+00RvSE5YJdKdDjALG0BDQQ7tNRH44ENIU4k++q6J0j5d0ZITAgd4pozXMDNXZ2Qf5KGXhwzid+KMh5giDpLnYY0tG29BJrRKvGt5zKI8kHh0yXOwiUhgOwp2VdHCAyHbbPXQ4zqS0N5BOt9Ov0RkqQPAiwLAAwatrfMvHjUuOhLjCI7j0VMTrWEh5uDPxLTkkyoaRidZDGqUEVkZjosGeiqdpBBAKm1xPBCliU24DCquMBlEpkQOKsPpBBTOe0C7fOhPpQBucuhCISZ+U0uQRMoOwSpP7ca3K0rCkM8xgeH7DS+UQKw4EBbVkzIdJUBRzqMBBwAkFpQ0kxfoB4fMafh5oLx8ImnktcyKi4kHukE78yhFKW5eQMZNgVDivCQIh4edR7A3Ds/rYkX4ckfF4RhUmzlQyzKMsIvyGGT6FyzSi/WYcUTjJPH4dj4abu3EIpXfCtAxdYJtM1J+7BSYRr+GT6xDtYywuKKyJpTsWIozynWB4eYvESpjppdcdtMcxCspCPYDSHBA8z/AxIj5TaPCRjehpnGXDCDytRaYfR6hQgcIRuzAhcinai4G2OACQgYblJBphkD3RRlh6ZFA6gfSOEjgKnBlbDi+WExIzPx2SZMkEwMY85FH0Z+lgaPrce17uo4bthGxqWBYHmghtdJ0p9SCg1ISneTKa4tGctUCalw95lCiC45OyGo5B8CzPlxBIaZF8ERRKpV8WeoeEj70vnCmZykelcw1ejOQlcrruERYNOSq5C9Heif+k+koSzBSzJXNiY1fuwg0YInQyODZMCIFY8lS+Mfm/3QOQessylMKZyPNAHsNMBzRFV/NA9LyuwjMmoiS+q+XZJgzLuRbbFrhhwp0p3FwNC7nEe/jJy5K0/yZQ8GoK93L+toLyGCfZzOT3bvRtlxgpMx0fH36naUiI7SnxUyaPmYYH5ziP8iJjaHoOASrcykCHcAwifLhgzEYOYWD7hsVNytTImQLC564T1kep4oyEjapJ3OtlJD0weGI31G8Yq5JgGVxQzhfM68P8fbyLwnc5OmaHGpe/v+zF505HowyciWr55DYJAwaZmfCJKlN4gYdfgIRLUqIoWR8OOcR6GwVRtWYalayhNarNlKRnNNxckPnOdGmBMnGUKijWJxEZeqy7LOJMw8tJmVeHnSkNTc9NOdxZb/fUT7f6ste4ehAP0zwqrWRMJ9Am5VRkSGRE5L02IYnZUfJ3vkBkVbiiRw5NrkieM3AmwipWRQUHQlIatMZxCIMyOBZBIo71jSgHG3pDezZBfyYopwhAfojcsZ8OSRpan6Klz4cHxmKih3smygvDaxT8Qhj2NIk3NL+Mw28o4Lt+HtPjiJwvrOFjJ4/L6dg0TlTziJ6Qu4fXPXmqQbseyZYy3ERTIJHss/UAbA0JUInvyZeYDQUlmudsSJuMJEJBFkjmkQn6kOwzgmmYipBeyS1BVaEtfKgdX2IMpxime1Q1jZ2pU38uiWhbkkdUn54qjeO2zPGFTCp00A4r5XfphHsmnmxQzOF3Pdpp6Djdy4PbN3AZHGEhvEuENiRTWxGoA/v6wX1PPIzxYlYYa0ApMNz4KgeVHWjnSVyQMk3R/VBgHF52J2Ib7JmwHYE7hDV70izWnviFQHe0pQNUEICJa0mvtIkk6GHDiCxhlDgPa6TbM6VpPg2Zc1t0/5JXgOywAEEXTAgjlDVKZnJ4MRIy7DfDpYGOEqZFhEWKXWkUipZ6m7CgEkamfDQFmhOCwtXSTTCEsDhCff6pXShPZ4YaT0YtWIaPyAScgHAocbMaloH+cYk7jxDrgWrKau14dBmcLAEXI8aMPVtkEfGtHBZyyanCQg0PoQhxnPxxWyamyNnv3HPGdGGHi4Qre7avtZQ9no8rJSB84lJeggSPonrCr4okEV1w5BkA0RASRmib7nHGdUJSDZjC8e1Yo3ZgVN9BR/yuRq5l0hhKtzk7itv++d4f16YQLvnt7WnEa7NxFPt2jvAJcXjnEa8fgTMp6QDb8roIbnmjinHu63oU6+mKfuyWw+9cAezCinPOk5LwCnPmV8trF+RkvPBDGz+icOs8WcQfwUB8Rx5PF3TCqMjrr4nT65/xgQG+XZbMpNIFx/Aacu7WTgkK32KTy1HpHIGUNihxhLsgoTsk7XYGKkDIT9/eHsYZuvJLuSXujeCBlLaATxceeQ5MPJr5cdnc04JOV02mzqXBRLTRhfbgQNvUkA5UEbNR+CsZZ0/cJeg+zvElRro/H5QfB8yQRpwlZET8O7yXeXgtNORRu1DGo+GeidNTeL2JxKAQgKsboCZwIdiYmCMsoA0TZ1xi5DmvBZg2/d7OznxddJ34sbgv6rIr3XNuh3Wxfuyqbre5+aWc93vf7gj17+zN69n5yezo8Pr4xfnlW/G9+Js5/vz87Hr209n5z+rIvjSHjs/O37x4Obs8fjW7fnl5fPXy/NVzdVbGsTn9+vB/ps65k6dnp6/VVM8Prw+DFtmOOb8ol2I2q+qqn812u3K9dOLpf/rrwaxv+mI9a8u16nTW1OXgtDox64q7+3U5fb4uy4UaY9Z9qO5n+nnCWb25m26qlNfbJk2rn66dbLRQhybP6GcP+909WpY98Mk1xUI8E+YAPemIJ0N9t2f+IUYxbzbKrG0X2UcfK/XlVglrDnc0RFWbpyD9s49PaO1d/F78pz0xQAWbv1oKrR9x89ibweebttUPd99slkv9JGannzs1z2ZSs2apH21VCi3mSuKIjfZQCm0Y/YDqh7p5ECv1vtNPDOt+nT6s7aXnqfWTmnaSz7Rs/Emz7kstg34Y3R5Rct635ceq2XRGXCbo6dI+YLtcF7d6kcqkWrrrdlNG+ule5VD6oWj9ILMGRlEvlCXq+XpjnpVeFR0b66Ysa7XKxRZInRTrriT4LNXyDHoio5RZ17eRfu51ZlTEIKUsQ+PQYf2vLftNW+8wGfSincmUDW6VyZTo1litfli/XERmEcxuSuRH0SlK0eYwTzX3K/WFO8AzN2Z3IE4VNIquJCToxTWt6B8ajx2LEA4cDvRGw7JX6n0wjqBMFMLDIMdiB23t0+JeYjaaXouBkpJHSWXhtSrb8kCIn0vztP181TSdeVbazdavGt80MOCDfszYaMdQql0k6akxfmc0SovQT6t3lT5T8EX6Tub5du06d8WHUtxtlEsvKq0Z7cXa9Kq3GuvRrOK+qm/ZKAaZg6Fca/0k/rq5reZGXnWsbT6W4r5sl02rNDkvDwg/CntPeJRv97CqFF1U4u+EwhBtxpkiI9BsraDuhr0te+t5u8Dxu+rbSvyXSN7vBf3Vse997/DMUp38x7Z5yZO2UUIl9qnzlr5TNBE0LZV7jidWou3aDn/RPfaMvnenh7QtxmOQEBQYlCrkZEPv7tT2H/bIKBBPz0SzOeLRZLa15U1bFh+ekJgiybvw8fp3kzp4/87+ej+9wG2mML+JGxVvzcq62dyuZouiL4ZB1tLeNjVNpTNsaIVWxeDLaqEdcDgy/ZWCXzaO2x4UO2oqKtbzjf57F4J6KzbsxUPTfugsdZg/C8E9b7spJ9OmKXIH1miI/bFl4vd74q/DufxgY2BzBfqEMNSR9egwPo1NsC8jZWWXl179eHo1zEm35KpupCezw41is92JMSMj996B70gsYzWgkaXi+Kwu7jT8v7p6eXpyPVMDfWWX+E9Flmrs/tHLwHs8CTbe8Iv0Zf9uhz8zaQ6rTILislJUo//eCXIxPft/uHCuKPS2X/nWy6p1PqVW7Hk4fs8F2I1//VqKv3/PG6tv8a/fnOyZP/ES/3ocT50/ORqQGgsByZDId7kouvfX/43RTw4/a/Ttljy6+CZNvnoC2EwwydMip2GdMVvK0RGn53+NhCtKDeBj2Z5yWRlO0qk0ol6MlC3ff0IVSZy48KFVrhfPR7K6mAofHoHUeN9YjWLxzpRj0knrn8dvjn68+HIH/bOge4S7Y+DucBL1J8efg+pyrcYeDX2ytWf6Z0WnUlPm4Wk1NoZn+vnwPJSfDc+dfwNQSwMEFAAAAAgAm5aKUS7dUbupHQAA1ZwBAB0AAABjaGFyZGV0L2xhbmdidWxnYXJpYW5tb2RlbC5wee1da5scxXn9vr9iDEkEDoLpnsvOKFESSWBMoosjQciFZDPSDtKG1a6yOwIpCnkEiIsxweZmMGDM1TaYcL/f/Dz6BT3+Cfol6art89Y73V1Jv9tVM72j1hebs7U1/VZ1nzl7TlX1td+76ezmxk3HV9ZuGq7d2zhzfnRqfW3h2sbu7+9unFhfXlk7uadxdnT37p5CFhbu3lg/3ThxarCxPBzduHlc/b/N4ejMxvrx4UZj5fSZ9Y1R41j8S6vD/edHwwPxj48NR4fWl4erCwtxr609jR+tb66MVu4dxv8V7mkcXLlnuHo+/v/BnsYda6v4r+aexuHhyYFut7D/joO37jt6277DSwf3Hb516dCRm2852NjbuLDQiP914y4vNBrXNnYNd2kAYHBDGm139jSaW+hd5wbL5getgH4Q/YzBoYGfYrDpJnqa9d4y8DOs9aKBn2Wt2wZ+zsAd1vfPWWvWyfMMbhr4BdZJ38C/YFfCLvBF1knXwC+x1j0Dv8xg1vqXrBM2gq+w1uwCf8VgdoGvGjhkH/kaa82G6nVWJfvIN9iVsE7eZDD7yLdYJ2xMfs1gdt2/YTC7kt8ymM3O2+wmZBf4DoNZ3++xTtjAvm9g1scHDO3R/R19aOC+QT9iw9o08Mesj8DAn7DRNuinrA8Gf8b66Bj4c9baXPQXDO2axl+yPkIDf8VgdtVfM7ht4G/YoBr0WzbpBv2OdcFq+b2BFwkdXzSoGejxA2yyDPog69jcY+OHWN1mWsaXGMw6eZjBZvDGjzDYzNb4UQazq36Mwaby8Y/ZBZobdfw4q4Z95BNs9Bj8JOvEjPX4p6wT89yNGc91TSdXLiWMdv8N+n8UHV/IYeOueSZLkjdmOUXegIuRN1r7IG/0XYy80boYeaN1MfJG6xR5A06RN+AUeQP2Qd7oez7IG/AkeQNNkTfgFHkDniRvoCnyBpwib8CFyBtwirwBp8gbcIq8AU+SN9BJ8gaaIm/Ak+QN8pkkb6CT5A20GHkDTpE34GLkDThF3oBT5A3YB3kDLkXeinUvZEjXTt2BjbrxXBej7jCfutE6Rd1onaJuwCnqRicp6kbrYtQNuBh1o+9i1I3WxagbrVPUDThF3YBT1A04Rd34yBR1o3Ux6gacom7AKeoGnKJufGQp6kbfk9QNNEXd+MRJ6gaaom7AKeoGXEZ3o49C1I3GKeoGnKLuVj51o/UkdaNxIepGF5PUHeZSN9BJ6gaaom4o0hR1o3Ux3Q24lO72Sd1OdLei1wsZdt2G6sZkpqgbcDHVLaNutPZB3TLVDbgUdQMupborT90W1Y3WKerGlaSoG60LUTc4yYPqzrdM8IFlVDcKL6W60UkJ1Y1aCqnufOrOt0wsqhtdFFPdMsvEiepu5VM3riRF3YBT1I0qy1E3WSacRt1Rt0/DxKK6ZYYJOpkidQMuZZjIVDc6KUXdFrfbQt1ODBP0XYy6cd2FqDvf7fZI3SLVjT6KUbfF7bZQd77bjcaT1A20kNvtT3U7oW58ZCnqRielqNuN2005JedL79SNW3CK1I1Opqi60Ukp6kYnPrxuC3UDnmJQaVHdFuoWed24TcoElR6p24XqdkHd+UGlhbolqlvkdctUt0+v2xJUVoe6FTNeyBCjd+r26XUDLkbd1VHdFsPE4nXLDBOZ6pZRtxPDxInqdmCYWLxuUUxpoW7AhdaYyFS3xTBB1yVUtwPDZIdStxPVjdZeVHebqJsx4Dao22dMaVHdMq9bprotMSWu20dMKfO6qxNTonWpmNKiul3ElGhcSHVbqBuNC8WU+MDpLQ+0xJQW1Z0fU+ZTtyWmLG+YgL2KGSaAZ788EHCxmNKn6u4Yr5tRnTvqxtT78Lot1C3zup0YJmg9RcMEcKmV3RbqRuv5WNltMUz8xZT4wJnHlIBLxJQirxuMVEJ1y7zuGahuC3XLDBP0XU51G8OEcdqsYkonqrs6XrdMdctiSpnXLTNMLNRtUd0ziClFqlsUU7pQ3S6oGx/oY4WJxOsGWsgwuYqpW6a63VB3k6ibkZf3dd1OqHsG67plhglgH9TtxDDBE1jM65ZR9wwMk/wVJui6EHWD54ut685X3UCLUTc+0cN+yiobJpYVJmCvUoYJ4Mrup3RC3YqmLmRYyt1uSothAnj2hgng2ceUTgwTmeq2ULcTw8RJTOnR63ZhmAAuQ935qttC3VUxTPJVN6hnnndTylS3T+pumcWBjI62obp3qmHic4WJxeuWxZTVWWFSHcMEcCGvW7TCBD2XoW6LYWKJKT163Q7WdYtWmGC7ys7akmNR3RbqdrLCxI1h0iXqZryzjQOonFA3Opniuu4ZULdFdctWmDhR3T69bieqW0bd+apbFFO6oO7K7Kbcgaq78osDZTGlz8WBimEuZAhmVuu6fRomM6BumWHicyO8E9VtMUx2aEzpzzBxQd1O1nWLNsI7UN0OYsrKU3d11nW3jOpmTLIzzjCRxZQy6pbFlJWnbtm67hnElB5VtwvqRs87i7odqG4RdUtUN9hr9itMZIYJ4GJet4W6AZczTMzJgYwyKrYlx0LdFtUto27As19hUp0tOTLqxmM8+xUm+dQN1MPJgeh61id2y7bk5HvdQKd0ciB8cR9bcgCXOsMErat7cqBZHMi4oY4pq2OYWGJKGXVbDBO0nuJGeJ+q20FMKTNM8td1T9/rxngUO/Q1X3XnU7e3mNKiui2GiYy6LaobracYUwL2Qt1mcSAjgVlRtyWmlBkmM6ButJ79GSZOYkqfhsn0Y8qpe907czelA+rON0zyqdvidYP9K+t1W2JKi+r2Sd2hiSnZ076NFSaY42JetxPDxKfXbaHuGXjdThYHOjFMLKrbYpj4jCldUDcal9lNmW+YTN/rthgmolctiKgb8PaPn7IYJhbVDdjHlhwZdTs5r9uN6jbHT7HHelYxJe7Myp7XXZ2Y0olh4oS6LarbJ3WLvG4RdQOd9QoTJ4YJ4GnFlPmGyVWxwkSmup3ElB0TU7Lndx43wstiyhl43fhIH2eYVH4jvIW6ZTFlvtdtiSn9qW7Zlpz8mNJC3bKY0kLd+TFl/uJAy7pudFFkcWB+TGnxugFP8VULMq9bZphYYkrA5VaYGMOEPagVe0sOYB8b4auzJQfw7HdT4rpnb5i4oG7Rlpy58rpF67rzVbdoS47EMLGobhl1V8frlhkmbqjbxJTsiZzVoa8y1e2EumWqG/DsX3BmoW5cYP1G+K1/s9hNWRnqFqnualD3TjVMZkDdHXOGCXv0KnZed3VUtxOvG30XM0wAl1LdFuquVbePt+TIqFtkmMioG3AJ1Y2rqw99bWzHMPEZU3bMum72jFXs3ZROqHsGXrcTw8RC3YDrVy0knVTHMJn+uyllqtubYeKAuiuvumWGCTrxorrNChP2MHlX3XNG3WhdU3cC71jqnr7qdkHdshUm+YYJ0Nm+JccndePy5oW6zVty+FMzh9RtMUyceN0y6gY8e+oGXFO3/lehmBI3Q22Y7AzVjdZT3AjfNYsD+ePh7FULTlaYWGJKtC61OBCdlFLdljNMfC4OtKzrtiwOtKwwkVG3z8WBgD1QN9CpUTfQmb9qQWSY5KtutJ0WdQOuLHUDnv3iwK7xutlz4P34KYvqlq0wkVG3RXU7oW4nXreFui2q2xJTWqj7albdFurGSBVaYSI6fspC3eijUEwpU93+DBMLdUsME6CF1nXLqBudXJXU3TGHvrIbflaq2wl1ywwTn9TtRHXLDBMLdcu25NTUXWpLjkx1i6gbcCnqzt8In78lx0Ld+ScH7kzqRic+qNvn4kDjl7A7236ESSAU3Zj5ylrdMuYG7MPqdsLcgGvRvfXPvpkSy0AKvVUYcIq5ARdaYAK40FuFLUeYAE4xN+BiR5gAnmRuoIVSyvwjTPL3wQMtdISJ5fQpwCnmBpxibsAp5gacYm7AKeYG7IO50Xc55jabKdk9vI3Tpyyi2yd1z0B019S986hbdHCghbotolt05qtlbWC+6JadPmUR3aLTp/Kp23KESb5fIqFu0FSpgwOxHMXHC+Et1C07fQoX6IO6zV5KdrNuQ3TL7JKauavM3Ji0uWbufLsEXRRzukWi28LcItFtYW6Z6HbA3Pl2iQPRLVsaaGFuwMVEN1qnmBtcXFnmDk1IyW5Ld053Lbp3IHVfFaI7n7plh0+5eNHC9EV3fkjpTXTnHz4FtJjoBjP6eNECWu+0I18DY3Wz+6/2S2rqnnfqBu0W8kssqltE3RarG31MT3VLrG7Rad0S1W0JKWXULVPdsnMDnahun1a3OcCE3WjbOPG1Zu6auavJ3Jb9OP5CSst+HFFIadlKOfWQ0htzy/yS6oSUsv04Ppk7NNTNbqnaL6mpe26o2yK686lb5peIrG6LXwLYwytyRIu6RetLvC3qdrILXhZSyvwS2XsWAHvxSzpE3ezeqf2SmrqvTur2uDTQ4/qS+VHdM/BLZCmlkxNfnbwiJyTmZjeJu/UlMua2bMepDnNbtuP4ZG7LJnifzH1VrC+pF3VXkbkr75c4ebmZG7/E7KRkt0Ptl9Sie26o27IfJz+kdLG+RHb0VH5IKdsEb6FuyxtyJEsDRX5J/msWRNQNriv1SmGfIaXM6vbqlxjVzebdu19i2QQ/A+rGldTUnVzJ3FG3aGmgbH1J/iZ4mdXtYn3JDtyP48QvsVC3RXU7eS+lk1XdbqjbrOpmEzwrw6RW3WWp23J+SU3dXgyTii8NFJ1fIqLu/A05DlS3hbotqnsGVreFutFJirrR2ssuePOaBT6TctU9gwNMauquVfeUqFt09NT0U0rLAhOL6nawISff686nbtHb4GXU7cQw2al7KY3VzaasXl9SeebG41czd9KJm/04FqvbRUppOe/Vo+i2WN3etlL6E92WlNIiumUppU/R7ZO5jeZmk1Pvx6k8c9eauyhzT30/zjytL5n2oYGVX19Snf04gdmPw6ahFt01dc8NdYtCStn6EhchpcguQWMPdkn+Sd0OQsrpn19SnU3wFtHtZFE3vZSSj3fN3DVzzztzV0V078jjSyTvWPCYUcpEt4W5LaK78kY3HdTNR7Zm7pq55525p37wlAvNXRXmltgl+XvgK7+6BDRaWaObtsDzMayZu2bueWdukeZ2wdyV2QJf5YO6ZW5JdY4MnAFzB/SOBT5a9UbKmrpr6sawVujMQMBzm1HKNlI6eceCxS5BJz4ySie7cUJD3WxYatVdU/e8U3d+Rgm0WEaJD6zomYGihYFAC6luXMf2l3RbMkrZmYFO3rEg20hpOb7Eorq9UrcxTFj9tequqfvqpG6L6kbPhZaXyI4vcWGYWPbAOzi+xMHyknyrW7a8xCd1o7WP4169UjcdX8ILrVV3Td1XJ3VXfGWgTHWLTurOV90VOalbtjJQdlK3zOuWHfcKMvZy3GtA1M0qqqm7pu6rk7otqtuFYWKJKV0YJhav25/qlhgmICQPqhtwMdUN2IdhIlPdaF2Ous2qbnbpNXXX1D3v1I3GhVS3yDCZvtcto27JJniL6pas6s6nbieqW0bdPg0Ti+r2St20C55fY03dNXVfndRtiSkt1C1S3R6p2+J1o3WKugGX2EqZr7ol1O1TdVsME4vqllG3k6O6nRgmgVHd7GLqmLKm7rmhbvDajlociIue9eJABztyXCwOdLKu27I40LIjx3KACei1GHVb1nU7Ud0dE1OyT62pu6buuaFuoIVUN9Ayqhu0W0Z1A52e6nawOBDUU8IwQePKqm4Zdfs0TNqGuln3NXXX1D031G1R3fn74C2GiWg3pYW6RQe+WlS37OwpUUyZb5jgA0sc+Cpa1y1T3bKzpyyqW7bCxIlh4mRxYEBndfN+6hNfa+qeG+q2qG4XG+FFhollhYmIuqdumFio29sLcmTUbTl8ykLdssWBlt2UMtXtk7o75vQp/gu16q6pe86p259hAnR6hgngMoYJ0EnqBurcMAHqwzABPHvDxELdgMu9IIcME/qJhmvurrm75u5kWGvurrl76wIrw933LyxcG49APAR3rC0P715ZGy43TpwabAxOjIYbm43RqcGosbyy3FhbHzWG51Y2R42VtcZoY7CytrJ2sjEanhvp34/LPDDY2FgZnBzedHQ4OruxpuF4gjfPnz6+vtq47szZtROjs4PRyvra9Um368NN3e/x4eq66my9cd/6xrL+RXWxjd2Nvv6PeMQPrK+NNuJuzKWp6z6A/2ocGpw5oy7o9sHx1eF1m9fvWbjt2JGlXq/TX+os7b/j4K37jt627/DSgR/uO7p0+5GlI0dvvuVoY2/jwtbwqD+HOx18ITWbyagFk3CQwOEkHCZwaxJuJXB7Em4ncGcS7iRwdxLuJvDiJLyYwL1JuJfAfQ6PUIwusp2ga0BTNR4HniryBPAW72UDaKpIfNUHqSrvBj5ZZkADPllngBEPJgsNMORBfxLHmIeTExpg0MPJagOMejhZbYBhDyfnNMC4h5P1Bhj4cLLeoA88Ve8AeKpejH6YqhejH6bqhXJqperF+LdS9WL8W7rexGpoAGwx8HsA2wy8BmCHgdcC7DLwjwAuMvCPAfYY+CcA+wa8Ztc1ybPTZC2vwwMVMPB6gLyi7wPkFf0pQF7RDQB5RbsB8opuBMgrugmgriixV3Azt/sMxJ3caTIQt3EnYCDuYX0qCkBijRYDcfd22gzErdvpMBD3bafLQNy0nUUG4o7t8DnaA5DN0a4/A2PxOfpzgHyO9gLkc/QXAPkc/SVAPkd/BTCuaHFxC9sHLC6on3yr7QcW19Pvb2EHgKn9d82k4c0A43IWk7pvAdGqvXfN5Ld/AFA5bc3ko28FqCzNZmJ7/RBgXM1i8tu3AVOeYy95CP8aYFxML/nlvwGmbLRmckEHAcbVLHa3sEPA4mr6CQcfBhYX00t+9wi+HlQxQVL1jwCqYnpJj38LUBfT2wKPAoyL6SfXeAxYXMxi8tG3A1MhSpBUfQfAuJhe0vDvgKmZST75TmBqZoLkU/4eoPJHe8mA/wO+1XQ1yTj+I0B+o/0TQH6j3XUXUH6n/TNAfqf9C0DOBksAORv8K8C4om5ySSD1flxRNxkNEHpf3WrJRNBXaTMuqJsMxzKBcUHd5FPoa7QZF9RNZoe+Q5vKgA+SKT9JqLrbmkkHpwiNK+onTVcIVPcb7qN/I1T5x80EvYdQdcslha4SqO65pIDTJCjiqjB1RmXEVS0mk7xOoLrpguT3zxCqysJH/TuhcVl4hkh1KHnRT0rdJFBRQvL5pH10QhkkTc8Squ493JD3EqpuPvRwH+khdff1kzk4R6h6mEA25wlV9x/Y5j8I5fffBUL5DfifhPI78H5C+S34X4Tyb6S7zi3SDRL22Pzeda5HKkvHD32SBT2SWa0mG5D4B6Sz9EvnMSbxD1r0g5ANS/yDNv2gxUYm/kGHftBmgxP/oEs/UDU3KY3tLdIPVNngxfgHPfqBqrxJlff69AP17dU0lQ/oB+obrGkqJ7mrlUbTVE4PqVYbTVM5PahacTRN5fSwatXRNJXTfGjlEVDlfZoPrT4CqrxP86EVSECV92k+tAoJqPI+zYdWIgFV3qf50GokoMr7NB9akQRUeZ/mQ6uSgCrv03xoZRJQ5X2aD61OAqq8T/OhFUpoKqf50ColNJXTfGilEprKaT60WglN5TQfWrGEpnLzN4iqPDSVmz9CmuY7+K5zA5oOLV7CZESiBwhWZYfJeEQPEqyKDpPRiB4iWJecjEV0iWBVcAumx8ME66/+5BqjRwhWxbYQWD5KsCq1hcDyMYJVoS2EnnAbAiVpwlYyMNHjBKsqW/jInxCsqmyh+CcIjqts0xiSZRsocRO2MChPEqzLxKD8lGAVyqKcnxGqFqajmqcIVTkrLu9pQuMa2ygR5m6ghA5dxLOExhW2UfdzhMYF4k8icnYDpXXa6OF5QuPq2mlfN1B6p4OZ/QWhqjZc2YuExrW1MZovEapqw+i8TKgK69EWlm6gZE8bY/YKoSqqTxu6gRI+LVzZq4SqOxSf9hqhKjbH6LxOqKoNn/YGoXFtbfTwJqGqNnzaW4TGteHbiJzcQAmgTtrIDZUCgplAPm6oJFAHc/E2oUoD4creIVTVRiX/juC4uC66eJdQdVfSfP4PwXF13bQRHCod1MFsvE8oO8jjAwK1XE1QuMChEkK4sI8I1F8nCfoxoVoJJegnhOZsMgy11ZLeqBLqI5lwU39OKFte8QWBilNQ15eEqrrSy+VCLYXS3m+opRBm7RtClXBNwG8JjAtDy+8IVNIgvT8lVEIomTGyfUOlg5KBJdc3VDIoqZVM31Ave0iGmzzfUBspQC8Rqv+OTVBwcKhNlPQ6i1BbKOllFqE2UHC1jxGqbsakXHJ7QyV48DVKZm+o1M4iruEnhKrS0mehhlrngAPG/01wXFw7vX8lVBIHX+dkC4dK33STtiagC7W6oT6eIliVB5odP02wrg8FPkNwXGAHs/QsofphQ4XPEazkORqb69AV4qqfJ1hNH2h5/ALBav7AR2MwcKiVDAhp/CLB+k9EOOIvEaz/SMSgvkww+6P3MhHVhMUyfoVgLtPHMQ3fv5DvOx86cvMtBxt7G8dW1k6uDvefHw2VdX1sODq0vjxcvU652pvD0dLa4PRw7664h92qh92dXVvZqvTf6mDt5NnBybir/WdXTw42VgZr2+xJXdjSaH1pfWN5uLF0enBm7/9vq5e75qXTakT2mr4P7jt869b4ba/j0fkzKycGq0tn1jdXRiv3Dpc2VAaxt3ljv9tvxX8Tb6vTe4bDM0uDzRMrK0urw5GKI/b+YLC6Odxeb4PVM6cGx4ejvbEoip6Kno6eiZ6Nnot+Hj0fvRD9Inoxeil6Ofpl9Er0q+jV6LXo9eiN6M3orejX0W+i30ZvR+9E70bvRe9HH0QfRh9FH0efRJ9Gn0WfR19EX0ZfRV9H30TfRt9Fvx9fHD8wfnD80PjS+OHxI+NHx4+Nfzx+fPzE+MmYJq5fWLjztsM3H7nz2FL8x2dQRya6mDoyqSMT4HVksgXWkUkdmWisjkzqyKSOTDRaRyZzFJlQDGA8Xi0iwGbG49UaAhRw5SKZflpDgBHp72SdlZD/f+UieXlaReB5vnKRPDMtJHC3XrlIfp7WEpiZKxfJ0VNyIoC5dOXBdwnXYUEb7T8gXGcFcI3IL9ayAvfYlYuwiLYiEhgZxkfW2oLcLzKMtboAwxl7WesLMsDIGNYKg2wWcnuVxlik8SUDVqmMLtVDDqzSGT0aFrJV29raouElY1WJjT51Tg5oR3PmInCavU7ALPorF8ll1qIj8Y0Or68NAetCcTWXTPe6UngodO1bQQj1/hXhOgeBMUJ32FYKAmOESt3KQGCMkN28lYDgfiS3WOcfFOOk8g8yl8nT11oE7j15IFv5R04YoX3KpP7L5BkrRRLAZfsDRQBKlPSSC7xMD0BX82pSPJkxSfwBW9HkMzr+SIbwMnzjJP7AI01BzFb8kYzg5d8RrItMBuUyPUL/d/yBC3+P4AmjmXIbpVYWMST0GCq50kvaXv6QUP0lj8eKEiGlWQI8y2MTXzSZQ/gHylB63N67/CnB3N67/BnB3N67/DnBbW7kmb47eY6ijkEyZqCOQcjfu/w1wbn+ng5CyN8zIVl/wt+jQKc/4e9RdqOzkEzWpBRNNmvSWUgma1KaJps1KVGTzZp0FpLJmnQWksmalLLJZE06C8lkTVtZSDpr0llIJmvSWUgma9JRSCZr0lFIJmvSSUgma9JJSCZr0klIJmvSUUgma9JRSCZr0llIJmvSWUgma9JZSCZr0mFIJmvSYUg2a1IiJ5s1KZWTzZqUyslmTVvWCWDKmpTMyWZNIf8D1WRNSudksyalc7JZE9ttb7Imvb0/kzUpmZPJmrTKyWRNelVIJmsK+zlZk9Y3maxJrwXJZE0tdtwCZU1a2WSyJh2IZLImpWqyWZPWNJmsSSmaTNak45AEpKxJpyGZrElJmUzWpIRMJmtSMiaTNbVbeVmT1jCZrGnLJklQypq0T5LJmrZWdSQoZU3aKclkTVsZSIJS1qTFSyZrUtIlmzUp4ZLNmjpccpusScmWbNakVAvPmu63usiiAOS+lbXl9fs2d6s+thlcuAxB8mKQImZ52St3HoV4CkNcxyFVCUT+F1BLAwQUAAAACACblopRVpJo2uoXAADnhAEAGQAAAGNoYXJkZXQvbGFuZ2dyZWVrbW9kZWwucHntnWubHMV1x9/vpxijJAIHoeme6bko2SQgyTJBF0eCkIvizUg7SBNWM5vZEUjZkEfGAgPBONxswFzDPeFisMHc/Tz7Iu/S+x34JOmarf/p060+Tpeme6Zmtnhj67+1NX2qqn/z31Onq/d8Z//FjeH+M73+/m7/vsr65dH5QX9pT2Xfd/dVzg5We/1zByoXR/fsayllaeme4eBC5ez5znC1O7pl44z6fxvd0fpwcKY7rPQurA+Go8qp6JfWurddHnUPRj8+1R0dG6x215aWol5rByo/GGz0Rr37utG//AOVo717u2uXo//vHajc1V/Dv6oHKse75zrjdktHTh4+fMfK0VuPH1k5duLQ4aOV5crmUiX6rxE126xU9lT2dveOBYj+zWk1CA5UvB11wNQWtR3Faq1Bbbd+yzqOLrG6I4cPx3K9EcuPsK7rsfw465t18iRrzeSnWN+1WH6ayaz1M6xv9pHPstbVWP4F+0g/lp9jrZux/DyTWd8vsE7YBf6SXUkrll9knbRj+SXWCZNfZp0w+RUmB7H8KuubfeRrrDUL53Ums+t+g3XC+n6TXSCb4reYXKV1Er7NZPaR78ayx+T3mMyu+/1Y9tnsfMBaswv8kMmx+hHrgw3gx0xm6+HXTGad/IaNVKx+wlR2eZ+y62Ct2Z3js6v+jA1UrH7O+mDX8QWT2Rx8yWQWzFfsXo3Vr9lVs8bfsFmP1d/Fajx421diNZ6t7R+xq4i72H4wluMZ3/4xG41Yvcq6YPJDrDH7QAYdPx7o7Z+wSFgnjEU+u7xH2UeyEBmi/Hjwtn/KZBbNEzvyAzeP/0exdTON1kY81ikM+w7DDsNaLgrDkB2Gx9dhEYbxBTlHGPbmFMMtYJhB1NQNe5kYrjoMOwzTBRaFYd9h2E43DGY7N3wdGFa83LwWl6IdrmZyuOo47DiMTpwd3p0ctsMOzymHFRg3r+Gi47DjsOPwuA+Zw/B/KQ7Dr1vKYVzetDiMNEGSw77jcJLDdfLDHICOw47DjsPjPtoxulIchmypH8blTcLhWjaH0UceDoO4E3AYKE9yGF3k4zBapzhcs4XDCnWb15DOcdhx2HF43Mei5SUEDkNOchjqBH44m8OAUS4Oo4skh4HQifwwup45h2txXoIhbW45jIWT4jDkFIfxl+VEHEbfKQ5DTnEYcorDkFMchpziMOQUhxFOPg6jkxSHIac4DDnFYcgpDkNOcRjyYnB4+n4YEzyJH4bFzcXhAvwwcJnkMNQUh4HFPBwGz1IcRs/5/DA6KYPD+Mh8fjjmMGOX/RzGUijDD2O5pzgMOZ8fRut8fhity/DDGKoF8cNCvQTkFIch5+IwGpfgh9F1CX4YXc86P4ye8+zTufxwOj9cIw4zSNnPYYArH4cFPyxwGK0n4rDgh9HJFDmMvvNxWPDDZhwW/LDAYeEpDnRShh9G34vAYZjWEjhcQF7CcTgfh2M/zGhkP4eFvEQhfljgMOSJOCz4YcjOD2u5KA4Lfjibw2Z5CSMOA5b5OIzLK4HDkBfVD6PnMjiMvlMcxj5ivrwE5FR+ON6nY9ixn8NmeQnBD0MuY5/O5Ydzcxit83EY2JnID6OTSTiMPnLVrWFuSsgPC3kJXJ6V+WEjDmfnh4V6CYHDM8gPA8/5/DAdLsH5Yj+HzfwwFnAZ9RLCPh1a5+Ow4IfNOCz44RlwGOPt6iV2RipWba2XyPbDc/hYs1leAqyceV5CkWTzGpDYz+Ey9+kKyUsIHLY+L4Fbb6K8xAw4LOzTGXEY9m++8sNmHC4vL2EHh8vMS5hx2KheQiFj8xpizC2HAYB8fljIS5TJ4TLzEoVwuBA/jL4nqlsrc58um8OF7NNl5yWs8cNGHDbywyb5YSMOZ+clYGWnuE+Hjyxjny7ODzM0zC2HzfywUD9sjx/GBU7RD5vVS+ACJ8oPCxxG32XkhxfJD7u6NepiNn4YHznJPl0Q160xBuwSDpeZlzCrlxD88AzyEpDz+WEhL1EIhwU/bFY/LHB4kerW8H0167xEaX54sTic7YdrdOwlv9nnlsOQ543Dgh8W8hKFcFjYpxM4LPhhgcNCXsKMw5DLeI5j6hzetXVr2fUSu4HDZnmJNnGY3dXy+cOWc3he/bDAYXv8sMBhs/xwIX4YrefLDxdSt5bNYah2cnjafhjyFPPDRXA4iDnMbl/7/TBka59rhjx7Dps9T2e9Hy6Ew5AXIS9hC4ehLi6HBT8MeaJzfmIOs/t0bjks1EuYPcch+GGBw0L98Aye4xA4DHn2z3EI9RLCcxxmHIY88/rhqddLCHkJXIeV560VsE9n9hwHrOwU64fN8sP0djp+Q9rP4RnkJdB6ivt081ovYeaHzc6XEPLD6CTFYci58hIl1kuUmB8usV7CiMMIMY8fFs5bK8APm+WH0Xqi55rN8hIIPZUfjvfp2J23aBwW6ofLrFsrMz88g/phMw6bPcchcFioWyvED2dzuBA/nM3hEv2wLXkJO95PJ5x7WUheQuBwIX44fo6D3WKLxmHBD8+Aw0JeQuBwmfUSAochW3u+hBmHi6iXgDw9P4zWk/hhIS9RHoez9+my8xIFcFg4B96Mw4X4YTMOZ9cP1+L6YXYvyRzOfl/znHLYLC8xAw4Lftj6vEQhzzVPv37Ymuc4SsxLCBzOzg8bcdgkL2GUH0bjOatbEzgs5CXi/DC7aez3w5DLOH9YqJcQOCzs06Hvic6Bn8E+nXC+hJkfxkdOlJdA6znbp7M8L2GUHzbiMNTZ1g9DnrN6iSB+Tyi7O+znsNk58GZ+GHIZ58ALHLbHDwt5CcEPQ5593VoRHJ7PurVC/HBpeYlsP1wAh83qJWbAYeHcS8gpDsfnXrLbYHdz2Pp9OgRv7fs4CvHDwj6dkJfYvRw288N2cLiAegmBw2X6YbP8sJkfjvfp2Hq3n8OQZ3/+sMBhyGW8n66QvIQZh8vMS1jjh6Eucl6iPA5DnSA/DHmC/LAZh605f9iLOcwWdjEc9q3hsJkfngGHzfww5DI4DHk35iUEDmMDKt/7OCDnqpeAnI/DaF3C+zgg53ofB+TC39cMOclhqLnqJQQOo3WKw5BTHIY8PT/sxfXDbAUvmh92HHYczsFhoV5CqFszei+SwGE0noTDgh+eOoez6yUch3Nx2I/fx8GWajEc9hyHHYfpAueAw4IfhjyJH0YfE+UliuCwUC9hxGH0MUd+GAjNx2G0nmJeIq5bY2vS+WHH4V3I4UL8cBF5CeE5DueHaTRMOSycL2HGYbQug8OEYbb4XHrYYXjOMGz2GIfR65qLSA8L5RIChrFrmwvDwjE/U8dwdrnEtDEsPE5nlpYws8Nmj3EIaYn4uDW2zJwddhy2lcPCa5EEDqN1CY/ToY9J0sNCWsLocTqzY+AFDqP1lB6nK++YH8EOQy6jbM2Mw9mPNftx+TBbT47DjsNzxmHI+Tic7YfNOCz4YbSe2vEStvhhOzhs9hiH4IcFDgtpCciTPNbsx3kJtnAchx2HbeWw8BjH9DkM2VIOC34Y8qL6YSEvUYgfNuMw5Fwcjk/5YSvEpYcdhm3FsGCH0XqS9LDwNF2J6eEiqtZsscOLnx4WMCykJQQMC6etxVVrbC04O+w4bCuHzU5bK+LUS8vtsC2nS5jYYajF22GURUzRDgscRie5OOzFfpjj0vlhx2FLOQzZ1urh7G069DHz6uEi/LBJ9XD26cOuejidHo6rh9nsOj/sOGwrhwtJD0/99GFr0sOoiMvFYQyTSw+XnR6OMcymsZhD4OfVDguHDzsMW4HhQqolsu2wgOEi0sMChoX0sIBhW+ywSbXEtNPDZdphMwwLdjgbw15cLcEmzNlhx+GF5nCJ1RJGHDazw6D21LbpCrDDRmkJEztstk0ncNjspUgl2mEvPgSezYzjsOOw4/C4D3Z6c76nONB61hxG43wczn4pUgEczvbDAN2sOWxNWsKLn+LgU7CrOezyEo7D1IeclxD8MGRL08OQJ8lLWMFhqPme4hDK1gQOF5KXMHqaLrbDbKxdtYTDsMPwuI9y0xJFpIcL2aVD6ynt0hlhuIjqYfRsqx2uxXaYjerutsOOwzZz2FVLuOrh38PhMt9NJ3DY7CmO7HfT1QnDbPicHXYYthXDkCc64yfbDpf4MF0hGDaywyVWS2QXDy/+w3TCGT8A6yQP09FRa3ygnBt2GLYVw7ZnJabuhs2yEgKGp5yVEDCc/WY6IzdslpUos1jC6IgfeiESHxKHYYdhh+FxH+W+EGn6btjoEQ4jN2xSsya8IDQ7KZH9gtAy3XAhGDarlaCsBA/eZSUch23lsJCVgOxe1FyZUXIY6myPloBcRnIYcgmPNDcJwyxKZ4cdhm3FsNkJP9MvWbPcDhu9l84Iw6WVrE0/OVymHRYOgCcMs3hkDPsOww7DWt4tWYki3HAhJWvZbljAsPAEx7QxnO2GheRweRi2/gmOmMPsyp0ddhy2lcOF2GGjkrUissNmBw8L70PKtsNCyVqJtRKQd9vJEmbvQxKyEoIdjnfp2CU6DjsO28rhhfLDQlpC4LDRE83oOp8fRuskh7GlZ+NBa2Z+WHhNc5l+2Oy9dHTwML8Wx2HH4TnjcInp4d3A4eyTJQQ/PIccRh+2nvBTj/MS7EMdhx2HbeWwWV4Cjs69iKNSdrVE9jMc2RyGOgGHgdApvohDyEug9UQHwMdVa6x3x2HHYVs5DLLmq1oTXoiE1rmq1orID6PrEl7EYcZho306Iz8MdZ7yw2Z+GHIJHPbih+lYN47DjsO2chjy9KqHhbI1gcOQkxzGt8dE+3TZeYnp79MhGBufaTbjsNk+XYkc9umoNd7ecdhxeBdyWMhLCH64xJOHjeol0Mesz5aYx3oJwQ+b1UsUwuH4MY4nHIcdh3c1hwU/LJwAj9a5/LBZXgKfOIkfLjEvke2Hs/MSlrwgVKiXgDzTvMQDS0t7ovmNpvKu/mr3nl6/u1o5e74z7JwddYcbldH5zqiy2lut9AejSvdSb2NU6fUro2Gn1+/1z1VG3Uuj8e9HF3iwMxz2Oue6+092RxeH/bEcRblx+cKZwVrlxvWL/bOji51Rb9C/SXc76G6M+z3TXRuozgaV+wfD1fEvqnGo7Ku0x/+IFtTBQX80jLqJL01d90H8q3Kss76uLujOzpm17o0bNx1Yuvv244dO3H1qxYuuYuXIycOH71g5+P1bT67ceWLlxMlDh09WliubO2OjvtyDYGdkTl+qVvWQeUnZ07KflH0t15JyTcv1pFzXcpCUAy03knJDy82k3NRyKym3tNzmMr4Vx9vhQV2rfaipGM9ATwV5FnqN9zKEmgoS39peKsp7oCfD9GjAk3F6GHEvGaiHIffaSR1j7icn1MOg+8loPYy6n4zWw7D7yTn1MO5+Ml4PA+8n4/Xa0FPxdqCn4sXo+6l4Mfp+Kt5VLL1UvBj/WipejP84FxJohFUg1pj4HYh1Jt4AMWDiHogNJv4BxCYT/xBii4l/BLEdizfsvUHfO1XW8kbcUB4Tb4LII/ouRB7RH0PkEd0MkUe0DyKP6BaIPKL9EMcR6e8aLOZ6m4lYyUGViVjGgcdErOHAZyJRo8ZErN6gzkQs3fHTdhCxboMGE7FogyYTsWIDPkcHILI52vsnIBafoz+FyOdoGSKfoz+DyOfozyHyOfoLiFFELX2Zt0JTVZVV/Z12G0S1fVTVjDoIMQqorbVD0KJ42q0d7TBIqwxGVX8xfw+i+gPXa+yIRyCq7eCqvqDvQ1Tf6p7+9dshqveJtJo74l9CVC949bR4B8Qonrbu8ii0KJyWvspj0JSn8PQAHYcYhdPSN/sJfENE4TTbO9oPoI2j0T3+FcRxNPq3T0KMomnpTzkFLQqmoS/7TmjjWPTo3gVRzY2nP/uvIUbBtPWn3A1NTY1u9zfQlPGtavFv8b2m5gZD8XcQ+VL7e4h8qZ0+DZWvtX+AyNfaDyFyHqxA5Dz4R4hRQE09Y8B6OwqoqRclkN5Wk6M1+jKtRgG19GJZJTEKqJH68zdaZ9EY6QVI36LVKJ62vp5zJEbxtPTAnScxiqehB65HopogX3/SP5GqZkjP770kqoi0uEaiCklf0wXyE1FIDf3xscmIQsLX0IDEKKSmvqZ1Esf3j276z6SqNadF8hzKXDT0x2+QGMUU6E7J+Shb0dQtL5KobqGqVu8jdbzu9JjeT2ZIzZMO/xKJ6jaqavUyqeo+8vSC+BdS+crbJJUvvX8lla+9B0jli+/fSOXfRqcvNWlpJBzEtw++RzpzEMcH/S5cHTcQ315BesBLGIj/eYpkP9H8ZdJrCf0t0usJ/VXSg4T+GumN7KtsJpr/ipq3spu3E83xB6pXr2Y2r3vZsp8t17LleracDPQ5upRGQn+e9GSkL5KemNYrL5GeDPU/yX8n5/Vp0r2E/gzp2cEGiXm9GnefHW2QjPYLap49rUEzW86e1SB7BSdsyOlLHfqTYmxFakglPERyFGkDmYSHSeX36dbrJPMbdesNkvmduvUmyfxW3aKboMHv1a23SeZOa+sdkrnX2kISymuyMFn0Tf4luPXf1Jp/DW4RBJRJadZpqOibp5kI8wOSeZjfXnmW9EScdDc2E3F+RHIizo9JTsSJZJanfItf13ANr5KciPMTkhNxfkqy2oHQhKc0sKcMTF2rlO71lIVpYj08SmoUYhNr5zFSExF+SXIUIf40poSx10oEiFSWN/YyVf1NFT5BsvpS8fGJPyN5/K2CFNd/kKwCxEU/SWoUYACVmK0sTR0dEwiUp6mjLWFAmZoaIqH5VramjbY/JzWKr55OTvvK2eBvCspN+8ra0KQ+T2oUXB2f9gKpUWwYNkpM+8rd1DBqL5KqYtOmg9LSvvI3AdSXSVWxQX2FVJUV1MSinLSvHE4dn4ZvJ38nk1JN3YP+ePcJwb1OjVWuEGG8QWoUXB0f9yapauKwMt8iNQouSCepfWV0Whi0d0iNggtwDe+S2mJGL/wvkpXX8TGhgIavzA7+LqE0tz92OxiK90lVN166+M4fpzYR3Yekqr+CfFzyr0gO4ozuRyQqtGCSPiZV3XfpvLc/tjrp7UefV5KAE/74qed0EYivTA7+lqKct7/jcbT6GalqVWrxcxJVZLiCL0hVgWE2vyR1/BerVr8iNYoMTb8mUa1JNP2GVLUmtYhct68sjR4uSnX7ytDoGaNMt6/sDP5So0S3r9yMnnLKc/t1tvd3lUQVVfqFIv7Yx+CzHiZVzVe65sNXHqae3mr0xw4G1wX++sq/NKA+RmoUWFPPwva/k6oiwyA8Tqr6RtdDS7nwcbbaR8BPkBqkvlwfWMpKIh87cejw0cpy5VSvf26te9vlUVdloU91R8cGq921G1WCeqM7Wul3LnSX997f668O7t/Yp35/786mp9l/a53+uYudc1FXR4bd7r3X1Ye6pJXRYGUwXO0OVy501pf/v9z4JFe6ckGNw/JOr0dvPX5kZ8Sup8vR5fXe2c7ayvpgozfq3dddGartg+XqLe2W34q+466jy3u73fWVzsbZXm9lrTtS+wjL3+usbXSvp6/O2vr5zpnuaDmykOEj4aPhY+Hj4RPhz8Inw6fCp8NnwmfDn4e/CJ8Lnw9fCH8Zvhi+FL4cvhK+Gr4Wvh6+Eb4ZvhW+Hb4Tvhu+F74ffhB+GH4Ufhz+OvxN+En4afjb8LPw8/CL8Mvwq/Dr8Jvwd9tXtn+0/eD2j7evbj+0/fD2T7Yf2X50+/Htn0YL+KalpdtPnVhptYL2StPtdbi9DrfX4fY63F6H2+twex1ur8Ptdbi9jl2z13H6UoscVspCtMhipTxEizxWykS0avSDpGtq1ekHSdvUCugHSd/UatAPksap1aQfJJ1Tq0U/SFqnVpt+kIq8Qz9IRU5Wt56KnG7PeipyukXrqcjpNq2nIqf5qCcjb9N81JORt2k+6snI2zQf9WTkbZqPejLyNs1HPRl5m+YjSEbepvkIkpG3aT6CZORtmo8gGXmb5iNIRU7zEaQip/kIUpHTfASpyGk+glTk8d8fqcjjP0BybY2wXSllXtpVyLQplWdzhG01JnZHvn3wQ9KntD2y939p46n47RG+92LZ9gglrGmvq5W51+V2R9zuiNsdcbsjbnfE7Y6M1evYHbkm6Wy0NxL99j712/ua17GrMfm+yLW7Ir8/h37911jYjkjh+yHF7YbYtBfyf1BLAwQUAAAACACblopRxaULhg4XAADMgQEAGgAAAGNoYXJkZXQvbGFuZ2hlYnJld21vZGVsLnB57Z3ZlxvHecXf56+AxSSUHFHsauxMJom4WHTCxSGlMAvjCchpkoiGwAQDimQmymGUnDxHi61dlqzVSk4iyWtiWz5nfE5e/M5+51+Srkbdrz/UdCkoohroxtS8SLwsFvqr6v71ndtVjUNfO3prZ3T0Sn9wNBo8V9u+O74xHKwdqh35+pHa1eFmf3D9WO3W+NqRjlTW1q6NhjdrV2/0RpvR+ImdK/L/dqLx9mh4JRrV+je3h6Nx7WLyj7ai43fH0Ynkry9G47PDzWhrbS3ptX6s9q3hTn/cfy5K/hQeq53pPxtt3U3+XxyrPTPYwp+CY7Vz0fVe2m7t9KnjF05d2jjz5LmnNs6eP3nqTG29trtWS36aSbvdWu1Q7XDvcCpADB7X1Vaiiol6lamC1M1MbYSkRqzfOql9praO1cKJusXUBqkD1m+XjmzI2gpqO2Jts0/bYWrW75hVkbW9lan1Bn3a5Tu9gH1gk/5i70es704m/4J1kx303i9ZJ+1M/pK1zgb//mesddbJ/c/ZR4pM/oJ1Us9kdoD17CPv/5jJrUz+CZNZ3z/N5JAdyc9Y62xM7v83G9kwk3/OOsmG6j4fqkyO/4lVmfUdv5DJ2YHE/5aprIsX2Qdmwxq/lMkiKz1+mR0HnQ7xK6yPrO13mJqdJfF3Wc9MfpW1Zp28xlpn6uusMav7DdaYyW+yUcrUt1hj1vXbbF6yCt9hH5idN/H3WB/soN9lMpuA95jMOvk+65sN9fusNZuvD1jr7FSNP2Qyq+Yj1kk7K+fjTGZ9fMIaZyCLf8CusKzxp+xMyEp/cI+dIc2McA/usSlrtFl7Ng2NFmvP5qHZYe3Z2DYC1l5V+vzj6X9axGzG4WbWfiZmB3MzW+QyO8hltshltvDMPojMxrXnmV00s9G6tMyGPBOzIc/FbNIXzGwBZjPimpkdFOSz85ktcpkdzs3swDN7VZjtffbDMxvqivjs4phN7CyHz5Zw3d3HVkufHc7NbJtsJN9n52cj4dw+W3hmH0xmQ/XMLp7ZuD9WjNnhcpgtMbq7j6JGZodz++zAwmfnM9vGZ8/PbKPPFp7Zntmp6pm94j6bmDqnzyZ9RmaTrjG7BWZzXlr67Hxmh7nMDi18dn42ku+zg1xm52cjwgWzvc/2zJ6ontme2TMx25XPboDZjIxumF1Unj0/s/0zSM9s9ePzbM9s9WPP7CVlIxKCu/sYWBJmz59ne5/tma0+0Ptsz2zVuOo+m9aNMNo1s+TaeTZShnUjntme2erHM9szW/1Ux2fTM0jGNTfrs4titl+f7Zk9+fHM9sxWnVTCZxPjZ2Q2tdeYTXk2I1iRzM5/BrnYPTU2Ptuv9fPMpj48sz2z0Xp5PrtFPpuxqix5dr7PDiyYnb/WL5/ZgffZntk4Ds9sz+z0p4Rr/erkszUqOdkKGVhgO7DAdlHL/fKxHXpslxnbYS62sexDwzZkDduQZ1k6AlXDNmQN25A1bEOexjZKmQ3b6GMa21BnwjY+cK7t65A1bEMuYlsNWs/0yhGoM71yBGpB29cdYVvSZ3cffMzvicqHdmAB7cAC2oGF17aBduC99qpAG5fZotb7GaDtwmvbQTvfa1tBG401aEOeC9ql8dpW0Lb02kuCtsTM7j7KrA60Aw9tD+3JB7oJSAqENtSFOW0DtA1OG7IPSCatlwftOi3SnsKJh/Zkwjy0yw5tqAcu1XYAbahVg7ZVPLKC0Jbg2N3HDQ9tNWEe2h7aJYU2ZP8oMu3kQDlteo32FCA8tCcTdoCgLVxAG50s+0EkVA3akDVoQ56GNtRpaEPVoA1ZgzZkDdqQZ8q0IWvQhjwNbagatGFC53kQidYatCFr0IY8G7TRejZoo7UGbcjT0IaqQRvyNLShlhvaTYpHOAk8tNWELQvagJ932qpKS6dtt3rEgdM2rB6xctroY554xADtfKftZPVI2Z32Kj6IpE3s/JL30FYTdoCc9kpB2+C0DdDOd9oLX/JngDbkZUPb4LSdrB6xW/JncNr5mbaV067Gkr867a65v5JL/ioKbSdOG50UEY+g9VzQRifuV4+4iEesoG2IR6ygXbeCtlU8AnkmaEOeKx6xW6dtiEfQiY9HpqFNDyL5ReyhrSbsADltA7QhFwFtF07bKtO2ctr5mbad0zZk2lbQNmTaVk47H9qGJX920DY4bUOmjdazOW0DtK1Wj6witOn7D/jV6qGtJsxD20N7YdC2exDpANpLcNp20EbfHtrT0M4ybXZZemirCat0POIE2oZ4JKwktB2sHrGLR6xWj6xUPGJw2pB9PEL92EM7zFaPsOvPQ1tN2AFy2pBnc9pOoO0i0y4O2mBoAUv+XDjtskDbSTzioW3ltOndI/xC89BWE+ahbXDakKu1Tnvh8UiBq0fKAm07p+2h7QDa8pLa3XdFeWirCfPQtoP24uMRqJV6yx8OemHrtPM31xT5wij/lr8C4xF6YRS/dDy01YQtC9p1K2jD32rQRicatJFsaNCGrEEbnWjQhqxBG51o0MYBzgZtgEeDNi6oRTntfGgb4hEXTrvAeMRqR6QB2n71SFmgXSdo82vEQ1tN2LKgDfjN5bTRyVzQhjxbpm2IR+yg7cBpQ3X/7hEDtNF4cTsiIZf03SN2Thuyf/fILNBuUKbNLwYPbTVhqwhtEHQ2aNs9iFx8pp2/ucYAbatt7FZO2wDtAuMRK2hbxSMGaBviESfQtotHrKBtiEfyoV2NeIQWj/Cz3jNbzddXfUekyGc25CIibZBSYzbk5RttJ+mIFbPz0xEs/NCYDVljNuRZFo9A1ZgNWWM2ZI3ZkGda8QdZYzbkaWZD1ZgNeZrZUDVmQ9aYDVljNuTZ0hG01pgNebZ0BK01ZkOeZjZUjdmQp5kNtSBmC0tmU/tpZmfhCDu/bZktPLMnfVfBZ5eH2YjF52E2rrLVZbYh0bZidv7akSKZDXm2RNvAbMPWmoUzm9hZDmaH9GJWfiZ7o60m7KugHZYd2kDlbOGIYWuNk0TbEI6gk4UZbcMq7eKgXeDWmvy1I4s32oYFfwZoO9laY/UYskijTVAtCNqGcETQJnZ+ynpoqwlbxUS7PE7bBbRL4rTtNrFbQdtq7YgLaBtWaRcJbYPTNiTahlXaByYdoVf88XPTpyNqvr7KaBuY7STRNuxhh7zARNuw3s/J0pEVYnaB6YjBaJc80TYw2/AUsuSJtikdKdpoh/nMpo01/CxcdZ8tXDC7yKeQS1g54iQcAeFnC0d8oj0Ls6v5FNLAbLunkJDLyuyifbaJ2Q2CNjvfVh3aTsKR8jyGNGysMSTa5VmjXZzRNmysMSTa+RtrrKCNLgp4LasLo231GNJuC3uRG2sKDEfyd0OWbGONIRwRGbTZieWhrSasZGtHlpCOrNR6v1V6DFmWRNvgtA1rtO0eQ5Zl7ciyHkOa1o5k8Qg7gzy01YQ9RKRd+seQTuIRtJ7LaUNedjwCwLh32oZ4ZOHQznfahi3s5XkMaYi0DU4b8kzQzt/CXvBjSFdOm5jNPtczW83XKkbaBqPtJNI+sEtHfKTtI201CQuItLMd7Oyk8NBWE1bp9X6Qi3jBnwHaaL3sr4dE23leO5K/gx1tC9jBDnWeHez4wJleO2K3gx1yxb6IHWoVv4jdZLQzaLPZ99BWE1ZpaC8h0rZLRxa+eGThkbaLdKSaTrvILewu0hEnkXbR0CZde1cUMZv175mt5mtZjyFBs6ox26cjMzG73OmIk8eQThLtsjyGLNkWdpFF2rwjD+3JhC3rMSQwXNp0BPLSv/4gPx2B6v79flBL+vUHhnSkou/3c7GF3fB+v/x0BGpJdkMaIu1sBzubOc9sNV/VWKTtjfYqG23DDvaShyMGo21gdsmNdskS7TDbws7myENbTdiytrB7o71Io52/3s/KaOPgCvhyyJIbbcPOGoPRdrKzBvLCjHbJ1o6IbJE2+wce2mrC/GPIam6H9E67pE67mpH2spw26Rq0s68/YKPuoa0mrGTbIZ1A27Czxg7adjtr0Mmy38paHLQNkXZZoO1iD7sB2nY7a+zWjhicdnF72AuGtqvnkFk8wobXQ1tN2EM4bSfxCODn97CrKssObYPTNsQjLqBd8j3sdi8eqege9iVBO8weRLJx9NBWE7aseMRn2vNl2mjr/ht9nWTaaD3P1hqrTBt9FLC1xpBpo3W1Mm30XJJ4xOS0s28aYwPmoa0mbBVXj9jFI2hdrUzb8Io/g9Mu7hV/5Y5HDC8eWUKm7Z12LrQNmbYcmt19I+OhrSZsWdD2TrusThvqbE4bcjk3sUNdoNOGvLhN7Aanjcal/hp2UzyS7a1hQ+ChrSZsFZ12ka+LKovTNmTaxW1it3sQ6eIVf/nxyOIfRBqgXeTqERcPIvOhXZHVI5nTZrV6aKsJW8XVIwf4HX/FQbvAeKTk0C7Pkr/Fv3mEnPBiH0RmzGZFeWar+foqZof5zHayeMSO2UDiQVw8svrLtCEfwGXakA9qpG3aWxMQtPnhe2hPJmxZbx4xrPizM9roZK4vQDA8h7Rbpm1ntHHlaNDG9V5KaBdotBcO7SKXadtB2/DmERfpSCWgbTDa2WtZ2XF6Zqv5creJHXJpw5EDvB9y4WtHrBLtku+HPAjMNm1itw1HbBNtg9Gu0yb26SMqCbVFCahtfA5ZpNMGh/3iEVXlar16BK0X9uoR9LG4ZdqGV4+gk7mWaaP1PItHrF494spp21KbdM1pM2prXzYmLKgtcqktcqktcqkt5vbaIpfaYS61w1xqC0/t6lEbajk310Be2JI/qP57a9If8/fWQK4itRvtjNralyDkU1sslNr5XltYUFvkUlt4aq8KtfP3sS/caxvW/Bm8NuRKeW20Lq3XdrAlsiLUbmXUPkDfgpBPbZ+QVJDaLhISG68NtQCvXXJql8dru0hI8r021HJTu9nJqO3fzuqpXT1qQ/WbIu0TEqhVozZk9wnJkqhNTx1n9NpBRm1tV+RiE5J8ats8jZw/IfHUriC18722C2q7SEhWyWsbEhIn1LZLSKyoXaaExMFi7efX1g4lp0VyrM8MNqNr/UG0Wbt6ozfqXR1Ho53a+EZvXNvsb9YGw3EtutPfGdf6g9p41OsP+oPrtXF0Z5z+++RUOdEbjfq969HRC9H41miQysnE7dy9eWW4VXt0+9bg6vhWb9wfDh5T3Q6jnbTfK9HWUHY2rN0ejjbTfygHo3ak1k3/kEzRieFgPEq6yQ5NHvcJ/Kl2tre9LQ/o6d6VrejRnceOrV365rmT5y9d3BBJcRunTx2/cOrSxonTT17YePr8xvkLJ09dqK3XdiejI0em2QSXA3BZTMtCyeG0HCq5Pi3XldyYlhtKbk7LTSW3puWWktvTclvJnWm5o+Qul3FPEmmRDaXiDii0Gq9A14rE/Tl95yb1gnuj0IrEHVpoVV6DPl2moAGfrlNgxMV0oQJDLrrTOsY8nJ5QgUEPp6sVGPVwulqBYQ+n51Rg3MPpegUGPpyuV3Sha/XCA4VavRj9UKsXox9q9cIf1bV6Mf51rV6Mfz2tV61vq0GsM/FrEBtMfARik4mHILaY+FsQ20z8bYgdJv4OxG4mPnL4kbUMWWj5KC4owcTHIPKKvg6RV/S7EHlFj0PkFR2ByCt6AiKv6CjEtCIFV5zMjS4TcSY3AybiNG4KJuIcboZMJGrUmYizt9lgIk7ddPcfRJy3zRYTcdI220zEGdvkc3QMIpujw78HYvE5+n2IfI7WIfI5+gOIfI7+ECKfoz+CmFTU6k60J6ElBXXVTfA4tKSetmp3AlpSTkfdFE9CS6rpqrJPgbNJMR31b78BLaml255oT0FLSumq/k5DSyppdSbaN6FJByXUAf4xROkLhPrkP4GYVNJR2hloshI1CmehJZV01RV9DlpSSUdp53FrSCppq6P5FjTpCUN1NH8KMSml05poF6AlpbRVu4vQklJaahiehiYrCdRRPwNR+pJAtfwziEkpHXXbuARN+jShxD+HKC14oIr+C9zQpL8SqsK/hMjPsb+CyM+xy5eh8pPsryHyk+zbEDkINiByEPwNxKSippZEdpOK2qogsLybFNTSskkRJAW1tF9yRZAU1FCDSXfQICmoraaHbp+BnB/V53US5QSpD79BYlIPjrxPYjpDajj/ltSkoK5q+iyJSUVN9fFbJMqS1D+/SUYiKQnGIHMXsiR1PQ1JTEpqqT63SZS/IAlV09+RmtTU1H4RF9JVNNSB7pCY1NRQH0+WR/qJlmp5i0TJAtXncyQmJbXVOXubPFBSUlddQ3dITEpqq+Lvkih/nQlU078nlZ92u6Ty8+4fSOUn3vOk8jPvH0nl96DLd9p0XkjfkPQ/+YsHL/wH6RLc6jo9NxxE8HIS3bjWHtzD74MitQ2B6uZ/XyJZXls4bR7ce4f0pMyGngclspy7DuR3SZaFBi3o75EuSwU2fvOvJMtaA+rmM9LlDSro7itJViroYBAbiNRJKBCz5qmXEPsGJnUTor5PlvOpgMVlOaGKTlxOCu3Q4L5GR5LU2aTfw14nOamz0Yb8FslJmQ0arLdJlqcrdYJfiYV0F3WSXyZZ3sFwVtx7heS0StX5b+gj00xN4MD/Jes8LbOtl5m+GkZNRNL7/1BzOZ+is6+5nE+xb95SvxEG+2Q5neG+aZOeo45fQrIcTaTRISrao1MrNR4h3oVABaWLmNQRHt57n2R5zw5wCr3wKenyxA3VuOx9SLKsE9fcHp390oUINVqH9z4mOb3nqdHa+4Tk9K6HThAhCGlHEjJM5F+/SrI8ayHv/TvJaZmoni5+6Us6bRosut1Ib9LFkfwnqWmVOO7/Ijm9ZaBvugqlQxE0sp+TnHIIQ/UFyelsYsB/CFlaFfySQuGn6KRF4vh+TLIsso6U8ycky7kMsK/upyTLc7YO+WckyyJxoewRJFLnok7Cw7/OOpGnbB3V/JxkeWmimF+QKreh4aiRzQppYJoY1C9JlSXiPN77Fclyf5Ue2ArpYZqqY8prhTQxDeyoo4GWLqajDu0+jbO0MSiDMlwhfUxdHRpFuEI6mbqabkpwhfQyGE0KcENpZjBRlN+G0s3U1axSfBsG6fTprAyloWnp37kVSkeD04Uy3TBIJw/H9kuS08mD/CXJ6eShvl+RLHlTV33H90iWBUJFXBxKa9NQpVBaHKbRCaY6/meSZYW4HcafkSzvHZip+HOSZYkwffEXJMsa4XHiH5Kc1qiKiX9Esqyxod+XwjQ1aewb6zQ0UfcUJqeZSUPHe5hGJg0d42GamDR0jIcTx6NjPJSWBwOFXD2UjgdD/SKJqQtQ6kukSsyoqaVQPQw7+/dlhmw/KkXqYWp01HVGiXqYvoUA6qukphRV6muksvz+dRJTJ6fUN0iVN0Sob5Iq/akS3yIxvUko9W1Sk7pQ7Dskyrr0zZhhupcbB/suqbIwjPd7pEqPqu/EDFNPg097n1R5D8TkfECqPCtx9n1IanqjV+pHpMrS0PZjUuUvSEr8hMT05qdU3PtC6WUwip+SmP7Op/uBkGclXJaTBoBcvpWAKqKO5BnZYn9zjf6GGfG0r+fXcqPks+dPnjpTW69d7A+ub0XH744jGUZfjMZnh5vR1qMyp96JxhuD3s1o/fDt/mBzeHvniOzg8ORJqeXPVm9w/VbvetLX6ejKKLr9cL3Io9oYDzeGo81otHGzt73+/6bkcx3txk05GOuq3zNPnntqMm4P1en47nb/am9rY3u40x/3n4s2RvJhwnrwRLfTCBLz9DB9PhtF2xu9nav9/sZWNJaPFda/0dvaiR6qs97W9o3elWi8nlAufjF+KX45fiX+Tvzd+NX4tfj1+I34zfit+O34nfh78bvxe/H34/fjD+IP44/ij+NP4h/En8afxZ8n94DH1tb+D1BLAwQUAAAACACblopROuUHW2sbAABWkAEAHQAAAGNoYXJkZXQvbGFuZ2h1bmdhcmlhbm1vZGVsLnB57Z1tlxzHVcff76eYWIDsYNlV1TtPAgGy5EhK9GAkK4Zgsoy0I2ni1cyyO5KlCHPkYB5yIBAfh5A4DsEhEHxCQnwcHDAOL3Z2Xvlb6JPQ1VP39u327dDXNd3TM9PzJvHtUk3frurf/Pt/q2uPfOrpO/t7T18bDJ/uD+82du+Pb42GG0caxz59rHF9tD0Y3jzeuDO+caxjIxsbN/ZGtxvXb/X2tvvjp/av2f+33x/v7o2u9fcag9u7o71x40r4j3b6z9wf90+Fh6/0xxdG2/2djY2w1+B447nR/mA8uNsP/8scb5wfvNTfuR/+f328cXW4A/+ljjcu9m/2onYbZ69ePHPy8rmTF7fOn7x4ZuvCpdPPnm+caDzYaIQf0zneeNBoHGkcPXk0CkBQPZmOboa96ln0mTja3MToKdK2ebxhZtHTcTQw2PZZ0kPc72dID13s4QzpoYNtz5Jo3PYc6TfAtp8lbVvY9nPk2zRGz5O2cW4XSDTO7SLpoY1tL5Fo/G3PkWiA0cuk3zh6hUTbGH2e5BZ/21XSb3x1Pk/aNjH6+yRqsN8vkJHHge/FQR13e400bWH0Omkbn+42iWLTPukgzuEGaRrPkZukbTxHbsXRLgYHpGncwZfiaHxaL8XBeHB2yAnEw3CbXFoMDuNgfJuMyPfH/36X9KowukcGAU91n4w4Bsek1/gS3iG9xlfgLkkrvgL3SNsWnu19Eg37DWbRL5Pzir9t8iq5CJvYxeSr5PtI66+RTuLLM3mDhLtx+JukExWH3yThIA6/RU6bnMnbJNyMw++QK0r6/jG5pqT1eyRM+n6fdKLj8AekNUnnQ3Kp4jtp+jpJPh6E6buz8CtPRv9j6fogDVcLYuMNYs2C2LAgViyIFQtixYJYC0CsWRBrFsSKBbFmQWxYECsWxJoFsWZBrL1BrFgQKw7EhgWxYkGsWBArDsQBC2LFglixIFYciE1+ECsOxJoFseJArDgQGxbEOj+IFQdixYI4YEGsWBArFsSaBbGSgBjC+UAM4RSIIZwCMYRTIIZwCsSGBzGEUyCGTlIghnAKxBBOgRjCKRBDOAVizYMYwkkQW44+SGPUxJdw7iDmFbEExP6KWAJiXhErgSLWAhDzilgCYiVQxLpEEPOKWAJigSJWCwaxYkGsORAH+UHMK2J/EOviQFykIoavTIEYwl4gXoAibgKICTClilh5K2LemtClglgJQLxsinjxIC5IEfuCWHmCWAtA7KuIzfKBuEhFXCSIi1TEPIgtGx+k0Vi+Ivb3iCXWhMQjNiyIJR4xr4ir4BGzINYsiDULYs2C2NsjDnwVMWtNaA7ExXjEAmvCcCDWAhCX7BFngBhEoReIMxRxBoiL9IgzQFygIm6iR0wgmA1iJVDEyhvEEmtCAmJ/a4JXxDyIJYpYeStiiTVRpkdsBCBeeo+4GEXsb03wIJ6HR7wAEMsUsQzEYDSX5xFb3j1I4678Yp2/NVFdEPOKuFxrwuRXxKWCeOHWxHqB2BQG4spbExkgro41gcvXCNjmA2KJIi5q1YRiQawEIOZXTUiKdeV6xN6KOFgqEBejiHVuEAcCEGtPEBflEfMgBlGYAjGEFw/ijFUTGSCG1osHMa+IA1TEBGFFKmKJNSFRxNVdRyxRxP6rJnhFrFgQl7mOWLEg5q0Jw4KY9YhVfhD7esSaA3ExHrFhQaxYEPMescSa0HNQxHOxJmQgLtIjLn/VhKXVgzSsskHMe8T+1oREES+bNcErYlWqIuZBXFsTpa6aUAtXxBX3iItUxBkghk68POIMEMusiRaAmGCpKh6xBMTlriPmQbxsy9eWq1jHKuLAE8QCa4JVxIv3iCWKWGJNFOkRA+cq+0KHDMTQ2gfElkAP0gCqCoiLsiZ4EEusiXJBXOryteVaR7xMqyYWr4jn4BHPBcQLUMQyEGd4xBnWRIZHLLImAnyzjqBmPi908MW6VVbE/h5xuYqYBbGkWMd7xGWC2FcR89ZEfkW8dsW6yoO4Oq84Z4AYhHIKxPhmHYHKfBSxKVURV9cj9gexvyIWLF8raNVEqYq4EI/Y25rwVcS8NSEB8TosXysSxLJincyaaAOICT6q8mZdUSCu36z7JSD2XzWhORBrFsSaBbFmQaw5EGsWxKw1YTgQ86sm8itizYJYsyBmPWLNgZhfNSEBsWZBXJVVE9C63n0tBjEW6wgoVh3EEkWsClLEPIiLsiaqumqCB7GgWOeriHWJijg/iItSxBW3JjJAnKGIA5EizgDxXBRxhjUhU8S4fI0gYT2Ldf7WBF+sk1gTFVDElV2+VgiIBdbEwot1Swhi6KSyHnHG8rUMEEO4iGIdgpjc/DWIXdsVB3HgC2LemqgoiHV+RcxaEwIQ89ZEfhBrAYi1N4j5TX+WtVgHrRdfrMtQxBBOgRg9YnKb1yB2bQsEscSaqBXxSihizYFYYE0UtWpCS0C8rK84y0AsW0c8DxA3EcTkhq49Yte29FUTkleclQDEAo+41GIdD2L+FWd21YRiQayLUMSaA7ESKOL8IOYVsfIGsaRYB35o/aeSXCcFF+tw0x9y60pfcVYFKWLFglgVpIhVBUDMK2IexP6KWHEgXoVNfwop1q2AR8yDWOQRF6mIZcW6uXjEGSDOsCYKBHET1xGTm3QZrYnVUMRFgZhXxIYDsfYGsbciFoCYV8TlWRNaoIh9QcwrYl0QiIFFlfWIV0sRN/EvdNDbcS3/VFK5HrG/NVGQR+wPYlYRFwRiXR6IWWuCB7HAIzZLpoirA2IIF7ExfIYilnnEIhAjh8mNZ+Ibb+5/oEOxHFYshyXOhGI5rFgOK5bDvDOhWA4rlsOK5bBiOaxYDiuWw4rlMG8RK4EgZp0JnsMBy+GA5XDAcZh3JgzLYf4vJQUch/k3nAOOwwHH4YDlcMBxOOA4zDsTAcvhgOMw+7dDA5bD/B9xDlgOa5bD/It1/KIJmUUM4RX526Hlc1ijRUzvsRrEs7brCGLeIuZBLKjV8W84axbEmgWxzg9iw4HY98U6w4GY32qCdyZYELOCmK/V8SCWOBOaBfE8anULAHHG+xwQzrcvPLTOt2gCwvk2XzM8iDUviPHFOnI3SUHMW8T+IOadiRrEhYKYX73GL5owZYJYoIjZRRMsiH0XTUhAzL5Yxypi/g1nfvWaP4jNcoJYVqvLAHF1FDGuXiP3Ta2IXdt1BDGviI1AEZtiQGzyg5i1JgQgNhyIWWvCWxEXZE3wIOatiSUFsUwRQzifIoZweYoYdyOmd0jN4VnbdeQwL4gLsogDlsO1RSwQxDyHjYDDS2oRZ3B4SS1ig4KY3Aw1iF3bdQQxL4h5Z8LbIuZrdcVYxDq/IPZ1JlR+EGsOxLxFXJQzoVYKxBmCWAbiDEGcAeIMQQzKN58gxkUTdNrXIJ61rUFsP9mKmLeIBc5EmYsmWGeCV8Sr6kwELIjXwpmofK1OAYjJBK9B7NrWILYfqSJW+UGsBIpYYBGztbqFK+L8q4iLWjTBWxNroYgzLOKMvddkIM6wJkSKuAscplO55vCsbc1h+5mLRcxz2Nsi5t9vZp2JEi1is3BBzK8i5p2J1bKIZe83ZwjiDItYxmElEsToTJBZW4PYta1BbD/SNRMCEHuvmeBfq6vmKmJ28RoriCUglghixYJ4LZwJGYgzLGIIF2ARY6mOzM+aw65tzWH7kTrEBS0iFhgTvoKY5XBFHWIj4DBvTKzF2xwyY0JWqoPWPhzGlznIVFx1DmtvDut14zCvhxdvTCx67RrPYd6YyP8yR12pw/ASryEOJBzW+Mc5yKxbdRDXgngdBTFbqROAWGBM8IuI8xsT/Ft1/sbESr1VN5clE3Op1MmMCVhJkdqKGDhM5lfNYde25rD9FFipK2jpWn5jgjeIfZeulSmIeWOCr9Txgni1KnVz4bBMEGcYE6Kla7jdD51KNYdnbYUc1qvA4VJfqvPm8KJXTGiBHvY1iCUv1a3BiomMfddkKyaq81IdGhNk1tQgdm1rQWw/Fdnux9eYELzL4btiQgBib2NCUqmrjQk/Y6LIl+rwXQ4yP2oQu7Y1iO2nIs6E73Y/Cy/VFbNkQqKI12GbCRmI57J0TeZM8A4x/okkMhNqDru2NYftp/SXm40vh9l36gQO8TJx2F8QrwWH57JkYi4c5gUxGhN00GsOz9rWHLafAldMSHb7KXHp2nptMrEWS4gXoIczlq7xetjg/pdkfGsQu7brCGLNgphfQ8yDWFCq4x1igTFRzVJdMYJYC0AsKdUtqUMMaC1i/0v4ynwOMbT22hAed5kgI1mD2LVdRxDziljycnNBpTrB/peL3u2HV8T5d/vhS3X8mgl/Z2KdFXFlSnUt3GWCjFkNYtd2HUHMK2Lvbde0AMSKBbHiQMzvMqFKAzGviAUg1hyI+W3XeEWsBCBWLIjVcoI4Y/FakYoYwkUoYny9mYxODWLXdh1BXKoiLqhW57vdzzK9zSHxiHkQL6k1UZ23OebxVp1Gj5iMQw1i17YGsf2Uvu/a0i+aEOy7Vi+acJ0sw6KJAl+rayKI6RXPJrFmSaxZEmsBiTVLYsOSWLMk1iyJNUtifscfw5JYsyQ2AhJrlsSGJbFhSawFJNYCEmuOxIolscSbYCWxYkmsWBILTGKVn8SsNyGQxIojsRKQ2NebUCyJ/b2JeZjE8IxfIokhnCIxhFMkhnCKxBBeuDexiTtN0EtbJIm1QBPXJJ6R2NQkLpfE+d+sk5A4vyaWkFh7k1jkEgNyF6+JV4vErVgTk2tYFU2sWRJL3AmexLw7oQUk1t4k1iyJdVU1sWJJrFgSK18S8+6Eyk9ixZFYcSRW+Uks0MQqvyZWq6GJaxJ7kriJu/7Qi2XiO7qCJK6CJl47EpeqiRVLYtYnFpBYsHJCcSRmV04U406oUjWxiMS1Ji6IxLiWmF6V8jUx705ISCzRxDyJa00s1sSlkthXEwtIzGpiAYl5Tcy6E94+cckkrjVxMSRu4b4/NP1VdyfKJbFaXRJX1Z1gF7EJ3AlfTSxwJypQsVM1iStAYtxxguYpJbGqNfGqk5h3J3gSF1Sx89XELImLcSfKJHGtiVeCxDpeO0ESqtcTu7bruJ5YsyT23gxTsyT23gyT33OivM0wNUviYvackGwPz5NYsyRe0vXE4Fh7bQ+fQWJonY/E0NqLxLgbJj3zmsSubU1i+5FuwyYgsRaQmN2GrZq7/wSFkJjXxP6v2K0WiSFcoiaeB4mD2Cemp1iTeNZ2HUkscScEG2Ly7oSExAJ3QnMkZit2vi878+4Ev3aCJTG7/U+5JF7Sl51Xy50wsSam51KTeNZ2HUks+eN13prYe9uJYjRxfhKX6U5olsSSt53XWBPPxZ2AcBF/vC72icmX1iR2bdeRxLwm5knMr2Jj/1iHRBPzJNaemrgQd4LXxMWQuHYnEiReLU0cxO/Y0d5rEs/ariOJeZ/Y253wr9ixJNYsidmKHetO8CRm1xN7v+2cn8T85sS8JvZfO7Gk7kR1fOK5uBPxmx2km5rErm1NYvuRvmPHamL/ih3rTvAk9tXELIm9fWL2zQ7BNvG8JvZ3J5aUxBmaeElJvInbxNP2NYld25rE9iPdFdObxPx6YoEmZknMbk/sq4l5n7gYEtea2IPEMp9YRuJ5+MRN3CceDkS91ySeta1JbD9zebNj8SRm3QnBmx0Cd0KxJK7qmx2rRWIIL5EmfmVj40h4NuHpXB1u928Mhv3txvVbvb3e9XF/b78xvtUbN7YH243haNzo3xvsjxuDYWO81xsMB8ObjXH/3jj69+F5n+rt7Q16N/tPX+6P7+wNo3B4Bffv37422mk8vntneH18pzcejIZPuG5H/f2o32v9nZHtbNR4ebS3Hf1Dm0LjWKMb/UeY/anRcLwXdhOfmj3vU/BfjQu93V17Qs/3ru30H99/4vjGC+cunr70wpUtbZpq6+zVi2dOXj538uLWqbMnL289f2nr0uXTz15unGg8mF0fK1aazdnVefGeUu6y6WRYu7BJho0LB8lw4MKbyfCmCzeT4aYLt5Lhlgu3k+G2C3eS4Y4Ld2kYbuVIkTU3XRRYolM5AmZ1KkkAbbSqAHsBoOhUksBancoSaKuTaWq84Mk8NVxxnUxUwyXX3WQcrrlJDqiGi26S2Wq46iaZrYbLbpJjquG6m2S+Gi68SearuxBP5Qs/cSaVL1x9k8oXrr5J5Qs/dEEqX7j+QSpfuP5BlK97FmhAMCDBT0FwkwQfg2CTBI9AsEWCvwLBNgn+KgQ7JPhrEOzGwceOPubuHUVaPg43lCbBJyBIM/o0BGlGvw5BmtGTEKQZHYMgzegpCNKMnoZglJH7NYPJHO3pC0GYyU1FgjCNm5oEYQ43DQkiNQIShNnb3CRBmLrNJgnCvI3+WggEYdI22yQIM7ZJx+g4BMkYHf0NIBYdo9+EIB2jExCkY/RbEKRj9NsQpGP0OxC0GXWSDwetMKHN1KNBK8wHCAUPBq0wnc1m8rGgZUvdJvlQ0A6TaaYeCdphLpvd5ANB2/qnneTjQNuW2bvJh4F2mAjkAY8CbVsZaiUfBNo2j9QL3m3rpm4mHwLaduFEM/kI0A7z2GwnHwA6YR6braT874R5tF2+vwuxMI9Nd37wQNCxebgYPA50rDPrvgMeBjphHk0Xg0eBjs3DXRd4EOiEebRcHi9ALMyj5dr9HsTCPIBV8LjQtePhzhkeFrp0bv0BBOncevFFiNLJ9YcQpJPrixCkANiCIAXAH0EwtlYA4137mOKyAYR37b3iRgB/PJXV4u6SbWPw488oWtl0XEP80VRWn6dWsmhls3Ez9hYGw2zcTBxgzCaTWlCoVZiM+5qXMGbHZhbbwZiV+6k1LNoqCjeusZwIk3FXYoQxm0zq9RpthUTLffUfY9CW/lwyqC2siHDTYh9jrY8tadGReEh5Rjp6gnSX4i4Gw2xarsuXUfCE2bTc9bmHQTs27mLcx6B9zku9lK4NnWoPMErn2p9glE62VzBKZ9ufYpT+3rx4r42zIdqis+VO49FX/h3jdqhcIhdHwz7oNjv1Wq6fRw/hQUdHywHd7Umb2xzhGj16+I/Y3M7BVgvi/4pxO3Iwno8e/hPG7YMm3OmPHr6NcfsE3Op+7Gvt03JbQfOfYnObbNslO417t7kC0x49/G+Uo9F95pKdYq7RLhptN2WnP8CwzbXtcp3+AsM21bZLdRr3bTNtt9NnHu0o0sZEv4XNbaLtLsS/jXGbaQczfQvjYaZxN9/FsM20A6P98PsQt3qihb2/gWGbaQcvzDcwblPtBOmTj7Yi6bgL8+i1uHebaweuDA6e1Ra6g5PgA4zbXDtuEky/g+EoVZfT9F8wHFHTnfv0fzFsM+3Coyr2bWWG7mq4D3r4yBD9ZYyuS/Wjv8SwzbTrpsBHOBxWbuguTIFXMWwT7bpED3BmWMmhuy7Rw9cwbPPsujwP8B6wwgPmy8EPMRoRyGV/8G8YjtJ02R+AZaCtADEKssfbzmoQo1z2Bz/CsCWrcrkfIAKsEjEKmdHDn5p29GPhsj/4CYYtjxQM8/9gOEwTptwB3opWlhgFab6LYSsYlbsmH+HYW3FiFIz9VyDcidKE7H+GYZsm/AAc/CeGbZpA3IP3MWzThB/Eg59j2CYJP1YH/4Vhm6R2uR/+OYYtdTXk/j0MRz8mkCVeEqtbDPyCHyIqrHQxoAA+wpvWqhcDvz6HOMMjAQO/2dMPMWyzhB+wKd6yVsM0wXHHCWtFTAf+OhVe1kjFwI/8YRy2AwlWEc7iSMjA7/Ih8s2KGWPgOv0Fhm2Kxl2nCdxmxioaAzrn8G8wbDWz6wMNOxOpGpA1h9/CsB1HUPaTv8awHUcDV+9NDIc5ws8emn4mUjcB5Pi3GLY5Bq71YRy2OYL2P/w6hm2OIH2nfwbhyDkBJT7F1K3UacJZv4HRSOzAdfoGhq3cgd8S/EKrd5ouQ7QkTeSawBPC5B8wHKUIdMWrF8keeBaZ/gTDVsWlbU1jlQ/8vE7hljaR9IHJ9BZG7TSFB5rJdzFsE4Rnrun3MWwHER5hJt/DsJ2ncOn+HqOWqzA93sZomCD8DE/ijm1+mzBWOChW/oAgmPwAo2F+8LN3CL8dJrJH4DHnEAfQSh8QCZMfYjTKD+Y/TrBI+MDJvYNRm56LHn4bo2F68JM/+RFG7V0Id8p3MGqf8tIWsbF6x2mMoxMcUyt34Of18O8gGpkk8HB7+DqG7fDBM+D0NQxH6cEs+isMR/LVfeF7GA3TA700+RlGw/RgQKbx99npCW3fx2g0enCX/BzD9gaEh+opXriZZQJz6z8gbEUO3MTogEfGcBPyexejNj+49h9iNEoPuvgFhqlzMv1nDFN9/lF4dq9sZBnKFy6dfvZ840TjymB4c6f/zP1x37rSV/rjC6Pt/s7j1rDe74+3hr3b/RNHXx4Mt0cv7x+zfRydlUHln53e8Oad3s2wu7N3hjd7e4Pe8BP3ZU9vazzaGu1t9/e2bvd2T+TxzX3PfOu2vTYn4t7Pn7x4ZnYlP2nX4/u7g+u9na3d0f5gPLjb39qzpYYT6qnuZjsIHz8+Ybcv9fu7W73964PB1k5/bOsOJ57fu9P/pN31dnZv9a71xyeOnnzm1OlnP3Pm7LnPfu78hYuXnrt85fmrn/9C79r17f6Nm7cGX3pp5/ZwtLu3P75z98uTVydfnXxt8sbkm5M3J29N3p68M/nx5L3J+5MPJh9Ovz59ffrTcPY/sbFx7sqlrU6n2d0ydcEjSqYueNQFD4jXBY9ZsC541AUPG1ubgof7jrrgURc8GnXB48iyFzzALXnxXgc11KziofAAiqhZzQM94w6qqFnRw+CBAA8YUiUJD2zigSAuk9gDTTywSQol4YEWHmiSSkl4oI0HWqRUEh7o4IE2qZWEB7p4oBMXS+yBHh7oknJJeADF7KwAEmeON+SsBBJnjjflrAgSZ4535qwMEmeO4zErhGDmXRyPWSkEM+/ieMxqIZh5F8cjKoa0MfMujke0Y3gbM+/ieMzqIZh5F8cj+rsZHcy8i+ORKImEB3A8aE3EHsDxSFRFwgM4HomySHgAxyNRGAkP4HgkKiPhARyPRG0kPIDjkaiOhAfiJwxaHwkPxI8YuSokpIox/woJGuKJCklcgIsqJNCHqEIS1/zyVEji2l6iQhIX8fJVSOJa4C+pkMDszKiQxJWG+VdI4pJCokISV94SFZK4NpanQhJX+/JUSOKqXqJCEpfv8lRIpvOvkEA0T4UE+FNXSNa9QgI/teVVSABQeSokEM1VIYH8khUS4EeuCglsk+1RIYGOkxUSqG8kKyTQb54KCcyAZIUESiGlVUhgYqx3hYT1n0X1kbCHY7aHY+YTVjTmVxv5eGXk/7fX/c557lWRQmoic62IFFsP+T9QSwMEFAAAAAgAm5aKUdq2vjIWKAAAYAACABsAAABjaGFyZGV0L2xhbmdydXNzaWFubW9kZWwucHntXWubHEd5/a5fMaAksgnC2z07MztKlESWDSjoQiQcQuJks5LG8obVrrI7sqUoyrM2AuQLGMxKgCHmfjUXczVX8zziefJ5hp+gX5Kut/u89VZXF55ique2tV/Ap1s9/fblzJlz6q06+LaHru5sP3R+ffOh3uZTjSvX+09ubR442Dj8jsONC1sX1zcvHWlc7T9xeEUhBw48sb11uXHhybXti73+u3bOq/+30+tf2d4639turF++srXdb5zL/tFG7+Hr/d7xbPO5Xv/U1sXexoED2VGbRxrv39pZ768/1cv+Kz3SOLn+4d7G9ez/J0caj21u4L+WjjRO9y6t0X4Hzj527tyJY6dXTx47/Z7VU2ceefRk42jjxoFG9tfsHGncaDQONg4NPnWIEKBL77Tg5eUjjaSAPy32bmr4ZbF3W8OfEXCi4T0Br2j4joZb4iB3BSwO8llxkFTDn9Nwe0nDnxfnLY79ijhIV8NfEHuLE/yigLMzSQv4fwUsLtWrAm5p+EviIwX8ZbG3KOcrYm9RzlfFNRF7f03A4u58XcDiI78hYFHlNwUsPvJbAu5o+NvieouP/I6AU/1UvSbgRMPfE1WKZ/D74iPF3fmB2Ft85A/FFdTo6xpNxT37kYaTJQ3/WMBdDf9EwE0N/1QcW5/1zwQqHoefC1hc1jdEMfoYvxA7i2J+Kc5DFPMrDWf3sVmgvxY7p3rn34iLqtHfip31abwpULHz7zSsL9JwV6MdjT4j7rhGnxUHXtbwR8QtFEe+Ja6GOMhHBbzCJz38mID1uzH8uIB1LcPbAu7qgzwnrpK+L8PnxXmLj3xBwPr5Hb4oytG3fPgJ8ZFi70+Kg7Q1/FIO33wn/Y/i4hs2FYsXskTcuJVjETcOMhpxY+8ScQMejbixd4m4AY9F3IBHI2585GjEjb1LxA14NOLG3iXiBlwibsAl4gZcIm7AJeIGXCJunOBYxA14JOIGyZSIG8coETfgEnEDLhE3PtEkbhBmibhxjBJxAzaJG2ddIm7sXCJuwCZx4xgl4sbOJnEDNYkbpZSIGzuPQtzgHZO4gY5G3Ni7RNyARyNuwCXiBjwWceO8S8QNhi4RN/YuETf2LhE3YJO4FenesDi3qb8pxyNu7D2W4q6TuIMobj/inoLirpO4HYrbj7gBT464sXOJuAGXiBvwSIrbj7hxjHGIG6c3EnH7KG4Hcfso7mYAxe0gblBaibgBl4gbxy4RN/Yejbixd4m4UeRYxO1Q3NXErdj1hkWuf0RxO6wSPFHzRtxTUNx+xL1gijuIVeIgbsDjKG4HcTsUdzVxA51RxY0STeIGGhV3QKvEQdwOq8ShuB1WScLELVg0mFXiIG6HVYInbTSPewqKGweZoFXiUNx1Erefxx3EKqlRcYN7RiNuh8ftIG7AIxE3TmQkjzsSN99Cb8U9BeLGmUzOKlF8ecOiS3/FHcPJcRU3DlIibsCjWSV4o0Yj7nkNJ72IGzuPRdxe4aSDuEOEkzh0eKukmrhxGiXixs4mcYNhRrFKHMQNuETcOHIdxO2wSkCudYSTgMdR3C1tlQhe9FfcU7BK/IjbzyoBPEHFDThaJUWV9VolDo8bxxjN464OJ/2Iuz6rBOhIihs7m8SN0xhJcVcT9362SvyIG8WPRtzaKhEEWPeokn3tcftZJQtG3HVaJdXE7bBKHMTtZ5XMtseNEkci7upwctLEjUPMG3E7rBI/4gY8mlWSMnELppuSVeLncc+OVVJnOBnEKsHedVglDuKu0yrBsWd0HLcfcVePKsFZT3lUCQ48klUSYBy3g7gdVonfOG4/qwTwrFolitNu2JTmbsCp0yrB3mMpbsDTDyex91hWiSOcnILHPadWiZ/H7bBKHIobsEncuH7jKG6gNVglgINbJWCYMRQ34HlT3EGI26G4q4m7qT1uwV11j+MGPLMedxDixhWct3Hci0XcfqNKUHsNo0ombpV4NeBUh5MBRpWE6Jx0EHeQcLJOqwTwWKNKqolbsdQNm6S8iduhuB1WiR9xO6wSh+L2I+4gVgmOPZZVEkRx1+lx+1klDuIO4nF7WSVBOicd4aQXcU88nHR43D7EPWnFva+J2xFOVnvcTT0cULJRKI+7TsU9O8Rdp8cdhLj9PG4HcQdR3A7idihu7D25cdw1EreX4sZZTzmc9FLc1eEk0IUeVRKkc9KhuB3ErUeVSNqpWXE7PO4gVgnOeyzixt4z24BTJ3EHCSeDKO6ZIW4vqyTEXCUhiDuAxx2AuL0UNwhwQRQ3GHqszkkHcetJpiS/1Dw7IMh1ZhtwcILTb8CZHcXtIG7As9qAA3S0USUOj3suZwf06pwERU93dkCQ1FijSrD3aHOVOGYHxEFmNpxsMXELIqm7AWd2rBLAE2x5nwJxB/G467RK/DxuL+Kuc3bA+qySeQwnIZdHsUqAjmaVOIg7iFWCY09fcTuIGwcphZOauCVjuK2SIIrbYZUEmaskiFUSxON2jCqZglXiIO4gVolDcddplQCuwSpxKO4QxO1Q3PUR9xxaJfPqcTumdXUobj+rpJq4m7oBR1DDbM1VEsNJm7jxYkfiLvYONK2rowEHe48zrauXVeJH3F5WiU8DjmNUiY9VUq24oc7HUtwOj9thlQAei7hxkOlPMqUbcAQHTGl2wAUj7plX3H5WiYO4pxBOhlDcfsQ98XDSj7hRzBjDAQMobh/innnF7edxT35USUsrbvGyz5bi9rNKAC9Iy7sfcaP4sRT3zIeTDuLG3jW0vHspbuxcIm7sPM5CCjj0pGYHdChu7Bw8nAQv1qG4HeGkw+P2I26/cDJEA05Lr4Aj3uq6F1KYHcUdJJwEHCeZKq73LHVOxnByUi3v1cRd7XGDpGZWcft53A7i9lPcjnDSQdw6nBSv75SsEsAzS9xBFLeDuAGPRdx+ijsS9yQXUpgV4sZjOVXidlglYLrFJm5HOOlH3LpzUryn+2c4oMMqwd4TVNxBiHvmFbfD466RuB1WiYO4sfciEDfQMRQ30Em1vM8rcTvCSexdx0IKOpwUL2Qkbi/idihu7D3WXCUO4p5COFmn4naEk5NX3IAXgbgDhJM4RPDhgH6jSmaeuP0Ut4O4/RR3h4lbvHn7nrj9PO7ZsUrmlbhrVNx+xD0rihvnUcN83NVWiVc4WT0c0Ie4Z2d2QEc4GYS4HYo7hFXS1uGkeMX2D3EDrsMqcSjuOokb8LwRd42K288qCaG4HaNKaiTuasUNdFKKGwyzD60SP+IOobjbejigeJf8F1LwGw5YJ3EDnv5wQAdxz/xwQMCjEbdjOODMKG6gkyNuoAuwkALQuJBCY9aIW88OKF6aYJNMORS33zjuOhW3n8c9hVElDuL2U9w4SB2KewrE7RjHDTgSdyMS96IT97L2uMXbEUxx+xE39o6Ku9i7ZsUdhLgBz6ridlglgGtowHEQN44xDnHjAyfV8u4gbp8GHLgfI4WTDqvErwHHj7in4HGHIO6WXgFHvAZ1N+BMgbgdihvwBEeVOBS3XwPOFIgbHzn9xYK9iNuhuB3E7VDcDuIGPDHidijuAOFkAOKuDieriTuI4g5C3POquHU4KZ/3Ofa4Z344YBCrpE6Pe+aJO4RV4iBux6iSEMTtsEpwjHHm464mbsdwwEjcBnE7FDfgWSVuzdviwa57kXcHbwcR3FMYVFInbzsEN+DolBR7+44GxOxJJd4GXOJtwCXeBjzSHFOAS7wNeKQFcACXeBuwydtAS7wNeJR1FByjAbHzKNNxAx3JKXEsgAMPpsTb2LvE24BLvA24xNuAS7wNeIJTleAjS7wN2OTtVGeT4hGeZ+L2c0qCCG7AkbiL6z1LxO2YHLDGOaYcxO2YY6pacPutXFZtcTuIu9ririZux+SA1YLbh7gdw7j9Vi7zWwAH8GgL4DiIG3uPNjmg3zoK2Hsk4k5046R4VvcPcQdR3JG4F524HSuXeSluh8XtpbgdxO2luAMQ96QVtyObdBA34NEmB3Qobuw9FnEDHmsdBQdx62xSPJSRuCNxLzhxBxlU4kXcOL0FUNw4jVGI22tWVz/idljcDsXtN6srRP5YU5UAHou48ZEl4tYet3j6InFH4l5w4nYobofH7VDcIayS6um4Z1txV3e8z4ridnjcDuJ2WCWObLJOxe1llei+SfGYRd6OvL0ovD2f2aRjiqlJZ5OTdkocM5UsWDYZhLeXmbjFAxWJOxL3ohC3n+B2DAYMYXFPPJv0GsXtNajEp/2m2ikBd40luMGLYzklOMj013h3OCWAS8Sts0nx5ETijsS94MQ9ecU9K05JAMWN05iUxQ26rIO4/SzuOgeVeGWTWnCLR2RKUwPOK2/HUdyRt/nYCzWKOzolMzuKW0eT4mGIgjsK7kUhbr+JSkI4JX6TcVcLbpxHDU6JTzQZwCnxIm7HRCUO4naMKXEMBnQQt180GYS4/QQ3TrA0pkS334i7Hok7EveiELffYECH4vbqd5+8U+I1GNDH4g7glMzMKG6/9huHU+Ig7joHA1Zb3Hq9SXF7I29H3l5w3vbrvnE4JV5jAR1OyeKMBayep6Sat/0cbofg9mubrFNwBxkL6OWUJHowoLiRkbgjcUfiBux2SrwEt6Ntch67b6qJ28cpqZO4/domg0ww5RdNOixur2iyxbwt7ljk7cjbkbcBz+uQkgBjAR28XZvDHYS3/aJJh+B2tLuDW6cvuJm3xb2JvB15e1F4ez6bb+KQEr6F3kNK/JLJOR1SkmjBLe5CJO5I3ItC3H7JJI4xzqJlDuLGziMtoTDbyaRPt3uN05SAF+fNKAkxhpunl5KXO/J25O0F522/WUpqFNwTN0oCCO7xDe4gRomf4A4yL6AfbzuMEofg9up257Um5YWdC96Gboi8XVyTyNu18XaNze7z2DNZm1FSJ28HGVESZHapEEZJm3lbXMK54O2otyNvT5m3vUYC1jigZDZGAvrw9uwMKPELJuvkbS+9nXCzu3GxInFH4l4Q4p7PZNIxLSDgRV2yzK9ncn8kk9U9k03tcIurEok7EveiEHeQZNLRM4m9p51MBljcHWjwoYBeyaTfkBLw4mhrBDt6JoMsoIATHK1n0m8It2NaQG2ViPIjcUfiXnDixs41NLv7zVISwirxIu4AVonPWpMhiDvIyjdBmt0dY7gdirvGlW9S7naXdUbijsS94MQdZMkyr6bJGom7eiwgjhxeceM0Rul2B++MMxE3jjHWfK7Yuw7F7fC4HcSNg4xF3NztLguKxB2Je38St2NeQBx6HKvEEU6GsEq8BgMGWEGhmrirrRLQUQ3TSzkUt59VEmR6KYfidoSTDuIGPBpxc/eNPPNI3JG49ydx+yluL+J2KO76iHvSo0p8iDvIqJIgVkkQxe1H3EGsEh1OilOMxB2Je8GJGztPTnHXSNyATeIGOpLiBhebxI19x1Dc4B2TuIGO5nFj77HCScB1rFnmIG5H22QIxd3SwwHFuUTijsS9KMQNdDTiBjwOcfuFk9XEDbQG4gZsEjdQk7iBjkTcYJgxiBvwghA34LE8bscSCjqcFB8aiTsS94ITt9847hANOF6Nk45x3Dj0pMZxOxT3pMdxO4i7znHcfg3vQYjbobgdxK073uXRI3FH4l5s4g4yFXeIzkmvBhyH4q4mbofiDtCAU+1xB1hDwaG4/TzuKcxU4kfcIaZ0Vce5YR0mEnc1cePdq2OZYBykRNyAxyJuHCQSN/35jypxhJPVxI2dxxkO6LBKHJ2T1cMBvcZxV3vcDqvEJ5ysHscdpHPSb1SJwyqpM5z0I26/BhytuMX+kbij4l4U4vZreQ+xTLCDuL2sEscywYAnRdwOq6S2uQEdijvIapN+c5XU2fLuIG7HXCXVxJ3ozsmXInHnB4nEvUjE7WeV1Dg54DzOVRJAcYfwuB3E7edxzw5xAx6NuG2P++aBAwezc89O/rHNi70n1jd7FxsXnlzbXrvQ723vNPpPrvUbF9cvNja3+o3etfWdfmN9s9HfXlvfXN+81Oj3rvXp32flHF/b3l5fu9R76Gyvf3V7k+DsMdu5fvn81kbjgStXNy/0r67117c2HywOu9XboeOe721sqYNtNZ7e2r5I/1C93o3DjS79R/bwHN/a7G9nh9Gnps77OP6rcWrtyhV1Qh9YO7/Re2DnwSMHTjx8aqXdXj372LlzJ46dXj3+3mNnVz9wZvXM2UcePds42riRXxeldlqt/Ko8fm1pqbhciQknBZyacFrATRNuFvCyCS8XcMuEWwXcNuF2AXdMuFPAKya8UsBdCfdRDBW5XKCbQEs1ngdeKvIC8KY8yjbQUpE94KUqnwBulpnwBTfrTHDFE7PQBJc86Zo4rnlq3tAEFz01q01w1VOz2gSXPTXvaYLrnpr1JrjwqVlv0gVeqncNeKleXP20VC+uflqq9yIevVK9uP7NUr24/k2qtyCkBsCmAN8GcFmAbwfYEuBBgG0B/hnAjgD/HOCKAP8CYFeDbz/09uLdWRJ7PoAXKhHggwBlRe8AKCv6S4CyoncClBUdBigrehdAWdFDAKmiglbxMC93BYgnubUkQDzGrUSAeIZbqQCZNZoCxNNLUxUCxKPbagkQz22rLUA8tK2OAPHEtuQ9OgJQ3KNDfwXGkvforwHKe3QUoLxHfwNQ3qO/BSjv0d8BVGbWcnGexwCq3yHLxZ4PA1Rm03JBUscBKn97uXgXHgGopMByOwcfBdmqX0LLnRx8N0D1o3N5JQffA1D9qF7u5uB7Aaqfw63iG/kEQCVFWoXq+HuAqiJc+fcBzCrqFOd+EpgqCNfjFMCsoE5Rz2lgqh7Q8xl8S6h6wALvB6jqaRWV/wNAVU+rqPwsQKqnqPwcQKqnqPwDAFU97aLyxwCqO9QuKv9HgKqgdlH5BwGqO9QuqvwngKqidlHRh/AFpypqFxX9M0D5zP0LQPnMPf44UPnQ/StA+dD9G0BJDKsAJTH8O8CspE5RJvi9qyrqFGWC3LtZRe3iwvPX6pKqqFMc8iKjWUkok79Tl9RNwhPC36hLWUmd4qiXGFR3Cc/Ik4xmNeGKrjOobhMO8B+MqvvUKR6IDzOqnrwC3GAwKwulXmZ1QWUVz47WHKqs4tnZYjArq10c9AqD6tnrFLv+J6NZWTgoSxClNXABdxhUVa0UTyQrIepkXynu1VVGVVXFRz3FoHr8VoqynmZxpMpaKT7sGqPqlVopLux1RtXtWinuwX8xKp/AG4zKR/C/GZXP4E1G5UP4P4zKr6fHr3X4+aBFPIvLyw5MogQFiJINmETJiSZ+vr3MaFYeqJLtl0RJiWW4cXuMZuWBLNl8SZSYAOWw95IoNQFmZOslUXICZM/OS6L0RLtsvCRKUDRx3FcYVbUV95Ntl0RJiibO7IuMqp+85ZgzUaKiiavzKqPqZ3pxP9lySZSswLcLOy6J0hVNVPEVRlVtZb8lUcoCXwZstyRKWuB+stuSKG0BRmezJVHiAkTNXkui1EWrbLUkSl6A6dlpSZS+AAOz0ZIogdHBEb7LqKIRnO9rjGa1ge3ZfEmUxsA3KnsviRIZ+A5h6yVRKgPf6Oy8JG1hbLzOoKL8ctKZKJ2R4HR/zKiiEnzYTxhVDFk2XZK2cCR+xqB64fA0/JxR9cLhw95gNKsMu/6CQSWfymMKE1Ib5YmqEiU3cCd/zaAqrOySJ0pv4FH4LYPCqn+TQdIbBfo7RhVHdoud799lFiDR0U2BMw8o3ZF0m8CZCUh7dIuq7+/Bh0lIfnRbwPkZJgXSLV7b+3f47SAR0u0A5/eDdEh3BTjzB0mRbhc4s41SI+nSEnB+o5QgSZdQ7x2ud4XuJOq9w0ykZEm6hHrvMDsoZZIuod47zCVKnKRLqPcOMw/pkyXUu8ccTBJlCfXuMYeSSFlCvXv8cJJOWUK9e/yOkVTBc39/T5+PqhdP2P29XcZVvXic7u/x86RES5pwvcx7SrekCdcL5kuVdEkTrvcVxunl5Pu7x7iqN+H7+x3GVb0J399vMq7qTfj+fplxVW/K9/dTjKt6U76/32Nc1Zvy/f0W46relOv9NuOq3pTrxXObkpGScr3fYFzVm3K9n2dc1ZtyvZ9jXNWbcr0vM67qTbnezzCu6m1yva8xruptcr3fZVzV2+T7qz9X1Yuv9/t7LzJO9IR678K9TMlMwRfe/bu3GFf14mv3/l0+DpkpkBr37/J9IcmDr977d3cZz+otqh1qUKm5AnyGQfXdUoDPMkg/9gr0I4wqSYCj6lNWJeII8HhTck+K82KLNyXvpOzwprlzUqB8icg6wac9x6iSOziz5xlVJIxPe4FRkt8FypdSyZ1m2dtNyT/Bvp9klH4oFSiSt5QcFFyIAV9JpXfaOIlPM6qKY2HCV41sFGi8Ib/HZKSwROMrRFYKvr+Hn2WYvj3xnchnTXYKdNPwVYZViRCb915nWN0/6Ij7t/kVI1cFevPeGwyrWwgJeP82M1NureBNunWXcRLlRaH3+IU3/JX7d5mAWqbbt7Z0SPnoJcf51JlHHj3ZONo4t755aaP38PV+T9nV53r9U1sXexsPKCd7p9df3Vy73Dt6KP+3h/IgdfS/jbXNS1fXLmUHOHt1Z2d9bdP7COo0Vvtbq1vbF3vbq5fXrhz9Y8b5n3p+q5dVzUdxzJPHTr8nvz6+B+xfv7J+YW1j9crWznp//ane6rZKFI4uvavbabezr3bPw32417uyurZzYX19daPXV7HC0Xevbez0fI+ztnHlybXzvf7R7E0bfGrw6cHLg88M9gZ3BncHnx18bvD5wSuDLwy+OPjfwauDLw2+PPjK4KuDrw2+PvjG4JuDbw2+PfjO4LuD1wbfG3x/8IPBDwevD340+PHgJ4OfDn42+PngjcEvBr8c/Grw68FvBr8dvDn43XB3+Mzw2eFHhreGHx1+bPjx4e3hc8Pnhy8MXxx+YvjJ4UvZW/3ggQMfPHH6kTMfPLea/YZMYgjSiCFII4YgMQSJIUgMQQ7GECSGIDEEITCGIPsoBGGrc8AOJS3dCqdzAA+BYhBtdO7qYCERRufQSEK0z7nLvlmzKX3OXfblm8vS59zlzIAMAvY5d9kXJYuAfc5n2fcjecE+5y6b46Qw4HMOnmOYbEv8mt1lH5pkBmzOwfMMk2uJ3+0vMkymJbzkFxgmzxJRzEsMk2UJy4KdZBIc7HDucspDmoMdzl3OeUh2sMO5q9MbcizhgO3q/IYcSy6VnWTSH+xw7vIdJAnCDucuO7GkQgqH8/TWZg8wGZa4sbf04cmwRLV89iRG2N/cZauf9Aj8zSE/ZaRIYG8OuVbSJHA3h2wukyphu4pTKdIlKb8Ja/wbg7RJWrZjKDphb5PtGMpO2Noc3GaYnMqiUPZL8vQEhtof2Oem/AQu2T1+DShAgcl1j/OpNrmUeHqfYZhMyqLOe5xQdcjmwsN7i2GyKIsq73FG1SGHsqjyHr9IHTIo23yx+BtI6RZ2NO9xUNUhQxYpzccZJj8WdfLr2CGnC3VyWNUhpwt1foxhcrpwP3XWQUZXUecfdHRBRhfq5MRqhfw81MmR1Qr5eTDXOLNSasbyBPMUhS23W/pMyM/D7vyqUIgCMXiPkyvKUCAHh/yiU4TC2S8M2TxBgSQccqBjaBt2Fik/sZNtpW7sZFvJGzvZVvrGTraVwLGTbaVw7GRbaRw72VYix0q2KS+xkm1KS6xkm7ISK9mmpMRKtiknsZJtSkmsZJsyEivZpoTESrYpH7GSbUpHrGSbshEr2aZkxEq2KRexkm1KRaxkmzIRK9mmRMRKtikPsZJtSkOsZJuyECvZpiTESrYpB7GSbUpBrGSbMhAr2aYExEq2UzmSn51ukjvlZJsCECvZzhOQcrJNCYiVbKeiZ5+T7TwAKSfbeQBSTrYpACkn23n+UU62Kf+wkm3KP8rJdh5/lJNtij/KyXYq+9TfZLBbkWxT+GElS0rQWMmSkjNWsqTEjJ0sKS1jJ0skZaxkiYSMlSyRjLGSpdw+KVBOlkjCWMkSDfSwkqVWUpUstdKqZElpFztZIuViJUutlpks3XT4yl5Rx9Prmxe3nt45rI7gHVfkf+PHHvmfHX68tW0+3hkHC0Lyv8BxSP4XKhTJ/2YvGlEBV6sVQ5FGDEUaMRSJoUgMRWIocjCGIjEUiaEIgTEU2Y+hiDbnzVCEsxIjFBHhh8xERISSVnmKeSKCn+vs7eaBCH5o6l6SlshJtLebxyE4tu4x6YiURFuKeRiCH7y694TCEMt9zbMQ/ERnpzHPQuBzsOGbZyH4Oa5TDMpCUCWb5nkWgip1tkFZCKrktCaPQlAlhwOkNZCQiLCGghBUqXteKAdBlRzW5DEIqtQJA6UgqJITnzwEQZUcDeQhCKrkICHPQFAl5xF5BoIqOR8i9VH2HSgBqWgPWanwPij/sFtUnE0jtl9MEsRuJal0kUmElG0dij3s7huSIXaDSafKW26LuZF020m3ynBWSsRyoSjvsJuFSItYnS9KjNimN0UdMJFEYkL3zbL1KergIfhm64gegm+2jugh+GbriB6Cb7aO6CH4ZuuI5bZR3GE3RSmRYrXiKJFid5dR1qFH9psdI3pkv9kxokf2mx0jemS/2TFiNQApyWL3tJFm4S6AUrcIdwGUukW4C6DULaK7AMxuEd0FYHaLcBdAqVuEuwDMbhG7fUkpmYrcglI6vo5mpwh3DJQ6RbhjoNQpgqe/3CmyzB0SZqcIXrdypwgeg3KnCH466HHgStxYzvVSVZch5SC2n00T61gJDeUgBcguN80FZMU2YkIb7X3TFPFWlkP6xnLEyUZZ5rtr9oQs8901e0LAEuWeEE4FzZ4QO0EioWO1JpDQAbOV+kEqUpJWVZdIuyqaUkrH7h1ZqcqrlMixfP9mZYhFCsdKA5TAsaMtMkzsQKWq/TXvB7EyHaVurKCSApGKLpGVqmCKpA03P+gmh9w5WYIO5JSbghE7PqBkxMrCcm1ToJwNKWlj5525g1IcVwcblSndcmXDi5I1dsbmjkbsnK9V2cxDPbBWfmh2gWjYuwtEuMveXSCt1sx0gbhM8tgFUv03e1HH+86cWFk9G6OORow6GjHqiFFHjDpi1HEwRh0x6ohRB4Ex6tiPUYcwt4ysQ/iPZgcI2yJm2iHMObMFRJtzZgvInp7OymgB0Sac2QKifU+zBWTP0QKizT+jBUSYdmYPCFsvZg+ItnXMJhBtA5ldIHoKELMNRE8BYvaBCL/YbATRfrHZCKL9YrMR5EU93ZbRCHJX40YjyG3dkmE0gtzWvRdGI8hzXK9sBMlwvi9mJ8hzekIu2Qki2y/MXpAXucfH6AXRvQNGL8g9ntLK6AXRA/mNXpDf6zmpZC+IdkHNVhDhbhu9IHp+GspE7Ewv7wVhb5dvVd4MYnm7RTcIe7scbFA7iJ79hpO6vB+EvV322vOGEPZ2+dXKO0LY2+VbnreE8FXgW573hPBV4Owsbwrhq8CvaN4TwvWyx583hXC9nJPlXSFcLydiFJVoL5sf2bwvhOvlJyRvDLH6YvLGEC5XT5pFnSFcro40qDXEmtyo6A3hcnWKQtY6l8vxltkewpMqme0helIlsz9EW/pmg4iexMjsENGTHpktItq6N3tEdH8QKSArYOw2K+JBUkBWEEgSyIr8upXhXlfPvK5jvG7VhESUk9hD9yknsQaTKx1kjbzPI5IC5ZH3SgfZI++VELLzi1ZVUqGEkJVJLOk1nHT6oGSQnTMsVU5GlFSNx0+qxuMnVePxk8rx+GS7WF57UumqJ5WzLOVKqEDZ+Ca7xbK4c7Ol2NeIQ2zbmowWy6Amm8WyopUUskf0KylU0UbSqgiw8yykHFVTFmI3zigdZMXPFIZYSTOlIXabTuVkoHkaYjXv0GSgVsOT0j52w5NSPnZwSJOBWiEbzY5lxWk0GaiVnCnFY4dkNBmoFVcptWMHUErr2FkTTQZqxUo0GaiVICmVY2dFFIRYqRAFIVb+s1yZ9CxXtitRj4gVxtBkoFbsonSNHbBUTgZKOUhFaNIyx1/ctFxnrwhE/dvDZ2ciAvlj5nmMQKr/Zi8COXXs+PEPnT1x8uSJ4zEHiTkI4TEHyfGYg+RgzEFiDhJzkJiDEBhzkJiDLHQOEhcDiYuBMDqHi4HoHE9PndZORI6n4xNaEAQxnpiQqilSvHt8kWlJEIR4YkKqlszw9GRiJDqQ4elJlkh2IMLTnUUkPJDg6amkKMVAgFea1orzOz3DGIUYyO90bxZlGIjvdCcXRRic3j2nIwZK4/DgcM8WJRjcoKR7NCiL47nXdbBB2SM6Rsx5rTi601EZ5Rcc3emojAIMeNZiwitK4nBHzZmt4LyLebAoh8NLyrEdhRdsUrP5TtkFu9R6CivK4PB8cpcXJRdsE5u9Hmzhc98W5RY8e5vu6qAMDm8Edy/lzR4whZm0SK/A3deNZSRY2PLWs2ZRAofn1mz04GBOZ5ykW5CJ/J+eC4vyNwQ3OvqkVUE4l7utIxDK3/DksvuYt3ogmtRpA6VvPCOf7tygGIO/qTgoLVo9UCub89TpAd4d6imwKHwD+bPBT30e+L4b6qmxKHordxDm64FwIsezA+brgXAix7MD5uuBcHfJru7roOiNa9VNHBS9IZLb1T0YFL3x7IN6/RAKOIpaf6+TCEremI+Mxg9O5PRCC3nnB4rVe1PMiMdXJzX04w6Pr27koJ93zEfsVqfyN6teZSKt6v6kqKOiGyTOghVnwZr1WbDYPqPpV29W28peQceptQvHr2+vb2ysX/jTZq8KNAmWnXu8pWM+1umGnQGrjgmwgs5/NXuByIlzZ1ZXVlrd1TgFliom5iExDwEe85AcjHlIzENiHhLzEAJjHhLzkIXOQ9hPfvzaCksuozEk28Cay+gMyTaw6DJaQ7INTd4ge0OyDcu8QTaHZBtavEF2h2Qb2rxBtodkGzq8QfaHZBtWeINsEMk2dHmD7BDJNqzxBtkikm1g7Wv0iGQb+C01mkSyDfyiGl0i2QZ+WY02kWwD3w+jT+Txa12+H0ajSLaB74fRKZJt4PthtIpkG/h+GL0i2Qa+H0azSLaB74fRLZJt4PthtItkG/h+GP0i2Qa+H0bDSLaB70epY6TL98PoGMk28P0wWkayDXw/jKaRbAPfD6NtJNugf5DIxpFsg/5FMtoyInqVDtk6ovMJcxkRDhyMZUS0PW8sI6JtbmMZERGsyGVEtGtvLiOiVy6Ry4ho195cRoTteWMZET1/mrGMiJ4obbRlRPRUaeYyIjwnmpI6dkarxI6d0Sq1Y2e0Su/YGa0SPHZGqxSPndHSjFpWRqs0j53RuqfUsjNaJXvsjFbpHjujVcLHzmiV8rEzWiV97Iy2WzUpEYUrdkbbrRrPTdGKndF2q8ZzU65iZ7RKANkZLS0bYmW0tGyINcJaiSB75DaJIGuMtlJB9rIWSgXZ48SVDLLHlCsZZI8Ip7YQqx9B6SB7vLzSQZahTxmKZeiTELKbNZIqQ18pIdvQJ+elANnQd3eGVPR1tCsM/XwF9QJlQz+pmvGMEhPL0E8rpwFTUsgy9EkJFSAb+hSVWIZ+XDAdWUndC6bLabOSt1wxfaj7NCjKQ5jNCaKxYrpYSJ2SPMS8nEMaK6YPjc4QvWK6nmVLrpjOWbG5Yjrn0OaC6Rw4mwum61jVWC9d56ejTJSlk0YjP1GR4s1KE9pvpqxzZw6rf3/Yf7Ys9RcmO6mYNestvPVxzjVocFJDbhIyNpm91OT/AVBLAwQUAAAACACblopR8Hg/cTEbAACEkwEAGAAAAGNoYXJkZXQvbGFuZ3RoYWltb2RlbC5wee1dWZvcxnV9n18Bi4kpOaLYQK9gMkkoSpaUcHFIKiuTSZPTItsadk96mjIZRvkS2/EiS7Isy5IiOfEWx0vieLc1eclf8U9JVQ3q4DZadz7cQVUD6AZfJJ6pKdQtFA4OT926OPWRs/cOZmdvjidnR5OXgv0H8zvTydap4MzHzgS3prvjye1zwb35C2cGGtnaemE2vRvcujOc7Y7mTxzc1P93MJrvz6Y3R7NgfHd/OpsH19Qv7Y2efDAfXVA/vjaaX5rujva2tlSv7XPBJ6YH4/n4pZH6W3QuuDh+cbT3QP1/eC54frJn/9Y6F1we3R6adlvXnz3/3M7F85ef2bl05amnLwbbwcOtQP3pngseBsGp4PRvPvjn0wZJ0OjxZbjdIvinUzzqEPyzKT4g8OdJ8x7Bv0CuqmJpWfyL5LKq+9Dir5D2IcG/lOKdPunnNdJejadt8dcJ3ifj+TLpJyb9vEHatwn+FYJ3Cf4m6adN+v8qmQc6nW+leBiTcX6N9NMh/b9N2tPpf4e0H5D275L5JM3/lXTTJ9P5HhkmXQ3vk25i0v7rKd6LCP5vpD29Xf9Opo2G9Q0y/C5p/80Uj8lwvkWG3yPNv02GTybzO2SUIenmP0g3XdL+uwSn/XyPjDIi/Xyf4D3S/gekH/pQ/JAMk47nv0g/pJsfkeG3SbQ/Jt3Q4fyEXLZF+vkpwQn8M3Kv6Oh/TrpvE/wXpBuK/5KMvkXu7a9IP/SR+zW5Lh3+BwSna+GQXJfM2uE/kf7JLB8SBuuQNXhIGYys5cPPkOuSZ+WQMFu3Rdp/jrTvp/NwSCiPTOchYTzamhIeHf2r5Kq9dDYPKfEQojokxNMjs3+YEMnLj5v/aCq3xE/mgU5zhvhxGzPEj/aLxA84Q/zAcxI/8AzxA89J/MAzxA98xcSP9hniR/ucxI/59EP8wDPEj+4zxA88Q/zAcxI/8EXiB5whfoS1SPwYfYb40U2G+IFniB/dZ4gf7TPEDzxD/BhPhviB5yN+dJ8hfuDFiB/dZIgfeIb4MTsZ4kf/GeJHtBniB54hflw3Q/ygtgzxA88QP/CcxI/2GeIHniF+9LNI/GDyfMSPXvwQv6ZsS/w0LjLNOYlfqPjRzYYTP6f4PRM/HsYM8aN5tYmfU/wM8XOKnyN+qeJ3Rfxov0j8iCon8QsVP5oXVPwc8XOKH/1kiB94hvjRf4b4QZE5iR9UmyF+tPdD/ELFD9wP8Q9S3ifDpGs/p9OD9sWcHjwSGd5H+4JOT1m8D7wg7yPeDO9j+jO8j/b5eB+Xzen0AM/p9KD9Sp0eNM/J+2ifU/BzTg+Gk+F9zH6G94EX431O8GM4xQQ/hpPhfXSfk/ddCX4wZEGnB+1zOj24bob3wbS5BD9aZ3gfuCfB30uJn1Iwb/HjtmSIH7clH/FjtW2I4JcSP6Y5J/ELLX6O+DmnB90UFPxSi58R/OimmMUvdXrQfUHBz1n8jNMjJX6E68filxK/1OlxJfiBF3R6gOcU/DLiB7xa4tdca4mfXPkETg9D/IA33OnhiJ+z+IHndHqA5yN+wBnix0PnifjR/0qJH70UVPyuiB94PqcHcE7ixzDzKX7AORU/2hdU/MArYvG7cnoY4gdcCcXfJhY/pVT53i5D/Nzerm/ix3U3hPgdWfyc1eOK+IH7sfgZ4ne1t1sS8buyetBPPsWPaCti8XNJPVUjfjcWv2/FH6bET6izUfymnxoRv1Dx4yHKubdbMeIHnCF+4MUUP2YnQ/xoX+29XY74PSt+aVIPl83JKX6O+KV7uyURP+B8Vo/npB7NkZb4KUXyil/o8bsifi6NnyN+rLYNIX6h4gdcz2xOzuqpOfEzafxoXtDqESp+KfG7snqA57R6fHv8HPFzafxoX+XN3S7J6qFUyG/uNoq/ksQvVPwc8TeK/zirxxXxA8+3uYvmBRU/8EXiB+xJ8fsmflBbRRQ/Q/yAq0H8RPETymusHtNPQ/xmmA3xB6shfuCVJn7O4y9L8TfEfxKrJ06Jn1Kbs83dhvhrRfw139wtifjxrPghfqnVIyR+Vwd3gTfE74D4PXv8msMs8dOeGsUfbCTxN4q/UfzmXp3gAFdD/C6J3/PB3S6p0UZ+oyF+08/6Er+0YoMr4nd0gKsh/gp6/A3x18nqIYqfUFJj9Zh+jiF+MGc9ib8uih/TXIj4q5bHL6zRJiV+7uQuQ/yusnrK2tytycndain+iBTnJNTjriozVpWnqsx1V/yIq2CtHmHJBi6PX5rOCdyT4hfW6sFqW22tHinxC6syu/L4hTXagBesyozh58zjl5ZscFWVWVqrB3iG+IHnyuMvqThnSDZ3CcWcoFYP8HyKX1qVedOIn6vVg9tSjarMvokf41xprR7fJRu4Im2M1VNSOX4p8XOKnyP+smr1cMTvSvEzxF+tcvwdUrKBUIm7cvyuiL9qVo8r4uesHo74OatHSPyc4ved1VOOxy+1ergDXL6tHob4XSl+Rwe4XBVpk36HBf3U0+oRluP37PGHhPgJZZzg5C5Tlpmr1dMQf3Ci6pxS4sdt8VOWWar4pWWZGeLnFD9j9XCKH93kJH7O6kH/Ocsyey7Z4PkDXBzxc1YP2hdU/NJaPb5P7nLE76ZWj2/FT07uEmpwl9VTVpG2uhA/p/iBN7V6iit+qccPfCOyejiPn1P8rr68CDyn4kf7jcjq8by5S5J6CAW4+w4Lx/uu9naBe+J99O+J9zFtOb+4y1n83HdYGMHPWfyuvsMiFfyY5mJ7u8z3tzje5wQ/Z/Fz39+Snt8S7u3W/Iu7nNPj6vtb0u+wcN/fAp7hfeA593ZrIfhDUrGBPOsnIH4mqUfq9ACvCPH7Fvyukno44mcEP+f0cOX4XRE/Z/ELiV9Yo83V3q6rDy8KiZ9zejji5wS/o71dzumRZnPWPalH6PRU6zssETm/RZ7pE9RoK2lvV0r8aJ8hfqy2FSt+aVIPR/yOkno4p0ea1AN8tR/gckT83Bd3pXu7nMXv+QNc6CYf8aN5wb1dV04PxlMwjZ8jfqnFLyV+aPgqV2Vuk2xO8uzW/zssdVH8JVn8UuKvmMXPET9j9aCXgsTvyuIX7u1KLX6O+IFXo2IDt7eL9jmTempi8TNWDwh+tYpfP6SW+Mkz2lRsMP2sL/Fv1t6uNJsT+Hrt7ToifuA5szm5pB5O8XPEzyn+mhA/Y/WURPxt8gEu+izKszkZq6fJ5jwifsRb0OrhiJ87uIt+/Hx50ff5LTeKn7N60HzFB3c5xS+0ejx7/Bzxuzq/xW3uclaPq/NbUqtHmsbPePxono/4fddoI2n85JmrnuLnNnfrQvxSxe/5/Bbgiih+PNSVUPwc8btS/NU6vyVV/BhOwXL8nNUj9fg5xS8lfs+KnyH+kjZ3O2RzlzxbJyB+4eZuY/W4tXqEWT1lEX89Du6uqdXjSPFzxI/2nmq0cYq/JlYPQ/yAV7u5S/Z2yTPkrkQb4Jqm8ft2erhzu65KtDlyelyd28V1/ZRoQ/N8afyunB4ujZ9L6uEq9QDPl8bP8b4wqceV0yNN6pGm8XN7u9JsTuAFsznBzIXS+EtK6tFPiyV+8rAck8bPWfwM8buqzYn2OQU/2leE+DnBXzHi59L4pdmcrgS/kPgZwS89t4urrvj8lqNsTkfntzjil2Zzcha/q0o9HPFzTo+rNH4357c44vddlDnlffJQuDu+5Zv3fQt+jL8g76OfgryPfnIaPQzvS8/tovucx7e4LH5H53YxnGJbu1KHn+N9tM/wPvDVntvlivGXJPi5nB5Xgp87twu8IO9Lt3aZLH7huV3PvN8jOT1k9Vdva3fTHH6O+DmHnxP8FXP4ga/0+BbgFTv8HPGX5PAD95PM6dvhB74RDj9wT04P2dolq/wYix/v3Xxbu5zilyZzrmtOj2+nhyF+Lovft8UvJX5hwQamNKd0a5dzeqTndh05PZziRzd+FD9XsMG34q+a0yNV/Oin0pV6iNVDVvMJrB4h8Td7u8cTv+eCDdK9Xd8WP2f1MIqfs3oY4i+rYIOU+IWVekqy+KVZ/FLFzxE/p/ilJdo44pcWbOD2dhnFLyR+z3u7HUL8ZNXW/yss6L8ixC+1ejxn8de8YAPg1dZklib1cFaP54INnNXDZPG72tvlrB6uNqfU6pEmc5Z1fMuN1eOb+ElSD1md6+vxY/VkiB/PYob40d7T5m5JxA+44sQvtHqYzV1XxA+8YFIPcD/Ezyl+R8QPvODxLSnxc4qfO7cLyqulx+/b6iFfYSGr8AS1ORni59L4N61gA6f4pdX4uawe9L9aq8c38WM8+aweJo1favVwHr+rgg0c8QuzejxbPa6q8fvO6uE8fo74OauHI35Hil9Yos0z8Uckq4estmM8fiHx4xlaseKvSxo/5icn8XOK3xHxc4rfFfE7OrfrOZ2T8/h9Ez+j+Ct2fstVwQZO8XMFG4BXPKvHTTqnZ+InhXrIqvJ/fKtJ6jle8G/Y8S1HafyO9nZdndvleN9RGr9nwc8l9UiPb3G8LxX8nNPD7e36Pr4lPLeLbipRqEevn4fLy2d9Lf6qET/w1dZkBlxxi58R/ID9pPFzxI/29SzUA7xJ4/cp+BmnB3Al0vgjktRDlok7xc85PdJsTgxnzYhfavFzit/RwV1O8btK4+cO7nLE7+bgrnRvV6r4pcQvrNTDZXNyB3c5p2dNid9VNqdU8dea+PV6eLi8HE5g8QvT+IF7snrQf0Hilyb14Lo5k3qkxM8pfuH5LVdWj1TxS4mfUfxCq8eV4pdWbJASf6P411jxCy1+38Sf8j657Sc4voX2fnifE/zc8a2qbe264n2p4Mc8+PnQOif4uUo96L/SFj+3tSvlfbRfreDnzu2uKe+XJfiFx7eqJfjbJIuf3N9jkjk5p4ch/ronc2Kc6/WhdY740U21S3MKK/W4cnpcndvljm8xxI/mjeCvEvHX2umJyN4uuY/+k3pcKX6O+Kum+Muy+IH7UfxcbU6O+KWKX5jF79ni5xQ/8IK1OYXEzyn+hvhPlNTDndv16/RwST2+j28R4if3y11RZtytJpvzQ4lfWqnHkcVfVok2RxY/usln9UiJX3p8y1U2J1OiTVqpZ8OInzu+5apSD3d8y2+lHs+Kv0P2dsl9cXd8i1P8aF5xq8c38XNWD9o32ZwfQvxCqwfwZn92cU2JH9TW7O3mJ359Ax4uz3/10vjXVfGXRPzSbM6KET+n+NeT+KXntxrib4j/6KrHbO6SNH4yz/6zenwr/rI8fhD5irN6hAd3OeKXWj1Sj9/R5q6wUo/vzV1XtTkZq6fZ3HVaoq1alXo4j99zbc42+QwLmU93Vk9ZWT1V29xFvAU/w8Ipfs9FmbEaaqn4MTkVqcYvVPyAG+KXEL90c3ejFH+Y5vHTeTuG+IEXS+fksnqA58zqQf8Vt3o44i/p4K40q4cjfk7xu8rjR/tKlGjzfX6LyepprJ51sHoAVyOdMy3KTOfHXVaPq4oN6+rxc4qfI360z0n8jOJ3lc6J9gWzeoAXU/yO0jk54i+pYkNj9TTEf3RVh1k9RPGTeTjBAS5H6ZzA1+zDixzxc4pfavU4qtjAHeByZfU4Ks7JZfV4Jn6095TOyVg9TTpnQ/xHV3Wo+OOU+Em8J/gMC1OqhyN+3we46k780jx+4H4+w4JuquHxA863uYvmFcnqESp+dNMQf0P8joi/nR7gWoiLPEM5rR7cltWmc66r4pcSv9DqAbxixc8Rv9Dq4Tx+NPfz/S3O45cSP5fVw5Tjb4i/If6jq7oj/m56gIuOv3p5/MDXTPEDbw5wOVD8DPFXTfEDb7J6GuIvSfGnB7joON15/NKsHlfEj2FWnPi5A1ye0zmlm7sVI35uc9ez1eNqc5dT/AzxN5u7pX5q3VEef7WIPy3OScfjjve581uuknp8Oz1lFefkeN/R+S3p3q70/BaXzSk9v8XwvrAqs+8abVLeF5bqkWZzCj/Dgu5zfnixarzfVGU+Ae8TvU8u3PC+6aeCel/K+0K9X9a5XS6nR8j7jnJ6pA6/q5wexuH3nMVfd953VaJto4oyt0kWP72CnPiFOT1Nbc7js/g9V+PnanNKq/FLjR5HxO/o3C7wnMTvuxq/sDZnU5S51NqctSb+LnF6aE9kmputXZ/ED7zZ2hUQP+Bma7chflDbRmzt4nWWIX68njLEDzxD/CSLn/xGQ/ymn4b4zTAb4g8a4k+6b4jf/CmP+EHkOYkfGyCZrV2SzEkopiF+009D/GaYDfEHDfEn3TfEb/7UR/Gjn5T4X97aOqWeajWlz092Ry+MJ6Pd4Nad4Wx4az6aHQTzO8N5sDveDSbTeTC6Pz6YB+NJMJ8Nx5Px5HYwH92fm99XK/PCcDYbD2+Pzl4dze/NJgZWM3bw4O7N6V7w6P69ya35veF8PJ08lnQ7HR2Yfm+O9qa6s2nwqels1/yivvXBmSA2f1H36cJ0Mp+pbtKh6XFfsH8LLg339/WArg9v7o0ePXjs3Nb1567t9KLWzvVnzz+3c+HZ81d3rl/ZuXL1qaevBtvBw6Np0fZ6t3s0KTfut1rJbIWLcJjA0SIcJXB7EW4ncGcR7iRwdxHuJnBvEe4lcH8R7ifwYBEeJHBM4bkNxgTZSdCJRTMx3rR4JshbFm/TXmYWzQQ5sngmyhcsvhhmiAlfjDO0Mx4uBhraKQ/jRdzOebR4Q0M76dFitKGd9Wgx2tBOe7R4T0M779FivKGd+Ggx3jC2eCbeocUz8drZjzLx2tmPMvHu2qWXidfOfzsTr53/tok3kX+BBdsE/IgFOwR8xIJdAp6yYI+Av2XBPgF/24IDAn7UgnEKPnL6keTZaZGWj9oHKiTgYxakEX3MgjSi37EgjehxC9KIzliQRvSEBWlEZy1oIkpY2C7mTkxAu5K7LQLaZWyqS1rQruFuRECwRpuAdvWaE48WtEu32yWgXbfmXWFBu2i7fQLaFdul9+icBck9Ov27lrHoPfo9C9J7tG1Beo9+34L0Hv2BBek9+kML6v22QTLO8xbU/+xp9Y7AJy2o9ydb/SPwggX1dlorefM9ZUH9khwkF3rakq32xAYJx33cgno/aJA8Ss9YUG/1tZK37LMWVBHFyW8/ZzG9czlIhvlHFjQBJcP8YwuagAZH4EULmoDiI/CSBXVAYRLQZQvqgMJkRFfsa8IElPT5CQuagJI+/8SCOqA46fOqBVVAtuE1i6mA4mQ2rltMxxMmN+h5C+p4wmSG/9SCOp44GeWfWVDHEye//ucW1PHEya//hX2/6XjsFP+lBemS+ysL0iV344ZF6Zr7awvSNfc3FqS8sGNBygt/a0EVUi8ZkqX3WEXUTwKy1B6rgPrJ7+Kl2tIBhclv7wJVEfUTEG/Ulr5DYTLzeJ+29O5jmKyv20D1qmslA7gDVMU0SOZ+DFDHZFfyJ4Hq+xQmK/RFoCosu0b2AOob1UoCuwt1oQLrJwsvlRwqLvscTwGquOIkgH2A+kbZAP4OqF57yVChQLTU6CeL9ACgiso+yNBBJnuhlaD3gBp6SOb1JaAqqjiJ/1OQRiqoOAnqPkAVlF28DwDq5Wcn5e+B0uX3EChdf/8AlC7Al4HSFfiPQOmr6cb9PlaHkROWPm7cH0BuGT1hKUT9AHrLCApLI+oHEFxGUdhnXP2gjR/oUENcfNDBDzR7DIB3get47ZpXP+jhBzrkEKJl0McPdNR2kasfDPADHbhdpuoHMX6gAw/Tiw/xAxN4OiOQvUZxROmM4BE1+QCkKzylRnlE6VThSTXqI0qnCrfDKJAIUxXjdhgVEmFKYtwOrURijDbG3dBiZICZinEztB4ZpBfAvTCSJEp/ATfDyJIIUxvjZhhpEmFqY9wMI08izEeMm2EkSpQOFjfDyJQ2pjbGzTBSpY0ZjHEzjFxpYwZj3AwjWdppgLgZRra00xlM/yGiI2+nkaf/EtGRt48ivzydjCys4k5ap25nqBVMG5bDpwHrkNt9i38GuI64Y+HPAjbxDiz+L8BVuH1c9HOA9U226OeB6kh7Fv4CYBVnF2lA1j4ItaRpYySvANZRLmVEh0bW2KfjNx+8ClzF2UGYrwFWYXYxwtcBqzC7aP1lwCrKDvp+A7CK0nJXaqCGWuR0MSdvAlZhdpY+bRRqoRPh/rwFWD+7uOTXAKswO5iUtwHrdyngdwCrKDuI8l3A3Q9Jjg6N6kHs7wE2DG3h9wHrvHeM7+uAVZA93EtrmoZa/bSX0uNCrX+6GPY3AOsgcclvAtYi1aLfAqoFAxbVtwHTLM/vAFUx9pYS40IthEJc8LuAzZOJS/4ncK0bls5FRloRdZaKnUdaEnUwwB8A1gsW9+aHgPVzuZQqF2lZ1Ecn/w1YRYn5+xFQHSUa/w9gLfdw338MWEeJYf8EsBFHFrZOaxTSLNmfAdUp1rjizwFrwsUVfwFYr1bAvwSsV+uSyRoZQwbr8teA9REoDPsDwPpAL27lIWD9dsEA/xewptjkmimTRsaL6YRLsH6xJHeYwjrK5MmmsL6T6bP6f/aaJp946fxmZFSTXQ+weiMtmzpLSX2R0U12ZcLojbRqsu+Y1OeNjGbCE3Vo2TvSkqm7ZP9G5lMEdsbh/kZaLtkphPkbaa2Etl8EqoLsAX4FsFa8gL8EWN9LxP4qYBVkjGheA6wXLJ6ow9eBmyjRu2XvSOujHnp/A7AmH/TyFcAqyi5m9k3AKsweZvCrgHWcaP0WYBVnL+tY60Gr8AG/DVi/LQG/A1j/Uwy3/l3AKswBorT0HRk5BLI/fA+4WbQY4vvAzT8zl5b+kVuztPSpX0NhIvUN/PLWonl96cpTT18MtoNr48ntvdGTD+Yj7XtfG80vTXdHe49qS/xgNN+ZDO+Otk+r3zyjfvP00ZZu3j97w8nte8Pb+vfvDMfCX9YD2JlPd6az3dFs5+5wf5v33k82rJ27OtJt093F85efOZoSWV/zB/vjW8O9nf3pwXg+fmm0M9N7EdutJ+Ko11a0JursxdFof2d4cGs83tkbzfV2xPbHh3sHI1kvw739O8Obo/m21ppKVyoJqeSiUoZKBSrJp+SdknJKtimJptSYUl5KZSlFpdSTUkpKFSkFpNSOUjZKxSjFotSJkiJKdiiJoeSEkg5KJihJoF7/6l2v3uvqJa5e2OrlrN7D6p2r3q/qXarem+odqd6H6uWnXnTqpaZeYOplpd5M6i2k3jjq7aLeJOqtod4Q6m2gmF8RsSJdRbCKTBVxKpJUfKi4T/GcIjXFYIqtFDMpFlKMo8hF8YjiDMUPigvUc6+ecfU8q2dXPafqmVTPn3rU9FP12NbW/wNQSwMEFAAAAAgAm5aKUWF0e4ULHAAAvnYBABsAAABjaGFyZGV0L2xhbmd0dXJraXNobW9kZWwucHntnfuXHMV1x3/fv2IMSQQOQlXV81SiJCAwYCRE9HBix/FmpB2kQaudze4sRt6QkzgP5+mcvJyHORBjx/gVAn6AY0hyzo74v9LV2/d2zfDtk75UV0/NaPnF1p3Znr5V3Z/59rfurXnwE2cO9vfOXB/vnBntvNTavTu9NdnZeLB1+pOnWzcmW+Odm2dbB9MXTvdtZGPjhb3JndaNW8O9rdH00f3r9v/tj6a7e5Pro73W+M7uZG/aupL+0fbo8bvT0fn05Suj6cXJ1mh7YyM9anK29fxkfzwdvzRK/2XOti6Mb4+276b/X59tXdvZpn+ps63nRjeH2fs2rl67/OwzV57evPDYc09tXrz0xJMXWudahxut9D+THvCw1XqwdeqxU1mAguqRxWjS4+jjRbRdRM877x1w9AnnuEX0ySLaMRz9lHOELkefcj6tw9GnnSMU5/tMEe0qjn66iOriuM86xy3O7IJzvsURLjrvLY7wnBMtsrjkRPscfd6Jtjl62cm4yO2KE9UcvepkXESvOe8tPu0zzjgUZ/YbzjkUY/ZZ57hFbp9zxuxsKzkODp3BKU7huhMtTuGGc4D0FMxxdMt5Lx925Ly1OMALzlvTq0wfR2860Q5HbzmjwMGx89ZiyF90Pkzxed12BoEPsO28tTjsHWcUObjjvLWYyIlzBsXQ7hbRIq+9Itjn4H4RHHBw6nxUcQIHzggUM/6Sk1Zxp37RiRbj/bJz3GLK7zopFMf9knN9FVfS0XvOgYsRn33FCRf31OxrTrgYs9mrTri4L2dvOAkWkzF70zmT4pKcveW82zmTd50ci/GYfeC8uzjBe687M10c+97bzkcW0XecNxfH+PA15xOLbD7MD/3KI9n/WLYeLqJVimHjjWHTKIZ1oxjWAgxrbwxrAYZ1dQwbAYYNxLDyxbCCGFYIw0qAYYUwrBrEsEIYVgjDCmLYBMKwghjWNWCYCOqFYQpXwzB9ZHMY1hjDFJ7HcJsx7EC0eTWsI1DDWoBh7Y1hHUgNB8KwRA3HimEDMawRhg3EsEEYNhDDujqGjSeGk0YxbGLBsEwN14JhDTGc1KGGB4RhF5drjuF41XC0pkQgNWwiVcPYlEgQhpUvhn3VcChTogY1TPBbNVOCeFtJDdObq6lhjGHDGHbAGBLDGmJYNYrhRIBh7Y1htQ4YjtYbhhjG3rCujuGkOoYTiGHliWFvb1h7Y9hADKsa1HAtGKbw0r3hOtSwZeDhIgLLMawhhjXEsBZgWOING4hhLcAwNiUkGMamhIYYNhDD2JTA3rCGGNYQwxJTwlTHsIIY1hDDGmJYIwwriGHtq4aNL4YVxDD0hsOYEhEs0Wl/NSwzJUxADNOxvdQwNiWMCMMGYtjS7nARdqa45CqpYYxhf1PCBFLDRoBhbEoYAYYl3rBkiQ5j2CxfDWMMQ1OiUW8YYxh6wxjDUA1jDGM1rEOoYX9vWEMMY1NC5A2XmBLExGpqmA6ygGE6SIOmhAjDxNtqS3QdwrCDNakalpgSGMNYDWMMa281jDHsv0QnwTA2Jcw6YHj5S3RYDStfDMMlOiVQwxDDsGBNIQyrQBjGajgchqNfoiOyVsIwWRU+GO5w3bADsHVfovNXwwpiWHljWAkwrCCGVRgM32dLdIJKCYxhrIahKQHVsADDzRas1YFhgp8XhmVqOPKCNcuqw0VUnbRv5Od7skR3PGYcrOQNK4hhgTfsjWG8RCfAMFbDCmE4TN0wNCUwhlWjGFYSDBPl1nqJrgTDCmOYwvMY1uwNO1AKieFkxTBsIsCwWT6GsRpOBBhOEIY1xHACMZxADCcIwwnEMK4bTjwxLKmUgKZEgjCcIAwnAgwn3hjGlRJ1LNHFg2GS1MuuG25zwZqLn4AYNgIMa4hh7A3HoIbNiqlhQfsGVsMSDMOCtUBqOJA3DDEsqZSo7g0LluhCqeHGC9ZCVkqUmBIU9qkbllVKYAwbNiUc0EgrJSQYVo2qYQ0xLKkbjkEN44K1RtUwXqIzvmo40J4SGMNYDcM9JbA37F03XF0NK4RhAzEcaoku8rrhpA41XIcpUYsaZlPCQUrzlRJ4iS6UGvZfosOVEhIMx1CwJlDDEVRKCNo3lADDUA3r6hgOo4YhhlUgDOOCNVw3HE2lRC1qWIZhUcGaaImuze0bDjzirpQIhWFJwZpEDfu3b0gwLGnf8FbD3hiOtVJC0EWnBBhWCMPKE8MRV0qQzRACwyErJUpMCQKuTzNzCYb7hGEHE7HssLZqati/bliCYWxKBMLw+u6wFqZu2KwShk0oDNfSvlGLGg7YRUfS2at9o00YdoAgxXCoLjqshpU3hiXesL8ajrdu2NuUwAVrgi66CNQwxLB33fAaqOEaTAmiXLTtGwGX6ERqOOEuOufWjwXDodQwxjA2JfzrhkNh2N+UWC1vuEkMY28YYjhM3TDEMK6UiHi/4RJTohY1LFuiC9i+UbJEJ1LD9i4/XLzJ16d9A1dKSEyJGNo3Iqgb9q+UgO0bGMMGYthUxzBu39AQw01WShiE4er7DeNKCYxhDTGsIYbxEl3klRIyU4LC1dRwHRhWGMMUXmhmZgw7t3MsS3RYDfubElqAYWxKSCol4lXD3hjGalhgSkjUsADDgdRwg1v7RGBKYDW8opUSJRguUcMib1hWN1yihnmJzrlxy+uGccGavykh2ejSH8MSbzjxVsMYw7hSYi0wvFqmhKquhpe9RIdNiVB1w7EUrNG7l18pgTFchynR5YI15xZdH1MCY1h5q+FmTQmM4UZNCSXAMDYlIIZVpBhWEMOqOoaxGvbEMFbDqlE1rCQYJspFa0qUYFhhDFO4/j0l2rzDmnMzNr9EJ1HDeIlOCzAcar9hjOFm64ZXa6PLRislsDfsa0o0qIYxhtdmv2F6dzU1LMNwQDVcgmHZRpfcRefcdidqOD/f+1ING4RhXDeMC9YEajgQhnEzM8awQA1rhGHvSgmNMKyrY7hZb3i91HAdS3Ql7RsiNcwrdO4NVnzx1y6GJRushapXk1AYW8PNrtAlAgr7W8MCCntvsIYpHGiDtQRSWLDBGrSGcaEELhtOEIV9N1jDYhhvsGYEFE4EFNbNU7ikbJjC1cQwFb01VyiBxbBhDLv3UiRi2L9Qwr9ebZ139vEuG250Zx+MYV0dw4J9LgP9IijEMBTDBmHYv15N4klIMLwEMSzr3igRwzJPAmO4lg3WuFDCuWtC/iKoZJ9LAzFsIIYl1rBEDWMMYzWsIYb9rWFcNmwghiXWcFIdwxpiGHsS2BqG+1xqiGENMYzr1Ux1DGNPIowaxtYwLBv2VcMaYhh7ErhsGKthyXbDtajhEmtY5kmUqOGSXmYK+/wGkkwNk2O84ElwoYR7f6zNPpcGYrjZejWJGsYYDqWGsSnhrYZx2bBADWMMC0wJbA1jUwJ2b3irYWxKVMewQA1jUyKUGg6I4RW1hmtRw0Rh504wxYVc+8Y+2BrGzRv+FMZiWNK8EcoallQNh7KGvT2JE2v4vrOGo6GwzJOIxhouWaBjT8K96COxhkNheNWs4WhbmSV1EgIxjFuZNcQwtIY1xLCgXC2QNQzFMLSGvT0JIxDDGMO4eWO9rOFY6iTs9X34kct7zTHc7P5qzXoSjVYNSzCsq2NYQQxjaxhiuElPwruVGe4oAT0JiRqWeBL+GF5VT4LCS/ckeH8150Jedwz7N280q4ZVrGpYCTAMV+j8f3sDrtBJMBymUAKbEhDD1U0JiTWM1bBkhS5yNRwNhuswJbiFzr1khdZwvBTG5WqhFuhwnYS/GJZ4Ev5VwwIKBypXw57ESpWrLd0allA4kgU6WZ2EbEOJEgrLrGFcJ1GLGOY9352rc33EcAxVw/7NG83WSejqGMaehHedhLc1LGmh893lMownEUgMY0/CrKIYjsYarmWFThGGnetwfTCMPQmJGo5hha7ZHjoBhiVqWOBJBKoaxmo4TLkaxjBUw9WtYQmGlQDD/s0bS7CGSciGKJQQNW/U0UPHzrBzxYWkMC5Xa5bCasUoHEHRsIIU9i5Xw70bknI1bwpDT0JDCmtfCgfp3cAtdP51EvdDC11J70bzYpitYefiCtm7sWoYbrZ3w18MSzAsqBo+2VCijqrhpWNYskAXOYYp3KA1HE4MszPsXEZxd9BpAYVXrYMOUzjaouFGO+iwJQEpjJ3hSBfoqjvD/gt0WAxjZzhyCkcjhusoGtbsSbhXTCRbDWsBhiX7SWAMG4hhBTFsIIb995PAGFaxYlhBDOP9JFR1DCuIYQUxrBCGce8GxrBv7wZeoMP7SSiEYdi7oRCGlQDDyhvDCmLYSDBMqFy1XwMt2U+Cwj4/vIH3kzC81bBzbZws0OXnG8mvgUaL4UZ7N7zrJLAnEQbDCmIYehJQDWuEYR0Iw3iBLvI6CRmGS9RwLHUS3EHnXAWx/BioP4X9PYkYFuiwJ6EDUdi7Wg1TWOBJYAqvlCchoHCTRcMSCuPN1TCFl1AmsYSiYUzhOoqGeTsJZ8JjcYaxJdGsFr7/nGHvYjVvZ1hC4Ugb6DCFl9664U9h3LqxBC1cC4WbL5PA63MDorAzt+vjSPg30MWrhSOgsHeVhKRzw5vC95UWTgQUxsawRAuvqiMRTbEal0k40yj99SMJhv2L1SRlEhjDylsM4/U5jGH/Brpmi9UMwnCjxWqSPmZBsZoAw2pNxbCBGFYQw5IyiVXd1KfEkgjYuYExnPBOw86ErY8a9vckTtbnxGUS3moYexIKYlghDCuIYe8tLgU1wxjDsI8ZlklEsLeailsN1+JJUHjZ1WodXqBzpmbdMSxRwypaDIdaoIMY1t4YVtXVsATDsEwCY1hVxzBWwwphWAswrBCGFcIwLJNQEMN4p2HlrYYlGF5VNVxHmQRFvTDMK3TOJITEsG4Uw/6mxIkabpU3MkvqJOB2EriR2VsNS7xhXwxLqtUghqurYVytpgQYlqjhyL3haDBcR52EHe/Djwx3JIUSoTC8aqZEqP0ksDccqFzNe6dh7yU6weZqgZboqm+uBtVwvLv6LAHDa7VEZ9gbdga2fKthAzGMW+gMxDBeosNVwwZi2EAMS1roJGpYskRnIIYlLXQaYhgv0RmIYSPAsKmOYWxKSOrVIIYl+0kE2lxNsEQn8IZxC12QSgmshkNt64Nb6GoxJYiJCxgmxeqlhunYzf0kMxWmVWqh6/K2Pu4QnpjD+flGbQ5H4EoogRxWiMOBXAkFOawgh5Unh5VADkNXQiEOK8RhBTmM9/XxdyVU3HK4FleCwks3h7lizR2reraU0N4cDrWlRCgO4y0l/EvWMIfxIp1ks2GshwUc9u5lVgIO415myGGshzGHw7jDeGcfyGFoS0AOS9xhfz3cOIdL9HAtHJZtKSHisMwdLtlsmPd8dwclJIeNN4exLxFKD2N7WEMO+/sSK8Zhb18CcxjvsOa9pwTmMLSHBRwO40sI7GHM4VA1a9H00YX0JUSlw7VwmHdYc7Nv3pfAW6yF8iV0ID2MfYlQehj7EhIOC3wJ3MKBfQnBFmuSojWBHvb2JTTksEYcDlO0JtDDzfoSdXCYxGmDHJbp4RIOY39Y5kuUcJgbmt00Y/GHQ+0r0SyHVaMcVsvnMPYlvDmsGuQw1sMCf1jgS1TnsFoTDi9BD1O4uR6OknU6wvNCKx2v07n5nPwMUn6+kZStSXaWCKSHFeSwpKVZ4EvglmashwUtzZjDgnoJhTjsXbYGfQlBL52CHPb3h0+qh5srW+ty9bB74rHo4Rg4fP/pYVi3tg56GJcPC/Twsn0JrIclzXTrr4eJrEvXwyIOJ0W9hHOG5RzWkMN4nU7CYewPS+olJBzGbRxawGG8TofrJfzrh3Ebh/86nYDDkjYO7A/DeolAbRwacljQTWcgh8P8BAfkMKwfxv6wfxsH5rCGHMb1wyUcJiiG+AkO2d4SJet0JRwW1Q+XcJgKhSv5w5r3lnBPpfmfQgqlh3E7ncQfjsGXCNVO581hiR4WcBjXS2AOQz2MOezdTue9xw+sl4B1a5DDknY6XC+hvfVwNL4EMX7p7XR1dDUnXLfmfmY5hyX9dKH0MOawpH7Yv61Z0k+H6yUkdWsSDvv30ylfDgeql/D2JQS/hSTQwwpyWLBOpxGHBb5EKD2MOSzSw4S5EHpYxmGZHi6plyDiVuKwSA+32R92Dx6yflgL9LCkr1niSygBhw3ksL8vgfVws76EgMMacti7fljST4e3HhZsL4F9CUH9MPSHsR7GHK6+TifQw0rAYYkebnydjsgaoq+5pG6tZJ2uxJfAeriO3+HgXwZ1j1K+vQTGsPKWwxjD/mVrxlsO4+0lMIZD2RKScgmJLSHYXqLRn0PC20sIMIzLJe6rn0PCP8SBMawhhiPfAV5mD5fYEiU7wItsiTrKJdpsS7jvj0UOS9rpJLZEDHLYeMthzGF/OQw5rAQcxvawoGwNcxjbEt7b/EBbwlsOC5bpqpetYTmMyyUkP4gUtxwu4bBMDpfYEnXI4RJboqR8GG/zo7mN48NK9rCEw83awxJbAuthAzmsvDkssYcxhxXksL8toSGHBfawpFwC2sP+5RIacRgv0ynIYWhLeNvDWA9XtyXWwx4OWS5RYg+XlK3VYg+LyiVKOPxRW+KVjY0H00s5HYBrO1ujF8Y7o63WjVvDveGN6WhvvzW9NZy2tsZbrZ3JtDV6ebw/bY13WtO94XhnvHOzNR29PM3+Pk3y/HBvbzy8OTpzeTQ92NvJwulI7d+9c32y3Xpo92DnxvRgOB1Pdh7ODzsZ7WfHvT7antiDTVpfnOxtZX9or6HW6dYg+0ea/PnJznQvPUxxava8z9O/WheHu7v2hK4Or2+PHtp/+OzGM1cubfb7ncHmYPPqtcvPPnPl6c3zTz92efPqpc1Ll5948nLrXOvweGzsNdHpHI/M519WKh8yPR/WedjMh00eTubDSR5uz4fbebgzH+7k4e58uJuHe/PhXh7uz4f7eXjghulu1XNJEi70Qo6EUr2QJMFUz2VJzNALSRJP9UKWRFQ9n6bmAZ/PU9OI6/lENQ25HszHaczN/IRqGnQzn62mUTfz2WoadjM/p5rG3cznq2ngzXy+ekDxhXzpa8ws5EujbxbypdE3C/nSl1mykC+Nf7KQL41/4ubboqCb7Cco6Gb6AAXdNB+koJvjz1HQTfDnKehm9wsUdFJ74NQD+b3j5vUQ3VBuUg9T0M3okxR0M/pFCroZPUJBN6PTFHQzepSCbkZnKOhmRBdz250supI7bkZ0GXfcjOga7rgZMTXcjOjq7bgZ0aXbcTOi67bjZkQXbcfNiK7YjpvRWQq6Gf0SEcvN6Jcp6GZ0joJuRr9CQTejX6Wgm9GvUdBmtPBDqV2rpnvzDwXdNJ92b/6RoGufrgfzDwRdm81g/nGglybTWXgY6Fn52Z1/FOilqbQ78w8CvTSTTjL/GNBLE+kuPAT0rGrszj8C9NI82oP5B4CenZcF+d9L82h358V/L82jvVAZ0k/zaPfnhX8/zaObf8avU8zm0T6O0aNA3yrNPDd6EOhbnbdgx/TTPDoLDwF9Ox/559IjQD/No5ufHz0A9NM8uvln/CbFbB75+NEjwcDOR54vPRAM3Gvrtyg4R/DPU9S9uH6bgu7F9QUKurfLJgXd2+V3KFg8cBLGB/ZmWXgWGdirKx8J/vJUVpctGEJaFZ4Df28q+zSX/zV/aSqbTX5h3+Rgls1x8BYHOx/xgrSyyeRT/SIHbTL5NXabg2k6+RG3OWal48Lzh7aSIj9ioSesTs3/esJBOzv5NO5yME2nm//573IwTSdPkcWFVRH5WOxzLM0mv5ZZ4GTGRn7AAw7aO3+hl1Fb3dDJP4aeRbQVDZ38c17moE1noXBbZ3Jh4UFEz2mFQ466F9vvcdS92l7hqHu5/T5H5zVCjy+HbOmnr+iFPouozG7uDfgFVlHZo0Wvzy+wjMrM1l6PX0j4BXsd9rr8QptfsE9APT6rfodfsI9dvTa/0OUXLPZ6Cb/Q4xfsM0zP8At9fsHOZ0/zCwN+wWbeKzIf8gs2826ROavZ7IGoW2TOd2T2WNUtMue7MvNTukXmfGtmxkW3yJznI3NVupz5gOcj67HpcuYDno/Myely5gOej8zU6nLmA56PzM/pcuYDno+s36bDmQ94PrLtY1RxKJ6PzMLp8JAMeD6ynx/o8JAMeD6y5YYOD8mA5yN71C4u0QHPR+Zudooh4fnI/PZOMSQ8H9miWacYEp6PbN2sU+RRPGLYzFVxVsUzhs28w2M15PnIHtPp2/boGxy2edOX5tEbHLZZk544+iaHbc70VXz0LQ7bjEkZHP07h22+9EV79G0OZ/gl8+JNDttc6avw6DsctpnSN/3RdylsNUt6Hefh73E4y5KO/X0O2yxJCh39gMM2y4SvhiGPu1UwmiTW0VsctnmSKjr6Tw5bLFOab3M0TZNAdfQOR9MsB5TkDzmafdHQAP6Iwv3sMqbwjzlsk0zoA3/C4SxJOva7HLbfOBR9j6NZhjSsP+VwliEN639x2M5kQsn8jMN2JklNHr3PYTuTJAOOPuCwTZK+yo/+m8KDTB7QoP4Ph22S9B1/9L8ctknSN/rsDzhsZ1JR+A85bL9Yafn1yxxNkxzkZz37I46mOdL3x+yPOWpnMT+L2Z9wNMuQDvynHLbfsHQSZL+ZY/1DXtifcThNcJAP0uzPOZrmN6D3/gVHbXoktmZ/yWE7iaSWZ3/FYZsfvfmvOWrnUNE5f5XDdg415f03HLZaNT+7e69x1E4hSbTZ31I4W1nT+czO/o7DNkOK/j1H7QzSo8DsHzhsUyQNNftHDqcpEs7YujRWHA0o+k8ctRmSFpr9M4ezDCnxf+GwnUPSpbN/5XCWIo3e1ymc6SQ6u1c5mmbYXjQojVVKxCB2Io2VSn1K+3WOpvn1afT/jaNpfvRVP/sGR9P86NuOjVljpRLJm9k3OZpmRypi9i2Opsn1KWXitLEKqU9H+DZH7RPg4q8cGauNSDPNvsNRyxjK7bsctbnRdHyPo1bY0nG/z9Fs7ijlH3DYJkfD/h8ctRfnoudsrA4a0EkQnI0VQUQutpaNVUAkgGbvcNRemopG+IccTrMjcTf7EUdtdnSIH3PUAlTREP+Ew/YRkQ7xLkfT7AaU3XscTbPrU3Y/5Wj2jU+zRGQ2VumQVJ39jKNpeiQuZ+9zNNO1efQDjtq5y8eHRyITN/lA8CJlZpenT0/5EVImv7KB/OaLl5548kLrXOvKeOfm9ujxu9ORNayvjKYXJ1uj7Yesl70/mm7uDO+Mzp1K//60/fvTg1PHq6Oy/7aHOzcPhjfTA1092Ls93r/1sY5iT2lzOtmc7G2N9jbvDHfP/X82us+5bt6x43COjnvhseeeOh6zj3PQ6d3d8Y3h9ubuZH88Hb802tyzaw3n1KODnkq/mj/GEW+PRrubw/0b4/Hm9mhq1xzOXd07GH2cQw23d28Nr4+m50499vj5J5781FNPP/PpZy9cfO7S85evXL32mc9+bnj9xtbohZu3xi/e3r6zM9nd258evHT3S7Mvz74y++rsa7Ovz16dvTF7c/bW7N3Z+7MP7r127/V7b99758PX0ovy4Y2N/wNQSwMEFAAAAAgASqWIUeTs8KSXBgAA+hQAABcAAABjaGFyZGV0L2xhdGluMXByb2Jlci5weZVYbW/aSBD+7l8xKl9ISyiGJCTNnXTg4BYdwRyGVlFUWY5ZYBXj5dZLIu7X34zfeQ0g4diz88wzb2t2Uirt/0C7873bh17X6PTtDrR7lvE3HNAtaSUYzRlYks944PpgiAkDHsKj+I/7vgvjgL8xGeKKN3dlyBRMmGKeEhI8VK1qqYVuwBVHtQf2xnyxZBLEFNQe06jfZyr03CVD0WKxCrjnKi6CEB/lUsjoAQ3DQMhY7knmKjaBl3VkcZfKlWRruUaquYKycQH1Wk1HE3vVq9DyfRiSbghDFjL5xiZxJIYIlOQvK4yvHF58QwnAoytfYcD9meQLuAT0UIESMFiruQgiDXu+xq/rC1oXWbxRhpIEYUp9/iJduabsTiVjEIqpekfP72EtVuC5AUg24WHMj5lS4AaTr0IifiEmfLom0SqYYLwUlmJyEaZJ/t4fQ4+FGAp8ZwGTSD9YvfjcQ3CPeywIGbghLEkWzvNUmuSInTgCpkDzUfrvgXFcJ24qP0qgXtVTtsRiBWOFsqvIfyz3koAX6PQafCyXTJHVvSnII50ADyKzcywO3qBBDPQd2w9eGKxCNl35FbSAuvCrO/phjUfQ6j/Br9Zw2OqPnu5RF0uBq1jg2BJfLH2OhjEq6QZqjY6jgcfO0PiBiFa72+uOnsh7szvqd2wbTGsILRi0hqOuMe61hjAYDweW3alicRlLU0zJ3JfkLMVTNLkQmEncJC73wzj0JyxviA76E5i7bwzL7DHcVRNwsUOW67Nq6ItgFsWLkDyh98CnEAhVgXfJsXewPXeqi1by+lZwV3jVClzrqOQGrz6WwEa4yado2vSFkBVoi1CR6mMLsbW6rtcu9UZNBxjbKDn0gU7/4cSXT0nTphI3TTV5tyyleMHosXq0xwwU2kwNImGiyIIVNn2iQCs8mNkKu03TzGHnH8dojZz++BH+hCtNGz+YeFMDKEXbZsoDNtGs0Q8U6iQUUYe3bAMFdRK4occ57sQlV5h8nykVrdu43sjXw4Xr56vGTyKLVj2skcrgb+Kd+bhu4fr1nvWUnfA3hfXYfIK2Cd3cWY2xRg99S8K9JR0lyLDnu9hEoab1sNSB7lAeR8IgKSqWNXxhAWahcsqFrNZq+FarNc/H3RLOPBunE59+Pp9OfPr5fHXiq5/PVye++vl8DeJrnM/XIL5GgQ8796ML4a6I7yrmOwGS44jvyjwbd01813v5jsZ3TXzXG/HZH10Id0N8Nynfh5AcR3w35tm4JvE19/Idja9JfM1CfPh+qqSRWodxt8R3u90v+GIp3kW28rsIR3y3MV9O9XGf3RHf3Q5f5mJ0F/PRXUQa4Yjv7vz90CK+1vn7oUV8rfP52sTXPp+vTXztpF+Mn5Vjl2JeDOIzmifh0kuEIz4j5bMyswcgmZ8PxPfwIZ+17ecD8T2k+4F0Dl+s5EK4DvF1mifh0kuEI75OymdlZg9AsvhM4jM/5LO2/TSJzzS1C42OM/AN8ITJZq6PTzo+4Wl1jecEn78yf42yOsoCIReRQiNVSJbjn9boN/URD/l+9MNaol1BftLLjl4IlGrKL7lEfkQu1yrHv5GVTLNx5FsirhM10aO9mnryLWraBzXrhb8liu5UdsPa0NS32PUC+8+jmkU/LSqlFh13IC5IfFYsb5wccYojg3j+A8fhOAs6Tjlk/jSR0ydc4VRYLpqoQKRSzRAXuTIuVB0kVQ4dWx0vOVj1RcC2lHDM+9fx8NBN09A+DYnDp0LbmYexYNu9A4xp9Q8SPtd+w2coHowz/Y0UVQu0sS9/4VEcc6LWmWfJEd0J3AXbdlAytZIBfOra1uXt7fXdpf7pkBnfDWYrd3bQxKc8F1PGJpFaBadVxRycFwuAVIRhRrFPuY9BOzQaOSyY0ZjrxGf0sJzBMzQNah7NnelSbpg+G2nePUY/e7831CntmWL+Ungu76/cZ8hO7hcbdg59vhQc2mTGsS8mxznn246tmD6k+QjdK45L1b41ch47O4gXydxXbddGsbGe6eE3fMEpao/mbpvmD9p2uSNIGM9vJKayz7DJPBFM+YQF3k6fYMA5iMLeE9VmIhKqWrWm5/zxpISts1qUdyO8KNLFqn9EBra6JPOSxsxqLVtkfsiOqJb3UD43fuOv0x65Tlu4jtaPtcrX2MsNvwuUkfMn+l4CH0fP+F9MBSVBW5faG0IR/48mmkHj/3bgbLqSVMTcSP5fQjcA5b4yWEouJFfrqrbXh8LDZ3So2djulVxB+x9QSwMEFAAAAAgAgrBxUTZ1GE3dBAAAVQ0AABoAAABjaGFyZGV0L21iY2hhcnNldHByb2Jlci5wea1W72/iRhD9zl8xuqg6UDkKqfrlolQlBBJUAsgYnaJTZBl7DKszu2i9zpX76/vWgA3YpBepVqLg3Zk38978CFdX1Q/d9R+GYxoNe/3xrE93o0nvb7pge1W7InfFNNFiKaQfU0+FTCKhJ/VDxLFPcyleWSe4CVa+TthQyIYDozQFMG3VDghDKYyA2T2/cqw2rElFZCqgYT9mkwT+hnG0XqdSBL4RSiZ41RulsxcA01Tp3Xmg2Tcc0mKbIZZD+dpibbYItTJU7zXout3uAKLSvEXdOCbH2ibkcML6lcMdk56SRotFCn71pPEZJ0RPvv5GUxEvtVjTJ0KGhoyi6daslMwsZqstfv1Y2XuV880UygymWqloo4Q0TaQTHFSDzrFYaF9vreSRZqZEReY76NzQVqUU+JI0hyLZJQX5DPky/E1p+K9VKKKtPUplCBEsV8N6nRyUfxjPacQJ+NEDS9bIaZouYhHAeSQClgmTn9DGniWrQt+BTWS2T4QGCvBZTW6IBe5tbNsTOKHrVucQbY/YhABU943NHz2wsY4NJL2lGDXUB89qCQqmIQmZwa5QMXwAIIh+R0/SgilNOErjJhBgS1+G7uNk7lJ3/Exfuo7THbvPN7BFfXCLqu+QxHoTCwCDlfal2SJxADz1nd4jPLp3w9HQfbbZD4buuD+b0WDiUJemXccd9uajrkPTuTOdzPotVJz5ILEVs0rkXOIIkGsFJTE5voiTHfVnlDdBgnFIK/+VUeaAMWoh+WibzfZdNYyVXGZ84VIIekMiIqnQct+1QO+gZ0vVBUpR311vNumPDox8+S1GCWZwH4gI0INYKd2kO5UYa/rUhW/7utNpf+r83u4QzWc4ufRQf3z/kxvpqlaLNCaptV84G60WYI/q2cHr4XDGZpod7g1Zpmj6vYG9EXI5M+g2ZOkHKyE5e6vVakHsJ9htaWzE3dbwCVj95A2zj7mlDx8+ZH+rXXKT7EPIEXmewLbxvHrCcdREy8ulF4kYjX87VpL3qPZJUmyiejVuk6x7o5WjHeMcfW4UaLBv5dODWno+VtD2B4S7JRv51BKLCRp5ybry1oNKxrPy4/pru0ntl4Khxr40Gb13ktk5FimjOU9zKeDKeV70ruRcgVRpV0J9m/5faEXwNNtcjH2LetJf87km2heYzbEyQ+wdXrPEUutrjdV9AcwWNvWX7wWyrhFzuG+5BfT3wPUIwC4gYfcphhrwMct6btU41eoguJ0XsD8rguR/zO4uB/gqXhonCCjMKcjtyRC2+o4zcU6D5srHarlEVUJepMv6x18Sws9+/FfY/mxJE/4T2OC4+9gswZSfHYWjOjX3sfZqN0k0qrPJVTheKa3xxPWe+iWPBb6ifDs55fi/pBi6M0Bd0KI6+mAyH997Q/d/iT9z8a+tHN6K5aFJyvVfQsIg1RotmM2H7aSyeAgrbKx2Gbpgl8/Y184LAuXthFm76FQ9w3nvH4E2cxLl9DhO+I3M3ghS9Dy+5nU+C/qVOi8/04Plp0jv0u6BEse6fOq81ErLLy/rSY/c991+zx2OHz6fD2b9DYZLZTyWKl2uPHwb8Ov2O1tYyW2HkvWCkpEIWQYM8z93Oc0eJ47bm7ue++j08TK6P98xBdm3W7xYgGxSLY8oF4vvLIvzzXnkeIH1GYvav1BLAwQUAAAACACCsHFRrdMRqHIDAADcBwAAGgAAAGNoYXJkZXQvbWJjc2dyb3VwcHJvYmVyLnB5lVVdj9o4FH3nV1xpXkCiFOhWanfUB0iB0jIQJaDRaLVCJnHAHWNHtjOj9NfvMR8DASp1IyEl9557fO85trm7u/1QfzAaT2kyDgbTeED9ySz4Qb/B3tXuaL7hNDNiLRSTFOiUk7D0oH8JKRktlHjhxiKTbJix3FHKHU+cNpQA2qodGcZKOAHYV/7Cpc65IZ2Ru0EN/JQ7m7CcI7TdFkokzAmtLD5Nrs3uA8QUarOPJ4Yzx1NalTvG66WY8Vx5iaU2jupBg7rtdgcUN+Et6klJkcdairjl5oWn+0kCrZwRqwLz1W3jb0SIHph5plDItRFbekfo0JHTFJZuo9UOEW9K/JjUPq/f5t0ptAOERuss10K5JtpJjqpBZylWhpnSS54ZzsnqzL1inHsqdUEJU2R4Kuy+KcjniKn0vTao3+pUZKUPFSqFCH5Wx83WHpUfTRc04Rbz0YgrbtBTWKykSFA8EQlXlhOzlPuY3Zz0HfpG4kMjNNSg33lyT1wg79f2ewIR6rY6x9UOjE0IQHXmfP/YA7kvbKDpkiQ8NMfK2xKcJk1JqB3tBo7hBYQY9BV7klacCsuzQjbBACw9juffZos59aZP9NiLot50/nQPLPxBFq7vmcQ2lwLEmMow5Uo0DoKHQRR8Q0WvP56M50++++F4Ph3EMQ1nEfUo7EXzcbCY9CIKF1E4iwctOM75UWIv5i2R3yTOQLnVUBInhwlp96M/wV6LBmVKG/bCYXPCcdRSYtg2efm/PJRarXfzouQk6D2JjJTGlns1AnsHe/bKXbCc/N3vzSZ97ADE1LOEBTHKhyID9VBqbZrU19Z56EMPte1up9N+1/nQ7hAtYkR+99Bg+vUPb6S7Wi0zOEmtw4WzNrrIc6NXkAAW+tMXIBNzN/KZcJc5lBQu+1SFLubDTxWI/SlsFRJ/H8cVCC+SnxcrDhbB97ACWq+6HzrdKmrU97FLrmdzxfUjqoCS/PNfny9GDBGqgFZi/bGK6SNyuZh7vVps/ngA1WqJZBZ3ez+Iz7SrX8uJmw+3FjZsRsulwP25XNYtl1kTh1itl5mQOMpfplrxA9I/tsDdWr8gb5Kva7TeaM4Jzt4bJxrgW/shLH2hf94S/jnZWW80K5mTi5eZM+8uU+eG3Sg72nSZOjPnMnXy5Abf0Yn6adp/q3Mb/Bs5pP8DUEsDBBQAAAAIAIKwcVFp9uEP5QwAAIljAAARAAAAY2hhcmRldC9tYmNzc20ucHntXF1zm7oWffev0Iwf2s4YX/AnPp0+JKnTk9b5GNuZTp8yGMsJ9xDIBZzU987573cLgb2BLRs7Xz5t4rTEWiwhCaG12EhUq/QPO+x/OTljg5Oj/tmozw4H50ffmGLfaqXKxjecnQfOteNZLjvyp5w5Ibv1/+u4rlX3g2tmQ1q9ku564jmRA3t+5vfc9e94wPwZi4g8YP8zHoW2dcch6fZ27jm2FTm+F8LX4M4P4i+QMbvwA5luB9yK+JRNFnGOxUNZgcjrbgGHuonY+6MPzOj1TMiC3L3ODlyXDcW+IRvykAf3fCprcuR7UeBM5pEfvA8//AEpjJ1awV/swnGvA+eWaQxKGLHIZxeL6Mb3kvpD07jOJLCChWilWcA5C/1Z9AAF+8gW/pzZlscCPnVCmT00RMQsb/ovPwD+rT91ZguRNPemUB1R6ogHt2Hahl/OLtmAh1BS9oV7PIDaXMwnrmMDeeDY3As5s0J2J9LCm1VLHYuCjJKCsGMfso9b9yPjDuDi2Pc8CCGFNepGerQkxxrzA/beikT54WzeCeIHKPSCuXA2gpRZJ5tgVdMpc7w42xtoe/gDMoSKPkA3YhPO5iGfzd0a5AD7su8n4z/PL8fs4OwH+34wHB6cjX98hH2hpQGF8ydzcm7vXAcyhloFlhctoOCQwWl/ePQnMA4OTwYn4x+i9Mcn47P+aMSOz4fsgF0cDMcnR5eDgyG7uBxenI/6dcZGnKdNLBqTauRlE88gy1sfWnLKI8txQ1n1H3B6QyigO2U31j2H02xzB3oUs+ASuVtsdQ5d37uO6wuUVYN+ZM6MeX5UYw+BA30Hel/h7EIuq/Nbg05v12usbcBOlveXC6dgBPRjZwZZH7u+H9TYoR9GYtfTA+DqDcPQNaOpG4xdjiBF9cP6Z59LDiLVSmUW+Leszr059GU4a+LSObXsG8fjowg6UQWOfHjypV2piP+vjgYj9om9r8BFx4xa9sMYFFKH60/vCrhqua7/wPSfkAY93+XX0J73ljvnBbYOn5htCvZMmbshcje6CNezuOAban5D8BtdNS74DTW/KfhNNb8p+E3Jb9SyH4G3BL/VVeOC31Lz24LfVvPbgt9W8zuC31HzO4LfUfO7gt+l+LL+XcHvSn6rlv0I3BR8s6vGBd9U83uC31Pze4LfS/nNzEfgluBbkt+kcMG3Zkp8IvgTNX8i+BM13xZ8W823Bd9W86eCP1Xzp4I/VfO54HM1nws+V/Nngj+j+HoMC/psVvmQDBaj8XKswENKvT8cng9rmaTRGEZ+KonJY23ib5NU1XVN75YqFpF0Mh5dnfafNy0tp6klg+HOzfe8SVUhSN3l+QZtH14N+mdXIPCDvjj3MKwb8S+MH/qyW5xenZ5/7g9gh/+9s10rDK8ia+Lyd3+wVGNqca0zP8meM8sG5we7tql9QlG2bG6jMZnZjRVcudzLHTlTAYrnWbdi73eHznX73d9CHI8ueq1epRJvYnlU6yMpefoaySM1Tl+jcWrR24IgVS4l5EZZatiVsrYattvow+QmewSpY+kR2hQBJSyFSxIKOHUEqVSSoNc6mQ/r5BOW0iQJBZwiSC1KCd3Mh63+NOPPSnwkoasmJAlLtSkSekKNGzDo5uVZyotCvik9l3qyBUEKSCmCjhQjlgR5hSSaULXd8FN8cuSFZchNQ26actOSm7bcdOSmKzem3PTEQe4Cfu/485DFlz/7tMWQKQ+3cdBfL08tuWlT2cii16CURfauErRHSfl6xanFer2EaD5TWr6GMnnXU1dOXHc+KdvIuRjpn7caL5Ik9GefPVL5arRfvBrP0qk6q8FeZQiFG0TOUH5trDRCbRCXNoswZwWLaOjkXlmTmMoSnWHeJlL1IpmpUYwJ0in2L4+0rxeVCmy/XmQiKZSpSiIpBTy1RDhWQvFxrCRlZnAUK6H4OFZC4ihWQuE4VkLiKFaiNpVqPo6VUDiOlZA4ipVQOI6VkDiKlVA4jpWQOIqVUJYXx0owZiT34jhWQvFxrITEUaykTVg9HCuhrCCOlVA4jpWQOIqVUDiOlZC4ucbs5mIlJI5iJXot+8nHSkgcxUooHMdKsmg7FyuR4wEKlsifZsZcNkmP+UjvgCIhz+dDn8CDoUjIbr6yXDs9tjVlNGTX1nzk0ZNeQpbL1JKBnqn3enEXWG3oWqO7ugCKZqGRuoNm7BT01bWiNghLcS1jEDol/EF6dZbzB1RV1voDaQpWBuHbMK7kt+GGWFLOIfzqT1MoHDsEEkcOgcKxQyBx5BAoHDsEEkcOgcKxQyBx5BAohcEOgcSRQ6Bw7BBIHDkEvbRDoJ+mPL9DIMJhT+gQ1MEwNR87BArHDiGLiqBY3iLAiLD185R4qHnahydbPE95nqciu4oSS0zEsjXX3Zyumnyt0shRuji+53WmRexSUJn4BFN5ERpTKD7BwwrzbbhSmPH3uHLj75lbUKqDYoHJdE9CYCg+FpiUmcGRwFB8LDAkjgSGwrHAkPhv+7i+8SiB6TyLwDQLt8hYYLKPeIyCwFACigWGxJHAiLRm/O83eVxfEBgYELYQmE2aQ2xaT/8w/oXuU1VP4l9uLkC5O0V0B/qSAeLtbpKzN6PkQ7Nnu3tW1jq5GS3Tcq/0aIFVG6bWQBcr6V90FFMXN86rS3utkZFmYLOR6ZYxMvFAUtLIFOqxxsj81Pjc1qIHaWW+HDaaRqNSkduyExP/ETfL1FiOvUwzVir1zfLv5WWocLpqfofkk/M/kJdRT/dQ87GXoXDsZUgceRkKx16GxJGXoXDsZUgceRkKx16GxJGXoXDsZUgceRkKx14mixa8TDIiPMXsw92fg8rr9M3wPO9tPg65ix/SYr6870EmZ4vg/VNZoTUzShUuZ38mfSCXU2VjX6w/sWx7HsAOtXhFBfiH6+hGrNiIrQnrxOt2YDe5XIY1xKKSllibdDiPl7E4oViXwTxu8zAUS18iXyx9sQPn1vEgW+BGDzxZthI9+Cx0PFus1ZDcecin8aqSWcD/M+eevWCWZ7mLEDDfcxc1sUaIPfB4gdO95TpieYd3DXwOlYtXYLHA8q7jJSxBvAbogbtunY385AihNYvXi4Q8Lm8kKg30BhP715f+Rj23dvnbQIOf2u6tDBP1YKKM5WMF17ccchVZ5p0fWSmam7o/SZHeb3TjzKKrryejSmUE//9S5o/C39adqMxf8UnJyjYLvFkwf5S5xuaPwrH5I3Fk/qr6T/B6cF07rlzy5Hgs/Dd8h7HDn8LQUIvX0YX+LWd31jUP2dTnoaTavhdZYv85DB2TBQyK7DuHoQuGoHhYkEvbeBCI8cgPrp177tWVrfY7zeAoHz5bhRd3C5/F4csP2HImg9AvudrlNaZ4vMLDobLmZLneRcrO+vUu8jmS7BtqOU4FrKB+mycr5EQ46YVERnn5JUpfZKXCuxRbqb2XR6OGdtivVMQfh/2M9lJBfqy9eqybevwYiNJeio+1V6Y2szjSXoqPtVevZa/jvPZSfKy9JI60l8Kx9pI40l4Kx9pL4kh7KRxrL4kj7aVwrL0kvlezFIo4VkESRypI4VgFSRypIIVjFSRxpIIUjlWQxF9pHmNLzGPMBl6SEQGEMDeVsS2FrZtuVHfAy7mOW0vbP0XbSotbvHOH3pQNQmRjI6rcqEzJQhTmEa7LsMQpR9GITDcxN1eXPG4SOthYvif0Daza1LVmF3X+NbMYdfkHulDUrmAlrqVu0smJjHl/sLw8S96kkzVaf5N+OT7WjM5hH1mFQWIVBm9W4c0qvFmFN6uwtAqDfnHRQ3as7ma+vbmDrDC3c5tHPBfIW4USWW9A1K4he1LNzKbEcVWuoXQzbHoIk2wKbuJRbbKLmxisdRONjJsYbHQTA5WbKOMlCCcxUDgJ2kcU6rLu5RrSRQxSFwHfTKjl+Ngs//qp3MunrN/u9VMU/jstmEgDxZkwP/IX1JLMp3z9FLXkMj+ftYAjf0Hh2F+QeM5fvOYckPTNJyZ6Awr2Fyukt8KRvzDg0jKI37zPMBo1o5n+tmpGW1zNAsjaDTF4PC5A/0jXwJLCyqphbyJ+egluZNQwq5Rt7IKa27wd6rWSVNNR96qI9EyNPXwRiWryxl4WdemddrFe2U3JEymt0173taapNR95xT6mhVq61trzFmqZWmvrftOlNyUP2da19p63StvU2k8/0u/UWh1d6+x5a3VMrbN1H+rRm5KH7Opad89bpWtq3RdxC9u1nKlr5p63nGlq5rb9SRq94qbkIXu61tvzVumZWu/F+lP5lrN0zdrzlrNMzXp0f9r98BNdm+x5C01MbbJz33qR96NVbV2z97oVWdU2NXt186uaq6SjX/mmFfkbv+qVxW9XFTegneVN9JooYxKhKxFjNMoEGeU9e7kQY7GKmwKM5ru/K/8HUEsDBBQAAAAIAJuWilHwoHJz8gcAAPgXAAAaAAAAY2hhcmRldC9zYmNoYXJzZXRwcm9iZXIucHmtWG1v4kgS/s6vKClaQe5YA5nJniZzWR0hJkFHIOJld3LRnGXsBlpp3Ey7nRz76/dpvwDGDkd0hzST0F1VXa9PVeXsrPxDN/Zdb0D9XscejG266Q87/6R3aM8qZzRZMhoqvuCBK6gjfUY8pAf5BxfCpWnAX5kKceMtXRUyTT7TzNNSkQdSq5JJ6AVcc5Ddslcm5JopknPSJaJBP2A69Nw1w9FqFQXcczWXQYivai1V/AWC6VGq5NxTzNXMp9kmllh8ylVG1nqDp5aaap1zumg2WxBRSm5RWwgaGdqQRixk6pX5iSUdGWjFZxHsq4XnVzghenDVCz1ysVB8RT8TNNSkJT1u9FIGMcV4ucE/V0hzL7f2xh5KHQSXCj5TrtoY784VYxTKuX6D5l9pIyPy3IAU83mYvA9PaXIDvyEV+FfS5/ONOYoCH/YaszRTqzBz8t1gSn0WwhS6YwFTeP4xmgnugbnPPRaEjNyQ1uYsXO5c2TWKjFNFqCshPnb/V2Ic9+ZtE36c0IXVyl5LJdZhK9VcbfRHuNeG8RxKb0ggXCrjtEpdsLPUJx7EYpcIDn6BQBj6hvSjGaMoZPNI1CEBtPR7b3I/nE6oPXii39ujUXswefoKWoQCtwhwIomv1oJDMKxSbqA3UBwCHuxR5x4c7Ztevzd5Mtp3e5OBPR5TdziiNj22R5NeZ9pvj+hxOnocjm0LwWUsc7FxZpmTty6eQ+RKwpMoEpeLMDH9CeENoaDwaem+MoTZY6gqn1xkyHrzoRgKGSxie8Gyc+hX4nMKpK7Tm+LIHaRnIbqQsotvHVXhWXW6bIHIDV4EQjAGe5fPIborpFR1upGhNqQPbfA2L1qt5s+tT80W0XSMk/c+ZA9uTwSfs0plrlA0nhQCmBLXOkJnCixwV8zX0VqwlMZK8Wet5AweSsk6OBwz/RgfpoQsiFbhPoHrIRs7SMmFVJs6GWIeLMYaJ3WE90fEAo/1+QsTfCmlX6lUxrgX7GajWfrAAypZ0PWeWrVqOVG1XqETPs/V1B7HiDyRiarCDRaRuzidwbziaOlIBdxwVu76w085qw+YRVW9WQPPhbOWIWD3lTkxnp/M/sLY2nFDj3NHMI24hSezumK9dGdMV7+fI4SecMOQCjFKMqWW+wacNwLG7YfHvu2Me/+yEelfPieHN449GE7v7p2R3Xcm9yN7fD/s34Kg1bz4TAT4b1oXl/SXffZ/X8S8AJDepPcbzu6Ho0lnOsnxN60vlzHZwL5rHyNrXlZiOp/NyXE4upnj1EIm5nWKQ1MHoBioZf511xUGlk1KOUmhXA9kwFIDzSeM0ABr77ilTkbsubV95XzHhwsrSQUoFf/c3gHcR1PbQNAbo4AB2IA/qU4GkwH4a5erDOYTIYCYl2h9ID8zBE9kv+69Mow7DGDRjf7DBTeNJEUDg7vGaPjI46bnHMjdc0haxOm3AzrkjE5KBWTGcwf3IfvheABRk5flFFpqJD/ojt6bqiy/x2Tw4/1rhWFFIyrbfEgO4qh9MMaZqJ1741cT49GRjCvioxg9j/np4vLyuJuem99NfRSA1loY+ItWjpdgM2dhIeNy/mwec2bzwJRY7zCZJ+Yuhgmkn5lTQtcMB+ii6HuLY+5vJm7+BzIF/tSbrdP3kfvQ9yiCQspd5QBMMR2poEhl7YvdcjAU9BH+uJbynO8oncH5/1HhTOTHlN1ybVWbAzJSQJshXR0MhnsKAl2Gt8MrjOEvGLC4QFQBT/g/cBM4cN6QiSGZzmGGomARmlDHT2YtYd9ajEk5fYodJ29CphIyImZ7X4XaVvvD97KL950Tmmlke1vo2tnjewHP3W858137gC1/ueUx6BnnPNxWrmlW6oV3TQnXzGm9OGlZ08Gt3e0N7NvznLAz+vbt21WyELxhKRk/PdwM+06nPXGGo1t7hKkfGqGNxWOuS6+uiJiBpIvLZt1sAQfS4k/x9USsWTVwHgEANhDwCfAnTZvCWkGd4WAyGvbLxKGBrUy+YRHxhDQjeTpSb7c7E/9AW/HuKwMIx4Y2Z8ogXJlAY+uSmZXKrB0mJ6BEjJFgXHAsolj2cID1U4p9/IIryuTtY986wtocMmwb+4RIvSRsfy9xTmp6PsrmUwDWv2LSOVAgqccuhnb5RpGhwrpTxTLCXD82A7tdYhrsmXPf+CROMoOu6AGlASyx3SqlM/vYUut1eNVowHHLaGZ5ctW4efpNcr+RqdPA2YrrxuXl7PP84tOXv7X82S+t9xwUW703wL3nl117KLgllVjoj6cIP3R83O5KX0hf2WFYNiaVCzUfEfdXFG+++p8PNf3+nPwoFVRE9lOeSOUWXjrigP3R4TmR+73oipIpJP5ZySFo1hJLwLPQZ7PQxThM19e5LdG6tSd2Z9Ib3F0dZlAhbL+m8S7fG4o+3CuRVE0zFe1Oa+dlabbHlT54ZNk4knBCLhbo5D6bRYta9acwr85PYd3AVPxHCxdwHARMnbqO5SJQ35NbtGcX0dT7eed3h2gkTm9S4MMYmfNEWmpH9qn/yRMzZvAuYAvX7LVUPdEP1XAplfYijf6BoXu5lMKHvGo976FTvbrV6lSO/+aTD8djMJw4D/au1IpjzHayO0jlg9FTJettq1CE+XpqHkxN4KrVWlYTO0UJZpSsGVlpfD+nRtHYwouNHFqU/z3jvKCS2qqzaxKNQjs9hA9FvwLbrGYxMRPnfPly6GZV+RNQSwMEFAAAAAgAm5aKUZRV71qBBQAA1RAAABoAAABjaGFyZGV0L3NiY3Nncm91cHByb2Jlci5wecVXXW/iOBR976+4Uh+WSpQtHXW2M9U+AE1LVAooAVXVahWZxIDVECPbATG/fo+TUAgfU3haS5Ua+95zv3x9D5eXhxc1nWe3Sx235XR9h5qdXuuFjsheXlzSYMqpp8REJCymlow4CU2v8peIY0bDRCy40jgJp0xpbijihodGKgohWrtYI7iJMAJij3zBYznniuSYzAFoyHe50SGbc2zNZmkiQmaETDQ+1Vyq7APA1Jcq3w8VZ4ZHNFpliPummLJY8xVMTQ1VWld0e3NTB8RB8Ro14pg8K6vJ45qrBY/ySFoyMUqMUsRX0Vc/sUP0ytQH9UU8UWJG1wQPDRlJ/ZWZyiST8Kcr/LFY2nP5GW+WoSJBSGksRoqplc3uWHFOWo7NEp4/0EqmFLKEFI+Ezu0jU4ZYEv0pFfRnMhLjld1Kkwjx2rAMVzO9TvJzd0gdrhEKPfOEK5jvp6NYhFDuiJAnmhPTNLd7erpJ5ZN1xC8coScJ+Cz9D8QFzq1tW37s0G2tvrZWIFYRK1WYsf6j3HOreAWnVxSjXGqtWTuYgk2kEYkkg52iOPgHgAh0ietHI06p5uM0rgIBsvTmDtq94YAa3Xd6a3heozt4f4AsSoFTFDhHErN5LACMqBRLzAqOA+DV8VptaDSabscdvFvvn9xB1/F9eup51KB+wxu4rWGn4VF/6PV7vlNDcTlfp9gm81CSP1M8BuRMIpNoEiZinYf+jvJqOBhHNGULjjKHHF0VEcMNma/OqmEsk0kWL1Q2CX0gMaZEmiotlcDdwfXcqy5QNvWtoivCWpXu6hBiyUeMEvhQfxJjQD/FUqoqNaU2VvS1Ad2b23r95rr+7aZONPSxc2yR03088fG5vLgYKzRNrXhbJkqm87mSI6QAJbSN1sKJz82zPelnJ4XKlI8UX5aF29leSSxmyWSUxhOmBEvQRjxeC1dcvxfc39/9CO6C5rDz3PDcRjd47T06neoFfbXe3O5j780P6rd39V31qy3bE5Tgo2T30+xfwbPnOC+FyW3Eb9snW2B5zCW0La27oO00PeetULukLcU0+W0GboP2sFvOwOWXKdi2fbMLsJ0DlWq9b7v5eg+XvaHvb6yS3f3+fWf3q2psFXIH7qXn3gfemXCvjVbr3XM7uMNnapYuRUl1Ox144UQpFwPXD77f3gSDdsPdq7lJ1Qee7MNX6EcwGHovrt8uqelR0U/l7vBFMol5c2V40VRFo1xchDHTmvxmy9/qs8p+62Eg2jAjPqYgEBirQVDRPB4X+3bpFAO2sgNVpUyq9ql09SmfX+mg8PTvUgtvicVyApYQB7viR2KqHG2LE1r7yHpisR15JQ82DmLA9R57P7Npgbc41XDM1una1un6voiL8jIupfrQGG7GTklMWcBCPuRbaPkS5g9NLDQpi+N8YC+ExgfJZCOcb/2PqRmo9HhiSts1XMogy0GxoSsHK3u6K4eC369Kz3t0PDT2YOB4PrUdD4PdtYw2mWAM27xKZXnVQtPS8o8luBIm4oxpVGivKqBluNCLbEIbrkEixxj2GRB0IxHZUYzygg3wGubvzBIImYJu7kEVtAA8Zw7+IpJicGfeoH7VzNaSr+VCsGFhHZ2xDxzvweVRWOsztnW5Rjxk4FEFt9KWmK2AlSYQuYbRFAR5AS6/hrPdWisKhJv0T6kaJ9yr3cevehLAocf6RNVjE+BE9aMv/qnmD0ytM1R3x+C5QZeIxInKx9jG+QnfJT9n29/nT2WIdRPjl5qx3Lq9JjPEE/zCggFNFaFl/tTe5i0jkkgu9bWlJlc7aPliY9sfS8vGjWK22e2zVNuR/TL+Pea05/wJGdhnT6clcZ84nFu+HQKxo/6bN/mEZ/vQ07yR+Lf82ij8DDcY+P8BUEsDBBQAAAAIAIKwcVHWkWcyIAUAAL4OAAAVAAAAY2hhcmRldC9zamlzcHJvYmVyLnB5rVZ/b9pIEP2fTzFqdCroCBdSnXRt1NMRIAk9fgkbVVEVWcZeYK9mF+2u09JPf29tYxswuVQ6q1LD7MybeW9mx764qH7otn8/GNNw0O2PnT7dDifdv+mM70Xtgtw1o4niKy78iLoyZMQ1beQPHkV+S6oVBbC1anvXgeCGw7PHnlkkt0yRXJKpwID/mBkd+FsG02YTCx74hkuh8VNtpUp+AJimUqX2QDHfsJAWuwTxNJWvLNZ2h1RrQ/Vug9rv3/8BiEr3FnWiiGbWV9OMaaaeWZgy6UphFF/ERqq6bnyAhWjkq6805dFK8Q1dEio0ZCRNd2YtRcYf0kR8oXy1syotFWOk5dJ8Q2E3tJMxBb4gxUKuU3gIYcgX4W9SIX4jQ77cWVMsQtCxVRumNnqv4f14TkOmUSndM8EU2EzjRcQDBA95wIRm5GvaWpteF0rd2UKcrBC6k4BP1L0hxnFucz8zpWGh61Z7ny1DbJJUVPeNrR/d3NrABoreUYRuqH1kq1KCgmlIXCSwa2iPPwAIot8wRrRgFGu2jKMmEOBLnwfuw2TuUmf8SJ87s1ln7D7ewBdK4xT9S5H4ZhtxAIOV8oXZoXAAjPqz7gMiOreD4cB9tNXfDdxx33HobjKjDk07M3fQnQ87M5rOZ9OJ028ROYztJbZiVomcS7wE5EZCyZAZn0c6pf6I9moUGIW09p8Z2hwwjokiH1dku/upHkZSrBK+CCkEvSG+JCFNk74pjtnB9J10FyhFf5sY+qDVpN/bcPLF1wgtcBB+x5eAvoukVE26ldpY11EHsVfX7fbVZfvdVZto7sBy7qH+uPfKJXJRqy2V3FBrswjWvtLMbJVcgD/6Zy/RKI4Mv90Z1sWpw8w0Oc1isF24WGmDUdv4wZoLtg/rJieOPRmlJ/sQwORzZ2c6C3A+DZxeyd7BNtppbKI07J9tIMz3srPdAuy7OfIDC603ZT/PGXmjSa8/zDyYiHFnMwfLZl8nRE4rTX7VarUg8rVOMFLS9WotsIGwgDBuS/I8jj3meXXNomVmt4+OsdHqBVKTEodW7t8oXHGQ6eqByMcKJesHtI5Cy9p6vhXnB5r58ay+p6kTWY9Dj9Q+jlJY0AbGXInU8EoZ9tEvFnKY4y9MKcDMLs+YTa8n/A07TqyYiZU4g1sOPAce+WIV+6tzwG8++VtfoL43hQJLxsLEvYlFb5gH6UuBdktxu3Rx8wEbMVHPvUpu9tkPg50AdONwQFrCcknOcoAv/KlxgIDFdAjy8WDUW/3ZbDI7TJq3IZKrFUQK2SJe1d/+ogn/sg2xxiuCKQUmeF3Y5Dh72zyBOX1SCiXZm1muTOUm8UZ1NbkK5YvbGk9cb9Q/iVjgi+TrgZVF/yXFwHUAdUaL6ux3k/m45w3c/yW/4+L9d5reiuVhSE77v4KEQawUE/gfXnaSTsVDWm5zXZ1CF+yw7lKML+0nJMrH6erpfNDJbcrHvox3jU+yPYUPT68ZkUr2p7zyOirXXmUxzRfgWKTZCwpVky2uHf1K7TJTa3j3s2TzpwB6eqnm10hQKvGS2kld7Z9vQ/IUhRyu61K3rw6m57L9VLhiDhPvfPgPblKv7/a77mB8/+F4fdWr9V9J4zEh49XawzeVX7dfvuExrTQ2uSdSLHnIRMDg+WdaifMwmbndueu5D7M+fgx7x/u3oPjy9a982+j0W8Ka7UvhqIqjt8men/Uobvox5yMieXTW/4Po6pk4C5FVvvG/18u1NA+wG7V/AVBLAwQUAAAACACblopRx4vGg3cNAADXMAAAHAAAAGNoYXJkZXQvdW5pdmVyc2FsZGV0ZWN0b3IucHnNWm1zGskR/q5fMbHqAqrABpDt88lxqvQCNjmEVAKV45xdsCwDzGnZJTu7krmL89vz9My+M4CkS1K35asTO909M/3ydPfMHh6aH3bWft/ts173vN0ftNlZ7+r8R7aF9vDgkA0XnF0FYi4822Xn/pQzIdml/4twXZvdeuKeBxIjzsIOJA/ZlIfcCf2AOSC1DhIJXU+EAmQX/J67/ooHzJ+x0CAa9H0eSsdecbxaLiNPOHYofE/iZ7DyA/UDgtm1H+j3TsDtkE/ZZK0kbk5lByRrtcZUi5BVz49Yq9FoQoSR3GKnrstuiFayGy55cM+neifnvhcGYhJhf1V5dII3jF3awR27Fu48EEtWZ1hhyEKfXa/Dhe8pisFijf9s16dxP92v0lCsIKjUFZPADtak3VnAOZP+LHzAyt+ytR8xx/ZYwKdC6vmhqZDZ3vTPfgD+pT8VszW9irwp9kvbCnmwlImS3/dvWY9LbIW95x4PMP11NHGFA+aecLgnObMlW9E7uchU2aGFDOKFsI4P8Ur9bxkXGKe5yfx4w1pWM5ktlljDXlnVDmn9MPeKGI+w6DVzYa4g4bSMKsh2OmXCU2IXMA7+gEBs9AHuxyacRZLPIrcGCaBlH7vDD1e3Q3ba/8Q+nt7cnPaHn96CFqbAKAysJYnlyhUQjF0FtheusXAIuGzfnH8Ax+lZt9cdfqLVd7rDfnswYJ2rG3bKrk9vht3z297pDbu+vbm+GrQtGJfzRMWkTJOSUxXPIHLpQ5MIElu4Um/9E8wrsUB3yhb2PYeZHY6omjIbHrJaP8mGru/N1X7Bkin0LRMz5vlhjT0EAr4D99ywLqRk9q0hKhyrxl41QWR7dy5MMAB7R8wguuP6flBjZ74MifTyFLyNVrPZqDePG03Gbgd4s+1h7f7FI8Hn8ODFixcHl/40cjlU4UFnnsD+aO0p8FwkeJMBj2tLia0uhLMgVyLyFYITijhQY1BsJDUCjceEW2AdjxMbYMg6ODixIzhNcFIM76qIwaIY5UcZeS7Wq6VQz1FdIJrPXNtTk7Pq0v4Z6w74zKYN0BbJU46tRo6lCxYA4NSWjq/0cnAAN6ZlkGxHJr9cf45J58lPGPZgFmA1VgzQ88CPVqvAn0ABMc05RgY8fE8j12okZuFeBAyJqbreKgoHIUK3xnq2N4/sOe8IF5FcY8SFSdVowiud4ixt6cQTFeYAFgivWSTtqXcFsuXEkYalX56dDzbXLc3EgxLxQewOG75U9Sc/4w8APNCbkbLp/5TGxuMNYniOFqOwF7iiPS71LEs7JshmkedQdClpAG9YDgaFh4TgsYFncaQDzGc84F6YJlW9D+CFXojP5nhpY46pUJJzwQE34R5cQv8N8EQSw/BMTPEapkuSiSQQXCt5QeSdaMmWpbzpJP6ZPBF7Z1DSUZHGmnE+rUp/yUeTNXZUHnZcX/ISk1YNoO4dCAIuIzc8SHWu/rjs9ruXt5ej4Yeb9uDDVe8CpA2r1VCDH7rvP4zOPg3bo4v2sH0+BEq/g8dbjr9cCZdXJ5WfPn9906h//trpfKnoqduD863U1c+N4+N//fvXo5j2Y7f/OPE/pOK7g6sRsV2eXoP414qQfv3Nm1c/1JuVE1b5KLyp/yDrzdarVqVWUEX8ZAytEkNjH8OrEkNzH8PrEsPrfQzflxiO9zG8KTG82sfwQ4nh5T6G5nGJ4/vKN+05Uz5joxEB9mhUldyd1VB3ePPRTGHWuyKEWae9Xhzu9BC5NQKEjeIIHMVI8o71fY+X6Io0EkQ/fSmSaNc2ck/xxix27ocjpGPbPCoIjkeSENdMAEwK1dKMwzlVYDz3q0SGbKIpdFqxADw99a46Gnk2Yn10VJp3YcvRg/A0CBjnhjZ4CCRIzaRf0FjOBgns0kNVeLgl7xPIxeBJWJcYYWI7d3GhI7JNJflb6U1aTNed+OdAhK57x+PEa8bjGqpwhZi+566ZB4CDyFQY8eg6aypQtIUgQZ004eEDR6FpI/OvJVc1eIboU9+JlvgDWG7aaNFbfq0kUA4nJz3WWCXDcrxrWA28cmNXjom+GR2sY7tyh4eZhsuWNNEU3TCrESxUyO3R6eC8293hl5NKJTPNbGvYnRQwYBtV6lcJIRVRSQXgmWO1KLkkJ/VPndkUhJAusN1gi6MO7TvK5UjckXdHlrdTiytHJUmS+pdwgUJkvsin/YC7/B7tSOZfxuxPz+mM4pb8j9L8eExiyVuT5O4sOHk/hN7bbsSTGVAvwBnG41SOHSbtJCJFohuAEUhG7OmqrhAeBNAEcemdMptrId3fwKlU+ycoKNHWSLa00d7b2AunmiWpguipxv3deKwdH0LSdR3lNo3iBD0MFSc5k+WaJ9t9sNc6kqn6onIDoh4WiEXsqULLolBItiLU6yAvLDWVmKW6InDAtJAecHtK8DAMIrw3x2/ixMRb9K2Ah1HgHeQpSazLvarBp3ZwCCk8xBsAIGXUbknN7LokI6GgWEtIsvky2Wj+RCDD2HEocO48/wFNytUlWinM6Kgul1pM6BFoQ31z7CQTas4CAsDyUosoU1zZIevG1S4BEDYUALxV54o50b1xtQLyHhjgdtgpMEN+sglLsxJnVXdCFgSMwPGmpAs9a7vDzs7YWYeR0PqbdMoN0h1Q/EKx1gfd9y+M5Un+KQJ2E4C9lyOH55XKtwI5d7dsvbT349ao1947U/xssJ61j4y663RYp80aDfqn1HfcQlElwtDlde5Nhe0ZNXkYs4C308kYJ2K+i2uf/o9bvxvlTyroMNrUZXz+2mjQfxWz/pQCEv2dD+ova+gaIxmhIvHRB4WATDq/gzpY9fhls3X0JK38vY7uo95svH75uq6k10nG70pLWjtaU522WUuxsyhf26ulVvPl8W/VEsn43WgpH8gI4Xxw7g5LFVfN10lAsp0BmQtFYkEo7qLfF4rN1/8P9RmKwFwBS1m5nCNy6/4pW/SXJKX3N5J0KjkumjeE0lPOyyqTecSgyiyUHSh2QoeO0anke+CVe64bCKqwVElMbcXMRt5W+TYniTLvQqAu1DU38XN9FyL5PyNSntwsmAs1+JYi/MSom80DFEuiSHAW22qSTPVbC/9U5qa/P365auefjR6ihORPcZIll9uLP5mK9UduguTr5mVX9xKL/6nePPlS8gdtdUmNYNmANTpiVqVP+Ug0PrTOSYqkaifUYR3XXSucy1kIT5Xs5XKtPBWK3JywD/9QaiX4azVarfScMFfh+XGFR6tTLpvSqJuX4sqYjJxFNpn1FM9MFbzhmFnhuK8RzKxiPKkpa7daPvg4MsaEqbNUDWDqTbSV/Im31bm67V+MusMtyzMi5z7027qW5CedvjwNdZ895Rx/ZoKqR0+B7mdPmoj49niELkdeDkmrwuJWLfZwVfOrzliyubo8pjtTJL9m6/vc5g6pC0la4amvW1s6/HXpShqvVfhJhII6bKdOPgrYErYWdZqVoi0njKhQKKuR5JRKXWdSwLl8Flr6jsFAV4o70pTt0KqRuAN7md2WqvtwWi2n+1+FEgueBjHhC8d+8/JoPLfkZGE0Dd0/Lid0P0EXvEhu2byRpycu7tC0mgwVHpUC0uyxAxd2nuFkPmU4li1dF20iwpcNWYlPkenJ3GRqJPv6+d9+zAOogsMNw21ISzSQP379Y+k6zepf9UcQbw4d494se7VC/VYt3XBVj7aUxtv48xdvZeYnn6bF+/2tEJou2lyAPgcV6SnWo88FOiUpV6fuxa50N7sqTHomiNM7Y4LauJV6dM1WPtBVk6ennPqCbscp/CD0V/pY+5fkGt6JgsKxdnytueQsWmmYtdmM7sBTIdkBYO5o70TX1PIkuWXdPAms5e874y8cOLvja2lS3zjxkHGNjTOL4hctcJzYZ8sp3iG78L1KyCY+feSiZ4uxXiRgkJwHTvPXG/uO//KObDylzywSi9t3jJa7pbGmfBLNqxXP12dqyXckf6gUDvou+MymOEKW0KW2PqMV+go6lz11j/I0+N7WcOwI4IotHSHM93zJ87TmcWvjGGO5/sxG7ZGQXC23lliIvGrCZahT85KHm1fQ/5WMppEihzblqzJ6lvbXkYmwYTW20JmkPBe5yfe21d30JLcDG4OmJW9B2O0ZI8/+V7MmzMvaprSNd3u4U5YyCudICE2q5gn/qjW94T0GdM4nL8yaySuktQ0213+gKR/FbClig74LKsox7zXUIbtFzRPfvGffnKhl0A0F0JFqRuo26aZeIyeT9gN9AmiQxr+GgZ3Iq8sVd8RMOLp8N3nJ5u7zx2jpFwKmM8ZYgiEpbm9XSmpWvLmPPUhf1c0lPfYIfv+cTzrkfH6PmP9W6CkHdDnPyYqfHPD2fN0hxXGTzSI10iD77cbatHLWuQ7qbs9mHIXEPe/Rl7vVI/aX7DOFi/bZ7XvzmZf5PHDHWeBGdk0aigXSJnossYyWdJ/L5cJ3p5VNQxH+qs/RRk9G4XjhhMR5CTvcdBsmx5Jyt4d5gTXDR4BbAifZUbaXvCBr51Z26PU7yb6TRTT6Tu6uCgzPc7uBTRGJFz+TvQyfm15BD3flliRGz/9ESwVjPVdPBSHP0VRBwHZdGarm/wBQSwMEFAAAAAgAgrBxUfW/vD1FBAAAzgoAABUAAABjaGFyZGV0L3V0Zjhwcm9iZXIucHmtVltv6kYQfudXjJIXSIkLqU6VS1OVgElQwUa20VGeLGOPYZX1LtpdJ6W/vuMLcAxEPaeqn+KZ+b755uIhl5fnH3iynycOTCdD2/FteJq6wz/hk9jL1iUEawRXsRUTEYehTBCYhkz+zTiPLKlWEJPNau1CJ4IZRpEjfEcuN6hApmDOcFC8g0bH0QbJlGW5YHFkmBSaXtVGqvKFiGEuVWWPFUYGE1huS8bTVJEquDZbSrU20B52oH93d0sUZ8MtGHAOXhGrwUON6h2TqpKhFEaxZW6kauvOPVkAZpF6gznjK8UyuAZSaMBImG/NWoq6fmoNZ0sVqW3RpVQhgpap+SBhD7CVOcSRAIUJ0xU9NcJAJJKfpSJ8JhOWbgtTLhIqp1BtUGV618NnZwFT1KQUnlGgomrm+ZKzmMBTFqPQCJGGTWHT60OnxoUQvxYCY0n0ZXcfABn5i9zvqDRZ4Mbq77LVjF2QCtqRKfTTNDcFsEOit8BpGmqHtM624FBpAkyUtGvqPf1BhFToB60RLBFyjWnOu8RAsfB1Ery4iwAGzit8HXjewAleHyiWOk1eml/FxLINZ0RMValImC0JJ4KZ7Q1fCDF4mkwnwWuhfjwJHNv3Yex6MID5wAsmw8V04MF84c1d37YAfMRdi4tmnmvyvsUpUWaSOpmgiRjXVemvNF5NAnkC6+gdacwxMtooiOgT2Wx/aIZcilVZL0EODX0AloKQpgsfitHu0PadTJdYDvPt0tLHVhe+9CkoEm+cRuATfMxSoh5zKVUXnqQ2RehsQNjeTb/fu+7/0usDLHyyfPaA7Yy+84hctlqpkhlY8TpSGs1GySVVT9MrPqEhGX0089JYB6LIaenrgMLDxMo3tG2kMorXTGD5tqOlz0asdGHJKu+eu/SUsTWuhmTLWOtsF7YIxrehPwtn7sietuiJeaR1aa5ktRsi6R7QOQDXsUNaNC+ce+4TPELP+tIqHQmmEIaMzk0YtjXytAYUj87p8LQPzF0oA6x9fOcQSo66tpC0Pp6ppt1QfgQNqYlhtgzLrhPckVR+I0LRzTOUca+6Mnyn5B36vN7z7mNNvSr3H7QSlMRs90rqVQlFlOGxIIUmVwIucpNe3158xsAjscqj1afoi0PZKWJShnXpYBoM6WR9Ayi+9rg4XjvfwVU8u4qLsVBFR10Q+JepfO2408DRp9yEPjZ227I9z/WaqQ5t3GX79tuwHDcIZ/YJYkm/mm8NK/J/Sz4JfKL6oexjd+GMwknwv+T3A7rRp+kJdtTfFe1InCuFwpRLxVG0O/D7I9ycog8FNLbwp0fot1rHKfa6GkWO7MAeBhPn+f54liWoVCNFyhIUMRZCKrv/4nrBcBGEwYtn08t09N9ae7zEB6WHZT7ScLT9ueDsDctrdXd3UnSzMb/Br02ZNfiq3vLmAby6OsPRgNei+1aP/n2quPZ+5Brvz0XXcf8AUEsDBBQAAAAIAJuWilGHbP0VuQAAAPIAAAASAAAAY2hhcmRldC92ZXJzaW9uLnB5TY89a8NAEET7+xXDNbabw0UqQyCEpEiTQBLSipW00i2+2xP34UT/PsI4kHJmXvHGWms+vRTENLbA4B8ptSBpWFETisQlyLQic83CF9EZ1TMunIskhbbYc0aaMHjKI1cz5RTxLdWLonBti1tWkI64DjcKpfULDWeauThjTtSqT/mEJ1I8BtIrhv1I6vq/+DBHkuCGFA/Gbtam624WXYd72Dt3dEdrvp7fP17eXrfm3+7K9qLud253ML9QSwMEFAAAAAgAcI6LSpMG1zIDAAAAAQAAABcAAABjaGFyZGV0L2NsaS9fX2luaXRfXy5weeMCAFBLAwQUAAAACACblopRt4wqG4EEAACXCgAAGQAAAGNoYXJkZXQvY2xpL2NoYXJkZXRlY3QucHmNVktv2zgQvutXDFwUknZtognQiwAddrf7KNDtBt3soUgDhZZGNhFJNEgqrhHkv+8MKclyXqgOtsgZfjPzzYNaLBbRv6VROwf7rSq34OQtWtAdgjbQaoNQqwZhJ93WguwqMLjTxrEKuC0qAxU6LB1WEXalrlS3sVH0+3fZ7hrMsigCet5CuZUmKILVLXpMftGEYXjl9UZRBnvVVXpvV2fn789p4bZQ6q5WFdlAeCfeT+oTQAbSlko9UT4T76LoYw2dHoOgmHZG35G8WoJyQ8iKYlLdrndQG92CdRSKiKIFERT5naKoe9cbLApQLXMAcm110zsswnpJsKpzpNaVTuluCX2niBIsGuXQyIaIGU+azU4ai+PaHuxgZSBqNFEUd2gsgRXFiVyUuqVwRrWLr+enYrLMB2UTSKdcDpr/jYIPgyCKogpryqL1ZcCmdJ00qkO7hE62mMeeizjNPOlMCP9/QSKjA0lMUdSbAWDNr5QSZngt15TlsSpA16TsE09GGaFR1vFuALAi1EpGxMgWvAMZXBKUfwWnYUO8MPYMUoQz7rDD8chH5potE/T64NDOYTmgDD7TL4sHb6hcmgZ9znjX48xwwxny8iT+HvKnZCapl9WEyShUUINXfjsETdu5d0waIw+e6XQS96JGrB5tvgG7pdyVVJu695QxC43WO2bFyjukrpSekbo33BCwomI3TpV9I01zgN5i3TegatgHXUrFr//8LSYTJOlFRW1/9JSfNenehnBF2WiLQ4AGbd84iqMX4TUaQKgQjwhMHOnwn6iQOyGhQheURiaeXh22Yy6TdAmx2nQ0ceJ0RAvYV/GoFF8fwU2ov/j+IYP7hydtf/8QC0pDK13C9pfPYC1PQv3hZwQ6Gouvg8fYWHzeQRo+4diJU+nQe61UXUIj4S7/TBl41Gd/0dAlsii2tuX56wuIlHuizoWRTIRSf2y5iahMKe9YnTYTY2fwaei36fCSRibTbHdYqlphNQz10daKbYmnLNE0ZUeXcHPD+WT0q7Ps+uYGlOVSq6juKbeymndn8GHW8ydRvoE/qbmfj9Er+HFpqJrG0Sl+GeQXXpJMbs4mWb64/NHr7PQug2/P18Z0xS3SmVdCVlUxupvE/haJX66uLTa7PP6D/dhvqaeO84yac6/7hgm4Re5t9se0nIWXPJqehCpJUoVl4epKX3GA85FPPLIjl7STxGYdpzzzzcbm8U+vAAym8itOvzc39L5vAZh2xbqvazTXr5C1Wg0XXEzV6EdwHk87LzowaOTx24Qumk1q5/0+uzPTYJkjotIZHPB/7IL1TZdG08yueWCzQPgcZvPxWAtlpXOHJD0dkf7OTxZfde+/LEzfdZzK2QcPyelGotjusDkIuKBJYGEBPz8T3eK3yy+fVh/A7RXNMBmuO9/S4fpcN7K7De3Bk5/mpWy8zgtwSBVOBw+6N+HjRnDz0hL2snO+Epfs8tzdF6BWK9b+1i2WvoXyIclozPGiClw8+pSo6YDw447nHTFZFLyiz6g8h7goePoVRRxY9aMwjf4HUEsDBBQAAAAIAJuWilEAAAAAAgAAAAAAAAAcAAAAY2hhcmRldC9tZXRhZGF0YS9fX2luaXRfXy5weQMAUEsDBBQAAAAIAJuWilFMpTq4whIAABJMAAAdAAAAY2hhcmRldC9tZXRhZGF0YS9sYW5ndWFnZXMucHnlXNlT3MbWf+ev0I0fBr5vINd2vFHlBxtvJMbGBuPYqdREM9MwMhpprha4OJUqg23AC7YxXli84X033jXe8tBSKnUfhOZpZt76/iffaWkWzSCCNJDUd+sq5QqjVh+dPufXZ+k+rVV/+1qVpa+jnPA1EvqY1ICSEIW6VUzj/zQyMTHOCT3NjKp0N26kd+q++uqrujaksHFWYRk2KqoKw7NCj8r2IJlRZRRnogOMqEpMUowjnlEklhOABKWEmG5Rom11HXCHR1sHFNSSYKUOpLRLYhRJchPDtIgqDzSQQ8vuoCSQxCgJ6CMznAB/ASFVUSXUVFfXmeBkhzb8P8rSPqLzSJErJlnktlsSk3aTGoO3xpHCpCTxCIopTfao7OZIxCEdiTBcMiVKCoxRFnlVQRHndxg6cYICjwkxhQNBOf1kRaKjLPaRYxwX4ZGiwKDq6kCYnXu37W1mtsTjzIFeiRU4VmDqv9vburHxQENdXYxnZZnZXWC4XoxSphqa6xi4gLMqcbPloYGMulXellJJ0Lbc4aW0czPXx0qMwCZRM9MJA0+oSXgx/e30cYkpTEW7HdTCyYkmp7MykEKFzjA8F0FOFiNU5s3MmkZnkExrx15m/dpNjasZrptJibLMRXmgudbdbqvJ1mY/J6OwTbD6Aq5gUAwrOFqPwbB5sQcEag9bVhgJySBhN4dlbiq5BDoRWxHNzMEEsskBdSDMbOloaW1lCuph5EQRcpwQ49U4QIiijMoTxT2ZLMjYzYTrZVFR5F1sUKzJSJEdDRR/Mf2I6WcFhVFERlZTDmqEOBOTEKsgxsGrKLlfUSYEOlIYsbtqvCyfSrBRpJRfxMbsAXKVEyIklx5tYlq7mZ9KvP8EsvQc8E+dkop+CjMDogrTix9gBARSAtZZADSYC9AYlWvhRY54gVU392XuKrnu53q5iKywkhJJURvicH8Q7qZQnGMZ+6YtJfqMM4cBYv0oJMEgJbafB9B7a6lwlWlVzBMqYjeDCxmpFjM1EvT/cdQNdgKoKJFIvYz47rA9SzbvEQU6jQpwLPwsCXczlWG4pEWneSHjRTkVuldzZd8umAZ6AXaQVL+7NIkpOw1NJe4ayg9CQ5M98zfb3FY2FJmGxuKflQ+UhgFPlP6ufKQE7c2lQZYeAI1VkmmuGDk0l/CxQCTFFuZ/N1cZVvdTMB/RH/RdrCvi4d0Uu97vB7AAtrtYXkXbJUmU6kNtKoCCzliYBSXqQKMsIHBEO1jgJlQlfBcvoVDTEZET6qkpQ3HAkFJfbG1oaHCLwx4XQ5VeSawaF0C0+ladC6wSSkkFsLrAIyFwdQIT+vmX+p9/aQg1wfxIsor9FEDI9kqRCPxF8RKJeBts1xUKM4VxAcXNP/9N+qVEsjfM9DUs1b980YlKu1CLUuAmzsUA0E2cgpJyfQBSBfX2NtmSkfs5JVEfioRAzOCXd2/Zs/PAlp3bO0B8P4e2SGyUi4Way57YntbF+0uOvzz1Q6zk4/GyabDxsnSHVcxB5NjfostAghOhgYVMsIrtOoEJHlzIIp6rghpVjhwGzxdjaU9qu2OqJCGButmYmEwiAawkBDmL+YVKcjYLlAhQiCM7HpIHZFAYkwDXxgNIU+C9gbpN0y9/TYwd4yURK9heM6VKEF/QuIfKAUw707q1beP6b5qWJFgyvT+EIBxp3Lhx3abG9RS0B1v3bNt7sKNx9Zp1633orXyFWto3rPk7JdHSDiyEfly6c8m+q6HcbO527k7ubu5e7n7uQe5h7lHuce5J7mnuWe557kVuLvcy9yr3Ovcm9zb3Lvc+p+XSuQ+5j7lPuc+5L7lf88fyg/mh/PH8ifzJ/HB+JD+aP5U/nT+TP5sfy5/Ln89fyI/7GMwCB/MDMPYgfyL3Nj8IjDyK2D9e5u7nT+dew79HoR8bqqiGtiKelVQZgtqFk8fV5k+y5UkURT67BJ5I9PJCw7oqNKwOhAZ6hWww2qhqY2MtAxLH82A7fACDXiVw1Ksh64I1bl20JqxL1mVr0LpiXbWGrSlr2pqxrlnXrRvWTeuWNWvdtu5Y56y71j3rvvXAemg9sZ5az6zn1otQQM7hjXPWS+uV9dp6Y73NjFvvrPeZK1ba+mB9tD5Zn60v1q+ZY5nBzFDmeOZG5kTmZGY4M5IZzZzJnM2MZc5lzv/rU6gaGotcXqCDkc7Bm75kbsC75jLnI/RV8McxePFnYGLOC3gq38NK3rgrNfliyYW6Hn89agHdn4I5G3Lr1vnE2KIQowCbXARgZXg9sh4DwILDqxJdFFuWtgi2ysg6lTkN2AJk+cSVJ6yuA4ZGbGgBrGxQAaTm4IeWGfYEVctRFEssBJRze0k+ykCKHV366arsYKnHvfCzpgo/f/cBBJcTwrP6mH4eP9Jn8DNjFL82poxZ4x7+YLzAn40veFA/q5/Dp/RpPGaM4Alj0rhl3MXTxnN83fi89Pi8NLKLZ/sE/AxuS6zAeihgGytwsocGCveDxGFxNlAc5ksJnlpYTbVQ/rUuWBjhUt+agEEEvo81fA8P40l8skZ3v0OUZC6OPDSxE0H07mFcC/cDacKPM18xTSxHoHfxO/wJ38Qn8BV8rUaRltYcmnexakqREeQtXvKVEOr1EK99O4CpQXwQU+PPX3nJdkOVbNcGsTXgcMyX5ivztfnGfGu+M9+bmpk2P5gfzU/mZ/OL+ev8sfnB+ePzQ/Mn5k/OD8+PzI/OnzKfms/M5+aL+bPzY/PnAjgdeNm4edGcMC+Zl80r5lVz0pwyp80Z85p53bxh3jRvmbPmHfjvrnnPvG8+MB+aj8xhc9Q8ZZ42z5rnTD9Ox0v15q35MRjT+2ZzGlgehCG+9NB8YaV1oe6LDT7sh0v/vqKcoLNr5aaXp6DaWE6ItNMFSQ/xyCkE3kERPQRUagoY2CGfPVYx+8LMwTDzfdhekT1krx/YuxEsXSbi/8rg0M8Eo5d7krHRmH4qjrp79OsJ/R53RH/byycFMSXJxnVFNZ71HQ0cu23Z2qKPbtu+Y6d+bZd+t/Vb/c13u9v27G3f32Fc6zxgPO06vIwIratgK8VmfRR1p1j9uuiBiI7UIlFBsSHYhJH/2glTa2RQw1Rzu7KXeBY/ws/wa/wBXNo4HsSn8BiewNO+HNsSnq1dlOi+lOfsVUTBMysrtfgRgktdiq8ONcw6L419U6mxtQETMrfKNvibv6uYljCzI8wYt8Jl43MozByGW58ZViqs+nWLki9ivMgK/aIUX3rRrtJybNm6bfvOXa3fFid354EufLkQBwUSATVCcdST4I4UTY+i9uG3Tmjlz1R4YW+7zPEooXggbgcneFuHYkMg69DN/VdYh5NUtZDPfYb8ATQDed+X5VuF7Yoqc32ql44kJHgl1oX7QZKJ7mDL6/+BaZ0xgW/h2/gBfggG/Dl+gdP4I35sXMTH8BAewaNgyM/h83gKz+DTy8lR8COqtC2xmIo4PkJLG2JcivWRTnhcamirMaF2M/XgkJMs3+CBgV0oKqH+hRgo3A+CgUSwhNKnR/ACwcaqkNfXUptLl9kL2fHsxexE9lL2cvZK9mp2MjuVnc7OZK9lr2dvZG9mb2Vns7ezd7J3s/ey97MPsg+zj7KPs3PZl9lXNeoWyN2Al01EgNYFoDbltc4liazi6aVLLcG8dMLPrKyIrw+VfVup3Af+Ia5HYGwHtvSmzop5/VrW0ZiFkfeYPhLXxyH6djk/Yxbc31GwrgGdKA27z+rD2/QLEHq7/LJxCzzzYeNz7Z50J12DY50lOC7mFcPtUoXFltbLTQEzsIQaOANbEYSsWDpWI0aqQRKvhAcFRylQf2eM02DdeFlLkratEicUJaWY/4pxgcb9xtwyUrXv0NG4Mc6zKQ/AtCos7wmXYkOgEIzzFfH/x4dgx2xPfhZfBAVNgcen3v4pfgU4SNcairWzPRxM7ZIr91pe2c0pCZX1TtFcbUE3bHl/adoKbtjS5Kwq4Qq+Y1vO+3xu0xbtE10e+r6W5aHKrEs/Qe38tu36pH6Fzl/9+aEKU2+8Mh7b5j7wji6rn6QuKY70Kf0qtTn6i4EKr2S8Np7YnmkZG7cAOMBanIM8K5JSZbAOnOyFOVbp8wZcoSGQfeD7gtkHvzj7M0AWFGHe7o96vgCJfSXCjhUQdnHHTv02IOzxt9/p73brH9v2GCdLMAsOMoqwwQLCJrp79DuAsCdHevX3vP4pKRjDJZj5B5kXwjr0wV41CcDyClTa2BiKL7Lc5GoLasuSPjZgHBn8Pyo+cZechAMWBixWGXC8UBtw0pq0Ru3qgFN2fcBpV4XAWVeNwHnr4XJKTzITTnlA5rKlZSZpgUBmipYIZKZdRQLXXGUCNzOjyyw7+Qhvf+W3OmCbqngtYji3A2zZCYG27GquDqhlu8Zz014Uu+MpO7TwEEq76L2ZVbgfJK1P+Vl7AAtZcL7Lzg5WZIWgprxgYQwwTGOAQgRvDIJtPr4XT1DrPN154OChw0ba+BhkahX9/wj1/4WMwxgCu3xCxK+pZZ5R1P6Bo8YHw9ea7B+v+3UokghhZ48xhF/3LwISSVF7VCQjL6CU2gKFAan/jjRhEA/h45AsjECycNrO5i7hy5DNzeLb+A6kDQ8gbXhsp49v8Fv8YVmruM6KYDuerUwjPBS6X0wukkOUWoItIEn+dmgDq/NPWe9RQ/pxEP/z36d+n9GHQEHnfp/8fdrXAPykbfpxL4mrsneVbbEh0OSRfC3HrEwMvczgJmSfldtfXVYbLtfbBgvI/QdGFVHRggJZn0WMpRLZgNG1Rw2wvxLNchVwrTE3vGoORlqKjQoFuUtERx282Md6VDQV7gcJBGQ/j6/EHs/ynDetoMR3nRpK/Ez/oH+hVZT4jXHZqaN0qijxCaeOEo/paf0zraTEl4xLTi2lv0rKPyilnKXruHhW6PXyulTySPBwucWGQCZD9rUztMLrtytjgWqz9wuW9+MrsLRfWNnftoxV/aUW9RciYRXTgaQoPXgcg39RxPRLnKIggZ6xiopKAvChwJ80rC7a1zATVe0TPRI9NCqI1QRlLpni6TnWAXpAswc5p38KdIoH2Jzjafa5zfJJTCUhiWpPopqgfXq0vTXMyKKNFEHsp0d+jhTP3NEjT0XmmqqB7ozOA+iFhmBA97WXtUjKPFQqp18sYT6zjIS5Ilu+WCymXzRXnqkhV/4zPHjtaxNB0nYvp9SZYLmFsLDvLvX2MiCUpdPYgHbKM8mws4zO1o7G9aVzZRt8rBq63BHRBok2RLTjRDtBtJNEGybaCNFGiXaKaKeJdoZoZ4k2RrRzRDtPtAtEGyfaRaJNEO0S0S4T7QrRrhJtkmhTRJsm2gzRrhHtOtFuEO0m0W4RbZZot4l2h2h3iXaPaPeJ9oBoD4n2iGiPifaEaE+J9oxoz4n2gmhzRHtJtFdEe020N0R7S7R3RHtPtA9E04iWJtqvJH2MpAdJeoikj5P0CZI+SdLDJD1C0qMkfYqkT5P0GZI+S9JjJH2OpM+T9AWSHifpiyQ9QdKXSPoySV8h6askPUnSUyQ9TdIzS+rKC1M271P0nZTfJ/bggPdBL0ipUq/nikexIZCxUXwZm8pdB+pWSzsP0QGm8OK/ypuurciGN9WeDPtbEq9yw/iBXd96M6G/LLhi/I4645uKij/1DRyleRkOtFbi+GQ8Yhe53tjVqs85fhlfoZ75RucBfK3r0GGa5eGZmh30FvDOHexAt1ec1sUhhULIa3XE1RZ0GbvPVykbU+My9ipw6UJc7JepJjfSk+/Ug9vRHj0+LArMxsYop/ikVR5m6Vxz0es7GG+3P03ja8cfyO2oCDkWfhtgkV4Qdjinlgtnqnk21lsKPmhQckDgqGz9SiguHkWCTL8jYcvCPUr7iwtOfATT2Sc9to/leDbKo6YfVv9ofywjKUJ4VJA3NQtdrfQDHD7J1Xe2dO1h1m1YvaZ59aZNaxvCTFd7h2Nk3Lpt+mHtj34hQePFwkdAABES+ofKSSgOQZ0aS9AvufQn0NKnvx1aIDnVPkguITbORjmeUwZowJriWfqxEfRPhUGNSRCIX224pF/8/oudoHTTSNhGnY+T8w4pNhaDBIYyB8Gvi+4+VQS8Nu63Oeb9qrW+q3Xf/gb6hZouW3JtAgJ9cjFooL8b2/Zsb2sI//CNXy3ATIEAG6Y1/U4QgA9x9hdw+mjhDnDV2M/FFR/ewqYlxxIoiZgE6C6OYjz9Lg4Tl9gkBPoxlrf3Jnle7F/qQyxu5hDDxsWU/W0BYK4wpYqfbjooSjyFX9yv8A6iqD+r4HJlLh+0sZYtMpYu/0VjtNgLP4aU0HFDb36bTf2DlvT8Ntf3z4HgG2Fb6FLi1hZa8oVPQ3boOKFLv91q30freX570fX9oeVsd7Uk/v3xRWSf+u+P47GI0AM/FviiX+r+D1BLAwQUAAAACADPqkxRhohr1bMAAADvAAAAFAAAAGNvbG9yYW1hL19faW5pdF9fLnB5TY2xasNAEER7fcVCCjXyYUtuXcSKTRJCGhlSHouytpecbsXeKon+3jKRINUwj3nMA9TSj8qXq8GrRLQrRnhGtUAjlOtN5WDfPEG1qgMOiSBwSzFRAYkI3l7qw3tzgDMHctlZpQPHkY0x8LTlrhc1uJMCPukvdc5Wgih26I1+bXYxJl6so+j0ssf2q4DGxjCVetAk+m9r8sOxKhflcUIn+bijLPP+mzSxRO9hB/nabd02z25QSwMEFAAAAAgAz6pMUVLZrYaKAwAA2gkAABAAAABjb2xvcmFtYS9hbnNpLnB5tVbBkto4EL37K1Q1B0Mty9jgJJVJcQDjzJAwkAKmJqnslktjN1gbI3slsYS/35bswRjiVOYQHwD103vdbr22uSJ+lh8E2ySKfMg4VQnl5I4KlcKB9By33yWj5Zj0//RTupNAUhYBl9AhEoBMJ34wWwZkzVLoWrZtW6uESbLN4l0KZAMcBFUgyXC2nJAooYJGCgSJshiDKiO5YFwxvsFImgkTQnzLOE1l11oC3JBEqfzm+hp4d8++sRxiRruZ2Fzr1bXWDUFGNIdQi5oSLB+TDYj9l9Pvf7Wt+dJ/Xv1tW6NgalYU91kxrE0tocpCXZ1s6VX7xiJ4CVA7wYkW+4NIJQoMf9tbu6BKUKFi2KiW+azzdFrc23tn45fB8Ruzl1lToCKUkQDgLWwXDHpNabfPaT/Yp9yUcfhV5kd9s1FKJZ4El8zX7W9lT/9ApEqu1g1DxpkKw5aEdF3G9XVFVAJE7p6MAh5cDPhLACkUqVKCPe30Me8TFiVEQ3y3fQKBZ1iJPOQZJ4xLRfHIqWK42oNOjDdSxiM4UeucyJkC6BZO5Kg00Ysa8JPsBc3RKWTPVGJ2Gf8VPsFT+3cHmOqotc4E4SiORZCYifPb1xdbE54ps6uLhQoltXTLDu2zjfr6j6Y7QJNtQOm6jF7HcNsXe+XFns6ZI41au10/wJ2Qmbg8wYdPz0ID96SwC2Nw44qhfSSO54+zl1BHFfX9fPE4XIxfwvYr9mjof3wJdVxRP82XJfP7wO2Qw8/pB0M3w6iX383yrj4X7zMBreOAlGqjKZZ4cmID0ncMsAjGtaNEwDXA7SIIZnWgZ4AvwXQ6f6wB/TLHQ3Am5RngfngbzFbDU+CVAfwvw9kZ47UBHu8mq6AOvCnLXQarOvDWMsgVWSWAT3Y9aGvKRHrAwUxTnPg8z4SCuGOGSg9AjtYn2bqYRxzYmIq4mPHp5PZuZXoVBp+N/FunArBXRdgAbgWYXh0ZvQooemUQBPqnOR6CUgsBrwLKXmkMgVcVoHtVMV5XgOnVMfmbmhdGNPr2C17wmrzgNXnBa/KC1+QFr8kLXpMXvCYveE1e8H6vF1ynyQyu0+QG12myg+s0+cF1mgzhOk2OcJ0mS7hO3RNLdUh/8IBYaGKpZSLjyf2xscU9zOaL++G0jPSqMwiHU/13xLEs/ewx8PFB1La0B48xY8i2ZWp4jhUFta3ifVAGy5dD2/ofUEsDBBQAAAAIAM+qTFHLxBHTcQsAABUpAAAXAAAAY29sb3JhbWEvYW5zaXRvd2luMzIucHmtWm1z27gR/u5fgZ4/iEol+a3TaZ1qUlnWxU4c58Z2xk1tlwNTkMQzRfAIMLZ6vf/eXbyQ4Kt1aT2TEV92H+wuFs8uwOySKU82abhcSfKBx1SuaEzOaCojtiGH+wdHI3JyfUqOhtOIZoKRKAxYLNiACMbIxfl0dnk9I4swYqOdcJ3wVJKU2SuxEfaSi52dRcrXZERjERLzdALXP/IU0PDqhAZP+upabiJ4aH5OZhdG9zmMJUvXVv02jG/gdoAXUx7xVF0prULh6NCKw808igb4S5PQl0zInZ0dizkmlzwG0xdGjoSCxFyqp8c7BP4KSTOw1wf9IKJCgKkpo+vblCYJSz3++DMLZF+r9Xo99YsvBaFEKFHiiSxYESrgfs4z2R8QGsgwXuIjSmQKcUpoymJJkpS/bMiCp4RGkYKiUqbhYyYZ6AQMhqcgKonyec3kis9J7zkNJfP6PfB3FcJI4M6cRWxJJZsTyQnPUoU15fE3loJjJIyFpHEAM+maPWcL4vthHErf9wSLFgCo3JwPSGB1jav4t0vAnceIDbN4zlIRwPQSBlIbuULvYOQkhXvwCyO3YgLiKlckpmu45AsHJ/cSnsdErpgd2IZQh3mUq6B1I9+3UmMrXxUwZkNAx4ULO463SyZx8NxhNM5xMWUyS2NipLzysEbahWOYNznYG5ouBfy8eXrGq1LoRMKCkEZ2EiPOn7KEPG4SyDEIg2PZXn6tQuT7akU6UCspE3G8twdzGjxx8HER8edRwNd7v2SQ+SGPxd7B4Z+PDv/y1z/tPa82wzlnIpZDgzp85unTEKdmyF5C6QDLVSbU1Ev2IqPwkazpMgyMyZCKMN+4bjBrQ5iFbyF17a4GsRy8URGsaphKAX1xsrE9nq1DaPX2EfTa0fDopYNZTaGRllVSBUAowNuNQnB1ddqOKxbl74F7ej99nZ5Nrj75Z5+vb2anPViUwJ0jFn8LUx4XUEbcIDpURWg8B27JnwMHw0iaY3yfQM43vGMpRLxfRncCeJNmRWbJdFMW1Hi+dhmdU/cjfZ9LspeAJcD4NmFnacrTMpAZ7UcaiWI4BjeNYqVhPRP7v0PWAQGbcXEmgogLNv+9M1FzsjToSIN+h28qkrZmYKW74bdYoporxvk6idgaFgRWhJzQLTkoWh8gNQLEnD8LrGxQt8DGMCGTy+tzEqxoClWFaaYXDFY+8LvQhQIJFdN2oFIGkgkyJMmkNCwNNUhuDKTJdlSBxIklt/UQiusiiwNkExJAdRLl2oFG+FP4dzWDWKcM6SeBXsHr3e/vH7y73z86ur+/87x3x/f38/+87b/pe3d0+O/J8J8PfZA4fNfrE6QcqFEy5RG5Nh6Qc7yfZ4HxTI3z+XraOc6Dd/eve/oAY9xTB7342yWfIXeoCsD1RkjwdcrXa4iOyz2dlXCMS3Cgp8Bc0wxYggkmxyqxS3R/U69pXszTNURyo1anXrdq1eo7WKn9MhfVq51bT1Y8iyBVGFEmgJnQJQmcXnCGZhFm1gJrv6rQxJBZZYTcAxgjv3ZHCcBy6EUwoXSvoizBMEKTYdLK+FdGzpdhuX3Ko6pWbTESj/1nneqgAqyIhZaMx6QXy55jzi3mtZCY0mgSrI7JT+cE6xkskUcWqD4WWxCUgNBgxSpWkQME79Z0AyokE6ozI9j/QfcYATCVRFXMHriWJarBLEZzQDw2Wo7IdLME08mN0e+PIIVBHkg4oGBNKHuCQKWHidHLUou5VZeXhtHLm8+ZKNofnYMC1qJvRFVaOFHDhe50v16/OVccBqlwRjGf79yqpRXAmaJZzudZvRo3Gwd57WHhcpLBcKsytfrKcn2/lkVqCPXb4pG+sjxWcQ0ZzbCZIrGSb1an0Tv7ssW/Jicc/5p8K7tWxS8tu3kYADUsiNpRqVwguR+WlfWcw+4AlgpklahwB8r6ymdbC6FR853H5RTBlfLMiuWtCeldGRQjoJ5bSMtQpuPQLwtK1XOjSnC1TNs6gn9YOvWSxkWjCihcQHXLFFvGjM2huSPnC7JAnh3gMtG7Bp2w1dqvChtODixvulhA9VW9O6SkeuOkA0qEQmSKkXiO40YBSdo0YblFKeRXmKJNN2iyQl2yGCoMvn0sWhxVF5CBYh4PDQuRJKIStnxroKwsjnCPxxOcUOAeO7c0CqHhisKnAqqg6hVFuyECaAasdYi/JjHd7GKmYCVzEs4Ntts52xzEIlQsN3tXKQg4odUUqkwq8oWLa0gJOa+xZ/q11pbmRwSjq9n17MafXFwcE89gjJQ1PsWdfn/QoXtydf7+7MZRFPq4wR4hGIFOjNPzTx0Al5+vPk0uOgG0yPdi4NnJ6ORiMv3oICzUgYo9EtGvu/SvZqft2vCyS/f91Wx22a6tXnfpf51dXHy+bQfQ77u9/zLrcv7LrEv70+T97PJm0g5gBLowpl8nHSHAt13at2fnNx0OQAS/dk8eLICaepfGBSa1Sgp/9o9X0magWPdVNEiSTix4vyWSSphOLCWxJZrOnk44LbIlHmbTK0H7MtsSyyRWJ5yR2RIRM60TDgW2xFJZ+do8fO0Ew9PcGjc9qiPerbhJ6Ze5qaLdzk1Kt8pNFe0ublL6NW6qAHRyk/G+xE0151u5SWnXuakC0M1NCqPCTRWADm5S2lVuqkewjZvM5JW5Sat3abRxU1PavJ58zdxUT6ItkRq4qSmltkRr4qbGBNsSr85NDem2JVYjNzUn35aIdW5qSMUtsRq4qSExG8F+qza4uIXytjv4tW1ruf01TWxlz6t3PQDlQ3Nrz4rNGbEVqh9supul0rFyq9AiysTKaeGtjXlT3jBA3h6rr1fW8eJpd7feAIhNvu73vd66NyDe/qDvugkI7h4Ygte+LX41IJW233WhHvDGeXS3ObeoovaIyxDPg1DUfBurnMuZMz2136PxRp0gONvejoNVu22DPZ+xSx2w2pNUvdEsznCKQ9SqsUGWCvXJar84pkZ7x6UJ8rkIKmmDXw7XVOI3QLOlc85lRwvYcEIUUq8SJ+WYpCm4wWI8R1IQI5HQ2GtMSYw+7FrD2EckT0dAGz3QSA1q1mo8w/De6CGWKc8S4R7zlNwHa6onoJ1DRyzWvtWTxdEpcmXguF1ZCPic/A1fbLVy75TCMYg/bLGIC+NKQdGGqRMcTMF4iYfN6lR621WqdW2egF34TcDXTz2DVRqhaZ6KRV7RcA2vYGvTG0comW4kMD17Z4tei/UySyLmwZrxkj5q4bzC1R9gQSgyJQcq0xOEcYaCjI1C6fXe9ioJ9bwKI6ZRtCMws4f1b2C7+VF5/V1um7n4I/EOBl0U3+zMK2ZXnC17Yd8ZF8Yg8Pt8qMT/w8d1ry5Ush0JviaheN4FmpxMT19FwmhVa7J+6y6HIvcaM6o5mfC7QNUVFWjUKYLdGJBcpnpK2uwPHsj56lRtXNO4U1gPrXqgkqvf7TfLGehC7uC4WdCc7Y11X5MfxI7L57L1ybPG1D+J27e16f1QCa1txVhKBfNFkLI8K8Et/Ez5mjG1IT52DhGFMfsfB0CuUW92bXVJuAjVx8whoY+CR5lkjSZgs6RVfKtibPkuQ/RaaTEkZRGV0J6UDIlz0qkmzS6ZgFKWDMgJ/M75czwgU7iC3Ic5hUVzCjfYMJe0XgYEv93/2puAHbDAyTDuD0jvxNypmyneANo+3qC93lDd/XZnfHlojJWJE53/nAnp4UBdMapXQWxoGju5lr5Gfwf+P/Q1prtSlfxYqTwAw6tb7AAeGpi9XKBzcNvRVJnb4aqT2UU7FZmSEPAMCsYPb39QPH/wCrnWiwlqNursQgkd4v8WiJfQuoYy0v+NJIQpgE0W098ueIwtrCPThnVQYOUIc17+UBqKNu3DiiWNYnlgIPvVCto/bKk1+OeuWoVpeePA6ctM9cHp3fkvUEsDBBQAAAAIAM+qTFEbb0VygwIAAHsHAAAWAAAAY29sb3JhbWEvaW5pdGlhbGlzZS5weY1UTY/TMBC951eM1MOmqxDBFgmpUiSgFLEI7WVXcABUuc2kNTh2NXYo+ffYzpeT7dKNVNWeGY/fm3njGazUsSa+Pxj4rCQzBybhEyMjsIabl68WKby//wCLFyvBKo0g+A6lxgQ0Iny5Xa3v7tdQcIFpxMujIgPM4F9uut1OSbs3gm87i651FBWkSkiZ1NyoE5eLG2i976zpQX1zpiiKlAW20SZXlYEM7pTE3oREnSk6ETseMZ9EBtYwuMG3ye3G2j4yoa0xyrEAQo1mw4SI58sI7MeLEA9wDVIZn2bp3DO41bpCmL15vQS1/YU7o6H0pdziTpXoQ21BwFcE2i9IGQcE52lwf4uIS25iVhnlXZkHm7ia/kEymctuG2GIH9u1o5w9UIWWQMfAQXZ2YDK3vzr+3ifsU7VZfra83UeM23Z/ZaLCNZGi+Mon9xDcscIqwdI9cXNwWUGZAxIw2vv7r+bN/XuhtkzAuEEJjFsTRgYFSSDodZNurAerpLTZjJxNs1tnf9RWYoh3rfRt7Omel5DzoCU8xAU5sseHfvRxXU7rI2RlPOI1rnoCQUPcmfkEsCP0P8CBup8E3MQ8OnQZsI17BuCwhcGAhRoMzAO6xmiVv+faIMX9CMwnId28OnG1w5GjH49hVkN1hLN6vnlB9DRBW/AnEzS1G6kzeju8dGm7LJlkeyQPdqeEIlayjXPE13ZOdALX179PbtVRcHSmLu8xVA8gao4i97uCS1uqwNWVpH/QJhWaCPZykcYHzqR5Xqkm896gC9XW/F0W2ojJdBjcTeHj2iYdSbx7O8cXZdPrsn41CLEnTqk+qErkG7eNgzfT8/aX9pxtrDf4GEJTkWxDon9QSwMEFAAAAAgAz6pMUQgbDBFQBQAAHBUAABEAAABjb2xvcmFtYS93aW4zMi5wec1XW2+jRhR+968YJdoatgTl8hY1D4njdF157ch4layqFcJwCLSYsWaGON5f3zMMhsFcsklbaVFkhTPn9h3ObY7JiG52LH6KBPmDpp6IvJR88phIYEfOT88ubHLj3JKLk1HiZRxIEvuQcrAIByDTyWg8c8YkjBOwB4NjEjK6Jts4XXkc7GjgLG/nX5bkipycncmX8WKRv5wPBoLtLgcEn3i9oUwQX+w2wHNKrkS970+n8Yp5bDelXgAsZ0IjQZKgttqRocTshzi9nU7NLnUorMzBiw8bQYxrIVi8ygSMGaPMIpOcL38xL+v2ZjSFnOKAGNGU0wSW8CJKDciSeOtV4JGP7mXFjfLeJnYFcNHCAQmHyy5vVzsGoUUcwTJfZAxj77t+5KGb9/PJbDleDHLJ0Xy+uEXde3C2m1PUoZ94nCPLzJlPx64zWozHM/fmy93deOFOZndzo9Re4JXP0dERz8kkTqVan6Z2ZCO15HDDGJKAu2j2z5IoH+Mo2DrxdziylF+m1TgeZYxTdk95LGKadjJuy8hy5CnBPbTxcoYfPqBbndH5fD2duovxaNniw2fvJV5nayXV4e+38r8AQuK6GBLXNTgkoRYq+TDA+KVkaHwIrN4/c0g+EKMmKx+p0lZhs79atdfHBnN5Xg+jJnhw0KlCC3AXyz6u9pJuDklTCMUh7YYKQdeH1IVsMt1AGt9Cw9I8q8MxVZa7v4NwRPDJw1oFVQpYtPbfwFJILs5t/bgpYHvsSRWens1lIt3KlFNp8a1FmGFlI59egJ+uZ7fTceVa0S4cnwGkN1kYApukIW13tIP5NWWvgFAuVclddBCjuzOYh5C7DLcE4GY+nxbwu7vlIfYOzl41b0Rd6yI1fF36fxRcveh60dVZ+xW9EV/ewjpwHSjuB3YXJ0khN8/EJhMjnDueL4Bdt2Dr4X5V3RsRFhOwt0oPIqGne529nuJ9Tr4xWn1p3s38mrJ/n+z/d8TeXjfLGBfOh/5ukLO0C74Skun96MFZLjoKXWno9TSf/NoKZ0R509cWAJ+vYpTt2bDMkpdnvg9c+trTT+v7gbJnqV3QkMbMSl+xeKwoTYxCt1n5rbutOVwIeenOqCMzSUgZiXDna8xqfIza1DPUhm9apEHGXd80NTd6kOJGBd7ajYOrQl3lZbQf5XX9pYT5M30ASa0Ad4ySyneLeEjk70JbWOyaV8beXWWhzan6HNC92hQ0lA7+yri4WrJMT/VNNd3yZmF83FMq/47JJCQigoo55oRmgtCQMC99QtcCSlIqojh9skuxOCwF7K/ktytySjAXS9JjTmrbujXD17nTeRKrfZEPO2FfanL4nNlkBegQOT2RN1iMxTbCqy25njkTCeBMke261LlN4GUDvpCSxou1M2tyeGvmxNhZL2YlpwILgduIpQb/hJxZOnZ8N/VIKSX1aNTgP8ewlTfIISfcZxSvrxt92yirgaH1njooirJc5GvCDSTo+K9XqFPeFV7hfCw45RVCC+kCeLYGTA629tBlRmWtYmz/kzI5SPuyTg6d02qmeyHQq0bdyBNIn0SE9xbhMfG+PoZ6kE8tOIb8sQFv3gEYWsNRZvRZlY9lQ9ErvjRbu1sWCwFpk/lUL9cZxS1FRJ7AH8x0/EPLwYk0HOTJlOey8cxRSwAm9kGcFnZbR+3Zn9pbakvk9n1W87/ZbrVD+9lLMuj5ZJ3tt/uTDYfDPj0kKg6svO/r12jsbVs8lPdUPKSUBaqmLPKLL4PBH4pPYqKNd6SIV18rq+3OkCc/cZbsy7EnrK0ZUgL+oTRpm8ByxzOE/G2uQI1dsGAc/ANQSwMEFAAAAAgAz6pMUaIo1ubuBQAAJhkAABMAAABjb2xvcmFtYS93aW50ZXJtLnB57RjbbhpH9J2vOBJSDAnegp2mUSUi2Zg4Th2owFHiJ7SXwWyyzKDZ2WAqq9/eM5ddZpYFQxJXfSgv3jNz7vdxHXpsseLx3UzAe0Z9MfMpvPO5SMgKTtqdUw/OxxdwetxL/CwlkMQhoSlpQUoIXF/1+oNxH6ZxQrzalLM5eBDPF4wLWMb09KRWq9VBnSMYMurNamHipyl8immPJYw3WPCFhKL5ew3wd3591vsD/3ahbeCPfVBwR8GXo35/oOATBfduzwb6/lTBo/4FaPilgj+cXfYHN2cI/6rg2/719fCTvH+V87vV+L/tUHQsVglxFR0MRx/OrsH5odL37TbUIYrnIMi9aKmvwA+/3nGW0UibNLq6fHdTQfkaKQMdh0eIJ+fopcvR8OPgwhC/dsUaNhbx2pgbwudrWxTXiExhMolpLCaTRkqSqTFS/iToTRDDzxKBslRUvUsieoymLCHjkBNCz7PplPArOmUNjTC+uRh+vGl6yzMheBxkgqQuy5SIiY93acOR0KwWPJkyTlC6PpTAFjxpcoEngS14qQxpgaigArMOVxQYjwgHwYDMs8QXMtWl5/ufIabSCRFbpi1YEggY52wJYkby0CpunsVuzPDaF2sWocz8FHwaOTQQMaBMQJiwIEDpxA9nwJAzb1ncUKbg0ky8mKMBC5+jfskKKxIz11Y0BfaN8CWPhSAUghW8Rcf9cm57pW4rsUmgMh/VjUjqlTyZqBSThVrk0J0TUyuJOBEZp1b04IUVIngOnVd40rCCAQ+2mOZahps3LfjmJxnZyFeTLuoSnmFxu9cmSxr6/s0beNmswMpzJOfSyFuBZ/z1AKUTqzAtlTlRSieJUZlRZI3ZxbsDRjd0368wJFaoK7ChsLs7y6giWNJFRiH5qXRpgULsvvUT2eHXiqoDS9NY08uMkXTrC/lzatUu4OogOTd16JfrbRmLWZ6hY6dQUQulryvetvihWw5RgUrQou2Ez7rw9zbKjQCs/VR8WeGXyWYcLT8PdrRK1kpHO83O7oDV6R64hb/L0faE+XGfW9y+3/1VTA6MhCpoEwr1bWKx0/26C1T63x0izmjZ0koq7g5Q38LURujK38MIhVhthL4yRqw7+LqD4D4YKeXtyW4zLyS7jDfp+qNRgWEOiz3iBheXYldoaFpjYNOdMAuWxiJm1PhAo1rm5vf7LCuG2IuWvYynjP9paK0yOSeh2ns/6ZmPwxBXgxj3ZIIDHBtY+zjwUxLZE1qO1LJ9Ln8g9wtcwFLoaGpvQ3vvM7zIt17n/NY9N6M1vy5lixJa9lgO7pM4hTMrcwc3paO5XlkyzgkVyUrvJjG9UxtRTo71JncgokcGZWCKxSuxs2JX5GOhfdNB1ob/y1nqRrFI01xFK1ON6/3oS5YK4/j7Fqx2+ftpbNjpU1MABbLWl0QTi6ph5560wM5RuG8e6q0NGfmRccjaiYRjcUxSVbXGh3PcRbvtXV6sQxvSGcuSCBdp4nP9qpPZqGMil3oJEaxSNlWfWoK9snf2YhGQu5hSmexbGZ24jLRgEfMct6W6xRz3bot3o9PqPHUDDtMgPqBFWiZhAik7aDaXrxQ0PZzhGyQUCIQkSVL5RDLOkk0BAsVtLVni4HPTBBaVkLpgDx7HfxHMqecOfFuSvF1qQNRGmUs17lyUW7oWr5FNh9yugpvCqgCqbz7bAZFJCl1ct0uLMWbRRM2PtcAtc2etqGATVQaSpOS44ypbrA3L0qSzQxOdAr3hcHTRwMpqN/fRYg+ZJz9bZmH5ji2yjsmHD7Y4Umrsmhh1+V+rZLMi9R4cJD79mpZa21skMHUyzMQiE708BYvmdgRHrZL+Lct0u44oW8oprTuJKpGjVG08+v8l4IehWjXuktVjemxuTuV1bj+ltkcPZ3Mm7Ba4VNOcEhKRyMHccwpgj4NOc6PZJzElT9nqJf+f0OjLbLa3eRfzv9XLn7BVOe30+NGm+b3NakubfqydHKLNAW3sh7TRvvq/tf3k1uY8iEQsisez+raaycaLVOFqrNo/UEsDBBQAAAAIABxlPVL8oDOEfQIAAGsEAAAYAAAAcGlvaW5zdGFsbGVyL19faW5pdF9fLnB5dVNha9swEP3uX3GoFGxInbbsU7eOZWnKzIoz4rSljBEU+eJoyJInyU1D6X/fyXHbhLEQSKR79/Tu7t0RjE2ztbJae4hFAuenZx9OGosOtYcfivuVsXU2hU/CaM+F/9L0d9Kkxlafo6PoCG6kQO2whFaXaMGvEUYNF/TTRwZwh9ZJo+E8PYU4AFgfYslHYtiaFmq+BW08tA6JQjpYSYWATwIbD1KDMHWjJNcCYSP9unumJ0mJ4qGnMEvPCc0J39BptY8D7jvB9Fl731wMh5vNJuWd1lDOUO1wbniTjSd5MTkhvV3GrVboHFj800pLlS63wBuSI/iSRCq+AWOBVxYp5k2Qu7HSS10NwJmV33CLxFJK561ctv6gV6/iqOR9AHWLa2CjArKCwddRkRUD4rjP5t+mt3O4H81mo3yeTQqYzmA8za+yeTbN6XQNo/wBvmf51QCQOkXP4FOYqQsiZegilqFlBeKBAJprd3YNCrmSgurSVcsrhMo8otVUDjRIs3dhlo7klcSiZC09993NP0WlUUQPGutBmaoigpSMtJJVFN1NZgXphUuIzwZwSt8kWiwedz5ZLOiepSz9baSOf1JTYpd0+lzobZ/7K4koxUuvcJfwbs4TqZ3nSqFlBCnRCSsb/8Y80vAG6Gj3rD42Flkgbq3aoYNXHJnl0Psdhrd+bewOtsdxw5cuPIw1lz3J2wJJoyhKfaiJgTC953phnReD7UK6eN3NXfB9Vf+zpoHwtc9L7qQYd82OQ5T7S3YcK3xEpXmNibuA47gmU9B8E8eS6HBAaSmF79OjsDDPrJ8NuwAaGAtwuqDTM6Oa3vsdLrpn6B/L8uspe3l5iZLoL1BLAwQUAAAACADIbTZSjQJUc1wGAACDEAAAGAAAAHBpb2luc3RhbGxlci9fX21haW5fXy5wecVXWW/cNhB+168gZBiQgJWcBn1yqyCO7bSLGmvDR9IgLRSuxNWy1ooqSe2Bov+9MzxWko/CaQt0H2yRGs75zTfUATkV7U7yaqlJVMTk9atvvk1ayRRrNLmqqV4IuZpeku8L0Wha6Let2+MiFbJ6ExwEB+SCF6xRrCRdUzJJ9JKRk5YW8M+9mZAPTCouGvI6fUUiFAjdqzD+DjTsREdWdEcaoUmnGKjgiix4zQjbFqzVhDekEKu25rQpGNlwvTRmnJIUVHxyKsRcU5CmIN/CajGUI1Qbh+G31Lo9PjrabDYpNb5iOEe1lVNHF9PT89nNeQL+mhN3Tc2UIpL93nEJkc53hLbgTkHn4GRNN0RIQivJ4J0W6O5Gcs2bakKUWOgNlQy0lFxpyeedHuXKOwchDwUgW7Qh4ckNmd6E5N3JzfRmAjo+Tm9/vLy7JR9Prq9PZrfT8xtyeU1OL2dn09vp5QxW78nJ7BP5aTo7mxAGmQIzbIs1VegkxyyyElN2w9jIAairWauWFXzBC4irqTpaMVKJNZMNhENaBrVXWEsF7pWgpeYrrqk2O4+CSoMADAqpSS2qChT4pVD+ySPKr9VO7Q8VkOH7IFhIsSItF7xRmtY1M1Hg+zzXXNcszyfwuLYYw0UhJIDOYge2JqTTvH6sJoXK33td+MzkU0I7vYRieJeWDM5QRex2btZBAOGRzAeZVkxfwCOTUZ43dAUOxkEQvDXhpJUUXRvhdhauAKvhBPCyFvcsR1yLTucA9RUkN7uVHYv9MR+eMCFFo3hbKSpjKNtnZH/OyYdJAgfmAloO7Kl8UdPKGJiQki1oV+vsPa2xV5esbrPwgxUm4E/b6fAJdWrZ6VJsmgSytRQrdpQkjXi0+6y1UXC91pKt/97Bh2cCbGc4yKsGqp7YsoQTs72CU7ytmdVjtmx0J1Bu5BBBrmx14WkOLWh0lCTyB4k1YrAO6OZb4J66LKgsYUsCodS12LAyBnvP+dXuWp5waIxt0sk6HHpx2ikNaJtTyPPd9YVnK+fSFQASm2+KZ0nkkkC+IHUp4C5UbFhLYU+z+MvQiZYqlSNps60O4Ci2knWp0NsJcVAAdnLlyl25MNnriUtEbpMJ+AJTuYkhhxiC+JiQA9iseaOPgbOQBDMtRAKo3SVUVt0K5ocy5vjCGzs2a/w9bpNw2HFhnCp4w9asjrzo2fm7ux9ir3HsT69YqJQ1ay5F8zm8ml7lwIHnP+eQ2vBX6M4HUbhkpGL+2+cQYYcy8N8bwXe2MctcdXPXlL0xyXQnm8DqMUlnxVJE4XTPUq5Dj8mhCsnhkKLiR6f8sPXCnhZT/xBpOGyRHD9x3GLmgUXgUs8bzx7BRhjKsy0rOo0ljW1sWu76oJFZU1epvL8M5LgfvQRM1g831vcMnV5NL/d5O/e7SLMgMkg55dAqNohT/LsXjWBwRiAbe6JNXb2ifUt4XLrO1LBm2vWjZxgAEGwWm9Ju+3nvqNGmY9eyzGq8gtRFe+fYFqa38iyKt5dc3NOd5zAuh0u8Hpi2sUuYzqJeQ45Ao9kyWmNsaGxenE2RdTg+DnrwuaGVDt/7+O2YsefNkIrcUaQGI4SbgzQZQ6ZGXnJU+eG8i+IeECYTykBqv2kSfNtT2aEi0aGKYc4BiOEqonGEK3Olg5sDpCENR2cPSdTj39p1MI5iO8yxTA5RAFiTtyiOJyMtiyoL8Urmp4FJ6RB+UY+/adM7Y50+l1LIwSUiPYPyomk1E/q9gKtObPD5InR+bWbwIjzIzi/NNaPK9fV/kSkgfuyXOB4k5hEkQmzqpyY/7bRIuraStHRTf7jztRPf+ZvgtTPspWfg73MztexWbQJsoVn4/zTls1MWic62iJmzmJfc5WXi2TnHSME4BJGbIJ5qN/MCBpIhXKtxVHhg1sxNL6xwFNqLk70ijftg6EQ28mgkNvQuG7n6oHvwB/Ox9/94pMd43L90vJQh4AYhT2yEmV29gE5Myw2aYvh5egomsZWSN081iDFhk2Tq42ILvQ/21WCYQZ+E/45M1rTmZe8g+veP2eL0+ZCRJhaYlzFD4CQ37T3qbsQnfm9E4xGCF0MAUfbHn/HgVkf8tQ6aG4LpWAJ2k5ZK+MgAjgJqATYBbMCXanLPdhshS7z4gRlAhv/oIVlGwjxHo3keWqv2isF1ZF2Jg78AUEsDBBQAAAAIALpkPVLB+/rFmwsAABkoAAAUAAAAcGlvaW5zdGFsbGVyL2NvcmUucHnVWl9v2zgSf/en4CoIIN/ZSrdd9CG3OVwuTbHGpXEQOw0WbaHSEm1zK4takorrW/Q++81QpCTKdpIm+3DnAq4lDYczw5nf/FEOyJkoNpIvlpqESZ+8fPHjT8NCMsVyTa4yqudCrkZj8nMick0T/Y/C3uMiEnLx995B74Bc8ITliqWkzFMmiV4yclrQBP6zTwbkPZOKi5y8jF6QEAkC+yjo/w04bERJVnRDcqFJqRiw4IrMecYI+5qwQhOek0SsiozTPGFkzfXSbGOZRMDiV8tCzDQFagr0BVzN23SEaiMwfJZaF8dHR+v1OqJGVlTnKKvo1NHF6Oz8cnI+BHnNips8Y0oRyX4vuQRNZxtCCxAnoTMQMqNrIiShC8ngmRYo7lpyzfPFgCgx12sqGXBJudKSz0rt2coJByq3CcBaNCfB6YSMJgH55+lkNBkAj9vR9JfxzZTcnl5fn15OR+cTMr4mZ+PLN6PpaHwJV2/J6eWv5F+jyzcDwsBSsA37imeqUEiOVmQpmmzCmCcAnKu5VgVL+JwnoFe+KOmCkYW4YzIHdUjB4OwVnqUC8VLgkvEV11SbO1tKRb0ebCikJr8pkbvfmVgsgJm7FMr9ct7lrlU5K6RIQHR3R/MVq3kmcABfalq2ornmSXxX+VqvN5diRQoueK40zTJmlEfS2NHE8cB6GFwMyFKswFdLzbNeD2QkJ07SaMH0BfxkMozjnK5YHPd7vavROD4bX5/Hb87fn1+Mr+Kb6wtYE6BvKXCuBRi/nEXguEdN2LR/Upks+R07Stkdy0QR/ZsXQe/m6s3p9DweXU7Pr9+fIsPXL8hfqq+XP8HXK0IO4CulG9Xr9VI2JyBdnAjJ4pTLEHgnLNYilkLok7c0U6x/3EOf53MwNarC8rswuLo4nb4dX7+rlRhdB5YQP5LpUuYPLuiZBW5zEBYWFFQvo9/A7CGaMgLnA0+BsJZh8J+gPyBB1NgAOFjRTOwj/WgS34Lzjm8nW9K4fapd1zw3SnZ2VuDgOpVg2NDR9z+8+ET+SoKPH9tbt4xiFnKF9mtz3bZH+6l5puWmIQJmRoUlVXEO7kVVwnmcLKlsRMEg9M6oWY4fEGZFvzCgVL4oHpVBQFGwPPTs3V4AdkYEjfSqMEZfB31CAVULfz/8zIsI4YqFgWZKB/2uQJKtAAAeuZW/ep/Zqqg7RlcuNhnP9TFgH4LpyQywclg9rjkVFBCgt9MRmgBAFDcRgEKeXIrc+X3LO/ERHoAXMZXE5lHHfx0J+qzh77ur7zj4s+Uw7YM0j9ry4w0ru0WnuHFMI1molqVOxTqPAcEQmE6msgR0slhRBfaA8EWOMhYbvQQAbmvtOabdNt63mXdmWzt3bww8cieR/d9/2JHPv2xI+y2naKF+dIa4nV5VV+dSYpZVSNeodkBGSpWMHLx8+eMxuRXyC5UCEpFJZ7c8B8EVGU/IeslyLC4k4jcx9QzHJAbpjiasxe6x8D1Eyw3r5HLEUQx1BGK08cA3bQfgvGcAkiSAf1A87HDPLhX6X5fSh370l2Zt/3hXXD7OIZ7gFA86xnc4R+MgRnLKlakLbfzsVeG5AVQjE2mgKR0KUysM72iGzKqCYihKrXjKhloUGbKHIiIHV0uH1fOajqEH1w/vqOTId0CSDZYyltpsvrd2Acy/6zkQ6qrYnDFeRe3HMd6Jwf2x9Alt3kZmDhnhZ5RIRjWrHApvhPeekMVNcxGzr6yLng18I2/0VLPfDHKBwUu7OSanigmUCiyok2gTJoTBUTmiKm33LbKvVhgQJ+RDIwawG64CZArlFPxnTYg/hzfBJ2c76weNyUw1GbFkKcJgVK3Bipc6yhX2RLZwxMai1R6dgVVaadOKBZ0F6JiGu+pEC3ig14MCPHqfYKus8nJAC1YhkyVfIGNmWWh5eAB87kpiA7Y7k7QUEAudLG28G84CepiwhTzb5+lDkVu2jTnBaG5awyW9g94Nivs7Lkt1NIcWbA2yQ908Z6bjcD0WMZ2f2ijNVoNgmx8aBPszqwbh2mQJCskB65ePOTlUATmsRHoIfyoTRXC6IxekteF8XYIzUWaphWxD2j3U450b2wBrcO05QVYTttzkoYBr/Glgo67XOKoyntqw/Zh3lIJzU2TGIO2qMkG/m5dZtnEmgBYXPEpgk8uVgJVwA4TlUuQm0j4fqs8/fMybUzys4arRZb44CbDrzmsBu/IFU+hGceOqwIMNP/v6f8bGGzdD+/u2Hhj+yYbmNp624gAuEPXFMBPQz+63TRD0rC/nOCIAnamxyE55DPYL07jbIYPprgcgHaM4KLA+NFky+D6rAlj1QpqmXb8i4AcUfB6MxhIt4BdqiruaRt8Eimf1q9PpL8QlJkiEPRwSuIooFYmK/AnQUUEX7MhKZOSMlnqVHdg7Q4UyDhMnIxrCP89HuWx9DO1TtiUMZnVbChhYCwGuXXKnJRRDZbGQNGXunmv9ccrx/5TunwUDf1b4mx2emvCfkeglU2WmYb8/vtXFj9+BYQMa+jZqd+8d0B7lcKI8baLlbKvoDVqhBMySUpuUgbvOTX8BuaaGjd36toD8HqE9E/qcnNXAKTSLcIQG/fXztGpSUaVFw7oauDqtvFWH5DuF7GreaUbxMKOySGFBOGc6WdqSMjY8wsbD+t/ZGDabuKqCRRCtRamjlCUiZeH+RP591rPx2XKSlUhLKCKIkWZfQq8iiAtTYrti8gTbUbjQ7k5oTQQ2DoM2qRuvAMbBKvwGJWdCZGGHZ1RIJpnNF/OtHU2cVbPBVny5I6nl/cPX3jWawXGnQx106NwoxhHWo5kupXMgINzlVDuIbXBtLdiBdNUiDxJwmZ/ifeoaf2uDH3vT4g7v2k+Rb9OA+FRVlgUKA3YoMN7ZFGxLVq5i22sY28ISuGxovrVrMDjUdiZrHN8LNUvZPX47POiOzKMJcArbbPvbw8InhE2tYLc6cfIcKpIKpoxcKwp4UD+xb1ywNlFAFm0X9fg5JCE2HR01+36y728tbe5YgHmPab6KX494Z1FXa2UtsFtmVJdqhIOI7OhI3qEZ6AwwikzsabiXZdD7HdelFxwVsDcVF8JKW69On2Iu98yHH5FdujNiQ2koAHCQJsqg9QvnhdfgNVQVZrkgC/rkh5M65OraMdQgfzWQ6c6lnuZdW561BjWaRqNUppPPq6LaSWES3c5T+VWUkiSllFgSO3ID6Vu04Hr7lR/cr3p/19Hd37NXySz80G1UguHQIdanASR16IrlSWv1ZPpmfDP9n82msjRlB6m1+AzNuJdIw67GZsqAFP19dVa7+t8ahVcZz5qcr1icizUoCA1AaMbHId6M8Cvs9y3fjCodd0AmNudiB2htL9hPHDRiNgbZT16T4KQrrGUdGln3L4NQ/pl0XiZWCeReWzwZOXa/Ymqs8uE+i3wCAzrN6rUGbdJyVbQiDFrywj/l/Vzv1dP6RTUq7voWpN0/s3B97Guux8XQI4rQwOuQndqmR75favfCLEW0x2Z9x9v7rZf0+B6684wLuDXHR5E7Ep7PBXhk+GpAXtt9Kn13DM2Cm1yVBXIE8L4y4rmU182kwTue81W5IvsW4HjnVfTa/IHGTNyxyJtA1PBc2cDV3/163uVSnymF/Vq8XUtG3Sox8Dm2iLf26n3rFRKDuXZ4FZptwYncwMSJsS8h1Dp98CB2b1E6TAL/Dp55c+dT83NfLtkxiqnLAyt/nSX6bkDTaXNcobb/jeVWiWqLo+pPCwpWwH1841XVRzXDJ0VftSOOhKy4D2GE99cV7XcR3eRsGXkvH1pz/84YfziEx4+a4HcPv8XNP93tQ7waXZ1337+2rGCmao0Nn/pK4HnDcmu2fcPyznsG52QYQBbZNJWQswZV9NhzokqBCwIqmPIwT9pUskkt/rv9iqSVOasb3QGY4xTA97D7pnhrPrLzrwjcFfzGF9Vu5z1/WLCPupvLa8F2pOgmzbYy7H8BUEsDBBQAAAAIAPuYNVIZQDN0XQIAAH4EAAAZAAAAcGlvaW5zdGFsbGVyL2V4Y2VwdGlvbi5weZVU0W7TMBR9z1dctS8NatMx8VQYInQZRIx0WjrQnio3uUktuXawb5ZViH/nOuvKykACvyS2j4/PPecmQ5ibZmdlvSEYFSGcnrx8NWksOtQEV0pQZew2XcCbwmgSBb1r9mvSRMbWb4NhMIRLWaB2WEKrS7RAG4S4EQU/9jtj+ILWSaPhNDqBkQcM9luD8DUz7EwLW7EDbQhah0whHVRSIeB9gQ2B1FCYbaOk0AVCJ2nTX7MniZjidk9h1iQYLRjf8Kx6igNBvWAeG6JmNp12XReJXqsvZ6oecG56mc6TLE8mrLc/caMVOgcWv7XScqXrHYiG5RRizSKV6MBYELVF3iPj5XZWktT1GJypqBMWmaWUjqxct3Tk1aM4LvkpgN0SGgZxDmk+gPdxnuZj5viaLj8ubpbwNb6+jrNlmuSwuIb5IjtPl+ki49kFxNktfEqz8zEgO8XX4L3P1HmR0ruIpbcsRzwSwLn2c9dgIStZcF26bkWNUJs7tJrLgQY5e+ezdCyvZBYlt5IE9SvPioqCICiU4Kuv0kWqHQml0CZ9qHxidHgLZ0Hgc/mc5Hn8IYEzyIzGh7USK1it2JnVauRQVeEMYAiNFfVWzLhnOGqW10P9kBV4VLSnmh02/OBzOyU1zbzXPrwz7rmJ0BNJaP38CG2RWquP6CLf/YJGL/pFYWsXBsHv+JZtGv2x4nFPFkaP9YQHg1LtO5yNZBFXO9oYnVhr/kLz3K7B95MfgwPZOTdSS1K5zNCF4Vj+mWZuWlX2H2Ilddl3ZE8EW1O2CgdP9N4JJctfP4m5sfh/an8CUEsDBBQAAAAIACGaNVLYy2JptgIAAPoEAAAUAAAAcGlvaW5zdGFsbGVyL2hvbWUucHllU21v2jAQ/p5fcQqqFCSaQrVqFRvbWMvWaBVUJV3VT5FJjuAp2J59GeXf7xwCg858wPfi55577tKBG222VpYrgijvwmV/8O7cWHSoCB4qQUtt18kMPuZakcjpi2l9Usfalp+CTtCBe5mjclhArQq0QCuEsRE5/7WRHvxE66RWcBn3IfIJYRsKux8YYatrWIstKE1QO2QI6WApKwR8zdEQSAW5XptKCpUjbCStmjItSMwQLy2EXpDgbMH5hq3lcR4IagjzWRGZ4cXFZrOJRcPVt3NR7fLcxX1yM5nOJ+fMt3nxpCp0Diz+rqXlThdbEIbp5GLBJCuxAW1BlBY5RtrT3VhJUpU9cHpJG2GRUQrpyMpFTSda7clxy8cJrJZQEI7nkMxD+DqeJ/MeYzwn6d3sKYXn8ePjeJomkznMHuFmNr1N0mQ2ZesbjKcv8COZ3vYAWSkug69+ps6TlF5FLLxkc8QTAjzXxnYGc7mUOfelylqUCKX+g1ZxO2CQZ+/8LB3TKxilkmtJghrPf03FQcAFtSWodFkywN5c1xVJY3XOtLx77/cKoyMXBHdp+pDdzeYpjCAcXL6P+/wbhDv/w+wxzb5OvidTjl73+9dH7sn0tnFe9YOAq/K9rR2XSPd8RRtlmRJrzLJuEAQFLiFzq5oKvVFRdxj4/fBaNIR4lJZlwOhN3R6cVGyf+UN2+8/wZ9+Trx+dRPwJ21U8c8Oz4nN2YJJlo0EIZxAdhOg1jLo9ILlGXdMo6sdXPbjsnmCeWtx6XOCiLqMw9aNFy5OEppZfOEfaGCzCtpujKgeU3Rc4BOiA2VZS0ZC31K/9aMFbfb4Ln9Q0wrlW10MzRupspVnyHQO319mvAE/ozTrED7trRMKyaKODKN3Do9hxjKIjxy8tVTToH3nIL6sShG2aRaqtgtTWGPwFUEsDBBQAAAAIAJyYNVIFEMzzugcAAJoYAAAUAAAAcGlvaW5zdGFsbGVyL3BlbnYucHm9WOFv27oR/66/glMRVAJspa/Yp3Qe5pe6mLHMNmInRZEFAi3RNl9lUY+i4nrD+993J5IWZctx17fNKBqJPB7vfve741FvyK0o9pKvN4oESUjev/vpj/1CspLliswyqlZCbsdT8qdE5Iom6i+FGeMiEnL9Z++N94bc8YTlJUtJladMErVhZFjQBP6YmR55ZLLkIifvo3ckQAHfTPnhB9CwFxXZ0j3JhSJVyUAFL8mKZ4ywbwkrFOE5ScS2yDjNE0Z2XG3qbYySCFR8MSrEUlGQpiBfwNvKlSNU1QbDb6NUcXN9vdvtIlrbiu5cZ1quvL4b344m81Ef7K1XPOQZK0si2a8Vl+Dpck9oAeYkdAlGZnRHhCR0LRnMKYHm7iRXPF/3SClWakclAy0pL5Xky0q1sLLGgcuuAKBFc+IP52Q898nPw/l43gMdn8eLv04fFuTz8P5+OFmMR3MyvSe308nH8WI8ncDbJzKcfCF/G08+9ggDpGAb9g1jWqKRHFFkKUI2Z6xlAMS1fi8LlvAVT8CvfF3RNSNr8cJkDu6QgkHsS4xlCealoCXjW66oqkdOnIo8DzYUUpFfSpHb50ys16DMvorSPll22feyWhZSJGC6HVF8yw46EwjAV89bSbElBRc8LxXNMlY7ifNx/KJ5F8c94IMEImo+wVCPFHu1wb+V4pnngU1kYC2L1kzdwSOTQRzndMviOPQ873F8v3gY3o0mj/HD/R2I+0ijEni0FEJB6GgRFfuCRlxcv3CpKpqx/MV5hNl/+t5sPLu8HizoFxzffdg5ZSsCI3EBSuKUy6CgajOYiJyFNx7yma8ARjQbBAJ/djdcfJre/308jWdo7cfxvW8E8SeZqmR+cYFXL0DccEswFzdFDuEQLo3tXBB6bb0oGf0CEQmsSI/4aDxqbXuz5HmnR9ZVZ98WAue3tCKw5TyRvFClj/hgnKPxPP4MmTH9PCcsA877sP3BpkQyqpj2CpUcNNV29Qhf5/VUTZzynLH28dRgjSeSNmLJRgT+LW6IaUWJIQkBaS5FvsUCTBW5AtuvDjqNCsjlKlNmP7SiHsX01abF7BvDGqTfohXP0xjLJ+wF5craH7TdafHD0W9AaUgcNJv0HMvsYkC6Wd/oxN8SVH31LF+DwxyW/WbNYRjqiw4awljuS7UvWBA6js2m94vhz3ejePYFiuJk3lqJSo0cL2OsB1irDW0cZx3IBgfEmEo2hzUGocCSDGzEmnBgR9hyvtHXdv6HQLVYtRFyIkV5yZqiFs3G07GtgiM7GrTs8G9FlWl4tBUEFkEbIBl5NBwcNRyMoAtgFPaQTNdfQfy2OlvC1nDUVMsIeHbdNAnOYx/Tqn+o0ddwilSsbJQZZ1vhaKX1QfK0dFi8sMjoCML6V5JeC+m9dfBomsZgGcSE5yvxCsWNAzHU5lek3CR/7MjsDS3JkrEcTrgEj7dVlWV7E4/0D36rtjmZ0SpTl8ijWQInWpSyZbUO/IcSS81VSWa1eF0wOspO5PecKGhTlNyfHB/GDGzG4kwkNIPT9tXqYHq5Ay8JgMBuCHkD22U8VzfQ/mC+DZZS0LSvxQ+7No5coHODi24Ua9vgDEm+QitTHrGXLOQeUUnFLs9gV3d1WR8eugzV0HFIh5GUQt5gXe61NMHpHbCw59DZPrWwO4OfZFuBIb1cXn8fiK8A+X1gWpygQdXwnEekCxWNTIvG38UfDSDOx8k2jUWh+80BeTqofnIX+v0tsNjHBX6j5rn3uvTBV3zrF6086NbyI2su7Xx5nyOJZ53otFQxw1gcNwVQkrdIYjg4jxFsiFkXypKuWM3FF9YurB1Z2DQvHTVE0wHSy7ddYG1C+EpWNL1+BNex5GssKlVUyi6Fi5SCy4UcOHLQSI/CrtSydv83s8aFV2OrD19n4lQdigBE/SUoxfalg/oXU1/DdCE+x7X+o8lTJz6Yw6YKEiqTDX9h5qCpWaHTOa577YHeziZ7jFfxplq0r0ENS7tPa3fmpHMCikQJXr+RLGqL6WNll9B11MLt7Zp4m7ISuj3SsSf/aafkFEDsmk9PA4OYTalBO52Pt3dS9ThAP549vytRjhNE8/F7uh9bgvWFOhEpNmhNmH17Zd+XH6zUAF4iuwI1f3CaR7+QkCnB26s0qv+9vQqM6NO75559/Kl5fP8chm7LZqw00y1jzkHUIuVRIU78Xsu753NAdhzxEFRcEjgj+CGnsLcNHTcEGMz8VwOBafhi6EVvCKIhRZWnAX7kiPC/IAydw9O2rTeOCj0OVINRx5/2vHGrETEDjdhvzi6HFj1u1rlfUhx7THOPis1jZB8CBQvYYCEre/7/Vv9fdxECWBWcu7PXOEX4vcjH+rDzQ6zWq6LJZZyL0mpbBLVsDya/62uAq9kw/2I7f3PSzz8Uqc5c00bbmgrJB38kCYAk9S2181LvdzTUXWUBv/0kIl/pz6CgrS4JpwfyZTytpnNo4m9VRPjBkgX+P3JTdJ78p3UmljR7xlJUlUwOcuFDDnpddrvnzdvm29VbcmBTFEV+Y3Z9h+OFPW7+R0eH+dIWdqRsxwFnpHst47rdNUeHCZTj17nK0yo2rv6zZabR6ZIPZs5cHiukZXN5dNIBc/D/cgEzsa65+wMXJWPuJwp3dO/fUEsDBBQAAAAIADqZNVKc3jStNgkAAJMaAAAWAAAAcGlvaW5zdGFsbGVyL3B5dGhvbi5webVZYW/bOBL97l9BKFdUBmwl3fS6C19TnNdJsMalThA72yt6hUpLtM2rJGpJKo7vcP/9ZihRoqR4ccV1lcCWRHL4ZjjzZkifkJnID5Jvd5r40ZD8cPbq9TiXTLFMk7uE6o2Q6fyWvI1Epmmk/5pX77gIhNy+G5wMTsgNj1imWEyKLGaS6B0j05xG8FW1jMivTCouMvJDcEZ87OBVTd7wLyDhIAqS0gPJhCaFYiCCK7LhCSPsKWK5JjwjkUjzhNMsYmTP9c5MUwkJQMTHSoRYawq9KfTP4Wnj9iNUG8Bw7bTOJ6en+/0+oAYrqnOalP3U6c18drVYXo0BrxnxkCVMKSLZbwWXoOn6QGgOcCK6BpAJ3RMhCd1KBm1aINy95Jpn2xFRYqP3VDKQEnOlJV8XumUrCw5UdjuAtWhGvOmSzJce+Xm6nC9HIOPDfPXL7cOKfJje308Xq/nVktzek9nt4nK+mt8u4OmaTBcfyd/mi8sRYWApmIY94ZoqBMnRiixGky0ZawGAdTXPKmcR3/AI9Mq2Bd0yshWPTGagDskZrL3CtVQALwYpCU+5ptq86SkVDAYwoZCabBOxtveJ2G5BmH0Uyt5Z77LPqljnUkQAvX5zqG81S3P0kXqKCNbj62CwkSIlORc8U5omCTM6Y3vpSwB0RArNk8EAcJALiybYMn0Dt0z6YZjRlIXhcDAY3N3er6Y/31yFdx/B8GDfC/LvAXqQt+dZLPYqfPrpjTchvnlpGtC3FDhXnARrnmlJDwE472kTOtAyBitGp14zKD/oncjGCBR9auxIH58HP8KfpjLY/qscMhy1MdA0fvP6D0Rh5P8OjphK6Ipgwz8ER0s+4PgpeN3F8R9YrJhtIIxCIKuY+sOJaZJMFxJj6dCA+lTf4SVUkFO9C9gThJ/y7eM/wYN88LcAYmfDn0bEM3LHKdPUG1aa2+uE4DhwIZY9+h6G4zS8u7+6nv/dG2LY9Rovr66nDzer8Grxa0+YRzNq5vKQSRACe2JRYUwRJGIPLtodkfKMf+MQpHSeFUUKtqHJQfNI1YMfS74+PtKZ6Gjfz+XSNOtil9MujZaHSd07DMswDUMf3br0AA9G2w7VQq5kwcy7MpwnaPv8kIBrTYA+UfzFGuh2XDZ3R1/TRLEK0YbpaFeDCssZ/VjpCl4hE4j2LgHgOvrIH3gTggH0IQeNhmYI35Q5TCaNYsAvQczWxdb3VkDGhugzQey85M7Ma9j3hfJKbnpOtqPFQmSsb0FnokuxzxJBY0PZdqJSwSAIXKtSGe34I2gPLg/amsnjanSI9Oq31h40G5FWhLQewHgQJ0GEGRVU8XSae8NmwJpCYQHU6oMYRysHTokxjLkEMM+ILtvPvWawQazohoWSpZCncKzfiHmuYyQZ1d2OIyIpVyyss8QFepoDzTHvQwY1w9ejxm3NWJi+YWVn37X3iDyHE3zIDJwvww+QxG8/LCetJah8oGUcV43KRkgAXs9zjo8CcvZ6Bv62GHMsNBNFEptYsM7UNZVniQFcJfpqKeGkrgHK9zaqDA/blosL4KDDFljCa0xjVq/J8cE8w4oRChOYsgyxKymFxMVTRY5goMiaGSn1nDYwTkhFan0QVUPIs40gb4l/PiJvht+Ook2oLqSKDqp5JsAJAfHa3d8D2afA28cGIcOcB29MTbqGkAja41/U+gaVB1TjXPKuLWHIvm2Hbor9JvPPjDzDgbrRwFr+aErA0hjDQmH1kELp2fJQMjcdzRTHMV1aGQuhrwUUq36tZZeNzw0fpzS6XVqsjT7lBqRsfEtenQWvzisxttjZQodi3S10mttxJCB86gr1FErqArYdP55ZE1sGeD+d3TrxX+58qsI3WACVxiuGqlN5uEayHhKqiC7b27QBkQ9CgXur1gCJuNLfpq1jtOOm3krTqjJsOwYWWQrrgjqHlQ4GVGQIzx/aKsGY13T1vRTiCqkHapjtHm8YmFZBVfQ9wwpKLy5FlsLGVk0ITjkiZkLYJOF05N07TL+dQDmqRy9QWo5LlWJmY1OSLVeYao7XlctI8lyjxhiybSV6nPPuwpDOn4e4/2qFyCPo6LlZ1YkPf2og8cpQIzdgvqudS0MZRxWFJi8r3V7Cgie4OUTQLxHpS5KKuEiY17Vky9nKQg18LWyAVIuhShR8m0Es2XcXWBo9n8oHQzePEZvItBBj4JPDeC1pBt6sXKkJMAYUIp/KUhZ9Nkefbc+Ji/bpc2NEZywkYSj6Yx93vwF++PnQrouphBRKr5NunX+9z10i6MVkS8ALU+974LEc2MEANTeA1fYrJbopupASj3mcyCB309UvZRXqbFjwpVfBjmD9eAzVk2qbBWZxJ2tgGpthbcmzvsxA5QnXNjIUy4dtzqp4qYkjU5C2axhTR8G8w85Yg7bc4rBWQ6NCQPMcV+eYQDfvN9spAwkPpGo5ztI/UySUAdtB54CALACR6Z+NOvM0kcxgz3J0eKXDc2MlU0XS8V/rFkfQ22bHhzszd03qehTmAqyKqU2j9SylU6H0Rq0WZeIFhJEXiLc59wlMfgnLFr+3wJ96b4weMM3o2Zaaz+vUGypDUN09rr288TgTY7UrNNax45yLnUhha/N8ZwP2WGMV2f3Wz/1XSgNXygvHDsvV5e3Dqt1z2HoqV9v6Q9vUePXMjVezeqWJ4SESMdQRAZ5E5u7eE68qmzzgYUPMLk3fTtFlrxyS4KAzztFnhtaP78onIwIrF/a/bjWOKsSMqAvCgo5Cv6O6GfN9FG1BMN/w77XLCggzZ3+EyY3U1a1NioZMn5+vZx94YGNMY4nItr3uZUo3Z6PBDD+vbFbshxNenufNaFaRnAkS94eAGbACiQuGp9yU4FEw5PwvNfwvBDe7eGQM+A+ikJYIKlHmnDgY3CWM4ol3Jd8c99uBkIsLeHkghUIqwcNkKLOdVviSAbk2SYemOda5gz8RmusxBHYts0qpYyw1BgP//fSjPb0nNMbTMvBvqtHrIvRA8kUVsfgyBO370diukitWxUKmU2b8v3VUxymcDYfdlTibutrCeEzE0s4ez+uZGH+mALaHbLrZ8IjTpNnqGFWgiUrdWqjJP7KO1PowV0TNfrz8Leg0h4U53dDfgp1Ok5NKzrg6yQV/ZRIKXvg8VvCVdh38F1BLAwQUAAAACADiTDBRqET1KiwGAAAxDgAAFAAAAHBpb2luc3RhbGxlci91dGlsLnB5vVdRb9s2EH73ryAUdJBRR2myoiiyuZubOKux1A5sZ1nXFAItnW02MqmSVBwXwX777ijKlpzsZQ/Liyny7uN3x4/HywE7U/lGi8XSsjBps5NXx68Pcw0GpGVXGbdzpVeDEfs5UdLyxP6a+zmhIqUX71oHrQN2KRKQBlJWyBQ0s0tgvZwn+ONXOuwP0EYoyU6iVywkg8AvBe2fEGGjCrbiGyaVZYUBhBCGzUUGDB4SyC0TkiVqlWeCywTYWtil28aDRAjxyUOomeVozdE+x6953Y5x6wjj39La/PToaL1eR9xxpXCOstLOHF0OzvrDSf8Q+TqPa5mBMUzDt0JojHS2YTxHOgmfIcmMr5nSjC804JpVRHethRVy0WFGze2aa0CUVBirxaywjVxV5DDkugFmi0sW9CZsMAnY+95kMOkgxs1g+mF0PWU3vfG4N5wO+hM2GrOz0fB8MB2Mhvh1wXrDT+z3wfC8wwAzhdvAA52pIZKCsggppWwC0CCA5+q+TQ6JmIsE45KLgi+ALdQ9aInhsBzw7A2dpUF6KaJkYiUst27mSVBRq4UbKo0nqKpRphYLhKo+lalGlbaqb8yZH5llYUW2/cLttuPN1t1yTZJp7dy/FWCsabUGk/gG0zG6mbAueUTVTlGm1qDDdoSQ2hrSVRishQza5POxdzb6Nw/W7bIg5ZqMWy0MCe18YNEC7CUO0SyOJV9BHLdbrVYKc4YrsVGFTiBOBaKctkiLSaFzjoruYi4iGkUaeEYDBKCQCIAMxdzdkMpKGFoMvbsHoz86yJxE6Jjj2m7Jw+xBVJ9flZBh3mHbbdtNz+fZPvF64jPDgO7crAZbaLl1xSxQhrYx1PKUb+xSSXiA2GXCM9n5g7wXWknKdhhcfcJbMez/2b/qTT8EnS2+xCNz7pQJxEoKSze2XW2EFwNVjCVHh7UcBkHgft+DqzoobrrlrupcOVbsx+hth27ojZCpWhtm7kTOPow+9ulSMCwnyZ07hetJf3w1Hl0MLvsNZH+SNWGiMc041nU1/h20aS2oIQXOUtSzsDumvQTvB/h8Ej834L+wl47H5+PTLz5PS25iqWTMTSJEnCy5Di08WJ8vijQhQjS3o0I60yk9K++67PjkbVNLnsRUF1AndcEzA35XvbJYUesnQ7MxqkJrpcN5IZOOY0raq0nV2HilUiglStWihIj8fJ1gZfqDqyrRJB6M+73zJlMESZZoFZZbVS6PW5eb8WDa36meePls1yMri1hUC4ok5ELpVjFVupyjrtxtCul6lEHWkq2Vshhzx72RxkthzbO7cK8SkM4QgCyc6bNH0LjHJTQ5NbQyRIKem+FziBO80basYmUkmgsDcflc41vQdefomVi92W2Mu634HaCnqUmythVNujn/9vcrTMYNg1PGDli+yYS0p/Re0nXuzrTi6WFpX499j9Re9LTIqqjwGssMUcqsFzrrsNRgJhJqDrqkUh8Mwrq5HRj1RtgvxRnIhSuM1csTLYGnhNV2I+yBymp1VjocXjqHoN24Mc3KjBzaZU3Z22RXfhHSiO+laTNCfJCiFGbFIgx+A0vtCJtrtfL82QsTuCDbz4kC5yv1mrweE0Xg0oOtCvBVmZoyMxa0p+kcTB7RVOznwmRZyLuYuHaxfTzvX/SuL6fx++uLi/44ngz+8ldoX1/7bwUxLi1dRVY5yNAdVbCeYbFEkczz5lvoNqY7UGPYzNQ8j6hhg5JjQ/kuEU4ihcRO8S7mOlmKewiNTsr0lVDcYJHFhkQnWFVTX72xkEeL70GNru9SIkfbQVAx6Qb6lOyesM+xgluNnTfPsnB7Vk+o0YMppCErTLhJtMjt0yfTpZHPzPZF5Hpx//nVl0Z7sjF2k0PlTOMYT3Pb/9A6rLBl8o1QGTumpG60QoEJCXtWqG4Ph73Tunw5g12sHiTgq/TN64Cst3gu5RYSDARBkbGDePN6JmzAAAsNCx7evgnq4QYvTIwCZy/w/w3atOPw2wTrNnJebqVe1jSssNX9L2XNb1t/sv7/IpZDjo16bFVsYHVPb76baApBQ2SKWaiD8Da6TV+2b6NfwhTuH/nj7FEnj7lClWFh0MHt8eHtSYTDEqXDjtutfwBQSwMEFAAAAAgAe4BzUL2PGFKFAQAAYgIAAB0AAABwaW9pbnN0YWxsZXIvcGFjay9fX2luaXRfXy5weWWRQU/bQBCF7/kVT8kFpOBQxKmtqrohVS2QjeIA4rhZj52VnN1ld4zJv+/YdSUQvqxm5/nt92YWWDt/CqY5MM70Oa4uv1xf+ECRLOO+VVy7cMwKfNfOstL80093xiUuND9mi9kCd0aTjVShsxUF8IGQeqXlmDpLPFKIxllcJZc4GwTzqTU//yYOJ9fhqE6wjtFFEgsTUZuWQG+aPMNYaHf0rVFWE3rDh/GZySQRi+fJwu1ZiVqJ3ktVv9dB8Qgs34HZf12t+r5P1Mg6xFm1/3RxdZetN3m5uRDe8Y8H21KMCPTSmSBJ9ycoLzha7QWyVT1cgGoCSY/dgNsHw8Y2S0RXc68CiUtlIgez7/jDrP7DSeT3ApmWspinJbJyjl9pmZVL8XjKdn+Khx2e0u02zXfZpkSxxbrIb7JdVuRS/UaaP+M2y2+WIJmUPENvw07jAGmGKVI1jKwk+gAgex3r6Emb2mjJZZtONYTGvVKwEgeeZPdx2GUUvEpcWnM0rHi8+RQqmf0FUEsDBBQAAAAIABFq+FBGu9Qc6wMAAF8IAAAbAAAAcGlvaW5zdGFsbGVyL3BhY2svcGFja2VyLnB5dVVtb9s2EP7uX3FQgEECZDorkm7olmFummLGCnuI0xXdCwxaOtlcJJIjqaou9uN3pCjHShp9kEje3cPnXnUG10ofjNjtHaRFBi/Ov72YaoMWpYPfau4qZZrFCn4slHS8cD/reCYUU2b30+RscgbvRIHSYgmtLNGA2yPMNS/oEyU5/I7GCiXhBTuH1CskUZRkPxDCQbXQ8ANI5aC1SBDCQiVqBPxcoHYgJBSq0bXgskDohNuHayIII4iPEUJtHSdtTvqadtWpHnAXCNOzd06/ms26rmM8cPXuzOpez87eLa5vluubKfENFu9ljdaCwX9bYcjT7QG4JjoF3xLJmnegDPCdQZI55el2RjghdzlYVbmOGySUUlhnxLZ1o1gN5MjlUwWKFpeQzNewWCfwer5erHPC+LC4+2X1/g4+zG9v58u7xc0aVrdwvVq+WdwtVkvavYX58iP8uli+yQEpUnQNfvY5tZ6k8FHE0odsjTgiQHkNe6uxEJUoyC+5a/kOYac+oZHkDmik3FufS0v0SkKpRSMcd+HkiVNsMqELlXGw5RZfXgw7oYaVssOKQhRXdt86UR937VYbVRD/4cRho311DPsvot9OKqMa0EIJaR2vawzueo2AN5mUWEFhkDvcdHvE2qaU+3vycFMKk0OJ1vlV9mria+ThYlYQWvpnooVOckiCrV9Mp2E5JZvkwZwELPk7h6Irr07ws0jAH6WOmx26eBG3Fn1QbOBNFR7FVDzOm3kdUVGomOZuz4QltDGCf/oDuDrq/UNxOCIl9J6edK8+JNkA7NtuDD7saC15M/DJTm4jjYbfIynYZ7V75q7R3n0iNuSNNfelX6c9g3FGHoP51DGC21jVmiJEMs2yfICNl0jsNiV3nG4h514fHNrFKuL7uu72te9KAq+px0L8ov2DS2GsxFpifwj9lr7pOJi9Te7hsozyRp1FcNQYG7J7QHoWbaCZQ6NKvEp4ElD88ROAgfoXIaswUk7vYv7Qu5JmT61iWg0yi9wU+9QkfzE/W6beakalGjCZp+Zj/AxEyA3NfSFb/KpCpM38rKPaN2mAzcdEKbllL8j6dNBhzFQ/E9j25QXKguJxDI/P9ydet0iZZiUGWdK66vtYsyG2SuNJeXd9JCv9KJ9Ba5TErxYUIfi+9E3tK5P6BEOLRFBXP0pOFb1Og6x3MmO+t7hLY9Y3Pnj0I72KHg8NcQY30ramH76nA5VGvj+iKNSH2BVl+A0GM1WXvmj6Bqc54YY+o80mSL6Bc/UdPUNHRPV0sPyP5JeXl9lYkdCKPcmPsYyWR7bXNVWRH/6t7udiGM/MNI7+d+m4Dw261sg4iyb/A1BLAwQUAAAACAARavhQEIZwFZUDAACnBwAAHQAAAHBpb2luc3RhbGxlci9wYWNrL3RlbXBsYXRlLnB5jVVNb+M2EL3rVwyUiwTYSnYR7CGti7qxiwrdtYPY28WiKARKGtlsJZIlR3Hcov+9Q1l2ZGcXrS7mx+Pjm5k39BXca7O3crMliIoY3t68uR0biw4VwUMtqNK2SZfwbaEViYK+N/2a1Im2m++Cq+AK3ssClcMSWlWiBdoiTI0o+KffGcEvaJ3UCt4mNxB5QNhvhfE3zLDXLTRiD0oTtA6ZQjqoZI2AzwUaAqmg0I2ppVAFwk7StrumJ0mY4nNPoXMSjBaMNzyrhjgQ1Anmb0tk7q6vd7tdIjqtPpzr+oBz1+/T+/liNR+z3u7ER1Wjc2Dxz1ZajjTfgzAspxA5i6zFDrQFsbHIe6S93J2VJNVmBE5XtBMWmaWUjqzMWzrL1VEchzwEcLaEgnC6gnQVwg/TVboaMcendP3T8uMaPk0fH6eLdTpfwfIR7peLWbpOlwue/QjTxWf4OV3MRoCcKb4Gn31NnRcpfRax9ClbIZ4J4Lp2c2ewkJUsOC61acUGYaOf0CoOBwxy7Z2vpWN5JbPUspEkqFt5FVQSMMLsa6nojoPz2Zrkohxr4w+Mn0Td4oglaUtj3ZKTJY5JmxqfsA6CwwZodxy5bUuyPs32pw3Cxni/BJXVDeTC4btb6Pfyd7clFrrEIJjNH+aL2Xxx79M2gTwMw+Dvv2R3NPMWZ9v/E/jVICixgsKiIMw8e1ZKG8V3gTcP2f1h4L+itX6P6bRLjKBtwjMlGoyOcyap/SDKsu6iLI5Pp+nAzKePISTNH6UfR7w86clHwPWr5PMkTIzUhbY4lsqRqGu043DAho5cYaWhzF840PS7lirqLxtB6IGJ2Q+Odj2lDTLqnITRuzAGwQ1pXqL2X2US73KMQmO5wNGbeMAnnMOudof7pfOxXXK/wBlnsWGbfR1ikVqrjhnrlvvXIZp2l7Gj5tZqjm/B6e+G8Ytiw4qCIc9lvuO+6LnWxG0ozLHcvY8486ekJ1nW8DOTZUGH+OJW4n9OrIfJgdC2imTDvjoV/5XRgj4pqJ6k1erXcP3hYZY+hr8x+OJ48D98dHEkfm3jYQgZt8TXvXMWLCO/aKJLOu+i/D9sdGrUaNin3CwnOHd8byflCx7djF7pHqAHhezWKqkYNojZP3ilf6yji/yMjvmMz6XKivH87A1s7atVXsA6qd1TldiG+E8hKkcgN4r7NkNvSzdZ2xa9NZgxy/xrkWUwmUB4NE94YOwt9C9QSwMEFAAAAAgAIAyITwBHXJszAAAAOgAAABAAAABpZG5hL19faW5pdF9fLnB5SyvKz1XQK0hMzk5MT41PSSxJVMjMLcgvKlGIjy9LLSrOzM+Lj+dKA6tKzi9KhclqcQEAUEsDBBQAAAAIAK2821DzSNTpGgMAAOMMAAANAAAAaWRuYS9jb2RlYy5weeVXS2/TQBC++1cs7sG2aqwUJA6RfChtDwHBgari0FTR1h4niza71j5UCuK/s6/Ej7hFHFpR4UOc7Hwz88145/OmEXyLiooLQGTbcqEQsIrXkKMa/B1TfAs0RzrcF+efTy+E4CIKDhZWyd0vAVG00ozY1VXNlVyZ0KVZNkm2LaGQ6uR6qWezN7DUb81tqZtmBvbz3clNkkVRRbGU6MxGTX3swv3I5lGEzFVDE0imEmhjmGKFcwSWkywTqQSpVLJD24s0wYpelWgHmO/N9hKYSOhqS+MrJnVrK4LaO6MNZjUlbI2W8c/Zr2UcFw0XW6xSHzvLBgkZV47YKA0oLRiK4xzNOnhYDUVZryxHFJj/2lXtH8mLrVpPlx2qOizbb4QFqwRsgSlML1yDxG5XvDd7BgTUh4hsvu/Z6tahVg/umBw1hGGazf/dxqWucT0HN4rSjNV40grZUqJCA3doZdhaJhZkfHSS9DP7WMO8gZA3Xb8+uRmaJ4ImRXIAqYH2QgzMQEMK1/vD6EfoI0CLWq7MYyWY0nukmcESuTENdkHNgiIUqQ0gBt+NDBnU31B4pPxHauxtXqmpXb3uwkryw2rdbL9gnnggS9hkJh+lwG0LrE691KbuM8vGT8RGP+Tpch6X6CSaWrXT5MN1zI/QB27o3BG1QVfHRoEvDouKi7j4ZlCpX8nQ8aAZ0VSePiAbD3kIlDuPqdk+hz/NdkBMzPaDuvgSZluPh/vI5TbvXcrvpFdHm0pxxFsQWAHiDF35uUe2ArY2hSrOi35SIgmTCrPKK6t5f3uPbMji75TEQEdb8Ah90lKhW0Cnl2eLReAzgNgQJoGxjKLZK2QNHGMsK0LibJqixQRaZn/2OvYcAqf/B4XTTy5x+lkkbs9cP7mQBSW7VALw9qsgymiYO67m4WBc9E1h+lrjMvT8Arh+wNObBp5W/NZgrGuzecR9GoyBYv/QvGANT/c1MLyFMiE1w0neDbU7GZX+wJ0V4fy/N3tx3ZvD34JuwDqB9p6iPDyPTcJ9pAE8SHwHl64Dd653Zb+RY4hwTSr7HfOQLPoNUEsDBBQAAAAIAK2821B8gZZwjwAAAOgAAAAOAAAAaWRuYS9jb21wYXQucHldjDsOwjAQBfucYpXKUKCICtFFQOEmDXCAEL9Ilmyvtdncn0SKxWfL2XkzCkc6DCwgHzOL0r4aN+YwfGDlMNKD2/vFWhP6F8LuXNFyAp0lEdI62D7Ffib/RX/8Jf7vpz4iC7KZitr7CdSx2pgDIpLC3URYTG2vXUvHpjmRY0yUWGlWH1a/ZCgLKw8c6qX/BlBLAwQUAAAACACtvNtQHJs0LCwLAACvLgAADAAAAGlkbmEvY29yZS5wedUaa2/bOPK7fwXr/SALtQ0nTrzXoF6gTdNt99J00abF4tLAoCXK4UaWdKSUxxX732/4kERSkh+93buegTgWRc57hjNDRixdozGi6yxlOaJhgkOc455+XlJOgrx8KhIapCExJzBS/uKPvBdJYDTJGU5WhFdQy4FFkCY5pkmvt7ijDK8xDKyXNKHJahHEmHM0R896CxzjJYkXGSMRfYChpfeQjEZeb6EJWIRpzheMwCtGxgAiozEZFN7Vl2IyOSRfiin8+1JE0YSI79nBtef3ejQSNI7vCOM0TRY0idKryTX6aY6mJz0EHw0doPKcVSM3DAbgu9dTFL59dfHijLGUDT6p+fLBVyD6/T56iTlB5CEgWQ54UJQyhONYrhuRBFYAt0B3jHMSooyly5isuVgpIWSAo2fieklDqvBVmA1kZxWe+xuSgL5CykBjMIBjQPLPAh7XJMk5wiCvJAU94ZzyiALudpTJHY5peAqMZSkobhesGIWUA4/pPUAFdotEPASSwaAEhChHBd8V7SkYCnnYCXt+Q2wsgksJDQxPv5XAEO0kIiQRcm1xEGQa6R1YgGH742riQBmImOnLmWBjMHmOJmqhHhIEmesTvCbm0nqy+DAMToc+47hQpjXof0puk/Q+ASvEDAc5YYIxA2BfIWckL1iC7jQ7lC94wGiWA44hUj81Kj2z4ZeDlIWComEVCMZqHb9S/699DTwrkkeBfsBtkHwsTZwMvHKGVy4pQAzudO/T06+Tk8nRb394Y3CUNRYztD6kChcqFMQkWeU3A/kAEEpZw7AeQz+h2bSWowb/GsecmPguWUEs8ODpQuEm/CECqdBYDEOc6cI2ODw+EoPmXEQAHTo8nvp7URLckOB2IVy3JECNxDmby3UlDT8gEQwQK2KIrfwmLWJwtyR+REuCcJbFwqlFlJM8Ia1Tjj5cntemwyUkgUyJFky7pk3EqgENH4CCzBdGRpJiTRg4cknZgcFaFWoc97CCkDAn0xeMRXPkebbp/4A+KtpjekuAL3A04FTuKhgl5B4sX4dvlEZIx98W57Hjplf6j0EWzR8Ff0oEXyd/IJyjLOVUUvb1oDZHRjKmtS684sHv4AaAXXkfvCHyXpzL7wvv2mbOkrlUvxEejJc4CeVQZQQNY1K241gEOujtrhSJCXa/Kmp1MGKwwHKLbhI3lHnuubNryxKeYbxt09JrynhuRnJTPesC3oGZOyo8H6IPYscBUlsUBrpS8Vu6OknkzmtSBda9JGyRP2bkv+IHpumAhFzjr3V5aL3RNrLR2OD7TH1/FN+n8vvsUny/l+Mv5ffFx3euXXYqRO/JBl4hl1pBlsuAjqjIBBhd3eSjPB3FJMqVAivV2O7j8jx1ee7mV3HadLEWZVcGW34cw30yV0LZCqi2jjbij7YQX2mohWKtXsMYm3PEx7bWCkFjru1rLiYDyBMDSvsC8Wm1jVOcSKLXkKAr34iRgMm7raDWfJNAU5THO9j++Xdj74JBwajkeC97n20xmfNui/lrbdzcl8wJW+L3uQzWMJWje5rfIBrHZAVmUQvQDt6ejoddCRFk2DnFsU7LCWtkf1ZKDrF5lbLHemcTtZ3YlUy2a7otmpdkJfIkSTXYdU24TvPr7MnzN5J885hBRbJIb5uZqiTr8ORIEQXV7FaqbjA36yoFW/rXlIUySzgCekuL9HwbleZ+5IntUQ2NDsqxrbjldiurxRxDAQ8gQK9aQJqSLaJIomCjwhLhIjH9F1QKF69PwdR1Zg22Kn/tRiJkBCCPCw0LS2t/DU/o1LPLCF0C/l7u3yC2krAgW9yJYgvsX5Q/Slbw/tqvCK+nQGn3cDiZBCfWXg6zoSSYnLge3SgpLQRohA6ufV8A7WiHtAQuNwMUn/S2sT+JyEWFbGSBNwBso4MhUn9Ovfl7qjDqfaWq/MxxPl6R3KCeXjuBDZi14Shhepee32RCKIMmTsxyIYgYKEGce5B5y1+vPL8lGEruGyFQfJaM4FtLUcKk01un3jYrtP1k+hTkWVeF/2dy/fAfytWRX3rb7S7h9+Au3fpW+UjHhGYQSY0gMqw7fXatvndUmUyWP1pdowl6LiX13DCx0UFDaC0yKgHOArlN2DOe2jO+XWZNDqY/Hp+4erapl/RYfZSDVmc0mlc25ZAS/cwIuTWyyd1oO46mYhtrjB41KG5Y5iaaRoqmNwR84n5foqaTaHlihZcgq8rehqLhHawqPNHejpYtyVyX+zudQO8NOM8KJ9jzhUTct3+HGHXb+fYNTtoizx42M3mYzcC057Usns/l4LPdRQHTIwlD9ysViMksetZJmh3KG9toSVrURlq0H2mzNtJm30SakVBJdI2UinLIXHOcBFVnYrB8zAnEJfEPM4YfzX2pbD/J/+OQqFZtkUejvxkJZO2fdiu7kYmdrTPRhNHlnYp7TvZnDLrZsfGqI9fv1d0YGWvbuzEGf07UdXqPzX53Od9oeFflitpTCL/yfv384vztK+/aMfyGv0kj+lYkp+8vLs9+u/ylgSZnj509g03JrbvE0GDHYYv3SyqEL4tbAb0sPZzeqFDB18O6RdrZOVAt/5J9XxImUia7RWeuUJupcfixqXR3urtGoR7+jgMCP/JU5j6apW9hYz8W/gwDeN8wgDZdp5t1vUXP1ci+qt5XHG6fp50ulyCXiDQSRJh07kmQEWnqY5ayQMQtkdXyOTtoludbmAeUGjt+YYJxa44NZ1kbbVuVunmaojhNVs38QgLpGZ5Tnkkn1cl0jUGddRpUbSu0L1JQVVbkZWwvBaHr+GYYb4igXFGfF7a9tM/7n2qumm2ojfLbLjuzX6FRSAMoWgxA491ze22E6t1MZwfdbZBxq0n0mtiF47CB3SYay/4OF42dga2GrqThSmQH7tRr195bcqOGft7hWDgxBJ0XIy3cJEW/akMRsXRFl7E+vYfIEKVFEnqWa9lpjBZra5+rlQKNt+52dTW57EC2QQ+mDly62nRSTjEOyzdgaLPdnB/NFoyscTYI0zXsNkPE83C6kIfEc5FFyvPsRIVTHFdVqgDY7/c/kBGsVdckqjPi8uKEPknGQQDZlPgFG+qny49HM3FvJSAcvGM1Lq9SqMs/kiCxxZWXf6oBOSktcggoIoboVZbLiExPJXpAip3pKeYaGVhIFmrf0AkfrLO9QqJn6b1AWVJyZawThVX99BwdHs+kuptND3kVaqz+LUTbf1ABhLBQAxmi/j/6vi9LQwsK+Fpe8JIQoOnKmQCbVgyJi7ivY846vC6z8nJIJuZTdd3gIk0aFd+gRDVH/c99kExrbmPOetWvzp1Na/F3WTut19amJ4dMhiiXpLpdMsMons6l3u2EUGRUDhiBSICSKExC3u3Eaiu5OzGqhWQJaCM7BuFNrjTgJwD4bb87hQvJgwpXjSjT3k7vX7w+7Q81Eb6ZG9SwGrumm5BZ1PT3TRf7rSm1TtUqP1HJmujq6HRNu7hfJmZ6u+RDGYeCXIWuoXKM8sEIdnqkNdq11Mt8y2YuPJWXEbovg3i/2j0lDfZcMxRzkzCbJF+HPePa0Ny6HsSLWAxdXZe4FPfOfqyo41lMIX0et+5T1Tz33qRexituqi2bV6dF0uKvPOsGSHv5r9TmnD/xahc2NuEQdr76rZE1WbKomkhRSUvVbeG2xHHrHiwk5jbwhEzHOMtggy/ZbsprA4/mCbZz6cu8nWOiWXp6Ppc3WMeebPwP1CRL8m030XjjFlonha+k/N0iobyPp31Jm/F+vvQ/9xtFxd4Oo0J7h9NsdoYODyo9rahc7c/2mhqY8I2/zmc6y9TvwWcKz7beouE2/wZQSwMEFAAAAAgAr7zbUNesSjRvIwAAbqUAABAAAABpZG5hL2lkbmFkYXRhLnB5lX1LzyU3kt1ev6IwXsgD2OPkmxzAC8M2/ITHi4bhnRB8ZLs8stSQZHsaRv93My/P/arOkbSYAgoEg/djnghGBoPMCPKffPrD//j886f78/fr0y7tf//y4/+yXz4P+/77P3/64/ph/WS/rPmp//nTLz/++P3P/+Lz/MH++bRf7Jtvvvvu/6yffv784w/ffffpX376Kxf+5vqb66+++Xn89PlPv/y8Sf/vm0/737f/7qe1/v7bv/30T1/V59/1D6Fcr3+hxH9G5ARyZbKBvJh8H3K9iFwjyInJGeTC5ApyZ/IAeTJ5HbJ5Ils45MXkg+/aeL4mu+lfUHbZmZ7moWfP9IzfZ/l9vw99cP94rLtdZrqroC+me/w+yu8jfh/l9wm/T1XoDXQTegd9CH2Crv0fvu4i9Irn9sT0fuRzD6EP0Gdk+nzTBc8EnlvkeQS0S+n/Rj/3/TXduzO+uyRVs55fgtsly/lyL43dZb2lwdBgTjTogga9h+yvT/Htv7cf5F3z64jNr0bDsuv90G8Sj4f6+C0m0ubresHfpdIL6PzWbgEcujemh3rogcQfIt4WUed4Xrmr3Te9i3c79NsyqcltBfTJapjvo1a7pPfryHIzbHlSTx49+V4CjfwmxNNQ+VXahFdvfiy2EJsAYfflWNoYndu4qwBUwYXYZYxX/2n9Xxnm1F7SvtKgUTiv2CYvsh1pnVFOrNJ3d6/f3z0Upp8x2+UU+gL9ZvoZzF16oQfQ5bkxH3q6hNfPP9kf7QfTCeSKUK7G5vxq89CN3+H+vEb7f3eO37HuXlr9lOG3raK/HGP6T3v++/vfwmTAdPNcct0Hk+N5IMBQBy90P0FnuxKgEiGw3d1m6AjvLhfTizv0tlQWh+XrciKLHI8scv1g+S/f/M8fP//w+Yc/fvfLn/+0vkzs1z/sp/7tp/cs+1QdVz1XA1cjVxNXK1c7Vf1+7hvhU+Xn+ue5/ks1cDVyNXE1c8+FWyu3Nm41bu1cHVydXF1cvanncHHVcZX5DYG6CpGriavMbyhcZX5D4yrzG5jfwPwG5jcwv+GmanzGt3ypOm71XGV+I/Mbmd/I/EbmN1aSZGR+I/ObmYXMLBQeo8JjVFgnC78LhXWyZK6yThYeo8KYC2MuPEaFx6jwGBVmsDCDld/BymNUeYwqj1HlMao8RpXHqPIYVR6jyu9gNa52rg6uTq4urvI72PgdbDy+jce38fg2tjmNx7fx+DYe38b8Nua38fg2Ht/G49t4fBuPb+PxNR5f4/E1Hl/j8TUeX+PxNR5f4/E11mdjfTbm15hfY36N+TXm15jfzvx25rczv5357cxvZ34789uZ3878dua3M7+d+e3Mb2d+O/Pbmd/B+jyY38H8Dtbnwfo8WJ8H6/NgfR6sz4P1efD7O/j9Hczv4Pd3ML+D39/J4zuZ38nv72R+JzM4J5nrxXZj8XNvHsGbR/Bmjm4ao3I9XcWPqqMhK47GqLjA1cjVxH+buVq4WrnauGrcc+fq4Ork6uKumF/264p3XGV+PfPrmV+fuJq5WrjK/PrGrcatzK8f3Mr8sl9X2K8rcXKVfxxZOImFk1g4iYWTWDiJhZNYOImFk1g4qXKVlSGxcFLnKitDYuEk5jcxv5n5zcxvZn4z85uZ38z8ZuY3M7+Z+c2sDJmVPzO/mZUhM7/sMRb2GEthftmBLIX5ZQeylMhV5rcwv4X5Laz8hceXHcjCDmRhB7KwA1nYgSzsQJbBPQ/umU19Gdwzm/oyuGc29YVNfZksycmaM1lzJktysiQnS3Ky5kzWnMn8TuZ3Mr+T+Z3M72R+F/O7mN/F/C7mdzG/i/ldzO9ifhfzu5jfxfy+5sGPNV2NNJdVXuJVXuJVXuJVXuJVXuLVmLnnwtXKP27catzauTq4Orm6uEpjVNl6V7bela13ZetdE73dla13TcxvYn4Tvd2VjWrNtHNS2ahWNqqVjWplo1ofo/p1VwyDjWrNLPZMk0jlpUflpUflpUflpUflpUflpUflpUflpUflpUflpUc1Adm5OrhKLmK1xa2sG7z0qJ0sf+2eq8wvLz0qrzUqrzUqrzVq51HgtUbltUbltUbltUbltUbltUYdzCCvNSqvNepgBgczOHhAB/M7mN9FO5CuXlnq9PNdJxu164t/z/7prjupe6kHqUepJ6lnqQs+3n/c9SZ1k3qX+pD6lPqS+s31IPwH4T8I/0H4D8J/EP6D8B+E/yD8B+E/CP9B+A/CfxD+g/AfhP8o/EfhPwr/UfiPwn8U/qPwH4X/KPxH4T8K/1H4j8J/FP6j8B+F/yT8J+E/Cf9J+E/CfxL+k/CfhP8k/CfhPwn/SfhPwn8S/pPwn4T/LPxn4T8L/1n4z8J/Fv6z8J+F/yz8Z+E/C/9Z+M/Cfxb+s/Cfhf8i/Bfhvwj/Rfgvwn8R/ovwX4T/IvzXi+1zdVIX+1+D1KPU09f7LbuepS54quKR8agyHlXGo8p4VBmPKuNRZTyajEeT8WgyHk3Go8l4NBmPJuPRhP8m/Dfhvwn/Tfhvwn8T/pvw34R/E/5N+Dfh34R/E/5N+Dfh34R/E/55d9pf1/hav3Z9fu1f+Ou1HfRVO/vQu16kXqXevq6bzE8m85PJ/GQyP5nMTybzk8n8ZDI/mcxPJvOTyfxkMj+ZzE8m85PJ/GQyP5nMTybzk8n8ZDI/mcxPJvOTyfxkMj+ZzE8m85PJ/GQyP5nMTybzk8n8ZDI/mcxPJvOTyfxkMj+ZzE8m85PJ/GQyP5nMTybzk8n8ZDI/mcxPJvOTyfxkMj+ZzE8m85O95qeSv6rzfHAZL1QeglOCV0JQQlQCbb0/hKyPLfqLqr9o+gtTQtc/GUqYX3P/EJb2cQthXkpwSvBKUHlMlQfvqT2ErIQiSHln7SE0JZgSuhKGEqZCX/qLWwhL9WOpPGTJuQmqYyvqnyjSpUjXVIIiXTJyvQrSXp3+wusvgv4iKiEpIWsfRQlVCU37MP1FV8LQP5n6i6W/UHk0lUdTeZgCM1NCV4ICMwVmSwk3q8N8Yqi+1vV5icmZl1dCUEJUQlJCVkJRQlVCU4IpoSthKGEqYSlBXrHpLiWoPJzKw6k8nMrDqTycysOpPJzKw6k8nMrDqTycysOpPJzKw6k8vMrDqzy8mOAp207XLfs2m+CU4JUgxuCWvZtNSErISihKqEpoSjAldCUMJUwlLCWITO+o8ogqj6jyiCrTqPKIid/sO2mnSTtN2mkSi3t3RdqdPKVrp1077b/qNCkhK6HoU3TketM/MSXoyHUduT71T3Tkuo7cuASYOmj3kLfhHqrJ6qDdQ0dOHbR7qDzUQbvVQbuHavLjoH1l6PdcQN8INmEwYbWLR38TnBK8EoISohKSErISihKqEpoSTAldCUMJUwlLCbcQnMrDqTycysOpPJzKw6k8nMrDqTycysOpPJzKw6k8nMrDqTycysOpPLzKw6s8vMrDqzy8ysOrPLzKw6s8vMrDqzy8ysOrPLzKw6s8vMrDqzyCyiOoPILKI6g8gsojqDyCyiOoPILKI6g8gsojqDyCyiOoPILKI6g8osojqjyiyiOqPJ49mmcP9C/fjB/n+tOPn3/45bvxvf3881epAN/+1//2r/7zf/g3mniE1BP/23ktlJyTT/LKVShzYiIV6eZkFKSBSVbd5UD2TA4gcw7YhRy2S1KxCsiVyQ1kzii6OsicR3ZNkDnt4jrcbENPZAfcjnE74HaM2wG3pPY54HaM2wG3Y9zIAHGOcTvglvRApKk4z7g9cHvG7YHbM24P3J5xe+D2jNsDN2eOOQ/cnnFD0RwrmkMi2xYkkQNwB8YdADAwQGSqutCYbCBzRmYYIE8mL5A59Sgiwyhy4lGMIHO24cmQ2uTCZLwNkQFGiCqyqCJEJRmdEaJKLKoEUSUWVcIQJx7iBAkmlmCCBCVZNGGIJVc0AbekiiKNzUmmaALuzLhhTZzk0Wbgzow7A7dkZWbgzow7A3eW5ELgzow7AzenKLoM3Jyw5QpwF8ZdgJuTpR2SpV1h3AW4OYfaIYfasYV1BRpbWGMLNLawxh5du1zlvLEKgJUBVgCsDBAZ166yxiLj2lUWVcNL0vglaei7cd8No9N4GBrYacyOQd6cq+mQze2M2TE80viRBnaM2THI2xiJQSHsd1LyJCEPpkASnjtMQWdT0MF850d2PHIwOwMyGSwTTNpu/k7GMQ/DBMDJACcATgY4IarJopoQ1ZT0digEJ+U6OAVu8buzMJacgu8WxnIx8wtjuXgsF96dxe/OgmAXv/ML7/xieS/IezFuZNy6mwX7kUwvufd45C2p9HjkrZnrIEvC/Hmk5Jd6eEqePSUPT8mzp+ThKXn2lDw8Jc+ekoen5NlT8vCUPHtKHp6SZ0/Jw1Py7Cl5eEqePSUPT8mzp+ThKXn2lDw8Jc+ekoen5NlT8ngxPXtKHm+Jl+xveEqePSUPT8mzp+ThKXn2lDw8Jc+ekoen5NlT8vCUPHtKHp6SZ0/Jw1Py7Cl5eEqePSUPT8mzp+SRh+zZg/fwfTz7Ph6HYPjIae/wfTz7Pj6Cy8hcRnAZ+ZFwcjw7OR5Ojmcnx8PJ2aIhMqymH8zlOTvi8pPJC1wu5nItkDlj+zr/QuQEbzAfmPkADy9E7iShE3YWApyFwM5CgLPwq5NVCsiVyR1kXqPhaIXQaNCC4VAUnjLCRN+T+54NZD7+YeKRfPhGmEh6Z2sfYO0DW/sAa68Hrqz3OSzMPKx9YGsfYO0DW/sAax/Y2gdY+8DWPsDaB7b2AdY+8FEi4QZAPnIjYEkb7sZkPJIPvohQq8heb4TXG9nrjfB6I3u9EV5vZK83wuuN7PVGeL2Rvd4Irzey1xvh9Ub2eiO83siKHKHIkRU5QpEjK3KE1xvZ643Q78j6HQtwF8YNtY+FcRfg5rch4pyhyOcMxQrclXHDGY6VkVQ8svIjKx7JXm+seGTjR+KMj9j4kQ2PbCwq+MiRfeTYIKrGAOE6Rz4lJjbgZo86NuDmoyViA24+fSPC0Y7saEc42pEd7QhHO7KjHXEaSzTGbcBtjNuAm/3vCP87sv8dDbh5bogduDvj7sDdGXcH7s64O3B3xo15J3bG3YGbnfgIJz52xt2BW47MGR7kwOQIcmJyBrkwuYLcmGwgdyYPkNlWYZWxp2QiTwiWZ9c4IVg+sClOCJYPJIqYdyLPOxHzTuR5J2LeiTzvRMw7keediHknLjmLCLh53omYdyLPOxHzTuR5J2LeiTzvRMw7keediHkn8rwTMe9Ennci5p3I8068gZtPPoqYjiJPRxFrkshrkngD9824sVSJvFSJmLwiL1UiliqRlyoRS5XES5WEpUripUrCUiXxUiVhqZJ4qZKwVEm8VElYqiReqiQsVRIvVRKWKomXKglLlcRLlYSlSuKlSsJSJfFSJWGpknipkrBUSbxUSViqJF6qJCxVEi9VEpYqiZcqCUuVxEuVhKVK4qVKwlIl8VIlYamSeKmSsFRJvFRJWKokXqokLFUSL1USliqJlyoJS5XES5WE3cTEu4npGLYr8Zl/CTtQiXegPk7QYhubYGMT29g03udtBSZHkFkmAzL5R57ORX2/P5JkR7/OOMAs8yojnxOyrsxuYs7HIudCk0CGp5TZ9GaY3jwnkw/AvEiCeZ25IbP1yfchF365y/ubTyR2CpZvhSddbFRehY1SgT0pbE+wUXlVVh8cDXlV3l7G0ZBX5QMWq4HM228V22+Vx7Ji8qo8N1TMDY33vxse2dgtb+cor6uxj9wgq8Y7rA07rI1PqWzwHhsv3xrcxMY7lQ07lY33Hlv3IAcmAyC7La2f4WnsWjSofWMfoo0OMi0kGyb0xhN6ex8AyLNrW0DCc1q7gYQXTe1eINMjDROM8UximEns6kw+gjVHojKYdfPEpfkjWAv86+BBDkzGI/kDlJ2D9zbZmDxAnkw+XBrvLBi2VYw/Ehn2T4w3SgyffYw/+1jCIxM/EhprvCAzrI6MNdagscbrHYPGGi9sDBprrLEGjTXWWIPGGrvlBrfcWGMNGmtsqA0aa4N/DY21wbhhv413yw0aa6yxBo01No8GB6qzeexQzc6q2aGa/ZpMPhLsrJodqtlZNTtUs7NqdqhmD/xIqGZnHezQQTnLsUPZOitbh7J1VraOr4adzWPHl73O5rFD2Tqbxw7z2HkLAYdxPoHMTMYj+cjfjrN9O1vNjg9QnVfRHcvl3riTBpk0Hh3YsM7r4o4FcDeWID4pdeO+oVadFbl3kNkR6VjVdTa9Hcu3zoqM5eXVWZE7LHJni9yhyJ0VGTP0NVg1x3UADlbN4Y5gB6vmgGoOVrYRDsLByjawZzpY2UZEJ6xsA8o2UmFyBZnkDQFeg3VwQAcH6yBWy9dgZRtQtsFT9ICyDVa2AWUbbPAGDN5gyzZg2QYrxIBlGzwXD/AzWCEGFGKwQgw4foM/4Y0J3JOmUazyr8EGb0BPhugJVqOD3Vuo4BM1zuTT+WT1mVCfyQoxoRCTFWJCISbvrc90HMLJ1mfC+kweeZzDfU0e+YlP65P3BydmwMkKMaEQkw+unQ2dsNc7sdU0eTto4n2dvFTBF9Nr8k7OxBBP3rKZA1zyx9uJj7eTR37i4+3kHZGJIZ48xBOn507eWViY0xb7PgtnPy8Op1nw1hcPGnZVrsWLvQV5r8p9w+dffBz8gs+/eBJYiEJYvCW5sCW5eEtyYUtysY+88Nl+8ejg09G1+L1ceC8XD9qCQVn8XmLb51q8u7XwXi4eHcTPbd/AMbmDTFqF8+Gvm3cWMJTXzQv3G17BzQ7rjYipO1QmN5Clk4P7Zof1RgzUzd8Bb3wHvCOfQo0jwm92WG/EKd1s7W9YezmNHofRX3cmw3FnA5kfCY/jLoy7ADcvrm9YiJvjZm74Jzer5g3VvDnk5W7om/ftbzgid5PT0SET3nK/4XHcxjKBx3HzbvkN//buLJMOdjo/Eop8syJjlf9EYEr05DsEU46n/gif5GO0HY7Rdhr4CfV0XkLg/LH5Tr4DfwlFZL3Y9Qq69JPQjwSfeQS5eAlk8hW/l0imj6BGCfLxZ92yS4mN7MDTOULHIy7GD+lnoJ8h/Qz0I9E4/lh0F3hi3XUPuoRC4vqIkCToEdc4BInCw8rVhSb0d+ykhLzEMzm4zK/aruPcfp5fdx2/Zxfc4Y11eQn9xu/5Kyt2WZ9gPImBO46HK46DmwpCoeRSAId33xWJiyzQkyJ8lYz+C8u/nAfsUvqBPEsXOq6/KHLNRTnO+y4lEvC4Cbtk/fyI+ZMwJ8yruxQ65FCLBPK94/t4+eLwBdRVGXcEG7gmJ/N/RP5JuC82BXYp9OP6uSbBlvjeuUserwacTUL08MXTNd4CcPjkuUumY5fQmYRTG/BbkqhD6INJzKWd78zOqvQPu2FN6Mf72CWPL7587nIJHf2L3fiIPZRYYawudsnP7eerv+uinx3y7OzzObg9brBH4LBTvksT+rEnQ65/Ge84RolBHCcI0Q2ZLz4iGUV/pse1ORIYPkMHXX5/3Asna4fnOp5Dl0jbebbS3Wy/E88oMX3zfClzS+Y1OMu7lJDG8/VrlxLTeCbUXUpQ4/n+tUuJajwfwHYpYY3XG4/ENZ6JeZcS2Hi2np4ITKY74JfMhuWAX1IbFm7iWDLvLAf8ktywHPCLXVoO+OV9XA74Jb9hOeCXBIflgV8yHJYHfklxWB74JcdheeCXJIflgV+yHJYHftHb5YFf8hwW9HmJPq8A/JLpsALwB8EfgF9SIFYAfnl/VwD+IPjxHi15j1YA/iD4A/BHwR+BPwr+CPxR8Efgl2usVgT+KPgj8Iv9WRH4xR4u2KUl/uSKwC/ZEysBv6RPrAT84iesBPySQLES8EsGxcJ1W7IO3nXglxyKBT9tiR+7cN3WEv9tZeCXNIqVgV/yKFYGfkmkWBn4JZNiZeCXVIoFu7okl2Jl4Jf5fcE/XJJNsQrwSzrFKsAv89cqwC8JFasAv9j5BTu/iuAvwF8EfwF+mdcW5v0l/i02NHYp+CvwS7rFqsAv+RarAn8V/BX4xd9YFfir4K/AL+uaVYFf/PzVgL8J/gb8TfA34Bc/Z5099V3KcxueK1c9LcNzJa1jGZ4reR3Y3HGyueOwu7NLkZtBbiY4DXITf3IZ5CY5H8uAvwv+Dvxd8HfgF/9/deCX9ePqwN8Ffwf+Lvg78Ev+yOrAL/7kgj+55PrBNYB/CP4B/JKIsgbwy7p1DeAfgn8Av/jnawD/EPwD+IfgH8A/Bf8E/in4J/DLOmtN4J+CH+uvJeuvNYFf1hFrAr9cS7hwLeGS9dqawK+ZMAv4NRVmAb/mwizg12SYBfyaDbOAX9NhFvBrPswCfk2IWcAv1y0urNPXLfhv4Jf1xbqBX9aV6wb+W/DfwC9++Hr74ZJcs7DvtCS7ZuE+wVv8anzd+PX1mx8XysnvsZ6VHVN3Y330q2s5f+/6Tawrb5lnEba3S8k8wj6D7GE6bGI62cTcdVx3WYrQcU2o7ANg13OXXegDdF7/fuQ2id37uN5T0t0+rveU/caPZChZJ3659lPkg32Pe8nvF+Qg+v/l2k96rndnnbhLuQ70fIHYJV8iOZBHM3h/wI/jd+1SM1IS6EXoFfQmdAO9C32Azjkso+C5RZ57/KVdCv6jD7vk9JtR0U+Vfir6Yb/F4xPpLrPQC+hV6A10E3oHXfFM0JfQ70Nnv2XXgb8J/gb8TfA34G+CvwF/E/wN+OU+1oH7WEcT/A34m+BvwG+C34BfryA14DfBb8Bvgt+A3wS/Ab8JfgN+E/wG/Cb4DfglIWt04O+CvwN/F/wd+Lvg78DfBX8H/i74O/B3wd+Bvwv+DvxD8A/g14yyAfxD8A/gH4J/AP8Q/AP4h+AfwD8E/wD+IfgH8E/BP4FfUt/GBP4p+CfwT8E/gX8K/gn8U/BP4J+CfwK/3M47JvAvwb+Afwn+BfxL7NiCPZScvnGS+vyQ64LHjX7k3uT3cSdTMjfn2f/ZZRX6BJ35Qhypn1l+f9aJXiIHPNKnd6n0CjrPL0iE2KX8vuP3XX6PlEeJKth1/H7I75F+KQEEHhEEu5Tfv3MnJU0Z+1pe9rW+uoea8/auEzkUfnXgzIlT2yXf5f77Vwg30OUa3/fVwk2SPH/32l88V67xxYfPIAeTBHxICG4I/XeuCf5H3peNzxSXRQ5FMsRbm6RkIOThsnxJwCciOzPvTxoCznfphR5Aj0JPoGehF9Cr0BvoJvQOuuKZoC+h34fO+3W7DvwS95oT8CfBn4A/Cf4E/EnwJ+BPgj8BfxL8CfiT4E/AnwV/Bv4s+DPwZ8GP6+hzFvwZ+LPgz8CfBX8G/iz4M/AXwXnWF7sUvgr4qvL7Cr6q8FXBl4QY5wq+qvBVwVcVvir4qsJXBV9V+KrgS2KYcwX+Jvgb8Etwc27A3wR/A/4m+BvwN8HfgL8J/gb8TfCf0BDLS/pHDHbm+c7K+f5ihb+P7HoAPQo9gZ6F/u6nCr2BbkLvoA+hT9CX0I/8SxD8ATiD4AzAKRH3JQBnEJwBOCUUvwTgDIIzAGcQnAE4o8gT9rOI/Sywn0XsZ4H9LGI/C+xnEftZYD+L2M8C+1nEfiIRZ5eCH/aziP0ssJ9F7GeB/ZS4iF0HfrGfBfaziP0ssJ9F7GeB/SxiPwvsZxH7WWA/i9jPAvtZxH4W2M8i9rPAfhaxnwX2s4j9LLCfRexngf0sYj8L7GfJgj8Dv9jVUoCf92F23UDvQh+gT6Gjf7HDBXa4iB0usMNF7HCBHS5ihwvscKmCswKP+CflxEpbEbtaYFeL2NUCu1rEfhbYzyL2s8B+FrGfBfaziP0sDePSZFwa5GaC04DTBKcBp4ncDHIzwW/Ab4LfgN8EvwFPFzwd/Xfpv6P/Lv139C8JNKVDPl3k0yGfLvLpwDMEz4AchsjhrC92KXoyoM9D9Pnsy+1S8J/0Q6sy79QTSLdL1jcEDFvl74OGuCarkjGEIxx2yfJBiL9VwVPPRucuh9CP3JrMa+8kqCb2E/FL1jieZ9ePnCVOyRARapoCh4WBWShMhxw0PQwLg11y/4hrMivSD+yPcYKK2VmI7lL6B05Nk7Kzgb5L7h+JUrtUegOd+e0Ov3fy+3f6mFd6BV36wbh0joc0ZEju8rcTzvqS35/9h12yHJB3vEtJRTvjNcVubC1/Ce42jsPZdQe6hAKfOJxdJqHfh+6lH49+vPTj0Y+Xfo6/t0sO+e7u4Owc73cvREPLev/G9/pbv9cfMbwGf2jDPA1eI5FfQ7lLObfzOnsET7m04T4NURsSHp60oaJBw5fPhwn3q1PaDqjn4FoO4XbY0NilHMb32it5NSxpeB92GySWaRPOw0PUv3gdRvWUEp2NaKAryOebKwBu0LjtALhBPvBuwhF7kC+tV8R4RO0Kodt6qot7Dvs4DfKR7iOYXE4dcBeiba4k4SoXPpddJYiW4PvXJY7pJmQ0yBe2630icdXjhOtV0dC0wU5D0L94rT6eUv8CKlrlcNlNOCpaFW4F3Cof7K6KEaxyHuZVoVeVM7MeQkSDPON9MHJz2uDRINFhV8PDm4QlbMI6DRJPcCGeW5O0H0JCQ9GGIytz+hcOfyGxhJvQToOOx0nAfsquDUfsFhUuxK7xvZeBc9P3/Jj0171P2gBUSxh8HzzdFW6H7nZVBnxEvbp87b2QZXB1CdO5EK6quZWbALhDteSduDH1HUTkxC5FGRYerrE01wmmeUqRFYIMLo2OeZ+ufd1O/uL2543S7+4X4gmemzqkAc+4OVNrE/B+yKdfnPbypKZEbXjlDLrnYHFpeK2ynmsgujS8s1z4bA0HDp9STvN+HyDuJCHBPSkZrwZRUXfOmH5KOS8cIbhOzxp2J4vhKYVBJIU4N/ThR3d3ObVhnQY579WdCOmnlL9A4ITzekb6OftzlxI6sQkLDbc0AK6vRRsqGpo2GBqWNpwR9E0bGhpMu+p4uGSm4Kjyp5ShfR8CH8T0bUJCw9SG83DN6nEBsgpeUAV/GAxB/+J1HMBT6sMDHh4U7msrbJdydvkmFDTow+P7L0SIcD92qagSupLwF+QhPUqvcPEOhqyyKniGRLo4RN7s10QGCiHGuzRtOAonpy86nM++S4lu24SCBuEDYcZODjDb7ya6ShLotwlHd5Nkdrg00SChYw6+j8viDm5CRIOIBMG9LivnGahyl6E9YSZPKX/xvqugOJFucWcEZcfX4QT0p5Su4Hg9V31LAx5el/7Ffd6PJj7DJjQ0mDYcs9T0KoZ2nIldalfuiL3J7LwJBQ1NG85r0KI+A2JvKvaTL/6UeuWDnddZTtF5CGiQuMBNCGiQMYfj5UytqOF1Np0/EEr7q1ylTZhoEE2E7+NMsvKQNvSUv2o4fAzx258Eo9OgSo0A010KqlGOhZMQoIeABpXuCX7ZpQSjfdydMVWv5lkC7NK04Yz5VD5mMDR0bRhoWNpwlHrqeCA0dZf68IwGCdbfhIKGpg1AVUUZEM66S68NAQ3aFXR3itfnTsSFe0I3uQEe2S4l5/U6YvdBFM7HdzKvvFE4PHdPOF5u43hfu5HFh8swMtnkrc1nh2yXkuGXsQTYpdwSgVDwbBILmxELvkt+Bz/uleiiJRme/i7lOguEg2fN28v99SFjl5LIsAnzNMhrkBf40NSE9/0V+Y6aY/v6OLRLSTbYBDSYdrXQlZilfB+ztEsRCeJudyn3ZGBoq+wAf8lIlRAlh63bp+Sh/XIfgySldnjIuwzSkONpkM2BjvS17mXLAvuBu+QAzU3AXwxZQXZkcu9S4CIkvktM4UOYaJDkxfedC7Lr+xD6aRBvadorP+YpszS8dsyfUm6BsIauZMw3wZ0GTX2A2HdZtKGeBtek4TVWT5KkZkm+tiWfMmlDRgOL/eMGCccfBL5KWNTMteMoPqWmIL6icJ6Sxb48clnU019Q0VVlHfUl60bS95/L3V4NTfPUPvJoxADcSNi4ZUcZRvTye8g5FA3nm/guue6bcGKae5UrEHDmlh9Lo0/Pwn0vfXjP8uOM/GcpcBr++hTf/uu/+y9/+Lf//Q//Ue8Vu87WxC7Xb/7B38kf4ADmizecAk4SD6zOCeH4iQ0xjv65JPgFhvDKLNGALYQnBuwD4l+++f9QSwMEFAAAAAgAIAyIT7dj9LLmAgAA1QYAABEAAABpZG5hL2ludHJhbmdlcy5weX1UTY/aMBC951eMWKlKRIjI9raC7aVqj5VWe0MoGDIQS4md2k7ZlfrjO2MbQtB2c4D44z2/92ac2WyW/JR/UIGAVloH+ghSOTyhsTl0okYYep5MG93jcWjb94y22k60Laih26Ph1VarE5hB2YQGB60sHgZHtDdcB931g0MCG+wNWlROOKkVw12DcNSmS9LUOmFcmQOqusxyCONHP37MoCiKrIDXhvUqe6bDGfp7QOupZmdh4Q0ifSKVX9ZGnqQSrTf4bQY8LTuEX2mrT+mD151lRTKjLBLZ9do42Euy4JKkRp+HEeqEtjoa3VXMkvJPlT0lQA/hXi6WPogRSBMlhqRSHZBXAlsAR8fV0lusllfPVQih4hTYdg52ODRkSLiJK88ynmUQ8E0cXPtOu7RFimPEBWIJqzVNrzy95ODBaspDFokne/HyApU66BprtmClOrVjQaNKWK3g6yP8ZS6SqLTjvW7oW7TFJZ1AaylXrH18sI6jmKNfD6nQ0mbrx62gpbOR1DNrWJR+jrVKLqDfnLao0hvaLBbEJ0IFmJdk8n7PuCVuu1ncyC2s19OZebldlFMQP9TkTqoBrwuHwRhqgMorgynJaGVePjHjFRVMF6LvKcC0CnkHjnTCuFlu8+kZm0W5hTmUWXZlm0QmQ+wG3WBUKEkajstCX09P8+X0LRcjisDbOmeh0BFe4w3c3KEMPD8zIufXL9Tm5YVi4SXfXy3OU0iV0kyVx1jG+/UdHZpOKuSC7XjPDo70CbLMoEErvHxGYhdRi+zC667gDmQeH0FFyUyNhxOXIcVecweG21+Ev6rFo4vJ5ZEkbH6AM1IjDG0Ne1LWdVhL4ZCunmhQ1CxJBADcxnvBStdADJdtVHwtOd3YlyzlGZZj67EOikaeGr5Ad/F7eRvCUFdkt7eAUcwcTgjwaTvHkr2a2M0P9G35r7M9NlLVo6+Q3tVW1B2u3aSKo4PqE/UfaF8H7Z9rjuMforWY/ANQSwMEFAAAAAgAJr3bUB3Ua/cYAAAAFgAAABQAAABpZG5hL3BhY2thZ2VfZGF0YS5weYuPL0stKs7Mz4uPV7BVUDfSMzRQ5+ICAFBLAwQUAAAACACvvNtQPjNJVumWAABkFQMAEQAAAGlkbmEvdXRzNDZkYXRhLnB5fL1Xkx3Xlef7rk+BVs9MU9OuMo/XjKYn82RmRD/Mfbl9b3REd18NRC9a0cjNnRtAWXjvgYL3vqpgy4ARogMYEkEYigT5gkKxHKWO0Ee4iYJY+/dfqw4UCDFq/zLzZK6119prr+3+ctk/vfTy28teePnV55eV/13+7jtvvLb8nZefXf7qq79a9uLzrz//1vJ3nn9u2U9+teydN9549e2/f/m515f/7XPL31n+vb9c9vOXX/vhsreff2fh7udff/aN515+/cUfvfvOC3/bXPbD733v+9///j9m/0ey7H8sf/PNEiz7p+U/KX/khbfeeG3Z//VP/2e1/nflBd/73vd+/OOfP//W2y+/8fqPf7zsR8u+H1X+ruvvur7/veeef2HZj99+/sUfdz3zgx9+b1n5v7eef+fdt15f9i8LfzzT9cuuv1n2V5W/+sHffPd3ZP6Ozd8V83fV/F0zf9fN3w3zd9P83TJ/J+bv1PzdNn9n5u/c/F3Y73UCsBKIrAgiK4PICiGyUoisGCIrh8gKIrKSiKwoIiuLyAojstKIrDgiK4/YyiN2NcLKI7byiK08YiuP2MojtvKIrTxiK4/YyiO28oitPOLH8vi/WZDbAiuPSpe5ohLZgtgWVGxB1RbUbEHdFjRsQdMWtGyBlUfFyqNi5VGx9aNi60fFyqNq60f1sTz+x1/9zbJ3/2o5i+PF4p+wuLJY/CyLq4vFz7G4tlj8PIvri8UvsLixWPwii5uLxS+xuLVY/DKLk8Xin7I4XSx+hcXtxeJXWZwtFr/G4nyx+HUWF4vFb9CTdi0Wv8niIO+fsTjI+y0WB3m/zeIg73dYHOT9LouDvH/O4iDvX7A4yPuXLA7y/hWLg7x/zWJbd2u27tZs3a3Zuluzdbdu627d2nLd2nJdbPnfvhda1KhTi1q31l631l631l631l631l631l5PbEFqC9q2wHq/uvV+9cIUNKz3a1iJNazEGtb7Naw8GlYeDSuPhpVHw8qjYeXRsPJo2BrUsDWoYWtQw9aghq1Bzcfy+GcWRLYgtgUVW1C1BTVbULcFDVvQtAUtW5DYgtQWtG1BZgtyW1CYgpaVR8vKo2Xl0bLyaFl5tKw8WlYeLSuPlpVHy8qjZeXRsvJoWXm0rDxaVh4tK4/kiYd57M2WsdhaTWKtJrFWk1irSazVJNZqEms1STO8zW9XEVjrSYIXZiOeWJ+SWJ+SPJbRP7LA+pSkwEv0AqTWt6RWSmlo02IWhzZNegZV/NBKgtCqfTrOcivA1AowpQBPEITGLGJxECNb8tSKMQ1hQ/RoZW+VKBMk3x3Ch4q9yzrudgge3j/I8hA9vH+I5UHU7x9meZD1+0dYHgKI94+yPMj6/WMsDyHE+8dZHmKI9xcFzGY27tTMtkOY8f5JPjGo5v1TLA+6ef80y0Nk9/4ZlgcdvX+W5UFB759jedDO++dZHqK79y+gPIOGLrIcGhpiOTQ0zHJoaITl0NAllkNDl1kODV1huTWKDIK/xnII/jrLIfhRlkPwYyyH4GmuGQQ/wXII/gbLHws+exL6MvbNrd/Jrd/JrXfOrXfOrXfOrXfOrXPJrRxzG9Pk1ivnNqbJrSPJrT/ObYyXW3+cW1dRWHkUVh6FlUdh5VFYeRRWHoWVR2HlUVh5FFYehZVHYeVRWHkUVh6FlUdh5RF1Bcv8YKUAK5ioKxjlBz0CrISirmCPH/QJsKKKuoIpfjAgwMos6grG+MFqAVZ4UVewww/WCrBSjLqCCX6wXoAVZ9QVrO+DjQKcXCPIdbMAJ9cIct0qwMk1gly3C3ByjSDXnQKcXCPIdbcAJ9cIct0rwMk1glwHBTi5RpDrAQFOrjHkekiAk2sMuR4R4OQaQ67HBDi5xpDrCQFOrjHkekqAk2sMuZ4RIHJlsFDpFCxEMSR/Th7mJB9D8hcEOMlXguRf/q1YqssSRpUg+pd/KgCCvizACboCQV8V4ARdCa3xB6MCrBONKqEh/mBcgPWmUSW0wR/cEGDdalQJcc+rv5GXRcbww24Btp2JkC78sFeAbXAi5Ao/7BdgW54IicIPVwmwTVCELOEn468LCdXzQ3GnVWf2yBJ+KO606iofUoQfijutusqH/OCH4k5rru4hOfihuNOaM3tkBj8Ud1pztRFpwQ/FndZcbURO8ENxpzVn9kgIfijutObkWoNcxZ3WnFxrkKu405qTax1yFXfqsoVRHXIVd1p3cq1DruJOXXYwqkOu4k5dmjCqQ67iTl2+MKpDruJOXeIwqkOu4ixdBjGqQ67iLF0qMWpArkMCnFwbkOuIACfXBuQq3tNlGaMG5CoOyaUbowb6OO8JCP7gQ3GrLv8YNYJb/VDcasO51UZwqx+KW204t9oIbpWdmqhpo/ioGdzsLTH6ZpDuRxK0Np10m0G6H0nQ2nTSbQbp3tomIHjbj8TbNp23bQbp3tohIFTeW+JqmkHIH60T4ITcDFX1Y/EWzSDSW+KcWqHG3hJX1Aqi/WiLANeCtUILdmsxEcOYpdoxZmkF4d8S79Jywm9B+OIHWkH4t04KCDX8I/1o5zlawR3cEhtvhWp7a1iAq7YtyFjMNAky/ki8rcuZRgnqrcjDJU+jBPVWvK3LokZJEN0nKwSg3oroEldvE0QJYlGJ8wpJEOZH4lsT51uTUGE/EcNJgjA/YuoocinVKA019ZM1AoIwP5HwBdnVjy4JcCEXEqsfXRHgQq40CPMTsZgU9fC6AFcPkTX9aEKAEx3Sk8+pR0XC8VUJw5EffF1BqOUfbxDgajlyfR9vIsicYpDm+1gEkjkXggzfx+JZM6cRJPc+FgeaOY1kQRAf7xLgqjcyex/vEeCqN5J6H+8T4Pwx8nYfS0iWudAhD07iY3ESLnUX5aFefyxOwuXwojxUko/FSbhkXpQHJ/GxhGQuqxfloUJ/LK7YpfeiPFS5jyUkc3m+KA91/2NxGy7hF+WQq7hrl/mLilAJn/u1AIhG3LXL60VFEM1H0mEo4D8lhiogITF5l/CLCkhoTICTUAEJiXdwKcCogIT0zayEYuQCb64UYGtejFzgzR4BtubFyAXe7BNgxRsjF3hzQICteTFygTdXC7ByjZELvLlWgJVrjFzgzcXOKwOYWqcAJnbZwhjZwpsbBTjJI1t4c7MAJ3lkC29uFeAkj2zhze0CnOSRLby5U4CTPLKFN3cLcJJHtvDmXgFO8sgW3hwU4OSKbOHNAwKcXJEt/Gi/ACdXZAtvHhHg5Ips4c1jApxckS28eUKAkyuyhTdPCXByRbbw5hkBTq7IBd48J8DJFbnAmxcEOLkiF3hzSICTK1KBN0cEOLlWwmc9GhLBImt3c1yAbWljZO0+2iMgx9OPC3Hfh6zdrW4BNmCJkbX7aIWAUEs+EQ+F5N0n6wSgYyPur+oqC+b53dKHu8qC3N0tcX8udxcjd3drvQBXWZC7uyXOzeXu4jRUlpekHEIWfSBc/6mUB1G/JeXoO14XECR9a0wA+kHS0qVLT/OLEbn/SsqduDNOo+gX0gIR/WYJyBohKchJIW0QaYKzDEQ0nrkZwAg2pdsd50E5r0p50M3bUh5080sphxVIG+Tizko1vMtvVwgI7yJzXSrOGiuwxt9uFRDe47erzFMwZea6ADdReaFycwZQpeamTCP197shAW4yNVJ/vxsR4GZVI/X3ibykS/1VkPr73VUB4kYY1tQ7hTWVhp1sVmmgsqq8GtahVP48yfDxtf9FykPf8bZ8uJtzWGl2mulUadZAjE6RoPv0rIBg4DJQU2kGC//0nIDQIfz0vIDgWD+9IMDOtqs0g2O9vU6AnXZXQebu9noBkBm75pWWq4JI2X0qVbAVKtynwwKC3XwqCkFe7tNLAmA1lwVA9FcEBNF/KqJHeu7TawIgeqlpLYh+VEAIFD4dExA0IPPiKsjrfTohICji0xsCgiI+ZY+qgvTebXFgSdDHbammiZ0wWkmCIm73CAiKuN0rICjidp+AoIjb/QKCIm4PCAiKuL1KQFDE7dUCgiJurxEQFHF7rQAbsVUWpuNlS3xy23lB5Jxus5tSwQQzrdhIPWndwhQzFRsyUGqAmGSmn4RElAoa08y0Qrh5ZhVMNLu9W4Bb+oI5Zrf3CnD+F9PLbg8KsAFdBRmq2wcE2ICugqDh9iEBroVDuHD7iACnW0QKt48JcC0cMlS3TwhwckWG6vYpAU6uyFDdPiPAyRUZqtvSWLgMVQUZqtvSSrgMVaVAJRavVnTyHwXEK6bjJq1VkOVSQyg6OXI3i62CLNdtfYZbsFW0Or0ZpCwe2mW5KkVwzb/TS4NMfyfOvAj+4Xd05lWktu5sEhBEe2ezgCDaO4s5a8ZMjU4xU7UreJA7W+WZQQd3tgkIOrizXUCo6Xd2CAiquLNTQKjwd3YJCBq5s1tA0MidPQKCD7+zV0Co/nf2CQgauzMoIGjszn4BQWN36HaqSIl9dlFA0NhnQwKCxj4bFhD08dmIgKCPzy4JCPr47LKAoI/PrggI+vjsqoCgj8+uCQj6+Oy6gKCPz0YFBH18NiYg6OOzcQFBH5+JPSCH9tkNAUEfnzG4qSKVdmeFAFjQSgGwoG4BsI8eAbCPXgGwjz4BsI9+AbCPAQGwj1UCYB+rBcA+1giAfawVAPtYJwD2sV4A7GODANgH8yxVt1a3irk8dw4JsM1yFXN57hwRYNuNKuby3DkmwDbLVczluXNCgG2Wq5jLc+eUANssVzGX584ZAbbBqGIuz51zAmyzXMVcnjsXBNhmuYoO/R1xOK5DX0WH/o54Gtehr6JDf0dcjOvQV9GhvyO+xc3lqWIuzx1xKm4NYbUBuYo3cd34agNyFTfScHJtQK7iPxpOrs0g17viOJpOruhq3xVLa7p3RVf7rphY070rutp3xbaa7l0xO+auhAkt967oY9+V1r/l6gA613el2XeTXqroVd+V9r7l6gC603eloXezXaroR9+VFr7l5IoO9F1p2lsiV0ZIzY4REvrWd6XVbznJo1N9V7yamzNTxZyZu+LV3JyZKnrTd8WruTkzVXSj74pXc0sQq+g/3xWv5tYgVtFxvitezS1DrGIWzV3xam4WTRWzaO6KV0ucXJGVvyteza1MrCIff1e8WurkilT8XfFqqZMrcvB3xau5lYlVZN/vildz6fcqViXeFa/m1iVWMcXmrng1N8WmitWId8WrubWI1bbNYFaxDPGexEFtm76uYgXiPQmA2nb2SxWLD+9J5NO23bYqpgHdk5CnbbttVSwovCexTtvOfqliLeE9CXLaNsNTxayiexLduFlFVSRy7omjzVy1RAbnnjjazFVLpG7uiaPNXLVEzuaeOFqXs6kiZ3NPHK3L2VSRs7knjtblbKrI2dwTR+tyNlXkbO6JG3U5mypyNvfEjbqcTRU5m3viRl3OpoqczT1xoy5nU0XO5p64UZezqSJnc0/cqMvZVJGzuSdu1OVsqsjZ3BM36nI2VeRs7okbdTmbKnI298SNuoWFVSRr7okbdcmaKpI198SNuilJVUxJuidu1K05rGIu0j1xo24uUhVZmnviRl2Wpoq5SPfEjbq5SFXkbe6JG3VzkWpI2NxfKcDKtYZMzf3F7iTjkFanOKTmZivVkKK53yfASr6G3Mz9AQFW8jUkZe6vFmAlX0M25v5aAVbyNaRh7q8XYCVfQ/7l/kYBTvJIvNzfLMBJHhmX+1sFOLki1XJ/uwAnV+RY7u8U4OSK5Mr93QKcXJFVub9XgJMr0in3BwU4uSKPcv+AACdXJFDuHxLg5IrMyf0jApxckTK5f0yAkytyJfdPCHByRZLk/ikBTq7Ijtw/I8DJFWmR++cEOLkiH3L/ggAn14oNuGqVEHB9LpLGXKTPDwsIcdfnInCsV/z8qIAQfn0ucseyxc+PCwhR2Oci/koQ9ucnBYRg7HPRAiZKfX5aQIjJPhdlVILoPz8rIIRmn4tOMF3q8/MCQkbqc1EN5m98flEA9DEkAPoYFgB9jAiAPi4JgD4uC4A+rgiAPq4KgD6uCYA+rguAPkYFQB9jAqCPcQHQx4QA6OOGAOiDjWoNayZ/v0JA0MfvpW3F0snfdwsI+vh9j4Cgj9/3Cgj6+L20o1hI+ft+AXafo5pbL1nD7I3Pj+krugVWNTcNo+ZSQDW3p1PNJXRqbTsFpuZWONRy91suVKwVdqunepfbGy2y+zLVI+kiyaZsHfc5rTeC9L888YCGUkcy8cEqg4J0vx4wKNjEgzUGud3aMjuppe4mnjW67PZSjchtv1a1Qm24eYiN1M6gaLTdcwr3HBeaNmO3/ZdLsDcrdgesZtVdU3MbjdXstzdr7jl195y628Escdekbi81txap6Spv0/WOm7nbxs319FpY1Pzw6PaHR8cFtgB3WJgA7rQwBdxnYRvwkIUZ4GELc8AzFhaAFwx0mmi5Lexabj1oy03jarkUcsvvFucSwq3E7+Rm8y6t1D0ntXmkVur2nXM1o5X6TeJs4qbVdrvTtW2s2Gq7d27byK/VdnvpuWxKK3Pb2iET8vD4oYfHRVHYIenh8cMWus3rMij9+AVzudslqZU7pbs9jlqF3xDPbX3XZZ+TuH5k0mVNPXGdsiSySk9cFyuJrSKS2FaepOKe43b0TRAMPzw5/PDkuED3QW7njgQh8MOT1+wDbDOfuN1+k4qtmomb559UrMklbluOpGrNIHEz6ZOqk5qbF59UbXVK3LYTSc060YRe8eQOIwZ6xZM7LYRXPLkPUJr/jpuyJjUnrZqTFl3kyTP2BVzVdtu4Jg2nSDdulzjfmTjfmbiNNxPnOxO3sWbifGfifGfifGfifGfifGeSund2YxeJ852J851J227kmTjfmbTdc5zvTNpOPi78TDL3Xc6lJc6lJc6lJYWTs0sNpl02ZE6d20ud20ud20u7bJVMndtLndtLndtLndtLndtLndtLndtLnWdLnWdLnWNKnWNKq7bNTJ3TSZ3TSZ3TSZ3TSd2uNGnNtpkpY6azhx6elT1AGTOdPWyh/z2nj7qTkfMLqVsxkDadrJ1fSJ1fSF33LW1aB5+6mCp1m1KkbkPd1I2Dp25/3LTl9Op2yE3dzg9p4mzDDT2niasfbo+FNHHv47aaTZ0PSlN3Tds2gKkbHUxd/Ja6sb7U+aDU+aDU+aDUxXipi/FS54NS11trd9nfajvf0e6y3952vqMdSd2QtrTzzqvOvbSde2k7t9Cu2A5m27mFtlte1HZuoV11v+XcQtu5hbZLpbRrtoq1a07MruvTdubedubebtgq33azktque9R2ptx2ptx2ptx2TXzbNfFt13y3XfPddqbTds1323V92s502s502s502s502m7MuZ05fbmESTuzIVnbNfFt18S3nXm1C6cvN1LZLqzbyJwJZs4EM2eCmTPBLLI6zZxdZM4uMmcXmbOLrGa/K6vZOROZq8+Zq8+ZW4GWubA2c81X5pqvzG3bnrXcO7vkVeZm1GSpTShlbnpKlto6lrkkWNZ27+Pqata2PiFr2xAgy5y+3HYrmavPmdtnJcudnF1dzVxdzdzuvJnLquYuHM3Zo72+/uG1YYFue+OKFUPuVojnLs+Xu2qSu9MQ8qb7LXceQt50mym7SCh3G37lia2SuZvJlic2EsrdFLYca6wfjq1/OCqi0l2RpAHtuBtp7ipn7ipn7pxt7pxt7ipw7qYv5c7Z5i5OyTPr/HPmmUbPPBzdLTBTeEig23DaVevCuc4C4/YPx9cKcTs4YyTs4UT3wxtXBbqdqKs2wCrchgAFhpgeTqyzj3RbRmNQ6OHEZnO521OzwEE5Dyd22Mvdttfsr0zstZc7cdSRU5lY8fDGZYFuy+y6baQKN2e7aFDCQw8nhgU6CWNoZeHySwKR+box/PDGCoENgeXNhiPFfmPEwpZAf7P7dmyJ6C93XbICK4Af3thiFNFyYnCHkBSuV1Vgae3DG/vsI11Fw/TdhzcOmctdP6pIKM7j9nJX0TCL9uGNM/ZyV9FSynuTqWip35vdVTTXGSva7ho3/bHIrKuPupz/iLpcNzPqwhzPR5dOKLKqKosyXH1OkXWhUZff0K0Lk74me/Yp8tt7u3RitMT+srGL8qLYhXlR7Po/Uez2YCiLbGNRFrmt3uKa/8Wa/0WXGIli11WKYncoUVnkn+WSnVHslu9HsUtTRrHLU0ZPNjExV/lvTJ3sY9f+lkX+F93s5LLI/6Jrg6PYRX9R7LfZq7i+QVnUuX/eeePQSuReqhL5n3Pd3bLIVdRKw5poVPF7zVbc8UpRxQ3ORk+Wz+pVmIA5ufGiohbQkKIEaFhRCjSiCBa68ZKiDEh3YS9c/ax6/1N3faSyyO8X7RJmUd2LqV44u2n4X2y43mbUcN3NqBHZMDJqxP5ZbgQqarhx/KhRswF11PBW33ABRlnk36vh6nrDHSVXFvlf9JWv4fIbZZHb77LhBkCjhksXlEWuIjfcASllkbuq6TXU7HLVvelP8GgujHX+oxa5V226qSBlkX8Jr9pmw1Wm5hJ7RbvsatT0m8k2vf22/Ge3IudeW/69WrHtLUYtN72kLPJX+YrZqrrK1PIHBLTqTqotd75hWeQMpuXl1Ur8e3l5tdxYVtTygUPLBzgt14mKEjcNqizyV/mwIvEmmnifnri1iFHijhCMEt8wJ97zJ96lJYmTfeLllfgmN/X1K606SaQ+3En9N6Zej2nhXEfqzhCK2hUXLrYrbgPSJ4lpvUonZ0nz3XHbzKiNVaCyar8kWOh/SQlW+uuGx00sLV+pBOttu5Vgee0aJVhEfkRJaMm/3b1WkfNBbawenezZpCgC2qwoBtqiqAK0VVEVaJuiGtB2RXWgHYoaQDsVIZ7p2aUI8UzPbkWIZ3r2KEI807NXUcceRxv9zMmeQUU50H5FBZDsydxOqK+DiqivQ4qor8OKqC+tSQn1dVQR9XVMEfV1XBH1dUIR9XVSEfV1ShH1dVoR9XVGEfV1VhH1dU4R9XVeEfUlez23U+rroiLqa0gR9aWuJ6W+RhRRX+qWUurrsiLq64oi6uuqIurrmiLq67oi6mtUkWt92ymVMaGIylA/m1IZsq102/cu2z4D0fahQdsN/EZ+2CnKsIhkuQIcmXhcSfiOnyhwcUCGnW2fUxAq0vMKsAn7oJJQi15UEOrQSwpCDXpZQag/P1UQas8rCkLdeVVBqDmvKcChAApc859hPckbCoIWZBvlkgQtvKkg1KW3BGBByTsKgi7eVRB08QsFlQ61BgtKbukpBlhRcmuzEhjzpW5FjQ5VDYtKtF5hUYnWK+7bu1tJ8Lp6VEvGDXz1RAIk/bUuuoR/WVR0qFNYUaJVBytK9HywDKMHixVFQsOOW4+W9+I4GT0LAstOJi/tUAQnfGmnonqHGogxC61omPWuFQ1zOycvqdVjZqeeIJNhWufPFaCtvHRMEbanHFaC/SlHlGCDSmmhMmwRJDsVlgRbzA0owVl+CpbejjnKsGWQSq1e6yAA7BxkvrLe6PSV2EJINsUrSavjVyYdv9L7OIzHyOZZJXFnN2SIXG/pEScIXJ9VgBOFtivBKb8XleBoITVwxKwvKMA223r0CALWW4eUwPK0PiJc1TOWMkSreixThmD11mkliH0ujykK0v9EDQyh6q1zShD5XOlTFPTziZECfOaQEihI1YAwVQ+DyhCl3tL6iiD1llolN0K/rAQauqYkaOgTbYIQoOr5TBmPMDqjBPuhr1aCs4zWKEFweknrIoJTPW8pQ2wqe9+XJCjo1wqCfj7RFhqh6yfaQiNy1ROYMgSun6pEfdya+cxn5s9iybFVweS1lYr8kT3YrWDyWo8if2oPtiOYvNanyB/cgx0JJq8NKPJn92BTgslrqxX543uwL8HktbWKlpAJWrRr6xX5Q3ywO8HktY2K/PlIEeW9WZGXd0R5b1Xk5R1R3tsVeXlHlPdORV7eEeW9W5GXd0R571Xk5R1R3oOKvLwjyvuAIi/vmPJebCckiOu4F2p59xKnVlElem6VP5o5j6kSPbrKn86cx1SJnl7lD2jOY6pED7DyZzTnMVWiZ1i5zQ7KIqpEj7Hy5zDnMVWiJ1n5XmpeoUqGFHl5VyjvEUVe3hXK+7IiL+8K5X1VkZd3hfK+rsjLu0J5jyny8q5Q3hOKvLwrlPd7iry80ROdvK4uvurljV7o5HV18dUlDmaDvK+ri696ebPveV1dvFtmUhZB3tfVxbt5YWUR5H1dXbw/5zlHX3Pyurp4f9Rzju0LJq+ri/enPec1yltdvD/wOa9R3uri/ZnPOfuO19XF+2Of8xrlrS7en/yc1yhvdfH+8Oe8Rnmri/fnP+fsJF5XF+9nMuQ1yltdvD8FOq9T3nrooJ+ok9cpb/Xf/izovE55q//2x0Hndcpb/bc/ETqvU97qv/2h0Hmd8lb/7bt/eZ3yVv/tj4bO65S3+m9/OnTeoLzVf/sDovMG5a3+258RnTcob/Xf/pjovEF5q//2J0XnDcpb/bfvE+cNylv9t9tjtiyivNV/u21myyLKW/23H93NMcg4Oar+209cyTG8ODmq/tufGp1jYHFydNF/S3jUcSPUKPdnS+cYj5wcVRffXOIETqhkVF1806sEG+lOjqqLd1vpRjn20p0cVRfvtlIpi6CSUXXxbkVvlHNMdFRdvNuCpSyiStTFu5XAZRFVoi7eHyedYzxy+Sc3FGF8y/hFt0CwLAoCePttJf77OcY4qo/2p0HnHFscVZfrD4TOOaY4qi7XnwmdcyxxVF2uWx9QFrG+qct1u9yWRaxv6nLdRrdlEeubulx/YnTOscJRdbluu9so5xjhqLpct+NtWUR5q8t1S3SinGOCo+py3eKzsojyVpfrtr4tiyhvdbn+1OicY3+j6nLdBrhlEeWtLtcfM51zOHBUXa7bBjd6ssjjz1ePqctte3m3Ie8xdbnuFKCyCPIe05C57eXdhrzH1J+6FfnRk0Ul312t/rTt5Y2DtCfH1J+6lfxlEeQ9pv607eXdhrzH1J+6ZVlRnlHe6k/d1rllEeWt/tTtD1QWUd7qT91ixrKI8taQ2a0ILosobw2Z3Ta6UZ5R3hoyu510Iy7smRzTkNltphvlGeWtIfMSp3TnlLf67yUO6s4pb/XfS5zVnVPe6r+XOK47p7zVfy9xYndOeav/XuLQ7pzyVv+9xLndOeWt/jvvPDms4/as5V1Uibp4f8B3XlAl6uLdGteyiCpRF+825C2LqBJ18f6Y8LygStTFu215yyKqRF28PyU853TwMXXxSySnOQ18TF28X6iRF5S3uni3RW9UMIE8vkIRxkfHVyrC+493K0K4Nd6jCN8x3qsIM1jG+xThe8b7FWEGy7i0CoWfflz4RQYF07njmxTx6zcr4tdvUcSv36qIX79NEb9ez6SP3DzUws9NLpgDHT+oiN9xSBG/47AifscRRfyOo4r4HccUUYvHFVGL4vsKP8G6YPpx/KIifuqQIn7qsCJ+6ogifuolRfzUy4r4qVcU8VPFpxR+lnhR9RWWycAJNVdMQpmcUHNlUnBCzRXzUCYn1FyZHJxQc8VMlMkJNVe/tqvwk50Lt+lNWcT3V4OruTG8osb3VkNzy7qjosb3VQPzK8MKzL2YnJDgp/Bz0wvmrybU9ur8JLU95rEm1Pbq/DS1PeazJtT26vxEtT3mtSbU9ur8VLU9v9TgycLbJ1fLibwlcUthuCZXDuON/ILciCty5YDe6MlyXHMx5pNcUOIWjXHRrRzbG/nltmURTjxdr8SlCopGkLgc5lsSX6eYvRpfISfhRlzmW7a0FiLGGe+2EJNcx3ssRLwz3hsgI7e44wa05f2YhjXeZx+O8Gi830LMCRkfsLD5NFG0niaK5GmiSJ8mivbSongCs6d9Z/607yye8p3Mjo0ftJAqP2QhVX7YQqr8iIVU+VELqc9jFlKfxy2kPk9Y2Hzad7ae9p3J074zfdp3tp/2ndnTvjN/2ncWT/lOZvsm7HdyTcGE/U5m/ibsd3JdwYT9TmYBJ+x3cm3BhP1OZgQn7HdyztaE+87m076z9bTvTJ72nenTvrP9tO/Mnvad+dO+s3jKd/r1XAVThhMX7fVo0IYsw8m8Zy1zC/QKv9qz4BKCG1fsI6CSGxr0chHBDQ16mUicMHfhjHVtyZFP9F/5WBGVBbbstxp0IbFobyo63rSQX/wz+p3GpQv5xe/uWmUh1XTJ/B7O3/r0qmVQ03nLvJrcBjZlEdT0nm0OmHec0F4GDuUy0RDTjxPaycDxXCYqQhbSf6Ro6bfaS1hISAao/YS2qMoI3a/2KHDM+qfae87cMsXCbTFVFkFe75kHoFq/p70B5g8ntH+VQWAaGWa+U5BRTtuMnLJcoMopo5y2GTn5NdpFDjmpHeY+FGZy7z3tT+QUivYnmOSbGFXUMahlru897TPkFM4qI5w8F6jCyYNw/qcAtxNYWURDHjf1uAhSu726Q/Tacf/k8nacRb/BPtrbujspvSyirVuXzITfxDVFHbsczPtNjCuClrQ3gfQf5fCEUU2qh0JqsCK76Dp+skPNn69WYFf7l0WPXyhbuFbLbbcn7nJpuLIoREqPVmxSZHuRZVEDXzGiyHb24q7Yup2yyOZqyyKbfCiLig6f7zJQZVEFHzBc/lNaNdRdYFPNZVEd91wu/yltGOou8IJYyFw9+Z6/+AslNmNcFrGm9CmyGeO4qxo08g//oKQZiP7oQm7qz69j7rGd8Lir1vAStEJ0GwGVRZ1UuJCz0Rpct+v2y6Kqv8p6ibgLk366FIRa/bICuz9kWRSqSFVBCOhrCkIFqSsIsmooCO6pqSA4p5aCZFF+f60geKZHq7YoCtXsRwqCX3pGQahrP1AQQvXXBTQ7iRxZk0hBaFViBcFyKwo6aaTZSSPNThppdtJIs5NGmp000uykkWZnjTQ7aaTZSSPNThpp+lYCKY3lCpZeWVuCJdYOPgFBF79UgNVJu5UEZbykICjjFQVBGa8qCMp4TUGrQzVEruJNBUEZbysI7fY7CuxOH3GX24GkLAqv+JY+2M3RibvcicWx3/Et7iqc24vQ7i//+2cVRUCLbyDhV8ctt8u7g+LNY4Pif3PRIBsNl0W1xZd49u/fUFQHeldR0Lusri2JazgijHP+5uILioLSX1SQLl0VIwxJfnBCCJa8vKwgXrqSRpEXR1RbunpGWMbyuorJrWIpi1pL1+UII5s/UxC+9y0FdulxHGGtyduvKQle4p3n9VuxnuQdc5MdyC+Lgov4tQIXW0VYTHJ7tRIvGIyjmgc7k4swevqKgiCr948pCR7hJwpChkstIl5CvKGGiauNsLuB1uKKC0EixLAqbYSvWo2wrcEXm5QECX+xWUkwwy+2KAmC/mKrklA31UwqLlKMMHT7wvJfKkKnaYUSrMYeUVJ0ugdrRx6t0m90a0fKoiCq5xQ0OqgOw7r60RjU/akCLw0suIgerextKIwEthTGAqMupRWhFYWhvsQe1uTOmsK63GlgkFTFwyCtqoct+c26wmCzNQ9TubOpsC0vZGAmjzUwZEYbHhbym8LqnRoMrPN/2RCs87coaPHlnysJKjQAS/3Nw+ogBjWIDEM1V3PFSLkBQWO/NA9LQQwKytJWpt7Jz2KIXE0WA+TqKBudtNPoqJ1GZ+00Omqn0Uk7jY7aaXTWTuMp2ml01E5jCe1IHNhx5/jy3o4KbHRWYKOTAhudFNjopMBGJwW6zfXKIrvZf1nkYzD017qcy3P7BZdFNvUcR25bwjhGbPBo1Znyn9LMUHeBCxRiBAqPVp0v/wmtdBnqLnAN25MtkytatMRVubvKzSWJK5iXNrVilaIEaLUiOzsyrsZ2K9i46uZSlUV2Y6q4Cv8aKQgWHCsIBlxREMy3qiBYb01BsN66gmC8DQXBdJsKgt22FKAp7FISJByZb0cjaD4+VNDIfH2onJH5/GCVkfl+NHwqADjWSCUAzxqpCOBZI5UBHGusMlhwrH9OiEQ/UBQ6nc/EBoVO5zMVg0Ji9JmqQSEz+kzNoJAafaZuUMj/PNMwKA2oaVDIAD3TMgg5oKjLsBzMyqMAMwJpdoEZiTQjMCOShSTdd8zIZMEPf8eMUJpUm5FKE3qLjFiaUFxk5NKE5mIjl6YbLKi2IOHlenULEv6JQRDwswZBvs8pSiDe5w2CdF8wCMJ90SDI9iWDINqXDYJkf2oQBPuKQZDrqwbBIl4zCBbxukGwiDcMgkW8aRD09TODoK+3DIK+3jYI+npHUQp9vWsQ9PVzg6CvXxgEff3SIOjrVwZBX782KDQwyxUsve9dCUID86yC0MAsBl0SF3bc8r+8NzRBz+tD0alXEBqgFxWE9uclBaH5eVlBaH2kW13FirdXFIS251UFoel5TUFoeV5X0CHFUm2HmOBNBUFlP1MQVPaWgqCytxUElb2jIOjjXQVL73hXgqCPXygI+vilgqCPXykI+pC8WzXrMOBQzaIOlTXrkHeuYrLKcwqqHWpiVutQE7E6Tmti1uhQE7MOCZ5q1iHBU806pBermOOiNREr5bQm4vgrrYlYLac1ESeta03EijmtiXnUoSZi1ZzWREyK0ZqIlXNaE/Oltx4sQb1DTcwbHWoiJtloTcQUG62JmGCjcaRbQxcnXbYv5ztsidtCK04Qkf7whz9SFPz5jwypgxjkEtwJ6sijM4O/vabQvVLqzrMoi+xEmdgfz1sWud9uY4+1RxcvKsKckItDimKgYUWYiHFxRBFmYVy8pKgGdFkR5mFcvKIIkxIuXlXUBLqmqAV0XVECNKoIw7sXxxRBfxfHFSFFcHFCUQ50QxGSBBffE4QBq0dDKxRBX0MrFUFfQ92KoK+hHkXQ11CvIuhrqE8R9DXUrwj6GhpQBH0NrVIEfQ2tVgR9Da1RBH0NrVUEfQ2tUwR9Da1XBH0NbVAEfQ1tFBRTX5sUUV+bFVFfWxRRX1sVUV/bFFFfi2utJCzseJREeTdVukMfTJXuVESV7lJEle5WRJXuUUSV7lVEle5TRJUOKqJK9yty8yzaftZZ2x2UErfrVPghRS4t10by6tYZJViBcFk9B/JXtwxxQ63tOhV0UpEbdm/XqZjTilwStV2nQs4qskuzyiLs+qrVHRmpW9rQICN1S60HGalbaiFuo6eyiPakjZLb6KksorFoi+Pb2TbS4j9VEL735wrC595U7468+C117phw9WhYnbvbaCnmOS6PhtWpu42WYp7g8mhYnbnbRSnmqS6PhtWJu12UYp7n8mhYnbfbRaksgvEPq9N2uyiVRTD6YXXWbheluI01Y4+G1Um7XZRinizzaFhrq9tFKeaJMo+G1Sm7XZRiniTzaHi7Ii/vFuWtHnaJeK5FeatndeeIxjwx5tGwetSWl3eL8lZP2vLyblHeBxR5eSeUt7pNt2tTzBNhHg0fUeTlnVDexxR5eSeU9wlFXt4J5X1KkZd3Qnmrv3e7NsU86eXR8DlFXt4J5X1BkZd3Snmrz3W7NsU80eXRsPpPt2tTzJNcHg1rMO92bYp5gsujYQ3i3a5NMU9ueTSswbvbtSnmiS2PhjVod7s2lUWUtzasbtemmIe4PBpedOMSUnU8giFuu42d4jbSXI9G1MW7jZ3KIqhkRF2829ipLIJKRtTFu42dyiKoZERdvNvYKW4jrfVoRF2829ipLIJKRtTFu42dyiKoZERdvNvYqSyCSkbUxbuNneJ2Rnmri3cbO5VFlLe6eLexU1lEeauLdxs7lUWUt7p4t7FTWUR5q4t3GzuVRZS3uni3sVNZRHmri/eJiHZGeauLdxs7xe2c8lYX7zZ2Kosob3XxbmOnsgiR6IhGormPRHN0CUbOK3JD9u2Cb6LOz+1nVBa55Ezb7TUUZ7FLzmR+5mPm18Rkbofr+MkpTHqV76o8OdVDr0Jw/eiyKCTzcwMyd9ZqWeSUnLXcwH/mp1E/OZ7CXOU6I0+OfNCr3PLg+MlBCuYq/yx3WnPszyUoi/yz3DnMZZF/lp/XnbnTmssi/6zMP8utVYyf7LYsV+V+pkzuDtGMcx/F5VhOP3NBXGruNZVjvd/8jQOKXE0vkE385toKRRHQSUUx0BVFFaD3FAUX+41sCV2i0IH7ZrRPUR1onaIG0EFFTaBRRaHHPN1r3jC43um+Y4pSoDOKggue7u9WlAHtUJQDmQcGhU8P6Hchmzg9cFlR0Nf0qkVVSnjT8XCC8u6g0uk1e/XBQaXTa68rCiqdXrddUQ1oj6I60DVFQaXT61cqagLtUwSVrj+lCCrdoMpBwnF6g9ZiJBynN65SBJVuPKIIKt27UxFUuk+sskDCcfqIVgQkHKeP6ssj4Th9dI0i6OuoKgUJx+mjJxRBX8dGFEFf5zYpgr7Oq/9ANnH6gmoZ2cTpixsVQV8XDyuCvi6aB0JfQ+cVQV9DQ4qgr6ta5zHrb/qqegJM+Zu+qg/E2oHpqzcUQV/XhxVBX9fVV2EdwfR19VVYSTA9dkkR9DVmXgP6Gl+rCPqSTfdibgk3PaEVAFvCTcvmXDG3hJue0BqFdQXT7/UoCvqaWaWmhy3hZlapwWLRwcxq/S6sOpjZdkFRBKQyxMkVMzsGFFWA1MxxgsXMjqOKakDqRXGSxcxO9fdY6zCzU+shVjvM7L2oKOhrZp/KEJvYzezTVh2b2M2cNa8R9DVzTq0Sm9jNnDPfBX2d1wpQZUyj+sICjJkL2xRBXxfUYLH4Ysa4FKy8mLloHgh96QBngVUXsyvVLWPNxeyq04oaQFpFsd5idtWYohaQmjnWWsyu1nqIlRazqzWewjqL2dVGUEFfs2vOKgr6mt3Qq6gAkpRBgfGT2a3aLmMK8OzW44qCvma37VJUAdK2EgMps9u09mIq8Ow2NQdMBp7doZUNgy2zO7Yogr52qyox6DK7e0IR9LVHWyIMvszuUS1jVvDsXnMX9HVAVYlRmNkDapXoKc4eUNPDOMzsUW1uMDV49ri2sBiQmT2ubQomB8+eUiPCsovZMyp5jNnMnll6W5KOh0XEBRZnzA6Z74NKR8xHQKXjqlIszpiVfTPjAmsvZm9oqIXFF7M3tCJglGluhUayGGeaW6FdGow0za3Q+oihprkV+skYa5pbqTULy/vnutVwMeY0N6CRLJb4zw2oh8PY09yAeY0a0LiioK+5VfrJWOo/t0orOMai5lapJ8DykbnVajEYk5pbraEWlvzPrda6gbGpud3rFUFfu7UpwBjV3CGNf7Gr4dwh/WSMVc0dUsljC4C5Y2pnGLOaO67GhG0A5k5otcHY1dxJfUPsBDCns3G4j+GczgnhLoZzQ9q9wFjW3JCKFzsCzOlQFPcvnLusQRN2BZi7rE4dY1tzV7QeYufCuVHVF8a45sbUlpFmmbuh9RBjXXM39DWwY+HcDe2QY8xrvltdCnYrnO9Tq8TY1/yASh47Fc4PaI3CGNj8gPmtoK/57apljIXN79C6gR0K53dpq44xsfk96kWxO+H8Hg0GMTY2v1ebbuxMOD9oXj4H2q+oANLWD2Nl84OaD8AJs/MH1IgwZjZ/4Jwi6Ms0pxg7mz+ofh6nzM4f1k/GGNr8Ea1smEA+f0SdHsbS5o9rOgmTyOePazCIMbX54xrxYZb4/GnzhtDXGQ3QMFN8/ox5Q+jrrPZXMFt8/qz2wzCQNn9WPTZmjM+f1TYFA2rz5zTDhFnj8yP6GhhYm7+uBouZ4/Omt40BtvlR80Doa1Tjegy0zY9pNxczyOfHtLnBgNv8mJoDZpHPj6l9YeBtfkxDEcwknx/foAj6Mp1+zCafH9fuIAbi5sf1kzGjfH5CHSwG5OYntJHKmLRWaWBgbv6GOiLMLJ+/Yd7QDtdUOu3NVgI7llUWhVf9uyVD044ndZT32iGmCncmm5KortLljgatdDERIznQEjHR2asIiZj1fYrsmEKlq2p3uimLvBjc2FCly81JqTzZuufPgp3q3q2sTbZHmR0ZK4tCnZvqXjXVvUaoG+2odBW8YWSqh8mOypNtef5Zi+xgbiWq+KuQyJvsXaEImy32rlSEGYD9pxVhB+LebkXYf7j/rCLsPtx/ThF2VeztUYQ9FXt7FWHry94+RdhUsf+iIuw53D+kCHtf9g8rwn7D/SOKsNtw/yVF2Gu4/7IgHj3bu0cR9dWviPoaUAR99WrN4VG0vYcUQV+9qxVBX71rFFFfaxVRX+sUUV/rFUFfvRsUQV+9GxVBX72bFEFfvZsVQV+9WxRBX30qKB5d23dYEfTVd0QR9NV3VBH0JcNzFW6gMtl3XBH01XdCEfTVd1IR9NV3ShH01admztM3ZJSwwk1TJvvUzHkKR5+aOY+67TuvCPrqu6AI+upTW+apHH1qyzz6tk9tuU59qS3zCNw+tWXOiO5TW67boegK90mZ7N2miHa1XRH0NKDmzSNFBtS8eaTIgJocjxQZULvikSIDWxVBTwM7FUFPA7sV0a72KYKeBgYF8cjcgQOK6AfNXfSD+xXRDx5URD+oNtygvtSGeZRur5pcg35Q7YpH6vaq8TToB9V4eLRurxpPg35QjYdH7Paq8TToB9UMeNRu7xVFtCuNGHhoSd9iFWU4Wel4fEh5N01PqyrPNBlQW+aJJgP6ETzPpE+rKo8q6duliK5SazGPKenXeIOHlPRrvMEjSvrVOnlASb+2RDyepF9bIh5O0q/+g0eT9Gvd58Ek/dp+uZ07K37HmbKIc2FU8cjK6dSVEmEuzDUNIpCVm967VxHmwlzT+AJZuW+uqRkgK/fNNQ09kJWb3abVBFk5na1TohQPNKgNpNExsnLTR9XykZWb3qftFXoEOpGnEvnuQJT7ZqVwV8XoCT5Thvc/UBgRdhsYE/YYWCHsM7BK2G9gjXDAwDrhagMbhGsNbBKuM7BFuMHAhHCjgSnhJgPbhJsNzAi3GIidIr69aLWCvSL+0L1LYQR9/mHtUQOhzz8MjhsIff7hxCoDoc8/XNxmIPT5x+6zBkKff9zeayD0+cf9RnzYqP2ZP148aSD0+cfrlwyEPv+9x4gvgj7/fZ2pCRH0+e/brWyhzz8eseKDPv+46+gfD9pPzYX/+17LnYeNY+iy9Kd6fQxdlh7VwJh3GjuJocvSqxpY5WONomPocrrvnIF1/qbxB3GDd54xELr85vqggdDl9PqVBkKXM/tMnY2hy9mV9jehy5mLpv7EGR9ral4MRc4PGKvGrv/PTO87oLACfc7sPGYg9Dlz8LSBMV/I6LMCfc4evWEg9Dm9ab2B0Ofs6usGQp9zw4cMhD5njxmVVaDP6TVGthXo85uxIwZCn9ObjYVVoM/pc8cNhD5n99rHQp/fjJs6hLMKnpkbMQ1Ohfpcb8yh2kUhGHOo0j7HTTWpQp9zA0HZEgh3PImkvL/C+0fMwzFRbvtGRYinro8rwsQrmeRVIswiOG8eaCeFV2KkOt5853lF2AYvUoIN9mMl2G6togQbxVaVhM+Ma0qwRWxdSfjIuKEkxIxxU0kIGeOWkhAxVrqUhICxYmSADWGNDEK4WDEyCNFixcggBIsVlQFzG5rQjZnb0NRszNyGJllj5jY0kxrX2WfuV8Q+s1Y4yXGsVtQxdxjXO+YOY+Y4NEEYM8ehCcKYOQ5NEMbMcWiCMGaOQxOEMXIcZVSnKKirjOkEIcdRRnSKgr7KeE5R0FcZzSkK+vqDTAIsUdBXGckpCvoq4zhFQV9lFKco6KuM4RQFfZURnKKgrzJ+UxT0VUZvioK+ythNURuvce3bkYNKg8rKuO6Pg+beoLU/7rmoyK4hqsTIcJg+cIz0hekDx032nLXGI31h+sAx0hdlrKYInl7zqHGTPWe1ZKQvdGVHidBzvj6oiCNxKxVxiq3WQqQvdFJpiTDF9qLWDKQvdM5uiTB+O6A22ey05KASY/6RziouEabYHjytCFNs96m+kOkoozFFaJk3rVeEKYCrryvC/CNZXV4itMzHVCnIdJQxmCJkOk5oXUemY3bbVUWYwi6LIkqE8faVpxQh09FrZIhMx3q1Ky7zGlEtY/7R/EFtbDD/qIy4FGHJQf9uRZgSfe6IImam1ijCKi3NMcUJ7UubKMw/mr56XBH0tVHFi/lH0+vGFGGk+/xORdDXOfNbnGJrPjmDDBdtWeLSjke0lHdjStmItumYolQG0oIwRWn66D5FQaUVjdcwQ6mi8RomKFU0XsP8pIrGa5ieVNV4DbOTqhqvYXJSVeM1zE2qaryGqUlVjdcwM6mq8RomJlWNDIIeq0YGQY1VI4OgoqqRQdBQTWWAOUmRdeOYlBQ7Bh05hg2uHcMe145hm2vHsNO1Y9js2jHsd+0Yt7x2kLteO8iNrx0MqnvpRSVBdc+/ZVDQ3fM/VxJ09+o7zwnCBKWp7sOKIiCNLDFBaapbvQcmKE11q3PGBKWpbvX2mKA01a3NPXYQmOpWX4rtL6e6LyhqAg0pwk7w3epLsaPAVPdlRSmQtn3YWWCqW1tnbIU51a3OGTsMTHVPKOJcnfcEYaeBqR6NprAl5lSPhuDYcWCqRzta2BbTTAqKsTHmVI82cNgac6pHWzFsjjnVo3Estsec6tEIBxtkTvVoHwxbZE71aB8Mm2RO9WhvCtsmTPVsVwR99WiEg+0Tpno0nM6hr579iqCvHg0gC+pL+xUF9aWRW0F9qVUW1JdaZUF9qVUW1JdaZUF9aXhWUF9qsAX1pQZbUF/aSyyoL7XlgvpSWy6oLw0FC+pLzbygvoYVYahs7Oj0FqmllS5xiVM9m6d6xo1pVLoiveZMWcemug/pNbFeMzLVs8f42EpXRa8ZN8KsdNFnHi1t7fFzui/qNTW9ZsR4hkoXXejxqe5T5TV6AR3pydKJle504WVW62VNuay8oLv88HG9ht719MLbXtcLEr1g3NhFpYue9szCF53WC9pyQU/5OT1OQZlec658iHtVeuCzC9cYsRR6wYgx/ErEqnJ+SnMilSgS+lh3iy8gMXPH42zKZ7ASlS94bInviCr6O+XnrnDXVPU555TWDC2r2IJcVTNR3V7Wc+iJcdhqGzXclReW0FLECrXkL7b8BQs/p4qKWKcuPJZA9/hCxTGfmepl5xZefr1ew8o1tFDHtf5GrFkjC9JeoxfkekH5E4N6AavV5cfvufDOck3cJdcs2PQSthKzil1dqBvOPcSsQmNLuIe44i5QNcVsWFYsIZOYzcuAiY8qMVuY1e5L2cg4zcZsZ9aY0EAO9enZsEQF49E+PRsXqkSvXsBmZ8HTLy2Btr3MPocN0aaFC866L2WLtO2xvy8drbeduNDLXN2odOkFKrEKw4qt7l5GFo+brO/cp3r6SkUvO7JEG1hhrdjx+CFlDew+4X6xJo/qcY0P5/z37Hr8vd3vLdESVlhP9piQuVJpCn3sa7foBS35lcdmqxqsJPoE13BVUr2grCrX9AJWkt0LF7ynF7CSDH7XVhupspLsW3hPcwGrx14rzGqX/MTj56tmq5He7uRcjd0F5idYN/Z/577U01ar9hr7KzW54HEN3KgX1PWCM6aHV6k29IKRBQd4wr0tK8aB79y+uaYl15hwo5oY+p2Bmy9i9ThkY4Fq29AlfF01k2uWbFirrB5Hl4jRqoW7QJ9QYw05/iQy1QtYQ04/caruIbFec0opa8iZxz7KRCO1ql4wvuBAzE+whpy1DV+trvSxHU11D7tvYSVZKgLB8G3XrDF4Hu3pWKgUsWMYxHUMSTnHcKynY0HvdceCyhuWYTi36VhQdMsxnHDmBIMh3chJBoO6kRMNhnUjJxsM7EZOOBjajZx0MLgbOfHwWDovH+TovICQo/MSCpqMvYSCKmMvoaDL2EsoKDN2EsJgb+wkhOHel95criho8zlDgiqXv6sk6PEny99SFLT4xmKmUXo0HQ9iKm8OWn7zWX1sUPFzrylpgsSKcCbUaxVFQbcvm2/D6Mf1kZlVm5RigHHXOZseaHB27gkzKFTBcPDMrg0zsjNvSTFydfD09PjGb8b3mGHACoaIjRYxQvy6IUG/n44bhJO3DQkKfsWQoN9XfqIkKO81Q4LyXjQEx3ktf1VRUN4rjgXtvfmCkqC91w1pQw4G4Rju8RcVBZ29ZkjQ1ytKMDD80q+VBC29YhHO7rIoqOlFi4Ke3rGoho9S8WFc+DVDYGaGBE29YkhQ1AtqmhgTft2QFC9nEI6OMgQH7hoStPSKIThy13gHjAc/a1HQkyUxfskgWJPxNhgOftaioCZL6vgpg4KaXnu0avvbCpsKzVsGbRkXghHhVywK6nrNIpyEZ1HQ11vLn1OUE/lPKCzWj8C475t6J4Z9XzeEftAgaM6QoLg3f64k6O11Q+r4IYOgN0NgXoa0Ot4DL/gLJfCChtALGhTU9ZohMC9Dik738PTC29oNwcDvaxY9VtI/a1FQzk9+pgRWpdEChnqf1YqHgd5ny3plPLfbCLksQnihbRfGd1/8lZKgmJfUJDCy+9KbSoJiXn5dSdDLK68o6ej2MKr7yjtCMKj7qt6DMd1X9Q0wpPvqGyoxDOm++kslQTsmHMCA7msva1uCAd3X3jAo2M6bLymxe3yXRfByby5+poShHQ9+Ku+GYWl0i5Hetw0J+ntbzRTjvL8wggj6+3lZGY06ggqXO5hzXoVOPqvknFdhGedVWMZ5FZZxXoVlnFdhGedVWMZ5FZZxXoVlMq/CQplXYaHMq7CQZ4o7yGPFHeTJ4g7ycHELMQIcOflgDDhyAsIocOQkhHHg2EkII8GxkxDGgmMnIYwGx05CGA+OnYQwIhw7CWFMOPYSQi7FSyjoM/YSQh/cSwjz4r2EMDXeSyjo80XtlVS77CLJVrHwO3RNSZe7Kqk23VVVt0Y2qbrGKam6/feT+sJohFxVR973290rFdntasqiGFf3KLKb8pRFVVzdp8huElMW1XH1gCK7hU9Z1MTVqxXZDXTKogRXr1Vkt+4pi9q4er0iu6NOWYTp97s3KrITuZN6jfLerMjLu0Z5b1Xk5V2jvLcr8vKuUd47FXl51yjv3Yq8vGuU915FXt41yntQkZd3jfI+oMjLu055H1Lk5V2nvI8o8vKuU97HFHl51ynvE4q8vOuU9ylFXt51yvuMIi/vOuV9TpGXN/JK3+5RD+GO2SuLIME96iHcMXtlESS4Rz2EO2avLIIE96iH0GP2JJbreOJUeReEvEediDuJryyCkPeoE3En8ZVFEPIedSLuJL6yCJV6jzoRdxJfUm9RJepE3El8ZRFVok7EncRXFlEl6kTcSXxlEVWiTsSdxFcWUd7qRNyuZ2UR5a1OxJ3hUhYFed9ZoyS053fWKbEnGyX1wvYXkoZvlBuYGvHtviOKnEgbmAbx7b5jipxIG5j18O2+E4qcSBuY5/DtvlOKnEgbmNbw7b4zipxIG5i88O2+c4pcFW5glsK3+y4oclW4UaEERxR5CVYowcuKvAQrlOBVRV6CFUrwuiIvwQolOKbIS7BCCU4o8hKsUILvKfISZOQ2uFKRcwINRm6DPYq8vBm5DfYp8vJm5DY4oMjLm5Hb4GpFXt6M3AbXKvLyZuQ2uF6Rlzcjt8GNiry8GbnJHrol8vJm5Da4VZGXNyO3we2KvLwZuQ3uVOTlzchtcLciL29GboN7FXl5M3IbHFTk5c3IbfCAIi9vRm6DhxR5eTNyG1SP7CO3BiO3QfXIPnJrMHIbVI/sI7cGI7dB9cg+cmswchtUj+wjtwYjt0H1yD5ya3Bh8OCiR5bgqON5VeXdXiWNrqUe+AR5lWCE9dvBUUX24OyyKMXV44rscYVlEZZDX1an3eBXqxd1C2uTBqPb/epFfXTbYHS7X72oj24bjG73qxf10W2D0e1+9aLuEOmyCOLav06RFxcGMW9pdW+6EKjB6HK/OjofXTYYXe5XR+ejywbjxf3quny82GC8uF9dl48XG4wX96vr8vFiA/Hit/vVdbltc8siVKr96rrcyc1JI6EE1XW5k5vLIkpQXZc7ubksYqVSXbqTm8siyltdlzu5uSyivNV1uZOby6Ig71vHlYTKeWufkiD1W0YwqKJnlQTZ3zqtxIseo3+f7FcSUqafqHlh9O8TrQkY/Pv2nFbulHrQkNSd6FwWUQ8akroTncsi6kG9mzvRuSxivdeQ1J3oXBax3mtI6k50LotY79WZuuOak0bb7vNcFqFyH1CP6c5kLoso1G2KQvb5k24l2NfjygZFDfz6KkV2j5myCA3WgTWKfIO1MFynH4sM+bcHriiquwcg8f2Bmiay3h9qrSvcezRjlyBuurNuyyJ7EGrSrPqrGq7323SHqibNtt36vSxyzUgz87/ojnFNWjW7n2BZ5CpWq+G+seXfq9W2p/6WRfIsCX06nn2UtPyrtzL3ga3C7q2WJD5VkFRcZj7xgk+q7tWTmr+q5t4rqbnGPmnbk3GTxB1rnSSFe6/UbdNfFi1xlfNAaZeTRBr5Z0X+WbH7xjRe4ipnqmnsf9FX+pTdE02lpJgz++3Zq4rQ3pxREsZ3vj23RVDd/zrmj36yXomz4rTuhmZS7kK84aAi7Ki04ZAi7Ki04bAi7Ki04Ygi7Ki04agi7Ki04ZgieN4NxxVhR6UNKnruQrzhpCLsqLThlCLsqLThtCLsqLRBNcZdiDecVYQuxIZzirBl7YbzirAL8QbpAqXchXjDRUXU15Ai6mtYEfU1ooj6uqSI+rqsiPq6ooj6UnvgFsMbrimivq4ror5GFVFfY4qor3FF1NeEIurrhiLqSwKYFP2cyY0rFEFfG1cqgr42diuCvjb2KIK+NvYqgr429imCvjb2K4K+Ng4ogr7kaOUSQV8bVyuCvjauUQR9bVyrCPrauE4R9LVR/R96U5MbNyiCvjZKTi5NqK9NiqivzYqoL/XZCfW1VRH1tU0R9bVdEfW1QxH1tVMR9bVLEfW1WxH1tUcR9bVXEfW1TxH1NaiI+tqviPqSjnGaUl/afqXUl7ZfKfWl7VdKfS22XxLUdTw1qLybKtUmLqVKtYlLqVJt4lKqVJu4lCrVJi6lSrWJS6lSbeJSqlSbuJQq1SYupUq1iUupUm3iUqpUm7i2j3JyF7mmbkPwsshFrm0XK2dPchv/LEWpv8rNdcme9MX0qsIGVEULGzTMDa1ShE3Z9l5ShEMh5UDDEuFQyBHzQJx7LEeMlYibfA0rwrniUhFLhEPQ5JSuEmEnr2Pmt3DS2YBBWMsiW7OWCIeHHzPfhZ3yBq4owmG5MmWhRDgs90afIGyFMLfrPUU4+XH/qCIo5cg1RTjprHujIijlZLciHB5+aa8inITbs1sRdsoTx1ginNS5aUIRTqaT421KBH2dGFKEMwFGzctDX+svK4K+zvYqgr5WmU/GSZ27zgnCBgPz1/STsanA9OVNirCz4XtnFMGIdq5XhJNVjx1VBH2tXa0IOxsO7FKEk1UPHlCEnfKMmWO3gJl9OxVhJ8rLqkrsEDC7dlwRdjaUnQlKhJ3ybvQrws6G/VcVYRu8taoULPqf2aoVACv+Z85sVYTDqFepKrHEf3bvCUXQl5zIXCKchLtLvwvD9XO71bNh7f7c1QuKcPLjPvWiWLI/f87cBfu6qi4Fy/RnD69ThJ0Nj6mPwtL82SsHFWHbwo1aRbEWf36dKgXD+npEZongD8/sUISdKI9oxcay++lx81s4PHxIXx7r7OdW3lAEf7j6sCL4wyNqRBj2nxtR94Vl9PN7tWJj+H/6iNoy1s1PD5nXwELMk1qxsVZ+5uoeRViCOb7YcDC8rHY8Rai8G03cJa10mDkwe02/D2vm52Viaomg0rVbFMFldpu7sBnsgBoTFsZPD2gFx4yC2ZPmLqj0ilYEzCyY26iNFZbAz+/WFgkzDObOr1AUVDqzVpvuGlWq1QepvLkz5g2DSr+5dl0RXOYFdWOYeTCzQiWPpe+zGzRowgyE2e0XFcEE12kDgpkIs0fGFCFOvKGeADMSpm9oqIX17t9c0+YUMxNmRrQCIFc5s13jKcxQmL2kdoZ17tOS8CgRQpJD2iJhjfvsPm0lMGNhbrO6TKxvnzutLS0SpTPn1akjUarnipcIIcmwBrlIlM6s1RqFROncWo3QkSid2aDeFInS2e3mLuhr9LwihCR9qmUkSqcHVFBIlM4cVvEiUTo7onUeidK51eq+GrQvNQckSucH1GAbDEnUAyBROr1ZbRmJUt0OukTwh2NnFUFfO7V7gUTpzHuqSiRKZ49qjUKidH6Hxr9IlM6fMnchJBlVM0eidH5MIz4kSqfXaBiOROnMXg2auJn5OW1TkCidm1CDRaJ0+rp2c5EonenXiI+bma9Sj83NzLdoc8rNzMePKEII2ae1F4nS2S0GQV8nNLhAonT2qn4XEqVzK7ViI1E6N35cUdDX3Fa1SiRK51eY78Lh4evNG8IfrtK6wc3M15gHQl9btBOJROlsj7ovJErnjqh9IVFqvSg3Mx9TySNROv2e2jISpTPrtf1ConTmvMoQidLZi2qVSJTOmr4sEqXfjGl3kJuZ79WGnpuZm4aem5lf0YYDidKZFRoRIVE6u0F7HkiUzm5Wj50wBaKWgkTp3Eo1cyRK51dpxUaidH7vYiZGwtWOZ/2UdyNLMqjVB4nS+YMac6cMSTTwRKJ09rhqG4nS+X7zEXCZezTuQKJ0Rra5LRFOThw1AoNKe4yYYYIXzBvCBC9qqIVE6cwOzf4gUWpjUqxwnx1Qf48V7rO7zV3Iam3VlAFWus+vNAj6uqERHybNzOxRLWPWzPwulQZmzUyvUU+AFe8zg2rumD0zc0Cb7jazJBqSYNH7zKjaGVa9z24yrwET3K5Kwbr32UOaaWqzi6ZNHFa+z5twFUvf9cyTEqGJW6UyxNr3+d1asbH4fXqFviFWv09f0u/C6veZq+q5sfp9btwghJDGYLEMfqZP8wJY4z5zUBsrLHK3HSCscp/fo1aJZe7Tq9QvYp379CYNIbHKfXpIo2ascZ/ZpT18LHGfGVTTwwr3mcMnFSGEHDG/hZBkk34XlrfP7tRQC6vbZye0RcLi9rkj+slY2z53RJ0elrbPm+47FrbP7zWvAX+4Tj0bFrXPjGrrhyXt05sGFcG+BtSIsJx9dos2HFjMPrdTfwtL2ef3aPiDhezzQ1oPsYx9flQTXljEPrPf3AV/eFXNoWDWWOsGlq/PnjF3BX3NntU+HybxzQ5rtwkL12fXakCNZeuz3eoBsGh97pwRL7LGY+aB6FKv0wEbLFefXiVKSTBUNr1qQBH84ehxRbCvtVsVIeQf2aEI/vB8nyKOyuxXBH+455Ii+sMxRbCvQ+sUMWW1XhFSVsfXKoJ9jZlPRrwhB5aXCPa10yA70bBIMEQ2fWiPIjvNriyCEnarYCI747YsYlJQJcxxr3WnFcEi9q5RBIs4uuS25dWOR/2Ud8NojpnXgdEcO6YIRnN8oyI0SoNa7zA0Njt8QxGc3I0JRXZ2apHEHMLcosjrB0Nhc2euKfL6wTjX/ApzNSK4Hn1Jt1C0LEIbceSCInRbj4wrgviOnlQUxDd/ResZRqrme1SLGKma3yN5iwQjVd/cOK8IPqfnhCJ0W/vUbDFSNa1jhAlGqqbl9MMSwSLWb1aEtOuOQUWImXV8K8FI1fRulSFGqqYPqR/ASNX0YXMXRz7My8PnDBkZYuSje5si9HH6zG8xLSTRVIKRqpmBYUWIwbarQWKkakZDpgQjVTN7VPIYqZo5rG0ERqpmLmuN4umz19RxYqRqZty8BjxYn8oQI1Wzq84ognvaZB7IkUXzXejjHFUfhJGq2WNaezFSNavzMxIOQx2T8CzhMNQxdYUYhtIT/0qEYY3jal8Yhpo9rnUDw1Czp7RiYxhq9vRKRWhxLpi70OJohi/BMNTsNRUUhqFmr5vfgr4mtPZiGGpuhVY2DEPNDZxThLSrnLVYIoxdbJaINMFY09xR1RfGmuaOq74w1jR3Vr8LY01zZ/U1MNY0N6KxCsaa5i5pjcJY09yNK4qQ2DGNE8aa5uUwwBIh0DrwniI0Ugc1csNY08zKy4qCUv50dK1aLAab5lbtUmRnrhUJRpK+uaaxLUaSpvv19xtsgtR9YiTpmxtaozGSNN2ntQwjSdP95i40QWs1MMdI0vRaDec5kmQaLo4kbd+uCE2Qpr4SboRsvHiDI3/qdLkF8uERRUgDHOtVhG7KMW24OJJ0Sl+DI0lnF5UicWjH43PKu5kM15COJ+eOqVQw2DQ9cUoRVHpDHQcGm2Z6tIpisGmmTz0sBptmetViMdhk22yenNt3UBEMzDTnHGzSLHTCk3M3qt4w2DSzaZ8iRBWbVbwcbNquXo+DTaZnIyfnqofFYNPMvr2KEFWYzgEGm2bOqRvFYJMZbk4w2GQSnQkGm2bGzGtAX2PavcRgkw1TMNg0u0KDbAw22QgGg02z+zWSbnE+oHo4Djat0c4DBptsLxGDTbObhxQhqtim4TIGm2a3aRuAwabZXerGMNg0u+uAIkQVprPKwaa9qhQMNs3qjOAEg02zg+aBiCoG1XNjsGn2iKYeeHLuaSMo6MuERBxsGjKCgr4u63dhsMkGUhhsmh3XYBSDTTYkwkjS3Hq1ZYwkzW3UaoORpLlBtS+MJM0dUyPCSNLcca02GEmy0RJGkuZOa8CBkSTbGcdI0pxm/RKMJNnwK+04GSnBSNLcGW0CMJJkgzaMJM2d18qGkSQbtHEkaVy/S0aS1M9zJKlfmzaMJM2v1iiQI0m7NX2AkSQbBWIkySZm2gwQtfZiJMnGjhhJmj+o+sJIkg0rMZI0f1ZrL0aSzIz7BCNJfzp8SLWCoaSSaZOIsaQ/Hdmo0RbPxj2vzg2DSd+s0AgBg0nfrNCag8GkPx1brR0jjCb96diI9jswnPSnEyanifGk+YkeRdDaDY063HrqIkWC+YUXlAQZvfCykiChF15VUsHTzE1VIHNXENDb7yixS0yKFMsKPr/0+RVlVbJjympkZ5QFLXx+4/Olx/A7nohSpMjClo8+p4+2K/nLolDVv9j9+0vKXNY5xRqAL4Z/L4mVFBnPLw4rCdr7YpOSoL0vtioJov1im5Ig2C/2Kgli/WKfkiDULwaVBHl9cVJJqNZfnFbyuFZXFshfKwie6ItTX6xUlpJ1K2uD/X7c3pkpNffmEK5VSUEmLj9FZrVk48qgsM2WQWVbLIPStloGtW2zDIrbbhlUt8Myb5JIrH6xy17eYmU3DKrbYxlUt9cyqG6fZXaHirII2tpvL7f7FxQp0qlfHDSXI5/6xSHL7LEIZRF0c8ReDt0ctazmHwWVHLeXw55OWAbdnLSsJZVcGXRz2rKUVee6sjar8XvKMurUsJziMIwmZbwMkqkPhpQEo3kwpiTI8sENJeGrv1qhJLzfA+lrpsgBPtD3RsbugUoJ+bWvjioJv/OVJL64ocRXvUrC73zVowS/068EvyPpK26E8NV6JaHKfrVOCd5gg5JQ/75apQTvtktJqENfbVaCt5a8DrcD+OqCErzbiBK8gdYddMG/Um2jm/2V1ip0ir/WuoOO79fazKCb+pXWRHQqv5ZwmMu5v9b2e6FzqMGDO6ulSBHEfqWxCgLOr7VOIKb8WusR5iF9rfrFXKOvBx5omIPJRl9LFyHFhKKv+5QEDX+9Wgkkr7EOpvE8MPcEyX95/MsTytpgX29XloM90C/G5JryPpUgptCUbFGGEmJ2PO2kvL3K283P1slUAJj8Ur6uigDzWL4Wc2538UO+PKssIjunjB/5oE9ZpeObtLv4dQ/WKAtxypcn7bvUycy7NMjOK2uC2fdskZn3TMjMewZD+PK0fc82mXnPjMy8JyrbafueBZm+JyaqlEzfE4u5vzxj3hNTVr48Y34P/a6Smd+rkpnfg/7Omm9Hv+vLs/b3oL9z9j2hv3P2PujvvL0vITPvAv2dt8+E/kbsMzMy88ycTHWLbt2XI+b30K378rJ5Jjp2X16290F/V8x7onNXMvPMKpm+Jzp4X16xvwf9XbXPhP6u2vugv2uWQX/X7TdAf9ftfdDfqL0P+hu19wX9PVhp78vJzPcVZCoz9PMerDS/h35eydSO0M8rmdoR+nkPus27oJ/3oNv+Xo3M/F6dzPxe0N+DHm0g2+jwlUxlhg5fycx7JmRGZinYg15lbTLzfRmZ+b6czHwf9NdrvgFdwJLpN6ALWDL9BsypedBr3hN9wZLpe6IvWDJ9T0yredBn37NOZt6zQWbeE/rrs+/ZIjPvmZCZ94T++u17tsnMe2Zk5j2hv377ngWZvic7hf3mPTHF5sGAeU92GQfM72GSTcnM71XJzO9Bf2vs79XJVC6YaFMylQtm2jxYY9+zRWbeMyEz7wn/efHBRWXwn0OWQX+rLXusvydJu2UP1j3YrLAAXB+ghMQdD40p2gszdr67f4N5+MKcne/gRgtjwE0WVgA3mw+qM1D9ckhZjWxYGUN0ozBM3ilZv7ImmSqzLqG9KrPOQNW+Z0pm3hOKtoExZvCUzLxnTmbesyDT92wwUDXviYk+JdP3RC7EBcaY6lMyfU/M9XFBMyb7uKAZGZYyaDbv2SAz7wn92YAaE35KZt4zITPvmZKZ94SjtcFFg4GOvQ+O1gYJmPbjggTM+3FBAib+uAYdOSbXoGNej2vQkYFyDTpm9rjGF/kp1/hibo9rfJtsKO33SUNpfg+Ott/Ul6Y0lFpfmmwo7TPZUJr60pSG0nyfNJT6fZjk45w3ZvmUDZB+A7JtJdNvwDwf1zhhok/J9BtabCjNN7TYUNpvoP80DWyL/tM0sC36T9PAtpgdst+Qkg0oo/+070L/ad+F/tO+i/hPfRdkI0um75KI/9R3Seg/zbsk9J/mXRLxn+ZdxH+ad6H/tPdBfzZBgMk/LkGA2T8uQYC8qksQJOzo2/ugP5sESKSjb+6Tjr75Bnb0jTyRy3VJgJQdffNMTAMqmXkm9GcTBKl09PUbUnb07e/VyczvQX82QYDJQC5BgNlALgmQsqNv3xP6s0mAlB19ex/0Z5MAqXT0zX3S0ddvaLOjb+TSlo6+/h6mBbnOfJsd/XCfhMUdjwsqb2cTaT4Fk4dc3xyzh1zfvM1cgGnK28wF2M9EE2n72JhB5PrYmELk+tiYQ+SaeUwiKpm6IMwicv1oTCNy/WhMI3L9aEwjciEAphG5/jCGYFx/GBOJXH8YM4lceICZRCXTb8fAjuvzYiaR6/Ni2KdkGh5k7EvaZ6Zk5vvaZOb7oD8bOmDIqGTm++BibXOdcyzD3Icl6q5pxXCTa1pz6WKY+6SJNPfBxdpmMJcm0twHF2ubCQxxlczcBxd7yd6XkJn7npKLy5+Si8vF/gx7Si4nLzrXXQyquTpRRJ3rBAbcHqxw+QEsWy+pTRBgtK2kNkOAxetfXjWBKsfirppAFcvXy4bL3NckM/dBi6P2voTM3JeyZpj7OKJh78tYM8x9OZm5D1Z4Tu/LOKJ4Tu/LOKJ41t4Xk5n7YIXn7X1VMnMf9HfZ3lcnM/dJoGPua5KZ+2iF6ikzjiheUk+ZcUTxknrKjCOKxrIzjihe0o5b1iWBqmHQ32XDOKJ4xbKooz1kHFE09pBxRPG6va/a0R4yjiiO2vvqHe0hixod7SGLmh3tIYtaHe0hi5KO9pBxRNHaA0cUrT1wRNHaA0cUrT1wRNHaA0cUrT3oiKK5L+5sDzKiaO+rdrYHjihae+CIorUHjijCHiQw7niYVHl7s7PJxK3OJsNBR2syHHS0JsNBR2sycfYUEeRPEUGxpAgWGAYd3fdh0NEGCRkGHW0gkGHQ0Q7iZhh0tP3hDIOOtj+cYdDR9oezSqOzXCrNznKptJ4il+Qp3wD9XbMM+jvxYK0yN007q9oz94qsJtltk7/IapKfMRmMrCZZmHP2XgaZNlOR1SQT02efXFeqksSw0wJVWdY0H2Pv1ayLMftaqlQdRk2mWDhpaO7F/q40atZl1nSihbm3HinV38XczsfUyJmjQZfLdzZPllDC3Ss13eq3riGDkWRdGh2ro7qGBvbJkNUV1yxxrOaKq1cNaeitJBvqK+y9VaX6RRx7ue4shaMv1/2Tm0r1ixoSPLt7E6XmrVKl5skca/GykhEVJysZU7Fv1dTpB5ZGSvWdObLS6/TLsZXe0o60tssIivsiHSexXySjIc5+OR7S578oVWq+qE1qbZ+jIn2u5jQl6XPevpWkfez3trxD57DH41dRw2vJDAHrSloyR8CqnIMf/U5AHP7od0rFAMjjTJO9t6XU3MuBKmcArVSpuZeZHP9FOqRhn8zZi87BJabh1N/VgQ37ZB3asHFwopkbe68Ob9h7OZPR38u5jE5HMsjhn8zeh39nuLDLzjwS7UFaChd2xVPmUr0WNJtjKfNxfLLE4x3PASsfUPAB9sdTTftYqolXS5ld91STr5bqVDrjbVLxkNZMU9NOmSdLEt3Rppip/V3xrrbKp4mq0bxVqr9raPup92ZPfatcq7x5K6aDnH7bklZ3VMdOLGVq1v1uu/K0720zseC+ty2pIXev9lzs7xo3bKhbB5pxucDlB726zCNjbrPbU4jgRGmdZrQjQ36z5D12ElDGDOdCg/zlBeUiiF470JYxzzlUhsarNEucaa6z12ZnM+Q7H6wq7++1z2/J7xuPuJD1rIAu+04Iy777tWVLPzYNN5590Lvs8f8t3GrejvPdvl73+Arl9oD2sshtYpQv5Dz/UYqiMGftbxQEbU/piU155Jbw5FGYo/ZDBdVF8F8U1BbBXyioL4J/UNDAG+1Q1ATaqajlXtadLV3kFRda5chQPFqxTVEMtFVREMSPFYTvfUZB+N4fKGgsgv+loLkI/reCFsRgXjkB2q4oBdqkqA20WVEGtEZRDrRWUQEki4ZyTHGeWrFaEeviOkXYG2HFekUVoA2KqkAbFdVc5agGRfyLgqCIf1MQ1oYv+22foqxDBal1ssRaZ0useUusdTK4WqiAaqK1TgZXC9+tJoqkizWNWqtDNa8lHap5Le1QzRcSMEtV81rWsZrX8o7VHLN7/1IApu3+JwVhyu5/VhCm6/61glDl/lZB0Mp/VRC08t8UBK38aKlAttb5xLG87lbE5/VQVf/1X5UEjf0HBUFj/1FB0Nh/V+BOVs0bnBOtvgDJmwcrLOOEaLX4htsKN29UcbU6gYZbuJ436rha/QJmzj4eolXWxG3qM5DSeTx2qyzBbepdkc15PKirrI3b1PNy2uwKyzi/fYuigrcpQ37ny0NK0LU9rAQB3RElCNWOKkEQdkwJ5z4qQab1hBLOQxSCxMeXp5QwE62Es5+VcPhLCDv+55Tgd84rwe9cUMIFD0rwBkNKIAOZ9Zpztt6IEg53KWGQqwRvIFvc5G3mYJXgd64p4ZI6JZwTJ4RTm7QV5CSkbiVc+qWEqQQhOXvySpgSU8JpSUrwOxrvcIqJhjsyiUSJ9PbVHgtmQ41FFjLtTS2vkKltamGF27skX5hTIX2IossFz0VXaDr/QkFw7N9XEALnv1QQnPt/UBCazv+oIDj4/6QgBDT/+ldKgnN/RkFoHX+gIPj1/6wgtI5/rSC49L9REOrI3yoI0czfKQixzN8LwKyILgWhTkUKQgAdKwg+tKIgBM9VBaF21hSEvnldQaizDQUhwmwqCDW5pSDo44cKgj7+i4Kgj/+qIIToP1IQWtf/piDoQ0LoIg7hz39XEPSxXEHQx08UBH08u2RA2PlMrwKTH57ThwaVPa8gqOwFBUFlLyoIKntJQVDZywpCn/SnCoJLekVB6I++qiCY0GsKggm9riC43zcEYNbCmwqCyn6mIKjsLQVBZW8rCPp4R0HQx7sKgj5+riDo4xcKgj5+qSDo41cKgj5+rSCY0L8oCCakvYqiEmzo3xQEG/p/FAQbko5xUQ029D8VdLKhaicbqi5hQ09AJwOpdjKQaicDqXYykGonA6l2MpBqJwOpdjKQaicDqXYykGonA6l2MpBaJwOpdTKQWicDqXUykFonA6l1MpBaJwOpdTKQWicDqXUykFonA+mUwyiQw/h/FQT7+N8Kgn38fwqCPh4dl8C0wFEBj3Tz2wKzSTSEqDNxtk4RE2frFTFxtlJR0MxUz5iiOtCwIiR1uw8pQlK3+4giJDq7jylCorP7hCIkOrtPKUKis8f8FrJNPea3kG3qMb+FRGePdD0KLDGe6hlXhFRf92FF0Ff3UUXQV/dxRdBX90lF0Ff3aUXQV/cZRdTXOUXU1wVF1NeQIuprRBH1dVkR9NV9VRH01X1dEfTVrVUU2ZGpbjkyqUByZKr7PUXQV4+aA6a9TPX0KoK+etRcsZx4Ss/uLZq0rzWKaF9rFUFfPYtmLnFj50O3Cqw2nupRT4CEzVTPBkVQac9GRVBpzxZFNMHtimiCuxTRBPcqognKNvhFiyZ4QBFVelARVaq+qkWVquG2qFI13BZVqobbokrVcFtUqbqxFvWlNt2ivtSmW9TXWUXUl5p7i/pSc29RX2rTLZrgbkU0QTkepEh8hgGpt8neFYpiILVKzLaZ7FcBYarNZG+3ohruUgFhks1kvwoIM2wme7UJwPSayV51DkgPTvZqM4+JNZP9FxWlQOpgMaVmsl8bX6QVJ/tVT5hMM6knMxdIOU72q1vGHJnJXlVhSn2p00uprwFF0JeeZVKk1JdaIxKck72rFUFfvepFU+pLvWhKfWmwlFJf6iIxC2ayV10kpsBM9qqLxPyXyd5NiqCv3s2KoK9edayp21G4wHyVyT6VHSarTPapJ8NMlck+DZKQ6p3sUyeHOSqTfRo/YYLKZJ/6Pz87pcD63Mk+jbawPHdSz1kqsDp3sk+9JXLNk33qDLA2d7JPvSWW5k72qTPIvJvKKGn1DxklfV4RJa2+NaOk1QlklLQ6gYySVieQeUlnlLT6hYySVr+QUdLqFzKXRy6wCvY3Ws2QgP+N1jKsgP2NSj7HHkm/VYeK5a+/0TqGfP5vtGJi6esj01PI3dhqgQWvj7Zpy4GBgUf9asxY7vqoX40Zq10f9asxY7Hro/6tikJ1frRDIxcsdX20U11bbr1D1NXVZSfIPC6zY7uPy2TWkQSVHU/QKm+LrQgflzX9Ty6knf7/vr6kO24kvXbvX+Gl+ry3SAAZAWDxFkACOMf/wNt2t+223e2e3XavNIuaRVFSaS5KlEhJpZmap9q8xVuptiovTWYyteNPMCi2hRv3i/vOqVoobmQyMr77xXBvIED1vihOXI9POu2U8ctY+7JxpJ6L/FQXqVdE6nW2fUmk65Iv1gbX4/ew9mVfVEGql0XqFTZkSRn5uyVnXV9WRep9WUpRvSZSz5woS/qw2Xpp5O+mkb+bNvbvpm2kXmepl0X6OUtt/2UpH4zry8Y2blmEB1keqRf5vVlp+yUrLf+ySaR9E8v77Ms4HtYbw+PK22fO3CEwQfAugSmC9wjMEPyOwDGC9wl0CD4g0CP4kMAcwUcEFgg+JrBE8AmBFYJPCawRXCdwguAzAhsEnxPYIviCwA7BlyGYBPF8RWAQz9cEBvF8Q2AQz7cEBvF8R2AQz/cEBvH8QGAQz+8JxHgu7iUQ47m4j0CM5+J+AjGeiwcIxHguHiQQ47l4iECM5+JhAjGei0dCMMV4Li4QiPFcPEogxnPxGIEYz8XjBGI8F08QiPFcPEkgxnPxFIEYz8XTBNrxahwZ/8aR8X5c8cue+rIa+23pIoHYb0uXCMR+W7pMIPbb0hUCsd+WrhKI/bZ0jUDst6XrBGK/LX1LIObB0jKBmAdLNwjEPFi6SSDmwdIKgZgHS7cIxDxYuk0g5sHS11VzsMKTr5/a+TymytJa+OWTIOQ0lU2CkNNUNglCTlPZJAg5TWWTIOQ0lU2CkNNUNglCTlPZJAg5TWWTIOQ0lU2CkNNUNglCTlPZJAg5TWWTIOQ0lU2CkNNUNglCTlPZJIgnTWVNEE+aypognjSVNUE8aSprgnjSVNbYpdS4iQxNkaWjiywdXcqb4L4si9Tz9u86b5d6LmclIBn5yN/Nzbur+rJxpJ6zS8LcR+p5+zuKyN8tRvb7ipHtv2LET0/slFW2Xhb5vsjWpcgi3xfZ0hXmpVk7Zbafi0i/FC7yd0u7ZSqqSL3axq2IbEmKzm7pii9PMHG9SPu+bBvDemVieVom9veWmZ1Cy0i/lObuh74ssnUpa8uXsrbxKI2ytVPGL/dJRtXI5kc14icqdsos76uR/btVEvm+JPJ95qWGO2WlrRfhaZVZ3lcR6aGK9HM1tnyuIlvJykXqRfK3MkZHXzaJ1DMq1E6Z5VXV2Xp1ZDyoI/2y+6I8qhfJt9rZ/qtzmx91HqlX8gMsO2WRvxuRFOoqUi/M32C9It9llIwmkS6ZREKLt0tvn1nfSyBOdev7CMSpbn0/gTjVrR8gEJcu6wcJxKXL+iECcemyfphAXLqsHyEQly7rCwTi0mX9KIG4dFk/RiAuXdaPE4hLl/UTBOLSZf0kgbh0WT9FIC5d1sPdDN423YNnCAziuUhgEM+zBAbxXCIwiOc5AoN4nicwiOcFAoN4fkNgEM+LBAbxvERgEM/LBAbxvEJgEM+rBAbxvEZgEM/rBAbxDHdZePt0Dy4TGMTzBoFBPG8SGMRzhcAgnrcIDOJ5m8AgnqsEBvFcIzCI5x0Cg3jeJTCI5z0Cg3h+R2AQz/sEBvF8QGAQz4cEBvEMt1CTQB1Yf0xgEM8nBAbxfEqgnZ0mkVl2Elnl7d5vGdZrIruHJrJ7aCKrtzayCth9VIvqRVZvbURQ2X2IiOtZgaatI99X29m4i0yNXeT3dpHfu3tekupF/u6uR0v1Iqvuzq5mkohXlUSMnp0tnq1nd2l9mVnl9csKs/roy/jCtb7MvNuyL7NGSt/RZmmx09G2Xmf6L4kYTEmS8UOOO2Xe1hubuCWJXa0mSW77ObH8S5LW9l/yxb2lep1tXxr5HWl4sUCwepOv3dn5GD8R2peZ1yj3ZZGfkBb2p6aFWaj2ZTZkaWGGgr7MUi8tLKVSq5n2ZZF6NsWT1KZQkrZmw5KkEUqlEUpFvLS+zGy8+jKz8erLbGpkI/s7ssR4fX2ZjVuW2n7OUtvPWRb5vsymeGY91b4s8jvs0NyXmaE0ycyLsHfKjJDQl0V+xzj2fZYHES+yL4v8Xit09GU2xTNnPNB+dIj0i7dDRuYj8c0j7TPPWfejTYRXY2eG+r7Mtm/s7VA6juTv2JwT6ssiQ+64sfF1ke9ztdng9mV2PHCNjVtE4Et8hC8+El9vp8rE26VBX2bj4SO/w9eWf94ucfoy+3fzyO/IEzu+5ImNW57a+OZ2aZDkVqBKIkJlsisOUj1c5S+u7CUwQXAfgSmC+wnMEDxA4BjBgwQ6BA8R6BE8TGCO4BECCwQXCCwRPEpgheAxAmsEjxM4QfAEgQ2CJwlsETxFYIfg6RCsg3ieITCI5yKBQTzPEhjEc4nAIJ7nCAzieZ7AIJ4XCAzi+XUXHixl5KtSdj4fhPwifXkQ8ksEBiG/TGAQ8isEBiG/SmAQ8msEBiG/TmAQ8m9DMDIURTT1vswuJUqrHfdlRgvsy+zQVlqNOSmtxtyX2SVCmUT+bmKnhtJqqX2ZnapL64X0ZXaJUI4jfzcyhZSRKaS0NnxfZqfMsrJLrNIcDN0pi9Rr7RRXRYbyKrL7iGjlSVVZHkQ08KTqbP9FhNxkYj2sZGI9rGRivbhkYr2BZPcdt1Qv8jsmkal6Elk6Tcy1rjtldik7icRtYjXwZPf1V2G9JtIvTSSPGusBJk0kj3bfBEH1Iv23q3hwPbuUaKwHmDT2WGdfZseDJsKrJhKPJpIfTWSJtXtNNtez+bt7JTbXi/xee1wzaexxzaSxXkiye4Mv14v83UieN5GtY2tVlaSN5FFEpUl2n+CgepG87Dr7Ozo7jqdZadqXRrYM6dib/kvHNo/6MjMOpZEtQ+rGZrzPIipSNk7N3x1H2jf2dnz2kaWsr+x47yvr9fvKBX83WDrIl0n0H7NU7stMF/dlRrjylRXCfGV3Ub5qTUr6yqoMfZlJIR+xHX1th1Jf29Tty+zvqJ0Zgnxtd419mUkhv2tFUr3c7Gb6TZTtF7yncPvC62UCEwRvEJgieJPADMEVAscI3iLQIXibQI/gKoE5gmsEFgjeIbBE8C6BFYL3CKwR/I7ACYL3CWwQfEBgi+BDAjsEH4WgC+L5mMAgnk8IDOL5lMAgnusEBvF8RmAQz+cEBvF8QWAQz5cEBvF8RWAQz9cEBvF8Q2AQz7cEBvF8R2AQz/cEBvH8QGAQz+9DMDIOtqVZcviIseE7+2SA370Hg+oVdvzorMrr7XOrfZmdgn1nl9C+i4yrkak1j0xdRd6Z9hWRKamY2CcNishSsWjsErqO/N06ScyUWUcMhr7MLPHrxJvjU32Z+R11Yqf+OvKESB3ZCtS7b5qnepHv230zOdWzS4l6Yl2BemKXdvXELnXqXX+c6n3hy99QmVmuNJG+b0Z2zm0iZlGT2Kev+jKzjWgSzMBrh77p/79NFTqscNFWgGtJ/qdC//9DqpTEKj2iSmms0mOqlMUqPaFK41ilp1Qp2P0HKzD5+oD+Y/bQU19mVilNgmrMtcOvbcehInPt8JtIhcZ8g+1ZVGf+8i2RSl3sm6j78cT28E1cyRh/TWKNziZi/DWpXQc2kSfBmrSzuRBxr5pdZ4Tq2Xmh37Ha9uGTVj8lZKDq3xEy8PNnhAyk/DkhAxP/npBhAfAPhAyz/z8SMkz9vyBkmPf/iZBh0v9nQoYZ/18IGbj7S0IG0v6KkIGt/0rIQNFfEzLw8jchAk9O/ZaQIT6/I2SIz+8JGeLzB0KG+PyRkCE+/0bIEJ8/ETLE598JGeLzH4QM8fkzIZXiKDwYRRyFp6KIo/BIFHEUnocijsLDUMRReBKKOAqPQRFH4Rko4ig8AEUchaefiKPw6BNxFJ57Io7CQ0/EUbjXkDgKFxsSR+FmQ+IoXG1IHIW7DYmjcLkhcRRuNySOwvWGxFG435A4ChccEkfhhkPiKFxxSByFOw6Jo3DJIXEUbjkkjsI1h8RRuOeQOAoXHRJH4aZD4ii8DIE4Cu9CII7CqxCIo/AmBOIovAiBOAr6AnEUxAXiKCgLxFGQFYijoCkQR0FQII6CmkAcBSmBOAo6AnEURATiKCgIxFGQD4ijoB0QR0E4II6CakAcBcmAOAp6AXEUxIKvHMXFo5dX9u98OFU0BiWBaAwyAtHYmQ1lX+YVgUE3IAKDaEAEBsWACAxyAREYtAIiMAgFRGBQCYjAsEEhAsPOhAgMWxIiMOxDiMCw+SACw46DCAzbDCIwXJNIBIZbEonAcEkiERjuSCQCwxWJRGC4IZEIDBck0iAL9yMSO+F6RGIn3I5I7ITLEWmQhbsRiaNwNSJxFG5GJI7CxYjEUbgXkTgK1yISR+FWROIoXIpIHIU7EYmjcCUicRRuRCSOwoWIxFG4D5E4CtchEkfhNkTiKFyGSByFB2CIo/D0C3EUHn0hjsJzL8RReOiFOApPvBBH4XEX4ig860IchQddiKPwlAtxFB5xIY7C8y3EUXi4hTgKT7YQR+GxFuIoPNNCHIUHWoij8DQLcRQeZSGOwnMsxFF4iIU4Ck+wEEfh8RXiKDy7QhyFB1eIo/DUCnEUHlkhjsLzKsRReFiFOGqfPGvG8IAKsROeTiF2Wim4L0sV++wZiL7MKXbBETNiV2WFkDGcHCP2wLExYg+cGSP2wIExYk8V6Tk4JEa8gRNixBs4Hka8gbNhxBs4GEa8gVNhxBs4Eka8gfNgxBs4DEa8gZNgNLbBGa/oRf5eXuS/8+FSEaw2GnOD10PQwFcbxbzBKyFoyAMpkYY80A+JlCAaEinhjgca8uCCBxry4HYHIq29VanBGx2IrnCdA9EV7nKgwQ4uciDSwi0ORFq4woFIC/c3EGnh8gYiLdzcQKSFaxuItHBnA5G2kQpnIxXORiqcjVQ4G6lwNlLhbKTC2UiFs5EKZyMVzkYqnI1UOBupcDZS4WykwtlIhbOVCmcrFc5WKpytVDhbqXC2UuFspcLZSoWzlQpnKxXOViqcrVQ4W6lwtlLhbKXC2UqFs5MKZycVzk4qnJ1UODupcHZS4eykwtlJhbOTCmcnFc5OKpydVDg7qXB2UuHspMLZKYXTjZTC6UZK4XQjpXC6kVI43UgpnG6kFE5nL17py5S26UZK23QjpW26kdI23ci4332Z0i7dSGmXbqS0S5co7dIlSrt0idIuXaK0S5co7dIlVvhyiVItXaJUS5co1dIlSrV0iVItXaJUS5co1dIlwfI5WCDKG/t3PqYkTZcoSdOlStJ0aUTS/Aui9EqXKr3SpUqvdGDZ/IIQpVq6VKmWLlWqpUuVaulSpVq6VKmWLlWqpUuVaulSpVq6VKmWLlOqpcuUaukypVq6TKmWLlOqpcuUaukypVq6TKmWLlOqpcuUaunsA5p9mdIrXab0SpcpvdJlSq909mHixo2VUunGSql0Y6VUurFSKt1YKZXOPlrYlymN0tlTyn2ZUhrdWCmNbqyURjdWSqMbK6XRjZXS6JxSGp19FLYvUxqjc0pjdE5pjM4pjdE5pTE6pzRG55TG6JzSGJ1TGqNzSmN0TmmMzimN0TmlMTqnNEbnlcbovNIYnVcao/NKY3ReaYzOK43ReaUxOq80RueVxui80hidVxqj80pjdF5pjA48FOKoV0qj80ppdOChEEfBQyGO5kqJdOChEEfBQyGO5kqpdLlSKh14KMRR8FCIo7lSMl2ulEyXKyXT5UrJdOChEEdzpWe6XOmZrlB6piuUnukKpWe6IqJnBotFfRN//2ElebpCSZ6uUJKnK5Tk6YqI5PkXROmZDmwWonGhVE0HNgvRuFDapiuUtukKpW26UmmbrlTapiuVtulKpW06sFmIxqVSOF2pFE5XKoXTlUrhdKVSOF2pFE5XKoXTlUrhdKVSOF2pFE5XKoXTVUrhdJVSOF2lFE5XKYXTVUrhdJVSOF2lFE5XKYXTVUrhdJVSOF2lFE5XKYXTVUrhdJVSOF2lFE5XKYXT1UrhdLVSOF2tFE5XK4XT1UrhdLVSOF2tFE5XK4XT1UrhdLVSOF2tFE5XK4XT1UrhdLVSOF2tFE5XK4XTTZTC6SZK4XQTpXC6iVI43UQpnG6iFE43UQqnmyiF002UwukmSuF0E6VwuolSON1EKZxuohRON1EKp5tIhbORCmcjFc5GKpyNVDgbqXA2UuFs1BlO10ids5E6ZyN1zkbqnI06w+kadYbTNVIHbaQO2kgdtJU6aCt10FbqoK3UQVupg7bqDKdrpRraRtTQYCmpr/zvPywF01YKpq0UTFspmLZSMG3VMU/XSk20lZpoJzXRTmqindREO6mJdlIT7aQm2klNtJOaaCc10U5qop3URDupiXZSE+2kJtpJTbRTmqgfKU3Uj5Qm6kdKE/UjpYn6kdJE/Uhpon6kNFE/UpqoHylN1I+UJupH6iSnHyll1I+UMupHShn1I6WM+pE6yekTpY/6ROmjPlH6qE+UPuoTpY/6RJ3k9IlSSX2iTnL6RJ3k9Ik6yekTpa/6ROmrPlH6qk+UvuoTpa/6ROmrPlX6qk/VSU6fKpXVp0pl9alSWX2qVFafKpXVp0pl9alSWX2qVFafKpXVp0pl9alSWX2qVFafKpXVp0pl9ZlSWX2mVFafKZXVZ0pl9ZlSWX2mVFafKZXVZ0pl9ZlSWX2mVFafKZXVZ0pl9ZlSWX2mVFafKZXVZ0pl9WOlsvqxUln9WKmsfqxUVj9WKqsfK5XVj5XK6sdKZfVjpbL6sVJZ/ViprH4cUVmDpaR+G0P/YSXE+rESYv1YCbF+rIRY75QQ650SYr1TQqx36mCpd0pl9U6prN4pldU7pbJ6p1RW75TK6p1SWb1TKqt3SmX1Tqms3imV1TulsnqvVFbvlcrqvVJZvVcqq/dKZfVeqazeK5XVe6Wyeq9UVu+Vyuq9Ulm9Vyqr90pl9V6prN4rldV7pbL6XKmsPlcqq8+VyupzpbL6XKmsPlcqq8+VyupzpbL6XKmsPlcqq8+VyupzpbL6XKmsPlcqq8+VyupzpbL6QqmsvlAqqy+UyuoLpbL6QqmsvlAqqy+UyuoLpbL6QqmsvlAqqy+UyuoLpbL6QqmsvlAqqy+UyuoLpbL6UqmsvlQqqy+VyupLpbL6UqmsvlQqqy+VyupLpbL6UqmsvlQqqy+VyupLpbL6UqmsvlQqqy+VyupLpbL6SqmsvlIqq6+UyuorpbJ6cJH+7xOChgD9v5cE2ZOkHnyij/xNQwg+PiVoiMHHdYKGIHx8RtAQhY/PCRrC8PEFQUMcPvIPGgLx8VUIgV/08evlZMF6Ur8fov/0EK2Pb+iLh3B9fEvQEK+P7wgaAvbxPUFDwD5+IGhIqY/fEzTk1A97CRpC+sM+gkrdYUNIfzhA0BDSHw4SNIT0h0MEDSH94TBBQ0h/OELQENIfFkIILKYfjhI0xOu/FugbwWVihoPNxAwHn4kZDkYTMxycJmY4WE3McPCamOETHTBwmz6+JqiW9AW/iekLhhPTFxwnpi9YTkxf8JyYvmA6MX3BdWL6gu3EHAV3iTkK9hJzFPwl5igYTMxRcJiYo2AxMUfBY/qvhf2E6ZERbCZmAPhMHGYwmviHgdPE/dvqqLQ6i1qdRa3OolZnUauzqNVZ1OosanUWtTqLWp1Frc6iVmdRq7Oo1VnU6SzqdLw6nUXgLHFvgLXECdbpBOt0gnU6wTqdYJ1OsE4nWIcJxt84kfQFk4npCy4T0xdsJqJvDj4T0TcHo4nom4PTRPTNRzJgOXhNRN8czCaibw5uE9E3B7uJ6JuD30T0zcFwIvrm4DgRfXOwnIi+OXhORN8cTCfiaA7eEnE0B3OJOJqDu0QczcFeIo7m4C8RR3MwmIijOThMPAnkSWzYC5as+j0g/adzSRIwopgJ4ESZ317JECQ6cIlMtDyRiZYnMtHyRCdaqhMt1YmW6kRLdaKlOtFSnWipTrRUJ1qqEy3ViZbqREt1vFKdaKlceeRgT3EOpjoHM52Dmc7BTOdgpnMw0zmYYQ7yN3pJXzCqmL7gVDF9wapi+oJXxfQFs4rpC24V0zfTAQO/iukLhhXTFxwrpi9YVkxf8KyYvmBaMX3BtWL6gm3F9AXfiukLxhVzFPwp5igYVMxRcKiYo+A/MUfBgGKOggPFHAULyswTTg974EIxA8CG4jCDD8U/DIwo7l+no+J0FjmdRU5nkdNZ5HQWOZ1FTmeR01nkdBY5nUVeZ5HXWeR1FnmdRV5nkdfx8jqLvF5WgDnFCeZ1gnmdYF4nmNcJ5nWCeZ1gHhOMvhFcKqYv2FRMX/CpmL5gVDF9wali+oJVxfQFr4rpm+uAgVvF9AW7iukLfhXTFwyrgb7BilW/fqb/9EQyHFwtZjjYWsxw8LWY4YUUPXJwtpjGYGAxjcHBYhqDhcU0Bg+LaQwmFtMYXCymMdhYZp4o9MgIThaTBKwsZkIhFd0czCzTvzoqpU60UidaqROt1IlW6kQrdaKVOtFKnWilTrRSJ1qpE62MJdpfIJ1Fpc6iUmdRqeNV6Syq9MoDDC5OsEonWKUTrNIJVukEq3SCVTrBKkww/sZK0hddMKIvumBEX3TBiL7oghF90QUj+qILRvStdcDQ4iL6osVF9EWLi+iLFhfRFy0uoi9YXExfsLiYvmBxMX1rrWigxUUcRR+LOIo+FnG0lgJ8jj4WMQp8LOYo2FjMUbCxzCQw0cMe+ljEAPSxKMwTqejmE2k85hMdFfCxfrhGkL1yMAcrakTI0OVJiIARlRIydHhGyNDfY0KG7naEDJ3tCRn6Oidk6OqCkKGnS0IK1QdgTXEfVLIPatkHE9kHjeyDVvZBp/oALCnqA3CkqA/AkKI+AD/qax8Ei9L/zxt5cnCsqJvAsKJuAr+KugnsKuomcKuom8Cs4m6qZDfVspsmspsaRRXwqbgPOtUH4FJRH4BJRX0AHhX1AVhU1AfgUFEfgEFFfQD+FPUB2FPUB+BOUR+AOcV9UMk+qGUfTGQfNLIPWtkHneiDyLvcmqqww2tV2rdPVZGLiKvKvrupqk29NvLesb7MXCzUl5nXCLejxLxrqS8z7WtHqXnHXV9m3uHZl5nrj/oyH6lnbr1rI+9Fa5PUXFfcJlmknn0tcZvY17j2ZebCqr7MvHu13X0/Xlgvta/VbdPOfl9qX6vb7r4PK6wX4UtbTGz/FRPzmuO2aGx8SzBFt6/fuklgguAKgSmCtwjMELxN4BjBVQIdgmsEegTvEJgjeJfAAsF7BJYIfkdgheB9AmsEHxA4QfAhgQ2CjwhsEXxMYIfgkxBMgng+JTCI5zqBQTyfERjE8zmBQTxfEBjE8yWBQTxfERjE8zWBQTzfEBjE8y2BQTzfERjE8z2BQTw/EBjE83sCMZ639xKI8by9LwRTjOft/QRiPG8fINC8eL4tx2ZmaUv7Vs++zI5QpbMjXumDEQoXc7l+Q047yc0k1U5qO4g1I1sv8i75toVB7NMaQUMXfbpD0ED4T/cJGuj+6RFB5pLyvmzg+I8LBA0M//SUoIHfnx4QNLD700uCBm7/eIyggdk/HiBo4PWPBwkaWP3jIYIGTv94mKCB0Z/WCRr4/CnM2hZGpx/3EQSBek7QEKgf9xMEgXpC0DAqfXpG0BCvT/cIgnh9RxDE6yFBEK/HBA3x+vSCoCFen14RNMTr0xuCIF7cjCFe/8mfGuL1nzcIGuL1I5E9tSuQNtUZleqMSs1rMPqyIUI/HiHIjgZtqvMlNW8X7st0oqQ6UVKdKKlOlFQnSqoTJdWJkulEyXSiZDpRskj/ZzpDMp0hmc6QTGdIFolQplPD3hHbl+mcyOy81o41GceRzhhrdo0jbR9rdkW2C+1Y0yoyJ7djzaex5tNY8ymyNWmdJpLTRLIv/O7LNJHs6+tafLk908RFutppmkTWKfgae6aJi3S102Omiyw1nB4sfaSPvR4sveanj/Sx14Olj/Sx13T2enHhNat9bMwMVnz6ZTf9p+3WvfV6PPWa/17z32v+53o8zXUa5DoN7BvC+zKdBrkeT3M9nuY6UfJIouQ6UXK91Mh1vuR6qZFbjaXN9RojN/dut22hV+2FTptCp02hV+2Fzp5CL94LvXgvdH4VOr8KnV9FZCgr9KxR6OQpdPIUOnkKnTylTp5SJ0+pk6fUq/ZS51Cpc6jUOVTqHCr1qr3UqVTqVCp1KpWRqafSLK80yyvN8iqyN600vStN70rTu9L0rjS9qwi9K03vStO70vSuNL0rTe9a07vW9K41vWtN71rTu9b0rjW9a03vWtO71vSuNb1rTW/7Erq27ayw1HbGEugiVkQ3Ss33dSMr4Xej0jC+G1WRepWZf7pRbdSlbjQxa7i+LFKvidRrIvU682h3l3yRpLIv3Tj63wSlX6GEoewrlDI0/gplDLmv0Jgh/xVyDOVfIc9Q8RXKv0LBMlC/0qb/dPn10wV/cfUVKhky3lKXfFGSdqvv+elPCBs6eM/fMTb08J6fMTZ08Z6fMzb08Z6/Z2zo5D3/wNjQy3v+kbGhm/f8grGhn/f8E2NDL+75Z8aGbtzzL4zVA/ZLxiYD9ivGmgH7V8baAfs1Y92A/YawFOL3W8Ygfr9jDOL3e8Ygfn9gDOL3R8Ygfv/GGMTvT4xB/P6dMYjffzAG8fszY8Pwu7H33O839p4nfBiDf0bIMGX+jpBhxvzZzwmC+wb/TJBxJLsEZKmfEiLuCeoRcU9Qj4h7gnpE3BPUI+KeoB4R9wT1iLgnqEfEPUE9Iu4J6hFxT1CPiHuCekTcE9Qj4p6gLoFHg35NiLgnqEvgwaDfEiLuCeoRcU9Qj4h7gnpE3BPUI+KeoB4R9wT1iLgnqEfEPUE9Iu4J6hJ4UugX3IQhQL9iCG6iITKCGPd77qEhRr/5DX/jEKU/EfGt5dYloK/8iqrD8xe/oraBhvIriusXDYX+COzkfk60Lu3qJamMANYlrTmY0aXgv23se7ux7zjBA/c29q/3/xGcAvycMCOzdCmYSLOj9KfARZo++Iaw4e9MT58gbKD6xoEjhA1k33zDnxvoPr11mbCB8PO1FcJy+Nxdwgr4e7cIG2g/u7hM2MCgrYM3CBsoNLtwibCBQ9OjJwkbuD/9wL99IP/0MH+ug7/3OMTA0p4uXCNsiN/W8/2EDfHbOvctYUP85k+/9mewLtVvz+k/PoR4usLNhRCfeU3YEOLZu3OEDSGeHTtP2BDi2UnGhhBvvtpLWAXYUcKGEH/ed4wwCPHLVcIa+M4HhEGIT1Pagns1O0EpA+uE+XPqT1gpzI4uEQYhXt1H2BDirbtvCIP4nVkgbIjf7A31J6wZZlepP2HVMLvK31kAFalfYOUwPfqUsCF+0wsvCIP4HaJ0sv5Wl8Jc368UZ1fv81oxhTm/r9ETxtZIgxpvTtgaGdaYPox8xxhrbO1/bWu4oKVHl2wNH3zHlW9sjTxox/FrtkYR/JXzke8w5xa7FB7anX6gCQMMsunpR4RZISP1dlpPvRUAsojgsXutUVhv90Ygqtca3b3zVmjpdm9PCevlkb+7+5wj1Ssi9Rrbd3mkfbvnmsN6kTOLfVmkXhKpZ73XrogsnwrrBHZFJB5FEfm+MlIvsvQp6ki92vKgjPzeMrf9V34xZaiefbSiL7MrucrZuFWR31t5+zuqPFIvNx5iX2bO/vZlxsjrqghfqsKcNe2qSD9Xle2XKtLPVR35Pnu2ti+zC8aqidSzZ2G7OhK3urTfV38RHanexPZLDWfvR4QMI0tCyDAip4QMI3FGyDACjwkZRl5HyDDiekKGkTYnZBhhC0KGOe/r+fZg8aXfN9N/mFO330+YUKTV7rVqQb3KDmlpvXuPyN+GZeZYd1oXifm+ukhNvcmuF/O3YZmhaNrWLb/NNv3L0Pc/i6v3hCWAvSJsoMHm632EwVnc5YM3CYTNyvtlwgY2bH54SJgH7C1hsFnZu5+wgRPTfW8Ig5XQ/kuEwUrowBphNWCnCRtWshtnrxMGR3CXL3JjYCkbLK92sA6wcyEGu83poVuEwQLh0EvC4Dj18rmrBMKq6uxrwmAte4h6Brebh+lH4Fnq5fPHCYQQHv6GMAjhYf6FsBl5e4IwCOHh+4RBCA8/JwyOUd898i2BsOE8wh+EEC4cIGwI4cYSfWew4SRuw4ZzevQwYSAYBCv5HSwDjEIPu8mNc+cJgwgeP0KYB+woYRDA4xQk2E1OjxPtYTc5PXGIMAjgCf7tEMATRBjcTZ7kdkL8Ti4SBvE7eZkwSMGT6yEGu8npSRpEYTc5Pfk9YfBcwvIdYihsC7f2PSYMAnH6GGEQiNNENNgWbi8/WCEQInH6O8IgEqefEAaROENRAl15yqMhKMvTMzS9gLY8XVwgDCKxeCfEYM85PUszD+w2p0svCINMOneGMMik80uEwVh4nvoTdpXTCwcJgyBdoJkH9onTCxQHUJWnF4iFoCtPv6FZEITl6dULhEGMLlL8QFqeXqUsA215eokyCbTl6aVnIYY72gUaYXBHu0IrADjzOf32FGEQo2/570GMlmlOgruoptdpSoLLqKbLNLrCCdHpMuUDXEc1vUlJDUdFt28s0TAJN1JNV/gPQgBXvg7nwRJWvudm5+MQ41sUYzhgGkrEOxjE+BblE5w0nd4mDK6u2r5xmZIUzpxu37hyj0CI8hr1HtxfNb1zhTCI8h1alcANVtO1i4RBlO+uEgaazhVio+d9+k4ZZOd9GrXAPpne/0AYLDhurPEHITyPaFEBZ02nj/iHQXgeUYfAadPpIxpGcozOffpSOHA6fUSzGVxWNX1MHDMqzk4ZROUx8QfOnG5cp+0FHDqdPqEdBNxUNX1CEYPTp9P1vYRBdJ7SGAHnT7dvvKSchROo0+cUHbiMqv8gcQvOok6fc0shdM9pBoBDqdPn7wiD0fPlDcIgci+pt+Fc6sbyI8Igr17S2gZOpk5fUZLD0dQpbyzhbOr09V3CQCW9we2E0fPmYeptuLVq4wZ3DIyeb2gtBQdVp28oF+Ck6vQNLRngqOr0La3B4Kzq9r1TZ0MQPM7pWxoJ4Ljq9s0TNLHAqdT5AiUFHEudvqNug8OnGys04cLp0+2VY7QKg/On26tHaGqAE6jT9/wXIZ3eE4HhDOrGCi2Z4E6q6Qf+exCL7ylF4Vaq6fe0TIFrqabf01YW7qWa7acehcOvG7do0wKnXzdu0dYZjr/O9tNeHe6m2r55hUHwgQ5QmOAk7OwQTRBwFHZ2iLbAcBZ2dojWTHAY1n6uAox/PFi1h/k7J4DREgbOxc54Gw8HY2eHaQSCk7GzI7SHgKOxsyP09+Bs7OwIJS8cjp0t0HofTsfOFmiVAcdjZ0evEQbxO0apCwdkZ8cp7nBCdnaS2wIZePM+BQkOyc5O0BALp2Rnx2k0hGOys5M0bMN7WWanaISFC61mpymAcKPV9s1H/OshgmdoqIBLrWanaf8Pt1rNTtE8Addabdz5On8GC2L5op6dj0OQF/mrIciLNEDD3Vezs0QAuPxqtkiSC9x+tXGXlrVw/dXsPMmJcP/V7Dx/Di4KWNlLUxC8ymX2DQ2z8C6X2RUa8+FlLrNLpJ3AFVob92nXCpdozS7TbhCu0drgdTFcpLXxHZEKrtKaHqZZFC7Tmh4mDQuu05pdpZUeXKg1u0xDN1ypNd//gLAhgJun6bfDtVoz3iXDxVqzqzSawNVas6u0XoPLtWbXaNSD67Vm10iRgAu2tldOUwbDHVsbDyi4cMvW7Fsa8uGerdl1SlK4aWt2g4IEd23NbvLnwCVYWaTehtu0ZjdpjoH7tGbLJHDBjVqzWzTOwp1aGw8pdeFWrdlt0k7gXq3ZKmUS3Kw1W6OdLNytNbtHwyzcrrW9cpm/FFLwO6IMXLG18Zg2Z3DJ1uw+0Qmsvu2Vm7QdBLdv9oB6Dfy+jScUCXD8Zg9o9gXPb/aQogSu3+whUQ18v9lD0sI7XKzeozUgmH/bN56RlgP+3/bKd/wnIYjmJ8Lmb+UpTaRwB9fsKe2G4Rau2To3FVY7TzgWEMRnoVKHdyHNnn0gDGL4/CVhkIbP9xEGMXx+lzCI4fNXhEEMXxwiDJyelWfXCYTlzrNnhEEavnpEGKTh64eEwd7v2TphkIZvjxMGAXx7hDAcSN8uEggRfPmaMIjge2oo3n608p56Bm8/WvlwikCI4feHCYOTZ3upNeDWbe3lPwgWw94rhMGm8QXxEMy6rX3HCIOTZ/veE1YCRhzFw6E09waXHi2fu03gEMOtQ0REvPPo1tEVAocYbh2+Shg/jtWXgUu3tXCHMDgWuvCcMDgzePQMYTAJ3rq4QCCE7thewiB0x84TBul362r0jUC5fCPQzudhmL21fI6+HOJ78g1hEN9TlGr43Mib+4TV8DkKL3h5G29oDAK/bmuR0hf8uq1Fii74dVuLTwiDSJ4lOuHpzyXiPZz+3HhHuQQ+39a5W4TB9WO3Hr8g0MMHacDPMEpPzxIIUTr/mLBARfuWQEjDi0RWMPq2b324QeAEQQoUWH3bt/cdJBCWNN+/I2yI4uZeSg/w+rau0EQCXt/27QM0I4DZ14NPCYSMvH3wEoFjBPlrISWv0kgL50e3rlKXg9+3dY1YBX7fJo/s4PdtkXdVgt+3uY9mC/D7NvfTyD7GQJ25RiCk2w2ansDw27oZ6hQlGH5bK4zBGaMDNEA7jNPFVQJhzrtNv8JhmC5fJhAS7vYVynDw/LZWTxMGs97ad4TBIxEHaeECnt/WXRrGwfLbukuxB8tv6y63BbLt9m1KGodBvLdGYGRmA7duc2E/YZhJD+lng1m39YhoBmbd1qOjhMEhsAVqoMf4PKX+Ardua53GPHDrNo8tEwY5tk5zN7h2W+tEQXDttp5xW2A4vP2Bfz2sSp7zl8IDDSdoOQ6O3tZLmtLA0dt6RWECR2/rNZEaHL3NEzRQgqG3vcqrGnD0tlePUmvgMpnNkzROgrW3vXqcQYjhe1pBgLe3vXqCZjww97Y+0JoHzL2t7/lLhyDO93LfQBBXl2ioAHNve/UcRRHcvfk+ohuYe9urF7hXO/ggzc0F7g9O0kQB9t7mafr9YO/N99OUBvbe/OABwiCKZ2gSAXtvfpBigfbePVrwFhjE65TeBXpK1/mTuE0/tUQgyp2naEkHDh97YyU4fPMFWnyAwzf/8HXSDpbK8lVEOx8fAr25SIMjmIDzY7R/BA9wfoy6HTzA+TGaguHOmukxWn+gPUj+Qwn24Nx8DsJ8jHZsYB3Oj9MMjNbh6n2ag8A6nB+nJT04h/MT/AMhV09SxoFzOD9FW0RwDucn+HMQ41P8A4cAzk8TVcE5nC+Gsm4JzuH8JBEVnMM5nc4rwTmcn6a1EDiH89PEb3QOV3mbUOFwSwcGSrAOt1fXadgA73DzHH8QQrhEfALvcL5EfALvcH6OVmbgHW6vmb6BGJ6nbRKYh9ur72j/CO7h5nkiFLiHm+dpzwLu4fbqB/qJYB9urx2gtQb4h5vnqd/AP5xfoi0U+IfzSxRi8A/nl4iK4B/OL5FKB/7h/DJjEMPLtH8C+3B+lZbzYB/Or9wkDNLwGu1JwD6cX6V5D+zD+TXuM0jD67SUqiMrVnAN599SVME1nC/TVACu4eY31HawBOc3aEIHS3B+g4YXsAS31zhw4AnOV2gMAU9wvkIbRvAENy/SLAme4HyF1jrgCW6cfUsYJt9NUibBE9xeu01DPZiCm5dpJQCm4OYVWiOCKTi/R10KpuD8OxrNwRScP6RRAkzB+RMazsAU3F57SvwDV3D+lPgHruB8nTiDruAzUnbAFZyz6g6u4PbaO9oUgi24vbxMixLwBecvaXUAvuD8BU264AvOX9LKEn3BZWYb+ILztyT4gS84f0e6DviC23e+oTESjMEepAiDM/iZTsmU4Ax+PkCjMhiDnw/SogqMwe07V4nf4Ax+PkhRBGfw8wL/xCGKn49TAoMz+Pn4RcKGGH4+SnECZ/DzaRqFwBn8fIboDcbg9p1HlPngDH6+QKQBZ3Bzlb4UnMHPF4jCHYbwefzYsXwp0s7nYbhdozEFzMPPV2hXAubh9AXtZsA8/HyVhmIwD7fvshmA7uHdBdrqgXu4eZeoA+bh5l1aeoF3+PlbGuHQO7x7hoYx8A437/FPhDjfPUtLKDAPPy+Hca7AIPy8fJcwiOXdCy8IhHRcuUnYEKjN++uEQTre4j8IgVpdIwyycW0/YZCNax8IgzA9OkUYDKl37z8mEOJ0/yxhkI5P9hIG6bj+njCYFde5MTArrj8gbMjGz8+pY9AgvHeAvhQMws31V4SBkHPv4CECYV68t8DfCluLe7RRrcAi/PzmLWHwSObzC4RBEN++JgyGVDoAW4FF+Pkd/wqI4bvThEEM33FbIIbv+DdAqt27SME3D+BmkQd/syQb87PV7Wj3vU9/E5Z1/DaSP/7h92P/85/+4ad//X/++g9//M0v/37PF+TLwDra85Mv//hfu/9Mwn+m4T+z8J/j8J8u/KcP/5mH/yzCf5bUDG4WtSuhhiXUsoSallDbEmpcQq1LqHkJtS+l9qXcb9S+lNqXUvtSal9K7UupfSm1L6X2ZdS+jNqXcWCpfRm1L6P2ZdS+jNqXUfsyat+Y2jem9o2pfWNmHrVvTO0bU/vG1L4xtW9M7XPUPkftc9Q+R+1znBrUPkftc9Q+R+1z1D5P7fPUPk/t89Q+T+3znLvUPk/t89Q+T+3LqX05tS+n9uXUvpzal1P7ch5cqH05tW9n+fhXP/mr/wZQSwMEFAAAAAgAh6GbUI8QMwXVAgAAnwkAABEAAABjbGljay9fX2luaXRfXy5weYVWTW/bMAy9+1cI2WGXIcB22WmHNEu7AG0SNOlZkG3G5iqLgiQ3zX79aOejSSMlFwPme+Ij5UfJg8EgG2ssXgV6oYTHxmoQi22oyYiGypbf0HiLDkqRb0WoQfhQaswF2WCV8yACiUa9QrZxGNBUoqCmUaYUGg2TC4c2eLFuzVC8GI2vIIizuH12/01g+OpFrjyUmXLU8spjIaPFlCVVECWBF4ZClxzEBkPNsqzbFjWLV1iIThF9xrglr3INw2zAza0dNWJYkOM+GHFBjFzVNmBCBLrjIsa76iPoTWRMWkMRkEyUYwK8x1QfuGkbiT+1OmBadG4TSgvlVAMB3B4rgVEVyPkDQ51vwSWhOFON4WaNrlFdBZJOC7nkViftXaI1aHsrQ+cuaZX38ogluTdS9VmKs0+RIFH+9yphQ668VfgbOH+xQ/BeQP9+pI1yfibRO1UeLPviVQXXiDtP3KR9dsglqT8TJodwknaPGibOUTrRE3rPh8JtxRkteZjn1/X6zk4F19S5sD929pQ/bKj7XRTSrI1TVp6YoNKUK/3hWQiyaJ3jPf/klv7Ic+czuOhjewKrNi0eB0WDSiC7EYpiUNQk31Cx6atEYigxRIGu9C6CRmnp8R+kWEWdqEyr1hR1FLKq9fGE1lHlwPs8kZTxxsYr9l27cSRsdVyuNWfY1sKHv+fzx1h8XBMW0RW/VYAVNlGsc3g0/jgfraKAJhWelamiy6az6KKpSS/pR2fFkTgY6lh8uXqezh5iyKq18Y5eZovn+XiyXE5+R+GX6SHeBvwYlZOPdxbfzZxc8/4ZddzbM0pnVWWtLNGl4Jxt7LbSBweqSZHIS77RfArupvdKBrJg+jKz7Et/SzvqwDXPbvdf5GtqdSmgwdD//WyUM91BonJqdxEeCUFrtiQWVAIn0chm5dNkmJXY/4rIPSYPiDxk+SXu+ZWlpTxcFpKDg5/D78Mfg+w/UEsDBBQAAAAIAK6gm1CrxDWqXg0AABUwAAAWAAAAY2xpY2svX2Jhc2hjb21wbGV0ZS5web0aa3PbxvE7f8UFUiKgJmCrky9likwdxZ5qmtge2UmmoVgMBBzFG4MACoCyFUX/vbt7D9wBoCjnUY5mRB729vb9woltXTUdy6r6dibk96rV3xo+m62basuirGo4U6vPm+vdlpfdxKPvd0UnzqrtNi3zicev605UpXpQp03LG/2orQvRJWlznbRdI8prBdTd1rzVMGebSmRcPdl1ojBPeLapZrOuuV3MGHwIIquKgmd4oAFLr7IZ/5jxumPntPKiaapG7hFaEP2utKUds59eX3z7zcWL5/9iMfNibzY7Yq+qjs9ZVRa37Jvnb//JbnjTwh72ZfQlA95ZkXbA2ya94azbcFZWLUmW+I9mZ6+/f/Pdi3fnr18lb88uzt+8SwgJYPe82ed+Vm3rgnc8We/KLGj9gN0RiUWVpQU7f/k2Pj65LE9oDVFdvHjz3b9jnx37jJc3tJQgzW9j7/iu/7X8y+reY5eXtG/wIagzBIuP++97gD/3011XGSpv0iZoY/2THZ+ygAW0r+HdrinZs9n9bMwWPKsHrFlyef0G/wEHnvUcpZT8+OLiLUI8v7iI/eM7e+3p0+gpu5dnH7HXv1E7ZA1rtmQucjxw+Wx1z8Lrjn3JVuzXX5m/H4j/l4AuZ198MY3qlFBxhAq+QjpKI+spOYSVolMKZC1m9L8X+3gTC1+ykdhhpc0aUXdJmW55G7R7lTNDa5yw1Z+NqR7hrpyvxzgPWnGYatLR1fY+SD6IbpPkXKIfgza8rWGR06rvs8/Y8ZNMxp92OaRqxYKAgTqUWZ7OlJFKFLEP3uL/Yx2M3egSnnyoGkAJLnS5z4dGjuT7Zz9cXLx49S48hYMf2DTpUJeeWfil3Tx86pBTFtx7gWRvXTXsPb9lJEMmSjBF//1NoLm+/4rllcKLRr9k3jGBeiwGJSceW60G1slsBT1BsQF+L1DPeaG0MQId69JsXuhDNRYwb/yXVyWf9Q4ZlkDdgxiB3AG16vEVZ+GPbFeiB/H8YbJY+IPjY5Nnj0/Ch2mew27nqAlLV9zhcttBLFoK0ETTrWIP7QBy685Dr+y966AP73HVl+fkqz4dZ+yJhWFZhWtRQGoNQ+UuYxsKw1Rl+lbGnBPm+egZD8b/ZC3ajcxNnu1DvjqnECUQkNWB7Sruwy7Q5w1pCryTGdh10gs0kQAtcCnDi3eVthtvwaZz7FzC/LIH5GcDgVxMgqBI56idRJQ3aSHyROQgoiTbpE0CpU4MASVC+kC8fuMt/5OGvzwPf34W/i1ZoU/OUKPXvBvz4NdNdU2czpkt3DlrN7woAlmnZGsCgXOmCYja3ZXveXNmsEUNr4s0474XwjK4dCC9TJ6KiMbijIBCn46d75Gkk+F94wRyv/n5udKK/niOJYOAveTu3jrfiyBebdPOV2wGc3e7bQ6wu5eYCza0TwB1JGqg7+lbEGHRidXIE+Z95SklQYisihueZN1HPyuEJdE5A89olULA9d5gKQuxtatYyjaCN2mTbW5ZtYZTy45/BHmyM/UNtnJcLqHK5Dlh6DZNtbveUC0CVTEokwGRIr0qeCQj0AKWUyhpC0GMkL8CiaIUVFBbIIbGhUQHP3G526QdEy1rdmWJ1bW1A1lZsPWuKFgh2g6pxiUJIvUrccFxkHQVR081GVTG51oS0kS7j2BVQGy0Td+D/OQOfyC+OQpYFAJtF5EAWfG7ZselYSEEIuk+RrCvI2EltPiEFg2JHzbgaJIJo1UI2ALwQWwtwewRXFE7dzqUYOFYDewqq45Z4BH4lChdKGJwm2s/3eZzm1a90diO/I00KKMZIYNjAQsq5xVku/Fh+FFuBljGtEhhb3NX2JNoerqlAqSxxUTctDJGaMb0P1pT+oMVwpjNI/ZTWrxnJHHImhDFtIVpH2JtegN0kS0WKVpqyaMRnil7mJbBH6A7/DxGf/h5QIf4AYaTT9Glw8teCNLz3qeW/vdjKIrqQwJkNClplcziEDiEQmi5ao6hQe56mYLW92+btr5p+Gk1KEUqMY6tDj9SvgpknyFrDCNjnkQ9Nuarhqfv7eSIZ8mMAgGp6ZJqnchW06cAjAOPPpU4sVw/XvRfGeSYbMOz9258/rDh4BYNg2IfY1i3AXOEP3QVOpSieqlaXEgdWQEITe7Ajy8iHknglkGlgKi8MFQVuaZMsdSTo1KA/LVcnK6obQh1DhUt2IJJvYptsJFEBiA0YNo9LQANqPIPpqiqEdeUh+xcBaqpazCf3EmWGrfcne0ayqxW3kq3YKUH5KhDzUhwjsCMFG3BoQJ65pkMZY1svPIWFUlqMnRG7LxXR0VkUNNpiHLBNU0Z6LXtBMgmzXC0ZVBAcbjjrSNXleLs5KjRzdV0zkqKStnkunp7Ty2odl2k1w+Ao+SUzsGvMDqajlSUOZdRlawI2lJoerZQOHXctxDeUATxlwBH2/A/wGq7QIJw6bOYmRndShps4FYDeBy48Cn72uKgHGeJ3nnVzqHLKooHpYPLqYKZ2R6D4Qzx2ZByFNX/Bs564ipsajC6KIFO+ZPuz3xl3HLrYb9ywV3/kGtEmzQgEjyanuFYH0sD0gIklt+C+sCXPt0B+aM90Bw68iqrAT/gXZNe1R9kEA0czRw9dLVPdjE9On/IyRzlJEoH8UBnS9uKt3xl3HNq86g0sWxy7NelzIMxC08f3NH7qc3rxPlznKJH56Bp7Gj67E0BcXDs1+zUeV7wchJnwP4+3Dt0+yHJjqD7NnzX8iax+kUc0vQl39yytcNu1X1c6GoVfKOtMpHiBAgHTLq5a+Xwaavt9jFNmATpCZH+ZDkBHYjNp9X27vHEfd2jdj8IrZLUqm0FqIuhfEIo5TKxFu7gTAUGLj15UCa00Geh2S6NaU55BL3fmasXO5bujtRSixPAk47yO47o7SldZGnanOZEZT+bk+EHRGnmxlc8Gfo7eQoF+sbPcBCA+Rw15vcC7m1WcsMLx2Nc60F3wwjgulx+C34qssSWX7wXh1vyg13FxiLjoVnG/VezKzgom2yokjnrdoAkkDlnQnQTHAzEojxMHWn52I0gW9IdVZuQlKHKp9mr9DYpeFr4A73Lwrpg8s2inIUokjR0y7Y7cDtZKyN0NHYLvcVH7W5EnvMy6PcT1n6/zU/ksNPbotVzotMb8aBA3Pols+1yLCmjVOXcbj+rho19L5u5HZSeeyhwydm4j70VvOilK5Wb5nnSd+rJKIQ6wdMauVc7nQKP2PN80O0bsGgqdDximDM4KQKD4cC7w9FyxJ+fRWouQBJrNxBwkg0vaqzl/GDcdRpFPtbEpwJK7z34Ue9s1CxkV8vCSdk8JQYUEb5kSMtbVc303Kq9MnRDO90JrN7oXbiaqmjqrMkZtbpy6DgZuNRMwkB98pBN5vmHh2oN38IaSsv40zBgES1/ng4UR9IGZAVXTsy09uiNiHuE1eFnecjQeqbGYnGPdF4nyFQ2Oal22J4Orv/3yfLvKGr21ipTxckgO2q+TQsZ092XKOe8xi++HPTNetM/+BrAlNAAvq/UhjKIljZpm+TVDq00T9sNvkcPQ8/uaXUEgG6l5B/Av9XlhRbFh++2WFFBEqP2kBLNSXwiXyrUaOzIPAcXvNp1CpHo4DlPW8FpeERZknaCkZKEAIFmYdjtWmZDbtzfhBGlrTvDrqHBalOByf5HZCB8g8xqCZQQorSu0Xmm0C2frfoNzimT0H+1SjYb2hoZLKbR4SvVgWM7BS2VAQN9opAeEKJd4Q6NlahPCzXW6SONekbO4sRR1b0Pc7kVlN3BDhGHRMuKc1+el21WVU8UjSOQyaeGYIRAoq2BxhP1o+WQ1fK0uaWDJtEAKz0WFZCN1+ojoi2mGpDjCMVqtGJXFvuCM36WfjXXMoKoLONxZRiRogHqqj3NwvjkYBgOhjW0bQ3yODkR0hMYzOHYiJlBpz15eLSBiIPzWLu5HZB8oFc2KOyST6Kb5tAMVf5kHvsZmSxhaD725/ApE8tvK4m1lN5im3vF13hrUlKELUtbyTwLqaemkVXOqZXBgdQVZ7wE+AwkhsKBPgYkSRcnI7stk9dRfOdMWT7klSaTjzIckFvscu7cj9E3EeQcLR7d3fQrcLDyRjRVufT6KyCeitu0j5JCN4ak+yAaUidoeffqdEFfpHuZu56kdDtsK2gLVl/5xCGwdeNztFMHfBpQd3yr68pPLK3oSNjjIw43W60n5ena4RHDC3aQWIBHyixQj6UFapvSPd/W3S0c3aS3/QiVppnlAI3UO1iFug4rK8g5Ohk7SU6wGBBlLjLooiG+2rOVASIoamqogsCJ3NetPZOnK+JNfaUJAt4zGU3AxwZH14UGkv2d9uXodJ+BTdrX6g/Tfy+NxVhk3h3svL/s7lDk9+bKCyzGymTmpI1YobB6z/HrRtfS9ggc68a9Lu7eNTK/sIrQ7zmAHbwKKMrBY6fnlr0fXRqiqtoGjEiHPiCZs9NgNmbFGl04Gw2Axivvd5mLeWYfPGmrHURBb+CFv+mu1ShjmzGynP1Zp+rtnqN9RW6sb5JNpZpDbmBp3WAEFdxJEczlNbb7Q6hH+u5Jw/2uzcjp+P8AUEsDBBQAAAAIAK6gm1DpRJ6cDhkAAGleAAAQAAAAY2xpY2svX2NvbXBhdC5weeU8a3PbRpLf+StQ0NWZdFGwY1flEu2q7hRZdqniSClJXm3O8UFDYEBOBGIQPEhxs7nfft09M8AMAFKUs7vZu2OVZRIY9PR09/R7cOAlKbvnXx15mfyZjcQyl0XlRTLmUWl+CWm+yeZawc23clOOkkIuvTVn9wVPPH39Fn5+yzdvRFQJmbFiMxp9/8Mr7xgfCFa8KOFqKLJEfnz5yTs+9l6NTn94d3t+oUfkKasSWSyDsmJFVa5FtRj70Wa+Fpk/GX13/cP1q10jaZjHstgb++9OT31PZPbEk9GB94ZXvFiKjHupjFjqneS5d5bN8QLPVqKQ2ZJn1dTLeeG9k3Ke8melJ9cAp57PeYmrGp18/314dvHu/OIMkPHhl/oRXn24uDn/7oymlWWg4RE+/hu+4qnMEfiLzoBgzqvxyIOPf3129aezq/D68u3N7cnVmT/1fH80GT1CoHbZmaw8CztziQg3enP29uTD+5vw9PL9h+8urgHiVy9Ho1HIslKEBYffBQ8iucxFyseF/+PL169//PjxD//+8vDrT88/ssO/nBz+5ydgw2gUA8MB6TCBkYBVxZchz0B8RDYfT45oKQWv6kJRH0a2A9txnizMbYDH6rRq7+k5wiVIaVjxhyosq4KzpSKT+j71zHj4VhSyKKcekCbisBYWs1nKj9+ytOTm6roQVXt1pPEUSQPGE6V3ITOubuCnuXNMy50B/9uFKiwmDRRCYQCGug6CUnDgXsR9mz4hDD5NZQkAb2CZ55e3BctB9sbN83qxPZymnRna3ykIczirk4QXMO74pqh5e7NDIfdnd1hDMvenGmaYJMqQlZEQLWXMF01i3/dPFzy6L5FMzJuLFc8cotPjAQyj4VWxaamnyaRUU5BKeV/nLfwgY0uOasQnEOp5/hDxvPLe09gzpE0PnJKAVo4HGdsgf0UPlV614J6WVM0VaxUJbbRE1lncrKRYKcFhVVWMjdD65hnY3Cgpu/eBFq4+jYvVpLcsv66Sw68c+SpWsMwoZWW5XdSEDJwLGjBtQNDVogpDSxx5mkx/g3AO7tBtYte5+/w5oFkwJX1HDkqBVhCoJs2X8K14qPNrpTgM+TsC35lx0gDtEiVoSEEU2KGDNJawPRDOgXcDYiOkt5RxnXISd4/0gLdecNC6KFXfb6oFGIrXHqo6b8YXbCVkoZ9fs1JhGXt1DqP04FeAgwTz62Uc7lTSq7MZoHSvnxIVXsMNA/rgvpniVWBECszy0ahZLjIbicD18h4s+jYyKDKwOlnExw+0fpJckMzZpuLluPtEbyvbH2JZktblYjzpDdAb+Iz+A3s7DCIHme7dMFYHwSsNGOhVwQ58mLhz6cE9Trt0GKARKthSD6DvnaUDt+g6mnm6318BYagmwhF6FrXlYp5qMbPg9khJEGJQLpFNw920I5o1M4kSFNOmO9GBt6iqvDx68WImqlkd3fMqkMX8Rb7JN+qPKMuav/jiq5evuwrI3omBBj9pFZC9H+XsJx5VrZLFXZLxNe4UkYGLluAOQdEuYefANiFnU0FGTcwy80PbDBYL8jjTdIO+aIqeRhV43kkJnlu0mMIzsPUS8XBY52ROcCdmPOJlCV4qzKk8Cwn2JBJFVC+VqJeBoheih5sQdb1MPKM/yMMyygOd6jlsb7Wp4e+MR6wuuYJaSZkqZPMa9jiLAdGcVdECdq8iBviZ5DB5YzALhDVMlfAsBlcUgUa8qBiIlPZmCRbg8lOdwwYs0P7wGez3SWBoagvVoPLa3116TN127rqAYZR7YXB0Q8bjDgb2MrQ1bVaCDkDfEDY210JVj22BITJfGIKIv9hgEttuOzB8esqY7tZaJF5CAgU+gOv+WVglY5rG2mm3HFgOchCLkkQBVTZOoJUH+MssNuKGysQocfCYQPNbgGJJU69ZBmEcyVxeSCAd7BUMEZTrIlAfwq5o9werjBwpMDAVTd04j4G9QrIYA+tydr1Bv7PWbUP1MIcpyPOuVoLphyRrEB90eJvrD7tZiUCGuPnwKDcfLK07rJyddb7cV0c7LurQyhpamf3xCK3MsN9EKwPk700rZRJ9f19qDXoYAxBnNsjHwT6NESXn90OM2EFP88jfm544jzN3AO5LOp787aRxZGsGCtWrTY5KvM4E2lkVjbA1WCA0fMftdxPLg56hZzBIRkdtah7V4U9WtbcF5mZSCbGfugeGD/4t8V7KlrOYeQ9H3kPQXNeEKlg25waxB/pl+0EDLqxxDh2nd6wU49TD8awo2GaidVcoYtCnIhG8GEil/JfOnoSf9JeXh1+Hn57/i98ECW/BZbwVWSzXEEFYTj1tYSBSLOvqBfwnMvwLoQbenImMfBdYQvWs1JASrnwKdELBT0If6AZdHzmDmKIu0T1S0oU2YSlLzPsVBbgfYD02CDWWbQgBdgb+RgskWOnNUzljKWDDKg5gP2QwR1Vn8CvdTLXPE0uuwIPkLQGchjUDV8mLUiAafK3QXWlm0/P8VJeYYJQ5z9DJQuwwa4RmT61TQ1qi79bMolADNwwsY2OvDvTQk8yTJNPeWtZpjEioGddAlzboImDoyMFNnL6dmxmiakqjsZ4qrw2xnrHoHh/C8Sq7NVVwFgAEjTADHU0xhQajnSZkC1A9A0euQid0TUECUPQc2EjL+rkG6dX0QmSfUfZBQzH80mtDsrvrJn6TjwvbFoJAsYIFAh3DtYBoNStlyrV4wP/gMdvr0Pc1JL6sU3ISNOrdeZDj6JrSPFp+7TxqaQW5d8tyFRXVnRUJw1I1KLZiIiXvb7xeCCQvPrrBrYCEBCV3GCmyt14RAsXM6IoVovEqD4gek6nyn5nK2qhErp3rjdt0LEhqAZxA51uvIPDOMw0MRASmj1jJSy3gQosq4I4ShxhGEI3EMrDsQRUqiQlRWsdJX68ko1FPeesUuiLTyNLN53Sjk8pq4l8OqrkTye9CoDet+aDEZxK970B9HT/VYvZCcoVad5haIJimSiFHk00xIX4ZfnN+cXL1w2CcvoNkSZRV6f9hiqnA8litM6C/DdnUtbfhu7Obt+/7yZRdj1zjI1MN/V+9/yYOXFxefPP+8vTbXTxQVrM1eUOW07WIwG1WRAsYaDs3LbR5S3+ycuM+wC6LMGdKYyfbwIDNtOGEqIzxuikm+GqMPxCmDE4FY7fOBSb50blgzN5zwdjOXLoMgsQxScdjJKLJPNIPm2yYfcaAGdU+qrVQ63aDUkPAfhbT8UcB0GMOabHqsb9XutkxXS8Tga7lluUjU/da/z7s3pNE8NQ/lEaD8/USMzuIhNL4+UTqyOmeRIKn/qFEGpzvMSKRCmRLACjDWoxXLK25GzpbHj/dVc5+N8VLt4Au9H8Qc/S2xltLotO2+Nfb/wQBwqhW87cF+F5MBRToxVO7Y6ktMdRAWKSiIhptqfZuYGVr/V0xGF4dUyCGQdjk86ItHDf1lnwpi81K8PVA4EVpQYSpVChqEN4W23RBrZfD7JnzPgJu8sZIwdPCZj29c0u75wuMCzJyy1XSmVzM1lvWoQIWf1iKSGw6UKIUPNMYg4ZM5bYRAsWO4FPUS26XK4NBWlFm5DNotT2x8jm5mm15nw4p3QzE45Php+ddbWHLYFIHdnIWD4qVUyy5tWJ1Ma+Be6C8UY8g+VWpW7NSNJzU4WRggVEhG8QRSi6a0gFCkUkiIgGBdyyjEpCN5BLilthTxR/Y8RacVnRKRAk0kold9VUQmGuSNwwPl2K+qDAgRgHCeqIFyUpCxBwm13lkLWhA/TwFrKp04+SIt2/FrlhZhNclhObWrE6GCucq+dJkzCxcr7ENoBRVzZqI+A8K10rAHXtPMJX4ULCAJxYUFgEArB+ZvEqmlorJFbPd7LUimpY9o9C/v34YNSXRGl473N4ic872/GeSueqfWOg6Ou3/ndDp9T9J6NRaEchSlODbKZmK+5Ln+/6JJVnOaJWFLJ2+npPr0/PzphtGrfc8sc1bk8dbsBWupX0cwiLbmBE54JotdVJPoBOcKMSsIAnUAo201DXTOhMV2G/7eTtNtSv3ptNiKudmejNcJs7qSnEeRsNzZQWCm6Y6eXsKInuvKnuRxEQT2vuFXAdd+9Nv8tmrd0j3PnX8IUw+M+Myhw4U/DH1uq6vzVwcIWBRlO1SkATm5ojHeI3/DEKrU4ZWHqUUKAnKN9b5RfciPFpnwEaTJm1naqAs0OPRfrWNXPNdL8l44F0aqdW5RRVny5snj1tExw12zZ5yxlobbpDMSBw3RNnSHeTSm7riVFOceuCZtX8QCd072BCJmgsaCBZj2iKvTe5ymIBNgmZQSgZcPVfwzNdm4KRRQjuEzldr8dvA0LJ6FLLpLdZv98SPdfEp3WaNYrRazFoT+9u70rqhowY8ttEdNEKOjwBSbD3QLqaXC+yqT2zvsjeoKj+sZfasajoVYZOyDhBXcZP6sCTVaCOsyhwKS4b0KneIvbPsnuw37ciujNmcdLbgVsNkTePGCwMtaHo1Nn071LjEvP5aYPCEnguSt8aem3SDCGmzrBgV7OShJVkuikM8ZMbc5LIsFe9KzE2Ab+M1Tlgh5gAu1bN3wCCJEOGl/EnM2L3TMMJNUNRnn4t1r115H7phF70SLq2gyLippkYLCUxHgMnEXvcC51KuoQUFDaEqopCLtJbFfek4O9t6qklk+n3VtotcsFz5XLYjirgw1WRp4mujOLX2cfwDLZM5K8DVA7eq7JnsLQ3qgxIyddHv6a52Ue61PTu226E7u7bx84ju1YGL9X3fVvuBKsAeuh0/9mSfSade6NW53Y/nP4vOjxBPO+DW9z2SlH8L4unJfjvxhgANBKa/VfJ2V3y0Sh1MwrR1HzNeJN4ufVYw0O7eVZ1hYEZFwbF/y5T6pZozhZvmXJCrMRLdnU8zBv30rVbNW5bVqUApynXXZWJWq8hkLUw/s+/Ceor8c1YKOAS+A6m3boXWntWwfdZNBa/fed2Aw+es+39ZZW67ynd9/yfW67Zt8icX7n7vqtx2rT5En/1rdY8RaO+i3e9dkXsagfav0w0R6J+oYNePx1yg9Dgf61NY2ORZw1rnrOK8jFgOoMy87ZBHy4JGSJCzRLoxb0s1llwAIRaspJCb49QwHEf7FhmWJR5k5IG5N+ovCqCYuHGrXCgw3RpKnzhqHB68MY2cDq/gdp9T6hn4+xilNJVgpDkqSoVsIUPs4KNOlym1Cm7Nwfi+f2kfpjpK6iw6uhMyQAh3eobSxAvUD6i7+Shc0Wj8XIuCl1Rqwljh7k73rt7doc25u6ONcXcXeBc6r+12GOpzJ9oiUW8jdQ/iTJRrw4ClrGfqBI1qHGTaCgF0oC5MBJEgQbEm1xW/E+zLW8D9VOdZWzwNWdTzeIGoAz+bjkvCpz1NYiEKUdeMTjHjiJHhrrrZcvN+zQrqW/rl1wFZa++22aUji1smY3Sk+fZrMw8uBE+Vg+HuTtme6erJwfPnakatXDDb7w7zf/l15gd4uppVY1q6lrmxX9FJ7MnEEb5+8Jc4s5BcIvzmttZlCqNjv7Cyaa7C91Xs7GM6Uy5F5EQI23lw4F3D5opZETf1mEQUpeoB5qXq1Szp+Idd7dl4MaWMsPSi4ZQ5p/IPyQ4KjOkXVfhQz5hJmmM/QMGxsXieycLUK0Sru+mE7qHvqBmWbcZLgz1Bp18f/TWSmuGfB/9T/xRil+Edxg+439OB2rE1etA96eqMY606urC2IDSIDIY43ecH8LCdyMfQ0MwC0TnUfCHFUHqxQNMMLJlLqg1Wi0LWc5XpKPi8TlmhFBEqPStPpDeXAtaPR3s6tpXmAT07tSrqB6oAWJdsJlJRofNdJwnx3cHcYAESYITDQoPc/j+hZRxw+v0TLPpQxgZznpnHH0RZkeyKpt0YdGmO3TU8nlo7gFWu1+/rhnGRrWSqC1MP2K4h4MddJPPN3SHQoFCVP5wNjAR27QCru5Bw8sC77Gh9wAXUTOrdre8OaQegDkbAVo2zC0k0eUMqS21k/QxbrxNwvKyopbG1sH/2IKH/QScb77A2pazVYZPxMuk8E/gi2LVPhNwD9Ikjk3TSDVWmVwIldc3CrD9oj0K4T6HGogOgmHIGwoA3FSt1tqGEIbgQnjkzwIi6GgyVkfJCPlBNlZLmqIoSmdJ5yrZNvzltECMc/bTZF4yEFTjsGGTtNSjWIi4ZlirtIQaOUZfIdbLeS7lSreTqmtSd51Tp1XtQtX/BJsqkfaEAnOVyoAkaBBEPYkr0tsFymX05gZ/UUqpsr+qWubzuNkWrh9tuXNNrTM3AV29ur7y/qu+nV2cnN+bH2Z9P32+1+wrEX9vanAR/3zfN3aDaX2pmrxdIA9QSVrvRMg9bw4Gz5axaBD9JUIzOhjB3QNfh2HbdbmbKD8JQceGQROqXo5dfPfza2HlF1QD/owa48RfeH//ovX41mUw7W6pHd1pqrHAkjWijrtuqYa3yyy+/RCoRpU19A10huuIWMNoT/H2eoUTznj2EsAMFBU0sfQnOzv58fn1DVc2ekQREG3ucdXQefqjm2AN4cnp6dj041rBAlMCEMQ8aFmwbzSI8cG2NpLb/2/Dy20cLORDigjKvO3YcdU4jh4bC/bgFJokWsBc6LCIG0FEn3XWhIGRRWsewS2fY0IDNA0tW3rdeY8cMxlsNoOMsKrX2Fg+EgZvo4mHoCNxP8Usry40RHR14oKljpX8AuaqoowqYHLE0neqD8vTeCdR5FSflpQ7N03H6vCB1jl0NWZ0HIytcpM3ZRFeKZqEp55Bw6x/qDoQf1l1CrvXru8/hGoYeQw7dnl+0rwawqOO8GWDg8HqPeki15mfvoDpyLOlc6+gY+2dnpAObjvVZv92xqlkHxli+2X8AM0Cmqk2zGFJVnXOizuFod4bmOYKuKRDzFLjZqxqYc78KkSGPtEsaNXTspISQNTa39ujhJFajYRsPLGHwSEzPDJmP07JpUBj3uTYdotZkC0M6jZ2f9RKBpPf+gDDkuLP6r+qw2OmMfrCEGOhAfdfqm85bVbOu9Cr+aH6bZ7a1oyC5tqODN81aMDhldSWVJgNLSO8AM25AJFPwZJfM/NaJRsyeh3hcv3EXKMDFSDWn553knFF7+uViQVnPxr5v2o5M0kaUoX59RXjPi4ynIUQrOURiTu8ZSCUoC7sD8ubyzeWRd4pOOgau2Nllnd8D4VjgLbxTkPemvX4PKwapBQcr0GiOEYB5wVPFRAouNr0QTxGiW/a1nZdex/jUG9svOplufe/SxGa2+zaNwCm5O91L4M2QygxD+KZOUsJX+21wIt8oWgbNu9oUOUKLVQqYTjrQOjvJRLrWr76IxGoA7OcG23WY4kFXDCl00C+eUTxu2kIelYZRBw7hSKbxPAEHHKMhWwjW9BaMlcCcGvh2JUQ19PYLkOS5Cd1UXDw6aHmtuwmpgY+ilZOL63N1u3TiaB4tZBMnAASKRnBXgVsp0CxvyMw2knvQHJBVLW4lxH8pJhOpKsWUWPbf0fdvX2vPA215YB/h1XHBjkLAtHe+x1IX+Bgr5qveq/uIzwo2vSORj7pMVJfxjWXgVyTg7fDYfnefFpT+G6aaYytjYMwyr459v+PpWYW4oddDoZNHTw4dJMAUDrpnOjXtZHb6Hqkuc6qDBwropCPLsJ4heJjIGUr3qBJxYV6AMgkK2nBj/8fix8zEt0PHV43s2YHaPidYzWWlZHW3lM5RYwjXexnneOLyo28DGiXW0wnmQ+9qwlcpacmnsLdsWhjxpWQ6TZ2m7YZxlmg+jI5Tl7VKjOOeAjF+/cqcQfdOvj83fbOojCSe3FiCtqDEowsJ89w8K2vMxdMjJTeNu7RxqclSZc0RMdReZNGKOq900tN8KvUuHfKx5cY+FK9yLWtWxJ22Kru7ssdk84kYvZfheJhd9BLQoZ62x4+5NIDJKtt3UI+rm1urOfgxL1mkoV19LnJU51sMiJYTF2NanimVHLea9QSu38hbZHHzOEE8pr+dPYU1ThtS0OmOxI8qO6JbvlIb2W21U93tLFFlRjDQT3lFXZvzVI/2BinGDD/sIE7CGDJ87crwTG0Q264+MEuzFvC4jA2K1kf1+xPR6Ymyte0IFb5X0lwyJUrbRxx3SL0mVdqIAu3z4B2vTtXOuo4KzrNv6HzEeZbIfuqi8+j1zZvLDzduziAoC2VhhxCGx4IrOnlySN/f8wQPGMC3b2QFNltfvpF5cxZzT1PZDRfatonBdv2tNWf9Ipnt1rw9X/n84ajd7F0TPzBMeYHEHIiUmpOXxprDJWtn42sSzZtdbT/tqG+/XM+0eeHfbtEaeAerqqQp/WOkF+3LuCwi+jI1pVf6pVGh8bvMHPUPIJhBT1uD3vUqJVJCNM2gen7kDOiqq5Kf3nCBIOyV73zvU39l1G2sU1suGExZ4SHe2Gond6DRqoc1xx7vmOwvyRY4RAFfPN13rFDfbZMFJdRHdl+SWzeb9CFqj3BPkNTK06kJDgDFty/tD5TaXzptPrjBmsKgqtMee78QiXxain/UKx5Om9v4DoPufUS9GYDn97sDEI3Rr6ORVa7eMmlL0KEpLdIMTWgtEqf7H1BLAwQUAAAACACuoJtQ3cJEs/8XAADeUAAAFQAAAGNsaWNrL190ZXJtdWlfaW1wbC5web08a3PbRpLf9SsmcOVM2CRE2dndlM7MreIoOdVmbZfsnGtP9tFDYEhiBQJcPETxXP7v193zwDxAWrm9OlXZIufR09PT7+nRIzZ5MmFpleXl6px17XLyPbacRFF08m6dN2xTZV0hYETZ8rxsWL7ZFmIj4FubV/B9WdWsXQvWinrT5Wp4wt5V7FaILXadwJSqblmbbwSrluxlkae3LKt25Zg1FbTl5bIW/+gAZrFnXSMytuzKFMHzIm/3LG9OtgVPoT0vAWCPFC8zVpUwSa4AA3jDSiEykSW0A7UyIi/u2yJf6JYNb9f6c9XoT82+sZE9OVnW1YYl87TabHmrVmHzTCx5V7RzhDlv2qzq2uGRL//2y/urV8N9K9HOF6Jp56KU1B8elpewzn4rmgPdDW/b/XBftRUloFcLvhkeUPNyJQj6cD/MzbdzXjb5cD8e+bwQ5XBvv3Nxn4qt5BZNGGSBS92shnVtXpgRIl1XJyf5Ek4nKTkwyWzGorKNzk8Y/Px4+fPr68v5jxfXDJo/1BG1Xvz87vLaNJbRiSgaMTzhw/T585t/e/aHYmim6lsjiJMTOG2Gu1y16/kajmNULf4eS6jAYtei7WrYGIqAHMRwEPI5LxkMFWmbICvi+Lbey4n4U9NMnEQQqV1Sio0uWiD9omvFZV1X9Zi9gzOij3E/3wGGP8hRtPaM4ZkS1GRuoz6fmwlqJXchF55C8FVVisOLqgX12v1WrEUM9l+HDwdOEEHGX1XtldY1INmgZsoKO0AJtbxMxQgHjnsBiXEITX7Bpl9fSbXhBDjktOBNw97U1aoWTfMjr0fy6BS9iQfmeZkDCUcGRCOK5bhHHcSBLwrRt0jKz3DZvnGZF8U8XfN6Fj2K+max2bZ71c6s9gWvQc8AHXgrZtG3I/geN1Y/6M5q3ogtzLKnNetqNxctn72rO+E1b0WdAk09vGRX1cx+5iA1zrY2c+pEpexNKvhCFOEGhdeUVkVVe227PAPaPJ/KFouvkaqJoRLwlvnsDukpBmP6L+4gm3wwzP7qDtR0hEH6oztAUxQG6I8DAxRt9SD1dWhg1ZhBYIBcXBySI0ZOgzuYjgDGyN8gAkrX0Nkt6TSkNJXCFQrqmQ1as1EcnIaQB+FRjQ4Weui320XnC1302+3iXVs53ajcpyc22kqVDiKu+mauVtbiF9tgdOMwoK+sgz81zxvRK7BRZCDCvvvJ6L7ktcii2F1AD55ZtnYkp8XBmdfypOuBrciT1vuWH4Y657cluFVmCKKGStNRfDRcst/UO5e7FTTefPTYteU1MbTkNvRYSArQQ0rwP59boNvgQcrEZ6Yyb9ag0Qd7N/x+rnkjRBtNQX1oatrVNQyYo7QMzs4bYJUsE4iYtCXoPI0Mi3v7mNNmi7wUg9BAHmvs3uRInWnyhxPLVBCiYCtwpK/b+k2gcnb7YAMZTNwqQ2SRVtkrHOUsdE82iUwR2ltiMfnpjheg+1m78BFQi8iDgCVsEzeINggK0svG3jOwJCbXXYn8oCTlb1VHvjhrK3Tqmd4TKuEGPXkOwg/nvCiq9DaJ4v8FIZKVKEFUWljO2UWJqizYxSN2hYKFHicKBgyFo5UxBTiyDblszEA0McjYAiDXhkmLvRRVWuJfaX/tGnxf2KuEyxCHUQyBEMYru6q+bSw4C5FynPPJyP4nRAk8RqMyIGZpuo1cikAbzGyEmgpmSA00gZOp96zhSwi/XvICGHfFPhEaPq3iTxaIdpenQmJIAVVWiYZFO1xyD0e44+B1Jz71CWxPAUX9R+zNvl0DeZ8xGQtQK45Fba2OpT8okMcliJh/TmoJS7+wia2KXswCAexhurwd8rGnCOCcdQuhEg85jqExTHY1bH5kwoYBe5ksi66Xrj8DI4MzAKGaRnSbBhvX6GkNOejEniVTn1KbvBwZrX7KRsui4urQla3BfZ7FY5x8ECEkNTospANISo6pAbAVg+hNQ/SAjUd6Tgz4SfQw7jGtB5ECW3KISo7FQ8Y1uB2lH40I98qeMJtimuOAooHmwS0aBJdVveFkEg/hacyhi05LnqY6Jhjjeg6NAPnP0Ea37Fv2x6k39fR05jcCE0AY93tmrKuu1uOffTcw3muEDbXsBz+2sggTff6Ssc/n02dfzq3/o0TSaATBGi051riO9TbdvfdR++AaB+F/FbgGEQXHB8fsH59y0Nt6FDLCEAu6GOPspzMWnX7u8bMF0scJY4AAqVBD9ERg33351kA2fARTgJHPptM4vjk7/xiABNP7EHFy94JBk/E9vaV6Vz/252iXsQ/lnliggtFPZ0FYp0VS+oMTa7aVYiiOa80DiPRwLUg+28m5Rd5oKT2EGmnX2BeWQ5rmm9mQDMFiN0EjQQKKD3bgzwgTmRCGNb0BeHJoYdS9z5Ipe4rOanwQ5CBx7J9w6seAxAN0jKLk7xVYKsxg+AwNbSH7K9ePPPDAkfaCbT8At4JJjOYXedu4oc1BK+JAHowLvbWN2THBfLCI7vHCT41ZwrdbcFtUINJrpNjVONayvwcQaJE4VF0mnUF7dsO2BxjTo0uiMRxY0ktrWLGpBxvH4QL6YN2JoyDYCySvh3BwkcFNmHnxic+hrggGuSWn91v2OVgrovxMdG4lbcbhIACph1gaOx4YiVjqoTphJeXL7Mqb9sV8i5OaUvt20OTHW568yQy9uuOxbjCwJS95MW/y/xYh4xtHe9CtNm2LbulK5yP22zbDlJ3UrxCipZxCLHnPhCuyNYdQUoAPD/jC4lmwuEkzuYtXRWYyDAc0nZPAcp2mtOhajJGNQdSXIK7QObrLMw2l2BkENvx+NB2HpBzFN9OPYPLc5QJG70G96Pc1YFu6pWbx/iIkVOPWsIhF2hCYjEw4IcjYGHwOk7MfYsakhQBROnIm+kT7pQ7K9QAsM8thuGMEUTmfIyfqDMXTsTkB20L15yCPiJvgs+95YeCdhxS0Ca2HDW7JXT841ZFNo4kBFQf7Nxa7W8aWaF6TqpA3XjhQ3sCi1mVg+ssVXr7au6dB38yCpJpjZg4E4GEiDn+54UK6rmjLY3n1YCLwsbp36DPVY1YW8n7Dj7YGg3bUixt+K+ZNK7YqxVbSl8ZPqSl/X/U+wMvQk36Y2SMGNm+lSyldaMMeDeRIdIY2BmaCcP+44j2W07WzTDo7jDkqVlcyt4SOMSbNlCp8MWN/wq9EAbZbi1qoz7wWFjCddwP1TRUBouBbvPPP8rs80/ku0PNVC0reJA3bdV11q7WPlFw7CQgeOFuICWxwiGKUVULnWM88EhIoMIegeJSVCXX98Wbyx/OP4H3fIJCP3lA7aR6wTM+OHZnF47zYs6we4PaHqdXe9R5MmwUIevcGX028D/IwrtfnJL0lzc26k5LdrfN0zfa5KDJ5444rAn9lmUwzY9PCCj6yrkZGxVRqW3cym0viJ8koYdh5afaEL0GNP6GyFQ2F1kPGxES1EqEmsVG1uPL9xfWrq1e/nGv0JOI5Js2XPBVULvPJumf+BACLHFCpSgsKFbmY6haZm9U5Y+ojQWyoFsenjy1qlWjKx6CWa4HOFIzY8JKvBFIsl/U1wNHQlbCrpQSss94WFKnUm7Hc0mbLIfIHb7wrgCQgvnjNwPGGflGBFuArrBJqremfKE2MUd8n2pJMSdP3RH2BHnDxtiBAedoVHNHcg8dXFDYYP4mNlNvivrJiL09VlgZ1oJVqsQE0KBcOkC0oVY2mS9Ys8dY6F+AeJLOjSf4f7jwe6jEjxvUdQjA3BqGbR4wKw47orwfBGRJqC+rB5Zz5SlOdDVpadfEU9AyoJqq/2QLT1qP+BsSqKOhLcX4SKRgQRjcXG9GuK3MMuGsAgbpA2RGGt92mLkfeeh+/DFf8oO8M9w1o/Cwv474wRXbQnDBlNy+7opDbkEPGzN+OXIfGzNMNKstR1QDv3eV1VQLnt6PozcUvl9fRmFRsLC/740THcgpLA8DJ8b2/ejWYDqcIFl2fgMQGjoOePXWbbx86TRZyOXt5d3n91yhGVhxFWbdZwLYiENu0if4J6smdkmcNJ4ShOfrv0jg3KHqjqGqeDa1wkA7RpgJP5kXkrwPxJ5x4DWcEY2A1AADbIaUNvEHfR9GoADaO2bMfTjNxd4q7gDEzJwF4lJoRzu+Xlmvr6juJsGxcZtL9lbVypjPZ3CIimj0As7SoGjFaZrLBqed64KYeE0Giz1+ixzoBrVeO/c19fYMILDrIYg899yVGzoW1F0C3K8FNve1x07V8g3hYDGsUyhs0lbbCQN90CeodFUlOl70cRB88Xano+SZh7Kq8q25xAO/FuQdCFipfrcGwdFtVmwprKndC6yNdf9ktAG4KHCDPGMQHjjbL09ZSDObqFSz4TjyGk4H9kaarGDIPNA6uyDodxan5eFlCTgGZRmoEooBGbHmOBUbwJambbZGD7J7CiZ3FN5Ozj4lsMVIhK4J0hIuM0wPBlAaWcRJP90eFX+fLgq8wRQtsZV2Z+Drj18u3b1FPRDH8x1R4ai1wdv7RTTyiZu7hu3wJkG8kRMxfR5PryOnWtU1OkQZdN0R1hGrLwhs18bXXeH4YmiQuevrmhJM3WK47IjYEV7koZOUeIyMzs8ddvbkcI+4z+KeqRlUFsarDdKqKR6myU6G4kxeEXA1oG0kIKqSQgoR86Ce08mK/LxMeYYvl1NA25frqxpzMLuEmRhpFOErw5LDAO4rdMtir16r+9S9iv6h4nV2hI1Z3W9vAbnkjIzbX29HrSn1npORXFAntF4OPsRXgzf7XyzFbgAOQ8jZdgy8Oso3EwUsDDHh+u2LbrobAELpGfAEyhOXaEl4jeJ3SDZBUBGm1AR87Q2evQW+E9L+U7kdqyjvpoADBMEouya0GLwWLV2FBxIXCEo7uF1PHjkmbPL2NdfoTLzgVOEScBB2ErmnzomC8yO/EuPd4wPPv2i0MQ3HcwFBs7rZOOtVFkaIBhRUWgDSoTTCuVKihTsPKI4hPNMJ7HRM0olVQPqFwzR5P/vIYPP2r9rHM2VVdDbFfmjekaiRYuTqELxDOIN8fqXJOkx3P7QpFxSwBi3gXsppLQk7BnwVESLfaQBx0BR5sJHJjBLRlQEpxMstVzes92erE0/eeRR+05pYxB056/dPrc1lhVIo71OaGO+i2ns6qweRKHyP6AyXplSjrjJ8Z7vi+nho4JP5E4WMqSTnP6CfLc8eQyHqtYEw2aIbdIqJUOIfQ1FJdR9RJPKDqLOfl8xfXdaEz7f2X3+1N2B4KIj/goRheeYsB+x5YAqvUu1JigKEz7YPJk8xlWgKikHyDUfsSUFlwDBcVt3xFbx/W2ccODH/kBizSxqYy/hJcg+pYUbzMSAkaJiu9yUbJT6o8dt7wO6HsGkAXJaqAWZS0920UpJsIElZ20wevkxwh+N9PbPXLYMhqffXm68URiv5sZ6WAWeWGD9X0SOwO3kLYtUbeBvD0bgWqCBb9x9Xb3y5+RYfm8qerd6+vIw8K7tJzgWBqcAtU3x0sl7Gi8yNBYAS7AG2XRQ6WepPQ3yCJFoWYyDbE+C7f4K8SPOAocBqsCEjm7EDq+hAIwqF/OTM+ngQ5GDlYKHpU1Ijf5VYxD46Zo4AqbjSyah3gsGeNP4bjVKLJ8EB4lQMHEriSeELucaXVdu8lOXSXlcZNjBtHAwLL1IM+/hBn0J0MqBmoP7lHi1bGt8RVHV/UAebtC6uQUQtjnOAbaEW5fsxwAYzMp7kvw0aA6zkpH7QlS3DxRfZNwDm+K/D6LbmNaDN8uXzgGufMCkI0iUQcu7ym2Iw0ZcBirjGnI5Pql34F7zSoVd+IKbOWqYzFhzKKBzT5U/XKrRdasGSH4v9tLZb5/SySm5mA6DbdEltchRgfZrAh/UFE7019RO9HJ02+ioJh1u4T5e7Tzsb0HK/0Xk4M1wAGS0UhVWZs0Clwg5KllNRlRlKCdCNHwx3jGEK3RwcVzuo5uNYt32wl7C0WZoEW2dA1kXIZ7PHGOEiVNTBCqxvHrqlczAB4VKAGiYOKlLRISAykg3K5ap8SASsQODROiBvPPEIE3tNxuhlLlUBUgGdmcVFssUqtmMVmlcGlemfNdtTIv+zqYgT/xgxVlHrpxooqxcd18l74/FgChjyervxHB+ZSnhoAO/YkU8GBUfj2WLcqNXVFnQMPI4dnATdAi5PKRBTOT0997QDD4Gzk9EShi5je/On8Y5Big/YT7eTbOVPK1GS83uWlZd95TVmamwjJGTnldEhSFw8cbEoPJu8jx5BKqh+bcG1NsHvCE+jHkXuh2Dnqc64o39ER3WYq1T37ictSDgZCyhlCin3jNsiBONLhdUobOdrzAAXk0YU7DMgEox6L+y34+BDNnYKaAL987Fj2AIiRpcfRY8qhxcf8Dr2IfHOBbkPkeg6BeEen7y+u3kWaFwgmzBqzobUPOBPqIHr/EdGwaChf1P/fkjHdr+Qmne1pHZvlNaoRmh5S8AEENOB91yua7B5IrK/SJ4x4jxLG39uARJGHkkRH9vdVGg96pDfRfbaakPagvX6Mj+sQteHAqdRvMSRrOH6fQwRPZY6iddtuUWcCYfFjQ/ozNq6XJJr5GiKklPNOLBZ1tWtE7RrTvj2h/QZc5yBuNZyZ7FMNoTnWlM7T9byt5rC5UbrWhmnJUnou20Uf7qfPLc0sXdsgC2Zl5vt530VmgyhNVG9Z5veTIr8Fe/iyrYunP3mAL1//LO+4B+CdcQlPw3qflxmQQEH6z8OQ6A88GHnWf5qjuUt1Jc2f+7/ckaiPsoKhNva45jtTOmlXj9HttBPTY136CKvFnDeB79bCFD2wTzTsE9thGrXWBSiLPSbUZO6DpVWNaWO8LKFLFguUrCYRlHDDxXgKiCXsbV6mQhOFnU3ZosuLjJ19P30+xlTzTuZsGxuUWhvOaiqTxFgNgUVT6lWLLJ2iYhW5pEw21mJF9RO3Yt9XMjyy4OIGd7hDeuVHBQ6AqCoqAUld8EWxnyy61QoLOsSa3+UVbOGvYGaqO1EjvgGWWIoC7EOhnSLSYs/UTfpYFe3gI0jMe+8EJZSHsbvMKYdeUeqy6c+lcQ6EiALq6cO9mGICGQibp3YN9iMk01akOS+QErI4ZG+VZiAx6bQajJbM6VPtCvavROsdawQ0biOFGf65HPwTN5JzqG5FZu1gfx+66RTQyu3XnhFIM1ZcbHDZQmBBry4EWdXg02MwVqFIIY74fleCoozxzzWEMHZNz62S8DGNniPfzBFhGIsESWxyJqtkTNVPuS7Y/G0Ldgn0k3qXqg+QSClLaAQS+LvvaXvOUTeYkQQu00eNaUT4igFAg6F25GyJPWVRyrc5FvH9e5Q4AieTnHhsDULscuBBfPJKRebulQiIUIf+FZN/A8eiqbuawX14UWvie7lDOiPznneMfMkbfHALHP64kWdKD4IVI00wZ9fQXylKHU7DG048VyNZxEXyPqntb3roo7s3f0vYodjHaI+xUklYKNbfWknHvWzzwigEC46ZTEwJi2SJp+94Ab0lMOWd6KlAl9qbDUSkIEtYUmV2sKN7Hbw4Yt3WXqiummZiAoY10IIKQ5FuyGTIq6qMDeVaEUE6Q3h4FihiXXahbtOrrX6k3ZFiU2pZowREhONKuSRGkaPOcliVo20rJxdvX15d9eQAg6Rr6BQJ6YU8PfzWit8tVaW3xX1poSqJYt9PFljrDEKAif9hNrso9zsORNR/7EoV4hU839Aj8Uqq3Gu8mR+1m1jVJZrtIitZ4PC9eqVv82q6zof5eGIlo3KMJgdBkboSqFxK4VC7cora0AB6NWHyj4xIu5vIte0b76CGbGC89V6G8gL4Tsfx7GTR2Yjcjym6fhEeuR+5PpLKHUkhVVIt//JYXRXWOeraPan2HVXvQWsEMPsCLFfidAAyTwMkBx2v+i5wOes78Ft6quh0n3q0bP1prFw/BfsnvJhDVWfeibghLwz1c1kZJWsoyVuNjkUtNNKsE87Qyx1PRuNblAYMHXBoo15GADWSNgVuofoiXX90EAI1tvsEoABtgvH4I+sPl5mL26HkU49DY3AYm9Z3L99e/HR9cfVq7OA+8OTF3F2atwL+EPyrO8cfnhGiQTJMRTEaJREmhugS+2suLUm+y090e+qVr6L7joEgJfCQFM+fxeGAdK2zcgevcYEb7QoON1iS+oYE2uVht0hygLoy+Zp6r44ORUeDMeP65H8AUEsDBBQAAAAIAK6gm1DsjkkknwEAAK0EAAASAAAAY2xpY2svX3RleHR3cmFwLnB5jVPLbuMwDLz7K4iebDQ1ttcAKfoRBXrILgzFohs1MuWl5Dz+vpKf8aNFdbJHwxE5I6myMuzA4dVdWFRRwaaE3FAAtDqAavc7pBQkPpCjKMq1sBbePPbuyyrkuJdI78BkG4FfEgvIjoKkxkwb+sguhmVsURcbYDwjW5RZfqzpZDeQ15xpRdh9IW3goqQ7dlph2UrkXgkLBzsoxTVuCPA0Vjwn0cBWBYSj0gOjOI3n21EvLD9PUJu1s396/jeh5XVgBfJ+O7Yx5TDanjNStnOddso0+EQy9rrJTGTRSNOeHVio/WRk3KC1/fGEmWBamSpOOpteZ/n2oXmIRaZIIrkur/bnLgyjpWcop4TumL7PxvApOimw9cHi/9rDs5rFxhj6UhIed7DGWqoviY5vU79uCrUckEKR0HpGWWtht2LAsmht3lUfosH79j8zpG+d9SGhO+P57EX247UqDIOS1w2E1H05INUlsnDYvM3UVlq5sGd97tPBfpVbQyzCEfACf6YCS5Hvg2x7769lH1DT9fgEGF3NBA9/6SH9NIpiPifRF1BLAwQUAAAACACuoJtQ3RO7efwFAABpEAAAFAAAAGNsaWNrL191bmljb2RlZnVuLnB5pVdZb9w2EH7fX8EqQC2hDp00L8aifjAMpwiQtkbjogiSQOBKo11mtaRKUmsvgvz3zpDUtascRQUfkkjO8c03h+Su0caxQpdQ2IUMT7q/swe7WFRG7xjPC71rhGNx5e7tz4vFooSK5ZVUZd4qSULyWjoworZ5ZcQO0my5YHjFQ3leta41kOeL8LpiSju2EVY4Z1LUds6SfA3OH06yJWNP/A5R1+zu4DZakagadqCccFIri4f3wKTz8ugygBoUe+ZfVGbHrsgL3ktNn2dBd/mIS8/9/cNG1uA3S+v1/a4VLHuRaCau8Spf13qFvnGUlSZ5rlBcnidoc5Jx64Rx9kG6TZoUtSy2PMkGEYMxQdJKFNvJIpnzU2cPXVD3aglYXui8qsXash9HMPJj2DlFCZ0xfvNUf0QGNY2UWJhuWhkQwbIeyBjmYgPFNq+0OYl1H+UQzjwvYdWu83x5FJRFjAnRqaNEKa1Y1XDKnwdhlFTrCVGQdEybb5450esdE2XgJMbg65TtNA4nfrliz2aFel+iVtu5RM/BbLpL+3N/h33pBO/khrjCSnBQOCiZ2wBrLTBdhdsjG0exT6ZyonbO7jdIYvzZgNjL+kBoFbo1Yo3SV1AIki4x5YU6kaCc0WVbALPtymFGYBRRlGIHPO9rBGdvdcvsRrd1iQvWgSinUs689fDYoFuopU0S1tuO3AmiolfMOkPAcfZSm7MjY3baoJ0Kz+x8pjMLcGzwxrnGLi8uQr41WCXA2cboj4ilT4WLxheNFxfDyey8v8WULbY17KG+6mMdVrOO9HswsjrkUUwOat+RPUmSW2UxEhYDhXWRooXL0mhF1YkisNa69E53/qIXsYq94Hi+IxrSepZdzhxGRSiQq9aFqGHRv64sGlUgp0MJ57XW27ZJwzYqVI2BCoyBErfpkviXZZwqlxcBjwU0jt36f4jy8lRwImwhZW9sfP9DvzCf5fDojKDT/UFtvVp2hS8bbeVjcuIc0g6jV4C1g4MTELyWPZX0fie/0w2oaVLR9S4JGFB5fiqSD+cY7lK37mp89NXdrX+PAB2/nwjMiEw7CqNwWCHePfswlNCA4B9vbo3RZsbUVTKQjxiRB7sseYF9JOsXsQ3mRd666hKXXmLCjML8hP0mtpSXmBQPcIZ/0WuDiaHWxCqHcGPCG+DjpiUtpahQBaRmf85WBwc2m7HQ7DlyB/mTxpAiZAaaWhTYg0dUQybXUlFW0hGLKe7oua//3RUcRMG0yinJm5Gb0bjI0Fo/gEkzDqoMzTNNOELw9JKMoLvLJDsSfwwkF2UZCZ+dbDzRRNZjhw6iUUcR1c0oOQnKvWlHMQkUx6advFfvR8U0NquxiVPZ/cFT1ibXZSkpEUU9Ln5LH2Qq7DjLONihAuSCdNQGk1Mh7K/7l08vWUc09BtCG8ByBmVsETttsZzILdSHOREG/mklVTf81fWeiLY64EOhVSXXLRVuX/Nils1ICKby6dIQIT/gDPB+P0T3Ixxs21DlsN6UGz72m6a6YoNJMO8dJTSSjuCgnraT643D/sgIUuZ0dBtCw5LWtrM+IiTY69CCDo5K10g0eho3g70wkgTb5ZQqgyDvsy+Cr2/y69evr6Iz39x9/fuv3d4vI3085X0vvLW0iK3A5tLi1E1DSUA4wk5uRpLNWen7IuJHswZraMyheYnoN8bpazz+AoOX7NPnhIfsSH2h+KilSi2aBGU6Trwsy45A6R+p5feVigb+aaELK1gssG/FUIa5P8Qnyc5PVzAWx3Wkrz9MqPJ/Fr2JxXEQmNc1+xnTi+lH/HhoJPeLB7/GGOJ0HGP7EA3BD0TFN2JSlmazqXWjmtKRsPDTJpnlOdQ2YeyWblbEMOGWGoI38Ig0DrTrjen9nRNy9unzmTdGug6RyHgoe94NqM1SzAiJZvzZKid34GeDAbk49D9I/KwVK0rjqjXouEH7oGj9uNs50g2M+DExsjVhXR0mqLUfuq/f3Lx6xYRl3aTniXw0l/KxjBv8gG5r9x/maBI5lrDDZrWO87mDxvJRYnrKZHGe/hdQSwMEFAAAAAgArqCbUDGrvxMyDAAAGicAABQAAABjbGljay9fd2luY29uc29sZS5wec0a7W7jxvE/n2Irow2ZyozsQy+JEQe17+xE6J1lyLq6h4tBUORKYo7kCtylZV2Qh+nD9L06sx/kLkn5UrQoYiA5cudjZ+d7ljoix18ek4SlWbk+I7VYHX+DK94RWWwyTgqW1jkl8LSMOU0JK4nYUEKfEprntBRkx6qPZLknF2lckMu4Euxf/yS7DQMG24o9ZikQxSRngrAVrMdAgWRZKZjklBXbnBawFIsMmG9oBWslUCMwzXhSc44AQM84r+nJy8kpIEjw7V5sALSs10RUcfKRVqF3JCVHLjH8x1lByZqWtIpz4LZaAaBMKEcOFV3HVcqR84btgCEcEk/DgUPCii3Qp0RLyapsnZXAYxuLZAP0MeCCfIyUcLKSKkwJ1KLDiTJ5FEGrbUXh/yCnID/XXOsMJGB1RfJMCFAwLOWg3RVQ02TDSFymoL+CbUXogYpYJUgi9lvKzVvGzBNr1vi+eRRZQc3zpzxbequKFZoF0evLfUVXQ4AkSjZxdRgSbYdhcNhhAJjwE40OAOucleth0CPL0uHNbmfTm8XVfAi03Uds+TNNBrfbZWWa50OQ+6y8qio2eOz76c31u5tXi/e3VzY4BG4O3uv72fz1sxg/Xty8fvM8kze3r+7vFvPP4EgUY+GCPyaV8BRJGEnvFQY3umHlq5xxCPAFfRLT2X0Vb7e0Gsa+fX86DBBAG6EQnieq/ZlH4G9Q+xiT8TbzJMbtfiZtEf1AxWWN8UfOW5ywD9ZU6iWa05xC3unQuEAPk9FWkKkUQNpQSdeQADnoAAT3jCtuYUm7kN+4Z+B5kEJKmr84BbDylNCseCDhnUh/hMDMUR6zHtrr3pzG6StWcpbTexvJXvfuq0zQISwHgBvq57cs7W5pQRDxTczVyTtozbriVhQg5puslNtaTu0rfwp8f9TBG427iggCz0JYsItq/dhlZ1Sr2Y6NT48tpYNHB4EvDeWP+hzbjfkGSg3s6wXeG5bE+XVFaWc/HSUmYYxJZ6HZp2EwcC7g73l3i9fTm0hFKWxiG9c/PpkEiDB7tziIcSIxrubzgxinuA348Lvr6G769laiTPTC/Xy6uLiUSyeeB1xm8+ju3atXV3d3Ekut3MwW0dXN7N0PP0Zvr97O5u8B9o2GzW6v5heL6ewmuriczRdXrwH27bd/MQe7nr4BSslLH6RZOTGCNyunIMLsGh6Wo5+eTuKR9/biH9Hl+8XVnRR0cXUDsBenX7/8GiMrjzmHwI2WMjiNSe5EVSeirmigYjJaZTRPeQSUH+SCsgsQgUUac40tEORyADVJ3YFBByLJTADbMAilApcPIlQQk6zM9xIBvdEGlmlWDAJWrCpiIUGqFDpQvom39o4dqKigH+KH4fWSrVacisMosp+ARqSvrQeVcLMVpvCzhsQoPMxKTisBDjjGnYo4z0W8zB31kC8JhrcHTcisBFve7rHJSeISm5w1hY5B2pZDWyV7l3iZQfuyx9aHQUGJBdX9G7ZQsNsjrfI9dDgF2CKFPmZlpWRotjAnK0GBt/Ybk6ppzgEmgSldWQg+uAHELmRKlP78OgbEoD0uIGFqb9wwaCCrPF5zCXMiDYQyzAhuSuzQbIj7dcpvPBIlghQnuykftoVnuVe7dVMvLSmxgGGIgETKk0D5sByCSzuo0DrWVWlThFh1ozhNK8o5bhjipu05sU/NOxt2a6bfShs0wRtBC5SyHde1ZR7vprNLRM5Y2LxoXaNRIgiOTESRz2m+GpONzHCWLXA53JiCqR5ak2Y8FmIvaS0ae6vQRmkwtEIWVU0PSg6RDRY6dB7rCJgD0PRdMZxNbGScW/R5l7bb7QXlkWDRkkaIBucFQ/rLVmzwM4yiLuLZkLEnzSLNga7H/I/ktEMXZ+C5f4/zmspq7ztQ/BvpKJb0LE1JWRdLCDem2atW7t3i+vjk5TGEBUxJDEe3ROlu5DAMPDveVNRaEbq04hM12CoBeUY1OE1HV70TfvUVVJ8BKo2vhwbfEqR6hHW7zXJ1oKqxb7mklVbbg7hrg+J2yGQcdSTssMaE1q44LmG3aH5Azs/JgTLu2vuI7OJMEKhF5G90v2Qwx06xMFT1VjiIOAaGPKd060/Ck543Vo9DfjS7U/KMdPwQKntq8suvo1CVP9+VO7DsgP4qVflh8iDPM7v+jI/rhVNIgB09ho/o0YeiXHbLvynKjTd+Nsr/yvEaIikoVKm0zXPo21IHUQEpN15TH95KZqetFZFLrQV12zZ49pGDMnKjvcOn1+w9x7GHPOqe1bWpbVJ1JM9RGv1MqkMcQct+tlNl2M4JzySBlkuRAZc+/zHpdZ7BwRTRchvIEs6E9Z9niM+kByPu8xlCY/3GJKHU0R6qEyYaYCLFUDVVoyGEll9eKg2Z73syeS4PSJUMBEEvCXR8zZGgiWKtfRgMaFz4uqk/2FTIWwcucceSoX7pthmRhQhast5cvKZeWbx07G8rbGLFvhGljItDKcPiFSLacNg8uRki49CDi7hMqP80bu9TgsGI7p0qVJyfnmkrJc0qr/nG6nv17ciV/CdjpUuyBZM8d7hmU/eAOQzqXJ9SPluHwKqEa3jDKWEDQiq2CLU4R+hj0PFVjfVRtX3layy/pyJN8Lkec+CYGtERpqJbI0mfePSd48dy4/Nf/lD9qjqnrFzLt++b9NrXAZKM1aOhseLfhIupbpu6/EhTXfOcqBmNVJbHaz1OYqKDwOd1ssF7ai5SVsMQS+JEwB64FON9ecnxirsUeE//tJdmg8FBskL1Zssa5rk4SSDaSQyoQvWIqjiSL5QJgy/IbpPBRjAo7kAAnAUlBC/xkZWe/kiCB+AkrSmixOZcCq7u/vEqH4aXam+6Tn0UHjbnPJQmdvJKM7XsdETg1FDzj+sSZgGeMJhLKQykMICiEvC2voJ3OD7qGa/0d5nYSDtyvIdv+TTK4Obrh97NaFpZI+wkpMhgnRv8/9bTDceem9s5B8PBYiSYiHNM98ooqlBLnAalrS2TtoCAUfGrhAZ91+HjRrTFHQt4Z8tj8kwV70dFc0qdI1DWD0aOs0aiPze7PrhMGoTzBgNiyTCFRJHqZIF3AZwKjHlP2gRRLLhvmeTIfGo6JX9qPPdrVU9pznbm5qWNcrxGN8+Ixvc8BGvuFC34IX7U8oMPZ6cP5Ltz4r8cE6s9RwrcXjbpkEaHxJfIThnUvrLnykHGw7lj3cWzK/fQRmGcpr72OK/ph3XaTbFjU1cLTmF2y/GhTxCtvmDuVzcUND0wvatV+342sFqoEX65hNEVL7TaRbxwS4S1ghVHt6SYorHzV0ClAh12bovitiDOWYcUArn2f62R4UlHrzoX0r9PlUDb+P9WSXsD/7tQibmVbSvABopOtN1HcbV+9PuZH7/ZhkmVvDj1Rz89TSaj8GcGoYZpBCk+nJw9mKlbVsIMUi4CJF9Upsvf2hgNo9NQb3N4T+TglJXCnwT2+iMOHIn6ENX/WuN3Phv5zYUosgx6Fw82w6HRw3yM9Z/pdpEHfkaweX3IHmQjk8kP/HEJU8pkLI+lJqTgoW1Th+5Jm+9Dvs3VrTApzR35ve7hQPVthh1B0/SJlqNgUHhjS7eEydqLhRrBQX880wwM/eShB23VHMLEUQmOzY0/Oh4FBNs8pD0n8Nrni39LcNuPQzseFFnv2dkPNkxGoILjYhQEz23V9f5mD6jcKoiiFXSvrMoolu1fJP7krFuJVJCenPUSsgKcnvXS0tj71SSsjEe67fRNv9+x5wqtCaYp2agfsPJDhDqI46mKAISGyUw+apfWY5mesZ9j19ygq6/82EZEjK/Usq+YOolpyVjuu9+IfYVtglL+TgFHdiddm6yg1WD6IDi2mU/G6tqIt/ppk7P1DSfjUm/yQ07jPdDSGDYYnL6diyWq2/6ojRSmSdADaK7Zuj3Rqi4xn/V8CHXotwZx0pOksU7g+q12CecTW7ObuvJqfEVpoye2vZf7Gaz7p+3p6FH6jvw41sU+ItMVjmH4uydWth0rLJkfKEGPKAcYXXOF+jnWAKeUxrkaiIBKD2UFJn8YHhlwqHaYpdUvwWiV4AuG/wCnZSaAkomQ4M+yCMeuFgZOmMwKHCu3+R55Qs4eoJUuJTdX8S0tvgIDlqn+YKF/oxL2iHWswIFRbMvWY8J4OIsupzcX8/euUbS60QHQl/4NUEsDBBQAAAAIAK6gm1DLNI8aZUsAAFIvAQANAAAAY2xpY2svY29yZS5weeV9a5Mbx5Hgd/6KXjA2CEggTEreu71Zj28paiQxVnyESNvhGDMaDaAx0ybQDXc3ZjhmcH/75auqsh4NYCR59+IOERIx6OqsV1ZWvrPa7pq2z8q2rZsHFf9R1d2uXPbmz6Yz37q77sG6bbbZsqn78mO/qRaZPJJftkVdXJUtt1rv62XfNJvONNrvVkVf5rdtsduZRlVftl6jttyVRf+An87yZbPdFb15WHXVqqz7al2Z96MWAA/+23bpx2/+/FX6Qde3VX2V93e70r66r6tlsyphHqZVvrwulx/yddOah/kGeyw2h166gSGt7/LdXX/d1F/nZX0jjcuPy3LXV01tZ/9sAf8ffPpNsXpTtMW27O3040bPN9Xyw4X5ebDZxcdquKOXVdfBchzv7A8d7PdF2zamCSzNtuh7eNk0+aHc7L7jX8vhVn9tqjpvGLg0uto0i8Ihxq7Z5YJmAw323XXQYle0XdmaBq8J/Bv6Ldmg28Fu4ijkKQx4u68Ujq+rdpt8toPfBl7r+rtNaZ4getndfP36x9Tv0A9gTE+4mHr+ou5/Kuor82zfV24NyuV1k/r9qoR5dXnRXnWpx9viQ5kD0hb7TZ931/BTfg3bNtgUTkvq2ZtiCYj+3QY24k9yyB/kW8al7DxrFn8FujKePHjw9g/fPH/98uWzV9/mLy/ePfvjs5/g8Uh+yi6f/fT92/ez2WykGr5NtHzqmmaX8ttX7jcG8eDbizc/XTx/9u7i2/yHix/f5K9ev3vx/ALBZGP3bDLSDV+8+uPr/7hQTb8td225LBCB/lS0NUzoLHt3XcJmbYHorbJ/HtdwVCawFF22krblCrt/AOua5dviblHi0t7m7nFeN321LMfL7Wpy9iCDT7XO4I+Za8I/4we3dkzINB4c6D9nn0Y4jtEZgcGvn6fZ+up81Jar0WSKhP78XbsvJzKuddH1eQmkYIxESwYxGo2QOmS3FRCsPSBP0S7gmMNcNxvYQFiCadZfw0ThnihXHdD1DEFki7usWOALT59suwzOOEGDlvVVl22qD2W2KLprXLLdpkQwM9Md/QvXy6zrVwBgtkYUAkRRP8PIvZ+bbqYGbpYZOxD4tKxTPJlXOS7E1HRc5jdFe/6qqdV84UyVbV1ssmvYzA1QBBg9jDwacdbtd4jqMzNo3DAFFrcfIbtt854CIuWfPueAqm9+vHh3MRJCOLaDnMH1tykAJUaPR1NoPJrM9niOxhOetYUGl3SP8GAZ4D6pWlhMOONj3dvEDBCwLHjRDa8t+31bP6C/5QbTa2hOtv7tgYF78mJPg+4nrn+HgE/tJvIluwVaVMnxGkNXZS5/TBG3TS/Ya1teVR3s3/l3cBuU7iThvPWLs+V1UdUZ7Cw+AV4CxlLUSxn7S+zvObecRAskIE1X7jlgdw/7MLY/EEa9QPjUza4B8rfYlFnfZMVqldG0DNnosqLLltfVZtWWNbQY+VCyAiBcAzZ6LwFeFgQe5sIz2sIRmLl3eeNLWItjw/yu2QO8IoAPY+r2C9tbEzYIR5keD5DHqjOrIMeGKKI/zLaoujL7aQ9c3ZY5CTfG0afPs0y2JHv06fMjBNeVPY6Je7IPbmHQsLwljt51MdITWeyRPcRRVn1XbtYILJjZLBubbors02cNCIkhdsgdQz+fPmeIg9z/ZGbPsrc4uOxT7xcPIQmJvccWtU/7dZbny03RdXkO37BFnh/o7l6N/f54s8wRXRT98npMnC+g9pT/zrvq7+b08akBot/1479Xu/EXzNbTK/a9iffixACv6psGeIwdMp/5sthsFsXyw9h8gTPffwRKg0+n2U2x2Zs+8SIAFAcyCKxlq14YwbyRVc+BpBLZp+bIC+nm0AKaLhtkkpZwLnpo/fXEEjtq/rvsa0W6kFzeMjNgWSD8+4Ftgn8FR87y1JkZYJf1wFNlX1MX02wczw/PUhmeuq8eQ3vmLn2mgw7FbbXZZIsSNmLb3MBvgLr/OnvisNR0PvExIGZz/OdAMJcfNuVNuTn/OkQOte9u13AuPIkHDwYbeJMFLPj3QJxErCj2V1sQ/fI9Shx5iYSiU28H9/lzBpAJBCZRsM8F3C0dcCt9W8CS8FrgtQ4ExQk39nLv2zu33XdVuVkxZaWWnjSGNFNRW8CXcgaDi9kBep8enSMi6zdoHoZg4lu0keXM/p6CxA/P+WW3DUhU9VidnPaLR8qw5ajC1PmgdiQUw/2/LIndH+MpZkTKmxa4tylgKFCfVv3ktuv76qZE2tqVf9uXcCNnjSwHri1dLMiL0Ut0OwFbulkhegOioEoAuFvmYGB+bgy0fkWdGXoTQCWcANaj64WdZdzsmDoQ7TI9L5sWjkXvRgA/3qlhSJ9wvVmOlr7gGnUoTX0o75DsbRVj4SEXbcUKlzpct1lVr8qP/LKTBXhX/4gHhnY1BWm9aeCgjwDNR9EBHRMHBDBnVZeXeESm+JZ/SDu6scfRvk0zmM65mRceWLpWMjl0Y5bz3O6ynMQHkm5W1C9VwGxXhuvmN3hHrpsN8EVAaHqkXkBrirq3m4ub0S3baoc7Vy73dHhxG0Fihg2BTYdtJvo0y7IX/SM8THDGN5s7XNiKODE+2o3jwfb1BjaP9xSE/8cV0QO4GEhBUSyX9LSB9Zrx+gQT2nfler9BtAD2YgkIt8PVCCYH826Z24L/oJFcWXXfNhu7IG5Oa7gt922JnNjyGkG3ZbHC4ayKvqCrh4838/5IGYF8thWieSejfGbHiGMCLIVxEnO3DIgjzPf2uoJulnD/ZyT4weWBJJrgnMF5uT6bLzdNV84zJJZl0a6a21r6AeEbVr+DURMDdnaWfTV7YhDuGfFkuG1zmE21qZCGo9YF5jKfZnNUM4jeh1iSbm6vlXkPbAD8ShsIHEKOCsW5OsGD/X+d7B/mA9I30X5ShMxpK+Rn2i3YhhbWiJ8aCCf099tkfyAuNy3OsbqCOZT5vv5Qw6oZLRc8gf7tZLfFR1ZewfrcVqv++qSZ/s/Z00TPomYgdY4CI1DO+M4Q9D8TAsc8Mh9kPmmVxZSZfg/+D2Pk1/h7shnerrSj3BL/JH7ZAXeUDs7q92WNalQ4p/jMo2aKrtEhBfECKPOqZDoAN4eGa8mDaB/ij2X1s+/kjb7ZEckwr1Zyqvc4ngEo+B51C3eK63VKo7CEZVECahE4oET3AuQtJRCQM7zHinZRAfICoRN6Ca/sUX2JNMF7o9j3DeqZgSTAnVyuq4+yX/QdaRm8R2PFlsgDLTUpGRiq/ThKA0R2LbvZZXNkIObYUW3I1TFIxEMniRjxtFWH33Gv3g1jhf2smpKZp2K9xuWBTaAtJJHx50xPyCIgeVZsbos7psLeShul6bbYwR7BiEk/hns0Jo2X3IUkPprGzOgOT4e4GHX2VXeoWq7gUmESwZtKXw36mAYzvqVMj4cXr6qv0WrCuxGcadrhujF/HwIDnYFk3HnjkNERTiCuHX6/Z/WilV6K3Q5uDH/FI0LJqwA/V9v9VvrjY0iNYM9q4hCzxdBhNh8ynWRjJn37FtcBsKep4X+MUl1GavHDUHZwqXYTwVmzA8RA/OsT1B60xZK52vURQIjKILy1bQWkHYnkizpjfdAt8GHdGXI9NXLw8NsRUHY7YETAzIlIVBPHNZV506JDn0dAsdBk1Lq3yH0zLH92RxdbFoanBfdZZQQxHtPamIy6bFtdXR8bFarWugbIaFesy/4O0GG3Q3apYQa+RRAeGkXcyBmvJCzQelNc4UKVNVEfRl63Rke3H3gIqzsv6jvmBGFZqpsKRtY4yf8IJO+C/NajHbxZxaZr4JgcA0PshyGiimHFQ1KhXhaJ4nFiLTtuGNKEUty7ggJuyy2v0+HN0RQhFwbL5NByj6M5QusJ/0rYoJXFWlEkAh6WLOY6JchhWB9QkmqMnGeInk88iftnInkYGFFQxVAlliTiNJMrQ6psWRpjFj28PbIyKGGYRUTGn5TgQB6rj4ICx9CFP8m5H55ems09y0jlv0fiuaQzhPCoqZkYckh4d58yMJwOwqeJfijLHV03W8LlTYEW5hOAOBWBN4FIFjmTERITIRoBuGfZV0AUCHzpgdR6e/T4OIzCntwVTzofVCWftD9qZ+bzy0ePHyOwR+/nc59RSMhOxESaGbF7BpFcUd+TeHj4hjZ7IFC5ly4by0ZO4QJoKlja6XEgZb+c2UuSKJFYYzxp9ZThWBIm8mvdwZgqEgwW5XVxUzWttzQkl50Z2buTC9RdkULNuuzZq7cvuHUnRqPBDVKbglyO5WQU0SU2oi5LlNKgSwSeAIRq6I44Tpo/qiKAIAmu8R20A+zrDW9aDdy0ZkB4XujAwtIkV/uWdFjM3iTgEKbCRbbb++Rdi5hEwJCUT+lnxfOQhAE0WPBjltzMC+FiLHIyk0IqcuC3UaNN3LPukk19aTQTyZUI1GMR7ESXI9wUShd9QlWXA3Gu+jx3Knu0E7lejAHS/sC8Mume3Y9W8g1+B1Eg+CUW04IGSroInviCQPAwYpGD5xHvEy5neHmH405fZOE6JO+DoFFEc8N5JuhY0IROaPCbhyvukVK/PkxpMPCYixRL9mMg7KQgVpiLGDGTt87l9RDoGalRzuZiupwPKFQsOKN9OTcYFgLUyg5ttsAV80FZ5CNVsnxPTBqJi9KFi0JZSCHxmHgKr0nysApCDUd0hY9Y4m6BAG8XKGXFK1Vs0c726XM4ik257vFAOn4leFcsdJfv9ZtwdyNtLRWbw1QZmT8U1C3zwzaflrQeO5QB/WUFJou1gLfIYy3LtkeDshyIrFsC999WDdPisiaLIEuRe2+/t/uOGKwaVdA4OhD/iGah3VzM9/5ILQ8ejsddZCBF97xBjklxS2pWII8XCDYQyIwx5hCTJLiq7Eq+sQDbG0SewR/hNpGGSRROXd/EW8wA9Jv0cw6oVSgDK/cwzUb4+2gKCDF5oPt65ilPHg9qT7qkfkQm7xtbFfk0S+I9Ty/PQJNZAC1qPjkb7Pw8AYP8dewRnfiL57+s/vKW7J2TVmtYPEA74mYK7fUALa4axOgeRUWxMCCr+UxDumqb/c7KpcSCoYZQ9LSenXRdXe2Rd98TufA0mwBoUWJfphfYUrSbbUjqXZTLgoGW2tCBKlI0mJQenKa+LdpVx94nbjqz7Js7x2wh9SHibnw7mHUMMdhTr3qOLTLOmXpDv/xizd4e5Keq9QFVZ1VURmCbP/ri0XxOPjBF5w0BVQDO36fVe5CxnxBcVkQ9An8hDUStOjN+MG1Rv941e6C/f9vDUvPQ8L6FcV6V+EgDEYMlbkKRnZFIgFYZWEuz8/PgbLMvxipXy3bOWK9Pnc+M3Iv6BK/ag+L/7iP9gMozG1OvIQs+CaYU9Rh0pScWMVL3mlv8tp1e9Cicoa/OhJkafdjK6jVlultUkZJVFcUeY98UUOaoWGHhX58Q+SQTCit0wvVJjToerl6lkFtM+xJErSy3MwsfeWdQUzalo2F4ndMbkYxGFEnw3Ds+RbVBJU90o/oH/qApUZiSeBrR8OPFiXjlQ2sUNw6XKmpxnxXbVh9JFlorXingOY1iRqTeX7paqQkNTUSvXVqCSC/dQFu3cukG/sIdU1QxS2mtpcbgpIHs0diAsrXywyK2CRHTVzMmlFbM4BrllOMWQebfAjsKF6nS3XZVvy94YMDDthG5vy1qdpVEERxWGu878UlAR11kzCPLK5wQVLrX2mKEN0ffNvUVtFlVHbDCbXGFnLBc6FYKkLvrDjvdwHd0q1AWVDyHTYv3OikFEmz/Mfz6bYhfg7s+sNsauyLRcwCx1kcJPX5iaJbYR4+8l30/3UPgLkes7Bu9D7hAZnE6awJnpU2oc6EFS8GNx+dd7gkJ/H5XfAqAu+gTT325QOksTTNmRq0Gk+ZNqkh3ZBLkzKknHT+GasiAP0gP9+g4PbJrNSxWoHT8I1u8iJSQEE1aPe/cIs1Yob8RuhB0dIbJh59OG7KTeJ2RdxBRobRV2QACHtVagP7giEcYhWHnHymHYPLRb2rm7AGA5IcwIGN9lnE1uCt75s6VsuW6QG1o6V86nhsK0UnUApL2DtsXGTv837J+uPy4Y0/4UvpTgKRn69mAtM0TEmO12+DJH0cH84i8iB8lM6a7OvhmoMYZaj6JaUais3P0oc8/fU57p/tzSgx2GozGBKNEUJRrYkTOksOKf4xgD+5Umsyc2k0UYRNwLKeB8UgkaSDvRRP5DUsE6U+PmjxX1gn08SaOjdTwCBRvdriAQ/ZMlIkMOoBJz7RaFJroP4OWObn75c5H3VMzcZNVuSPp4InWoJfI0eX5GJsoHNVvfHmeWa81L2qTX1JqanZDhR+9Hj6Sjp5U86i4pEBJ/kYkcJr1i4GeH+uecWX1PGAi/ibxcuI6KKxUYahjUWCF7upmqMAp7UoZ53JTFvV+x8F3rhvyjq3YrQTjfMr+ull5FjBSfWmm0fjKNhR02vSOLFQ9u0+UxnkFvqPDEvBiSxSPu7I0Uj/Gg0ojM5u5EgS19dvY0FjcZnaUTMKoGeDeeG72Pu4CbbFMx3hzYZygMcjM5d25MnqL9V2eWCgOOupQYM+ZsvMqiYLd80+AjcMu1tWmlLA+40eJnxdrb+wVO+zWxocyWG2cgnhbWJ2WBWX8aovQs1Z1d/GxwPs2o/CFs7MHHqLRHi/7jzPGmBRp77pSwniDbRtPcOzooK92j3cJdUJwItBbc6DDX9hRzKD/y+yJe2zsrbzEscU1xhvnUd/u62EXzszZYgNHBXytJ1uABUrs1iAg9hlygpS392ixRVLbsfJ0EEhfYvAPy2dIz9hwq3yq2fbjH4O0MRQ/r0T7j5A6n4/B6ZatXr2ZpiWathHHKEsfk7UUKY4iEtjsiqFy6IB+E2MLxcTAE3dIK3KWiPiowcGEAyIKzVQVbSmAi3eWnqLhILxXDAGluAJlQLAKr+66aA0ZRalTbbDjla2piA0vrJhlyx9giPDqpBPAePeqR4UbbicL9ohD7rqhwAXmh9ccU4BGf8CgSN1Ljmllt8MYlgWCvQMa64+JYtoA+ZigMB7pWZabzeyBR7Y/lHdMIcmNgX0o6DKpq7/tAfsa0iGKC4s4QRtnAAto26z2G+TX+2sGVmRXDV5MJD+xAwEewD+J6wjbhSRahiQBh4mtCeKw4iluK0twcKXQsgKoH2RRbk0wKcXTFbXnu6rWBL8RI9dxSAT1W6zwn85cg1es2gAEg/WDE9T561tibDnGwJxIpn989ur7/D8u/oyxNY8+mRDKz7NNUV898pvS9Q80FB/tAdRYByrqD8dXJcltqu0Mz8ClGch7eJUAx51f6c4T/QpvleyYOiHzlOlomj0C4fcPbx9NjhF/81QTI8XHsVXQcXOUTcK6eiYO93PyAGG6bNv5ig7kt2m/jJ9Kom8vCck4IHLoIJEwDUxJ7a0eDyvtJ25GSKbzpmb+WZi/FMFalUu4MuDcWNs5UjCr0kAGxljjCNft1egkLWNkIwO2vrgwQAd6wBAdxw2Qyl+0h0gSKiV9w5lp9u1S+CSxFqZirQKCMWXuSiKcLDg44DXzedob4jtoOkfGrWTFhImlx0ZVS/xa6YJiLTA80bOIqVizac85sVljnh+hlMLHpIAzw3wl9Wocyx9K+HCb6u/oC2KGO7pggnl42EiKlwXSyeQYAhlxMZ4cHjMLZQO3pehSciTiyVuT1C27PZuUWO+CbQMfBXvW5nM6ZHMbGOUZhkWzLY6NV6UJv/O5F+PPpVzWoOsFW1i9MKHOWPckZ8PaXtoGNdtGi77emb9BvYfHDA0rVfw1p1f9xhGYY7I9d//pc6bULurFmd6YKbSOEK69mW3wgt6NFV0BzmqV45wTe/ldhapMulr3SMPwpBtPI70wNUfIk0BtfgNGCU4wPjk6MXldtQ1Hjo+CIUvSHyaE/AcJ7EMzIBTvehXiBLwHhQfjW/eYzvA80LLkkn/QdKC3odElpui5yQysjF2Fsu72bXniOvyIXi8ScKmWb04qVGAoOjklteyyUwYUblnKW+feCes3V73NxUJqQ6WIyT1wjAhx9UbqoeujAa2TSlTlIkQA1fvjBOa7dds0zYf9zqinZOHIVcZfMWhGKYi0fzX5nSoHa9JdCl1bWAcSC2ZDMMhCRhcW+iudzZXXDS1bcVNUGxTdBkWuyHXnBDoTegT5zkACGKkn9jwGapHAzBta3IBjTCwpmg1kIYHCIjX315Kyz3WBg47QYbEYiiDFEctrDBuk5G8GiICN72t5wLc2R2jIT+RThOZ5hDyAiRTa4XIYjOVVVk8rIlngBBIEUk1M4itj8NRGU1zKSiTaOzjY5098mJgii0FSlBoH6pjlYYpFWbGWlJwn6u5C5a4yPSI3TpdsYgo/eBpCjk9XTiHMALNYZ69s4ezVXSuOALW98gcWXHHspmEwOH/UeO/ff9CWW/jHjdgNzA2YVZfjLzjfyhdffLjFb5MzNB7Vzd+Ks+yb//XkqyR/5wKlDXNe4TYX5ONGwZjFHdLX8iOm0BTP1NbxEKS6vG0yCibVWlRk0GmVlMz5dMZS6rpqu96ay40eqXBjIGcDdLP3vU09Axt+PpR3GDmoW7Slsclrbz0hhIa7dkv+VXpIpH1hBYk14RGdD22dRRA+NzQSEH9Qt0HXHnO2At75fXpwTAQKIwq1tKAn1kc3MX9o7ttf8UPiyboirwnrdqpo2qumFw3EolyjBogDM76efZXo4hYVE+QdQfOA1UXIyvkXs0pdFXhjy+WOAqalvOQ0vmKrkgvDpXxXwk2zTKZ0N63vJM45+RjSNSaOZMeUa0JUhLMiPzLMv7LYX6Ftyx2qTYm7RoaDtlyfzfc7uARW5eO+eQyznQ/LV1OHnefknXV59pWzH7HWwxl28PNQBAbUsuukaXJEjC+1wS9W8FFoqFYUP5SfcMGvixt9TEJcvC25s7WO6Xyot5wWClUUaH4Grkr77egoE8+6rPPK2RRUcV45/NCM8uWWPP9TMaFqDW3bWbolrajNwGIaT1U0ioPApnQJXvFtbjIJR95SPB3hBt1i74CNC5K26Q9JmXwXhj5T4e6YjSHaJm6ns1EEdeKruqwrOG6bmyBHHcSDNlmWaAU4C2CdMfk3Zlt4CMQbxWzSrMUw8MOvXDpY700KJrp0DM8Km6LGaxzf8M2vztxhYJYhld4quFBt46TlJsysFV5vig1kMnufC/BttQXeF71sjHTCW8SCCZ6gTh0cQwX11IUaughSMVHaPDrMZvqHXK5Rd7x6w8VLZKsQB6cRMVfYlK03HrjuILmiU2gp1X8hWdLEI5WYMk07wvM3eq6OLCXBsNRppJDQOzAqQifl8waNvCMS45w+B++NRMMA5UfXs+bQhAOj6SkElTxS3wB1lkknc0lhmkK74DZoRnLDVHW1LTbZszcv2N5YsBLBR4GXrCFZiSaSY3dswEPReSKyC8spQFI0WVfWe740DI9UkP1GxSFgx5wpTJCSYg9ogqjU2JAnJkZ0ERjja8VMoIktZr+vFYUvGRXbc8MHddbA7KtktbFxbwxAbYXxAPwusWeEtWz/4OS8D+Sgcv4CgLhqls3OpLz6Rnw99dp3ZoCJFcKR4h7QPKgzM82e5s8jocSHiJLAVaBHy5QNZoVwTDZrqAkkJRjWfBSar+RtF/TuO1BYjTvTE8nvk4kf2R2fS2CxFvtqQ0nA7NXkmYmc3YO5qeGEV0LacnF26AZTMbk0STpURcWp4MpLlrJCYnXiUFYb3uz36kd9a+OhF1RlTKDJ+85+KFBnZd1MPCeJIKDWhi46lYxSrginErnTzymeiUElXO3JQ+Te4OPkXlEvKRd19NW5R18Dab5UV4Peyjwte0HbOGSn9JpG+6ozXqpBEgZ56HNd1R+Iol0XeGL+sGtqa3uhBHepqFOUG6zl5nvEuDmbVAn52ENVlkN3FkabyuHzo8hgEH9u9saihacXnZQkNEy/7eJo2UPpL3ARy6L/p111w9/OMb9nWy28eC66bSQcNlTmhwua5nWjVmEo60mnK3luIse9qKfwJ40ibblL+NnJLTv6Hdkffu8bIBL5f90KDeqhKOOu7oI4D5CBXxiyX66EB/nGux2EEKPOh6CNhpRGv0YP5BivOiDLsvYrVKLQVFLt6vB94EOI0iRMtdbISIZWFmcwrahNaecnXaHD8UHrFJr12sZdm7ykLLyLYBkiOruKROElyucOuAu4vmJ1FGYdurqO9a+npeP7cK90fDSkXyMlH5+z42n5Hh3LyoefKOLz52bmGwY2C1eX0/jQvrjw80ZSQRVdmDkmen84p+KA4UHeI4w9kxi4WPXk9Gk+4RmYMCbTpQAokzAFP6H5GnqZmgQBtSu3M06SsEkkVnxAfygWKnjw0Vjo50to57xb7AA9JUdwqM/V8ZaDbULOzdH2RW7ncGmcc3X9APMxIk1XElvAKadZXjFNjORtXCOR/Kg3LIWT9zwCYzIfa0W3yzSkkxlURuHXWVqiAsdEe9HJU/si8cSUkR+LJvn+jYCYdYmxZnBfad9fcafzLPeikUHrmSgANIEdUASeTMdFjqDETtfwnzs7NkZsFCvwU1dHvKRTRd7sAhhaozxIHZU1gy1MMhqcB3NKnrQDy0GKml84eSPtMAFG9YIzUfo3WlUPZaZJpF+xtTiidClBFRSVNQXDFosN/JZjCQdyVndP5RTR32kPTGMAUeoRQ7w9/0ugvhvfOnELEHrMuFloI8sGM2sp65pR/kjyOzaisM+WcoMPTXLFmhK00x3pJyzFVb8VwXM+f0tSHtrllI9LTRVu2IUSJGDKIugfFTFuVaIjssSadtEYVLBv5+NibfNu/6KcMaqbw3G2mZ/6199Clj442zWnmqZbzDbiUh0Rt5C8zzwvNOcbZEKqJVHowOUC2HgD0iotNFb0Abg3l0/P3mPKBHY0ii9Fg8Amdy0boEXAiQYDA/gmNu3HnwgWp+Xhm0+81ooPZrPQv+0AMGZzUKeppvXEJmNTs9HHTqzgibS3xsNVHOX7Y9nghsoT3Sf7awZjH+W/s8v9e1efCHaHDq59Bsh7GBQFcVGysXABAsz0RWobZBIFlzD9ONxpRka0EKszndcUb8GjQDhKRFWCELsz1WNDEFtyEjkKx/Nv6IyGSckRVul4FJTwFuT+c73vyanTmgnbXUvKJDx6RyENZ5i8Oy1RZpYF6Y3oKgXCVrZ2iqpa0qEP84/GvmnXRa4QmbPP+w19AIhvkbgvk+wbnu/NKGfZ27KMBDhJsuFbYtN8AgXQ3nLyKsDiN1QlMvuaQl1pX7h8JFOGkG7oOOesK/C6FFPvrsGKT+ReTC5i631LKl/n2INOYzdNtVKuYw+zRYtxzpGcI6aJN3/+yueOE7Utx4diQQ8U0BwrK4Wpt5NOkmEL95iShge7lOZUikgZwqQbRdlSfbnH57byYWzqbLoZec6ichwbj9VVQH5h8ieNLstzvFTy3De66mRY2Q9N88FKz98ERfOE7+C01JhVWOf6wMYKkLoakEEhpQG8JpHoU9bM31Y21VOX/W1fkVoCC7MpQHXTqFAjv84e8+EDtd/UvKL4ougH/Nigo5mnwlHgjdmShTpylU8ZRPGj/XnZ5IQm2VRLwfDwlhqkP869LvX0oUuKgQmpieCivEk+Ze3NZE5u7f808G5t/Uvm7c0cEO/ObR2uB3pEU9ALJUkbPR0FAZc+NAq3X8Dtuu+yktOYD7QkgtXtF8CJk4vEGfZ/fsn6Mfz/+zkZlpYYNIdOJU362nloi6RZIUcy6ZPbPy4cPJNEi48fY4iVWa4BeJTpXDh+Mxe3QC77Wbenai2/kQQJA9AWd5RbAUg4Kse5/aajb8k37M75qCNJE8cXr78jwW6a/Ud5t2jgIqFyku1+1ye8NamOJ1KAc1fZMkZJ3ycx0atf5jeo6mQ+90FqVzPK641ixhPBSDh4WpOS/snZlTEx0BevU3Wn1AgBAJafxgBs+jK7ePPizUV6kK5GKJzruNzs2D1Pn3K35AffT26JN+un8fN0Ihf8+Esr60IlVuNFoXj/I9t1wtonx0LOTXVTPw5Y5amhZuz5K06ridcdYTLXBd1CbYl11Sit8VwR2zm6nt2UPP34ZD1EJTqtQvkRpfUKBWWgBv31Hr200WRipDDiGjKOLUyTuoeSyFgmgsebM9slWkrcJRlmmnW4II5BQrpLfZKPX4I9fkihnxSxWGwX1dUeyJJkc6doxLakheQwSqaAGzR1JUSIh+p+eDrh0kR4ach8ns6nmt2+bepHZOEugkyBapKlKFtWFdD8lqqqLcr+tpRYsf42fks6U1gVIi0RpGR071GkjekLUUL2zS5X/zTiYLJBqqiPntWJ5RQMZS2lkUeT5rifbaqCcyRZDWZVz1PRgsJ9VHXCicrWOmP/FOWroqsPKtVezx4r1ZIcC6iG12LTADo7rxRWdJFEt6aIVpGyn0ts7DMBYJpLNgP/dW1cYmejVdXtsL4mwaK73bTR1c8k16yxiPy6Xg5DoNJ1q2oqvtnlVUe2wf8v/CXMKMSAd2aPOZvzjC5EJ5KXsYVVudCLy5gGbI3DxoVZOlu81n+zr1BqFpgttiKZ0Ui3r6nnOUqV5qdnIkfPTRBoVFGBx0Su/hKeoMpPxV60RmjfVZvm6ow53BAAe1k96jgVPrqLu3ogzWA5HBdtwBphqhlISUPougzT27dsoObh098MYWj0ceax4IOMVO1SAJqj2/WSjdEz/iWqh6xWucrUdqasBBnevxak2XDE/fmcU8YpjXbqwyAVPoT5WiQ1oHeuzWH0D+2ZWRVRYdLteE3BtR3fFb7u5eC4jNbYyry2PoAenKkkdBDUi3Uify9WDXJLRMYHGdtBWIlpyEn3kJ+Sp5/hv6WHKqwwVpUVOp+8uVK+wEx03Z4CT0y0lMg6zBkVRxSjGtMqXSP4ZxQ/8OtBJ72R1GMhYKFNiqhUogRA8BOf/jinv5zJsLACK2sptQAatUaXr9+8e/H61dv3I2Uh849PYNsKkDish8BbGf7qllM/UUyHYg5mJ/l0OY7nYXwRmPh2Fe4v6FS1pc18yFe/nwTblDTwctKg4zJikZzN0BnJRR5E8QYmf78YqdV1ExJFv3Ivqpo1ELHfIF3EAM4qCCHn8seSoTvLLqhWaSL+xyQ69A3WC5P0aWWCdIDPz6jULefO9udr6xTIF5iIrjvAadVRk5utMZvLmAa4AMHnA6VFWlNpVz0DMT23+3rJCWFU3biHGadpUFwBZooEZCpXzvCEEVa2R62ztFkvRn9Zj7BTorseJaAmnNlz1oFw1Y+x7TR7Orl8EqRxU039B3wI4RF/8R8GZw4DVPxf/Obu7HLaOfnDbxQcUXTH93/xmwdnluKvvV+CeXIti3M5zP5DVT39XJ3rU13iMIKdtPxswOBgTMPUUwZ7Zlz4eqYq047Vxg8673c28JtAcXdzW0dYJ7EMnHIkK8o5Z4jxU6oEKSQ0bPZlsU3jxBfmCQa1kDVmPJm1nJlg9Jc6dOfjk5N26LvxgwM82u+2m1oYz0D52dfY+ml7j8RXw/++zC5V+/fhDL3gaL0yymfHrY+3339Cv6f0dvc6V03oLkChkiBqSWUim/Fvs/G8ayy+DbjW7Cr03DFrtmzg9aWJHuJn/sK58dziwB0CBOkoRtlo9tcGJF8GMtGZbVKdDJyGnwTJjceHDJeEpqvGLZNaOnU23Hb37BAy6D8X5Su4TFGn93oZgvAXhbn+LBjkDFNmg5zvgruiNT6YxSDAZs6vfGzVjGSbzOjsKSxQ+WHSOAMTQRsadTc5MP1U9I8FOnO6o3y/WwFFlHUA6N3knu90JVx0KxCkc/9tWTQLYHDtTlk1tU5GytbLpaB1A/RGdiikOhS4pd/m3KvJiyvAITaJK65xzYlXyf2ZSAwtkHhVxi6TbCzn+N+eSHxcuzRWRqNuDdtaR+vJVCpl8aGHb+kMY2LoCPeHZX/f9qkXxK/FBjcwOh4FXLY8ISYs8UjHXaYKvFmhwi7fNBrO+egtORCyZxaLTMxHwn2rxIHQU5zdKYdQTGchowT/mzsS2hnR+N1YI+DRa25zLuv4hrsLSfR9aBOfKkS9vjHD5394AuEGisNodLpOYWjoWP0CVoa1ef8QTsadol+NkXH8KZn7eX021bbqz3/7L4GvKabkUcohm8fCZEFoCb0o/AbT3mLL0mS7soA2DcphTsF1MMWFfwQD7tp7hiUiDIfvE2sJazeBymrGY/uGTHkSglQjmkTck49QpzBPDrU8tknyFJnqez+bhyLMC99fEopyfxj9pQIvVfqNx/BfiiM/0IBwhhyADjQygWEHmrDENU+iwelsfHhMaGQntZYhntSWxxo1TWFGrvz274MeWloewJBUJqZYLA65YKShV22xuw4M3KQqd40rIPniDp7KpWmnZliKZJF4lx/KaveiNj60L8+zby/e/HTx/Nm7i2/zHy5+fJO/ev3uxfOL6L1wXrTOFpD2jjo2in/MCiXHl55bjDkGGU/GGyN02HpBSepCjo+c/kwjDzKnfrL7e8sMXi4I2oUWQ49XsfORzZs2XFcGx2NyU2KuQI3l+CyRHsKtdscl0MYj5jq60Ql7s9qMmUEP90EO+r2Or+iQjtH31OkVC9B/F3aqMailOCmsR8QFm1Ukqa26Bz9/f14+xcdbDtT51u0SXCjuvYqPLLY5K2/PTcoBtQQUdRL4VHqnBV075aSQz6erbTVWsKfJUxVslJR2EG9OPl+s4OVp5OzRwfeQm0TCqVSvfBRifo9twSaUUS9CqNH3AGFfc/YSjBIyNerIXvTpczb+9HlyuCTLqBvhgDdlzU6r2T+dZ0/Zf3Q0UmqabbEbG8dUmfGh6iz8l/2TlsClpYlk8laHHP/SqCs4YuwmZG0LY00ElLjNavSWLBm3xYC0kG+Lu0WZSw0Tc5vlsHnV0uSoU1vvWzWGFYc2lm+m5mtfRFcQfMZ46txBXgLqVcYnJPIHeZZt8bk2xTmvkCDcjBKeuth9sfAZVw7Obe6qcUqGuUxSvm63AEGcLaQXet0P5PetjTzNHElms0evHwIcmnFZqC7DifRe8tUDH4sLfpwOm/HJiUwenwQsrnFrLcV6av89pmljZlb2+erwGs3TezD3DN2YkUW+HwQmRXl1tbEB0/fhMSXN4vdfJjKL+74VduOMflZ8LMQ7RAoAUICZkIJVs9zbI3IMQ8hnhh2CGa5DFCoY4PvdoKOy+Oz58TGon5q7+r9wLgn3sTqAOn+JwXiV3gg34CKBuS17l8ZepyTiSSZN+b3KZ0PpaaxfktsBSTnExT0TMOyobX8SzSgu2n0DF+914NTBl2nueyXxj55Nmmk6y2aoccO+Du6P59li/Q8SmV5s8pXh/CxDWVM8MdV3YAg8B9LnLtQ9hs4BgVtChM6hLwQudAgzWODglS++wFwmvJvqmj3oSyDvBFprn+lMxrik7Kj9wNL4GoB7WmDTILFY5+G+8PaOFnmwZB+f6AgJExDOs7d/+Ob565cvn7369m3+8uLdsz8++8nnvJNu1EdARZBYR5d6Kf7Rf4mT35/znOwjqfkZHUevGEvgzIVUrfHqzIpDJNrEbYqsdE1wlzkrLhWpkZgLRepfPObbzSgS6k4wSgkQlRxPrCbGA3FieXcWDqQk+oCWheMrftrXfbU9lMESP6OXmukhes0bg47OmjzH6SotiATlTmS3xM/PsbiSzsFQhyNvqZeMXmEAQQ8aNu+nnDFjO+WtpJbRLP6wntFHWgEtxR6jzB7IlK/QQTt1qXHEAW6w8+3ULOtaRUyGr1MaACy6d2f9MD22i+FSKDFc3BZMqkCYO5ZzmYZ2iM4UDXBXjRqGydhhoeiwWpvPxm66hTEWE4axuevXJH8nKtgUD2SpLhaGNWAcFzSx2ZwLm7rEOIzxL3cSvLHw3ChpXXg3toVKxxeXawoLNf07F5Uix+9AMySPxKL86HH1aJo9evy4qnf7Hr7KHp9/9bX/Ghd/qcbUbrg4xG+/igcyCxAzBixaEaPB4H8ws83BvgTzvuR2x7JF2MeWwSOMOmPCrDleqnTIGEyCOTK/A6E05mPRzhQcbsstXC9Bqnb7B87ZXinjMMNts1npGyV10YRXvveK8AUc+syTjG/w9O0VS2l+CSA9ARO0Ps5N1dHh4JMQ2lgPeBhA/Is/jKE7GC8Ddr3IbyWuzYwWa1Gl9B2Gsquf7A5FNN/S4uOq4AvSfPFDm9uUYuPpSvWynRZEkG2JvkC+Yp99pdZPa4UsTYpU+FpfIHwGkjjvZgn2jHMCW+WktOQryIHzF/ShLYqHNJ2jtvqm2QA9xUAFysVeqIvlBeWEBAku4mO3q+Hs26jDqOogPQK/JI6OB97x52gUScILjN3EKCnyxAtMJ2GMlvPrDDknyW8rN2O3K5beHcAKTNNFsLpkXsZT59TvWFQte5z9D/hvW3wc08vb1eWT9xNO37alvbPw/Jm0IP/62x5v/TSEkbbmIcu95QISgTNAwiZu+k6uIL44CQaKVh9oPxD6nrDemHiylPlG5hiacLCD/zfsFqg8UdztgZmcImyQ8rZtelLMG0UCdhG1kmcKnch6im2PgZxqAPjC5dnT91P+9vQszoltWp+kaydVR8AyDHiOJS+Ig9ZGZg7PI/13AGRqzDG+NlxD8pK4hCgWL5k/FD8niuNjkXg63bjh0inFldHqBnCsM5gJc8gUaElE6IS56VASm4eyMlLddJCfjgpC2NmYoq8u00u6W5NbMU7+9DDZo7CBghCUDVvx/cDMldtdfxcAIt5+LLnqy6KWG7jWpgWXcgJrhJhik5NZEskGjAgpCd56TQ4oahTymDMfnYY05RzMAnI6HNV5eMYu38e0isx/o5cVR6qn8u0/zL4re8x8gcSAzl+jxD4hEQmi9KUjCrrDmCglCdqlX8AAEf5RGt9vS0kkQxc7J5a6aZbOFqXg4CSdHpkUz6aGCmc54iMQFHYw5WdURNJQ2K6EuobUYghbHmYvMX88ltfzwmtJ9GTBG4Z2W5r0kpTmM9vvolPFxU+7DLVBm/SpwiQqt037IazbPYx4wECYdDhY5kB2xlDTZnNT+gylf4Xp7ZUTnauzeW7BR2+cjuwAL+eUqsjseNl23OC9TMnDZ09gHTzO4YmSd2y9LjNi/tlnPF94OjfYU8mfrPYdNZ/ljtws4d8p4aeVGhQor3wE7usCcyIo66SUOqCgYqwyTZm0LBopSJSv1FejdNld2U/tQUJCrEmqyVAeJO4SAXz+xXzO58CdJmUJ9rrBS8QQZT25fW8j+1xU8zCmDuLX6IuR9ZggtwNkGLxXhxEtOGCvbZKp25LLKVHotaMnLvWtS/xH2uAigEQoENZxiu5OUyA2OMMBLLnFbapdqvYV7tgjk0ak84+9RblI3uACpOlyKb8OSThwbJOnz/aafErnO/nEnfmBNwOjXcKj328a2fBSTv74SZBBWW+rsRYaETVkcmUoi1lh9efUuxzxw3FDSamR1pmkRe5+KFvZQeJ3Ewx6mN55r6VppnUBFJW3hzTDop3BAZ3Gjkr3PFFcTdNWV1T+XLW214yiMd+XXtEH3cmgusTAmUSMCaq9H/VULNijeAvmGpjfxszLIONuqr/7LgAPVcV0k3iXmJreJOzgAjS1z1Uo3Qqn+IRd6THxYW66KXMEPCws6SUaeHns5hy8+XNWadUkVwmTRBY1XR8UR40Mv84+quDYkDu6EYvelP+T2oTGm+UHFlSmdvH1RdWgxs7cLdi5xHCvGpP3KCwNybV1bYEhhmMzrOjxY8kEKpVgM9lckXTX6JKWKtfRQ4P/GQ2JO8nYa0UC3fF+lhFeNdqYoIAon5AB7DhR3YGyEIZao3XL7T2csAH9c5hU3lCoITHjFUpnKs/Ho0+fH82sF2F0eCdxDFfi/nH6CBP9kiAmFuQJqet1JRhxAjRhQu42D5NdmzrW2h+QFfj8JicwuG+edUUpfU3vsaBVF2/qOCKOsozyGQh6OYkOSH0xlBGedwHvH3EbJH+8sXYe1E6DnLiIHXu0U2DDvkAeNyi+lSpNkGF6tWugSc5u63Vh8ic8ajAvTjbluQZaJSn0rhIhReXU0nlEnHOKVFgxL9mCK+yw4vZAL8SJTi4PjWuStbXqZaHMNWXVUmghFRLjGFX7ukRPW5uB/QrI9+mzKiy9WoUHA0+QnVyISDYDj5QHjBDeJWOiXTZ56cugSpFPnae2RSg8RznUNd6p+kcZa9FnYS2k4Qy4cZ1BJTnVXEQGNR6mvWT4JfuOv2KK8pjtIpZxkt6NS1NXE97QLhEa5OF8bxxut8Ss2caWRbcJ/LUpbBAjHx2vEJa+ZXCVzRbR0eoL49DcUe0f5wrZGf8Z67+pTfzVdluuKpBZN841QMpRcB1fd6erollSKmDhNHimlADFVEjYmELPASpJdvuZK4GHNACjFg0P56mXh42zUqtWNiFc/nFgXLTB0ZbJ2a6SXK7dYvVbwv7IBv1/zNYzsf2FG3/FhdL+7992Guj9Np0X/798y0/mSBIV4DvksMcBU30aO2Cg0a0x9oBGSSCfs8MVmuqGrnKzx0vblKUa352euPJt2WLRAOu263xqlQMvu+wyMqBwowNjQbYrMHRCktoHAQYPGLfR3r7ElJ6a3TGpG3p/XIThRkdqBD65k2KLPZ0zSkjHd9T2XjyCdPMrswjvPH8myyr4swy4AjPhczt1zgnl8QT8SPoncMh/Jx3NsM5bsN3a1cxGeLSzKNpXBmD0CK6fn3NOSLVBAK0fhMBPxDHyk0OCqn7lhHDGA6ZZ8xnmIJz8gmqQ8L2Ek+IJ5/xGMqdMfsYCzSTBiaxS7E4SeVAKPSEtjhCRN8Ybzq913BLdsK5y5GyvyIgRRm4b4+3FyT+5eC7n7WRW3s/d+Zcumb3zL2gYJT2trVJcso5ZzDlScs+vyksRLl11VTOBcGypyfTQ6QpBNlakonxn5A274Wpwa5Rcq78jA0st3iIsWwezoKz0qtMFMNU2urfQxRd9+YVjDPHODzOjCiPAZYRd5g6TOWa4LovpyaO4hrSgIZrW92gWSSWGyFh74LB5kPgtSxc4uuB8rK5aFCEPMueJ/J44DlNOBGGKy+imoPDbztS1oSgbFZ6bKkoT1IJbu+0IokbE5drFWKnAGusBzalzvDfFg8gvCiSW8HXWbKu+913ayeq4MHXUSe2XXGw/5yEFRlkDucmj6MokUbmvgfgq439Q1Hca39QkXLRMEXjlu400Jhvlz2aRMo0tqKLb0s2gpXtJdgHP5vN1rdMIpaGwh8icE4vbomYq7Ts18KPnXBWwer9dYN5EryJhw8Oyhb9gJE/n8yEPCjUMPjT9HrkbU/0XlS1sDuKB+AWs1skTWZsaMdzxWHKUix6SjpHrSQohDtT7pPjUFiu4CwWjdybeethgNRMLaSeDpXjLjisChlks/azGKsORF3Qmvre9QUkLWhJINzWycgfKeNlcknJBGPQjPy4KCHGZhzlAdxiWKwpD56X7UAHf4Z90k8XpTDJqinc4JcJlg8Vg3k3G4XTvck6kfDuaRX3tL7q39OxlXCHxCkpG+7MgHV1j3attXh2zF/UN7abNaATAgzxzmUnynazVlpxDcNyJlbHX2pFM6NkFuuqk+2KnIfIVXWVwb12zEr9WteosGPL4MbOS48S5YU0qIsDCrsLSAcTrUK0nOtDoIeFOmuvcpMtgU82+7tgCtD0tWXz2nH/NkFUo+j0X3FKXsRdRKITdZE5X81LBD0gcmo3Cc3ExJtToevw/emtMTXQk/h5ojAugrG0t+cixqHN21+yRcl+T6I3krbpqnY/BCrCg6CoTKGmYdOYxkNgYe9DIjvMe2ZUVqxLEAiLo4Cdzz8YJiTl64aRczHWiZmg6gNHLy+YbeW02t2AkfLgCOMhFLG1BKvVQ8ePsc0o8vsnk2MlXP4GgsaFJ9gdaOd/+rZYUzzY6n+qZ2LbKTkIQ6eI4N+wRbe0Y/2ejQzzr3LdyRfFlBFhza+q0MR9HpU73dIRuS1bce8G+D3WFuFSpZ9LODhZDM/IUMXiwG7i+TVf1CdGr1v4G1J5uPK9dOuDRvPk0WCmDh+Tlyl8DXe6BLNKy0wy59jzdOEOJUYCYQF/vqd5JTFGc2lhJdMT7cx6VBmXHRUFgjEKVr8EwbLBmMkKTER1HQF/8hz7CY5IN7wdNHZCFEEVGrIUa/e7T5+zT599bYx9jfk5CQJ7DNzwxeT51x0dw9N+xYiNg8Z3t6noPDEKO8T2IZjmXq/N7DXNq4huZeUOZH7ySALHhiZaBNKUuoykRfpMx0pj4zcr6l/1BG5qdZ5DGUSCFMzKnRMUOH0z/oRuHxNE7QagY8frUXR6MVE5BI1sKVVAdx87sfFQwDUwa0Jdw88xms2ipzDQ8VZGchROTuejytCx7LPcbmxDTE9c85ZV2/bpqdCTiFbzfxoUb0Pgu4txYn95Uii39/GAByKh1EpnoBgchsWciwhKV523jp9rkldMJN12vyLtok1XdAUoLXKWcozRb7i1DyyjjFyqu1WFWC2RFgxinDAR6kf7I0QCQM22KctqeAAm9D9CDY7/zUCYYVezrj/MOV1TNPIxXUCgnLnzkN7CvmVslGrZBW27b7K+u3e3aUcnuoHa9r6wwtZK0j8iczhLLwnNzz2CeEwvIhKva65T6G6BJJ97B/kH+XXSQaSUDa2tStBk963vk8UvlNB2MlP1AqaProksHmo/Y8VWcTz99nlkK7mn5/o3hDMHQBdIFVJGtq48wON7K32dPZ/7FVaf9GiNdsscGDEZTkqQ+thsw/miYPUfb6GIhRz4JncAGSauUA6NaalC+zSwXJnEs4TCUjzSOw+E0pefn2ZPBWQQde10OTtp2/1G6zh5nT4dmG57WcOzj4JaZZF9mi6bZjL1t0AnhjWvi/Y8367D5bnFHndxxm6tqKfXqTdXtgEKi3wHmNOhAFDhQUtmpUdDHDF3ZrmgMxrPLOnRfc/V6Qv7bQlUoYaFPHI05Y6xoH1EQBNqyrq5QmEWtIKKrdY67LbTTXOBf91ppV1zce6CMjeJ2Hoq+zMbOsvLMhGqY8oJkPCZYNTqqzZLk/jjrk7wMeVfd9vMFA/Ruy/EvggHh5h++aKRXm+1H3giR0eYytnhIOCTX1HkWpnVMgZXfgqxB6/1mk5+Myd4N678VrVFq8vfxJ/T60kybT4dcnJ8IYzZ0M9qgVJgg3zgSwuRsUdDHuVMqnzNve+TCN+7IzG6Ei5lgx0V4OoAY+hWV+kW9DYRL9LuovAuzRpItWnqpdacJQoxsYtPNRP1GHBi3ja+qEwydaplUjegB7jToVo0zETp8gydiNBpODHETnlHNBB4wgqowBG8LQ77Rn7oKFR6QUBx44pDYSdbrQZtzE7NI5fkM+OjI453DH/dXKEtKKhxyjO7GIVofOHU+6+6Ydu+NZBVzD0yCxmhqod+zxYGlsPNgCOUJBMSuaLKysxlhFNdzerLMwdlr+BIayto4Lz2PyqrJKRXU/RGBPL4wP29x3ALF5Elba7yXXdDzpRWH0FXR1z9pKjkNkqmGqaFTx9IXI6PaMwfcli4Dn27C/Bx4k2GJv+ytJaRaY6oKk0bUVaYstkRPMTauCsIMPMd8m32ReRJjHN2LPp/fTHNuOMScrDDnTv9Ljjf0V0J5FdV0GmW/MclxUak21uy/Be/cL6Suib35nNfWa+Ng0KL9nUOhrQ1bDF5RNU+mhwSCnbTRk4Hz/65Lsn1Yq5IxanFkB7YWc8ozkD3ZbVhnSrI1Jo0x0Nj8lB0Fhtu3+yVlaiNQrpzprWEfQuN8aG93xitdsHTw7ChLJ1AIjH/Z3FlNeWfD7AnWjPny4RKpnoGYkXGKbDK+La6XbNVSZuODg9PWL1ZX9hXqrlCbAPgIhJndQu8AlUDu8FLL6LUzxkK9dMijJ0x1iQUcHJ9vKc7UAp5scKSPv8p69HDrgByRSPNE3iFkmtXWQmuApighSeeU6pbhAjKuKeXAbt+zH4DfCaEntbSpoQa2SzxvSEe8LHZVb/yB1Fxg8deVWErycGK+5Zx6Q9WESXbKr56QXphDUNDpQk/Rr2oMklxOcz5ow6cWhkL4qzA0CqlRSF67ZheUZl1hLJKCW7g4hiDxluhRS0mmM3yda7E5hyeUOJdSaw0bBe4XAwcWFW3QpmeHVq8zBGLcHPgWCIkL3QbW8YpSeEjm4qEpBUl1XaregvQUGNsf+ikNgXJppAzi48EuKgr+6eBeuGb3lvYDedilyILVSw3nDraY4LInd+J1O4SIVrTn5EoFFVlCBsGfd7WtUH9OMeOsyxyo74x3HpV1J3M4JwsWzR7S5kUFF1N75/x70lAG3J2afd2fqf1j9wIX21fVy5bDjIqanP6ugizDHBZM0gnuHNA8bzVd0mrvbDfH7hD+uGvRkJ7dnnymOIWhR7yPwbK0ndIQkvPAri3X1UeuqrymRMrHLkr+iNrreJn0kOQEtaRljROlpPE1622dcE/gN38V3wTNV4QuAEzxwl8TNDxRbFnIa/jEVJXzB+FoTejNIIcpHgMgbvhjjIuBq0PCDyORDTpdKZrWaXndVOja7oNV7EX41kAWaFO0yyl20LKMLUl5MJLno2lmnlOJYvOHhWNZ3tCPXu33lKfN7g/Ws15LSnKxQQc4L19M4mdeaSQycUpexvEo51IWk5m78j1TngefVudQB54kG2ta/Mb8l4fxM+nrXDf1WyTQl11Fwl/91xxKc/1h+SNq5BUoVrrf79Cx2NeF5XxlDviEuDNxxB1f4Jz7qtL0AvovONvAUGVPNU68yGK89cEH7hq+00c0p3g+6vm5yxs05PUhs5Bv/mMPkvsjUhDo2YXaSffalJaKFdbslAoCOse34IP3iVUQF6RvXr/+MX4IveJ7yY2LNy31ilKB4+dh9hwpoqYNguzwK6H3Xl2RaKOnmz/EOeNwm8Y0Pa8Xdf8TegSOt1V9/iSy+x1DFAvOIcuTwDNJOQ+Zr36DmNwjEY1+DE7oUKl0fQ9m5961mGgoF4FpKH8mGlrnIvWX3ra3RY0uy+Rkyq6c/X6tskUIp6e3LodxLfZXeX7QNp00VIaBwEY/outT2PdHaWuukEyrMtYnyB5Zja0njOM59y+gcRk4DsM675I7MQDsZvGokp268fmk7YTBfE/w5CXLpFHEQ23FFBKxBlYoPQ51gdjf3M04TN+j8f3AlwyDWjUlv4zCAWvM9RBlSVPL5ujDcIjXsOU+NbJBvjnEs0XppCS2IyOVEp9L8jdD2WkwuX74iyuJaATkX324MkIYKyPmyWN1HLp2cmUmTdgzraNWPGJcxTDynlXPRDLw+CfjIm7Li+u0SSaUGq8yDq8KEQSuQ6y5h6rkdoxNEqlrVd6BI3a0EItf4WtG7upvgXyO4p2VWWHnJzA2bJVaXhO9Hf3biC+i5QZTt6KFefSbkZRf+028XTb1C70vizKQqxfT40xlO2R4bBIbOxDT7Gk6NyUn1znnf00J43RT5Jiw1bDZw99im6XK5rCh1xPl5MxHl6bktsmmdqr8ZbY5MmpuNjxsH5NdDQsPeOqgp7b9lHUg9E0PV4+AmvmpblVWDTr/fk+BeOKPAiNFxx/Ku/NNsV2siuzjWfYY82F/xJRdE7z9OWMB1Y42sZC0Cx5UOQQ+cABx+fS9E8MeoxiWgxgG7I/ne2rmgXlD9YEOQoqDzoiODK1DRCkQ+LClDT9i2GGW2QQEaBzw3kgkLDExRairbLdoowl8kUfBvkFbopKOLRlmA47eDJi4yWyQoVmUm5JHQapmNuxgWchZ9m21wlCUmMqMKFdvRkpXjF4tqVaD1S06k4hVwf1v63gXB2vH7hwcdpFcYHsTne4EywkiAB0+ed2OVmXXj85UoIf/mJ0NzxQ7GjRoFn+Vx+7B59h4m+Y+iqV44o/40LpFdnxAgq1xr9FD/VZIVFxTCrsbxSNL8hm8WrNdsxvLEkwJ4ScJ4DnZ+bCLT5/5u91mbnAfzvIYhytVX3HfpWiKtctOZTznelhTtkKylktVrjgOd+DyiMZ4sFtWodl+I5iBt0XyTrjP0I4OKFIGnDC0eFj8yuWIexihrwF/9a+QQ3sVFBE51QnBYE+qqkTgo1XUdzmrxVF0ZzOKzzcSL8s1CnBQ48ADnmDeTAkQvU6MJ5rybcWo2P2GLLG2fbybiVFdnuECXiKKvg9haYEwFk0HRJ72hsIvsk+ffU9nLyYl7XHsVV6hTKR6gez+Td5HO3LwUrJJRyNogbZOXQOi3nCqDrgflW8GezF4goMdirKR+wfMajCcS1u44oe8AHUnCZWNyd2JfxuPMmeYOSxU2KEhFVUbl4anQqtMhE6Ehm4iwz3TIpq9SY5rhBMjZwM1qGFxc2qcXTCl64p9XSgKfch3UQ1Y6SytMyV6x0wl/H34ZZKEEttpPoe8+81+6rQL2pdwHKvUMGsdbIv+LfayDzWwuvVUjGpkCUuVZjI6RzEHA1Z4NbojgOE9kujfdu2v6Sl9D26qFxSVGELdYclxoF22PNWBMKqBeYszzGQUwE9dldHrSZ07va8R39ioPBz3YU0OuDifHYBs2ow8hKM2/mtC7eD0X376/H74pEED+J95TPV8ECK97uqx/5vZMerpGKc9xvbm5gqvTAaKXmwTcWO7mXAhodNj+FTRhyJSPWbNvlW+HdkWszRwWOrHbMHZ7xWk29J60mAoGKqvMOcX67Ik3QXpskwKPRUXocBUZkAUvaW8S/Dc+2labm1Cd0pKo+0zphBL0SWjB3+OUtmrP6rzcx8oQ8olRlneVZZNFvLpmcHwtEKLZ8ctEwYm1cZTyslvznKbxgMvRAcNmTDFA+74o9HI5jLCzDqUu6nHjAhrLgpCATBUmxKZzptC5TlB12YLiLfG5dvgQu38q9U1U3ZfdBYTbyhRY2vXCXI+42Ic9HplIj0kM7CU/6ltfmDxsOK8I8FwCpPCfyhW6LkJZ/WwUpKX8Og4YeQdR/dIrFvvh+kr68/heI2HxgmSvRyV2YJ9r/R5Y8d3393loUvTt7lLIv8AnpvEi2ysHisbQiqzgUFRauBTRf2m98B4gpibz3tIjgTWCug/Uy4fgbnDb+f5UUQGNb9tytNkyIbvv8lBE4hPSvk2FPHzceJeTqTmPxoLQzy/O9BH3tPbfSgCJY48+ZW56F+Ze5bxDoTf2FX9B4azDK6hR4B5AKty16Noe2LIpO5MA/h99oQ9/A5t5L1iZ/RGe0ayg/E5tp8F5vMaowTu2h8uAn2v4LlkMNyAKfM+gXI6cjG68PyS1+H9ecoEbKiAyZaYChZ45rIB462BkdgcKKBc+HUKR/awvQNGri5b9FYlQBImmq3LW7gBdcBAbVXIqDrG25js7RWQshqDvn0/UM6JWNqsLJypUdglaoExBr8kukCmPehkaNTSw0lfPS8zm9FoKO8rnlMzmSFLQsIHbnLEPO4S2PjuRvhJSzzqFdWfUdkCCYBTbV86zcXOTt58SSSxPSY0H/LeOG6h4FxQj59KZdRFVXM6Ig6iCxMyBgkCAvP1L8k886vkaQlTxNiMKnYk//BUMfdKE4PgI8WZgjCUFcaKNmmxWK5nT7j1FELHEsscSirjJZS5t3eCDD7tOXBPe+Dl+2lYvOl+FkBLqbyVQVMrjW+CAl6wMkLk4E0x4KNFNdXC93YdNLMmooKPHll34fRUUe0jiGYYoFYPZLmdZldNn7IpKubNTTpUYARLz5bCS1iA99Mo2PDkIMWEivx+cYuGI8Ewv6S+3QK7T+4ea0MxmDFGk+W5M1hK6jxlocT6NRIj/38AUEsDBBQAAAAIAK6gm1CQsj0W1gsAAM8rAAATAAAAY2xpY2svZGVjb3JhdG9ycy5wec1abW/juBH+7l9BqFhEDhwB7YeidRH0Fml7WKDtAd39tj3IikTZvEiiSlJxjMX+984MSYl6ieM0u7ga9xJLM8N5n4ekRd1KZZhodMtzsxL2qz7pValkzcquyY2UlWbuTdcWmeHpUWVty9XKUiVpLus2M55IGK7g31r7110jcllwkOZJ0vzA84e0lMq/TCtkyyrPlEvFPfV7te9q3piFV3eyrrOmWHjzo5Jdu/D8p9YI2bgX+0reZ4N5e27SvFMK1gKbGsOf/JqdEQMZzw9ytVqBRazNtPakcbnerhh8oij6R6YeNMtYnlXVfZY/sEyzY9YY0eyZkUzxnItHzsyBM7cg8wuiBHn/C8QDmUqhNPzhPJB4+Sv6AzVo+DHFOMXXQKQ37Pr64Yh/OV3wo7jpVMPKeMG+eA0sE04r3HGNQx775TasXIc+AI1D+z+KWlSZQlu3SL7dhZ7abdh9Z5hsqhNxkx+czbLBbyTHUcMj0KvQLN5mxqjt7s4+T4Bjt04Y+3QQEBvNOg05VjFRggRIRyvQ2dIqrsFsu5Q2YBKTJQSo4drwAlMeMvZ7uBe1fLOL6+yBp+TBgkMyZ0aq2JqXmlPLN4w3ulP89m+QzHyIwo+QYw3LGu9bpAUHgKtyxWFJzNBeoHXaUVQVO0r1QDL0chjR8RRBaByGZwW6El9QdgehLIdQjpN8A03CLlWKpiAe0TRc1VKbIewlKUz8bvXA5l1ifUjB33NgfsYgiZUIzWB/gGyrxIP1wHa76gN4Wa/z1BiPIQplkAj4+SHM89GbUTbl5mmeFGNJrg+wWwbECfopteaHkV/PWFxOIY9oHuUDj8sNW87BBbZzqTgh7X1gXbNtM5XVLNBtS3GlnLOZ0KehpGxJQj6bwFssXs2JZPdJdRw6Bdbo0bNSztxzl78Fw94/9QCpWPP6niugsP2kTyqQL8yVZo00+BzmwokvtdXlCF/YESjjzROEbrEljOhAIWf7mehbihfjz6H635xEoBByQFX9UzYL4lQmNGf/6mCY1fyvSoGLlkLAYAY22R4iALG0mThMw6MwBwn9I/NxiZZFhJ0E8+jqy9crxp+ExkEaJYAf6mxkSpKmTVbzNJ0XxmK+X1Im08Q/264DuqBAqImn1MVzi1hwOdQU8htmGqyXVz6DMEU1dtasyUktB3LCkUMx+AQG2wBE7w2Mr9ZYb4NPH7kyIfwQDTxHb5MkZo4i50lkXWLUaZBM1aghX0pwZV4JQGn2UZpOaBLFYRXNg3wuePUcH3/KeQtQDowVMDms3gvLfv6Znh141cI38k0CRRRH+MQpDA6i97MUdVwOziJfIfM4aF1j1yI5IJETzI1J8TpB+L8Ew1jwOOpMefMHp8G40CbL5hUHH8PC+NzSkx2frQ0/O8H04gwQdn71iQoP+gUxcW7xPwymXNnnfFLJIyTkGiLTVhkYGKXRhkU30XrTs/qMuC03E+ff2v8Nj6+vSe2VLR6bwz57SQN0PiWu+8sxOF8q6Kd3PczAHr7NK2j7iN9IyA67N4I2C8pcuUAK0ygGkA74dxXq7KEeDQHwEGR0ZyR0AIEUJ/Rylh/gTTUIG6EHgv67f2ta2D300Joea+sLDhHQWEl2cpC2PdzgzHq+DN/iZMi6yvRcIU1vD7Y9ktI1BayA2xLNXLAKSERWZPrANdj5oWQn2dGWgSr6kDV7ToBmQy/yrFnZ0Dn0DAXOQWhhF87sw+nmgVjeg3se+AlwUdG/AtNhEkIWItC2TQT5Sc3qhLDO20khdJJ+giIKwjYyFZNW+7YzC7wvQdt/EKaBQTjXbS8u0IChW1WiAV1gBybMCTMe6GyoraaZ2yxYYr8W7f88SHQgA32znYXHB9hl1zSS3qT5hCIhGNOX4hnqAOWyHWUO6WuHJDrFCHDmgi6z5adOHUCM63R5pectEh/e9tvmF+BOXhdA/PLcChmgG0HvS1M3Qujv6QQFsrOTco+xC3vMuLM821hszG1IsrCNTFsIibE7A4ko8IjjlHaGrnpcc8h9wv7SaWMTFal2YPRu1bdObBfoaQdcpxkYhsUONCB0kY0jEAVNmmjHDT/otIMDPJSgdVMAuRIDQt8uRw9l4iY4AhhYwrIvDDaQhTj5kGlcHYVF0+EeTSbnfPwPQ335/UQLa6BvTPG1tRQypNILefDe9gHs6D3PtHHbltdKLTAbsmrc9fo2arvOEFBcEr4gjw7D6k+jdn+iSeNaqY3uM+0UcokaeMFih4N2lEK7dTLsYeEf/p9OPGaVs4H2ONh7wbbZ4n0LZWBjh+PPagANxfZGZBS9L/qTE+sS6/sddFZtxi2yb0+9N9/an3qVL95leY47WtmjwFa2vlo8wdB4JgUxkhAvptBsP1uebUkWO7wmHS3Hd05Ge5r5q6SiW/q7J6Lz41vT0Kl7cRL+hn3QuuPsj7/7PQw52Z78wAPY2Sp+A5wASwqnniYAA4+7cJAgNO4FWsKUpPRJjYLjYIsJHdfuEsDMEce4y4Zvgm3FbAeyRDckvnWJr7KQNiw2S/VsqQVCpoUWSnxtvcEeFtBrTRmfXlZ8Hw9SmbwzmO0jfoiXhM2xHiPNfSOVRWnu6JLk7HY3NycO9TCqv/CscVYcTnUqjzHWn2w8BvxPuFJWsF9DrmHPEZ5KkhccbLHnhUS3YbByxydj101qejU/ssFTjuwevBOm2g80hhOPM9bTF87pV+SPqw3YnZZVtr/FY7nNsI/0f2xmq9oPf4Jmx1PSzJ5Pb1w8bq/+Ise7HIkXJB3/89V65IVCyba4jycmY9Rec273PX05h3XOW1A/6K/1GUqvVzQ49Rx56E9gsSf+Z+itr/Ec4DlvR+fYqWcA852tJwsNhgzHQzy7AiRyEs2K3Fdu2BpwCxdHlFbRZr0eKjl+4QANI44D7n/pB57X94Jfo6Ivrziv7VVfK67qwq4Yvnmm+A6i4Klo2s6SjcvKAoGsqEUT+wXfUGNnUu/FEpibdQHXYNyM+ILs8xa/LgXxxDOYSO6r36W+AA6LAjesOGEcH0wZh26OB5EfmKhrXiCwqU4MtkT2EAf8sQexFhoqYe+Qse7wpRPEmg6vO4K7UFG3FUcA6A5TGsazPVckxSNTnIYkUY9kIXTjT8KMlkc8QjjWb6RHYM2xbhd0wnrSB3m0h1rYWEHio0AseodZv5i5mT3Ottu6DitS6FyC4BN7FBlutLuWLutGRyuoarp8xuOtiMPTHZRcQJXmA8BxkmquNbhry3LY98v+u7clvPe0R5ckdNGUeLe7ehfj+mtICu+bdz511voKsHe4Nh1IAPbF0/WTIfiMu3IM6uiAbtyJZqc/fqXZCRCenrsNvT5p3NLvuSmxX0338rUsuooDNAS6pKeKf7tOytT9csKezfsD6KD/z6+iemkvt5I+kOPNX/8Y6h1tGlbz8RmRu4c4vc4GIFp/A9CFbQWhgeJaVAKv+4ARUeXCBRq1lnGfBe1A+d7A6TL0/tkbOcfd3/ApKfGHB6Ip5VwamA20zvjpOo/2IGt5mdE90YjRXpi3D/sUzJedyrmeEbrd5geindz+jIzxI2fEvHixiR+c7dAc8KcIYwUSPN4D/6fQLJZZ8aNzJbDP3JIQzOYUYqdOaZ214ELKbphOWlY8dbTRGmP95euzMlGlFH+SgXJaCf0Vlet/FRU7OQvX/eGH7oV7CYmtHlcUt66YzkvAj4022bYU8qXPPez15135peTAz8LNMODGriqoTLDTqhqP8p0m0fhGFn9VFftCfse+ULlHW8puKGHPtEX2rwiFKqluMefpr7EsujOHEfatMPprQTdIpnF7CYpxAPsjzpWlMZxM8fnnYcuAm37/5TXgxzvzVdgHNb0QegdQB7nejnPoirUFl45+7kXHTaxrGp5j3gA6wKleFP7i0DhKeOTuY6zXiayq/KEciGoqEMB01+LvxDT3t31/x58LuUE7hn67TS99ArUo8CHGGizSUxQ1YK3gcu7MpdxzM/8bb3/tREPdsHAvHGtUv0iLTRTjhT8tPFul/w+VOik/CKdvQc/W3ysq/RuUqlXwsjr9L1BLAwQUAAAACACuoJtQPyISCGoIAAC2HwAAEwAAAGNsaWNrL2V4Y2VwdGlvbnMucHnlWd2P47YRf/dfQSgPK6GOejkERWDACK7pFchD00OaBgguBy0t0WvmZEohqV1vF/u/d2YoSqQke530kJduAp/Nj5nhfPxmONzr5sjyomyOLbdMHttGW7aXtVD8KArbFJ1c7ZfW3AlbWHGyhbGV0Hp50bufXvcTnZW18cOiPDSr1aoSe1b80khVtFzzY3GQypp0/J5tVgz+5J5JI5WxXJUimF6z1HZtLdaslsZm/Wr808J2WrGE/ZklOTJItWh1esrYvtHsxKRiAZdVsGUcBvnKmhvDvqll+fHtqRStlY1Kh289vyRJ3igm/CizBzg+7WElV+zAVVULBp/MHJoHZhtYIVhnhM5h64pofLZhP8CgOEnLyqYSJKY9SDPSpXW4oKAFW/aF20o6LKSCiSI1ot6v2VEYw+9EoI/SNro4mjvY1k8OU6BcMNK4tB8bdoAMqrHsu0aJeNGErv+aC4UCpkln959/lWTDnkFv+URcv3NciuN5L2gg8nBe0M6R26IfJzJz44dEQlUZq3vW1+yZqqcoOiXxgEUBkvXUVsP0BRZn2Mz0NYiK7tKrCONxiyYI6IFkOIwGmhuHZrbTGE1HFWMEpslbrRu9YU/PSe50SvzyiX6zrJcAP7IhLv6Nk0QhjUMkCgyIJKEVr6cRYuQdjBrGIRTQzAIJ5QziAA5kH1tZ8rp+JEJ8B5gBK9Uj23caoke7qJLqLnfq2lDYekfZUIQRQT+EYVdJ09b8MQ93lPa0YQ2JhexoY9ko1JkTs+QQqVUfi72ILrgfZF3PAgI0VCO6hHR4ZxtQpzsQTprmKOD8tuPI1+ReW6tZjL9+KcYxek5Tz4itMQ03jw5xtAEZCuLTZPhYwbBfkQO4HxHJwPeGXaI2gjzwD/LcsqnBrlvH0g8iYMMY6DBgMpwgwDAHxP1EjlwOom4L5wKpP1R2HvY8px/0I7t5eobYuSG0RjL5z2oIpJlrTJUIOc8e1uNwIEeBude8f/UhIpLNzwbqPyuo11PAFwaiJQ4Enp5/VlMEwPWonM4BwJqOHcLA2tHf0ucngJUJPY8xf+XVOwxUASCSjoBzKfU6LoY1HYQew6Kh4rqS/4EojiEBrcaJzo5XLvEjG49B8D+E/r6r2cNBIG3dPChGxQxnGMs7DiiAefqxBbcyqyH0CBoYt5aXB48CHUdccLKRqA2DXJ+iDL6yWQMjWR6IziANrpIm63Euz9m90AbRqqpEtdmw1/mrCALp0wHgSKPZ/SLKC4BG54ViZeazoBrBarG3qM01xc78hEQKzwayop0XqIDDto0xcleLfCYtVVsbspUGSO/TA0AIGKAFxQYHwbjo5V3g4tweaq4d1VcV7uU1pR8r7ykH3BKtW0ThkhtxlgqYXAOCdwagm93zWlbObCBWV1eQftpWKJDk270z0Dk6w6GkvTGDUKYrIfKxrMVRTuUrmmzJAPQnUM/SiiN65a9dY5EOARmeB35Ncsg1CWPt9Bp+J0tM0XqMujOZhEhO0okz79aRXZgqehgNy20v+OXqzmNfQOYsBEasJrtGyKojkr+ZGuEkRRLNjTkk4GDEYh2YfKvIt9DDOjEHzFmqjkS4eHMaS9JFXgR+T88Ry/BiFbP3aPwPCTGs7kZEDuF5xOTvuURHx1sEgYUWv3ZSk8v2tRbCJtd33VHASXYA1BBED5wU7+BPN/cSAM5Br1T3zUeHDFA3lVq29iwefrmEhwVC9BRhpKqgJLPCEFkC8WYfA2d+Lh7xsgauyruavA/BXAFiSDsBXqKKKeMcIVx+B9ikPDIBpvw4mgnAAWDo9vZmIHlze7s+RwzWOfXCItQw/PZKhpFLEBFF6BDYPTRcBRjrQNPboTQL4jZ0lUtA0hNazy7oXrx8ZDQACP74vwKQiFRUCf8eiIg0OtFxqLdgXV+7j+X0VWefsQgYUdE7yuS6CtGFfNGC51kChQIqL81jjsiLVH50aBb5iVuTRXSA3UBq3gJxs/Nxf4Y/wV0BgjrA2YFYNts0N3SsjmHrHN57bAZG7r/li8io7hhFkuVEkI1WJ4+iu16STPbmuN/poV+RT5bgDABSuDN7sSfjzezr9cXrohMOXSe2Mo3EjjJeVEMCXn+9N4zgvZAbkegVaf2P7CIFlNJs3kvqE/d3zb+g5Pynu+QuXaOmKRtKe3FsscyE3Da0MH32pvxZNWJM2OIEJezFpNwzOlufBjffaQJyVwdZSyuFmSSl2F8uusrYUExUQzV4zzSydCDHaOrfVQMHlIBn8GuSzsLTYUYLf1+b1HZw9YK970PX+zCLpIj0rOVbi74BEi3L2HbLvpiDEnLM6RpUpcnfoGB5bDrQBjjJ0/PXcRkb0Xv/6kMWA98y6E3VYhoN7rgk4GXR0nf9xbO3gEFrZ4OAydq/EMREAxmHxwS/EulHLQoXWOQkL0TXGEPgondCCU1NQdO1bS1hCdbC/fOAr0absf2PJbKEENcarvNBnyLsIjA9MMPdqjvusAOwH+ptd1el5kcoDOZQT/na4jrwaddyIF+P5Ia7OKIq3XwH0evHl++rS3iwGPafODYDs77pNXalYYcLzdWm9Tv+d+O620Jo2VCaa2z7lysw+lOYwev377J+4fEgUK7rCpdc4Ul26Fug3yq/JKt/wnSty6m0nSz8ArB//NyZ+p9Rw9VfFM53hDv1UWGLkEr5sRF9uRu/cL+JZQt+xcsW5P+NL2TJN9TMQp2iQp2SJ02BqUTnWgNv8I0m/b5TVh4XerTDK5B79sGnm3MPQq7BCGUHPfs4G/dM3p7kBR4TeuH9nrvQ4xiKZdTJoyfXB2kP9CpD1CDUbGfoHTZ+XsIRh3PBEpR0IDKBNajh6sYaKvLSZHjYSdbZWbfF+e2rwFak7vBNCP9Z/RdQSwMEFAAAAAgArqCbUNNwv3oBCwAAQSQAABMAAABjbGljay9mb3JtYXR0aW5nLnB5tVpbj9u4FX73r2Cdh0qNx53JttjAqIOmm6SblxZYTJGHZCDTFm0zq1tJyZcO5r/vuVASdbFnULTGAGOJ5DmH5/rx0FuTp2KTZ6U6lYleC50WuSnrN6nM5E6ZyWSL0+bRJk8LWdaTSmXSKFGZGy2kscrUg7ZIdBnlRelGcXKl69GdKiN8ozOZRFb/R00mr8RPMhPb3GyUkOKo43I/F+J+r62Av8qqWKzPotwr4GuB/tmWKp18+ucvP338EH35/OH+Z7EU/8gzIDWJ1VakStrKqKiU60QFJj/acDER8CHSFiY/PtEzsBQwLHSG/yxPqgd0fJqBNhIcVVmVKiNLoha281qiX2H6A1BO5SngN3PYaUBEbsNZo7EAKIYhETCqrEwmyqoAKc/EEyafkZ8FTam4JqRhuzYIYRnvD55NhALT3khIsE+VlU6yi9vCl0vHEDfSDJy1SmIafi2C6XQWij+IoCErbgRKjitqEY5GFhH6SUA08NuMNbH88e0MOOtSg311FqusXAJFYau1Vf+u4NF/WxgFnnNQEbiQ3AHRvV1+kolVE7eX6XT6XuxVUoB/batsU+ocVLZHVwQ/TRK9A1LJmQSyJAe4zt/OAoSUVQJC6ZLoSGvBhNYtLUVekD2tAHJSWJ3tEiUaIUS+JVpiXcHsLfoeUVmNyLuiZakqMQIs7Cg/6BhcFpgcdZJ05SQqe5nFPjcrAhBXZ87Pj7lQaVGeRQKvbDif0KLPW3+BNMqRiWcgfyv4BiJprVCvW30Cgkdd7gW8I4pECKlSlEuwUrajuFqtvn1br1ZiswdCG9xJgK9Ot29Xq1CUOWwi1hvQF+mPyGQ5ODBqvUAidp9X4EF7eFQZOh7peZ3km1+d/AvSEml14WIZ9EvT3GIQ21FU8dxfQ37FiyC8dFq5V+ToNanOiq7/8VL3TvC7PucikRtQFzmX6sR377PVBnIQKVFadJ3SgAI63AeuXgtAjHnBRf7XeMNHyc0erWfVpir1QZEkHe4jLrpgHwbv3CZyh15qFWpA0W5FY0X012f4i17cDXx5XoctpyKuHmgg5FIXgXt4/kKWNpMmgWBqQkOqUwFEIXlDzuO0zTNh3FsXNIKSL8wmrXyd3NN9bKcN89HgTTvZKLJPdNxD7rUFfOUsxTNYSlBxlpej6vfoUMp3G5pvQd8B7jlkLRSwxa8P9HVdbdsH5zl1kcNXmISjbVLZPTIKvJrk5AAC3TrFvP1pMOXr7cMcHbIIQrFcium39bS7qphTSMdB4ISAkLudiXtTqRlMz6bz77nOAiR1t3gIw7amKNDPi2ixJsVUtLR8OrFKSNLFw6SpbhR+mGXQXwhvUK4cUQO+70rha60z0NXy5W0AZTcVAgnnLgYxkxu9w2pPLu0KP0oSDmbSTpYcxYmzxGBSI1lD9+YaXdBWrel2sLNtxh+H1sMI8LDTCyOPMw5I0HCx8OIMUm7tujBspIuTAEwHgIEfwoGygN5QQ+ZQi1hT5OVRniVnjonupoZ2GCfTxlS9TY458NXGW80BccwmAVAgfgZs8Sk3qSxBo0G+/q42ZYs9CITyRAQhlpWw5fmUxoHTzVoiRsUJkAh3ygIE+Vz+3hKRylYygUT5vYKykSmF0AC1fVDmDFBZbbgmAXMAxFC+rQJER7ADKAgIjZzIQFLMkYnNuXLE6qASBDGWSv7RaCrOShuRHwFMy2xzFnlVFlVpXQV+75JTRqgISB/l2fJKixLkAJzT3Jy7BduZRWcbo9Kmlsk41gjFSHY3Qtui+pSgcJdK+EjpdmDfYTaLgIPH+JgwUpKYCBgmBbCA82UDDQC6/fi2rUJttoywFERRYFWynQ32tXxTA1gM6RmSi9pnz6tx+by/GiKp/8rPRA2x8ZTRDi/F21t/4ZVF9QL/HNQPvSvLfRJ4aAFNB4OzWRBCgfB0EULiAT39+TbsqqMmRP+7Q5vKmLakwpzb7jgkqy3V9q8Pra3IKZ2hGC95BgCrfmGnlaLK9CaPVQ2qyIsZa7mAYvLzGo/02NbJw/FoBXCJDad2OX9G82KQepBOYiQMWfR2/no57jotU0gN40w/qP+W6c2zTEnVUWUhbzmFwwlmB4cKs7P1EQ2OEsvpv3DKQkwvWQKH68LsrOCUPGkWNBA133EywG/4JoMD1Lw/DUVYiBZzwVZwAE7GwAeyKUQ6TKlwP3awmMWuueD3Jue0EH7ub6X5TluJ3CIARY+Ld4/Hp6fHJ0AonPoDHqx1dVyO6L4NEcxxTXx78XIzZrKJH/7eyndLETQ135cwhDP7m9te2X0FGVW12uGT6BayvrMM4Ig9KbBVz7ybPOpw5do+zrmzgjdGgTtMNN12Qf+Dhp6NjrQKGB/vgX1fuvEFQ9jfx/r1p7u7a7iWle38RWP5ykWSZ+AYUH25XDaG4AMmAIFT3wNJulaHL1I0AvALIJbtFmBqH/EyryHlWKAb/el/a1HfesNjGYtxyR7PmqNXgDx19FLbXskYkrtLbu7pQhJzo4MMNkizjl+TGRaILV1uwKTpCF1KDQMhm8PiSPZvpGu7PNfkg7ThVbjFddfpiUEGZUURhB6Tw6gb3gUCLz4ldIVxaI57OSB3FjdU6sOxHTQMHI/xnNk48ZW8ORN3d62P9MJgLM+O6KSLry57OLU7R99eylXj3j+Y9vLsNNY4pUP5hazVB2yXfSBOnAe0zWXQ//KHW/6OlRg8e/nmgpNSJ5POBlykL3gH/O3zo8gLnGkbSuAswCVN4T83OevjkztyYWewX+mpxw2ca0yADVRsmXOj23pHDZOSO4qDTCo1hAxuq2OdRlcpGTnAvCrNRpc77TCJrErXAG1hLcEXK9aqPCrXdGNSfnCMfaza5KSSLkc/UnD71EGwJd91dBtjODZyIeKnC6wCPDcUv1uKN72+kdRWiftzoT4ak5tg+vEEp1aKflA0S8ZK7pl+6iVp2m2Etykgja7Z0eHCaR3rj6dBbylQpuWzWhs6G1yBeFsIL6e8Jl13crUjfilT+8RcU4nlGJ6nrlZm/GDbXWeV6hNtijHJEoq/LD2N3XQ86ypTrvn+0h7lFzVVnt3GNZavx5Jt6LkCfq5nd19+OG3e3XYlcFcEkesZt3mazdKFHZfyZJckdQ8drZp0p6846VuM3l9X3eOTBwpoPvh7XxP48TuaPO9u8TCk3aN/MW+0bu7xv5plMAqQMQbBM5a8SGfoJfx2WAo54fDllngn7sZ3+qo57RGW5u4aXScQdubC8ZyOhu77Qo+nGX/t3YXjO6yT4GfI3JVJPLp2ayG2FLdVUl+lC7eeG3fHAZqbtcCzrd5YptrDvh1WPWTLZcaJQ2/c/Sa39UooNdLWtMerR7tzD4OOgYUGR9N+x7ph3rLSnLtKpgtmrxpkWNRHErVrgTxjAK8DMoKX348rXr+8c/P/2g/KvlMlwY8RwX+hTrX10BLvBO3fqfiuo+262R7ar6/n8X3ksFXg/rdN7b/rA3pGA5h4guuhWb4oRAokScq3uQCIcsQrRWHywmgIS6J2lGdyVdOK3izAzCNWq6CBbhFzYCeX2dmdbiNtI5tIuw9XK3HcK6Nqt6ZiX7YUCdChd0u+yGwuo+vraYvZBSjXeM3tzN2GQ1TwlS0y695T+nchI5Jhm5V+lUDWhnQNhFEop9rWik3TqPkRDKofu6g+4KpnwfHkj737tnHmWLFa8zd3HoF3fp+hMM2dx2GOPyEJflXnZSLTdSwFwNoT1h/v7geyvnOh09e7B/4BCv1o5ND5gYo5zMbEmvwGUEsDBBQAAAAIAJCCaFBpRYd1qgIAAN0FAAAQAAAAY2xpY2svZ2xvYmFscy5weX1UwY6bMBC98xUjLk2kFLWHXpD2UFWttJeqWuW2WoFjhuCusZE9kOTvO7aBZLfRcgHb4zfzZt6jdbYH6hyKRpkjqH6wjkBbKXSWVfEND2m92WZZ1mALR6RKjs6h4bc1hGfaeKV5+fBLaI/bMgN+8jx/Qhqd8ZwAYb4BUiv5CvO9AmDfKQ9SGDggjB4bEB4EnMQFyEYcISX6dxjpNtjDX5QEbSAhzOXUocMFUgWY3joMpDinooSmCZ0RpCbkBBG1bEcjy3oQ3i98amhQWifIugUvBJGyhoEj0OBUL5zSl1B1O2porYMO9YDOgx9lF4jM0Cg7W8OpU7zbq2NHTDaCKM7m0BPTVgZkJ8wxjoE8R3RiUox5EKErnPhOB4oswuwtDKPv7kXsoOyRurL+Md/w0g5Y33Z8BikKmLh2piiaBpuyhG/Fl3RUDsKJHtKQS1AteKTQvnrvRgYLeV2cNUxCjxiaX/+2ho841tilmAj27glzmoTS4qDT7JB734pR07UFHMPJnFAeQdwDKfHMbX4aDakefzpnXV0sIoxvcpdyvTiXmuRdeBLy9fnz15d4zkA4EGy+Ezl1GCmh7eDRNHiO39srUCRHS1/eFJaKva1ok++DPgMZ7oiQUYJv3ZAvFgvTXL0l6Xy11B8+wSBtg6fVB7OQl9FHRsVCfaZZVY2SVFUFj25u8CaPkfkOnl+2hRgGNE3MtlRhh7WIW1P3dsJkSLIDaJxQJw+GrbvJ0ybjrT8RVr3VEzK+tq5aCoqrh6Cca7780UTL6tldge0xyO9GKUl1tk1tCCDQanFkPT22s2JWYQafB7/RJz8rgVds02A+bHZgGcOdwvRiiLb2NQQMkWIS0z0j3qqNdZGKiLMmCIT+k1+MiJvccv7JfvBbDS7brsgc/SEunYuE/Q9QSwMEFAAAAAgArqCbUAboJE26EgAASz0AAA8AAABjbGljay9wYXJzZXIucHnVG2uP27jxu38F63xYObGFbAoUxeK2bXp9BWivAXLXfvC6Ni3RNi+y6IrSet00/e2dBylRL+8e0C817rK2SA5nhvMe6pVYvF6IxKQ639+JqtwtfolPJtPpdPL9QVtxNGmVKWFLWZQqFaYqhbQik8VeZRchYenpIk7SlkrsCnMU5QEnp5ne3tiJOZUnWVjloZx1eaAZOyXLqlBWFOpoHgFueZClOCuRGpGbUuQKniG8BsRWJbKCvzBJH0+ZOqq8RFhHoXPxbaaTz8LkgNBB7w+qEJl6VJmIdqaY6BywzxMlystJiYPMAbt8PxcHlZ0ETDjKsoQHAgZgfQbbH02hZvEEOKDEKZO5AEaUxiFLozSZvhDVsKMSMFaIUh+VW1koaQGlEtkI/0mR6t0OJual5wcCQXJrIjssnOC+yJmSNpDwv4eRAPOA8HfxE0H5Of7d4ungalUUphBHZa3cKzvZq1wVEo8Pp9ab6TzYSgBvrdirslRPJXIFEBN7Y1JHxoQIBt6Wgs+hQqJspSxQy+wnCAC6tMLsmm3OhQagudhexB8LtTfFRXyMxd9lwegcpc5L+F+lE5iBCH28lAfg2yezK89I8h9Mlaey1CaPxfeOmZk+aiQITgWEl2ih3Yr4dEGEQCoLQvbd27e3C/jnF93NY/E+ywRNQjGEpSCHcXvlO155DaFBIKg9IKSmKOHhhA41MVmmElxjhRtK1T8rNeHhWD0l6tQa/q1M3xf7CuX8BzzHaxP/Sk+uT/vOfKqSA88cnUQgfo/iM5lMUrUT6yo/yeTzGhTeRvjPXOT4Z21PKpndTQR8gNw/6kc4YtSUEkRtC7INIiAd+pZVqz1IUARC0TudEDftnMBp5BqYhxx1pqxO3nBIYDXKB2OE0tzAZ7nf6cKWIAupeiJItC0ekEIpIx1vlliWfpWYHI6M5qPWDuBF6o9D1XELKt6ijNTTHkyVpWCi4JhzCyMpgQMl2ixuNyikgBMCU16dAeLJWE3Q3WowiaI61VQyzqkqrEPuL6BuSAIw8WjJFuw0yFTKzNl8Z3K1if15MPlIyT3LGZ3djB4351cPBkdKU4pHGFqu6LsFROEXwmdESCx2qkwOkZcA/JTFpflB57jjtUArLm4P0i50yiKJTwYOeVdGs9YUldlnFgULWJTFBzx7kt/2SreqIeJ80JkKWNFMzx3bHIld1jjK3Kx7cdvZ6DGWp5PK08itJ74HeGb14l911z4h08NlZIfXaNwKme/dMc1WrUWvxIcdOMWbAkUGPJBV6dz9PlVZRhLDhr4RWgTIc+cdWNaggyX3C1JLPCMfKwu0efHY+aITGz7jp9jt1Dnchk+k4dHTMI++EW9HhWp800JqcDzfg7snUYim38ocZx8kuO/ybBrg0zZWTtYzlUfF4xjCuOeMpehVjQwyuNZosBD4+6yzNEE/F2H4NIsFHpUubxh11ti5g3NmdUbjV0dJtQlgvl8lvXhc4uAKsGeGNvqOHyfTy1V3gXgjbsUdLvPSE7VHHKVOgRg28GYOLtiWbhfnKijsWIPjZ2+Rs7uA385KjKgNn1bbi0Wwai6mX77icmRpAXZKY8QIbsQL8jTm6A0nO/H5abDgUa0UITDn42aeMnvKdImERQ0x7GvuEeby7nblCaTHsbYyA28RBebRMXA6JY746bj69u7dCllCS3sLCP67Fa1avrtbhadBK+YOyMohmyMZmf6X8gjPRVI+NUcAP7xJRg8FP+PSfFb5ulm4q/Kkb7YbhOjRqVA7/US7AxvaLAqR5HkgTWM78YqQ08D8tS0LsF0R/xkINPzBCZ7BPhUieXU8lRStEyjUJ4gv4dcRHStFp7H3j6GXQ0sLp58c2DjGO/TYEK5EDfnT6CZa/uPm4WH1Ovr13cND7H7MXs9u/v0whbGHaTjIv2D0Yfrvh09vZg/29bSxt4z2POBu/Il/BUIDRAKKhFe8BxMMHi/GhaHn0xSOoAyiEOHXBQgDxz7uOZA0fZjeTNuWkoHjnNu7xe0qhqQCQuloKm2iNYjpdAthls2kPRQKsqBETWdxqnhOlWv8slA2kScVWNFeFMC7YOrlzxKNRs9x/8AAB1w3JJc2sFreCtdAnJgVjyBCCWBrBet+ZLY/QsTtuEkGag1BYLleR1ZlOxJcME+pQhWSFJrfo8A75b+/nVM0V7qHAI2+BaeDYOI1hG8FSX7HwPJoZvL92CBrhsIhqzD6qYdRGlGvNKmb7TDEKd6jzCo1rHqBbKCr4BVjfvJvCMc5yg85QNUp5/siOcgCOAMxr0MIrWf05etswPIOUhbLNI34x/Ltqocb+lkenZFPIKHFh0TabCC8GmK7l4ge9cMBZOdcRldfIyY4KlS/xGcJ/XDEjd2LqS1NoaaTtgig9FEUbsv2QL2Ov7QHfYhKf9tDJLIwRH/bQyDB6K+2PzIOvzkV5qSK8lLrRyk/K7sm3pOK9L1XiBrIZuSIAlvBXJzOmhQBwCfKWqdsBHWOclWGKoQxTUhuzac2F2lZjMe1rNmGMQtBbceNg+DWxI4XAm34eB2yI3kMaAw6DXyQVVZGNfw5GIGZFzmW8pds8gz+z2/V0PTMfgnE+S9mVIPAXrV2fjvD6DHYqauIfctT5Z9zc869wtx8+XpTW5kAycDauO0LDJBDMkHCZ7Uv8CWUZ70BI16b/jFzP6qwV3Syo3g/WTlG0sWDydh3QKB5Sxb6CZWS3QKsrcO8nt11K+8DW9u3k969UM4cDpDcMIif3Xfzs+Zwu/WrqDcPP9M6joNgnAwQfqG9bfv8+YAahvStdU80nrEXLxKgj7LAsssnnPusEBWEWEdknPf/8rX9OOvnZPS8cM+LAUFCVHlJO9b5SLXPNnoQ5WI9y3ltro5SHRpNN/j0XGaCYVBNCkbAfGhgNxb2K0sVAA70qYxrXKHQxZWcNGFKi/nsEUI3qkXJHUYLde0XJ28x6GNCpLD6qIFwsa1KOAxbwlYWy/l6p2H1+48fCKIviXHhOoNJGMVsFaHFvIf8LcHVroyHVX9X8+diNFEGwnQu5AmTAFSPi6lcLe2DT8JzJQuGop5KlVuN1Un4VVMAy4BaR41FSKlRtJbzqboVUbc0iJtYnqvHsG/Sb03YCpINyYzB8NjiXs6K25lD9A52lkdMne7cCRA7kOQ7IvFu858ECY6/NTmW7jfiTL0CLjHSofejGsddQ6WGpmY4JtWwe9cWvrqjYukYDsjtAINYcOGe+wdbFYLhMgitsOYITE4fsVmT4lmLRFpsMLSUAPPXe8SpjQyAB/9WFiazYJzOXJBhoU+VhIdUViHJtycqdARiHIL6sKtbNuBWMZPc/AHWq808hHnGYg3EFidh8qb2HMLJTb7gIwPygw4JAceScC06OVgnQMdW28Qcj6AzNoRj5Q40ssMEkAJzXofUrJ3Z+L6oVI8zoNOZDdEnDhniDDPGu1+n5oDyby8hGCeYXJ8C0rnFhA2n6HzQmDYju1iBZnPSb25aocVpkUMFd7IYTlQ9SL3PDf9Es4GHqXPwQM5VghEJwbChsQe9495d3RtokcG5P9fSLJo3bgF0RYp3XrvFa7/4XtDBh/7YFU+GS4/PnAzWP0ZG+2BGUUIow4NjeemA76nTn6ExLOAFqemX6QID/MVi2p3YOLDackCK5ND5XyXZYJjepym2gnJ19t4sl0dQmA2CpfZKI9kxd3FwROeylTq5c9P5DoQXlkdVnunPrrnkDf6Mm7JKpaSk4HPUE7inRIOzqSGBSD7qVKWw2XsOVxPwqlv0dxcs/m42lHVswGS4rxzAbzZNvWez4ZCDJ8F3H+VvNtQ42lAkvtnETcaIhG2ARRu/nfPSAnABZdmxX3AsckV/DhmwVtuUaJy755zONdpDFoa8D4Uf49jBJJcD3FZM7EseA9VIb8Vn3TLHKlzN2a8v5fSliP94OXK1ZpYl+peFiUK5cfGOq1NKcR3baf+4WdLGEOcEhYcB7W9Gl/D/iuvDoRAOAKxLEUPw/GAHXEvhvB97cSbT6JRvWYAbqAPxK8r1/ymLjbXyYX6dFeK8+5BhvmnhZCesZyBC3NlgPndifUCQwnA7xFSOm31be7PhrMsykDlzZrbZtMSk5kI6HHxjPHoGx+5jYGyh4h2UsHrsG3674AoJGClnJflA6G4Kngpd26AUwrfHG5OHjIO43QU7Lk6BVbnitlaAFc88orvF3j3eiOkAI3cPMnNUR1OAbUi7sx1lw6dPaRuccSsza2eEvSo0i4ALJegQ1zvuVSFfI868X7KCz7893Zew67sT/ZalD1yDxgv6Iv88hvBEZxr4tz4xVSNZda8gVye6rnzAaeU8zG2DuH6EHBLnbvXhxIB8Nzy8BzJQHeJs9o37VfDa5ZOrXdTFiUYVG2PfqXvr9Il2xekqB6HCq0tRs7BTqoBHsa+mEMpLALDy5EwmQ2hS18N2hnzeHYYzVyRmkGd8qyCAN9QLCYbpEsPbWXdSpnLXhW61SvDzSvzOVJikptIeUFOys7xYvtUGetQEKyAhe1nAQ0vXsc5gaDuA6hgPjQKV/Xv9fUL4noK/sZsY/dJQ0HUaCCidCUMSexUtOoyW3qFkIxPq8+ztdi3oHoDeSEGvkdSAHWwbBKemc3BNZfSW5LRfh3KMadIV8Ule6qSSPaHe65bTRfsbpNdiCSMMH1x4HMf0NdKL25n75v++wSf1hO9gwioAc+Xzj2BadHauga8QGp90ua1mQYIcrAIXknOZCulaerTayHBPx0+S4jWkuZBXvwah7JPbInQlIoqnA98HvNNF4GvIkeCtjgDUViFW7l4phRO0+zgNTmszA8k8AaxsRVUWd5lL3KK55luf9c4gZdSZDKDy7Q6/ysKySO1jNmVUdnPREF8Bo1JnbhqQs3kAqkTWco4b2qBohqBS9CB0eU2Xlb+hdjdInhDe4jHb0RT0eN2RmNoQPi9fbeLHUl9AeYeJ9NwhQ0x2hissBonX2Ly/vBaLBagbTbqGNqJClYYAAjpVKSAIunCph9LAvYPys8CwU0+9jq6bZHVem9D1eFUeA3hOJTtReqdRa6zVW/DrpaZMenkGf0w+jr70ViNoHImp+2oxL6W2ZPvCF1fXw9ucnFa1drtv/eISXp13NZapzrMGko0OwZiqBA3CNqWvxPv6ViPwnS85YeEKbcnRpJgPsFht8WAwxOQ7G6oDxjPft0T8rW9QlPqyKuULyISUEwttO0C2hcyTQ110VDJvrlELtt2wlvsbPhTdVVmQ4DMcf5mz5xbbInL9Ltqw32hDCE4EP76V5Lje7ig5FDA4CEDPxDe8rI/AlWtZfW86dq0RP/V9g+vxy7D79Iv5AlkAYnlHe676bjRVmRiY2PCKMH7pWbzoZpiv7ZN5RkOCMDuXHYLtu4S2WmYdJauD1JZZ6Vmkun7QJJl9E0R15151Ep40LVd364rv97xtlLlfUFyu2vE3X4Hia0GrTm5NBcN2Sae53nUISjvdZaGVqUmkrnH/zop4g4R0Bd69JwGA+sLlw8Dhumh//gAjfDSYHPqCiB9fjh5OywbMcdvidrB9zp7iB2wqRD/1FRxL+b07ml8L8RGiTMUh0eWGGj593MAf4tscJEMYPpHcsFVD8xvA5jvt8RBnNZgWn4oMs3I0NF7quwG95iUkwdSs6E141v45zF5uA/HzUjuIn2dtIX5eaA8Z3pBNDIH8BLuIn2dt4/iuw0YKP88bKv9BhYMT7APfFkp+DjMfupwu9hiWgTR32zNnbMwsEnPcYrHeBbV8n5PvUAeQmpc4wowAlsuylAnfmPZX4yh8LhS90lKGme8rX9DkIpK01FXAsNSHC2dK1VznaiutToTHD7K2xIagMKbwlf/koBVmHL4EUHe0EOP6cku/43jddhGNV+3ZQEYLDu3L19preZ5Mp/GPEJxFHWizsMbZzruveKCO1+3cEnkl/mzqc6rfuIMviB+9foCX8PkyLlci+TY1PhE6ZLGtTniIuDoobfCJ+xiObiHkJF/YL8a3HzisK4tL++AxvnW3fIPqNF/ZDg9kej91hrbNax8fd+M3drMxXcSMYPFc3IbXrLpaGDTfYFk9hH41bMy1/Wyz90Ac342/PQcaWiPIVTGWnTET6lS0MNX+0E48WzMIAjkLk2Kp9zvTeomJUj7rNTKAQ5216WJnzNT10QgSdt1tuEGgCSNF206m1uLSWLbWLc2G7vl65jJK/06CXqfsR90rMh1AaFkg76R2IsU4QTP9T+as6PXQuifOr5jJTBRV1s2CuKNuIT+euw4JWVF6fUWS7jQ3c72hYDXvAIpA4zJMPgG36YJPg2qs7pXY2Tx46TbV9sTyYgYys5AifueSOEFmDqApmbpQiN6UM92+FwMhFzxUZcRXHNopdVg0HH0LLJSQJnIeqxe6KPInhYrtqjtJ5UgJ8b9QSwMEFAAAAAgArqCbULdDEPR6HAAAvl0AAA8AAABjbGljay90ZXJtdWkucHntPP2T27aVv+9fwcrTsdQq8nrXSca62ZtxHKfda87OxPb4eq5PgkhIYpciVIJcWfH4f7/3BRAgqc02SWfuh9uZxCIIPDzgPbxvMN/tTVUneWn3Oq3Pcnk0/letq9qYwroG43/ZumraIfZoz87Wldkls0VqdnsFY/nNty++e/b2+zeL56++f/ufL18Pd9roenHIS5htt7D5T3q4V25VXR+H31XqsMjLfVMPvwZs83KzqI97bU/32C9UafPh97X+WNP44dfvrl/KC/0x1fs6N6V1756t4P8n3761aqNfVJWppMumMCtV+PeVtqa41TBfYapFpteqKRw0Wo/r+Hxr8lQPvUlNeQuEDNGP3v+g6q20N3XeTq3TrRlq/179dPwuL/TZ2YPkzVYne+iyr5N1U6a8tNokjdWzhN5mJk2IiZK0qSpd1sUxMYBPlWc6qbfaagATjU0bW5sd8EGyNQfsckwOprqZnd3mNl8VesETLnBQchXQ/owIyFtl4c2nswT+RqtCpTejeXJ5PuWGSmf4+FgeN5XWJTZcSMNRF4U5YMvl1IFoND4/kecdEK2sFTZ9KU3pURGQr+T5sIXjgw1f+1mtrrHhqQNa5ZttvXDoPT2P2xnLp4/jVofs04u43eP89LILnlB/+iRublfw9Mv4jSzk6Vdxs1vPU1jPZ9lpWtJCFQVs9uhv55eX7893o7OzM2DTZJtnmS5DWo3592ROcNuzv1cWxAe2VbpuqtK1zeRfN04AL1ZNXmQCeEzj8HROE9us1/lH+BfYxp2Uq+/gLOlp4h5fmlJLj5QOjL16UzXQhCeC3p4JfsLVVwScMV5TLxBESWnqBDsnqswiaNQAbFraWpWpHuOAqZxNARwA/yNsWzL+9Hkymq1NtVP1eDRNRrO/m7wc79R+DFKJMZsJ+Mlk4lCRFQ1jIy97E8J8nz4n7z99/uBn5DfTZMHPbuhY/pUJhTIOb9lrR5ETQ+cO12BD5N00Gedmdv3qG4XUcRJlMqElbBWK+qrtOyrVTo+C/RN0pMMMX0cc5OQk49djFfoVsQS1AMtqFiXCNtQK4nOd4/pAPgnXha894/DjrYLzht3SoFEOAW/aFRyiEbdHnEp8SM0gHMMZ+tzqeHQ0Gv1AoIHvUORWCVAioRWQ9AXeyPEVaYAy10AAL2pBsIL+SlVJkFYax2cofoXGXYBJoUBBz3ibr9col7mHQv1m6Zk7ro6J1WUGGheAkFqvGgBo802pCuBnQIuAeEwOOUiQVNXpFkwO4oBK5RbYOZmDwpwvSYMuE688BYnZLAE9YqFBgajJ5vPk69m5Y5Fn2ERIRcdzryrglXYhfRhfdWE0ZZ4a0FW22ZPEwh1Jdxnocp0A8u/yMjMHexLekyGclrAnyx4yc2ogFp1TN/yFJMEl0Ly1V7ezcIQ77vTeCQbiRNHFeAhLI/TZqv1el3YmZBRqdP9Ermxy4BwkCxFJeKMpwR6AxoeWqa+zCJ32HM1JaAofgq5AdMByJMVfBizDuOIUg7gwg7JGiWYaOJvzRNkby1QK3vrto6kiIHiCZb9RvMuOoSGy1elNOyhRG4VyLBrcnvd2rZ6uuGp4dZsj3Xm74vN3arW4YeWtucFhMKNWWWLWLYps0VmCYk7BELMPpuwvORJIsGMiz1kmALc1RYY7rphhzSm+i3QNPdkEthnpbwd4MS9PAYLjQNvXYZFkDUrBASHbcLm0dYaHZxlsTG8HqJdp6uVyyiIAyAFsAQxWb8ms7a9CBMQ8eY1nTRaROLGR8+ajNYIbIlaAEsU+O0WCJPkOIOmParcvdGg/uJFIVQ1IAatk6ojTHrS+mZ6GFwkzAEQ7hRKTRAU0jP5UmWYPMnjkz9hpaHKc6WgDuf3YZAzYTAmXCSirmVM2omItkvSKTI4zp0qT0NBDZAJtvYbOfXMQ96OVFIkGfZcMWPgeSl0d59FSHiTvKrBJA54C/kGS1hp8DGuYmw8a7cmkROcoHk1+Amqpegvr3my5Qe1UINajIcg5Y7Y1y8JZlqis4b9J1FPMkPV4NGpfsP5Kxn/Rx5VRVXbtVOM0efHqO/IBJ90VigkMXpS25cMa1gkKFdin1IciL7VjzFAR83YSq//P81kH3rOi0Budwf6QpFrprbrNTcUCB9gQ9jNLyOdzxvflpAeDfLpVs0FDDUAAl+E5zRLY7W1d7+380SN4a2f7Y70FbW2qzaPc2kZfPPn68eMIWMQC8x6j0oazyT68zWQmkHkwnpw5a7MVybgsHN5CDt5dRY6xWOrOdD2LfYABn4NYknghEqax++EBxj4HG/UERmYC7wokxOMW0V6Dxx7QGXCquttKXfs7uqq0uomZuhh2JvpjY0O+3ckpRRAm/QH49wAxyTM4k9Qr1ghj/TG3NWxHllcLcwMSUNfpbDIIyK3dmfZDffqrw7+OT+Cae/LEC7Z2abzK3hFugzaoVTpbRUw7orfz5NNn72jp2U5bHDhpuRn3pzT/UPPkm8vzryIwwJx1Xjat0CITrh40eYZkD6/mHvx00WGo0Y96r1Xds6BAEQxz2cXPsZnrmFxdDY4YxjjaRzJ9DibRKDNB1BAYFIu0Jzv0HUaBkGC/T7APYwSdsACJTPcw4KUNeGitdzbghfWszvFR20dgef8DsMWGya92oP6V/tOv8VXcCtFKAwv85/2TO/wZ2pEh32GJJFiS/tvABt+i7WMP0R4OCAa/cNxZ3Brc2XBr/t827tnGztr7DVTg6K+PylEYsiJTb3R89HIkKnBQQP0fsfdcfOxnLD6nngYsWDQCZ4UBNh1PZpRoGP8aozA2elyrl7HASOPREeOIIHpG3bG3gCKeoXb+Ih5Z4sjSDA5kqTcwEuT6aDQwoKtykfB3KEtwedFWYCk4OrHRPb3Y6hrAh+QAiUDUC9VtEDLsbZtTO7eiLjANhTmoHKQs5aHGrYD/kfrywZU8RoJdvFsu4/Ak1Q15e3ygUfkTkOVyfMizejtNthoD6hM6psiDza7kuHFFcSSZkf59gIrCbjH9Qsb2AIrJ+Acys5PL2SVBoTjdhGMYLsSA4uNoZyLuwdxem+Tfr5Lx5TS5DCjtkmE04Zlv5udFb3KgMLRRqJa7AOv0OgEd0ZyMOPUUwJg37E8wwamu40GHy/40kw2d4m90kSS1AMJDu1gMynRd0jmNtFE3Dwmbe0AfeqVRakhARqCBhBVIzQotRTDtZiBEgBKgwFFrTSloRtoCWbGdGgizbgqJ0jrqdKcetsTbTe/gGW0udQLink+T8+4x5m0af/10mlw8mdxxMN2GYjrW+/i5SWugBcxtfxqvs8kdwlpYaZ2WdTH0gohp7Fl8tiukOKWWZ025V+nNeLRFw47AzGh6mHfqRs/eXL96/qd31y9f/zew3uOLyyejSU+0vnDaf2iBZ/EjYMAYESbRcs8nqL6jpsf9pgufnyFbvbpjh9YZTAFrMHtdjuHflBaVjcE9gKdXix+/ffXy+7/GbN4DMowrkCaeCo9NMTAUpy2M1dGIu/eNsnXRGnET+Nf78w/Bw+MP7UjCEVepy9u8AhMUeHg8+v765YvXQN6LL3nR0UspGYDXnSKCOCUF52BMkwEI+X3+wXkAqF4Wt7la7MHvqih2szAVSJNSg9lgqinbAJSqaYU9JU7aOK26wbweR9hchs3i6QbA0JAI1jvSCXud5uuco1Y0KRoXbHH1zO50q8oNGd6Xg4Y34bZM1oXa9K3uaB1xugDnnSIhVAE8VZKhXBzB2xl0mts/Dy7Ru7yu2VSKwXai7wVOjRq5wgS/j5LisiVdYpNnL19fJ5KTZ+bgyoABZIIwhGpqk4G/kbLDIpThs4mwMPE/VBoxpqc2GCTFLbPc+tU5yvbZIVSFkvmN3ougJcsnTPL22SqsOOlAfd/r/kGghjIYe2L9zQCSTqG5AL+G/x9huCYOBIMkJx9M6EYRZziqGlWUqo7eGW4h4tHURSe+o4vOKths94Uw0GFCWhNHwjEUtKQ8BmVZky9A2BdO4hNbRFlaPpS+ymgG5yEXqgRbOfpbOZrIQZ20Gd0NkN+uVMWuCAJRoM+DpGuhy029DRvUShfBM3kpYL8EmVdq2usqhZ3s9twbG2ZlYUbQvvgC+SnoDH5ZsYClVFejB5Ln1eAKHKXtC2kD1GGXYH/AXLsa/X5M2E1skrz//RjeTeyHJPn9GC21iZUh+LAAl+dqlLgMMpmUV67oBF3CAJNWtoUZ41i6pWA911S34PeQDjTyzk6VdJRdpthliZmFDA8AhwzLecD/2mmwe0BmsCeHW8MRDEcsXDImHes20Se5jwgQiT6HyxJFxpJJuaQ9t8mY8FEVItoApoxPs58A8Hc0N8PD5Umuk7POnYiJi6WDMZ9hUMn5ux5Z591zDnSJu7tMxqHLzYKdqxYIJhjDSGy3Q6kq0gYpDJPsgLlJpOY7TtnsTIVFUt8c2yAxpw8DFITIABmV6kp7ZJ2wpSiAGIvKuyGiLrD+qktMR3DxokPKvHNJWRlDMNw4mMMF37pDSV4XADc7CvgMoVFAAWVTe0Jp8z2VQxgcjPAs6DJtTACeg8Co7BbFU8ZJL/8OyJ+5eTur8CvQH/Pa8skIEiiW+SCA2F0aWU9gB2ekylMswJL9fWlqPXc1cNGYttYt0xi3w6wKcDI6ZamysP3gWFTax6tqU6uiBSJnTX9E1SXbAFYIJlgKrSzGPWAPYYTVsMhMnMZvdKpwArMWBwQX84PA/AbwSgtMJZnV3wEquCaYT8pyCxLoGLM+nS9chCEnh0huTLKGmae0S76nXwVxNcs1XR8wJWRrvafQXSEgS3K7EF+/e7z1eCh2jXWFCYnpc4dPUTYl0qpEPkKLVjwT0FPmqB3cF5JvbTDYPp+3LgaFuELVQfJkgj47PHWsc0NiaYe6rfeSZgVR7ETeAiETNNGCz2LDS6ovHHNjPJPtRA2+DBZuIcGBTRtck7Cy541YIknoioQkdxxPlgniYaJagSyvgMpFdPZgnwfPnlRqyrwCS6Vo/rOcKJvdSrMsAtBMWZT/JRwGMjrcQcR9uHPHRSmn26a8sTNi+8XqWOs7qEB9KVRCg/qUEPd7Qe/H9P9+CgmXKfslk/O0p0LhF2CRn3g1HCUXY72Nk7u3yhHKk4ml2lmLvtseOZuxse/YZh7p6I765WKeINDAWPF2D5v9wIWV/kcDfBJX7/CYeUB4silJ9fZnbbXXqVKDcH2hjpREQSv30RJVK4yfgJwegsSYTdHASLfJDqNoKCz4B66dyoRpJ8KtGi5wAkvOhJsV1e0Exg6iGdYrn0ZsaOY+SXravfNHWxQZRGChoJ/Icp1UAM0W0QyNRyYZ/fRFY6X4br0jH452hvAcNDziTX4aaAb+jUMxtbNTpIrQehGt0dYYDnMY+nCYB0tJrAlAb7nwMnCr2bQZhoE+INo0HSYNDfXTaEsHUAMRyndUxAQeqOSaBFtPUwzDKoe8GSQh/y3JWVhKnGQAe2NPY65W4Ns2wAHQKyer6R4LCJHnyWcdQRJ4LPOwFg0ppDMW12GImzQgHbe7Qgd4WsSlU+IzegbsQrsLzklmZUuLuT8AeBcswlyO8RJdoOXvwr3wThofGvylMAAXVP959LEvbA4MrCXcf2Likwes9f/uMV1pyi/iKU+t885DHfqXc5+KUHVAIJwZ8xXSy2dkPajBPzJ3naS05PuzN7ZckuxZLj0ger6jmm25hKmC/pGpg4bmcok+b9vjNChKadgwXOS4Xpxm3gNJGAI0Z6fu4MTknLBZG+dhgjAMSlEEEvnaDIZ+utxPbPuXLXXBBD8Hna9K9DwHS1t92ogAdhjUkS1ndX/g5Kdp63b7fh/V/PXnMSUVfDnl0Po89wnnedi/aUSvLU8n5EqtM1YNCHwAEJZgW2IzsDqLhgyr8sj+R5s7b+kAZgReCeoDYuNBdo4OI/hjWBjgLhNEscbT4azAsTq7f1gSO4qoDAC06XQfx3I/2tMjprMYQb7ZR7Hcj84rF80KH7pdjL1yP6YhKmGAK35su7XhLv+rfRkEvtqf7esoBhY+BFi4mJf7Ec2scdJwjyjE1xE7HCPj5GubkKDYGP2fG33REHjYVZD5fY7PtnMSOAggPEwW21bdsiOs12t0r41AAlHLHj5Kja0pfI0ruIAqHcgfU2Do1sXeQdNZU4UeQ232wAprf8EDK0OJlzODJ4JDcG2tWOkjCL3o0LDTE3K/gOGbl2PMIEvAq3sTRyLSIJcO+mEV3ovg0BheA8RwA+2SL7tQtyoviMm5VvmgXWQbd47lNe00VURtdVGQC0uXW15h4PCAKf0Du8+kzEqwVFO1d3As+Dd46cWnWd9dv2xRN7CcIzizu/EoLezIxfbDKHy75BmJ3zHfcrv4D/rn8b89/vPI8Y2tj4Xu3jFab4Jw7Cp6MEUWPGb5LnhqMMaH4alwADzfBM8VhoCsjlqsrnsXhF4jXj5/RRYeyW8r7Vh3EBQ3lPogFgI5dxJg8Q4eDSMOw5qsgmrsaoXmufPKSN1xhJZH6DJzkQMGUHFYmNAluU7Vx1ggnDmmFsNtj4uk2NxKQlTKUvHWcsmLZSt3GQd+bBiBSIs8vZlRmQn/ZDo9/DPel0zemarIfvdwioR6SFcrHwYJ5FNjn7158+Llm+tXL3Ek0wV3/R4jX5sdSglYgoWhjoRcV4go4N1LxIAAvWZ9C6tn1YK33Kws7Q9oO+HFUbCNxuwAY01asqnUceJ7gGu/XPonWl/wzFdGYwAYfUNncxLMAl5QO0jujQYtiHPwSPdEI6AF/YgxC+++BoPbq6/9xi760cXXfnsH7/jaa/9FZxXhpdegmbgOF8fMy1Hmgoo+M02WzC8JKPWurYVXzRgTMbdOFV8GThcyGh9zvKLLdlNk5q03VE4Yhz4kvpoyf5IroDeVAUHEM8euxX0grICypyGA9DsFg13iwCOm3qAUszj7DCLz/iCgM0M4HbJYKbwWYd2hi+byAvn+M/oh8cJRWvwTK8fuKItDGCI27g8lp9tiw84T55OQecYBzZmONiSiZEcGgRjK4h3UMaG+kw66cFTmgYXtZP8XeHHcyX8up21VxmlPW3i9p25EoUlJeKqq6uiClG+GLzmKlvGBKUzYGbDurRZgsS+wymv8qsD7D86agJPkofYqc7D3jBIamVgNnz7v/GWA8EsF79ebD/2ypb/oI5dFRlC5ivHNcc/XD8ajt+VNaQ6liKGHnz4/9HOsN+1t8dVvhOpq8yH5Y/L4/F+B7yrEF4/8YA3c3cg+9oOpWuHiIrgwDyLgF0C8cGN7AP0J/yVgn8QQGPiTYAPw5P8SwF+2oxnoly1QkRy/BOzX4XgG/LUADgfSzb92Ojz5gxN0vh8ROcYj+QIC9nfWdVOyBRXcLKSqXHCVtG0NWq7TZJTp0i+676o1aN9aTrHRXVzYAgLkS2N8NC6qFVA2eY42HIxAgy4uIiAAcZy7IqRadILamzsdr2HN7oqvAqi6t8TuBU0u3fSftBGqiJ9CVqlcRZLvYbR1I1jm3rnmEtbITZM//IFF48l6ErNbYdVtMqcg8xJnW5LykAYajqXPmFcpWcDjxmG+DHyKJt2KAYJmHRk1B6qjKDj6464s9G18Xtgdhv2v8glo8DNQWDf6eDAVqKpq02Duk9ECehxUFdwI4aN9xAX4j9uIM7WXuz3IQqTEMANc42duNoYst3/GPxdCDh9p9/JKvFN5DqgYMkzIGNMguoI8URa+HH8axk58oWWWBx/YEF7BRs84uryVX5J1XFh163wfGIMF2aa8Gs3qj1j7jzOjwxN9k6WChb/IcslKc1kOX3wu3ZUackV5Yp+P40fcIhpCoMbtTR5itwYLgvCCotBPf9RpU7MR1rBVAtZRU2BocS/ZdALEIQQ4VqoCUhIILEexUvEBCGUumNPCnGDM3GUVrQ8QcXg0XMCrvSt1mFKFVVRsequqnFNGbMlw7MCSGy0XzNqlU50vp3gwxcq1p3YqyRHOBiMb8OhSziXdInM1RggMQLjSAtkU4h25QYJ1QGAGWgdVie+/DGnO4mDpab7ksO6mNJWv4YjR9zlC3PuScup8fau9iMkrQGsjC4pziAQSiZqTe4Qh3HyNdUrG2i8w2IiilGtFpi4CQvcGEKsB8S5Vl+6a9A+vXl//F0IO4123eLUfz65qpdrUU9mdSopdt8HD5fJv4IGiunG1STtV3ejTTp9TDbhJcbqJdm0Om+WYJ9xM/3Wub4NCNr/GIfu+U4frZilv5yfYEQCKQPTHiRk69gtaloju+tX8QSaMCCLV4T2r9QDQoBdCf7SfOyyW6nGnOKfMmvFSHCvO5ZzKI2EPSiHcPqpQ8MFX2cIT+OClPJRnS5IhdORYFsBQDo/wMQQhUtbq4wkoW+hJMZSuI+hkZOwJum+1IL5iytD5jb4jMjxV600ia1H9HCi4tmaT6EGBVkoamsrVE/f+aErFZaUlCwzcz9x/dsjq+yZaXjDFOTrLNLiSxjZvIqqG/2FlA/91dE34EOoc/4vAefPVbW//KwJOYTJTk+5rDd+gdYEgxg6O05WFAoNgO24q0KkHlfv7x4VJMQ9CT6fMKx6rQwX49sfvkzFpGpkm0Ib+9t1truma7B6kXxp+EMexB31lLMosouL0CgtvMxEgZltGo6so85ILK0EZWuuSfD0V4eUg1mNK4EwqQnhxWYhma7SDqlqe06W5DN+J2gTRSnevfi4CLJv+0H2gglv3WPdQW+B7rLuyMxAQj3qGohv6aHd8BCK+LIyCM/IIt+2hpxoFgO9r3gPp50S3gGw+E7SVSB5PGx145JY5/d/GOXPUCxj7M/u4LIhwu+MiNQnZQDLwnGKvDJ3skIGUtSbNqSrIF47gopwAauu8hiAJC4l14Wp0PSBqZfyz0xEcYUfSnwedg77h9JtPXiM+PkO2N1jwPYyOm5PNufvKJjRHFkDN6FqDawxOOP7Pswr/g9LgQXjenPCd4v0+zJOOJ+L3kK/E3ZhUQfac6vEfcHFxmcOOW6rz3DcVxrHgXCwEmv9gj7vrSlOgzd+VON/hO0oZYa6lCMtVaCd6+UqXP8rrkFLMA2wO+uog9zG1FiQCIGcpScGsUiBDKmd4pXmVNju+j2JDrSngsIA+ocpiqqF1IINiBJvXjeIPi0q8cHhIaP7ib7r2uRY74wAaCwMf0ENZE1SMtIUeFLFs9k7y+t1ZNcCOlSsTw5VkaBTJJ3qUlG+kNUclehnasOrJhXf9jqqsT44pFtyXdAvU1SazNgP2yvf0NTExyGJcTprMQo62aL1ETYEchmVKz14/v76O6l36H6dgiuEBIMiuBrzDASSIhKwrg8kLOFw+c+uYfSUV7o5T3na5ycIZMzdJkd9oLrFWxRfgsHcs6Z8X0Hgswo8usLicdoq3iAZCFCsVXMAEZqACJySS+zBuWxpTc8yaAOTdChT89oIcV2+Z9E2S0zLKnX/gtnUoptZ0+J1Rgl/RdQi66ofTMMPeDDiG7O9pIbnoEtPV6AeqzVHlEUMoHGvnm/xAj9koCDh1bB/QyTu6dgnazYq5QeoHCwsiVUhfU6EvWMpMBKczWyA7wRnMi/aaj/PgVvQllRHh7m4cEgqtW+2UrkRdqgbPPVfmq+Aw1gH+rUx0+pYzFVuy6n+OL3+Lb7UgGdjB4WI5nzPki1ArjQkgIlnX0eh8gsQ5sBuj/3UfHhmsPcnLibtgfM+ilCjZQfdBYRMi3Cjshc13fuOjlzTxSrqbCPknPuXh71L3LmifxtRj9r9QSwMEFAAAAAgArqCbUGeOAqzCDQAANjIAABAAAABjbGljay90ZXN0aW5nLnB55Rtrj9vG8fv9iq3yRQrORJzmQyBURRrHaYy2cWA7DYokkHjk6rQ9issuKd0JhvvbO499ksuzEyAFigqwTXJ3Zuc9s7Nrdey0GUSl20E+DI26uVL8RffuqT808iG8nAbV+LeLnzXIY7dXjby62ht9FIWw3/faHMthUO3taGCQ5nhSo4+IvLfftpU+duXghhQAwJ/jzPB3//g0P9APBhbfDpdO9ldXV2qPU9dXAn40v3pNE168dADu/Uo2veSJjgQdwMbLbPeqrbc3qi3NZWtkWUsDq1VN2ffieXXQgPL1UKt2qW/+KathxYhruRfbrWrVsN0ue9nsr4Vqu9NwLfRpgH/tNPzhaLGlUbHhWaMxBoFBfriKVriVAyjB+EUeIsRGDifTCjtlGa2D8yIsEtiw8OY8oYwXLe5RSUsYH+M354AK5WMxtZsnT6fEMEq/oKWnILh2tUoxNaqVvxYbwWYx9jR3iuzHCNvDCu1bPIA6RA5zv1z9HKsBbdjqYIoYB5fvRx5rBAytm0eIg8sU8grBjuWd5C9bcA5ZHpdW29WhNL10RveReNGLskFeLqJs2eQEQxTsFntxKHuyGothgbMXESmxu435TUzYnMFwM060tKRHCGGq6kWrB/GtbmUWNxib/1KqXoo34P7PjdFmuXimT01N4Lia4NUEr0YSTxhdWHnDuvwdlk6XdS55s1jQN9nAXESvetX2Q9lW0onn5jLIfjUFZauRbaVruXRacMsm8rP8uRgVS8eJVRdf4jJh0IWhV7I/NUMagBaLxTe6qXsxHKSoyg5QyBpQ4Uyh96z3s76Dj8/++kL0lVHdUABUYtYcv5KAADHi1LbSXIMga4gNW+Kd3qQx7k0+ACRyjY+V7AalW3oEnHu9QUET1khmH63FG6CVsQPZEIIr0NQAFCIPTHoam+zcjQUao0Id1aWpbdwUZc+KKlIsMR+AK36dxSjR5DxCiOqGjEdYCynPpWrKm0ZOVvIy4pX863glFKBAAeIiCpL4rTQjur2MAZV/nuKx0meJHsquky2IFAhFemtVT7A6gE0AHmMdTFnJm7K6m8CSfhmUHtmcvuiM7qQZLt64WCXjAAf2h+iXTs6rSHWnVhGznPfJVEfOE2lzblkenVk2Yy+/aFHWZFFLcvfIQgvr+hRHuwZkt1gV9il4F1Hyk/mpXcA8+NsPrB7hBgzofdx4W32EGTCHqYVOIiKxTWH372VzcnGXYcjue9mVBly2ufiYs5gUDJOFfjOJfUAuXfzh7Tvx9t0fFwUXtClyLC4ZsNhu2/Iot9vrKP16/1h5AQb3wSpTLPRdeUnosjH7WaNeEaeTsI26w5Bsgxso/axq0Mb+1FaIuGzUcBGDtvFblIiruoNgcTyCxgXWJ4SLYzplPtD8AILGal10J9PpHtXbAqzqdUMxVrZnZXR7lO1QCHByUL5uG7a1e23uaD4kvttGPhkOlFVr3Cdg5S7u1XDQ6DHtBbcc1ckYSHoXil0Dlh/traRUROhuG31TNhTVTAd6AC7BWAdZsNbWaENHV7SsOYPBS1nRTMks4VdOs8i09di6HEpHveoTVbrf92++fvI5hG00jhKTIYL3B1873EhLby2YjaFBPrK4OC/hNgEFCyphTaDcgsy+u4BsWvGpYPdtLkXMJYh9DWqoFesWChaUZawNcS6NwlzSE9/6DH6janTgBA9UllD1wfc12uLAEiBpAV27N+Ykd9dIcEsVEdJL2x0CEVTc53lENrWNm0G04tTL/akhikB494hPPpTHriHDmsPU6yOIV5nqdOQCqgeU3+pBcnYy8vbUlGTzx26YpedeNY0oT4MGf1VV2YC0kf1gEolkjuphy9EmK5mvS/BTJxpmk02Co1pp5BwZYLq9NGcwFErRtYTMWqPCuMLss9KaQ/Z9qx6edAfV6F53B7C4rutdyj5LXAtNBM0gInIOWatVf7EcQGV2qg6MSpbwdCwvaORHWfYYn+dwRAzZKJAvDrkmtM5Khd01Wq978ma5IUFfR+rYoFGmWwqLJp953OBGLE7D/snnIaxS5A3D9mlUm7S4EcG/wWTfvhsNejJxjn9JJwXKYVJ4CTKBnfbWRpUtmPAtZQwnoEalKfrP6iwxALuwzWkAwyWZt01PaNIuUCFKNGjE6jHRvoYdM8xUXPbvcOZO4D5O3ZzAyWDubrcwWg+L3c7WqhGPQxETOM6UwEGBCBEL4wic084TZGuZtTFK9mQFKd+vCBsTGEc5D2O3apDbMKiU8dbEU4SqRH9YOtUm+0iPalS5nItTBxlCLv2E2WbGF6FxVthH0FJ5azcZyDNnTgjacX9n4gCVbrRh20/l8CfXmxMWMbsoaAHCRcexzK2QigR3bx5TnPUhnunGRR2HyAZ4TCqI85bMjhMnZkuPCJHsdF9YnewCSKQZzBgBS0hawXBobeBWg0RhBw4bUIr5lOuhdKGMyFkSgi+GIV3hHnTZqDvpCwT8cQ5Iq56VrRD8QrhWkgdq2oSx36yPcjisd1wm7QS+6TrCUBQCOOsReQ3FzHotPis+iS0GXWq3Iw2Cu1A2oWLlHuI9gUTIbLIhwa6j4oRzATJLPYYWc+mlL0grxRiaioF5x4BlcyJ39RLSuRb3B+BTcn1kqyJb3aC9lSAbmkh7S0hRbw5z+Q0yEOiJ7a8qMTdiXHLUcB6VDzhHDc0lHzpcH2S2MxVH7lWQpm5qH469uMajmlDbYR21nOw4B2o7joE6HgePqmS9vVc1WPkm6mYXX7989ez5V9sfXnz15ps4zObGAfLzTwLZnGM4WbiISMHp0bYZ7YFCk9e3gFbJLL/BCIXeRHFO3ElfOm5R2VVSzEGC2OyKpo3X5x1ekgmnNDAC3nPOMhMty1qKoII0fZt+RlJRR+y/JSvf2NPFG4jdL17+YLCj4vuk1OoDdJvUsGfFPcETL/1B6H6dXmZFN9HMDIWEaJbASV9hjrJkqciVr0YTKBJwY9kPYRI+q15BTcyxZck5Y1x0pEK3Bxk2vWAts0glcIatqevc+pOEVWGwa9Itud0wp1GLfPH2HUxyHQVAuJoF2Den/jDSga1FAC5l9qAg6bS/nNeUnITzX0PX+0ST0IwnVGgWS/TF1bSgjwM8HwM9ndg3gk4NesImops15vfwhLAJ4VTEc6bccMZM+eKcuiXOt2XbqyUntqTsyygHNzmENbvFiShCp07oyJGNk0bEYXJzXsGq3mINBVzwwWyRGUyArZVlYadjCahT9gjKfU4T9FiAMJ9OiYvJiIeb5wCAk1AwBskyFfvTGMDRjIdXY/JnyERTnpCe8Mz1QbT5HMwlNQAs9O/k5Rqd/0SVrD8ep0piai4W748A9TMeEfsKvgCyl/B16hJggxb9nA1maYt/tWyipWjx7Fxuh4rnris6j7Er+2nDZ1oCeLbTxVH/yFIy96IklL2jlJpJlrT3idJakNhetbit+HAdWW1k9PT/IvSkvAmV+nzWD9V6bg4lfr8dSGY8Gg1mwmAOQTY25CNhDjyKFJMYmMyfDxvZeDi2uZn9x3gzE5oyvPEdnd6GxkGjwktpbrlXEz5F7Yx4fzP6AvvD6rD1hx499fSi4dD9CB8//hjqScOdh7Qn8oIo7qOuGJ5RtPOHFBIpP+Frn3RqQSD3pcETiloZWWELf+D+cNIv4dbSNTfLiKgdeva9NnUsmrAAOQweSOu4w/DvChsa3d1t8Yyxw+5PtTvfuxB6HyJ+oGHczDC2M1aKNZ0RrXd8sL+zvcFHWxe/z7YuRtp5bxcj4LVnIHnM7hoBtyxbfY/XRVBRO3fsG3cdXSMpxuIPkDEu+tPy37g5A2paJ0bgD9HGM9EfeGpQv59ciBeD66JzI4yZxyyQnPknPzyCdSev4gc8bPCw/NW3fm9kdDQ205/HFenMAEoOCTDOpMTftME+8AAShSlDHnqNlrne0QXAou8aNewm7aRJJwu7hZT7dj40T6Ee72BNe1YjA12jZLh9pXmQjhQ1fQrTsFU6e8YUfrvdazqffP4ADGZoRYdnaq3Tp9pGX8d/rZeTT/9PdN2iaxj+og3+yBGp9gm9aw7zvntx3sAft32hv1doa8CSPdRKC4P4skiyFA+G+ylRkwx/eOkqXKJCb7tO7nNm6iecRBW2t1mCW6WIs/WTP4uheymg9KLTsF31n0fbeVs+/UVe6ILD4/hInPmDHzzy+QDq8FwFbYvY2RCbYCjL1XVYZ+Ofrl32zJIczB2VliniIstAJ3avmR5QcrmoSG4WuR/uzP2sR6vaRyxhguh3MGUOS3QzKYtldDkvuoQGATVjU/ibtBHADgPkaiqZLNBi0hTK8f70Kqc1X6fPKM0yNomV2eXoek5O75HoHicxA/sBNpPdKY1Eleu/0BS/XfBh5sdPfkavou1FBuJ9bcUIM28yJsGJOJvd6ITNSaDoaUKRB7OdGHsHM23S0A2eTVp3B4b58tOGXyYT/O2ojT3Hz8fWTTDyfGTehPuX4wl8F9M9hOHVLzwDha0H/g8BvgyUuY02c9TJtzuxkMH/Y6ANXn7Zw3ZG8obc3hpKK2e+kUOXa7Bk4upeG74PxReD/GYh0CTw7lOfT5bVfc1tE9y33deRsQ3UweL//VAc72p8joYBpDoAAcuoIT8J8NyCCGVY1k08Jlg/tfVswuD/qlGYIximXA7ZTLB8+fo5d+hfvKSH1Rovfrf6X1DxfPnJ08+mSQ1bAf8BUEsDBBQAAAAIAK6gm1ApiIzDIRkAANVhAAAOAAAAY2xpY2svdHlwZXMucHntPGuPGzeS3+dX9MkwLAUabZJbLBa6VXCOH9nBZj2G7WwQZAOJ6qYkxq1upcmeGcXn/771INlkP+aVyR2yF8EPqZssFquKxSpWFdX+UFYmKfWJ4m/aCHOyqcp9kgkjjdrLxL5xv0/49WyZlvuDMO71civNUlTbi6Us0jJTxba/3UblshB7uTTlslb9bRAUttNHbeT+BoDYWJtKyqoqq/4m5UEW1Ebs+xu8/u7z/hdGXpmlOR6kfS2vUnkwqiy0a/GlyF6LCiZkpBu9Nir3778WPx9fwlz63mmxkanI85OTkzQXWicE6R0MNy7XP8rUTOYnCXxGo9FfZX6QVbIpqyQtiwtZGSBIciHyWurE7Kqy3u4SRFTPkuTdTkLLPC8vsZHSBKSQqdRaVEcCIrCvyqjL/IQafAJ/lYF2MtPwHpnUfW7K5ICYuiFflYVM6iLdiWIrs972Ft+ECCBAwirk5XUtldFJJXWdG8LPDxaPg5+x3M6b/msQ1kwCbY0szKR3CGgi1rnEr5kUeXKpzA5mBGRPRJEhBshyaIaUW+HsVjM/2rud0kkqCoRigMap0DK53MmCfjHLgNxJrWVmIcOcD8YDUMWhNnrmmMp0V5qErtTKyGSRvBS5lvzm0ZwAZ1KnlQKxu5DElaTcwHMYhwSTeItPF8QM31NtgNi50iZqjujJqwMgCijijHEAEiN8c6jzHJ4zpxwgZlgiiwtVlcUeSAsdKoVknDJg+HO5g0WjDzmyDuhdH0AMmXwOzF4KWDWiOEJbmKk+iFRCo5cojHnOPMBFpAmlrSxkBfyp6pwwMwDfQWr6uxGhx57HRNH3izQRlQTAZqdpqqRSsHe6c6CwAcFI1sdktSr1DJvTP1oeVit8nMmNQFEcj+ajBIB+U6grgjf6L/ztQH2riqy81BPmLlALiLRE+i9pAJhZxCGAmiyXuPqXy7GW+WbKbJgyJRbYcpqk5oq+WUVA4rJp+FWUhkA2b/FTSVNXRYJAZ3ZJjUPYBHbSoIEaFEgvAGGLCTULxgRZfUNAmTm2sacMKhQSBF5IgCEQFET/AlajBhLJmRd2P57SGqQKxgWdtJXD454TJ4FMx2SvtjvjZgertBKwoGDsvWBmr8vagMxb0B6Il6zZiX82myVAFo2Qs0xm83ny+ezTcNgGW0fBLo+YjhG2z7ixbpbVzKoNyy1VXJTvcYkBybz2hqUDgujh8LpJxkRqngy3ncwiFFv8piYN3iR1SyuH9M5OobqIcf4K9ErBGwJIFa/9one5M5PDVR5oNtCoeo8rOd3VxXsNOMCui9s2rhlWYxtVwNQZJVZNbmkErDnbUGu/aHBEaVBhM12mvIKtPiHidRTC1EMzqJ1zKQgR0neVUDn+CDohe7ZFWckMuHUOXapLpYHLtp8HFvV3CKK6r0k+sTniCTuQOQJ95F7bjUQVaV6DnF3Lv3F1kYBUjEaTGcEmds36FEmwdjeAjeWrXUo3KpDGmoBVsSsJZQTDOxawHmSUbAMWCAt2FmEsgD6R6TP2o+OI8NehwUvaWzjP3E7XmDr+m8WxtR++q5xU/zeoFEDbHP3sQS7NkaYfzI+Re1Was/0hlyjAMnuBxuG4QeMlmBLDGLBuVgWsH6ebN9AhGINYY3ddfDVbLsmoXcYt8JVtcR+FYqrjsGZHoKzWJ74N73zJP/ApTTnu3oGHH+byojF120ADwLD1gSneBzqEBAaDhTHLJLYfj2qzOf3zaJqMKnnIYcmNYvA8IRTlvn3K8uybAviPNqzMhllneTLC2dxLifcr0+USEK+sNHRbj7559frN+bMXb9++eD7yCL8lw+lXxBU3WtgdwGcrUulItz6CWpvE3JEkhl0XbTy5vXzwbmYZCgDuISAbvWRMBhy8Fjp2irbXfyxwGl2gg4hfOwEG2h3v1nO5FvpN8k6jgJnfD/ZeICO57X14a2F+++7N2auvGjl+titV2hVf2BDQ2k7pLTsXAn1O7W0J9rfSnUzR5BFbgbIKbzfqCn7Drk5wwD3R9QEdYmn3HPBhn4IhQX6L1NIZSjtx4WCyT6Kt2fBdWSd6V9Z5BrYGbMTkoTrnB0zTGvYBhMaoAnTa43GHrtCsYf94nKv3zu8wZaUnyV40e7quq0OlyBRjz9SNjSTgJ95Mg40UsBf5pTiiAYAGsJ0LYKO2iq1ZRBImbHE6YQZsRZUBQhrbr1boXy61LGAnBBsNvBH0lQp0VEAPzAwYksWyQPs3Vz/LJW4IK3a32OrQ4OapjUKzg56+lTKZV3IzX/Ggp+XB6BUfB6BBLXC/tG3nbMrHGMwBhGFzAYQXv+zFeycBmhoHBqHvNkues6NAHriB/bzlATtFyIBGoaRGm7AdaNpCa4EmQntzdkgtIgo3ryMI2Cp6cBfnyC2b7z98/GE0Y39kPPqf0ezHUhXjEJlJ2+m6lRPk4MMyLDUb6PN/Fv80Hz7OmuGm+OSGIW+/sTxK/i4M2Nju4MUJmXW08KAEjz4cuZQ1ybjrRlWw7jLgdI+ATq1FXl7KKpKXR+AwwlqvLppFkqwIxxUdOlVlVoOaAUEVaVrDEvWWKYhaAGXlbYmVf4ooyGwZ6dX2y0ZePvDXudNsdObGX1URCdfHxmuBfQpIGPrkTKaBdTrsvLdwHQLQZ6R1Z9LZXgbBRX0nc8+D7h4O1IgaTxt+AXliHGbkBLW29ZhqSIWeFRkTBdq9/u7z7m5JYsQW54y+xzZJ7w4b9sExN2WenVzHAuowDh/emewRiP8LGgcT6gDodTHiJt+HEH44iVUp2e0RjJHzIN1KAlWVjNNGf8GDiddd/RYnGDrwp0ehRc0n0+gnK7PoEbqi/sHk9kaQNXqefPj4pEEVLYqOerVW0nNQSe/UftBOcu/ZUkrdQRGGVZw5w6coKxdpWdkj5dDUYER8Bz4KwVNMb2VVBHyjtnXFR7Tr2viTOrRkSnuuD072HrQ5iGVxisP9TErrEgBMkrO358mf//TpZ3Y8h8G3qLvZrDiihfGJm9QnruE0OV5vjAk2x9gCaNlh06Rlg01vb4O1CEMnv85dTGrqtPKUnUGzA5F4NbWn4DZKAqTT8qdaFiY/2hMrPswbJDzZvN7GAuZrDrqAoaP80FJAawYxxRVYVpmspv4AnrdMO0RzQA3irGF4Xac4j02NZqMNL8RmmiX+PHnaNXpJwGLsCQU2RzOkf9FZgvjhKUKzo+Mnhj1wUpFB19t3tXry+LvTx/vTx9kTpHHw+93jv84f/33++C2+uKlzEjQeMBodT4fNRkud9jkYKy9+h4c09hvQ7vuRGx91UAfx8KFHcPTDA9uMFp/QgFuCn4txU6s8ljj12JrjTrc4QuqshHEM4bZHShZcHNe4i6H54kqkBpa5sTKPH9z/rMQ6i8tJeDR4RvHpBbfoJc7ApPAD+yL171oIjkQc7Y7FZXiv8/FyHuxhNj0nBPGmd5/9zGnqxq0/K8zNZ1OwI8mtrO51PDUkewDzjgeXDe1HHz4629mFsB2KjrQMeiDWdROZzl69iyj0BuPN45BUza7+tAkt2ThEWb0Hda32KhcV7lhzEAoB7nau0vczAL2izRg2L1CjsK8ToCYAi461MmwEiKTCkW1E023fa7kTF6qkoIg7tVd0snDiZQid8xzUWG20yjhOTaDYEAD4GMAG/53PUTAbA7c6mPD+YAPra2kupQ1qm8sykdlW6s4ZAgHtOT6wxDnpEyPGZFhT71Vh4xZ7ceUiGIjZgqLibeUNzQH4Pti/+LG4wsfiquXyIyB0qfD/ex0NX0DvUBRmN/UNjfAGh45v4yfTdh9hxL/4t4OKyjXoByu6XimA/cK/vQFsQEUAOe4uyxbeUYPOHKK3IDh9KPZB+KKLzeRaMnYda49wV4e7j1Uua7Xd8pLmNQCjqn29T8KoWHj40guLCHkx7eIdfib9BlCPG+M+kTvjwbTc3hbvfwktKKQbEQMW7C8kxoC9+SsRo+8M4HZz53i9U9AwW9JeaFPDe1C/d572/7Y02IVcXdxh/3Nb3oeP08hg6c4hiKbmpbiFLbHBZg9qSRDEe9sSHcr1GBc0AnpwB7DJDCN5jaXRstNuTfaXX58/DQwPIijzIabtvY0PGuD/rflBXPw3MD5iYfjd/Pjd/Pjd/Pjd/Pg3Mj+Cje8uBsiXZZnfbH+soZUUxQOm2gDASa9hgm/adkmc1sEhoUhF+/jMeIRBcjwKMvjPZ/jPUWr6b9Q/IGXJuWe0BANoFK7H3hv851P8pyjp3wFonIPuHl57+uKI+iCnL1+en3/dWEHffHP23CcYXsvZulbZ/djKhRjYvznp61ibHH6kzaArBD5vbtJd6DHLKc1JjkdCp0r1p+8gIjOc90MekCG8Gy3XO3AJ4QW2KthwfTGv5xLeg60JaASWKldgUCo+mW6VTc2Fr5eVQkvb1a9gzQwRHyDUpsQk75QSZ9K8xJhOWaS2CsPWbBgpKp1k5SWIvNiwXSwpygWMI1Ab2Dz0DmszwFaGoSbWqnxJhQG2sAOLhWyC9iByFAITueXvanVq825UkQGSBmM2JqMwD34pKQDXyobegyjY4b/0NQZTGw3imoceTGiiaNf3mdMEzHaCwdeqwGofHCjhA/XWLFzaXcAfSwOMMLF3UGI/zLtw2USp7xYE31a5+PkItngutsSOqsQip00zmyaA5PDb72WmgFTAUECsPthCCo6EnZ3PIsdDudodjFXiWDQbXIeZqDIuq6HlCaSGrwSJ671AeHRyKTEfS9sCkC5Zp24Cpcv9nnGoE5tS4rjFDWYCDVV+jHsrwlAbTPuy0A2WIVWicm1pJVL6DHGO4FGaGC5UmNhOYrwU+iZ1AXACOtB0AfxeKAynAms2dc5VRxY9Rq5hL9JKXJQYfwcU+YljBENnhLEoqkkOM4JryigL/Bk6jVgTMbVEC702O0UBi9IuSZC2JmpJqUFYCIDoQNdt6XxKLVHSjJNwXghaUMwkx0gkstCLAiaB55Iyjjz6RLI1rp4LVAEXrFLCzLokL1Oisy28cDrE0o2qoghUJbc1KCjAHvmIhT7EfWxYUbkGLJz+7DnsfiqqrfU+92Ulw0KUIR/UFj5yFv1AfVCrAKnHV4125Smt7sWogs3cLUvruVI5pF6M2NeH9yhH9h1zbtHs8h3fFnXGgoDHL7zKWPjxWg1oWHxNX+KXJMoLwiR+wQjBK/7STBv2jzK/kEvsskT1Eu7psXnWjHCrwqgICW8uLYBRp6Nb2ERkYo0uRz5AibS62TKLYD3EQRhgsRNaGJdyT/nBIhtNUKu239CCbJt8AVpBnrD7WJbRFLvMsEZKGyNs0JP9DXBcNWy/w2Lx9PScxkI3DUXMS3EgQDc4Yxa7Vp5efw42JspRcV5ZLMngGOPpCfy/xFBWnqstHVx1B3AnkzFRgK28BTIwXOlNTfJgMPhhCBHj+AgLrIQ3mrBojwv1sinsk32mlte+LTjC0BuJ2+4mssTklUxrUtxjNDzyWu9wZ57MqLpLtOC4XlkpmSvyCrQi7qpPtC2zxTOAJ1QTDJuDVmsFCvPYzj3BDFKsD+rg7UrwUFk76x3WxgE4oH35bguUq5Vtl/LqWVvYbxQn1E0B728rb6443Ane5C4lBNeCI4ZMev2PTdvhGJ+dk7sxTc7f0pcJGlJyjjQqyp/EPPny08/+OOCLdFAbPSMzEGlFtg5yBxMl8O/1ZxnxtQHef4mK/8eyS6KeQ42BA43OYcYkKMs3u6G0PtypvbQEp+8ofHPqPl+hxltxI2u1g5jibHl/BDNjIysstKQkPqzgf0nmHywr4NiUhBZtlHJj+cTFjA0NCcwOrCc0q1yJrE5+rLXxqwCpN0MzBtZblh+nznmwqFCRZ1kzRmuhYTtmbGxdLRV4ezsMVlKmKpmasgqyw6yl1BTX2nL9+Tz5U1Neu6KMuWUm9G6VXII0UQlunNBGKkDPeV83rmxgOoCAr+6nbrjO+2SIilfDwhSyyWe24rQp0a3kTzWA5vJ40QeJMCB1BQ4fjB1qLUpvR+t3U1dkTzoqVrIPlI+A6PcKFJKtEHVpffByWb4Xx3nkVQnvIYJrXWrQh7krNg57A316Ozd0uwkC2guYmEl8YAYI/5AnRhsIS1ALeTRDOp3dw5s7s6mBq4sBWAZ5MWCngFYfqnbKjbS9sl4NQp+13KC1Hl96wIU4ZXEJvqR2mwWVFw8DopAb7VBiDYPWhkMb+rjPVcHs9uigiJlhUN4NlFcHErkEXLRMnh7A2VBXU9S3dvbDMKiACmfBkp1hqAU8GvKvduj9YipuROFmEc7DBeBKrdFqxdzYBNNXUdqhIb5wJxxDqHif3LnfzOI9Ojgxi5F1dG42Bz3ma/zd/SDu4g9MWvVnBzXPcGBsPLSSGtWok4xW+BJQsaX1jbPa/bi6chlZxd7zlIpWNVVZJv2KBj411w7Gxz6kQrFiCn1LLH4H+0MmWyq/b1sgzYcPN/DMx3rleG+JJpuk5Wk+kE8ZmACohNlNbJ56pURlV81zp25aj526aINxmqDVPFz47S6NyLbfeFliB7fXp+XZoGdKX1qn225SmAjsvsdN3PyghfsaN/CKceEnHTfwym/hZ99u0EyeGjU/W/6ypwT6zP5H3IhW0KKhTVQS0po16h1fieM3jq5ZFx5mjLqv/VjY5mXUpgkLekJGgzZ73fCofue6aejn3YZdWzkCjd1vgvqa2gReu6xS5s6S6xH6Lthws3YmYhQJpxBfE1HwwbqecEIbjg879HjzmCpQXbjK4cFi69uEKh0sG7u4BayeqN8dsxxaxxBKO0nvEdr2crABewx7rUenGOM6HU0iyWea887XS+HI9ugniFOpsIxz/AKca52C9Fakg86nvnjJGnWJ6M8Ol3Wzet1Iv1isedy7Y8S3/3REtD0s4XVzPBrroFoe+i2iz/EamvZ7cb29HywY3WZxV+GwHAFLZm+XZ2/fvPhqDHODLRQPXnrOym5LLDKu6fghDmHfRI5fJQ8hnHikf/28n5+9ecB5e0392xCS8JdTA347d4oaFq6gQix3ngoPvl2e/+2X0Qohu6F+u8Typs11xHrzIMRyQ/02iNXeFq9Ty+646R2W7o27NyXFB0+dpMxyYx0EjpaKw4H8KTIYyuaCL16azhskX5dTRylKChsn+SYYxNNTtylRcBF97lXBca/GU7S3eRCwtKwLjsM2R1p0J2Xbh9vQ8Y1rQgXM6CQXQR2msAe47gyNiGIP0YIotXPX/XOqOQ1D2CCig1gnRb1f+9vHXvYE86CDC/tRReUpDrTyoe/mPkhgLF+quD7amk+RvD6aHUYvqRQzpzJXikMzU+ITL6LTPLyykQjX5wHzdXvSwmXqxZ5gT3YrgWv7RDzGIvneFc3R/U/mOOExKLBLbX4YuoELl9NQnshfPnz8oiludHVt5shGdzNCg4ordrztTV88ECzqcQDjnuldCIU1Al411ILZiuzRDWO4JPlesc66H51hPjbyDKMMwmZokxQGQohl2rBgDccXgKOjLqCkuQqNb9hBOszihh3bmwQDCD2+iqZrST5NrpDqP6tDMEMXUkUtFJDOCcTUqZuwiDa871BQlIa2ABjkYAWffJXCnoaTXgF6AGsr5Y6QGuFvRBj/39ZUue18ryb4imeBR5dWyrqmOd7pBmHivL0mzQYp1OKqQdeeSbcXhzFvGbZH4N90/STuiIRyrf3r1jSau+xivJDAbZRc+NjycjLQrb07hGJwjCnmXcbELj3MWamaHzHlLBC+DCoGBCzttDt79Y4ePaJkTL7rtZKsjsnatCaopUhwLSYfVspU1Fr6s/tHlEyk3cWRxGB/YitSU9vTwrXiMAmoTZtRQueyFkaTj8XF7DZOyaAVQ8fRL+GPKMyMszzQybVj2gTNR9ckeniqYCakt39CxndohWmOcV8qUOi0o6IN1/BaiJZLFtlndHmPcDc87GFHEe/98lnC5Nb1drm8Pq1AaV2vafMdlDOPBOnDp4BehXQZUIr4GT01mBll+KQaGS4w44kl2qBWyMJsQZTV8YePk8bWMz0h906WpNfMMap40H8Skje6BBIhn5w8wjsUsnq/P7bxIMmiiJpzg3ecSveS77XGvKEnGgHAzoXJcnSxFJ2r8yZAVhkBsNdHU+YTmAMr5h5X52B6QUVn4QiqKN15OCtkTdlQdIRMl8CFt8v6+73Rvkl3StLwEsHQSHRk/Qd3Mt2YjYWzUz7/w3/SdqxgdfEd52DzgcjjjR64PBASwEbxdjd1w45W772ZF2Dj7kQN09Vs1iWCoR2Polj2embNF01QmhlvmZjBSIfslBTGWM+gL3ZHS40OSSuZk8zU2l7T4cxFPKtb+biswKIiym/ke5wwA48v18YLPPAO6PacSSybC0SCdACeDmoTuvaa2MT5dEEuhUO0e8/wH2efngS3RcKm0Huv5cSKomOXlYKWTHo8cOpqfwBrQvnLXlwCHMCJaq46hupqBdBXK2ICbcQsj4Ba+wZLi1Xhau6Du5UDa/i6kaAjjUTkp8Fg42iVVfvJ9xXf3XFIBLRaEaBwhqRZOwVVfmCb1N4dS8U7Eu4Kri1tKgFOCOk6SmA/Rsm5A7gtAE5xMYNDiZK4g6us6feiJ0d+cvIvUEsDBBQAAAAIAK6gm1CzYE7ZShQAAEQ+AAAOAAAAY2xpY2svdXRpbHMucHnNW1uTG7eVfuevwFIPIm2qx5ad3S1WxlWKLNlTq2imImnllOUiQRIcItPs7m10D8W4nN+ecwMaYDdHSlJbu3rQzBDAwcHBd+6g3Vdl3ajSjSz/5o5uNNrW5V5li3W5r3SjZGSxMVvd5s2iMR+bhWs2pq4/c2bZNsMzdduUi0Otq8W2rBe6cHZ43soWuj4CqdrovRues7W5KfTeLIBke4bOrWkWOA9O2Zj9whTrcmOL2/OTcUc4Z3nmpNYtVsfGnOGorEwhPA9PuPnz0+EBtyvbfINrbfWAWHC8uF00x+ocC5+iIDf0gFhpBu4wPPz+6rUM3OblSufOD9TGlfm9gek5XK0gYjSyW1WUdPL5SMG/YQBtbbFZyKUfatuYemRyWAq7JcsOFm6wgI1MWIq3Bh9vyoNb6Pr2/hPTd9rtFtXxc6bawjZW5zSV1o1GZr0rF4VuLByUbkFdJpeivlQTAshM4Q9d1/o4HY1GIA61qEpnP9rtcYKonfK5atO0daHGT8bZX0pb0FDmqtw2k+k0y8uDqSeegNNbs9Z5Ptm2xVrWj8fj96BOTmmFnza2LJQrVbND4QIcDjAfJKPMx7WpcNRlsGREa5Em6mIFe3wBhwSmv/ji7oC/CXX819TH7o+IZdyutyxM5P3UC79tSqLSzo3i8wsbctC9vjMI0sm9zlvTnfR5WdybusHD0oiyRVPyH3Yj90DHw/mAHuts4RpdrA1T4kv5nMPR9GxjwFyYyRkjAhd0etx3hcUVL9CAfJruuG22T/5zPFPj2lS5XpvxNJZJUEQRQywcb3DBbtTNYmfyaoL/zWD04wLM4m2zu/z2d53k/sQktQKMb0zhzEaBJB2ipdwqXHoqvkNZbxDdOOYBSQNN2YBO8B4w/pWw7IAd+PPnXxhaZWHgr5dgHwxfNNh7ogl3xrQ7+cBN4Sc/P/l6/ou6vFTjbJwKT6i9rVsTPi/MoWPia9A7+GOCZKZIT/gxsH03EG+YnOLLmNp3kQxP7xCJZojUYjMZZ1k2nn6ST2QhJRPYSz8e2EGd0E+He2fC7VOaK7Dzdx3YkzNfRodOdHEspoh3Q9itc9BX9Ur/9fgS1GBSrv5i1k0HrmcqhyHyx3iRd07l9s4A2Gpz2+a65pFVSxZpU4KVRI+wbfP8SC6TYbUz/XlgEgA3e7BoexjQzq7VemfWsAOYVlgN2u+Mofvcsch9UAAmpoYf4EiYEmoNzAXkZ0q93VlwW061zgAXBE20rcIOxgeelGPcgkdC3fAH7szngpzEYjEJQnYm384CG6CQoOmX4xq03NuNy9dwT/AnGgl3OUa9Wzcwrptyb9eXrDNIKrJTSDWjc10G2ukg7gOD+CMd8NvCYAh/0gnECA7TL+kgMwWD/MsoxluQNerskxOdpdULEAX9IvHNOi8dchkFSpNUVJ2YvISmD6sSiBZNCq7t69MjdQ07KV1sFG8dUAZL1ho+OJjHtfHXjriD+x4gA5ySDL1rPRhYjiSa9Q5EAzZGu4ZhKuK0xQAZmoD7CoCz3hzk5EQk04x4n0yH5AvCRDj1h04kTjYpgi34NN00NSCXARuFJPhPTIHMojkZsTaVqTEt8F6e0DSx6p5Hyxr/umefZBskMJHJ01Mexr9vC9waXBbd3ONff3usfv3tu3GGpkE3k6Abs04TIv6I7RPeQIcRGC7CA3DZPGY+j4ZDeW8pMOZSe3u7A3Rom6uDBYvpSWk1B+c/X6JlJL+/hGWvgcoOUJcjZhqkQaiAlUCpqstNuwb7WPCnnX1GZD3P7foO84GDy2J+/xm5yrwHop37T+tnD6JD8p6ltmYWW5Zg2SKDkhDthVGTq2sS5Uxdv6FfpkqDCOeoQkX5P3quXnz71dOEBkfxXZTrg/hwLaP04NrCQcNgjKEdBJWXSSo4MVGk1+ldfX8KVfgkwI51to+75/g5A6+FUAyMAGIEMQiaVYKfatBnHQAK2T966zIhmIuUF/BUjclze2uKJj8OcEZYD0lEWYA7XHfMdlqiDnAZopGrIw2i/w+kOA7ggB504SXg3ofhrAukBYWBAFSssmsANA+jPQbowKl7R15AmA6C7JulSDWS2R/JjbMxBBhR4M2/SerQrE798ZBYExbsIAeRMT3lChd0htAHXv9lTIXmqh98JSFIF3mcbkbZi0QO/6ITWAhST33A/6q0u3TxIYcz4ExQFp++kAHh80LKtzDln+yNc/rWSOiGw/JrkV+ia6VghUO3maIKCI13MfINJFeUuAolVeUt/gkxODgJg5EsKtKtvYd4ha4Lg1KqpIEOXRcSkdYYZaAnmrEq5WXpw21cXuEuQYdnPpbeabKHdXlvNkTItRWX0GCT4KckeaVoiUsxaqMbzW6pC9vRAxYlkRFjBb4KgvMN2ouy2NrbtgbLgOxwwgwGK+NLACHsdW1hIjC1N5ocMBA/li2FU8x+vDcwfgDtwp/CHt8mjoGRWpWQyTzNPhLP38DPvhgh0MNP9iVIDkxSXcImugEDpdliVaVzdpXHaYHG3BgOo2uzBRfQ2USixYUVsmHgT+F3jphXBjaA7b2MgN4zh8k1O/R/z77iG7PFOm83IMz4DtrobHDjFVxbyXy/58qWktqUCPIKYtrNxhJTDYekMzSVS4Ke3uvlQtFeYHbz3GxmRAuR3B0GT0DEALRl4Gadk10OoIADPHv95kohew7O9MJBEoVVMb5EFsNOcrgNS39bYs0JVs+Z2ye4yQYgUcONQ14GBIY2AM55Gzy7nDsLBHYWoNmxQpVkwJ9dMyuUAYKWO0jUNJ2Pb59Bq7sQyNR7mJGLILNMLbzM5mrXNJWbX1xUx8pmZX17AXBBa3vhp1yEVVI9WcM5bs1mPscL9pv0731I9hgHVuj/g+xjFPSAcDgBAgeZBMc17RQ0FOIxuw3uGNeii6qrmrJhi+nQEeEPQYaF7CXSwyUobMZGZ4n2xyfVqCakmgAnUGi8PxhNTwOCR68O+6OdwcuS4/jjZedl97ST3ZtG15hrU5AdalQwIYj0HJap9ODJ0Gp/ayG4D/rQ4wXgSZx803HyFnZZglVfRqUEjHxo6gOH+TYCAk4ldlkxl2qb61tZOyey3h/M2UqJcwCdJoHHExHP8y4UgylUKMdfJlIOdPjHcik3uJzGy+Ekc46myEw14LQ6Yr31eO4lyQsSXxB9LwnodokM5xaSYJASGmPIh61BBFGWnOdx1cH/m+P9zZcYa0ctpiW6g5r8cMx/kcfsL9HpLtWElZ6Yn0beFHgh+YH09RZYOuh64xJydB9z1KamLrGJwQbEmwcPWhcZJ4egB4DTgU3vNMozQi4ErNMGIEPw7OpG+FMKJzgrDeFhAC8pTWs4cBtqxU0eKoycWwc35kPUR0rK6XCmggvjFziNi+ooDO5zSGFYYYiW+RN4oEa5CF07/hFV3WXaTPX6JlH45WldRhVv+UxYxR5SPrTA/4YuNE0ahpgI5KepsDyVLy+Byodi/IBco6krmiqivCL41IbDh7AjioQrTGB2b47NDiT9DX+MAuYmBsVwQociOWkgHcAe6KIl/1YYNCRg8awslSCJc3Teh62BIPNRd0UFsxbpKdWpnUFNaLDq6ataFCRJ/5KJcFMrmFeMwzBYO2AyBuF6BQDHoOB2HmK4YJTeEGyuroUShjklMsL1rx6SPHpu/vyUfved1gCF7iKkT+gx3u8dTjh+j+AQLzmbP+NotoW4fHdSa4tWZ7RDh89z04bIcJ7hIYOG5YlrjnnnIVWCI6wGdPgGNEDkBDZG5949CiESEx5pRyVMB7FVxfVMJigrwdQVcF2MIy1ZOsbB4mYeUTUd28di7pLV5GQ5AoFPjKWbxCSfA/0EM54MjnBYx/y3UoANftkHPuSPIArJdYJg7GJLtAcznt1ckSc5D50HIMNsXA43qSf0V4KXXj9+wnkvzxy2CZdR870PkLSdHW3VfxJxHqEepViP7y07QX3YFEmxu+vRepj1Ezl3y88pQoJ8zp7RuSePOeLmd2hMotGUZFEsGpoLvEyMJtewB6OZDJjpUpBRp1YuAiJXAyUDxXi4RaxjSNglh9S44PyYU2LEhZMKPT1OsCub2wZyC+daGFmZ5mBgIQTXW0M5jBh0iQAFl12O2yT1NLxTgydBs42nA8lQoJtYcsx9mIw4izRYRKbn4puBz3IbHxp0RKrW/039cJziSHmXy8dUYnu8XM76cQuPQmQAw6RL/AGEGPBBErpQ0Q/VKH2ek8FR+Fo9YmRiL8ThsutbcCpcdh2/K+6K8lBgYlFsIEjzZ8EifyjwE+mkNc70E5BFD1smXMh9uN/2eRCkgKgPwdaxWxbocRotNc9wBl2XLUhTn/hqXoPdDAApX24XByeCXfr6DWXo6Fwb6mJiz3/dNpQne5yw/gHHOsdeFZZi6hrMfVqU8Rf2/wFUPi+RW5qrEhSpthupN3P0DDz7qNpPTMJ4vtT+WllCTRfsT2TDOI5fQ/2fobjf8GRUUxMGTeokGNd/tKWMdXlflUzayx36fUzo7N5irx4uHOt5KMY5lZ+5tbWUzj4iEmHGkSkRadEBYKGf+uVa2qlmQ3kFvQxYHf2VdC01Pr5/IhBO6OKSH+HrgnFE5a3l4yeIJ0zvgLOQhkOYkk51nZZFWMbWg1dRiXg5HCkQB1LRLOAw0qgjxxnaxl6r12vAWYF1hKM/DT4ucKiovphItDDMyg/66ELgE5yBFGypFwL622I97J6SrBLlXOPLBjYq0W7Ciz6F2Xze9bbIyXXA8Zih/tk29f9Z9mAV5LT0MGwlfCmC7nICuPBXtOXydbiTaaK21K2XuuyGUhSuRXlKnnQ2bCmoAOSfNcAakO+gVaB5ZANCuZGMOjnmU/KI1DkBcwWb55ZwEiolJ4zhbOv790KAFWxOFTZ+NUGHozjJqdvSv1YDFwNRL4UBSImSneax69tQgCNW7NHM09X36gjE8mkbIzzT+dTDimAS+IeEcDP1L7zVGCQpIehwBw8bqUl/a5uYyG3k4Ut63+kmJ7YrDv9gvKXyJNxIgxjFgiY+3zzXBvBuk7194ujfs31A9aYKqXXeZIRN/SvE8NpDKzb28kiELCYS5lowVfVoBzKjoWDr40IrAS25bleVVDzA+npJ/eDHYBvXDQcewQQwnpMSr6j1dcGnNcW9rcsCxcJCOuV9ufRS+nn+9S+gu62vZjLgfiwP1BOAe8QkX7JB35hA+NZtQc9nJBh52ttmxLYJrbo/wQotWW4dXVMoFVPNwIXC48qstRhPbjCIY18ZtJeYWEpHpoLUka6RSgwH9M/BhONOKzJTLF2N9hWfdHhrzTzK9QbEoCWAXcxZK+kr/l4hH6n3/CqIWufgUWo4rDT6pbNGSIxQiY05ZlE6KI+UiB78MffLUSgA5rbyJhfQC2jSXWERCPqiCeSX9LP/dBnfaCVvnyf9BmjvKfUk0cWAkq/nv4haMtoX3ixE9oGCVFNwuNFp7Eta4KT+QJ6E+l8O3+lZB9fIThVLX6CyVVtXaIXo6JZNZJxRgWaYwkFo23nzQFcsuVDFSjAG0rn47A6R/Bg3XYs+Re4MrVfI29C0U+skbgMSqajtd00vUBDkM5yCfIg0eptQ1YIbgt0LxhahqZudb2b6BdkZn7wdlum7q0Si/t0F5xJc+R1yOSplknyWl4UPVvCgp5G4HHHO9rEMMvADrnd4LhKV3dvN038shB0/r9tAGFXhMtv0/KDfOylQyGvJ0mVIJ1tpl2I09TPJd0miOZ37Ab1bbGw9wZ+M8brUewy++QEAyHxt+I1/gvo6SjEl3IR0DJukkA0F+x1rNSvAqa3jwxLm/aN5EA1bZtfvb3vC2GPUVGjg7FZQ9LakOghbdNCljdEzzh8LJEOVNoNZG6hsqf6g6zGkeVQd4TIjRrCjgBbf8JVTYZcSC8QrE+JwiVH/qNfq+o36yV/Vcvm3i1d2hdHQxbNOBOoNVwYvZHNJGf1qNbm5fnP10zSmAmlW+WQVpr4r7MdkmMV+0Z/1GcTA16mfbtRELjya+nz+4fty3bJzRcv7hqs67sPv0aZ99+FVCZLsPo3P+L1u9If0gH4jtAv/xGafQf0/zpziHRCI6dDyP/HMYTJneRwkRXKICJ3xqU9PMg+vbPNTJaEsxBs2Di0RbqGnvtaVhazJ/lVevPT+0ZtgbE5C9qc5AYEwvdLrNCuQE/Y7haK/3dYyU5qEvTcMp/9+JNev9HZrIEoIYUuyeWRS5ryv5OpJExSfX+B22NYnKPs61jm7ShaS2SeXsMIYo8T6kETJu3JvuhlghDVZ4KEerv+3IU/m28VE5afvf/DGjgiCYCBkBTMxnOvwrUQ33D2QQUZ6Rj+ppd+ZI9j68bObm++fvX02pu9YyH3Qd0DGr66fP3vlhzs/wWckLyFxMpWBgFzSDpB5vUrQKQ3yNOZjBeBC+E/Gfxv33vj5afQdC148CzgPGVN89Q9SGNz1Ivv1t1B46r53FnaZTsNGGNWF6Bkf8vMdjR/eNZHAMAsPmPXxtDtxoJSWxgY3O7mlMSBs8fz69curHxY/Xv/xxXh2hhUx/uPptKtUDkiFB7t3lzd6DeMvsZ/xXr4md/rVF46reFC+UUJFA/liANgYRHGNKd8f6vLOFDdWqoZOvs0Tvm2CLYvl0rdPIA1bGYSvOGJs0RMBVQEFtWm5J4/pwa5twMwUF1t8uPDkh+dc4mQdlIwszg7x3RDkQ8d0M+xbc7EqbEh0lvGbIF/JlY/okUim3pRYXcK6IWRLCnTO7sHl2X2F6Q/bJWaJu79gSYq2or5e1wnn72JQ53PgZXR4xiUyIHIohxnlcdQVJFL4TtVCbi11SPAGH61PY4e/t8NPUKUsePpu1lcLL/2EjgBL7uQhae99fUyl1xKWx+7y1p1fuCer5Qk7iLko0+fr+FQko8/Vv13yhOzFzdXNi4GvlGGx+qFHv/jHJx79yglk7ujvUEsDBBQAAAAIAGyNkFFIXG/MbwYAAC0QAAAUAAAAcmVxdWVzdHMvX19pbml0X18ucHmtV21z2zYS/s5fsVU+iLyhYUvu22hiz6Spc8lc6mZst/2QybAQCUloSIIFQLu6Tvrb+wAEKUpWPL2Z0zghsO+72F0sntHJv04oV4Ws1wtq7erkWweJomdElGXuc5plCdb+j7r/M8pO3QfoU4qxik8oPvV/J+Sogc0SLyP8TqNoMplEN+L3Vhhr6PXd3Tt6K5ea623017FftCOWhnjdsZQdS0oPWlorapI1vdvajapTWilNm7YC6VLAHcOi77iROf376o5aw9diEUUw5fLykmTVKG1JBw09WNPFAGNrYePpxtrGLE5PHx4eWOP1MKXX02TgYMZy25oMIRQOOD8763HLaWeZt58ardaaVxUso5LX6xYGTZ35muWqhivW8d3pVkQRY4zgzLsfb+92Njd8WypewMRC5jb+KLazi+k9L1sxm6aE7Txs5yPzxg41yow8ct+l9O6cOgxkFNzyi6BmENFoWdtYMyv+sB74Z+RPFDZ2iwniXk0WPRwAZxoAk864STpGzAfEfNLBP6V7Aj9F0d1GkLIbobszrwSiWCCGWpBpG3dyoqATMkLQr4N3vJG/MnrVliUVKm8rBJRbqerIRd/S897vgUELXkAJiA2T6pJF0SJXzVbL9cYuKM4TnOXsG1pu6T+irmED3Qhp/8uiRSlzURuxoBcNz2HrnJ2l3pq3b15eXd9e+UysFMwthOWyRCa65I9C1rW6RBqf99t8wzXo+u0D17XL3milVUVM/JGLxvlh+qTty+J70Yi6EHW+/aVjiaKoECvIE/lH5GPVwP+lLKXdxkFldi+0ka5WgtIekCz8GRyQIXkOIMw0kBdPWZdixI0RO48Gvi8u6P20EPfTD0TP6Geh5WrbE6Ea6qlF4qNwyhIH6f1cS8t8poP+VuHEZSVMOvCoutwikZ3/iAP+9Zq4odnXbNalolxRKepDZxO6uKD5ok/CRy7xxsUxnp7Bp2DBSxfCQbk7zb1wdtoq/pvSKaGg3QfYfPM4YE5arX7nC3r17Wz2BJ8rMo9J0m7t0GHtaZJgW2/V5QXN2HzGZik998uvxyfiRTnHZ3tQJ9Rxzo+AIQUy9iIQsuR/i8BBao1S5v3i/MP/IwS9WXDknJ2xOSJAX2FxNnYqPk8JZTlPnGPxEY1AUPyVJzpLQu1koXj0trGuXTebbTzeHNQLTBkhIW/GztmXHmX1dpdyx0TA4VIa53ETw8P0KNEoeEnnfdcP6GfXQa+0VnqnRQvb6jrqS+Go0uf0HgmD0Hz5YccYWg4smv5YFkNtqX0ZFP/5KcHRbSnnrUErLtVDoR5qNmXuBuD2eKQOtRjmFnHYpZ9vZ4kbQro87DofekXRE0lhjmXlEPUnmiDLetuybGiEY2AShSDHL3wqAegjnY6iHhJg36dJX5s+Us66kKh+XyjhO1/l052PrrLJEKPdbxLM+WLSR/cfm58eEfd0lF9glKrgsFUkar4sRd9lpogyuvSS4xBcuG+v3/R2gw1JhguU0MjrAmb0w9ngaaD0XGAGLZimxpTTgbS7DPg9bkmnd3SCewUUrj6wjovgjYceVAFokMjXqhZDJdTKEqY5bq2OgU5p8vrFbQarJim94qURyY7d30Z9qN1gpuWyV99sFaLXG+F+A4TJ+jeR2wyVrLLAHof7ZK+jjgsqHNm+7j2KoHh0uu7GO1Zng5B/3MKiz0WxQQd1WbHLgUdZY8hsVItescTxS1y6uShYtBe7x4PL44FlKB8DklKsZGmFjqdyjS4tMJAey9ZuLBpHZAiSlbYUriqyrBAm19Lr7wAwq1sMfE9JWrayLDp63mL61HtrUSFdO0gYBZ+WNoyVHU/OPzqGwNGTtRaD4gEM4+VHPBN6cIU3Rnk4B7oOahqEWaT0DiMSpuQioAIbJuODB0/qyiGlDSZgXIbKAfyViE+LNbQIC3GqO78gxghjxscZ9inddouebPceGkj95rMDbRyNOtRVj07pDjOgcvb8dPPWYSU863rbnVI/8Hp7IwrAcotB0T0UQpN+qTCt57uu7TleIUl/gBW/9NdOoBp03CAWYRP5nniLvo2RgLelpVKt1+6C3KDRlXiWoE/yeyXRua/VAFypti4muyuhH+gDc+d+LyngrvFced3xR1HAuYfnWyxRCVlW8wq5kjBeFIEuHvHEiTf1wDlDa4XLe0WN8E23d4N9rt4CHgX3KEzdcHzhnqVJ9DdQSwMEFAAAAAgAnZyQUZbjVFwHAQAAuQEAABcAAAByZXF1ZXN0cy9fX3ZlcnNpb25fXy5weWWPT2vDMAzF7/kUgh68S1THo3QMBhu7FHYpo7sVkixRG9PEzvxnrCMffnbdroxhHpLe+yHhGWCOVwH+nXPMZjDdAEx5EE5weqGvQhraWAPBwqvyqApTTQp2rFlWlk66nsoSHoAZ+vBknWXBbsk2Ro5OapXC9dF1WsFqs1nDThtY+aFWFiPrTZ+YzrnR3s/nl0VoqG5dR61uLEod2U8y9nenQLHAItrvXvbtyeRfXIgFL4JZ+3DSJPSFlCLXwStJ982uIQ21PF8f6PGQKBMh1GYfwV42pOz5i09j3XQEAnmMGj0ejdx3LoXPlxEEFxz+nWzqQ1rj2daLpbiD7RvnvNjdLjkkh2U/UEsDBBQAAAAIAEhysE6IqTm7FAIAAEgEAAAbAAAAcmVxdWVzdHMvX2ludGVybmFsX3V0aWxzLnB5ZVLBbtswDL3rK4js0GRIfOhpMNDDsHVDDwOKrTu7ik3X2mzJo6imvuzbR0m202Y6xBH1+Ei+x3dweH+A2jXGPpUQuD18iBGlNpuNIvwT0LMvKmMZyeq+Cmx6r/6+OUrdk3s2DXqIz4YnaIOt2TjrgTvNoAmlhvVhwAYWrn6C4wTf5xrq1Jm6gwZHtA04C/jChAMKqsVTvKUk6LAfkTxsfRC49sI7jJp3qWHVkhugyCEww+hIPr4ap+s9HIPp2djKM+1BfpRSDbbArrKazTPGB1Fhmz97QJtlubnSvjbmalcqkCN1vgragoaMBHf8hTXvgfBJU9Oj9+CEdxoxxjiQyKDl30jo0bKOwggisSV5Zh5j5YqQu1mCmWbpBbSI0+B8OXVImGgs1lJW01TAQ2eknI9ae/j449PdHQSbmmLXi7JSgk7GY7FMk76mFZ2M9axtjasErySbp4/HBYabub8UxN7j+TlRRcnPocusIs2D22Ws3Yp8S/VfXhr9dV6CZpEjcvY0WBNxlfSRvNuG2dyzh59RFmowFmO/M3411MrWyb6yFkVmDetOk64lxxe5aDlKYIgpsLCXl0TsJA/r3wV8C57hiAtgnTD6aR3D/cSdbMU1PErqY/ampGh+CUfn+jdmibuYFns1bOkgLXZWk2k6C7m8L8IvK70CZgkfKOTe8KXGkeFnbvc2Zd0SOSovU75osUz9A1BLAwQUAAAACACAJItRje/eInwUAABgUwAAFAAAAHJlcXVlc3RzL2FkYXB0ZXJzLnB57Txrc9s4kt/1K3D2B0lzMjfJfNgt1ShVjuO5ca1j52xnt2qzKQYSIQtritTyYUUzNffbr7vxIECCsvKYu9q5U1ViiWw0Go1+o8ljdvLdCVvkiczup6yulid/wiuDwdHR0aAQ/6xFWZURT/imEkU5+K/2ZzC4W8mSrfOkTgXgySous5JVK8GqgmflJi8qZobDZV6xG42V1aWASzlLxFJmYsCzhK1hNGJATJlYVDLPyohoGcg14crLaMOrlflZ5osHUQ0GyyJfs7pIUzn/PtrkebrmGb8XBdNwb+HSG3VpwjZF/mkX45AYhvhjCwE0Z6UwA3+6u3t7o6/5kHUlUwO14UUpushckDu5FnkNzCjN11teLwI4gYSq2JlhN/jDBxKfFmJDrDFAZ2leigTXeF4UefEkuGKuJuOgIcgGAkT6Y/vrqWFv+CdawEHAV2J7Zrf9oBFvcSMbspqfBwys8sWB7LoRPPkcXt3eXjY0mR9PT6Jk7CDgy3zB8cJfeFrrEWpIBIoo0g5SfXORr0F3zE1AT2I7YXMOmlgVYAI0IIqhRTJ6ff7j6bvLu/jsNH717ur15Xn89vTupwkTn0DFF1X8s9xsRBKjWpaTAQt87kUVi0xZGaV3K+ApWATURbERWRKXi5VYi1gu40yIRCT9iHhdrazyTnAZYEAKfo/XJ6wUKQhQTCo+1suBtdWLqgbVthoAK74AxmSlrOSjeC0XleVR/iAbQLNGfTmu8vgfXO9PYGNGLQGetHRt4grTxEpKeLH0aWR6whpVmrCL7JGnMrlFtnH7k6Df3VzuQaghAciwBxlnFhCDLMiF4jGwbTCAGaeEzBNJNPSFnEdofhu5vz778y1RoC3tQDGIXdB9Ilzhgg3rQo++48U9SMR33z1s8dt4ahdRcAkW2Vvy6OiNLEuQJ0CGAgTihdu2BLUjzKysNzhrdDQeDIwEv72+vnx1CbfZjP3IU1AM987txd/O4cbzZ/bqzfndzcX5LVx85kHGdxdvzq/f3cGNqxxc12CwSHlZslcgVqfK2Y3y+T9g3/UiwIPdgUvE++zO+kUNSu7NsCWOZSarOB6BIC8dFsByAKkzAYn6chzZAeMGCQh2QggmTPtwgK4KwdczWvaEVUoEZ0j+hD2KQi53s7uiFi3JWYjCAKFKAYvpl0MYUH8L05UgqQLsiUi0f2eKARFKbV2AihhjZG4MLIopjONrQ+qUIaumxNHpxzbWH1oXXn5kc4FiAGsGnC2UatFTNspJT3k6Zn9dCYhOCgw81F0KVvTcFMGEEGl+eZh+yrcszWFqQLXlsiLhQ2SlKB71DMAZj6EJrzgQDJCC3ctHJLzeTNBTcLZMcw4bhY6DTQuxnH4c6TDITO9vDhCfmDtj9oP+VgJHqnqTCmcN1W4jmiXQPDgNgbVXqmTBW+i5JI4B4RBhCJ5NGERo25VcrNgCJVoqvhU5OI2tZu9WaEweyQ13hhAGXd6SfMmlBHcm9MqVIwpMsa5hf+YCQCgA9NDmcPXslM3rLIEwFH5CbNleGE7lLes02yFccQKS/SjB56A9dilCRHMMZGFmkXRkQiuEhxNFV19niSRHwCGYQwI3m5S+OOIWuVrUsnZXeQV2MwWnCBKZaCdvFHyBAV/bRACOM9weiKw3JuZm5UYscDnAQbEuowPn0fYM4zxjzxzT4xu1eS3T6gS2C6GNTSNdMN5C0f1WcRkl/V5kouDpidpamLdY8oWgMTY7gJCkJNcKLKO8YqGiUMa1SuGPW5yjZHMKl9UaUKWQxR0z20wUMUpa1Bq3Mk0JX13WPIUtgh1fgGoBMxBv5diiW0US+0F/AU1TOEDsBKk+IVrkIN+lXrWRFdCc2ElqlJHL6vUcBuZLwyon76EhavUcPF7Uwbbmn0r5s1CY4Idc12sHozMZWSL+iKym9eBwDx+MjjHrIGkOo9O3meCokhZ3459WeZ0mjFcgZhuw+iBW6GaQzyj5ODTPlAIsuUyBua+vbsF85g/1Bpy+zuMMNpd4zAsdthgzN2GZ0FbW5KlofMCuko1d8dJiW0OsiRZEK58yQBF7tUNd4nVKYZlGkeRAaZZXTGVhitYQXRG7WLJdXjOMV9k9SFud8sIYQpY/KonAC4lUKyExsbiUddsKPRNvXHUToKNMgKX8+JFCv49G3pAlG/hicVFiDYl3BS6hKynzFLg7bTyfosqVM7N9BEl66CXghPFdCVHadGrc9suXLw2hhv/OnRJCI1s+0OoCEUoDwF0AUyCIXIPjCOXse3doCVlOnVWj4aqqNtM//GEI/nNsLBL9jWOQw6KMY5jk/dBBBKBDWNlS3uO3uK2VzUWtXMNAIK0hiFXDDz2R26Sj8bN2qBlA7U7dhXfVdNYKUfuQEZWzTvzreA25dPGy2Yy1UE891Li4yBug0pLRswkFJCrAHNsxkI2KwzBElNOBkXZ3vkFEw9TewYhffvVvqJKOKfrQ/Vbo7IhWX+hssXUEAzC2L4VG6K0z0PpnCFIp2szZpBYJRJlTyBq15594c0yU6s4afGNXMiFvLitwad28oqDonP2CCjPF/Bq/aBHGrxPKcMZkE/A3+hC1DqNjv7oTlf5EmHbAL2e+Y8i9s2EF9plCNfCwPMGyABt6WzhU0bM7DzjmBXfjumO99U61j0qKnKV8PU8goK4z4tVE21pZ4swbuXiAMGnuRsh9MtQrfPaO4QskUViMIfbgkiOKt0bjtux3+Uvj2hLY2f6wXE4C0rcn96ePEpS2LDriEpx7wrxpW2LXMTCYxhPyTi4PNvoCJpCQyv9Mm2VCH6dE6+SGqrwMjitPjJNC74xBGkRr4HlVXQJ8OlaxgSD0jVIFG40R+rTBAqkKSiHkhDgBtqmekzfVAWMT3etozzEY7Ie9rurlx24y+/WxnoPsW4R6DjodD7wiG0S8yCAqK4Tw4y4IpfgjxD++qriBhdrcKTvHKhl7ELttXkAMWNzXGIlThT9BiqTdcCIKd5rZrXYEw1VtXAQAw26RgqjSDuku1ik9ZQmZ64Mt9QFGOmSfXaszc2V3BPtCw8tZSGNmB2ppS13pfyriQFKpCjUtDWv017NjMbDNRCR4nYYRQEgzVa2mUUmnPGerG/fyESSGcPwO9JTWMbV5+07lE8QF3suHYClgd7A6KEdSF1obaNqOOkwVFYDOK6k2t7GoM7U5dhDIVSmpBcM6cE9MfDfVCHYX8j39+uAEeAZzlOZbkP9xBA6wqMqtrFajIVWIhy03iGKQ8TUWFWELiUuzbm1/pIv4n0kZ3OvWljvappShc9lQNrMkdkdqkmfmSxekMQE9brszwliHQ9x52IF34XxF927vi8/VIH1A4zNaX/zyjfFPXg/eFW/2mffrX4P5TninjYtmjVPSE0UVq5KpE3DR+ZYp0E8IyLfYf6E7YKtatcvoMyyyU95oWeb/rchJGeRAoKTODhhMky8k1ejQzKiSBiy+Y5gBhcKlyYAB724uO2Cm6P17qnTjqgMFbUVrOOySFJwG7TjWWsCOk3Bobg08ykh+QRfsmZh785idpoCVbMOJLknDVuAYlurD7MgbAaSoaVAUUW4x5pl21MyZVW9CGwuONVB7x4eOs3vOvsd7Z8Hdxd+6VSUSnyTI/8jcHnep0Oeb11R9Hx2dWWVdSmA3SEotK4zCSZBg990tVZIwYUcdrP7nSKrjU5KpKeSwRxEo9ZpXDWGtZaHaRXQTlAc9wfDs/AbLQv/57uLm/PUwyASzaFkmsti3ZoWdxwhCAbsG9QC73qk9NIZpQqO7I3uWc3V9dT4MADaUkTg/Mb8v8lKZ82mIQbLEOi3PFoK443Zf9HIJ51nKVOiFvn/2IQwIIacH9/zDwdxsTfEk/g5T5LKNCU1FSA88qM/WBjrb8e0pQ0RfpQE+SePgwuzi963LAH3xsgDBt1mOpcTJDPGoLolNi1vTIYD/lRs/sHiFsFifMV7dnt83Lt1cevnROGaKKWzi5AQ9ClBHJZ+bIJowxKu6/SbhSKgp4bMbEkyep445K6GPfDULujOUGz/eKdqdEnaETvo6GxD05hbNzPZeuJXuY2yBSed88YC0oj6jqGNII4bocqmOWZex2g3k+HYFi8FzrULw0nXYdm3OEJXRUbUTb0/YUN0c6oqyS8gb/iCYyTgwCjqRTXNWYJomOQk0co1a02pgmPeXX8fetLeiYqYtLTCLuaVz02AD26hN07iLp+BbOuwqN4F7xEl920Drq54/cdwG7H5EWcF8V4myZWksHoBQR2z4LUoE7sloSB2+w33pXxiBy7bTBFRXbJlplSPFdQ5WnXJOqHmuYZm+7pogd57/kKoE2HQOlflaNRkD5sCGmSYeorp720kjVJbaScoMaGMxceObcdpiEvP726FMwxMPJTB+FQ1zkYBJbBKyg03j/2SGZpMqIF/Xs1SXUn5Qj8ypPW0/KasdOFSnUSZf2vYZsqJ44I/s6TTMtOtfTeMl1mKD9lCVv2Zei+jI3cuxp3GqMtgtjVAZI9y0OtIlVsqWhuPu2FgplW0XD1VSdJxo4aNVXla94YTf9zk6egtpK1wHwsCuK3pJyC4w8mRrnmKMIJKnggvLP91+Qc0Bgq2llSmGZGF3ZXeR+2pBVI8OrBplyBaINKyjsU3NCP7tM1/H7Bq1Qu2MbWsQjHJa8i0+wbgTWH003dA+fvw4W5ZE96jb6ShIe/tcoJ/8tt1BwKebu17LElW9RCXh2U71M4FG6QPHButZXRQiq9KdbsAhhKU9ejGFbNxZxAMmGi2tWy9t6lm6MqEwIDQuULgdOWW4ltDlBkhm4XCOznP6K9KROvZpn6CqSrPBZXmm7QOxuNX4apTb4+X1nB4zqVTUpesoynau+YMRcYjMgb3W9lgEFxQnsbUosScGFavpQYU7RV7fr8D8U7uaNgmErk5Tspkrjgd1Fh2IJxq7iF1j9LWV2KC7tcJLVh6po/M8iPUZNt1QMUyRQQUti+yrAmzjRZzt/829yW/Q9mu9zmnLtyizUGKFxnxFLqApo6NTazDLrqfBdviQoAfdipEZ371Y3VDWybE6Dvw4UrcdZ1TGCkUSo2OJmzhHWVJag8b5bzNmanV2fI07F9NJTGyoVe3vdoZ+dxd3iVXmW5NpqoW+zQzM6GILHRE167WRJ7EERZ4erXKI7eOISc07808DJt17csTbgY6BthEw2hqeJDb8b9mawLMLICoYMKPpNGmLChZMd2ljSSN2Ssb98UX0TFlu7Ea0mGBhKxT5udO3OK/Jr6diqdrPse2wkIkGQ2XXT90ZHbbY3MbWL1Tg/zOmBqvusIdm/wJxrjn6RcTdg1+bISF7zHMBo3HYcVJjpxU2/+DNOcjvyzl8g0eBmiWbVoF/QBiNyqABdYTC+C7lZ9UWw2oeSnXQYjKaNb+XC0QFmbc6yObo+cQO20aa9CWHQGRRYTxGnlH132qPWHDdjcozjAA4q2pQBBIfQ5tcNjHN9dXV+dld42vJY/4Ly6LTeIDmSO+VMpbNCnW+uC8Dwg0PClJTJXE62T7v6N21uWakb0r1JO+HFD6enAKWvJA/04nOEI98W0+UjfoP1j/rY6jv2mpN0bd5Gur/H4D63T8AxZonVexD2mqH2jz4No9GeUuwh8dfc2DsYfQPj38Hj0YdVvRuXFix6577mey8Vc7bH6Xrp1e7D1ujtLarpm41Bgsxwhqbmf7bbvF1Gz5Uq4dHjtfy0QqNabyb8naSXX8qN2Jtm0D1p7GBRtOMGXTpmKkTS2MIu2WzxarOHqiegj7Y8neeJ3SOT4cMwL/hmbIyJ5ciu69WQ5RoA2vr6D3Vb0sfKW+rOtDZfCMAsOHq+QQgTWPowOnrAOG+oMGYoJmHZob/+TmPFpe9YoKfY+XP13ynpcYoNlPHd/QEm0AEUWcsXMas70gLmiX5l18j9paeDGIjj85x/zHikRlMjDQmBiYHM6EsJNnvag+GeY4WRptd+3gVOHfVs2sPJI2NHncwKQ40PBvBCt3yXs/euxvULhC5SU63PvjEJtsZaJMN3Xusi+n9UIIfKNOCsdLtyKjX+UZk3bY3/KhOLWMsIvUzHCQBnhnaiOBN1LWZq3hhMNNM11K7MDBEGxIDeR0vBWGA7WjQcPdjrKfsg90UAgQsiXWwsQ9UHVwdAmmejGo/XxSGbpm7DkyrFwYPC/UpfcdB4SfcWgHCseIlHUYqC68fcsGyaLsn1ny0uyKBaaAHHdg038YubGx8m9GSWeiNBeMuoqDNdGeINnWlFz06RDxDn15xDX3KB7mJ+QLNqT11pXA8QD1+MOxU8us8hdMS7PDzOH3LVYNGHtKeye0wkA/jY/fQKV3aUD0PIIgSmJX4NErBeMjx+P2L6Qd1Ot2c6HZNaxjNfPj34u/Z8FBw+U3wtkGfIayGDw44hmRpIcz5r21kaJ00hxW7T5wV3h9hD97uQHgz9iL644QK6/N6uRTkgSELp6K9mbHsxYR+2C4LVM821VhkWmJDg3WocAdxrfNWlH6C1Yt75FymstqpQoxew/fR9//++TT2cF37KveVV+qhTKyxQn4Udlw0sl+50XpR7NQP0kTkM0PuHnyH+w78hPxHELi7U2qXwntzjGdAkLytZKVOxYp8noKBYdg+A8Ey5oL4GoZWgbcHF6RGFP6raKjMVTltiyWszDwpiZj4oqp5yux7h8L47Jarg8SwCNJUjRhoiRx5L8Yyj+VHFI2OKZ4tilDi03rtEUZx+/IfPZv3drBAtOwHf6ZZpv1OJRodsOvA1uvX11OwJOucDAkE3RI15ln0bAoWRLDjF396/jzktFt9ms3M3VeU9TgUjy2a0P054b4Fey8H620tbHj55TM571DrnacB+Yp5zKuvwhuHezUvYAw+tOu+S4Q9Po9evKAabsorEUiRFI0G/dMU9gjwAeLbeuteb1XgS3A7+9CL192HLoaRZfHEeWHf+Gk1+5rNgeCHnr8UvEilKe7Tln3JPrng7VRQeK9Se0oxLOAB84QC+Za11JVmyjRaPbW2vKLa2f4bUEsDBBQAAAAIAIAki1G2ErFpcAYAAGAZAAAPAAAAcmVxdWVzdHMvYXBpLnB57VjfU9tGEH73X7GTPNhmjJ3SPnQ0gRkCbiFlgInN9KHpRGdpbV+RdOrdCdfptH97d+9OMgICpM20NBM/2EK62/1uv29/iOewvbUNiUplsYigsvPtb/lOp/Ps2bOOxl8rNNYMRSk7f177dDrTpTSQq7TKEGReZphjYQ3YJcKbsAv2z4+HnU6UqHKt5WJpI+glfdh58dUOzNbwAxYF2iUtl/b9sBNlMsHCYAT7pUiWuDMAgwgnxwfj08kY5kqTO42QohUyM0MHsDPXKochI1Da0gZjpCpMp9NJcQ4Bfi8nNyodQKWzAWxtXa6EXph+1AH6kJUD2mF1lRBiUaRkpEjpCqIkE8ZEcTgOvAwXezEdirdGpdAiB289Cr8OKEehwNVNEzGo2S+YUBzi+PvxNI4HdHF2Pj0+O534P47G+4f+6vxsEhacX9QX+9ODI74kD3F8OD4ZT8cxgbmGhU4YwcWbk8egaG1034YIUqWlCIqsD4cycZd6PYBMUgDUHGxFTBsGMFtburDKhctZ4o8snFfyo9dAQSVRNVBuwmj5T4UVj/Q+8L5dGOYyw+1MXmKDwJ+tBlYDmql07Sw8hOMXo4oWjn14PTk7JWNaiky+FzPS+/mamC7+qaslihT1h2LOJo6m03M48ssaNytJOfOg8USpS4m3jXPQDtyz10LfPMHjTHPM70Mdx91C5NiNNuxse0cmjmkbi/f31hLH6x9x3PdZXmVWkisLWPi6BPRciXTYkBzHm31kMxEFzJBSdsffoue9Lq9wTgbOCSHoc+58fe+SAXQTVVgqZe/susQubdkoS5OHbz5q+wCSyliVvwtcOwSrJWo2UC/ddkvpGJKrjk+aximVMVlwCJiWsAF4Qy2xhbzCwvl3xSuO2x7JrICU+HE81ISzIeHtijSVnsdakI1vkgU9bfKXfbSEICq7bOdKxfpx8aG9FBtOllfCyGR0KBckpNGBA+eFzatb9qzMUVW2ZfJIrSAXBRUTJNCpS4OVkLZBRYl5hbqRMNeR5gAznHPHoBB5EQ1AcIjnJCY78HxGGudR3CPbhcsED2FArUNsqlq424eX4crsxf6cAb8jpIHv7LN5t6QVsSxTq3caU6k5HVonfaVUhqIYwtjFbZRK4+JHjWIUesSIm8KI+sHItYKRbwEjbhpQGyVrQzjEuaAsctGK46musOkTDuotHDNy3moHWv12V/kIWZ6LsuSQ0jKrEpWxHyaDO0/QJVtYt+glmuR83TI5poKDTMPMH37ARXS1lMmSctrQYOGlqlVmOG3c4hUGSw09jqJGCl0D05MJJKitnMtEWAxU+8y6w0VOovT1oxR22TZLKQAH+zCritSrujJ4b3z9WckXirx1VsmV8TuRGeQiwHg1mpJGj01er2SWMRCZ50QNIc/WkKpVwcUP03Z9p+PdND8JB+RTuIQwGSSZZMu83BeJ3rDEvD+E4zlMWZ4D6HX5KdWq7iWuu33aLnXwpdFWmvrhph8ExC/rq716mggbWF4RNHNjvcwPTBdGLDCKOiHEe3t79eBWb7j2hG7B7sZSPct1KR8Y69La0kSjEf/OZDFUejFaoO322ybCXw1e+GnnxYuf9+rRz0N5Dq/WRGxdZrvcB7vEITGQO15IG1RHTEVfXmhuzOSCnWTKYMp8ViRRDObElZIpkKJd4TEquUQSiypxIz0aFmgmXjj1EzhV6QR/FNrVZFKoUXltjGVK0w5X94w6N7hCLmjcpHF4zU4ueYPi5DCeN9fH61l4OPEXvT5Xv3A3alTuKa7vD9sj8+61yXm3PT2HEZtC3nMP/AC5e6oKvDVja4r0JEzVRF9NanuM/t+Orm+33objRnAWIJBeFlX9RkTNII7DmakfW3GJ5pMnWEvQHs7QoE19pep1b5R8SiEuWz5bggaaFOM8Cm9LgVb/c5t+H3LTu+vN6hrrBYQO9omp//xCHwLavfmyGuLNI9pDwYYwD/z3gaYmsxnZb0TBjbuFsjwoXMmUa6jcdEAKn+utvl9CT2ymUlWWXHLrkSNEGSIuVVEDgYwsqfoq3X8CdLtT3M03E/ohsumcobjyVBtKK7+gPlxleVD8xBJ4sm/ofMOh+9smn2AZuakT1kKtE6cG/gpq4K871FPdFs99irn4IpjPSjDVXXq5JRJhk+VHyYRfPL8I5XMSCkvgEVJJMUOLDw4f/n8ST2L8+FfD6MNzu5X/BVBLAwQUAAAACACAJItRu7SJK3MLAADfJwAAEAAAAHJlcXVlc3RzL2F1dGgucHnlGvtv2zb6d/8VPAeFpNZWHmu7IqgxZE12LdqmRZrheugVAm3TNhtZVEkqTjbs/vb7Pj4kSrbj9IZDD3fekMri936T9B4ZPhySiZjyYn5MKj0bPsM3vV6/3+9J9rViSquUVnrR+2f46fUuF1yRpZhWOQP8QlNeKKIXjCAwKzSfUM1FQRa0mOZMKjITklx4ioZ+jy9LITURyj9J5p80X9bPC6oWOR/XSwvJKArsX6yoLOCr6vVmUizJmCr29DFxi+Onj1kBCjK3mk7EsqTaL1cyL6lUbECUlgODCw9I3EOLK86UB2c3WtKJztzrTIvsC5UONuOFZrKgeVZpntc4AFOALa5Z1qLcgjEyZFMOpBegHJO93ot355dn55fZ5d/fn2W/vLt4m/168ebs/MW707NTMiIRLcvcGXn/ZrharYZg4eUQFLL6TqM2ibe/vrl8lb0/ubhE7GWVaw5c9b7BmlJNo16vN2UzkoER+CRDP6LEcaVQqSWYqKRKrYScJsc9Ah/w4QXTlQTHU/IzIpETQCJWzdS4GOH2SP8VOKkAa0OICFJWGhDGfD4UeQTBs1xCvBCIFS1KImaEo4+pdriK3irzHf5AyI3Zgl5zUUkCX6bVckzGQG7FSMHY1FCXDAS+Zg4diI3ZhIISpGSihGilkkGg5bcgIzLlOu07WPgMyZvqiipq37j3lwsgafAWDP4okQM68lpC1GPkQ9xMriAMp4rY8OJjnnN96/Ax9EF4CFGS8ytGAEmlxGTQiuc5CAgCLcU1KAC0fkgP4D+DymekEBCrCpJL02LCAmc0oercgR+fCik+xPVr461zUQwtAvFUHP9CkFwUcyZRElWVGJJWFp+wpN+mZWUk73MGUmD+XzOTmYyI8Rc20eRWVNE1MxFjKcW//0X+kaDROqSoixcCRhrfapDJkQAkJFgwKsmsgjhjiE2vBZ92aZRSjHO2VGk/xXCmurZTMmhBQr6wuZC3o1MGcWKz52/WZg1gUj95KpAxYSYkvS3e8Qny57zjqfzvekfflo2xkj/nI0/G+aim6nJvOCRnxRRMBflFc/ha+25jVgGJwGGB//1jaqtrHOUgWHEYJZvoNXHQphfI6h+30MPqC7hYqm1ljcijtU7ShFDd5eJxdBylXwQv4k2FO0lSRC1jax7HTJoq7nlCG5jkgGCKOTBnsXV5U/V/NmFlYExhphCliIzdDBwN1dw4DeozkyAtwYZXdwPTYrIJ4GRZrFg+G5DQRJJyIH4u9CtPi03PpBQyjkxzWUDnhcGjUljXCZKhEFwp2s2J/fLy8r2xGcLHXolG+hOt6QQqugEM+lYwtEAkY3DPQfg6y1zgpx1FeMF1rcjWVokfBEk3RFQbYEOIhOzY15qZABFblnNezPP4UyuhOoxHZM7AQZArhsKARH4tGoDhi27N7Ii1ju7XPHqN/TkJRS/YLtGxmiIAMjEg94uY1I5M6pOJECH5b8aL0WewYXeYadli0NYt6cojWzH1XoqbWxNTrQjbFlgGfENg0XuF1X20NRyG/1GdT/kcZLxXIlnQ//JM8gB75DVjJVRn6DXYykomh3ZfAb0WbA8rQtJ5h2JmQTILMmp2Iql5EwfhbpQBqh7FcDK6BXrsQWtS2DmdHMqgcZrz36Atf8EaJ6CdBNLVqG72gK2RScV18SAvkVgUsNusR4pgoMylrNguUIgLnRVGJmhM0S5wAwl7papABge7wCcLY9Xf/9gFWAoFcFhrdkpQLbPHB4cmnWqc2knjiudT2HVh4Lp9lwu/JYOkgvYNu6nAgBiw/vlY4hBzjA2+tR7kE82XOJRsVvRTZACizzWCt+tWBAMQIHyF7dJW8BSqdBwBSNSkOM1hruJ6cYdYFq0GDJBFSSF7d2FaqAANN++wH549a1nfhXAjEMQ+rraDNQsFjt6ePmkijuXqLuD6OYV5GbyaBDmX0+V4SmHPqlQF5cO63x1lKLPLs5tySEFqp2bcl+bsmuWh7CE/Jx0Oyeuvhx/OPnyI2sJi9C2nT4xh4ptOjjoGwTx50x0kw88N6HtTj5HmDCewv/+48u7OUlJgDnyhl9xY/eM2Rug1L2dg+3X1P7w82aCiWtDvpyIwP7yvjl7QXToOj5483awnLHxXVYH/Nyjrpd2p75PDo836wsJ31Rf4f4O+Xtqm+rzGQzRbCogakOlxgxL3H6jjB6pPHpAYl5KkVbQa0huLlhO1Xev2yMePH+1pQbOtIbdMNw4oNCjSbWtlZk4GcYbxJ5Ux9qSG8DEMN7jzUsQd1w4rydFJvHCHBL+8IEdPD5+S1YJPFmAMUeVTIwrsn9iydKdUhhtSGtVMU/Mdalp/vx8aoF4HfvK2rb1BeQTB8xNuWNuQjTlODrGgGyvD/5ExdHtINc1x66x6clTjG2TfrpF74KyXhk/j15PDJFg7aq8dtb3suvHGdteMQTuHq3AEArMc3tHAdg5QDXIxuaa5acbRg4NnN2iDu7GbOdYdk9wNnmxNSIVaGMi7QfD8Pp3g33gHMaHSStJiKpbxs8AFEz8Oxa16rlop/+n48OnnJHTb/dpvNzDaoQirA6vjwImRdGND4/DVzXtV2gx+fWpJBGXEUYOgS5IgBICWGeLwOB/2TWaAcE+QubCUqjLnMFYNunO8ITg2g3vfC3/c8FsroE4AFzher4HjZiRr4SQ7dPP8kzsC2hY9ewFkzoeGvNDp7mK5a+Nh/u3WVlfXcFzDaw3YRLnJTpk6Z69EYJITPzWHZniMNWqOP0Zgyb4rPe7ZsHLPUFfdU0T+0TVwhCYShbLAd1Q0Z3esVANv11YE2wm6bUkjKVbVgVuuudivG2fqrSRqiJpK/SYkZDvSVirWujUJCx3ir2VIgAxroz6GBNp4MnqgfEQ25uuEahLurEzQRO7EwWUtUg824DbsMsmmXLKJ9icpA/LwId7UzFV7X3fBFNOkvV00pZBJvCTyZFQa7gFBSZlyVTPZXc8729HDNXlhdZeo9fMlvWIqOF7xIUiAFNESry2tk4Zo6YGpXIxBGqSNLf02tr7rvXBENm9q98irWcMHhg4shY9vYMKbCvNsroob6A+MkYXWpTre359DgFVjvH/dL9Vs33Pc57APY2r/hx9/PAotaygfHJDnIzAyHpBUKsMkJs/Jk4ODf8PUIUJz2BVw3HLS4LRcn/T2yAVb8cIWnRmHIgfg3Bx7wVs8AYNyLmZmeSym5sZwhTeIHSocr7DNzSheXTp6zjydcpn610gvVYxdberkIEbQZM1BIBk1J4d2p443xsFdPR7+RlG7z0U2fEwzsmTSXKxwO21CbKfVn5Oj4963OepR11N4Vw+yM3NvDzaOpZMKy8gsp3M1gsVXfz1/d3H24uTDWbKLnztlWrtxj4FTqqpxHAFhq+3AloDRYdj/rc9eQALg6QH+9AFvr9EektkLN3PRJvmcF8AJAAooDRAUHQp4FJyDOQneZRds5T1u46BydBSecELkdePA8e2+zQVsENomKCUrjfd96ExEeduB2fyzhhhRU/9y0JAwj3S1zifFP1Qyj9Om0DGiWbvj6N74btMR3dpwYyjVewD80toj4SeTxgaNN1LMNCNfUGc7KOmC4znwbUrLEqHlGoD32ciw7W2qMZm8c7LZXqfaNWrHtQAU5vroODzNNifLQelvi7L5lDppl/sVlHB6DV0FghF/ouAmGHXFSxOiIP2OKrptv3Tnzc1W98va1bLtZ93djG49Opa2fmqW54G27GbCSk1ONPTOcaWZuXbslvxX9t57gokOtb19SQKjJt6Vm/Sd2jbsa7+YdfMfJ1XJ8Lcs9d7d9AFqesnQ/FLE3pQMsLHgdgWROmTafcd1m5quUdPfMnAdKYJjjhYdIudrFeZ+p+6YAHPIEYggvJeN6yk4clv3ZqpJvhnJT1XJt6XPnfnzf3Z9+i9QSwMEFAAAAAgA8pZxUfut1AMnAQAAxQEAABEAAAByZXF1ZXN0cy9jZXJ0cy5weVWQvU4DMRCEez/FkBRJUHJpUaQUiAqJCqW3nPM6t+JuffgHuAbxEDwhT4LvchRsZY80s/Pt8mafY9ifWfYkb+iH1HhRS+xud6i9ZbkckJPb3Y2KUovFQgV6zRRTrGoKKarPf6PUqeGIztvcEgKlHCQiNYQ+kKMQyMKSM7lNeLjHGMGOa5MI5yy2pQqnhgKBo/LSDvBC+Pn6niLGtwu+mz6zFb2pX8yFKqUeHQafYYr7Kpb2eJ7bbkHVpdrC+QCDJ5b8AcsxBT7nxF4w6Z2RkmVVuQUHLx1J2k6htRHUjZELTcsLAgtffQ7vY+P1BsnPxCUpUm9CwWoHNTe0I/AMOR1yQvnD4K73IV2jlGIHrcV0pDWOR6y07gyL1quDQpk+sKT1vHajfgFQSwMEFAAAAAgAgCSLUSjRnMhjAgAA9gYAABIAAAByZXF1ZXN0cy9jb21wYXQucHm1lE1v2zAMhu/6FUR7SYbGGJLLUKDYoduhGIoO6G7DYMgOnahVJFWiu/iy3z5Kjr/atPvCdBFJvaQo65FPYfFmAaVdK7M5h5qqxbsYEeLk5ER4fKgxUMhKu3OSxI/pEOLLVgXY2XWtEbbSrDUGUDtnPUGbogqlFTWgQuBKUCB9RzTwuaGtNbAEzhEHZ5WlPUWXv5V+jdT7oQlCnMKiHWy1aWEUY/O2MST3EOqN9JnIH9HDRUzN2ArKmlyZyrLwvG8h278XKuSuWbJyFjO+vv0GFxewnI91q163eqJbsY58cy6AR9cszxrvAifKAHEWuC/REVwlwUfvrZ9kJM1wlnTCW4elqlQZJnGhKmgbbgtU3u6g9lqrois2SwtxPNSW8AxqczDSlDtdhz7YeV6jYQ5YtEFy3u4VhrO+UAw0edE4GVg89nI0j8pbs0ND49xxfD7p1EkfsOu181MHtRnsO6tMMoJjhJK1xsrLzdNTL7tSKTffErlcq0Djz1tae6+QxUPyZQp1gmvLuXpYvSXPL+Lqplvv/KQ4hU+IDm4YUI/rD6okqKyHQpb335naMIU/G6qWVmssiUHs38ml1FoWms98LZ3jPdioKUZ6f7SPEKlYUStNyuSBEt/k22hD/MYGv12tjYrX2ipk4PccT8ILg5PWTL1Dr8qcGpeqzFS8T21jB5W28nCJHMUN+iMyfgf8hQ9wrp7Bmf31tXdc/hHMx1nJDr+0F5CZsP+PzA9bx/JTEO+kjz+GI1RGbdbGw0tsKvvfqRwjd0yXyaL8bYJfY/Y4wWl+TuyMrbN2cf4Ks7+idS5+AlBLAwQUAAAACACAJItRvScXOsATAAD+RwAAEwAAAHJlcXVlc3RzL2Nvb2tpZXMucHndXG2P48aR/q5f0TeLAamNhk6cL3cKhDvbSc578dqLzWwMYzOQOGSPhjsUqXSToxUM57enXvqVpDSzsQMcImA9Eru7uqu6Xp6qbvqFuHp5JYq2rJrtUvTd3dV/4pPZ7OLiYqbk33qpO50VbftQST37++Azm33V7vZ5V91WddUdkY4UXStupchva/raayk2PL6ubrOv6Nv/5WojDlV3L9wUMz9b31W1FtVu36pOizvV7sS9VHIhNFEuciXv+prHm14ZrXfGv2AZ+6P93lU76Z7ntWzKXM1mRDRbV00nVZPX63BKWPW6AZ4e5Vp3CuRiehfEqnBzGJYWolf1Plda0re+Md9ft/Cnhr99h7J4ne/3SGvWqeNyJuBjZ7tXMkfxz+THQu478Yqe/0GpVkUdy363O65dd5HrYOxsVtS51jBr8fCWBZm2tx9k0c2ZCMjne5XvtcjFxkna9NzgRu2qXVVgKzABbH3uGmFrkMD1veT9rZoTGyo/7mE+XFUFskTR3uUF9W9VKRVOUrRKQZ/6SCR3eZNvpRGl2Ld1VYCWLUSVyWwhSgkUdlUjxeFedqABsDjTtcgb1AQtu4XYwkY1MKckkmW7y6tGi/YOH1n1EnlT0m8eH3DUqmpbgQa4niw0ARygaK/apj5mzHtdycY06H3b6Ao1/K5VQLSuYQxuA5LFeRp5AJ3NgWstHisQ6lZ2a3i4Ng/T+YbWRFLaK4mDceBOgJqodq+qvJM48w9tT0Th4S2o0VEcclgEkWNeDMUNyusOhFWCYOr2kNlNZ1ahTaxB3atuvU5BLe8WlmGjHvjB59laiZVtG7QE64c+P/4UN3fHvYTH1hhSQy2DB/NMF8Cb9GvB9eMA6hUsASTRq8YTjEfct6DV0yOmp21kV7dFTIR3fA0snqNHZNyc85gEeB9wGaoejn0hvgN1sSRY/0hVZKLFu7ffiIq1EnyiEvd52SQd6jA9+7oN5P3CKI97AAObtrM7lJldwAWmCY5MglUMuWBhBLRf0SqOoqxKmr7qUBvA1clHsFY2FrBSWHen+oKXx7YN2sUG5qiheGDXhy4zHaz0Pa/yZiFkw8FmlVCwSeaOFO1feUqFgvW/HawNJQvO8GBXCTxMqIdxzOn7SFA8qdHPBbGzsA/B298HP1S+0+4n2Ic6LqZI3al8uwNP4dpuAu2p9LpvHqWq7ioMCieU71r1gebf59qYnbHcJt/J8SB8ir52IHnwcIOmwIwH5jWchHxK3tfd6tu2mZhySh153GimoM3QnAdiycsynv1BHhfiMa+DOcGXuaiDMgGDELXcVhDgwVcSzkBnTMFnB/GiLX+HdFGhb/PiAU3o2PYCfGQpgJsMfaPjJ69g+LdtB7G3lrh7sqQAnF5wfHPOXN+3fV0SwClL0FYCIbj8vlGyrBQZieVlfjHgcapTKG7guJcjjxyI8T32uwEboZ7x9oXh5YxTG+///2DEkao7OnLP0FGiNVTn+SmCn+h0h91P0v0UDx4hJHbLpyHSfdftEd58fX395rXUGnDKFErKYFer5q6FXxYnZVl2uM+7/xZf5roCxFmDJoNfakHB0FkZL4d0nVIRvsRGiAsgTRc1HJw45McAcwVIq4UhRHf3dMA3s8Um9Tp/AFWOhEJmFM4GsyAWMvzhZ0ne0FJcAoEJeaHnAYBXt9u214ja1dGgHDswXMhA5z3OGLkqlPdZBZ9ybqFhjDxoNCwLelM/0BwkIj92Ki8s7NJrCHkfcpXCP4elFm7nvEb9gYcF6DPYb9sdcWALUnRg2sjayBnmWIoJyC1SBAWNLFDgqgLokQuD2rXrNA8pmYUuBWisaA+NGKYCBv/GY3iRS8E6/1vaZKctwQC7jQatpOCl865TqaWwEMnaAu61g0ZzBBwD9MJN2bj3aM/p5wuS5rg3eHsJ3rrSbEVg3HuwvVBXB2xwRAehgOKFqZQFy2a2PQBAEKFBboHKUzgINJyw1L5HSIIBGFt2QHZpptFuGuOPznCe7fSW5wd1yAbaiANJDa22jhKESFG9etLfN6ote8jUIKsK0g8RhT7BwM5k9xpTIWLWJpOQgIC9I06wuqsQwC9xXDSZOidaZA0DZbx0o8PGyFU2SqYYCPN6EysCJXctAFJD6va4RmtO+ScJw8ARArSEcBDddfch2IFFvwPZd9rnnrdHMxC+GCgjWvTa4Opd+knbDrS0EQbHFW/eRS3Bd8wXqJrfpc08i0RErRhQUT/e39AzTjRpBaBIjgtvDmB0JrsluPcfK1pmnBYAboZMs5fhIF4yLgRtFnmn1ZvHQMZQ5QdP00O2R9TooaeFP5+g5GWQodU2ZZpGC1mEtBYh6xZYosRsX+5kcbCn7RfhJGr2ZjzSQwjex6/a5q6uCq7UpG/7BktN9MMrzzUWrkQO/7pD6/x/B/gAMKrJ/ApVdQChcqEhqAOSkqV1FWa/cVFE8B34KVR1EmmmzZeqKeq+lHbHnLhztdVR8eUWnQ8sxcxTBJDBMDYKHulE1BmWtDy3g2IgkvwdqkI+FbzAgMAvMjLCLmVlooirHLkyDZaT2IX70HdAwUl0U4Ed4pbbiEaCANK6Au9JIjcFIsq6SQRHQUavQYIglXZnizyQQADgMsmk879292y0MrTdcwRj/Z5LdcCLQKgK0oCxhhErXViDZPvoDSik/mHFjMuS9RHE1yVafOg1McfeIZIyOWGIBjTAFqmwTpeJL+raS4NKdyZ7ObTqgUhhCDOVstv2Y0wL0ASEgseqJH3UXQ5CorraZuNrfuD1ZbZlRdpsvvn+TdBEG7DZ/LGqZfDUyOJdU1eEPJXc9jXsZ6AXlMKxQsKXfVU8gEWCvjmADXhYNViwXpLkQMS5OgbyZgNDq2tatSNWvkt/M6ddBSOIHW6IEk/mvk+ECUPr97CYK+ILac3NMmrtFAPkt6fl1qes1ZFzVgv619aPEheF8ReLjRXrNMHIXuNT9LPeW1A8cpR2wEQFaa0NTgGOj0Tp5GeD0oJ0FCWXTSJ1V8m2nwiFY6K9btp12QPYKsBQdRoGXBaiL+uY4vef5DGofA8Imx3xW6YHW0ZZ8UK8fPlwQHme2h39/3p3pkT9wrmWwMKZg57xifVC4A3BcKptg1UMNNecozCJJkIL9AT3GtuH8p6CTpFxsDmwnBl+8aNkbswjbMIHyXw+saezcEUgOeNoUrOTfIgyKG4WgIp21IBJGC+SBwTqVOsh9oFRHDHskGmdibNC7XB0Wvgmo49BZRlD+IM8jiovkd65Tkb5mAxGFGrKOwhfsGO4LvK09tjNEnN54weXIeIHrFhLiZoMVoyEiCWcheABgotO7hAmT+pWjCyx+5AJ/Bwpkwpgluf9Sb4neRZgKN0Uu45NR+wMu0NWT7Np9gxn5cKy3415vI+G5lM76aY+t5fc6edsphHev2orB4XEZ/B+gm+3nyOWP2lDY3Y/cTvt0gYbyoSe2k8z3ZOmecWOs4O49vO30674FzXNxYnNfZYcJmQQmWrE/vTWIvJsD9rEqit7KwCLoQAIEbKl4zKVAYyU3jhqj3lT1XUu9sfuHoAJ42ryOCZ87fNK6Wfo0nk5TyqTkUWgS9i+NnF6QozvOobkfPqAHJPckGsC+aY2YJI7FFS4BtvsMv7nK4BP/Q1uQdwGfwzJuHMwl82so8GjKGc6D8RA1Y1PFwINOyUCbvxZAiC0ZtgncmPmuS4Tsx5jUcM4dfRsW6R2RgPeGovBAzxz2GvS/yHMC0XgKNjhfwT9laLF0YdKy7Dwbopqt21bT2ryL6lFwyLOoPWMfoXnmP+03rEUuLarCKjiZQwC034JH/A2j90hrAuSd2Gk+pyU7Tp/wJSeHD3Av55QM3w/nQnQ4bh1jPs6PAxvwQ2/iT1V4DHJVYVhMSoDBdz/ra8UHULqiZ13ZZLRzvtMOLqc8ezNT0fbmHpFICVwlKwOrFZGPuMaPo23tcDBaHoMY2Orw898wlc5vt4HIQ7PQKMgN1AePyo8D8MqIyqgOxMbHASdzGh7yI3HMYvPuedZRJhLhZaASWsnKoaTE8Un/+s1aDSGoVPrjWJ32Htutn1UKYoKRNf3CsL0YK1UAIhcF9YMQVebMI8lYriaTLxqWJOLXEt/I8KWtmi0/Ig1gKozdRETGzDZi88Vf1494jnlh3koXT0h3fEh/EDIbtAvJGKsj9Z4vnr0ZwxUkwOR2oK1jRRW1o4eyfyErPWkrKcEZzPdMCOOBFXK+ik1lLXsZHBMwtfycqMjfP6xmbw3uEm8fDab6dLDHAuH03t+vlIxj4pFNpXndv4BqT/m/ZNVo4pu39AZZuhsFiLRXa46jfvN55eRM8p8a5pcTHWA6Oebhychvt/AyWVKQsApZJr89a8XCawiGQXNJzxVWM44wb0XWL8vwW6MsAiNDKAetZv7nljYYvUPk768oXFB3R4PZaw1hRsZl39olN2hSF0G0oqjGw0bh5BRJafdHzP8jxHC/Fzd6AmJGiGxeAKbQf8zVTE7i0bcCUGvrVyd/bqqPEBqTJIM15zYBD70Vei7CxNxuDZJG7PgtUHzbdUpvjZQ3Ld0CkOnt5bQn6UUE27UXqSii6gQFLxL69DXxcHDO6rxQsb3SejAEnyGOWo2QRW/kiN00Gk4zhxNitSitvkECQNZThKhM8nzJAi3TBBg21tOA5JPz+cHJ7mrqZNc0+/ZAG082lB4BkSbHosfWwcdVRuokS7V2YJ+miATq0vlLAG/kh1cqkRciqnTgaFBDQL6p5rXly1eWNgQUFpzQHPHVPAIvhecp4I87vqGEOSST+AaGRbte7zCha7iwCG8cWd7/0ZKjdun/YGMV0ubGN61fQD67YApqHsiFx6WRPHDSVHeFQwvaXfs8sFTDdKxf8IGu5bTbIitqCH/traJIresBpn8EjPqs9sR5KX7XGu+jmAvKZycDj9s8VO3I5Lr09O5VGIhAk8wOC0KP8EORmAJGDtgZgImDNbadD1pjLuNX1GeX7f86kxjr2O40BQdRdk5JrM02/ivcnXonwAIddIA7gHsskfnfLj9rJPzCO0jZZAd50lUMFmvGQ6Ft+wZWfP7Co0nJd5+0xYP4a0/RzPbt/s0cRcka+g3AVCx5yAJC3ldcI9fmOWIVYtraZ5w0wdrt3XEaPQAHFJTOApfhrBvZWUkq/DtEZLyqbohJU/7I2d/1cRtnIgnvABXfIDpxpd25oNOhH3p9SqenC7Qmd/zUecA9o92j7vEFbeA8CRX/t7OG+rpbpNQGM1OZvBM11zmW6NkbJpn7t2a2WDjMPkYHWQbYuTkbUebzdH9vwRphunXC/G9TMBFlTKvMTTy5f7GLxh2ZiTt4Xx0hcwb0zRNEFwD7rQIEiM7ycxuBTK1Ej5X+WDv8ppGe4mQnsXRK7oYaLs/nQAFm0x1VZL8c87M3Q0wc53crISvQDR4R9NdbSNcgm/2Waj0pbu+tTAnBBUdtW1wKoPOaL4Nu3Z+78+86+FKwUlCxPjOF158aDAGqKN7ry/tzDUyvOeFN/U0gT1YUS4uKMfjRV8M7mIqqfFm2Ur86ASaAGG845Esxa99wYucPjwiCQV9cemJOagOnuNlDnhMeNU/NXcolsBP2BevT8Czz8KHWha9QspUJw8a5Md9BaueIF7pIlclNGCZMWgo2h2Wm8cjTAO+6zZuhDlwyI/J1123xxffTJefwj53xee/+fV/xav8iTf+Ni/pWs2KKlVGk8QV/WKpz63Zmq5ep6VC20hi3ZyLLd6pa9y7ag/yeGhV6Qr7eikudTKI2tfHPd/aTJHoJR8CmgltVOblWM8YXhThlve0nWun5QmWp/GMJg3bk5t4DG/2uVFGHabH4csdVV6vy7ajkcNBURUqSwbrBZU6u15UuRvHfpDm+WpM+vKl3Sd2FaNLObvw+g5dEMW3hTp64QRb3Nu24esPYXKCFo7g9+GzR3IMmbuxZ7Q8RPGVXcH7ZJd/vMq3Mrk5U9v3FGD6FF1Chv8BNfoVPRnRmo/K+n9Bo56q5g80y9JA/QMADO7olm95biUBwvFUzGMdsGTNOmQJlruGNHZfM6JLLnPA0OXV5e3V5Q/i8uvl5evl5Z/F/76+TmZjru3b8MT1dhcf/5A4IFnck0hGa1jEc3vBRIEkNs+gFkReZWWpWvdzsxh2QcezIr0c9Z37zsavrQaO0GBvO9KaxWIoipX56xsIvvO4DN9EdA2E4S1BNpGgEUx8FftIdJGryEHawfgOCh5nJjeBuzTecsgIe/pYDsb7h2KgCGOXPQg3JmK5tdsIdoNppQli1op5uwAArDF+84GqAV74feE7mGoL3mc8YH64wrjirf2tOyb1KIerwuiZP+OkzR/Uxe88BTMuxe/9vY/PzPUicBiAmNCZkPPwGHlMhF6fCmogX/jnSAZfEg3fzuraiIbjLqLx6s5ENAYlmCmY4vyoqmFPd/w5jkl55QF9m7nxac93Y1wZvFHl1zxCur5pOhuISaz5tnlQEogUX/O2M7XwyPXUKyjxPQP3jkWwf8MKihMpah9BSptqxQuYOA12s0ZwdgKiBvPzS7PzqWDmYe5Oqq10r1O5VksowLhflGWgK4Hw46sBRLA89UpfoJnB2QhHw6d10jxmw7DX39UkJfum8jO1jPbBn8OM5HDqLIYjno+HafJD29P/p4MubZAwBpaaeMUczagX5Bjm0zo+5aEiTXFEvKsKOPH+ikw4iLVT6zjP9whVeAU1aNHqzxA7fAF5aHXbd1P4wVsaoDwyRWdRE7dtpm0iHH5K9f8BUEsDBBQAAAAIAIAki1Enrn1NLgQAAFkMAAAWAAAAcmVxdWVzdHMvZXhjZXB0aW9ucy5weZVWTW/bOBC961cM0kPswNGllyLAHto0RQM02yLxtseYFkcWG4nUklQc76G/fWcoUZZsx0Z8sUTNvDdffOQ7uLy4hMxIpVdX0Pj88gOvJMnZ2Vli8d8GnXcpvmRYe2W0S/7s/5JkXigHlZFNiYSlvVDagS8QHHowOdx3QOewRUoDRW5NBY0tS7V8P6ABVdXGevg6n/+4sdZYEA4+CYf9QpIkWSmci9g30Xdy+z0YTK8SoB+RzAu0CGtCEBpEtVSrxjRuGwpFKijMLGusRQnrQlEahdCypKLAxjQ2IHXVSCNsEh4k5vD4qLTyj48Th2U+gwthV47+Lp7W/NQF0nndkqUSpfoP9yKHtfIFLDqeBUUr+c3VVBBcgFn+xoyawdQRMH6Fv6AlS2tTT87j8vkM/jYap709B5gOnOLjrkGIYA80rO5hqhwmPSTNgTY+WIT4+WWESYu9Z/wVwgnvbY8yg55sOqjegfhG+cT1bTJNjXayW+ZZ8Jqmfdd2+9WPVj9sexjb4fqogxlgmNI4RKFJEebaaE2dI7eTYAPbY4g/rHnZtGA74EOsmq2OwTw8fDsFotnoGMZcVWgafyQp2n5x74Anawlkn7a751r4rOBd5llBWpq1KkvI+AMsjS+C3RVt1qvFnwOClHaxd3Es+gE74nKPQvb2gdQNdvW4azG/nRLNYuIn8uzUxNtNyNKwPDIOP/rgUBnPOmmf0XZFiWrZ6hJ1UTYZoQ1KJEjPnMiRUSwS+H74gxwnB0NtKUGquElptwq9ASm8AKVDdKIsjffELSrT6CDlnNloAP65/8YBKxqMo5P9TKIn2Zo1wnYenEAlnoipl9fRcBlzRzHdoyRj0r5jU2YYieK30XiEdKecow48ZAVW4oAk/BRlg/vnRojXBSeYYLpKofC+BmoB/7sp51K10CO6Wx3SfRPdAyKfJqIpKfZ6AzmxtEVrA3CHGCi+N2ZD8/SsJJ9zdCA6U2Fh1tTvgHaI4SsN0kEVfY2kCA4ceoNvZgvKxklt8xujt6I2SoR6cAjxumj0E8ob3d5uTmnvcE8gIfB0Zi0EYIcByybsFD7GImdrtCv4now+4zHm2fg+sw3kiyDFCDtDMgBuD/msxR1ruLcoKmJ0DUnOa1TzTX2oVR1gGLUgLz1VuC2VBC03bBXA07G+kOycqul14zzd71iiFDoozUplkIf8RhKiLa6VlmJZ4icjT8L2Asl9IV1C7pWIJ+a6QD0Q3BaaBGZJyG0K7+CXsJq+u91bpOs+TLr/LSc3i6oSVkO9oseoKl8otTvqWYTZgZ3BZ6xJnATns0fxEXI+K7j0pkbNk02J4IvnqzVdinj4+tQlUtqVClb0ulRa2A2UqFe+2GlU60HMJPFUsc0rwY1O/fb+TeCydwNp0OlziiaczXw+4EtNSktWtGsc31ms0Kv2ePgfUEsDBBQAAAAIAIAki1GHWFYGQAQAALsNAAAQAAAAcmVxdWVzdHMvaGVscC5webVX3W/bNhB/119xcxHIBjw9dBgGBPDLiqxI0NpG0u5lGARaom0mEqmRVBKh8P++45dM+QsZ1hqJLZ3ufvd9R41Go8+ibCsKheCaMM74BlbtBiRthNSwpVVD5VhNstFolKylqCHP161uJc1zYLVlaiTjGqm80EzwJPHkR4U3gaUiei1kHe5Vp/pLVfUirOQkXLeyqtjql3BbbIksqU6cEVnQnefPVCpUi+YQhWb/01KlVaAmiZbddQL4sXIeNDPeSrbqPehEQ7mxhL4WtNFwa+k3UgrppHsOmMFccGqJCyQ9PHyKSYXsGi02kjTbLtBppahD8eq8XEyK5ZIkKekacnxU0ZpiXkxcxxOHgYm4p5gADgRKVmh4YXoLekth2emt4DAUA8JL8NHIEouwlOKZlRRWwgtyUlPLZ248L4j1eVDnaislEqoOZMtN4WTwh5BAX4nhnQJKffDS77Pfsl+BGVurCpNkzLcY31KjO72G1LOmU0i9BYZqBdOdN/zLlikIdQYvQj4pWGG6Y1XGjWW37K6BcWiI1KxoKyKnRnsjxYqsqs6ClYIqnmoLA1ibcOcA8OpWCu7g0CVb7Aj2jIrYxsVUbUVblagbUXzitXBIotU2boXA6GB21JY0NASzEBh2owuxFe27QmUhs6Ek4gTOer6ssUYdFYaLDlsfSc72cXXFcwwfOuWEGv8E8Y0YrU4rMMF+C3p6pTL7l8IVjHEAoJqm69uX8bXIavIo5LTHeuPnDBbj3xGrkGKy93F9hk/SihKFX8+0gp/Q5zXjpIqiczlCafYoGB//dWT0aZHpG6wYQP19OZN3/79SAN7BB2HENIWPOIrVRY37RvsxWsPcvRz2r/yJixeeujZy02k/mYZyg/F0GnLn57fJRTS0P1JOJdHU0mXtgmBmAYkWbhZmQL+2zCc4btOLFn8bZDXFKtC0Rnv6ADnKeDIs/9QXRszpSTHrzgXPL8JFtAT/iy19VM/acIJjl5wYgEHT8dgzvH6j9+ZE6QnLPjojON/8WeKUjH80lBmeAI49j+TNwt/7kwaRaKV5d3dhZvvDQBTh84oOlHnR2NiDaJ/Qf/VqBnAQNf+L5c0cf/M/b+4fbhfzfP718+8394cFEZ9QLoZgQzFBWo5jAWybyEiz5NPJIA548HsTqGG8BGZ/XBHm7rSG32c8POC9qN+HLUJ2S6C/U8CFtum3cwdtii0KQ2UPHfooakZrQFQ8w3o/njcH7HtrkPXArYitVXhUy/siM/r7s23kRSTRdL5aYt4jWNds+7Y7ZPCdte+xI4aoXgzXYb3FkcEqMPEIVRM9Cm8A+Phs3xy+JUSl3teRHeE1vhFFI3yJadTdz/Z9x57nzOCOxzm+gdw9LOb9FLecY/MilJVt3aix2wm4uHHW50+0U7MvssWzMuMlpnX2foJnuQQrK8/N9sF3GrMl89zYgZXuDHFGJf8CUEsDBBQAAAAIAANyM08bSnPheQEAAPUCAAARAAAAcmVxdWVzdHMvaG9va3MucHltkUFvgkAQhe/7KyZ6AI1ybkg8NPHQpElJWm/GwAoDbMRdurvYGGN/e4cFRNtOAgtvmW/ePqawnC8hVZmQRQiNzZdPrcLYZDJhGj8bNNYEpVIHw74firFNKQwcVdZUCLVWJ5GhAVsipLzme1EJK0jIlXbiew8DBwNzNhaPAWPPJy4qvieG2wgZSxKNplbSYJKEDKg21D9oUKBEzS1mkGt1BD6QA+f5JYpeP2AFW29o8HaMsQxzoIs3lY3dHH/WoTXaRku44AmlDWG7c4bdGwgJDndlbAqbaB2FowvRHVXJ6kw3HEYIU3Oblm6Gf8DzojtVt8QZt3wB8/nhi+vC9A7I9bpvo7i4+5JAqRVKct3SSSwEOYJaYEozaQ6Bgva4LaALdNWv5P5y/asHBdrW0MxtiXxIG/pqFW64tdrvHXtxnPKqimNvNn52z926h91trw3OmafcftHbim8R9J78/zJ5aCFTd10UuVQW3ijuR/JgaoCPPfe/eBR/AFBLAwQUAAAACACAJItR0/Mm6lImAAAEhgAAEgAAAHJlcXVlc3RzL21vZGVscy5wee09/XPctpW/66/AWeNbrrqiHTtJXaWb1vXHRW0Seyz5OlPXs0stsRIrLrkluJLVTO5vv/cFEABJSb52pu3MaSbxLgk8AA8P7/th99XhwaFa1XlRnR+pXbs+fIZP9vYePHiw1+i/7rRpTbqpc12avf8J//b2Ti8Ko+DlrtQAo2qzojKqvdBq2xSbrLlR9dlf9KrFZ1mrtvW1btQ7C5SG2Cs227ppVZ61ui022n43N2Zvb18d8zdd8QxVVV/PVFur7KoucgVty2JVtEo6lQCkSblb8OK6aC+KCmbR6CyHGWc3apXtjFbf1/XlbvuqaepGXV/oSpk2q/KsyVVZnDW4Algg9MzUn47fzgCy2a0uVEbPXm3OdJ7rXL29aS/qKlUnWquLtt2ao0ePzmHE3Vm6qjePtmb9yGLyUWEMfHj09KtfPkvtWu3qTFrkVba3t27qjdo1JUzhaboudAlTlqaCvNf4MG5X6m1t3JIJqF5sdmVbbLOmXazrZgNYzsJuu7YobRdoZvQC3oRN9KeV3rZFXblZJHsK/l5qHIFwN4OJZfkp7F+9a+XJ26Zu61Vdytfv61WGQN7iIPRsKistagv3fWV2W/yk8zdb3VB7bpNewEa58XO9zmBdC3ooDUzb7FbtrtGu1YvM6OPK6MoUbXGlXxarVkZMs117YZt9d3r69neZKVbP4aG8XwHgooPEX/+SNQt8vcgB0kyd63bBLxYXsHgNa4Tv2xv7EJoLtDEE4siCnR+ALoACTlYXepPN1HF1lZVF/v7d9zP14mJXXer8lRAJd6D+L+DE6aqlfXBv8GkFZw6GkwcnLVD9Bh6b3QbgMOp5ZosCIDRVVi6QDtz02npRZYizBWAVIM/UriqInAqzyMyqKKR/0IsXdQ70aRZIjVW20YwmRDejDmhqpvAw1C1SWsELMTTDRU4EtYAt3MJk4T0Pigd+calvFoCTRVkYwD1TKqMdHlWXhgEVsJqFgaOvzUxm8hdTV7C69QyO7hZb62qmAM2rS9ufUF20N1O3+Ztt1oarepGVZXZWwlx+yLZbRAk95q2GUzLD07KraF702QADaukTH8QZLnKmzm5abedqFtubJzgXYDca2p7tCjir1YIbAvEy8oenhctCPoRPS/0Jv7qDkLU7s8BBPQKGL8BPj9QpMGejW1WvifwUt+YGzKWLCugbGKnKYIBdW2+AElaw/Bvsvm1qwK1BVMA25kUDlJbuvXv18vjdqxeni5PT56fHai5II6AgO650PlPh3756+vgLr9G63lWDjZ54jWqQLM1Qo6deo1bjkoFzL+z8Ztzol14jIIRNVsHZiRs92wOu9PLV6+fvvz9duGV9f/zD8Sks6+njvRdvfjx99ePp4sV373/8w+Lk+E+v4PkXj9UB/O/Jl3vHp6/ehe+++uLJ3t7eqsyMsdzbHuUfik9FlbCInB7R9H4LCIbJtTf0DfgckDqcHSCjxOhyLa3wD4Tn74Bgcha30EgBt0DRCGItJclqW0JnmMeHj92TLXy3NEpwU/g29d4juLnapvjBPS3WIH5betlNw2s+eTQJBk3hpOgqT/C1BxxQAGIVodMnHzw9CGF7cCa/mUzH3lFPb5BGgyio1GSS/qUGHHfL+y0SfLHaaBDZuUPyQqQlnN9sYxIUkyGqacsQz/BeA5MRpWBb6JXGs4Q90m74PxZliaoCnpX1Ds6OiGMfAKkbWyAL0CDgIGcKxYoCPSRTyOQAqgP35LDdwSk3qXoDrKJBnQQWCMoWdC14cHzmOroOwFNalTVnRYsnwke1N5Gs0cgbgRj8maT+8vf8rgVIKlSTVpoQNVNJx9qm03D7ZB9I77DPgF+u1UVmsrZtBMIE9bLJ/7HvYkFsf9Hvb0BJYNL3n4MipC5n6or2MBIt8dYPL/vKBAwaNw1Php0Xvh6dlf2D4WFmV+Zj7y3O7wrndmWGu8JkrnC/ccwf60oPt+pQYA/JaDP8Sy5TptFkQlbAZBot+pJE2BS2APTmy9mtwNTVHcCufGBX0+nQxjvZmfAyZiqvjf7r/LTZ6alHEUaP0809zjyqKiah/89U/+R3TPaszm9oczLltOpHqFUf0gEUFf8+XIAG+xwG8JnH/x94+FFfEHBoNZ3pjrcknZKHn0COTWfq6fjbGZmIIHRvtt7+wXq/vF8f+LwzoI+I3mamIYvy1pfgySAkxywhK4De/jsrd2yCJA9e01ZsADCuDaTvVQEmXfpgGrKcHs/zjv9dQ7zE/aERcFowSqa4J47i+lb6eiG2XsCx3LMhToXY++nnqdcYV9Nvy8+lcdcaHhB4YIZZiRyHBwsXFB3crLyd9+H7W5kfDoWcLyv7bJnZXlYOMuB78Lx99bKuJqDvZnjyYDowv4olE03XHOEAb2+egqWgsM15jQexqWEzxlgtjhhyLpZ041z3CtaHg195uPb/uq2+kzMn1C5ly2iMmcoe8rSYpfKjcR792fw5IBqUBVdTJhggrBAT+0qMeGqqP4knxh7tcM9RPON2hk8vhp72JpgQ15gR14v1DukAQ8IuqPlcPRnerjUYg2tUh696r+ncdwCe3gZgxisZAhJLp37HGS847DzccV1Bw9DCxumhQtNvy8u6BYc4vKe78T9Z02Q3Q+hcE8OZA9xoop5GhhAHdbkQQIpNkmkfDswZzvjw+UZBUFQ7fR80dVMNefMaHvoutAQxOL9kuT9fM2u3mJ3jFomsma8vIh1lnW6yS8+/loigWqComq/bsHn/yDdr71ChauFEHUGAiY568JIOWt/k6YOKzc/v0Gs2YHuiUtToczhNwLrRtUam4UzpK4AEmIAnoWr0lmxVUGtsL5Bs2CqNLQaCwIy0UmRvkufuDsE58dyBAsJs9aqAlQO3Q5euBQybpR48NA8m6qFK6JnPsUKix5Fnzp8TkWk3tw8E5qPdLVr8sBXCAEdFXh+k/tQSSOKPF4gSfB1P05ujrAX3B2jxc3bopfa2Ztvoq6LeGW/DALG0Ya7POyIio1DHxhmh3kuz05+wA+D9dYYigeXiiI3YxkZ8HweNRrdQhFaPinH8Dt3kP/VIY1Dfp4nFtJ70aF4QBBN+jq6S5nAFzAgp7Ig6Hi2lh/q1fPh2KVEM0ezfo77e1ojOLWrPmev5lp/kDkL04NslkO1FsbpAJmeQcgFMSw655goDFwT/iLRzxdbKEXvp+Iv17vjNwEg6sp4fAJkHL4V5HZFOX9QVRWTW9vFgFxboUYefLEs8sno5oONn0TYBimNRCiRynYUQkWMddQYUBm/aNgMkyOKt3aSO12J92IEbt82RYbNcfkhAvyW1FWzBj8slYtQq7zNFRpmLGV2DGdbRJjBttS2zVYhG9J8esVMVT+Wds1UJSiurVVsLDDmcY1HTYAD2LPFWeeYXwicOY+HD+38uJtBXf6QwFgIcrspLYB2o8eFRmZG1OuWxg04SLwnpplEv6PHvswZnbGMqEUrJmBXL2SddEhARHaJaf5atLvktrU7ZCAacjOxcuzMKn4+OLEv69ttvrSfcBuK8N/AIpK2LdVrOMfmvV6cTYOw2oof/nhVVWjfnj85163yRAiIVfuDUmvj0qw8A8OO3lvt0PB0kR1W0iwUz84C18bmfo0JEsQT5ZJUS/kZkKJ9Jj6GPkYcWqU/a4A7LR9kTCxaxKp/xKNDH6VHH2MG84sib0ptte0O7Y2gXyHXBo3RCQbSwDx99LwXCZLMicOxZy5Ub87egNT1yzS0Lm4NFix3s96CLPNwLseD6yNegCz/rhqGooxuEY5DBEBSBdO07QQedgiilp+2GFhTZ59QkBQViAw2HFIhQ6pMQRbUVv819M5Mai7SYK8/j5V5yNACDvOGkHUJjrNFruz3hLtAr2eVgN+kFcdM5UVL4wu1DhG16SaHZORFp+MLyj7mlWv8EwVFr5AR56LNRgF+7I/jQfPyWtEQPUZ56Zc9wP9aC4VOKMJvPEvgsTZqsMhuM8GLMDnh9I1pW0aa+5woNtgiCRzZbx2GGWIS3nvDoI9ewGx++sVzE3/+wBXOWjgDCt8RrHAmE74h9OCoYZEYeKYTviT85WgjfWYblU0S0KmJi3UHs3k5jutg6bTHG+lCgbta3nzpdEt2k7OLd7FqKjn4GjbA+ZSPKlEWD0hrVAf0pA8ZK5jlHZ1GEow9xVH08FguCXbvnusI8CtBYKTic3a3lzpBCCZK5qHdlbp2WbJm0BQHbZNUOQ8LfqLzGqZqavMOgd+S7lVa7KtemaBAPBEmv15gF9M8SzgygJ6Dp3R3C2mtq/HmcaDrNASyTGjLsnQLwThIZ1Icnjx/fKfk9frMvaj/s6pnV0uPNtm1Djh94zSwYzzwIdNi2jsCwbIhhhDoYQRRuEXXvZEgIgoIIS6cMLtGIofWw6UVz4rcCuKPytiYbFSxVD1y2RoNWtnPhcnUM6Yc6kneLTm7EC7N4sJr+nWimhnch6D5Kaoi2O/SF/SPqfw5rzjWcRjpwLVhb+GFbY3YTyJUabQb0qxH3QXZ9WBaXbMZEAy7w2cL1lAUNCsF/RXXUQiEPFE2Vcw6BIxZNR93kIMLn58UVBdqs0RW6p1gMCS3xAhOrFwy2wVwMSmPiVYy0EpwkNlY13EoWnMi/I61wu5LON2kYHSONEZ0JCU4VJnXswzbTYcNMTK+xC36BYCCRApY+khC+Q5Ry2p4ymJrm6X5dKuQbMhah43XdXGK8JRNRKKPkA6FR5AlwYH94f3KqzuvoROPIKZmgMn7dYIYSCqMsz8XJOIJ2Ojv0/+ln6Ic97n+Hnoh5fjGwu7Q3x6M9kN5r5r2WDXsvOq7qM9mUpkBhm4D3eiEytlACZrX12WGcrZgE/NKfuvA9xwP92Qnz6jiZP1jMaAbYz4BSZrEcnUr2dcpejLMBPu6e2yzQsW81kCwy5f1ouDEEEmdL+jST7rZb3STT27OPMEcSU38lJSEHMiaj0LTeOkVH4hRh+7DnasVOMCdsZUN8+AiYQWu+/JpzJ+JwogMgjlbqfPzyx+dDzlby0r/nzEx6H28gDtffQ5vBRlzJ8c577SK6xPwtBHn4fEUTDbLLL7IrLYF1hcddo4pMvMvTU6DvH/WkQRWVmBxwrbOyqPLyhmPGknL6COAAE6tIrhu/d2bYZ0UaSlGtyl3OCkwXZLYZlGjmn00mgSCHU7ClbHH1NP0UTOuuxPEtsNRHT548feZTqxcwILQORaadwe9ve7DrvRiadGFcUPIcD4YJq8xVMLwdi5d35NNXJXAicjZeFDCZbYamiM0n3+tPqkSkbZMAEgfxc5AL1Q17TIk0WBCtKeOgOuT0VZZKilSd5SYryrZezjxQS5SbS6XblZNQWYPJpsrLyqbpLWE2C0rgtW56Dwy7Qo169/qFevqrZ1/DRpaeWgXYmRxN0J2DC0MTHxkHLQ9rHpJpSgqbQZ0kIaNlMEzU981058rHz4kXYJddAmzB6iuKhRmaAaZdepTfD8oQ6lj/milmEgh1Rj1nnIwJGkeTnW/Q2Jx39QG89Y5+mGv0E/zxsMS5WcQ+uvT25ECnWXNuwnAd+dFpemFvTVDnKnkgEIg4fnr8H83PR8CmuU/m8plS9VY3F9nWqJt6B7wezFc6ZnDKfnr8828eTAeB078pOs6zNunxdjpmcoKi9A5eW5DJn2gpdIgWh9i+AzHBEh82tD5i7nZ1D0A9iY/gcSUWP0zyWqvrTJwEYJkgP+/qaDiuZ1oKnUqcT7iXrePxwOJxe37y4viYktWzFWnRrMEB06yvDUXS2LXvZ4xj8j+BXtUNJlnTJDy4ZxqYdlHvmlS9BtxLjo7vA8FjpuKhaW2VZhsyK02NhnKxvvEgF8g+tEE2QiePrYEM2Xa+wvKe5GAK7FLDNmteg8XKrhIh7PCTxrsXF0PEknrwuOGfCGfWgm4R+iFd8vHyRW4fco98Jkg2F5jQVwFbYkoqszNdppM4jg0j+uxpNznoZdJ+FnRvG16APGdbALbfelAJzZVuiRmXwjVcJ3gBz8QDjEGkySTAP70OpyddfjFXk99OYkDwlDQSDwZyuVEIwMZ/QeINWwWL+R061JjNknMNicsdUdOjkvvlyTu5elvSnWXVmJLV33t+i3RFH+LMrlvg8rLH4Lqd4A+fAZcFyDBUW1sA/3wGRBFGwyBtRQH9+xlArWgbg+uJPvuxB31EGxO/9m2p8S4K0pMx1rHQndNqtXDNmXuEBQuxKwJzblyfHmUNlFn4aJw8NP/50JD1K2jvYMU5W0PZVxZO1yuuRfEKwJKubir5YOnc0iXTEXuAInXk4zTyf3S6U8/2sL4Ytj+sR+Zetoe1tvsuo84sH6gzTIKtsGkYAaYo+Ye9nZgBJONICLCPVFCviQk7rRVNCct6BQ7lAPTzWAeL3cQxNe2fekq/JlAuGNhnOR4GPvToF0FMP2L2IULp7wf5s3gzel6tu5x83t6QV4IKb4LdAamDC7ZhZHTAzmwcBMshMU0LP3nWFyZcAMueqWZHRcL17vwCHoAGWNqKtzRypLVFNcEtAM2yAzTkH46S+jpXqxAHigoKoaLOTiHTUbfDvi3JpQNUIEoy5i2eq1eqkdWTiSFwab7bbE0ERxJExJbl3StvZlQxIP2fEqpxBNE8bNJ6ACpa3SRD3ZQl+iMcfRK0Fvx4NYs8uyT0Z3qY8VgqJzaO5V4LaELBOI82Cy41RfWiLJMPoetkrKwodF5H05ISqC4lnhOSZ0qyk6Ve1GNXH2OpIZO6hwJZ6uqcxKerZeWCpSGFMTmFPZES4OewrgI2134fKrQeQKobLqRaD99dkY23ItBsCZG8Y5NWl+WE2fj09hR+9CGAqcBRqtUObIaKE8e7MIeo7A07GfrMThzL5J4hvR5MEzQTGg0aPvqOCRzdBaA5b3IAhMRSbHlr3GBwa/BvOLpCNIlISPrc1u7V8RvZmTcnXKA9Vt9Aq8uL9VojcjAaK+4LCaZYU4ZXDSfRc2OEkAAVGeAiV0ue25KvT+CyJFgiGUQOcTYj7jPWzd65ZNqjj4GiAfxjKwN4K97eoFHIS7V6MuESdpgrjFGIf4NTUlAn3+xaikYjNsudAbYVmCEyKhPzgPrsy7KJ1NQffk+tJyjFvLrshIHcRwsKwZ5iCgjs2aFNKSDIkxXX9ndcsg9rX/2A2ZWHlF5JxMs5lia9J1qTfkb4NFYj+zVw91ihJHUNU6ofMhiqrh3sdEehFVqD96gb9f+GpO9Qu/E6jQEogZT7dHh9fX1IeZauYDGfhNQXxfwYGJMS7U5ErPvqeZ7bQQ9pUMRMq64z8mjYmhoKsUnBWkwMwZTxuCQTH+AkzMbvqcTBzHuHAyULEXBYZhB08gRyXwOMcMC6IGFiSPNT4aG06i5SRo46mI34SkQGV4uwoqJAmtCo+BmQrLwzEV7HuAjpkAKEcuXhIOE9C0Wbqjd4b8F1gTdDXGvgupwfMAAC2G2PURwpYRJ9OfR3cS7y/fiBLCEIl1rz3avnLydTwmYQeATpnsSDTYfLdvbVCaAg2j1Y5GOyfnhcid6ssoojOFlfzOyTXppTUEAIHrZdpyopUvg/ThzmjNwB5zztH73bcDR5POnTJwXRmSpdKH0+mdzPLiHH1ZBdQlYGp1YDugZOMVjan1p0cuJhJ6kuKeHA2xvTBi6mTMD0sY5xDMmi7F2+4t324HeR5q4nwq9uEvt96oWS4znc5rdi3JEizISEx4oBDpfk7XP6fFYeruBw4wkvVh1Se81l2sENPskBDdDjqKQLZpKpgKVbgGODTuXqXEeytBHvI0f4Y0jvt3hXFREW60frUotTk8APgmQ5SDcHLRbpjkAkjXvSGwT14M0WFPbo9NxbrDge3M9udVknTOA23n8v2ubG8XUXpJTacClr1Tvx/3P6IZqRS8kAWy4tA7cU7uDwQDZDYWc4HCFX7KTq5Y4Ctu4JWLiYZ3hezTieEfoqyASQ5MVGd4mQLEqzElWHG8erMTrEIQBvKZ0Rn1UcigBYnGQGX1fa1YoAL6VrQPzFfHYCaKqeVzcgf84Mvqi4irmz3GHly2W0hYBLWiZxTuAtwDoA8ZJvibc2gULHe/iAkd9JROt7wvILuqJHTCuMdI4W1ntn2ybfehvkMvyGYpuLfv62fd9XvoZ7BBdwdTlTnqvFu41LuF/wLMxwmSk+3976Qgi35394QgU7iT7k9R9wRFJ2krghKUfprkPHhQFB9oOUISBJ4o0F7v4ISvmR7EVbm+ZpRFJs48GRDBV1SrVsVEnJvjEKvF0BAtimNHjN3g2G+DDcw5Uf6OLwQPnFEVSHd9hJcJshxP/CgfEvN8AKcR5Z1nq/2gdBn1QTTr2qP864DQtbJT+7S32WtFyXoOslP3N9nrvLkEsaOBl0gkdFumLgUVhiUL3kJP5igWaKWSywpsWtaWLZNCpY3kVdlMrM9IQfQe7SkwLzX28mnf9pYgO4E7Z90MMGn4Sg8aMusy0QBL+nibFx+fHurGN7OGiCMG0uqBx8i//SbXIjzSrQY3puo/0jdSx5rC/Qn1ivBZ8YbCVUnhBGQAtKz1P15eMvkVqePH4cpa96eBsaA93xh0Xnj1cvg/Rct/vfxTnM0Pc13ViQbchzt1y6I25NJ4f+j5bzStKTz/gBDrvPyY20XDqt09n+0NlREo8xmkk9HFwI5uxSfZmGo+SnDs0wWELX1+RXyMFzTkaeBgh4b2jay2WTXdMsxc9MOvpyyY5KyiKDt2dylVwV1HH64E5teR8AoUgaBuWJqaIJzbfpIF+x+dEl5WF3N4SGfCC7Htrv1wUmVqOSbGPJ/jaPZ7j7MF65vIhacZYUJwyQLyyjC3worSxtgbAjkC6nYgDuc1eveQ/mw448vztpNcwERLuwuGFdwboo3QaL41NXuQ9mt6UM+pTy8GlCWH/MdfXOyqjLnGsC6NsGMxUANO5Zb2OZRGVe4c1yuOeAIlRCmD3ddcof/AjE8BoTsh7gaX/w5g8P4m1nOIPYDQpMX9gCU5e+z1UyaGxHMG/XLIJLcuTOxGwDc+TK22KDqbXEZuEItNcar40FlNsMEsGXDyETD2rWNAXefyOb2Z1LunkJIee6bLNp/xDZewFtfTHn14DWanZWY6CJYVVvFU8rpimyJimU0s2ElVN2rFaFuaDigqwxLltI2KU6DlZW0NgNe+V3VUaaJyLmRrGM6LAia7UChlXnQa6J7S2zAT5zqW+uMSqQNec7CsJHB1D2Yu4uEU4dJpPH/a38bMWcMgdJLwg1qCO+dasZZjUWpXF5xWKBnu3xbHR8GrT+1BUHqwNKlotk9qqsjU6CfHdQfVFM6oHaIiU3waLi1dzgvcjn33g8jtO1eIsyGzYigznM/W900BSTgc6Q5Gy6T5b3MmKGVYgBjU+a9O42+QkndOTiS+KgaTHFgqNLJN7gu/NsOjXsZx87JsTOjG5B9aPOlGPqBcKLipsMx+dNMB+vX5A+tC1Wl2Q4CrPPa7k4C1QUlG17w+AmPYSBbhdegRd1AFg23PZZJbK2WC2sffC0rQDcWV2XfXCg/8ZXiBzRpi09OHRHgVimoEV/iRpe6EvoCI+SF0yXouhuq+3x0MJYtudgAWTiaF/Dv1TfZXMdG8yNxLO7KgukXs79pKv3RHJwFqg69u7gC8efeQOikkoDwYAzLz/cu8yE0yW7E2HUwQFs/8EBToLyFYIJ+uwyp7UtlzjImz8sl8PWucc90vrS36mqrv6mm/r/N+vfYbOKQdGAt9Vwoi1mMvM1MJ7kUZKJaTNbxoYi4MJOki+ePLNVKb1Lh+Vmob+fVuL7gv7tKOdfjHCGr1aiyDleD7bgmSe95Hx31fwtVydFD+kKphH6KIy7OHuAULrLo4rOJcO60rUuSwqWWmPAmTAcBaIiPxSJDh4pFZKEhY6uIL88ATXzCP1YR0upyAa1y9TllXbzM8uRe0JlmcnEmo2TOB7axb58lwM0Cu87Hz1FmNjbu2j83vhCd54Qv4OCie6GSlbIrJIElX/QqhLvvvZu4iXlDgxfmj4dXTo6gG5hIVlcKek86eQ5sqoz3bHtKGR1keEtDO5oA7IwCjjG7MgJNTa/bIujw1Ks9T60LWiwSTtXOTFzwTo0cUgD5vv77Q+GDM1HmqTwn6UAq+NOP3Q+Pc9HF3BqidNgGHhhir/p+Rcz8VLYn0iY0wkOp3/cSuiFXLkBt6HwjVJ/5B88cS4dvpbMOnS8RdBuCMujX14xNgErMhc4KlJUGGLTG3QPrP27q8B46WYBpiSZY7QuhesSY1JVu82ZJpOeL74oWrmLwptSlvvDpCJQxGNfafqRgqYoeYskLg8ANd47hUp8tEXsQs/llzTIue7fj9WFGNwmuLJpPKOUosE27Y8UmX7eGbPklw9u3nKRMpfHBfPM9VZ8COJPcwCsIezZl96eiQgCfHAWKaGL/AyaLji/Br6qyReCk/b3ldbCGVTo6YEOOV09JtCJpGbu3iYPTw4CiFGYcCl76KHpeB0RKELA6bo8JHfFA7fLJdpHaWa+8yS7ygq6BbGrXXJ5Hz5Nj1xFiGfJhv5is21fnXCwWVGwmXyR8pM3QTvvrkfrhyTvPWJpKPdoND0QR2BqtywZQKUMKOkoyx1uQRUX7Y5nJ93gTaAMuNdGxH/wWzwDZXn2j1Pwhn5xJtGjyYve7wDdDXrgJ2tuAR3/qtB94Ps/fhODHk7z2keXJP/q0zpypveTbq4vMAcPt2R4HrzB825/6a7bbndHM9+QcVGz8Z0+A1j9PcY/nwb6+uFQ2KZT72T8kZaoLfilSH4rzNmqy8FisYEfHUqi5COPl/q3FtjqWT/W7J0NYLODA7ps5+TBAJOmOrUWk//5B71MixwzUw9NinWUyMD9PfJqtjH8ucPMWCfyzAYrxYV7ioZmPVZuThrvuFlIo7n/w0QxCn3SiDh817/jYXsx/55Hg41vpa3c7iAHBBBy7BDHbqzbf6qJcegi6309qBvUaTllUXW5KJ2OE/2SzrDGg0/LYoNwBgpH7tCAZqRi4/CoubD7XbSiQUkbaEd3akXdNt2uHfW0og5rKeW26SMJAYS3UjRgF+HFcqAbZesx8WdVijh40pdEgcLpbcOAWLI7EH7174kUgrKj35rzb/mlbfyLIS5G1CkbPVCmgBSEsRzSQvhXjVzz+wiAAQBMlQNZ5NSUctnw04fDLz7SN15G8JzezQUqfhkohnT7Q73Sbb3tXYs+NOGxfcU/oikkarpcshpKCWdpgS8DBnDnfnE/aTZmWvlWS+8ORY78hM4P5Oms6fcuDg9TEmxySazGoZbgc+F+avx9Ig/4x6Lk3a5CXsDSZFDcTk49s4dN18LLDiGnkySYOa99n5b62Qxz9RhtCBfuHr0MP87V6CW231KU4HU7sz+Q1ecB/R86m1ICPnSJMr1HtYtuhzh315bsN7rUqHHLlonC9g25gCYSRuILN8jIFqU8EMnISK+xGvIi2+G95ASLsxLdXvq+gCCi1KfZdthdcRvBCtsLjR6XdeCMFdnBWWe+WMOHfsbBGj4OyHIpzgL0AHreUs/+iT2i3vFAB0OzoR8GYivJ1KUG47LmXCUHz972CbRrC4bwZpMnX3/xtc0AKHWLP6aKq0Kfs7OIKXukzc61//tE7j6Wy6q+hm071y7LNkP3KdYV0XpRCrbeYmYEPLLuUcoul41D4nKJfhjYswbrnSgLk+9t8IKWXoh8RBbuA1HekCsG4VPeg18R0ZPX0aHy0jyCtI/+xSWed2fQ24rZ+JPwnoTX9s5AuUHjkD1FqLPJMGmPLcYkFl2VEk235/AKb3Um9mNtdcIN5x/2h+9Ztx2+jLWQnW7bbTM52s180mhyqfQvnUq8n+Kdddp8z2Z/HvxmL3Jd5Nm59ah3xyxjKUa/LOnS+nwyY3jdz10qvKJ3q4HZ4CFDh8mmAOUMHyPlh0JlvzctN2WbmtlNLN6qWyGd1MjZ8MoWezNVfxPuxHsP2z1V3GeIyAKxBNcmGRxcXkd5Bo3nvEU0Y+tDe1HKqmOTmc8kqYjA42JytfufD/4sAxypN1TLnpUut8OlmlF1MBW6wfFH/HtS/YhQa/xfhEA+FXBFrg636WaS0Cn3dRDsYS7hH2K3bc5j7nR5qWUIPLnq2/hHgrBSvNt8YDup+v3Jmx+J13759ZNfwiN2BD7l9AKDOy/X7upPW3gZgXt/+vrw2UwdApsGOjt8+iSFs4ucQghcUoDBHPzGIoQ5CWXFNRE05+7EQlAUBmjXWja0pLWhYFzi7f/kFRVPt7D2CFpGjjtm89N0jBmFP8obIjDWj/xjM25AjLrbHKV31eZET+O/tuXPxt6WZicx7c7FYP9RH5aUz3tesrHa3j/i75DhHlPAZaWsEPgGNpTrKc40/2x5gXoSooQIYgQcFk2ZegOCGuMl6tnhWcG/BLzy3OXAqpAar4q6pHDR8G+G7bsMNomb5kWOGt0Zg0aVQePteYbczTL9A2DBByPg0GEx/ItrmNDeZ1bxFjri9LjVmHJHvw99SzCKf0C3MdpdpEE9BrQ+ZmgBv3DFBv0aOYQSinnMPaVq3uiOkJJ+YiBgQgwpqlEs2AfT//Vrd5vHkCV4KZZgnFyPf5f6ho3PS54zqOYTUvO7R5iM3ifu8gN0/Sh9e9LFu4SlF5se2Ajm5jYvz8Wql4RyioOu6DaAPMJ9224XJOoWG4PMJbwqKvZaciLp8BUScPjQC4Q/Ht16ScB0g4RNl5SzR0eKj0F8rcbqoq65OACjr6UEXIrG5sLKBWep5c38PVZIqMaXRnb1oo4rF6Y+fPbsq18dfsG5bvCKjmAEwzItGCo50Vq9faf2n3719Fm4j4Oc06XbejgbvTAU/z6Dzd0Ku1varXdTDsEITg5mg/x63jeuf62+evw4uiw1JqDd5KFRLzhZRPSKh8ZGhvDzYF7cTFnS6qorQ1f3V6Nz+vp+czphtvsPmhPyl2CYIYe6O4ZJ2HbmOOLc8/KS54fyUIcYLdn7JjL4HVETA67rMlVv0K5vPWenTSvtrDOuvuOb+nL89TlUEGy9guTrBj+2urKZI+egAHra6AFeh32kTrpfOeAbf0DMWkdFV+3XFeumB/7SBvXG+6S4YmQoyNtl2iZEYb+K69fiqKPfwiV5enMIIIyqTX4rGP9/AVBLAwQUAAAACACAJItRKXz/kDkBAAAeAgAAFAAAAHJlcXVlc3RzL3BhY2thZ2VzLnB5ZVFNT8MwDL33V1jikA6mXLhNmjgDV24TqrzGrNayptjpRv89TlemSfgS+ePZ773waUiSQSetqgf46FihTYGAflizwlcS2GN7vKCE0jkNmHnPkfMEQqipV2+4VwipdxkiHwk4A3HuSDy8jWrFlI5gOaRShAtOHjarqiq7B9uNB8P0ULtRYuT9s1uD49BjedvODlN2q00FFjG1GLVe7RbcJ2yhaXjW0DT1Ul3Ns4uaLHgmUYxgCQ4DCvU5TtBTS6ooE+jYdsYP80ySg/U5M9m00LJpEFKSMwWohb5HMmv8ckz9Qts/lgu35EqiaDylUPRFM7Q2n73lYyRdJJXgr3lou735cYV5zShZL+bmnzZ4AufdHbbE3dad+0/QGcjaxaz7yVIqn/7OfUD72xTX5kAaD90ahA9dfql+AVBLAwQUAAAACABsjZBR8vJOtTMhAAC5dQAAFAAAAHJlcXVlc3RzL3Nlc3Npb25zLnB57T1rcxvHkd/5KybWBwA+cClZukRBGaqiKDrmnV5HUrlLKSpgCQzINRe78D5IIS7lt1+/5rkLknJyr7qwXBawO9Mz093Tr+kePFL73+6rRbnMisuJapvV/nN8srf3zTff7FX651bXTZ3Uuq6zsqj3/hr/7e2dX2W1WpfLNtdqU5U32VLXKlVn3EWVFz/pRaOaUq3TIr3UKi2WaqOrOqsbVeumgYGh/aIq69oOqIaLsrzOdD1WadtcjRHwZ/g6Smhe2XpTVo0qa/Op3tqPTbbWe6uqXKtl2mj8prw3S503Kb9elHkOM8NlmRbvqqWu9PJVtmj2uFGCw5vXs4u0zhYzfDSrm0paLMr1Jm1MG553nl2MVVbPNtunY9VW+U9lVtCHTVrVeqzepJsNrNtCoLUaEMM9BX/88Ke0mmGj2RLmNFb6c1Oli2YmPWZNOYMWY3UqeDui5/+Cj9a6utSm4UhGAjLp3A4kvcbqfaVhYnppH7w6/uHww+vz2enxq5PT46Pz2euTNyfnAuQKYFoYS71K27yZ0cOxWmY1IGNxRd+l/SwrGl0VaT5rm8yNDnMv0ia70YhLh4y4zbXezm6gb57hxOxwOgVS1W6m79+dnp8JCP15oTcBYRml52X5Ji22p3qZVUB56H1SAOhseba40ut0rI6u2uJaL48L3g/HVVUCJo9KmH/RvNLe05HhD5h7u2jaypHvKK31SVHros5wdcRMwkvLdAOYsC1/PD9/f8jP9vpWz7PGPVE2etZW2Vhd6mami5usKouZ7Al+WOimYtYcq/qqbPPl7GK7SevaNiNg2JT4l5gKGHIM8G+zAlqXy+2et6y0aWtgn6VbGH3Z23ukVmUF3JVvkRpZoZfqCnYNAtKfN2Ut37GVukgX17dptVS8SbKLLM+abT8zGlY7Oz88P8FhgCtXugK2VIu8XFyPARoCB5lye5UtruADbG0UPTBYuli0Fex3fJuqS8B7gUKh0etkL1vhx2STpw3OXE2nagBLfvrdYEI4aartRCkYb9tcQfenybN/ouf4tzFzmNEc1JSkSALyawXIaZGxqS2znDpsgJUv2kYTkxDU47TKM12p5iot3BD3DUBf9gA9mue4oxkJu709oIPsdxGoQxGk5jvwBItj9wAFCgADDpl6Ym/Ew4GQfaVhbWsgLwjnDfDQpsoQv9KfqGsQXRmx0aTX+A72e4kUQfwwhq80YGiTZ4vMynykFOCkcb1RMWBL0yAr5CvNPFEnK5USONsA9QyuA16n1XaMzbfqNstzdaEZIQCxBJ4HhlRtjX3mbt1zs9Q9+oBsEiIJB3gLXDax1Ko0bHW7YNPO9o+e7+wfjcP9H6mXtGERUFE2wdLUUCeXibrRVbbajsxw2GpoYdNDWCNs3WKhhx2Ci84ZIZ53deqwjelEHUYPQwQj3iJh6rHaMBLo8SxHox4ISbtBVd7pGw0OfQWPp3pd3mgFjWtmMdBtyDRohCA9EnXMepSbrLKqpnfpTZktVZoD4+NiGBiyoEeIZVsRZaFNis94JxcAdUbApurjNW2OIQismxEycbQa6LquhyMk4I3hkE8EBbsBEOxjATqUg7CMQH2EBp/29jx6hO8DyUAK2uJM1LVBv9Xed8uE9yAGSPATyFpdlGAcWZsN968AVAQw4bmRgQj/FXoBbxGJF3qRtrUGOe6kB88BhfMvA9CmG9DeejBRHz99oX3t+EJdVDqFlmf+UAoUNCj1fJvYTR3tabFaGN8KMB28SEBIDN24I5zHx087+Z36dLZ9Z4jgxQOHCKbVJW5Hwt9HSdgVe/TBIMyYP2+yz1kxZPMcSLzHPLYiE6GSNrMmrXDatc5XqODrjScDAMmnQFJQASiHT2VhCXzC6eIzA0Z9OD1BfMzniJn53JCHd9irVuPuw40GBiGYUqpcAVVvHWeB+kHWgXEMRNzYqPtBtJdLEvkeQBD+ixSMe9jLjcp1Cru7BOmm2k3JKqWssssMDFJlqEG8axs3t9lCe/Cgl07B4KjbixqnVDRuZRbCEBgBjMtR4nVEjaUWbd2AubNGdCNztDVpJQX2wBJcJlpHXl5mC/AYGnCScHuodHmTFg24S2VbewCh2wJmomkVdg5gEZAsgokKHu2sxPtKkRqgwW9AjnrgUmOuuEkTO9ebBJwXA38SaAs72JQbiiX+cWBeDD4F7R+poxYMl6IBsYFTa4slihAUoldNszGeIwAEZwkYEK1MJUAjQIA/sOGy4gmYgm2j9HqTVRlQWml0OpHCdXt5SRxDYp8bI85BcW4jYFWK4oKpcZuBHAORu394dnRyohZXKWoHstQLstLNhJIIyEljLdA8u0Z4QADYMOrD+Q/PpROMRPYHGYA8pRgMSUgSiTjioqyIrMQgZCmtGJ5GvwSma0mwY1bnparL/IZ5a6xukR/2uTORwPbP+icEPMC+a0j5iPrmY8KQhwMGNRgFnUR2xc7e0PQeq0HbrJ57vaQHSgonlMSlwc4bcmBEJJXwkLyYQt/ih1A8gcsGjIFqhihwCP1g6//FR55Axj1XkdmwNFqJmR/m6ksrHI98+CVgwPjzQ5mFWwPOptvMzNHfbA4g+NV1U6RrrX4z9QDYx5M+vJ5Xrb+hzzawYtgQC/CUJmDJ5CBFaZftv6B/nQDlVbJNTFY2GIBL8NQ8YOiW1YlR38UATHcEv8pgVRdbdfrDkfrdd0//mTcjtLlGD8iYUb44Rn2N4xhvsA7dQd5+gAigxg0GhtBxL61aDeQfWXO4LBTuxdbTByLaa0QgoiwQaUMPzTU6+5q8QETJgGS/9568UdgZw+ePx8SFo84uwB4ehSKI9SBuYEE+e/ZUYI56yflDCh7fnrfgH1lJSNiDSAJEwzAaSQmU8ksiIWx5moVbNkixAo1B6jPtrDBkMnzU6WnWpbrYC3vzQ89S5SCNjDwMYjRkBnUAClZihCPp0MuJZrSDYv6499Gsr88DaXImW0V2WVWWbOCsQdGD/m4WV7EsC0gBdlC4HCflgKAot63mrT3DC///M9h5Deym9ZQmNaYgQNk2U8TauLNk98eO4xSlxVgtdCU9TFhVvm0zDUg1286M8e23Erea4ea9rL/KArzUBTpKsGbY0KZBjTgwIcvEOuD4d4VRYbSLEdHXWm8UOmrXZBHCqxLUuG0LohSaIoaSPpuVrFU/znKTgTE1W1Xp5RpNOE8ww5ITFMyJeWm73V5lsP3gXcgaGwmYGmSRMfRzsig32+FoL2j6SH0g99XMnxgxXJkld6zI2cCSfsRe2WWBxkZkxPIcKF5CxmS5CQAhhAQceV0sI6wwj3qDTKnxxyeTT+EqMEbW4S/queDoKBl6QNwWtmddLq7BBqpLNGgXYPWQckXbWoeRB4maDR8edx2r07ZAruco7I45VeltAttkOWRzciZzZI6O6AMiJtfF0MfCSL0Qvlqnn91m7BkszcDGjsPKw8ExrEujpfbLF4+4gwTDjyl7UyHo0dia7FOmUMQJp4w+IjyspuCDC9KoHG7DF5uyzJMubRd5CTzeASmqxRo6GFcFRQziRFSJgomCfEM9/+T54+fgP3KrZ6MYgbA/MGIM5gJCGA4ODgY9pGHJO6t433qbD+YYmEXmjxsOJoMEz0+GHztGpAdR9MiITlk+dRb7FjGfZ3+hvUyCW1y+Bh07IxyUFQ4YXWMSDsXOeaJ+lzxJvgtn2bXxOgsBSKJynOSBRbGN0JFKu7AGQwgUYJpNni700HSZdoCEE9B5dwo9w/TIx6hT0IdpIy0uUd7nXRb7IV2ghYfSD/Y/kU45P1HZQxx0T8Woc4Zlx0viGOjgACzHq4OmPEBt2VYLPVAYvwRYKEvJApscHCzLdZoVSZMvu+1HEeAjsEbzDPxttkRh/Ke/f/5bcpw2GjrAC897QmaLKYw2iuCi0A2ssItgy/XEy4bpx/7xDjFPTLxa74IV99y7U0Ul3Kmzh7o9STxV+qLNwBrgCMswhibBoJjgZP4C9i8Bj+0FHo0ebOrVgTEpDrK6hg8HTx4/fxajkDDiHTsRTtFmpmOnpNF4TJRWWys0x3wghWcx67QAItk3PbLnwVN7+uz3j7ubo6WwqvArmrQDUU77r3Vx2VwNwI01T863G43fz6u0qFe62jdqbdCVcBjxFT8UlhoO011EL1lNDGBTbob8eZfX0umKR36wGOdpmz+30F3D9TWnKQz4CHpgJhExiAm8o+9mjr1r3GDivtnAlag0ewreDQVRvFDbKGGiXpqosh6AnFm3KHdAJrRgb5cbdFrNYjpWlrB0KwoWXAs6XCRvE4TAVXqj0f3d0hFCC4pmGUqA/mP5zqZJZjargWx5Y6uEpAoO7u+CQfvUHvDfSWl5cD/UHsOD5AClYYjKKj/jEQXbMvYExA1NHoUxzI0Ykcc9csRkduwWQRTueaAAOlSrNMPIb6NzUEh46lOrOR1ug/eFJ/JlMUfmmnNkdDiaS4QDw3+0E0KAN2neahD/NR3xz/mwPL3I9dweNLJXRQoMXXEwIwA+m4ZpEfsChYPwEiYlRq2nwNA1NEEZZ+nFZp2BgbLo/o0erp/OYkC40ilFfBiIfx3phtvNyASQWD2izWsRUrJLoQZFOQWKeBm4SnQblmoFlNvHOKqErTtq1q27z/C3aQwdZulM4h04xFW27HekYlz/3CMHOz5E6Dt3p0fvEViPeu91YswOqtFr61UFKEN6X0iMgP/pb2ICB/JvfyOJGvA//U0oloD/639t4gtBDkr8RzvH+UISd+htGsciOo1GXWTuEM6+9Bx36OsL5x5jQmC6aCqZcnwCNCatztrpc9P1xvHvq0IX5s+wUL3xI0aejORgUf9SUKmGkZt/xwDwhUZZY8bH4LemI6hbtIYxqIgBdxL+eMAqsX9K3zFnsvhnIhD2DD2XiO8CIGNHoKiIWTmxw5SwPM8u+VyII++OmqhngHc3YJVjZCkc/Zayi0CY1RkKQDumGwtwXnuxFD9+/xWWjXg4PWa04wig+CA4VQhEJR+I4x7unF4YkiQeWHJdI9uVzhCBJnim5FEJF03GD0a6yVGRYwymF/rwwIkRpAiPvYdHmGRgT/TClX3yY6AJ5ZupdXZ51ZB9JGlYaCUg+7cUkEfby8zSjYNRWGo4jTLXyBfhM3tAWlO1NSW7kZRUgW4m91ygeNrs7iCdtYJoLNMfz8fj3WSslV0bytgswX7y2RvP29ByAAu05tAMWU2g6VbZZcuZI+jqouoDNVSJwrfgJMWP/PCbtMpQ5dWJ8AJms8S88OH0NQC7wZQNgGvhvH03e3/67j/+xCxCvLFjNol6h2dktxmGfG85XWYNPpFJhGGEYjfOmSERBwvGgYfA8wuJToHowO1JY23Yn09tcMETGOKpJY6pfPyBvEDzgAIdjMD3OPZ+7wkeCQSPuyTLxAM9qRpwyiaUFdErFpzVaj5hzMR89MwlYsVfvvyd5YlpYg9cgnBSfLxCpxjxhE3s2TYqZ0wu14LyT8zzgafXvERRbN+bPjrkU1bpPTUfgqOaaNvSiQsgzgcf7tAok1UEQvR058gdvwMnH3WmRZsjpr53A7A+BqNuTLhnthHuwTJr5PTIjhDPDPVDD+f6WmKyW/729fSkcCcmD/5rhSfFMA9A+G1ZLQWjQcbv0FvDR574J0dGCcn/q2bX5AED8NlRGETAmLC0ZadRmofg7l4ogI4S7ofd8T1cy1mbt7quYJdo1n+BocRHeiSqRIaBL8cRDXYYDECbxIxWcwp8gIfq5FZdVOUtLBCGAoWalVW/BSPQeyQJv/G1tIl5NWUJBlimm1VSVpcHV806P6hWCwyyPqrZwdz/bfIseeYT0JooflBuOpWoW631rKSsCqSvTOo3UzX48fjw1SCks53y4A/H5wN/gq9KkN5pQ4iS5ddqWWKef73JGpeWUCeJn1j1A6ZsjhUR/Onj72o+AwHodSeTafcSVmWLRwB/w/TPNOjQJRv+6v27s3PUFXIqz5qZAsopzPGJzDZrJD0aZ+svidTfBXB/BepTWADMJ3iImdMp5dkDt5xgmFI9+d3jZ1+xUs5r8VaKJxA43weudAerQUPDc2GK4bAv1dClkR7aw1+b3M1jvTflQ+yXmTIhTO0ae8GQfTzoovTklMMHnhnDgF6i3FAfMFFiYv3rFy9emGKDKLUE39QSUaczabOOkd+A9YXZU/jvRVbQhoIXNrj7vTnlVh+/e/z40wse/V3FOXh0Evm5kVqoKpwcMUt3DtjTqgnYB/Tvr52NkICHnc0wA7CezfDI3VJ7IHIZg9jiIONHlML4rwhX/EjJpvQsrdI1feJgwcC57wOUc9Rfql/wM4cm8JM1F/wuwdmovPjkpPlslhVZM5uRHB958ZNHE3VIluh+5gpw/OxtjK+JxQZ78ELb2DPmd/pgJsTPk7kwKuKRPryYcxdxgbO6r5PJTP5ePryYu71KNpKzGqN6Jv8IDQC+krSfw9Bza9pNTvnFrrZODjKb8mGLiOYj3liow3F8h7k1FwKghdOUizLH4e1n3Ibo45moPToFov7IIvJh8ineL5x7NVGDVVkmF2k1efrku+fEU3x+Ry4j6nq/zbPHT74bfBlFywQytqJTKU33wct2ZidY9D7E4xsMftr8S0lmD0nI2eph/VtMvoDxYA7Vlg/dsDQxDcj2FQyIgZSAqSlEXZvMYSyNIP/MhwbyGzQEshAMvob5ZtRpyZNStH2x3ideJe/rLoLOaP+60xqTBCLYiKDwbgcocSoVADp7rf6IIsPwdgeC2wa0Z+cYbZ/zsWlWsU0mugTesvQhxjt/fUYmFoPWiq2MECnrssHY/jIYDZxsAZPVpmpkTjOXYWkwCv6nCzKW8TArGs4HKKhnZ5grmqobPKbDbUNwJKvHJoCC4015ZJpiSAchLcEcyKgozo2GSb5UEkfQ1um1Vls0HiiCJoi9aXNMxeKQmQ8PVBGIy32Y2P46W2JKyPBN1rwZMXP6jA+N3xX5lpGC5orDDAcEADNY4RJSX5A55VzVmPiLPEPG8SklLEBm1RntF7T3G9omdZ1LFx8Q9qbTAzVMNno9okjJOUrJsRpaBXStwesFSFkVzZC694i/N+nnbN2uVdGuL3QVZGqZfAUayTPzyX/Sy7qjG/JsnWGNm93YcdbQXNmyVbIi8fwoZEyyEJfeXrCmAldSJv1Vu4Y3wvk8fRwhIdC5gI0dJcDBhFB3B7EqW8+9YvUQR5lsAa8PJopLUtQUsJWnMZ1caKGHmQ6VLX4mcQQWM0oHoJNa2AKEsm3Io6DYtD1+ltPnEEG27PDl1qbfZpTnnN4hp10FtvrekkdGSjptXswpeTrcjVz/ASKF3av53JaUJ7bjfG5TqPPuaZl/tKGmfZXkw1++jAI/TBbopZYZcy02FUwN89SvlvcCT8xMWPrprFPYfV6t83C0u3VvY8/wQzlaOcvPgLG1U/kqaP3Zmolj9W2UvMpY8nPjsJOJEQvxbAIunyMGcQFMd6Tq79rb1lEpvfo+evBiHujmBk9SKc4qnF9J6mzWsJ7fAXeurtLabjcvOEA1r+aA5i4z1tR8StltWWsx2VzUNDRn535AlQwDg5bOLvCgg5gSlLJ7E2wzJgNBH7jVOI4zcVu7kyIs9AZIHOMbb9U8AZkU2DHqZVmCPKjSjZMdgVdNKUiuOtaeFvbsyOjc5u7d1022eKTeUG0j4cgUUUqziLozBztMFYlcef9VR/IMR1H+iFlUOKkzHch3IBJF5GKRLagyJd5sIjhMinthyIFfHxA2thkn+MW6KSGa+4+RvNC6txo8UY/4xxNbG3M6FKMR4xvTMO6RtJsNSqbwjBpGm3ojhy/ROKnta/oWNkCPwL7HL+Hrn+qysK/xS/ha3Mdpb4loYvMsfeczqPbtubMiWh17AjsG4Jdj32eIuiNdos5yV4UhbNRBuHEa8ny0avS5pj3lzYktijWemge9U2kWHKf7Up+pTceyvcjgyDdRjj8aMvA3swT+xhzQLdQgzHCToJqjkxbBaUZBxUYPNrivZIDwF0njkEm54g/iKcrSu1+tdRWIjZ+jrpKj7mJJistCM3UgDor4izYsBYrIWC+xcmHsT0xQ0iVV3HbVTWwBCQis26BgxK/pzESeqGFJRnmajwKHvgJvjk53XRxJkhLJpw51HHv9ZhbxDDpDI0vtGHhMDj6pavRvgMlpGmOckM2fCgZ3QSIkkJkk5X5KjObe+SCnBPPBB3dADMa/F7o5CNuF6RWX4P7oAnc0rJgTXzmYbMrOYIg/Z7tHOPt1Q9GOv2NV8/kAm0iQyxJvnwev5/NQg8AEKXIDwCUfnbINN3mZLjtjk6r0h8YQogscYnm8hAIAFH4KxqLw+cGrDGupD464fp1ogFA6Y4nYCob7sbxVecmFibcpCAjD+xz7MJjtqEDYSysMhVxmN7w6Lg5QK1hlQ0wOMqnSq8l8KL6K6k1hw+of82akvpdPNYgbwoG3BrQw3RJoHByGmnWwGorkYMVnHClCKY1xnk4ciwfqQLgoy7wjeVjG72Kd+0KxkVaQmNKO0GyHmqw6grFN/TSAyNZrmHvaYKn7srwtkPmCxO1IiVNYMAkjeBIy6m4YVlTB0McZnzESnnRaYKqsxDMo4yQjn7Wpyry207zVAimYi2M+sGKjaJ0wVi3Bps4QVHqHXjnFoUKweJR3dAhuPN/mUGIsOl4wxSzniaKTZA4pBkAsSh4eYAyiijsW+jURRhNWDOn39wgx4t+9MUbcPhScNhFcj09UBGorEf9Vm5vreLCmCL7oG52XG4pE9YUjjQqAVQVMdmecsRtcDKbz0EBjx5U9jTdMeCnKEezChvMJTuO0ZE5JNj5Mn79yn5/SsWiN5Wqcgx7nZZfTQmKbXOsel6XrqojtLCcLPf3IICbnoNchuMMTYKu/x9BHS9Xk28YBHvjXdxI7iWBR0MBGOE2FKHkfno9s/JvIH8dhOcnTXtsn+dnC8myae5MP3PBi6UeZ/ZhcsZRcaDylCYYciFYD46JXRw4iZTSYxOrJtf/SN6K5mMus2PesogR2XD6Wknu9u6k7YWqzu3eI0Pbtt53y8wq2zBk5HZRN4SqBdvkdu52Nv8lT+PO3f5bJTdQ7kSoKvrbID3IXzXwuswN51oD0vCvK1Ssa7BfBvZd91iHkmMyQjqMrVTXM95TiEePWYZ+lY/0VFHj3/vzk3duzf1Dhq6ggWLuDEiiSv4IMmMD0Dxo4GkjN/51EoKSv3RTYlHUgiryIj42h3EsXSg/7n6LL//WAwv0Q/3s5r5eLKKHOZxEK43p2UC9vtbtY6z5++vAPdvrfRPwPfbTvIzi6Xb+S5IfnRz/+g+j/i4iOBHkY2Zc612QqP1SPvzp+fXx+/P9Ek/dilzFwh14mzyI4oO/FqiDVXlcdHQL21Ak91EnHmJ9LyDGJ7JwaiPce4W3ueOcMRVmxgpwrpNL8Nt3WVDbnAeOCb7760SXkcZ4P+IzLdqElbCeX1XScwR57yCbaeol4o7s6mPxdP3frzg4S9LCJVHc2drnDfgJm4Oue4Cmzq+5EpLZUFsC1hukCr3QsGjD0tiw7UhMJ6bDyI/WHFu9pSy9TPMNnYHKH4YIuCkCSYJAvOPXv3odtf2AhviGOivz/iKmUVC0zHPypbInyZWGmF3FbnQw6J+ztxhX5mWuHVnR9cHQdHMXzzE8syM2gfE+wARjZv+CDCxXobo77PBSbqCmdKMVcWMi1MqmvwWGrv6Y/aN4I/r3xkjckAVI3X3nsFUPLo2F0nh5iDS+boqiGGtIon7M1BaVHu8pu6HoqrprxL9If3hlncfIJesq8OJ7RlTc+nPOywVtp83RDd/3iNMNpxbO2fU2fnomqfV6Em1TiWtvfNgF5iDUp9VTeBfOy56/rtMg2bS5llAEHVXRhu/crHt6d1WMlB+vVjoW/l991iTNXsELF3K4W3XfwyGRQitjkuKe5jw7TTDCgz2VWlKVk0l+aMowxy47ZoDHhDaaivwddB8DF/3dcBfBAKAZA1JsoQTf0up2KNUSSU+qjLT4winBn0kdFVqBMsFcuhoFqeOwuZYmvmaz6NGgYYbUXBH4kJPvYBtCfPA6Ob6zyugY15GdX7WrFN2DTTwBVVI+VETdUGrSAdAzw0UtX4CFgz4qlDl/nPzS3eozsnhP1HG4ib4JJRkCGjwEZ8RVhRqTleD+4AbhOl6FVW8n9iQgMBW500WJ0y2JwmSVtA0/QV3TjEFcdrkpmDAwZm9sf3Q3fhX9IQHSxF3HiBRTDUYA/yqy6i6f6b3pMZnSZxZTutBg+gIuiu0Q5ecWyVnTJGdecnjXl5sT8rkLfRXi1p2VkKXJaGeFZzh27AWZnO94Rt/ds9Dtj9aGJaT8fXenFNf/kiZcZzcV3mOKXyTVzdbm2v3VSf02xOnAj3yi+oLoPm+wJBiZtIWQZb+iA/GGuXbyLuul+ptY5aHh/bfmd5fOdW5ZgyF9ZAu5DCX90w4NpfnGj79LDTiU3AYg11GuQ6CLx5HTWJ214qwMSGn+AwKZnR7CI9gtwyzq3G7mqE0oiKCvvSfd2C/yzpRXDsk5kSkyK0+N/+3B8dn42Ozqcvfzw9tXrYyBKWXUguL8YwhFM0e/dk6yKufXIeGIt2veOlmHGn9tNgfFvulnrM+xltl6vB2MxEPYx27TXiZFyj7AH3WHkezGx7PjFuEYTKwSsOzNxgsKYyxO16/ol9pi4aOVL+LMbxvS1EmiHiDGxgNjI7qbvW9+fXV9iu93urs35fwk+kfllsr4J0F5DCzX7PDZD0bYLagTcxotZHe/QRJVWgXbyLo5liOZN7+2+RIvU/Gia48i3JZkRymQ1TPYPHAXJTQt+6234zduyr9qBby/hynBc5C+/qb58Y+7t5es5LcW4diCqRMAESnxOFUIOLF02W4OIXlz5P2oV4/Smi0Ou7oul1023coGrKOzVBgFpoiu7L7GoupJ65JhjKKNFKOEwfGhXgre7lFXD5ehLXS80q5wSy0Ew9Yn74q3Kl362mL/WYIkfucMn52O5EILekm1Nv+dkf1rpuoMlc4vz9Uh9Tx8Y5MizN70fV/KhhmgN54U/r2RsZksPtOvgRVCVAnsX6+51tzCFHuPJPBZaT3CT4wehEn6UezL599Tgu12arc3+EksigukPX4fDj7mFNwsDfCzXGWYCpF8z1j2TpH4j+UGp2lSm24p++tfd+h5XjtAEpPR9n0vf2TKhfkkC6wCCYZrRcjJRT5LHyeP+e4Gw6OVC68LroOoM60zkhyO4M223rOYoDP0shV9zs+NnKBL1Vt/ShQnmMi28D9Qs5a9WSJrfQjUF+i5NE68BYfc1deVjPH1OWjK/MII/YqFWLf3WEWZQCCKMPBbAAXKF9u5igv8EUEsDBBQAAAAIAIAki1E9y996jQYAAFwQAAAYAAAAcmVxdWVzdHMvc3RhdHVzX2NvZGVzLnB5fVfBcts2EL3zKzDJeCgltmLLsuN4Jrm06bTTTttpcoszEERCEmISYADQttrpV/TQS7+uX9LFLkhAclIdbGL3YbHYXbwFnrKTZyesMrXSm2vW+/XJVZAUhX3y5EnxfivZcgla6ZZLZlafZOVZLddKS8cEa0XXwTy2tqYFG21rNNOiBd3aWPb9+/e/MueF7510hTfMb6WyTPettKoSDUO7x0xUlXROrRrJpAKMZQKMe2/Vqvdgy6CgVpVXRgu7K5SXrZsVxdsH0XaNvL4uCga/N2/eMNV2xnpm5edeOu9G+SCY4ZofSrAAQDDGrayVhW2VHxF8fvryK5NmXorOeNQuzq6+avrGvIi25qenRfHOtJJ2yrbiTrK2b7wCrylQsHtds5XxW9Z3nbQnOG7MPXxWwkl2J62DbUMU1gXEJoZXWMlEE2D1jH0HAZIUiuMhWzNzu1ym0S8/hhGYLpJe7CClYAScs1a6zsDClKQ8c+h62MmsCAVRYKpnztu+8j1MGyL+kzG3ffctJKkoOG33NfuDEvOU/aChIFqBCWxmKDw7Pb1mk7Iy2ivdy/J4ehzlZ0Hu7pWvtlBcvLPGm8o0LoPMAwQUWDh6k2nO0ehWVredUdonzRzn9FZxbwxvTJjFypg8viePU+bkobkNwBCv8B8CxklCX0m6MaYO3zehAOD/v//8lSzhniorhZf16NOc9hHqv9uX4y600Vz0fmusglSoO8kVhDGY/rImBjgtuiArPMRYZrGYn14EDWRP+qRkJEjTLzHIwnolmhwWRQn4MgCxrjkVTUANdX4owrF6hFDJ3BUGpYFg1eF4hvLKgzNHv1TLgVZIHIvst3iSIQazeJZPR8/COtXWKKiY0dQ5paU1d7LmcPhaoWGLDWYUhTGdJ+U4ARO2Nr2uMyuYLSclN4G9sFrwYwTERHjeAs+ulcwnYypgK6HOH3aZ4jIdg0c6jPgXOAyWTtJxC6MoeYQxHrecGUA9/UI9AFdDbQG1Q/y8jEUCwuBLiDk0CCCpeSCOlQQqxDWZ0ux8djrk5ZtGwRrsrbXGUmIWlJiVqHk8gMEyDAcHF5SZXscq/z0L2SKefrFryfXPPfheU2WiLFk5p3TZlaprqTMTY0ZiLll5ktK8oKS0EtaueUBFrqWzl4Yj/nIwR2dZQC/LFnsZ2ephh6cWPIT2F8p03/kRsD9K8LTeFZ1f4i6vWml6Sn78HIGvIseuG1UlAlicYfw3RmdunmHIG6k3fps5Nqoj50qwViv0fi1UM/iexOPiZ+e5l2EbfkckK+wmX3iR40YmPgDROdEO2iQSAm+hZgX3uw7L8pEGD3GCjHYus8UAa4XeSMyxgxi7taLcsUMIir6IHS1jmuVDB+dI7MVnRFxF5gKf8C5Bh3P4UlxkqmHSnDhKOTqhMjsyI4Ram44NMXgVw02RyeTJLCanMdVt7uEcU0F+81p2UsOxqdBMNhrRMSfG1hJqBXpE0xD/0rpRnvAY+77bWFHLvdqPsoS8elRs+0flC+U2x1oPpQOkthuihI1nEI7YcwzqFjqMtBwIualdXnSsfCQbZi6GpkpXJidjP84Qr6jCPFAwsPeWiskn9l1cEPtR8PkqwHRt7h2Hzgp5i93W4pUH2+2BcLQzkOQdJAyzDlTHG7kBMHRPB+4FA/uCYfIrogbkZl41xh1UViTvd9LCFTQn7wsib7hcSQu3Oe4QwWVAhOUOxy/MzQ3dh/4eFr8geg8nSYXOEkg7K8MLYvjQHjZwYboXu0wVm629g1bOs71TyaXhOAETFu0krhzVWMNb7zser9p0wAcyCWZzbbKLxXwnrBI6dARnuJYbAzcjn10xLoj8FbDTeq0qDLbz0Iwzbrsgll7B9fxe1UC+jWoVEOZDJWVNHoy6cXli8OCqfPDhYGbhIybX0t8be/t/LSeHHI73286fRTFc6tNNfxIeI69LuuDRpb+cFgW8DxlcGpSfTK/RofAYDNpjBpzUhDeDZgSf4VNuwA1YRAUQwZMy/OCKGt6Gk/h4RMgxmp/u4dSaQXRID+8VuLOGu9R2MimpHF+U0+m+5a9Zn+HLbDIdVsFJYZO1qRCY2aHn2WsWVph9ghfIpFwuj+DxXLIjpnF3Om3/Q/j7MfkNNNFbzcpn7Ki+ZkcuTJpQ5NBwXHvTmBU8nzkHBzhHUfyGlSfD53O4u+qSPT/cY5CSa6P/Y4aCaw7rfkIeTqeH0yGuwwrKYYh/BvZjsoF7YPgCH2Pyi/8AUEsDBBQAAAAIAIAki1EIjbXffAQAAL0LAAAWAAAAcmVxdWVzdHMvc3RydWN0dXJlcy5weZVW227bRhB951cMbASkDIpF3wqjLmA4KRogSYvCQR4cQ1yRI2njJZfeXVoVivbbO7PLq2y5rR7ikHvmdubMLM9hebGEQpey3l5C6zbLH/hNFJ2dnUUGH1u0zmbWmbZwrUEb/f38F0VvhRMwgsDthING79HA770P7zHaGF1ROKWwcFLXFmTVaOPgV1OiwfKtLFwHygpdNeSmA3wUTUM5pvCxdWKtsHuOoqhQwlq4ERbf1xZrK518QnaUzKGLywjoR2lcQ0HopRzhkOclWeT5UskHBL3+RvllkTd4XzUKK6ydBaEUVOh2uqT/1yXoBo0IdeiNB+f5PGieg7CwRzKkvxwjtgQqdHPI8wyuldXerjH6SZbIZ4p5W0mHlSVIyOGa7B/wQFENAv7RUHZYgtOwRuadAtkMbnc4NgEM5Vyt0XA30DvhoilPfgbizLHH3ge61FeU5xTYJESNE3WBizxPu7o4fMLPAVNNH8x4ODoZQN7BXlIJha6dkHWgfySfrTP4hep+QpMCCcYcqCTvqzOx3okjJfGBtKGYSQcvLwNTvlBZwtWLilhMMXfxdVFg4+J7QsfULyUL383vvlldx3OouLl599stQ1/CApzDrWlxsFHSuoQMF4yfBOpxHvizNtRMwfpiIncoaAjsXcw1k96WWIfBjO9JRp5Ag9Tbeujok1Ctb6kg8/imM3vXm5EVTWND8kQIzlN6sRWmVGgDo2S703sviYCAWlQIexKrNnIra5L8gVSlaTj7eQgKoiSD2LTh5LO2KYVDlgBX9dgKJd0B/BAbSRyFcOPAsJK31Jc6CNuvjJ0gNXhb9ugHgQVk06HiNRJGUgSSQFuXuJE1J9YNdkiQ3sJqJWvpVqvEotqkQKmJq0+6Jp4vLh72wmxttw74x5hs5YskJUxW0UQvcuOdcFz2Mxr7iHxyBX/+NXcZKEn4dBJ3miTNHY/JkCdRkYauTtI7h8/UQD+1zAgrv/SzuyEelNYPbUMMrVsX+uSRgpaAUBMXjBdK06KgNeMhPkz2Egl3BO7Z59lIJmlNs98+z36SdqfVU37vvr+f+ipRveKLTk86mjWd9k7n4nkmiWeuJ65/SKGiccYyzJKcJZz5l7TEZmUrrE/GoLNk4mBiN1nrx7ak3A987Uy2ZujnXrqdv3SGxoddyVI/Lm4myMQb+OroH6qC2F7MEEzBM9QccsRFl9kAmXGCj0PnNInLTKqjyZG2v1ASf5rC/E7uf/7wxOoObgc4Kns0hB0Rn7QbbmwsJxNw41fR7NJQh2Ma+YYODZz2a+HXeDmkcXQYiOAIzYEXBH83SdMFZ374uj8hmJdK/VcFGmxOy5y2cjKW0ee4GL6UPviN4QMxbPws4le0moU5dFul/w56bbPydeE36/E+9ffIlT8fD1ra/8mYQOqhi2zw+d+rjH/scvwav7Ff459ieAPJEPh/rKlz+II8Y3QLbujP0u2Mbrc7ug4N3RZWh71n2ZdoleMPJi43eka7b9qKKV2tMooZtqanZsyG309Wfef0mMDXXXZGi+gfUEsDBBQAAAAIAGyNkFH8Z0aryyUAAEF3AAARAAAAcmVxdWVzdHMvdXRpbHMucHnVPXmf27ax/++nQLV1STla7mHHdRXLqWOvm20cO90jabt2aUqEVvRSpMJjD+cln/3NAYAASWmdHu/9ur82lkhgMBgM5ga0LXbu74hZHifZxVjU1XznMT7Z2hoMBluF/LGWZVUGdZWk5dYvzt/W1ukiKcUyj+tUilWRXyWxLAU2TapbMa+zWZXkWSmqRVSJqJCiLmUsrpNqkWTiWIHeMm+jtMyxybxOxTwvhLypZJFFKSCXlfVyhcACQmsrWa7yokKs5axsvmUV9EmTqX6S5PpTbloVUn8q89mlrMy3qqhnzbdb06GSy9U8SU2366jIgFbm/ceEX8+LfAk4pKlU01bv3xSxLGT8IgHo3CgIwytZlNAoDHUr65FqpN/MZAFU2hZVHmZRlVzJEFAFBATQvs6IpAsYYCSmdaX6qEdExWk0uwSU4xJwW64AwJSWR2OSZEzkkFZYj9keS7VmCLrRKipKGS6qahWmSQlrWIqQn+HXcCEjmHhvT39LwN+PdV4B2nWRUi+YwG0lyxGuBDzN1OsLWQFr3STwhnrhl9tweruKypI615nuHpWS0R0JnNaFLMLqdoUgkzJc3T7oAghldpUUebaUWWUP5T7/NlqtAOrQzCW/hDZmfejrh6gI8XUY4zpzQ2apumjaPgcUj7JSZmWC1H3RtJU3M7ly+IaJdJRdRWkSnx2/GunPXxNhR+IlcN23sAN+YIYcibOskNdJFkfTVH6Vx7eHRZEXw62t14enx8/Dl0evDk/ERPhekMmqmHkj4YX8Cdq8OHz57OzVafj8WfjV2esXrw7D756dfg3Nif2Ca+Qn32r33ZvjU4T2k4cM4I3F4z2Ah59L+PLw4YOft2CbznEjBas0qoAVl2IyER4g+ODAG9PktrXUEJGzLELtBQH/+wEmlF+XJDZy4PAXr09ECiSvV+UWAYnl3F3TQl4A/xW3/iIvqyGPhH/wqPmCf4AeM4b7mF6pvZ4ASS+ctzIt5dr2IXfArdDqyusrjqgdLYwLpJDAKJl4CUJQbm1AmbarrE5kVaEQghXggYI3K5l9I2999fXrbw7/Fj4/Oz4+fH0anp0cHo86OBfeST6vQDbIt98msyIv4dtbRe63z+uiAOb/nhfi7ZEaV+iBgWdsWNviO1yCwwx5D7ZEncZiKsXx4Z/Ck78LEEP46cUPb45fjEQGrAB8/JFkWOWAWVlAJjhZPZ2/1LK4/T5Ka3l447eJ0J3a5j/PwtUbnu+9653LG2DCAnkT5GyULnOUcOl1dAvfhJKKHdRNH7Ms/1bENep6GEK+zWJvTu5iL/0Q+D/LK4fosFLmkR7lUxh1WyyjS9zGs4WcXYornLAgrUDirVpIobelALYCtobvIBdmEt9ZYLwnaT6L0qeeojEoBepNT3FDc3cRZTE9n+XAp+Uqz2J7QbbFLMryLIE+3D4wr9rr5HwPyhUoR9/7wmLvbaDItZoXUOxawlSr2QJkE5Br7k6N5l02g6ECBp0Gii/bRFMAS61QPur598iYufACj9YHwCEtum2sFTotaum85yHon0AR3x8Eg5EoBm+DwdCsY3kp4hxMjjv73qe+wX3Td7aIsgspLtJ8Kkq077LZJ6DwJYNRUFpg4HPRplUhA1oCH+GMiBIjfHg07BKkjxhdFm7rEKU6ePF/jExPMD6PG4AjWjhYf+LLcqGlHsOQcdDsj+fIPiWPAaRRwvsiqlCvxs0mcewOVJ8rOUvmiYwbUYEsZfFcYCNnb+1+a8Yf9m7ndUYRE6IRMR3l19ffVcBgByB50S4Kwa7UfOHHChNDUxCsmdD2qOEf6ggqKILtVa/iqJIBuQBqlouojKqq8GOwPhIw1UExNQjGwGtxQI/RdrHwjRVWZb0CKzGVmZ+rflVegTUMTy6qBXR/Dducns9YIYarHG03MEwmYq+DRY42FXYOQxuPFkwejjvLtNUdXm7omgfwcU1P9EKy3Ntk8XATgsMffWttWX0keXAG7taK/QiwKooIp+vCwWXewBRtpMtgXlZR5fOYQzCMwzL5aKkP/NsWX0dXKPHJpaEOAAi2JjDEMslIUdAEBAMeoSjOJLSt8hYg8ATnSbFkx7NCJ5X6XYNZloOZBF3qFcrQaUJsBR6sDNpCxpsaUZsH2KIrW7QnGOAH3+8VxgPt5+JSNZPRygu4Pat2FKVIWyC2g35QyhsHAiGZEICaABJT6yKc6Rgk0rW8QicBH60BRzRBrKZSZpowMF10ookmwk8CGRjLG0EhVdaBS6ML6g7NsPcwEBwfiG5hxSJcJt7gpLJn1To4LlEC8HpMrEA8CMDLUMwJeKUpittCLvMrQH0dXkBVnGrpzA3UTb/11fKqOm2GvZu+kmm6cef1iI88wF7dHegrCw4cvjfswo1b/E10BQsHUFjBsuHEynwJDC6TIgZuqGras+hL12CpoDeykJlhjxY0tG/BTY3S9BZNW9Q4IH+JO2JZzopkVQEJ0wTsu7ICM4uWBPm0DSeDPQsSmzZmnGdeJS7RdLrmXaj3LYwHeOWoBcH8R674KAtkjbgFL5UYrVErP1vU2SW2x1GAmzr71ZE5MCXcuyi8u9u2ZynszhvkWmvRSykvvSGboq3R+0feFidk1B69oU5fYbwDPi+iKyAtAKMQTkZBMLLGWV52wHSYq4FPUICkEsCDQOistv7LA2zpw246GPY26OgdxaubxsVQEw6uCCwMgeGZ2rRruq+iokqIAQuUFIj2DjFcPv0AoqLcNIfOcgKz7nUn9Ymba838G1W/eaX7uymjYxndIMWdNjsddtQGE9hvHJ4Jo7pa+HWRgpEbJaUMJeJdTsh+7RpRuNOMwKzqFfARAiDtEomL5AokAQBjm5MGaAwqHo+2PqltZQkGgIvvURhJOUboOjZte7cbv0dvhsNaE+E3XUZDZcOUm3t4v+z+9LMXYPQI7YchzWKOAs8KaimudLZFMzsdm6EvI/Ea//kOI4a0/Fut0VdRY/Y5bhwN2sKwZfX0bUtoy6REwIG8WcHGh+1dwFzcsBKz5zfytsd7x7/tHiCkA+ZRkrJ8/+3Xb7495LAwMBBZGW2pypDQNbiuk5j6loE4kWAIYOhuvLs7rcGgWd2Cys+CvLjYTcqylgd7+48eit/1gNLdLsBIqKcY591dlfNdLbe5e7m7//jhozW+2VZbxDbzBC+i9IGCPXvUWS1o0mkwBUlyaQconk2RC2RUgJRhv61AzkU1BYvd6BPD2gS8V5a3ES8SQELHsXGnDu2BUeavBPNgvZzKojTcCYgrK4lV9/tkHgSw6zCx8f69iFGdCkvRbivjGPjxO1oisIgOQN8uElDzcS5pNto+qrME4YDmBqMTZEUzRYpygIcGWE+9sWdPPSm1GmeJA61a1Lc6649BLHEk34vKWZJYsRNyjCdAn0BNluMruh+Fr9bbTCz+oD/96zerMgxQooHQTGAjgihsealqKty9bycpHx4NW+CdC9jYu+TSXOdFd7tQgxBX2N9rwALmJL3EflfVKHHvq5YKwLuR7nrwrmvztcTSetvvSLMuejMRJWHQGyCdIEjEr9DFKEvOJeD2I6WqXQaSvi2Y19IDU/pDjVGMS+BVpjtpjToDy7kENGHJZkmFJmJ5ST4XKyMeuOyYY7am6onK4FteediYq5U4zC7QxVuABQH/lgqeJo4VNR+JZ2B+JWAoyTZ9yClVuhNkTkmKJouW0gcrotGTpwUmbwB/amRogg21D8VKkm2PQIdVqMEEZScbgNMPYALiQ29EIsIoRp9aooFnbSZ8Zqeo2GzEp8hJv8HAn9eR1vR6Z5/fP7X9C8ViWlQiXJop/kcbEODqFGDYhx8TcBJi2jilT9vHshk4BpsB/ihtyWrDduw6Y56FDX+gCtpmc9A56MaJpURBhvSKMAFK8KJitgDC8bbSMVu2yObo+Sl8gHlm+epW07qKCiDpCFlX6uA0caKaIrZRWaKYcAOW5ACh8gH0+nQ1hzVX5jRyrimcjzsCvR1KqBFYzEvocAKIUkD4FvPUF2JeF7jh2qTHPpqDQdfGipEKwFwDxbzzvGcC5DAABpXKjJdMRE1ABRS4uV5KFesrG1BKK+FnzbNmPZT7bQNSn0e6SWOMsCwmIlFL0CKp6cvsmVdtmqrXFlnNACvgj+SmM4DuYToYRLxdL/iQJ5l/zl01ju8aHxsxUAn2IClD9bEHi86qQFNtyGoAf09WL+3eehCFkIr26I4BUhdTGP6mYVB4sgOnmclaSSKift5sGVXx0KxRtVxRVJwLDdDaxs9xUqjggNk52uDRFCbqQe+RuM/gdQJj1xsObRq2VtEFaM2vM5Khhnrj8zgjIsEEhnbjqm5/JYgoL34pb8Mr9HuQopQnsUQy5Y60xOX9gSyPfiOYpmiWVGTrUrQHmAWkHcoR3DkEo4kRB+KMNZbqgZPv9sKwyEjjHGUEw6rTGAlYhGDEMxuPGxPl6dOnPbM59z34jvl0eOQNLe1uwdzQqh+qx4rCsqZOgbSSnGyf0pGFnKHAnoHjLNLIyXWDFWk+c/aRvAokCVKELUztXTcFOvjuYIecxvIO9H6i2Yx5Nj9/6pSZogWWZYydypiWJOcEYsf4VivWeGeuxUq9RsKnChJVTTLN85TqQYb2NibTpSGM7/0Kwnguy9sTZr5WbF/l/3dMf2S1bhibM7AocQjxjWzdxnY9u7bfbASzjk1+FZD/963gsC2i9N/Ir71j69qmZiyeyoT/7U2eWdwMrL4tXqI3uwSPrl4kl/nutSwuP8r6Qvim3s/ySYYBbY5OoVh7e5AvREOVgjInGImeArzprTh++Vwc7D16LE641k4cqFTrUcahxFmdRqSjEMYsXy6jnVLCtwg3EMOkiibOuaYSU50lbBTWxgtVuoCZiySbpTVQmKrR4h1mxDIQ4pn7iGteqD8mMKIEtx+NTG3BwN7h9sJuz5YDvSiV8UYglkkcg84V4i/8CpdUpznALcuXEbq+FLCfg3OvvUBNhQodDdUAfNrLko34MZZkjt8z6UupKf+e7W3iHVpuRgEmj9mFqBDLOq0SjCNWyRKRAUk1A4dD6Do2rPZMMLkNIqq4MnnvU7JciWPM9sDSGegfFbEYz2CjluP3SOr3Shjh5u9yhlfllzIbiYGiIEEbKGlwzm9RktivPRVYOM3FDE1ttM8YXJNsdzAQ0QUs2ggDLGYZFMHierkytNJlrWqSY+SqJY85NpVBzPRK/nLPQMkQIsjYHXuzeAGywgLAjjxnKYnRH1wnZJhuwaWzj/S2h9bnY/AjJxP+vLM/pi/eoFVnQnAnuvpSgQwJpE8998fgjw4tAYe4BZSGiqnF0JYU/PpfFBJUOXC3kAA1B0pjpHhtFYEr9gmCw/jcsGuvZEGJKqQsebkcBiVFazEoVhV0MfPmeT4ZEIvPk3IxQGe/mAww9ybTVHMraTdYZj8e4naItelj6lOwQUmpd99ULihG9z2AiHyuYHpDUB04LD4zA6MuZSnQxDjRtWWycBIA6ITmgk6gvkf91N2CzuxQH6tEMLODmtBPPW/GpPB+/vQNiCP9ZzYgQt68AWlsZwPGbXvUbMCffv4nN6A3McUE2LEdTUbw5/jinV1xov9QnySZVb/EsSStp7GfdvsmwApWQFIbJnrv85e1m19D7N393Ld3+58jQu+0yfBv3P/rEaGSbh22czJhBazaWaZUqmE5NmaE8I+xLKKMUhQXiru6Y7wfBkqD4R7NJae3FGNiNDVVqFGBYl1xinta5NclRvfpMIPKqBMcLthAtlGdenmXKsksdNETUBQIHAYFFu+3P1Ez8zrtOevdXe4mFoYz686KTxPMkxsOG0O7MtflNHa5JgpUrPGQSpqorYK1NfUFF22bmmUKIucFTM+Oc1IN+DSagqlCNQw5Ci2LlizrYOmODtWpkGi5SttZEQDMIW6u9KBxB8/Hb0E6vgWpGVQ31QBhaZbpt3aZve3cDSWKVNCwCRPr4lOwZQriAaxSxLAHIGxiphaUSJy9fq6ijJi36AQ4GQtdaMPMC1M+04U+FixdNmvq46Yyza+xUr4Zhap6yLSdz9G3JA/QLWfZVhUZTLU4r7HeoASRuNDKD8c2z9SMM6s/bL+bMJFNlH1oMlBocwpV5pOCd0oJxu2Hnz92s2woEJtdjBFgJa0OOOL9Fv68tqxs7ElTQcoNR9jBG9pPB/hQq167q12TSKENc4jDn33optRJY+7yIlnliKTHIvGc+v4ZuMzZ1bMP4+aV9vKxNINDZEIfI0Eo7v52FJAyTrAtaWRWQ0YP8RvccDCeIZXV/pw/B1pGq6+KDBZhrD6KPFEch7ps0ybQyG7bR61m2opEfeTbRC0gEziqsmiohEwZOB0aFMYCgy/KAORxSgsE8bO1SDapzWOX3g5JnKM9vjUu0OGDXa1Bzji6h5qnqJDNV/92CWXaM5k466RaKzumRSR+N+ZYARs6Fke58NzsyLpaRe8oa4qsqLxu/UzaFXeBeAkc2KSPvWWO5mbG1RqwyuCBg4QhT5FVZ5yUs7rUR3s4Obl9cPDoUSB8VLYWLI2xrqvOs9Q4pDnIvWDoWRV8LzBAxtkmVbinQhYomdHVLVDIF5IOomEOoPCegNKKgvtfqhaT88Fb7919P/jsyyF+fPoOhAfWNJYTKi0naKsiulhGm4AxpRSwLwzwzWBvlmkPzH88efslvAGoejl6cHQjM34z3QCTUmCBGPYTnzmS1EzlroaMXKeVZnxlAKvHdOBOG8L8T5fvNTthW9IsxN2yMpURvBPUAUJ7A/CjsX3+xhj0XOqkgi8cYWkNY4luFephSpjRXSFAcQWsQlL+Q+tsiD3jEQMpqZQQe4EBhsf/kpU/HOlHYHZvmfFKS5iTPkRXj+rjqVpkIgagvcSgEfRMgCRT3e20N76Y8L96UFvP0gtXjVqOsuo46p4XgQWXN2E+D0E8gIFthkBO8AeTQafgot0BdDj4Gk4rNbiGdT5u9dFUc8nRLbFwcD9vD/yZAFp/AiRrJc4BqwAMKWDbYa8r07fctrK0xSZLTWabUm2D8hPl/9enp98JPuJJai3o2QDl2OblHg3QY1TYTkOHfw2Tl1zqp2uw8Z3nZmPtbhsC3Wt2xwZpYT9rhvSURPP6WN9kY/HxuWmql37gvR0MLFBY/E1wNs7BOzp5s/P48ed/2Nn3mr6gedKEFczuhzLPNsDZFs84dX92+nLnMdV8oPoiX+nho4Pfj03R3PX1dZDIak6FdsV8hv/HFuiuoP3Np+O0DqOKnxpsmqqDMh3b9/SZFqwtAGuFarJCPh0HNFflYD5Vg1VYSWOJ5hPqI7gPmnC6lXPYpggMg3VSHXZQRHd29/5tIkGPY5sW/voMFo5dkImKx/qRE4EEBQXno1S99hschr4qhPWUya8EM5nFXC7eh0pxhaeCGJouXKPmjtAsrvqQL6621oGYeqjYkyxKJyhJTfbdBmSA8EIhbmEJbCVLXx9cp6+qOLhZniOaBbhIV0Ag7sF1H8pK1FbeKi+p6liNbQPTK4ZulvP8CXRoUHRe8VElVbDEZiTViOAwT+x37Sny43NoN8a2nzlgm1wfvZs4Ly1pqhiWhalmY7/HnuDwBdmwVFzEap+yg8ABCowrR8GGOFYQLdcMRjVVkxoMS1IVpE1krMKk+4HZlurih0ZiUoODQMwxG0looPWhHXd8aAYxcQM3xdiO8Pw6672XcP+NxnuFBG+cEU6B0JttWIzbO1bAyKrJBuVcBFo9GymnG244zaPkLiwTAFADj0zHTnXnGS9IT2V3a4Y6kdJAUrN9qVlJHVK0EdqMzEj0S0mF2ilQq4WXjt1qWBS+xWRenekMnzg7PrKDXj7qtgd/ePxouHX2+vjw5PD4+8MX4cnhKdAeyP1RotZith08++r5i8OXf/r66M/fvPr29Zvv/nJ8cnr2/Q9//dvfo+kM9v7FIvlwmS6zfPVjUVb11fXN7ccBiJDB3v7Bg4efP/r94z/sBOEvA+2A6CBxg51fF0kjJc6yHVnOIvIBbjHGjJUC+pGOolH2NaJpNbfVGIDGk+TpqpJt2B1XqCs57EkNRwI2mbyIUlU+l+08O3l+dMT+ukrW6/Tour2OCeyS6skT7XLcszRbgpgWWP/o749IBlMHu1pgwYZxVZ4n7873xgeNwAXuxh6LIQaEKfclFkFSRmlWL9sng3uPM2A19mxR4E0G/mIk9h8Ne48xWHUWHRBcy9Dca+IP1Od1azMW3r3SG4h7YtE6fwTTmSE5XJ7rDqmJgcgDJxnaHIzfudj33u1h9YaVsPpvre+3uY8221T5Iy+gYmcU58TOReLy8bHkCgKrQhnY1eTa8ZCryoxRJbQs3YbwrcjrCwzl6i2zy/BmtzPM7edKaJY11UVQMYAgqFRnkJFmLblIGB5wsv0OXi6juaTkYKjWFh3b32z/9t7vPH94/7PR7viLyZd/PH/3S6s55hLdHv0dHB7dFirvw+qmciWWpWqbDqcYjLf66N1ri7Y4J7+HW5mNbgFpBqEqZrNbrZWmzv4aSTWieU86tHLkdLNf7An/oO5awaC7gu6uOp20TMEnKpFWOv0EK0sJHgsSp4qx6GMqNagY56LrUojZcEBdI00XfihmkbegXSxoqyKHSRgu4eQRuP2KlrMIc2l8NIg2DxXjBGuoViRtClnsMWxi1QXW/CcZHrLABISfrEZ4ksGquHM2CchtvFfoNq/pzKK+3wO2x9F3lFRBi4MyIQogTHYKH5njDzkNNVa4lhQ+oSAIBm/2/3AQ7D96HOwH+6wJZOU83ds9eOjKGQ2GUpmfCmdvjyE5exALyJxNmKyQOHhch+6jCvDCrNml701eeSN1CVqQAOQQ/KQMqDY0t8rAQ+wKvJKQSoLvVoGxbkI3hnwi9DivsDhY9SI1grCHQ2dQovYnQlQ4Un/xO42PExRVBDAvSfv5epzmsc4KuTjSK8NDz7lMpOR7Usjw3L25EWw1I7vc3NwE1v9b3ILV5tgRGPHgYcOLevUPPv880P/f2yxa1ZLs3czVn/iH8PfFkyfiwYHYETzPHbFvU8ImXlblka8ozPR9euTxSpvYbgL7aXX1MFSbS3l78Kyhx2bWc+RzZ+kacLakU81kr1HaXGBkX+xisCUZGc6SuNDA1Sq3EP5e0q0JlEjmna9OV2BXvZh43jMP+cqWq6hI8Eh2cNdemwt3YDCi64z3C3Ld/ganQu0j3BMtGM2eO9/vnh1bZ2z139SkOfCJ2EdtRZ+fAs/8U9eRrVvSHsT3uoj3r3TvarsW1h3M8MfmJshAfVxGWXQhC46PkTNIB5vB0boKrXIaKyAmq/aFPIYJhKe7ebjjPa56YjKdYEEnuLNXSV6XQtWqUFBkZJLodJ4nV9WnbltBL/AaDt4/d2Ogaz7nGg8d6BkpbYuHmDR7UotQHZ/SUW77+LZmYqdhQ/g8jUMdem8dD9cINavcNDjXL93IusNORCP2cjCIllqv1uOj3jZorb16IZZpL0KfYP+vmYcZVIddKdSh70BSVy/xIVotRlpSSMevwPqhopdraS6R4msQFRB1K9tdsgfvrUvyIqnwNhhKZVCVbh//lBxJrFcrbqT6AzNfSrmiymVt6oMptIiQQwuuquH6HIxgI3pcdo53MMA0r4EPVOUUBlxYck5EGi2ncSQux22WAQWFZ1ZbDwPCCqsedeyDDtWxmNakMoIZC7T4rLs+BIHXi3BjXa8EpusrBetagqGK2LEZTNUqyr41ILGWj2ehH4VRgVEk/VVvEhuJ1t0HuZm9oYTv6afKdKJUSNx/cjxRxa9xgEebqTymM8g2zqtUN62oqwmpnlx3UQc++Eqg3d1dHKjsWNksNFtTajkZ2uZ3F8FchUfWu91OHWDRDVw/Q19Oom9OU0djgbFU1WYWO3cO4dnfoI+07o1LdNYcIyT0wVLeTUWQwHogb6jV0gh0Ml7pkpeNJzR0NGXbAGqtSStiQmla4pdkZSPQFSlJ21rR3dbcRpL0OjgtbEbiDijtRW+/oxvF2mw3mRiw6y6dObK3worSVPr+CUzapXgYAnwqEGF8HFhd4YM8QPaWedG9YIIHICZSAQ0ApHiHsr69Pfom2ZXtOEXlcON1CZP21NtaRr3Gxl1KtIB9NhHe2Lq5xOrbimH1cWwvw7SwA6EZlzggX34gFJgGh1aDdYt3yvKRy1x5O2MdJp99tnCiSIK52Ok6ytbd5YMu82qlAjBGg/GNUThScOeSUQMSBbap1ojPkSOYnRPebe5V5+e4wp1StngC31yLxTWdHEfTQDpGrlLGE/eGyLYoaBu3vomsG6f1Ikpkz50OBr5lbcN68+OO0dtQyLXRrSIEole/BTKhmwr6zBBdLJ/PHYtBQWnZHp0S+eST7J9JyxCyZqHKYHrt/OYmS197pqXEa9aVYqUxVAvbgk/pXKW6dHOu7s2kxihPOaFv+XScGYT3Y852FJgu04XbVo7Rbq1GHYtnbnWRKEFgLdl00x8p2p7TrUy5QgoVuENHvV8mtu2naMNmgsoN2BaDWgD9foPJYN3WiYuK9pbpxWiOnJdehMdMlMRi9r+Ut5SIMzBbAMRnIPl2dzHm3UFotK5T8wJHvLs74cVf3zW42YcnGl1Mh10yC3vHsei0wdV0tqcGrV6emx6u72DdN2TfiapjSnIe1WkV4q1NIXii4OPTyYUBHzHa0Uncwbq9qao9zUFgfZ2LAizoOigCfEdIXuce7pW790pP3BPqahLrBwiGLaR1rnRN1Mf8SERz333Qd9F9DxY9zfyfmlU+g0ntPMNJeeM+Elo5ZO/ZDMXuzqFKe+KRYzD2OMHiexcfkxV+ByBpVEng6U5X7HF/975nvXieZxkfFMOX6BrtgMl2JVWbnzWh1C8h8AmSNMkuy/ZBNbOO+kS2Mv6xsS69aslaunvzFbwfiyfobo13gyDYnYNgroIPK3nx9AugYjqhB19QkeNkkCyBMLv4djBSnagXZo7tTvj9i06XDcec6QPNzErCK7s6pDQ8ZrrEW2+g4iDuKWKux3LaO9dT8AmYtpii8ZoKSGhEuU9zS/dI3H/iuZEb/OsocNYPugQNmjelnM5xqTviaR0w6Ew0xhwtJf4gArQDdoH/qml7T54SYYY/uzfKtSo6rfrST0jEdis4mzNgvzol27orTc+GaiL7lu7d5oV1SGJqGvBL+xw5re/WtnhdY3kDJsm/sK/hKaQ6OgiSDgt1MiEjMNzolL++wCnEarywruZbYYZQ8NzIzd6ep25RM3eSoXVoKkKgMyfm7ZvUGMABVikSpPvigB89sB49cG6Y0mP7cVRFa8RjWwBviz+fvHmtHXY6QqQOLIFXp9Bq8o9kduO1wZwowHNIpQIjoxJv4xIUYdb6ANFkU0OfskyK5iImzuLWynbfbl2urMkTiGepGRVk1ldvvh2xriTVw6ZyycewJgKnfj5++M7Ygep8FlajcyEf9A/PTl8+OAhfHY5E5+FXh11zkCoaHxx4gvGExvokfuyOcz5+QKfbXKiP+wE+3imTC68NcCS+PYF1uAWkfaxxyusCRGI8bA908K5nUvuPeiYFD9dOav/R2knh2tHqYO6LBlXZA2K+RmA2zZzSvVYxaF/rA8f20RPDmU0Uix+MCbf9km8keVDEfJ8EvHLkgzulnan0eiDvd0Bvi4OMbqUUDzHS8wmQUwvytniR8K1UijcP1N1KWGm7/0jQVt+h4ph2vr9NiQe9lHjQYNv6URiXL9fO91P7b5xVZM3qwUH/rGw5ylXXbImAKAZhG7JZHSbzEGUpFRqgHyav1ZtGVv2JSgUiigFQwBRrACgxdEs4qbutGu+ABrCqDPgNC4UX+qysKXbUQkM1ay6Hw1JUcy1aRHf/gzNfL++2YDUqfKXkSJ2rZCU6Ej/iD66MQPpFF0suH7GdJYcGOsCsG+hTnlkyu8Q6iAh/VwJ5lQIidPcF7HL6kTMdWjZXiEYKFiNlRKUuBVf1NF6pXEoMv+/MorrC1I8aBEgDyo0BKGh8OAaLd+cNloxDbF0DSSqT7te0jSp+ZAWlLXqR0UCX3vFwNjs1v6nl+7+K1kP7MBzeHsmllgCP/NQOy6GHzRHf5jZP1FJ4BArYI6swgK1ONtjXMvBJH3WEB90B8mD0BZ4t7qHLdfCuUdfP3hB7d+wtugRzInTtjg776FGH5pfKTIhPoTF0ktq+e2vlqKm7HHbH8jhM7SwKviNT6Vu6BCavqxJ/vwbv+NZFBEibqzzBSmN1iEzgYfdbspe2wuevDp+9Dr8+fPbi8Dg8PvzT4V/Dr/52euieOpt6/3j79uQc/lO8fZu9u//b//nHbwGTvs4np8edE2vUtbA6Mj9Q2sA6YZ/ESXXbOR72vSzwp07U5nJOwieldbODc9mtOu/F/ok6zQwtwJJcofwBQabP77TLNzHxStf+1BmeUM+0FlYDJ9kH2XPPhD6BRjw40rkjVTHg26lk9/yle2eDfbSt91omsoWdu01Rkq1bw57Q2foOsG5dNtc/BRVV6qd12k4VsaJduclHlJrizTaZkfR6QXgtksxQ716J5ZxN3HRDMXLfmN+bu0zUYv10r0SgP4slHqyf8kWueK4J7ymGZv0/DaH/BurqLaQAY2Yv5IgvbGGCGBEH4gL+AcGnL2dvWf+2jOOKe2YUrZb0FQIt0YcBr/+g+jMqDxN06jaoNRbD+39JlSg1ONF6qVDO6R/J4z43tyz8syrH84ZNwSz+5mE4zeNbHycDRmUcqphUsygoNjnYv8rpQgrzawVYR4USs4jpci51o4O+jZ9Jnjt38UUx31UjqHIrTvCaA3e3IzIh/SZCc2FwG7cAG+lfkWhdIdz0t2oz2lcKdwASDczvCLR+BHNTgMQMdxfMbpZDXVM90j871ysyen+Y0h88y/S11TP6EYSYr7Hnthzt5B+82bx93a0M4EkymIUZ9P3UwEa8zvi38CgAga8NHr3A/xdQSwMEFAAAAAgAHZGNUQXz0aYZAAAAFwAAABEAAAB3aGVlbC9fX2luaXRfXy5weYuPL0stKs7Mz4uPV7BVUDfQMzbTM1LnAgBQSwMEFAAAAAgAHZGNURpMDx7tAAAAoQEAABEAAAB3aGVlbC9fX21haW5fXy5weV1Qy26DMBC8+ytGzgF8iMu1SPxFpR6iyHJgKVb9ErhK8vc1TkBp9zazM7uzyzlnnxORRR+c036ANZ6QQrCoyeuLJcR7moLH0eFalMvdJ30TjGcvMy6GOWVuYYwNNMJp42vRAgd4ooEGjGHO0/0S8qyln01MDLnMCKWi7r/1FymFrkNVtaWz1gEfARdCSZAC5h+P6pmkxDg28l1eJ/tW0IvzmSgsMuo07fQK0G20HMzstaP6P1ZqNDbnEWJ35tuK5tS0zTmPOK3gzF52lQiyt4ZterqZVO+0fDxF5BeVq9dNj5O5UmtPKd7+9W6OX1BLAwQUAAAACAAdkY1Rlqdv4jAWAACDSgAAFAAAAHdoZWVsL2JkaXN0X3doZWVsLnB5tTztcty4kf/1FKhxuUiuZxjbctl7vlPltLLWUcW2VLYc70arYjgkZoYRh2QIUtKsz/fs190ASAAkx0rubpLyzpCNRqO/uwFoNpsdnNQ8bjiL2d2G85z54d0mD1iaiabOlm2TlUV4cHCs3mYCAJdtljcsrpNNdsvZqqy3cRMezADXQbatyrqh0TA0F/pB2X0TG3zR/Wripvu+64Bqrr/dxXWRFWtxsKrLLUvKPOcJ0iSYAjivU17z9E2WNBKmmztMypprsJNyu42L1AHRb/NyzWKB/1nzWsJkpX75067h4uxcPl7n5VK/yPCHfCxXpV/U26bmXL3ZiaQsVtlav1zzJpJPottYTfZ7Vq2yvCP2r2cX0ZvTn98dX56+mdOvT5fnH0/fdPytbtZRzUXZ1gkXBxJHCA+zYtWRfVdnDY8QEp8qmG2clOI+yrOlOV8S50mbgxZE6n0FP1CuUROv9UjexGncxKwnAfFGTRnpVwrylhcpcD4Nqzi5iQGqWzpgU4IMSZ1MGr7gg5/hgQLQz6PoltcCJB5FKCIapx8BP1bI4FCD0Pr/g/mH8+D1AYMP4eLbOMvDNS94HTdlrTG/7R4AXhJy9+SA54J/H4Mz6EDEKx4V8ZazI1tEYfdGwih6x8G6xV38Gr07e38GShAdX5xFF8eXl6cfP8Cg2kuqw99S7+DgIOUrVu2aDSweuOurZde8aeuCedXu6zcvlBbqu4y6enodKAyok1rmvjLsqC7LRuED2/4oUQKhTEMyWqp3lxWHz7058/KsaO+j+x9fRi9feOgOcOgj9ssvvwBB2xJ8RW94Ka9ATXiR7BTBogWfcmRYL/4bWoQFBAoil9AhOI+6EXdZs/FnUnFnAQMjZ+YK0GUV8J8PZaEkas23V/UtVszVIIcKdnTEZubKZ0QCMnsb34vsd44Qz5+9ePXix8OXL171NDxiVVaxqs1zQPWPlouGPTp88W+vhkQq/NnLH1/OTPlKAEOGqxyIBq8yZ6s4z5dgf3PG7ytwmTw9uqxbPieHSl970X4W6P71CHYb5y25dRBSw+tthg6YfTo//umM4QQCF99sOCs4T3nKpDMjZDA18rstBAefX8OX+BYsJ17mPNQKAehhSbYXRJo7viIAILEFBs+R8v4BfnRwCPGLPzuRfhZwZTgj874+/eZ19MzZBdkJw3WAcNk23rGZhc/+zJbgnAoIIjXwb6atCCmds49t0WRb/kUSMGfPA0NqJBvNTlNetPSjTiKG4OJlZtpvb2/IZ03wMhbAbliBlIUPPOnYGyC7+ZZUWb4nRP6JWvRzXP7FLujEIEqYcygIj8Z6ShjbCmWFbjvMCtCFqkaNIEfWWyNal8SGik9jsoL54KPQKVSVJ41yE4u4aWp0Q/AYbKMtsqRMuRf0Qk1hNs/rfm7tn639MzN03rvYQcT86fNbbz4qUXtyGNaUTZzXfJWUIEkvGB9FtuJLLsDUsKAgsDWQCE4naPpydvmn6OLX98fv3p2fTBBmIn8oEcjOPXo7HhDZj0EQsN8G47SzGh1hL5bEsZ0WwOcPZyfnb06jT2d/PZ1YjHKLSvS4oKf3z56u4DMO3zmvF/+/zDn8p5lz6DCHlLPtmSOty3ss9P889pgRpfOhQSn8PniWdM62c9ZK6+I5JjidbdE3M+zBgsm8F6YRqZmRF0/0kCrPGt8DsKtn1w/DXO2qnYX2EbvjwO8CjR0yvg0GhTy74QwhD18uqurVoUvDwgv/XmaFP6Di9fPrwAFGiJpD+E2474XoOiIv6J8s1BOHenfZcqaH4xHcxYBxx3Ta8FQ5aszOlPPDf+xcq8vw5LuRCU0kWuDqvyOoXIhJhDK1giQyTssi3/mrtkjmrIqbDcb+BFVWoa9q0Dkf6jpfPQdlCCQjSqiWNtsy9eU4LMvCT9HZl4+QfUoIREtvcd4kj4VgS0zWIsrIfVVfwUwEnXKR1FnVyCTXS+wa0ywuPTlAtBWm1DyFYLQFqxCCirwjs77zrzpR+Z5osMbwzPLI8OK+B6zBWKghdDklF4OJLxmtAFmUVaPmuvI9WtMizeoj5PJywo2xWcOxBIjrHSwG84MSvmHKRCtF08DAba5zNhFjwNKAzgUqDU05FQbYzE67mxLC/RLyAYi1qjCBH1hR4WsxldnMfGBMDFnja/ZYBDPwSVaKjcofTFJ6w3m1wJUjoTeThCIYrb8SvE3LRVaAPuUwBWoDVsaQoEPYhTx9Bc6PzdiTCUSTzNQZ/jRTLTGmk6T2wgN+Vm0DDCwgSZMdDnNGSHr3iFDcZNUCB6G6IQ+n5kNAsFgCxYVxMO+d9KU+qg/Uk7jgP6QAssbSOZietObI0lv+nSlpLuKg7ti0AufTw8lVPERfIKMVfA895R1oIfG7neT3OcJIBW4xmQV/UPQ2E0NkrEmHp6hhVx05SQuJOUQjtOHraarWoGoVUbWepOotwvzfUkXT7iELMiD07HH+Helt4xv0mx249KCThDxcWoabPfoODbo7ZQxhPsCzcvWaff0WPICa3h1PQev6CiWlkobRkBBMuyeVC0F29b0VqaIIszG+BXFJ14TTwLdlBmnKDpO0hywMEjtyo77ZhZmmkaxxUbTguuvvUfkTWa6EpeACjkKAudZNhj2LmqncIJw03mPBBCTQ2SqTgeLi9GLx9MXzV3OJatsKasFitxCSPtCzNFtnzTS+Xs+R7j3qDbljnm0zEN4irrIHigNrXD+pDp//F/xzCP98+BDQuiEFO1Spw8Oksl/5r2XwX5ZlzuPCjP92hLO8uuluDeu91vnOCvibNVmcZ79zjdIXPF8ZKTT+DGXWBIHHzDW7t9hHnXyJYVr3FyfeIg/HXkrrwlwMrNmz3+GiI1w0vP4ZOeeQtI9evpZt4Kn32DmLMhFVbT1ONTI5kjFqdLyOUqOkUcgZHUf+d/RN70pHUZpO7sjwWw6vO2PHHq5h+Y6scV2RsuBRme0iZScR2Mk4RZ3UI/SIOZqyhut0j9KWPZqH5ZKtfIMOG37ka+wzYSlFfMQCXyEnR4xZvkqToazqB1h4BooO9QWmGdKx94PAlMisPZWP9zrXmwH9lm1/Gkf6/wSCBMK4YhljlWM6Rj+4n7Spd6+HK7B1QarraFC6csGvO2RQavGqYX/mu9O6Lmt7ljrOgNV/wYYrvfW9z0U3gxlvMc72jXxnssDgHvZkDY8mE2HkJNUWmgnau0nDG3BfgNAhP+cg+B6bFvqEE7c/P4CX8U1a5hZlgTuj4yZQQH7nfLp9yE0sIn7fRFCotjkXhrVNfiB6jONJcBMMCrgM8RjkaEtxLBObJEhVzUMQQbLxxzdn5mODg+8IfWZHSxmWaRZKLzC7GJ/NIPsR+yT1huV8HSc7dkUmcw300H4pxVGQK2W0nQvshsvgejTCK3QAUmqgRVCDdwZrMMyIh5hlEIS95kcMMi10KylU/A2TqiWTEBiww10l3EwFpyx70cIaLfdlZZffu4RKxl1cRhtKUMqhqw4ZbmhcGd2Ja4YlKI/T0LNVRu5FEMyVGdSvnl2HyIPKUTG5OxHm5R2v/UC2uZ+hMTV1S0a148JzxN3puBl4cANmqHNWuDD8VKd9A6ir10BpJiht87+rZzKhpDTLzEODyURwpjTsP6u6rHjd7LqA4zhkN970GxhW2b7CzS7ywjTNgqmmVip/R3pzAj/o4GDtRUN+zOi9jeuo3JOYyPiY03YbR9F1YYNgr2hsNht0PjlSXsuEng+2hrq2aD806EM5UoKphMPRRzI4ow2LQUhb6S2uO87Epmxz3CbKd1jNsqwh20fPWu3Mbi5KsNvLwyqadUETRD90iIPYavPBTE7tAX0szDUy099Po/HiYucZowV3vYrctEWn0cRg49ish0RWF0ZooHbXTJQUh2RVBJa4AcvKuWvjDnst6+sej24/D03/AWwZX5xcICxCrTHO7+KdYBQoZHfN7QeiOoHQpQUXuxFsyQLCJy+INyqIIo+6TA3CV1YkvNeIJC5UBTmGLmabbL0BsPfHJ+effonenF68O//1/emHy+jy+OPb00t2m8VAWZkLuVVw8j6+MfyetcyyQUx6UZAwINv75Us9rbGLxUEa5lJG8KnFzckCqHsoS0ObaeFeaVmNUTujDQ5clTGMEYMCbdgv1FEI92hE8NATAmNUef1ZAK+nwoToNVTFqeHWwXCDZBiMpk1UQ3QBbUix2jn2qt1zSIYOvQfouhrilFcWmCy31CaaV4DrBOq75QZ7PAUO0fzZt51twd9S0Ta9WTcYAdD9RE86JI7P+qKzoLuyvkEN13v0h+GzOfzzNBz3R8OE1B+bLXA2CA/HEhKb2SbiAag6mkDueJk9SJT9ENxsss43BFoppwWrYEclKzmYCdFytt4sDl+9eA2OEVCyEpZeZ9RUH/ewfeWGEqXdnsaU65w1IUw9Oe3wQy05tHdSEbBnwuwH19a4WIAjpbNvCGpTMWezO4rWsgEis3Dy361RB+LQr9+6Eyjwc5BSoKV0GUTdFm72IBMSuScntOBrbrSs+tLeBDXyZet5yO950jZ0zIbMHBXYm4AFuhM+SHolDDjxh5ADYANS4BnIj/yY3RDBjz6XYreYRmp8YJYzmeUM5dbVfhIV0MMq4+4jcUEytVSIhDyW5c5NjlgT0EWgARQG/ywf9sn0e6vP5rBlAIyVlmq/OHx9xI4NNS1bSkjbSsZ4rV/YWsazt0ldCrHQMTQ0kHxWYdlvi7RMWuzB8zRgfyvKiFd/Y7LgxJymx+4ZwxWdnUIrDuKA+LbM0n7zBhDXO1ZBtt1o8kJ3uQ+zCwfYGwiq03daxEDf5aJjlkCtheeCkw3fctXW7/bm5mwJRSwmLZDJb+JbyutSyL9SbiCKG2bvqWZYUW2yZKPRwihA0q8Up7nhO5mcbKAShhhGTSC1GNwkxXYaNokg3ufZUveL8Gvg2k1Dh6kUDeNq3/ELT6HA1ONQVl/Q6vzNcZDZmKHTb1kdlUvwp7dcHRUzDR6QyRAPb4rGc2sFOqcKaOoVVT2QIbOSkkohk0rP+3dQJPLG8CP0/uiM982T5aQUoVrj6wTqiLU8JirAO63tyDFCuV53AXaBX/x9jPDC0AuCoevSHAYRmS1b4zE8cic3G2/fEWMnQq0So7kh5QAGrNKZITqXEkO2qsGDOwn+TGGiff+SPRazOZvMvocuXDtj04ljZkQZhZ1aqBRFt7nt/r0++otUq8Rx9vXbQv9/ZjVjnW7IfN+UwWiM0vscttJaB5knQ8AwCXPGWco13pzqS8Dx9xGUWiDsSNOptabTNuTToK070UjWY/haXk4AX+N7kLSCFNDtGHtKpt4jhfq5LoZIFtTJWRAiLRXbWP6l3tG/2jEyyXR577B6sCRn+wgY8RxBfHerzR7pcl3e/OhuWPgTsI8YVuNm9HE1U9PO7wGD6HlAiGyNK7GYvUH7duH6CaWVIMZRvvRsGdgebvfcbcyuMyXJ3Z0Rv0eNW0refLB/E9DlkZVzflzzCtkk7IsPVsqTUmrhvTHlT+TSQA/bSs0mlm2ZWVvlZZzOuqQEy7y+n71WXnegUBiCe5RzdnUdhHGFtyRsbVb7MFK+rpsFgwiNnaIfBnc+8ODlHNdE/ZjD8JU9vuejsyfSOapus9hmpenBPTqSiP77sfCGztscZmJO610ErnxYTsrrVAPjgfIf29pHzgFIo5XqGgJimLPut9qC7K71HJmcBT6D2lnXjVANAzMZMu4GbUHN4nV3m+m9/Gkq0RdQA3XuDbMxfS4/fEU/6cjRrCNlJq8t0ClpqzMzftmpa1FmgnxrkXC/w4XHOV1z7a8yHfXfQ17gfL7XNqvFj2YE3QqMlGpRRpCE51ceWeHiL5Iq7xrd8rPwqUdtPdlcxg6iPaa7NEXwHQU20Eeww8WZWFyo9ONaNRQGKciwqfC9HRXnYDvORpsjcg53pCnGNyUXXfMGJad0Bm/JiOZ/l3Os5NUyuj+hEehT06GbhauDMQirppgE1eBIge6Jf3dAx5jLeC2lqrct+j6NXFTg+ngyrjE/75qe9+VPp6fvDLduuZGuiCM3YmM2mwGrFTXq1D1Ng5/2/TxfQs7ZNr6XJVDOi6OnQYgnPBpe+LBaJ8CU4H59e2KML0uPwokTTVQwUdOgeOkmldF/XXq/1b8VsBb84gWGpxqkV9JV0UrNPaCkrHB/Rt1irSMsRyAZ4DnH+0QaLq2plHQkQMKmV77NQWxfw4Orp6+fXWPxBAMEd/y7wkXDwQ8S/LPXfadL9aHw+dSWYZ4lsErJxcEBle566YP2oDW0oTkUNml0Y2hAhZKt6SiEoGaa/9VOW6puc1x9BfPQ2HFebOVLsnVc9j3MUUF6tElMBtTP982OmtZgz8S97yIbbXHPzKGzjrrhRrc3arny41lYxKzfB5+zNwoPoFXX2OzQTCPCOE19TfOVvRzcJd+7XApI/ZIpSDnsdGEGSqel53vvzk5OP1ydfLo+/QEFcHJ+8evZh7f0/cP5Jbykr8efL/90/vHTD2b0ItcnUZH3U1iH7pSUHH0vnkXwFdxY91waDMTLVLXZ/3vKgyqHRue5ofBZQ8EvL84QF4jJbAY1LvqTDC+ilzdqryxmeH2wxZOItrmaH9z4zIp2ZE9N0agZLM2DttSUO8gE5USOixmhXTpjUIRxwn06qQJOSbMYnwaevoKiuTg6Q69j6maJfqEvUeL73kta9dCc6YJITtRVOc6KZjO8GHqLPfi4YFhFUalo3NvICuwbsr6M7N+ZBxKQgjjNSuFXDsMA6rhCf1dnYJf5TjnkHs1c8gtULM+Km9DEqmTllFpVn9L18sKx+k3/FCYZEIQf+ScJQpU8V7YAaCd+MOcQCYC0hZq3l47kgs3wQbXgYDeFFbituUva2aX8jGkBhfA0o14ycHYZL4GtujeKOaUGczAhn/9giFamfFhEpvJI1eh1ku7ov4MN9EJurhu3J3CGkJ1seHLTH8pOsP+GcoFQD3HGQRMnSVmj+eQ7Z29P/UkI/DsS5vMqHrRt9A/VKbD5CY7vh06znTNOVQkFsNynwXlC7dschagxhZqdrte9v9aXL7Hf/Bj7mg0xc4U1DB15twxwUNjpiUf2B3NzebrK9/UA+sME7hgk8MkRnvIGUogEtujXts2ElLEppT/Kg/kw29zZsB8cjQLsgdtLNr3kXu3tfQr9eRS8XZNLCmxB3PQ4YPkmShdO1nZHY39kw2a6hcVmGnZkbtA5OHbaMXTkOI2zks6O9q3D0lKbOO/iz28XZx9+PndV8p9ZoTmdI8ZHjAIq3UzZghlzU3upIYNVNAQLKFzRlimTt5t80klCWr0jN7knpOzf3ZOEHOXxdpnG7H7Odq/Z1379dH/gHy3wU4TNPXU5P51//nhy+kn+3It79OOBKS5+z6oF9im9b3sRDNim41P3Rzgi9PG0LZIR0+j02N0GyhlRQeViDXdHjSqCzTo8R28PomXbWtFXXKMzIAtl3TV4jaY29DKD1R2Njwyxc+QHUwc+0eW540ZcmgyJY4Sb1bH1N3n8vRx7f3p5/Ob48tgL5p3BOEmtWVHR4QKsnKwyy8lx1e3QMedrDgumbMSCmu+VuJ4rGOQNtsv6H1BLAwQUAAAACAAdkY1Rj52ptGgQAAA7PgAAFwAAAHdoZWVsL21hY29zeF9saWJmaWxlLnB57Rtrb9tG8nP4K/YU4EI1Mis7PqNw6gCOaycG4iSI3bQ9x2BX1FJizYdAUraUXP/7zczukrt8yI57vTvgToANiZzXzszOi8vBYOBczKOCJdl0GQsWZGnJo7Rg4TINyihLWZkxnvJ4XQg2Xac8iQIWR5Oc52tnLvhU5AWCiFWZ86BkxbooRcKiNMzyhCMBxzla5rlIy3jNshT+wR12xoN35z87zhtJiYUR8AZmCQ+yYqWpFCXPy4LdRuUcMeZb7xjgnvAS4EU89aTkAU/ZBISLijJKZ8uomLMJUsyLkj3bYZOoFAUsYcqikhF4HIspcJrBStJlMhG557zPs4XI2Q2PlyBHaN1FJBKhWIZhtGL+2eGr0yOPnaufR6evDs9YInhaOLm4AYUA+ckauWb5FKm/zACbRJbSZkGwBLKg29uMleuFKPZRUpRxb1eieo5zcnghkZQ2WTmHlZe4ZGUAw1riliFnNBiIrw3kAvEIFyy1Po3CUKApJFONMfTYaVnRcgzbsds5wGvda3NLs4CEx3CdFUL6CV2FlZvWkhi1mFkqatnOMxaF0vKmoWmBat2liUr+I2qhHecwLIE6UphqjiUJzOFPyyX17klhQTcAYXsWGkEC7TtBMmVbtvVRcSRTkCUJmAhhiuizALgyK3nM6AeadBGR4SW0Zm9oEyQ+TRUtXgi5JAVXsDdH/sfjD+en7976Z6fwd3gEO4S5yF7tiu2xt/2MvETwPI5EPnTwByC+/PH0zQ8avYWzSzipuAUMUk2Ugt4EbZeRMxEBX4I0pJdK3aYT8Em2LFkSpVGCy5V7U5kB15Qssrzk4FW5SHh+DWrcYicgQkgbNQZHozVHySIWCXifpBpn2XXBpKirKFkmWuEVZYZumWbgBHMRXKOzyB0MWwWw9uSyppkEyZIFLa2URg2qmDNZRvEUDLPgwTWfCSSLnkeUFllRRBNwQIhgIY9BC7nAxbB5NJvXosidlwoBdDxY3GEMaijzZVAuQY3gALOUy68oQsmvRcpoxyojqG1AukD8U1RIei3JTqKUIiCpG4QH2hDNkiynbUHCzSFm/JqVWRb/ysAUi2WJq6CQFjK+ALWiSXOI4AEgZQmEcUCZgTwTjDwNxRMLXAyuGlgtF1NeyoVdzIW2LyoUtyZBFwIDD8RYsYizdUIRhOczgeYBQ4JjkZAg1Pa2Nyaj8jzBWIbKLzxyh8GPaYQKBR/aGag7THkeW3235wN8zQBoKRYQg1KCkSTVVbAe8vKcAWQwJyIfZAHFNf0rq77BmhwEpOCApKQt0d0hSaAipTlZmGdktflWZlmNmEBAlrGfHbDxKuChmPCJoMsyB+DlCVwMYUvV0LguAyGsEfSdSahwzl4bDEKQMeSBwKs1/UCEHK6LClYTUeBhBV7xDRWG0x1iEGZn12mFEbz+bAfS9/sf/Ytf3h/7hx/OFMnx9hg/geOgrnypKV9luAN2CcaTH3dAsXQwUqbxAn8JrvpsZziCewF4Mlw178LN4chAB5BiOemEgrtom+Y9Td8gkmLI7pEBo3cW9gEYRMKYz7pgCOSK3FA5kaET9oVuS1C/fETaeP7o0bffEFSjzpiC30egxZx98y3hwep9ZAeYSlfPERW+s2IhghasUpUEVz+ea2YRJM8WViWZViWB4xfMlZScm5CkTbkGJThWHBmf6gxZtFBqJUvyGGYoa0L4gvCCvzcTIOVLnvQVAX5/7qCcUxFSQpuBB5aGxvruVjp6LkNH24Plxunw7Kfs0h1AmBf5jZh2uEKfFyDB/zvCn+YIFoA2D9HXP5S7kL2hKmkHrM1xKkUcngfzu2xe095g7zqNYDNjZomWgjXf57aOJbdC1g9hFkMGbq4QsZoBuT/gbg60CjkLQ6gDNoTR3gDqDngMNVJX8GypDwVXyruX07so4gNd38KttC7XqXyM+lK6gNUS1bHZ5DcRlN1bAtUgMbVb34lCqpE49JWqKw6lJFSnt9LeO53W3dv9txh4b7fXwHjrDgMj6oaI2W3/Ol7++10AtPpgFyDcP9EFvi7QFWKGhPwJ9JpWqIPw21eQyda2L8whJSruc4hx0DwyxYK6RYunit8dDvoA3trHgHjKEwsC+hzIYGx7j0jcJHw6zTdQuEn6WKhiEuy8AZ1agX4C0Mcu8qzs217QP5ed9zHD4BigvwLtrz5H7fKzYQP2haEXg9We7WxNoO/FHRaVQjWvTbcCM0hPhH7g/PjV2fHbiy4Y6eUAFqVBvJxSF4yp3RgHyRyltyUY6tEjZcHL7b0rQtb+gxdbXKQ1VY0koCFeM7wgiqLaVBq/jVrvQoVqbcY+POUCz5v7/j54lUZ4ki1TihUJX8iOEusac+ffJD56AtUF5DMqOsk5yMczhteUIlso2o+U+qMygo66E6cuJMi9mqVaNXqK0v6V3Vl415I14o4dA2RR/R8MA0ay6g4DKtH1hAEDvS8MKAL/nWGAcqqOBHu7D4sEXUXqPYIBov2heECJ9WHxQKF+dTwgvAfEgwrvfyoe0MZX01I/idJ2AdBVjTxln4g61CQKt6+7mF7f1Xp1MG/2YKZDd8zBsrya9vR8Gnin71+/e3v87vzrMX86vDh6/RDEi4+AtWkHyo3n6hkEKEMrRiml3e8oAEL/2fvF+zvOVkUaZDghBVdIo8kEh/gr+Hjrtff5c7vtmV5Lzd4fXzsNzYGbQt7bbRYxL3Fy3leRRWm2Ya7X51gUinHc3oVreV2n9Jv8zh6x3t+SnYyGbBEvq5C66YP7nBbEugnjPU297SFayySX/tGCImV/rRv8UTey8OUSm2ENLwKhMo9EoaYl2LtQADcc0cF6prjli2c77mq4T5RzAakxZa7rrtj337Od3SH7KxuvTk5o/D0esn9Ymldg30mo8VjCdUG9eFFDSbgeKM1SMjw5GQ6VpDOhNkUQ86LwcdPQjMmXC3fjaOJjihnBFhLXB2+zVKhFRSFdQvXi1f2KLV09YBrTK0Ucu3K+LeLCAKwgEMPFfxLKFAAINXaOh6nPnyzxGTR48GLttgliY+kqPOWnzf03HHr0mN4h7MfsNSwdn1PlGRgVn53Lp+56qZZM4EaX1dOXETMfxIyYfm5Sf4PLV/WqUW/rwkMWxIEdHLBBHJVlLAb7lu1egl2O0Cy1El5Gs+N0GvH0XD83rDBs3fbgvyE+TRIVVkPzyo3Nq1127ODToN1nabUxKgIjSwLlomhMf8pLrmKNdNVRRdTeZCZM21VsD+mNd7brmCSH1c5RR1V8+XCWCgb5zFMHQHfByzmERB+YKhnpmXK2ENa9ERvkk8EQJzVavA7djprGuf/OHQ9N57PI4DNv7c00Px5Zo2TyYXXdeFB4ZfuZ1LzTy6SDQce+IL2TF53w8jVNv91q9cP9lq10QwiqaM3iHQvaGKcfGN5UsTFcycJrrgM2arWMfaclUCX8IfRDG0XvEN8YtFvgcqf9CbyqsW9bV3Q/jooSO21LX8jN0BY1gT7aN8dzAm6taK965gCFjsVAbY6iYnBl8weKIkaSliTtdZX5unux+rCFMrXx/MzYEiL2ZA827KQBltdkIL3hJrFTXAc8UFSjZfSTxsNurOZi2PXWmobsLwdsu58ofh6zn7FyUYctsnLDEYqJwOc3dJhhfAdNeRZJn4Qw23ePnc7STJ1ukLetsxSbqEqbyYMoWCNVBy4aRy3GI/nE6Zav76CIyBkexdIyygkDnn0rRIxzcK6OjdxbSCmLdwcUHQjExpyHghknm/BkEPqDUs0NLBQPLIV3NGCP8YkBdFx4iupv+LhOHbzaLIbhhOBR7vY2RHIM5ps9Bj94/CpKl6IX0NqEHl9ARpq6um5vYYlVIBYl+4jl0nGeZ3m3BAsIQE4zgKLXW9yG7AUbtwmo7J3wVQO8Ixr24OIWrfm3QTsjhsLdECrGDRHuVgb0AeT7dIRKIAybLnNsFpBNdeqyOhG0cT11CdQtXrMs1wTJhfH0bUSjmwXPwYUT6zwlHQGUVYwsc+95WE8qeR9I8qQuWUBIOhUa0DE4LHKEvVZZ/SwyOjZoyWq0Eu1Y21c71rXPg0sjSYgeFUMN/mxn0JXyq8NU6FFssLc7kOuXKfhcDhYwA7s1S2OPGrm3Ywjh6PVLIaQURr6XTPBQqqqIOnk0+LSPnDhG1f6vpg2VhKPatvq8klln1RyahRaVD1FdPxgUPDoVYsixyIqephI/pmot5oZ9uso827mAh1Uqm1Q9PNMLBuoc+nVVsR/lZjmL0iM5ZunXb0PH/QPQzlLKx31rLbrFuq/CVZGGgkPVtphkvVZSEHG/Yqyp1AadvMRh0b3VsWm093UKIb4P1wVNpkxNNDNMy5vY05aqsKe0GVfZWsb6TgGUhlawKn2J5jkhfORw6MULtr1HQOsmEAIgGAF9RzCfu2AQyurLVyO2HrHPSrCAx8Ey5qXQLa8e4fkln7lUod0IP8+ycsTMW43EdKTJ4JMFfFtCnW6uBoKAgsEd8yWdu4+plowgPspD5/RsiE4dQ5YVsXSB4xXH48k2lV8l6S06vb4lzwb/agmzgKQVwTLJF5U+RvoNjQNrGV6xiKPSfbL1xMg/dbNRLoG9ewnJzV3JxmiFgc2EUhQG3mB41UnD/Hm5v3Olk4N1fXwFFdS2UUI1iLgN6KqCgY0m8pIqMhNkiJt3R7MayIDm/3D8/s27X+hh3cXhh1fHFwNcTVZ4Ir2J8iyt2cvS21dFfq8iatRLy/v7GV619dXFz/pdaU0tx77ZUl0XPbeJ0xyg2AjfW/q3SeOcryghm+XebQ7tS8fAaXD50+GHt6dvX12xPkVQIyJPDel2R75g5H75fShP9WOj1K4jmX4cxugVHNxBCPh+Xc7pjRIow8D/8d2XW17ok/pTIjui4lC/RdBFOqI+cep9SgeeLBvdJ94T7zco73BgZtne0phxGnrjp5ea5bztbmVTgG5sFUsu556bhN756dm0BFD1L9MoQIf68ntV7LjTKMfJ34jBF3w6DbUrBjj6OlTb5JbH11Y4NdIjEtEI1HBrZHud6oUovAO7blpg5Q3mma4hQz0ZMoOIebvInnRkYkxqKDOsBITDb9Is1VI0qbYp1HNDwLx7WKrZtKlgTa4I3TmMqTmqb5djMyJ0k+2OC91k3Rqn1Rrqj+UAl3phV7VQVdVvdccI3eiOG/6K3bGdqax+GQnIhxqFS3NqJPG4M7+q152K5YJebMHKJodCa4ZpLxexACbSaUHghhADfyAd4HLTxlQBG2tFa7/0hUuoBSaxwOYz8GXKP2CX10T7esRukLy9TginCSyTpiSgNIvL1UayAwxZtILWXSvOo3HaEBgIGkM7uuGTboG6evEwFoMNgaiJIgqh5gE1Eg4OfNjaBZ9hT/PJTpt13qBOn0oheh8Jz3uq987k1Ml4+yyFYAS4TVoXGStwE2PrTsR4nuJLfZR2etMS5iOMlLwogeTTT40FNhznKcDQkc8AynIo/gDD1ALepvmATHAtEfuk2GcMzAnoLUtZzyO+vqzpMoH1W2e9gUrPQKdXVTQoBPGgktngFPdi1542YU7XWl5ny7wrwUdGfuczfDWzRFnq/rlZqVi8FaBZDWNxTLUzWs6XxmxbnG7IatrsK0xCzj8BUEsDBBQAAAAIAB2RjVHHWPz30QUAAPgQAAARAAAAd2hlZWwvbWV0YWRhdGEucHmNV21v2zYQ/q5fQSgIJCGytixrUXgIMGBtt2FYFwTZgCE1VEaibDayqJF0Y6Pof98dSUmk5awTEDim7v2ee46O4zi6E6JVpBGSVKL7xKTm3ZqItl4QLUjHnhZKH1pGtkzTmmpaRDEoRXzbC6mJUEVP9Wb4qtleP0naj+/7x3UpmRI7WTEVRY0UW1LAIe8aQZyMZLQuURAPoyiqWQNn/+w4KJZalOP/NVc6dd+2rNPZMiLwQDy3TO9kR/SGEchAcdER1bOKN5xJkxolnh7hHbl5c0Ouvn/xzYuXL0lD1QZUCkwMDfKGrCFbraXvLSfJTrZJTt6JjjnX+EjrOyY/wt+F76cA+SiyMl4K5Jrcr8wxRib6HGPGmHxVDF/5TjwDBe171tWp6MEf6GZD1J3QoeQsyiSJgpjTc5XF5JwkeVJ8FLxLFXSE1WlgJctcVxxASi9Q5ZdITR35m7O2JrfOzOI1BkOUlgAuC7aeSsVqP2c1vB8bgXIgcFQbryzWiB8PFDfAXHHrFdWIY8DZaAHrDDrP423uYlIGtEuqQD3O46B8c6XCymaTMvTLnk3phDbvz9UKe2NPRqGDqewpF70UH1mly45uGSDDWbowOQ4tXLOOSapZ2EMrOpxNXTSfP9muh60yk0yJAiD1aeY4ouaVhkGi8oDckSZB+2FyEs9EYitBO8gluZHiE69B8A0GgpImoiQjYL6FLtoxCsMkXEEEnk/RkM9GZEnu/WBXXwjUoacKAQeBuaBzY3OnkO+QOdi21wfrg3xOkrkRUN0AMQIclaZtOwKlCMqFoDVGclIznFOF+A1DL7hmW5V6LAKjVXNMBDrvhnTMGI7sJ1j23gGAkmUyGl8ScmZT04bR7eFkVx06TfdzrOWBb3ME7NNynYL1nFxm0SyacMIUbVhpXlkczSEeItwCeN5zIxpI8maKLbRxXLI4Re6dTi5InBlsxdFplQvQcelAwc9VMk5aFH3dfdAt8gP8ec4nAwgF2KCl47CT9Okwkp2s0fEADcYCb2au3U5F/ho2dcrWdqeWuKLzUQS/PTPiBagszG6uwW2lBUzVE9cbcvPbz4tf3739A2cAZ+V354N8V1ximluqA4PDOjfU6q33NAgiEC0k61tasXIDCkymyeBj8Zdd6UgL4M4Rxxm52wjFILy2JQ8M3AzUVlty+jCOp97rD3ZGa9aO/u6PEbg6IRI2YBUuc8wBEnR3ILsAjmqe+EEk46IeVNgezKo0sOghwZReAD6OJJDOxpOGtywEz/DK32soVWArUm+e5zsEdYYdFg45MkKpmCHbKWJHol99HtnhuqXbh5qS/ZLs779dWTLLgllxfATGDWeeCC9MFHXAMlygaLtjqHJ6vQ1bAQ1/yeZMAh1JJzuZuUeh/wGZM7b2nxEsYGEF5TM2IoclVUneO6KYUPV6OneYggg8Ye+CM4QAxA69P7QCOlizGtIqPYV0kPPuFyGQQ5f+JfDo5j0M6K7jlajZaDknDXLSRBy/0OoR6aASdE/+tNJE7DSuYQo7aUt5CzyhFF2zNCMLcnPQGyjEVXF1MdAE/l7wK2NcuLuxYcBr+1m04gkoIbjocmX2cFexFM3keHv0WoTYwL4FjZT0qTzZTLCJ54DLwRXuBeN73nUXtVG4XBWsM4VKqKo4R5JSOynFGlAINac9g1vM+5PIKWpmNXe6WbzyZmF4HmBgH4NmoWvXqP9CQcjur42kWYduBT0HDOyna2V4qfl/SHbEPDR6RMUGXLdwzcoNt1BreqwScs5b2ir2THc938dNDmzcyR3z0H8U8DOgDjLIZmNbQtjGuHdmudC8cIj0FWxb8F7wvnO/qcagzjA7XJ8Nl/A7EE3gtLSiW/t9xIvtQ0u7x9zTPFLbMDntPt6hT1YXo3w6y8FAG39gjTffEcv4i72wcadT1HMLl8tV5uuibOZqBolNzVieasNUmROH4YAMIxXDYLyKj8dnGJvYDFyck/ho4OIsmJm5u+hfUEsDBBQAAAAIAB2RjVHU6zHyoQEAAOkEAAAQAAAAd2hlZWwvcGtnaW5mby5wec1UTW/bMAy961cQutQGsmzAbgV8yLC2GIZ1OeSyk8HYtCPMlgyKRtp/P8kfSbwu++hpPBiS+Eg+PhLWWu+cazxUjoEJS2NrQFvCkY3E8/bzw5tPj/df4S18udttPm52GzgaObheoEAOEIX7eJEDAdnCxQxrrbVSFbsWqEXTrDtkTwym7RwLbIebUsLPtwqC9daEQBrO+fbbe8jgHhtPip4K6gQesaU7Zse3l5Ad96SUqcA6Gd5G70XZmiwxijtVfpgf1AAtqRqazrvvdW5s5fL9s5BPhq9wOiaMxiQ924l5ko4NBcgJeiVh0qEcLvJE6cB1ZAfHCjTrFNDDIQQR+zMwWkveY02h1WXdZEKnP9ObAs5c4hRpSWY1o37D6uZ4M7BqSbBEwSWtk4jJ7A850dYN5VH7PBtmF9+eRqIN2exduq4aFAk15vqKAuzPM/sQFX714CapgoaTb11S3LVk3tVMoy+M0SuguGE+074PhxqFyBfYkT7LfG0gcRH+eib/uh+rhfijvSD/K8y1dv6/fdPH/Ugr/EiWlJbDT4L/lbv2A1BLAwQUAAAACAAdkY1RTWhggkoBAACqAwAADQAAAHdoZWVsL3V0aWwucHmlUstOwzAQvPsrVkUiCdAIaFVVFb1wQOqpB44IRU6zgZWKHexNoX+PnQdK24Qe2JNXO56ZfdBHoQ1DKi3OpoLqjHT7snsrhKDcP+IdGktaJaRy/XL7Cg8wWQhwwfjNCe8LhCWUijY6Q4ALUPpTLuBpfn8nKtgzG1Jvq7VDkY4f94x2ta5LGeagJNMOQ3sDqByFgy6DkvPxPIhqGR/OCllSlqXaVNhGL1ocKUInDHJpFNi4Isaw5Y/EMULg1uJpU5ZNXwtt9t8eUj+KDuDAc4bnPAvhpUuztTLHJJ1NmzYzybJhHY1GJ3X4In7XJUMhM8/sMKLDW59EPEAbGzcTKsI0WAbRqYPG9KCDuj7kwKVuwJ4ariCcwhjCLaqaDS5hEkV/G+2ow7Vnax1KmzT3ErbzPruM40W0+xQ9O3D81fdh9t+r6lNoBtyv8ANQSwMEFAAAAAgAHZGNUbhsghJ/CQAAqBwAABIAAAB3aGVlbC93aGVlbGZpbGUucHmlGf1z0zj29/wVIr0by0dqFq7bvWEIDEvToXML7bTsMrPAehVbSQS25ZPkhtDr/37vSZZjOw5dOM+0taz3pff91IWSOYnjRWUqxeOYiLyUypBSicLA1yIxQhajUf050df+dcX0KhNzv5Q6KplZ+aXi/k0bZvy7ETkfLZBjIrOMW9raszxXKVc8PRGJcTCp0KYyImsgMrkkTOOfJVcO5osoFyLjHuL3s4v4ZHb6y/M3s5MJ+V2UZ8VC2pdTgBo5nPWK8yxKMuGx3uKHmVJStQGQtYeoVKbZgsfz46OUJzLlExAkrgrh3gtmxDX8bYHxogGbbwzXE3JlQKfLs/PR6IC8lsXhUnGebkjOTLKCDSIXhBVElqgUlpF5JbKUFFU+5wqANmTOiZGSJBm/hi80l6DjAyKKa5aJ1MlMUBcFy7kma5FljnYYkSteMsUMB7Ms+WeykIpEqN1DAep5Nnr7cjb7JT57fXoeX87IFKCiROYl0KIjAo8aj8d/0GcXT5A0MH/q359G95+Fh7jCr7gIqV1a4Z++T9/9cfjhH2H4zJIhdqvceFi7ZHOxXZQZM3b1Plqvsr8B24kTgEe/zS5/Pr+ahaPRKOULsuQmBtuj/HEKJ0PPovgL3C0vp6BfHj62uAfkSuacsLLMRMKcxxWgeSBaKplWiZiD/yA/qz0w1LwCT13xDUlYERiSSlgJ1KhZSdgC7SVgr5o4AJKGL9oQP4giFdcircCMtQ8SOf8I/q7RFrCvdcXJwcOjf0aWzJbAFHANhWDixbVQsojgoDS4Ov/18sUsPgG3jmcX5y9eBpM2U2UXkdVBGIa1yiCgC7exzLvqCd/98Pj4A2gyyZjWzv0xPmgdJ7XmQP3PfegQiE1xbd2cOCyzYoawTEtgxVJNrl4+P3z047HNC+B/GEiWytbRHlzOXpxfnoCXpyRZ8eSThteNRXeqJ2zJRKFR+1LzyAsxsi8xmJ1VmYlZtpQKbJGDsuokFOkVA94OEN0jjkUhTBxTzbPFxFKfkBwCchoo0B16t+JagzNM2ymjPjg+c6ZtJAGTOrVF/hNFcmEDiSwAQGmexj7+AKsTVJGNROopbJHFghTSNNzA7KlGR6MBemQQonEHGYBDopNvBbZGZ0LzVjqj459ZPzWQm3vqdhyBF4NMW4nCUUOpNnm0V4ldBbbeId1lmVwDgeOj6RtV8RZVewr0hdgGLWoUtBTc3G4dJPBSDZ04WipZlTSoc1AQ9iygIC+r1NMd4nafBLULBl1UyyOuHXfaLkQ0HILU4osFvLlt2xE1Q6ZwJBV0rXJAzpYFZGvS8n90fA6pPU25N5AWS6gjUIV1B3tHwnf9434AUdAXJvb3NyKjVqKPax38/1TKn3ao9PRwikVJFDZH8s8lJEQ4fa33ucsEWAlhO7cJpNZYh4pRm656reNbUbzdZckL2hcx7CDxzwkvDfk339hAGaDYD6XgFWRtlO7m1oZC11nbjMLusTGcawF32WApzkSBJWMvDD4WZmr/RK4DoUFlFof/CsJBeBRkYlUb6yqfEHRZj680lEJDq2ACqfDRMD74s0ceFgifJhNvOdU5GV8jz2a6R0Z8Bq3ZfnyGL/iaNvz206vt+hvLKr7Hsu1n18q/FroqseerPXN7yMdg+cboW1F61m4/oMQGLoK8yBUN0dA3QZ7+CLoPoGw9DG6/UcSvQuMTvOXsU094Qm9uQywaWG1KrnJh8IQQdBezC3L06KfgTrLfdPTdlOEz1dflb7nUTs9NG89yzTUNmE6ECEIvCFb+JvaxK895LJWtAHX1H6vxhJTrtN0gesy4KrGTjBOVUPA2eGcTwuWiD4sPWBZ2hoswPrg5JRxUAG87u1tGIJ5Yem69DJVp/hiT5sUG2qGCPPqrZKzQPdOoqiggd1lbRA5vmGt9MCxRHZxULKF3BPe9N20yt935C5lz/BJdMRfaNkE25dmZDWp/0DQiboSifBG7dqR1gPobKHQ7c9G2caNtV4Q2wRaSFUkXppkG9+eORu0dz+n0aq0ab3WE0VSL12rdHkDfhrtecISCsN+Jibuat9fSRfFCVkDtO/QGKvPN3FfjwsbE9x20e4ZW+Ha8xFfmTkao6X3YccAOZp2zhuPsgLySxScY1UrrWthXtMKY5BxCJ4Wx2Q0qduiwekRAp9o9XYY1SCsAWrPGHZWoF5UTmwVaMk17HyZtibfGq+c3vtimtjVw5FaDurYkdu9xKlTLCu5yJELb0nECHZXBniX4u3Z2ZGnarEEtwkA+tJbxIdQi2s6OXEFHDLK/21oL9aikNBMCwPbSYdK6fwB/h7lpzbJPdEBKZ7sreycEpoBNsLhUG+KQtXTj5Z81iT/ddQa+uuYQqLMeMRASmpsUBibo3ol0TWbBP0PoGa7s4B91ULzUkQYxaNeQeDaXUCBsbTNAm6OFu25YDx1+UIRmP8cX6j98lKKgTlf1sNWnAG7vgYVGVtS2ksOtAVNJbzRVPLMMXdvXKBy+lxmDTOjhNC+h7XiwpyHDfsWTnu5MVfvblJJpPbjJMyCJ527Ptdtxb8/x8PEuF7ESEldK65PV4g0o0LHTAznCP/Y8NoZ6xEY7jt53CXSHDg76hQfucryDSxPHraHahV0NN3XTkx+qY7Mpeb8DsROFTehb9EDNseposujJY5ybLPAeltZxLmlPg9gIABzam6W0pZEvaChXRrB4Un/+uhY53jZ74e3SdPBaTpsI5nB7B9ViaylHEJ8cwjCLmTEKu0MUM7qKz16dn8w8JtSikPyX+K3TV2/aOyF58oQ8PO4R7igQCHfX/laldXfRHfStjbRR9Iurkq6x6hDpWxShnVEtDlbYWlsQke4K+KtW9ZX6u4i1fLVODbSPuK9L2mWwv1Oy3VEfIRwuPq1SA0VmsXPv5QS9d1eisU1/0z/sXAJSq41wNwY7rYbl9cEPp5E7Zt067VzauzmjaXnDvcTtPdCWNmjXS9N4RpJJ7WK9ZekD8hZt3O87QCeuFJftpseWbfu96cnWwfbj/n6yjmn/b4dehbNehhGX6Gvncoo6J08ha+e4ntoLgv9U0vBkxWA5hiXeIBicH0F7Er69L4IhwjVJudZ0d+AbHgGtHifDBa8ZY++T8XQMv62JhoH3GGgHdte9bYftfIP27zbCwQ4+gkPmuqfa8KsKoXTfvdGEjMf408Pvp+DabQfQ78jDQ3R38uTetLhF6efsH+Tx8VEvCTeG6CdS//8w62z4341rvKqh4dAFdCt4Rv8DUEsDBBQAAAAIAB2RjVE7DE9mXAMAAAwKAAAVAAAAd2hlZWwvY2xpL19faW5pdF9fLnB5rVZNb9swDL37VwgeCttDY3TATgVy2NYW2K3YMOxoKDaTCLUlV5TbFcP++6jP2G2y9rAcAksk36MeJUp5nmc/9wA9a9UwcNmteiGBTUb0wjzVWU72bKvVwJpmO5lJQ9MwMYxKGzZqIQ3NytYIJbMsTHO9G7lGiGOF8QufMMuyDrZMw/0kCGu822lANekWsJR8gOoyY/Qz+sl/2F+ku9s1yZmxd0yqe37Jbj5efHCu8KuF0bCvzvtaa6UPEJoLBPZtkkYM4GxlXvy++FMwCdDhM+yS8qe8twzBTKNRqseqzuut0gM3Ps2KFtL2HJE59TzktcuAtAirGMkeFjzJkbd3zbYkdTCYnay1t8RF+pEz+08XUD9akq3o4Zy5cQdoqgB9CngOm0APkB3p3xqln2aQDU2G4WYSfdfIadiAjkytkg+gzTGyYIp8YegcwrdntWvA44zktFEIkYyGSFIeI6sjTdNEr8avzu7IMndqsTPM2dnc5SAY7U5dxiKxddqy9Se9mwaQ5ja4OA8kj7HmXdfgtPHBWO6hH9d5ODSYE/ahZo13ojB0YYGw8NbinLng4oevvMu2qF7Gu1geMiqL1coKRtHFqksYVzQlJLebjqWKFudp45/4kQx86s26qN9AnDZfYvUdw00dC6dj0wQGLG1/WMftH2TS8C+ZFiJ9gxciLaKf5TrTIAIoZQ7S2FNt9hAShu7NwF79FQGlCkQRFdJZM/u6nbTdza9p73fOVcrIKIb0AS4vv3XLAM3O4leFVf6WJN2xXfljGyXIP9tJZvjOck3UCIWckdl+dhT7ZRkXRYzd4EQVgznV4UvoELDbMaXZo5BCorEZzUuwBH22PNc8CFDajrAu3ifsG2uwUJH0DWD/r6CnK+pWhv8s5ys5hqboUnygf+7u2nXh8BujJzi+1pe1S807lC+2xRPlC+Yk8a1trTGIUc+j+1ZEoZdYR8hTMw/kFvMUs7Ul2u979Uh7VaAbB7pZ9BGung+bjrs75ZL6tn+l2JCySu2HHjKSjeE+GLiQ89tgnDd/C+P6v5u1tcFgEVt6gRi258iN0e6WoirZFIrq8PJYJuAfKj3CwWHx1ImMtYXxF9/CFjK/SJPh0XN4hDCODJaA/lakp4M9P2t6hNVoOtB6qcaH7C9QSwMEFAAAAAgAHZGNUWwyFLwdDAAAGiUAABQAAAB3aGVlbC9jbGkvY29udmVydC5wed1abY/bxhH+rl+xlWuQiiUauaRfDr0aSWoHRgPbiI04qGMIK2klbY8imV3Sinrwf+8zsy9cirq4QYqiKGH4yN2Z2ZnZ2Xlb6UNTm1bUtmhku59o92lUeLP7rtVl/DrZ8NqqQ7PVZQT8p3afW1MfxEbblvCs8LM04KZ2Zb0Ko5o+Jm68KFYEtDzulSoDQDIUoPiDVgowb2ngWVy6GIw/NaY2c8jzc6eNWja3O6Ns3Zm1spOJ2u2WutrWS6PEDWCKdX1oQCg3WZZNBJ78yas/V/Kg/lI8ejJb0NcHZfjDTfNQc6LB5vTT5qfip80jN+XnpFnvGX72hIdnTwqs+kfQJ6aKH55+//XL109nk8lkXUprxTKReNnKXZ58z66ZxAMhy7I+inavxLrUqsJe1KIGD0ZvFA9v1FZ2ZSt2qlJGtmojnFZB0JN4k0Cd6b1UB9CUra4r0VllRXNq93iX1UbIlSYi1lOpt7yc6apKV7sA2Jga6rUFFtEwACuqGpbT6VausGvb2nhszx0wHxvVyPWt3DEVo1adLjdipStptLLFhBG2XckqWdquaSD3Bnv2TJZWDWYx+KKuFNHnv7URUuTgTO7mwtYQgN+aUrZ4mYnWaEjsVoBCwFTLercwMq9wevRW0EgxZoLUMpgKEtPyPQF6jGo7Uw2hI4CCJBfBk+0pBtzBaIhj2NMVz+Zkz3SK55AEKBttvAR0XMiMoRx/0IuVtDwUkZzZHmS73gMsORoFj+WBhoODPkhGnuq5NlJblRy8PHtefZCl3hA95kIQiWtx9zErYAhA7+nO3CaElcEEUy92pu6ajV63uVsaYmEuuJ/icLuh99x2263+5Wa6VFfHaWQyiKstAffC9jzjOFnbQTdHJfbyg4K5OI0TyzXM2xy1tzF6jrrdB19X/F03zwZkQYsEGO4jBgr1S2vkusXJzWlbJuMdfyDIpNjpkfXXXbuw7YncXGUJT7ESLYmv1m1NByPiQpWiAV+6IoFLcA+oS8LSY806sYN/1LpKDKcJhpAY/pkOgX9GkalynIAHbU5XBDIXUc77LfwMsTVKOdwBdyDkGPMWwv42sdF3GY9k78Om82e/0r3wGOO3Au6nlGuVZwXccpb5dch3AyTv8WgEaNB2JqtTNjtDXKYjCz8yCU7bWRl20jm2k9tOadglim9esfN0C8PL3ohs3WTikePw3dX1e5KMWfrDjVueFSqyCn4mc6uYum6X2i6bzqhSrwYye97hnMgxBVWdYfRKWx2BnbienF6Lv+I/o1cdBYd8dsmMGW8UxS4iTxx8kfJAcXjIUoBywcW7eFZKnIEvX5ILSSPDG9OpEcAlhYTNTN3ar2jlQgRIFjuDIethVue0p3PePi83K4g9rPNnY4vP7ojlj4s74H8sCH5B8NFxfvZZkMVvBBamWECQ+QVyT7/9dvH8xbOX2Ww+XD1iH41u1TImWPkAah7idW1ushhzMofsdtqreMD44o4VgL/0D9lbGQWIKpmLRBZHj7xsTOzOpPGxbZ6sCpGyY8bu97jtt+u49TKRONZ53knidMyBXY4b52DaSGOhAl2R12WGcv6ADmidOdlP/PJucDqdPnXuXRxUKzeylYJT0RDaQgbjoSwnTV9GYDB4QMqg1AbGlLtloDKLYzJ3lu5e2XqYMlMjIiE2mD7EUz5CU/zhEzQwzbYTgwecz2GlNrSgriI1H9ZETp6mOs08228cBSYQl9lLJ4bby+vrSVQ6TS/AdL5g3mf5ghkvAhM90Qvcf5psQdQCbcRVn7u9rg+U+yKBtJQO4xQrj/x5cd9iPlHDvmOLW/1BFeKrKgFcS2RfSG8ZehM4IQUfa3MrGmW20GZ5QuoArw7OZYJdgCVxqA3hl5pTX7YMu6+7MhIDeeTYnJ9XisJUU1urAVwwxFURtO/3r6dAqEiVt0j7gU8hJO46cRitZqXWsusTGAAhaKxJW/DGUu/2rTNWrhti2RZsc+7SfkhxwAsd/pPj7AvHmYutkcB9jOpdBU1s5qQkjbovpi7rGvoy3ZpqlEjF807W66Ki0xG21RUGA8ufB1LHvUZwpIoDGinVB4nCaHHfKQHYujZ0GAQyPJg8lF9hhURN2ApNtdVetrw9YDxzBkNJoSLNnCKrmitdCgczp58vnX7IWHG+1y3FtkNnW9JGK29BLoo7Zm+sJ1pWV+uyc0d2rGy36p9gwcmKi0p12OSyX8Ji1zWM1WW61ZA/bypEPKyb8MYnElxR7SHylaJaDcdv3XFdNyMVpNQWtlFrvdXrQryN5LxFsAK3dDacYbA4A1a0c1wwj5YKXNCmWLxwSUAR3G6sGHzBkGY2qaPuI0IPm1Y4VrFTGfj2tPQj7fvJsxKNC54fZNkpV/BMn6JqGHrKh7EG5lJoKh6KwUrzWcwRX1H0YcF9BIpUPAB8WZpFueOedw2dDXab2gAJuacPoz5oWdVQuwFTNyINZ4iqptWcj0UcLy5Qzuu6VMzn4yN1Sc5B7OzlfE1Vt8jIe7u8y/NGf95dL7587+Hg/rwDCOcsj6emlE7SuTtWYAelE+cNSO+9LETvyot/XIY6gEYLc1l0gDoH76ALJmuJbM5kE530LF/1CUdcJBAYlRZshWeV3wtSmpcwHBv4LjqLKKeQ+sLbvt1zz8udBR8k2DkldPiMeI2t602McNTXki1jsIZWqGuDZq9Y3i/m7lAmxBhXHOWJ/PBtVR/pwEf1RwNlt0CtFSqgfZFDACsoJqHmvCxNQCoXWmUJ4pYCSwdTOvk466i7dlVN3pJiaEKIFG70msI12yqnTd7pDrcg87rLvDVBiT94Jbug1vsbf1o4U/fW4qu/kbEU/7Vz0juxJKNN6hiacd2RPKPRbJaAxZI3haKq1xP3zaU7h3kdXQXDXAdduCLp2qtjLnzlfB20/NGnzd4afB/qYg/qYuMkNk1Wm2N6IF6zQ+asJkY5H/V42z6oc48e9BJDAD2E34d8aqUdC3qnDkl+1sSAtrOYo2YEHTDHPYuzNQdOOn1WRsnbPoX1kedCjTHqyrFizqqNntC4zh9UoCQ2NB20RlLT+z1Se8giSDHwea++++rNd8+/zi50fMZM9N3YsRKSBe+trukhwS1o3WV+GsaWZR9/pU2aYKDO7zEiUCxjATR9yAXWzC4e5lRAWDp+XJVEaCRTriSfPrQFfT0mmEhkMvBFXF56FigGwzPdCm/doIsh3/kj5wmfhw1N8H/88UexM3IVvSn2ScPxr1R7VEgRKUCiBJSbDdBdKu4iPPaMra53ewcq6Azp4d37+86Gv9T4jSZyq06oIrxhgsrYXpD3tnn2GAHu89k5KhDwf1HWR1SEw1miSZrjIwEFUnc759XoEI/akBHct7DGFpkQDLv4KF0dX+BygFaXm3vEGoBV6ujB4hqPok4GkOdkgOKRB2AbhDdS+gtMvKmfU0PKs/J+qKMhjCf1vud3AP1AfFMj2HAjgsyB80OL3etaUR+QO2SZz6DIFKvWnESpb5WY+mP+eHqudL/gWNfe3grZNKra5B5udsbO98ozEr046yRUq6FdhXSA2qIK+zRioE+9l5c56bkswIn3W70nv+C56Dk7Gpf2iMHKQVx4zIHhXqWcE/bJxLJfYJBKPE4i9qduNVbxVoMeMovhlcI87EhMsmOPLu0pu2YxDYQsadxBD33v39Hzdhy89V4tqT59zufKT1qH625X7Z24z4ANDx3zS9UkVZ6xSj0rSrX1eSASiHqeJqNJHSkv1scuKoU6E0Gk+GSH3Kupbx4/EM+3ZwX9fTXx3DUTZHmoyfqVaaWukAIjgNaelr8Q6MvowNDgDmB8y3FWdqBomfNVwqVG7SJzLdW+0+sbjmm/evZJTfy/3hVcvidIs///jYsCylPi9UCaq/w79wKDFPP33wwMKoFQbLjN9aH50838vl7orwB6Ev+pVj98AhTuLqBtX65w731VWxV/bvGSTma4nHWVqcfly8bb3TL+poQdCL7ga3yVNf7dSZ4NaAQd8R0u+TJXeNheNJpJXErlfjZDJcI4mQ/K5ZwMESKPiLN3nyNtuHHBLBvHLmLHVYxJ1AjP5atbjzLY8sk5R16bY+zGID/Op3cfi6IQ03Ap1PM7G2HYk0VxQlfjxbbs7D6fDVcjfnoCSQX6W3l6+TfE2n8BUEsDBBQAAAAIAB2RjVEFs33ueAQAAIgMAAARAAAAd2hlZWwvY2xpL3BhY2sucHmdVltv2zYUftev4LwWlGqHbfrozglQJMGCtemQpuhD7Am0RMXcJFIgqXhBkP++Q+pG2VIepgdbIs/1O985ZKZkgeI4q0ylWBwjXpRSGVQqLgysisRwKYKgWZaalNTs2k/F2jf9pIMgs7b2O8ZykuS8NfXTLlwqJZUv4H4znrOB2BUsBMHF9fe7+Prm6lt8e4lW4IUksihhK1Szv8LzP38TtGCPTJ2172dkfh6d2C+7uk7Ju/MoWpOUa3PCRSbfzKLg84/rLxfxzY+vR0a3Cn+ueJ4uUbhO1/t30RscBUGQsgyVNPknTLliiZHqaYFSpk0M3wu0tRqxqIotU9EyQPDMZrNbZjUQBfzYI5eVzp9QJewaS+vEUWcNAcISRAXbN1sWDhI4W3c7hvr43//8/fLyi9tHRaUNSqQwlAskBUNSoUIqhgx90EhLZHbUwI9dUA/MOHO9fWTxQgkVaMsgHcNUwQVLG7fLkipa9DEuXSBTGQxUGmSW6ALeuKCWN16yIcBJq9xoZKSLLqmUYsL0IlELovv/FV1xkTrJHocD13Y9tuvWsYai3mcCZYAH/FlwNMlBAvbCAyfHD89abhOurUb79bfkwmdAJqIIUYjMJykpqEl2IextgsZazqyaH1+EztDpsvOvKNfMa44QfwV4eJmPJsyZhswq8AuJPb9gAmmCUy+xOjOWg28hzQE2r7m9kf/XYVOoi5ZFHus8xlnCHZcLqjUM8f5DjZ0Vj6GNteXPagzmgV5EHpSsyhA3MwF3Yd0ymjYRQWPQhkzsX27p+VA3MKobGLnBdNhvNaCNfOw3PMR1A63Xt1ZsE40tYWBrijqDuBcIOye4rtueg6osgTQH9oBsUIi+fi4ZYPqmW7GEzy36UChPsOUh7BANRTHa+gjxHX1YIhwtjxrBWia0hBjSsNYqc25CDML3pxuitFG8DKNhBzm+HfloxumYlyk8X/EYdEYabttIh5ZHWe2ggkGs7ZhxLK7r+smOP9cjPXHHSIsnZkXz9B3h07Gj33dWT+HD0WuJSNP0vWJlThMG/4V8rFvHwWbDttGOsvEAtMEngDP81g4sS1Qok2bj0Lfzakp16YPvCw0LMOja+QrhE4zmA/lgyhD6ZTUe2kGJa7wKW8wV6jj2Vq/VWmD0dngiEyYSmbIQU51wjqMjpw6RLR7WeLILoVvVdo4Pm7HT66XtyVyHmBEFEyg8PnEaFvsXEqKrrQi9FBcjNm1THPue8D9f+YgFR2oZMQpud9SwkQgzslccdkZi8Kar1qzY5qyfsXYSDSlfs6soczuzNFzzWBo+g2zb6SfQ6R82tWJNe2vopY6Ibrll1LTm6ZQm5G1sd76i+3FKF17dNHUcrmf4PSbNm0slAja0C02M/lLnPNp4aLl7YQeOd3KMHhrdNRM/v5w8v8BtOe9OYL/VFm24kXeMdDfpsPcAlvY1ffcef90tP2xurfZQrCsHUuCTkFnrsrcDicL5sMK4Jw1c/WH4p7IyJMsrvfP4tG+I5Cik/VtY0LvH3/4Aa/8BUEsDBBQAAAAIAB2RjVFpKwRzawEAAKECAAATAAAAd2hlZWwvY2xpL3VucGFjay5weVWSPW+EMAyG9/wKiwWQaLoj3VZ16dClVUeUEnOkhQQlptfTif/eOMDdNQMfr+PHr5103o3QNN1Ms8emATNOzhNM3liKqm3JOCvEJrsgJ0X9/hvOQYiOCVKeesShMwPuiA8WnqMghNDYwWwn1X4XnF+BxkCHXOZlLSCuLMveUxgUJJAUSU8MaJ0ltAQnMwzwiRsJNZCDC5OWx4tVIy4Plx/0S8UIj7BqiWMCUI/AaeqIwAFQVkPaD4YCxI8QO93q1pPyagT2WsNbyqSeyzFlM3i3jz3U8BSfxioeGGjjsSXnz1DE3tU8EGe3s/fcyDVayr399D6ZWOU6tzSqElSAU7eOiRd7j2bhENV4GD6gbnjsrMujd/NU5NuevLxm6Ttvh/0Y5ZcztuBQtWNvGekGFNuxGHuM/mu4LFLKTHbOj4qKO2hZAVp9yO9KxsshA2k3k+yGOfTFLRSd4y951ZIahn+Ydfxr7fz1JeL+AFBLAwQUAAAACAAdkY1RAAAAAAIAAAAAAAAAGgAAAHdoZWVsL3ZlbmRvcmVkL19faW5pdF9fLnB5AwBQSwMEFAAAAAgAHZGNUQAAAAACAAAAAAAAACQAAAB3aGVlbC92ZW5kb3JlZC9wYWNrYWdpbmcvX19pbml0X18ucHkDAFBLAwQUAAAACAAdkY1R0OnRbl8DAAAUBwAAIwAAAHdoZWVsL3ZlbmRvcmVkL3BhY2thZ2luZy9fdHlwaW5nLnB5dVRdi9tIEHyfX9FoH5wDf5AE7sGQhyPki0AIYV+O47DHo7Y1rKRR5sOO/n2qZ2yvFNjFLLY0XV1dVT1VVX10nnrWsR3JdkPLHffR9icKUUdrKI6D/LI9Ddo86RN+rJXad+Mw7mlFseHJSSbd63YMNlB0rqULUwqMY/gf8tl9wdtT5+rU8pIujTWNGrw72xpnjPNMx9SbaB2gbBzlV62FlW6BStJ5Ee5nCp9P3LPXbTsunztcXGprOrCM5XzkmnQknzBdJzxrIVXLYLHBi6MODeBopWwkbWIgjQ/1buWGPwtrB6a9i9ToszwZ5e0qv3Zn9g1r9B0V5rGnHuz+CQTQmHwfyKU44WgLzpn72nl9aEUrHM1yBR601xH6uuQNHhydV9/H2IDlm831y9s1PTYpLDGEFfVqPmgobnSfgfnXwCbm7k6kGDwHKLlWjw76+CfS3kHeXL3M0hJUdJdi1s37rN8V4cCNRYGmj7oNvBqVG4pV8h7wGCX3O3rXiSxi0J/6SVJWxnViashcDzkotQKG5w4i5v49wyBMfSMjGcoktIEewYpetfWYEOGtk5dW1z5Q/VEUKTGje74E6cqcTkn7HADYbA0Do0fO6nsUgivR0MoA2yWgaYsYWmQts/asTUMNI7KZuC5CoveXybosRdLrkqyuknputSSySAuvm1tYMynJqvidrdgqRfjLgj7v4G5uzuO/3z/s3n/+8P7rl2+fSoE9zp9u89M71Lx+vQbrH3zcUhPjELabzcnGJh3WsGkz5KxtJB4bG0LisHn75vXfqqoqpXY7jLfb0Tv6r5r1q5ZUGR1i9b9SD0gpz+kgrD1EQVpqPkJSWZlp6q7OwcPs1yRDQDskjOwTy/XRlmyQadg85esAk+eaLdEDrNenTm+xDuiI7VQvKDBXkKU8H52TfleQZaJSvpAAh0hhRDJ+wdifCYmUh20r6OXUOp95HmGZJ8D1WLt+EQF2ESEQotuuFWrPBWv6jJgtpcT2WInuvhNlbvYhh1WgeOFvl56A7CcU9pKr/fUbNtHz6n7pT6kuAoBuK4uV12eLNcyrcmideSqLAW9wweHGLt5NyWQT5vF70YyH61XFJs1v6ZesEoYThx5erEWy8uFXwm23pLNuE/+1LS1/6vtCeJbLubxWvwFQSwMEFAAAAAgAHZGNUfmiZWpnIAAACXEAACAAAAB3aGVlbC92ZW5kb3JlZC9wYWNrYWdpbmcvdGFncy5wee09a3PbOJLf/SuwdO2GmpNpS3LsTCrKruPYiWsd2xs7OzPnczEUCclIKFLDR2xNKv/9uhsACZCUH9ncVd3VulK2SDUajUajX2gg6+ziWuRsKmLO4G9UBjGLRciTnEesTCKeseKas4Jn85ylU3rYWwQh/DmWYH32T57lIk3W1tnQ2+qzIIkI7NX5aw3jsXPO6eXx0f7ByfmB6jChd1maFhI3UJDxRZqLIs2WgG+aZixM54uYF5xFvAhEnHtra9MsnTPfn5ZFmXHfZ2K+SLOCBZM8jcuC+/J5bU29j0RelAU2xd9ra0W2fL7G4IfwSKBYTLw5DEskPFtqhAe/XgCxR6cn/vmHw8OjXw/O1/htyBcFOyKAgyxLs+eMrbNFFszmwXOWpEDvF54ReoUF/qzRcxsdG7PL28utKxroLfIDgL0ZL/y8nE7FLc/d3hW1jXhMiBTOMI1jHhbA9Vy/itPZTCQz/ZhWXyzioAD8c/2ccf0pL7IyLKqnZW58DNNkKipsN0GWAPJc8d7zi+UCnvUQL347O/D33x7s//3o5E2fhUGO3J/a71czinDaGF36An9ei7DoV0+HWfoHT8658ero1PgMghpMYt54A+JUvzkGcaifThfIxSCu35zz30uehAaOi3JhovyQQAv52JMze7YsrtNErQOYVI3iUiSFnL93QVh/Tfjwuz6rAN6ABN4BsraG8wurcawnGsXkmN65vp8Ec1gIQM3RycXB+7P3B/DbP397+v7CP9l7R4L2lbpxFkSq8xw/OX2ckjccZF6Envw+rAHChdPXjQAYm1RvRJYmNaSo3n+q3n0C9GvfsAOYWf6c5vESJK6PYocD8kdD/9XRhW+QDGSC6MFCvM3FH5y9GLMh++knNhoi+PHBm7393/x3eye/HR+dfPgVPp1V41pn+zwpTs/ZLrvZZDNkJmijwS5zzw7O2NOff+4RmDvss8FuD8ibB8kyFkl5O9wabCvqKyQ7FpKhQrI7MJAMm0i2mkiemkieKhyDUY3jqYVigOxaA6V3NFWtOKwPFl4HyYznTBQ5mwefQE98kULSZzecJRzUdJGyz0l6w26ug4IUaozrb53NRVKDwxLOgfUptgqDhE1KEUs9XSnYGBYG6uEgjnUr0Lbr7BCwAP4+m5U8z+tursXsmkMTu585vC3YBOxCkOflHLQ8qA8Rx4BowtnTLdJ1BbRDGWansEqk4g/CAoxPvGTXwWIBRqPPykUUFNJsRIKUXUBW4UYU1/RWNmFfgrjkHgjI3vmF/+b46NW+/+7o5BSlydCTXsSnQRkXiMqNg/kkAjX0dKvXkNB6yc3sFWmiwuUWFbhEXUdBwFq6dGiC4JNDLHGuYEGuhTAbObsIZm46+QQIetL2OI5Df/fQ4mU8B5kJELk2skUwY0UmoAtiWABs5zz2pL45SvIiAM4B1zKcwCQXYKlBFMR8XhaoAJUVLiXEdZBf41uPHfwOHBPFEuSKh5/RXpClArAYZCMvF6h9eeRVNNIH38/jtMjB1ILBcnxgD8+AaPiNg/WDiaC/2tLQA/bpXK0p6zUFHCIRhe+7OY+nxGKNAyRlIvqVnVIMkmtJzoyr9Qb96rGNl+wkTXgFhyg9kyyg03jy4vQG1GSvAQ+9Ahz8XvG9JgiA9McW5Dr4TxzGhqMF9sDk4apdshxYC7PAYz6HmUXLHoBVKC5BDq5oOeBi4Ci5IOIR4+B6sELMuTl0XGcB0ALmHhaGVAEfPfBmPqUwOLf3kc05aNsINMG1gPbzYIlYERhQXoP3BiKBXpuJFPrAJcwTloMaQKMOfSyCGUfaQRF9zknewMX7HKDekYstmKH2KdA/mhFhBko9LI+dZXwDtUlZSDAulya7BtkEy59GJYpsLmaJmAroHRyNBSiwckF9Giij9AYkPOPBnIQbtEiWe43ZQY7DzOAf120JQL+e435jOnvKaP8NKFrwrFhWImq0J4xdkkjCB7RV3wB4mSVtEVzVCVD0ncih5SqkemzfiblyEY3Vyn+v1moKU5l1YVUaDXFP0jSuAMD1S8CnF7AKpKJyCUUf1aCBx6DjJC2O0AzhauHRWpNM12ojp7tenmNJYfWmZ0GjJpQtaMFrYHhYBWcpEg1vvKzb9UyOSR1w9xQAlu4pwMYmMpir+3B1TKfz9dsG/XM8ZERQPG5lmASgWfoeCl58xSbf2N8YffBF9O2lRc1YCpX6ciwi2QfaShLlIMu5DxrHLSphMe0AdVyFAaR5LIN6hu1z0j6wTL6AYYzImLrcA3/j42I52kjAdmyA3/Wxh/ORggKcEj5UtaAFASXTgpsri/ueRie1JYJRpPp7KdDoRqDiAAv1mOa5mAiysIX2k7B3tLCECPUjmPtcUQW4PIt8UrVjfK+sjDF1OVnKvDaVCAkNvHwBPbrOhiOboAI3ZRjjSgOLBvccY2LJyYD1gZYK+uiE0XC6ex+hK1pWNtHD8oIoctERWm37/Z4cgRKmalpQFnItIT5Go/5nvrxJs8gHeQFvDFX2tExCioT67DOAQIO29PSNOARV1pWtvPQsvALzByiinOwZOGZqTskaymgPnPpdnHawtuB7o7Eiq/cEiXsCvi9TBG6kSby051ipR0nk8+YKOgRXTPoBPAbImCeuGg57yQYM+O9gH45UsUkLjXz2FunClYB9cpZqpQVfg9wk/LZwBfJNNQB6c7fXq+GyQOScXQDvKNFh62DQNKADZkACBBMlIFuAJQChVqPGTkpyfb7+Kau1kTFFAGDqUYMBkp5LSfyVnnTMisikhP8lyFyJBEHGxLDOucZ5pQmmkF369vQFMkSqDemhjOuUh9fRUU9Pm4SGxYwIyGIgBTXvZZAOocaknDX4tU8oAUMmyEF/8uf8CWIqUb77Wqj2Xh2RXlC+nEjCNMuAszCJSEg3w4gqzacEOR1D+IwmBCTSlX9WaVKtwrUxImAPlH8cgNmGxYy+vNOr32yoN7o/WL8jH0K2WPDclSkBX8WCzT6tNEn3wnuNKxmiJ47cRuWp+KKjSxWh5Kg2Rko3Y2A9eraNES6biiynlJt2JXCFKBwjb2ivQzVmXGENwmmlUQhFQV7r2zFzR302rJigsibIDGSCX8foKwXUYoYhqpieuqQUCYLXuFDVK2JqQjD+0CpoagThpLUykaeJHDHShbGbkvkKo8YEUhOlhYH68vnwqqe8AZBlDIGWc+wnhI9lmG/DH8VF1Im+hmouU+ds6b8+ePXhjSN5IXGCswP+xTRMS1AQ5MMHRQE+9xJsmwMYirQIYg2gjNo6+0UkEBjkEB3wPHlSkB3W6Cm1oWNaYoWSFDToRBxpcgGRkcIG6g9MC2UsIDCJMcUivYYJ5jRSSgt6Cva6KBb5883NGQy1nHiAaXOxXASbC7HYFHle8nxzNHo2WqfP8C2K3sZgdzTc2d35eVgNGbpEtvmRt1hGDkpmR4ZZaRqDqzAY13g0tY9rcRIAVTc9wwTrqXGiyvoYUvWCJPmZAU9dGbPdmtJfji7e+me/vds7Pj7dt+bVpL3CAFTZL9QAbCfB6NCZOya2FrGjhn9RJiJMI9B3mDPsFsEPJ0f7p68P/POj/zxoUaz6sdGM2TYxvuXJWGDmXKjMpfoeMWzdDrYO4cfC0eEc6fVUOrXZp1kz/e7XNI2Utsspg0cZmzgNIuZIne+0ZdozEPzC62YqNZek7MP++QaNtJoA5deiDNfNySekxFzkOuHiq5qR2rKrF2OtmnqV3oHIKYdgtebkVp1KN1F9pSF/+6oJ+fYV+VL3YLGt0V1f8mtMv/vVWMb6Q594PMZftQnVKXz8rUwB0qt0ulbp6Hm6ShebVmCME9+vFbreSLi0FPtVxYaV8HrPgpS+0vrap35Mo59+ko5TDU3WtWl3PM8jO6M3RtoR1G+Co4yp0CVX+cd9ZUXNvJq0vxcakBKRlEOWfW4AE1/YXHu58QKYAb/1EF+uhkQT/yBAiue6AGPMV0MclrB7cCN/TmPc7bT9jZxSUejmk/NAmI+mDWwMPXxMZYViKjAnayfqkZHgIsMa2KgCUnDzclQaMuQD/j3BMTzB9+j96QQhNIrqXp8g0U9wrSpoTO3qbsnRQQjwKqlD+LWsEC1xSgFGJe7gO4E5fdQajPZbkU5UYhhTqLB1wmeCEoS204S6E7XsiiDMMdeNU0ViZtxjc6/WcQ2uyr0g7aCIZJqiU7LWDIpRcYIWqfVEy6cxsZJfo/IcYir9opY9UlFXh09o627lVTW9P7NV09Zw8AQ7kVzWmgL3+GAZufhZ+z5q7nGKjMmHqCsWoSho1ySJMO0LEo0LE1vhutUQvortXQcRoQuPWMxIvdoVNwkDt3+efuGuicYYjNwM/yeGH3Iv3DbpYGXWbH2mh1a/ABqr/JPUtb06iWEkJOxMRXcGwu6eZJ7dl2/QkvCAOEZ3TvkcYGULteZtjf0OYntd1ALqtfu7oal7fDd1F98xaNrRqtYm9JDhvmRzdQ2uQPEO+vhvY/DgzFHbI2qv75bD0WqDP9o2N3RAk8ytq749oF6vha79ZoVAtWe9TlnQzjpy2W2aYdsGV/Ge3JNamYxwzk/BRDg9Q38157edAKA1K0nSFNVOjTGUlc6GSd3/eT9GseBxfswLA7rDhamay6VJWRxteoMIDS/MFe6DBzlZQENva5fgcUbWnMduI2sQbBg2ekkJOHuHlF4Z25oKsDbFJqx661JuoxH82evW8XCr0r00+u03cF+Zstxhi7WNtdbSdxuVbvMKnauJUylV2+BYsY80m/+rFkppE4iDzVnQ+vfhyba2tmmslKbvC5RHPA9h3JhUARGslsretFCVgehvwFKp3B18R+4v5b3r6hPbEa2qBBM5LfAlDOuLSMu87p4qIcAZtbzpViZdemorvDTJYWexXB2w3p0CkzNdoyFaaiT0ODbabNXyfCdhlUk1TWnLjG502dHHj8m1CFSmr1ftuOktjpj/kGD3URbl0RbiXzIDuarLI9FCTS9rLDJu8EDu8QQ6sAorEYY2crT3m4vF8qcVQaltSPRGJI4HBoJS89EA+Ijq0DYQBm5o11wL/3p09b2K1Uw+g0SvUlZ3OJiPU5iVvmk7w5oZnRZwlQ+nsDjAVOdHjOgOSlUfSqvPA7BpWXjt4i8wjrk/Gk5EMe6ojrx7i0tv5FS1FxJRa3sR+6njX3jw8iLIihzF3nUWi9AMCvWmPr5eMxNljhg923HMQUwEluf5UhPl9bDDRUkDbFJfV8TWRV323odChcGxRnKlCdcvMM3q3D7b8Xe2HSuAN1LGg60+2+4uO1FRt9GbRznUyL10cLZjnK9pUAB2+WE0pKo+bEBpWosO4sn/IBXQufxwBw0wUxYr1tnF6evT5+xEVYqGqO2CSVoWbDTcAAFhZ2f7cgFiS9CIWVrOrtlgyxv+tWsoL+VQnvaYsUAePT7tTkne3jWaboYqKnYez9BOPpr9wmL/6gTZXM65kq1vz1cOoUwEUhXEQ2cVNoWkr0Skr6dJfqD3NM0P6UV3okskJJxaibgQK93p2sYbyaGPzZVYmdp6SYKTYNnqh/mPVAGjq7KMkAuoOj1He1PwuWE8Pyr6PrIqsqE6GVbcpBsCYOWGp7LES11TKLFVydWU8FF4gNXCrf492ReOvtERIts/+0CMge5CPE3yEHyvUnAQKkw5U4XFugYIZixLF5nA1nJnXs2nrLYuswzLIjQ3TDZqa0yK3e8bS6EuQMUZ/oIlqPUEihm4c1xLXmWzmpFUbfnxfIbr1LMNAii3lufBwqUiCYMSo6xHesQ9tVbzTtzqk2lgOoI6Oaja+FVGogO3ArbsFi3+rR6eENBdY0BhqqMBAph68CwTOAcpnsVgIEEIQXW3Sx5kEKpkPOZBTr6hgpiU8wWnMMVAo2q7q76Scj6BuEiKtJ34x3A/iG+CZY7q9CHptDoAWOH8Sz/V8OKQERYyC9w2yprlDVNt45SKws5+IcVWI6TYxtLO4ak4BTpM81tfRU7wF4mFv1bze9J6Msyqhjq2Bty3KRlbTx1pveZCwWKOtrSco1OEKofCgXtEBgUlr0Nf1pyK9VpKpJiYJyZkiT4e4CAEIkLk6vBD3pAaxL5aajC2QybdLzUWIhj6/1+haYxUys/Wj5MZ0jurPdH1WnQYtJPfo0JsBpxEAe4e0mG4KhmiJMzayN9D36Sqb0ElAzpbVtfTLuBggMcw8xS39wF2BWoDoe6E8VtwwB+kqAY7fTb6t36yRM2mE1djNzCJYAN4sAL4DjFtN8Cgch1ro+dMHTbr04edrS0Zp0FQWJ0382sJdHVFJkagdOxpVVKxPodjnle0S/nAs/HlATZVi2NhdKv4vIZ7YXd6R0XsOtvHGi8Zr9CpKZnMqYelKl+kEFt7mupkqQGKejn9XdZldxzsrVMnuJFJQJZjAmPQlWs10r5xpM9gcbMmGmhHl3FskON1Tk1rki1Wkcq336DrQL6SLRnmExCu+hdyP6JdjmVwHyfWlfB37WOLqU0I6kN1yrGF+V7ODe5gXRd5XVw0cbTG30kqHup8PK149vMHkNtA80CKd7+T4u0fQ/F2i2LV6CKrK5ItyvWmZOd+aDs/vK5OXuTqTKwev8TSxxwEFeCprFeJ5+4kqGeS00kDbazCR5dSGStAkLzc7d01lhrPw8ZUnVTJxDyQtw3IauXqAGhXL2psae6p7uzYcd34Bpf17yWEtBBLY4ZnCvEebdcECZMD8l4fH3sQ0D9RBz+pUCoWn3m81ENIcbtmkqWfecLID8hzOrFL90VAJ+CdzpZUwJ5Lt4MS7AW4Q0EWAa5Jhqd1JbIqiDaV84qyWkyobqqKms1JnE42p+F0EG1tjSbT7Skskq3w52jr5+FgOh1Fu1t8MBjuhsFgsjvYPBaTzSpQXizXjwe7TzeOB89GbWNgsst19s/9NycffDo6/M+D91iQ6/SU7GBCQs0AMog59eFyp3aVGnM1NtE3I/VLXJobIE4i4dGVMkLP2eGz4cBah51kVRDGeY4c6yubJBiqvYL0++1IXcGrMN9IK8grCOoT+4hAWUl3j7qE1mQp+2wPRiQmZcHV8+m5+lDXBvVWMJ8WX8dIZSnal0DEdFzCpUzSJIhkTqXneTXzqzOEaqj6WIRyOO9cump9P27lgkMSTwLwQx61dNXSszB1eSgS7l6vxBy1ol71sA+r26VMn9wESehcvTxEHMXpgifuyYfj457chQ1k5Cq/UIhAx9OZ4DygkvyjKV3YQnUDmMyBxv2qylARgkeOqQYNIVS2q8KGWzpZOsuCuaM0yE2w1FcRxFxdWyCSz6CmIplGu0mzz6iFpmKGebm0LBQ2ediZFmFaohuYhqi9zCsEiN9Ky6hWv0BoXeaFVHeKUNJYmFwMYsyJcTwXncnX/JaH6iS9WkiBQhQtgQ0ipH6I4sgAVoPDUaVhCNTdyNpPnH7oPiay9T0Rsj4vQBECXZzIaxByAWMoKM5RU9WTm+dcLiiI1Gg3Hk+e6dlSqw2RwGzLqxXiZR8LOTGwK7R2DlV6Cymh+cvU6BQe6AJCRjoFKRtUiDFpoY60K5GuzneR+seNhTRR98lYRGFEqENPmjNR4HFPkjyZg804MILLvUuQcuJ5oUm6RmNC9fQISGzC/VIcSR/smohlzpaEu2bYnAegt2+0/OF0kJhg4YG8AmMCTXGUKEGgjvl8UXSEDOt4Lhn0AS2ra04U32QpDJ94J1Fh9oYUu0xQCzSkCa+1kxJQqn7JF0GIpTfthdqVzVWrX3HyjpVvET1LSgq7bH+xTYbXBWj2ayt1Kzm2nE/SuDqIQ2kD1JjVbPY1Y3BW1SpRcyoxGC7aCl22jzPaRaK+7mCFeR56T6Vq7Wrr4eoANtdTEPohyJi/aCbgAaILgWkg9Y4r+DfLIduE3yNmHRd9rkPdxmF4K8+Pe5+tRLqiwEzDRxyXgesEeShEYxPIgKuqhegYtR16G2CrjgN2XU20Ls9U2x54S7uCHoCpyPiM3y7o+DQoKlQ21RYC+JNhgFAgGjd4+QMs20jkIa5wXcuwjumlCFTFpzL5rKp/6D4Z1CIsqKqO7CtnNjbkupOg8v4YhQ4ND95bwaNNkEsUQ7O8SI5Ingw/xtxK+qSqP6q+V5hKTJDZ4UdeidxwawOjIW8wcHrysrPZ9cbo6bNnkk14hQhoL7pBw80c969nLyhl9PJya+Pnq//o/ZdHr3BQ+pVjbcJYpX1z46yWupfLww+NA6cH+kiuHTlRtnFIggqrLdHXCnnUe9+xceAB3+fsz7nD/mztTllQ78sErxX5RdJSf9drLm+5o2EKLu42uXNvlqXlwlXX5/R6JHvGa9pwkfVKfiMMZpdXtRRT+UBDgq3zw41MVJfT17UARNN7bKliv5mV6VAnK+LgRmrZV/GbnZKx2+pNYVdtEXXtmnW3uFctWEF8e1SYX1RVgqj8pdGWBUp1kIfFRJigpF25gtFVdqFAXwEcwKSMg4yuR0gBF7QD2Zku5capuQ+rrkHKSnlHjemPwfJDbYA+gL7SClBF9cnhwnLSJrhPo5yma25RJy+eq7tZW9dmUjlyVMOo6uPRXTiWqRRpgEp9z8TB8aHah/fUdU8+vDoEj/ktdMwz++anOu7liXcjPosFj0TgpdlsE582D6qh+qALfejyMz0cUg/riNa/JryETnV4lEBcJCK7387oS4ce+LOHKX1qKAeBtzJK3PI0dVomkWe1pAeA9d/tvTna908+vHtF97Zt3e4ebj/d3t/e0RD7x3vn56Mh7gFYr3bwrONQv3q9d7E3PD5/ZYLRu3f0TsG980fPduBxpB/PRz9v4dfV93vv38Hz9pZ+/lXutIzZjgI5RBB/79XRu73zvxPBh4db9NP4HgPQpwSw9bQb4PD4dO/Cf7v3/rUEw59tACO4jruukK1dd6gcnV5OlgXPr9o3WiGWMsFbmNzpvGgk6FpW27xVBn9aZ3nwR+Vw+z2s/SNP3VM9dGb/oFtJuYerx1UtYEmFePKVqOo4NGEQRzrUBlGOpcLF20eG8EdeO2GvIK9bvm3sSmvJYdZXCNEdN9wnVePPg5mgI+xy5M5LfZgCf3BTog38p7F82xT6RkL/e6i2epMLuSbt1R2USVhVrf5Vk6dWXJ9ZL3a2v/1oUqOgCB5IKYE2CdWLvqZUL/kfTmrtKXRRa4GmuTx9cy8ggD0C7QL84LGxknZrOGk0fCxvcV68dbqZNx6zJt/I1jPn5VuniUoQqqPHozpqofqdUP3j8aj+0UK1QAZoArtl2cCnDQeh08Q0eauiOK0jFSNbU6Du9H0AZGtGNcEtSCA6W7bgFi24xXU6nT4ALn8g3DSWd0PdS9+1ugnhviEvrtH/fyhsUs4fAJc/Amf+YJxgMZLotgvU8O7xQrFrpQzuzOfa+uSqnUKhGIlySVgkX/uefeZkE6eHKdOprajqvtHTtzXTtGdmVcDqN5Pk1RVL/QepunZ9djPzXVOj+SNyX24tB9n8etrNn2oHX6bdNqZxCu47nmWjC2PpBm4ZUVZ+MzqNati2w64TI9Kbbvi9OabLQy9Kw9wDemjjR1wLcKK2N2ebQQDkj4beIpqutVnbnGgdPhlQreipVUZQ7b7XrdrqyPiuVkpm8790ttfa0W6udeRd7StdZTcm37bRrnbZLAxSQ/zFam75vdSs1+zBdn1/QFeGh3xfjw3Ihg/XEF6x82znHtn9t7RApLSaldfBF27s2RvlQHiwsuucho4xKg7rql6sd4PV+2U3dtr5kKa+abXEqbyrnZxqcyBd5fQBvqwK6Y0PMZ20ySFKvHW+1cdU9GDp6JKqi1gx6PpUSrvuXV4WkhcqtSb3yqvLkzEJCvqT9tTTqZ3WAGlTdRtquyFN/TSOZKYFY2Xz1mmC3LF51zxPgGz8ZsaWp1RluIlfyM2u9C5SFT1Pe3WUfy9J25IiVcle1XpZYD915dtkO/lyHtz6dOE4nu4xMWkO6+uK5E1F9jWMQZiluS4JsUpu82ZtQZ6WWchvgoxThmVSzv4QcRxsgtN148OTF87EX0U0Hm7vjOS60TntV3RDelBdiw4Uizn4K1Y6Ncf8E+Wp5WamapuWxaIs1KZbkiaYirLuV5dIyI5ao1ft9a0z9lxgSjKMS0plIRLa3J1j9ihbNhiAe4ua0Z/MU6ZWb578svPKBnuadALRmmSjA/BcmtevXxpfXxnHBCvESJTdi1VbV32lqAStYbNDvrf9sLlIfLk50IbG14YxaxawyYvu6bLfTsnSC8lePLdYBOytpGGjLukwxm4f/DUGSjn4GkFHgW0z/+022NQ3+7DzI3ihyNgsT/z6zTfuzfnJrvy0moo7ikcB7V21o+aPLLmVZWTVhZL0iEdQglmvMSFv6336GHRquGR1dV+fWaVz9uO2vHC2OQabeXiqs+s/lWjTLTv3JQM721xaqK9aGO5iYI39oXy8l5c1yipCkt3Wh8Mec9K0OmTaNoWyknbcce2I/d/u0E0m1TXlvfqUbuucqphqpCCskupWWb3Zs1M7DI6xvDvQaG/hTjzKpSEQv69PH0k+q6NQPnB4UN8c9GCfCn+Mm33u90fsudaXAxkz37xppp7eB943s+rOmHsmT28y20fBH9ZlXf5I+0arjg3Sji5tmYO5ri/jNE67V6V+8iydS1GG8zrIbkTSdi3to5F6y2wlGtrp6XBQm8uoa++t2j5rz4riXPvqlS7e6QIDPWZdCosMo1qsxiaZdaWN2dBKbqjbXzCzYZev0X9rclchSqMgRAb4Hf+fkxyJcU225b15TUqMkk06TW9T5fas/3RD8XbF/3OEgipvbMaqQroxuc1w7Y/qi4ZWaru7+G9UCTxoCu670aeDwMbFPrXNb91wWt/vIW/8UFecGpfz1BvMXYc2sQ7TsvurTnc2LhbpukLCvpnaLsG0W684Y9K+uKZxR7W+VghPq1KgphHp1YUnS0gj3TvDq28NMee6cW2I+n95qirH7sknLFg3R/fmaDmpUNG93vkiTfDcdArrSKS0LS6hzfpJ66IKihjmaU7VM6q4j4pDg6R4nMBpJhlSZnR3zx1R1fUaCo7uaHM6rZx1j2otlXcZOFv6DFzW9WUrUaw1KWjcb9N5Jd5/A1BLAwQUAAAACAC4o4VR9dIiCEAAAAA+AAAAEwAAAGNlcnRpZmkvX19pbml0X18ucHlLK8rPVdBLzi9KVcjMLcgvKlFIzs8rSc0rKdZRKM9ILUrl4oqPL0stKs7Mz4uPV7BVUDIyMDLQMzTSMzBV4gIAUEsDBBQAAAAIAEJ+hVAg8PLYlQAAAPMAAAATAAAAY2VydGlmaS9fX21haW5fXy5weU2OUQqDMAyG33uK0CcL6gEGPuwGu4GUGl1gWkkiu/5iV8f6Eprvz5fQumdWiLzskQWdmzmvkJCVZgL60pQ3xU2lhfcT2UIlyzD85vo7L8dqmUchTaiRPk7TGCtrfJd8C77rLqH9YlLK2+BFM+OofKAPzibE7NVRymkR8zqaz63SX46bA3s7ky24ek0IDl+C/6ycfoIPUEsDBBQAAAAIAICjhVGGsZywmS0CAF4GBAASAAAAY2VydGlmaS9jYWNlcnQucGVtzL3XsqNKmy16z1NU7H3THTr9C28U0Rd4I4EEQgi4OYH3QgIJBE9/Ek1TZs1a5o/dsU9FzSpVkkkmCHKM8bmC/vc3te8fSbf5xhv/LddtGNTHIrt8s9r2/o1nv+1/bLwM/9UH3/an/34/Cv3vb8dHWCbR/d8dvgvCpN58+19/HPq/lpMnXRGAwziNERSMoRSNEwwFUyTJwDCBwjjoowvEN6m4ZEl37YoLWAiWbHBiQ6AbhNjAzIZANgy6SZBNSG2IeINRGybdhMiGpjYos6GDZRqFRX4+BzgeRhuG3NDhJsY3Kb5h4g2JbtBgE9AbJtjQyCZ9mwFZpgrwDRJvaHTDRG/nQwny5zMmrxMh8AaHNwm+CcMNWGdEbXB0EzGbBFvOGGMbJFnOu5wu2OD0JiQ3JL0hXktJqE0EjmKbCPRMN2S0nBADQ8BRBvqv5RcnyqrxjRctW5VUnrXFVyukq6oQ2zzP1mjGjirHZuqOY1+/OOl0D0bCHAXT07atr+ZDZLCmKHEmOzqzuNPZSoZY5CRyuc6b1ekp26zLZYbDsa0tinEfoloeSsbVR/EsvHj3CBWfosDu3/r0NodoAxRiZmbC4lOeWf/tgG6L1c+DTw0zxDwnmDabSCNM7AWW0AXxqZfsCOkCF4DGCTSChuzVuLTpUvTkZ1Z7O6lns5Um6VY1SqMnOKa5FZ+cEspMAXnnpx2c44cqE+jONXLdYkche3XaiWN8DFEGVkWD061+lM1XO5hbew1exkKvwZI2vF/KmGViobOwzB9v8lENMcEUOdY8sSyucsLILse3bAtutikEwiPwoTIiSxxebdNheBa4Xgerq6qsxVu/axzRPDK0fLDwJm7m5xzPz7u6XZFG4ZFBNzWsHwxX6DnBx4nsI1thldaGt7oOO+VpjWPxUT9xp4hChMeTp7D1vj7SV4nBZcwxbH7vVsZMV8oVQs5d2bcV6ZQVHo4eXch1uK0w6Yoc8VC96M26oqeHyxTp6XjQNLy+h1Esk7YlK1YJPkH95bTPH5lf3J17aDi4dD0XZJRt9/th0jjjECFHW8RPpEyNibE77zhvImL88USfdFYFvQadUNKcLz0W7+rRIsTidNbPSUA+u0pseD3zt4wk36ry7POdm832esd3XMjVwjFLJIIxaIgppJZaddPpyqwrQjiwmQ6eZLk0S/BIsbgMntRYGEVuPZri8qhzJXtYng3FAv1SWoQ4mxVYU1nrHPzWOTPPHGdlCeoFlom6U1ubOwwWZ/vYrtczc5xZg8uqW14VMjPCHAS+Y4ll9zx4SVjkcrikIoPCKrqmdrdiKG1pK2yR9PDsL/zYDWaTnCimc2+tddyFNb/dz9BUIrkdGzIf6quRFEoPOYV01w2dfclNqsLblTcUhUdRJGc6w0XmBxifI3MXSfKpJjIRwmgjrY2TM1kWd9GtOD6bjpAyjr6f5HJNG9Q0ER4cordhTgf5wuxyTfW1LqtTvqGm5gCxoejczTG+psR1J1dVwpHz9fl8eg9qO2lJLyHodhxyJW/w21PynnXMXQrv1K3OU+OeghgStjee0GoLc3kMRTzGS6wb7sxnZsAZrFJ0jiTKU8fYp7XZkVHK3IeEd3H3aFplmIW6CCn6Kb2q3CAdBQ3LJpXPsbNfu8VaLLXt0b/i7H//99uWJhrCHzc06Heo9RPcAKD5ApH+65uF/h63/v4Jfo9crx6/hS+SRmmaIAkaQYmv4IsBez++oagNlSwQQYAtHyBLusHgTRhvcABM8CZKFzSIYdD4JXxRxCaBN0G44AcCoIXYIAC7qAUqYIBmAFHSTRxvYjAD/UIjgIX4BgVTJb+BryhYkCp+LYDCX+PBeugFr0JmA6MbjNyg0SZlNjFArXRDIQtiBsiyZiR8wRqAKXxDphsi3OALZC2oCoaAo0zyl/D1KAF83bZ/gC8B9xoig7+EL1sQwe6Av8EX/9RdC30OXiP1J7S+hAX3ueerPJydSvUpzqz1AW38D+gEAXj64aD+00FwbFTyyNAFD6CSiOhCBpCJHc9LWym+2qDPxpLT9SM7Kh/I84w/EeYXgMl2R+4IBts6uC1vl5Dr258u4f3gcgyg4i/HwP06qp/3BXq/MRy4MQKApgMrgA5my4PPHLsNDxpLrnYN3TYnh39u+5XqHEOeMda5IpBid9hBAx6nz8tKhil1dI2Q6VKJwvYu7mmeVuUCAkuHZIXdVxFe9Kc2p463cHsM/OS2TfRzLtNQ0u66oZ2vPTmdNTNxj9fqxk0rWLkk6yJbIexlDOuulB522w+Gd3wkdz9NdibX+qlb1TfobtdJIdj9oGQ6rxViuC2NI3XMUvNJ2CmP76I+n+5Of8awvOUbsU0vdi1edpq8tdTdHEM84/rz4XLTxraLCEW+WI9+0ocW3wrwjuB3dvoYjXxAZfcmAfCcPGuvuto6q8arVePXAJpvqw5JkxsfXLMhnn2XYabbmbXdjOWmU0ceSPvGjXrOtiQ/ZQe+wWmeHUWWDfbcReA5qLHfiJFi0i84Ag8T+Ba8UVjoigXbCzJx7AnQBwBhMxu/9cVFKTNPzUpVIAeNIqXnbtyd8O9ae8eY0c8LfDSy1wlSjqfHnc124PozDffqQLHgSGiHHWpMIU9coPenbV6etl1D1DHPTMt7sHPVadeATgKbvmY96qIssOcMvCZ4Frv+c0xGuZUhrG7gpsBSjGvkXfkzOP6IjY0n2fnz2dZ4YFF7bvsQzd0Nl3tIg9fnMcwiEytmQetoshjpsBFD+9RfGZ+WlGPIPfaNwMqadL9VakU1Vx3uvabf4Tme7yGUQZ4G13GOcZUPK8He3u53h98h+2ZnqPKK3HoXF/OVB4xMxeEmhWbqpsTZEnbJxdkHwxFq7yusYAQ246rIith7uS/xXWDBTnWRuNA5SDHxsJSMyMl89VgbhKzJFCOv4jHldcN7xhCbDkIYXgZLRgirlFb8QF6zXllT5P2h6pY5OavY9nu3ZOeajRpAMa7zaX2rTzvroZlrCrK5El47O79smifJiQesLb3VE9EYskvqiM4SXcvEe1+b6vO2Vgh+L3KVOCRJlsj2LvsH2Che7t2jv//rkgBkSrp7kRZRcC/ayzf2cc/brrhP3/4DCCn6PwH0/dgZYN84jv9Kvjet+cPx/126fisuUdtd//UtnL51Sfqvb/9RF01x77/VRRD+6z/X/xH95zeEYZhvP55vt3RJ4l+Q9/+Hy/vA9R+PHrqkKR7Nt9fpj0n06JIF3Iek+0WoMjgJkwyKw18he5IsihN7SUsMXfAdCMkECDuAmMQmpRapGgJJh7/Q82tkJxbM38DkomyB4mSolzwlNgGAcmY5RxQu1AAoXipefpPEBo2XU2LIb5CdjDfRa0YKXUgDoAhgeYBjABAHgpegNzCgH8yC+Am6IH4QLcuOXzSCAtwCXsAdjhZpC5hARC8KO0ZfxACck/orZBe3C1I9P5Fd3MsAR4Qv9hWwf94F8aRzqvyOhjvIOhNwdHHmmCcevms+TYFdvQvPk4HFWDwRdXixptg14PfdTjhJRgrkI7znuSsUNsYQXVggCzVCVbTaL/BsKz+v4bmGo4nrg7NU7Irqqdls+aFoFT4vt0f2ubcrAlJF5xErGhJh5iNsHMAn3gb7Z/Opz+zzgzJsq1/7GXV0sQC3aOrSc61rCCSw6TpwIDNT4FqEymeTLpj49kMO2+Kkl+bTmE+jYUtvathmMejVKADiYWuBrsow2H9GMXuXv+Nd+un6BYnVBfztBj7N5Q5hENCfPy1tBxvmCaFfs6ty/fBQZop4PPMuVRY1TrMr2DaU6ztY5ayCewW0tfrY2mKt8/r7mfVoK+tXVRDBsqvsl28ps98G174gzkDhv7EbwGBuv3Y0UWeK5boJzkYO/h4AaeNi12pDTLvGSpVtBXU0hOy6PEic+gcwEt/BiGaX43y2fQFTd0J2N2sr949bqbKRIzXmDdrCgzWM963tUfdMCWqfinFT52azz9vRuNtbBkkeSuAZ/n4nXxFanNu9gjwwpV/XGmcmUO/J19JF8Vm+79i1yAvG1F1PbMUqDFxv5Zjnm7lgByTHktiJsGrEKDdojl1uHeXaebiQXnPDISpIP5vL9Q7Fj5GEFqfKX0d8C2hd6U9r+UI9n/IZMJ2k6iefQ/3L44TfGBxpHBty7fl82e0OW/NA7EjL7O+WOmenyfE6pm8sXXgcPQ5zw5RZEbzkZLnNXlfuXb3KjYwDeIKU1o+TS+sMCc2W+alwuIit+MAeWEILNHm9ElP74jv8aBIGhtLNTOueetYaExPOSMQqEG6qQFuzXAuroyn8c6YDfVAdJzlysCWzw73QHmZR6mmTa2x1frjsV0xfeJFY4RFCJRKE+j62G/dJJkFs1Ezkg8eM4vL1Vseesoevzn5hkybX5xrdNdHlMNlr/NmkGHhYny10ogM2y/feqgvuaA0zdEQ8mPxk1aqqU+XK6Z5yJzDRgOW0UCJRr/QN1eRXsU56zya9FJpdxBX5VcixdZDvnAfKwSQeBwl8fhLupYok3S1hcbL36ImmYpoZbmFdW51wty7C4BAh9FjTJYVm/vTc2hoyCrszDR5mEpVvc3IeUut2yy7XgSCyyCIa23Af+Xa8JRwfaoetc6dWUOiZO169r8qkcxtekelVRCdHJrkYki55WE7xKjZrV4En0ijTeKNHkzCEM1VywsOwFjsolcggftR+pTt0Np8s3xH/PuHggvpeNC0ASH4Kk85eMPRNGO9/OAbg+/vhXzjBv3eGD9j+7egfYRrDCAInEeorlAb4BlQzkKoBsWEArFELKsYAUl+GXiZcYA3ALoDgAEA3/iVKA3QE2hqFF5EMBDxJLuqXwIC8Xuy6AMNpepG+FL2Jww1KLycGAhsIcQr/DUojYDognalNAFCe3FDkAtFA4ANdT8IbBhCAYJkpDJaJ05ehOsQ2CLJBgCInNzj+wm1iEwEFDwQ3tkycYktPEkwc/rX5eF7Mx6tPlGYzln3YX6E0F+hmP/JvJlRZHDUNsmzxqHPsB2xrJhCpYDu/g2281i19FM0PO+xVSM5aHdVviKUDAauyngC9GWNrHggXODgjQ9ScMhOrC9/VTm948Sbmgdp3BXuxDJ8W3Y0bgjfqUutCgq0ib43qbNjV0gi0+Jt1+8O4fTydnmLJmp8WgBMQ+AoA5jMzQb79XWsDeNv+NLsgFmBz+9Dh/o+XB2Ce8Bpngpw3gH2zcgs/i/M/1+a6+Ji2HdQIiEvy/tR0DoHwlwJPCifbySOOPPbbqQl8Y5W7CQruvHNHp+wxN9vCG0i4MNojOZcdpPoYax577nR5qDGjRyWdkA+vQILscolWmWVuU2vWr0V5xOpyfDQnY9uedL0lh3OneckWaq5edDsn+GGcHWZdH8VpzcuMM0YH/jByuy3XPwI8voCN9oohQ9k/Uqm1RE0VmR073o4PyG2E1f3mSeudHXNIxSNS5TXyAbmeD1nFPhk3VOVk2EvkYzixJJHkApGun+49CGfAI/wJiiMGO1XYPPls/7Cxejoa9uFJVw0vRRxRXYfII6l9/MjLa1djVqlTSCsLypioCDqspwQqa/iW32KjMsaLXFbv4hxsjKI+KuYLmfYc54nS/hyfbZ63kFLvDq3qCIGczDcE4kRsfGegsfhmZ1Z11lsgDnxl+ptLwYIPb/AGQDAT5R+9BJDw+p7f3ASsyUuChO4JmbECUZVaA6XsKapzds8wqM3s4mjESdOUVkOwPTZoYjMoxOSVrVKZyQ+1dzWsPNrBonduj0WeOnyHSYPA0cij0jUPlU1x3c9bY7XXPUw8re/YOXtCZTUf+1GCqY5A3CxW5Qszrp9+lOsckYeZtHZXK9+SS4Fm+fshPxpzJSJB9UzyYt3yHQyJ1wvWwoCGzM+E8dHkHhVJylPqVSMAp7Z2YYqM4bkPPAqpiHyFzYMwXSaSkql0Oqn5DFX9rsCfgdGUKn/DcQ9LKlNMiJURPMxuxsda6Ux9Ri++uUbWKpl4PaNY/Mi5YR/f7d0RshgV392FVRaPU5CDjbycnfU+4RQAopq4u3lzc/2nEvndevsbEfqpPv+fb+ol+tdv9Oe3on9Xny3gD0n8LkGTLrlEyUt4ojBMfvvpVF8r4v+Lq/lFAP/pSn4EVQQhcZKEafRL8QtACABqhG2SeHHDxvFi3IbhxZmJxYszFkhWJF00LZb+DlZD7F1WhtTLjYotTlAaX8zPMQC+6CU98Q0eL4oYfCBBN2YB15T5DaxSL28qQFMc2+DpYouOyE0M0DRerNNEuIGT5ShQ1Ci1ADUF5os3CbE0AkgGYxf9Ti4WewDsaLigOpDPQHjTyQaP/lL8VotXFms+YdU6303nN+K3F37GK8hx9KdUsqcPwBJOnzquV0Wg2yb8uSjED92qKz8LYui7ItazwAU/Z6IEoDWCHyC3nOpTFAMA88ExAILpu99sAcEz9CbyVIC33g8ib8yOoPOuFO8633+gYvX9+KfhvYYWBfw7AfwO5qgOhK8xg0lKHdbrFrSpn22QYb8axyxkf/YD146tW94osR9CGPkuhHlOCxv9oQMiABnjO/eYOaCFo4f/swQdTISzgQieP4UwWJ23aFeeK4BKAczg7NdAFYODp6fyLmSWuy0VLysBUNEs+oOR4PObWay0L9GzWAe07x0+/eCAXgCy4189VAJ/Mw9VlJBYBlyhqeHE/s4goL+kELvAuVcGv+r9+7ZhVIyw9L0TSVRvEOJJaiHjgfXra8uVpIhvDzMmin6zq+BE7sTA7kNr1M5qr1/WutfPLPPAMqxfqaqVUKF23m5THMJ3NRvZqTTB0b6eru3Ibx0vd0OLuSAwP6yzatA6m0ps42FmErvmvZvI7seRL2FvTgcG2gKNrxIndyeeEwUlAAuEdVcrV8dtKqlwHLkD8iCeJMw0uQR7gXAmt9syVMqtJ6w0V1ahLiTpknwe6+pxO3lYJc6iT4qEcWEefY92ziDUpyi6ksllZWIuHGdGwz2QqhlzZUVcDwXE4ELlpz1sjPg1Uzijmwt5dyXWDrlKJJLqFL0HNGCFKkZ5aTOzWMWHANX7T/M+1INXtPtn5v3uzTPNiprAFlDG0q+H5efn/cYJr8/eU7dVTC9ZRJ/N6Vz+aqW3WqjaW5fr1rczPZH9m/1kYACR+JEJ7Z8dCYEGLpU8NidcUPImqOg03pnrhwgNZ3hhQe+c1Gc4WGQ5DkjuvFedMgIvTAvvShaQmqP5a+jDwmmgd1JjIwI/IqOebe8C4a0KS2BP2c2h/elyn+z78Yky/HmFWIF8HHX+kEyDem4vLnOH9sh23t6HC6IedW/tHabJ4yqH6xmJPuFXAx65faILVxOnrOxpzaNaHY3olPQT12mk/wggwMLtNcat3KdkHK3HLDkaNTl2MBCo06GPANWoK51YQpmoliXc1h2FCubFOBbkjbpOlwPEnM2IrzBr2N76y9SZa4xZoxfs1ifwqEWyiJb28YwVgvOYIqPXGzxXUB+u4ur20FerYQ0lD1I63mIzO/AXV7yddjUtNfbzaCaCcZcPB/a0Jy/qISpRlqKRG3xXHg80e5h7xR0yC2kgeIjdSAjmYT22HSbWudPb65xYnzuT/tukhmXZHzD7zVpdREkPqAPfNm3cLn7qr23y/3DoB114P7aM/hzR/aK7ka+YAYBoiln80kDRJuFCBYBmBWoVp15m6GhRsUsQV7g4nuOvzeIxsgxFsSVyiowX0Q74Bp1uYmaDEhsS30SABCDLb6CWwVHQEtMLgcB/xwyA4g/Ab3iThgtfoZKFAWDIYgmgwGTMEp2FJ8vyFsFNLcSFSBc7+EJrgsXQDzoAgQ84wWITTxYrQhJsSGbDgP74XzID/WUWv30wA479WmxTv4htxSzFENK5N5oAdqejBVToAlhRwRkewOVABuAmO9MPAVCKwMY20NYNAP5Kt9oRkt9hU+AkIUSRwZfpl0/6B8stkAv0G7iPowcWw31YtBc8h5YZVWlpWADMmd/BHNYFcdRfCp19KXMA5jjY2OblBwhzZO+0YzKLO+hHpmPB6g+RY5kuVjHgIxLsu2pmnyUAvXkdYeASS9F8DwISIW4clRMq9X7DTGC5gc5lb/ckGy0TZe4hag0v5/8PBnvVfttWwb6tQ/JiWzz+jMP+kbPBv9HgDC5t/nMVD/2MwQR7Sa0HnlzR/Pk0rNNxP1Shmo1BPB67lcyt9gS7I2nyHp/U9qybYDPj7oIU8TvjeEROHj2hYZPLPHK4TfBYjbvnZD+6pxRQsKO1R743yL40Mvx+05xUL86HQwJh+nrI8KAoNetwQcup0Tg551Ml7tblLJz6AsEVXz7zo1iMN00hPJ9BVYlvqyhu7skdh7zMONNqG4ir9tk+yaxJYZwZvIte5wO3drrHoT9tyRXYHuezhzBzabRSE2T4Te/dRPAtqNs3CaNkZBnRB/QEdg126nYEvWdjargQtUYfsbRTLEMmCsSi3XobK0TFlYp3nVYZHTVQMpNbLUpZzMca45yZqoYeUIM6jvgxEhyq3dHVJwaPAIKHX8AOajlxq87kmTbTHr/RVwrf1inDjted+Ru1Tv+o7iXwJL5Cx8ZkfHexK+YYlSzeCkFmqN70i4u9fHtfmNI7Lp/hAVpejp89Gc73h2giyqgZR+PGwq0A+LScw7HCkruJWdoXynmHlkf1nasDmJV+fiKd7y/Zu//+D/sE9OGT56WQZgc+JA+ranX3qWd1ZOdqLT5Tjz3rU3PvxtPxnInxo2yoGuvZjMmQFjHBu0A3dqaURMfXVLeiY8nihjVGi12p2EgHF2dWSlEe407dzAwKP9BHIlYDdOci3WzsZsi6w8Pzwd1GWofZ6cnUdyQYM/LCXy8c5z06gV/PrtAdQiF2eC9NTjDXn/dr+n6712FmoxC4GBqXWud5pXzaqVWdl2oWnXvyKM2U1gttwmJdwDqyuiYf2W5/naaryOk9sj+p2q0voBoV8EoiYGS7DU4UNt3OZdY2FI+g07MdV8mwurcEEk7dsCu3c0bynowEuOsOBXY/PG8Y1DeHggFEOLtbN1aUTNpuhAvhXo1r4IX/xCdvPloniIE4/wuN/9nvHWy/R05/PeQXHP8fnOYD83+Z4mdXOE3AKEkyzFeYD7B0CT4jF4s4hS56HoY3MLb8ybykd/pyK5OveDX0N0b2ZDEV4K+wOAJ+2bSxhSWAQQDkU3KxCQB4hqnFjw0jy7lpZhHu0e8wH5AHInktLFwCtMEaGKD3gyV4nIhe/vF0E8HLB5JeCAaYMkDf4q+XwLaYeK2ZWmz5YNYl2g1egvcAIaEXX/lfYb4EA8DgdsV3V3jnm8X8Je6vf8F9HrJt0de56MPIbp5cZ3AaqVqE/Q+w/ZOT9kepCf1ea4oPnR8/hHz944n/5gleHuwF9wHOV8+9oM/6bLw82G9t0asNWhp1hf41oNv4JaDbis/M2Ttb12ji9OCMXBdbhX48jZD6Ieafz08bw5+aGI74uGPfg70nx4J+OPPfO8EvfmfozxzPAyojtbMnnfVM0k202+ddKgJ9U4e2NegIOa+9K1QXeOWIbLU/REEePz1bf1QavHVhbSUU/aEC9yVkt46lXFgx3u84RLh1CAlT3DOTygEVAOJeG9TKwkDtEOd58x6De49LhEZj8hSU951EK05JIfVeuDmwgDhGRaWJEz23OeWdz44GnXmwAd/uaXpdX5EK6zPseH2is0cV9TY/trJ0qE/E/RD4ZrLz5uiIMEI/gm7m6VhS0SODpJX09CM89ksFizPRnxRYOO8C52ihjViE7TN7ovjeaKbVNb4W4YOInulwTi7sMdq3/fUEPUOJrC3kqVTttcjAjahc7srVSTiHxkhux/uaiPZ77TgcctFcBeZjfPc74yp/ArwZYit8PJieuh29RZgq4O6L4EkbdB6I1sUmtUDyzHJ5IbWxYo3RvMA3QFyMfUTg8Ybi1/NtDH7jz8t37b9h+W+EPKB5VvsiDSp7BJ/FEQKcz3h99ws5XFbByqszy3K6qlDg58RlGVD/C8OMeLbkuefzxj0lrQ7lOg8bo4ZUGbxEitUCxmn9xVNZv+x0svRIjtzogTcR/J1DEWYg4dmZwYESkIMxlheifMpC1MvAm1m/Tn7GM8/lRjBr6Z21Hkw2L/18WZogn+cAw9buYFawJDMDVAQcqF+vN2gb/IJDIvTUq/If35FI0XLIw6w3WsK/neA1qyQhIeLn/mJS+/UyJG5YVpKAt1LNPBX6/Poy8Sw1n8ToZadbvqa3b0l/eA38s/dGve/CBLOhbVjJcjIS++Ay1rh1m1brVFflx4fpJAu8MQv27MeAX/tDy4DWk8WrKnP/zs4EfWxN/+7OBH1sTf90Z8oyk7zX/CKkvsyK+G3cZnE3T/eUgpvr9iLHxwpKL6pXMnWbSmqFneNh73bircYZvC5G2+W9XFZaeWVcZZbar+DYbEVqTfNmOoS7PXNMaYjiGft2MSh2RuDw4Z0vj0e9649rp4jNLbolh6qPDpITmRZcDa2aWQgG9jeClJoyTU+IBUVK7iq2nqzNrX9hZ4PPnMOTeuyvikseG/SZqbjmdE0kN8LKjRQ3uY9WYghnN5IxJIAnqDF1suifJw2gT+b2tlrLpNVM+YOgSE5+atrleIAvh24W+IJ4XH21TfF6fdqvk06vbuYZekqqRxbKvk+VJleV+nFr5O1BE4BuPF6CMUGDsuab2yUleWUbrafihJ0o3S2IS2caxX4LHS8mujL/fZLIfkO/oGp/zvh+O+Z39O3bT1kLCEp/yd2IV6ghFS4+nJReQg6SaEl9S15WG8C1QAscbQh8YVxo+CV3AwwJCxbTSpQuIQyAxAEuiIdLnEKILp4V9BUjQcOLFQXMhjAL2aKiTUr9hrvRxGKsiV9BjzG1jA/ihVem6QYmlnVi8bKkxUXz4pjR6xBOLF6d9GUuoqhXWiC2sERASwNi8fNE+GKvocm/5G73BQWIzwAJnjOrL5MSLPtnL45ZwU/op5y6n3bI77aJn1Ln6h/6SN/z6zK9fKNaxivxwAS0SsXeU+cAzfpse9EvXTx97mfQP6JaP6fIvfpAv+xN3OIWyjL1dyly/FuKnLqkyIFthw8gWb/uahZmdwEtbL1uFHBF7arRzy1YvZD91VLdeYfLdz0nTatblXnhBcpArBQuI13tCWjH1JKxCqilguQOp+yoYMiI+7ZIB6cLnwXGZ/19nVQrauzk/ilcMV2TpXUerwM7WBMEID7XudFXXlUP0fpR952itMh49y/r2705qff7VmY7iomzkU7sQYXRKjXWK6O3RPoYxVjIQV0X8UErkbfTWcAzt3k4S+5acjgqUqk+RhcwJqeohrSk/YB/nEccYZJgCSg7NBIJ21doxVoz/bisXK3QGXc/BJS1mmMrApuyvk/kqfZPd7NNXSTcmyYV9+JaSbA0FFdqtYZdF4Gqfm8h3k2FNaHHZCwpIq2O/GAnmAfmsmNC6TYd0VW3StzpTpJrTOqHcD6eOsJaU811XUCnaCRP41MlMpKZQgvl6l0jWnspasBjtGdFo+gz2dy18TZK73199gcO0eLnZTSJ3FOLGTrc5Xa9PQRKKFj90ThhsIWGCcKhujypnW8rBo0o8ZTHU/skeAwhEjec9sKa8ASXR/cZtJ73uUC1vWS5t5o6HNvuvKLb6azkt4NynirPToj8os9g5PlSGEx2s/Qs2eZweL24xEmB2imyqNwzE+opHatp4owt+NpcRpCU/UluVT1tLDSbDr4E6Nx826kC8yjPEbO/h6vUeajQ5FDULCtRMRsYDJuTYdYFp6lncPGJBqfUflLK1b6Pz5+0Ux4Bq7h/WI6gD9PRh+WIf2ONh08T00+5h2aQy1v6KI6zZton6i6gEEubvnWXT8HMfXIVf+bq7IvOn31JSbuK0WuDgX7dYf7pBgP9usN8bjDtb7c2IVvM1AK+lSo0hbj60XYXKd6Np8FfebblHUQDPGwj7+lC6Ci+hOF3ZadZt5Mg87FTuDkTP25nQ2Vd1ZgvULYujDWb4GjNGLsmmfID5luHJ3ZSlSbd2Zpg3qfTOke5MeYswtNXK57XroZTHvBCAc8tlErri9YdMP3KeyfDxCLHRatCwhnCIVZDdtfauHFKDruWMa4jqnne4mvPo6agUwZZIbbQ+XzYloF2RoJoGCQvnecLhw/99sadesBLSI/2+xo2abhZC8c82q404eiQqn8KTvcaVgKIg1fXk3EzS9+ScZsa6wMMblOJ7Fc5i4fWw8nbbJYZr0zgh+Wtz6SvrwlK7LG5O6vtHEH5ri9CRsAJ3SNI86ge9D1JIg4ZeryvHZyeTQe8pvjTeTUwYBXPGM0M42yW3S53WvNgQfZJ9bFDjpydoFwFuZakxSB0ldUqExY8YBjeeY1XZkE+zjh5gB8wwa05Qrwpsb9y1bMANSGL88L66g4Vwq1szWsINyVjs04TctKGpryp3DP2mwGrc3oeIzxseFdCs3F18Y472IfaXDzJZ3LK83t7qDJMbgvM9f3koqeDhqoqfhV919g91RglJXjL15jMnWb5eln7jNcxE4QHe1uJpq1Wt9reEPbIiLJSZ+FX+6bYKrq9xo5cr9Ve3DW0w+9Y1uGuJkHB/YO5r/ZzANHJ/kkxK6tEzBs/uZyWX8RTzkp+fObFfcfrEfz492kZ9m/Qst+M+S0tw36iZThFf1n2AFnyPLEXA2PwJUSVxJaMjCB4JZAyi7cqSBc7VbIkkH5Jy5B0CZhB8Bcjohd/G0Msni1Aq4JkCbOJ4E34SkgF7A19FTygiMU5RxO/i1ulX363aEOlC/EiXpQxeJ0xCZdGsBiYWv5JUIs/DqwQozZEsFje8HgJtqGwhbeR4csqiCzMbHH2IcshjPgrWiZfbJ7n1PN3WhZ5/zdo2fwLLXtRMeNnWmazqCFY/+O0TP8HtEzQIQdWz442N41xsO2EWlFRkppzvfXDQyu1GYyOiF+59qHqMtHcwvxxlrtBRa3AyDIhbzkIz6+Unccx3t6wA1EFc3LPb7RWX/MVdqdQrFzPTKTSu1ZOVmyg+TOmNMJUo2tKOienUwcpBEE6+6Lc2k57ZaWDQJoPY0WHw2p/ELf5dENyl0CO8qRf5jPT9miN7sNyKg/3jsoebgzRNSABtjEUZbiHOWO/ppitIFj6tdfzwWFFJ3k8HwRGWRZRSTHhsN7Ix527a22GD8JxgIZzLkh1oG3LOK9StOkqip2eVl0L8a7KwoEzBPWiliGPPbiOEpltb9X7S4FS94nt450NNf5IUs09CKi9cQfE7qJvATL0g9TJSSD0ckgSzGVdJpQ+Xq9EUWonfaDWUqo9ZNVO8wQK76kvybivo81ljx+1irZsx9rnJzdnV7tSa4GSfdQanxH4iTKd47muz1cipS82vd3GZQTZhLgXqTmpAzstiGbVaf1c7FdIFtCAG2v2dAgV6hqdet2hE2mn0jrxiFFevD6qW1wId+jMiq6uHa5yO2QRevCD6/Z0PJFwd7pJz61e6IdRo85ZEZGBKkin/Ky7+f5K37Coy6u94EMRee+zXdny6NFutUmX09UMZ3NfHQOl6PYF7vKHHdvV8xlpT8kQHEZnXcyAfSLPbl0zLIQXO/W+syqbCcj0lK1ucqUj1EOOonp+CDR1OTo7dGBY8rs1kKuXOClffNntoC8Mdxz+ZjbKOFXxdVU5gx+by6rFNieyIeGxLHhfotOY+boMfZoOR5UHhE+WW1kwzwShKs7sH18WMTj4yrAlA+ZzMWAocC0EvKq/t8lJv2Fd0y8mdjCbGaLPq4dV2W76IlZM4ibvbMCLi1GVDHhZRXh2HlDM4+PuR8toJp7V8+9Ma8blLV34zQ+5Q40RimZ29x7i9Bne9JPtDXyJIqBi5kxRVMFc9KuHuMYDn8C0uvyWjB+ro3XR5TP7Z53bU1NZMyf9u46O8CMIgn3qxx/7QJ+FZo7sDPY66fk7a1gmsjaJZjtxJseDNjCo79wmHYaoR3RFeyO8d7yAxoIJCCdFo/xljyDZaUqKZu2patFdBpKbCH+sglJ+Vkp7QXHTKo5JA8VIiyPUqs+H+eF6e5rrQytG+0N4NIcjdu2vY3KeHnvxQqJq8UQ7qUVCPwdbwHDcZcYuhlY7DR3XIy6SrY5V2nWLUvNh/2A1ZkCulWlckKtzNgdHcDT1CV4Xulixz6SdTsLpWE8U2JXT9VPFc2uvrSe/9lFiZKyadI6CiGgn/4QewlVxHEdT8QLf3nZzlMs2se/Qhrm1bhAb0J3A+e6is5PRluyqJMi8hr2MP02Tmg3X4+UcnvmgI/3EvV3pqq1OQwyvw+ueuGUx25BPSPA4cQwoW53j9IE79JZQH6RC1gW4zXhIX8IJiW+Xh7LOuvi4nvbMMazCC8eH5aHXfYKCKlqppnMVHCKuswvtTt3unh2FphmJHVnRxxyhOivOe8bPeJgUPMdr5cZqilZJLV0je2hW3Ee2Po9eeTmEUlrYxtbiRwLZco9gWMOBuVa28bqnSlTGg2N2NjMrifg2UuPigIdwCZ0nBDa1ne89KyNikOsga8qw5+AttevSkOBkymWt/pyr/T21e7Gt7rj3uJ9u211vFc8E4IJWZ7U0ljPSXmoE3wF5ZxtPnArssLv5RK4sUR8tUCcXc5WMVYVmEmbRJjXbR71J3S2EH51cpzRfXmkPZI7de4ZexXv7N82M+/8+ivxe/2b/mFb9Sm9ePMN82zSPy4f7d+GiPIv8SG3/veEfLPdPOv7iSf4ynjx9pVEDiksGCz8ENDIklhCt9JXjlFBLPPYS3xVvyGSDf13lCyMXix8aLqQ3ZZYKXEyyGA+X8iSv0C6M3sDpEhJOvKLJAHtdssPQ31shwbzEy6OdxEuZMTAMThbzKFhDiC/mTBheCG2AL67rCFuYMPKybgLGizEbFF0oNYwsgWOAeQMOjweLcxkwb3JxbP9lmtZ5iRqrtt+jxr6MJefMXzbV7UkQPUjnvI9N9XCCHcGG4cz5IS9YP0aj9pGq9SRs/2wgL//ukVuCxO5QfCZ+QKAFvizBtMX38ij6uLf1URfMJbGYeCuP8nMbdC6/XtrfXRn0u6X9bmW/FvGCfl/Fi5/7NbGGUfRJPX3aIU966AbbHfxY+4e7TrXdSE81DTHp+rF9CFcyvIY+vw2ahu73hX89mWdfu8+OIl+fz+uVUa5YnMqzXMrx5VhSeBSyvkZWGiRsA2eAH7pwuDqNMHgkv82PmIgnweRWTTMXLnUDgkZuuOM5Z7Tc6J53DQkSZ0WxoxQykN6vKtSjeJVJjNvh4GlgIKGwOLPzyLsGU/XkCy0p00ennmxeH/NR8piKXClyfvZvawMyHUztYfjmnIJOYdoEr1gGpRHm4W/Zi5DGguZXl3gEG/Vxh6FKIvnWUQo45tTXuxuvaNCzU+4TvXc8QzzQ2/u4MtY726V6ZLh1aIisncO2Jl0AbrGPanw+fxTxOswss9jGoO/GsWMWwY0fGJN0Rt2ymbLBIVaMTo3KUfgjEflwz0K/BFr/1tkViPz1thsqG0GIfjwjEmVk4mqQoarGMjg2buvhsWpQdP0cnfsZoKNy4DG0tTy2OZBHLhxs8rRj4JtHl6tEJhElQA97Xkw76FQy+GXLGN1QOja9Chq+NU27Pj4NzG9GaqhG+dEX1DYQ1cpsprGf29WcXIKjbjrT6kJA3Lg6nsRmi9my69KXq0G21Pl8dmthp/UEvdo3mvc8NXcvI55Xe3vb0YEWVwYrPo3LIdBOkGYJO9ruJjTtwqMTUNeBvJi2K+Bqnk9eqWCzZ6rX3Cc7brtCvHOEkr2dRkV7Wt0Vt71D1jGtdV1K6HtrT5PDn3wHPEbPXo2esPlA7PW835UjAzDOG2YyfEwuW0g7jBmacceO/8DXdWwvSRd84+ug79G3qpFvTb8YUv6s3yes/NDnG/oVnKBferUCbNmnKWLZ8NFkcT7F6SZ9FWEE+zGebOBwCQIC/yRB+9deLYxaDCdkvGQEwdTirmLgTUQsIIMliwMLYNKSuoS8imXgS/Ztgi/VNNDf4ckSGE0vXWFsMcssyVL0MnhZzMsEAqbBiAVYqGVVi6Flqe6FLFFL8CsvGMOWeGWYWLxyYCyAEYRYfGFLZPRfFucQ1CWENfuMSOKUL6OQWeKXTVs+2uIBWjbW911bPi3BA66W/2DIEMQnZ4coUUeNmJnoM48wfXqVYHyLFX5CABNGo2Qxvazg92Dh5y9tAD9+NtxYVfUUXm/8y3zS2lwNxFfjTN4PsgFIAvNjRWDG3nONWS+W0pP/pGqWxrrH8hxPA2vUfSyucg9biwUzuCt2Z58o/LxqIZ9s1uzzaZQyPVmMwwVb0+Z0ERG0m2iun5GSrrR+lbmyjlru+qHhq9varhFankI7di93iGjt0lmd79vIhvdFebm6D9EAMLB2CHQI9HsT70270NvUykvaMSntiqBnIub7YfWgRaqHMLtx7HaR27Fm6qXEhtrp3HjxIZ0J0h63l1bGowPLFSuzdJRZ7YbCVDL+HN2t04yKJTTsO+pibh04DIjIvl55gT7c9xL/xEvkQBTtlWojXJGeFJK7mcORrnyHrYwET0UplLf8AdEXbwqLRBgvhxnjyvauHW7xyeo4mc0iJ1Eu6X7Vamx58NoKj9scpfX3kF59KQ8yQr9Jn7E+4nz5zFSPN/52Vm3bLcc/+Fugr5JV3nJVuGBuU0K6qI4D9zHqD5e28EZKMy4Y493h8jgwc1FD860/P4J+SAV31xns4S6O3VoVhgCfLHf2UYZ5zPLzcmN2qrU+S09rR7dgR48HyhBIbbWGMEFUo5CPy9iDrXlrPptTxZDcNmWtuZzrQcKf0z1EdpPS4Ql+ELYiGfHJ9XKgtAvHDQIkGR1OwFVVxWwcDNd8nzAdMUkIl6We2Jm5qnB85CnBQWvR4eaHwvnaN/nKStYXgoK3JGRXZDIDuVYbs2/5z4QSAWMiKdiNjk/xPm/3ZPa4WFbAuWeMMuIS71rkDm5slZTBxZ9RyO9OXsfeGof3YJ1RwzG21nJ52/NkO4X3gbanc4raO6Wur2NnMPrf3v5dK2iu397qKP5JnOpbt0/Z8Jlkol6ijwTYZwe69O89/hW1zS8A8j870wcE/TwL+4fqEwhMITDNwDQNYySBEDBDMihDwwiKoxhGga8ZwRni6+IUyLL1L1ES2BJlCpAgppeNHugLJl6gK34pFgZdclBi5Oss2hei0eTmLWlmCXF95eYCWILxJSADgxdFlWKLDiJewbkJsRSCisjfFYdMFs0Vv+BuicR9FYFcMnLTd/SL0aVeFTgR9lagCl2QjI4WxEJflaMi+BWo8YoHgeOlOhb9qpkBADNA/zpXZtmVn58oZZ40q6e48ob4TwPx0yH2Vln3JXLxHJT9UgZiyapVSjb6zON0X1mzeNRI90gxag9zXgFWuwbgii1WkM5/FqQKz5KWhy6bnVCnjN23IkWnJfS/qUvf1V+JsfoRHrcfEDhZHnRazsxz74Ugx7+qevQup8ynDjByiZ2FDIGFX3pqPo2vRuE0G7NIADXI/Z3Lg/7s+v7O5UF/dn1/5/KgH6/v71dW5j2NIxkpPJIQRif69Zige/Z+pSl/f+PHh2ohkWXQueviZXwgkrSztncyuCsklXF5WDTI4PuY1bkef4C2PirLTBMJfn6Pc7Y97626V5htozQpruvPtGW7uzcDSOmt/C7s2tZDva3t6Kp2R8+UCQlP8CQScWqjUkDvbaIKhotiP2hSX8PBBMPpXlM9a9rTqCTO8io73ppTL2IBQVZwclFx6CYq+kEzrTQZ1Gs7YXk/bPV58A92slth7Sov5kvERFuHfFbN89IxLC3y6q1nn5HvH6wA0o5bw+CniWmyWGwwu8jxE9ofD9eHWuaxQwohcsP3F/BuJJSZ3y+3wr1bnp6vdUVLDaeADkM3PY+YvY6t+kOUZT49Zv44iuNnJCtvPE2eY72EYzmBFcVPwIXeEFf+QxLNRyTET5Zi3T+0JSx7uKlddKIg2GMPlc6EkKEX6sJL8cfKaC5Ru+OWZK8tn8ja+ef8mERZnkhu/hD8UPKedXMWY8E8viXXiOyPSz9xb3JR/DKIAXqjdqKzN3VORlPqmM8E33BhG1+NGt0RmqRfEFyr7Cv7GOEq3BJdtN7muD+7TwXAOTSEsYo/BVSI6TXcN+itPlfHXcujDOHvcifcE/A5PaWusbqmtusdja5PEVLmONHL2ul5h24+zqUlfZ0z3sbWmFZd9lpxPibENFSKJvZwd9mnETHo/sUmOuqoXIWRtyzC5fedHe8CSLUYo3GbGI/oy+XJh4qaGb16rUxbxoVmMrXtMXQV+fDo7iuFG8KgZQ9qOF9RMsDMw3GCCrJ5EvtVIN9ZJvAvjxtflLg9zTSgNxedoc19GBOwwbT3jLwHjUGXR7DVmiZuhgzvmSa0X1GifbB7DXvy48Wis7bVptAUtHD827ZJO0++ye03IYjj6ZvctY/r92oXn+0fOu9vpMT8HzvjZ+XnPwz5a7Mlgyz5JTC5pKUG4QKS6QvuEGqJmQzDpR18RoOlrgVJfQngKLX8dwDhq3Yklm6QF54DTKXAOHKpYRG8ClYtJaThxXRIv1zvSfJZVuOPAI69pgsXRbqUh3qJVcAvSHwxqQIaACeLFRQIWgR8iBYbJzgvni4QHUQLvMevihwIs6hR0Jl+OeoXv/1S1uovAfwlqx7FX5kty19kpnOaxRz6yEMFAOU5ixNNjAdVtHJftgjweQoxZ/xe8kEcdx+h2FOuhBMnLj7y6mUolKU5mtjpL2OzP3NZvQnITwxaPrzpU/2z8b1t9OY/4u/3NNPWliULqMQj91rK+0qUqGGQ6HsdjafO0x85O62F0pklS5UPsPddNWfQIl7/ul7EH4rnfeha4z1XNXsTtgYZI6urK4tNfl4NrgsXMtlR8XplD/5zhv1zMTuYnLmXhKL8u0a6PAsdHM/zxnxAh50OC8yarc3C4QSvb5XTqJyYI7ZWYlpfJds+YKlTFkzMbUspUqFQ4uNJjtAY55KGrm4GUmL5FLooj6E3K8EUTEXtm+ce0LNX3ftbWKPFui0zniHWhAc7eDLs9ne3gMSbau/iYt8h9PEQsCpnFqi7deo9a0mNRZaezMHPk1xHjRp6/SkNETowO5w/nc/gzdY9KBieOEvWRooLwup2D9Zbib3qrS8N5DTtmSQasUdMoQFzabxhJyo+qTpCjGZn3ReTsV1BXpGnj0pUTkh5EF0cj3UXX1POtVJXYry/uTK5FInal1kESEz4S86CsROh3thaiDhaUWjk04zm6zvaBne71FXZ+MxZ8E5j5m3ZZcCv/aGPAe05qXz76xfmz94X6O+8MH/2vkBf5yKIrM6O74zgOxv4Pf4K2o6mdtvDVaHFPsg5fNrHJDtzuRVVHO4xY9EczNZfeQkrnokroXmufqDh6mxM0H5P6QogLopvtldBQZPeOiHrsNadTACifO/dHyfL3SMD7GraznWybHtXsfpahgVqR9QBsvV2VldZVGxvcQFLD6mvMsJrktkegugQr5qjl0mSWd9QYs6TIFR9eBuq6v52KHnh0JqQ0kxnCo+MJ8vkBYk9sunhrFTymCsqQU7CLVuhwuzHD343d3YRoBEAdnjt6+vCf+KNaEGx2K2d500RMEfd9YwVWEnG5lpeA5ps7lTT3lNix3HC9XZO+PvZ8a6tMeMF/7RVneAfKWQlnnGZiqgPq9u5Tu7GuBoUdx0OPv33fYP3oEuLpI6/2UmUX9q6zYqk/46Y34//IxD+P3naT6PvH8f8NRQD1MWDBe7CV4mGxZXIvOo7Jq/At+BVCipewt9w8nc5qMGrMgQSLVkEIbzgZZIueEu+slkBIgLgXey22FIJMsEW/QvQMSQ+/9+hPwbM4UvN5jR4RcthiwsQ6HWKXFoCcklJDZjFrEsDdCUWvZ3gLxflK8AuCBZMBjI7Ql9XRC32bBR5lbBIl6qWBP2XUCwseQxD8ldQ3H6xs9TQZ25prkcnzMqjxr/652elSlbtofkjRJ+Dj9Z1NH1i21Ly5gPbrtBPg94Ns6qg/l1JPEJGqRJAE88AgtE3SbyYi39oK79e+sfKoX936R9joH+6dLDfZb93QZovuau+y11M78sV6coNp57vAidVGE0YFJ0Jshqt22CgDtsghWh9n6N32wuLu10d+uoqkCKtUa27mmsNtpHt1lsnDJVtB0HtEH249K3E+npSol60X2I7VmBri0az9h93LF3F/rO6+ZplncgpVGiM9hGbG0tyNVpFt+6S/krFSXrLjkrL2EQRnGDIZe5C5akogGy6DwsiG9BoX+LmJAwD1zhNcu19WcDWkSPSOk+kQ4lgEaXFXDMLKhIE0BY/NVU+XdjuUB1GdOCVhn8IHkNeZ9sI93QQdcisYe36fDQknJ3Dmti6/kVT2gS+WB0LIWfcNo5GghH39JCszwwW8mRJUgkLR2YTd5xR4sj9OhRrTWxZuWMzUWhxRdJVhf/VBbl2qdSa73CaD1boBHOEPAVeuDUqMfNc9VZCouRUeQtgWsne+0NfDiCl/iq3YyD8kRR+rzDe2opkwABJNfDQOL3Pcycgb9uwYfoQja++q38WEVv+G6wPS87WWeK8PscI0N/ls7+DZ+i3pZbZc3zAixiOqsAJ5D5ID/M5voWsFwU2klxbt9K29wGDdpSazHqcgJ1byEnZpeAKOVwi2XTyYsD/P9reY9tRdA0WnPMUZ67uFt7UDG+EEV4wwwsnQA7z9A2kz9pZmXXOvbWqdu2FcNJGf3zxmQgseNH97XyYF8QWWols3MNN1c7uRMOy+E4xnAOy+6ucji4ooETIuxx4ZMfBsbxjDyupWl4cmn4U4hXqDlaGUiqsrmw9RFzQL6eMm1WlAaYZwvtoIF00fCJeVs/vojDNZ0eeHSJVMf9y6TEqr9Nrpj2bmICScNPbAvO2oE/r89cDnq0ENHse0EnhTt5TYnVYM/2+YYaqkaOeeSrutYkbCnTsO09Fz7e+lGfnpr8dDEpOfAD45lmR7/b5pnvZ6Zk1z6d5ivMSMRlBbK8UxrWnI4flD5QlcwEz/7xqypVFuUHjf+h12z1L/yNz39nufX31u6R1um5L1m0fZMb/55N9geJ/ONEPOXACwlACIigEhWAQIwkShyGcICiUglCQgFAYA8kP5aLI3QYPjLcJxJUmr3CKUlsKfBNpIHfnhHiD2c2mD/mLgD+EbRDbm+N30Ad3Y790bzr/FAlEu1/RGhik+QbV25moresHXSMB5BewvdV398x3/MkSMNuigK1YnGz3Fieb9hOV7oLM2S4nCW2IvtVkse3CJLXtk38y9qO2vqF1NyTdQpA1TMF+3/izjx/2X8cPTc7IC8zKA+uNnzGfI8UjPRofS0itsP13QPQ05iuUa5bY3CJ3W0TMTxneb0VclZ8YBNiFE7ed/H2nvVtUs81tivtzpffJR37a71jIMsw2m5603oqTDf99o/w3I6WVduwSUV+MlBb+x20V03x/18B/c9vf3zXw39z291aAf6sx/iJj/eSuFwPjDfqiihJJpMXhwtt9RCSA0tvy8HYMyqaxk3AtuHNJw0PtNY5yPav+dJLt0xr25mwxcwIynOvTfMKQxrlwIn96B2eg5WQ4fSwZ4sxd96KGwyzNbivlt5m7SIfTBOdoEOqy7UNHzGcK6M3neufEWIQc3QdXHIDRenMVdw5hlgyOZXF+4BkHPfSXpTFXPQz8Y9MmJRI+oaNY2iN4P47PGe6xApRxU09CFPCCpOiSYxObd9m+jFPL6Q/51Uogp0TdvXOKq/Q0rCxtnX7ushjv9ZsnLAJ07zxKHtAjQLsrKJVXbFalCBOSyyShCXdnwTUA8R8EPDcHeOiPLDJFxbGxYvOIiz4+XnNRSncrQGDLWAcrT/xo6v36kxfgR1aAAMNYAo6f3pSiqkXFP93gdetnMSVhROaWv6ku/m1f4Ludf9l21BU4iRzUJ2noc4L0daMekaSNA+1lsUDqn17Xw3uG0lvm3Y180VD3pNZ6AzMJX08BpmtUATaCryRQZA2ddej96dbe+ef1VgRODuRjTTZGhCrlWLwdeDnJN+RyJEu0z3jp0DQEmhcIKdzsWE9xQlZOr0dLXMpD7pB3kkhaQPehvDRF2PZeOW368bCAzZjMcE6qU4zG4qG1Ohzln43xZJ/HQZOeUEnGmBkS6eOdnydAgh+aXiR+vqTk4D2f2Zu3rZbloDnh3/XbaAiCC+e+49MDjY3jEt5Jh7Os1xpc5sFEZ8ChA2PFhx4V7iOBKU7goLWdxUy3CCnH441rPRE5jYm8lETrqqfboegFFVdH8t/oMH2Fqs+l2v8dPP+bE/0NOH88yY+FYwpdQZPCKJLa3G9BhEApDCIRmMKRFTpRDEVQ/CPQJKiNKK7UcVNL3mfkkWhLIq+wl4AbaczgXQI52ZAIzj7muisOkruFbrRR1OzLfHy8o2eKb41PK+P9xJrh3WOX2mUAkF/Vjbcrklu2epNTRLerE+RWH4bxPcOMbQ1OG5Lur8a7ZON6q+ttbyID6bZbuifMV+q77oOgW1/tes6E2CAYh34LmvcdNL9yXZPl3oXXM6x1F6+pf1f8UJLsj4YDOOb6fws0v3oDruiTfo8+X+unX8YXgM9GuZ+myr5oKn4/7P/dNk3k/6aPDGiWu5X1PgskT99fbUv+fTc1/HD4T+LR9bZPsO+DVUAMg5PM0dmXATgBXFkG3OypaPmLN/A3vWfmX8klodX7yl/UbDg5Tgdlg3s6nVkkM+fo1BBX1WiaBwOwNqfRoXFzKhZxjyk3iTXtYUhZ2Wp6HUOalnlleaBxQRzzxXlO1kv1w0ciPJDgJnQUAdyuuJdnOGKv7A1+Ru+sGLGVoh7tBszfTI4OBPE66SmYIz26MlchErF12VHUN0jQuNA/ARRhj+nEHo+0BF/TbZViAm1oIFFfSf4dk1aeNFBKtxz4Wg7kt3shTPyqHq5D3Wu5s6UbIeqRNnhhL5l1e44l1iKGwAxG9HgfllhzQyaX/LnNtPtxJt53hwVVdyBSRnt2GmQcUaBIfaLyiuPTene2XZaJ3k2MjiCPazw7dG8wePW0Kyh7Xg5VrRlv5cuAFKyN65NgAH+TLA7+zJGQpjBT92ILcNRnS57OpTi9uYaQKdBzR2n8TIyZYhQ6+uvOH+37a6apvRId72V+kk+HJ8TfeMp+nJ38Xqw881LL3WwGR/5xB1bAf77Si3R8O4wEVepLhJPs5txadgXG+FIlJ/a6uLPchoZWX7hyGMnk3Rv9ET57GJ0WAIgbx5v3UMjUN1DoDFbtGT/jefwU4zxoYx/0MabK5RXLesTuD+te8t1PGFo+gM+TrAjA+da4dRkFa8gnD1z+JvUQC5g4uxuFsfj4w2ISVAVvEeq6h9O9hl2SxF06RtRXxXtg8wACmw8g035m3PgwOubeH15vwXJ6WL4xL+f6QHvhUb6p+nVJGm/haHG2KzRdegRMyWds1gC7/pkIFqZYghLeEIsN+fne0rx9T0p56gvwgoKnsxb3UOh7cYr+F0AplcX1E7GLbkn2H977P4CZ/+M5/wafvzzfDwZAGIagIAgSOAqBKxGlIIqAUQIBCQRFCBJaXyI/bMBK0V2FONvGlbFkm9nY4A/Zu6iwTTwmwTZEXfER/aW5PLbnaLO9DIwgG/Ri1IZkUbrVgNHksy3getaVQ0Ir2EIbpKXJX/CvpqyJzd9vg+N8zzUn0EaRUXyjpASxYeZKl9ezZHtjF7pL6yDxFg5Eu8xiujcUR/hekSa2bmI82y6/IjhEbrPivwPSaSsvDl/N5U16mBKl7VRTea1L9m2+10GTfixk+Pi/BaSP8fRlGHpWvoc2ef29k3lhSRBv3hSRt/Kr4H3nB/yd88D0hXF+ru9OP20bY+4nuY3dlcGhna+uDPz3mNi8guW78cVJMz9b8O07VdtOnxuv7hr7dX6x/OEz2H7/ykY/DZAClhd8DQx+7mL+xyZmLdawy7kFDpRNYDb41IY4xwL+OCdgY8fhdHqcvYazbt1K7B4C1fc1O01qNlcUG/SnhvGdu4Mojg+c9SdonKzTwoNN8U5PvafZhkEsK92c6gtWPYdXeyGN+nq+noNGPBy0ywNeShsd44ZVeA2Y2Cvj5W/V72ovv0mdHlN6UtTUu+pQV3gimvXSH2RSW+Fwu4sgLQgd/yQ6B4f4U7tCBiDXWBMEGWN6bJt5s4Jcm5NHuS+sARN3ng6tBkbMNaoj6WyuH4hzOQkTCPWklz6z0OAR4LowPmO41pNdl823gBlBWdJXgVTglXaoKUo+utPAlXe2ddg3HKZN4DCd7WZXCIxc+lEA/GNiXjCquk6J2uQXcwC9WqOvD7SG/94mBXzYJ6XyhxGuuYNKSXRqB8q1k+kXVYXsm/tcy03l0Qw0JqKBf9z5l13QdCIW0QXRswS4LbMcFoHszVIsuzl6arPhPRVzWtOmR4onErmHvO8bej5kR96Hbs9G09wXWmdXTpXxBcg0IkYhHUvSuJFDk4EbX2pLq6a6vl10PNFJuNNVoW/ns3y7FeUJYTgU8iTN50MCqgTgalOGdo4KzQqq2cjL0AqWmSAjEaepg9Zn5SKqAV0qqjmKF+GETOf61Oq8d8FI+30bYSBYSso6WUeMDe7sw75EJtJXhkrzQobOUmDX3mW2xVvwZjvWHykeYukJPtp4woZpLbIZ8OYfF9Y+gPOEcZFWSwop2ZdzPshx0/H9SN7UQ3aUmaSFzzrBZ4Nip7eOyxdaVihPz3rgYNQvHtcRnKFOf46ytvMV+i7IZ/R7rkxw85aPnpvn7Cc3O7b72TToXx76FTN/OOwH8V4IpihiRUkCQxCKWn8g2IqRm54vjpEr71wxEvvQvn7rIka2tuEVr8B8d7UFdwf4vXi5dSPtLnX4rr2WYB8r+0Z/JdTnDiNsp32bmm++y5ogeykT2qYoV/6HkHubUrT3OyV/Qb9Kz65IS+7dUeu9rUgZ7X736+8ptTUm5/uAzAq51HcNyNnuXQ/vl8z3IdBtZAbc7QX22dNPknHbAA71W4C0t7nM6utcpmmdDmOhR5VCDIrGtaL6vtLRhwBJH4HvUpKnLynJVBQe8u4+j11TyZtXCPvihMfFMzoJC+19FXPiasvxvqNhslAs36zy6kXj5M1dZDK8LzM22zZ+E+ufdK8bgfPyYx/wDkcXa+N2u219cLGgzZPvi8mdCZMvzUpG4TMCA/yI8S70zdvGtFeS9Bv9/O9hCqD1wxsPU5OV9ctTm8owj8zitUjrd/SuaX1M6DcuT1J6tAq3PHCdhoTK6aUdZbd17jxqAPcFk2f48jrq2pWDL/bpWc8VujQUko387QU1Cat0eIsTF+21ckBR64wy7zYDPNDqDH4ADLXB2EqiXBWmw/SAuL7BzcZJDrJeDQLp4bYvrHspqliWuX0yMk7vlKpCL+qVSGWdioGpHE7DjFPJCRHYqWtqyZqny3MYFsfX5NsR8wsng0x11qMXIQxJfUWpUDW06Xk4zq4wAgQTzpAdPwzBxUyKI4/WNTHP4gWn/KhFwfT17JpXEgcIyXt0NdzhlpjOJQFd6DI56xEHRJlptlM9PMvmgh5cqsWOI92AX2CK1Xj6V7zP+OzP+qOvzY/tvPbtEVmEKkk4fBDUWrocJ8YrrkH91SwG+Dv0sJVYzrEwMslgrUxbDBDjfuCmhVLHsS0am0lRqgktXT5wDk4BZf0qUuZo8PIpSZkuzfsiQpKHYxNaYRm2hScLmUeXOHpdDtgbKZwnjNDcACV8+yZflztAvyWL7h7hjJn4pa54kcEC0SMzurmP3FmcNtbgB5Eav1qLCuLT4d60Gt6HPkmU/RQugEU+7ovSjjpYnVEoVKmEPHOSPF/JeLTUp5O0EEfZodw2yu0Jlfdjm8LJpYq5SPEFRsMAhROFbihYv2IkNIVMhhhZNqRpHLaqQHn4b7lS+Fds56GoHhxwrnwfxC/z5CHxMMVBBxgx6YXWIlO3zI+KQU/H9/oZP/iqyONTHJyIHmZ1xzX/fP5yLB+PDSr+I3ZbDw39n//3P+KmHfrtBVr8eRbzD4/52qLz4f4/ZDcRdBszxjAcIkGcWiGI/LBvZ12S13V3XYy3hCS0TbGsXCaPdk/VdDd6ybchyCTdyBWFfIww5EbUVvQg94lM5BNExTvvWU+/869NGxTbk535Nsu/+bsRW1bxFzbq8Jb2XGlURm2qWzm2TeCsoIdku4kMuRX9VsK44gyylxdX2NoUr6KtjWfr1SH3tiF0Q7Htd2hrxd2MY7Ctzkn9VuhKeG0Ig39FGIVWn7TEn6FLfRg/Cvw+kJnS5Z8Sgk4KN0sCbSiDFqabfOdvpjlCoyPRRV9cuLkBcclIMbw3vjAyCxbr0/mtlsdt3qsr4nAa9KmW99O2ihF+JoGczf1IAl0k7VfCs6PNyt0kzfocJO+J0tABvr9VC6b2DgjTpp8yn8zr58P+0h282LOOLLCnHQuevh+cV949au6qvAaPfgq1SdS9ksz3a3pVFJafBzL0MtbksIuiQWY5u8MTPpIAga8RKUOuXKZzmo6s+EPQ+TRbWWQi9qhZnYgX1ZTPo5fM6uglOdcqDUeBlNf1CzxgByCOB0aSVpBhaQh2df16HngYkh/kiN7S8Xl/T/w7uZW5+iwO2LVA/LKfD2lf1srJm6+HBMBjjTyR74W2jKP/ODJPs1+ZGAy1vuW8Tqz/gI+lcsusymBKnj7lOn2ooVBe3BQ/VPHAA1lLk2u4mJ8OS4YU/DGukcaVY/V5Oj4tnhPmZtDgp3zPT9VrM65mh87oU1Jw76k3zUoKaO1waVbeDJO3OHNC4ur0p8k7KQfbud0u2Xo7lCedvCmy3xZdOvNjjt2I6ngvuzDsI30CGpeZp5edCZyeCdf1rN4Lmhdbqd9iqnSHK0M54uN2NeFx1FhkVCteuryyW1rJFdKB8AxojyUQqLv+JLH2ljrU5X2gmgXt0yw99LAS3GcX7F1JOsej7mrdyuJJ2b8evAS5lm+cmgFBrI0+cznuVhpKeWVJOlGDkjbDZSWtQ80ttIlmbfyWZQOq+N6vep4+ylhSPHG5084lEIkYVWUkifgX8BJNFjHb9H3o/QY+YvcLEgXOIUiXuanjIKnYOAojWYkTqfQMA5vrSQMKeQ1KYDaSngeYrIuMu/eGJ8IBaoilOCiIqx35AFMf1tSuf7jwvjz4rxY4922kbfh3NnQ/5HT92SOAZrAa94KjRn6mMzHMcO5+Iw30bzndbeeP9gW2na3is7QWR45nhyaYoimuF5PxTX6fvlEr+vGDDL4VFF+8dAAVUZpEpJY1ylyf+fqVfPr+L9v3f0+Q2B+3D+8apGyGAyhmkWRE0Mg1b7G08ijPHoujTSweKmTgIU/96H02rn7+nuaMKzjYfpbiyGIHoymWZDEAN7hLLie8ULc/iCzV+3FAhTJ/R1GDx8qTVN2QgihOYRAXGaUW95JZnyNNnuql9LUowgAD0o7jbDte8+zr1yKM8QOljfNDwFsU0VKSDoxcqzPcLWVQchSc9aJbzrrw4EAq/GBZIB4Hgn+Ukj0n1sFCnxOmHW/PZ660Txu28RNpOaIlg94QZ8d3irfiC3+p+VNOp/zwOsxvQDy7g5vT2FXJvFhE43F+8+ka8CgxfVKoY355ytgCepRZv/PHPGZTEqZz4+KdMvVtd4wAgjiNZ+UgxYx8Dy+051Z8pGjUW7N1U0KnczWfuZQXKknwO0EHD6ggmMuRjzUhMOr7+hauacnN8/rtZWFUST23uxciPsB2z9rFGESQfdWH9e/0YqHI87S30T6fw/MUzTDIy9cyRQAKHgqzHdcwmLikHj3XDzU/LXRp6+vS7xTNJXL6S3gUG+liWjk4NqBxrk+P04SGS8D3PaCmeJPpiQi3Q2YvGGKUtCMXkvmGyyyAmbvuguq68F7PCeugElk9IP+ZrN9F632zhddhBEKNZ26v26kTh4B7HIPgLL/tuKrNF4/qVgzOInamUMHH1aF6l8b7/obe9IFmjYWBD9fnEzATknlkLTr78bpAxYsxWCBZ17VPtiMo5MwmnoWGufJfhGt22byz+78N2H531N9Dth+P+D5owwgQREgExBAIIjCKwnDko5htU/nE/4qgjdcT6Uay11/yZKPaCbi1OxHYXo4mt9Iu9HHMtpLzKNqS3J+ElbJsa6JK4q3iu7VuZVu0tpkA5Ru9z8Etz73GhtB6hfgXMVu8Owyh6ebiE8db2BZHWy4+xrfpZ2rvvl6DMYT4C4W3dPqWWge3EI6itsGrrZyeb2kKcO8Sz9LtJtbwcY0p1/gt/X3M9t4StfhXcVLZmd6uCtmECj4+Fin9bpYI2FVKweLHXLPwLSbb+oyt78Y96EkLvo+igC19EEvhZgz4LVL6mvmmZ92hUW2RQX333NV+3jYC1k+jTf/2boAfgrqP7uY3cdv2IbJf4rbpLEo5paNanqBzXnGta5DTMSP1Q2okca9WuLdI3vRqTyjn4Siqg9obEBYwnzWs4zUBvV9r7jRxuCq1HPUqsUhtPLKw+H65YUfaVqW3WDp2jgWXF/48+CVPxHcgcAgz1qX2cOwzwoLB20BDPi7a85FZVz1cYAv3gD1rFa0PBKK4yFGReq1yS9AicafMBOAW017DqVFgQpLjM+y9VyRc1iNXqPqye2GXSEqQsDlJS3h7gVVdEAGCgwV+H6lbNSUSgNPOiYC76Uo59PPdusnleQvVEq7dns1g96WJnUaF3KvJ4nkJ1AccCSfiHM32wROuWfgEMkXj1X5mYyfqJ06oJTTi2PkO6maPzt7lbMaMhDts3sbYdaAj/mVf8ctShSJeow9ZPwIJKXEGWAxFQV5botIG7sJdmRf3WPBDr3g97QwKLRU8nNzA1mrv3g2LSzTAhFCseXZUAK1jigd2pk/3IGAx6FC5t5nn++Mh9UR1au1uDeWUYSYqbmm5+yQx1LS4uTCGLCkfYksCJId5WEbX66hvR2JEFkt1yJb6BULcKB2fWaBGff/ubmYuxqKkzlRggfajuU2C/bJFJwcqXXg9GOTKoKQs9W2SZI0Gny6INcl5qgvWrYuXcZArk34uMPhqMUQTK00s8EQI73yMA1h5RBdETKwWxibG1w2p5iy3ek8CcmENXDLsk/gowLPPn5EkamT1jQzQlfxmH7wFbv9L3AYIOKePmcU8qz42yKdwi8Fk7Cv82hR/i9s+2hf4svM/xG3cP8VtwG6C+D/EbQAtncUio29gCZ5RxR3RvmdyiH5cIKoMolaM2jrgJEuBGpjHa8EWRSq4e4wvi3fxbV97wFekpLZ4aHC69M0MTaAQgYRQQu3fwvz+RJMHL3Lz3ahQb40+5mIxX6hhN/6VU4zr/UEBE3sPoYmaiTdmdbbCPC48G0wD+xBP90uT2BJ1VJGLv36KEFbLY4wKXItU0qGVnuMF900APiEofQ/fIMyl5hq8TQ78NG5DLl57qb7Uy6tTE62tuaZFc/vITMeXfksGdnpDs4qdhxCQHxn/sl76yiiOhH0pFtgnKJ/nCQrMHk3PyM1wvUHgAxfeShzVGieVQ6CFfjUKESeWJBBZzfoEUodm9I9TVteuR7iQ+3SItK78KuDC6MzQOMRoZ10UUd+8wz4ExVItNE80teDLSgKhcLCHc0YR3BWtzdZtlkwrqLfHQyl798gL1ovzQBgE2LyUPjpflGstRhJRLL6TmhaQ0s/hWDy440n3PPR2sB+vlz8lwnw+6fIiOIYuP6PqwL4CUI7eaWZerNc4CQcGH/tA4Y+AofUXnoYpjT1KfRYynT68mCCLupPVxFt2QG7xl25go2KctPOgY2F/F0zBCPF7FDTBAbjS1xZ8mHAeJQf+PMuobtOYyVLDWzeYQcejd1MmL01xDq+YK/iKDA9Eri9JzIgXJVZn4ClqLlgEQ4jOHJUQA0OVUXQlHhg9EKd6ubM+jS2PvoRZ7M+143dBmexzIWYXL/t+Q3fvu/s+4vZz4Pbnh/2grfn1kJ/67imKIFCMpCAYgwmCWIkqDhNrHAehMI6TOAwi8IedD8lWFdk0K3eJszXYwoitL2ENkEBq623Pdkn4rakA/pX0DEls+pbJHkmB6JbcQvaKSwpv0R8Fb7+s8ReSbUEiim5JPgTd8nnQr9JuObR1O8R7tm0NDaM9GNtEcJB9Zp3aKkdxspVx1gtvsmfINhYXY5/vfwv20F0tdG+QWCPSjNpqVpsGffoHlo3caytSDOy3vvsza1zowu8jiM2P3F2ZriH48Qid/FHnQ7FGYF+SXpfPMivNt7IKNa+L6/x5iGcCvq/ycM0n7ZbQs+b0ov/cyDBugjBbG73xSUgN2xyXgfUFTOdoaKvy2B8MJX1r7uscAfrbBd5AcmPeSftp4Pz7ig8/fhHh9L7WpT7qSwB+2ZhwetVF5ntLfoEFmWAd8u6it9LzlYlBTTg0WfNihPwChK/2gAbGO2hmBczH2ofFBWV4y7TGNH6z6OtYZT0q4n1dibcJpt4d3psOjjYG2ItP2wDAQkvpA/Xk/CTxqES8J3eZylHjDgeNTds+C8HV6xpzLH+0rHfhXs6qfCnEMM5heZGjDhh9cjLbyT63lUpONYgQL0kUIlp5OCaiMW+Ewoux5/1ONC0btEnpHd8O7TkLhwnuJbECCC5yI6lHelW6ceWByV4nKOnid9e+VJI+xiBUH1cGSlqsnaCIsVA4dVFBub1FDfgqGBsg67fuIpPELtEKSFHPKomvr9QyfGc0eoBGT8sclEU7wWul1/3xNeq4OSzTVrQDfJU8D2REoOX174/yNK/RpvOTyOYvOgOBn8MRszrBwrvjjzmW2sidO+apZjJQZOLkqNOfjZQ3XZdl13UpACUIqp+clD+Lunjgpwfok66LC1kf6roA34Rd/iZz8K2dkOOeDni/+lxvJ80L6ge9EU8R4TpPBMBDZAAxKkF5r8lG5OQflNFVTy5jrUFikummmdgJZh04Vrse49HMYdr0byrU0viDUJsjgFz69yXVEup8kBm/YQfTm2Y1eyiv4vWUp+GISMlLldZAeiJlz7xjQlm+oKS/93jfTXULcFj9YlXuffRv59bqlCozbrf5reiVRSiqjjqKe+npoJXuYe1WYR6IeXjTXCGl37dwPtsAu2IdHuFqfuBHiksPxySY4RLOLI4eYwOVkKcMHnX1aJ5DlRJDkWnslqzkUzAHY4S9LQCRn9LrJWKQr5rdwIHh6KEnX4vi0fEPWqh12DDphK1j9lWVQvQx3q/d2wBZouL/hdznjk7fCaT9OyT8wwN/xMJvB/3Q5kBs3fP4NniGQCAGYRgKIzAEUSgJoRhOESRGfdgGuGJWvmujbGiDbtR/hUcc2wo+KLXB4wY10V9xvleUPu6nR6IN4og9e7FC16Y+Df4F5TtW4RsaoZ+mwHaJtgTd+h7yvR4F/SqfgcLbsNlWekK3/RJyw7dt3jzeGjJWSN2s73b/FAzcal4wtVvwxdtbgJItPbMBKb4JoW5K2tB2Z+mOxZux3++7HN47GNpfwZCBgrI3VrbbNTrFnGXyXA39x0Nop/8dDL91q6+oJnzGKvs73bEf5stoRHNqUKtk9JMSdT0BWrW199WQVtHbnPjp394R8PMt/ckdfS92Bvxmduyt20RwFycvMsMJs/RuXRTOsDZerWM1BVypAKV57t9Zn1mNpiDCAvmvCrHsjsUX4QrN9eJohJTTHZIXB1zrq6sUZu+KzJPZKX2SekTAUZCekRab8WCRii6+zEfpu6L2Qs8YdOzL2wWsX02mYRpsG9Jg5bWu3M6qGh5rEfOiRAGqmyxI3Tu1ZJ81n4wyMlBB6vxFVS53argw9XAWxiGRAxoqGIb1sxBd2XLUP99dYzk3GZDaC1Yf/YH01KQNC6oPgojj3OWwXpihA0/iRJrAuyAilTWWvRsHRyug3KeiSnsWpkMAD2Fxb6dzeWGQanAV6HJ7u+mBxDz1rrDXIub7RlHRq3r0mBK8nG8V0nPfxM7AESjC7o/Uzv5dF9+J4hlNYfK65GAQxejX8rhK93Z5tCuJM7+InT019jECp4i+dawvyvCPamfJ5ycu/ax9vrtyQLq0PkivAFEe2na79kNcoyqTKarEW/+/KaDS/yCAWonFlc4jK3NHCIGl4SWNoAq4VsAR05WcDeMdNaUjiKz16Jyk5PGDEXQ4eYjY0gMZnTDuysn0uF6G/LrnLzV2OdwuBiCBlRG+TdJkI7sVx5goLZFjssUdLnEfitay5E58SG4s1xuiReI9dE0EksLO6LvuKa0FZAxsOejaH/n08HiyeokZx5NLcdHFgkPwfWbQpaXfGYTGFvd0H09BOWIIG+hvPJRSOg6AUufxk8Pyy1PGClGOBy292PE0eJ5wE9zhoJt5DV38QEfqUdAf/c1fhCiZJC+SR4qcEiAnVa5lprtzjWgc6dHQ9UuaGd5rvOyFnCW/lBNGxpZ5ypWzPB2j+DTmliGlMnK1fDLx/xgQWUMzOOMfBEm/7ED/wmHsvzrBF4D854N/nD9DEWyFSQRHSRilVqik0JVOkhhIrj9IBEVxFCM+LAB8ks5ONwPXLZm+OSQkWxafQveGumRXMIG+aFl/3BaI41vv3oqpK4ble1v75tKAbywvxbb29U1Bbe8GjHeQW/eJ002QhfgVYK4HwHsj3wrX+afG9/yvCNny+yukZzuzhaBNGG3jivHWxkFQuz/s3uK/mZtR21HkrqEKYrtM93qeeHda+61pLC9tjGj8WgAwnY5fP32lQenHGlKhEF3HzfmXwqU/K1+D8nduZOurdTqHvgCGF7lw/K1P/NokiNUkFW9u47HAfuCkSS4sPMKWmkOOjzSm+IJvlglSugNa572p4zvLM2Whm89tI5oj1frZcSne+ciF6AcFsq/DavMm6rz1zwOfp9U2wbR55abrfy6mO02kbXbbP6KvZFbfLH1YRrMtRGk2tamtYqBvbfyRuLIE0Zs1i/7UbG2aEj+mTuBPbYwotWZ1o0h/aaMUOAeEzoDFk7vD0nfGQTeNdb/UKLLvPoMPNTSAr6JwP422/dNkG8izaomoVW29EcBN+Nij7QDE2+OYRaeL85IOxEteCqRSF1Js3mx58tjw/nwQnZeNqSBMSwaxtQsxx2EFTFgcxBS0Cd+PLq6AgxA7jZZ2jHTMYyNnHCdJXNw3fXUiKXhVDSkpeKUoyFxMUTBcQxIwsYfnE9lLV6QDJMqtyEfR+fBmDrloeofXIytgFUbkMWpjD+WjKtGnDs5J3pYbBLlfeuAAp08za0kjBmfYl1kyFruzjyI3Q36jT6NUurf4EjyuNPjqPFxshWsGC3/Q0ElcBvtyADjncJPiu7N+FmqvDw/DoDyXNYXQjRydJ59VhIgQy4dgR5wYX5gYRJewoAv5O8g7CWYAt5Mn39VHS32zZDXWh0j9yWlV9Q1fnerR03GLHhy2l2NM0pveB760OP5Z6p1RPs2Rk7xZrXtyeAGcTzR+ra5dKlmjUZLvDY73hLdP1TGsXz8lv6n9qbN46m/fFeB7RZZ15zn+KGv0eX783JdZewxiPE2wJ1K+pIscAHZqSBhvrLHeURnefvfMKC9nBTvMbx6XCQ+Kw7UaMSy1UHmnSKeYZM+GyMsDgzPsg34DMksxJSYlNu+TZBJnr1t418iCVlf0dwzkdksOcnMml1GIO0UO2pdeoIZODhEF2ouWHAFrSrXuIYtNcfPhI3o88yGDQFXpFSRpkHxSL5fQEE4P4lE91IoxGs4HFYZSM/EWkYWMAovi2fWRWWPtNpHFnCfererBEljfQuqM2roX5x0WLR6Zu6E3hNEBo5M7dr5j1uKGWJquKxJ+YFGjFVAD05hTMTmax8S1fiATIX2dA7tDSJ3Jqqnku3fFCJpFSJmKBYFTPoyVtQPhv/Fo17Pn2N3r/9hd89pQ8/EdiGY/4O/f91T/P/X/Y3/u4/8/csIvuP6HJ/sB4CF8Jb0UtDJhmNqGy9d/V8wnMAxHSJyEYJQk1g0fpoeRrWa+gvBKgTc172i3mkj3DCu0JYYpfKu0r2x0BdRfTJgT6O4Oimzp4RW2M2KTOaf21gE03obr1t+RZCv74+gmsbapmmK7ynj2KzU1bIPqeDfDWM+70lgi2u8z2dpFN2FTYvN/gsDtrqJ9Wm4NGYh9Kp4iNo4P7hfbPJ92Nr31i6a7SfwWbvyWEWNbV+YD/wrwHvlYYlJJhFcoCde8qjmhQz9OD5cfMeIfxBud1gPTlXJG8+ajMUG7uthNKxwW09RaewHbALj6ZZp8To3wYiErEt5lYV2LJG9fd5KfcHvlp1/lyYBv0mrBJjU1/SDJslLmnTFXGmQ4LrYy5vLnOwb+7S3/fMfAv73ln/XDf0Opufot4bYmIiIso3eWWAOoF31rnkR2yDsbXMYFSAiNV4lpqgw/f5ZKcW6odClux6IY47YRTLGMFCT1rhfrlvAF+WQHhbtYuakrcoHfzmfAYEdRKRo8eee4y6no2J+dKJKrpRanxXA8aYmtsrqjlXguBaHpCRNxcvjdvehz48D3BmhFvbdp/6C+yeX5ai++f0PDqX3VsOhbzMVJ7vTxLfYUwV+PVWLchxt/d+GGcRcbeqg3AWCKO//gL5DpQa/S9Yiz82irNfbEUtXKY9mCzs9AK09Rod2So7n0OYRyDYkSNGNLCkKjwBBgr8ecwq0gFUymXYfp7l1tmTzFfiQ8fHo420S0sGcVDNjuzmvyi3O+Uepko9Tmj2yY5cc5XyMAEA/gLhtOT/am3gVai1LtI+kWgPmVdosgf6bOlqrx9WjhjNDxhmj+pBMObDZhCUw9EkR/fMbir98Hd92e7kEdtvwo1+f98F34xLF/SaVZ4l6/b08ov+d493yuMcrVvzPYyU0xIyEBPLfC8JJB2RppVrYLo9JwUauK9mCWa+mIuxENnLWYiaqDrJ4nYWHKsQ09i3uN6UuujsAVopNiBU6UO9FvnFYtsuK07BCGy4l2puSamVN/0bFMP6Hs044HV6eOoug+5lyp0KiWgONtmiT4sShilzF5IqzR/sCvcHZpJfVeVk7+OIFhz7eXZXwpwlH16eP9ZMxvPowXRHq+gfGUyWSjIw+Yye4D2sGV+4gXSwDn+Iq8ptiZ07twmylrDZ2Ku6FkVmImDoR319CgTEkHenFqopOgpM3EzWlJ6m366EMbgrQZW0MWyCulDNbO9wP5qgN+Hr2ILdZPbP63VJpn2f+dTv/7k/xEqf/hBN+jLgphBAmTK8ISILkCMLyC7YpkFAxhJEWABIWQIPXhKASxu33n+S5Ymm7sGEM2xRSc3KRNV1JMkFvPHJRtrBn+RVvdfjSabW11mxViuiuL78N76/lWeoyBu3QovmWiyWyH8h2hf1mTXRnw1jsHb1i7QjeEbkN8K5quvDlKt8l0eNdIRXab8Xw/O76blyC7ZWO0K7Ot97Hi/HofK4Sn8XZPK9/fDv+taRVbbqy6+KaFJoHZe2hlOhEY16HFrIWN8FTRJ6YoVtCtjPOWJFtY5ur8NMr9bxn1p768/4JRb1Wwr9N68jdGLZig9ofap8WoLTT8mVV/EU1bNzo8+g2hP73H371F4Hfv8XdvEfjde/zdWwR+fo9pRZtMkXz+c8kMU7j3wjRpudBLeoVxC3m806RlheBCpJltAcLTvgf9DTo3sso8MIaWDhfU7OozAzKMsUa1Hag041KkmYMfkOx0ertcwD/gcgoqYQAVIMmtE8VezecZlyURPcYs+Wa9Ju69h6pht3JcYOXgdw+CUB3m1VY7EfxJSAxKomQNTlryFiKD6eZ5o1lyit2c7A8avYDvOr1+fFRHvdtk++iKp4lRj7NhRjK6n59olR8JTxTo+nQYuBbIzUpcV3pKPF2Xtx2fAnpOl77NF2g8a4Z4EDhpoCvapRSNtKNkyXpGtAi9yi0jdu7pGxC5jHaPRCobNNRWsTWNIoY9l5Q8kqnKdb5HtbaRBn9OmPbFsLhF24TytWzn7lk+fl57P97l68r6+eUfWAu5JSRBeGUrMEghOAwRH44mR3sab6UoWLz3l+xmq9Au2ZiSm3gkjG86zuv6mafrovqxedJGXv6CkE05EsV25yR0Sxpuzn7wxkk+9Qtjn2bR0I1orCfbBpd/aRmLbAvg1jMTb6dOd3lLlNyUutZ1cl1Ct0E1eHNnSohtVm3jVOi2qK6UKI93xS1oKxtuThD7ANr6vnJsa4+ONt71W4oybEW7nv02OHYmEnTkz7NbHT8cHOPMnwfHQnt9rrdq/J5b4+iGj8TmmfkUGF20iXc+hW7rQ66xX9JoMHbdmlMAbivEfbJMgDRHG/VPI8g/bxv1n5pTrEae+HVRAD53p2isa3WRD2ExYvXJwlufizJr9DjKn5eXW9z+K8dXTo7OkgI9o0WX3La4Eo+nSgwXg28JS5CCTCxzJkQBk5XqQMGiWTxfJ1X06zcZxH5dofazpCik1MuDxRCNvIzEI4uDB7ZYakIXTbfMkjjdZqAwk7Oh0CE4SYfr3Zk3TwOpj/VCXAxjEZ3n+1SAp9bjb3DTPqb7LFt+WRk9NsueO8UjsDD5w4OOfVcMAZsS1QWb3ghfVVfz4flDhN/wSUbHdqaO5ow0KPi+TujFVeKlQMsKhE0AQsBZVDVVFYdjVZEuH9QFd0vcpwO7rJwjikV4j5amCZEcTqz3OlVoEExJc14wXmZiGFAeRXMvvNPTSCv1bGhCox8u54clFhVjtadcvlfT2EE9cu5wn47zr+QgHscirn9p8fdDT4n4Qg6m05pP1grfhTS7T0+gmg5DGH4EQvpzi6sAjj5K/8PO4tU4mfD3j/H2FAP/7WNcFDV9fC4VQJtHxT6THwh98KK2fgFZnxVtWhQP/PZw7byGZpa/iaF9y/JdTS2rbxJsDsdrB4sZfjzT3PHUQPrgYc/oEHEBlbdo7sj3N2iSVyD28MZtzwb/rt6nZ//Gl60RRJXm5XGQ23cU2NgRkmQKcbirVE+0GIxnaH0ci4UhWuGWAHkSYRzbaJ1jlDic4GHgOM1Lfaa1N1aEe0fedQXVzevM2NDUk5DUcOYYUEPCm2zweL0Ayb8yPd5fcMEYGEoWqafrMsXLopGVKEgnKAj99a5fGJflEAI5OvKKA6io5QY+N6ONj8ATNNuRjek75I636u3pZRcyZyuR3sezquZH8AxLJiN5vG0QtkZfh8js1Bz0DipjnI7mCPizRPIhD75r6Z1h8CXND5cmYX2fPQ4vML68Dk6o/huVSHaOV8zZG0y+V2Y0vnthNy/4Gcf+/LCv2PbhIT8wBRLBCBCBCRLFKHzlDASBkiiCf0wOdnfZlQeQxBZW49Su/LTnuLJolyRGtgTXNi29qSf/SqoKRbYkW7wX3rb6F7lVu1ZY22p2xDbGvFmU72YJMLwRiCTZIvtfegVS+G5NmO+uhcjWbrn+/DQAtFXjqK2utg1SR5vxLU5sXTTg3gET707um6kRtF1yfQubeyCy9duswI5QWw0v+n3DZreRg679Anfqugxt/zAc6g+qW3w4d2MsnyzIgS8e5CbSlFsG6lNj2vhZluqHiWQu85VtjfjcKvlJCxH4Iob4rTFTnvaZmq8KU5+UOL7b9vXqX+wJ/uurbxcH9qv/i1rVQSvJt2WZ4fV8JHUdAwj2PD+nu1R1l4m/Ga0YdSaMzesdWVG6YFbuxTDCGjBkQLmv8oiTegrXElDU5T7YLTagkHF5XKK8Ff2CBwnx1NoxFNL2Mpkixb0riC0POE2gA4jJjQgbjcObFwMu1RjxjBaeAUl9FiMfqnTuKfcbJpZPBqwiXqMfxOtoZOeX+GxJhOJplWoVy7wjFr1+Npl/Xr85EVGegSfy0HqnuiN1HkMeiB3l8kZSyZCepc4fZOIGsVtHnqAnihmGlyRA1TcSr8tmOJWzry8ru6B7Dmx7+8wuwz19TFEyGi6T3h9OebFDh9TQRB6v12E9/lVYpWmMuSExCF+EU7/QAXCx3Vtvfq1VNZoslh/lvX6V9gJ+LGzZMCs99OwxP2R+Fr1KyRb8+bra0Ogt9PFLrcrgNoJoF9qwksRriX2tVW0SZFqJjamvPCJfe/7QXrL3YlJVuv0n7ZrXexoM+Fl6SlADORshfDmNhSOHvtYQ5wHGBfXCXD6KI4HP/Sc+MXZVJ1hGE+bKQb5F62LvdiPdUAzpDERWXb1rP1bsE2b8k5qdlSUQooOkVYA/pCSTnym5ehigGfPwEmrJaBtYTJeYdlnU4RLKBwN16q7oYZRVFLIMxJQoJ2hmE3cCLkaD3VBGOkfwlR0T9+zmRxquI45+8hisNT1ymOf4Cl8NsKJuoDSsOANSh+V9aE/PB9wBXZvc3aePhDmNOaJR1JfWcQvKRQKDuFHiuYf0ZSTfR82YSEatAos5OBeEV+R7+jq/ugSgQTwVS+Z6QHmEEAiSrf07dEguXsoWeMvG/TuuKuHRj0VYCAr4bMC5ryc/DRKTuYCVD/gq5GuWYvBJcUVVzar9S/w8RbKhYd6fGv2w19etuI7Rf5ysyZKu3VSi/p//rKi/+/Fk55P8WSXqT+x9/veTfYHD3+77g6k7SWE4SJIrKBIIBpEUjmEgAmLraoetG2ACB1Hiw1ZOaKddKxqtULYJRO2qiRuWpJuF3UbtsI3UbYMD8V/xxzm0FadW2ALTrWeSyLYs2fpzZZkrv1wxd2WIK85iexEr2aWW19OvcJxskli/cuQDd7sfdO8rRTZ6uNG9fXIW202G4L3RZcXIzQMh2hpq0uxz+wyyZ9hWDrhCO7Zn4bKd4a77gLuO1h+Mpj42Voh9s9QVkpIK3TS5E+WFFoiaeZ7I28etnNnPhSvXW/hqjZk/5YiKMTLhKxS3aZfCfOGJ3iP0t3z8Lly1LmATCIQsOp0quvssPqzJvmfaYP1VPup3jSbA3mnC8fPmj/KpSJXussg/b9ME9CdZZOui2doIyOZnFsD0XCR5rxC+IoG9GbFMzbYsbsMParmudJJVqxU/aOznFNg4XkOPUQHb/qq39c9mgr+YcQW+Fyf5MuOK2u6Z6JC45HQoJOGnhIC408IpOJMuCevgPPLXqMqHq0BLgD2HMevqDznEhll3Ocpn+opcRvll5tgxHeRKRFTmMqNnlI7q8/EKX8SndWd6cHrKN/oKlJU0N4itsJbcSgpxgq1T2ThLhPvZkT0xNUqF7BO8vJujA1NpBtlXl/UlOPD5Z/HWkJXch52jQWcryBscSlP0gXULNbLicoX0hivfgzGh7oU9XRiWc20J4R0QvDZEY2vwpQhkCHCY2yPMw/tk+leiThzorl0VzDTZZ10bxLDyal3UuJVp6tUFgu8vY6mqE2VfuHsdr3CmAPmSDIdLii6Q8/TBKO1Q2qjdMwM1z1xQh7zvwNoCmfCNyOijCh/68RCCHmj45nCP8pwGHoUlZI1J3++YQ90vNzQvyG6R7CFHr27rCH2bj6mZiA1jM14S3DBaPAukMCRpdrCPLxfwJejAO8ZkvtMyZip/GZvufKMe1BU/BwPcBNRD6SeyNGs+i7H2dH7m2Blk8CxmGzpUbeDmgLIQuSZtw4t2i7rGhJesvxPMxKC8f7xWZIZzsxul7L2RlCvTpuT1eig9pu1OD7iXgLS9wMbjcA6uSZiNXbdYd7uY0Os0z8f3m7pGanoTiSfqBIgRHi71GOCIDMflLWQgXSl7QC9fpzXWwW7ZopV3CVWCJvHvwbtiqGdm2ze3rbgrdynDDqq40tMhq52xW4308yn1OJ4FPuuLDZpY/FgFZFCNIsIb+RJtpWiEUXAxdStB1kP5vSHR14Zawwz4cO4kmjY3T8xRNXeDMmVLB3OFxoqFS2t0IjJ+ssY4a1TPWMJDUyWAbUKSaJ4op1wwUTgz/XUJ+F812KxfNDY2OBeqmXPvKa9cZIDXu4Fl1oAUmAEhcQh1AXvQwjm8HU/twzYlS+yGafCNjFE7i2oCcdKGy62Nb2M3hHjQAOcx7L3bmSvbNSaZW8ZDTHHul+FkFGg4B3cy9aEz7DsHLkyrDtZNlpXE7P5WSHoz0zoDyuXZuZLl3egpzL2OMkOzcYuqsObR06yb9x5Tb7o/7GeYgxfUEF43iYH9meEvwYm9s0eg6HMErxD88Bqfg126BhSnYMNv80AUy/haCslg84ziu66lVcuf9csrvldNz8JKYbI0DFT4kdBf6JPlu/SlHuLL1s5vvYoEj4ODSBTaaOXRqbtdD0g4hmxCxEgVVf47oA53UW9xAHs1J7xhTxwsOtJLfoqZPDacb19MHGZwMixkSqoFQVVrJL1mqs028knA7qR4X1nYy2WADtYQ2Z34SXlarcUbCTaKFWS++vmaWVwreSWIvAOPbwxes+c5GbGToIuSyhFlbNe6DRwrE8/jqj+lEzwkxXhgrKnQgkyvr6BcC8kaQ3WiJKpm0PAYggU+XqKVde57eOGsA7wAYg+V9w5e+YGdIV5tjjiSojVSaelFIoxqfpxxW7oGJ/G9hOSxuD0f7UGKrUeoMEfKcHjApxLkXssGEplRjMyyp7l+/BLwiCVQ407qPTcrBlLenNbgGJaXQxSZi/pm+kd4WswDB1x18yDLF8SuwPvtDA5s0eh4J6F8+OfWypt+ti2L+haSff3dMgznPyz9Yzj3mz2/xGo/v/Sj1jYMgTBMwCgFYR/2DkG7s8Qa8qT4lhBAom0QM6c2R8V8Twts3b7x1oqDon9BH5si59FnUW0E32qN8G4SsWUI0u00a5C0DYLmW4Nuvnf2Esl2yjVOon7VHJxF2zDrepYE3dqZ0L2jKVrjt3jLq6xRIfRp0gfbUyHp1lBEprtk6d4KtSnSfdLxJrYz4Ph2NjTbagToJjfy20yFsYVg5dfEvCjTgSDcaPbjpPzjp2xmo5w1i/9UUdrV3K67uLQLNpJT/ahAvds5CLpigWjh1tTZ+9FcYkvQm5O+yKPGWZ/NJX7c9vPVt4sD/8vVt0lR4I8lrNVkeV0IWXEH45m+wBPzGjyM6wDQVp1QvTv1oXLvcng1xb7w4Kt75WEyakyWyY95i3XDvQGl9cvEnaTj+zC/8SyXpHtOm4A722YJx8ogl/c7NFS00R5edfzyEZ1QmYwtPKxUTzwbxgY12Q86fzgkvegXLkPKwwNLASsN0MXx4cdDMm+ycBpe9kx7Y1pBh3BSxecaC15xjJaLjlu0k85hPbuiuNvZGRRDeG0CBk0cKnCKWzAezNwfWcnhQLlYnrflkurH5KoLHHdzsc726JPRo/OIPtSqTSv5+RKu4xtQOtlEX3rT0B0/CgRy8d4ob6jm69arBwpF6BWY/bmqwH5aztVJak+S4trHCzKMywMkv2L3b7VBfyhlJt+kQYEd6A1Wa6lHY8fnKZdj/1GfJJZi7p1+q/9BlfoAXmcFUKsLeZAuKXajmvJszY5WP6BFMUgKDDM3o6rqGdcjZdq26USTKSYvUgFx8YqCLD9nSQBoN5O0RfR8A98uNRFOjYa1p6RV0nCelxxxWdHYrn9zMqYbQuPBncRgcQJeJZJ8q/EYAihaTAehjor1j9jgITjBHO+T06W6K9DRerBs+gxj5OREeTKZ6Uq+1YP0uIN+lrcDpuIyoKTQVZm15OnwEsNFoNizVCdZkys3zzfjVBwavcjocZhwWllOugxmXBwamf1MDu+k1kegPN7WEGt0hhtut1Dq1Md+HHve0PI2DiGkb6prdiH0/5+6N1lyVNu2RPt8xW5mmuymAFFes2xQFwIkEAghyw41ohZIVF//WPIiKo+zY5+8z+57jfBwIVgULq0x51xjjrHYTXq+0kQcZexN0fCzfz3zDF8aEP0kRrfAVUu0vAu85/+4/C3FzVt35bG7VX43/5YR864l9bn/h5/v/wj/518oDJN//fjOf/wlNt1f/tvhSxz99ezjv5q6nH+qo/93nP8D1f7Rub+HPAoGxXlih8K7HYXABOD3ICRJwxSJIySNEQiNYl/2ybx5BwIdrOBV8U5ArYB6reXuEFB/R1Bg47DCJbn7T+Jrf4kVhUATCgYIQDsSYNGKemQEyDQkDIoa+KtFBUdA3R60uhCAALvCVPC7agS4pOC1Fo29WEAo4MoSr5UFYCtBvQ5+GTECo6kAaJcSr0Xp9azrW3QA0Bx5rRmAXhoCHIsir15U8g/6ZLjuJZ/9rU/mqGnwiWkYbCA7lX/EHk/y/s80iYVjqy/NGXLG+ZSocqIyQD7K5G+eqocV3T5cj3Quy6H9iQFWvztF+GXnVDuxUrBTUu8zpW/LK8ciIeqkAYr3sS2g0Ht/H2goeVjoefhoGHVktQ1ccQZm6v+qpAHFP8pz7V56DvYPxhQYEOs+8Mpi2AVyODegYvjTOn15tnXLG8WPHpgRka8u/SHP8G73XozGh7fGwjTeXKSgXgIZM/vLzi+h14qeFenzUomra6br8ykViX4GcjGt4QP82Sukff+0RXb2XSQL6+LvGE7gIcuQnrMo6G9k5xUrdIwGy6rs6cmyDHNjUGXN9dyJOMK86BzL7vCUjUm8kfSeN0qVts6hBp0ahDzzPRGU1JnpWbPtqVLb7fYnLZcdSQ/3N0FJ1AZFmWEDnwLR5YVxz12WyxnNn5pfQg9VewTcnBA0wt98hTrBN0teR1QfW9fjCFr5G5j81WfpZwlt9pwY58g6J33Z32HeT0a22d43wvly1plGgjju7d5BzwmDhowumZwunVzXDxouIrTn0Po3JR9lXLatez6fipHzto/+suSBVkg2dDfJqo7GSdb2aTulYRzLspEq46H0h6q2enp48hh/tDlxk9W6GtRw4D76p8VWhxv7DBeo44kmtTRzJjuzSJ9o3fp3ltn8ucvBeZ0iX5qCTn0b4q7/dLr7LdHy44hvFvGfY7zNzu+NDtv3mZ7666cj/hRq/j92aR8o9A8v6wccwlGYxkmM3GEwheEUQq8oROxIHCUwDN4hJEpQX1fFAeRE72a2wFY+AvoEa9pDhYBlFCHAHgHBQNmcBonQ1wIHBICD8OVxS7wMGEgUyA6sg60/fRykZ+vGFVDgl2YjGYAUDgb8pt/gEPpqzQTuuAhQKFiHIBGg5BPF4MJAy8jLLQmIMiQgtwMdHRS4i5ACpW8yAQkY9eJ90TBIB4EFMAwAbM0Fd3/bziE8X4KN0icOmWwnXDlpEWaB57uhELJOlH+pivdv/ZqD/au+zjcBnxWLymu5TqEvNUTtYz7+tqyrQcJ0dVeYaN/1FD/m4k8au24344H5mLyFz8n7wLGv46C3A9/9628AUq5DeGOzj7k2Bt628nm5ntghqCZct9PR+OzGoF3ou7Ofg6pE19fL95aEf1SXP/AMrPPKD3aFxvLqCv2+AZT+ov3lAums80E1PZyr8+yfX5Lfn4bo3xTKe1v87oEq4hvsQIqAl5EcrZfUT4ecwT6R/pTl70CPKeKvf4kPsIP+FdqBFdYPjquGfH/289O/rK9r4xsH4A9WBr5cpYe+WqafUGF36QTWMB43ZHKDLZL5OafnSMUdiig2K8Ug8DK9HpRFXJOBc5EFp1uYDI8hqP3FgZmHnj5C4iL7F+ksLwXVF6ZcH9LDpkD2Eycne1c66jc1S3tXhmSU0BORchVRFOALezxvulw+HPU4xj2UIbkedu2RW+oqC7t4ZHZxISzxQViwQTeleiNDmkaidBJx2NPdZuhevYystqPWHE8+C3ohEHItPv2w1yLHU+CwO+3xi7lsn7gpPYpcjAxoy+pW7NmPS2mjhkopTKKbquldTo9uki9t5eNZer3bV5JWnukgj+RY3y29OPtPhQ/yow11Kn1m9ATlpLvzPG/DFfWmTOJxdw6tx3F0qe7h+g1T5t9W6ef1Uzl8iD1AH2oPH7XpL2lf0prbcr0ESsvsKOjs+kG+EGLUiP0IuTZ70UXH5dzy4blRqaFRe80Z0C81sqMn7keMZ7JGEJVtCU93qVPQg08dj6nUOSc27aF4Kp4657jfqUT0ARoNWv365H2nuUijIToNV5R6XtGy+uAOQB/kgWjbtichTpxJO4/PRtZrT4avoSx9NZW9k9NOQ45BPXOsNCki17xy51HT0z6WNJ/uwlkrkOf6ufC2TbGpZj4X4uiAHpdqKFG9da3+ElOdet9AfWxOSuiz5fnq853MIZpUuf4yedQTs1nkWgjrrMp6jYzcn8LxyTp8qgf6Mh3DI+JtDguEzbKq8nW7tc6VNZiBELFGSBi0NRQ06WeJ97Cn4zZPIzHsJBVlH7rZoO3p0l74rmPRDcRO8ohEQ4R7y4jY+zHdXC9Ys9kOd+k+LHD0iEyMeMTjhW+Pfr45jtK194iuRX3TpRXZgkrLPCQhejaM+pTv2CW9PMOkQz0vysQMv5lT/JR03UOGLb8dEVdJ4WFgr4oUJnusUg87iNRRzksEDC82l4pr/fwftqBqTVj8xXR+Pf/1P7jS7/uXw8b//Ev8P08YwZGHX/+fKfH7/zPF0WNYfyL1ewPp68B98ngFLvYXuxU3P1o37op14B+CjTW+GG5h3P/PX/tX/5uv5rvm13/jSn7M4XEMQwG/DiGQL02VQ/wlmUS+GnB2gLUWvaq9OwwQthEKBCFJCDpWfVAd/jJGWqMSmALcbfwlKY28hoSxV35Nv7jlL59GYFX16oNdz0aTL8HF3xqRhCAEAhZaL9rAGhol8KszCAZjxTAokEfoi10QA3YCQgN6+hqKASOVCCTqa7AUvQrW6zWBLh4MpP3YSxaKpv42RhJBjDR8ekFKJ0focYYxf67zcaOzIphUfw/z66SqKmf7G3ubBezt+lx4F7ZcM+bv5aXXcGFFcmEaPLRPT+gV1nJht6bazsc6/PMsic+RbJeRQOCoP2RBXXa+KxYjaXQKl/0arYhGCYU12HBe9oB8zusfHPIedK7aEp37M8sC18U1JW9MdMrCnf7uN1KkVu9aUPTLWT9bdCb95dTsrCGQMr310IJtgAb4vi1f48T2J1ntk+h8Rz4OdU5Qkaskjtc1nPnesIVnJhAK6lCArvcnPKoVXidjYZAPFoVWWlnQH4iQOjwiOeAbF8d9tMyu+mHxZ3A7b2k49F0ebq8PCX0Za84FYCUuHxRo7bunb15UcJvpXjB672Isa5AVDYFktooQiMXl17P+HQER+iG04aw4JHEtsGy+Sey8xNkn4HnL+fK80mWBsfd9QjXj3BxzRZdzmu9sqBQpPxEfj2FhjxmXoPVEq4PuX7mWn/nteWti5s5DJC2+n8et3HqLRwRkaEiBYo2XqFsg5srkWwEb7xcyU9FjTbom1Wi5qqPHjdjy217LaYRYo2vV4jkyOLu+H58fTCHvWLyjexw6M0gZRcXZvK5ZAkL2dLObtgRSbG+cjyBLt717CSed8tvueu4sjNxLzDObL839TiVTZUmQokVjsizxyXi6Dhni0cb0sT50szVGc+cNKVmuuJEqkb5W9T1R4Jao0DY9UgHm0Wd5QiFWfXQbh40Y3pa1tkTq2FUYojU2zPFk1gEjAbGM/U1rYGc0F+b0PdGQ4xmgIiVv1zBG+A0z8Qdy/nJs62LLoU+DK0eWXJwtqkMOveER3Pt5GUf71GPcP7ZkNrr360g5JpeOrKCwfnzFK4q9idYaKw8SLu2RfZcQrMkdHG37QBKOak6oUqSeotGuPMkSgXl23qVJe2vsh+89Ds41tDO8Qjlow1FlqCmZ2ouzY210TT8IhW74Odkd6X1UtvHTg5Ne7IsrIp6Me4Cdc13hR+SKJXtr4aBgvVj3jJru8mx4mz8OO2S7DFKUkjvVqrC0HcrMCZpM2z03rXXOm+h0zrZS/EwOKrWgIvTU8mDoXHyf1L6xznmnq8lngl0PsD4tO1dTIxluKxspBr9j454mfEczKs1fmGtiNE8UuuQSth8eMV3LicX58XTwjCIwn9HVZRy31fS9P3p3yaaug7f0Vh7Z9NUi/4Eeo9zUabH+++vY9I9PQ0hkheUf3vkJ6//8qA9M/s0RPypMwV9y2X0KJPWgGk6/Mnoa0NKJl1IDhoJfaAqIFYYhYISHX5fFATj7wDQMhcFC7YqhKwyugIu9XB6BJHACtBBX9CZi0MyFU+An5a+//E58+FU7J19GYyvs4gioh6D+y9ICUOBBGACjYAl6BdPoZTMRv7j4gHOPvHjw8KuA/mrdjaiXCQUGivFhsp77b1eIdbAKmn2S9Dhm8zV//WejhpPQT9CPZfBsTfijLkDxWhHZAUDtN+lf3RbhX95PoW9ejsz0XpheVvgFKAHatibjjc/+sQ02bGUGhemPq4G+v5x/52qg7y/nh6v5Q347EB9muiOFPZ5lxRR13nR2VhxLJt/VONYh+Dbd0+TtdJJPGoo259lPyMtxrJ3dVUKYdjGh/Nxl59Aws65o1RUSUJ+ffFNv1hOIyg1x2+XhlGfv5lrUOv1T6dFFb0aH5Y0mPh+BUEPHpbS5+N75zwzue7W8KMQ20Q0s09FYHBZEK6h0n96SaHsU5f7kO5UXn0QyFxj/qLR5Bl09LLicjOpA3kq9lJXsfs/uV3wbtTbXVvPOTPjzzHgY/jD1Nf0mbQkxc/3Eq5RgZ2JBQ3V9hh+PlLvkdzPuWc6otd4vdiFJmcxu0r0zQlWxnrtcXe6GbTw8dj7emk9BRGCTqLYZdMcd64LCVINMRooMcz9V+1TptexDi2n2RpX/FV7e0YWHvoKX6Zc/37e+KL4Izsc9ecvoMk69noMqQVByYabQx/BUpyeHo61Isr5mY25Kkeo4nO/us2+fQYxLN5Ss9zfC7adiIchTcteUNQVbkaMkveejCmtkf1W31rwGPn5s3rahUs2+vVV90a6mMAo7J84esroGbacObjyVRMKShZqbzkZ8dr6NG1yr4pvCmDu0HTV4CjNM2Vxi2xoyIeXW72yA55ZQ4+JIK2ycCUduH6k9JGR24a2xlKBycSZyJKVeB+u62VNU29vbxjpkztnqj4aMGYHmCCfyzNampdOK/3Ru9/YAJbo0bYjEfZzCoSQeT4zd3WBr7GXYvm01wmquC4ncSjvE/MShM54vd66HqZPssfC8RnoQUw1X9580Rr0J674q02Au5xgETP6q3/r1X18naG9F7y9Fff+tYX6U+P1hiB9A5StEWRMp/JXbxChIctZpl4JfVr8oaEWKMYAlay63vgS69sTXBe4AZEZ0Atp1EwostK5p4Jq50eFLciF6aQYFoHdqzcUIHPRLrZM8cA/+nU8xYCglgMW05mN0DJhQKwohLykHADb0axkWB0oKAPBIgILRa611TSLxl5XRCiRYApAS6Ne/1PRB+R4FskzI3yNKAJK38nOhlWW+pnh7P9Vm9w4vdNCHYT2X6bdTJY6ei321tPddSvFeis6FUGebN0BgQIL0LnP6Xmp+VUtNGKROb5ykgw0qyOlo8A5q8NG7hCADQ99v1MX0R1JS0Zr6qR/378xuYVb3a1qZrSf4zASh71PBj0zwWy1+HKWPaviKaO/q5O8FXtAZYwHalPDH8APmsu0lvrfWbLL2oNlqv0A3pHEs364LNrB2SHJSLK4Qt7ukM7yk3dhBckz6HZnyaGt52zMyJ8q4vYxiHbGui40KBWX08zmP0mEcjGpqziLNaNKhO9/6+5aotU2BP06MruYLH/h2TtQOygdzf5z3823ORPtwhvSoY6St9vTaSvKWzXZ31e8pkaFPS08eFH4wG/eoPMOnNOzPXKCID8c6RISQDn4922lLQ85+h7AmItrwddqe0o2z7QWU212uFrKXtt3xQDJTlZ+fs9JL8MhZVGsqV2eeDMZj4qa+QZQe8m64BWpFtd4dq0rgpCmEa6EZ9JgidoI93TwmzI+3BxO0J4ZzUbRH6V2wOIpzXAEho5zN7aNwCyujyf9kcrjNDJvcl9nDJOBBzKs7t+GS6+VBY686LvRLIfcnid/Pou9vhOYhZs9lB/ZaaffIlWcpZIcmIoPiNtlphQr4kdwb2zjCJcWX5AijZE69z63uDvyy97jdVEH7wA+S0/l0cg6dzWFdULdjN3kHbFT7DaxVkoqIqLiGC/wQ4RsZ1tI+NMSpd4WOzJXMhC64Ew4btFO6c9ljLlGnG6yLz4SEteYhQ2k+mMizyGhPZz+cfcZLfaSs4s0GV+ftpLgdZAaqE9BjucQIhjWYnpulunMN0q0ql7lJzXBWr8QFRmYqO831ht0+yg7ehhZ5uiSbQ4JD7bGdS2zN2v2LqWeZFZWFEzDbjhQ3TC6f+ZQ6iNWR1usbbOByzBcwgZRprO3ZQ5CzlQGZp0g1D2SM3wzhEM2Z8vAJZqv8OUTpt7Br+jj8K/6P07LCQ/OZdaAwTK8w87kDaFD6CZj+8cEfcPSvD/wBmTAYwUgEJUkCoXGSwrCv1XNXHMHolxrdDjTuYhjIKajdi3NDgUIh0HangVBdEq5w8zUriAb1SCCxFwOoAIMlr+5g+AUtO0AVIl/aEmuWRL8WeOEX6Yj6nbjeLgSa9MCqOH6t5vpgORUNX3p5ySvZeQkJ+Qlgx8YUqD2u+Vry0spdczD/1T0cvzhKyJsE7+4llx+8kPTvK40cYAUN31ke6+rGHK2DtVDX31QbuQ/ggt6R619XG78lJWsSg7TeTh2ABPdnj9KHEi4oiMnFdztIzsPZtUAfYHiDBvOlMvtajbWFBKzAQN9dnspYnum7eBXAbKldDAJgSjDjTfQN8VDdBrr1+qjb2QvxoDfVXOZz4/f39ye3B/2r+/uT24P+1f39ye1B0ReWML/l+R5qLN8aeRfdJXSfpOYwHKEiIip1uF1b1xi764p8ucEkLuoGd+FgHchMwFHHLPf+cHHFiJsbPkPtR3bb5evvy/YRQmFQ++SRbJJmW2gTOt9lV0a1OMPt4Vg5rQQr+jUJuUzI5nPgdDCqx6Vt68/MLpnogjlQojBrsMPLphtjjcJm5/21t7NtWpuYTIQVoW+SzSg6jcbsmXaqkfoxnZ3xcInHSNniNQkZWFNMYq07LJvn93srdZwgNQF+IZ+TIxEFbHY6chE362gr+p/t4KYm8zxUiDxF3SPgoDWTKVlTvpLnFZFOBr49doqqHM4Ueb47pmxGdNAKdxmXmiOZZk+8VxM4Sr3FhKt0Oz4RaNM5n5YwKc9ufot2XypbwK/A7b0T2dZ4KkjM4qgfwydy4g6ZVN+rfdfDPs8kLww+6YLEM2763b7QFzsHb/miIIhr7phabBtU18FcP3nh+xdLqzLkF5lH8D1/Yw/zKmzisfa46P1u3Mzbkd6OcFNedWHWtv5yqTAT58dWIwfqSWVQpS0OIsIS/cQ5kmf7Zn9v50EabkOz5XbG/fhsnqaMJV1pZXHcPzk+uSjbg16TWNTHUgFF0TPFStPpgybc+6ZHZ3uiyUwHWwRkFvjtY8OIUZmwsljPG21bkKfz7aLYY1JjSU+SOPSYBWtZn/S55mpBVWJpObHyHQ2lXheOB5jzIi9mByM5NMm834pitnHozpDlM3aifYIMIfRYoRKqjtwCo7OjzfojIrw4OKHLbo3varWil8AV7Euw3IZkl9sNAfvRerWjfaXyCX9Asm4g1h1DWD9ALzyckWUwzp5y0y6tc9/xfHJSy7Tm/lzY/k3G4pWYHX544Xz/6gMd/+Mva/cz+/ffGeCTvvv1Hr8V1CBxGkMJFKbpr9tUwpfWbPDC4hW5YBzoQOEvqSX0pZqHvBbddvGr4+Tr9b6IAGzYNwYTyBphwIkFerM4kJMiKSDmBNOgfWU9Feggxl/wTvynH/2uUzh41S7RFwf35doCmFHRqzsYAVdIvQSv1uHWM0Wv6iL68nSBX/ZnQKj+ZUFDvmIC8mWgFr5UOYDw1N+3qVyWdYou4l8ENZRzZnP7X6Z2UPsfbf7NSQV6bwK5WOg0eJXYf5/xvQTkODh1cn0SFsb6KA9yxbuchWgABMK+e1P/4c31vfeVt2LUFwHT7R/Ua1/boM+NOavrJ2aU03cC1RS9+7RM32V4bzCnndjTerANVH0+NEH2P9xC/vbme0L703s/Qh70LzFPH8uoZXG2Tm/icGFS0hfm2y3emmdUCN3HTdYoyEpVfiL3+9q0ElXvn6eNmKZFkDn3Xk+daAwMpIDjAdH2+jHNYX1PEBeE9JwsY/Hn0ttQKsc6dxBVuGpv2kTHm/ba7LCiLu1bwj7CzRz2lWsiy67jFeLkHdLpIpHIU4NTK52Lak1Wjtf2sA20mbtZ+BXde+dw18mms5Pt9PDEZ20mwg3NkcPWoZnDChqbG7cncLvNGzfElggyTSw99BzcEnLbFxtTy9WUOCfa0zydfCkvD9w1jYJ9Em03lnjYPBWhpjqHOZ8MgdNd4QpduttlDaJ3D/Tkxx2djNZxqFCN5N0lPUuFezePfvCs+GInolNViWkWct+3tkBfYttvcPAHzq6yHU+7TQNphVN0BWJuqoN/o8nbznpSX0Wh77IXmmkMjLPvNjOzDDR+dSDLqcgyZVTTn9cPpi/tmXCZq6GKtIpgOPTZMp1NJ/LEY/dtiEb7lIqEeJenHYr3wai3UJ7ruBUeDrhWXoJ9Rwlt0DuU98A5q39erXxDrx9lKXKPzQFbFicbqbLZ9qQ/lof7onJ7iEjYyGrm8+7Senu2GeSINBg+YvMNIgRRZO/VaEOhoSBnl8ut9ddkBtdVwtKlnbFEg3mBqlBJ4pTMNfP24LKx3y5zdzaxY3FZJ1bKuJwCMtNuCOUpA2+eBVvBdwd6UbuSkZoqDntInyjiMF9OWcEfDvMsxXqZadOJIB+Pc0BvBDJ1VDuAG1TWDjCqmleL7Io25vWoWh5hK0MuTyd/DE/M89F0t8iP/orib7XGENQaxVtX+W3XJHG/vgTGYYr4F0OgxA6DCeonlPq/GecDrP7tMb6HMyBygZIYSpMo8PTcUdSX5F5yByqLaypIvhK0IHh5nhCAExK+RKNiFJBAVqAK4RXRvgQyPwb4kASAtbLuG7/0oUIM5HPYq80SwMtLGQrYqMAvaCJfzur+78xYMEB8oQB0grGAExoFckngqJ6AgdZfIgqsqdEYILGA/hMUdF2uaLqi8HoduwBwkncw+B14qWGA8YtHgOUSJ38HZJII5t3t/OnG7mxGkhye80n8ss4zOvZPbuzWWZ+ADOhHynRwAFOUnn3Xyq4cW1x/bPPI3xiy1zaskAwKZXW4VucFbHzzBislRRBQPfcWg2fQA/+ZCSKvNIvXV0A7v/Vj8sIMrYD0uVEXhZ9qn2dbd5TRfGMH8zxfggYLwGEtPNdMr5ID3Mu+lWo99FWqlfyL+ljTxTlAr2UItq0gtuKyat1Y1sgVVF/M0cjTMU2VG/TzbPeuqsi9qSoqQFVxBTZ+X1bPAzHkJOUrCCbTOvrkeecR0dAj4xWmJBZz7gQbvc9zNkV7tcUEq23dczw8TiyHK/0Rf6wZTXo4aVvHwiXtotcChpqmDoV+TzsX7MjSdM6el3bArWE8Vdyo2b4T8OxRez4MuA3nQdSMFCvu5JbP5IS+izzcx4kEabTycD2E4ArC9c8Kd899jzwuhKjoujFt1SKPtggmPPDwhGM8Bm+rBD5WgQVvLWZB8BtkMPTI5lgqid2B3imB6s52xJ7sZneY+PtdFjjjepkZUXKSh7+CqdC30dbwur5VKEXfZtCFoNLhzqLJLihJ9i55tr7Bd0/4SDDH/L7H/WqDZ/OaCbmz0pY87Ve6Rl91V5qqY/9EA6iiKpM2BX03FTS/YJhCFUM+LhYzYME5uh5gBaY6eFNQW2LYP3SxvhRKE65pUnAKZ5WboevW9MRWJ7ZC4sGXm6tbG2I/TsnlWj08rPRVjkVRY0vfYaJS7vfo8vTqW400e/9Y37rch4Sgv2jXKhJmS6Kpyw1VN4eEio+RhPj9M5tpf3mqLPfQVjjazqhv1aI8FFryHOWAlrc2tFeoyT0P9mzuq4eo7YM2IU3KUdRqs6e1ga7n252PziI16YQc5Uys0Ox1GeNSOj3jcRAhwijYG1/4JXYtzMghs3F6btKtNDipMyylgag4+2g2ruwe3IKuzmt4NfkqtmPzJ3Nzzhl0OB1lCT7lYuyEG1UZn5++MvKgK3Kvs8r3kYGiMx6IDEBJ/zcF5B/0uqxyiZ+dYWHMsSbPkc6ED9mQ+awttIVj2/cB0vUksa5IwfrPY1NrTZ0ZUMQ66hz1Ha1YYcWb8YOWl1ZdWwjMKj9NKh+CXmO4sOEPFu45a8oFxjgMmzGyzlxNdoAYjmGuDFuC/wPwxvq/mbIDI2GMZ7JPRqKYKH3bbjDM7v39dQCF8Ua2hBhpZIIR7CgwCsOMa3jL6AwzMXz4Ww94ho3o5ljBu/Cy/hkJRFM1N2PuQ9R62b5P6fNpflxyfij1aLeZeG3CkUdR5t4sHeZSr5MLBp/QkRXuqVbQkF/hVEUfHlv96Daba7G/LBZmp3F6G7Yq6g6byTtPHD5lBxfZbu+FRSKF3g2o6p1uKqwhkKLxnDAx1vr1OT+Lvbl/qAJ29SpiERVhgO9oX0jLzozvznDO5hyP7dPpeMMF4ugfbYxCoOPsLodoyvct2yniVnAy9VDO471T0cuuyOcGDYLxsedL/1q1OFbym0LTcbHkyo5Hz+YJ2vlb3k6xRC0xY6cdDNJw2dAgT+uXQ6TQ6UA7k7pG69aWVjTVAVxxSZiK/ZAy9hGW8QI6xfa8I7S+dxZmn+3qhyaWTX+iqGsO32tG9sgThuYPfVMwN13srXZgRL73OAa+dVn7FKFdNETEXUVT2aDp6yhMgmvgZBHecPKO7C5W2Mlx5Ni1We9uZ/RB79SKOnp6QzScnYdnHbqG4pgGKbYV9KkfPN4Q4rk79je27+OdFcmySFfPSPebR2P1/olSqLoYmmT7vJ7QjQin0OlhJTiJNDF6mUWLPB3uxYOIsk7dzxdXsOTuXHjUSSzX53IwJK4xj/Jy3Nv8njvo21u4QCbMpeKydET+HMO7nz+dVrtkV4XW9tSszKfpiiadrKADf2IM6dnecI15ssmDlK82fTJZKNf0GyE8qHPoR5u77jxRVwwq/CjU2P6oon8otbaGisoS1238v4Aw2uF/K1fBOAp/nf4X8/Paw7/Y7SNg/LbLD462CIkTO5jAMRreUTSKITiN4ztg7E7TCAavceGXy+Fr6BfALxWLl4RY5IM1AuASi4HYcEeDeApNQJxFkP9Jfh0SArlqCtTxgbf6iwDtky/ZDPxF23q5y6IhWBigQ1DtAMJqCVjU/ugf+7XfCwfRXBiCDmj6Ffqtx8AoqLVENDh4DVHXOBGUXoIXKfpViUFfv4DVDRzUWNbwln4tiu9eFgZAZgQDGh3I34aEIgXK0/SnWKjJaNzOXT83F3KbzVtXQ6a6Sr7s92Kwn1XQRGcRnHfcACpo2uncinbJioqor2nuD2UMnStKArq6+Hg9vWyv3+sYIWAQL6Def+DfjWuX9218OhuLgrg5g/28xvGPz/xxYgicGYR2fxjZqfCu2/MT0bdY0IjV+Q71oRJYtjqVUb0RxEHvNnEZm9LxFh73VHme6F28iXB7Ce9mbxm3uGh753CXa1Vl9lzpH6ApSqvyIF9PB+FxfDT78IHmlXXxU38v0/Ljqdax6u53LjHOs3lpl6DaBXGdsYR5U4SakCGt8iwPnZzNMkdhz1HasOUeNGxET51AtjHsa8SNjg9s0ItSgKAGJuyks+iqUq5PXCdeoKd/2Ff6sT8stlg6YpvUF+7I8aIXtJZFMGmhHrJCGBa7Xuem88mHTacyAw6xLXgZepOHZu5MjRc+OGxNVTub9Wk/Dlh46o99rhXFZB/sMCcNnd3EjGoJiHHV+Yw/32Wlmx8ScdxAauecKSKhMrZuyb2kPNZ4OFOOyy0SYfZe6xwdcLtbLDpcsBfJXI2byNXYhpWreSMQsAl1mlPQ9s1qoquGDhIJP3D5kUhUmlyv/goEzqYyxPCxn4lysA5OYIbbLLsne1i6J4MwGxCbG37TXMqCd1OvHF174PNmaHipM/swMDxtBQSO7n1+M8SKRUnR6PG9Xg9VsjBPh9Kg7JZv4K6+Y/S9HOGoFZ58sILE9bZByNAIOeSJyhKX9ixn6dHGUm5ZJx3wzuGpjogihYVM8W7EwUZb4OF4zwK2jE8PW2k2Ii47vauV6dNl2L3JJw26RevNjcejI2/oxoZOLPyibiBZz3Zb5OnzZPxknaCk/NQlhbgQv0V26BrZLWt8NX6sPKT+mtn4Lsuj5RO6VjQDuvuDmi1fXVX+iS1sjs1zUdYF5+PLtfnpywWKhfzJ8VKgqDPpi75bM7pRO6trHqDmWnlt31JE4WGhIvCvbOMb6+hrlmecWGnNsVJnSSdzYdl3qftCPxQiepWENWs7r8kYUl6lEl4Hmz0XL4OZFcGA3prZXV0h1W1zvQJmXAecIJ1jXf8t7cs0J8qAr4d/af5Y1wX6tWEdDq8m0VC3M/lQ5SOuSRPeIedIGsWval9A83WdKFisTUf31NL6je+YeSRKsUaTp5MlkkIZ3jrhLVbZdfvhTLci3dUrmpP6IVbcACp9s1aciDvVk3IYzmKi6XpeilinOvauD+gkSP1CmLsiPcqko7BLuvX65H4rnmIa+DgB+WN1n2710xfKWleYIs4F93B+bChrfO7cUe0SZRo99fAMBnzoqHtmbxlzrxNuMl1Py9hAqvGExYv75L0bodVHZjjfZNzRZgIhn3LO3Kqw38GhmQVrmjBUcIVnS2HeuNgiuT5FyhHS+IvbLR780GFyw+8bcmNgt+RpWKfFr7VsY7JThi/ErbhNGtXviErz2u32OMdEkWh3zobO8xBn5hH37USr6+zOBraoX24qKd/rLJbweFniIcPxTCeSkMGvY+48C66Z0NgS40IqIC07BAaDVzFcdVc1Ma3ewOuLanqEv2YJPn2Sdt7BM0aCv4xsJN2HwzGYGe2eHFEO7dUAcnL3WfH3xzN3bYUIk5MBI1Z7mwUpL1pb5rj1+yh5gjmfWWR7aH2xxyxkQw6Okj68hNpCZq2LpXA85/l0YOzm2lq0ZNeJeYldVrlJ8nbdkBk3u4uujQnfZnTzWNRDbCXIqXg0zAaqfZ2yZW2dWk8poo+YSpFntiVuJ6Nua4rgQt63q3xIypucu0Goo62wo47I1e0O11kqe8icPdZwjfTsFfyhvnjPoruej9vnruE9LRIw5Iw9ODyjj9USbDl//VD8E834zK+CuOv/apK/uKaq4i6M39ag/uNNBuDwvxnuL85f30hAce+rEPDfHeNTTf5vjv/R9/GlWINiFEbBa8RIItiXHW94/GJJxkBcBveBmSOQvQ2A3MwalSWv1TDkJUm7A9IuX5s8UqByR76sUcC6VvBep1tjwnX7Gu7hL8PG9SQ+BWR0k/glLx+D/vzfFA4JcLo10ExeAjVrsAc0bncgXATaN69C5hrWYiiINTECXG1EAa4n4HfGoJqIxWBZzH/5Vq2nBJTQl2ElMLqC/y5KlO2F41g7/sZD2R/XWYooep/0vxRrU6TnLzHa2RZ5XRA+/JUI2xULUJ5TuGy5uk7q7c5zWJ2fEcdmV8mar5c13JNEGFLkNeWf8dxzkTKs3qqJ712/nzvubeEEtFNeg1u6atogWjQXPU93kG71o/RBipxU1pxZ/vvBPqLEvc3UnwZOgtGs+wAZ+gVSJLoCerjB6yCj/Fgq097b6d+bA7CXSRXgrOQF8k21Zk3Pvtu44i32c+nyrDv6aJrvjs5La3iutSKmme5lo7ye2ByKVvRbg1Z4fSDFVVZL0JTnXcz0rRhiZIF7nq9VOQeu8F4D+dyvBZ4f0LvphyiMJbuG1juD1+fDGm5/s8ZqbKEQ+fU2vx8sdWac1XKhXaE1/FjtS000W3cC+vt6GqDe+pp+gIM81HlvU2AeyksAIf2MrqG/D6+5gdEfozE/GbdoiEC+OYlvbKVsixqRS0Mo1RuWrGzUbm86XZsf5swLCHcJrqeKopGCFy8o/Uxm5bZnLk/xNnVei3liT3XbMrHVO3TeM7N0rjcyNlyOLidlJ2vA1icQLVha5k7mk7qCXpjn9RgLRXl0+Y4zb02XZxgswSRqQvxzf22sp8Q/7j7X9Zp3ZiRnkOJkF/TzuDXldHesbIaWdUsUxFuPPI4NsrncJ1OQI/pqQXhqbFfYK203Q55xRdUFdg0TZz7h08NjC21DzVEUzVu1R4/FLsXjixGrJrm/HB47IU006CqIctgeOkc/dtzlWhiGgj92nsWZCGqFp7bLkXtHnunraeOsYV1/kechee5RyajNCsZ96BRt2ms66Ecd9H/FoRwfD3l52LARnvLoUEqPfotthGw+1SwV93ItKgHjWNZR7kuEskvIKa1INZO9eOOwLrZYsm6UbVsOKeFbTMf2Rnm+47sdUj6DfRr5F+p64okYHXu3P/kW0UMbBG2na94+xIcXdxjdFCbhIbXDzZdYgjc0bkrxEiktcqUuktkOwzib8FgmaHzYG+GEQ24BXw18v5t06dFtLVxV7zNjPqcOmV0KY+YNMtLVUUqPcBcP942jPcpzlUVPT0XyQMtyaPYJ9sKmCKZy5JBPR2Pe48lzONZ1mLU5jKXJQ0Fzgd5vDiodcchwIVNHN0+3QM+rbA0z18GewYbC9ClDhU/5BIUNwAKLm45C+n24ma7hNiiiKiz/ztKFPmi6m9Op58k9spFrZlNxikTZV9vcx+JUjGmsv9sPnFh04VhUYT73h349oMrS4FSkgfBHEwz08wzzTycY6OcZ5p9OMNDPM8w/nWCgtxnmxnEml6OFumk16YnmX/vOHd9i+nSd+EeDZ2ZQbIZe1WauGfeMp+xHD0CXzKSCK0ufchNjgE6ttyvWexYfKxZUr/Wi95IF9Nsar8qcullBxruOUxwZE8GljeVJGXKatq5qTET3SUpGFzqqG9hF/dh/JvzzjCoEs4aBs37c3Rzi0k/HNpQQzR8LuEzl3V07+p6V6pvU5K1Dq9CcCOEeTrYtRoeZMetb956E11wec3ibiltVpzpNNNXdU+mCqyYdHMol8mkTF4Fjua10PzwQKC39+k6wlM/qC93CIyVR9eFk5vuWpwuuQKj2mBj7i0Rv8yFn6Nupnp/w9uxsFBStSl+GxEYhdOLhK2m+S7vurj3XtLw7IZaviwe6DrXizBw2XZhsUpKg5V59pEjL8+LhPl3qzkCh9sSSGwvfs67CtrcM8dT4xLvYxrYjnr8q5xWSb8tZujZc4R/FzV7PjUDXY1WDY48ndB6ahmDqDGqmjIqVnqdwSHxGPPKWplUiHd3yPryVSuyEwvol57tdsvfrwRCNAN5YdwEzJeiRK9wk7p/KQwv7m8hJj5ahuFolmUa/ACnRflLgJdwvrLK/1dX6YTK2vjPABsfS/WLfobx4FLRN0v1s1KIJC88j8xjN0jpqai8mXKnQMR8d7FLr6/VLG3HTfZDqjjfd5VZWCB9DSXbzHo5D0nUFE8fQj0ef39CchnaDPFi3jpMoKpUezHEqrs/K3ePrHH8xdBTZ0Ixzs1LoIIWCHs9HCtOkXVeeqaWfinMXPsz03F28kksRUmuSG7/3pIHzzMCOI9JAsFyemSnhr1AE5+Y/ZL399RGAf/LP/jz2//dG+JH39rujf+Sf4xiCIwhJ7pD1J0Vh9JfMN/oV9yev+i6MvIyaYsBU2xGvLqf4FSvDgLwNgzaoL+N+7OWcHscvGYmXWcYOB0E/cIWNQWsUjr4cC0PAVkNpoNccEaB5Cf5d3P/mwriOgu1ApA5K1SRgy62XihCgD2vNAVAMKGCQKOASrFE+TILIngzAyVAYlIap5OX4joFbW49ary+IQf4R+n8b959sEPdL3/HPawPe1OfkdDz8Ju7v/38Y93/HArfl4tNKiod8aY1RqvXyviftcfAbC/yDrgDif154OcUb72Jf67advggT9LHx+wfzT54L9NWD+SfPBfrqwfyT5wJ99WD+9XMBot6/Zf8pb+y/FLD/FKDymJwfx+LQPlArMG10u2UfWaUZsOCVZ1UmpjiC9t7tYLijpN9w2RsMldVWFOX9KQxn2k3LBYkq0TpurPN8SS65fwgNMQwdPUKjbrgYGglJJEw8wuejoSahHdGnYjnb56UNivritayC3axq/8D4E5arw7mdLaRJTY404Kuqwt7xiELLlB09TclhPSSXStQqb8vxBsv0bR7yfnZoyGLfVVzaOeeTR7bV4ObpJsD8uyKRciFiUBQd2W3KnnslcgguNg0L0XUCvWzV8Fkpp62mV/lAS976JXx423xfKZkn4vXDMg+XJJ8lSG5u+jDsrUyhS8NIGVtG1z9j5O8vzV7izLFZYiS+F2xyCtyNSRzcRKal5YDs7f5ygCUUUqKdM/Lr3wunEhPh1Sc59XEbe2SP6vL2GTo+oYUaXNc7mfGJiS6koEEQmOAD/jw2uzM0q2g0ujsT1mgLPxyxcUnR7uHXUewPmWBEBa7ofprEhwn1lIffj/YlaAim3O72SJTtYiiIi/56m06ZwYpFj4V47CxyNMoOcsrvjUJWeTjsDDS9HupqF6DPrXQSZXuuZzOIsyPdQYTU+0fdvfWwRt7GYnMZs9OEagLCnKeBsgr8eMvSTboR2mcjP0zUPtET3cAN3RxagVYzaLxKwFIRzmFJP8FL4Fva1lFPoaIY13CDUE2iTdtotztFBu+u8YhHNfQxdpBzWbd836TQwj20Yi6On+aeqXgHvY7X/LfN3/pPlsknnAvvofwY7IBvu+6JONT5abO587zkHIuZ7x6finzVFdlNf9of+uGAu8T29xPbrclB97N77Nl5ldTfJXXsQ4Fka7TeQleOaUL0XCqSgYS1Wga1ma65wDrznJdwZrN1slkj/vCreHcA+0FvOxYvb9q30R2bc4AHdwjri4IZixDo7Gef7Ml0QDj/bTDIO7G2VghP/RSO6qehH/7ORR6/i/1fBOefCgo3DuJMXl2iY4tc4Hz5B/H+R7gP/bvx/s9T2rd4XwEesnxc3PIre7WkLc5e7okw7KbG8LctxWeTqspFjQr+PZjLK+Q02Sg8u+iYuIGDWAPmcrc7U+Hk4XFNdA+hotEjErHG/Q1hxYy661uBp5QLX8eWdWkW6IJsXE26aaMTHyu1p8fDotGRyxWNicABhh7E66yfH7LmN5dWMixibNjusu2j6xoGWtsJSqb99IytIkETV5k7+MmXUXVIs3Yj0UdH8SO1HTs06x0RUZftluTLXaUJySW12yujnRfIR/WUzkWR44sDLbMbU2b9I8125r2Ej6d0YCoECVtHzZ0sn3ovP+N7+5Jf2Dwp9vQ8R5CXLWh3WaI2F+JHJ8tJ41Sbu3V/rFt0Qx6KJZ6vN5pmk6R+wE+v5C8MajfteEVnh9cj6HQv/bYveHKzg3Eie94665IdnsWR5p/3+1120WNTbNTubpywsM46aQPjuLhms8RdRhz6ADFH8uq3FKWbVMOkIl0dbnW/V4u6rrHTUTnfw6WaBbtb07ErVT+mY75M1T4RJVbZ4l3fQDqstZbZUkGyl+LTVkyzkua8kupLC73tyXhMjjrmkoEe+XbXVik5r2PiN9VdmqeApTE0UNyp5M0Am+PdbcIHc9jWhB0HDgs/mqHgyP7huXw7DVKe33tpkLk0aR5jfrU3LHEnrhBMp+My6YY9XdRMm+sTt8N0ztihwlWL3R2aH2AiQRkrPtptRZDn8zodpYagme2W/fNwv/mL96No/lmVN/5CnL557QlIG19qIfxfDvWZAPzhMN+nAl/K7gAzuZdVLIqCcD8mXpK9ESio7wLQZ7IG9YCUEYASPfx13yn2kob3A9BUgr71hFJg5YB8eckCtR30VXl/0TVCFDSgAocW4j+p3xmzAOoIBpYdgC06CfTm1zQipAAfOcBASw3ohHkxR2gEkI53L4UHsA4QgxQF91/Gsy/xhzUZWJMEPwQaewgNaCbR38b9/ARYIXf0m0jCL0ZSb4q/6fKr4C8k8G9T8nqkzcIiEIwfgkr4joMR2lxp5MHOgkPUygLJmaSc8T6KRJDgRIP1KkMVb7XsT+l2YdTGD7HeTA5mVgCQFP9kRAe9682WP4jz/igwj79aZn4UmN/pQMtn/Qd9Ksx7+k+2L0BgnnlrEzRNRRgjFqjkBsDs3dJH4b3CBglja6+XvqKKUXjuVOpWM0ofqvSTKAewBUJ1/C1s/xSJAJZfb2xrZtIbC6XS9+fwpf7w9fSriLz+3nvzc2nqN74y9OSl+bQpC5ieBlXaH3epUHrEac9DAhGIiqCzB8ye8Oas1nNypxszsO8cjO44b1oUtjedDQuTT/rYHjWkGJV1xpDO1w5rGBnarrFa5DG4cxnKje2ikUC0uafYuOZt7+aB39z3m1t2vic0po2kdxWZy57oDw2rmqRVjzPEJzpzva1ht1s+jGa0JC2x+2xKH3xOMM1ygGlEYmlsf3w+okTPqA3JdA5xOnlVaanmOYOk4sTm3NyauJfviJFIr81hHzrhPS4jufPjOmf2h5CcbgpPnpCdrj9n0Sv00mBUVx0lC3rwj3Gf088+voU3RqRr2sZRxHh4KrrVDpF3J7PEGpbDxPb8kam7ky2GvuMvmPDWewP9Y1+Zn+gHkMjf/cwMzet8Q8mtT7OO+FR0yUHTbfz73hvuiiIIjiTVBXLdkPcScXMYvSk6oZmi4MerF8M04YeDkbcazQfukzxGyrQ8+IxD0zO5YVTkeUTLPoqfEP1IYoECvi7E3npIl00XPveT1BUaU6fHuqmRrjXwTYcbdN9jzqW2d1dVoPHCvriX0e6gVDl0Vao8HhYPoyovs7LBkBelbPZVQqpE57P765nyj0LeqK2GCFvTOxuUFOD8PiftvIFQyV40GXO2jHavqd2WRdMLOu/NA4cQeSQ6lFvnl+W4j3OE5J7HfYJQOB6vt9CfUYk/HiDtyAz2frfr4+RgE7lQwa3D9udtEjkKv1HCbY1d1nuK6Yfp9oWu8sIObdEnXHlWOdd3BcKeqjCUy47IFuTP1YMefpfc1o/aH2Ddt33tOMzqpmzS2+/UhP7rhv1UF/rTIf8WTiMCECEpBEjDAfGhV92MoF9uZyFoKSUIoAUH40B2iP5acyh42Y0BMfvw1XgagGrc7k1qCAcwi0YA7ZKXzsN6tggDmnNwskLu70iWIejeCQOAqMlLFA/oQSBgRZ9+idKu8I0iQN1uveZwB0TxgEF7CE4WxS9PF+ol44C8Ftp3AHWBisRLzT/5W6tZfgfgtHf/Fk7z/yo4VW0m/4RTWTRgD2Qy7rm/csDg1WiC6iWk3V4v+qewPCjefBR79udvx6wp45dy7n8Mr9DP+PoNXqk/glfoZ3z9BV5Pzqh8OLFNkx1JIlisKgPJBPa7OeRL+LDml/V6P9/Ujuw1n2Q+wonyh4N+hlvo7/D27+AWesPb3WM0jxTdbCmmEwcXpxX0iuDYfb9jUNGV1rTn8Uj2R9t53pzjrnGrYNc0/tbSU6jWLDValPY8oDipLJEytPOOi7JyQ6JuY/dBVuG30xJm4nCOjo/uQrlqa7Gnm3M901qGQPLhusXF0/O0zc5hGXJSkl7Cc93Jt1SOVqg+aXj/OJ6K/mgUxq46jYdJutTbLDgbunffGpA8PvLnco822wln1CyLdKpKCzanSHX2s8IAVuF8fdGN7VO7heJ1vYDthTSSq81jLRkZUFQ2cVRi8Hi4uee22vdbdtvqKL3jlSlR5SMmUtZGet5P58WqrrbVPI3cHUv0cb7eMOcBQ/I1cNSHqbBibVYMdsAfJDVuxqQ4Ctyf2Lj9vT+NPOp6tqlRm91OMtI06L5pQqJjkb7+hcTwDW8Zy02a0h6NoVQLsso2XGbXTpS6zuUpNAWK3C5mzTX73IF62cEo27rX8Sm5NV7lxF4Ph94jaJ301Cosqd32110/YVX4zFWHV284XzvNRKcEwmvPHYTl0VbpGqYZcdIZHt1zGQR4V1p2j5q0FMpSmFJW3RjMZSe6h+iBN84o4k0xsXzKHpMUouqtc0+7rZnBO/Jql1exOClyiMGLsjkoIlLWR8JXNtNMYckUL0Qtk8ekkyd2RteoZ7uHWm1rluN5Pxwab8/szeFsYdxJnGBapOWocPt9mR0jZs9wGjXtBo1zLZFbHkyaRHTCawhU6a2X1/CdbNlriNq4UVux6svINXWeyVKc76eOdJTnIXNr+N+A2w8Vvf+3cPe/bvxfAfhPx/5bJEZIsG4ESGgJWA0CZmXhy7gMA+C3C0F6GL/k0deXPvolEq8ou6aSVAISYqB6FIH21Rh+Cae/9NwJHyyZAWUG6pVxUqAxAmjYJr+zWSPAWGtAsEYA/qsFlyJB3upj/xnsAB4DyzYYhAjARj4CwoL0W4fFy40N2YHAYkVilAaAvyI6+jIgBVy8NYv/eyQmgZTDI/5bJK74/04kPiwM/oHEazbyAxJ/py34z1EZ+ldZ71e2aj+jMvSvst4/QWXoe1j+GpV7YIL9hsqL+iMqo+cZitb7XB/WP86I/0yNwnD0Q2/eNw55owPsWiKbw008TPKy1RacSgUUbqFDnx4Te9n5Ow/z6AL19rfgUo5MqimDe9mi2bYoTSyofetxqlo+C+Ojp5nIIdgGyimqUIiaWre7PdGItbtl21fYdCfkq/f084dXKqV8HqiyUY3RwY5+JpvOiMYxK6XEDsMZN0P2kN3TfGEP9fnhMaH+OJH1g+7yrh54GbeSgPN0ynZNpUv1EbboDb5r2TIwtaOmSlX7TGIoszI1ka6HZmkf9+DyNDiC4M0DptO0TJBil58u14oiWNg5S3p7HTMa4/ii5LPg2ofko4CISmQ7vXbOxkbWqPDW3wK9RkrHV7fUcGuGSXTCyGFTEXO4s11pyej8pEbxb2bEojoljLG5Q0wUjvvlpjRd9ji1yyxcJf5fqVEYd1+I0Dr6f6h7jyVH1bVLeM5V7GF38J+DdyeiB3iPhHASMzxCCEkYYa6+gaqsXVU7a5vv644/epJGiXll8l3rcWsdpnsezqYKxCNRzjkqYhJ0sR6KhXI9Z4RMgSVJFK2QFD/i8sofj2ssKyygCnejkypz47+hMputMwe8M9KJFw2mnzJvUChvN69eb5Mi91A6qz1nLM+vd56+aofoUg06KoY7T7ZclSk3H1/IArzGIU7tqT/F2aHW5015sIBV2j+NVEWqx7SCsLdtS9jCZ8/Lw1voKlEpTDmmY5zN3C0FrqJwzL1LCk2UgicUpDJvGXwgvvu68QScnE4VBUMxQulORL0C6WrNV9RwWlRUw9t85hsAfqGYfuYIslqiyxzkUHDFzMM0glig9yhShJSazUbzRPXyzT76RvDgu48pkXpcOKfmLaBzruTfV6PIt26OL75xXxu2VwDbmj1+/8PPwhN/75RvGhOfHv6D6QkJ0xhBMBTFkDiy6Ud82gdOf9HMjbZWjWyX96OjDdmiXcaP2MVqafxrC0f8C8NuZkvSxrtIOk5skMkkW6iZJZuw7SYsCP8nTbaWbTLb8DWhtshzE3+nftUHjn00lO8yhsmXZcA7nOPbySuob3Z28AbtW5v3jv3ErkqBkRs+Rzv2M3uOG9+t4ZJ9zJDY/On+Ej7dbausnG8CEimWyCv3f3bn8VMVpJPwk4DE7gj3VSl70+TjYem+9wH6X8zLvnODEwQu5MIvHQm7ERyw7fYximxluSoKpO4LqonjJg5xcEXY3Gp99Q5q4xdQ+/bYvpI/+qT+w5UAH0v5w0r+iRw7U/bHcEzax+mMcFfDUEZ5xjFL4m4nzTB6TTu5wdIdsNc8HafbGplKOSm+0lgY9COgTKQsR9mrd1DiPKL6+AIl63ybjbhLLlU+d36vH5PWSnzoabekR5pVBjqaGppx/aIvLRBHsEQfW5+nwYjIOfupdtSJ9KoAe5KgYELDAQxr0CzG9PK4JqAHUrVEZRYrTYqXHtn1RczUVru/YlfKhpZnweHmk1x+YO7ozW8b5KDKR9E6X0huNDQLwpQTSD3o8yVNpvNckw4CzMqTQD19jXmZBOrwu0ta98IN3ifj6SnlOJr3ICWq2T3X3CHbZhhlypTfbwKuskHjXy3gj+ZVZxEtPYOYbj2RN05VGEsQ5p/o4TbhUfbwPptfNAQ0E34kwrv/5l20Vul/lJ3dPubAp04f0rVjWPuwJKwFjS2DGI/gPN+ZDL2Ggdg4PQdj7plu1v1aBs7eUS6vOJhQ6j33QPcVx6L+fLVqmHhdSpowOWjSNv9tuZP0oi5PafFyRD5Qp4LrQqsC3vGCXy58tIbvB7sRrq8zLGtnuHnkxJsyzEyzVgxHvIgVOqQX3iGCwCN0Ed1rvhKt67sHQto5zN5hPsudf7V1+vKeDnTrLa9We8Pj6+odjugBLIaTacRhdX2aSKjSARybOGxVAlMAFoG58x0BN8H2BtPQ6zTkyRtxLE+S2OflrRh6lMC3svNq5eRlMIU+YDGprXs3hT1z4YGmfh7COPDa8p3rMRvQMc02RUJKqINwhletGKXX7nDOD/Tfn0v6HgC+WpOuG+jfhpg/OeUziPn98B8ghiEojEZplEK3MXWKIj7VKNpsPYgtJ7pCAvzFqTr6D74X6ujkPziyi/Cl+zT3Gsjlnw+kM9u+ju6pTDreGv627Cr6n3z3I93k7dDN9Srds65rYPWlBrl5ePwqQoOj3Qc12aWN0C36onbJvfW09fxtBAnbsINItymm9XLrbVaQ2+SUiC1STHZLVQzZArx1QXC2zSKtp+Tw7vvx12J7P0NMLtLi4bR4dwf+3Pnj/zTEfDMbjQKi+SPEFPMX14/vIWZ/7P88xPy4kn8CMb3qmuaUDBFx6iJUch6HoVqwu+ceAq/QGsMPTmJ4YZpw3a1xZMSc/PK+446oXLEZuGjw6HazWGZqt0xkBlVRa2IJcrIKpC4fjDWUpNBX/omUXtHlHUJGR7ZNHSG5GyTxEAE33mrvbaamamIqNUg0V4x8IWaLGT16fFrrPno1lZdaKdbp1To6ebfFIQ7Oxvt6uvvOyQBs0ZlkJi/Hx5nFShY6Zii+0udJRY7JGw3OMdMQtiJbeYz6iEmCDwlvVIZinj17Fwr2CZDLJNMCUrwXxob78W77ciYJ60uqW6NPFnEJwj3YvIeKbatXEGly0nNgiojWXTniTSqvGIWhjKZz1huLraM052/TlFoUlv4EYrgJcghiicY7eQVswxmzmrU9xRVnA/5vQcw3zXVWrc9dGZIv02CQ/h7fF5dvDHuWRLR5WlD3fmUgKB7jm5sfgF5QB0/yIssjUBsTC4qwMLf0R+ORC+MJ6TFzQDTGXgmD5HjLU4SbozpxnRT6z+vtuQyAfYEnFExgsr6ViC2RCOrgodBYc4a+Ka8THD0r7rbMYnJQWS+iDrzyWNzeaphLZyXzQ8AoHlBsVScm87RentZQrC0kD1XSAMUCLYywAHNYXYDv8BUcl+w2VHGRq5lUTw//0eMD8KgHpp0q4iYJViI1uIauARidFdzyZGBnSmPuRoatz0Ch9C5aGeS1YyyJ+fSocuUU4jQwYdk71K8uBoXPAtcK+rbGLAckYiVHUrgLeiumBHxF/Zvp/msQc2yz+3W4/218+dXxn4HL12O/RxaKZjBqwxSYwnCMQFdU/1TGFd/2Z3iXTl+Zf5RsveGbLXW2OTLFyZ4B3JvB6TUO+Tx4Sek91sG2wCSDN7m7NUqIkW3MdA16SGyTG6G+aLCSG46he5iz3gf9VfBC7fOnWL6NwmLUZtW4Rh/wbm+1rnMDF2Jrlol32+01/lpRbzMLyfaG92zTSFkBcYWeFdtQYkOlLZu5T7xiW3fOX0qdnLZE0Ex+Q5b4MnqnVr7zA/4zspgbstg/q9/99X7+u32GwFl/QBY7uft9dPb7P6CKyy5fAhf7d1T58ti3VQB/H1U+XwXwFVV+X4Wq8r9ElGJHFH438ShEduKMHHj5EGinWMqEoI5DUYe7E35vlwutMORDMF+YChcBifcxmLmoG47RvTpWtVyVft9wOmsDmsykumpwNZJfHP7m9oMM3jwsL+3JlbVHpunasYL4a2m/DYavIfh1ulDX0Jqj1yMj2hAAqyo7SYlP5FdztmoVL+BAm+BsVg+SFmfkq/a5hTWvzoyeqhXSrhFzn8AG0sEb3VqtA3T0sYy0WQOVB+v3FOyHfgdSzxsW6AY2bntif134KLpTw+vysMyeDUnTLJ5vEJbdMCMAxbQnnfHzt2Q6EjGH/lzfU1QsTTsZNO+eykdjoOd+qoyAPNiplkLL23jqNneBewNLKYCCD5C1oiR6rJfnvMywlA+6iN/POGhH7O09HKuEG27DvSJOT0a8TuyrOYhl10ENlEeDDPjggUQePp5ST4G8lRDTX0EVhbM3I6KxVCZ0Rt5k344Y++ikQ1xWBkx3jKU6oKGCCugALyWUG1Grjy87G+1ECG6XftDypWeC2XeU99BPJqvllKR5jUlBDxtOZbi4htKdpe4N5QDEAOPkMHJKNan+7ba+ASPGaqQqdNyCB8ydPGuKKeA2YXfCHD55Vl6kWiHKSW3zHFcjgEcaMXA1rKOmIvIvBBTbcjYvQSjE4dur+pJjwKejH/W25BlVxxDpYGci3stvlIth9wwcRgmub0bBHtQhAluJavRuoCCQfL0eoLWgXXPX+/uP+rc/ttVo2PrOXky1v90ZL2ifK/EQVxZ0iqbq72jDA78L6P6YcRTYL4PNrM0vPgzblxtOEvryGrj5bV6PagfXkRdOKKCrCPGqU1lizoj3jrDToVBPBn0pLdUoTEwS3zDr235ZwkrSO052NN3LfOzH5srg9cNc46+eoAX05l51H7Gehfrs4rw1qSqwIuzYkyQNdrBtXa9F7uPHGfKf+RI++lPGsfi5zQkOoA/BnLyfYlFZPMkjFwaJzEsFknbLJ4I0gcbdu58la435NTx/rdzIQa2BQw+PzhmhQLABU19DSPZ0fSVub6UEWYPw4SCRjkFY4zO6JzGZMuKEgFNRqp1PNCQiqlrW3LWgd/RQTgC4qhdeyrO7HcEBAdvcoPCsfsUV8cHz5boZeooO4iOinlH+cNSfviaGVnjw4uBBTrFhAwN+l2/gNZ5tmnxiL/yRc/jp3dLWDNXXh7tgEC6ikfR48PQNL+4+1wf+PIi3euhp5mlKwAAiC+lgp9RtzsTsxqhI5DYOZjBnE2/EHx2t3mUjqdvrwhKXUUFZmSq7CnpIhTo9FeDyCOqFu8GFDC4t11YNxFGOjvlsWjf9q55v4KMP22AeDjZzNIz3uru/yDGDXkuwfvIjGpD1CHlJJFygUxt5gtswyzSidTtkUs/n7vSqOZRvnkxWZqUfhvzdFTUsYE+V7Y35EB2AUy+nktUqEmhL9WMRNcOLl8lWupuAPwiCK9tRhOUhmPkXax1RiBqjCvMrqXRhsILIDNAzHh3Y+iGfxov9TzRAPiM2Is//YzL02Tl/Qoi2438It3EYQVGcgSmaRNZvKPkpKdo8W+BNQo0gdvNJZCMYDLOFrmsAjmBbWnVlPCtxytYwPP28NYne3DdX5rJH0FsWduNQ5Ka1tkbwm3RcssneR/hGcDbrl3irj24dRb/q9N0m85CtHTjfvTvXcHszZsu3luE1bid3AeN015tbo/J1/SvlophN/D6nd8m5bAurN4XjaEsuE7tuCU1v9GklUSj2V6SIgzZSdAl+z+hqSX3tEiir7ZEvLupGipYKXvdPczy5PxZFgb+kIr+rza9UJP2BEG1MBPigIqroC/ayz9NNpsBOZnWbrG3cozpt83TwRpS2ebqPx0zR20uUwI81SvvL4P3uFN3/eLevcvxfva7PdhB+GUbxFQ3ZzTUVrY6DGokdTrJhc0z36ZZkJUbV4WirHFd4bWHbrFpYV5a1LVPCYymEBQDWJcKKE/KoaeRceskSGEvDhwm3YLV/fFVINzrk2/bO4PUgR93buFX3liuFTF9siz4wQNfBHXHLr/IQVoMADwZWiS7zhgXy9HAlf44IL3XLkq/PlWkt8wl/9rU+36tNh/knaxInaueaHDkRsZzwZLKCEL0JFomo4Ch8cdf+GFDiXFbYcGwzpgQ+MT7WuaL4+txXnButhhW4G1uxZz4/KFeJi1p6fYFaRjlDfgdEj7iY+BQmhNJFRh+SF7earuAyFzfaIrAzQZUynaMl3ogrFGthCR89LwVJeLzNQUeqQF4nTCMxfAR5ihGfx+J5JIIAHMLj80JcugxHD2B/Uax41M3M/icyRVnbrzvGvn9k6Ue+bvPJOPwvr7kuWf/4oTNjHzTevDe+nvijPeO3FoyfhYz+r93lm9TRr+7w/UaIUgyFfzrdvO502d6WicNbng6hv/Zk4uQW3tHM5ri47jhwvk0jU5/7eqyR2hoHrjHe+hXd1c7XU9doDmG2rXANAtfYL9rtGLFoezD60pNJ/of5VVvmpr9Jb2ugv1TUiC3Mw/dNjcL3PlJ069WM94QlAm+h7LYn7nZaeLTtkjS23SbdFTw3gxJqa9Rco9/1adLZX6Yah60Z5HX42PsETnTZT6ealZ/0NGrOBExHHdVvHf21H99rMjyf3mucWV/QcojR6R2i9dam8fO0myFOhABsfQtpAH/mH/l9D8O0hmjFRzOI7O29Htsu9TWek/2buvnUK+k7uXebd8dXIc1i3UjVeetxtBYT+2oIsg8pfzwGBBUH/jSUbLuCeDV59mN6L/QD4pndfTie/9CuUgBflTsak/8qDjit/53b01G2Lf2HtpRnjOKFffbhaNMCPJ+I7fUD1I/2y6kWPl6PLzvyqQ6/S4BuRimfJUCBX5lO4lDPPDCdHN+CJqk5Eo3SAQ8IlqOevYYgEIN0fYe0CuD5YPsU9PvlkqFxAcpwxa6BZ3WO/KyUhTqN7idiKqSwFcbJqUoaLlzHmauHKtEURxom4J6PMU0SxwmJ/eCVBde8XV5o5al4GGo0rWnU3MWNLigCN2MgfyVTo0wVL3w7ryybfA/guPfZXu6971QSXr4oxhRubVVqJj2hZUgTp1S/NW91/auC5we7z6GgO4Nd0FBiD8etCdw8DXP5s3YTyjcKCSaI41mN3EAk4A5E4T0oryZEeCAdq3uDZ8M9JC2oMAWcvAPYXu8CsMmxw0qxlxA4HyThdC7vTZTiijlXuqediSfiGr4a2qeoIZwfE6DHL2o2P6PKD1Lgtpp2mMFB9I3pzhYVD/b7oIsWHCLM1wQo8FkG9NMEqB49Wsc4sC56f0DMFRav6RUhZqBTShFnxqQdG0aFK/LttOLge2J/4qvKyTMe1yr4QGWCkBK23127lo9sf74nB8GDldwAVGaDwikwQOkp2Fj4aumy8IWQewUPiPAwWG9BvD0idweRSrWt7aI5p6z6ZvDmcs/uNKAxJ6WKH9apnLBlcm6Kcb+ZiZPoii1YR3qRnagmbQTuF/I8NfFDI6Iq7LGyfWtcQL8ugP+wluTgyHKvTnb8eL+vsBs04dsdykNh41AwmtcHp4NhXZycrhMmw37pVzSQQJbwjUkFYOzSNGuIx71ijRIa58UM+b3oGrbynp3H+wTUPBopUOU1fuoXF8k7nLj3N5z2Fcydx78Pqm6wIttP/Yk/ANcKey6rBqz1rw0Cvf/11ZvqJ9T8b1zmAxb/8hJ/aZK8qW/QW+Fq5d85s3VLxLsl8hoerMiCZFurxDbQt0t7UMynyLgC0SYfQm0Nkim2k/5ky2qi5MbnV2haEWz9ujL5CN77N5gdLrH/4PSvTZLTfVUZsgEfspcDo2zrc9ykP+KN/a9BC0FuPZ5wtoH7JhiNbAFMzGxL3WYZsq27hNj7NjefLWoPTTZvzb9ExmxDxvvhr0yS85/Qw/MX0QE+5Dj4YtR8UdJ8WDoY3rqB/97Zbwhs+s0By3R2BaYvUQIveYAPW9w3M6o/R8cPsNvVok0hmS3BXIAvstHsV7TzkIPrESvYfbrcz1YL/JPlfrZa4FfLXTexX0lNc1+08MRNC28DNn7MGx1/sgePeK0bmHs9OaXElmRKB4HtZZR3Ei0MfDNndkDia+mcYeusHkFpZeyZJK6bug4rpjnZZaiUrnlNW1WPR6jWfO5YXiLwTRSDKCfZuxSlsgjsSWrsXCnsTuWSHlQUQMfORq6BQ5/Kqbqk1ZOZ+McVdTiut8fzgB/Lt+YXjmEgetxGdUAmCrR+v5QLjxZ5dgZO+Rj6S9fG4ElhtFqCSmwCtay6cjCmSPMRVy71vRbwh+RCJ41DVUadp+7Qci1EgxS0AO0ZdS6FFuupiTyIQ2Sjp+IcG6T5XrFXZyxbbokJPL5VCGln0Dtel8KiipaGCvDSrG8/gAWTE+Z3o4jxK36aLiz1Osn4TfmQb9hDKBaXPwmA/g6wnV4HqbtXKWkEb+2Y1Y4gn6qKF4L78JWnAD/8w+w8RWSPlo8d0za/xi9FYEsvunL2rSVH20UJ7e4I/BV62CZ/1vmMB0yx1W4Q8yLIC5vjNX/vLyfCPx4MepnR4ixCg2ZPwkvOkyXKS1Y7ECqi14cZGrqWS+sOOGexTTHWK3zivq76JKmqbMuRDR/Ugd1bD+90BX3tBZ1EmXRivBjudUK1JbYkRKeQqADUZckIrecdLu6kH279gyAopXnOweOwZAH07o+Lzb/8iwvHOYgiRJDrolrrg0AvVC68GyDqnsolsUjQOqwfHhBXVbe0ajuYYCE74M8FsyCZ95acsloIkSz+kTTzpYSvxTKfp/wWApc1ZAod4wwvi0xcyNmjJ21pxxFquoNJCBSVqt7tRCvt305eHf6XI/IH80s89Zszr0HVvfuNP/z7/zNcYY/MnCwZdgzaugiH5gNYNqzhWfR7JPs/cK1vYwB/euBftvyTyZ4SSrf80woKa0i1BmMxugVpKbkhyFZaQ7e+jXSNsz7XsCJ2jyk62TBwBZkt6sL2pBO9JZqSvXkR2SfJk/XxXZJqBZyEWiO2X0V5yD5Jn+xZqv2Ka7y22SUTW2KL3p0TkGgTtE12c671QRLe4O8LFmPk1xgQ3e0k17gv2pNi8C5jlZN/iWXphmU1+Bct/1z6EzjoniDWgMmbH6FQ4sG+4MIfAYpdeFi9xV/9GuEJ7ox3rnQSf46GAA/1N2nFvRt9FzE8+8N34LCjyhq0fTc35827AZbALgf/cQYEV/35wfH8UyLOqdkfBg0UyZJsmLHWWHQGtkScKlnEFlPFa9Rmw/SwRqDe6Qf7485VaqveJKe24Oyr1i2yBrUV8BG97Q33GwD+zZG3L/30rA8cfH3y2gM5+Xd+khCnrZ5CeOGMCdKDt9WhNRPdQ3V+nN9CxZcLhhEJ45AUes7GsvfkFljiGkyfIAi6OGrpLDXml0lcgfe2IOfCPBPXsNGJqH8hxjmyQ9Ye0ziwHw3/hmxcfPom4LNnzBpOUoF1XpjGiSBiJ6zBzdfyFqUYJ/1XGMVY+PReNTkkVRs9n6nXsz1/7xCpuNlAaXGvNeqTWSFVCIU4uwtokGiGX/VWeteWv25xYh7fx/J0kzOeii+nlixzX79FSiP1wQF4VE1eG+WozAV0hSb2fD8IR9V8yc+6XRgijKo3HU/xWYEQXTz0h6K8kC2fmB4k94jjjEA0WvbowLTUI6LFJ1Gad78sb0nsS3qd05oLS9pWFVwgkg44HEWdEpbjnwHeH9ODv1MV4KeGevPwssTWqKUuydy8Kwz+ZuTh4ZFQdd3xxks7o63uPIMse9DKlD4lIHlok1C1ziKDTa+L1QBdbg3dnaHHfF86w0Hp2YIUhWbnhosleFnhHw3dQYunEs2O5wR43IpcdsHDDXxPYJkPi0dVHKf5yHC+YXkHcuflqviU/KTms4sWJJPdBv52QFskTS73kgZ6CK2uD6doZR3Ux7tiHbkXGw+x7l9W1sBiy2x1tEe++uYki/f5RFWuT2mvEwE74E2QZgDxbjxTGDXDQW1u3QM/aiBKbYm7l0OW/+BfhWtc60FJnPvpHTlwVqDM/e2f1ZFV1FMCAU7VnDjvZjypC1ZEflrpj+X8EB+5njIa2LHtA8b+diAm8v9iv9ROiqxJrtFvfNRHddREPzss/vY/1r3gN/tfMA0jCEX+S/2fX3CpfWfX7rfjENfXpPv5JMjPimz4rez7Z/cfCBrH8d8rICXrEf9ush56Z23Utln92/9I/ieMQdr262tYFyE2/bWP+j9c72N1WfdTIPj/8NP4QO4vT+F7hP4XilEwQlAMilPMSplgBsEYEiUJgkDWryhOozC+B5R/wPEtgCQ24ZZtyi3dRvfWyHSNJ5F8G4lP9rGENabLsN0r6POYFN07arBdCIbYxSA3ect9WI6iti5TON6usWVPye16a+C49Xai/8l+FZPSuys0lW+VLnIvf2H7FDyKb01AGbo3raZb22iWbyifIzuIZ5sE5Rr0kujWQLTeI/vilMlsy9pUcfYmJIb5y/Ydf4UdTvjWvmNT144hGbvESudxeY0izWDi53EqzwH08rM8mvndlN3DNW9SEwZEFQXiJlYGX4KpjO/ibhtp71Nn39lGqnx52PxOPGdXf1xDzAQ1vNvTdNYY8pu5MrNP6oVBvagShwCX+6YrZn674vcXXGPU0Ry/njhPQRikdepwu+NdsjzeBpZiwK74eD5VW57UuBN1yjPo+nO5i7jx7OMy737PK0kwP+hH59z9+XLWpjSoS0AV/WG9K7xeZFHlbVDwuwxtYD3jTQXyvI0tSkN4Nidh2V7ML4ln7uYLa1QsfVTpxj28XuPt9ftoflW93BxY9scqj7DcOtrNZr5jVcBXpybKFL7Jw832+lzju/W8OL/fff35EytRugB0kdiMOU+G+0Vz01ouvePcJl1g7994DLI9rbCOthlBxb/Gcl2tFG2/IPDTFSfLZZePEw0prEPUR9RdDY5bfvca3OjadlF7AOK7DxtYWCd3aRMt7dbPQqWvF/npLdS/vDMSsn2gTgEBr6yqTBWzAD57/zdJ7FSWus3eJlnE4wa7X5Ww5ZNn9rZnCR/pb+CvGoC3ELObDcUF9bP9DNQTbrFMCZ9p3Fo0jjgBNHHVR0LHIZi3uTOvXMwb+4oDLzzdrtIp5210up+0h8UJOBGTvpG9nlWPP8Umravb5XQHcL44Djejih8UJvGZG2XkSXhZudAqbfjSZndaI7y7Tx77/shBzhpqCtHhpocTpUHdFK1htZkTlhF4ZRqE5xenPhSqkdAAfzQBrryPtd2gbyo/6I58SovScdH1AwNRlp28NZRprRSwa46ANRuMxpF992Ur3PAXJVDOoupXWV4/YliW3Ws4EplKQBdMrbF2SA5oQzRLnCR0D9SykcdpjBwMHHpePF2Orw+UrRG7EURygAyhK+B1Ydc7O+Mi4aAOuIywJjTaVy8l4IEr1fr5Lj4yAqJtBybncOLdr87rh+sCcz/+t/5UgAW+r8B+Qsd+6Cx+mAfjpD+wpxdANc5FcC7hwOP5fp4v8JiPX5UOlWJMKw7mim5zvRTZ3MdZ2+T4iqtNfvzJTpN7AN/vLn+6uQgs8qOVJvuUr2kAfLZN/cUu9UPQAPyY2ufUYGWWzA1RB6H2rXBms/oQIn4LdWeRWoSbVktUgA4gyPp9Ck/UBYDOyHGJOA4XHPdNv6/lc8RuTy5QrKXV7XM9aZRipaAumJikesfn61HVVsKG9t2K2Jq8AQ5XkGUAJU08Qk24cCVVkhe7eqZjDyV6T2Lp/WzIdlbGIJ1qUTliD4dixyh+mObxUM7A6QlRjuVnNRhNj7y6UfClrrVZQ9Eb/h6mRKhjJfSV2lOv6hs2fH3BajB+ZUZ71Bnl4ABsMYCuHLfqkSRmKghzMEJFaGXOMBZStSVz1Vt2X6gbPCQw5p9GVPhSdVTLpyDbJTrVQKOh9UXzSK+BEDjq1Ph9HALorh7PJL6GbQIhqn8/ta9kdZ011+Q3do0wsvv6Q9Skv52yLovapPxNbbqVFA1bVqL7mpb4DV252Mrd/smZG5369y+r6f9/reGDy/0X7/+X6RkK28dvVpYUb5mTlf5QzJa5X1nZZu+YbLyJzDZRg5T4T/I5rcuzrUuaJLayxHo2vF+GoTdZcXJ3nySQTbg8SnZ/S3prd8LpTaDho6Hpj6WGZCNreL5xyQjfZnY2MSVmKx1Eu6PQytEyZMvZxMyWpFlJHExsi0CpXeZw1zuMmK38TjAbH8TxvVsp2tSZKOSvaJ1obtpI0/1P0jNfKFz9U87jhKgTcBI4/oPCHeCyjuWp3nIWqrjuwMFp6+ip1I3O8JwTnq36ss1rbkIDjbUhMgLsaZjG/ILI/E8Vao8dj8WHEkGqhsHUrRzxeZnXGHszvwiQJ7D+shLFTTDIX8JAmi9osYn5LRvRSvfECbF8qQ6cBHt3CxKnr+3feyEesCpxsYQbYn4ZXN0fNN1vj41F6P1k5pE6pmeP9tdOJ0Bc+k+X9rdWtlJAYOM1P4hGuBJrCvgHA8Ec2e9ieUtbra/TylhC2e+3n1e2cluf2noB1C+Tu/XY5CsS7PRMlfVFDJjhQ6HChsVNGXza3+pPEkfAp5kjvXbZgzk839EBvAsXI/RAkB9fvkhZw+VU1lJ5rBbUIMTjAqSXu+VlrmAxun4VEUJpEwfzLNx5vByiT1XEBm+Hay1acaEw9yL1Exj3ct7UBFlq8aMG5NlKEUA4ygj4DMaH9CCxx2f9JG4X/m2R5B1eFKp3LlrjThGFKJLOgME562alMKJEbDogLhb1XmUWA4noRezuhqpnsFItgs1UT0kc8fzWapOqoIcXI8v6pZNuWB5TAz1zJ7t+CQBFHMjodJ4uTzS/u3f+Eaew8Xh7k91TBiSofP9gMvsV3aa51hVtuXmH6MlIK4F0iNfZOQKSKCiYRXZ2cOp67h6zd6vXZOd4MtSa7Ig0ZafKrGerBD+UGA7c1eW58pfFDrb7ykw+ZyXPp8RDJ6t0roeM1+0nQKSFy/HHwXa88fSFlWTceurxxdImG/DsTDRJxUpFYa4Bhjdy6yfGuPu31GXlotjINaY164HctwPtjwPF3w+07eHLcX9s1AG+qjHlFFav/2P9cKR0s6xS3rnhiTWRVtg+bkVSH8WCLkf2cC6vfn9Ozaseld2jQLfBMVheP9bkRC/CvTpBr5FauexSgoObLDYKvmd3+3i0Y4Gp3JM4VIH4eN5bhsjDK1kWNOC+OLeJVbI5DHWjiUF/Q3mcHSVHrzsmWfCZQLT+yPLPHBlZENXVKBhEPNTGxVrej4QCUrU7n5zQlJ6yAN1TZvGQKoTaNdzSg4yNrC7I+6oCwQameSY2NQOyzJKhXzPh02wyd4DVvKBHY5EMDnF9+ColQz+aBG1Rs5GEzSC+Pe/MVTA9tzVmqZBOdjRkulR1PRxYxzmrQE0F6f1ZW52w4E7Bx6GF5gfvfdKYDP/7vcFJH9XXbgfYrOm/L2V86Yv7OMD59/Pf7L8hGMMImkBhhqR+7hj+b13pWx/xn17le+wmUQqhcZyiUBxdv8IETH9abGE2vWA43aAT3qv8SLzVRPIvZfldKineu4Fz8j/R50qH+V5CibFdBIncUicovTfw7pmY9a/4bgu4ddjFW10koXab6BWZf2UYQhDb0C4Jb1fZXEjIPQW0Y/emMfExa7xeFI4390Fy/2seb8uOdwWKKNrbFfLt2a1X26o/+SY3vAkw/WWxRdpb6shvjQOqPz5ONWyIOP25QES0/DRj5fj2JFSs+VVPyeQ85LmlBEzHHNWvlhUC9+Qu2JYq2HIr5pDwBGdc6REwFxM5CN4KsjfUWn6vxLDjmK3ItWV1niso7RX5zevq50IMsNf3P9BZuM3mJslbrYD8oSrx42M/LH/viP7vLH9bPfDfWf62euCfTHU96Vh8OvebcYBq2QxGT7fegOcOOV+32ngrcL5TkwdXQrc4UAaPhbAT8lDGq4A4cHbVBbxComMc3vjbkw0Qn1ZjtTkDeDTTqqlPuGqdrvdNTDeM4hliTwpZCYNzWvxqwI5vRbn5CuZkBM/K+fMqpown9ga8MICuY8X1BV97KayrR+hVhCXoKU6cmmtl8gdyyTlGRHL2nOpCBJfmpA95IT3jQ4tpz1mFgIJPlmAksWsxpdySqDO6ONktuZ6Es7SY41D18IuKUyYskPzii1f/9K5Ow7E6pixyebYx0E6uGpCKeT2913c1ph9alxdRqiij2z6Wu8M9wRCmIJe8MXbDNWD9SLKjfEYfU7G+ahcbIFbG8RKeqCaCnJqcK2E08BtxUlTjDSIs5UZGk07KSywGy/WVJl25mEMXWWy0EX0cUAmIM7oWc/0s37SSgV9nUh2mNaQnw4s8P6rmyCwLJB/fMu2/jCBT+VYZHFjEPRepJaaYMkCXwJEUGGmhwfcdhajSsrDg6b9bzRGbgaRH8XV0nkf8xCtX0/NLT8Rt9GAiuTiGvYVLwJs05Ya+Iktm58iUyML55aeSZ0Vcu3KE/hpqSI9rQTEStuKPsEe0sARS15zoQQPv4gbIV4rp0QFrSewjOLKOp4hn02jvmXygGUPv7/MwQ4NIVBJJ8jPvYc0gDEeo8h8oJmY3CqiO+jT6aPpke1Nn7rN8DJAG/lb2qkxZ/LHsJRmXq9CqDVbeqUuzANlSjrV549kqtn811aWMXx03uGKUHqzn9Vf10F3zTI574Jpb1EHhvdlWeatnfxgB+9UE2NcS2UpkWQPIMF0ZZf7ueLMaHC7p9Zh4oXi9o1KhCzfatVIaUVK35ypFLVzihaQwJVfGcBPgE3ylYKDqrMq4WvdOzsCYillxqYvXS4W10EK8nmyaCD6UeO0kwfoac7e0gK6RHgQgI4ARmgsLEDySMrlw1gyy+H0BKXBgRzcBZRj1bPlUnepRn3RM4yN9Lt4eEaHlFYqIKwcf0ehd4z7gmPBJihtW92eYVCvsWEVDjxqMcjeyRClsRSxjtJ1vB+PZUL4Hnus8R1iLdVX5Bt+YCniONc+fXJrVG75QrKPRcSx6kijn8CTZTnDJueC0uoTHhFs5NOrWOUzkcffCoYjH5/kMnOGVPYcuCV3nClUu0SCi80EEY7BE1Ityu+PvI/NK+YhU+KNzbgMihnWh73oaRyESPNyAPHkr9Vl5oC+LnhIDTzVVlPGoe/KaaxtRB90mdIEGz+xYpMEuUDwEdvzi79pLxw2DOgE6fmaeaKUOhdh2wQQrcbnUWT70dFLTLGeyhgb2xWAoxyPraXg9ZKyKVeEdWrIajnsPCPlF0yjfuDVEDTFmj8f14a2AN9uRbfuc3Q8r1WyGQw7L4ZvL5lfakFA0RQVJnRVI0zzAmLuTNntYJk6nqBWWRSpT6Si9HO4MjUWGdhf4WNWTfWpN5j3KF5fSQl9MQEtZ7+VHLmA0x1d4LfHlBHtvkj8aM4kbD2qW1NYkY58G0TkV9HNZF3+/iWZveVlJlXG9X7exhIP37SHp6Pz2SdvnPzjnW4/nH//6PV3DSJjASBzGKAJjGBjDMRhfqRtD0wxFECRGITBBYJ8xOGzXvsr2Lk8y3ipjCL41b5LE1jSD7LrVKLxVuUjqVwNhWLzps2D07tWA7fxvY3ubdjRNbikVFN1tmPfUSU5sqZ9NHBte2eEvGNxKu+J9/J1h9ok0YlvD1gnKbKU8eCeExC4bQ9JbP+kX6cuVOm7Kmck2+wWjX53h1nVs9DLbFTz3s6j0L9tlwo3B3b61y9jyBPb9VSA0y0QjKFfoy1wEn7eDSsBPPTSKXYkXk7t8FHuOX3v7NxZjRgHy3MYXvptXNwBxsr7Ma23cSAxt73eRy6/EbCu1qNsw2Gy69le5L/XLgJi7Ga4tF2QXY/k5XQSrkyysseXXbJGAfBlR26pErlz30flUh4KYACb3+Cifud8tV/ak3yUn7V8kMrY8BvCHRIbp2xmBU1Yq5JO6WNXz3T9oFr3nJ558JWChmsfnKw1L+m6fPAsE2MNLzpyH8HZh7H6p7z0Y6P4jchu5NCLWMW+EyR8rwbGWx/VyuSWlRzAVE7yz5Yzm11IBrq6SCE19U4jGCagWzFEearN3cxSKZ3SF6pvd+xA4vQPL6+eUMMNGPgpWIqJFflfKqgLezo1/HR8J7g9EQZacY4xRcsGay+D13fDOcxOKX0irm7lkqm9TEqGMB88WIRjU2ZkWFoBPHn2DpRucRaA6JVdWrTMFHepWJhsHX/oHZtxb1LIM/OxIQhAZN9IkK/2yhsPlza454NC6JQ4ZJG3e9MdNSV+ZKUx44R+mxZOf7rlBT6F4hz+ogLuu4QeJFeA7jZV8T1o4pri9/wXnkGAj1tmlP9uOV5ZFP5GUdhMeXRkuvyc4gC3DMbyfk3a+Gz4s1urlYiTZMIcsaahB8usRBYW4QBCMACsdTGQRzDp+oKvH6EHzXKC3NB5BkDMiWiKbkxpAJugWuRInwXKj6avlz+gR85rzeA+AJRLA9401z5zmg9qBn6/N87y+0T7e4dY7leTb+FhCghsOSOCqzs02r3ine210ZsWoO+IAwqkzaFNCl45zKdpdTPeyAD7vts0caf9aPwvYElAle4ZEmgdBeeTy5iX5B4oUFCoJRSBHXOQB8kdamXz1QT/7h1zhAXIwuIENwblXNdq83BV/hTSBcjAOreGn/vCgVj4PZUFLQBVyOQaSOWNAg5IPF0IBbR0/4SJLdI5/fEt+X59uz7SlWurQqOmSX+orR54XXk50W7SAMOvXD7V1rtteXS7i3y9kcMP8jLruN77evqLfpQs+/sI6/2JoDCExDP055fCPT/7Aql+c+MOQ3qdSYOTeiYH+50t+f43H16h83dPXCJ1gdt2ueOvAxPHtB/Tz0gDObOhA7ZrP6T6OsP6KU3tCgt70IFdkSnbZlRXjEnJDLATdJuUY5hdQxERb+mI9AiW2HAS1+5bGzDYizeC77PI+t5ekmz3pVo2gt/vF5DbSt7WdJhvobTMHe0fqiklwto1DI/sTxOm/TCYE2zYLy7+XBv4Q1u6dm4efUOfgLmK67uPdR1+/Zzc+kcjS5m/HeTNMHARzWsOHxaySSRXY7GuXgynBGpKduXLzvgZsdNp/MK8/Q5C4SSjPVsXi5lKMJvIh3PLDYyPgVj9CkHujJ8Vl449paUn8/W62b/YHt1ix7bKYi4ptk9PAd6PTfHqux8vm/yla3f5dUH+Eo+sv8+o/OW5auXJ+5xzHnDAQNkvm6CJR5g5mocQP/JIT0s0ahhQpEKMFyHIqJe9KKXauVzo5YlqUkp1V3B4RryuHxC9iyEHdUeAfmBOf62WcaOot6QNmjmF+9AEDP6D5cGyYkGwvx8alQ9RJ1famaFEX4MKzz+2pJK0TZKbgIwAPHpZ7NS35JqGCMs8gAKKjspMMfovYcmwVsogjMQSKd9lvWM14ccl5RU2Je2jaKR8M80Q7NXeJLG6eTRRJlJUQ1KztNhBcPo9daR0Ob3GAzqx04BYskdSXx7/cVwJ1hpcVLjdVpPAWW9i3/dxdSoayQ8C+p9dzkxeP+tz1ff2UGI9sYbd3uiAjlEeTH3wEIVtDy/I8GttYgFHXfV2L5dwNdH3jgKhNrGH9kOWPDpeX6s7XWXjM8JLUj4jAxekVHOHqOb4UlvUlHHkUjDY2U6EuJ+mBJHULeB0mnh5Q0ufHi4+ZGRnaBGdALlZVWS8du+g0X/POORJcP7a5fgXzNybdT/coZDQvMq6AdCob7vaEkGBG3NhccFlpzzH1vLP0jEyIceSJiPX1E58bOfnALtyNq16lcoM6E2vKkwMcIfe6HLXyxihMiL7P3msNT/SetUnubPkWTktH/OJtnpXxOSZ688AiVSvrb+sxXJPxYQGMs0n/PC2yUQUnfSvnCble6JzBQqUzQQqJ49NgylU2W5d7p/hZRtmKql3LtNJxN5iOwI8jG78I5b/PBZh3NgW56+1hIKfnsgDDOzVHhsQfa7zwi56LP24ue85MZD2ELgEmfo2HWiUMTR9jVtAoGi+oMZ7rJ/V8KicoK1d8hQIUnLz4SA73UdFS0ZAmqp2OOIl2AIvCQ+KQ7+lw6B8UbIpRBkPwa86mlbGQ6dmODbZ9212QhoqoVovqi0/TfBbli5FfE9YDh3oYa4sQcVhUH53SKWnMuFQcnBjW4+n2Prc+lWIEpyCkMFGReQij8UhEnB0wxRqePwAw765JWjPdgshvyhFbgk0EnHaiF/SmSoJsC02/lkmbvsnOV283Q6ShvtUb9zE/bmFOAXoSUmceJWY0QnuyjMValnq7Bi9NOUKv+nUxLqnQ3EwoaV+ays0jkUB0k7X2rOoTOKCAoDq8oXKtfXmo42GoIwYMxW7QEZ9cX1Kl0IoCdcwzeeBEBJoDwcg18s20TPUm6xn2OkChHdUjCUzo71HaBSsVQauhP3fmi2JfrwWDz+uHjLEV/FZh6oMcnxrzWh7k3N0F+DEbNqCCgxc0zydmg5AtZV2E1DYaHUI8oMDKlghtNn3sqafZ+lIHQ2o4AhfJh4seZ9ERt3QKIHqGjq8yPwYF4cbOJZDD6yK+7HN3JLXRmbKTD9+TGWwdIdPubEIi4en5Or4I3YSeEFMC2FGK3GCcVfg4tHo1ULeHw7tTmiQ6mOUtX6JFykNIEiWjDGtPxtdur9m9RXLEGPrtuAAXBImCg/rGJ+z2SmOb7/nszWQcnyvaNF+sVisC/8X+V8kS9t8hS3/j5M/JEva3ydLKOtawG9nNDjdXip0pZfTWNbFGv1tpI9sF7qitVTZLPle3i7a2i5zavpLk12oJTG6RMoJvEzLxXm1ZL7CG62sMHu+yrNutfqVul6Xb5VZqtR2KbhMqaLQlBvB0+0rF2xANvssYrNxrc8FCd38LfLv3GsPjydbtu/4aZbu4d7z7vaMby4r37o3/R8jSH+L178hSVSAH6Sey9OWx/+tkyfwvkiX9HPFPL/AOB5+uyTStRNlsXjF94tCB5aPeV9HFOSmdRl+A0Jgj5t36WXq1L7fxajA4fkzj4nW4JYbV42J2P0SS6Cddvph4fntIsHE+cGdufoxMgomAhSUP93Q9ES3ke29kMs4sSNCxeB2Oo86+4fR5La946nfVw4WMBNSW7KAOh4c7t++L0TFAvzSCUEjK3Ycdl+kFsM5KKr+n71JStLpz73qfSo/XaE3TufHO0FW7oG/qrXNY/y7R4xmABe2F1EgnHOUlrpprtIjDwWYbycLx8TCG4ePikBoyS6V187rsaU0LU1RCX3JFyuhEAkAY67KHYWJci3SY0AfZwHLQ+8jE5sOqR2+SpMUNOoN2bQWdEgJhxkeGvpEGMofRo8+AXgrLYrYPEkLa10xGzYzyceF6XiG7hovKkELRGMjwShS2FHUrpnfGPPTMh6L8fnXcC7CoIxwf1Mpgbo58lQk/lN48IRGyPfe2WhjJQSPhgrpE4pUqSpMQpeqJ8g9lKo04sN4OcEA8+zR6fohqoCwf7qeK1oTans8tbV2aR0PhwgNlaoOrH1hwPds8p2GITGueljAzhwkAhk+SKcUyjDpt+D6y5+e6k9Pue8Sm9ro8iZyytGXBrtcQLExxkIZw9jTlfsyD4XkKiiOgM8KElsu6T1a6E2j9bHHVpUcKAbm+KlKmuci/Pzo6TltdDA3JPPgGaxrtWIkd3xkR9s/JkpjhSw7VMUjh3TC+AbegCC3mD0f5LfxTssTybAXYrifeTI293IU3XvkmsoAdXjn2oEvv9P0IpNdJtebleTON+Xgs9Ia5ckTcx+jV61bw9YHEsWemKwy6nV6gdui6IufPBBQv5lV/tcQrBiVNNMcJwXlqoKvLoyBuPvi6Mon+NE9nB1DltoN4ldNNUB5UNnsl4+npLrPUWkqTL07BK+LMcEoiyuX8MEOen3q6RrBGfXgiY6OAohkjYV8wTI/vN21dPTK1MhzJNqzlx0JUPOSUhmcMuzaH8l6fImWuBYnP+dIGkavSRcCBcDAl4Js+XBo9qM/Bc3CzmznK4/F86Ur2+Wrp8HDSEUJy2agorjKZnGFnJVc8Zx2mNwBjWORIUNtrPG1Et4QnxwSJtIeqsiLynqdqBimnEi3ncUlIUEV1J0bQvhLpxi8XjByA9G7p2Y2rb3iOKw/eLIdARh70AZLM7nIogsvpdT3eLGpx68KXW4R+3O5scBUcXV1I8yYCt1g9WZwIkj0nyCdauBGsCSEi40MnLh4U42FQ7RwcrThZbqAQvSJt3Ul89JyIttUXOAJgB9E8x0Phha6Rl3ErOmB1u51VV1HCt3kPvTqVDUQ4vl3/yQiwvxRRbbA0yDxksjbeAjBQTJ1ZupzljHaYXoJwFLLssKj0DTHlnuT1vOKCvu2p4dKch3IFJTjxovLxgt0KVvsXgEMFNTCThaDu7MXU/fXqI9JVBq6dlvdkXfknpAxh8g/UL/7lZnXmZMlvcv2Io/oLbfnKYQ7rnz9GgMWm39lBl/3u6iXfY2UveXw76qtXSbYd/LNAxv/VO32rr/zJXf5SPiOJ9lwOvGWq8N2Nk0G39pWVwuTZVnRA802PaesV3eaCPh85JvZKBbrRoOSLpG+yC99jm0YGhf+Hgrf00zYPtfevIMg2+rTyshT5BRfL063wsXK8FNvNO/GtSSffCyvYbucC7zfY9PbITX4P3v21U2aXQ8622gqVbXWf9cbULni/FV/SbYgKXfndX9dQxl1YavgT+Yyv9tk/kZ6T6E2AvrDPD9aj1nb/3ZixFDenOmm4OTpbtSrtcy7PC+qvRCftLysYKgubftXE60zpx5O/GZdsrSPhWf1uYtg0FcnufdnvQt+qt55WJZaZ6yWYPsjcB436Tlxq6+dk54ProV/kNsyvyn1bE8uut/H58/s7Tw/4s+f3d54e8GfP78+e3oc+B/BXAh2szTNpeBwvV+2t6VSRNVGXx1ioWQHeQ4sF0KJRkNhV9Wsyvtd26tqzzvTHY3I8OX16dbmDJZeNxDnX96hfJ59lQnUEWeJwwOazMELAyZjdYyC3bgdb7zdbaEhxOCm0KD+yGiEunvUUbGfd8tK8iyLsMIEm+eSdZfaYsyCJDg6UrzN6nTsCfZmLbzVkUraYWnrJVZPaHI3rEX2xHe8uGB5K1yMc5ligKBM4yeNz0aSBAMKM7XyzLGD0cj6CiukL1nKzVfLZMFRa3a8KEaEHnURmzYKVkCT6g180DhPAmdCe694ExIY1Y9EuXpNyYbgGhZ+TY4E52XfqdIBbT9Lu/TS1yNmHSI4qaeEEBcVELh/8BfgzAvNpL8YP+hwOArBQih5QmY9K/SVLx5adZe8NUYf5VwRm5Td+hb3X2J9Bm8MMBAY53HT0ohE5yMby6BU87mZ2rJ7tOO+E4Xy/vbSISZASi+Cm0WgieeJqpGDFKRQgKQQQ2ZEc4v7WbDubvehZMyTflf3YEAvaYuKEnTvp6SzukDwVpmtnZsj6wSugNxdhY4DBAFnc39TxgBBjkD1LUvcQJbjhiplqR3RIX3fN9uHMf4K2QPLOfDmZMlUeYUU5jSyC5GcXYBAbLNyVSgSvqANp+5jFbcwoqnrLjcWkOTM0QvlgXt/FLZMrIuqGUytIJzL3rMOg3msgY7LrMYzk5ajeLR553Z5oJPfsiNfIgTO4/DpzYEqLTH0xTqfngzoqVzwmFVsInGvG4U/AfR6Fp2R7wT9RlxX+5Z48x/3tB9TbZi1+Q2GYWfFvPWBHtA3pfkLOf3ruBxb++Xk/doliJPxpW8EmbbGXTMhdrR6ntmkMZldZxHYPlS3rsAs0Yek3G5afIZHevbriTfEV2/sIMGwDWno/m4m3XlNynw9eES7f/TmJfFNJzOFfQCK+dzpE+D7RkWx2LCsgk+heJtr1FQl8F9kg9m5RckuB/G/y3mvpUWzdFrznKda9orfwpu5AeAEChI++wVsBwgjE0zcoTVXlylxVtXuf0x3dEZnxI4SZIJjf+NwYKXqIhVLpsUt6kFUdrcLhJ6hxEEF+elcOaTHot/hvtHkcJnH9bhLZi69vP6ucUjnwh3YHkwdU01645Ruz68opX/llv5mF32ks9pn+yG7zsmNDv6s4A9EnnkEfAQHmyJwcUtc360sn6+1T62kvN1aFNKs4OlnfP64DfjasfzIq4GfD+vmo/kmPhHZ730cKN08U9Hjr+K08uzbnypo1CCH1OsEL0z1vNMuZ+6Nq02Vm2X3XsO5mU4Lt43HuPM+p7VXjtUK2O1cYej5kZuMqMoywHAdqtSOzsJTlno3CwHQXr97W0AxP7VPfu1rLuTcYItA6y73rt7tYmYJ0sZieF273YnjZLNV7ZnM2Y12kfcoE3ne9i584+OJ9OVsVRVSE1zWgr2/HU1nqBgozJGpOfyWCdWMuovEcQJUjbPpdBuMqjCrQ8E+n0Xrj8RLP/X16qKEl365sJpon9HIntv5UtPZzdsQTI+hTWS9kH66WQONcGbaY2QPnok1gUSPz+OkiHTGNm8QHvgFic0Q56wXykPCsELsxib/3SFxoszusvnvYIeAvPWkdCXn1nqkaWrxM7HLL3oP/1mRUF7hfcO1eGPBL4ULGSKKiSqKkSgLdiXieSQEeCWYRs91Lgc0+fjgVkAjUO71jteJ9edq+NlmyVgUdT+DdcTRbtqTly0Nmv9Wv6OZYp77t9/4oa8znQ3lUGktHTfNobdD3x/f4zoSh8n5ZWd02eR3+s77sQdoMR/DX0uPH2seIsRg4w3TsSdDdo3eaxpU3hSRIPAcXCPwCzLA58IyXj8gjoMDGlHwprcniY5g8VX3eBYjcvP3A3iZnn3fhjlXx498Lx4Hfay1OHryxEoLf4+zO47nI3nhG7kvm7vicwQyK0qvcKbJV+QGLuKYqzqKmbQmEcbbF2pjzfmSw2eU00DxUqNipBeHzBNNEq+tXMZXTUCurNsgaQ2DvWimeQOWO8lQPAh1ythHi4tPP9RXC4yjfzXfnerPsDA1WKS05nYZ7Nmy1UFfwYgUYtPpnwbMbglDPF/QKbBf7qRkW6suck1gQc36rmRAXI47KFnONausia5X/xrdm2gjBtG0BMVveI8JYhRf0TQK65D7CpXuw6cV6CJc5G/26QfvCw4Rb0EtysUVaeQi6vwIT4ll7t8VUflbUqzhZxQPxAbkrFuj0NDcLx97jxYiaQfB2AA5B26k7/YOe0V8bTc75v2Wrf7n7X5vrr7v+m8X+KTvybtNi/KhhgD8M6nDy8T7Rg9sqBg9LiH7KGED4WIh+3sqxO5IxdZjlw5fEPlpn4NGYudvObPdDP4RWMHxUSex+Mf6h4oioD3s88quEQnpQNe92G/90eJIfoVASP0z0vuc+NpA6Wj3TT+IA/PBB7qfZAcPur0JfmLTQww0+ShHRw9rvDvD+VfKx5ORfW2zjsNjvP1ls8KcWm6f/ucW+VnT3zTZK9t+w2Kbj/8Jq24vGBj9YbXsBjpU/G9rfHRnwq6H9emT/RGdabteCNZe5PCHq9XJ7eQu3EVj5klsq77N7mvct0FS5TBXMrbnL28PfDcsdaZlsCeL3Fan6nH6xCzVc+fFEBZhszxOprjXc5adrlOuXRAUBxNIhfxKLzWx7oih0iy9ntCBclh8dd8rxWTX8gCEqlbhCpZfcWOUcNMJoNTB57854ADwNS+XTNQ/ZaLqIM0JFJ4tw/TVHNyG27qJVZM8Bnc3KXF0jREsNQhGyQALwDmoK3JhAT2CPvuvw64CIwiAWvH453QoY26B5DV84ONp+3r3G9IawrxorqEq8ueTovQrvMl3vEQmIuXESr6zPktM9h2WS6CarCS69gytP3/D8k41w8rmfhxTBIEhEQvwPlvtuLEc5Zv63YuDazS7rteTeXaCM71fc9ZQ2pSEgamv78xj4hUGM75bb2S33fbfcYicJ3P6fKVpqDAR+AQ4ekUBo3oGrgREiY8rjm/kz5g+dCKjd9N8ftEatvuTQDkN85NWAGFH3lfTHhBsgdyy/P1ba8T/LKktjCkdS5uWbtMJh9j+P82jslh0wLar6k0y6JzfJg/rKy42N4aHVwIW5eWUuRf2F0OF39hNjAv40XFh7RxfqOwDxkE93c+Z/UoBapkL7gR3y7cEO7G0ffDEDh93/tTg3DRLeFOrXu13eyJDzbFEh9JOud6l9j4bi7PcAMrMrpPr1JW2ZDbKjiWWDrRhOTCM8+NCYCEJWXm+6k+0dqlQBot2KGoGuKxcnWzqCGNCO16kSuYJs+mGgSNJq3NfYmQ0vPbCEHJ9qROgdjOgRWNpqHbwwRFC7a8gJViySucYDl/ssJN6WeXDj0do0w9fgLdWTsbvjvjOdEEGnWAO6zGltEqTYmBCoUj11Y8AzK1tEGwJrnwqgpLAYJ0/ngS0DDr3Jc0JrlxC6SK13EbTqdkkgsdKf0bNKWqzREw5mSp9RkODpAVdneb06npn97Yy3UM70hAZtiKU8Ved1rR7y7LwW6o3Sb/HZrtGq8Hfo7ysl0P9iy7HMvxhTEz6s7udz+F/jf/2od/AX235XLfhhuz+Fk0GMgBEMxEEYoRAEIWHopxFmGD8aFnff9zCgxIeUmfgIpWKHy3qo2IWH6QY/LJPgz0ktd8cWh47cfPphj0zSw7eFP9X4+Id88mBQwA5nFv3k/A/DTxzxYOJXEeYUPrx3NPzo4iWf9D744XLAPtYf+tA/g4e5P8grqaPFIMkOJiwo+3jXH41uHDlC3jv6IMMjun2oeZNHLyn4l7ItfHgYG+h7tl+m5es++85LOfLVz4209N0SAl80DDRFNdWF+1IKIHJLf4kfPLhPBbu7EBR/+O66f8ft6/vgzRRKq867da8XfvlG3c+wxp35tsGXiCovfSW05PbJKV5vB7GlZW/ql+z/7oP8eeVi/xAotsFx5Tba/NpGaV1q+X1MVvE+xyQPbgV+/7Lbvzy+aNp93p3jN7oKFu19463iDiPNff3+K0mzXUmHWZB+RcR8+RLnlY4476HjVXakQV+SkPfu0MTr0WVBbimgxfLqeDhzwifBvrFMxjUo9pwwl93CM7LELVV6dJufQpDjcFugXrk67pPkK9DugxdqIqC79wh3y3Adl0gnnqexG0G6xH3HbMlKOD09qle3GmSlUPfB6m45faRY9ELz1ZoJIyIBK/x+DIm69sTWYSn/gKbddSVMJohrY8hR3idDOnzUyzlR5vpGajJ1yhpPB9G7F0ZMlAKGlYN49yLBNOd4gZsMDx9XJLm9Id4+QfhdYEbOfVTCO7bwab3lDyU2r0TmOuRKtkW2O/Rv71TUaK00vppycEqb18cVj5nAxUi/gLlCOz+X3avv708nJzWLM9ZNNOa32bOmUQ03wBBwZ8jOQnOF5ga93zL3lJYdrd1daEPb+S6O+rZk+qDkzgs2X7qG+NxbMUOMSds3BcGASNFBMucjE+luy1p+M61FgXE8xhmSSorhbBQNdMXfWo4Mc1Xi7M2N2nnWggkONiqUASPzubrr+qsLDbdiaxMPvMQGsS23lHqvbdK6l/fyCPJp4DhibB/F8AiD+tJhqzjlts0C5Tlo3bRimEKgkPhE0zXVGGIRmxArPU5+lnuv2rwWUREMJdIMznqucVMIFIyV7exmjkCrqDfdTMuxMu5Qi7+f3IMAva4zFLzki3OGsXHGeTpR031j4JKW6blAO/aWRbQ26xYEDE/n4iALzPkr4Y0G2/or1v5EpuFn2j8HqAH+E/XUFLToQFxsKlVzKH9OW425/e7MGzP4b0j3qxT6PiNd/N2VZNvA0qX8QQQtE+MC0j/GXIRTduq98vw8gwR2VW/+9cGrwHQx7mULTftUh7SKd8WGdyqjmCrEZf/yBhra/FvkO+/dLArdA4FPrVZlxDqnRh63/jMDhK63+qkkYMtxRlPkn8btaDPGClktvZZgqEK+l6duDIjtpNU7+lTP5gg+7jdK7dm+joDmlRQz++KuRIBGilFFZ5YCCTlNzFPQhOVITUOxWjxxonhhpK5kQJilo3QyBd+WGr+GwClt7ko35dzzRVIu4xIrE5eksUOTN+vCxu1NuCRUn5mMXefK1HbA8BpUjY2t8MxDUdgAFj+t7zRfX3OOMnVZCLPyBKf9pXDy8IzSt7z1HhNZixFNvM5btT5EkZsQ8sYndBPuqAVo76+JyQLBxLdp0Vn7dlJGog+imtFuYuPjOMG+mmF2pVXAyfomJMLdeV8KCFlBaJ4kBMi3wrqxPrHBW39yxxuojxzOUQgE20wq7a94hRb+iz/7CKe+A4qD8bztWvcUddwJItkBELBcj3dPbOwGdZFsH9/t5nhOws5Iz0/7eidhumxOhr1/jqw2oqsWofqLJ5on5CwitxHY1FuDu+S16qdmaS78FN5ye1VUx08KEhVmjguKl20UsypRiUqdZNbDRTq+PTawfM/kCijoe+QG5GVcKvLqptlYaHpQWpy9tr1Y1g5xCqZRJKfgjGwRM0HmU2/uRdb3Wqz8fW6Ly8UxaSk4KKeO5SPNrl+lY/FH7or/uOV3bopvW/0pXEHCJAbuuAglUBKncBL8KanU7vLvSOIogEyPQP6OLUDq6M6AoYMTikg+aW/4CBGQ8G8g/PPYBXLsSoRH+SSEfWIh2VFHuX+EsyNSQUFHRAH7yPseRODxIXiHozsS+3XnyMFkBR4dJulHSSP5QJwoPbAVRB1VkTvU2nFPQnwE7j/1nDB84LwdAEGfYcNfFKs+zBUJdPBpHOWU+1D+Eh6J4Ha5MNH32IXkjTekr7Vzf6N/KiJvVL8LQQD0ssgH46LTyMzd6dYfhCCMO9gwBqi5qgEul++RBPPrunEB/lBeydvfVO0+9N32crNURN2SL3yZX1Ttvq9TOWnlKtoAvkVGLgfhJhTcDbsJdyxjfJ2xucuyiDY3fRllxWlfmXqO8k3uWAc4PybenSO1/bcRTwQ8w/ns209veJ+8oO9Bj2KD5oXou6//IFYyMzf9Yl717DGh2eRYCe+tvWbyr5nM1erR+YA4lTpshiTH5bCnM9WIMaF3MRAI19330qxzxjFxd1+yZNJyFSFB+CyftCfMdsrd9N0OEOCy09MKNIU31cWKQhO4qhcqXWjU9a6ylZQPHW6lrcC914sBVk5LclZSewVTNm+tp4FG1IctxzydvjG3Hrx2TsKG4epF3sNIby40sS//xb2161VoOzzF6RptwPtzJkKUlYZiACSaXK783clO7Lzl/aNNeFpx0XLAwHAx7AB8nGmyP6MpoV6M12Q8TXCqF7J6khHDYsoZAK+SQzmqHJvb2TRvHFYG6el2kUR6IPkh7OIlREnhxtFPVnDnHXto1DI8b6ycDu6KpSJQ45lQdt3WwDTCsbinP9CeT8KCpQRJYa5ZhD/rtVYGI1SqxtYtendEq2EkyLcKr2eUANAr1zBgObz9BjwvpZ4rZ7p5eBsxr0qowEmpqusIsiuunuGbMseYxp+hm+M/kA2HdPUGPBDXxJT+rhTNCcw8zS1acs4j+ARduztWc0hWYZM0GR2IlWV2EWX9yRqjIJ4me7re+xCIvb4Op91IC6q2T2gy5YNZLdVv/lxsBlHd3f4m+ElUJMbwTN0ALjlqxRejgfI+THu9AWZ79Az6tE5DCyH1OUaV23hbd+9DMq8GjAeSSvexMdDBN8SzP87vI3Q5xktm+BJwXfyDHErc33UutpiXyv2BC3OjfxLw4Csf8Q8K3FfwaEYgcPk6cptZAQ8StaJPHtSm/DEp4pqv+E29fbfBfVerkoqbfUQGVYb8nAj4eiamKLTvZ4pgbYsvWOHDGqw8nO3PlQvWvSCsCtnitoY8GHDmJ4NZkVox6Pll/QLNMV9iXDve81UmpHntKk43PdPeqQU4WeDindho41sVqxN1cMXG33hD9+XwoPR3/X0O4EsmNx3xTn/4ZF32E9MUgD+Qh16OL3gGv9AmTRsGA9GiQUcL86aFmg72q6QFg5ZopqYF+/jLHn+BOGfAzwY509OCSvvGjjT3z+TCzPSFpu183/EG0mlO58cBAuP4u+zb7X85jgaMZT8S7+9HpLtjRbAwDS2gtL8cB+T+eEb7+OsfBxZIOqKZFy3ENEAY+xn2M6WfI6r7GfYh70MPDeZxjGTfoThGFhrsdhx4PxB/jCA4Rrpvt1/Cly/Cz9A5WqG/HOhuMMLnEgwapFmfVml6pVmO1gwapjmbvhr05xKPSzBoXj2O3Hw9Q3ccOaGZhWY7WlnoFy3GdLIwCH1Bv94jlU7y/QCfm7jRy5+YWE2/DkUT/CQIv5Cvfn+gFHhtArjZIuFgOqZmD94d933jSeU/rEKJuJi3/V1Y7gcBLxcKpvDn1N3nUS6xZn+0H6G7NvtjPgGhi76Mg0RRaOAIUV/+H5iMA2F/LxC5CL3+MwrVoerAk+Yvsb+f+xrel0eZ4zh2R7jG+tnREL6/gf9mrYHvPoYcr3R/bs+21t53q4ddHiJhL10wXXQt6TU/Sq4NCEMwxubMHb2tbWuQfdIDLAFyJvU4wYTdw/0rGJ6PAEpUUpV1aL+u7kyHmqlbV753SJVayxLPkdMl8y93MCLI3Abk96UPOOusTAH0fKyavz+Md1uzfWooN6V/YDbFpc0rCDtuMDTnfDK43YvcJMIuzYw9PQBaPXNXT92dAFwQLDwhisdVoNyF8FGqvQw0m+RUMKskGyFOw28l+owhYTFoqqLCKu1Z4OWcZDFsmXGH4WgN0pdpkGXo1XIYE2O6vXWNMyE3Wrbup1VuxjYxaHkVZORqFFnbPEZgavGphYxFynVGbPn6/KrRS+/7iCHZw0VXmGJJexHW2ARtjbSc4MJFxoueXPHKgktXBIi0cEwOlnZYcCrkHh30+ObU9Q2q1AbqTMN4LDlXgE8owkmyvTC9yOSv3IUeGMqZClYAEr71/f2ucv7Fdp/Xcrbb+5JsZn8CV+7+ToUwmlHHK5bboLO+VfNEWmZXL3XutkCMGw0U0ErD49vRIS/X4hQtFBz0YgjPF/5NdNnDW+F58j1Bns6PJRh6MZfF9v08Klyj7bTyQIKcfBnr3t59qIobwT8E/9WU9P4WVaxMpcspI4IsRowWJRWeL8z2fVKWLZ+QudShDhaBXndcYw0DRb/XzmCAs8Ah71j2c2bOG1wkXR/puSwyWXByNM5/lqhP/DONvS8FuX/oqPq7qnp/d8c/6ej9eac/cazA+E87sbIPAy2RHlKs6SH0evR8E8jX5icKPLD8ITSbHXWz1C8Sp/ERFkXJw6U4uFPQjxI2cngb+3JKHk1Q+/KhrQ0eKt0Z9uknz37DsV9x4FGH3sCXs2cfRVgsOaRo4+TI5ZLE4dRQ2RGnTbCjX/7gTomOEaIHQcrhc2TIh/slOqLG4Cc6jH/2AtPfoOgvY7OfDqP3d0bbC6ugP+W+s3+gKHH4eAW4j+7018CmY+4OSMJYJcQaf4T/qyr+3s7Exd8oS46KXMDhkyMe+7XCdflD39NXR6SiYbWKF62SUHXT/uiIrJplY8CHuZ/nflC8Nff5Slq4b4K3S2PvToln2OhkgNx6zN7faPQBBvoqhrd/IbJ0+D0WC5neQQVrwuvLf/Djd9E8kPuTcwL8hXeyMMlLwtGNi7quIFBMa0XuKkLyQrjwpZUzHoDA9WbarWJwV4irzFGIZbBn+awwrh5xlKI1+r2V3reJKDD4/XLC1/UWjNZ8XTixnu4bANJKZuuBM8D+7X1iRP9CDmpVQ3bVdfm5IPjR92dBcc23a24vOuBqePLPnqUjTnbNLgWgMsuzk8sHHyHz2axh8nY1DfSMvyffkMFGJSiEIX1neZDD88n37FmAhQjRew10+33eF4FNKiBxmEbmdYrCDfUIQXjG3iaIoYLc09qZrM3tXBHispiPVoTiImJ/PrLLNdqn/TKKARS/drXbZUvP8yW/NQ+lWHvTDt7eCnHxuiQcOT1W2DR1yL1e2dOMBs+33scXqIrXeoKB93UsYU/V+8wM6a4+Wxha5jNeJrz61B21DU1orCppDGj64cMcbD01YdooanzDYxRcSqAJldtGPS/YEoNCEPXzRXhePfxxU/Db1e6KoK2zkbxBFzdLockQzZf6hGe/1GBWySNfBzr63L9l5/yCXJPxBl03PTqiUHkHTyy0GdHGXRpSKaOAcv3amttCLB35aYYXPR8SZUdsDLtlM3O/4dqpr9y1rSs1WZTsTsiK9MofZ+VS89EiD+18Il/vJ+mSjFGB/BL76duKYg54+vdKfZ5m4jF6JXFdz4+tqKW39JQTaRsL7X1WhQ3ar7G+rmKBIQqK51gv3ZjXwkuT9ABQizczS4nZr7oB3VtdJOvLy/Jvord/4K/5Rl8DnLdfd1p5251J5pMrJl4zJfXFRw13CfE85oWWAldRi3MFgN45VXpi8Kw0Bi+MKLrs2EtYL4KHZ6Ez5sZ0KsFp4DI5UaqI7fbnfO7dmnsYz3v/HFtAKXotj04cJNLpYGens/1M1BP7nmOTv1y4K/xo+hiRtFdlnRppnpYVhSD8yhInG11xlwdE/KVrt+V81VGVdFLBGhuHWjcbvjoU0/YvKCENBOVvkuuu08x5aeDwzIhlm7YKpat1gCnBFiWYS8fCyZX22Jt3Qf12zM+pFeFGWcwySl3iRD+9N7RGAgZplBx1sntr3MgEI05AWzYpRfKmz5xTOJ/fiuciBlha2DnA1s5Mcr7JG31FHxJJ1pA4GTItIrBZyep0iw23ACDMCEtWWaXWKIen+4AZubeES0XP6EBoZlXnU/oqKTjEb7A8vHWayq/k7pqbA4j5s+sC+GZW3P4sNZkwEadznPOFhNszij/cEc/e9BR5kpk9xiU4B3Pal6VEcKQ9s9wTeZSo5QLtqAz5WmbhMEayQG+xuo073N48rcGy9LS7yoQskWpNFO59tGDTeofCyw02mdGf/RWrgCWEqIJWSU4sBQFpq1XX34xs50N5u6yKitPC9YxVfo06Kb6uuJEkTqZjTnElOWJL3Q0IBdEwy7CXHLlX0nFeTxOyPX18MtTNQiITg1abdhAl1S2ZVc4616Gecte65pYO5+fjvTvikcGo4D/otEqbMrx3bTqE36HM6wil/uGLH9HP39vlO+756eZ/SlNTFIhCFI4TKARSIAQSFI7uq2CSgCGCIHEShDDspwzBh0r9J34JfaKbGH6krWH8K4KJ4aML/GvzFPYb+vM+dRQ5ME90oKePoBJ2VIBR0UHOi6YHey8Ff3h9PvrFCPqpOSeOUC/yq9DsIa9IHUXlWXoEiTPyqAUniOOIMHLEjMOP1OLxET60nXYEBX/g16HFmB54LySOqwDxo0P9qFKHjzz6jq9C5Dfyr2WcbkdI4X35ho5MWnZP/JNFlDpa0+1xiV9PZQt+KgG+ANrG2SojfQt2KkdLT+jyVgTvfuqD+0N/kKryjdlEQlPYMDUfCiQH3AC+4o08qbivrUzxuqMf9MO6z9rLl1Ym6c/rKhpRTWPhcp8FvgR7Jztw1953tFd0KCxZXPY1fnNw9bo/jOp3CHZnYED9Rf/5T9vP1esJf2eLFOpbeA+crEd4wDFD09ORlxRRVi52E9gLqr+JC3GxlgX37nG7GFFmINPJe2Ri+6wU91LimDQ9FxoRHAggLr3mkYJI3ZnmigqdueGyhNkL3zNnnI/F+y0OhoHiA4JDhMV/nicCG0SYPUH4fpiTBwQEplQdVDNQjDpuDWoVaN1vlI5O2kN8WrowJKlW6fZEh5RAi1SCmgbNeVDFI51ErCfgXHkF4TDE07poQqLK1aNovYgkm7Ww5ndTrnGfxqMoNpMVKeEFFOGaJW5DaeucquuXESAhdSKZDSLcBbt5N5ofi/vun2ooS8SItYqdMkLlfPVDaT5hEfUmJgXvU/BOZG9fuNYPIJmW7r7SuahpZ76NJ8I90RT4IPZfm/DcSoTUAuKrk+x2L4QHM9vSxXvp1SfLgv2nIKbArSDuJx5lUVWURWmzKhuxGivctKP6CRs3Xqcn+TFZmfRQ1VGeCRYsaLaVO7cqbUmdgXE3teQW5sPlXEeweLGNGtO7yZqjqYWn1Zq9INB6iMXubL7PqHlxl82JjLeZAh0FN1GgzxMit32YkaIktTyxuS/EeFU9LXU2kTBjNz2HeME0KTIYGXbapkuH3JCL8oBm7EpkIzA23L2B1N6drIUr2NhargTXSy9/Ms6hrZFsEpGuaDOlDPl8/UrnHaaaiyAzjwH2iKsBhIN66fOr9CI0MSuHAMr6LmUd7Vv7lr7R1K9K747ECXC0b/28dctaKqhGaUWHKuzpspo3nNr5yZ9yi/tD5xbwJ2nlHRG9ZjPeTVhN7bPL+cxarFDVNViXOmi0ETFNSKc9tmelstkGPfKoAZL1buIYxKTYfsSbdz5fRMbL2FqEUiQJH4W3SI8zlYkUSKTWuUJELqLT/fDKRYJI5rECoDC1inLp0P2ytM2DC36NUZy6pDrevg3IwHOYS16BSaCatbbDmW0CWekoHMq3hwxZFWAZfR4/FK02MrePztLDfU0r0z6e4BGfc15qKs/3OD8nHf2g336PshFMlYyFrsmiMWkC+HCehqeNtfwQ5Tb65dm+tt9XR8D7gB2auDICafDuokdmpLp7lNxJESUDT1EG1dCYIQADdY3V7/31YV9TPnuvparTSZ3fKVQ/YVc+ufdxjEJTujs77xnjhzxQ6N3mj05jwNVTAm7vhjUb3LtC1s2GT9p9Tt3TQK1sfVUyHew6jZHeO8TM7TfRtTdLHquB1fxHqezOinoigJfzGhIP6S8SLqjvFUuWpu/9lhyRi1EgoQ6+r4Qx4lS8jLlcDsZjgxaxNMfNT+CnmbrARJJa/ZpvwvXh3xMhPT8YLi4FTEiRC2WJ680upfpiQg4TTtvLQkPTrG/ZXM1Kvxhq3AKicuacRsd92DPIdbnxL2comkITNKtmfbxpndlERL+2d0/t+noFE/aGoDky4DQPytVZgfsVRvCpCErtbrzWcIPTx+i6vP1m3vh7FK9oVOeWROI1+mg69X0GzwHUi64bOf7fB0Tc/2HN+Q5VvstRfjQMvmsY7TDn2OL/nEEIyvbNOEb4F1M25bECy8rHv6y0brumq3Y4PJT/eqX/EsvtkU6fT/R/fTZLP4rV3050/3KiOhzf+4nUdKjTrfxRvfP/LYP6rsX5nwf0R3RHHLgOJWAQJ0AExlAEw36G5KKPwNJR6occBfZRciAk4tMfToaHItKO0ZDwI3RJ7YDv5y190JFYP7SVPjqaO3zC0yPQRH3q9LH4w4+YfDQ5kU9jXnY0wGM7kvsVPeMxkuyAhPCnTzD5VCzuY9uPuK/HkiPJHn+6DMMPgIvBT4MD+pHu3EEicjAdp+GnMZH6CFVgR/vDvmV2kDf+FZIT7keSnf1d6yF85KeWF6I39G9h+0+8K4/+rQbRvKsGeWz8qUFk6YCJHlNxILndKJy+tYlroD05ose1yI7iOOdivpkLEO4AbA2oProzOxib5gheX+GjGXeo10ti0Ehc0acPqEmEdQdhdW7cCb4t0VWu6PrrCEZVtI8jO+0HpX1PZewjQD6qCtp+sCHw+j8qe7IsQ/GKY0JA8BnOn5qjPjrZf9KQ+lIFuamsumifasga/MKBJG3AsfJDZPxl5Z9u0N+5P8B/ukF/5/4A/+kG/Z37A/ynG/R37s8/kqtAX/a5XhxT7JzS4TH8crZ9gEFvc/akSIq6X0PcqYztgd3PGbs+7rIeGLMjMfebVYt38JUURgIX5PusYI66iXCrR6sIsFixnKQ3L7b3W/0AI0MTAjaaoGgs+xAb6IIVXu9aV/ZpHMR3+BsuQgQZ2PVy7aO6vfOAQd3o4SlILo5veEMofN8jploWVGN224TrzXvGXZC+sILhLYprbam4cnB0Y8X2BQZcBzyhU8410hKvj1t12pEQrrAzOCx4QTrPG9psV1M4MWNJEOrNILpRVipe4Tdb1IskUBAWqCG06zeyJX00Bd+9wYSaA8ev9ubo9EPGVUe4KvLAIpkPkZgapkEtO3mdtWNTasErFoHsgu6+Ch3r1MTKqnsu6gQbkTqmoAHkTut4Ys+la54copZOcwh3aufIDRid7pugu+M8AQkXZ3ggIMg756Qna7MQUqb2+RlJrvAKy8c2W/hyErZhQkk7JRQOWZgMNW6eI9htoarAVOKNpddYzAavZuxmljOdNR5wz7hWCBXUFf/caOPZT0Yv8ufzq7bpZ/XkhVsl+JgpksCmTLKzQ+o5YYrHg2qiW8S+Nwy6Z7jen67y6mZea/uWVfHw7X3f2oJviud0JlbEPilbCwx8H0+7TfZ47+ZERhk7U3Q5szpyZYrg9uwhOL/6eJaz1ikfqNsTbImXHbIP+z45dWF7gE3OSJBjD0uvsMR+G9gqLyto/1qu4kJUMCHLoLzaO2bHAfk9nDaOuOMcZv9duQpl1qOxbo2W318mT+/a64tQrUnprMb4p3IV/O5fD6AVJTxaO5AsneAEUjpRy40a9jayqYWeRdNruiZgchmyG32tuQIlbNynsfZ0FS4mIFp0Mgsa+bz50JQNlu9FDyhPlPfjEY6diSeYxvP7TyFrF59blfOM0/PZxtTiXN2869MHhMXLaS647h5wo6Lj7rKAKEidG31uTyeoTXzf1MHm7nIwZ+ndiQ4j3DIJGzIoOZw3KAYIQruYJEg4piqMdBudXR2+dfn14VInNEYjG+65HaWZF3EmXehang0fuXFMUYFPd5ZpBDgJkZjKNM3fcWVwOMhe0i6Ey/lkoyTzjrQL7SwbW5+TAW5AOH7QfviwKTm/ISubQe4VeMl2uNxzzGIoFuxFMG4e19mJSJ24J3B7iZPmqRoQO1cV87aS8/meZcLTzYIoXC5cKuEAX7qtS1dKBGlMy+WoCecbmGRiRZmglFgsEzD4mcTdUuGcqwNWT4rJO1PWkZfhbZbSAO/djzBwhFI6Yh1OCvjQu7v4Zv3lGqtF7BoUO05NGa6Kgh3R7RXsBhlGcotdUbl1YR2gZfICjyIuIj1+ic0r1uXPBjvJ5RlEPIjEt6oIinp+xcYMwrq8WBj55k63pYeyBp56FnijBkiWFYc/EPA6n5kQicITghOFtd1tUtZerViYiUhJcKxxiEdssNNKPTzvv5h5ycgE0JTzScJiBKxaXDf2R5awoht+GyJoSaZ2nwRRCSSMIJbpf0Ap8R+ojuD/bdRN/wNn+hvUTfBfUjcdKdnoyNmm6NG/gsdHbwoIHkRMUPhbHB/YkSA+LSzZb3j4c1D7EaiHk0/elDzKRg+28PTImxLpEUncgSwCHx07O9SMs2MhIT/k4b/kHIcOZswdiRLkh9WCPPpo049SfPRRND3Sy8lRVIp9dNLID11TnBwNQCh2pGqjj7Y99GHVBNFP8PXDcQHv6Bb+/y91k/QjddOhmQH+f4a6SfpH1E1Pj+oi71RsdeqFnn4vsTprSLhwfNpOAPp53x5Qu4nd86VdEZKNleDOtHPon2VJX4pnHgdExMSD4IneCbxk4kQq5sudhwe9FOUF4DsLDwZaWhujylNLm+36TNXUrIF5d6PP/GtOulgHsQZE7itWmvZ14ExFrTKrEXFHLgGouFreEK9NLfEnJGzFpw4tr61PR2d8eryOjxP6Ei6vlSJ2EzSfsurWRP2dJVkLl8LXE6jaa67jVqryr1dRQ8/GmVjzmhu8uTW0k/EPXXwwZWk+S5afIPVh27f3ZRUc9ybSLBIFwCJBZJ5p71jGXufieYMdEloH+aWJ79Od29Fg1XqwDKFtfxL0XEsFf+K6yRP/p6ibzoB7p2FafOxAQB4qzXv7yRVV1Ply/w/UTapxK31jzJJDmlsbg+lkw+mpvHaoz7sbCRPt6TnUZo0OeE/yNrJNz5vWZ/cbVd/7/pQXTQie6B3Klzp9AebXWkgnf3tsDB5uQZniICehph+kSnRFh1Z2VMRvtOyldYxfPsq+TFas6sps5F9i4CyAxHVHgPl5Xl0aiwYvnYoo8RY+LRsxqy+damrIZtPExPNiWqImCsYm0kMPUHo5jhDhQA55z0yV+tJ89RGh39Dc5d538pRKThmNTbZ4RZXwFX1ncvVhtUOvLuHkNWFlujHMGBpAtZ3okHGZL/aky2MjV6A/4g2bqZX0hO86+7ydW2ZOVO0Vgkw9P6ttPW23HcRZ2mA2OsDc0xuH8/Pyt2WhjraHqftqs9LkY5O+6nMf63/skPjPm35vkfjZZn9ql8BRhCQIlCJICEEgHAV/WrEUpkc35sHt8MlahfGhboklRyput3i7udttUxQd1Uv7MvbziqUj3PIJliCfYAkYH/0KR/PmRyX7IGwmjswcih9nODbAP5JM8W/wL/kKkSM7GKWfXBp67B9+WkYj5Bgbhhwmjvr0SpD4V03Q3dyRH6oK5FPGdKTxPhyFh60mDz7FDD3MeLjbdvQvjV5yGL3m9Hu7BKsrfrlm4/ZveapPJEdnuVRllu/tEo7hHSXQXydywam/ZLy+ql3/0CaRCNT2RxJqgFvkfVDf2ySQIyensTaqbswfq5P2/zb2KU5il1Ws6Pg7txJv82CEqPlXuaYm+FpY9EVz+of2iGOkP6p27sbtu/n4G9bDKazZi94doVQvvX+pPaDtL6dwXU7PqUWtkD4JdYq95CEjd2dMr7Mu7aOLLKEQda3Vs6RQUcy//TKl8MdrwNBBBRwWN2z1REOyR+CKe4EYi5/2WVt2smh0WHgUmNr1+n5bbki0wKd3hb0SUXk+K/oZw9cTcA/4YjeOJzZXnxTc5QgtOayDOuFrq/JRgNYAqi/uu3KDXJTJOGrKqUhEfjTOIqL5tQGgMjE6IYdIz6vI0PZoIjAoKk15df3uPWRFfXbrhr4Fs3fhpzSQ8A4yzlqbbgIpshOoAHEP79O7LzYW2bEvhE9syoLaezhdjLnKr+aGRPxjxZxEXlEpEhcl45SWVJymyDOSN0og7Zbv5iOzGOIHi9D2xu6xXH3ZvxFmc2qWYVgIwd0iyfqVgPWPJfHXtGEGbuzzJicmwcO9y/xixyDSxkJl8i/kTBJtmLvdOp575dM6QAuLYqjc/uz/xG4Jf/KngR9oDR7JZkUNVwrXWkgUFhVqgeWq66I4Sp7N3stitrY+VRgxVtCNCMgKeAXZFkLbi3hBdD+dihrnrsVze0kag9ERhFJr68s7bttH9ZgLN1zeWQxzpL7tDuwZq3WA7fkhMaNCyjZfHhNxwiPdFeU1G4bCChzxRj5eUSiAS/qWqcHQb4pXBtrSbHgU4VgfA49Q5C8aQWHT4EBNz7PqHVkG2yYIwzwvqDNlHgSTIYVDz5bk/fJprY2j+s5TgYV2hFmgeRR47AsyarwKvOCikK7UMCDGthZSk5Ue6XwVLy1H4Scz7DUlWmNEQB7Mec403ZSVF3AdYl9/xgFsTNRoJYwxXHCfQd7nvDZH/SKmeJr8bVNkzJ0TJuX4vbwD+pdwkOd+X/9Vh/AHs/QPdvtmon66y587+ggQPapHcBjHcQrGQAI5xKZBhMBBHMNQHEZBgiRgEET2qeKnmYjwIyqNRb8h2VHAgXyoELIvIs7gx3MKD1/nkJ/erVv0U/u1e0S76UjDg++Awo82u8Pf+yQB9pUReZS8ktCxkvjoU8fgUemx+4H4r2pKDj8MP/IgyafZkMAPKsHdAcS+6FXDHxJe7ChL2bfczWf6cewOugT4+HdoFmJHrQzysX0HTxF6pDD2MR1G+S/tF+8fNRNg+c1+2SlfZMoTHAX7VWlLDGmM2k1BZAfBv2cmjoaC5c7+2SIYNfgHGoHO4ngeiqCgCD6yhGsfuQ0YuMbHDH3r1rN45w8b/V7bmqt3RlS379W3u0mS1t1lQTTWPOwbCPy4UuXyH2iLZO0PlAtXbmXMxKVc3/2ipAj8LqWI7lPoN14G548bfVdlkFguNzf1H1Xc5q+GNqq5fUfcBWTkNz9b4hW5IDUX1pzOTA6wpMk+xYL1pOqvIsFV5SYyenK6YPVpMtFkJPhJXuzBmdHzWODrOe+fAsGC7MORGLByU2DQhsUmm4eu3Uc6F8P9ioknLQsDbsToudhcMUSoHDfYyFs2csNPcaBi8W2ffp8av78uAE562bzg8SLBIormaOFmuD6mA8rcYsYs/Q3ToTG4gueLbm2Ux8lgm7fVO7pc9ynw3hUAqi/Ys9HDzNtted5YLx7kGfVU3LuTknSS1mXVfV1NxMVomEGFSM8j3G6wag19+vz0esAupvsUSFicq7I/wLvtCOZ+Apsl1x5IpnKgzZZWNwuUcG5ynG4LHuWWzDVeFk2tt1MHhNGCPvB73Ux8CT9amg7C+U2apnbr1OeLLKr99tybrfaDZwvO9TOVIFO3Ood4ykH1bGIAGT2svuxGm3NWJBCCSHxmugX7GU/AryLoOh6fL2+ddPPTU2r96R1yhphalnm5GaV8FoDrHHlU8NxcBn2pUi0J0L2cgrwi6AIRZSfxd8xRBmvW1U/zMZPFs67dy7Wk/Hu+vr37BBRZFKyRoICpbag1lJVvGte5OlNRJ2CTl3LxHHZ3uIkQ4SlSO3OWiAjdm5Aar1Vi/HoDrBqsTxBRMwr2FnC/VewmfHiD59F1PiEne7bPK2uuaclJERdlbZ3MaaSbTwRdhAd9m4DtUr16O9vs5e8zIPyxKQn4kQGhwzKXhPCSuwmDGZAkDxskkfNLq/5U0v4QAN1nIabCXcQj9XYQPSQT39NZ90j1vnJMArHX5ywMHmTajtnnVZ+GhruWgXW7TcbzdgFUK5S2tCVW+u7epZFZUZDZoHFj+v03bY3EOiHMNDxA1hVVHyE8pU3VplieElwMhZPAQMyq1nnm9b7UEEHvwupWUkHc6vrZknlqG1Zio5kLOpkl1QejGlVnYtQn/dooFHwpbQ14euNFvLbGDSKVReJw3bWKFx5P1gBpq5b3ayn5oOqOcX696HiHd7vX22xichF0NjHvGOBf8smFq5x/No+81EwqnSyYFaL09EBa+zWUTKSfHBAt63qpTsiKry2YrN0qcFDrCMsLiGAPgzdklNI1pfS78n4wjaPxa6BbWP+8Mermb3F2qVOeug2+WiCVKVdpEQwy8k6aDgbIQgeHEy2vMPeM9CxvQ5wo6q6L3sQ8ia1Wszo7IhFOZczYGoJx6nGD6tf3Bmbhsp5rQLszFtlYOw4W2D5XStnaj29Jk9feDLuBLquKUveTiAm+kUChbGycuEMki30lkew+tQoI8iv9Mmz8BqYxQdMPS3clOzp1EkL6DEErhD8+OteyfHsYPPmcjjjV0oSaIS6UhG7RA08IxQlx3T2MmChsPOWjB8jbZ7bxeh8imxF33xj5bipvMEbyAlKE0zfotYkMVZYePj8BbUEK12q5T9KoP3CpJq+hBrVDfieCunncnEKVr5u5zLIUb/7NY//7qAr+76GqX+/2S1QF/4CqEAqEMBwkKBQjKWxHVQSK4p8QALXDrH39DrdAGCdhlICxX5AohNlXwWY8PXDHEcNOjsDAIeqcHhwGhyBUeCwcwOrnUQGQOpqf8E/zEBkd/5L4iFRj2OGTE9hHJBr+SracQkc4OsN+i8nfEPxXqCr7UDBHBx479KzCo6DjKBEhDr4E8KPjGX1UEw6pK+KIdO/n3o+7n3gHiUlylO+C6VFYgn46pnbMFaEHLoPI/Rr/Maoy+RiU+ZkpgxEiRxy9blPUv6Mluef/T6Cq8t9R1Y21MXWT/4yqvq38X4yqpH+MqoqhdN+0WcUOmp/N+YUNJ2WQELF8THwRlHwGPJ9ka6fOLKyRrXiQMfIa8vJy3L/J9e4ekkX/coUOn84r6WSU64iFomDFnWNUMdMG1QVadKjeyezvYMpX17gzX+/2nbH3SXO0iyfLp+wqongbZiFPhYSEy2Ez2fV9PCnYfKLeDyDGBMMPfZa/sG8MTavyCk+dtJ37fGzs0mv5XHTeRA7lxru6ndkCzdbQi3E6dhH0Ho4n4EY8UQilmRPuDS6h896Dfqrh5aWd8vzWnzq1XPZfsU5ADL950ao+bgQvPAqC4G8P3DQgoKPOWi7vplMfY0oXzvehwiF/Xe9jnA0ZxjyGG+tlV86ZT40D6rdrCKtPyD2v+hTRCVgBUnh0je9gU+gswtQrrpxpRMgeTaRoYinP11fBQLpy5elUKxv7vj5aaJaCToG0dNSuT0CKBR+r2CqAPPEB46MQFk5f2wJ4UXH4NDU7ejS5jCYssp8o1uLi1DrT/AB7V7TyJWcDyNQwxrs7Q8GV4EhORdk2nPZZfArH3YmWihuqQtgmZmnJzzMrSZkJvmvTue7oR0eRtABemm0KyI4nlyo3jBeLr/vVXo0ADq/DcJJau/EHuutG/mJhL1C6vN6RtHbnPKoKyn4jDUAE5da4O4Q91xClnaTVpaF6ZMjQXIvGjAycQpVhQzmOcxqXp9EBrN5u5LtktWg1rQhAfEGZwVoc6H8KVRFp8kqa59m/rbJLhk1CTG++FaKVBf8DqpLFLGcp9uJh6/LKhhEtddQR3i8Wgk73Inkr7+CBTMlz3u+9MSC4olgtBbWqh+MAHQ7i7q4QtWZIniLnYc8u7/238F8Phcim+TotgmUtPYvWbtkU6p0+d4UgPnXx+khO5gUYurIyoALLnsS1d1TtaUHL604HfmiON31l1VlkzPMZJXTOlKqr26oK7MIPN33TqgEKIeCeg0Dwq9Txc8Q2JtSju7QDFWrFYIkl2XdKS7Uj316ln0pv+0mL6WBEFVYoVUhoBtoCzQt6aOxU7FBu5ZtVZBpTpsXe5wb6SqAeNUb5lrhPS2SU3f5jL9E7y+JbVwpByMRO5oCTc5r8xq4fzdUnHLHtPNy7zf5LXMXQRumxCPBBM9lIaqjn6uCefZbedF4vHVTtv4roAPEYrpnQEMvZhs14LaIGUxvVSYc5v3ndfKZIJCfCHSpv+uww1YkliFfWmYNx0paHNiVAEkmaa6Q8f1cx6CVmz7uvQ3UljrhfUpaKuP0+LGTGBcZ5nSnfDiRNBvO+lZJR11wtB64XpRoDl91894HcSR2Dk3s0jK/C26B7q7erRdCvO7eDtzM5LZpMNy9JTqPSYSso9VMVEJ3b+3CamKoSFb1CR/GqyamD2C+DFbnyYfMnSWKZmexk9rnBXnHbAfdbZKyFLB9diALufYDNDQzKC9IVqZASki2FAz9qap0QXD7ckGoKxvstdR8s0p7U/z6qQv57qOrXu/0SVSE/oKodMIEUSOAQRIA7nDpCUzhC7fgKgyGMQGACRmEIIUCSghEKI39aYHDAnuRIt4TJkazHv2QmoAMOkR/lCBD5jSIO8s5P9erP+5/IA3V9KWrd4VVIfnI3n/LZlPgNAT8qGJ8wVvrpHY+zT9tSup/5V6iKPASgDvWo9GDo3Dfdz34AIuxY3geTkUc0jYCPmtwjSJYdp4eyD6H2h87z4MpCPjyd1JH2ScgjZoZTRwsUiv9jVKW83IguyxZGhjMU3npiANlOJe9h8e8T4f8GVPX+N1R1iATAP6Kq7yv/F6Mq9R+jqu29oEaAEk9eTlu17K5OFZxDbhNHmMSl9W4C57U59/FzJAYNbr2hL9d5CDcxOuWTZV3PfG/2mC716hnfMjnBbrAvvS+glb6nWR2u2gzwnUr0D1NRu5bgCx/N5olFJw28j3J5adUrYj82h7oul85NYmtLO/JFqy+Vud0ZVtg8E7CJ20qMrhX60okf7M58iine1TJh31DGDq/Fyzk6RqJo4QpOaalnInXvgsYucWdp4ykGhhCiE7Ee6IoEz+cuDz3EIh4iNA96q2o0IqHB27ft/s43XYSkD6UTTgwIvQaS4EzzZgK8SAvVespOUtKPBvFa0DrAT13sZyseSUMM5arSliHOTYjtsI9Bfqob3roMXCIaC+7eMU2JLz6IoxBjebq/WEEuFaO9Qxisv+ZK41SEWyok66pwFmbjvZ1ok8PBjMCaEqOWbQHS97zuD0C/gEypWJMUJkulc9WQLg32dJHwyV78DWXeNFo+XDCc47YhL7RaBCGOoOa7Acb7s/y/mHuvpkfNplv4nF/xnqu+LXLwGVEEASIKOCNnhACJ8Os3aDx+7PGMx36836pvauoOSLq40I26V3evXq0mWMvcMjrRiwU5dBfj9S4XyrUIXO/ynIbEmPibyT9u4lRMJ+UWgOeG4BbVl5gecLc8pd2X5qaViJCcmqwqaHkuSfW5ia9ISjj8S6AdNjtxJ0kfIWy5jNKIebeEkNULaAA06mlkdlKFwWPGCpeiC3Ou+ZNLnf1pMHiMmW088RnqDTYGkZ7lRZxjHGVOMBEZiHk7AWuixxCheM9/oNb5l6hqKTLjrVRPur6tlzkMPOtlSNfuSFn8BarizAJ2Q4h/JK6dwJVmC5cXbojxsGT+/fros/Gq7cB1Gm64EkBn+n2v17C0J6RfAOXS3uKTYNXa4L6roZmQ4Ok+6AKBkBa3nylmE/Cj7UQlf84XPoslkaGcp3q6exvzGjsJEBymWLvrPVY2azrTMSb5PakS7/ByMyaLVYT7JcweoT+pHZu83+qrou+bohVLZ9jY/f0GHov3pM+oXcJ2DZKihUs2YSW8YXtNi+MDRUngIna0MyRbGizablHc4n3NgtpLlosv5MDrzPi7lYzZc3qTGqeb+ZGJ7FfAJUbSwlp3pbgXF/ftWzZv/ROZzjpWDUJ8DizvNj7CGwDS1fkl+k40EY18Wof06tqvyD/jLIeBz/K0P6IU6MqT5255XMpIKnBG3j92jCwsM+1nAKJw9ssNOxTLpwzVEwSdh45TdLW3Z9qeS6WnuLkkuJarRV18k17OsPsdscpdyxW3qAFIVTD5kb6KuVFxgtXYLCUvzmBOLZZz9zcZoi9BvlhIaeCD7CTRTaVOVoSIuDFc4HdyArgilkCw9EDxYpE0id2q3SaJiE+WyusFd6BKWK0leCZ3ZKj1FWZXuCtsTzu7ndRRogbcmkevXWuqUPElSMygDoR7YolMghFY+hLyLtEnhqnATJ/SGqVsq5T60w6WbjV8GYTpDKz77Xq/c/79cncrxzYphDrJO+QYHhzEgCt865fFlWveOkP+KajAvz+epMzLoxXof+j92JAm/yNxX2DP5Ytu+a+PSl18cC7nef4/yX4s3o/9n/jRfjus5N8u9tvokh8v9AfmJoaQGIKSEA6SKLhDLgohcRQBEQSHd/CFUiCGQtT30NcBmMgDfR14BjlSQSR8FOGOFiDiGCeWflrAdyBEZr9QyXfR1w7W0I82zw58dmR0SIyGR0YJBQ95HTQ7IFkKfnAXeIiEUsihbI4lvyDZD9DXDgh3+HQkrvBPlzpyKPGQ8UG72V95nIA6Gtv3J+x7y8Kj6oh9utIh9DMuHT5Kgyj1+Y8djUzhZ7D6MWV0vxDsp0yX5hC66/Cv6MtgMTXWJx8LTnuIQZy5ARtA63uSGxzTAN+MTnedjXdVRv3CLSlU1bw0Xegc1Ecjt+5Y9TscdN1xEAJ8JiIdT7p/nvTyYWpSrUOG6ysOmvjwnvTG0WrDMkyMaFDcurXEN/xv7evm9iuV01Zn/UPlPNrU6V9b1/P5ENr57VjFNN9ybf7xtn+/a+C/2fbXXR8UG+DvcWy4AFvzt1ORcFy3Ur3Z2+nySFXXooEOhxwjckUECx+QcqKvUa1siEeVoUvJt6GS8nl4y47Hbvr54kAM09P021g0/oaKUxrHQFTKrnq/e+9E9cACK0nq/YwEVr2hhtqMJ2Sdb/nawoXAz1GZIBN9ZaxMOZnRlUd5SuwBPq9o+krHyh41JwgNtzihp34W5x3Xsp45u/f2/YDL7E3BcBrd1s6jezezhjPmFiTZ0EC0IOa71/fQKn++MPgcN/09tsczdLuZ7Bt9EPjtBQftm6b0m3/N1vp5OSSTZHHjtBn3X4Bf6btNlRFTGLrceJA9aLzSKD8z1yV+SFlxwSmzGpHxehvQc4vMerfufsjsGvvy6c4GfjYd/LtMl9/xcQCGsfUZfGKt660vbcrfeHN67yCi2cIO+guG5vp03Uq/SYBxx3oZTyA+JcmiCt5gj1xSLk/CICzrtn7plzXKDNspw/t+i6fKaonqE960cllDaKAkAKzkdvYHmlxJnCD36F6+XMA9yqepaUtgStHd24SUkTh58FsBr3uAca2scmQXiLmil64EmnbWzYtvmNJpYtI3moZreznliCZD9nq/PB+N8rY6+l6MEr5eeTvmIn87ESBb2e4d3CiAwdbyNdVM3GybHYsJN/AxF5vV+4mAwu0lE4rMcPWmrkKy3/Qo9xxBtXq0QXvf5hvHvgFdo95vRT8pFt09EfvMrzKK9Inlmjg3uUZOn/DXzFN3pMrUGTk9GTYlQCRF/Wn0Mnl+AFKhbZFKtpT/6LF/NFzzh+4H+X/pFP/mYj93in+cRI2h2KFKTpEQCJIYhhAIRMEkQqIUtuNODIVx4qM29yenSHz4nrsXRKBPxedLMiI5ijtI+gtFHQyaoxU3+TTnfp8+k2FHQ0H4GQZ2zCEhj77e+ONn94MgeIij7E4tiT8JAfJwuLuTQsBDHOUHTvFLBedTNELjQxh794Lgl5fhRwEJin5ldO6uNTpqN0cmZV/9qEnhHxUY7KhYRdCnfwM6rhH9aHojR9riZ06RNQ+nGMP/cYq4EJ4KJHtcXdlUzpqsMCPB0QqT5/tnev/07jaf3r54FuDfOMTDswD/xiEengU4MgT/rUM8dg38G4d47Br47xyiOicfsb/4CXx5VyWGyZ0hNwxayrWSpo0AI9bRvHjTttv2++2ljW7amywoCNn1zZ5JI5FPkN/IGRB0aIYlc2R69XVTA5vtYc0zrnss1qV0M8CN9dAru1DKuru8VZ/T6SRzk/7E3okygwgDMC36dvd8A9pjR5JFUu0tj4rd/m0nAXzPS+xO4gpe4R4NcsEJBU3DFS6NcU20hrr45oYC6FnrdphV0xXd9JIg0O1oWYgL2mReoQi3Jt41zaRu3jBh9QMs5WU5cIeWWxau0/XGB+QqoKDUAIuqZlVxhp0zPWN3udL7rpyeKtFuNi5OD6PuhLQ29Q4JzVc9ziv0dopgjN8A3gdV2LpC3TvM9E/6yn6zW7+X0PxX4cV/s9CfrOgfF/m9BUVhCiHQ3VKCIIpTxG5BP1EGQWEgAoMwjO0PfTenm6KHJSLDo3CNoQepHYOPWUco/qlSJ0fe9MjZfij0KPpdA5p84oZDWor6CBjgB/uewD8vwo8RxwRyoH8QP+iEcfwZopwd0UKI/sCA7qZzX3H/ejDvwcO4p9gRmEDIEdzsr0+Qj/YWcpwySQ8Lm32RV/hkfONPeIF+0r0wcZD4d5OKhZ/JxtEvWPbTqKL6RBXhbwaU3oYFe8bmM2QJ5WItotHh2HcbyZjifyuqoGfxN2uU/N4afasMKh453S8J341GP4z9it6N5Rfy/ReD6vx2TL18qwzq2n+Y9sjPy+/PJket+rv09Gjz4kenuj6e81GPZrEKiGBwkTg6/S09DZp9ADfcMbRO4pMxguUiYr8mhuP1kCCX/iwE9KtsgPGRDWA+sgE75HxtmaZpCxGS7RrK7GR13tkcHgWblxplNs6avSQAPusvsnrKtb3g2HO8XNr3bWCRh5fXtXnty7Yj7g+8OKGCCUn0fXSuaewv/ahqWygu7QJAC5GekyxfMYvTcGIUQU1HvHEEB/DVW+f6GZWTPllBf/UbPJgGeo+C/Bt1k5zap+DUAJ4wf+mk8/p6tSAeSGtIeJt7KpILCati+HIZ2ZXJzZmalyZHCYSg50m2CGt0jbSvsPsGTKxO2BdIIG9hP/bOPN0g1fXnzmpiJ5OUZPN0C1yC3equqqNdbmLengRcbKV4oPKTYwBvSW/Y0eyUW7AJjEGZXcQViyVLtqkNMyVwSiA/oifRqTskR9W++CZtCfzdvGXxTdrSLmVHYkoXwF7aC8vP+GmoLcLwvWqrv5u3/IzQvDCdIptvri4qfBMTvI19YPeG1E29X63u3L+ncRCo0+whGqJUkq37Qmc8jIqs3U5LV+l9Lm/jhVc1xXpJ/Lo77TcKaKkAw8mpNYa3aNLlJdsCUBaGMKJB527fKbLukqk4y+MMiUoFB1diil+E50j6JfAg7QIIyfRoz9ymas5JTRWtkImqnIawqVCIx92MvDWzIzKiYQrexSHoCkcvi+zYwkpG8u7AAHK46G0ovHlCYOIMl5SxuPEs40Jn1TFTLzdv9rPAnLWeiZMDRvhVRs7lqmAWVctmaKdAf91jJg2MMlfJqqbhSulSd2XkRjiScLGPZCm4v2fvJtlBM1Gt2iJA9zt+DYIW3zQ7awB1+AeaRN/3Nv8mivhvFvpr3/eH6OFTtETR3e+BCLj7QZiCCHyPI5BjCCGJIjgKod8NHg55nORIdmEfxcYs+ozDSY9GrR2Lg8nhqyj8yK5he0Dw/YZp4tOTvLsgkjqczB507L4PTz6cMPyQbtw9FfKZuZNQx0DDQ/86OXjxVPoD37c7u/DTv7a73ezTLX0Q6cmDELZ/PQSG0mPPCPwZkYgcxdODMRYeNc99w+BnNtAR7VC/7NER/OkESLODZLavnPyUJcbejt6x+P6b72Nc9/6+yWnPOdCMGzconIS4+lPwUPxvBQ9/3+8ddU7g3/i9w+0B/8bvHW4P+Ad+b1NF/9DgFg97uFXgIRssAArK8zQrcX5O80iYBS/0ibLn8ZqtokVe8VN8VjfPfJKaPqRL/yJB2YNJdTNYoi/ukHABsh6duhOu+/PsEXQyU/GJv9bsDqvzs3EHiSHRa0Go4VQGOeOEGjy8rMgTl3pcGCbnpgMBNVfnWY0fJ+n0T2tYhy8Afu8MRmqS+ltbLEn50mpR5e9a75ctaZH+zOa+9Ou188ffJaTpOTCkBaAVmCTb+czXg3m1O47NWy8+W5L2WCWZeLelBBlFmFSnAF2RNrS5s6iORntD7utwaqcz8KClWb8H0dxa2kvGjN1juFZ4nRZqMy2P9OiokooHpR9zh57ysy9Hz6SvCOrqSoi5EwmMa+z9c6P5a0vrr3YK/RdW879a6U9m85tV/mA3UQzCQBDDSIogEAIkCIJCdrt5TCcDIRyHUBj5ftKF/PT5xMek00PDPzvS9RF6JPmPrqMvwg7Ih7SB/Ug9LUkOe3uMNU+O3P9umvaX7nHCkXH5CEIcmQ7yV47s/uvRvful1PCjmAH7lA+ID003+4woC7PDVuLxYYmJj7k88ijZQUAJo0MH94htwMOwkuknXgkPTsh++j1M+ZUZ8omLKOoXkvwpD6Q+eCBI+R+7GYyRi+G6ZF9L3UipHkkgj/s2ZpiPmKH834oZ+C/yQh/bWfzemv3W2Pu7pIvxT5Iu5f9W0uXvb/nY8T8hkpyxntnCHcpjAqTcOLpUL/VGqEq3o+4dEiMrUE5FML/4vt8g/4mE4RZixAU1tIXbjd7yqnUmGtwx9CITHsauW9dCtDDhfGfsxeIgKQOWHnV7Dz91eOMJTePGT+pRIxw7Dj3U3vtN7W2T5/c3YDqx5JzyWGcQkSeWV2OOiJJzgdWiE3+tp+21pPZY2idWKNrNHpg4SAlhDN/6W95IeNR4Jhu9viW6TLKUonWhNHOFUgc49oXYeDzDbvRauylBcUS2IaLR0nhZqaftTateoVw49RffkBlsRipxGkR+uj98nVYNoEoqR8ONF+PBEuVLJ14W5id0Zw376sGzuSktbtLeXNiaRQ7FyCUuhAZTjauOFaogewZYLQmt0GaxZ5sHFFzLxFrYWwvxbu5RqxmbD6qmSKEvxdBPKijwHBku0NYLvV4idbYE+GJq285WkHpMsRmrhlfkEJhi6T1KITRXm9Zdnvqev1jTaZYtEGyFCd9uwZJQV4bmVCAzV3dGz4gUKSsfpUR2vrqVSI/GnX2Od9U3ZSdMWvlEPdj5dCrqvrqZpZEV7yhrDdzwgZcSIHTK3xp6LsRIdpT9jJHu6E4jiMkVbYdrwCQJhg/CSbuRLQmCvMk374YXuEGNPQWIC79kE4q0Refsn+bCI43cuU/vMXxdSvDMQrWbdRZHPkxCmKXT7ntQRe47CLvU75YBJ4BK2n4skOby39Jzv43ICC2r8klevLupIivW3U4p3ipozIHktwGZ+h8iyXUqYA/uoyvqLTIfzfilpCWkCi75zR0pZOg47Bz0Sht1cirspkE411hh9G4+woDlQrx/YqdO9v2gGCvOhjD8Dg1QY6NgtTEGyL5El4Oc92roxMtv782wkJfueSlrmVoT4GSlL1W6Y1SbaHp1tCzVpQPawyqA3PqCjLSDSsl40quotWBIC75wfvSR1Q14hUT2PQYy4alATwltMw0tz6YGlruDz+1XJU9i7knazBgrsTHB9UnkcSbfscvTizDZiIJQC8VnCIyV76R5tMrXWuZdzmOvF7T0nrwEC6yS3qstlHIjyczuYgd4GRblYns2064OLyw3m9KAmNUvHD/EeXJV1d7iOSOXm2W5zTo2SKIxgy8a0xhWkEyHYfXCVSdssZL6IUCMhg2YBoDefQTVgTCiguvDwZ5nl7fXGW5PVxyt76gEaSPTUp3rUZfJmc9RWYSpFVm9UpQNJaUA+oKUkpijs5MoXEJ1QYevd1A09JMN6mdj/wt177kxaCdkFWXs9FTdXPwR85frTR/AVgKGs261UbhhLX8DHw6NQXSIMS+3M9viFaxLS/C0+DobHEixkVorbx3jTlW/9HGhyU8HAs5+k7wltxTtq/VgJ4cIem9O3jivksGETsoFJZmpTF3nVMLlHYrel8rZPxJXJ5Tvp4xtgVzh7uKgk9xM2YnVPvFCQzANV3PrMjELI/IhLN6MzEyi7UbCwelvgzZWV3VO/x/Tov9C6/bXJ7H0D8i6//UiX6Hazxf4Q6kMhCiQ2kEahhAYCYMUghy0EQjBEQxGyaNwhkCfMa5/gm1QdMCs6FNQ2mEP8lFIOWS18IPqcUww+EhsZckv6X6c/D6BJDsysclH1SQkD6B0zH6Fj2pYlh1pWCr7NK2TBxE4ig50d4yhjXd4+CPYBn8a3aHj7PvSh/zXp4Ud/oxZ+JL8PTq3iCMlve88+kx/OsTIyCNExz7zZWHiMysBOWAnGh2x8Q5H90gY+XmrOXzANvK38QWGrQzYOk1VdKIzCiT2+FK/dH9K9c4fzTCg+GbikwlKy2Wjgy/hX27zdbIGd+GQ+Mrtu7CjsqI5BE3i6svwJ+DzwmP6EyyMQUutAceHh3LFryDKNEBKs0Hz9iHP/o77+1W5CziCTKnWbrZD7YaBsRyQz43fzfDbvx/CrkzimY8IkftErH+FefQB6TDgwHPf4Dz0EA77qhv2s0sEfnaNP7tE4GfX+LNLBL53jf9gOK4J4IJlgXl/H8NZkzVE2ECzS+R60HCNkhCajqPFRkgbVwrlZiGk4Q5wFosK4ntn2ZpJD+g3pBppsyDepNmQGVhUqHKqsPgU3FpNHALh8u66qy48JBlPntRSa9l4NhC8u2w4QrAsQDHm6RQRfF9StwxrzlO2dHvISnE0dy/Tabhqt6nC8lhQphOWaq+zVj4wWarhWhv8oXCBczow78sKl2dVr4KhbuGlb7MCtThGgEKk4OxF8G/z2jR8975k3FricHjqLwsZ548rnwFBgkns9Vnbz27NQR8p9Pdj2z8tBpzocfmMvCukXtZS8ViZmJT9r5wewwpuHOsEemTjAXDqHQ/u5s0FebJyxYklgnhYl+oyUd7KnUjcRfgWp4Q2Vap7aYGvZ3O/xdT7+abk+5WYgeftDL4UpNfOL/x1M676u3sYoJSWScmvy22Bo3dR3lm0Yov7wBhJRw9dnL5v3ARSzyAsAOu6m0L8BHGWrM7MhSEEn6AmvUSbFzLmRun0d7qGu0dVLw0Z8NzVY0D69bwGi9OHrsQCLyrLnEvvmsMpf6xFke23zYwrzyt7eZok+ujoQEiGE3thUxAKcXCFuDY8m2rR8TMeRhkgPKIcvlE0kr0N41GcH5uKX5s5NcwL45OoH9/HgVBCZdqEWG97EVU17J74+eV5XsO+fALxsHjWJF+7aDTOV0Y1Um8SbShVZDjerqfNSZ6debrz3zTD/wb1gAPrvXDqRFcI3r95spDwiahKn9DqVZ1+pCD7n3Iw8Id68HeA4QcX0sMCOSE/4Zj5gtfVdniHljW1U98NMAv27cHedfrdUaMiaZTF+jdGnQYhLEctOPHBtb8Oz/Ta9+sYgYF5WQotVMKJ8a3QfaoAmsSnnhke1/kGDi2f8Mz47KUJXzJU6F+7SxqrU/fEbwrxoNqs8uO58c0Wb7ub7cmU7gJwlXJxsdnxiS1NrOZ0AXEtr6YVcxMJecxFOq5DN0HHqiP1h5VPwUJWEfmqYambti4EhKV8ve1ZDm8nvt02F8pHDoXSVLhlJg6epbcfVxMRyAbSCt51GOr8VSyv4vHk5/toPgOAfRX2Vd43aNR+YizNU3xfJSIO57IU5uV9BtmpJHCTYIOLH6CzQ8fQg2n7SvIcbjdcChA9xEuRKX3PIh2lODXPp9w6ImDlNf5ohBG2PJ5wADIQZlKEoSnrm4twpWZub/fexnUKVHVNvU6O/EqZmxVIlPCQ6U1dguXl44QpvUJ7GZtIpJ4FRGRoeBJzdDXfb4JHKSgD1ytggUF1zmnQEDlmJtoCCYMZza1jSlufy+IzkBcctSTuuS8ZzVhjw6u4r7VFTw5LwnsEGHqxR7BpYg0dnawX7YxmKzKsKrFk2QTWVzCTXyo9hlyNwYQpklTa3McOPi8wqNTo2gCgysJihOJ2b5UQjI0sqSjZ7ZGTpF1jMag91ZdZDwJZpCsk7L6Ae1y7LSakaxiY2SoygObqAlP3SYfDxGWHTX8bGDrW/vhHofWvYZ1dpP/zea7pWPb/aOk0P4b6G3z4b9f6ChP/1jp/7PhCsR0eEjhKkBCIkQRJYBREEtB+HMcxgtx//BFOzNKj/2lHdzswjIgD4yHIMcaAgD+wK/vItWIHXouwH0nqkdkB4L5Qk3egtoPBEP4lAQ88iMcHOTgjDupx+lGcTcJf+8rIH5VFUuJgI8fUAWDh7GjSCsODD5B+xIiQz3Qr8iNzuz+B/OBSHD0qLgT6CxUf5RnycySCjiN4csDJGDm4AXG0A9qf4kTkoASQv6MEZNCk3tZqbS6PC7HUXOVw1x/hxPKbFi/XVRd+o82vIIqtsSZZGSXw5C3w6kXgDgXI47HYZsH+YOlqTWox3GcEwX8arRR+cZ3w4uSuqwlOY1r7d0fi98XE5B2343Kt6PE3nCi7rm268ld11n+EFb/0if0EK/7VZQJ/5zr/6jKBv3Odf3WZwF9d59/Bi8CvgJHmW8fTcoKD53IDlcXjvGjarMy2FcjIYbF8lozGWlDNJpteBmf1FnYjNZ4ZALmJ9pgEhLbmpgJmoR6HpF60oIeHVBbAlQ8qcPJWen19mSddfoP6fJdkWr69ro9ErX1gkkXHb+0ow9UL6ed+2NPl7bqd+DMrCuIbxpiTDummuRRCZ+aFuaK+4+7gSz1jp0jezoDQg/7bvehaGHbBWKwBNRbBIDotknP7zYrj6jYj1zW1b/ibCXxIhJJwOp/1kw0j12sEA66GSNgi4XaIqeWQxO1gIRKHKNkqgUOHEuHFZ0w9Zuw6sNtNyynMOjlbasTgbVNHzQYI6vU8d6YexslQXVgbGW2R086F+iTUepvMVHa78oRS7htVwUt9u8znTbaCQYURJKozHNhXarIcb4KB7zNO4X3oLi80wtSQMV9MfQQREOlPU6K3M+RpEwMt1/Dp1FeEKukyb23Af+BQMJJNqcL868qfe66+wYaS4ousNt62hfO994qQ265Fh75yu4uXKJ80dTxB0Zki9k8jPlf6CtLvzXUTupFhvvEv3cnSXoFZ58Qmd2Bsmym5pgsnT+zZcCn66Zg8JXedi6Yp4DCU5yr56eyZ1ZUQjMDo2jsvvYylV6cb3ZhQhzMMbkM7QLAalhkn/JReMzJYvGJ1Ux4Qc6qCXk35moLMtYinp/qP/dZs9CjXFbxbbTmOmY3UnLc3EeuJ5b7Bi38o0DlIe74/H4M1Uk6ui35Lsgk5SFwwjj/Ei8B3+YM/wovC5mQ0cqNmgTKCpuHEmwA4/fl6Uk8B05ERXKtuh6G7wUjvwk2wbmwqNmw1iduD0XAZPguaMUtWtLST/nrMhX0oS7l3xSTh2oWvq4SS1pM9I++n3lxd63GRLpCbsnVANOTs8WPNu3uoJvcvr3wMxP637JAzAtB26Qiyu+ObjvCV7iUqo1UpbOg9Uz9smqncSOlEVqYZkr5wtww+pzaFJQS0NPWzUI0AeTOFc6ls+HrSwakRfMNjGvj0SDrlVqIzPBCkxsTYUqVhGy3U2HdCuSSVkSOSSt5jEyiNNebBZdW0Ewl5YvbsxASNmrHiZsu7e+Hbja1pD/HOJy+1777p7BHl8Jq9acebtb+lgJURieZdSsFKHVGlCnQNiQjXOtkSEmwCE3bFHpftxQ6nlQtQz2kFARyjNsil7pwheQB4YqP4LG4ZCqZq62Nc46RcaSyhtiBaX/u9bVxAxHyInRjTN4qLoXSmoNuTuJGrALXUGXhaSPYy9g9XkIaT7YUznM4F+OwVGa2qNxXL8LsY+fPGnFD6OplBQU6WEXhPis88ojUZwPVW7W4oLnJXknnoXveyAAvlHk0YJ3J0llF+DSfc9a6ol3mk33nHb5yoRSQKt5AJhgxwxRX2SWmVKXJ8lZGTSjynCnlBsVS+bkV3M9jKP6ul8YLgQHq7FtZUgojmi3HCJTHJLkBVLVxYwN1Fw6ibGS3+u1NqpaL+C7zIs+z/M7z43631Z7z4F+v8IbMIIyCEkDBCwCBEUSgJ7TgRw6n9VxRFKIrACBhC0O8SacKDv35IFFEfocjsQHJZcqA16NBXOkZTwR92CrzDLej7BeEPNzMOP5R4+DMFK/xw+z+0GZw46sA73szAg8h5rBofJHliPw/4A8SIZgfDHgePtdDoAwLxD9DMjq1mn7Y5CD5opehnUtcXHUvk8yj6oahGyQEy91ftz8HDo7CcwIeSc3hkNX9KpKkOIk3xHyKNJ72CxX06SyIv7kRopc+p8p+INF9QFPBv0OKBooB/gxYPFAV8A6MEA1T/fmZxB4s/zSz+DBQD/wYtHpcJ/Bdo8Q+XCfzoOr/y/H9A8w8HwQyfWfMApFOCQ5b5dsgg3MHGsEx3GEyDLQ6JpNN81c+Q6CHV3It2HELIdKIBz2h52bZ35pRdlwMPVDtdg8zwY3tpk7mp7/qQbYdr5MoF57fupp+vzWKP7mnLbPlcVnaVer/S/Bnwi5/+Qt03cNRoL5BKBnMfwAnfwIhOQ0urVW314wHmwLcTzM/bN7fsrD2Obkq6ouEA5++sttXNzDCig5/Qu8oA2/Z6GoVQP2TY0Q3JTN2FELO+fqXo3Rj0czlK8qJv9eiArGpwvdIKYiXIigWifnyL7oCpBS/K1/HILSlZa+6WPrwXRb7kfvHU68h8BpO23sUQdCEvLPK/T3X8wim0yrzbDervf3F+/9thP7/Kqvx//2Oi3xjs/3qRr5b6L571B/uMIjgBoSRMoRQMUziKkiCJUSAMQx8dPIogSIpAie9aaBg8LCdMHHY6+TLLBfyFSj4BOP4hCYZH5xT2JVBOv2uhd0u8/8fwj6wKePD6d/O6G/QQOqRb9nibyo5yUhQeJMU0PdTpwuiwm1H0o4GH6eEi0M+swhg+7Dn2aRxIPtNrwPAjtk99zDZxUBp3R3AMVcQ+/QXxUYOC46PQhH/qPdmnXYBAPkIw8C/kTwceMugxutlPfxtdrVRlLcq+wmgYO5Zlw55ysKWlb1hq0uxwfA2o7K9jqxc1MuGjnVMYHbjpdlvxMSL/GRJNT/uZQdVUZ974yi3sReDXuSd2eE9ev3uQOx78w2NfRg6uu/08mI0fm6oKDw/gbPVDc9RtelNtY9agx2drf3dnwI+29nd3BqhCffQJ/J6++PWN2sONmDNymn+pAQai1CgbeHat6kCk9Xq/ARrdiGVAGPtqx6OXk9R7s5vpxrvfHlnSGG8ynQ12jTpVP5NxgZll/Zya5YZXzivGVTHUWHX/WwA/y2f/YdTa72e1Cdac4pAAvHSZzs6jEr1fJ5WsyQdquyr9uLDs82KpKPWxhWBOq7zDSgYX189LzuPRjSa4dmEvHlDfHo67ghyh7x9ImFCelwV+K9f0NUu5jJeCvN0jdwwrss6sCUYjOqe9Z5u2QiCmp94egXR+ox1q/C+bLez/hdnC/pbZwv4g5wkTJEZQMEjt/0AMJGAYx0kQp0gQOnQ+KZQ4Wj/R75ot6oMk94899CE2Q+mR4juaJIkjiYeQR6Lv6KuEP0Oivl+yPuiJ6FFURsCjHB2iB1E6zQ6tqN2cZZ8z7FgvSQ5lKBT/MKmj46Ew/IHZgj5l7uhTPN/3gyRHWhPMPmXx9DCHCHoYvx3uHlJY2UFFzLAP/oSOrqfkM6o1xI7sZYYfrMmj3g5++lepfa8/BZbikYoMrd/Mli80Msr6rxfkYWyXKnHWKPBl/pZc+1+ZLej/v2brT1v7+2brO6zr35OuTdDRm/dEedG51xO+OMnkdZpcQuwl3BLqGCAv0nKNGVy5oWEPrds0rh4Ges79NpgJDHGPkRUD21BEZEjwbd4e8T2xQ/NtBA6akXUKFPrb7OrWKjBL5LinYLVh1rmtbQdJwTwC5dc8zT9CZX/ge91Sv7fk95MhH4XJP1qkJVLwcTM6qP7cF8D3WNe07vb82Lxg0l9eecOgQYaeznCIdqC1phAZaLcrY92v7tTmAAZhiZ2/uE6YYCWkZbkUnn4uzXGiQBW0PfWTsN+U90cSSMQqbJSlk1rCKg9Wl1+L0+nAMq9kDws9mcUEag3Xk/Xegp5G/rYdtKYwnP4nSYc9/N2/NmGXpN3vDNGn1+S7T/rGFv6rhb7aw58v8kceDwgiIPjdnkwwOuzQHvKCH2Fg6FPw2PEVGR/DgTDwE9NCh2DwDsCQ7+vsJeRhWPDoaB7BoENtD6OOMPaAZrv9+YgWx+Bhuw7hlg9d5+gTSfe4+Ed9KfEnJAaPQg32GSsRIccqyEfC5aDckIckIIYcdjSFjlrRR8LlMI5ZcrSp7DhuN4tHZ3x2kI52M3xkCj598PDP+dXJQdSB1q9Wj6flstS/34MZfkNO1gH7dwOO2Hx2HcQsfM/Ig4u7HpHh8T26CK/9+0u1xln51XRwrGwnF6EAdsNTfxgurbt/l0f/jtXBHf2juTwaOr7Oh96tnvZpQclBtflYPQn9Ygql7VdTON+/mcln178fhPRQBVcD/bsAShezAeKS0YO72cTtUkSt2UQVP6jslxfT81z+1SX9pjVzSAJeP+Mr9jez/NMwKObXjO2NPt7s/MF+YYGi66MxbkB8G0dP6IZItWonLQVluKlWZa+jcN64MY5vrpqWdPGALyQ1xEq6SXLHrKkYijzeIfc7INW+MOrwtECvVJnw+MwNlybMIAGOfWylZJZe4u0UqZoOoSeIXZDLuJLK9TRVW00ITw9YNjKN6Xx+aJswwtAblOSVD99Wfi+CvEiRVJbz07ilN9QeKjvfarpfpfMD2thgURNhBRT5GtxXbQoGd2LA69BXN72e3jTVLlWqIopdwRDmKhEZoQTWmPl48VM2HMVzY8m8czUBarVwX8zD9pbJfAbeZ9sJXdF7G9StGWpCx5A3t9RY4Tivoa3d68OkmLdT2IIn1CwabgBm4aftaUSz1fKPwbuyrAYbq1SLS8xDFzxe3stZgf2QkIYGGimNuqvytDgY1L1G/KSRAO4QZOJcJcItXY4O2Ee/IZjIbggiv+9VQpdJKfRatrAUxl0SU7mzq1pWbfpGLZE0fQLQ8q0HCVuJmIZx8rYQI+b5Rq/vWOALdZqF5LFdKdiuaYh9V7LQPUlvJZrKRwYCwTbxBkRqTcSx6JZXt3mr3ENYYpEf3Bh8jnlN2G3+0GZt9LQHCk/laa1mRxex+lZqV9wtN28CmK0LnwyEd1uY8gOtBqZiCHcukGuGR6Eg703OCauNMpJZv9cpTGBJkTjn4Dymq5jYE+A57fa8D9fgYdiQu+aIRr0OsYTY8yQXPr05JIm+Tp76nuAB8PcHF5rOkA1i3aSvtbrH1+JKYNc+ASRtddzv6Up9xpzztCq3CWNfJS9HiZbm8fJpd8w5wU96GiLQDmIcLH7e4gdpYvkLNV2CDK6bnzwN2QyaWaYcz0A5HZqQ/Q7mpxz2vc1OdPjGzmvJzP3cA9eyK1dVZcjq9lSeuykwKiS4Z5ctOdtT+ere8WZyHZO92Ju5YoLOvm0pfXmBv0UMpJ1JQOozxBeQp2JR/jhA/tuH7/bC7J+qgri5F/FhL6A0XkkGOdHIbhTP7cDEHDvjPtaj5dIDeWDIrwk52THLVbK5Yyo/H7A5o9855Dr125xsmlTYO52T2+KJW1dqVHPNKH1S5Xz2C+B8p6mhutLgC9f6N9dNkkyy444LvJY+3TCV2u78xX8sp3kIIOQUkYoShqQqWC+I8RljBsDwYRotYUuzxLNk0CAJZCXUkwkJ5XHKefQVRE+lXboGbZ1u2ApX8+qwq97WAA5tBdFANkZ0ksivE5zPhL5eu6yRteARXrV2a+zOFfsrsseqzfXkUJHdSzZdxRibW8oVozR3ewIoE5z4ZXpCG+F173lKoisjaM4hWhRF83hKWVJDKl0ThkTCUD3MDYqYHU3bnYun870JQG5blp5tdwSaWlR2iaJUki9UXocWW7jT3Yg2w1SmJ08Q5lUoEb7S/LFKKoS5QQ0DngFDECH77OBEXAk4KaWiGbrpmJyM7mJH9ehOG5c999CgcMpRvA+Jfu9q1GvQ94gKBwsboFCGkO5xtwfzfz8G/T7a4d3fAM+/QV5/a5m/xl3/WeJb1LWDLuS7RYz4qFSEnxaylDyawTLoEJk4GtvII7YjPq1uO2jag7noB93A+MFHIdID+RwxZXTEe/vP+4t2nEMcdJkjfRWlB/CCqc/ayfG0H6bI0M/QBwo6cBwaH8QcCvtUQ/AjajwkLj4QakdUO/baIVf6YcHskSX8UfiDDynA4wj1Id7EH7bL0fScHNvCflrEEOIP6ip/j7ru1fdRl/8vUVc9y/NX1MX8NeoyXf8/yOvrpMljquQxDdnmMbVqjqbfFVCr3w7OalWEqvCtujGm/r50wDHu58xfTwx8c+ZFsenu65xKSfgPPPsTOtuDVrdkLOCr9PERuEt/0lH7VeAi/whcsB+Bi915oGRyKrO6trbBAvZgGbpeuhGh2xqFLg/ZmrAXnVOofMELybsUoa1gY/1ycFuWGYJy78HiWZvgX3J+ojoWcEofLRX7roNsO4/geQtKe4QM5y4HLuRyp+IJ1z5CxcU51LEytYIltXbnOSJa0CY6kgDB+cz4PlTZ8ynafey8m8sBLEjjceuEbAn63NBEwsQelacUdiS1y9CPHozcB+qy8CjeA0OmpeHusy8cxiircCYeU8LMYWKQRs+Wb1Kp8Mu6rZz+7mQuGQ6KMJny/Ja8LucrhDRALxcGx3gJenvG2VY8wKvSps/MVCPoVDZ5ZxA6rmKi3WO568lDC84UBGcL08rx6Vl6EVBh0msUR9U7C9XTzrAWcXubzVs5GVyykGfT9SoE0VLt7BSRzOqaO8jgehtAkj2lysICilC0vRNMMX31+FtzdW9LUtRPcUPOihnO5n1wcscH3yWfenrM3V4jw9IOG1gsfw3xzALOQeSCEXbpnC5n8TCXahQFVZ5Ur8tcrQu0aZxQCTxx2wPxgA2KLOq4wCedjhWN5xv0gDjXb+/gpWINZndDmxCoQqDRVsa1EEmBbZt26oAJKesu0kn4MxTjfnrSz0vhP9l3LYkA9JbQvLuFBfRubpqe7u8l0b0Nbjx3S2ZqIP0+EY/Uw2mxjvs2YEphyV3cf7GxhZ+D4Qb0C0XPxFu9571rbSOaNBfUR198w0St+1ZZeuZp+tfE7JGk+DZHAZy372c0/pCYveEDLbN+V9rkM57D8j12rys5R8+c+JPW5K+jOfdFuFuyLi93wPSRCHcrZQ0mWWtgF4lFTyYMtUcd11ECUoXqwXySkeomDArClrRMMUMM0aOQr9GZx2U7hTS951c3PLd4OXSggIjIFt2YU/9AXgCcZPqdyR5Pq33FYCli2FuJyrYIBDLgz+mLKbizE4eR7TqNjekBTwt2kvH2Nqat4YgW8EbLJgM9criWzWSraj7aBHMOnph15705Umbfx44J65sXE1dVVjkID9EzO9xaPnJYmwXmm71cMtpUorC50EoEwZoaS4v4mDXOuzaJ+aS16EwF1UAkHXLl7us7q4S3jhnLJZKVFWCfmuryki+Ykv9OBvLVma8zeYEfF9t/upQ79FQcduEdFrWuOE9aBm2vMO43/vZSnhmcAm/bRy2nFSkadUi9FV/cqbORPqy6zqlPFhEKCj9ctp7Eitn1pPVkW4MCttBmMSXG9TgQwPrQTMs09Nl4linYfeSvYKSiaWzrUYuF14vvrphOyOWzrAk6IlH8JDps9bLD2+0hhcClwSW84dB7qnBmWV9R0IzR4A6HARsKl5M3PMRbqJ+CdsAh7CScT7eHbS6Bul1AydDTK5BeKCOvTeMG+5fyOXGFECjcSk9FTkDg9LbSR3/dQu9hv4VULh3mbul5Nl3hrBQ8aE1JQHATtecjBpXUdA/zNREkL5f0ij1vBp4/L2vqaBj0hN5pmRo0bj9lKT7DERLgmZw5fB0DxGvzrv9kBre0w5ovhA720bbpEJdf5VA+o0n1/zzhG4z1j174FVX99Yv+gKkQmCJJGAIRlEJxBIURCsTgI71FHooCOIlQKPxdHYEIOfrNiE/NbsdG6acomSC/pMgBoVDqaOjav2LUp5PsB3mu7KOPmB5EDfQjsoJ+iooY9guJHp37+Gf21yF5nH5GP8RHIRQJf4GxHzWkJUcVcj8vFR3jupIPQ4SMDoh1FEnBT8o/PYoPxGd8GAYe/5HoOAHxqSnsJ9tfuEOvfRNHAxt4JO9S7KDAhOk/nSdhsLnA5vT+z3Gqlbeg40f6e4KsHKN8T0fA2iPdr81WsrVDlKgx18TTQNXaXfnXFPmCyQcKA76M3DZyA94DmLu7+nDzO8GSz7TRX1kexkHogFV7B1eVtH0heewh2R8OVozyT3cEfLulv7OjfyID0DlMl96wmoI47ULeKdP3lfXpnG4B2iSF1tgAYsyP3c7PZxx3DUQJTpGbZNLAGC9+cUTbzA2I3IKxeIK3clCgtGiJjfUf2b1SqMfr5QCntIjZ13ZuNeUdRzroYJRenE7W+4qM9ibNJT96XpPxDnmF6T7V4Ls0vFcj8x9INhN5D1hgg95kLS/ZK9kmD3hVlRJiF4e+xFDU6We6qeZeQ5pRkdp0HHLt6QTC26Om0+l1AzkIiNwHf45RcC3tOGHVyLP3v0uD8LTlwaoGsl5wziEnpSZ9jB7RJFtJmd3n61a+jLrWzRKwwTMzoKOeMOkD9BQp7B6MFa+g2XUXgRDDlkHFe9ZDku82SMDct/dr6O9sssgI5gzsFXj7GVatY8WWGqyf4w2Na5qEO8zCr7k9LKd6a3nmnPCxSJwYaGjGcDMv6rZqqStbRqUA7lhTp5n0M38kZvPG2v5ZtmcUwc1TwbVD5pfEVTMCM7U2SbYr8FS/utJdY/ClarofKEAibu7dz9gbiKqecAVvWWLlb/H5wDfKso1QuWlMyT1s4lWlZ6xOPGK44gyxvlwmnznRBuKT934/uUmdpx3Y0flySUaSzrm0udMZGOjNMwPFiiioKZdRW6sV+OapDZ6dYobgkOINNMRqt+825nsGTR+sKCTJepC/ErFcXi/hFdMWbuM7GlQ14ryJc7yBVMM+Fxbk9ccN04Dy4g6prYPfTOn6YVnoe4jrjzIAjhHM2m1mHu9XL75OxituXbXUtc7/i3kSNPyquSvc1xNpin7gm2inqFDq6mTz1lWpvtU9hGMPVr84tFC9ryV2ciBFnZpZBPBHibf+ZDRayuYaVbAGaw/G/pEYCYasUie9Mll31cuYKG9MoKKbD57Ga0XM6mkhX/MEXM23SijPcMT7PC/GSSd1/uamSlPgcRJVO4SCclbSDRDFHNKB2lmAQBpkK+LhnuaCQoCOjh5zGPueq7hE3CVygE2nZzc9tgcICg0BvyCD3O5nIh0d2xZF/2aHpJ/GaF2Vy+ggwGn2jVPnBkEliErSw22x9fmTeLdDY1JoXrVt6/rV1rg+DUOQwZ7PF2xHb44En33TNxXgDnvv0tgSQYnzdSkbOTK0kyHOj+kK0moBVk/+aUlYAy83Hi0dL0tfpwIaPUkwzRrsbYCe36MXPzbifqXMOH7fqcV/SPQOPgfvXKhO/9pvHL5nE83mEqjZNp+6vBsHJc7Do7avT6CBcl6aUHQmVzKK601vH0pon/JV79cKXaqi1KnIXu9d7+WWsz4fQ/28YDOce9U0n4oLgJZBYIpOCnt32YlBo5Chwlen5BTEpe3jPvbSzlTzIoYRUayHMHj5e3NSAVROzUnGswBonUY/KXcaXp2beNHKcqy3AB5JXrpdhgR/bGaoVxktasglI59v0sg8pjzNtAaBMubgNECcn4vH5ZfenBQ0mdGrvcXP5WRcJlfpdMKML5tKvE3vxJR4ccHF/wJY3V5RU8Y7somnx/APsdXfe+2f4dUPXvdzhAVRxA5ucRJFKATBKfJ7CAshPjkt7CjbZR96AfXRxj54sdFRT4Q+k+bj5ODI/iCntT/9yCVBB5TZsRpFfvTs0E8lMTuEoA7pbewAQPBnCP3RWpUcwxyyH03s2gHRAaM+ZcRDcPvDooDxg5FBQZ8ufuwgcCXQkWnbD0LgkTcj8U8GK/zMWo1/IT4kDgo7+swS9FOCJA9aBvxTdVchOPgTIP5dhLWBAfkXCEv7hwjrMStfR2Ktwh8RliO6ZXRpKknQGh8x33H5VygrhtRNXQ+UBRww6w8HK0b7J7sCvretv7urA2n9aOTDt0gLlnqb7PnyjfPJwO5xfPKy1xv6IIC0foyq9VSriO3nTRieYgIXbAgPksByRjW4bkmk75IMPGR9XODrk896v/NTPkX3jV1WwGQiEJ84XCypFCanzQhxkr4yigKy66DzhEVKU5daRXuaQ70gZvZ6MzDWgBjsFE9qYwFRMorr4wTdzyxHgmfxGnrSEL9cSTEWRUj8+8vSLthz6HJQJfPHpu/2me3jFwlpyMsxBeDs21etZPfIEA4jGJKsi6jYGmWDIWW9eSt7rtSQI9d34nMhU+0ILK5Cnwy0LVxaNUZMAKlwkeei4hWaOAEzxji+lb6Jcg0/DRqjYnKaY8HL8tPnw2rlJQge/mnILvNury8c8p4B3hmRB29OKfl6VKIIQtHd1MZtFmJ/QBreG4NEdTh4adyGZDxwkhKHfs9C92gwom+2FaDW61LTsA3jPe/cIzXzfA6Hnw+lyoMG8bUQ7YtTtMFEF1Ex+04Ue0PZAouMYr26JeUCl2UtroMnCq8IfVartXtCmI4vUNHDMjePaCPYD3xa05t1J501mqBwxJ6jS9uCNYyDHQBwVnnxNMbvC0wF7vldcs4zKM8vatAaktO1TC6Y0PFvxrL0p/4FgRfhucX9FXZWw9xXAu6hILps/crXIhN3kPxEJI+mQ91M1ytaqVRGPQJzx7PxeMukMVrdyU48zF2JO5RRYM4B9zMiKE8Ojled55mRwf4h0gJ+RMBBETHvprIzpi6KA2Fo5Nsw4zdTUNQ/IC3gPxK4uzXiMxwxnjMf8OjgQAl1cvQGMoK8LkVXWp+B3Pn3Ny7Rsev3QbtIkFEBE/xIJCFr6LvMCJQqw4h3jRrLSDI07FBemSfEo+bOuCOSizGoHFbgRq6XECvc0+CKLsCZ3JQ5V7o6EXSbV66RBDFXCn30YAqu8OiXehYsU7a2K4pvmvHSaS/VMjCLiJIO5ZwC7JBTjItnxcgGlVStNPbZv63adJn4p8x0QRGpHoEUr6dbmRJ1E/kTtMoelYyeNoMieQGaueUVnynErE/PiD4+dF1+McsixFGqeqSF6MLU4ucOlyko5dfBrF7hNpDCRYA0wZ7vQFs0BiM/17almhKSs5uQ8wrr0UHLL9n+IU6iOnxK4j0u0m0x1EUzBTRVrjlus2qGchlw10jyVaZ39EGDUar7IGx0A1+cFDGJl9It5KwUuIuHL5z07oNcwG75NVj8+/JQULXoMOAUNRjCnDV8//hyExjBoFenr5hFezc5X7rZ2cPWxnMxFsJcrMrjRmkCFSOk2DOxDLrIwLQHlC+Ok8Kq4qKeKLQlejJ3Wb0vskiEKThCxX0Buy1b5AdrCwt5Qf4vc2+25Ci6Lgve8xR12W303szTMjsXgAAhBBKI+Y55EINADEJP30BkZFVmRa6qWrZPnzbLylISTCKk//NvcHfcvKcU0rrjy85ZQAr0+AFVZ/2dRoH4uL7BifePZjJwrs+IhiUVdIQQ8cs+8Rf0xsfWMkAdDhVkydPWIZ0A2kqQ1J2f3OXVNqFxMrgDHN2fkX9JaaIedcypmCCFWbtzsP4cDAPdgmwCRn8baQnN8MFg31HOL6hN//Whj/9t3/9nE7v8720q9ZYkv22Kl8nHD/67SQaoSrKg+q8h6esn9H9F//dvKAwzv/145H/9lq64Kvg4/TuJfxufyW9tUy0/Ibn/v93bJ1L82/f1I5cLXxEhgxHoV6gQD7c2YcTsDl/k5p4CRxuAgpMdkWHbtNg2Zx9s7cYQ/RIV0vsRKLVbBOzmJliwITaS3Ple8d5CTTaK1YrSwnA76wrpqBXV/UoICsd2BsI+2bvC1a0ymG4Hb9Nk+MbPWk+xwlVqZ2mlyHbSFXBuE27oVkBcbwhPNvC5wsAVrCL7bNt6T9vw7SaS/FeoULhuqHD5TvAXbtVFVf6k1/ncCf3TT4NbwMZdEkvW+vRsPVj2GH9AqqcsVKO34K/1ZPWnePAR0Sr/9k0E0yFg4IN+RIy+q0+hZK/L/DzEW3vUVbdBWezzQJXPS+XGLuqBJWTh94sA366yTXfVISZna7oLBxKzBO6j8nkOiVArC1HimWwjuYcPZMi+1IexXn27+NZr/UR6VdQYa3ipSs81HiGKZ/r3kxmEzMO/W5Yd7rP2ZrEVii6AZlrwRxmQ3VSWt43Ivq388wP76nkB/+SBffW8gH/ywL56XsA/eWBfPS/g3z2wzS3tr8zSgA+3NJ7Mz/6CErgagIpPmiz3wMJO7QtbN/oTWosX53i+QlPAJyHz9nRPedxS74lAJmBYeBQN/kWdTkuRQVj2avSg5VlWsJKnmjZ1T9/sJYpaNJv4NmGC+nlxa/d9PKY2IjubZqEEP9/npiDP9ua88gzLm0FT98VqhAuZJiBiMDZFzaRErVeXSR5xC+uUOWquRWcsd4A5UqwndAoIPgmaxXRf41uvF4fH6Tf/ElyxPMUkVz87wQcffE3IFxQKEU7w9Sm5chSEABYCRtdJd88X/9EL+GJKJ4zs05YIn/DE1ef+8TIIKgYH+/JSl3MVRsx85XoSfwzN0F5hoAycybu/NFwsnv42mgkVaOkb5UkxXj+Ohf1ZOZMrf+V78ONYWBcVPglz1JQmERXYRyuU0fTOneruzWrAr9zSEp+Oq2eAJiZdlF5q5rMqeNKjrwvCL1zV6IWrwRhXCCjNez9fFcbEeLW7QZ1I62f7RFkSEXjqe2l7RynYY9A7TjVyOQK+zpVQ+sUkDEaOzq0PGPf0TUJxOVusqCvubYBuSF0GUOflaMEaNsePUY7RgfZ+gefAClDtdnKfHdMfkCcqoROApBq6pkZUcciKxlnM+qkzEy6HvgnWBwTtoIuziFGH9FFAX2NeIC+tFPWcdjFP+PTGDaBhx3vjtzkN8SH/5nCUPkY5fAUn6RIsT5c/qs2xTGlKqDKZ6D2GOrZPcxoP1RNXr1J9XDPlyz2iFRNCBL3nbIuNS5oLpVPrrtCdeJwQ5nVJ8Icc4oPI/JNW2t+MqQKP/OfBHkH/9wKR/+9u7h8ikfXG/ghFCITAd34PjTAYTOIMguAIQiLYVrT6sitI7h4M8U71pjdD9q0TuFPHsXAL6mv4Z+idxBP/K4y+lh+CN4GgFYjg8AYqmBUqEFsxCUG3FxvDB9lKVSm1NRfpYBuV35iL66WoX6ATGN0uB294aK+b4RuTHCc2BXMi2hqGJLXBKWpnkpO7+WlMbZTE9UfrGwl3yXFk5zLRu0P9umdCbKTG9f7Sv/Q55cGNqth+l6nUWCU4J7f7XqqyNN4AzT8Tyaf3R9AF/l3U/TtBF/h3UfffB11h2YLuz6H976CU93rwZ9DtgH8XdX8ZdC319clCAlRTfl0OAqKW1lur2nWjin1uW1HKtm3OQvoLTwhvFtmNcbOzjBAxbD7KaOcPT4hRvWXzKfvUNWdM37GyeMUp5/r7wx3DegUXZ/RV+aj4PLvbmBjyVs0VPH0Kor/Z1lvu2a6yVHB/usj2doBNPVNeU95Yyqeorkjf0bN1p0qWmDE83jeW1euT1q7cv1/9d+LU5kIROP7DQ8X1/8woC99PBic7gcE+qCaHbpVDbvngP24T0dxt5NagWQAsKrOcrJtLzJOhJVJ4/dZJxE79TA5OVyMsnOqIUyWfpseFfTppe/VDxHtKkudfrRc3ANyiN21wwBEr8j3rxSwPtSEbXaVQ0OFToqSOXKx1SBOT1KlxX7Zx6AoPEVIm0QpEqY4A96ZUWfk2Y/QfcD+BfcboHJfEq4/L5C4/KufwuHCdJYiVYJ1OP3E/Dywasaqk86okEujF5gGDoaO+uvgi5U/HI5ZPL8mC9YscJzetCG5KDIdJ6BwndnKpIYZU6E5BUNfUj1meHaJxgdyMpMF9ylDybAq4s8DkSD5wvOYvOX2v8yFi8unUzTnbF/6w+Jyz2Fk/cLI04tLf1zYWeXYfgr1czE2AOC+aYFvRgmaf5PjF8v2ztvF/epLv2sZ/OMEPdnUwRRAESn9tL4FvJf41DKwLLroX/am9SYDBu700vltEh1vuSSPrxi8DQLLTkba+RfhtFCTY2VBbQEF3r2tyiylBtOt90Ds7Kd12o7FfjYVEu1zc7hWB7/Fp85ojNtO89fZg/Jvdz2YAtBvhbSn17nW9pqRItGufJJsuMrxzsNZ72mZxiT193vhRf9m0KLcAgH1XExEkoVe/9OU9cM5P3YADYJbCrPL45yBuo6P5I6yFzKjX5dghVrwsPv/digp8SGx8N4U7HNjXwbhver22I4unq4l8ukfIm3sErh7ULTF87flgeX8BarmuxZ8byz/f4l/dIfBXt/hXdwhst/j3VYEPrutMmnCgU85ubM6CMeCpU8+aHy+igZF3+OlmhfhalxLXcoxZfJ7swEIvooOm0zyH88iXPuOpvUoXfcdgNv84A6b8MK2mP1AFlTwxoZqTKr4ma6pHXjGlfJ/kF9J1r/WNQ8c3pazLlUrbb0yejs7FJU8NAUD+5W7LnGoNxq1biBNGHLRRBMErQ+bLHc4Q3m1zvjIHSpKPEESiDz7lu/ugm+CLNrIHQOW+fz4YJ6nLJIQsZDjTlqQ8F2Sda2GxOL47KU7aL/iAjSr/pt5C8HxJ1z7EaFR5G29AeBgQRs91M4mLa3OV4zGPJx4nag0dJLlDKg+ckzJNnLtFvd5hTqGpcYkvroNphWRlA5C/ZgnEbt4KBN40694kSspaKgoj7SIHYRUgZQl7w1wVWAGBlxwcxfepspj0sWbDsjRdgYDBkEN649d8ZvELXFeuges0oyO2NCfdkGfY0ITD+vdslg4ZrWn3AV5ebXLXwLvz7toBCBRayRyLjFQp7C1ksNW2O1ujKFEXlmg48eAMiZZy0IUqIoI15sKQqzvTKvXtlAW1lgFm40m1QDIZCceO3FZ5fD76Bj6UzzAdnmGe4q0gG9YjvrJgc+LjA0+9ipIIuhUnHJ+pDVyV61DRaqJdWxzUswtOc7GCXw277k9Dl1vWsib+dcRkDQPD1ykfMjsb3UNYZhMhIPkERM76oc15YraEE4XJqf8WcYjwxPLTvw9V5xW9pHsae1MF6cA6GWeWUIExisaegSHs0PZ5g7iuXdPxK3V+/31rCe5nfyccwtdfRqnzlEMO3VmY5qDjvMUElz8pwn1vdAAs70pjPfU5PSVZWTvXlBMe6ChE8zVpbsN1LDhoOhbLm0hmiXi/Eew+MlaBwtPTLS6hCSQlNFivq44XTJdET1ZeyvpYrnDIq4W58a/aIRh8+nrR9UB+pemIch2OZANkXUGzW39lQHl5D1bNLw827MxxgoNXw5CQFeC81dXD+6ibIbYcdTE/1PYl9s4XUm/AbF13OArnVkgECLesZSFoslCPfVgtLNY+Den1vX8QjVQzHI8+JYHYJMgEceBBrXC8t+L6Vp0f8RPULcCVOGbvDA7pNxv0IV24xmROiyWaiXSTGtBv3i/hTveWLlTPTE5d7tAf1EpGDlWIP2KEAV7yUxMMxlxe5LLCkTZG+gxRJ5kjKeRSkBeNSnXWGg6Km6gXP7lmVY9biXNqubIJjkwM8AVFtXB0uQZemTw97oVDstszQyYGYFHcSBXsUtyUjWY63kz8gEowP11OuGEdq7eQnzWAqJf4LOfL9cBz3EMoyKoe0Pw+yk9FW4H+EZcCOlq0VHaMMhNKpD3M3tU35ZsgxPr5kQDQRDiX4Ci/ETKRHEMStNa9h5GYKcu59k8MQZ49bn6iJzCWE4dXZiYy3Wu+6BqjLDToAyzbsvxLstHKF1k8Uxo01RG3fnUywoY6xif3A7mmnneDOJ8tqqaciLhCMWtb89HDwMkHiCacYP5CXciKeDIWr0ToqSW86610G/N+ZuMIPr5B70liz/Fvw6+LfDOF3xz5lijJ8qN3IfdBa/r82Zqzf+wstmMTf0ApoYnb/vknq4n/sZN+wrO/OOGPFu0URdLE+vtASIKmcQTHURQhGJSiGZKkiBXQUQT55RBKsDuDhWsSj2wjsCsMCqmdmETvdX5i91eHt1ndNWlG4i/xHJxuaGrN5qmdNx7vSIwMdl03ekuwA3o7E5PsuCvewGGwg67kV0Mo5K4IB9Nbo4LcM/KU2pL4aBcEIYltKGa7Q/JfKLJVIJK9DoEH2z7pjihX/Le5jSF7YQDZZ0+onQS/biT/0mJ42PDc43eP9rgXMqsx59yLpSeUldIU8vOX7Yc1jfoZPd0Ov3st8Ll6tOHK9K2hWtPoQuXZT1kN31y324KVAUbNIGFtfIqbievraZNT8w9Cq/LeZ96dfh7w/YS3D9tF4I++i3rxOwtL21lYwkvbVODepw/rRfNz24rx3mKgSvAL+JGFpcmq8S2h29Ps2L3ZWnVDbUK9ybPMfqbX1XXdbhk3TgJCzB596TOR3V4zS4Ta9z/k4+s1mc8Dvp/w04YR+H2IOOa/MbS4XzK0frIgRrkEA45Ce1eGwH1GfXGcBuZyAT0mlIlawJuRE+OEkatKLnjx5nfSW6I68ZnLt8k7wGTqTNILcEaDQEq5VEDRXGGO6B6HFWstUA635xsRB93Vl6kjQh0iOOcGMBFThCvuBSZfb3mSDy6AiIgOUY8G5S/+kc4gnKGgEBmwpzOMo7rCFvCo6JZ3UdyjPt6u9OKJqTnFE0aBQu9qd2CkYr6sGxQ5enH6QJtRTBTLiReEubXjybb0o3pgxh4mIbzVmwhqbmr47D0m4/SjyRNXgGEsRcxQxr+rWFpoh2SN8/lkq0rcXeoO1h767VhwpIiDlYn4k1zMWplcpkyyHuO4MD2gooZ3J5HHhNMhha8Y+HMAAxFm882evw1gfAxfeH8ecwW+Gr7QdEjWai3Bu+sTNIdajAjDGi9GXcKb8MtJmT2OYyVee1kc8DHWwf7al1jgVBBPltqT9PSBic8zW7+9nFLeihb2WQ5EduGmAY6JCg0SUBLgDYZGfuFzyuMQH4sSh6v82lxU0zcz0D0KQ+5dLCxLkU45nmeZALLbGuZfjiebB1A5sWypHfMFeiTLFcMFwaPaJufvRgzbep9YUqz5g9RAEObPZ6dt8f4C+JN11Wm0UZCY8mC/6wrihl7NAXfQQfE5/Hbuc5nsyiJZkI4I2UEYi6OfJMl0GvXjMQWCq1iZEbECUcb0g7qiz5LLHVnbyC4eoimQfb5lzhG5hczDOdVnC9XGk+rQEc2feRiVI0CLEDUwbEt68B42PhOXfmAverxcLe3RnB4ezOsU9hrYqsGR3jsezUYiC079B4RjnxVl46MUwbNbF17pg7Kdg9/kdxisUetdFdE7aYpt0+2/2f/+mWn8Hxz/nWL847E/yFsRFIxjMIZTK+aiSQbBUYRCKQrDcYKmMJqkcAyjKIKgUYZEmS/78QiyD2Ei20jkpm6/i9RvnknIpgBD7d7Ca2TbZFySNUz+quCxOSkF20Qkln5jFaO7/GkYbwEO/fAO3oPiGuPW4BXuzsTxrwT3g91dmIm3v9GdDw3v1ew1EBK7rfH6B92VuRJqC87YXrdf75/Bt0sSu+7VpuGabPwYGN+cNONki9vRNljwlwEy2vrxVfcZIK1r+4g58GXD5dkewAvqzsf+HL/vyKj/6asLrN/d2frJucgS5j9Ut1v1CA+L5zymGBWym/sovNsaD7DHM3A0EvAd4hFicS6L6qjf8NeWQn3yfg+IFuiWf7IK7mbCjLUHj/Jb/NtinHmfAe2tv9X3h/fw58bPbar4s/cwp/4hbCkHjjkDUS12+x0IFbnmNFu0JbfJzKS2xzXmYevtmue7MKpGNovZZ9GDMZ27KN1sOQOsO3O1d4L03+s9f2s9Y9OB0Dth0gD97F68JHGW/paj2Vw8rx2SYB4b4/P5jaFt/pxrK9Gzq2epSFWWBKR30gkL4ACvqXEwAex605FcUw4nlp4hM4BbXLuXffQMj9CanBzGAkmz852frC6WZhCe6TPnz9cY48boGl5mAMvYpDsYx5Hoeyh7WpMZCGgGZxP0CBfy7sgKTHgXfIrDsKmIN3GdENB0GO0MgvLB6UkASwUmLPiq5RTYdHniPcTLBa/NB84LRz4+Rfcagd6j3TyP6sIenyRLKvwjbJ5kcCTikAC421OrYG6+nrtnbHcRYqExm/W3GzHUN9g7iqgzNOgis9pcFMkh97U1WTqIhGcu1HI/aoArtexymPGyKqZ/J0nyK0US4M+SJPoodpUind3z+2qvK79aulAeE+R7Xr4AjMBn73lwrzjLvHznhaBkoHYJwbbPO8aqMNjV/XGNj3oDkbVTR4SESwhtKjL+YP15kznnhGSGDByGojYlLhB6D5fBZC8H6BJWHTdT/dF4o22j6AsuM4KnnOF+TJWOzon6IgGNe/cpKKEOB0ef8X4wZwh5c2f/cSCp9jpnlc1cTwVtyLh2ifXoOhGTMXDYQ2BNcKn5K9DeF7yPoPzOQlqf9UfXHTFLO1te2ttiPLkNHhv2ZaxwcDrlAVvJh5Qqn7iqyWZ+laUFiGHi8PDyNK+T/JoEsCtJ6HWYwGEpxTZLxiHqlfLW3igiHeaSvy+3BwlCmia/Rl993zLgPDkP/g1ZbnK85ieokKJTWgxedhy19zD/g97zVjQf6+++zN+Eu7f0bYtJVlO8k6H9zUyivGmrNiuS5x6NtpTu26F/s3b/v/E638v7v77GD9X+FZYyzCa8sWmJYzQGMxuPgSLxNXoSCEowJPN1L/jDpmWNejGzNW7Xf64JG4ptrn9b9oVv+t9IsuVda7RLv55U2yLVTgDFki1ehemmmrEZSdOb2Aeyy3mscXNNLNFdR2PbP9qaDQz6K9naXaQ23TvCcbCdaHOnjrYjyd1+JiX/hUW7i/QegLE99U3x3Y0a3XLLMNgyxo2Fmm5+02uUX88Zw1v2CP+1ZSG8RUbqe2TU5TjUVwRZHej7okFL5+aKRv5JowP+sKLJDn+OimvWk332hCV7DS/uo4olOrMluwwkYlozviZw7PcWDIEtGp7ea8j6bBLf96I8Et64w79tMJofEo/At9wy3FW2j/Ygix+9zq2dadY2HKPMEiy7pNqyHuAd3vK8K6cdWFQ9ZG/gYlqok2frusfC2tY3OHjz5aAS2gpdVVlif8qOdfPwhyw4V33AXoP7GkbhcOEs39HasGbWlDB++K6aWQvBnUuhWZ/MZ9qcfL/Tb/0H4JcNiJs+y99zz2F/HrEDZx/sCmNrcV9818DW5PXUf1Aq5H9iVciAbokTg8MCB+kW5/no+FIEyWWbxLq45n5D5OPv01t89Z1/rEfrXMnCGKKPgRr9Kkb9kb0xiaDzzwaAwYJUz0+QN7rmttX9YfY+P9LjAyTDUwK2fMa7ud11TTw/lkRGOHCYTat35lBzRkXkgMtpMsC3CJUgl+KhAB1w3Lk5B5drYQ8M2lpQnh3MHAwfh0OjJ46qZo3RcBQ9pm88rBKA9D6UJ7mWzqUOKdbrVixdM18UQ5FrYhYn4hg3zYnEoDpT3Dny9fvjyZ/P6GM0DZ/vQQG4TVAK9ZeUZOoEP2Ulpfh9/PI6lF6Gy2u558xLihDc9+pctMGbnt0VSh/C2UsOXPtGaqBFMFi6kPLiwa5xq321sXg1wR+nZ96zY4B4dxvSXnYgo8UJOVCJWSQzLbDqJMDuAqMF8HxROlf1MfO4Xm3M8Zm0k6Q6xp8U6EClGU1JfLNH5024NoXAksHFrzhILvbBuhCQfHGAi29TocwF5ktbXkPMKO5DGCvlrgw2Z2T3DCqUbKiecxkup4PmutG1OFoTFlDkyzhnyRswJ0rn48dMESVpj/6AUrZ7Y97Vmbfs5YSPiUDh6PoLzIu3YkNqQETFrXh1fNX0h0lkb0AQZxfnHpwv47MGi+tp6Hluusvs41qub4EdX8xJYkbnEqfY8j43eo5MKpdz2YiryIAQDYDd02dtla+HIthQh6peixO2RRNiX788AoOGv7CwBv48XHdDW1sn2Oclu+KkMl17C+SWGjbbC2T+mZIB7JyMHzMA7Tuj4ihVhyd1J0N6hZzOyXnqvJcO6svQ3bM3XC30qQMi9KpyNdJv/iFB6ai+41m9fg8dtsKJ9ppcOyJAHoYWZYYxHFppXZRHxXz610eMFMe7mQK83cAOFp01sD7Laojzd3x0uHevModrXh9O6DSyZ4JQPdnArzfxjkwDd3xlV4KukChEGcDVcDh/E9yTpdAx9iDeuDgiDyV1jgSjHV40s5tdjNPcUX3QN7WNqhrtaEX1Cy+Kl7kG4tI5K0r8aK93irld49zg4MVnD/bj2PTU44hwiivczmV7r63wkqzfv5E8B2ag4oP6uJsQ4JRv6eiY3rAu6I/yRXZidEZBJJee0+vdaJhH3o4h/DIuWnh36SQdWqEjZFtO7Dy5QGUIsO2pmc0mnDHjfDW9BLzVZiHlYSfovpzyDbmud+dLYWq9jj2f3SwtPlkXVlo/Ora5PzvgCo1lPRFvtTnyzdNfcO/RnqDj/UCZgqnY+R0qXIGNOpV3HmOUv8YL0755BGQSDjzgSguEVECGsnaIaVS550neVAMuloiIl9qCJWK9PBpziawa0pGWE4JxGOqwPOP+1B8lOm9KwGXPylnLp1uW+ovpBvrRXV5K5IcEwQunHCEeztk7v4f1u+cWT8quxZdTZVeRaiJJS6ErQFxwSECPI8q0Q54etP6BLhJbiTOh5FGe0gYVZPzyfr004hCweee+pzmur9Sb9Z6PZ1gAh94hpuJ2/dtw8phUVdIU0W9sFMRJvb4Imvg3I3kmQR/lv8nNcyiGcUNwz72yv2EzGCFWCPhPjtyA3n//Emr+n7qHTxj6H17/jxAV/gp9bnWK3c56BZcrSlsxaBRuHYfNsnDvEtD4Pr8Rbi2J6GvTBHgXKIfJrS4TkPvgIrNND64nDnduQ0Tumrr7DslOtV1Pj6Drzr+qy+x+NQy6UWdhdL3uNmQS4lu/Y2Plotupo48rRRtzYpueTDd9FWKnR2zE3GQr5aDBplWC7h7dxF49wjZZ3r9CnxK/ScdCl0/0ybG/4Eg8fhr5NxD5BRx2ycwPCxfuvoJEyR6jtyiogvwJz6ibZD9DaStyqGs00HJfsoft9SbBBsjiqYpQO49qrd2GCVdU9Vih2Y42o+UDgZ5/dGt5rVEH/G5ro8F5FUqvKlwh3ApPS29jxjrr602HjudWKKRVnnsqg23yrtHgFdYhe5ek+VAgB+JvsE01rW8jL9Y3DsQKak15H3nRNleUUp2/byt/fx7AHx/If/I8gD8+kP/keQB/fCD/yfMA/vhA/vg8/i6UXUP2gQeVOyThDX09zIJrorrWr1GvudN+1U+heeduRgcPNAOZN80ciPUcL7VTFO9F+wIL4Ev57AuRe+dQALnwzZmlw4GqZ5docjpXDpkAS9cBfPbgCn2k56uH+DPMZe9RG8SgNOE1XLH39V540beTuGi12mwtBwrPC3KhBRjmikNinYyBn/izV3YXxy17Xx2eIHlldT9BYAC/gU2q0I12fj5Sf0TfcyMTsapAcl75rq5gRzVyVYR9Gm9raG+qKR6ugUy2TkDxJ5jkgbZ0Y/GqpxB1whAvmrqaYE582ryez5oYXdCf4xIVLA0zH75vVl7yUPyoRKNcJGU5LG2A4d806nI3EyvwyZz7gnA8JrwagUpn4pFQXRFqCtBFNE/wNSYy+HNcT4OmvFvNZQ/9AcjSzF0IGXVjqUSPVoh7z4ZsHrKeIqKkB8OJqC6zyx2x0EkzW70RoaTeRPilv9KyVH0S8Aj/rJjcJReIQrJx+v1I9IdLcySBZaA8nrCb4119BU1HyKdt0UhvcL1Ile8l/DPosw7QckFIKp5R2xt4Zl4LEkexeE/vBuplV+jmvALwwrpddcAed0aHvZypx0JzyVwVyFm6t8A5lbVAlDqctLFXd9MPnYAVb6E0aOHEX4aRwYoQwc90zvP+zahR4R68QNi2xa4u/WCJAG6GuoCZ03PmL5QcrPmSPqAILZ5Bc2YZtVbBhJ2fCN8aEcx/AWWBvzsz88f+VGTYzaKWp8m1YyAa1iOkLqYx4W6zz1/OzLBHhwpt49zlnGeU5uINkaNVsAy4g/1c5IQZeEKiyyOeXh784KuOHS/5gVMytBbBA5J7EWosLzAXy2F50IUHvZpafdqqDKi4NNv5BSQqMUJPT8WEx8iuVJ60IPTgHDrTOtnkcQ7l29GUVlQbQwp+v4rtC6oCaGoHgDlDJ8aywneZ6UqZKElwgfG5euZeYEJ47ZywgivRtDQawyqHuxYkJ4UREJiFwCUGURvwifT+jJx+QtuS1G4Wftdb72mc8eng4UXVSw0HniTJTGD6oBaWZtz0vuoNKegZZYXJAVDS0lN62g2N0jA8Pd4e/p7Enm8fgteBl+eNOiowBWV92r5uszwK9vU+XUfN7rRX/YybHHCZ4l2Kd9gJbr2JLtTxVYZxMHkLcdaqQ54fskg6woMkXAV7alHRPQyKgovEgTIeDVzpQAVj2KHy4/lkd2u+dpDQ8sTc+sggOvD5pMRTUpIs1QSg4Y93z0SOfClDfKgir0W3uzgFwncrTCqCF/p4OSxg2d3BQnrJjJjl7AESJVNLumQuOX6yhxOD8yXdH4bbpJDJJMu2igOPaKbQY4SpyumKOpBB3/lBd1v3FfuK5tWYHtsrzGVs09OUh6tm86Gb7lcpOMmUXzZHBUioQkJ75VqbeCzM8E1IKKuDDg/R9Xjicki7gk0cVBJ9gX/cT5HW29ebk6PHFdS6vqPAwFQz3QOynvoIL33o5U1P0v9boOyn48z/aTj7P30f/wmk/eke/hLW0shu3I1vLjpJuM1Dp8Q2cb0iWzjeuLMroN3k79ANKCbpl7CWSTcKLoVsTF9md2tkdtsvKt79tqnt9GG0Ac8VI5P0hjfDYEO55K9gLf7BvyF2x8VNnm8bqCaCjdq74nCE2IqyG9042hqNm9NOtOHbkNkbnsGGsEliq7SGyLbzZrMTbUXf7b3Q/8KwvyTYzBusvXd/hLU/EmpWCNd9AWkPH3S//xzSbggO+KcQzjhw/CeCu6wIDvhPIa1haYdv7hDGR8V148h8kGYQ9RCt0HYb2ole6s6Z0bdi68bM+dw2Z0G79zKB34d54puq76OfWx30KMw+F0sryGzUP9x2u9/2H+8a+Ce3vVdk+R+Lr4Bq6bP+WX19D7LvvJ5bH9dbOM5DxbvvINvrPKw3Toz99h1x8dAsuznEez0xDMR7SZd4bzwYffmYDtocMzZWjvZveDE7LeakZICe5OdsRQr4lL0Ev5Z8AT+dbmCs32ilL+1rfHIWyzH60pnqK8bbNGsLBukvF5FDK/20hrEOb5vpPpiPZjoL+WTy1oPUxJfD0PHsWtigpWSCPfhGahW7etCBPq4f2fs9PFKc0Wk88Cvt3b8lvXvWC4DHFf/ECpfmPN0PEwqBRJTdiXv3J0+077yY9CLWMt52r8IIkgdQ3UxWKpJILac1CXLILklxTtDMPCFuckzGzM05XB+Ed1sg13+pF1mXZy4RETYmWurWpsCaR5x4FnveSOQuLmUTR4Tou3Iu0s9C10lVIDK8royhpvsivbS8wyvG3xf7uhnSx4iju2tzNUPSN8mw6W+NO4Hx+xor9e34+Fnu6x8f/V3w6w9H/jBXSaE0TTIoTZIMxcA4RcIkTlIwimMEjCMkA5MIgn65jsO7HW262/rEH55o2FY8SOJNKwuPN92vTUoV3gY08K/LE+vSGsb7lAazGZfB+1AlhmxlBCTeuZLkNlcZ7QUQJt4l5Zn9xPQv1nGG3Bb+ZK95oLuO6tYrw7aw8E1ALNi6bOjO7Az2ecutE4ftGvm7uBcSbFycdaFPkq1PF+0TLHG6tf6ivyxPiMG2jiPfyxMGK8v6mzrc9IvmG9I1G9ELX8xfTnvNgPn+s0zB74rvrbktzzvfsbbhD4Us+4Nt+C0LBz7W8HgJMXv+IxtFmF8nCzkdt6V28+Fxvgt8WbNWsvCmT68dVgz3IaDw40an5K5fCHw9VD76jDDbGgavgWIE1tQzs1C7jN09Uvyw0BnYaYpd9iWarPkZPQ5CZVr36HOY0wNU8x9YAylYezpeYfGQvmsC7+0li4CcoqKBofG7/BqvF99tjyUWR0oBTXYXTh5rLmWI1YUUCjdz6MUSMvRbQNEpPLavehFBADZVeryXCOY26ZMqIWES8vo+cUXrvwLrUfv1ck3L1zyR8EPOwjehHupMoYobDmK1S1oAS0CmQcR0bWWlBWZ4f6eVEFdH2KrcUubgYWgn+FBoyazNsjEgdMnSYAuOWPwoV7DuACatXARrAN/z1EKUjZ2n25LAfWZycnU48hq71Bluq3eKu/pUXkPCWVPKA3ha8wID65YjwBEm7GHH53k8TQ5RcLhXRdqxesYjTd2lE0EM470u6PoVszquUwlq8BdxGjGGLLEXaPHrCYqrlhU2AcpYlcFo7FPUoVFeR3+kWag6cXHBYboDK4PPkcHMxQ9LOTBlioTw7fi2JkDh4if8KLmOre4xShw1qr/0YpUEJwSKhuD00n1OMQn/OsA1czNPQhAHLfxij3CQ16HTAJdKHPNyTFJXaYTMxp0EBi03s/n5ci1jduJCGUzgNrphqihMb4kcOV3AXoc7dnsvjdkAZU5z66OaEXF4ab1+HJ8rahBf8oDLVK34jCd3RbvU/PvcMdmsh22rHvTg6HCpEM59OAPdcZEucNDe+E7GjkEQ93QadBYjeVB/uWp37Jn1B71tISgN8dzmEf6snxAsXwOOR2C8DPQWVaPek3wNcGM5FDRJJqLC2vXvaEB8ndv/qAFBDGJTJ1RYEaz4ztYvzcI9PGasw/DbGDHwlTWQbTBeFy5LJx70w/noSfU9Oy13uZdExJUfIyifq+AG2Uzln4ExzN+C2JiyH4ME/HqB1PnmKTDRsVMnLqKTp6J+qJr+PXI+GfYnMQGlxgOF7BreSV/SAYxL1kRsEGkpsOHmNc1jS1Ev6LowwXiCpMdTLUbIRcB6agvuMkGoC3X327N4GtGlhBQF0MTBQ68zt9g3Ylzz1aLN3oU1D/lh4TGQdOzZIc/nCXud06NZjvxUHmW50d734chnik4AF4N9y/hJvZ5A6Vk53jHEH3k7FzVBFcF7cC/taTbXtPmFN2c+i7Xwksfls5ne3XQcKasHzLvr3Aa2fl/sZcny7uG7pRgcsccFO51FsAIh8Kmw8jgNMTWC2ishWAee48SoNFqbYx4otatQPd52HVodfrKCTChG83A/vp+v40NUbIXqcJDEbiqiMYSBaGHs5M8o5kPQZ09vOwLapcA4HGtK86ITyyUFET5KnJeEhLr9JPwxXR9jtWI3q4AhpJpycC75/IrfO+VyQrtXB+BG1j2D/ODZk3lkZqp0w+WcFFoc066KzowFDdQCiynELAUsCTjuB3gvomeNiRHEvLJAbUhjYx25qHGEKTtxesU0J6GwYH99UlkErZ+Ta+YaBu52GOXDJd5TGXLLBOE9v1iCioFkXTRfWeS9GigxcBxSTrjAPcHKPhjYlCynGry7OsOEKAKBZU647RNhG5co5KFPJD76mwNOl/8lrjHtvwxe3QaJ2DUxZWX/t89tf0RTf7nnJ3L6+Uc/TBbRBE2RGEyj8OaHTa/4ac2ACZyk0RVIrS8o4su5ogTdfKVhfEtTY2zHF8gmeYXsDZ0VgGwJJrVRdAnqV5SUFeIQO31lm95Bt6Rz3X0z50F3uXd0o6SsWIfYBaoYZtMsXXPW9W8U/gV02pLxfbh2RXYryoL3IeAVx5HUltWu4AhBt3x2m1pCN7YKvPd9SGQbgdrcaKmNWLMiwXA/ySaHuuf4zK6+lf6110+2QSd0/IROV9e/aKoUoQu7cVJiK5fux68cONTD82c+x6abIHwkIts8K5tL5h2xzvbpYJqCr3LfgMs867qlZtZdPAFOwf1hp32adr5siWZ5X5Mva5/u2YZp1QP72hPQzURx83pcr/5TAvrPr75dHPh9p39ijvh4ZceHmtcEBCycNsyqzxxZ3i2XWZWpp17f+YfUJ8fiWoR23VNEM14KQrk8Fjt2jGOoFSRmGVHa6VkKcFx0d5QWu+VlSpiNZUOYO98Wg/WP6xdRP8xiScdw+izfBKxT3VOTEe1y9JuyP8jhm30DzlGMhqvdh4POWefMTOuX0sKNIXPNOKnsQ5KcBpuoCdM7XU6iwCdOW2c7Nd88fc1fIjBwBzcQ1qRROJAEFrnJ6J1L1A6vWh1Yw4hMPiG931h/1y1+PgVLvP5yhJNH3acuSmfQBzAKLzXLStjqDQ5BEdY3N3AntZjfDULw7QjTXvqSlu5lvDpWt5UzcxbnIINPFVI/YpkH5PTuDXOImI9q6pRBtZLyanGlGNMZwd9ep3up+N356YpYPTtPt25pw/etCMkQ8kEerDNQh9P9fTtINdxKl9BuIV4hqcpRFZjqaOpYQufArwebBxtR41XweKwfrzRtzOFSV5EnUsB8J45V56Jx65SKDD0yieQs0h5cKpfB6ExonTfeUhCvnorKUZewWH8r5OsZYQUy44/kBqiKdMKpl93xqXMDUb33JtJbbP8cZAgWda5Kvat3lMRw8p7cjFDurFd7JEqgpjVw1AMF/NvytHGGYdjEQnCBryq05ODG3rQcQWNq1mUf6XqO0J9DG+nlwzvDRBBRcE9rjq4mA2B18omQQMnA25Rcssb11KyfzVMoBkEBh8gnAso8dc68P5cMgL9dM7jGzCvFBPLUhjF6axgDzd5n8Ah4p8egHj6wlczqmHqwZnX2hPXAbAVTu3Upzz8lVrdEbl1wxBxp46MxXwp62uRTgHO9Ddvpo18TQ8wTVbQw90jS3ud/47rIEZyCQWppTocD0IhiVRNz0a7AMk+1t+IMGpQdi05/lWxICz7pxLUIMaxxJanToyC9EBzq8y28LxZIcwhguK/qcC0WjQafBxrUQujuMzj0PE6nuZkOyngBMQjzsLia0LAt3z0qL/JD1S51dxElTwXOtgbbqJUg4TmWcYF6OF55QqNTCYpYd79qvi3IlC160OhtusTHXNFt2g2ox4W8X2gjBShKfle54A10taKKMm9JMwLzkoCp2azfFamde1NPJ1Jt225YRolH68PlTGlFgZ8jBdWA0+M8HieLUzYHxUcShiPfSsZMyt5TPd75gQXT2G8oZLyxGgsWDuidROTQZC3LxQhR1kDqE01EXwJlWkMuKZDihYYnUb4UfhFwAi8cXUIMfM19j9MFFDnafL1GTriEYOxR8qt8AGRLGaYVaLQ53YNnR4LLBauhzmdvVeCI7YBDjRXqeN1H4qid5wVkZxGsnRJ9P7FsOT8AZHgtKoTEdMEzcTmXaFFi63egdxzTxkRmSYsD/fZq5C7Fmte0kNnB8brYgMmkt+LAcABzL9Z3E10tt34KymRRrFYTdTePpXTT71w3lb0ZjWKnIQ7dc6g9oFVO3y9GfFmXpbm9A0YnyD0TBoZRO4ioxg5uELR6wAwQPJe0JfUPRPUeGGRkJg7TNSrwNhunuNM9K8WTvQkYR3qOQcPC+0Ko7YLt8svZMh/X2zU4D/0/IEGxdfBumx/U5T82/VSn+nf7fcdVP+3zQ1UKx9CtIEUzCEkSBE2QNEVvJCcExRAKxWCYwAmMxsh1icK/lBjF9sGW9F9BstWC0mQbl9lcrLcazuY3TdLbiHUabayghPxaYjTexTuZrbC/ga1kL/7vMltwuhX/yWST70p3K8Mo2ipXm5xW8i/kVz0GOtmGXZL9BvB00xKjd2i1wqkVpgW7vmiEbZdZN2K7MgtC7r4+uzDpeo1NOWZ3t47C3TKb3N7gx1AP+deUJn0HFvUnwDK5eknfRA2VbEvgE4cX92tdlX64fKHrAqyLJvFFFei6IbJvVSBJd5A8qZlRNe6z+Fl6enFc6IgksA0r/8Gu+vV7ld9atJKdv7lSb8pY+E7XfX/fNl9M4Qz8XBn7fXil3Tofg+c+prD8HWCtl9A/7+gHB+q9xHT7FcASPgCWvgGsNeacT3h2PCqJ5pZAFDDHTOTg1KE8BM9R5lS1DJLl3rWCc1aYelYe8uGS6Wtu+OxMXetbbmqx8KZmR/HtqwBzIWWZjkDynSKD0eA3p5ixISHiMos9n7xDrYw+EluxR0PE04YZuJCMtS6q3xZxhroZkEVWCo+9np2VGgygp/Gqr9YhO2KKcrzYJT4OzgO08kY9hWN1zJMQr0srYue8DnLDCUjAvozlTByJm/aG4CSbzy48xOtnH8GzO0NQguOQVIRHLl2eJOWcH8A+irtnB9MP+n4okDPAYGLk1g1EPix+eRdKX7F4yEzU2ZHDVxQl9kXEcCmVD8RylBkP0nkOWj97QibM4GXRa6DM1qXi1MtdBv+lZd9XEADYaLg/YABZ996yBVPnWa1O+siLdfSiZN3MWvmrfAHYWGesznt0GQe6z+fSc42StyzTCvXSj147kj1eKYT8OHCQBM330hrhRZFcpg9fSXOQAYu4qjxfljXvXmXSJLDiaKaydeotMojNnufR7pQcfcF45VUoI1xZDlD9nOAhiHVktp6ABmaHG4k9vIDlw8ldaNVZKHvEsGtnucckEUgbsjrUpqfCvDDk2RUnxalOoafQFgNPE9BCY6qf7EG1TVofrkcjp8s+vl9vRz5AXRuPYnHR3wYSVrE/Z6foVLOP96L6YkvKOulaAKE+ZXBRDR3MD4p7Ktqgit2stO4KiaMqbs0DZ9NtiL5O2iFG/Xw+N60eJ24isYfw/liAvnONNGz1pvWfEt4Rjnld896bPk0S8Z8GFPRvBhT0bwQU9IuAQqM0TTAkRhAIjdAYvoYXmCRoBiVgeA0362sMxb7M2LcwQWzd5ijZEmt8d7rd/EDgrXtBRP+ioo1eg+5Bh/w6oBDBllAn6dZljqlv45jE3qCg9h/R4aYztnUwiM1fJEq3IgAermHhFwEFCXdzFXRvWkdboMLhvX+BbmdZE/g13qV793sz60232sAa9daUnsa2NxLhWwt9k6Nktriz6VHsyXyAb5Oa4V8zgfaAsvwYUOCHh+QPWjmAjpRc8/WbPiranzDz/D8fUJZfB5StbfzDtv/pgFL+k54F6jQLGt3uLwXI3Mqok0VZ0CGzjAttOrAEnVm5jGFfkPrjKZsRVOUmWV7T0bMU5vr14DCDQqolfj+GPuDAUGleMkm7Y+qKKZnDie3vg77m2fxTgw0i9yS+t1sMZzG1CXzVasJOJ1CM00SdqdwMQGKlvq1vVAMbJe2IqLIQuS7B9f09huLk+to5v0n3i/48M08urNHknHbwRSev3Mn0JkYB6GYENd15CKVZ0qgBe8XMsEIVKFd8MVb0jzlWwzYChd577Mj0GrOI9l2gr5RC8rjP9ABqueYIcWkOwvT5UEtoCSXU8WSTWL0uaVOcnnnyqFI0dqeR+ElfwWOWBqVvGEWcO2CdAG+IL2wXoU/eYzpTpvjG9VGBYM0yuCeI0OHEDeArwKmaFV73iT7b0C149pVLBtN0cEMDoC8U/G6DBpeoxyDVOYY2qEr7j/MjMpvOOT7FSM/M9GRRFyqFghvsv3XperuFQ3cwSb8EamupQISaZMcgZZF5+rJlL+/04a3xVcnDiL3hC1oSZ8bHSSaP2eoCJne9kMCeKDuxfQOUOsA64RKhVN20Z/QIoZfNInMKEiBjgFNzsxKbh8mTnFUn/Grnx2n9mLSPJWw5H0IiEgBda2lhIqUucOsNlRZBZzUz4oyKsB7TxmbN50G2xxabzS0o1Af+Nru20HmwbeaWE8kAPCJjWtMQXKCcc6vqhWCJyhCSmE9BLBn/kjsMfEUeZjPpJ+7wbT5cOVW96qLDnmTIvFZWx5zzi1YD1p9Q5/w9se66gl1hC96CfIGoWM34OXkBW5alePfwuNBOV6LAWX4tOVm/oCPzhhztlSjO0YnoGddh/ZlrQeidkWAM2IZkRR4t7wY6HYMBRCE3WqLR8gAwa+D2pD7dWFFjz0Z9f32rWI2pN63s3eLAe36bqz0ERnRdP05rYoKcX0mcP17pmSbvN+BOaP0DzKYVrAmeWMxv9mRI4iiWzsn3qGAYNDIAlxBj+ZR1bQuLT83JOkKlcyMEfJkrgBpfqtokcPPqHzcEzl5xzxzlyHndry1yftb13Z7d7n7WkGthNM8GSjiJbmvsLSjosmQ1EA51tZi9rBtaxiC8KgbkEhqtLVUxTjzkDnUcPSuZJ9uBo1C2TVV6AvJCi0y6PGroWAFjb9DimbssoZDGIo0z1bGrofbZ5keru8GNdHdePXW6RDrGOkLoBHp4tujNbHLg3pYIAqk1X9PjiUiqRnPv7aU/jY/6qBHp2YTf5xrn5mVZwQn+QkG59fmGUXpiQiOS4Vrby0kMaCiced7qySeFG11lumSrB5Ubcalt0OaMuixOlnyqxsVyfA0adD9qUurrskRWb0egLgJAkUrlyi9MCeJ2lsZR15R2uPQaLSPny2n26/zZ2ufidL9ASuwJ4HE63U9q5PUwBRkEfgSY0q4emqrYE4SIqPGkyKw4WbU5DDQrMg8vrbDxZYwzHIupbByOYHoh1+W94Wj3hTxTE8Cvz5Mnzf9xYo39TRyE/Q0chH2Fg9b/GJiBKZJEGZxawQ+2ptNrcg0za5JNrz8mGOzLoY/NIRffMMyKKVJqAyoxvU/rERsO2lLtvQ+xmb0ha3b7NScl3mBOHG+QBYu+2cCtfwh6o4mQ+HboB8cFTbazblwVbGuJkL/SCtn5Lxv5Od01sVJk9+LYZa8TbANRIb1NcCR73r+mzhiysZ03JbBw9w0JttE+hNgIKev9w9g2ZxJ+gCBsRUN/hYO4YYv/9vgDDkLcm6vVHnSZxwBNiiTOrsut/HmojyW+cnT72xhog0DAHzDQ+59ioD/pc/9TDLRBIGDHQG9u3Un9YUDtc2BrTeWOLCyzHF+7D9rnUprVajDjJCSU6EpZV50CXYSxvJ2HlFwi1+tqOI3w9dtM5P3Fnd+PyL7k7bpuo3lh2DFjiFn8fKeVP5e9P5Al8E8kLb6ISj0wDJPLPXCsP/ASR4jzi3gLUiji889zmJl2Yg+cxBbCmkY6t/aVYGV67wGuc8ye67xAEhdwlHL4+owSia91ohFHVedlnY/YEXpVp+VdTU3/Knp8KN7g5cFa4pCogLcY8lGj5zS228s/kXT46QuP/83FA/8biwf+1eLBUAQN0+vigTEUjuxm2yS2/ZOmqDVgoDROU18q8W36QvsUbUzskvfUllBtk7M7FSze1YjXffB9fDf6uu2ZkptmAo1vbc+Y3LKb9TtM7r6QcLQNE6952bq6bC/CrTiG7BkXuX6ff7V4rCsEEW8DYfgucLQtDPA2erYp8e3KgBi9le223InZ/sb3PHDNu6KdNJfuztvbABm6sdm2dXGX+1/fCLWLOPzV4kFvi4db/Lh40BIlCPNDB+318/V8LlzPHX5ePN7/w4sH/H9u8dAOfzHdqil9UcYrCFI16CkpCTy2CeyfPYorAKaAQ3TOX3Iss6R0YeoipehDNbpJyzyimus6LZRPuegaYQglmR4mlwi/XBgXNwoa4+6ASh7OJ56Zx7bIlY5DQFkavSwU1jWGCIt6Pk7t6Cq/rlIBX3aqfq5Sadfn6/2owuc7R5sgsKcxonF/sEGHA/6s+p6xqmTx6qE7y6nEpLk0wBfGqwrIIQkEvMtw/0Z9e17epaJUM8Dfowt9iH1hoofa11uzeFw1C347mfxiLw+EFXDqdegs4XE8OUIQy4a2PPAiKkZDvQ2jAyDKcg7Q4SRU6ruP0/tUmPSgP1BEcWiB/QerkWlxsskqvylBPf52U3+73c6/Ke19W0U2OZd78Cx++691XerHem8MmGN/L5bkN66oivqZVL9NyW9mct9UYcri/hvbB8+h6OvgN2U7ZFyP/bzCxfpfHxf5fuZlXbrUpL8n7+0a3+7gp1Xw/4/397n6/qN7+2Fp/mq5jaNN7X0FU+uLjWqb7hI06a56Gu4iMfFuuIbsmvJf67qtSGnFQismY/YaUrSL3SSbrukGnLAdB9LpRtxI8A1frSdbgV2S/Cv6Vc0K34X1I2yDYh9C+PHOoMB34bgVb63LOx7sUjTxbre717XocKutrZAuCbaeCMpsl9mk6chtdHg9zwYbqa318hfLreBtUybw+DvR4k9KNR/8YfhnyzBRfgG/y7BF5gGOK695VJs3xg39f6l7ryZH8exb9J1PMe/cc4Q3E3EfMMIJhEeCN7wRRgghzKe/oKys7qrOmu6emfOPezo6FZUgfpiU9l7brUVX/sUbQkfYrcSn+cU9yVtCpMYDm+XCy3wHouu5jjgW2Ta4weU5Rsj8Cpv6IR+Fxb/uQwbK07dZNbkqcHR1d6ES13MVxTsKqmZDE3D6VOxYLNW/wPDeBvyNk/6xLYDvRt257Gf1iPCtqfEs9oVcCJr3pl7gs/FW9SzPvNWu6Q7b5QvPxGYdZ/txoWm/ncdPC9/323RRbwF2QhntG92qth5nrXInnZfhs+PtDTKQtk9s/G6bJkv2790UsPkp162OvsZ+EL2ys2ZYiFemzft+1Qg5F8H2sDRXnkzmGyXrWrvbM3mE17oG5KNyj8T6GSPeIEtBLQtWHSJvnqA+vAy5eVWKfYolbuBiu384br3t9pid6ed9y8B2z7PqMI9PDiHl8yHtYx1i3YSX57bAm5r2HGxnDa73+8ef+eM5Ac6uf8ybn07t6QkeZ3sWay/s51/lvP04DrffzvDjwsgtB7b7dN5/470Q9jeIXx+oO2lETwIhrQcqK6PFzjOKpwyEkO0Bf5q1Q5i1F3DwXFNKZ59vr46VnM7AGhN7YgtFyBVeLhvgVXsDPoMWUxV5nfpnWFpfh+hUCXMdYU8dOVkn/REdV0pK+JhESnoF7X59sR5NyBAsnx/AGZ3i6UXADDhf18cCPePrk2FoZ3MsZ/pIaflhFFfqBVZHgi4OTVsuwrWVHhmDpIqqIFfAD2NzFC5mNmFPZS0gFMxo5IbZGAR5cq7KmM5TPIGcYKp2XW0iearb3Jljul7EV3VwAEpbXlUwFLgHUvfsgKBPI1ZFiJxnnb7Y2oCPlxtN5yqZ9qZ5tLs6Gh044ZizGogpg2UAo5xFLCXvYDobwo/DtT/MywbOQSq7SDTOEOUJEwzyj6ebzxLgUfnfkoH5iijyg+SV6w5YdlyqniwaYVavA/2Qmk6BytP9OCSph8Kr19hMIfUOzjT4UUOyU5kVACOloK3lcC+LGa7mw3Kl9OGsqGcY7cfEVa+VTdOSdp9AqBGCGeQE/XSRUdNeqmyKjAyQDQPHQG1D70tcnwvdoc4PgczQeCyfQaXDiqc/MKPQ+gClqRwhHo826IfgAQY6+ehHDKjXiRcfd36+h7h1lbGBSIu6QqwUJRnZO2sFiC4cbHtuYHhy757Ll+jwFe7yD95fXDIGqOq4eOP9BqY93FpBY7bqmtH6rLkGdZexK3WBqh63GvCEkvxUjEoJH4QpVoZuJV2Ny4C6Q43nC2Jar3ObB8VZxpWd7lR57WWjS/9Gf4PIbzHPm06OcR3pHxb+KT0jusxZ/Aevby+/W+If+7t0S3b8f3D6//5/VIf/mfX1v7LgJzr4erHfwwAagrbwjCZwiMQgGIHgrxVutmgojnc+kV2iFNt7SPH3rCSO7nHM3pxK7bELRv0TzvYy0C8Y0ffZHGrvXKDeQzN7yITuOAF9p1+o9+BkSu9nIIh9ve2cu7bqrwRYo2zP9GxgYovAdrkd9D0/mezRIRXuoRj0ThQhnwUzOttDri362/DMroWD7Bmjb/Us9D2ZiexBGPyWZKX/dAJTKPciDfpd4kzOzOZ6eLES0XZfTuv4vwMIwI4QTAjbhUenT4LXk5t4potL8tEynFucm5Bne8datN0zu5Oam57n2kfa3hxHsPm0s6GWs+YdzS1Y+yYYtVOqsoFk7RQX31jq3gdxrH22P8hfv8VsEKA5xz1AgzVHm8/et6DNkddt++aGb7DudT9c8s9XDPzdS/75ioG/fMmyzH3l7z6YQvO3w+PeDi8/MkioXSitgBIpjchVO+tTAHrZAvsyjRSFwmVe0BhdyZFXpQL4O6GijjkwtWBNc0tfPPu4ZMJjgJZps0ri1anEro/Ho5cSeXEpW5l+Dkp94l7qo7yyFeC07YYXRrqrkZm6HbkTgdz13hhS8zFsTq46pCBjnCComftHyQWk15+4ojg8zn7DZzA4AicXo58NOTwGaVLwccQOzkAS+IHGfDpuH4979gycPnvU/lTq17ZQzdJY1cUajxIqaMcK6GP92dy840CqV1VDt1BXMY8nPF6wky7MOZIFWVMq/eQ4pkJzC35p/H5g06gtcKR17w2guVJmHF4CO1LRs8VCq4rQQNRIbL35Mpi0ieV4iZfaZxIBw2JoXENGlDw05yvDBiKMAMEoWgiCSZMoMupDHlVsnu70kTRU3cJFApn550Q1i11P7dlCIX8ydLLND5eSwKRn3RnAmg+aRWS18SjpLE6jc8gW9XpnEyvTTniAnu5yIT0bLynZNtSo8ys5XKSp7ptR1WJUvAEqCtm5mjjaMUht2A54JFPucbXImsiRCmShlMyBc0dCKZQ3I10Himzy9qNEW34WxZQDKlFKR3W1VHwleZp5kNYTGVMT97IK6ywE6zuGcWS1HVpKGdVp6jjqTHuntHql9jB1zPZRZt16ivLBzIJ5ouPgClGRV19xHamrtGZcnPJsgp3poisw+j6xpeALciokaNPn7Y0Dft/Y8kMWQFeV7Q93Xscy7K6rwVd0PduNHBa19XvQAPxpAvOLxpad5mbbbdlelgN3au4uasfyyxCsPjL57mU4pnDlii0moSAodAe6TQe1rxQpeSqtoiN0xmtLvTwk1g8agLcSWmDdCNZftIQ/kOs9uT/nrr4z/Xpz6OzcLyoppJ0xpmxZFFfd9yDxpkqENzhX7IADnN7YiYzCFn166HREpmKgn1sUJwL1zp5J2r4YVJQNbhycWxVKTs8NwUrlfY2P/vSCH8v2OWhqzIc2qNMs/ppqZ+QixOI9vkz1MoZwZahSAhrT8lpTEVdHveEScCyoC3ZlLCrfsI1ykRdl8X2ts7PDxBBHsg+dzDJG1prkh3Q64bx+ioWJ5sAkO5xM6RmEKJmIBz0UweGVA1t0QYx9pNLXNfX7y1yCZJo34cmpuklaQWYhoHbM5xSmudkb7mgcneAkFMzeZXmBkjsAiWm7hF+yT1uc0TNrevNHeupyq7bA8EbNlC+AZmtiwVVrySGgRpm83p3HtTmJccWyHgDRT5U8ciY1wKNHKyXfztcbKbZRjCQ5OfQ4eEF0VPAfGWpZ0RzeUtwRLgfHMms4evQmcLWw47pmmdQXzeCvjSw+XodjoSdKwT2W+qU2DwlEUSuojuUq+0zWhDx/VKGXY9vT/OgBh7qD8Q1SY3lpbHVsOsvZifmOjWWPfT46YcjcFbevl+WVlI0vCW3ueegxIg1PKgw93TxTQsBX6vZIbeqQoVrUGR1/KlHzMkloBFHFPX5Bf0c/942BuO7xQTuRPvZU9f9652o+d9jL8EybnVL4H0n6D+t/q29i4e+7f6MWTn9Jw/F/7CTfkz1fnuAn0RscwTAMonEKhiGIwKivaYo3tIXvVa/kjZAg6M2N/6bFiJB3e1C8q8Kg5D7PjOFf59WzfQxpb08l9/ahmNrzPhusQt/IECH2TMuuQRi+pW7e6ZoN+W2AD/pVoifBdr1aOt6P3NbdgF365uKI4X0Mm6DfzbNvUuKQ3IFhFu5ihtubKWxn6oixvTSwawa82eY+GIy3G9yVBna64z9N9Gg7npu/59UV5txHpCStDMkEX44RyeLtM08BfHL3ms7v8unMJLqiMG4BfqFZ5nT84HqQeOZp+he8iC7H3EQ+mIaBnWr4m5hg9I1+l98VZ120XhPRe8YL66glews2UKTeplGz4+10H7kdnsVd4K02ezy/4vJHXuPtgB+oOKRv2iO7MoBQf0NcCL0AHwl2633wzvWrOp8z3/6kvce7N3BYHZFPjcS3RKITL9q6bas4Frj/gar5+LsMf66x9c5lITx957jB0I/bZadJ/XxGO6Z9X6LCM+UnKBbh3y5RFs74TkscvXmPsTwQ3dwtce2T/xj4NiaV/v4Bmt9TKeci2Q74UYDxB+D8w0P8YNN483bs1Q7oL6VdgM+8ywsj0DpVOaVQHtrcSqaQn3q46SuTqw4yL7nSqMMc04yVbCPc2bVt15TvZQJYT5VdAlwXF2zgq2oVS6+TTkHIpn5aQuWhUQLIaNoTEXnY3Qwp2GRTznwsCnq3DxzqAUPaQ+XluPmKzkGI1nBHSFPUHm/HGWQkh7gR8HAKTqMb2SQEp4fhoHdVsELKcejhe5MCtEKCk4Rz+hirtWeETyTXb8eVjHnQsMvFpZYo8ZHmXp9z0xk8iVO4QJyT83iZRxLhPODoY0WuXuhOMnxIVdD5eO0vZUQGbYCAjJ/5F8jw4gv/nNlLnPvSPdNnMdeEgCGSS/e4AEXLRMqZBE9y94DEfjpIfYmqCs53z5qfftAM/CHtQjZPxZC6A8Cn+sxF6Wk5DUGLaqurx5P0UYjZnGQ+CR3z/c1fvRf4y5Qk/h+ofN/8Z8BHjsb1YUU0jiBhSAVkuXT3tLhb0LH4Qwvw8xZ9PA1vZiPcfSgnAW/4Dju/RjK44zJwwDmTXFF3VEaoQN2DrLz0eAALLxbOwUkO2P4oaduX55ReZ6IfK1J1T4nCS9lVXWB4yYBbClolmcXkJSxXDG90csn0XM0VGro0GufBTH/DZTFMAhNuFTYr+Vh8eI3HPXgroLUAWLq21eoOkXiC64XeeQ2RGSgistINImqHKHsqdUdEx6qI5yl7gsnz5RTp2R/ahEiq5wCoMBPj9AsJ0FtG+yevydNWOIHGFjMXwdTa8A0OJfYW75QpE27eDEd52CjpporNv6rkDKz1QZJuGIXJt7U2B+PuqBdDuOMqe/sPnT/yP+H8/xsn+ZfO/4eWZYSEYYLGcBiCaXp7Ieiv1e2QfRwkewvSf7Bc7d3F+D9jcq9nI+G7xYXc6VWxvbfmS98fUf+M3uSs8YdePLzrA++Ceeje7AMju9fH0t0do9i+8K6wg7xVhX81SgyRezIpfUvmbWffW3yid9Uf3fNCG15B6b3oHqbvOnq0b6TfOj3Y+/TRW+p+r96/RfniD52EdD93vM/j/ClJrLpyHMum33M5SihlyxYvXMw/NOm+czl7/Ps5QQx8k8Rhf8citdmo4NPHzwLP2N+KQBoHf/OBNst/MvAD8ncdnaf7Ow/kpG+VAfitYyCLVr1d9uhwP8gZaNLmwoHvDvJHweH6Jz2D7FsXyxZjTpff+0jgGzHqPsC4Nyg/v8sDVTvDlrn7+kWrzh/qQLtk3rrP28iItta7hMHt576Cv42DgE8g9O/iIOATCP27OOi3h/gHHPTXNA+Ab6IHrSyS3KlXSkW5mMmQY1nH2z0lRoF5cWnteDqeXe6hI9mNSqVFZdoTJGuG2YGA6fVpkiDnZeQiUsyXu9jYoTypuYlfOh4LUXuqBVl+1fT5Zr0st08mwuOg+YQ3HPW89QAM0jOj5vNdxQmFyXiz5JfyaW93/qy92zzAxoj43l2SSccPIxvVnyxkMDPc+bOe9NIdQJa+1g8PfTBoMCwrWplXeUhvd8pLxkB1zMnynvwDG/lbJF9flnUYKd1fd0HkhxHB7QngdT26ug3m6Mp1CMqTWadxMh5er0To+rMKcdETPUdYnefVUSjnoyyEd4sVUBJGICm8p0C4Eqr28iUVjo+34QEf7ihHpOW6AU6VqaQA52c5LzNUlBXE5u/zYOlbbOqOs+Nw0uUkAOhkgE5mv4yEji8YSsS6WGdlJhUl3lezKhYCzrseF4vBE8NfK0K6CZiucENuYLYUKAroLgYJhot0Dg5rfiduxtTH2qVRm9CW7Q4fgxv6EgbTSO288BlEEFr06vHVfKsj+umcNSCn1+tRodVDHGHmAyEySeMwg6ZX71XAp7lI4cyz22cEy56vwMgB5J7548Q0j8IsFCpAgabSGUPAReOQ8UOoixoVddccwc/20luDKDDthen04QbOlx4Xk0PUxgeasU8qOpPYnBQAdYaU3ublV97cIAk/TqQ82VXZ9+nkb16YO9Ej1rLlExlZUSBW4/qjEPOPeslIhhWmSLjtY4mMYKYbjglwf5r8h/wHUPX5XuCrN/8dUAX8klVWwYU2n8jneCj0oaAgk6FXUO3Zx2XRH4NoIwUBcfoVSE7xQDGVn3qP66WzTwh72mB/TV+P8DSHV7wHL1XptwmTPQY0a++3exYNx4Cj6HPZ368goF1iN/RKk+s7laziaoZZa8NrYDueSRp0NLOSn7a5qgfopjUzBh0u+Fh3d5whgxcytSqwU+IIfFboxnX1rcDH1e3LYw5HcaVN9QquM9qFQsfmoNxlhDX086shGOt+f9GKP8PWFeDk7R4vLGoTc1CwvUwlqOqg1RUHj6uaraOZdfmgkiq9E9zoklmYIEna89qDKHhr/RAIJDriHU1h1zPJVpR1F+bJkK/MCupmL59R8PlqZn/ugplt7578pDQ7qFDwAF1e5dPNLgCScELjIm4z0WqVYszlFidHUx9Mq3wVZPLi+d5YhkPMUGLJxVV98Nl0EVmOsYbQhXsSOBMh+lL7I2Hhg/i0bsjT4g93XbUPm12xfBNWNLWUwQKRfXe7PKlZ8hsJJ7ZTz1x7eqCAnU4tcWTSgQgVuT3FtAmtT6GsNP6VwOLdvZFY6GS6UxsZVTDDoeDY7QNzPs5J/3wxDxZgBirFAyegMDxCjuvUpnMhkIOr1abGlI0j3U8i3R5eOC4LfN0mjZmP6quPGUF15ot/B/ANYlsnUz/JR+ccX5EIcRozdjyVmiDLvhqmyV0Mtxune+g7EH5qlRRFZtDWhurAw8IIwOOk/H24evw/maP6by3+B3h6/DknReMYhWAIjW14lCIQnKa+HMBGyD1pg6B7+Q0K967qXTw5fvMDEnsyik72zvGd+ZX8JxF/PS9HvTWssr3Lcie2IffjiDdTXwbt2Sf4TTqzj7NF747QaE9bkRuY/ZXo8j6BR+3AM4K/Tbslb7GDGN87z2l037u/xjvJzQack7c8FhzucHdDwlS69zel6d4qvl0c/UGtQ77vcR+f+9OUlLynpKbfpaRkm1MFKvafe/fylymp+P/ClJSwMt53scofUlI7semeevkoWiIaL08f8FNeNXivWcr4t5olqlX5dIa7KQ+m/wuh+VVj3U9orv8AzS33IxX31yUxeaMCGesZgF3SRtEGiGiXRM/VyT89LSqsws07XFcDM2HpLla6pVlpnmiOe5+kZrjLYHhHn/yrhpoj7xiTzgBspzCEKpV3WGwlX2tC4pWCRWqd6Ep8sMTcFjcWDtKGyBF0FtxMQVebO3uItNy8AmJwAHUK4Xi9mk0fQ5h6OC+CnIwb7OKjkpzzFYnh+HJpcf5m0Z4+BE+Lsfv21MR3aFEETB+BbrJSt+NUqZDro9VeeQmmNddiief4Gtj1lSfMMAdd0azo06yepvJSh7UVCraRC++IH4ApgMBs4bRcG3pEScpF1tbbFZm6uts8ek6uhlwP29NRwfk8b95KuD7aZ71F0lkg21UgAMHTJhqhYj/H2vyVLX5i1zu2twpeRViGT6yaHfBA4UC+xpuwqJjsA1HZ2nHvCMz/9Zv/IDm1AybgK+K/4gvihU/5TNbB4CvrTQ3VSjEivIC4fLlTd1hMGOLWwXbHwLRyJEmwJhmSa3gYp6U/D+HTws8VyuIg/MTGw3gLti8Wn80OAjCSNlyiY8GOEvlgS48/GYcmiNDTkkaw7WhSgrL6yPmWyh9xHkeHq34PuBWRGIEyYFgAipgT8OVi1Ml0pdYlExtiWkYtOY215h+6m39RL0hLIJK4wkyBuqcn7N30oT+6MaXWOAQMnVzer7AjQddhw4E0vsgXQmO787MSKXf70PMqjiWSJYWPtD+NMXsCnzKD35ojUocUKwMXJbg7ySRVguh0TzDjV0T1VZurwk52mu3DZtxUaORzQ3ilV+nYKrHabM9dPQrGhv8uJfBUDlf879SebFv933HXfJuQ+Fqi8h+WzWzOeO/e3XzovXu89/8sCP2fLPRdGfovLvJ7D05RJE5gEELvzCooDEHYl93DFLHXaHbnCO3NOxm8d+KG7//jj9JSvCdvduIS+J/I193DEfnPMNo7eaC3K0/DvbGHJPcsFby5U+jNfBLuBaYo+Wf41nDG6L3PZzNzv6BQwfdmIiLc81RIulMPR+lel0rfAp0xvIMKit4hxy46ROzFKjLdt+/SQ8neToRnb5GjcC857XPv2T7usV0HumEL+k+bhNB94p26fE8spcsSQXPIaPfbl4mljP+pSeg9JlEx2vciimfVqSismsV81Pnf3jvZHMLmnET69/LKWzTO0O/+3N0BxSK9fNOA3CJd5vXpcE/vtlO8ihDo+3T8p7MGvhTG3Ny9C/2+NrQ5ZCdedUfDP8SEjt+3Ae+NFUt9MXeiaxsY+QZKBE/0MP+qzUf+Ix7cHTILFa+3/9wv+bdO6m4XtN47ZTf/qEzbT/FmWa+Os8ZRnz60c+GzpjbnFxDZH6WcnxzwH7QwZUFxzC+Y9IBfDuYbNwMNtUcWv8zTixwC7NLgCxaNbVZgh8vrrq+EXSMWMAuJFM4FGqLRcgi2o8wDJ9wxNRjOl1rBrjl21b3xsAgviPFfbsl5ThdYiW5Gbe5A4RXoi5c8inh5bZr5Sg8905JUpD1WM6mekF5RBiLIZMTwAguZ/G27EPWpk3JQH9ZovTYxB3A4InoXiU53YpFRDhg1eXUeWyZXk+qMh6wEJyhqu3I+5GmX6gsaHOd+GRLWAGs7N1GA8C83bXnR2DPwztIU3I/3biZPHURm23PSZYISry95xaXkVhacBc2TSYf97X6j1scovArgUFN1X1n+oh0rT4GihpV4XZlBww+Gu0kzRTtxtDBxzlKpj1bcDPND1g6YpTjX/qA+BMDn0SBjK2/oWye55nxcqid90DJyWWu1b4m2XBDXjejHZFyIhu2Izr2cm1EgLJIZaPQIKOeFOXUCGwUmuOi8km+fk7YmDhnlys1J9tWjsoWP9UvnEtXpeMjwBQmTC4ooVv159WLAtbH4hFJhXFYto16tRIuuuAI+WVxH3NWFD3x2mw5BIjywIqYJm3uVuY/0VH1XeuNVUkDgXSL05Z5L2z8eODe8l959oZTn0q7lxQOvD/214ZaSgudnYHAvjSpa+YYMrT+3xkG/NQCo3ecGBZ1DZbXFkQiIw7KmzG2N1Xtzb6OniBoPsXfPMyc7smJduBs2REdiPsRgzEV9CWjg5ox/iWCchGVuUvfyiMxTnOP95JFVySgm0lycXxIMf7QgyZPpa2zICGfoyJlpSV/vtFtr9u1+HXWZqfkwCHYAA/xlBJMfGZnNrZprSeUOxVKBT34mekB8P8/KCe5ucKlrPRUNKMNvD/ORyBfTuBY9rTbqPYjJp1Va40y0oMtGt6z2mpBKjwkbA1KYNBgpuuw0LXoY9SLJ4giLxPHRqconegQDNyurgjcmUbi7aWu44fLS3TI0ErI95wNg5F2xcND6UA9CHtzmRBPgOL6AQ8ZUVmYn4WEKfBypXowjisxQj7Cu8KTOuGdcIG/WAehxCwuUyqHLKinoYgquDsk/bg5BxIYf3pZ6WNMRhCuHLcne5dFOsEZZLubEqvr0YUJAPDKVgibx8873RekxPUitPDVm+YMoZeOFPG0oxIeTMFxNA6SKmuk3l+5myeb92RddPYCQmEF0nCttvqDyVBpzDp5N75FUwwWvQE8w0Coan3JkqhIYu9ABk8VyrAmIZK/5bTOlgISShRfcVDkhnDZ/kHh/Vl6bLziMCTr0LFyT7jP382tg8yhyZ5iWqu2VV0/n6wpv5s8HTnQGK82qsJV9Ecb7dLG6Jb3e1GdXHHhYkY2IHpCTclSfgv5EFR/Cbk6d4cf+UF3L+TkCrToNnfDywpx7XdesgLPO5PAyLsa4qShyIkXi5E0jg0HEMp3Yyg84wrvkaCL2yO05ZkDn++WzcVt+XJAWUnJczLhncmc5ynFK5Bi9jC672a+rxSTpWDYDEl/vJHyWL+PIUHbhA3KMTGx9JZWVdm4Sd2dZ/KqQf6My+ZfA2K6W81+Bhr9a6G9Bw22RH6AhRuMkglIwitAkAhMY8nVyJ33rjmN7FY/M3i0+2V7m2yDePvL6bheCyb1yh4b/pH6h/IDu6IuM9zUQ7C22g72phaO982dDjRsqo/G9zztF3m1G6d7VDSEb9vsFNETfbMNRtNcpdzo+6D0iHO4r0sSeK6KR97Ra+J4uTvdps11DE9mXxsK9833bu6tDfFzBrlnxbol6kxv/ec2Rq3awUdjfoWGSRtlCCd2FyCcu9+UdgKwVtJvJH2DhjgqB/wQW7qgQ+E9g4Y4KgS9goWBC2k+wMJ/PPLP+CAs/tgH/CSzcUSHwn8DCHRUCfwkW7imo9etpY+D7uPHRG3uPP95LDWlrqtv8gFqXys2gZ6IqUI1T9TK2baK6NTjLPqW6Lh9qcJUBMsDkc5y3BNZoLlw9/O4BUsJghKtg+9CRLGN0INXwLCYaxNILOefBYbpdPFJ7HnrOyAEubVjwdZYg4lxp2yP8kedOtYqrNuGre4QwjLu9XvX9LB3ltDp/9g4DP08c/VzRyZ+iEK98ezYdp8pPNgheblBsFoQGvT9owB8bjX8lvHNoCfhm3UXe8CPukoKQANqUA9yS9YlnsxnOgmg9tFg22XIkSR4HqzOLtzhvPpO4Io99Lk8SuRAcKE+K8aQin/W4+w0EcgZa8UtYDYRO3pOLWk234V7DIPZiJE4snlA736P6kOGXe/23jfPR+/OI20L+son+D5b72VD/taV+b64JBKMQhMRoDMWR7QXFv+RsSd+kbii856zhcG+r2Ewt/jam2dtQb+E0/CG7lmw290tzvQXLmy3f0+7InvdOoH+iyM5Yn2G77dxnfZI9Q74F9lsYv620GXbkTTBH/8pcI59ULcQ7obD5AOotyLMZ8PSD0I7Y7Tb5Jrgn4H3KJ3z3jWwB/xarI9ke8yfvqaI9tk93OprNBdDwnpT/8/ZQgdjngOnvQj2y9/Dvq2NTqfFlC9i0WfCf89Ceo5k7QchnHtpzg2tRxOvR/Jbc29shJVuk9+zvbrq+j7wCXD4Zu+2S9/xzy24W9yMw34Ls6fzZwcjhe7Q/+gj93MzW5ZMxYW9iBH5rgXyPqf4+/5679T58I38S4u3c13tKHdMccz2/0+zmArw38t83/nB/f+X2gH91f3/l9oB/dX9/5faAXw0SfTVHVK1BberSxYn561OvRaR59YAGZWfHqOksImjVQScErYqivwZjXl9DHb4aPW9yR5HHl4JV2EMVF1eTsR7ktWWqzbRkgJ4axuyS4q2BmrkdyYHu2tbsRcI/omxGTvFVGqZ5vfuEfBUU9CUimVN4Lsc8A2WJ5xDAIgmN1lO2JCZZHsWuVVG1p5/PdLpl3W1ebufuwRmrYQiOHkxgt8LIRTRfRwxVH49EoAHJzl63cTBf8OuhEwcjP6MsdPePF/QO3k83SpfCm98Rue6RfULRCSM0RlBOIEucKtb2LSAMsr6IYqPOn+py5AtX7cZyeKE83pU4Cobn2ThTN8gJF8matKmkekGkN7PfavfibMYMENFBwbFSPz4qhIjOOe4iOKlQbjDU18v5dS6QFis732ag9BAUZ+QhJfSZs4WcQq/9fTEB8U4VqkRjT8TGEL1saKlcvXg8QpV6TE9EVSFSsuaF80gX+cBeb02ONpsLQNfbYoys6QHG5RQXVS4yom/jQo1caoNh7mV55J6dJY16GmOr3Yb9BTteRPJyQs4Mk8J4+WTaS9FoOnDPL54ddV2Jlc5QmTFysrzoEcfQmQi8bQvNqTlo140yTrkrZZGdj8ZrdDlfYtnr0x4Bl7+VAhepQ/VcE8GTWLRh9TCfjpBTs3I/1oVWmzmIu5QdHTT0Jp0xCuxfF/bWZQER+oDGrom6fVdExbsGQ3S4ys8LfY0/CXLfWOAX/RbZRyT/vRbh4L76cjHahehHBbMdU99RI7Kapmt/kgEGLxwJ64Z3NkIMoM2QUcJkRaDg3ivY3xw6Yi/AgJEqd4eV6gHeZkUkgyIW3KCAQdDb4s4+pSyH6Gn9ZLxA6+TTVUmXUO+ZG74jnKI84IDdoNL15V3B+L49wRNoTRQyJ3T/pJ/wdIvrjGxn/1B0qrfhn+x0Hk6O8eLnVEKr9h4yORCrzHGOMjTus1TOEVpbPLESbVsZNVBt9AtyHzUjy30uiflVQsR85E8sk1juOTvcnq4GkHQvtnh7Jcj0FeoyrtxtIlTTQ04bfdrEtN+ko5J6C6GrN/KE2fRteBjK4T4c+VUX7BU4REm3nB9iBR+p4TVaKLu2DY4WzwleKvB0m081BqaD+9ACno2VWrdznxl0brhDwqu5PoG6puuEX0nOcccUn5yDNRjXOHnmzv3CUxOJhRSnLqfBGu6icWJi5xwcnwI2Xlmv4dJjA5wyUnQbkRiuxmGalhi/zH3NU+5yYy6176yXsBmu0FzcENTSqaWszam8N0lrcQSOJKcTYEbnhoMfZGbrNVX004Emohw3R8g5ZLdHaj0mlwziNI9U6ewXKn9jX5USY9BLpNHkcTSB6RAL4sBfHqhV2myC3prG9K01rX0W8mTKlzRjZWjucD+e4aLW/DTvRs6akBaX6Hz7DgI2fdRd7posk6YJVMMzTKGfXeRUgujE3K1GPVqHBXfbukifnMMNz/Z4jbrhSheTAnMQCTQnb4Zg00Eu/Eq7z8Y5PGayZOwqsgePFASfEIekbznw77Bs/VWY9ncC/H93rb8LHX8K81F4g43Y9vcmSBzDcRyh8K9wI07vKBFB3vwr6HvAGt6hYwztQfH2a0S/FXLjXa6Rhr7EjVi8E7Xg8B5eJ/De74G8oSOM7YAuJvbWC/TdKLJ3UMDvtmViX5v4VQ/Hdj0hsld0dvrBZOeS2UfV431LSu5XGOE7Kt3VGt9cMhS1z4VvWBF/8yonb0pB7F2Jyuh37oLcoS3yoQZJ/WmYX+8lg+K7UK+sck18maMnG7h/DPPX/4kwf4u+l+9hPvxbmG95/l+uAH0d6jvyH0J94L2xYg//ExUgSOPlz1D/8fsKkOCVf7EK9EW4D/yBXezU2RbO+eLh9ZogRsoXVqccjuvyyKLuJ9HPVES+VCdGcyTipjGAJ0fxwTpkjFqwfr3GMesvaAEGsLYKLJXLEnK8sPCRzrxJckEN1uU1W4NDoObw6VncRuDSsiE7IiB1EqflySin8ItwX3idruM1hTqxX8P8GQgiglxPUQ0GBvArgpGfw/0LdU/xhLTz8HHuOfjmRlEQ38crgN9+NVf8c7j/jYnM5E74jVPO4OsOW0YALE/roRj6ZPiJeGEfw5DQLxAOiVh8Sbq2doM/G/whmwPU1/NdSMinOI1HEXnJG0cLcqDAtaYhZVh6PC70ulqSRhKKszRit8UCB83mkXUM/IdSEBXOgmzZdHNs/51SvVh3UVjbZd7uhBu/+8X9/W+fVIf/6x8W8TN7x7+zwHe2jq/f8SOhIkySBEHAJE2iGIbROxP9ZpQhFIIJmMZR8kttk2w3qVtQnGJ7yL3b53cmdovxobdAyU5OH+7W9i0P8rW2CbQPcRDvCc3obflC+K1z/u6Lg99n2EXVs53bY0+6om8tlC3wh39lluM9abudN0vfqWBoj+s3Q71PoLxV1HfjDu1WHn0L+9LUXobHkbfI3ZthbHvPh1rvTiz2VpELk3dyIPsrhfmfxON0Kw1JBtPWCfNqW48Olnf8OazX9rDe4Y/5hr4/wnVu1q4WMr/8RhhcpG6j36wM++a/qvz5uDLWJ8chd0uGCFEKIBLO92Czab/t1L7v/Lbvm3XdZy8+xeOY6UNu15yBHzZWrKbZzCTl36i+5kSKRLr0L7MTXpLvzIk7caJqs/a5OjrbLRw/WcdOP9zCtvNzHzP/vO+38jjwp7z1iisRknEKXu0gaHfSMOIzZ4iQZQ5D/rBkYB6fkXEi+PG4GY/ZvkXo4X4aVnGQi8cchQoUh8thdnTXMgvy+EhE+CHCXTY6TuexI3wDgny0c+1+RFvddV56W15pIxU1eWEVM3KVRoUQPLWLs1v0J7HjUNE/6tlgn16ipcnWzAPhOaYN+SEMTeTdlB7VzEh4jcpTy8NGejU4QfTVqIJg3pzNzer5ZXK48WgLE72cnZ7KBKjtq30pOhl5RmlLi3ZkYuyAhEuCCCCm95px6qG7Ea2129ksgtKVelJWevP610y+SPYEwJxG0DBELL0atWabXl3zeTNEdvVSG2wJymWs6nymH7e5BMM1XPTUHhQ+RCkdRCT2fAVuZJQOr6osomTtHjnc364LpkBId6Hd8iUsXoONpeZZ5s30ap2oZqe8NBCuX/KnRE0+AtjXeHpJRxQPo0E2C/igB4VQ0SicNFaNmafobHLO1WEEHaX1bOSpGnM70544sAXJ7rB9lPNx4dRzEeR1P5g+EWz/TQYDH+I2PMlQePSTDYL0XdO6SVv1ImtyKYLxFyVrYzbAWuDizojuvXowvBSIrBlQdsg0VsKLmFptY3NgF9NVpbvv0GeVO7ZCfTFDf8JxI7uslXb3gUcwc9a1HvkuDq6CPQdReKiUV3wEb+eIzEdUTMbFH6ynb7plzgSxfMZvQWptsW77WuMU0PLMF0SNOh2X1w/l8X+htfv7SjjwR63dzS0wl+o2G2U3ZiU8r5f5wB4WMXE6/iMC/y0At0fgX7z5lxz3+XJ9EmeJrj31DLQDc+wU4Y7Xq1mcyfgRKgZxTDC4ufi9N3aGnFBM97CiR3yJwSCbBNuHrzY4xWh5DMQnIM85jabCYikhVHskk2JEkLIBf4SD60CcVp30UPTILo+T8WhWFxzMvOjS7GiuCa49CBjA8Wlw1Jk/BY2unfVBTvlKyh4+u54RbwNOp0d9ljl8Cs+P2j0s/PWsJ9SLPvJHq6GeagW8XJ8RG4gbSy+pwuPsJrBrFfMZwZsLOXcxKyyNkNIYJrXgNRnA/jZ7h6Dz+suhuL9eGRDz/H0Ccc4aUe42XRSwhat0PZixL1CMXvqPHMfOmlaDBHVqF/aBOoNTzScNux1DW7qvQCcl93kLVjNMlaUX7otL/ujF5XltUIZNFPIJjsyhdNFDforC08xdY2Ok4zWmBBaGqg0st3pAsmd6ZJsGQfNOsYVGItDB9aX7rW9qnsQlydEnH72sL3dBtCYVUqqVwRV25NclG4A7Q2tWdnBGh6lYaDGOKijWzya4POzAm5fbqg5e6emEyrgGrtmpGB3989nT2ujxpGfwBSiKe0xPOT+CBIsn9yyTn5uhZiElTFfj9pJVIaRnqnrpuhLfXixO48txbM3tq3HMs5a0AOpGSRcPVFX3bBOQr9W6BAe3BE9oz73M4FPhM9Xy7np3tOTlXE5N7HoF0yLwrVYm8YIBeHGfo57rKF/tLAcf4Fy9ck3Ks95DubPMX4djumw7x39cZDs9pcs/PuDRBzQSuR0d6f/v574NX328WejGNvkIZo9t0j2GNPkJov3XFv2EbX+y4A/qvxhEYSiGEwgMoRSOUTBG7Bwd0LYJx1ACxhEc/7KAHtI7d/UWPiNvVTr6jX8yau+nJOgdh9FvBnyC2mEegn6t/wvtaI3C3iQd2B7XRuke7G6ALXrHtXtth9hL8RsS3Avg2R4Qb7vQX0G4vbcS2oNiON47MRHsLeYbvsvw0DusTveSTxLtY7xEttdu4HftB9nZtXdAuZN34LvQUITuzB1blI3jOyUbTP+TSv40sg73AnoKfkI4U7bvF/5EhvzpyVgR9ehKiCD+QILNPvdIFPhdKMrb/G8VmA0PSR5UO4H7rFPnWG4RzSfUC5xt+85qZjU0DESN9VltELZ/v+L2XG/mstM4/xM8ZZ8HfF/QZr8hs+k7k7ZkLixvfuNHPa8MrPG3SXfMDYtaH/yo1ec2d9t2DjUR+llA+Cz/LiFwOk7J1fbOtY14m42QJ5n5xIW1sW13LZsVI9QbgUD8jO29MdgC4BjxbpqdT0r+SfxNfx7wfUH5+A2lct8L6Am/411N8qcj40vf8hm78qpwwo5HhpN5P2eOjl6bk+YbcVFSiCESA9aWQOr2ldAnD49zIjc79DRzu03TULbUs1ewE8snKvNYpVsiK+NSXoNKuiRU8jKbXlHlK3YB7ohuQlXrDn6CXefywsNMdHZiIxyiGLHO57tMmGcwpC+raHWwObnVj/OGwKdI7C+S5T/kv205dh+6wbd3Ntef2alMSQd4+Avkiu97V06Tz7KMyJ1nl/1YmPkpx6PxIcNMgSlPypDctzjWA3BSbRdm0SrNSFJ/inz6qrh3S3e29eKZWPLtc63ErHZpYOV0YbEjqIC2/rwx1ZFBVnOLRvLq0Nxu3LOrUuFEJ5FSz5XVHUo6y7sqFCUm5fQ2cA7xqSRTmhxk1rgwtOquDf3Xg2PH/jBr1j43JnZdXqcf5JK7fXuVcTr8Q1W5nyPiv3zU9zD4tyN+DH0JnCJhEqe3FwKHthd4M6Y0iZMUDCHEnpWE6C/jXwrZzU6a7cHvrpMevtOP2V413kJLmtz7f2BsN1kk8k/q63L2rqBJ73wDKbGvtMXQm/XF4j1HiOHv46L3/Bq0W8TkLViwx8joP1PqV/Fv+KYleiuqbeYRRveBt13t4KPsHu+5yi1G3mwm+p4f2wz3FlTvydB0z6bulArxbnuTNzfnrucZ7eV2+k2KRP6pioBw2WM56PTdeEa39D67T4ln0EGjOWW0Vgj7A9X1hj55VvpKReA3Q1logYXQrwCZ609Gxw9u6L1xyFvl46wB5vobBdBmKFUL3i/xI0x1q996y8+VvPwY+35sA34X+0r/ztUAv7+cP7uar6b/gZ/H/79N/yNH86RKo14k+ECiKugaj9S7QwzVZQgHXqGF7ZSZfoUakB1eHULOvXpPrx02q6D9Qoas1QsWmcH4ckVHEKd64/5iT8q1T3u3f2Hykql3VYx9+nUFmis5cTX5CE8RNNd3iXchUwM36G3p1cIWgw2uFBfwWXsx74qtSV3k2IaN55h2sDk/JYHVrSYnVrm0K08j+TAuVnt5YODEklyqZSI3xRvY64NnxN70Z1KASnEXmBWZ0tB2TyfIALIlqnumAusxp0LFcshOI0pu8Oq8WTCp19T2emn1sfUa26hvdPeokOvU2cakzszEPGPglYXSsHrDgy3MDHNyR0NsaOHvGjnbTUgtT7tZFbuHtsMXLL7faDDkjjLatfHpVBodBgTdg/IPNxa8VnQKzyjYhhI4rtlg4njtpdDLjl5wLlnE7J9GDFOf8VUo68sDItb+5g53YGWbm7ZB6tNLqK0zw639Q7cjp2/RhR+OLIlD+uOOLFWFIkqe3bV7dvCqwdBtkIMRVdcBK6aRSYeZ0wF2eJJrYWc4D35fMjQ2P+IZJRqaNJ5RdrNlG3+QBMKr1FHUXPeqptfEv2whPHQPeeOlN9HAYl2DzsbVQzxMofHUtkymy9lD0+fFs2/mOuLq0YQux+QhRcecMnUWBHjvcfaq1aqnC75Ar6fujvHMH2zPOo+Kyl/i7AFN0UMjrRd86AQWYTjfcB7yo+3985wLQG3+QGX9pYj6v/KPwKeDxE/UQ2mP4QnK28Km7aBcX5R8c2IH+yqZ9jHQz5cXgBsx+qn46RUEk5YZ1nZ55csLtau8y8yrXWen/gjr10UafdStTjFHC4UUUd0UBceT48FAgpdLdm7o5LScQl2/a+btzlzYFYMSyiVK0y6zl02n2Q1MufNAhCGzcDh1cI9s8LpORABcDT+Lr+iLRIdXNnYIfE8mbr6OMDxfwkqvMeiG8WpBgxgi3FUhuL6sHkuQgm6s42MMLCBfhGYujiBF4RJ5nzppuYYHYm7qBIJ5eH3J3FweApHo45W63Bcn97V7Dd2pS3uC9IRDgYR64ofLjbhV2TOqitpqybuvwnipJJnOqhDZ01E+lCKcikG04Q2qDQk7C0biAqVXgt9iP0xBTKNsILiI+WXmkJsqplgOzZTkW8GLNQavkJK6co8tcpa9HmMrYTP7D9OV780hyAE+kWcI0X0ZP4fM5jGe+uFcDqiy4u2IBER/HoXORgVF4P1Or6BkvfeGkoZMfDk+nteXBoC2e8nT43wlxCorwlvLBn09l3TSnmoOx5Lz6L86GwRj5Wj0ehSCmm2b4lRn7bhyybIAAoEwlsF2dx90k4yGLmPZMe2kcenpbk9jXpjPckzBzairJHkILFauB+JUQ100XAfySgO2SVOGvvAix/LO8+KMDxMaLOpyLigNb0xcuK0xZmDJcqpLw+X7ZXAh5mGPpZ+v52QagCNq+MpBMuMRh/VFTRuxaC4HSfShxJPUvuYEAb7f8r/eSPgboEH+LeD0Z0f9ETghXwEnAsJxkiChXbcNw0gapQgaR2EYwbdf8C8n+jBsr5ZuiAJ6S7xC9N5HB0E7fArTHf2Eb9X0j147KvoSOG2Aa8/lE3tef4c87468DXxtG9EPYXJyL0TsFYn37DxK7cFpFv8T+1U9d8//J3sr4H7SNwsVQe6wDHmXmFF8j3KhNy8Vlu7DeyS1y0Rt4GwXocPfsrnYPu+XvjmqthPjb3XdDXTtpObQvwec6n7FF17QlO4QCuoSfaFf+z8BnOT/XwGnr2mTfgGceB19IQ0IroPAb65nCsJIaFHRuSY0JSZe+HBWZ7zdUPUFcK/7s82iqfDZqHMLu11b4Qli3UM/qEmTu2MCPpnLEkiUWUrBAYzbLFeF8YUz9sFBTzkgVrZP8HVHKm6domGBNw1ebEF96a/gI92iiVanDphRLijKQgN+GjBIaLuncqMP7IVmR+D6YkaNI7iD0VNPNj7Z+kVuqEsU0sS0PEyeOj+gm1rUgZHEzgntsiZImyTFpoqUIVZPgEdK3qzrqHhZepIQxS7Y0zrduCuGdZmFi00iPGxQFaoTy2HD1GBemzBdGfppHIHoch0BY7zkGW0VPCyoBg9qyChMybniwpOET+Z671LlMMIuleTRGN5I7dblkxP0tDM95aazYaA5GR6IGqyHSMlJCOAjQUjVGGuueTMTv9BeMoqn6+rKtzw7PddHSD6PQzyssaOIDwI+AZS/dgnfD/jclTHG25oR1+YQl/o62I/AH+fhjLBElz9XT/HAxrbTAhFaeQ6W8ZJ1fQXMuHWRH3RvoxgrR3KlPQ+35mY9L94zoU0ul5SXmCrp+WaA0XLqoccsWLpHBiCSPmFvsIDWOYUiiXpjPdZLPNShd/YUeM2XKlJLUSKlR2YuIHYBab1xzoR9T5wSPbiid8bG1h0h4LZyfR6TificrXiCjVhv62fhF+K1WfDupiYX5wSHI8XFR7/LDq53EgXDgFyF0ZeC1m/Ac/ovAafxcDhVpZ45eHtCQKW7966nzHGKmP8COKnBHaBOAXq4kyOHiU8s5u7z4QZLLsf1oH98ng8qPUNGfmDBI4ScK52stEXl9WxmUARnbUhxgFcRylQiY9fB6hpr8d27ruFI9RSR+5rmHuNc6VqnA5+KCd5C+OqAp/dWZFFRuMBZXjrASvOIIca8cDkqoC/gdDo7d+WgVJOoxpSFJs+F716uZlt9lzwJu0EcbFhWQaE1aWJKBrgrpY1N4oXpO47sKHJOhCdXaXtlAndg8/KaBqkLrRgfXspVtrdPO+MlywwqLRnOx1cE3OcAZUn+nKTFYj5Dr1AQMT+ot5sGKRZtqwzKh5fB582X8zwT6iTCrGtPpF+cseCkNCxgEZgirrQMxecX9mBz4XAd5elUIzkbRQH3ILcYTVxf9xkyW8vHH+0G0wp1CzYu4/XB4xZghbJ1HxaBzO8dVeGmLnU3v8CuMp88wxuCcsFLOZwsn44isj1i/oi7HE6Iz2bKxnMz3ACoasQp0Hn3fGKtvsj8Oh5GZL6VTDGS89m90tBzFpMKosCdGDWRDYdMOz3qWIJlBJ4DcGYqL55sku75Ukw8JginVvJHpzopZ6ul2rkVd0rVG9KFKn/FH7ImMe0o1IjYV/exFIBy7SSOXQjap72mKOBsvA75JbLkq16cXVPNeThqBfx1KtIL5GtVKQZPvIvKmJdfbqm2wKInh5mb86t94B84LrCxfmQeGa0yhe1gatIdeLfIb9y/AZzQfws4/dlRfwRO6JfACcY26ISi0IaSSGgDSzQMUSgJkbue5dcZJzjcRcbwaM/JQNh7BCLeQUv85q1G0X3EbG9pCPcEDvJ1xgl9C+ci2J44h8hd6SSJ3tJr9D6RtgGcnSyT3skNNryTRjuu2UVNiH+m+K9Eb988nxG1Eyps74M/SA2Sd4feW/cyJPY2jL3NDtuhWPqm4gzpfeJjT0PBu15bCO2oaUds0T5rR8J7wj+K97P+Wbqe35sDAvFH4IQs93ixmNKkeC9BzpLzh3S99HO6/m+Dph2lAL+GKdqfgqb9d+A/AU371QB/DTRpU1IxJpvH356BzLK5+8hNkwHk/FwyjJk5qy5pS3PqfCddqLi4HEWFqMPkBI3CXMCaQs4HpRaWCDxlcG+ctvO5Vjc+ARLd4jJ9mbPycOivYiLKlsAeBS8qX73SguSNkSp7boj/j7k3a3IUS7ZG3/kV/Xivcc8R89Bm54FJDGKQEJN4Y55BCCQBv/4DMiMrMyuys6r7mN2vOyurgkBbW4rQ2svdly/Hj1fXvDQT7M6meUIEASOCkkEYgOdVBOOSr0Pd/1px/PvaOPC10ZylrgHRccgzv0ln6CD0wmNdt0np18/Tc9/6fSXOzZbrzo7PCki5M1MH9oCqhBLOBt7RcM0claQKFrn1FCirNTUNaubl5tmUiJjDv1g9j2pEE+ltEaAt3Wss27Wd2hUpmlflyNUS/epmqkZIY+bCl3tcT/nuaRjBKehdCNPKOTDJW3jWmGce/xvwhf1b8PW7R/0ZvrBP4QtBaBSHsBWrYAKHaYygaIQmNzEvTCKfxn2b39numbLiAAFtH/8NhvaR2zS9OaRg4WZqtsJNuCIU8Sl8rbEeHG+P3qb30vuARniLuuBobxqD99kA8YaFK6JsE7aTrba5QdGvnFxWqIl2B5lNupZu9r8rxmI7wFL7/N0VMUN0S5KvUSUCb7XIFSjXi9ts7i/TIIm9CyzYdhAFWydytNsFr7Ft+PtqI1f+Gb5m+WmPz2L9vdk6N1W2+f8Bvi7/V8HX5XfwZS2xZLSBPGaPysD0yGU1aVSvPkq+XcnAR1x8uS/nZmbwo+Lj6JAolcUGxLI8gdybi4t0I/sowEw663H8ZAbt+T54Mt7OTdrdS8uD8Vve2OfuZtbsKEXF5n5FFVpQHGpgOr1M6db/p/B1ZSw9fMRnWtH7s4OcZ/g8OD2lXOLyz/DVrvBVMSXb20cFAjjNfKMKfok5qSu9Ln9DoBvmnimXTq6mnayDmB8GaDgME80uFnxjq2G0LD+cGU5j9AkYwr68MU+R9Ds5uDtdC54WzNer9EhY95HG1RtyxHDrLMPwtJxPbysOwSYq7N5zC+zvtC/YHPOhZhCRLwBj/I/dFjsW/QRav7v3A6r+fN8PiIVgJEkT9Mq0UBKD8RWyYBrGcAQnKRyCSIJAYYT8dKAJtbt9pztzwb60nUb7AO690LcV04ItDxTsJbyU+hyxqI2NrXfBOzdayc3KuWBqQ5b17+BLA8BuDRXs/QzrM6woiUUryvwCsehd3wrvpUOS2B4MwduwcgLbVtl8qIiNc20CCmyXr+56ipVnrc8dxhvWUtSGditIUsjKsPadBTsFWy/+vmPV3BBrJr4hlheDE1L3JekgoNvYmX8xLuSfMlXbNFuG/jlTxVul8DFwauvWlB0Xv3/xKbxM4sL4Hw0FQr1ZNrIS8KFzMBf5S1cB/81SfGsu/apeZb9IHL5Yin+7pvHQBPzQXFrphmZ+bWnbextyJ2zqL5aMvBBqbPWh+786ts5uKgXgq0xB0r6qcv9O++eU3B5AiC4vJbPbDhMqpDmoTNr4TV/N7+Ik3WzRNKgXH7CDONnz/UQd2+MsxycQxU+3xuraggaq5pl1b6RIh94aiNAsec+J08qjB/o4JQ5BSonVyVT5yLCAQUEQ1vlRbZ8Ps9DDw7w0gCP19pvrHEpr9DUKJhVD8gJDns7MbTEfvi0EQa3Oin2qM525qBOYO6aPLAw4JoiIHkzA6bKXWPa6QT45IWGl9dVfc+JF5i12VsSRaS2zfcmopN78V2IRRm+9vSsKvpvEeEcuHwHcwaneFM6/RHh6xmqiwM8ToZfi43n004jqVMvFaucWUKFyu5LRVadyagBhNTNEHSzlEhgbEL0qtjzYppHf3gRTXzKVBg8ORJHGnclhSmh055KRWnQwweXlPmg1GcTRmOKLJ6o3gIfGE8q9iPAxLdWADhPMdxc/9HoPHxGjikush59OcX1W/fX0ntzDjX9wZzY5uVgoMfMLKHFDecRPusOxfO4qn9RB+D09HscXjunV4oYjAx6n+XJEhub5GgmVpEyJzQzV0/iS4GtAD9gAqyZY8qTcsHIrEXgtw88edydiFwNPuOFlV8OUhyrVreIOn9rXLL9C5ZU1Zl3HBFDIxUC23ADG7zv2fkfGpBimHrTWg2nm89kX74kZGI9Xad9EqPaPrtJRPAPyT8au30t7BgziAhVhjAsFLU1Jcq+Rlrq3cTvGNEl59/qYmLnT2Nz3Y+S+79YAfjdo9kffCEkotQXGef5wv7xlD3s7gD8fISY+pL9u6WQs/6rCZfEcTcNSD2Td4YPBXHlISA5dCajoY9THfv2tRhH8TtYeXJznJZq7KK/HHsPOlh2eH29yzKzL61wrtP9C88hGxuFJgevbDcCJmbIk5DhKDM3DY7TInvClIM3CQjDtWitdsFg/URoUGTZSWRz+VHvRKAppjo7PMa0BuG91NKGRRoYYfoBCMDPQsmNvfBEd7NfT7oZ74ketm+s9rnvSogzsOQYDVqEVdI007BUPWoge+RzCrwR0jM3XNTrykUTPrPwmG1AXroPcxpb9wtjjUellU+/exOPaYiD5cjHVAc5jMCaKGnr8siAnlHiK42Hib92YyU5RX4ZWZbwIIy86odlnpXAY5n1nnWdytZvJo9ISmCmq9W8YfCRjb+Z5/+I88aMadu8MtLUgsRtt6gnSy5WDfemZlWPkSkFsqVWPFmuKCwFBvGFi6YverHTn+KBMudb2sCY+TjKVZ34dkkdwuNZC0xvE1a264HbwcAccWdmvwqnPAF6z5dtAMB3NL6RYJq/yLB3h8ZBppmapYpPLD94gM2Uxr+wzL0vnGCGHcXilQpIb5VkGQCcjTQGc5uyksMqtCzRHfXKB8qRviwrzzuHeK888m6vaEl2Qi0GHrPnrKaTHRzFz4gzcCnGFb25WG8vyqLJM82NrmtTx8DQKkjS64aDT5bofaZZT1eOgJyNAKyll8KuO3eHQA2wWPIHvEH7n7Rti/iYnEqYxaeMk/ocT1MVXWejv2dFfe9T3POlXj/iBMUEEDEEISeI4gVFrSEevET5B02vgt8ICvn4BkRD0+RgYeBNc4ukWHUX7nJbNpWPlHemWSSKTrVS2jfeNt9pdgnzKmAJ06wIKoX3gG7bVAZFdw5mgmxx0G9SCbBmkdM8spXuPULqro9B/MQIO3ZNiayCH7x0+5D5rmN6HvK0LQcSurqK2kJGE9ig0+ufK3BJyuzkNtx4hbI9L4WS7uMWuyFb8W0M+BPvbtT2Llh/legDOvJFYi3nzC30lIJ8xpj/X9v4lY1I2ffdXxiQdd8Z0BBLJrMP1xPA51r250/2bPPNLdPU1zrPfK1Nafozzsn0Y27+q7f2l3QDfb+d3u/k7oqg7d4k64X1aaQW7vnM4f2zvy7AG07FFdOBTwxjpMRRut8IL9joOyrAwcC9OdSHCkXh8QgexFVh9fpDPwA+wx014N+18ZZPheMLvMqTmyPkeyrL6ugLDWTwjp+lovsDeRzgoRvFeWt7ByuKE8yWi8gsiQCyNcK+4P+r0jC0m5UC4y1g4TgXdHTCQhQBlerSiDEYJ8oFy1jOx3TYPb8dCJ2Tv6lA1YrZc3Bzc3D7mL02RntNt/QmYFBpXwCDdUpxl4OP0mvnHcbhzfRkd3oo0YbPoaCZON4vK4ch6OpVoi/cF03ZUlpxAVdUFIy2ACFqf8l2aZ1CiOPy6KAlN3cfUfOCHQ31/wJX3vHFoaqfPTIKaE1xbbUkdjiP/xutcvpeAo7nM+OSSKwpLSh+x3BE1C4X03osigJ1y4prcTpfcYqi5Yni9sp1K7bCTmdTkcBzUBTg9/QIpHqHryhfF7vrsMkospImRnF7Bu2aevLtsJU97Qln9gaSOHYqMzAhrwN3J9zt7AKwn/1qDZumB9LXXvcgF5uamvr7eWEO4HAprSjHprYynVSUcrk1rSW3FOmlYq5VrY7AIDBPi3JzYTYnD+1iPuStSiM0KKnJ6P2rzFvA5JS/WDfJNtvBHl/GmS+bNkNZJ2SnQbwMAg/XrRCsn1j9TbUM//AMoUzZRB/b9qr+9fsoDHRquPnSTHwbZwXEam7ZTLjOTxrh64YH0x9reD0JgxLsQ+Bol8Wl0RSU8YH0q0ZUHipmXb/U+4N+dHfdFFBXoQE1N3NG93HV8aFQ9JB+5c1fFIRBfcTq+Ksk6tv3KB+RnQGrPAidQjYcHDmUMAkwjxjaB4E7V1lu4R8a55g2pd9sluoYvVip6ljZ9NbpLcleKeD8+qNY8LJ7NcMJhMiQmPA3T9QI4bOQL+WOS6EgLnAcSeSVUS4jJYeRQHa/GSwRz6/SiYtGiI/+BXS5JvvhSdVYeWbPIOBARQw+7rZwoQqN5aDEt/HRgTSyeZEM4WPHxfj1ckZiMjsZxfnAkteS6qjD4m0E5z33dAezpOYWMuqoKPkSSgE9ydF1/m58HCaVKmpOUBxOCZD304Ck5mx5rzHjL1IXZggfsskYiwIiUcByg5zEND4KHchR3rR/xmej4+Q7WaHQP+Jd5uoLws6xx1nCP6CCeS3WcyJh7SUEJIKKNnZYMtq+CwTfUU2d1BruOLS/Cp4vF3GS4mx2/VY4gQ6GvcEgC6OGyTfG4vgvx7hrA6x5cPFvxpnNlM4v9kDjYdN5Fa4zYAdcKiEHP3PsaMM/3yEkEpD9mf0aGGRwIg3cZhAMmkxbtxIhEbdYbDB2uyQjbuqudju0p5q2gZIa8n8heBD3pYNrgm016cNafShWq4KuZgKgZ78t8EjhEPj/0ymeUaxGXi636j5FVsJFt5IsOy1HuyaECetpUSoMOTqXrD6rkhRqQlqegWGM4vT6RaOuncVUrDw+k/Ss3z5HwiPMcaeFg+stMajeeyNrgW6uz8T98XjRzNxbD1nkDrbTmH3uDDApRK8eB0J97rf+9FT4Y1s+P/mGQHkGTMIbBFEVC+MqjMIygV1oFQziGoivNQiASJ+BPC3/QzkdQaMs9IeRWlsPDrTq2cpYg2S6Gwe5Chm+TQkjy8zxU/E8o3mqGMLaRpm3c7Z4LWhkWBG/1QwTak0jJ1utM4dvzrH+2gSnor1kVFe9t1OjGmOJwy4IF2DZPN8G3BDhN7nn+aFtoKw7u01bIcMt7RfRGnfBg44P0rq0K9gbvdYW9NeifxG8dMER3G64nfHNOMxntcRexdnIumt6BPhtGVnl//qndendRA9zyR0sMs5YnYU8xf3GC4GyzC1wYD1HzHi1CpLGd+HUMrPUl8V0wkMELkF5qb4Pfc0yLXgq+xkYfKaPLVwexNmyEbw4YHy05wJfElLA+eJuBF+8z8H6+ph27H83QKv+qmfLWFLIPYjnxTC0EYj0mLg0F6ydM4pngY06IsGy0Tc50fnPGvK3cbuVzG5VbbpNoMR7wLbf2YV6B4Pl3Td2/nU4HfCez0kW+rsW6mYjm4vLdbCuKQ2X0+Whcw4g3KNfBUA85zeWlBbn5ieouPRjAOKOjuZ6ww9gsM33z7FbuEAw32q5HuEOT5Mpdj0esODnLdaDlFUEZvPeuZVXfos6lNYAr2LGddWLUwkA1LrGqz8tJZyyqmgymanJH4BL8aR87DhHmM3gLdf5R5L3AsQQacOcnINPOe2lgMzD5Z+c9OOgqT+/udIReihPXLKV4DyU/vtWHDnNW8WqzXq6K6HkZRv4pk/cGsNSxuJ9ry21MMlVKooOKhMfd530qoeD5fjKQ+6IkCzsNMOHFImhyt/mUShPtLlqayTnA4fTrzoNg65yLBUXuqjTdxHuan60IFcVbB1X80b712ntGDRvLKle8vI+D22P67XSv+BRIziHMStNdwK4UFIstO1ArES2Z/piQRiOuMfZsrXBFUfoohE4bXZ3m+VB6Xy9ZNkFvCyB3Sfm+n8TwVb/JnpBy3A4nqae19GxDT9c/kLhMSh6csLf43vJsurzDzlfJhcooeHAtgOsOsGPdkTrC/UbulNqL5qbb2kkvRE2itkqSXqg8i7mFR2WoHTg68Ikjy5xfSQoHV4DiPhvZbcJghCHLfXpJJdL9lOIVG8vlEuJq7B0RkOhz22HBASLM8Njhpa81OOuRnIED+bvkJqadauzWnwS0iDU+mOQlRMFTfoRbQznWkBbfDweLHZF4yYOnRHkfTAyTWUDcQjTzl7KqTyVY3ye3gCNbSM6TfcYgVunWZER4l8JPqUg87PEnO/NP7gW+3SxcvtzMXGiNH97G5Sasz5IxPLNbznLcIK6fwiO7wt4aOXSxZL6jpXsBKhqv/4+etz9Q5+m38uvmOdDuWSg6i7qw45dSFCX4JVtpHJipAfPIi7oDtpWMgnrdUGVQmz8wQW38WUX++DraoEzU1+v6HK676rZFbrcHEEgmFPHda715Djm8+g6ZdnfFf7HIHvsCn9m112qRWAe+rC9ZgVNwd0mjyIkdijHk0ejqOOCzl32V1WuHqgARjvH5MUbnUOgOT9NyzPO585mQyeHUr26KNpc5f716a3R7kcB75eAB6cWPdpKnsyWaIiA5s4TBbXIZxbCXiKaIkbOkVe/sCZGthjKE2WbBmHGxlTzo5dKdFGlmmftZT/RMySQCgFhRA81jT/YU/YbX+BimlsSaxV7Sj5X8zsZWWY6zAbKIVyeKrK/BFkNg75XmgkPeRixQM0iEPyu8NMHGvs0+z9coFl5DMJ9aB6H7oCPuJ2jyEu/uycNB9xBdLJ3JN7oQ06q4ADok0kVFikDCf9B2nkez7pfZqX0JVk8LTUw55g10uReSF5U650dU6rNC9mNqebWHuYKB7DxVF9xqsGl6vXrIODWGf6JqME/9iVhPnjolkxLKIne8Xgnu9cQXKXxm5hqAl+vpe3gBaRAV9Fu6WWmjQAwRsE5TtffSD+fXKVLx6l27JW00rzcu31E5cxWlosprcBvrJ7poBAro75RWxuaWX62De9X45onEbVBWXlkaMCzrIS0fwlA4BlBrFPejGB0sRD1wXYRGhh/MObByzGvg4euv9iJJZdRmhKtNb7U6arDChOwyHFCx4u8vqFlGA1yjjpAoLjCiMsK9UWzzDaAVs8bJb4cmVOOsx4mAzexxyrz1kzTFE0PAoo2/r8ngzO/aOYMFUoGnm1UnjxI+lSr015N/SfOTN4+4tTQm2jPOH8E/rCTK267usmITaBRNMSbxRkO/Pup8kn/ir/8Ly32Q2U+W+oHPojiNwhRBEBSFwvRKh1dWDGGfWv/S0Sai35rEyS1dF4Wb0iwgN3E9vfvrhMSWN4x3zVfw+Rg+KtiEbptV+i7zD6ItIxftPmskvrHJYB/ul+4JvSjd/ODWb1HJP6noFwR2u5vYzN4hdFOuBfQmndsMiOJNZILjGz9dn2PdfLSz7PXp030a9XoztHPedYVNKbf70q1EOKK2P/FuL0SQvyOw/G7h1s4fBPakpV51y6bBNVAX+Twd2P48hk+xvjPW4Sbt5LvwV3ceVr1aQq1x2ocII/JtGPbFfL5dWRvwXb0LG3oIkfjue1pmrWAdeObWbP6N7a4njvXHgj/Y/UiA9pXJGjyzW7KtpPWPyuvy4zVNjH4isrUBaKb2Fr4O9hPe9zp0doeizBZGRbvab/lrVVaYptrynCqQlJWfmvUNyZ8hMr0AH6nraGa1lahvp1ulme+3+K3JXP9jwQ/ufWVGWYim9c1nt4ot8GnJ9rKXbNm9ZHsRmAp6koQbnMg7HMLW1YLYIXmDSfIULwuQIjoWqJautkcYxodsqqD7S/W7m/xAZf/u6s5jiR8ryfIfhwr21btTiZ2vQacYcnXJMQCqE6EJ942HWTl29QDPEgtHGvI6EYPTlBrVPwy1H2D+kHp9dD6MyySQtYYbWh5aMsT0QEwarzMjDKGB+Kr88q2muQ2v5HwJmTkRJZd3DjzYK0yVw9ER9N/n0mu7R8rdnqfHnc81YLQqOAQ7Pkg7whGLYxiHswqtFOG+otdYOkF/dSFTo1QpvxB8f4Xy2MUtO7iwb7C8LiNgxDSHyTob62C5RCfxJuQdhlSqw3AqLvl3+QLjVnmRvdziFlVEH3FMRfJjXe4L/wI+S4WBIKXnd+KN0cj9mQrrKUWBhzOLnqbuT35xwL+qQH6eCls53LE9UN0C5yg8AefASEX4ZSKv0mrFAXn5z/steSXHYoLOPtnE8cN79gl1ydP27EsP3EPj832ZFvw0hEKpAe9CPgTW6zjm9qtbPDFYzyKHoHASQy96pN14aWCcfNGLqYbQB3YWnvyl74UDU16nSCNiQNRvMvOuRbLhs/QRCteLaaYem71O/XxA6znpb/HZoXpQexQHq0FNsn2kIyXIxIFomZsEEOlYVhjLjJE/cKXQLdmcLqRW6jeWLd1F0NEnq2JcfhFORyKusDIpcpuC2BfSdm4WzoB5eV7AnsxfODo/6oi6B8TsvK6qb/P3gyWy6vmCc3H5DIgEuueQc/dLdH3iW+6hi+1ME1DoBLGwIJNW3d8+/jaH0e8OGvR/4Qj8T5f86Rj8ebkfjkKKpCgIwyAYgnEShiiCxnAYJz47CtejZD37SGS3Q0l3p5RkOzLw/dRIqK3MFVJb4z9B/hP73M30i/owDTaLkxTZD9Volw+hm2ZxPZfWcxWndh02tc2M3VriiE2tGP3Sc4XYDr5kVzRB1HbkbXb68daZFyZb/gbFtnoevKeatgkn8WbwgiabTBLdDQM2ETe1n5LxlqzCd5sCYn84Ef5WBWlt4Vf8LZdzOp9vUr91HIy9mv+sflvYx/dlKOA/OQa3UxD4xTGYffjxrceg923Bzclz/tGPDzCXD7V3tjmUYuu/l48ymr4dgd9fK3/c/rZ74D/Z/rZ74D/Z/rZ74Ff6yq/q8PJ+mTHVVOHT2ZiGES2Y/MS0ZZ1ebSSdrzYEuJ41PN+3CKfY+QEWTxU8so4c2b3Qz4Q0c3g99mM8L3FEqOzIiTJJi/ANO5/fFgRP8xVIX0F9o1TYw7CnRQg38SI/tKznfAlyK1r8Iq/8cTYq5a3sQKAtrbg/WWDJo0gtqqQV8vXmv9U2tf+CAZ/Jw18vPV/e8kVyrw5LZrewK47sFeQ5NrnMOXiyjEwX0X56xC4LcHb6Moj1d1iaoiaURvOdXrdF2vDuHE71iTDQEW9v7KV9yaDI+6Ujqo71Ikvp9fAvLQ+ASqibRMFRue/EswkKOeew3Fz+++EE9z3/l9vo70UPv330L4MF7odggUJwHN5mfRIwisIEBGE0jkP4pxqCeMdAPN7y0gi8wdyKYisVD6Etvb3iT4zsGBdsOgPic9VlsscW6T62ew0HVgyE6K2gv8YF+D4hJN4HeaPkph/H4S0iWSFwhVPoVwi5jQgltlWCXf29AuAKuAGyaSbDXdZJIZuocl2I2BFy3TmRbuLOeJ9VukL9+l0c254P26UDK3Ane7xAQGtI89tgIdqMRetvxqIqcyLPjPoQlkXFLqT8aZbb+ZrkBj6y3Jvv8x/eoIPFNc741WD0coWq7+ZWdxaHOHrsml3UCBlwdfHyr7Fr7WOqNqbx8sr/138vW7r8uM/7WL6/uF77tsXf7RD43RZ/t0Pghy1+DQD+Cv9fwOfKQEUfYKPlduKOJwrVIPtmusLZzaz5fcUOndUU6WU51LjYmqnkVfjh+MIimcyqWkVxzsMd+ewDUnyW3c4+eEOCsCAGvjUieBCTeyk6XPF490U6pN4jA92eoxUm46IzanB+Xo5W/JBWGARQfrg7d70fqGNv3CGajkTPOGYrS32bGHiFnkfkKN3OYHKkVNPNbteTI0bLhTxkBzl+vCRAPGtH6BYueYK2z7iaH44rL32AVCF7fkiYI+Mhcj4wmc6GCbcyW1Zw8JRI6dd4ut8DMAKmq9bTyzsP1ZUqQ+TReKiLzqoUijHBNbDs3vfQlVklXdcMtfbsAuX5Khq7XW7tE73NMBDM9ftCsHcOvOL8vyiFH3opi1isZ5b66lYn0FPEY5IXPWCF9ieG0X+d/wPfAgBNOTmvzpG9oeuebS2lL0yNLnhdHTVjjoZJfN+ON158nOgV+6mGAzVkMCgSOFSGd7VOvpA7IToJ9wMxWqD6YhMGHNqj8XJIuCt5+K4duLLj9NJAzFauriPsSapT3DGg6vWzUAqI/txmOvBChzBnhUCyQe5hvb1fuxBqaY5pb89cr7mLhTOdQFjzQx1ynrMfInC7WPXVMkGIsmT6cmD6Z0M4R3K5zePZgnn78KjJ5vam3xxBMcXLmgS+KrJoku4vQ7lXFgBOUt8UsiaYreTlT9bmebnOlSdOjWyKC2RXJagjMyHK8Fpz5/s3pV/YRtY0jXGup6RbD/slfxSnAsvuBH+4Fz2saFgqpfOD4Hlb/g/5P4f+/TPrb67wL9k99wO7xymExqiV1hMYgkPr2QVBMIZDnzoqrowYRzeZ2Up+V4K8lUXJzf0/pTZHrXA/N2Byh/+tbfLzadV7TmoT0O0zrtZl1iXJeMtVJelGqbeBAun2Z6uu4pvb9paKWg8S4hdnV7h3R21m2+H2AJjaC7HUVrLdXMDiTZuX7nMIyG2w4d5lGm8BAbGz+wDfGzX3ZNp68/ooKNmONSjeFH0h+lt2f9rOrvBbj9MpQUUkqwNMaOeo/zO7D35m91s30b+ix98ah1Z6rH5Hj5Ww0SZgBZnkwwz7iHw78LZRAz+fXcvfOrt+riH/Z2fXH07b69kVfzu7TFvngZ9yb7z2i8mB3yYJnJH6FuCkkjMxEUYFoJ0wkZbFZbCVqbYaCoLV8kEccOoewVXpi3yXOGVY4e6zIVGaB+cVjc/q6ISYUQavsQAGWVSYlqWvmnPCwKpwOEWvyJHjTzTackaTxnEuRHg9HfLD4eXN/Ve1+EeNDNgV4OcxuOocIwv83BsVwyKVHxNp8z5Y5981TgE/dE79OB2A/246AIRwFFekCGKJJ+ICYVYuneDHCEUAOgYwegzOrsAGaoxlFnfi57vRpU/setFSN4cOGIqti7Bv2zdMqu40s1V5022O6j2jFQB681SXLtU9pQ+POHpDWoymJMGysP22OcamnQjj+myyL39D/Ct1bVat//zj3A3jNwza4OuH7/wEen/9UR9A94tH/GAkS8AktOl9KYomYZTCcYpCKHgTrRAITdIoRlIkipIwQiEQ9Sn+wfBGt1eyG8a7Fw+0iTqoYLPKQdNdGkxtdDna56qmn2c31ltWXh1DWzoC2Sf9bRAY7rNW0A1Jt3kB+6S+rQCAbKi0frm1bCK/wL81eEDSzfZ/MwOKtmT9isQ0tGVEtiTK7q64PX7vjFopOxHt/v/EhpRovOHiZpOYbMi9Yjm892yR6Zam2ewfid/qf5cN/8jkA/9sjvXTopprkuGVCuLTSQueK1mM3P7yKV95hz8NcLkKw3dqlfU32c5fYRNlV4R++otw3bBhv3fSFOAqrhdnVg0RvNXM2/vIfPi5wvJ2LUD2719CVId+QqH9+8D3N3yPRCsOfrjLItqe5ZBxnfc/3GW/XQO2i5pI/VQByNUPKcs210941/uzycK4vZTvXl5kAT+9PldjLx94r+8vD9kflNkivfVt/ZD52L4P/HAD9136Y93i72Qum8oF+Ko4Xgo97ZeMyqwH2cCZPpJ1S73rND25RZ69MTDQ4s5V3tFNeCqX94zDrDuTw9EA4qSB7+ChJizXx7V3hENjWlraSoF1CwkCErYwq3xWaQ41o83BlzkvQMYpCgHl3CfWyIDTsRGoQsPZOGoOVpAQ2Tgk9ZLosZtirmjw+qrQtjDNT7sRB4TDJD4w5oaEL2e4Ce8OQLuWeWOIpbAbrCioI9SZx5M0n4Mjc03O7xXtz+r7nkX5yUgGFSvv+iOauTVWafCj1DU3AHlVjJqFd54f37DD1IXSqounZzTtHXQ3PXbhlPQUfHoK3mMWs4S/QLaZqyXUmEVRnW7AS7VEjimxQ5BrvjIhTAi9eve98HR2OKkZFVyOXN7i93dUifPTIczGu79H/3JZY6wRtEYg1JODkglml9/u12aA2Ds/CPQJAZE7ApXLSOm3EU0EhzwZoTovyrl4VYH1OkSFO+mdHwITSj8K2A6vg53dLOQ5w3zO8T04yHR5cbQ3d6yohoXRZ2OYydBdbJE7UHpC1bfkXFMeCNRIx9YnnXIxOz6VFQEdrzlk1VObQjkYrj8QQ82Yjn7WxaVWT0yinkqhCNIX6VeiSt5OgCUcwm54o2JPS/kVOXnUBdKFN3MwC8ufzqYO+vIoD+LkxKR4u52SaGBm5/S6vCi0BMUSkNqOtk9jyT4jZw08ENNKbJ08glRV8inlwId7ops3KrhP9/nE3plvURaivdeP3Rn4tBX589P3p4kCF6+NoAQo6Bt+QnnL06/ZkwXfzHk5riv/EL8dcVSXupdrXMc3BC92p2bpwPDU5Apv4Jfy5GPoJAjZyJl0vdyHG3whPb/QI+xAZBOuXgn/Ol4JVQRIVqFi3ZGhurKbiH88Y+lBC9nbJZDWQQ2/j8/1SAtP92reUDF7qo16C57mm5uhzOa4CtDunsko64fogKLaS1Eeg09gQgKGA6l2qEyobh3PVNmZVmuDlcoK9oR6vkoGL/pmGt4DyHzi1SnN+Oor1h8GTLKW9DIdIMsloGceiwcJpXPsiAcZtPCH7gWyVzxT9dgKeg9L2woQNQ+DrUJTyoWmirIg67tScEuaWIjR3hnqZR9PxgiH9L2HlpKqNYma00Dma52Pkv54BdCGsEozaw6OO7xuYAgN4AvHbsM8UUpI6K/+ZtkRSeuddwmtQs+o4W30LVi1K9L2qtIAxlIeEP/yptuT8NqkcsxBjOa3G/iadHgcj2T4LBy3fyMP58QUdpvHCTpivnDs6iHjhvWzQDQR7OGOpYWJaTIR8azI9q1b5BMnmIvsJrrVvR+4GHeZdZ5P5JWVYzvjIKbFcjEnIkBJreXsYAmUL/gwI8iKzdE0DLn14NHGjm55JDyetftkn48LS6pRT3Nc3XoGVPNgk6RnQMUPbTwe89NryJ+LdOnvtHRX5WLOb4R9TAUX0tvJdQoGqlgCOvvIuUgeETjd3viRPrEBoCrDOAUh8whyieZizWCgpwhVpP2yujU+fjhcaVOlcx35E39r6opXxKjF0z5mQ1qaBBFo7i/oL3M9oR13y41/OSTvv/4hbh4dX+/9/7bo9b+38PWaJP94v9//nXz5xn+3yXiokyyo/2tMHs1w+H+i//cfCATj//jxkf/1j7R7/CP4svySxP94Dsk/uraef2KU/7ft7YO3/uV9/ViQo1EKJTCawrEtZKeIlcgiCISSGEkTOE4QJIF9LlWh9mmDa7z7daAAuQlJqL1xbbsYbd5EKLW7FW3Vu08ZLIztRDLZcsoIsWeZoe0/1rAep7caGR5trJMkN4q7xtUIvc83IH6dfd4idXzjn9vwQmKj1pvx5a6g3rLP0bbnzcGb3Eyd1vA9STaTAhLaWuRW6htiu14G2X0wv/iu7J7jKbQ1tFG/11pfN601/53WWm/gCwq+eqs6M9v/jk79cLLPtdZZiP15pPOPRPQYtl98QVRuj9qf380LUAFhoi3ftbNN36g2zor2e4PZM2wcSEWm2keOg+qZddTAi2ZVb/39VVSyMN1trjJgZaOTfmX/9Cxb9ctv6FkWv00hJHz3kq331PLKG0OpmtbHvj+k0tbJ/vbsf5pp+PlIw11xAgFfEwuwxtuzvgiTZm0J6i2voKGaJe/X9D1p3b0/e7+Av/OGffZ+AX/nDfvs/QL+zhv22fsF/J037DNTBeBXrgpD8h4uT7KALP5w9xUJK1D+2Vy9MHqgfOj47/Cs9mLmA8gJFEKLfXseuaijYjWJBEow6V9PdCxgaHhAtMWKNYZ5LAKoCyKnmLgrdw5aNMshRQXAAose69dYLkIOAaTNaFxDgtqitFjaT5qT4OCuFsX9dcqu8NCHUic9muvpdYWcVoNbrATwezxQglqjx6N6tKXxaj8UNOc8uA1ZknBhPb96epxj8nrokJBBI3Ma3pyA0/VFLURGAzj4UauMJDqng9cPwiWh5aP7yJm2C9o3zolM7V85r4+gIuFs6F7bzQM+G0lH3edXQaIWwI+W7TWE1DYdbZqo6ZkviLj0w01pySK0Dg23nFMWvTN9JzQ5gaFy/lRCffBfEVWddQ94h9qLdtEZpPoc5JrY7J5LsEZX/jsBVTE6nXI6GErcm3Qtl129tu9COPiNkXhkQ2AQAyBO3xPtubuvP0ITD0EXw+1bcH6swc17kIcy9hRKthaZfh0hmJ3I7u045GPUjeUENm3cAG0/3StOliREIOoHWTfVQWOtd+fGZ5Y/XjvXFelZUjRCn9McBelWyBDv7pb8o8KUo0cBsRs+mKcm61x9mp7aQ12MDOkN8W6evMONeSC5yWH4iT6/lNhrYkjNZ9mcK8gD5blX3jWgYzPRMJxXQI0rvaC66JcIGfM4FvFmONMCSgi36YHL6pLYyblwriV9EGA8dlMYyiu9BCKo+tFV4W/qzoFvrgoKhU3HW/le2q6TjgNxNDXcyIghpNt/YapwBXD71CTYcOYNU7yHfnaRE03xiPG58mWX8pm4fPOgVvv02XjcBuxShmbgy1P3Vtn5slhXQHy/EPV4vs53Vs2bkOo7raDlIQhnX35IPsqph2NzXCCla5KEMnCfl9mUPvOok4+kKj6A/OhAMXYRFFh55NVioGFdH+hQ9O5gICi1GrsPMHg2nmxYVdw+RGh9LZUGZZV6l/zzeABYUrcS1T7dXspyoXD2hB17tbPd+ni2A3hFqX40VVt1GGX2XzRB1vzoHfwHnA+ja8BPGWAShzoJAw/aDZ+qyiE1zmPZHw+3o2E4PnzRWfk84jEZyvHJNFI4TGZGP7A30cVPgRS+AQlXK+LhXiHkaAorH7nTdTrBh0gi9Kg8HcGGTBII9l9+jUl1wY8caq2RIKEKpnfP7BoEQpK3bYkqYJiumQxpaNlOkBMmXqG+hcpj836VBn4pmjtzck0xXz9U9rJM1euoXW1JelYAknIp/xAZbBQTwb3eC1Yg4k6tb8OJQU5XnvTPr5QDLwOvaHXudNejajeXklGMLMJIowbkC3F9K0y6zGw6lwM2kfFovM6NqWaG5j7lsuUfLRtfe0G01S5ZqcntOnle6lLMKWzXHeBHQgStwEbRlCcuKGOkR/wJBUYP6b5CRtlzPt+dislJXqD94M5TJZpGgpU/K6gR+OcNaA9nucwHzCmOve2frSq6i0jXoGfH4FUmSwuMttAUHKS/YzSlFdGjG7p0/K628409Jt9xx5WXkiun/eP+X8/L/t9a84Pb/q31fnBoQAkKpSEMwTGUpCECIQmIJGiCQBGMWMnt+kMiIeRTfhvvhZ1NakZsGi96H069ssow3dkgvbHEKNxcpZLNAv1TfkvvSunNbwrd8qAptpWn6HSbvErvNHlrJKQ3T1H4C9NMNget9eboVyaiW3Ep3tK7W2Fq39gmKYM3+k0QW29jtNem4nSny8n2rZVDp8GW/0XIjVgT+6jZmNxqUytdX1cg9iLVJmj77dgazt1mfsV/zPzyXzL9wNKkII8nIps87SJx5J8rVfVnLnyJxr4/spOO5dZl1NBLiPhbwvEVtezKc77wnt1c72snHy/MsB64+hyi+stvL3vd51uy9UtHT7N+P49F+8fJ0rz8BjQr+qo/2+iXgGml9tbLC/xFfya/V3a5XdtMsiC3/LLt73cN/Dvb/n7XwL+z7W3XH7Iz4HPdmWW/eIi7tA4rzGc9Y64rvxFeQV+wt2ysl3N4ak38dW18E+iys9/6EjHmwVSKZJJqaJgEt9fyeBnR9VDfg6EjRU3w7y0Gvk6WwHh5ds05jPI72riFQC6ypyI4jMmFIpeXhJhnm000rnR49vpZfiz/ydYP+NnX76srqTzj9RwdZQ00AnDITO90fZwvOT/q1vbaqwebCQJzk1HgeBH2lZk/+/11DM/WTMneqArt+XOdek88O0UDQY0vV+su/hldHEClTtOiGE9bHRRtCEXSIxX9frniYnFkezmEOGqrkfmEGUD86+5e9WulsYGZ6KNdijYLFM/44g/yNC4N8WS7goVIKoAvrnymHmMSa7yANBaq/TswbF6Z/3UY/s/W/DMM/4X1fiiYQTSJYyRJ0SRCYDRNQCsm0yhGEzCBIV8yDuinzoKbJCDdh16kmyZtRbeU2n2cg61MtUXve7V9vQ6lK5p+isJbEwz+FcbRcFuJQjcvv23hHfqiaDPPoYKt1LWCIZbs8zVWgMV+NQOD/CcG/zMl9ycNtxTDCsoUtZ0NK+ZuTqnwdgOyD73A0e3v9YUk4a49Tj92s+MysnfiwNTWSo5CW8Ii+f0MjH5riMG5bygsjYbHOYfbqOpSxBL9q6WPw+czMOrPZmD8LUgDfsa0D0iz65UG/gVIAz4w7UckluEtvv8JibfG7OVnJAb+3QPkY9fAv7Ptj11vZTDgd3Wwr93eJ5ckbA1732tfcLm7S5uIyhap4QP6SIuV1tSkl/chlJjBOWt9mFmkQGxAkK8vhCEwdcR6/iRfZMUS1PkwLWNXqQGnJh4E+DGvhWar1WlNPoTeflzI5Appcf5OrgK+hvvIBTYuFoUn9TCQt9RWLpjvsNH6juBj58KApNoeofvHNi5m5cGfJok9PRquQsOzT57fJOzE84s/yHOoJlfkhcnIGnwxLl1HqR4tYwNkolWK/fsJ2tGRygJkJaJwwuvhREikMvf5qPRmqUiW0clgXHHQ4ii57THdmfKO7ktVgFJoyONx1Ocz3Vr2+1r3KHxoi67GUu/gYFmmz/l1VklYbsbngEs1FDsJRh9nMepyxY6AgOdfJNRmujdWOF68a/2u59YAOtGle8Dp0ubn0CySVOqVxJSN6h49HIHU1TNlle9nIAK3wLxqak3IAv3il9yaF00T5ucZvvf0acjGwZzoKyydTPooK6gS5+DLMRNf9n3kZd85AnAJ+eY70bVFChxmnUetmXf5XkIayI+gIxoXh1d0gUaq00IZmnTD1uMIAw0bs/37/MZOgC0O1rN/n3W4R4WHuxID3H3UUZGPrQKNkmcnxsOgfOdgYgaEXk5Q3PdE02D1XJyvK9sCwKPCGy/r5Fj2MJz8/q0sONVJudA8GDOu24EiDzJxUrjaso9q1fd6OoDBS1ecbE5u4AVw8QyfmEx8B9OBLyHm/jGN7JNxnd98c76LwoFfjevkotFPsWCOZCpYo+7yrbf3FznqQ6H9MK0T+H5c5y+nbZzm17lGOcEPlLI/t9UYeMcws7re5wA1U/Vj5vgK1WWE2mME+xisoPCcHq8vpHhmlPG6ON4aEtbjrZpV3hkptboesok7U7DBAZmmn40hfgrWocGmwMzP45hLFBSfEOVObb7dSZqL1+tKBfLHpbY0Gn1yz/vJvuEvJ3gSwOib4qObDshJuSiuk2VCGGrv9TBW3Vt8vNSocq5AQ3eOFoKFkXa6syob3JwniliTjbc5cG3tFQDsM66HEXM4+qKRS0WoeO79ivRx5p2mWMG9UH07gW+UyfpM1VD5ooXFtNYtMQJYgZiCIpRI8Zkgzy/IXH88YXRA3cQuFFR+5C/dey78qAholDoB2ZFnTJca5Z3wM9NIKHB/vc/P6e1xBM4i3kwrxJlWy4dZ4dcpmqCqIOhQXj+JIxI3SWoTUx+42gG3qiEXB1M0geleH0qqdf1SyC4mJ6mXxX0HFNRo9yo7DJZDSyzFT0R58tiDb+edJLEVEk/Csz8XzP0OiO7Vl+GQfHDdM1LxZmJmgQRdlcI1FhT7y3qzOjRFObqnM2GBWlKOCQ8m2lPzVyaa0kBsqLK16DPmX/AwhK4PEtOslqVEBNSH5WRF0MUNkxKiQc7JZND1rKKiT6+EKzmponMdYKRjYV5j1ahOgovS9YhEkF0g0bF5rh+cnOwgRYuiSJtLgsdP4Wt8C2+vFsskdd5B4LOAyYDiwM3mVKL9IwOFv67v/K/rUmRt901x9AMnS6J/qGP83z8rOv/iY75pOD+7/weeBsNrmIxsnoYEtdntwDi6OfCQ8Kcipniv7aTEZpJDYRtpCsjdkx7eJ1rsvVVrwBvvY6/pz0tAa+y7+eOge2/xbrezRswYtYkwt+Fhu4PhekNAbxWalUdtxoPR9rTxr0pAYbJVkaBwo1PrunS4/VljaiTaSj0JtouS6K+GOhCxMzlkC9LXbW9NDnuX2RaS01tzGb4TwwTZraTXpejfhsiXjZwl7gc50xjHlMlZomu40unL5fSTJo/TJOFbFQP4qvhxvjNblngm52LXzCNxN1v+Q9STvfUP1uO7WmZJZgWopeBprL3fcLu8Dac62tejPa5cCjb4C2RY0SSVTPThaXN07dFG75vVxGtjQcA30dJW2vhDuLQRtK1igWp/CJd+uPbxMr4bi/3vvQxgex3/ycv4QQX65WWwvsZqP6hAP34C68ElMZDMsEoYnW+P2yCNL2AqEtBUuGmAbyvhwHlFgoL82D5vSDFPNSFBrCNLfXF5hLDVjY/EuHPN7Uh32sMVLzEoAe48kVOKU8nYl7eFzX8puv9MoL9GxcAfYfFVEkxbhoIHmzDz9KBIcfb512th1nf2Z93JH/cCn9z8Y6ic6coaDohMITCjk8Ywdne4JczzyiJgve6AMiwjGetPfHx5pcl9IVVaD08ZJ1949R5eruAzgQmNBqvDsug3+mXVd2pUJ2N4TXNfjz4AJmmk/WWFp/E/23evsqj/Y40tDft/ojWy3L80DcPawEpEvoe/v3j/B/T98d2v0Cf+MKURhdE1JsUoAoNgFIIwcj3xP6967yOhSXwDhWg3ql/juW0YNLmFgwS+xXMUucENvf79C4ex3XOeRjeoTL4Yg1Fbci7cPb2w3fAhoXcBerzr47+MT1zjw1/pNtfnXUExTbYS9vpgNN2br6jNfwHBt3g0RTfsC5BNq4kG2/U02vxZob3fa8W49R5o/zKKNxvXkNgl+cHmfQ/9drTQ0dx0m/O3rKAiXBhorEhRLyDks9qKJvwMebVy1szLW8g+CrcjbzqKbUO1ZBWsdbG+cxab1nBui9OOumJCWAbYFX12dm06K60f9w/EmjX+9jYsGdUW5wOxfrj2sYs/EOvf3AWwbePHXazvR/GnXjP2K5k9M9sRkXXcTmw1/gjEZmOmtgnFcgry5dNF9YxdI/jnDZdaDjkYxvt+F9uFwwiQK7vQ8zraI2gtd1MI1yH5Dbxqvh8z8F7o2VN1qxynBVQUcLqKbddDxpDRZPzyhpDcOeE2Yp8lW61LijpCIBnx7MMHnvKIyU1aBSHbTdZShce7iFOoBD4PAik86aC/Dofo3dkJeB255tEvbmAZlsBpt2Y553egBa8RxbWWd27FY+EmMqVlbws6n5ecGc4EZ/JF7+b9KUD0m6FeHIi8mYE3JI5BaGJxGoDoHh1kuAnn6/rGX+LzIh0Kh+qukfps/FS/x65B1+kQ1hRa9acDAtlEh9zuk6JByDmcXWA6H4c+IOvlDT9PzBqtPryT7Y3YUdMyFT2soaaXC35Lw5c+bzO1vNWHh74GTU9J7c4lfAYe3EyqXVh0aHDGfa1fCPcxH2f9+g4PQhUMiTbY7OJlfQyqREA51hQoLokiZeT7j644AvwgKsREt5PtGusGUb0YMb8zTPs60Af4iMbNKSfFCDx3Io8dg7vNUiu0No8bCQpHNJ0A3nqlND7lw+LeirKfSf4d6AsNlrh6RkzZ9vXuwuQOe4AOAjHN5Zz2Pg2Fd8ws/SHMZkCNBps/8rcMcXlyjSMXaji61UKIfvyAa8iCKCVy1PccESxGp8dRGp7pPQhSeVxM2yc4IHHN7GRqYHeAz1HTP7DRqp+c6aiCqRZdLrRaL0BzRzLZeoIxX5uNvzvdgL9yvH13unHyFW6mMckw1nss1VsBYsrM2tp8Mp+NxvjqdXXTseBppPNNVh1mMdj5HZyoq6IQSdkDlXcQNRjvxIshGpDGLu/4jTNZ4t9cE8+FYjzYnIwRz6eJ0xKKD/gDqmHfDqjMbR6YzQEhQWJwKR2UqD7NWnLq4ya9Qk0oOIlfVZqJPm7LXVu80jVpWIOoEzdDzT3srdQTTO1SA33BMQhXOzTIsgfm1hzICqFtzWYQH8NMcUIKNjUzFmM4sZYyprt5+atnBLbEIah5HSDAUHjyqYtLlIVKlATs5LUjR/g4lWtqe45jvh2qijRlBPNTtObExIgZvBS7SvLft63/UJ/f5ng7oX2PVfpxnHmx0henSelWfLXMy+TKEmeLE2/PtnY4SgL+IAvDt1XlhLwg36uAeowhXxwnK5OpvvMW+aTzhueH4ZEHm/vblhrbLnKX7jBl/QWr3WA8RYOrzbgrZfYsG8D9fVeIYQQloixuHY8IgnNtmNsN7T1dRcEeNipwjREH+a1x51PQI+rUxjxkHw+jfZ3SEoDQig7dUZmvmaG25uX1Xnyz7C750LRnsMlI6fC4e/Et8KQme3co1flK8MBxTuERJvcr4Pz0AkvCNF1rcY8MltNRbO/zs7+mve5fawNDBuuOX0vVOY4JMwkzfUg48WB0yPUB4a4AwGp9dSSFrAtPe4lteRUxHdKSNRDve5A1rqhJpjecgnvzhpDyjGWHC13cDvrIxglMah5wMdlYWbE8d2JFzqK/Xg3YHenfwSv5mNfzK0Gf8d2tUlfHKysYvogGf4oV/3dW/KBTf3W1H2qxFLZyLApFSITEURLH1uMFQWgEgQnkM6qVUpsl6jYBKN6leV/a2L+020Wb/9XmcrXPZNzUfMnnVCvdXLDQvWN9K4VSGy3D9lAPpzeiFuBb9n4NOdeYj6C3iHBlZ1vLyq8KsOvj8Z3lrfRsa02MNyaFRttaFLXVJNaIcuWDGL7dhkHbxS9fQtDuoQ/v/0H8n+qupF1VBMnu+RW9dyHzUDvmGWRSYMckkwiIIPDrG8x7szJv3ffyZVf1ojYuEEPiQ4MTESdO7JTD7XXzAor+AcdvBa5dF+svoRa8Qwvyd4l8nbkmZvHsFBIMIO3RL9/CLVmUv2vA/lOQfrPmXOYhumDTro7Kf+zSZegN74BGu5fDQ5icAdn9LeXYlV/Fjw1lKSzAocPIMTzXm4F7srzeg3pbCvfWYfwQeW3Pv5HrbCTww9u+IOhjP9DPaW7uHzNQfQZMVwd1V/lDCqrPn8c+/fyZm8Cv+PkzN4Ff8fNnbgLf+/nriBGgtVvqOYV24jIHDDRzsndGOIz2JKmeRiHF0qVn45tPV0QTwNKVzA9sgOMVhc8r6K93YHiNE0vTysU/GqrTyzWa+KLMPUtNBZ8FfdXS8HqOZNdPJRF/hZcyqA4PTk2P55VjknQEiH1gvc25uy8XRceO1cu8IcpBVvWxquv6RBj0CW0g3kWZfni695buXDruzRsmwPFjJQHoMsBYzcrQfZj8l99qImiTh2yZOoV3DdXvToSTtALHYGvHuwRUzl14tan2YoA8zW5gjwTN9drlYWo0SULVwVRLkiHdQ0rUWItoVoWgy+VYU96QvGzipJweRY+O1zb3mcxqnydA6f2DOch5/JhQoSUMTm1AEZ5h3hSCzAsOZx2neyFRjKWOG9s8cXp10ZiVYLJcvrnQDbCf67he7qUbHCSVR0F2JU6C0RBIHFpNDyEQc7/ARS8vPBoriB8MeTU/Wv012ry5BtcXUMjgObkvBUGuSymKOCU2BCe/tPSc8COP9gKLUtz8yvQ+LI0Ra9BSRRmPqXhWW/UZAoGkbQfKrbvW2DA3yvJa4lEoCM9Hu5vGxpNMqBqs2msOVBUpvsZTOTvL94ZCkTkM6j4BmAtJrWN8sWEznEt7SgpNfkgH60mPdmKWCFYEVmJfTSQPTw4vUIbXV+VVUxzkyfAX6A48X2Xgmp4tRhibGytR0753EDh1Gp3nTKoeNEcpVmSnxxp/ixiBn+5BUu65eEmM4PmEB6qlRmFqj57m6BYuffIMgC+DOD9EjI1kvNAH5xLufXBFLuxtVRRm/AKAZuGp3LPWHLE5KNCFhzv55B2lU3mP43PJnbntH+ToAmRaCWLmaBjEQhqlEbx6wuRfM2BcasSiPemF2c6d7GrkyscqNYtsQbP6FVIjGpRChWukyevbqNx+JAjWvnKNt9b5tIAWcBOPB7RypJyKT5g9QHEqc2hMG73K9naZsUafnJ952Vg32392twjNn1htpD5/4yExKBggYn3PmDNeuA5M8lzOyE1uZCVv0HsMKfARp7mnGqS1sUCiq07ghemiu4y1lbN93RTHPDBogrc+scGKwEuIEPHRrYzRLcxhEPIFA30EKrOsURelpcBbONWXGXE4Cg4k5RmOzskF9IhtjmuVrgtzws/FxWyuHHiNwiaEceMR0RpaSC4aHW2upzEuSbrHo79huQ3KdmnDVgb0I0ZPqzPfZcpEr6rjzgeTxHAfmcwmu/TK9svWlDmVj+MKejR1cnxEtzOTympOsNK5AM5lIkbZebECyX3motKyJJ7c7wezYo9WtkpBhdsOeQ11P2QP14QMDq+mknT9arcp3hckUOAVqyBroYP8aSWPJK3SZa5gageT9MALG4bW1IivBKtXxy26L6iImcy5nF8KfVF7iwJ4nj1UsFLleJPkd3D7DzWcLq2aQt4pqQnogSVc2TmY+hwOjQlaPX29rMrpBFNCJ5muCiwZC9/Nu5n4UhZz5KWT6n8DMe5MudMOX/7z0PHfM/1DDPlXZv/cqdgrdCCIQihF7KMrCAlSBARteBL7dqduvMO+7F1Mw9IdEf42cpKRuzoDiO1aSRsijIi9ZYCh3+tNoDtBhIR30Ie+5STi7N0iiPe+AY7vyhUZvCv7g+RuO0n38t5OE7z+CEyiHwsKNqNYtoNRDN3pIHtTBNpnwfftuMReIUzfzJJ9SOU9oUK8GYjRe+h7u3j4PSmzve7X/xZ1jch/xH+5b4kN3qji93lrnbt0V5YjW5/D7FtKpf/SqpBF+6uw6p8RFqP/CEi6XwEW8Knw8AtAEte5/HNQef4EWMAXhPWbUAUnQ0b5a6AS+ESVG4CEdJf5Cirfx/7o81eXgb/r81eXgb/r81eXgV/3+fseCPCnJohEELEZVCiiL6ze5djNTMa7Y4gag9aCSiNuRTsFYvf64nZKIpp6awDCRROrnO/DEO6R1bG1VmIwznT0xKVYt29OOFxZK8P8qAcCfJAJPqpEHke/EpH+InPUgrz4UJgn6D0eaXRWeaVZh0jUnCnZ0po8kHfQvFbgjgM4+0W/bFrOmUPowTmeXx7qyIcHaY7jY5Sit2kq8+erWm0d7ZFXXgAcl7AyCzY0TgvTZbKp24qGySLGsZkYfFEV9F2o/CRChyVBfZv4N6MyQqL/X1H5/2z651H5J2b/NE5IgChFERSMYyBCIhBOQARJkhAOkd/ua8miPVbh773Bu4Lmu+mxr5AD9yx/S7Wzt/wOTOzdkvT7TecZsXc3IuQtKn3dteQSZFfb3MIlnu4Ev12+bovB2N5bxsl30zd9d3l/qIKB7XEeIfcHQvLO6TeLWbzLWBBvK8mbIwhju3jnHnqveyVg7wnFu5zH9sHt5L2pDe8Ubfw9OgjFu5Leriz0l3LX7P2dCzq/R2VWg4UbvIQK7tARnxBfRV3+K6Kyjhq/mOr/MSrDBmd8jcrvY/8VUflXfP5enwj4XaBInCLO9yCWEyQmwoTm7M+bl6Mz5ZbumNW1PbnXJZfNMojM4eDnxYF+LokCVNQWnXVLbV74cKGdB7WG1I016+bVqyU+PY5uvSF5ITu2y1h5Ana3bvlalh2Idk+SCgUAOqlBwRW3VjU4ned/NHh1+hM9zNI55hXQX1rY9rkPHAUc+GWyKy1WN4g+VPd7jLP1Dxe20whAh6pv28qhPemHh13jyRMBPUXn+AfGgzXFdPKS3O1DRQ2qg4G5d6zxuAsF/zEESPIYWEAXkxv74HV/xLsAUyYspLVjE5RLfaXKSkLyI4ZPM3sQ2SGrjkEndXZIoGhhkE+7Uc8j4PydQRqDPvP2Z9T86RS2+XEu4zmywTvO/5w02hVMW3/zrr8G+v+k3c8o/8s2/xjdKRBCcAomCYSgSBzDEQSHYRzGEASiCITCKQzCMYpE0e0cCPlW05nchdDQ92j2Fj53Mja2N6BjZB/Zzt4N6w3sxte9HEvF3xOG3tJuV3inBG0PBjTa29QQ+qZW/waes/cq1PcOguQdfHdZ1PTHhCGS3D+2he002dnl+6bUt5rq9k27Ain0LvVe9wb89i4c7YXk7E0UB99APHlvSd3Oj9K9jU7Eu6rplgRsD4pdJe6vu+ftXtJF+99Vj+jQekm9rCFXX9CXfrZAez4YoeVa4L/QI9+qR5H7RfUIkmelouvPEqbkYcy5PjsyvwVJ8GbaZ2O7Cka3zrYIuJBi/MaXpkfdlV/6B0+aY2+mdQ4Fr2Skz13y3w0mAz8t2br5y+Q81ODeFdv149iirx5muLdIF+uvi+afju4EW1L9sWiegT6vgj2fDcWtz663MJbLC55dU47rMBwQI8prC82LztGfVdjOrYWLfZZzG56noBGG7xnetykuGQZIfbt9b/6R6l9SOfoQOYKhk+j62pkGSqt/cCETe6I51ooNCuB5ge7P26W8aR0U5Q6RT9bd72B/qC+VcOvnxAddHYdtKbG4SAIQMu1xJ8wuQYegh0K+c/zlUOH2kDyU9qBe11Jw25cM6/rToUc/0m8IN2cxRhSSVJI3HpBaxxX5HrwfPCcU75bSnks6jhW6gA85JBK+8UAfWyBurplzPiXg5dAc8bJh+Kft1mG0AvX5kR47ZlVPw8t++CpLX6XE15TwqYO3Y6RTTKGiKU1d6gscRUl3WE5maeTOnWbkXg1OwLCOTuXzZqpftIVfMUoZzZGbO+JCEh5LBUTivEDmFUfbc2binR7WQc8PbTSISTN+tj0wsaTOImIzzMHxbsbYqlCukclcq9LBREzzNLmXSk4Ma0rE8So8Ccvx+i27AF+xaInSFbiHyHqWYtNbW6brFIagnap6wSVk3VVoGCMyozg/YR+dJ518wXgleiN3JeJFsLB67E4Ht7CrSMoPtF3PI4YwNKjiN6O79jGnrjyoEmDa0QtZHo58uz6o1BMvbS3Ca6rR8owvLQBmw+F+mlOx1UeVHCESdFKzT/wgjMokNV634mw8wXklilsyn4eDdcWH9EITInwyaQOJAFZhyqfpPYm6vEdzFp41XHJGs/NzW8dn5nk24onMqiUoYi0Xp+cpQyBpZW+PelL4A6zuW0+VURCClxhsD/5Qmw1vphutS2VLh0FI1Kwfa8mC3UEGEFwyNA0ZKHdg6FBfFUJ7BPzwy1qywDdisv9kcXOammtmejpbIpJqjjaxNe3wWghWahwQ+aJuCWXfgsUZPYqn+0OFIcnzHifv1jq3i8gcMWs0peN2E4sLg7kj/FzkiQ1frvAQhl1QNY6eFZCMSDKNq3Q+BC9Zki7QzDE85DEV23EYL83r2uEeppltrgucW13px2Bpz5oAuyf+UsUGOGjejE02tMQ3t/HPknxrPSFJUZGIUtxaURGJ5yJwszZtHQJ3S15J8cxAdS/MWtljNaB4gAYpYKazRoS50NeyVi6oNUQTMllyrQ+2vBKY04Mx80rGzs15BC2w7sEu5JkNNSsDbtIgK0kxr3IqnFHfvS+3Um4N+/aigxuS9o2iKVeRGRB4ppzRfrm6mo0MgoCcK3HkSgDdkeSmHnrVRqshSfG8QYfo+qoX64oY7TBHsbcufX0/hFPVwZz/4Mo8I+p8Mp8MxroFCXSlytaYb9EEfqB7WkAcukRhMi05O5/HQB2tG8QeaQkXm4uRXAkZFU2Ta1DbeXKZqtmAxrhHzimWpLvEfn6PS88J+l5QRkRwyMcRPi5ZYfQH9HnPZMTt6zgcwNp4eb7LHp+HwQcwOUOSlC0gJDlDvOaTkz43ZzhG7PB5OrSifCzEttxu3DFOmzHoC0IMzie+pOCngB5UE0gLOKoSS6zcCBFOZnoWG6Sq1nMnwm4eZ0/qAdUZqSkR1+R1txqGHNn1qau9EDkcx/EGUL6fldd0+QkG/F9QSwMEFAAAAAgAbkzHUKn7Xw3VAwAA/wgAAA8AAABjZXJ0aWZpL2NvcmUucHl1Vk1v4zYQvetXDJTD2oWtSw8tFthDECzQXHaDIkB709LSyGZCkQY5sq099Ld3hqTkj3WEHBRSfDPz3ryhH2D92xoa12q7/QwDdes/ZaUoyrIsGvSkO13tx+K/+SmK150O0Lt2MAgeafA2AO0QtA2kjFGknQXjmvTiOmiUIFV77MF50BQ4oCW0FKoYR/d75wlcKAry4+cC+Om86yFtGL2pPAY3+AZDXoO9oh2oAFukWt5XnIpqa8ITFRGgfnp8+vr3a/30+i98gW/O4tXyy+PrX9N63Gixg+MOPS6WKQN5HiAWy3/B6O2OzAiE3uuNwRVsBoIjwlFZAnIMYNQIHN+rhpjOyEmnDV6gactkBK4iRuLTn3zkTbcoRCn4qfe5wKBpSAwOlrSB4HqcikhgHGZgvkeGNCZMyc95tc5+ojk7j+uc2r28OAoe0CcoyWQGC06y5MXWsXL8YYMCYCGQk9xJalIXUFvjNsrAQXmtmKZq3sobF7p8tCXazHu6u9aMtRDRzhp9oNObsu/jKjXmnTZ6fHmO3AQY3cAE3cD1yqptrBQag8oOe2GFJIhQF3nh2luHQViepUh+uCAkwaUO5QOTX1SywIlyJM/YitXSzPRWHzBlxdHl5A3YUeiXfXYQip9A2TYdZZGUHeeU5y/5/4OIVcGzvUGLJbq+d6k1pUzrCCyizAROlFDoU9wcqXKd03wbAt1g5eqnBoMwBj59ngWSp2zWNZ401fViKZIpDrh2++oa7Ab6HwRlmPSdFML9vHOm5W7kNwFM/N9yylbARg0Bb7CmClp3JbCwJS6QfR4rPFuU30gXNM4YbAhbkf1WDExYMbnkiaikSj7LnW0Y18i4OqIx14Vez6lpnC3KPHzLFZTn+Vku757NwyyQX1zAVUyzdIjwvCzmg1mkK7MVBZ4a3BM8R6t89d755LDsrI67e6Oa91Ts0fl36HiWv4y0Y12ZtMD6Bth7zassyu/VH4kHI4eYiQx2z4r5KpGx5dFoXnGph7hJQpykP+I4+gHdYBtppAwmsykOOdW2DCf+D4MMV813A9qD9s72cs2A0e/IyX4/6Vb/nMyWBmRAynB1LU1b1xI+5RSq+WqYb5dFnfZWkO8dtOn6/FKq0GhdXlwfMRG3R7uY52npy4sj08tSeqNVpK7HWpZKNipJYJFlfIDn7jzioyXuELtKg3rqUPHr1PJiHuO2uslwcvcwd72QnS4ld7ZxdrGYtx9snorx/m21Z1+Ysfr4Bu24L12o5POKP7eqx8VE9K9NOX355rRddLetXxQSYvrtMEXJR88CfWCdO0oV/wNQSwECFAMUAAAACABsTp1QE2e8P/YAAABGAQAAHAAAAAAAAAAAAAAApIEAAAAAc2VtYW50aWNfdmVyc2lvbi9fX2luaXRfXy5weVBLAQIUAxQAAAAIAGxOnVApPsel/SAAAOe3AAAYAAAAAAAAAAAAAACkgTABAABzZW1hbnRpY192ZXJzaW9uL2Jhc2UucHlQSwECFAMUAAAACABsTp1QFey3UvEDAADsDAAAIQAAAAAAAAAAAAAApIFjIgAAc2VtYW50aWNfdmVyc2lvbi9kamFuZ29fZmllbGRzLnB5UEsBAhQDFAAAAAgAJ5c6UiFJbRxRBAAAywoAABMAAAAAAAAAAAAAAKSBkyYAAHVybGxpYjMvX19pbml0X18ucHlQSwECFAMUAAAACAAnlzpSHT8TcgINAAA7KgAAFwAAAAAAAAAAAAAApIEVKwAAdXJsbGliMy9fY29sbGVjdGlvbnMucHlQSwECFAMUAAAACAAnlzpShxkUdT8AAAA/AAAAEwAAAAAAAAAAAAAApIFMOAAAdXJsbGliMy9fdmVyc2lvbi5weVBLAQIUAxQAAAAIACeXOlK34KUHPhYAAGBIAAAVAAAAAAAAAAAAAACkgbw4AAB1cmxsaWIzL2Nvbm5lY3Rpb24ucHlQSwECFAMUAAAACAAnlzpSV6IfBB4oAAANkQAAGQAAAAAAAAAAAAAApIEtTwAAdXJsbGliMy9jb25uZWN0aW9ucG9vbC5weVBLAQIUAxQAAAAIACeXOlJezEm16wkAABkgAAAVAAAAAAAAAAAAAACkgYJ3AAB1cmxsaWIzL2V4Y2VwdGlvbnMucHlQSwECFAMUAAAACAAnlzpSxyhLLCAKAACDIQAAEQAAAAAAAAAAAAAApIGggQAAdXJsbGliMy9maWVsZHMucHlQSwECFAMUAAAACAAnlzpSh6u/o34DAACICQAAEwAAAAAAAAAAAAAApIHviwAAdXJsbGliMy9maWxlcG9zdC5weVBLAQIUAxQAAAAIACeXOlLoopGLaBYAADNNAAAWAAAAAAAAAAAAAACkgZ6PAAB1cmxsaWIzL3Bvb2xtYW5hZ2VyLnB5UEsBAhQDFAAAAAgAJ5c6UvyP7gKnBwAAYRcAABIAAAAAAAAAAAAAAKSBOqYAAHVybGxpYjMvcmVxdWVzdC5weVBLAQIUAxQAAAAIACeXOlIpLxgIYx0AACtuAAATAAAAAAAAAAAAAACkgRGuAAB1cmxsaWIzL3Jlc3BvbnNlLnB5UEsBAhQDFAAAAAgAFJc6UgAAAAACAAAAAAAAABsAAAAAAAAAAAAAAKSBpcsAAHVybGxpYjMvY29udHJpYi9fX2luaXRfXy5weVBLAQIUAxQAAAAIACeXOlIqg+kVtQEAAL0DAAAlAAAAAAAAAAAAAACkgeDLAAB1cmxsaWIzL2NvbnRyaWIvX2FwcGVuZ2luZV9lbnZpcm9uLnB5UEsBAhQDFAAAAAgAJ5c6UuubHOVaDAAAAisAABwAAAAAAAAAAAAAAKSB2M0AAHVybGxpYjMvY29udHJpYi9hcHBlbmdpbmUucHlQSwECFAMUAAAACAAnlzpS+kJ4aKEFAABAEAAAGwAAAAAAAAAAAAAApIFs2gAAdXJsbGliMy9jb250cmliL250bG1wb29sLnB5UEsBAhQDFAAAAAgAJ5c6Uj9/YcJbFAAAikEAABwAAAAAAAAAAAAAAKSBRuAAAHVybGxpYjMvY29udHJpYi9weW9wZW5zc2wucHlQSwECFAMUAAAACAAnlzpSlhI795klAADuhQAAIgAAAAAAAAAAAAAApIHb9AAAdXJsbGliMy9jb250cmliL3NlY3VyZXRyYW5zcG9ydC5weVBLAQIUAxQAAAAIACeXOlI/u6WFVggAALkbAAAYAAAAAAAAAAAAAACkgbQaAQB1cmxsaWIzL2NvbnRyaWIvc29ja3MucHlQSwECFAMUAAAACAAUlzpSAAAAAAIAAAAAAAAALAAAAAAAAAAAAAAApIFAIwEAdXJsbGliMy9jb250cmliL19zZWN1cmV0cmFuc3BvcnQvX19pbml0X18ucHlQSwECFAMUAAAACAAnlzpSKFuFlO4QAADlRAAALAAAAAAAAAAAAAAApIGMIwEAdXJsbGliMy9jb250cmliL19zZWN1cmV0cmFuc3BvcnQvYmluZGluZ3MucHlQSwECFAMUAAAACAAnlzpSfinWfFgRAABUNgAALQAAAAAAAAAAAAAApIHENAEAdXJsbGliMy9jb250cmliL19zZWN1cmV0cmFuc3BvcnQvbG93X2xldmVsLnB5UEsBAhQDFAAAAAgAJ5c6Uqw5jKxQAAAAbAAAABwAAAAAAAAAAAAAAKSBZ0YBAHVybGxpYjMvcGFja2FnZXMvX19pbml0X18ucHlQSwECFAMUAAAACAAnlzpSslUWkxUfAAAYfwAAFwAAAAAAAAAAAAAApIHxRgEAdXJsbGliMy9wYWNrYWdlcy9zaXgucHlQSwECFAMUAAAACAAnlzpSAAAAAAIAAAAAAAAAJgAAAAAAAAAAAAAApIE7ZgEAdXJsbGliMy9wYWNrYWdlcy9iYWNrcG9ydHMvX19pbml0X18ucHlQSwECFAMUAAAACAAnlzpS3rhjs0gCAACJBQAAJgAAAAAAAAAAAAAApIGBZgEAdXJsbGliMy9wYWNrYWdlcy9iYWNrcG9ydHMvbWFrZWZpbGUucHlQSwECFAMUAAAACAAnlzpS/JRzplYBAAD1AgAALwAAAAAAAAAAAAAApIENaQEAdXJsbGliMy9wYWNrYWdlcy9zc2xfbWF0Y2hfaG9zdG5hbWUvX19pbml0X18ucHlQSwECFAMUAAAACAAnlzpSPoRL1rEIAAAvFgAANgAAAAAAAAAAAAAApIGwagEAdXJsbGliMy9wYWNrYWdlcy9zc2xfbWF0Y2hfaG9zdG5hbWUvX2ltcGxlbWVudGF0aW9uLnB5UEsBAhQDFAAAAAgAJ5c6UuaKmZrYAQAAgwQAABgAAAAAAAAAAAAAAKSBtXMBAHVybGxpYjMvdXRpbC9fX2luaXRfXy5weVBLAQIUAxQAAAAIACeXOlKNSUUlnQcAAC4TAAAaAAAAAAAAAAAAAACkgcN1AQB1cmxsaWIzL3V0aWwvY29ubmVjdGlvbi5weVBLAQIUAxQAAAAIABSXOlI3Sq6dXAIAAEQGAAAVAAAAAAAAAAAAAACkgZh9AQB1cmxsaWIzL3V0aWwvcHJveHkucHlQSwECFAMUAAAACAAnlzpSTgP2n/wAAADyAQAAFQAAAAAAAAAAAAAApIEngAEAdXJsbGliMy91dGlsL3F1ZXVlLnB5UEsBAhQDFAAAAAgAJ5c6UpJkr1TqBQAAGxAAABcAAAAAAAAAAAAAAKSBVoEBAHVybGxpYjMvdXRpbC9yZXF1ZXN0LnB5UEsBAhQDFAAAAAgAJ5c6UjYo1bRgBQAAtg0AABgAAAAAAAAAAAAAAKSBdYcBAHVybGxpYjMvdXRpbC9yZXNwb25zZS5weVBLAQIUAxQAAAAIACeXOlJsjqGqzBYAAHZTAAAVAAAAAAAAAAAAAACkgQuNAQB1cmxsaWIzL3V0aWwvcmV0cnkucHlQSwECFAMUAAAACAAnlzpSbMEF8ZwVAACNPwAAFAAAAAAAAAAAAAAApIEKpAEAdXJsbGliMy91dGlsL3NzbF8ucHlQSwECFAMUAAAACAAnlzpS7sDESgQIAAD8GgAAHAAAAAAAAAAAAAAApIHYuQEAdXJsbGliMy91dGlsL3NzbHRyYW5zcG9ydC5weVBLAQIUAxQAAAAIACeXOlIkyegIwAsAABMnAAAXAAAAAAAAAAAAAACkgRbCAQB1cmxsaWIzL3V0aWwvdGltZW91dC5weVBLAQIUAxQAAAAIACeXOlLWU3iTgBIAAIw2AAATAAAAAAAAAAAAAACkgQvOAQB1cmxsaWIzL3V0aWwvdXJsLnB5UEsBAhQDFAAAAAgAJ5c6UqJGv3HABwAAHBUAABQAAAAAAAAAAAAAAKSBvOABAHVybGxpYjMvdXRpbC93YWl0LnB5UEsBAhQDFAAAAAgAm5aKUaPnZtN3BAAAxwwAABMAAAAAAAAAAAAAAKSBrugBAGNoYXJkZXQvX19pbml0X18ucHlQSwECFAMUAAAACACCsHFROb+EEO85AAAWegAAEwAAAAAAAAAAAAAApIFW7QEAY2hhcmRldC9iaWc1ZnJlcS5weVBLAQIUAxQAAAAIAHCOi0rL52dmPAMAAN0GAAAVAAAAAAAAAAAAAACkgXYnAgBjaGFyZGV0L2JpZzVwcm9iZXIucHlQSwECFAMUAAAACACCsHFR4FkoPT0JAADDJAAAGwAAAAAAAAAAAAAApIHlKgIAY2hhcmRldC9jaGFyZGlzdHJpYnV0aW9uLnB5UEsBAhQDFAAAAAgAm5aKUcXp8AV3BAAA/w4AAB0AAAAAAAAAAAAAAKSBWzQCAGNoYXJkZXQvY2hhcnNldGdyb3VwcHJvYmVyLnB5UEsBAhQDFAAAAAgASqWIUeCXYVq/BwAA9hMAABgAAAAAAAAAAAAAAKSBDTkCAGNoYXJkZXQvY2hhcnNldHByb2Jlci5weVBLAQIUAxQAAAAIAIKwcVFc+zdIpAUAAAYOAAAdAAAAAAAAAAAAAACkgQJBAgBjaGFyZGV0L2NvZGluZ3N0YXRlbWFjaGluZS5weVBLAQIUAxQAAAAIAJuWilHYDB0JWgIAALAEAAARAAAAAAAAAAAAAACkgeFGAgBjaGFyZGV0L2NvbXBhdC5weVBLAQIUAxQAAAAIAHCOi0q9QpoxaAMAAD8HAAAWAAAAAAAAAAAAAACkgWpJAgBjaGFyZGV0L2NwOTQ5cHJvYmVyLnB5UEsBAhQDFAAAAAgAgrBxUUQErMnAAgAAfQYAABAAAAAAAAAAAAAAAKSBBk0CAGNoYXJkZXQvZW51bXMucHlQSwECFAMUAAAACACCsHFRBIgFPTUFAABuDwAAFAAAAAAAAAAAAAAApIH0TwIAY2hhcmRldC9lc2Nwcm9iZXIucHlQSwECFAMUAAAACACCsHFRwQpgohQGAAAOKQAAEAAAAAAAAAAAAAAApIFbVQIAY2hhcmRldC9lc2NzbS5weVBLAQIUAxQAAAAIAIKwcVEgN8TQKgUAAKUOAAAWAAAAAAAAAAAAAACkgZ1bAgBjaGFyZGV0L2V1Y2pwcHJvYmVyLnB5UEsBAhQDFAAAAAgAgrBxUfRBA3lhGAAA6jQAABQAAAAAAAAAAAAAAKSB+2ACAGNoYXJkZXQvZXVja3JmcmVxLnB5UEsBAhQDFAAAAAgAcI6LSiYFl/g4AwAA1AYAABYAAAAAAAAAAAAAAKSBjnkCAGNoYXJkZXQvZXVja3Jwcm9iZXIucHlQSwECFAMUAAAACACCsHFRzNtJ1TM6AACFewAAFAAAAAAAAAAAAAAApIH6fAIAY2hhcmRldC9ldWN0d2ZyZXEucHlQSwECFAMUAAAACACCsHFRoEGNGDgDAADTBgAAFgAAAAAAAAAAAAAApIFftwIAY2hhcmRldC9ldWN0d3Byb2Jlci5weVBLAQIUAxQAAAAIAIKwcVEZRdLXYycAAOtQAAAVAAAAAAAAAAAAAACkgcu6AgBjaGFyZGV0L2diMjMxMmZyZXEucHlQSwECFAMUAAAACACCsHFRfqv+jzYDAADaBgAAFwAAAAAAAAAAAAAApIFh4gIAY2hhcmRldC9nYjIzMTJwcm9iZXIucHlQSwECFAMUAAAACABKpYhRDSnTspkSAAAONgAAFwAAAAAAAAAAAAAApIHM5QIAY2hhcmRldC9oZWJyZXdwcm9iZXIucHlQSwECFAMUAAAACACCsHFRwho5YRUwAACxZAAAEgAAAAAAAAAAAAAApIGa+AIAY2hhcmRldC9qaXNmcmVxLnB5UEsBAhQDFAAAAAgAgrBxUQZ5JWpOEwAAu0wAABEAAAAAAAAAAAAAAKSB3ygDAGNoYXJkZXQvanBjbnR4LnB5UEsBAhQDFAAAAAgAm5aKUS7dUbupHQAA1ZwBAB0AAAAAAAAAAAAAAKSBXDwDAGNoYXJkZXQvbGFuZ2J1bGdhcmlhbm1vZGVsLnB5UEsBAhQDFAAAAAgAm5aKUVaSaNrqFwAA54QBABkAAAAAAAAAAAAAAKSBQFoDAGNoYXJkZXQvbGFuZ2dyZWVrbW9kZWwucHlQSwECFAMUAAAACACblopRxaULhg4XAADMgQEAGgAAAAAAAAAAAAAApIFhcgMAY2hhcmRldC9sYW5naGVicmV3bW9kZWwucHlQSwECFAMUAAAACACblopROuUHW2sbAABWkAEAHQAAAAAAAAAAAAAApIGniQMAY2hhcmRldC9sYW5naHVuZ2FyaWFubW9kZWwucHlQSwECFAMUAAAACACblopR2ra+MhYoAABgAAIAGwAAAAAAAAAAAAAApIFNpQMAY2hhcmRldC9sYW5ncnVzc2lhbm1vZGVsLnB5UEsBAhQDFAAAAAgAm5aKUfB4P3ExGwAAhJMBABgAAAAAAAAAAAAAAKSBnM0DAGNoYXJkZXQvbGFuZ3RoYWltb2RlbC5weVBLAQIUAxQAAAAIAJuWilFhdHuFCxwAAL52AQAbAAAAAAAAAAAAAACkgQPpAwBjaGFyZGV0L2xhbmd0dXJraXNobW9kZWwucHlQSwECFAMUAAAACABKpYhR5OzwpJcGAAD6FAAAFwAAAAAAAAAAAAAApIFHBQQAY2hhcmRldC9sYXRpbjFwcm9iZXIucHlQSwECFAMUAAAACACCsHFRNnUYTd0EAABVDQAAGgAAAAAAAAAAAAAApIETDAQAY2hhcmRldC9tYmNoYXJzZXRwcm9iZXIucHlQSwECFAMUAAAACACCsHFRrdMRqHIDAADcBwAAGgAAAAAAAAAAAAAApIEoEQQAY2hhcmRldC9tYmNzZ3JvdXBwcm9iZXIucHlQSwECFAMUAAAACACCsHFRafbhD+UMAACJYwAAEQAAAAAAAAAAAAAApIHSFAQAY2hhcmRldC9tYmNzc20ucHlQSwECFAMUAAAACACblopR8KByc/IHAAD4FwAAGgAAAAAAAAAAAAAApIHmIQQAY2hhcmRldC9zYmNoYXJzZXRwcm9iZXIucHlQSwECFAMUAAAACACblopRlFXvWoEFAADVEAAAGgAAAAAAAAAAAAAApIEQKgQAY2hhcmRldC9zYmNzZ3JvdXBwcm9iZXIucHlQSwECFAMUAAAACACCsHFR1pFnMiAFAAC+DgAAFQAAAAAAAAAAAAAApIHJLwQAY2hhcmRldC9zamlzcHJvYmVyLnB5UEsBAhQDFAAAAAgAm5aKUceLxoN3DQAA1zAAABwAAAAAAAAAAAAAAKSBHDUEAGNoYXJkZXQvdW5pdmVyc2FsZGV0ZWN0b3IucHlQSwECFAMUAAAACACCsHFR9b+8PUUEAADOCgAAFQAAAAAAAAAAAAAApIHNQgQAY2hhcmRldC91dGY4cHJvYmVyLnB5UEsBAhQDFAAAAAgAm5aKUYds/RW5AAAA8gAAABIAAAAAAAAAAAAAAKSBRUcEAGNoYXJkZXQvdmVyc2lvbi5weVBLAQIUAxQAAAAIAHCOi0qTBtcyAwAAAAEAAAAXAAAAAAAAAAAAAACkgS5IBABjaGFyZGV0L2NsaS9fX2luaXRfXy5weVBLAQIUAxQAAAAIAJuWilG3jCobgQQAAJcKAAAZAAAAAAAAAAAAAACkgWZIBABjaGFyZGV0L2NsaS9jaGFyZGV0ZWN0LnB5UEsBAhQDFAAAAAgAm5aKUQAAAAACAAAAAAAAABwAAAAAAAAAAAAAAKSBHk0EAGNoYXJkZXQvbWV0YWRhdGEvX19pbml0X18ucHlQSwECFAMUAAAACACblopRTKU6uMISAAASTAAAHQAAAAAAAAAAAAAApIFaTQQAY2hhcmRldC9tZXRhZGF0YS9sYW5ndWFnZXMucHlQSwECFAAUAAAACADPqkxRhohr1bMAAADvAAAAFAAAAAAAAAAAAAAAtoFXYAQAY29sb3JhbWEvX19pbml0X18ucHlQSwECFAAUAAAACADPqkxRUtmthooDAADaCQAAEAAAAAAAAAAAAAAAtoE8YQQAY29sb3JhbWEvYW5zaS5weVBLAQIUABQAAAAIAM+qTFHLxBHTcQsAABUpAAAXAAAAAAAAAAAAAAC2gfRkBABjb2xvcmFtYS9hbnNpdG93aW4zMi5weVBLAQIUABQAAAAIAM+qTFEbb0VygwIAAHsHAAAWAAAAAAAAAAAAAAC2gZpwBABjb2xvcmFtYS9pbml0aWFsaXNlLnB5UEsBAhQAFAAAAAgAz6pMUQgbDBFQBQAAHBUAABEAAAAAAAAAAAAAALaBUXMEAGNvbG9yYW1hL3dpbjMyLnB5UEsBAhQAFAAAAAgAz6pMUaIo1ubuBQAAJhkAABMAAAAAAAAAAAAAALaB0HgEAGNvbG9yYW1hL3dpbnRlcm0ucHlQSwECFAMUAAAACAAcZT1S/KAzhH0CAABrBAAAGAAAAAAAAAAAAAAApIHvfgQAcGlvaW5zdGFsbGVyL19faW5pdF9fLnB5UEsBAhQDFAAAAAgAyG02Uo0CVHNcBgAAgxAAABgAAAAAAAAAAAAAAKSBooEEAHBpb2luc3RhbGxlci9fX21haW5fXy5weVBLAQIUAxQAAAAIALpkPVLB+/rFmwsAABkoAAAUAAAAAAAAAAAAAACkgTSIBABwaW9pbnN0YWxsZXIvY29yZS5weVBLAQIUAxQAAAAIAPuYNVIZQDN0XQIAAH4EAAAZAAAAAAAAAAAAAACkgQGUBABwaW9pbnN0YWxsZXIvZXhjZXB0aW9uLnB5UEsBAhQDFAAAAAgAIZo1UtjLYmm2AgAA+gQAABQAAAAAAAAAAAAAAKSBlZYEAHBpb2luc3RhbGxlci9ob21lLnB5UEsBAhQDFAAAAAgAnJg1UgUQzPO6BwAAmhgAABQAAAAAAAAAAAAAAKSBfZkEAHBpb2luc3RhbGxlci9wZW52LnB5UEsBAhQDFAAAAAgAOpk1UpzeNK02CQAAkxoAABYAAAAAAAAAAAAAAKSBaaEEAHBpb2luc3RhbGxlci9weXRob24ucHlQSwECFAMUAAAACADiTDBRqET1KiwGAAAxDgAAFAAAAAAAAAAAAAAApIHTqgQAcGlvaW5zdGFsbGVyL3V0aWwucHlQSwECFAMUAAAACAB7gHNQvY8YUoUBAABiAgAAHQAAAAAAAAAAAAAApIExsQQAcGlvaW5zdGFsbGVyL3BhY2svX19pbml0X18ucHlQSwECFAMUAAAACAARavhQRrvUHOsDAABfCAAAGwAAAAAAAAAAAAAApIHxsgQAcGlvaW5zdGFsbGVyL3BhY2svcGFja2VyLnB5UEsBAhQDFAAAAAgAEWr4UBCGcBWVAwAApwcAAB0AAAAAAAAAAAAAAKSBFbcEAHBpb2luc3RhbGxlci9wYWNrL3RlbXBsYXRlLnB5UEsBAhQDFAAAAAgAIAyITwBHXJszAAAAOgAAABAAAAAAAAAAAAAAAKSB5boEAGlkbmEvX19pbml0X18ucHlQSwECFAMUAAAACACtvNtQ80jU6RoDAADjDAAADQAAAAAAAAAAAAAApIFGuwQAaWRuYS9jb2RlYy5weVBLAQIUAxQAAAAIAK2821B8gZZwjwAAAOgAAAAOAAAAAAAAAAAAAACkgYu+BABpZG5hL2NvbXBhdC5weVBLAQIUAxQAAAAIAK2821AcmzQsLAsAAK8uAAAMAAAAAAAAAAAAAACkgUa/BABpZG5hL2NvcmUucHlQSwECFAMUAAAACACvvNtQ16xKNG8jAABupQAAEAAAAAAAAAAAAAAApIGcygQAaWRuYS9pZG5hZGF0YS5weVBLAQIUAxQAAAAIACAMiE+3Y/Sy5gIAANUGAAARAAAAAAAAAAAAAACkgTnuBABpZG5hL2ludHJhbmdlcy5weVBLAQIUAxQAAAAIACa921Ad1Gv3GAAAABYAAAAUAAAAAAAAAAAAAACkgU7xBABpZG5hL3BhY2thZ2VfZGF0YS5weVBLAQIUAxQAAAAIAK+821A+M0lW6ZYAAGQVAwARAAAAAAAAAAAAAACkgZjxBABpZG5hL3V0czQ2ZGF0YS5weVBLAQIUAxQAAAAIAIehm1CPEDMF1QIAAJ8JAAARAAAAAAAAAAAAAACkgbCIBQBjbGljay9fX2luaXRfXy5weVBLAQIUAxQAAAAIAK6gm1CrxDWqXg0AABUwAAAWAAAAAAAAAAAAAACkgbSLBQBjbGljay9fYmFzaGNvbXBsZXRlLnB5UEsBAhQDFAAAAAgArqCbUOlEnpwOGQAAaV4AABAAAAAAAAAAAAAAAKSBRpkFAGNsaWNrL19jb21wYXQucHlQSwECFAMUAAAACACuoJtQ3cJEs/8XAADeUAAAFQAAAAAAAAAAAAAApIGCsgUAY2xpY2svX3Rlcm11aV9pbXBsLnB5UEsBAhQDFAAAAAgArqCbUOyOSSSfAQAArQQAABIAAAAAAAAAAAAAAKSBtMoFAGNsaWNrL190ZXh0d3JhcC5weVBLAQIUAxQAAAAIAK6gm1DdE7t5/AUAAGkQAAAUAAAAAAAAAAAAAACkgYPMBQBjbGljay9fdW5pY29kZWZ1bi5weVBLAQIUAxQAAAAIAK6gm1Axq78TMgwAABonAAAUAAAAAAAAAAAAAACkgbHSBQBjbGljay9fd2luY29uc29sZS5weVBLAQIUAxQAAAAIAK6gm1DLNI8aZUsAAFIvAQANAAAAAAAAAAAAAACkgRXfBQBjbGljay9jb3JlLnB5UEsBAhQDFAAAAAgArqCbUJCyPRbWCwAAzysAABMAAAAAAAAAAAAAAKSBpSoGAGNsaWNrL2RlY29yYXRvcnMucHlQSwECFAMUAAAACACuoJtQPyISCGoIAAC2HwAAEwAAAAAAAAAAAAAApIGsNgYAY2xpY2svZXhjZXB0aW9ucy5weVBLAQIUAxQAAAAIAK6gm1DTcL96AQsAAEEkAAATAAAAAAAAAAAAAACkgUc/BgBjbGljay9mb3JtYXR0aW5nLnB5UEsBAhQDFAAAAAgAkIJoUGlFh3WqAgAA3QUAABAAAAAAAAAAAAAAAKSBeUoGAGNsaWNrL2dsb2JhbHMucHlQSwECFAMUAAAACACuoJtQBugkTboSAABLPQAADwAAAAAAAAAAAAAApIFRTQYAY2xpY2svcGFyc2VyLnB5UEsBAhQDFAAAAAgArqCbULdDEPR6HAAAvl0AAA8AAAAAAAAAAAAAAKSBOGAGAGNsaWNrL3Rlcm11aS5weVBLAQIUAxQAAAAIAK6gm1BnjgKswg0AADYyAAAQAAAAAAAAAAAAAACkgd98BgBjbGljay90ZXN0aW5nLnB5UEsBAhQDFAAAAAgArqCbUCmIjMMhGQAA1WEAAA4AAAAAAAAAAAAAAKSBz4oGAGNsaWNrL3R5cGVzLnB5UEsBAhQDFAAAAAgArqCbULNgTtlKFAAARD4AAA4AAAAAAAAAAAAAAKSBHKQGAGNsaWNrL3V0aWxzLnB5UEsBAhQDFAAAAAgAbI2QUUhcb8xvBgAALRAAABQAAAAAAAAAAAAAAKSBkrgGAHJlcXVlc3RzL19faW5pdF9fLnB5UEsBAhQDFAAAAAgAnZyQUZbjVFwHAQAAuQEAABcAAAAAAAAAAAAAAKSBM78GAHJlcXVlc3RzL19fdmVyc2lvbl9fLnB5UEsBAhQDFAAAAAgASHKwToipObsUAgAASAQAABsAAAAAAAAAAAAAAKSBb8AGAHJlcXVlc3RzL19pbnRlcm5hbF91dGlscy5weVBLAQIUAxQAAAAIAIAki1GN794ifBQAAGBTAAAUAAAAAAAAAAAAAACkgbzCBgByZXF1ZXN0cy9hZGFwdGVycy5weVBLAQIUAxQAAAAIAIAki1G2ErFpcAYAAGAZAAAPAAAAAAAAAAAAAACkgWrXBgByZXF1ZXN0cy9hcGkucHlQSwECFAMUAAAACACAJItRu7SJK3MLAADfJwAAEAAAAAAAAAAAAAAApIEH3gYAcmVxdWVzdHMvYXV0aC5weVBLAQIUAxQAAAAIAPKWcVH7rdQDJwEAAMUBAAARAAAAAAAAAAAAAACkgajpBgByZXF1ZXN0cy9jZXJ0cy5weVBLAQIUAxQAAAAIAIAki1Eo0ZzIYwIAAPYGAAASAAAAAAAAAAAAAACkgf7qBgByZXF1ZXN0cy9jb21wYXQucHlQSwECFAMUAAAACACAJItRvScXOsATAAD+RwAAEwAAAAAAAAAAAAAApIGR7QYAcmVxdWVzdHMvY29va2llcy5weVBLAQIUAxQAAAAIAIAki1Enrn1NLgQAAFkMAAAWAAAAAAAAAAAAAACkgYIBBwByZXF1ZXN0cy9leGNlcHRpb25zLnB5UEsBAhQDFAAAAAgAgCSLUYdYVgZABAAAuw0AABAAAAAAAAAAAAAAAKSB5AUHAHJlcXVlc3RzL2hlbHAucHlQSwECFAMUAAAACAADcjNPG0pz4XkBAAD1AgAAEQAAAAAAAAAAAAAApIFSCgcAcmVxdWVzdHMvaG9va3MucHlQSwECFAMUAAAACACAJItR0/Mm6lImAAAEhgAAEgAAAAAAAAAAAAAApIH6CwcAcmVxdWVzdHMvbW9kZWxzLnB5UEsBAhQDFAAAAAgAgCSLUSl8/5A5AQAAHgIAABQAAAAAAAAAAAAAAKSBfDIHAHJlcXVlc3RzL3BhY2thZ2VzLnB5UEsBAhQDFAAAAAgAbI2QUfLyTrUzIQAAuXUAABQAAAAAAAAAAAAAAKSB5zMHAHJlcXVlc3RzL3Nlc3Npb25zLnB5UEsBAhQDFAAAAAgAgCSLUT3L33qNBgAAXBAAABgAAAAAAAAAAAAAAKSBTFUHAHJlcXVlc3RzL3N0YXR1c19jb2Rlcy5weVBLAQIUAxQAAAAIAIAki1EIjbXffAQAAL0LAAAWAAAAAAAAAAAAAACkgQ9cBwByZXF1ZXN0cy9zdHJ1Y3R1cmVzLnB5UEsBAhQDFAAAAAgAbI2QUfxnRqvLJQAAQXcAABEAAAAAAAAAAAAAAKSBv2AHAHJlcXVlc3RzL3V0aWxzLnB5UEsBAhQDFAAAAAgAHZGNUQXz0aYZAAAAFwAAABEAAAAAAAAAAAAAAKSBuYYHAHdoZWVsL19faW5pdF9fLnB5UEsBAhQDFAAAAAgAHZGNURpMDx7tAAAAoQEAABEAAAAAAAAAAAAAAKSBAYcHAHdoZWVsL19fbWFpbl9fLnB5UEsBAhQDFAAAAAgAHZGNUZanb+IwFgAAg0oAABQAAAAAAAAAAAAAAKSBHYgHAHdoZWVsL2JkaXN0X3doZWVsLnB5UEsBAhQDFAAAAAgAHZGNUY+dqbRoEAAAOz4AABcAAAAAAAAAAAAAAKSBf54HAHdoZWVsL21hY29zeF9saWJmaWxlLnB5UEsBAhQDFAAAAAgAHZGNUcdY/PfRBQAA+BAAABEAAAAAAAAAAAAAAKSBHK8HAHdoZWVsL21ldGFkYXRhLnB5UEsBAhQDFAAAAAgAHZGNUdTrMfKhAQAA6QQAABAAAAAAAAAAAAAAAKSBHLUHAHdoZWVsL3BrZ2luZm8ucHlQSwECFAMUAAAACAAdkY1RTWhggkoBAACqAwAADQAAAAAAAAAAAAAApIHrtgcAd2hlZWwvdXRpbC5weVBLAQIUAxQAAAAIAB2RjVG4bIISfwkAAKgcAAASAAAAAAAAAAAAAACkgWC4BwB3aGVlbC93aGVlbGZpbGUucHlQSwECFAMUAAAACAAdkY1ROwxPZlwDAAAMCgAAFQAAAAAAAAAAAAAApIEPwgcAd2hlZWwvY2xpL19faW5pdF9fLnB5UEsBAhQDFAAAAAgAHZGNUWwyFLwdDAAAGiUAABQAAAAAAAAAAAAAAKSBnsUHAHdoZWVsL2NsaS9jb252ZXJ0LnB5UEsBAhQDFAAAAAgAHZGNUQWzfe54BAAAiAwAABEAAAAAAAAAAAAAAKSB7dEHAHdoZWVsL2NsaS9wYWNrLnB5UEsBAhQDFAAAAAgAHZGNUWkrBHNrAQAAoQIAABMAAAAAAAAAAAAAAKSBlNYHAHdoZWVsL2NsaS91bnBhY2sucHlQSwECFAMUAAAACAAdkY1RAAAAAAIAAAAAAAAAGgAAAAAAAAAAAAAApIEw2AcAd2hlZWwvdmVuZG9yZWQvX19pbml0X18ucHlQSwECFAMUAAAACAAdkY1RAAAAAAIAAAAAAAAAJAAAAAAAAAAAAAAApIFq2AcAd2hlZWwvdmVuZG9yZWQvcGFja2FnaW5nL19faW5pdF9fLnB5UEsBAhQDFAAAAAgAHZGNUdDp0W5fAwAAFAcAACMAAAAAAAAAAAAAAKSBrtgHAHdoZWVsL3ZlbmRvcmVkL3BhY2thZ2luZy9fdHlwaW5nLnB5UEsBAhQDFAAAAAgAHZGNUfmiZWpnIAAACXEAACAAAAAAAAAAAAAAAKSBTtwHAHdoZWVsL3ZlbmRvcmVkL3BhY2thZ2luZy90YWdzLnB5UEsBAhQDFAAAAAgAuKOFUfXSIghAAAAAPgAAABMAAAAAAAAAAAAAAKSB8/wHAGNlcnRpZmkvX19pbml0X18ucHlQSwECFAMUAAAACABCfoVQIPDy2JUAAADzAAAAEwAAAAAAAAAAAAAApIFk/QcAY2VydGlmaS9fX21haW5fXy5weVBLAQIUAxQAAAAIAICjhVGGsZywmS0CAF4GBAASAAAAAAAAAAAAAACkgSr+BwBjZXJ0aWZpL2NhY2VydC5wZW1QSwECFAMUAAAACABuTMdQqftfDdUDAAD/CAAADwAAAAAAAAAAAAAApIHzKwoAY2VydGlmaS9jb3JlLnB5UEsFBgAAAAClAKUAGiwAAPUvCgAAAA==
@@ -51,11 +50,10 @@ def main():
     os.environ["TMPDIR"] = runtime_tmp_dir
     tmp_dir = tempfile.mkdtemp(dir=runtime_tmp_dir)
     try:
-        pioinstaller_zip = os.path.join(tmp_dir, "pioinstaller.zip")
-        with open(pioinstaller_zip, "wb") as fp:
-            fp.write(b64decode(DEPENDENCIES))
-
-        sys.path.insert(0, pioinstaller_zip)
+        # decoded archive is imported from memory (or from cache, reused while DEPENDENCIES don't change)
+        sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+        from elrs_bootstrap import decodeBase64, importBootstrapArchive
+        importBootstrapArchive("pioinstaller", DEPENDENCIES, decodeBase64, tmp_dir)
 
         bootstrap()
     finally:
@@ -19,10 +19,15 @@
 #  This is ExpressLRS CLI setup application. Intended to prepare all needed libraries for ExpressLRS CLI python project.
 
 import argparse
+import json
 import os
 import logging
+import pathlib
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 # import platform
 
 # Declare constants
@@ -33,20 +38,33 @@ import sys
 scriptpath = os.path.realpath(__file__)
 elrsrepopath = scriptpath[0:-len("/elrs-cli/setup.py")]
 
+# embedded Python doesn't put script directory on sys.path, so shared modules next to script are found explicitly
+sys.path.insert(0, os.path.dirname(scriptpath))
+from elrs_events import emitEvent, setupEvents  # noqa: E402
+from elrs_logging import setupLogging  # noqa: E402
+
+# Setup progress, so interrupted or repeated setup only runs steps not completed yet
+SETUP_STATE_PATH = os.path.join(elrsrepopath, ".elrs-cache", "setup-state.json")
+
+# Archives decoded from get-pip.py and get-platformio.py payloads are cached here for later setups
+BOOTSTRAP_CACHE_DIR = os.path.join(elrsrepopath, ".elrs-cache", "bootstrap")
+
+# PlatformIO core installed by get-platformio.py lives in its own virtual environment
+PIO_CORE_DIR = os.environ.get("PLATFORMIO_CORE_DIR", os.path.join(str(pathlib.Path.home()), ".platformio"))
+PIO_EXEC_PATH = os.path.join(PIO_CORE_DIR, "penv", "Scripts", "pio.exe") if os.name == "nt" else \
+    os.path.join(PIO_CORE_DIR, "penv", "bin", "pio")
+
 # Logger config
 loggerfilename = os.path.join(elrsrepopath, "elrs-cli.log")
-# logging.basicConfig(filename=loggerfilename, encoding='utf-8', level=logging.DEBUG,
-#                     format='%(asctime)s %(name)-8s %(levelname)-8s %(message)s', datefmt='%y-%m-%d %H:%M:%S')
-logging.basicConfig(handlers=[logging.FileHandler(filename=loggerfilename, 
-                                                 encoding='utf-8', mode='a+')],
-                    format="%(asctime)s %(name)s:%(levelname)s:%(message)s", 
-                    datefmt="%F %A %T", 
-                    level=logging.DEBUG)
+setupLogging(loggerfilename)
 logger = logging.getLogger('setup')
 
 # Initialize argument parser for ExpressLRS CLI setup
 parser = argparse.ArgumentParser()
 parser.add_argument("-s", "--setup", action="store_true", help="setup ExpressLRS Python tools needed")
+parser.add_argument("-f", "--force", action="store_true", help="run all setup steps, even already completed ones")
+parser.add_argument("--events", type=str, help="append setup step progress events as newline-delimited JSON to file "
+                                                  "('-' for stderr)")
 # parser.add_argument("-a", "--activate", action="store_true", help="activate ExpressLRS Python 3 venv locally")
 # parser.add_argument("-d", "--deactivate", action="store_true", help="deactivate ExpressLRS Python 3 venv locally")
 args = parser.parse_args()
@@ -61,14 +79,22 @@ args = parser.parse_args()
 #     logger.info("Deactivating Python 3 venv for ExpressLRS CLI")
 #     subprocess.check_call(['.\elrs-cli\\venv\Scripts\\deactivate.bat'], shell=True)
 
-def setupPythonTools():
+# Return version reported by command, None when command is missing or fails
+def probeVersion(command):
+    try:
+        output = subprocess.check_output(command, stdin=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                         encoding="utf-8", errors="replace")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip().splitlines()[0] if output.strip() else None
 
-    logger.debug("Starting setup Python tools needed for ExpressLRS CLI")
 
+def probePip():
+    return probeVersion([sys.executable, '-m', 'pip', '--version'])
+
+
+def installPip():
     getPipPath = os.path.join(elrsrepopath, "elrs-cli", "get-pip.py")
-    getPlatformIOPath = os.path.join(elrsrepopath, "elrs-cli", "get-platformio.py")
-    
-    # install pip
     logger.debug("Installing pip package manager")
     subprocess.check_call([sys.executable, getPipPath], shell=True)
 
@@ -81,14 +107,141 @@ def setupPythonTools():
     # logger.debug("Installing GitPython")
     # subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'gitpython'], shell=True)
 
-    # install PlatformIO
+
+def probePlatformIO():
+    if not os.path.isfile(PIO_EXEC_PATH):
+        return None
+    return probeVersion([PIO_EXEC_PATH, '--version'])
+
+
+def installPlatformIO():
+    getPlatformIOPath = os.path.join(elrsrepopath, "elrs-cli", "get-platformio.py")
     logger.debug("Installing PlatformIO")
     subprocess.check_call([sys.executable, getPlatformIOPath], shell=True)
 
+
+# Setup steps - name, names of steps it depends on, probe returning installed version (None when not installed) and
+# install. Steps with completed dependencies run concurrently, pip and PlatformIO installer don't need each other
+SETUP_STEPS = [
+    ("pip", [], probePip, installPip),
+    ("platformio", [], probePlatformIO, installPlatformIO),
+]
+
+# Setup state is shared by concurrently running steps
+stateLock = threading.Lock()
+
+
+def loadSetupState():
+    try:
+        with open(SETUP_STATE_PATH, encoding="utf-8") as stateFile:
+            state = json.load(stateFile)
+    except (OSError, ValueError):
+        return {"python": sys.executable, "steps": {}}
+
+    # state of another Python installation says nothing about this one
+    if state.get("python") != sys.executable:
+        return {"python": sys.executable, "steps": {}}
+    return state
+
+
+def saveSetupState(state):
+    os.makedirs(os.path.dirname(SETUP_STATE_PATH), exist_ok=True)
+    tmpPath = f"{SETUP_STATE_PATH}.{os.getpid()}.tmp"
+    with open(tmpPath, "w", encoding="utf-8") as stateFile:
+        json.dump(state, stateFile, indent=2)
+    os.replace(tmpPath, SETUP_STATE_PATH)
+
+
+def updateSetupStep(state, name, **step):
+    with stateLock:
+        state["steps"][name] = step
+        saveSetupState(state)
+
+
+# Run one setup step - skipped when already installed, progress is recorded in state file after every step
+# transition, so interrupted setup continues with the step it was interrupted in. Returns False when step failed
+def runSetupStep(state, name, probe, install, force):
+    step = state["steps"].get(name, {})
+
+    version = None if force else probe()
+    if version is not None:
+        if step.get("status") != "done":
+            updateSetupStep(state, name, status="done", version=version, completed=time.time())
+        logger.info(f"Setup step '{name}' already completed ({version}), skipping")
+        emitEvent("stage", stage=name, status="skipped", version=version)
+        return True
+
+    if step.get("status") == "started":
+        logger.info(f"Resuming setup step '{name}' interrupted at {time.ctime(step['started'])}")
+
+    started = time.time()
+    updateSetupStep(state, name, status="started", started=started)
+    emitEvent("stage", stage=name, status="started")
+
+    try:
+        install()
+        version = probe()
+    except (OSError, subprocess.CalledProcessError) as error:
+        logger.error(f"Setup step '{name}' failed: {error}")
+        version = None
+    else:
+        if version is None:
+            logger.error(f"Setup step '{name}' finished, but its result can't be found")
+
+    duration = round(time.time() - started, 3)
+    if version is None:
+        updateSetupStep(state, name, status="failed", failed=time.time())
+        emitEvent("stage", stage=name, status="failed", duration=duration)
+        return False
+
+    updateSetupStep(state, name, status="done", version=version, completed=time.time())
+    logger.info(f"Setup step '{name}' completed ({version}) in {duration}s")
+    emitEvent("stage", stage=name, status="done", version=version, duration=duration)
+    return True
+
+
+# Resumable setup - steps are run as soon as all steps they depend on are completed, independent steps concurrently.
+# Steps depending on failed one are not run, setup fails once running steps finish
+def setupPythonTools(force=False):
+
+    logger.debug("Starting setup Python tools needed for ExpressLRS CLI")
+
+    state = loadSetupState()
+    os.environ["ELRS_BOOTSTRAP_CACHE_DIR"] = BOOTSTRAP_CACHE_DIR
+
+    pending = {name: (set(dependencies), probe, install) for name, dependencies, probe, install in SETUP_STEPS}
+    completed = set()
+    failed = set()
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=len(SETUP_STEPS)) as executor:
+        while pending or running:
+            if not failed:
+                for name in [name for name, (dependencies, _, _) in pending.items() if dependencies <= completed]:
+                    _, probe, install = pending.pop(name)
+                    running[executor.submit(runSetupStep, state, name, probe, install, force)] = name
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                (completed if future.result() else failed).add(name)
+
+    if failed or pending:
+        for name in pending:
+            emitEvent("stage", stage=name, status="cancelled")
+        logger.error(f"Failed setup Python tools needed for ExpressLRS CLI, failed steps: {', '.join(sorted(failed))}")
+        sys.exit(1)
+
     logger.debug("Finished setup Python tools needed for ExpressLRS CLI")
 
+
+setupEvents(args.events)
+
 if args.setup:
-    setupPythonTools()
+    setupPythonTools(args.force)
     sys.exit(0)
 
 # if args.activate:
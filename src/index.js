@@ -3,7 +3,7 @@ const path = require('path')
 const fs = require("fs");
 const readline = require('readline');
 const menu = require('./menu')
-const { spawn } = require('child_process')
+const { spawn, spawnSync } = require('child_process')
 const log = require('electron-log');
 const os = require('os');
 const usb = require('usb')
@@ -79,13 +79,13 @@ const winDirPortableGit = srcDir + "setup/win/PortableGit-2.30.1-64-bit/git-bash
 
 log.transports.file.level = 'debug';
 log.transports.file.fileName = srcDir + 'elrs-cli.log';
+// elrs-cli.log is rotated and compressed by ExpressLRS CLI, see elrs-cli/elrs_logging.py
+log.transports.file.maxSize = 0;
 log.transports.file.resolvePath = (variables) => {
     return path.join(variables.fileName);
 }
 
 const localElrsDir = srcDir + "ExpressLRS/";
-const fetchHeadPath = srcDir + "ExpressLRS/.git/FETCH_HEAD";
-const packedRefsPath = srcDir + "ExpressLRS/.git/packed-refs";
 
 // handle creating/removing shortcuts on Windows when installing/uninstalling.
 if (require('electron-squirrel-startup')) { // eslint-disable-line global-require
@@ -257,8 +257,9 @@ ipcMain.handle('update-elrs-branches-clicked', () => {
     listElrsBranches();
 });
 
-// helper function to run script in terminal
-function runScript(command, args, callback, errCallback) {
+// helper function to run script in terminal. Optional stderr line handler returns true for lines it consumed
+// (e.g. structured progress events), those are not logged as errors
+function runScript(command, args, callback, errCallback, stderrLineHandler) {
     log.info('Executing script: ' + command + ' ' + args);
 
     // spawn os subprocess
@@ -294,22 +295,33 @@ function runScript(command, args, callback, errCallback) {
 
     // fetch stderr
     child.stderr.setEncoding('utf8');
-    child.stderr.on('data', (data) => {
-        // log stderr data
-        log.error(data.toString().trim());
-
-        // TODO: show more cool - looking notifications
-        // dialog.showMessageBox({
-        //     title: 'Error',
-        //     type: 'error',
-        //     message: 'Unable to execute script:\r\n \'' + command + ' ' + args + '\'. \r\nError: \r\n' + data
-        // }).then((data) => {
-        //     log.debug("Clicked dialog button #" + data.response);
-        //     if (0 === data.response) {
-        //         app.quit();
-        //     }
-        // });
-    });
+    if (typeof stderrLineHandler === 'function') {
+        readline.createInterface({
+            input: child.stderr,
+            console: false
+        }).on('line', (line) => {
+            if (!stderrLineHandler(line)) {
+                log.error(line.trim());
+            }
+        });
+    } else {
+        child.stderr.on('data', (data) => {
+            // log stderr data
+            log.error(data.toString().trim());
+
+            // TODO: show more cool - looking notifications
+            // dialog.showMessageBox({
+            //     title: 'Error',
+            //     type: 'error',
+            //     message: 'Unable to execute script:\r\n \'' + command + ' ' + args + '\'. \r\nError: \r\n' + data
+            // }).then((data) => {
+            //     log.debug("Clicked dialog button #" + data.response);
+            //     if (0 === data.response) {
+            //         app.quit();
+            //     }
+            // });
+        });
+    }
 
     child.on('close', (code) => {
         switch (code) {
@@ -337,6 +349,127 @@ function runScript(command, args, callback, errCallback) {
     return child;
 }
 
+// persistent elrs-cli process, serving JSON-RPC requests over stdio, so every action skips Python start-up
+let elrsCliDaemon = null;
+let elrsCliRequestId = 0;
+const elrsCliPendingRequests = new Map();
+
+function startElrsCliDaemon() {
+    log.info('Starting ExpressLRS CLI daemon');
+
+    // own process group outside of Windows, so daemon can be killed together with git and PlatformIO it runs
+    elrsCliDaemon = spawn(winDirPythonEmbedded, [srcDir + "elrs-cli/elrs-cli.py", "--serve"], {
+        detached: currentPlatform !== platforms.WINDOWS
+    });
+
+    // fetch JSON-RPC responses, one per line
+    const readInterface = readline.createInterface({
+        input: elrsCliDaemon.stdout,
+        console: false
+    });
+
+    readInterface.on('line', function(line) {
+        let response;
+        try {
+            response = JSON.parse(line);
+        } catch (error) {
+            log.error('Unable to parse ExpressLRS CLI daemon response: ' + line);
+            return;
+        }
+
+        // notifications carry structured build progress events, forward them to main window
+        if (response.method === 'event') {
+            if (null != mainWindow) {
+                mainWindow.webContents.send('elrs-build-event', response.params);
+            }
+            return;
+        }
+
+        const request = elrsCliPendingRequests.get(response.id);
+        if (!request) {
+            return;
+        }
+        elrsCliPendingRequests.delete(response.id);
+
+        if (response.error) {
+            log.error('ExpressLRS CLI request \'%s\' failed: %s', request.method, response.error.message);
+
+            // run error callback function
+            if (typeof request.errCallback === 'function') {
+                request.errCallback(response.error);
+            }
+        } else {
+            log.info('Successfully executed ExpressLRS CLI request \'%s\'', request.method);
+
+            // run success callback function
+            if (typeof request.callback === 'function') {
+                request.callback(response.result);
+            }
+        }
+    });
+
+    // git and PlatformIO output is sent to stderr while serving requests
+    elrsCliDaemon.stderr.setEncoding('utf8');
+    elrsCliDaemon.stderr.on('data', (data) => {
+        log.info(data.toString().trim());
+    });
+
+    elrsCliDaemon.on('error', (error) => {
+        log.error(error.toString().trim());
+    });
+
+    elrsCliDaemon.on('close', (code) => {
+        log.info('ExpressLRS CLI daemon exited with code %s', code);
+        elrsCliDaemon = null;
+
+        // fail all requests still waiting for response
+        for (const request of elrsCliPendingRequests.values()) {
+            if (typeof request.errCallback === 'function') {
+                request.errCallback({ code: code, message: 'ExpressLRS CLI daemon exited' });
+            }
+        }
+        elrsCliPendingRequests.clear();
+    });
+}
+
+// helper function to send request to ExpressLRS CLI daemon, starting it on first use
+function callElrsCli(method, params, callback, errCallback) {
+    if (null == elrsCliDaemon) {
+        startElrsCliDaemon();
+    }
+
+    const id = ++elrsCliRequestId;
+    elrsCliPendingRequests.set(id, { method: method, callback: callback, errCallback: errCallback });
+
+    log.info('Sending ExpressLRS CLI request \'%s\' with params %s', method, JSON.stringify(params));
+    elrsCliDaemon.stdin.write(JSON.stringify({ jsonrpc: '2.0', id: id, method: method, params: params }) + '\n');
+}
+
+// idle daemon is asked to shut down, daemon still serving request is killed with its whole process tree - shutdown
+// request would only be read after running clone/pull/build/upload finished, leaving it running after quit
+function stopElrsCliDaemon() {
+    if (null == elrsCliDaemon) {
+        return;
+    }
+
+    if (0 === elrsCliPendingRequests.size) {
+        elrsCliDaemon.stdin.write(JSON.stringify({ jsonrpc: '2.0', method: 'shutdown' }) + '\n');
+        elrsCliDaemon.stdin.end();
+        return;
+    }
+
+    log.info('Killing ExpressLRS CLI daemon with %d pending requests', elrsCliPendingRequests.size);
+    if (currentPlatform === platforms.WINDOWS) {
+        spawnSync('taskkill', ['/PID', String(elrsCliDaemon.pid), '/T', '/F']);
+    } else {
+        try {
+            process.kill(-elrsCliDaemon.pid, 'SIGKILL');
+        } catch (error) {
+            log.error('Unable to kill ExpressLRS CLI daemon: ' + error);
+        }
+    }
+}
+
 function localFileExists(path) {
     if (fs.existsSync(path)) {
         return true;
@@ -345,6 +478,46 @@ function localFileExists(path) {
     }
 }
 
+// setup stages run as soon as stages they depend on are completed, so independent stages run concurrently
+const completedSetupStages = new Set();
+const waitingSetupStages = [];
+
+// register setup stage, started once all of its dependencies are completed
+function scheduleSetupStage(name, dependencies, stage) {
+    waitingSetupStages.push({ name: name, dependencies: dependencies, stage: stage });
+    startReadySetupStages();
+}
+
+function startReadySetupStages() {
+    for (const waiting of waitingSetupStages.slice()) {
+        // stage may have been started, or completed ahead, by stage started in this loop
+        const index = waitingSetupStages.indexOf(waiting);
+        if (-1 === index) {
+            continue;
+        }
+        if (completedSetupStages.has(waiting.name)) {
+            waitingSetupStages.splice(index, 1);
+            continue;
+        }
+        if (waiting.dependencies.every((dependency) => completedSetupStages.has(dependency))) {
+            waitingSetupStages.splice(index, 1);
+
+            log.info("Starting setup stage '%s'", waiting.name);
+            setupUpdateWindow.webContents.send('setup-stage', waiting.name, 'started');
+            waiting.stage();
+        }
+    }
+}
+
+// mark setup stage completed and start stages waiting for it
+function setupStageCompleted(name) {
+    log.info("Completed setup stage '%s'", name);
+    completedSetupStages.add(name);
+    setupUpdateWindow.webContents.send('setup-stage', name, 'done');
+
+    startReadySetupStages();
+}
+
 // cross-platform setup procedures
 function setupElrsLocally() {
     // start event with running spinner loader
@@ -352,6 +525,14 @@ function setupElrsLocally() {
 
     log.info("Setting up ExpressLRS Configurator locally");
 
+    // Python tools and Portable Git don't need each other, ExpressLRS CLI clones using embedded Python and git only
+    scheduleSetupStage('python', ['7zip'], installPython);
+    scheduleSetupStage('python-tools', ['python'], installPythonTools);
+    scheduleSetupStage('git', ['7zip'], installGit);
+    scheduleSetupStage('clone', ['python', 'git'], cloneExpressLRS);
+    scheduleSetupStage('pull', ['clone'], updateAndGetCurrentRemoteBranch);
+    scheduleSetupStage('configurator', ['pull', 'python-tools'], startElrsConfigurator);
+
     byOS({
         [platforms.WINDOWS]: setupWinElrsLocally(),
         [platforms.LINUX]: setupLinuxElrsLocally(),
@@ -368,10 +549,10 @@ function setupWinElrsLocally() {
         log.info("Local 7-Zip installation not found! Starting installation...")
 
         // install 7-Zip archiver
-        setupElrsProcess = runScript("cmd", ["/C \"\"./setup/win/7zip-install.cmd\"\""], installPython);
+        setupElrsProcess = runScript("cmd", ["/C \"\"./setup/win/7zip-install.cmd\"\""], () => setupStageCompleted('7zip'));
     } else {
         log.info("Found local 7-Zip installation");
-        installPython();
+        setupStageCompleted('7zip');
     }
 }
 
@@ -382,8 +563,6 @@ function setupMacElrsLocally() {}
 
 // cross-platform Python install procedures
 function installPython() {
-    setupUpdateWindow.webContents.send('python-setup-started');
-
     log.info("Checking for local Python embedded installation");
 
     if (!localFileExists(winDirPythonEmbedded)) {
@@ -397,7 +576,7 @@ function installPython() {
         });
     } else {
         log.info("Found local Python embedded installation");
-        installGit();
+        setupStageCompleted('python');
     }
 }
 
@@ -405,7 +584,7 @@ let installPythonProcess = null;
 
 function extractWinPython() {
     // install Python embedded
-    installPythonProcess = runScript("cmd", ["/C \"\"C:/Program Files/7-zip/7z.exe\" x \"./setup/win/python-3.8.8-embed-amd64.7z\" -o./setup/win -aos\"\""], installPythonTools);
+    installPythonProcess = runScript("cmd", ["/C \"\"C:/Program Files/7-zip/7z.exe\" x \"./setup/win/python-3.8.8-embed-amd64.7z\" -o./setup/win -aos\"\""], () => setupStageCompleted('python'));
 }
 
 function installLinuxPython() {}
@@ -413,10 +592,9 @@ function installLinuxPython() {}
 function installMacPython() {}
 // end of cross-platform Python install procedures
 
-// cross-platform ExpressLRS Python tools install procedures - should be called once after Python installation
+// cross-platform ExpressLRS Python tools install procedures - setup.py skips already installed tools, so interrupted
+// install is resumed on next start
 function installPythonTools() {
-    setupUpdateWindow.webContents.send('python-tools-setup-started');
-
     log.info("Installing Python tools needed for ExpressLRS");
 
     byOS({
@@ -430,7 +608,25 @@ let installPythonToolsProcess = null;
 
 function installWinPythonTools() {
     // install Python tools for ExpressLRS on Windows
-    installPythonToolsProcess = runScript("cmd", ["/C \"\"" + winDirPythonEmbedded + "\" \"" + srcDir + "elrs-cli/setup.py\" -s\"\""], installGit);
+    installPythonToolsProcess = runScript("cmd", ["/C \"\"" + winDirPythonEmbedded + "\" \"" + srcDir + "elrs-cli/setup.py\" -s --events -\"\""], () => setupStageCompleted('python-tools'), null, forwardSetupStepEvent);
+}
+
+// forward progress event of setup steps (pip, platformio), running concurrently, to setup window
+function forwardSetupStepEvent(line) {
+    let event;
+    try {
+        event = JSON.parse(line);
+    } catch (error) {
+        return false;
+    }
+
+    if (event.event !== 'stage') {
+        return false;
+    }
+
+    log.debug("Setup step '%s' %s", event.stage, event.status);
+    setupUpdateWindow.webContents.send('setup-stage', event.stage, event.status);
+    return true;
 }
 
 function installLinuxPythonTools() {}
@@ -440,8 +636,6 @@ function installMacPythonTools() {}
 
 // cross-platform Git install procedures
 function installGit() {
-    setupUpdateWindow.webContents.send('git-setup-started');
-
     // TODO: check if we already have git installed. Currently using Portable git version.
     log.info("Checking for local Portable Git installation");
 
@@ -455,7 +649,7 @@ function installGit() {
         });
     } else {
         log.info("Found local Portable Git installation");
-        cloneExpressLRS();
+        setupStageCompleted('git');
     }
 }
 
@@ -463,7 +657,7 @@ let installGitProcess = null
 
 function extractWinGit() {
     // install Portable Git
-    installGitProcess = runScript("cmd", ["/C \"\"C:/Program Files/7-zip/7z.exe\" x \"./setup/win/PortableGit-2.30.1-64-bit.7z.exe\" -o./setup/win/PortableGit-2.30.1-64-bit -aos\"\""], cloneExpressLRS);
+    installGitProcess = runScript("cmd", ["/C \"\"C:/Program Files/7-zip/7z.exe\" x \"./setup/win/PortableGit-2.30.1-64-bit.7z.exe\" -o./setup/win/PortableGit-2.30.1-64-bit -aos\"\""], () => setupStageCompleted('git'));
 }
 
 function installLinuxGit() {}
@@ -473,8 +667,6 @@ function installMacGit() {}
 
 // cross-platform ExpressLRS clone procedures
 function cloneExpressLRS() {
-    setupUpdateWindow.webContents.send('initial-elrs-clone');
-
     log.info("Checking for already cloned ExpressLRS project");
 
     if (!localFileExists(localElrsDir)) {
@@ -487,15 +679,14 @@ function cloneExpressLRS() {
         });
     } else {
         log.info("Found local ExpressLRS repository");
-        updateAndGetCurrentRemoteBranch();
+        setupStageCompleted('clone');
     }
 }
 
-let cloneExpressLRSProcess = null
 
 function cloneWinExpressLRS() {
     // clone ExpressLRS using embedded Python on Windows
-    cloneExpressLRSProcess = runScript("cmd", ["/C \"\"" + winDirPythonEmbedded + "\" \"" + srcDir + "elrs-cli/elrs-cli.py\" -c\"\""], updateAndGetCurrentRemoteBranch);
+    callElrsCli('clone', [], () => setupStageCompleted('clone'));
 }
 
 function cloneLinuxExpressLRS() {}
@@ -507,146 +698,51 @@ let localFetchedElrsBranches = new Map();
 let localFetchedElrsTags = new Map();
 let currentRemote = null;
 
-function getCurrentRemoteBranch() {
-    let currentHeadCommit;
+// fetch ExpressLRS branch/tag to commit index from ExpressLRS CLI
+function loadElrsRefs(callback) {
+    log.info("Loading ExpressLRS branches and tags index");
 
-    const readInterface = readline.createInterface({
-        input: fs.createReadStream(srcDir + "ExpressLRS/.git/refs/heads/master"),
-        output: process.stdout,
-        console: false
-    });
+    callElrsCli('refs', [], (index) => {
+        localFetchedElrsBranches.clear();
+        localFetchedElrsTags.clear();
 
-    readInterface.on('line', function(line) {
-        currentHeadCommit = line.trim();
-    });
-
-    readInterface.on('close', function(line) {
-        log.info('Successfully fetched ExpressLRS local repo HEAD commit: %s', currentHeadCommit);
-
-        // set proper remote where local HEAD is pointing
-        currentRemote = localFetchedElrsBranches.get(currentHeadCommit);
-        if (null == currentRemote) {
-            log.info("Unable to find local HEAD commit as branch. Searching tags...")
-
-            currentRemote = localFetchedElrsTags.get(currentHeadCommit);
-
-            log.info('Successfully parsed current remote tag %s', currentRemote);
-        } else {
-            log.info('Successfully parsed current remote branch %s', currentRemote);
+        for (const [branchName, commitHash] of Object.entries(index.branches)) {
+            // add to locally fetched branches
+            localFetchedElrsBranches.set(commitHash, branchName);
         }
 
-        pullExpressLRS();
-    });
-}
-
-// fetch latest locally updated remotes either from .git/packet-refs or from ./git/FETCH_HEAD file
-function updateAndGetCurrentRemoteBranch() {
-    if (!localFileExists(fetchHeadPath)) {
-        parseInitialLocalBranches(getCurrentRemoteBranch);
-    } else {
-        parseLocalBranchesAfterFetch(getCurrentRemoteBranch);
-    }
-}
-
-function parseInitialLocalBranches(callback) {
-    log.info("Parsing local branches from packed-refs")
-
-    const readInterface = readline.createInterface({
-        input: fs.createReadStream(packedRefsPath),
-        output: process.stdout,
-        console: false
-    });
-
-    readInterface.on('line', function(line) {
-        if (!line.startsWith('#')) {
-            commitHash = line.substring(0, 40);
-
-            lineSplit = line.split(' ');
-            fullRefsPath = lineSplit[1];
-            branchName = null;
-            tagName = null;
-            if (fullRefsPath.includes('refs/remotes/')) {
-                branchName = fullRefsPath.substring(20).trim();
-            } else {
-                // if not branch - it is tag
-                tagName = fullRefsPath.substring(10).trim();
-            }
-
-            if (null != branchName) {
-                // add to locally fetched branches
-                localFetchedElrsBranches.set(commitHash, branchName)
-            }
-
-            if (null != tagName) {
-                // add to locally fetched tags
-                localFetchedElrsTags.set(commitHash, tagName)
-            }
+        for (const [tagName, commitHash] of Object.entries(index.tags)) {
+            // add to locally fetched tags
+            localFetchedElrsTags.set(commitHash, tagName);
         }
-    });
 
-    readInterface.on('close', function(line) {
-        log.debug('Successfully updated ExpressLRS initial local branches mappings');
+        log.debug('Successfully updated ExpressLRS local branches mappings');
 
         // run success callback function
         if (typeof callback === 'function') {
-            callback();
+            callback(index);
         }
     });
 }
 
-function parseLocalBranchesAfterFetch(callback) {
-    log.info("Parsing local branches from FETCH_HEAD")
-
-    const readInterface = readline.createInterface({
-        input: fs.createReadStream(fetchHeadPath),
-        output: process.stdout,
-        console: false
-    });
-
-    readInterface.on('line', function(line) {
-        commitHash = line.substring(0, 40);
-
-        lineSplit = line.split('\'');
-        branchTagIdx = 0;
-        branchName = null;
-        tagName = null;
-        for (const currentSplit of lineSplit) {
-            if (currentSplit.includes('branch')) {
-                branchTagIdx = lineSplit.indexOf(currentSplit);
-                branchName = lineSplit[branchTagIdx + 1];
-            } else if (currentSplit.includes('tag')) {
-                branchTagIdx = lineSplit.indexOf(currentSplit);
-                tagName = lineSplit[branchTagIdx + 1];
-            } else {
-                continue;
-            }
-        }
-
-        if (null != branchName) {
-            // add to locally fetched branches
-            localFetchedElrsBranches.set(commitHash, branchName)
-        }
+function updateAndGetCurrentRemoteBranch() {
+    loadElrsRefs((index) => {
+        log.info('Successfully fetched ExpressLRS local repo HEAD commit: %s', index.head);
 
-        if (null != tagName) {
-            // add to locally fetched tags
-            localFetchedElrsTags.set(commitHash, tagName)
+        // set proper remote where local HEAD is pointing
+        currentRemote = index.current;
+        if (null == currentRemote) {
+            log.error('Unable to find local HEAD commit as branch or tag');
+        } else {
+            log.info('Successfully parsed current remote %s', currentRemote);
         }
-    });
-
-    readInterface.on('close', function(line) {
-        log.debug('Successfully updated ExpressLRS local branches mappings after Git fetch');
 
-        // run success callback function
-        if (typeof callback === 'function') {
-            callback();
-        }
+        pullExpressLRS();
     });
 }
 
 // cross-platform ExpressLRS pull procedures
 function pullExpressLRS() {
-    setupUpdateWindow.webContents.send('initial-elrs-pull');
-
     log.info("Updating local ExpressLRS project with latest current branch changes");
 
     if (null != currentRemote) {
@@ -660,11 +756,10 @@ function pullExpressLRS() {
     }
 }
 
-let pullExpressLRSProcess = null
 
 function pullWinExpressLRS() {
     // pull ExpressLRS using embedded Python on Windows
-    pullExpressLRSProcess = runScript("cmd", ["/C \"\"" + winDirPythonEmbedded + "\" \"" + srcDir + "elrs-cli/elrs-cli.py\" -p \"" + currentRemote + "\"\""], startElrsConfigurator);
+    callElrsCli('pull', [currentRemote], () => setupStageCompleted('pull'));
 }
 
 function pullLinuxExpressLRS() {}
@@ -680,7 +775,7 @@ function startElrsConfigurator() {
     setupUpdateWindow.hide();
 
     // fetch latest ExpressLRS branches
-    parseLocalBranchesAfterFetch(listElrsBranches);
+    loadElrsRefs(listElrsBranches);
 
     // fetch latest PlatformIO build targets
     listElrsBuildTargets();
@@ -699,29 +794,12 @@ function listElrsBranches() {
     mainWindow.webContents.send('update-elrs-branches-success', parsedElrsRemotes, currentRemote);
 }
 
-// fetch latest PlatformIO build targets from platformio.ini
+// fetch latest PlatformIO build targets catalog from ExpressLRS CLI
 function listElrsBuildTargets() {
-    let fetchedPioBuildTargets = [];
-
-    const readInterface = readline.createInterface({
-        input: fs.createReadStream(srcDir + "ExpressLRS/src/platformio.ini"),
-        output: process.stdout,
-        console: false
-    });
-
-    readInterface.on('line', function(line) {
-        if (line.startsWith('[env:')) {
-            // remove '[env:' from start and end ']' for correct value parsing
-            var substringEnd = line.length - 1;
-            line = line.substring(5, substringEnd);
-
-            // add to array list
-            fetchedPioBuildTargets.push(line);
-        }
-    });
+    callElrsCli('targets', [], (catalog) => {
+        let fetchedPioBuildTargets = catalog.targets.map((target) => target.name);
 
-    readInterface.on('close', function(line) {
-        log.debug('Successfully fetched PlatformIO branches: %s', fetchedPioBuildTargets);
+        log.debug('Successfully fetched PlatformIO build targets: %s', fetchedPioBuildTargets);
 
         // update local ExpressLRS build targets component
         mainWindow.webContents.send('update-elrs-build-targets-success', fetchedPioBuildTargets);
@@ -741,12 +819,11 @@ function resetElrsBranch(branch) {
     });
 }
 
-let resetElrsBranchProcess = null
 let resetBranch = null;
 
 function resetWinElrsBranch(branch) {
     // reset ExpressLRS code source using embedded Python on Windows
-    resetElrsBranchProcess = runScript("cmd", ["/C \"\"" + winDirPythonEmbedded + "\" \"" + srcDir + "elrs-cli/elrs-cli.py\" -r \"" + branch + "\"\""], resetElrsBranchSuccess, resetElrsBranchFailed);
+    callElrsCli('reset', [branch], resetElrsBranchSuccess, resetElrsBranchFailed);
     resetBranch = branch;
 }
 
@@ -783,12 +860,11 @@ function buildElrsFirmwareForTarget(target) {
     });
 }
 
-let buildElrsFirmwareProcess = null
 let buildTarget = null;
 
 function buildWinElrsFirmwareForTarget(target) {
     // build ExpressLRS firmware for specific target using embedded Python on Windows
-    buildElrsFirmwareProcess = runScript("cmd", ["/C \"\"" + winDirPythonEmbedded + "\" \"" + srcDir + "elrs-cli/elrs-cli.py\" -b -t \"" + target + "\"\""], buildElrsFirmwareForTargetSuccess, buildElrsFirmwareForTargetFailed);
+    callElrsCli('build', [target], buildElrsFirmwareForTargetSuccess, buildElrsFirmwareForTargetFailed);
     buildTarget = target;
 }
 
@@ -822,12 +898,11 @@ function uploadElrsFirmwareForTarget(target) {
     });
 }
 
-let uploadElrsFirmwareProcess = null
 let uploadTarget = null;
 
 function uploadWinElrsFirmwareForTarget(target) {
     // upload ExpressLRS firmware for specific target using embedded Python on Windows
-    uploadElrsFirmwareProcess = runScript("cmd", ["/C \"\"" + winDirPythonEmbedded + "\" \"" + srcDir + "elrs-cli/elrs-cli.py\" -u -t \"" + target + "\"\""], uploadElrsFirmwareForTargetSuccess, uploadElrsFirmwareForTargetFailed);
+    callElrsCli('upload', [target], uploadElrsFirmwareForTargetSuccess, uploadElrsFirmwareForTargetFailed);
     uploadTarget = target;
 }
 
@@ -942,34 +1017,9 @@ const killAllProcesses = () => {
         log.debug("\'installGitProcess\' successfully killed!")
     }
 
-    if (null != cloneExpressLRSProcess) {
-        cloneExpressLRSProcess.kill();
-        cloneExpressLRSProcess = null;
-        log.debug("\'cloneExpressLRSProcess\' successfully killed!")
-    }
-
-    if (null != pullExpressLRSProcess) {
-        pullExpressLRSProcess.kill();
-        pullExpressLRSProcess = null;
-        log.debug("\'pullExpressLRSProcess\' successfully killed!")
-    }
-
-    if (null != resetElrsBranchProcess) {
-        resetElrsBranchProcess.kill();
-        resetElrsBranchProcess = null;
-        log.debug("\'resetElrsBranchProcess\' successfully killed!")
-    }
-
-    if (null != buildElrsFirmwareProcess) {
-        buildElrsFirmwareProcess.kill();
-        buildElrsFirmwareProcess = null;
-        log.debug("\'buildElrsFirmwareProcess\' successfully killed!")
-    }
-
-    if (null != uploadElrsFirmwareProcess) {
-        uploadElrsFirmwareProcess.kill();
-        uploadElrsFirmwareProcess = null;
-        log.debug("\'uploadElrsFirmwareProcess\' successfully killed!")
+    if (null != elrsCliDaemon) {
+        stopElrsCliDaemon();
+        log.debug("\'elrsCliDaemon\' successfully stopped or killed!")
     }
 }
 
@@ -106,6 +106,18 @@ ipcRenderer.on('elrs-build-started', (e, target) => {
     elrsUploadTargetBtn.className = 'bg-blue-400 hover:bg-blue-600 text-white font-bold py-1 px-2 rounded inline-flex items-center invisible';
 })
 
+// catches structured build progress events, parsed by ExpressLRS CLI from PlatformIO output
+ipcRenderer.on('elrs-build-event', (e, event) => {
+    if (event.event === 'phase') {
+        elrsBuildTargetBtn.value = 'Building target ' + event.target + ': ' + event.phase;
+    } else if (event.event === 'progress') {
+        let progress = event.compiled + (event.total ? '/' + event.total : '') + ' files compiled';
+        elrsBuildTargetBtn.value = 'Building target ' + event.target + ': ' + progress;
+    } else if (event.event === 'memory') {
+        console.log('Target ' + event.target + ' ' + event.section + ' usage ' + event.used + '/' + event.max + ' bytes');
+    }
+})
+
 // catches build successfully finished
 ipcRenderer.on('elrs-build-success', (e, target) => {
     // show status text
@@ -12,24 +12,32 @@ ipcRenderer.on('elrs-setup-started', () => {
     setSetupStatusMsg("Setting up ExpressLRS Configurator")
 });
 
-ipcRenderer.on('python-setup-started', () => {
-    setSetupStatusMsg("Setting up Python interpeter")
-});
-
-ipcRenderer.on('python-tools-setup-started', () => {
-    setSetupStatusMsg("Setting up PlatformIO locally")
-});
-
-ipcRenderer.on('git-setup-started', () => {
-    setSetupStatusMsg("Setting up git client locally")
-});
-
-ipcRenderer.on('initial-elrs-clone', () => {
-    setSetupStatusMsg("Cloning ExpressLRS from GitHub repository")
-});
-
-ipcRenderer.on('initial-elrs-pull', () => {
-    setSetupStatusMsg("Fetching latest ExpressLRS changes")
+// setup stages run concurrently, status message lists all running ones
+const setupStageMessages = {
+    'python': "Setting up Python interpeter",
+    'python-tools': "Setting up PlatformIO locally",
+    'pip': "Installing pip",
+    'platformio': "Installing PlatformIO core",
+    'git': "Setting up git client locally",
+    'clone': "Cloning ExpressLRS from GitHub repository",
+    'pull': "Fetching latest ExpressLRS changes",
+};
+const runningSetupStages = new Set();
+
+ipcRenderer.on('setup-stage', (e, stage, status) => {
+    if (!(stage in setupStageMessages)) {
+        return;
+    }
+
+    if ('started' === status) {
+        runningSetupStages.add(stage);
+    } else {
+        runningSetupStages.delete(stage);
+    }
+
+    if (runningSetupStages.size > 0) {
+        setSetupStatusMsg(Array.from(runningSetupStages, (running) => setupStageMessages[running]).join("<br>"));
+    }
 });
 
 function setSetupStatusMsg(msg) {